@@ -0,0 +1,78 @@
+"""
+A tiny local stand-in for the ConnectWise API used by the benchmarks.
+
+It speaks HTTP/1.1 with keep-alive so that connection reuse can be measured, and serves
+whatever JSON payload it is started with for every GET request. The payload can also be a
+callable taking the request path and returning the JSON body plus any extra headers, and a
+fixed latency can be added to every response to mimic a real API.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.clients.connectwise_client import ConnectWiseClient
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pyconnectwise.config import Config
+
+
+class BenchmarkClient(ConnectWiseClient):
+    def __init__(self, url: str, config: Config | None = None) -> None:
+        self.url = url
+        if config:
+            self.config = config
+
+    def _get_headers(self) -> dict[str, str]:
+        return {"Content-Type": "application/json"}
+
+    def _get_url(self) -> str:
+        return self.url
+
+
+@contextmanager
+def local_server(
+    payload: Any = None,  # noqa: ANN401
+    latency: float = 0.0,
+) -> Iterator[str]:
+    def respond(path: str) -> tuple[Any, dict[str, str]]:
+        if callable(payload):
+            return payload(path)
+        return payload if payload is not None else {"id": 1}, {}
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:  # noqa: N802
+            if latency:
+                time.sleep(latency)
+            data, headers = respond(self.path)
+            body = json.dumps(data).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args) -> None:  # noqa: ANN002
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,55 @@
+"""
+Compares building the URL of a deeply nested endpoint, computers.id(x).drives.id(y).smartdata, with the
+previous implementation, which walked and joined the whole parent chain on every call, against the cached
+URL templates, both when the endpoint is reused and when a new one is built for every pair of ids.
+No requests are made.
+
+Run with: poetry run python -m benchmarks.bench_build_url
+"""
+
+import time
+
+from benchmarks._server import BenchmarkClient
+
+from pyconnectwise.endpoints.automate.ComputersEndpoint import ComputersEndpoint
+from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
+
+ITERATIONS = 100_000
+
+
+def previous_build_url(endpoint: ConnectWiseEndpoint) -> str:
+    """
+    The URL building ConnectWiseEndpoint used before templates were cached.
+    """
+    if endpoint._parent_endpoint is not None:
+        return endpoint._url_join(previous_build_url(endpoint._parent_endpoint), endpoint._get_replaced_url())
+    return endpoint._url_join(endpoint.client._get_url(), endpoint._get_replaced_url())
+
+
+def timed(func) -> float:  # noqa: ANN001
+    start = time.perf_counter()
+    for i in range(ITERATIONS):
+        func(i)
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+def main() -> None:
+    computers = ComputersEndpoint(BenchmarkClient("http://localhost"))
+    smartdata = computers.id(1).drives.id(2).smartdata
+    if previous_build_url(smartdata) != smartdata._get_endpoint_url():
+        raise RuntimeError("URLs don't match")  # noqa: TRY003
+
+    previous = timed(lambda _: previous_build_url(smartdata))
+    cached = timed(lambda _: smartdata._get_endpoint_url())
+    previous_new_ids = timed(lambda i: previous_build_url(computers.id(i).drives.id(i).smartdata))
+    cached_new_ids = timed(lambda i: computers.id(i).drives.id(i).smartdata._get_endpoint_url())
+
+    print(f"building {smartdata._get_endpoint_url()}")
+    print(f"same endpoint, previous:   {previous * 1e6:6.2f}us")
+    print(f"same endpoint, cached:     {cached * 1e6:6.2f}us ({previous / cached:.1f}x)")
+    print(f"new ids each time, previous: {previous_new_ids * 1e6:6.2f}us")
+    print(f"new ids each time, cached:   {cached_new_ids * 1e6:6.2f}us ({previous_new_ids / cached_new_ids:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Compares the memory held by 100,000 tickets as a list of Ticket models against CompactRecords, and the cost of
+reading a field from every record. The tickets are built like real ones, spread across a realistic number of
+companies, boards, statuses and members, with the nested references and _info links the API sends.
+
+Run with: poetry run python -m benchmarks.bench_compact_records
+"""
+
+import gc
+import time
+import tracemalloc
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+from pyconnectwise.models.base.compact_records import CompactRecords
+from pyconnectwise.models.manage import Ticket
+
+COUNT = 100_000
+BASE_URL = "https://na.myconnectwise.net/v4_6_release/apis/3.0"
+
+
+def reference(kind: str, id_: int, **fields: object) -> dict:
+    return {"id": id_, **fields, "_info": {f"{kind}_href": f"{BASE_URL}/{kind}s/{id_}"}}
+
+
+def make_ticket(i: int) -> dict:
+    entered = datetime(2023, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=7 * i)
+    company_id = i % 800
+    return {
+        "id": 100_000 + i,
+        "summary": f"Printer on level {i % 9} is jammed ({i})",
+        "recordType": "ServiceTicket",
+        "board": reference("board", i % 12, name=f"Board {i % 12}"),
+        "status": reference("status", i % 40, name=f"Status {i % 40}", sort=i % 40),
+        "company": reference("company", company_id, identifier=f"Company{company_id}", name=f"Company {company_id}"),
+        "site": reference("site", company_id * 2, name="Main"),
+        "contact": reference("contact", i % 5000, name=f"Contact {i % 5000}"),
+        "priority": reference("priority", i % 5, name=f"Priority {i % 5}", sort=i % 5),
+        "owner": reference("member", i % 60, identifier=f"member{i % 60}", name=f"Member {i % 60}"),
+        "severity": "Medium",
+        "impact": "Low",
+        "closedFlag": i % 3 == 0,
+        "actualHours": (i % 16) / 4,
+        "approved": True,
+        "estimatedExpenseCost": 0.0,
+        "_info": {
+            "dateEntered": entered.isoformat().replace("+00:00", "Z"),
+            "enteredBy": f"member{i % 60}",
+            "lastUpdated": (entered + timedelta(days=2)).isoformat().replace("+00:00", "Z"),
+            "updatedBy": f"member{i % 60}",
+            "notes_href": f"{BASE_URL}/service/tickets/{100_000 + i}/notes",
+        },
+    }
+
+
+def tickets() -> Iterator[dict]:
+    return (make_ticket(i) for i in range(COUNT))
+
+
+def measure(label: str, build) -> object:  # noqa: ANN001
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    gc.collect()
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<20} held {held / 1024 / 1024:7.1f} MiB  peak {peak / 1024 / 1024:7.1f} MiB")
+    return result
+
+
+def main() -> None:
+    print(f"{COUNT} tickets")
+    models = measure("list[Ticket]", lambda: [Ticket.model_validate(t) for t in tickets()])
+    start = time.perf_counter()
+    names = [t.company.name for t in models]
+    print(f"{'':<20} reading company.name from every ticket: {time.perf_counter() - start:5.2f}s")
+    promoted = models[-1]
+    del models
+
+    compact = measure("CompactRecords", lambda: CompactRecords(Ticket, tickets()))
+    start = time.perf_counter()
+    if [t.company.name for t in compact] != names:
+        raise RuntimeError("Records don't match")  # noqa: TRY003
+    print(f"{'':<20} reading company.name from every ticket: {time.perf_counter() - start:5.2f}s")
+    if compact[-1].to_model() != promoted:
+        raise RuntimeError("Promoted record doesn't match")  # noqa: TRY003
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compares the cost of building a condition string three ways: the old experimental Condition builder, which found
+each field by reading the caller's source line from disk with inspect and regexes (reproduced here, as it was), the
+builder as it is now, and conditions built by comparing model fields, e.g. Ticket.status.name == "New".
+
+Run with: poetry run python -m benchmarks.bench_conditions
+"""
+
+import inspect
+import re
+import time
+from collections.abc import Callable
+
+from pyconnectwise.models.manage import Ticket
+from pyconnectwise.utils.experimental.condition import Condition
+from pyconnectwise.utils.naming import to_camel_case
+
+ITERATIONS = 2000
+EXPECTED = 'status/name = "New" AND closedFlag = false AND board/id = 1'
+
+
+def selected_field(method: str) -> str:
+    # How the builder used to find the field selected by the lambda passed to field() and and_()
+    frame = inspect.currentframe().f_back
+    try:
+        context = inspect.getframeinfo(frame.f_back).code_context
+        caller_lines = "".join([line.strip() for line in context])
+        m = re.search(method + r"\s*\(([^)]+)\)", caller_lines)
+        if m:
+            caller_lines = m.group(1)
+        return to_camel_case("/".join(caller_lines.replace("(", "").replace(")", "").split(".")[1:]))
+    finally:
+        del frame
+
+
+class FrameInspectionCondition(Condition):
+    def field(self, selector: Callable) -> Condition:
+        self._condition_string += selected_field("field")
+        return self
+
+    def and_(self, selector: Callable) -> Condition:
+        self._condition_string += " AND " + selected_field("and_")
+        return self
+
+
+def build(condition: Condition) -> str:
+    return str(
+        condition.field(lambda t: t.status.name)
+        .equals("New")
+        .and_(lambda t: t.closed_flag)
+        .equals(False)  # noqa: FBT003
+        .and_(lambda t: t.board.id)
+        .equals(1)
+    )
+
+
+def build_expression() -> str:
+    return str((Ticket.status.name == "New") & (Ticket.closed_flag == False) & (Ticket.board.id == 1))  # noqa: E712
+
+
+def measure(label: str, build: Callable[[], str]) -> None:
+    if build() != EXPECTED:
+        raise RuntimeError(f"{label} built {build()!r}")  # noqa: TRY003
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        build()
+    elapsed = (time.perf_counter() - start) / ITERATIONS
+    print(f"{label:<32} {elapsed * 1_000_000:9.1f}us per condition")
+
+
+def main() -> None:
+    print(f"building {EXPECTED}")
+    measure("frame inspection (old builder)", lambda: build(FrameInspectionCondition()))
+    measure("Condition builder", lambda: build(Condition[Ticket]()))
+    measure("field comparisons", build_expression)
+
+
+if __name__ == "__main__":
+    main()
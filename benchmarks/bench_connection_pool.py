@@ -0,0 +1,34 @@
+"""
+Compares requests per second against a local stand-in server when opening a new
+connection per request versus reusing the client's pooled keep-alive connections.
+
+Run with: poetry run python -m benchmarks.bench_connection_pool
+"""
+
+import time
+
+import requests
+from benchmarks._server import BenchmarkClient, local_server
+
+REQUESTS = 2000
+
+
+def main() -> None:
+    with local_server() as url:
+        start = time.perf_counter()
+        for _ in range(REQUESTS):
+            requests.request("GET", url, timeout=10)
+        unpooled = REQUESTS / (time.perf_counter() - start)
+
+        with BenchmarkClient(url) as client:
+            start = time.perf_counter()
+            for _ in range(REQUESTS):
+                client._make_request("GET", url)
+            pooled = REQUESTS / (time.perf_counter() - start)
+
+    print(f"new connection per request: {unpooled:8.0f} req/s")
+    print(f"pooled keep-alive session:  {pooled:8.0f} req/s ({pooled / unpooled:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
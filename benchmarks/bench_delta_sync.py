@@ -0,0 +1,67 @@
+"""
+Compares re-pulling a table of 20,000 companies against a DeltaSync of the 50 that changed since the last sync. The
+local server adds 20ms of latency to every response to mimic the real API.
+
+Run with: poetry run python -m benchmarks.bench_delta_sync
+"""
+
+import re
+import time
+from datetime import datetime, timedelta, timezone
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks._server import BenchmarkClient, local_server
+
+from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+from pyconnectwise.sync import DeltaSync, MemorySink
+
+COUNT = 20_000
+CHANGED = 50
+LATENCY = 0.02
+NOW = datetime.now(timezone.utc).replace(microsecond=0)
+COMPANIES = {
+    i: {"id": i, "identifier": f"Company{i}", "name": f"Company {i}", "_info": {}} for i in range(1, COUNT + 1)
+}
+
+
+def update(id_: int, updated: datetime) -> None:
+    COMPANIES[id_]["_info"] = {"lastUpdated": updated.strftime("%Y-%m-%dT%H:%M:%SZ")}
+
+
+def companies(path: str) -> tuple[object, dict[str, str]]:
+    query = parse_qs(urlsplit(path).query)
+    conditions = query.get("conditions", [""])[0]
+    after = re.search(r"id > (\d+)", conditions)
+    since = re.search(r"lastUpdated >= \[(.+?)\]", conditions)
+    rows = []
+    for id_ in range(int(after.group(1)) + 1 if after else 1, COUNT + 1):
+        if not since or COMPANIES[id_]["_info"]["lastUpdated"] >= since.group(1):
+            rows.append(COMPANIES[id_])
+            if len(rows) == int(query["pageSize"][0]):
+                break
+    return rows, {}
+
+
+def measure(label: str, run) -> None:  # noqa: ANN001
+    start = time.perf_counter()
+    result = run()
+    print(f"{label:<24} {time.perf_counter() - start:6.2f}s  {result}")
+
+
+def main() -> None:
+    print(f"syncing {COUNT} companies, {CHANGED} of them changed, with {LATENCY * 1000:.0f}ms of latency per request")
+    for id_ in COMPANIES:
+        update(id_, NOW - timedelta(days=30, seconds=id_))
+    with local_server(companies, latency=LATENCY) as url, BenchmarkClient(url) as client:
+        endpoint = CompanyEndpoint(client).companies
+        sink = MemorySink()
+        sync = DeltaSync(endpoint, sink)
+        measure("first (full) sync", sync.run)
+        for id_ in range(1, COUNT, COUNT // CHANGED):
+            update(id_, NOW - timedelta(seconds=10))
+        measure("full re-pull", lambda: f"{len(list(endpoint.keyset_paginated(1000).all()))} companies")
+        measure("delta sync", sync.run)
+
+
+if __name__ == "__main__":
+    main()
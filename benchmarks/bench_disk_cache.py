@@ -0,0 +1,52 @@
+"""
+Compares how long a freshly started worker process takes to fetch 20 service boards' statuses with an in-memory
+ResponseCache (which starts cold in every process, so each status list comes from the API) against a
+SQLiteCacheBackend another worker has already warmed. The local server adds 20ms of latency to every response to
+mimic the real API.
+
+Run with: poetry run python -m benchmarks.bench_disk_cache
+"""
+
+import os
+import tempfile
+import time
+from multiprocessing import get_context
+
+from benchmarks._server import BenchmarkClient, local_server
+
+from pyconnectwise.cache import CacheRule, ResponseCache, SQLiteCacheBackend
+from pyconnectwise.config import Config
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+
+BOARDS = 20
+LATENCY = 0.02
+STATUSES = [{"id": i, "name": f"Status {i}", "sortOrder": i} for i in range(100)]
+
+
+def worker(url: str, path: str | None) -> float:
+    backend = SQLiteCacheBackend(path) if path else None
+    cache = ResponseCache([CacheRule("service/boards/*", ttl=3600)], backend)
+    start = time.perf_counter()
+    with BenchmarkClient(url, Config(response_cache=cache)) as client:
+        boards = ServiceEndpoint(client).boards
+        for board_id in range(1, BOARDS + 1):
+            if len(boards.id(board_id).statuses.get()) != len(STATUSES):
+                raise RuntimeError("fetched the wrong statuses")  # noqa: TRY003
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    print(f"fetching {BOARDS} boards' statuses, with {LATENCY * 1000:.0f}ms of latency per request")
+    with (
+        local_server(STATUSES, latency=LATENCY) as url,
+        tempfile.TemporaryDirectory() as directory,
+        get_context("spawn").Pool(1) as pool,
+    ):
+        path = os.path.join(directory, "cache.db")  # noqa: PTH118
+        print(f"{'memory cache, new worker':<32} {pool.apply(worker, (url, None)):6.3f}s")
+        print(f"{'disk cache, first worker':<32} {pool.apply(worker, (url, path)):6.3f}s")
+        print(f"{'disk cache, another worker':<32} {pool.apply(worker, (url, path)):6.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Compares the cost of reaching a nested endpoint, e.g. client.service.tickets.id(1).notes, now that child
+endpoints are only created when they're first accessed, against building each endpoint's whole subtree up
+front like the generated endpoints used to. Also times repeated access through the same client, which reuses
+the cached children. No requests are made.
+
+Run with: poetry run python -m benchmarks.bench_endpoint_tree
+"""
+
+import time
+from functools import cached_property
+
+from benchmarks._server import BenchmarkClient
+
+from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+
+ITERATIONS = 200
+
+
+def build_subtree(endpoint: ConnectWiseEndpoint) -> int:
+    """
+    Create every child endpoint below the given one, like the endpoints' __init__ used to. Returns how many.
+    """
+    count = 0
+    for name, attribute in vars(type(endpoint)).items():
+        if isinstance(attribute, cached_property):
+            count += 1 + build_subtree(getattr(endpoint, name))
+    return count
+
+
+def reach_notes(service: ServiceEndpoint) -> ConnectWiseEndpoint:
+    return service.tickets.id(1).notes
+
+
+def timed(func) -> float:  # noqa: ANN001
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+def main() -> None:
+    client = BenchmarkClient("http://localhost")
+
+    subtree_size = build_subtree(ServiceEndpoint(client))
+    eager = timed(lambda: (service := ServiceEndpoint(client), build_subtree(service), reach_notes(service)))
+    lazy = timed(lambda: reach_notes(ServiceEndpoint(client)))
+    service = ServiceEndpoint(client)
+    cached = timed(lambda: reach_notes(service))
+
+    print(f"reaching service.tickets.id(1).notes, {subtree_size} endpoints below service")
+    print(f"whole subtree up front:    {eager * 1e6:9.1f}us")
+    print(f"lazy, first access:        {lazy * 1e6:9.1f}us ({eager / lazy:.0f}x)")
+    print(f"lazy, cached children:     {cached * 1e6:9.1f}us ({eager / cached:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Measures the throughput of exporting 50,000 tickets to each format, against fetching and writing the same pages one
+after the other, and the cost of checkpointing every page. The local server adds 20ms of latency to every response to
+mimic the real API, which the export overlaps with writing the previous pages.
+
+Run with: poetry run python -m benchmarks.bench_export
+"""
+
+import importlib.util
+import os
+import re
+import tempfile
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks._server import BenchmarkClient, local_server
+
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+from pyconnectwise.export import _get_pages, _NDJSONWriter, export
+
+COUNT = 50_000
+LATENCY = 0.02
+TICKETS = [
+    {
+        "id": i,
+        "summary": f"Ticket {i}",
+        "recordType": "ServiceTicket",
+        "board": {"id": 1, "name": "Service Board", "_info": {"board_href": "https://example.com/boards/1"}},
+        "status": {"id": 2, "name": "New", "sort": 0},
+        "company": {"id": i % 500, "identifier": f"Company{i % 500}", "name": f"Company {i % 500}"},
+        "priority": {"id": 3, "name": "Priority 3 - Normal Response", "sort": 6},
+        "actualHours": i % 7 * 0.25,
+        "approved": i % 2 == 0,
+        "customFields": [{"id": 1, "caption": "Source", "value": "Email"}],
+        "_info": {"lastUpdated": "2024-01-01T00:00:00Z", "updatedBy": "admin"},
+    }
+    for i in range(1, COUNT + 1)
+]
+
+
+def tickets(path: str) -> tuple[object, dict[str, str]]:
+    query = parse_qs(urlsplit(path).query)
+    after = re.search(r"id > (\d+)", query.get("conditions", [""])[0])
+    start = int(after.group(1)) if after else 0
+    return TICKETS[start : start + int(query["pageSize"][0])], {}
+
+
+def measure(label: str, path: str, run) -> None:  # noqa: ANN001
+    start = time.perf_counter()
+    count = run()
+    elapsed = time.perf_counter() - start
+    if count != COUNT:
+        raise RuntimeError(f"{label} exported {count} tickets, expected {COUNT}")  # noqa: TRY003
+    size = os.path.getsize(path) / 1024 / 1024  # noqa: PTH202
+    print(f"{label:<22} {elapsed:6.2f}s  {count / elapsed:9,.0f} rows/s  {size / elapsed:6.1f} MB/s  {size:6.1f} MB")
+
+
+def write_sequentially(endpoint, path: str) -> int:  # noqa: ANN001
+    writer = _NDJSONWriter(open(path, "wb"), None)  # noqa: PTH123, SIM115
+    count = 0
+    for page in _get_pages(endpoint, None, 1000):
+        writer.write(page)
+        count += len(page)
+    writer.close()
+    return count
+
+
+def main() -> None:
+    print(f"exporting {COUNT} tickets with {LATENCY * 1000:.0f}ms of latency per request")
+    formats = ["tickets.ndjson", "tickets.ndjson.gz", "tickets.csv", "tickets.csv.gz"]
+    if importlib.util.find_spec("pyarrow"):
+        formats.append("tickets.parquet")
+    with (
+        tempfile.TemporaryDirectory() as directory,
+        local_server(tickets, latency=LATENCY) as url,
+        BenchmarkClient(url) as client,
+    ):
+        endpoint = ServiceEndpoint(client).tickets
+        path = os.path.join(directory, "sequential.ndjson")  # noqa: PTH118
+        measure("sequential ndjson", path, lambda: write_sequentially(endpoint, path))
+        for name in formats:
+            path = os.path.join(directory, name)  # noqa: PTH118
+            measure(name, path, lambda path=path: export(endpoint, path))
+        path = os.path.join(directory, "checkpointed.csv.gz")  # noqa: PTH118
+        checkpoint = os.path.join(directory, "checkpoint.json")  # noqa: PTH118
+        measure("checkpointed csv.gz", path, lambda: export(endpoint, path, checkpoint=checkpoint))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Compares looking up 2000 companies by id in URL-sized "id in (...)" chunks requested one after another, against
+get_many_by_ids(), which requests the chunks concurrently over the client's connection pool. (Requesting each
+company on its own takes over 40s.) The local server adds 20ms of latency to every response to mimic the real API.
+
+Run with: poetry run python -m benchmarks.bench_get_many_by_ids
+"""
+
+import re
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks._server import BenchmarkClient, local_server
+
+from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+from pyconnectwise.interfaces import _get_id_requests
+
+COUNT = 2000
+LATENCY = 0.02
+IDS = [250_000 + i for i in range(COUNT)]
+
+
+def company(id_: int) -> dict:
+    return {"id": id_, "identifier": f"Company{id_}", "name": f"Company {id_}"}
+
+
+def companies(path: str) -> tuple[object, dict[str, str]]:
+    conditions = parse_qs(urlsplit(path).query)["conditions"][0]
+    return [company(int(i)) for i in re.findall(r"\d+", conditions)], {}
+
+
+def measure(label: str, lookup) -> None:  # noqa: ANN001
+    start = time.perf_counter()
+    found = lookup()
+    elapsed = time.perf_counter() - start
+    if [c.id for c in found] != IDS:
+        raise RuntimeError(f"{label} found the wrong companies")  # noqa: TRY003
+    print(f"{label:<28} {elapsed:6.2f}s")
+
+
+def main() -> None:
+    print(f"looking up {COUNT} companies, with {LATENCY * 1000:.0f}ms of latency per request")
+    with local_server(companies, latency=LATENCY) as url, BenchmarkClient(url) as client:
+        endpoint = CompanyEndpoint(client).companies
+        chunks = _get_id_requests(endpoint, IDS, None, None)
+        measure(
+            f"{len(chunks)} chunks, one by one",
+            lambda: [c for _, _, params in chunks for c in endpoint.get(params=params)],
+        )
+        measure("get_many_by_ids()", lambda: endpoint.get_many_by_ids(IDS))
+
+
+if __name__ == "__main__":
+    main()
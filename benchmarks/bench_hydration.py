@@ -0,0 +1,62 @@
+"""
+Compares looking up the company of each of 500 tickets one request per ticket (the N+1 pattern) against hydrating
+the tickets' company references with a Hydrator, which looks up the 100 distinct companies in one chunked,
+concurrent batch. The local server adds 10ms of latency to every response to mimic the real API.
+
+Run with: poetry run python -m benchmarks.bench_hydration
+"""
+
+import re
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks._server import BenchmarkClient, local_server
+
+from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+from pyconnectwise.hydration import Hydrator
+from pyconnectwise.models.manage import Ticket
+
+COUNT = 500
+COMPANIES = 100
+LATENCY = 0.01
+
+
+def company(id_: int) -> dict:
+    return {"id": id_, "identifier": f"Company{id_}", "name": f"Company {id_}", "addressLine1": f"{id_} Main St"}
+
+
+def companies(path: str) -> tuple[object, dict[str, str]]:
+    url = urlsplit(path)
+    if url.path.endswith("/companies"):
+        conditions = parse_qs(url.query)["conditions"][0]
+        return [company(int(i)) for i in re.findall(r"\d+", conditions)], {}
+    return company(int(url.path.rsplit("/", 1)[1])), {}
+
+
+def tickets() -> list[Ticket]:
+    return [
+        Ticket.model_validate({"id": i, "summary": f"Ticket {i}", "company": {"id": i % COMPANIES}})
+        for i in range(COUNT)
+    ]
+
+
+def main() -> None:
+    print(f"{COUNT} tickets of {COMPANIES} companies, with {LATENCY * 1000:.0f}ms of latency per request")
+    with local_server(companies, latency=LATENCY) as url, BenchmarkClient(url) as client:
+        endpoint = CompanyEndpoint(client).companies
+
+        start = time.perf_counter()
+        addresses = [endpoint.id(ticket.company.id).get().address_line1 for ticket in tickets()]
+        print(f"{'one request per ticket':<24} {time.perf_counter() - start:6.2f}s")
+
+        start = time.perf_counter()
+        hydrator = Hydrator()
+        items = tickets()
+        hydrator.prefetch(items, (Ticket.company, endpoint))
+        print(f"{'Hydrator':<24} {time.perf_counter() - start:6.2f}s")
+        if [hydrator.resolve(ticket, Ticket.company).address_line1 for ticket in items] != addresses:
+            raise RuntimeError("Hydrated companies don't match")  # noqa: TRY003
+
+
+if __name__ == "__main__":
+    main()
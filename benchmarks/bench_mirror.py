@@ -0,0 +1,69 @@
+"""
+Compares a dashboard query for 50 open tickets sent to the API against the same query run on a Mirror of 20,000
+tickets. The local server adds 100ms of latency to every response, which is quick for a conditions query on a big
+table of the real API.
+
+Run with: poetry run python -m benchmarks.bench_mirror
+"""
+
+import re
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks._server import BenchmarkClient, local_server
+
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+from pyconnectwise.mirror import Mirror
+
+COUNT = 20_000
+LATENCY = 0.1
+CONDITIONS = 'board/name = "Help Desk" and closedFlag = false and priority/id in (1, 2)'
+TICKETS = [
+    {
+        "id": i,
+        "summary": f"Ticket {i}",
+        "board": {"id": i % 5, "name": "Help Desk" if i % 5 == 0 else f"Board {i % 5}"},
+        "priority": {"id": i % 4, "name": f"Priority {i % 4}"},
+        "company": {"id": i % 300, "identifier": f"Company{i % 300}", "name": f"Company {i % 300}"},
+        "closedFlag": i % 3 == 0,
+        "_info": {"lastUpdated": f"2024-01-01T00:{i // 3600 % 60:02d}:{i % 60:02d}Z"},
+    }
+    for i in range(1, COUNT + 1)
+]
+MATCHING = [t for t in TICKETS if t["board"]["id"] == 0 and not t["closedFlag"] and t["priority"]["id"] in (1, 2)]
+
+
+def tickets(path: str) -> tuple[object, dict[str, str]]:
+    query = parse_qs(urlsplit(path).query)
+    conditions = query.get("conditions", [""])[0]
+    if conditions.startswith("board/name"):
+        return MATCHING[:50], {}
+    after = re.search(r"id > (\d+)", conditions)
+    start = int(after.group(1)) if after else 0
+    return TICKETS[start : start + int(query["pageSize"][0])], {}
+
+
+def measure(label: str, query, iterations: int) -> None:  # noqa: ANN001
+    if [t.id for t in query()] != [t["id"] for t in MATCHING[:50]]:
+        raise RuntimeError(f"{label} found the wrong tickets")  # noqa: TRY003
+    start = time.perf_counter()
+    for _ in range(iterations):
+        query()
+    elapsed = (time.perf_counter() - start) / iterations
+    print(f"{label:<16} {elapsed * 1000:8.2f}ms per query")
+
+
+def main() -> None:
+    print(f"querying {len(MATCHING[:50])} of {COUNT} tickets, with {LATENCY * 1000:.0f}ms of latency per request")
+    with local_server(tickets, latency=LATENCY) as url, BenchmarkClient(url) as client, Mirror() as mirror:
+        endpoint = ServiceEndpoint(client).tickets
+        mirrored = mirror.add(endpoint)
+        start = time.perf_counter()
+        mirror.sync()
+        print(f"{'first sync':<16} {(time.perf_counter() - start) * 1000:8.2f}ms")
+        measure("API", lambda: endpoint.get(params={"conditions": CONDITIONS, "pageSize": 50}), 10)
+        measure("mirror", lambda: mirrored.query(CONDITIONS, order_by="id", limit=50), 200)
+
+
+if __name__ == "__main__":
+    main()
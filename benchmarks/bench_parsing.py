@@ -0,0 +1,91 @@
+"""
+Compares parsing a 1000 row page the way endpoints used to, decoding the body with response.json() and then
+validating each decoded dict with model_validate(), against validating the raw body in one pass with a cached
+TypeAdapter(list[Model]).validate_json(), for Manage tickets and Automate computers. Also times the "raw"
+response mode, which skips validation and returns the decoded dicts.
+
+The pages are built from the models' own fields, filling every field (nested models included) with a value of
+the right type (nested models one level deep, like the references the API returns), like a real page of
+fully populated records.
+
+Run with: poetry run python -m benchmarks.bench_parsing
+"""
+
+import json
+import time
+import types
+import typing
+from datetime import datetime
+
+from benchmarks._server import BenchmarkClient
+from pydantic import BaseModel
+
+from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
+from pyconnectwise.models.automate import LabTechComputer
+from pyconnectwise.models.manage import Ticket
+from pyconnectwise.utils.helpers import get_list_adapter
+
+PAGE_SIZE = 1000
+ITERATIONS = 10
+
+SCALARS = {
+    str: "Printer on level 3 is jammed again",
+    int: 250,
+    float: 2.5,
+    bool: True,
+    datetime: "2023-11-02T04:15:00Z",
+}
+
+
+def sample_value(annotation: typing.Any, depth: int) -> typing.Any:  # noqa: ANN401
+    args = [a for a in typing.get_args(annotation) if a is not type(None)]
+    if isinstance(annotation, types.UnionType) or typing.get_origin(annotation) is typing.Union:
+        return sample_value(args[0], depth)
+    if typing.get_origin(annotation) is list:
+        value = sample_value(args[0], depth)
+        return [value, value] if value is not None else None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return sample_record(annotation, depth + 1) if depth == 0 else None
+    return SCALARS.get(annotation)
+
+
+def sample_record(model: type[BaseModel], depth: int = 0) -> dict[str, typing.Any]:
+    model.model_rebuild()
+    record = {}
+    for name, field in model.model_fields.items():
+        value = sample_value(field.annotation, depth)
+        if value is not None:
+            record[field.alias or name] = value
+    return record
+
+
+def timed(func) -> float:  # noqa: ANN001
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        func()
+    return (time.perf_counter() - start) / ITERATIONS
+
+
+def main() -> None:
+    endpoint = ConnectWiseEndpoint(BenchmarkClient("http://localhost"), "tickets")
+    raw_endpoint = endpoint.with_response_mode("raw")
+
+    print(f"parsing a page of {PAGE_SIZE}")
+    for model in (Ticket, LabTechComputer):
+        body = json.dumps([sample_record(model)] * PAGE_SIZE).encode()
+        adapter = get_list_adapter(model)
+        if [model.model_validate(d) for d in json.loads(body)] != adapter.validate_json(body):
+            raise RuntimeError("Parsed pages don't match")  # noqa: TRY003
+
+        previous = timed(lambda: [model.model_validate(d) for d in json.loads(body)])  # noqa: B023
+        validate_json = timed(lambda: adapter.validate_json(body))  # noqa: B023
+        raw = timed(lambda: raw_endpoint._parse_many(model, body))  # noqa: B023
+
+        print(f"{model.__name__} ({len(body) / 1024 / 1024:.1f} MiB body)")
+        print(f"  json() + model_validate():  {previous * 1000:7.1f}ms")
+        print(f"  validate_json():            {validate_json * 1000:7.1f}ms ({previous / validate_json:.1f}x)")
+        print(f"  raw response mode:          {raw * 1000:7.1f}ms ({previous / raw:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Compares walking every page of a paginated endpoint one page at a time versus prefetching
+upcoming pages concurrently with PaginatedResponse.all(concurrency=N), against a local
+stand-in server that adds a fixed latency to each response.
+
+Run with: poetry run python -m benchmarks.bench_prefetch
+"""
+
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks._server import BenchmarkClient, local_server
+
+from pyconnectwise.config import Config
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+
+PAGES = 40
+PAGE_SIZE = 100
+LATENCY = 0.05
+CONCURRENCY = 8
+
+
+def tickets_page(path: str) -> tuple[list[dict], dict[str, str]]:
+    page = int(parse_qs(urlsplit(path).query)["page"][0])
+    links = f'<https://localhost/service/tickets?pageSize={PAGE_SIZE}&page={PAGES}>; rel="last"'
+    if page < PAGES:
+        links += f', <https://localhost/service/tickets?pageSize={PAGE_SIZE}&page={page + 1}>; rel="next"'
+    tickets = [{"id": page * PAGE_SIZE + i, "summary": f"Ticket {i}"} for i in range(PAGE_SIZE)]
+    return tickets, {"Link": links}
+
+
+def walk(url: str, concurrency: int) -> float:
+    with BenchmarkClient(url, Config(pool_maxsize=CONCURRENCY)) as client:
+        tickets = ServiceEndpoint(client).tickets
+        start = time.perf_counter()
+        count = sum(1 for _ in tickets.paginated(1, PAGE_SIZE).all(concurrency=concurrency))
+        elapsed = time.perf_counter() - start
+    if count != PAGES * PAGE_SIZE:
+        raise RuntimeError(f"expected {PAGES * PAGE_SIZE} tickets, got {count}")  # noqa: TRY003
+    return elapsed
+
+
+def main() -> None:
+    with local_server(tickets_page, latency=LATENCY) as url:
+        sequential = walk(url, 1)
+        prefetched = walk(url, CONCURRENCY)
+
+    print(f"{PAGES} pages, {LATENCY * 1000:.0f}ms latency per page")
+    print(f"one page at a time:        {sequential:6.2f}s")
+    print(f"prefetch concurrency={CONCURRENCY}:  {prefetched:6.2f}s ({sequential / prefetched:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Compares fetching a list of 50 service boards from the API every time against answering the requests from a
+ResponseCache, at the client level and through an endpoint (in both response modes). The local server adds 20ms
+of latency to every response to mimic the real API.
+
+Run with: poetry run python -m benchmarks.bench_response_cache
+"""
+
+import time
+
+from benchmarks._server import BenchmarkClient, local_server
+
+from pyconnectwise.cache import CacheRule, ResponseCache
+from pyconnectwise.config import Config
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+
+LATENCY = 0.02
+BOARDS = [
+    {"id": i, "name": f"Board {i}", "_info": {"statuses_href": f"/service/boards/{i}/statuses"}} for i in range(50)
+]
+
+
+def measure(label: str, request, iterations: int) -> None:  # noqa: ANN001
+    request()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        request()
+    elapsed = (time.perf_counter() - start) / iterations
+    print(f"{label:<36} {elapsed * 1_000_000:10.1f}us per request")
+
+
+def main() -> None:
+    print(f"fetching {len(BOARDS)} boards, with {LATENCY * 1000:.0f}ms of latency per request")
+    with local_server(BOARDS, latency=LATENCY) as url:
+        with BenchmarkClient(url) as client:
+            boards = ServiceEndpoint(client).boards
+            measure("uncached", boards.get, 20)
+
+        cache = ResponseCache([CacheRule("service/boards*", ttl=3600, stale_ttl=600)])
+        with BenchmarkClient(url, Config(response_cache=cache)) as client:
+            boards = ServiceEndpoint(client).boards
+            boards_url = f"{url}/service/boards"
+            measure("cached, client._make_request()", lambda: client._make_request("GET", boards_url), 10_000)
+            measure("cached, boards.get()", boards.get, 10_000)
+            measure("cached, raw boards.get()", boards.with_response_mode("raw").get, 10_000)
+        print(cache.stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+Compares fetching a page of 1000 fully populated tickets against selecting only the handful of fields a report
+needs with select(), which the local server applies to the response like the API does with the "fields"
+query parameter. Reports the size of the response body and the time to fetch and parse the page.
+
+Run with: poetry run python -m benchmarks.bench_select
+"""
+
+import json
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks._server import BenchmarkClient, local_server
+from benchmarks.bench_parsing import sample_record
+
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+from pyconnectwise.models.manage import Ticket
+
+PAGE_SIZE = 1000
+ITERATIONS = 10
+
+TICKETS = [{**sample_record(Ticket), "id": i} for i in range(PAGE_SIZE)]
+
+
+def project(record: dict, paths: list[list[str]]) -> dict:
+    projected: dict = {}
+    for path in paths:
+        source, target = record, projected
+        for key in path[:-1]:
+            source = source.get(key) or {}
+            target = target.setdefault(key, {})
+        if path[-1] in source:
+            target[path[-1]] = source[path[-1]]
+    return projected
+
+
+def tickets_page(path: str) -> tuple[list[dict], dict[str, str]]:
+    query = parse_qs(urlsplit(path).query)
+    if "fields" not in query:
+        return TICKETS, {}
+    paths = [field.split("/") for field in query["fields"][0].split(",")]
+    return [project(ticket, paths) for ticket in TICKETS], {}
+
+
+def measure(label: str, endpoint) -> None:  # noqa: ANN001
+    page = endpoint.paginated(1, PAGE_SIZE)
+    size = len(page.response.content)
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        endpoint.paginated(1, PAGE_SIZE)
+    elapsed = (time.perf_counter() - start) / ITERATIONS
+    print(f"{label:<52} {size / 1024:8.0f} KiB body  {elapsed * 1000:7.1f}ms per page")
+
+
+def main() -> None:
+    print(f"fetching a page of {PAGE_SIZE} tickets, {len(json.dumps(TICKETS[0]))} bytes of JSON each")
+    with local_server(tickets_page) as url, BenchmarkClient(url) as client:
+        tickets = ServiceEndpoint(client).tickets
+        measure("all fields", tickets)
+        measure(
+            "select(id, summary, status.name, company.identifier)",
+            tickets.select(Ticket.id, Ticket.summary, Ticket.status.name, Ticket.company.identifier),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Compares exporting 40,000 tickets in one process against a ShardedExtract over a pool of worker processes, with and
+without a shared rate limit. The local server adds 100ms of latency to every response to mimic the real API; with
+more cores, the workers also split the work of decoding and writing the items.
+
+Run with: poetry run python -m benchmarks.bench_sharding
+"""
+
+import functools
+import os
+import re
+import tempfile
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks._server import BenchmarkClient, local_server
+
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+from pyconnectwise.export import export
+from pyconnectwise.sharding import ShardedExtract
+
+COUNT = 40_000
+LATENCY = 0.1
+PROCESSES = 4
+TICKETS = [
+    {
+        "id": i,
+        "summary": f"Ticket {i}",
+        "board": {"id": 1, "name": "Service Board"},
+        "status": {"id": 2, "name": "New"},
+        "company": {"id": i % 500, "identifier": f"Company{i % 500}"},
+    }
+    for i in range(1, COUNT + 1)
+]
+
+
+def tickets(path: str) -> tuple[object, dict[str, str]]:
+    url = urlsplit(path)
+    if url.path.endswith("/count"):
+        return {"count": COUNT}, {}
+    query = parse_qs(url.query)
+    conditions = query.get("conditions", [""])[0]
+    low, high = 1, COUNT + 1
+    for operator, value in re.findall(r"id (>=|<|>) (\d+)", conditions):
+        if operator == "<":
+            high = min(high, int(value))
+        else:
+            low = max(low, int(value) + (operator == ">"))
+    rows = TICKETS[low - 1 : high - 1]
+    if query.get("orderBy") == ["id desc"]:
+        rows = rows[::-1]
+    return rows[: int(query["pageSize"][0])], {}
+
+
+class TicketsClient(BenchmarkClient):
+    @property
+    def service(self) -> ServiceEndpoint:
+        return ServiceEndpoint(self)
+
+
+def measure(label: str, run) -> None:  # noqa: ANN001
+    start = time.perf_counter()
+    count = run()
+    if count != COUNT:
+        raise RuntimeError(f"{label} exported {count} tickets, expected {COUNT}")  # noqa: TRY003
+    print(f"{label:<34} {time.perf_counter() - start:6.2f}s")
+
+
+def main() -> None:
+    print(f"exporting {COUNT} tickets with {LATENCY * 1000:.0f}ms of latency per request, on {os.cpu_count()} CPUs")
+    with tempfile.TemporaryDirectory() as directory, local_server(tickets, latency=LATENCY) as url:
+        path = os.path.join(directory, "tickets.ndjson")  # noqa: PTH118
+        client_factory = functools.partial(TicketsClient, url)
+        measure("one process", lambda: export(client_factory().service.tickets, path))
+        for rate_limit in (None, 20):
+            extract = ShardedExtract(client_factory, "service.tickets", path, rate_limit=rate_limit)
+            label = f"{PROCESSES} processes" + (f", {rate_limit} requests/s" if rate_limit else "")
+            measure(label, lambda extract=extract: extract.run(PROCESSES, rows_per_shard=5000))
+
+
+if __name__ == "__main__":
+    main()
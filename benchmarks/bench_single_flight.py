@@ -0,0 +1,56 @@
+"""
+Compares 200 threads (in batches of 50 at a time, like a busy web service) each looking up one of 4 companies, with
+and without a SingleFlight coalescing the identical requests in flight at the same time. The local server adds 50ms
+of latency to every response to mimic the real API, and counts the requests it gets.
+
+Run with: poetry run python -m benchmarks.bench_single_flight
+"""
+
+import itertools
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks._server import BenchmarkClient, local_server
+
+from pyconnectwise.config import Config
+from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+from pyconnectwise.single_flight import SingleFlight
+
+LOOKUPS = 200
+THREADS = 50
+LATENCY = 0.05
+served = itertools.count()
+
+
+def company(path: str) -> tuple[object, dict[str, str]]:
+    next(served)
+    id_ = int(path.rsplit("/", 1)[-1])
+    return {"id": id_, "identifier": f"Company{id_}", "name": f"Company {id_}"}, {}
+
+
+def measure(label: str, url: str, config: Config) -> None:
+    global served
+    served = itertools.count()
+    with BenchmarkClient(url, config) as client, ThreadPoolExecutor(THREADS) as executor:
+        companies = CompanyEndpoint(client).companies
+        start = time.perf_counter()
+        found = list(executor.map(lambda i: companies.id(i % 4 + 1).get(), range(LOOKUPS)))
+        elapsed = time.perf_counter() - start
+    if [c.id for c in found] != [i % 4 + 1 for i in range(LOOKUPS)]:
+        raise RuntimeError(f"{label} found the wrong companies")  # noqa: TRY003
+    print(f"{label:<16} {elapsed:6.2f}s {next(served):4d} requests to the API")
+
+
+def main() -> None:
+    print(
+        f"{LOOKUPS} lookups of 4 companies from {THREADS} threads, with {LATENCY * 1000:.0f}ms of latency per request"
+    )
+    with local_server(company, latency=LATENCY) as url:
+        measure("uncoalesced", url, Config(pool_maxsize=THREADS))
+        single_flight = SingleFlight()
+        measure("single flight", url, Config(pool_maxsize=THREADS, single_flight=single_flight))
+        print(single_flight.stats)
+
+
+if __name__ == "__main__":
+    main()
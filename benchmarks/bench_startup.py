@@ -0,0 +1,66 @@
+"""
+Measures what a short-lived process pays to start using pyconnectwise: importing the package and the models,
+and the first access of client.service.tickets, which imports the endpoints and the models they return.
+Each step runs in a fresh interpreter, timing only the step itself, and reports the median of several runs
+along with the process's peak memory, both with and without PYCONNECTWISE_DEFER_MODEL_BUILD set.
+
+Run with: poetry run python -m benchmarks.bench_startup
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+RUNS = 5
+
+STEPS = {
+    "import pyconnectwise": "import pyconnectwise",
+    "import pyconnectwise.models.manage": "import pyconnectwise.models.manage",
+    "from pyconnectwise.models.manage import Ticket": "from pyconnectwise.models.manage import Ticket",
+    "every Manage model": "import pyconnectwise.models.manage as m\nfor name in m.__all__: getattr(m, name)",
+    "client.service.tickets": (
+        "from pyconnectwise import ConnectWiseManageAPIClient\n"
+        "client = ConnectWiseManageAPIClient('company', 'localhost', 'client', 'public', 'private', 'v4_6_release')\n"
+        "client.service.tickets"
+    ),
+}
+
+RUNNER = """
+import resource, time, json
+start = time.perf_counter()
+exec(compile({code!r}, "<step>", "exec"))
+elapsed = time.perf_counter() - start
+print(json.dumps([elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss]))
+"""
+
+
+def run_step(code: str, defer_build: bool) -> tuple[float, float]:  # noqa: FBT001
+    command = [sys.executable, "-c", RUNNER.format(code=code)]
+    env = {**os.environ, "PYCONNECTWISE_DEFER_MODEL_BUILD": "1" if defer_build else ""}
+    results = []
+    for _ in range(RUNS):
+        process = subprocess.run(command, capture_output=True, check=True, env=env)  # noqa: S603
+        results.append(json.loads(process.stdout))
+    # ru_maxrss is in KiB on Linux
+    return statistics.median(r[0] for r in results), statistics.median(r[1] for r in results) / 1024
+
+
+def main() -> None:
+    # Make sure every module is compiled, so the first run isn't slower than the rest
+    run_step(STEPS["every Manage model"], defer_build=False)
+
+    print(f"median of {RUNS} fresh interpreters")
+    print(f"{'':48} {'schemas built on import':>28} {'deferred schema building':>28}")
+    for name, code in STEPS.items():
+        eager_elapsed, eager_memory = run_step(code, defer_build=False)
+        deferred_elapsed, deferred_memory = run_step(code, defer_build=True)
+        print(
+            f"{name:48} {eager_elapsed * 1000:9.1f}ms {eager_memory:7.1f} MiB peak"
+            f" {deferred_elapsed * 1000:9.1f}ms {deferred_memory:7.1f} MiB peak"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Compares peak memory when reading a page of 1000 tickets with paginated(), which holds the whole body
+and every parsed model at once, versus stream_all(), which decodes and validates one ticket at a time.
+
+Run with: poetry run python -m benchmarks.bench_streaming
+"""
+
+import time
+import tracemalloc
+from urllib.parse import parse_qs, urlsplit
+
+from benchmarks._server import BenchmarkClient, local_server
+
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+
+PAGE_SIZE = 1000
+
+TICKETS = [
+    {
+        "id": i,
+        "summary": f"Ticket {i}",
+        "initialDescription": "Printer on level 3 is jammed again. " * 20,
+        "company": {"id": 250, "identifier": "HealthIT", "name": "Health IT"},
+        "board": {"id": 1, "name": "Service Desk"},
+        "status": {"id": 16, "name": "New"},
+        "customFields": [{"id": n, "caption": f"Field {n}", "value": None} for n in range(10)],
+    }
+    for i in range(PAGE_SIZE)
+]
+
+
+def tickets_page(path: str) -> tuple[list[dict], dict[str, str]]:
+    page = int(parse_qs(urlsplit(path).query)["page"][0])
+    return (TICKETS if page == 1 else []), {}
+
+
+def measure(label: str, read_page) -> None:  # noqa: ANN001
+    tracemalloc.start()
+    start = time.perf_counter()
+    count = read_page()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {count} tickets  peak {peak / 1024 / 1024:6.1f} MiB  {elapsed:5.2f}s")
+
+
+def main() -> None:
+    with local_server(tickets_page) as url, BenchmarkClient(url) as client:
+        tickets = ServiceEndpoint(client).tickets
+        measure("paginated(1, 1000).data", lambda: len(tickets.paginated(1, PAGE_SIZE).data))
+        measure("stream_all(1000)", lambda: sum(1 for _ in tickets.stream_all(PAGE_SIZE)))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,29 @@
+from typing import TYPE_CHECKING, Any
+
 from pyconnectwise.clients.automate_client import ConnectWiseAutomateAPIClient
 from pyconnectwise.clients.manage_client import ConnectWiseManageAPIClient
 
-__all__ = ["ConnectWiseManageAPIClient", "ConnectWiseAutomateAPIClient"]
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_automate_client import AsyncConnectWiseAutomateAPIClient  # noqa: TCH004
+    from pyconnectwise.clients.async_manage_client import AsyncConnectWiseManageAPIClient  # noqa: TCH004
+
+__all__ = [
+    "ConnectWiseManageAPIClient",
+    "ConnectWiseAutomateAPIClient",
+    "AsyncConnectWiseManageAPIClient",
+    "AsyncConnectWiseAutomateAPIClient",
+]
 __version__ = "0.6.1"
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    # The async clients are imported on first use so httpx stays an optional dependency
+    if name == "AsyncConnectWiseManageAPIClient":
+        from pyconnectwise.clients.async_manage_client import AsyncConnectWiseManageAPIClient
+
+        return AsyncConnectWiseManageAPIClient
+    if name == "AsyncConnectWiseAutomateAPIClient":
+        from pyconnectwise.clients.async_automate_client import AsyncConnectWiseAutomateAPIClient
+
+        return AsyncConnectWiseAutomateAPIClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")  # noqa: TRY003
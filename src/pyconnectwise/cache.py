@@ -0,0 +1,418 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from typing import TYPE_CHECKING, Any
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping
+
+
+class CacheRule:
+    """
+    Which GET requests to cache, and for how long.
+
+    Args:
+        match (str | type): Either a path pattern, matched against the path below the client's URL with shell-style
+            wildcards (e.g. "service/boards*" or "*/info/*"), or an endpoint class (e.g. ServiceInfoBoardsEndpoint),
+            matching the requests made through it.
+        ttl (float): How many seconds a cached response is used for before it's looked up again.
+        stale_ttl (float): For how many seconds after that the stale response is still used, while it's refreshed
+            in the background (default = 0, a stale response is never used).
+    """
+
+    def __init__(self, match: str | type, ttl: float, stale_ttl: float = 0.0) -> None:
+        self.match = match
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+
+    def matches(self, path: str, endpoint_class: type | None) -> bool:
+        if isinstance(self.match, str):
+            return fnmatchcase(path, self.match)
+        return endpoint_class is not None and issubclass(endpoint_class, self.match)
+
+
+class CacheEntry:
+    """
+    A cached response, along with when it goes stale and when it expires (as Unix timestamps, so entries can be
+    shared between processes).
+    """
+
+    __slots__ = ("response", "fresh_until", "stale_until")
+
+    def __init__(self, response: Any, fresh_until: float, stale_until: float) -> None:  # noqa: ANN401
+        self.response = response
+        self.fresh_until = fresh_until
+        self.stale_until = stale_until
+
+
+class CacheStats:
+    """
+    Counts of how the response cache has been used.
+
+    Attributes:
+        hits (int): Requests answered with a fresh cached response.
+        stale_hits (int): Requests answered with a stale cached response, which was then refreshed in the background.
+        misses (int): Requests that weren't cached (or whose cached response had expired), and went to the API.
+        refreshes (int): Background refreshes of stale responses.
+        evictions (int): Responses dropped to keep the cache within its size.
+    """
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.refreshes = 0
+        self.evictions = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"CacheStats(hits={self.hits}, stale_hits={self.stale_hits}, misses={self.misses}, "
+            f"refreshes={self.refreshes}, evictions={self.evictions})"
+        )
+
+
+class MemoryCacheBackend:
+    """
+    Keeps cached responses in memory, evicting the least recently used once there are more than `max_entries`.
+    Responses are kept as they are, so a cache hit costs a dict lookup.
+
+    Args:
+        max_entries (int): The most responses to keep (default = 1000).
+    """
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: tuple, entry: CacheEntry) -> int:  # noqa: A003
+        """
+        Store an entry.
+
+        Returns:
+            int: The number of entries evicted to make room for it.
+        """
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def delete_prefix(self, url_prefix: str) -> None:
+        # Only whole path segments match: .../purchaseorders doesn't match .../purchaseorderstatuses
+        below = (f"{url_prefix}/", f"{url_prefix}?")
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == url_prefix or key[0].startswith(below)]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class ResponseCache:
+    """
+    Caches the responses to GET requests matching its rules, for data that rarely changes, like boards, statuses,
+    members and the /info endpoints. Set it in the client's Config to use it.
+
+    A cached response is reused until its rule's ttl runs out. With a stale_ttl, it's then still used for that much
+    longer while a fresh copy is fetched in the background, so callers never wait on the API for cached data.
+    Changing anything through the client (a POST, PUT, PATCH or DELETE) drops the cached responses under the
+    changed collection.
+
+    Responses are cached per URL, query parameters and credentials. Streamed requests (see stream_all()) aren't
+    cached.
+
+    Args:
+        rules (Iterable[CacheRule]): The requests to cache. The first rule matching a request applies.
+        backend (optional): Where responses are kept (default = MemoryCacheBackend()). Use a SQLiteCacheBackend to
+            keep them on disk and share them between processes.
+
+    Example:
+        config = Config(response_cache=ResponseCache([
+            CacheRule("service/boards*", ttl=3600, stale_ttl=600),
+            CacheRule(SystemMembersEndpoint, ttl=300),
+        ]))
+    """
+
+    def __init__(self, rules: Iterable[CacheRule], backend: Any = None) -> None:  # noqa: ANN401
+        self.rules = list(rules)
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.stats = CacheStats()
+        self._refreshing: set[tuple] = set()
+        self._lock = threading.Lock()
+
+    def get_rule(self, path: str, endpoint_class: type | None = None) -> CacheRule | None:
+        """
+        Get the rule for a request, by its path below the client's URL and the class of the endpoint making it.
+        """
+        return next((rule for rule in self.rules if rule.matches(path, endpoint_class)), None)
+
+    def get_key(self, url: str, params: Mapping[str, Any] | None, headers: Mapping[str, str]) -> tuple:
+        # Include the credentials, so clients for different companies sharing a Config don't share responses
+        credentials = headers.get("Authorization") or headers.get("authorization")
+        return (url, tuple(sorted((k, str(v)) for k, v in (params or {}).items())), credentials)
+
+    def get(self, key: tuple) -> tuple[Any, bool]:
+        """
+        Look up a cached response.
+
+        Returns:
+            tuple: The response (None if there's no usable one), and whether it's stale and needs refreshing.
+        """
+        entry = self.backend.get(key)
+        now = time.time()
+        with self._lock:
+            if entry is None or now >= entry.stale_until:
+                self.stats.misses += 1
+                return None, False
+            if now < entry.fresh_until:
+                self.stats.hits += 1
+                return entry.response, False
+            self.stats.stale_hits += 1
+            return entry.response, True
+
+    def set(self, key: tuple, rule: CacheRule, response: Any) -> None:  # noqa: A003, ANN401
+        now = time.time()
+        evicted = self.backend.set(key, CacheEntry(response, now + rule.ttl, now + rule.ttl + rule.stale_ttl))
+        with self._lock:
+            self.stats.evictions += evicted
+
+    def get_validators(self, key: tuple) -> dict[str, str]:
+        """
+        Get the headers to make a request for an expired response conditional on it having changed, from the
+        response's ETag and Last-Modified headers.
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            return {}
+        validators = {}
+        if etag := entry.response.headers.get("ETag"):
+            validators["If-None-Match"] = etag
+        if last_modified := entry.response.headers.get("Last-Modified"):
+            validators["If-Modified-Since"] = last_modified
+        return validators
+
+    def revalidate(self, key: tuple, rule: CacheRule) -> Any:  # noqa: ANN401
+        """
+        Renew an expired response the API says hasn't changed (with a 304 Not Modified).
+
+        Returns:
+            The cached response, or None if it's no longer cached.
+        """
+        entry = self.backend.get(key)
+        if entry is None:
+            return None
+        self.set(key, rule, entry.response)
+        return entry.response
+
+    def invalidate(self, url: str) -> None:
+        """
+        Drop the cached responses for a URL and everything below the collection it's in, e.g. a PUT to
+        .../service/boards/5 drops the cached responses for .../service/boards and .../service/boards/5/statuses.
+        """
+        collection = url.rstrip("/")
+        while collection.rsplit("/", 1)[-1].isdigit():
+            collection = collection.rsplit("/", 1)[0]
+        self.backend.delete_prefix(collection)
+
+    def invalidate_for(self, method: str, url: str) -> None:
+        """
+        Drop the cached responses a request that isn't a GET may have changed, see invalidate(). POSTs to search
+        endpoints, like .../service/tickets/search (which get_many_by_ids() uses), only read, so they drop nothing.
+        """
+        if method == "POST" and url.rstrip("/").endswith("/search"):
+            return
+        self.invalidate(url)
+
+    def clear(self) -> None:
+        self.backend.clear()
+
+    def start_refresh(self, key: tuple) -> bool:
+        """
+        Claim the background refresh of a stale response.
+
+        Returns:
+            bool: Whether the caller should refresh it, False if it's already being refreshed.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            self.stats.refreshes += 1
+            return True
+
+    def finish_refresh(self, key: tuple) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+
+class SQLiteCacheBackend:
+    """
+    Keeps cached responses in an SQLite database on disk, so they outlive the process and are shared by every
+    process using the same file. A worker that starts after another has warmed the cache starts warm too.
+
+    Response bodies are stored compressed, along with their headers (including the ETag and Last-Modified
+    validators, so expired responses can be renewed with a conditional request). The database is in WAL mode, so
+    any number of processes (and threads) can read while one writes. Once the stored bodies take up more than
+    `max_bytes`, the least recently used responses are evicted.
+
+    Args:
+        path (str): The database file. It's created if it doesn't exist.
+        max_bytes (int): The most space the compressed response bodies can take up (default = 100 MiB).
+        compression_level (int): The zlib compression level, from 1 (fastest) to 9 (smallest) (default = 6).
+    """
+
+    # Reading an entry only counts as using it (for eviction) once this many seconds after it was last used,
+    # so a hot entry isn't written back to disk on every read
+    ACCESS_RESOLUTION = 60.0
+
+    def __init__(self, path: str, max_bytes: int = 100 * 1024 * 1024, compression_level: int = 6) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compression_level = compression_level
+        self._local = threading.local()
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, url TEXT NOT NULL, kind TEXT NOT NULL, status INTEGER NOT NULL, "
+                "headers TEXT NOT NULL, content BLOB NOT NULL, size INTEGER NOT NULL, "
+                "fresh_until REAL NOT NULL, stale_until REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads, so each thread gets its own
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    @staticmethod
+    def _hash_key(key: tuple) -> str:
+        # The key includes the client's credentials, which shouldn't be written to disk as they are
+        return hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+    def get(self, key: tuple) -> CacheEntry | None:
+        connection = self._connect()
+        hashed_key = self._hash_key(key)
+        row = connection.execute(
+            "SELECT url, kind, status, headers, content, fresh_until, stale_until, accessed "
+            "FROM responses WHERE key = ?",
+            (hashed_key,),
+        ).fetchone()
+        if row is None:
+            return None
+        url, kind, status, headers, content, fresh_until, stale_until, accessed = row
+        now = time.time()
+        if now - accessed > self.ACCESS_RESOLUTION:
+            connection.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, hashed_key))
+        response = _build_response(kind, url, status, json.loads(headers), zlib.decompress(content))
+        return CacheEntry(response, fresh_until, stale_until)
+
+    def set(self, key: tuple, entry: CacheEntry) -> int:  # noqa: A003
+        """
+        Store an entry.
+
+        Returns:
+            int: The number of entries evicted to make room for it.
+        """
+        response = entry.response
+        kind = "httpx" if type(response).__module__.startswith("httpx") else "requests"
+        # The body is stored decoded, so the headers describing how it was sent no longer apply
+        headers = {k: v for k, v in response.headers.items() if k.lower() not in ("content-encoding", "content-length")}
+        content = zlib.compress(response.content, self.compression_level)
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    self._hash_key(key),
+                    key[0],
+                    kind,
+                    response.status_code,
+                    json.dumps(headers),
+                    content,
+                    len(content),
+                    entry.fresh_until,
+                    entry.stale_until,
+                    time.time(),
+                ),
+            )
+            evicted = self._evict(connection)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return evicted
+
+    def _evict(self, connection: sqlite3.Connection) -> int:
+        (total,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return 0
+        # Expired responses go first, then the least recently used
+        evicted = connection.execute("DELETE FROM responses WHERE stale_until < ?", (time.time(),)).rowcount
+        (total,) = connection.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        for key, size in connection.execute("SELECT key, size FROM responses ORDER BY accessed").fetchall():
+            if total <= self.max_bytes:
+                break
+            connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        return evicted
+
+    def delete_prefix(self, url_prefix: str) -> None:
+        self._connect().execute(
+            "DELETE FROM responses WHERE url = ? OR substr(url, 1, ?) IN (?, ?)",
+            (url_prefix, len(url_prefix) + 1, f"{url_prefix}/", f"{url_prefix}?"),
+        )
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM responses")
+
+
+def _build_response(kind: str, url: str, status: int, headers: dict[str, str], content: bytes) -> Any:  # noqa: ANN401
+    """
+    Rebuild a response read from disk, as the kind of response the client that cached it uses.
+    """
+    if kind == "httpx":
+        import httpx
+
+        return httpx.Response(status, headers=headers, content=content, request=httpx.Request("GET", url))
+    response = requests.Response()
+    response.status_code = status
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.url = url
+    response.encoding = get_encoding_from_headers(response.headers)
+    return response
@@ -0,0 +1,270 @@
+import asyncio
+import typing
+from datetime import UTC, datetime
+from functools import cached_property
+
+from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+from pyconnectwise.config import Config
+
+if typing.TYPE_CHECKING:
+    from pyconnectwise.endpoints.automate_async.ClientsEndpoint import ClientsEndpoint
+    from pyconnectwise.endpoints.automate_async.CommandsEndpoint import CommandsEndpoint
+    from pyconnectwise.endpoints.automate_async.ComputersEndpoint import ComputersEndpoint
+    from pyconnectwise.endpoints.automate_async.ContactsEndpoint import ContactsEndpoint
+    from pyconnectwise.endpoints.automate_async.DataviewfoldersEndpoint import DataviewfoldersEndpoint
+    from pyconnectwise.endpoints.automate_async.DataviewsEndpoint import DataviewsEndpoint
+    from pyconnectwise.endpoints.automate_async.DrivesEndpoint import DrivesEndpoint
+    from pyconnectwise.endpoints.automate_async.ExternalsystemcredentialsEndpoint import (
+        ExternalsystemcredentialsEndpoint,
+    )
+    from pyconnectwise.endpoints.automate_async.GroupsEndpoint import GroupsEndpoint
+    from pyconnectwise.endpoints.automate_async.LocationsEndpoint import LocationsEndpoint
+    from pyconnectwise.endpoints.automate_async.LookupsEndpoint import LookupsEndpoint
+    from pyconnectwise.endpoints.automate_async.MonitorsEndpoint import MonitorsEndpoint
+    from pyconnectwise.endpoints.automate_async.NetworkdevicesEndpoint import NetworkdevicesEndpoint
+    from pyconnectwise.endpoints.automate_async.PatchactionsEndpoint import PatchactionsEndpoint
+    from pyconnectwise.endpoints.automate_async.PermissionsEndpoint import PermissionsEndpoint
+    from pyconnectwise.endpoints.automate_async.ProbeconfigurationEndpoint import ProbeconfigurationEndpoint
+    from pyconnectwise.endpoints.automate_async.ScriptfoldersEndpoint import ScriptfoldersEndpoint
+    from pyconnectwise.endpoints.automate_async.ScriptingEndpoint import ScriptingEndpoint
+    from pyconnectwise.endpoints.automate_async.ScriptsEndpoint import ScriptsEndpoint
+    from pyconnectwise.endpoints.automate_async.ServicesEndpoint import ServicesEndpoint
+    from pyconnectwise.endpoints.automate_async.StatisticsEndpoint import StatisticsEndpoint
+    from pyconnectwise.endpoints.automate_async.SystemEndpoint import SystemEndpoint
+    from pyconnectwise.endpoints.automate_async.UserclassesEndpoint import UserclassesEndpoint
+    from pyconnectwise.endpoints.automate_async.UsersEndpoint import UsersEndpoint
+
+
+class AsyncConnectWiseAutomateAPIClient(AsyncConnectWiseClient):
+    """
+    ConnectWise Automate API client. Handles the connection to the ConnectWise Automate API
+    and the configuration of all the available endpoints.
+
+    All requests made through this client's endpoints are awaitable. The first access token
+    is obtained on the first request rather than during initialization.
+    """
+
+    # The Automate API names its filter query parameter "condition", rather than Manage's "conditions"
+    _conditions_param = "condition"
+    # Automate selects fields with "includeFields", and only by their top level name
+    _fields_param = "includeFields"
+
+    def __init__(
+        self, automate_url: str, client_id: str, username: str, password: str, config: Config | None = None
+    ) -> None:
+        """
+        Initializes the client with the given credentials and optionally a specific codebase.
+        If no codebase is given, it tries to get it from the API.
+
+        Parameters:
+            automate_url (str): URL of your ConnectWise Automate instance.
+            client_id (str): Your ConnectWise Automate API Client ID.
+            username (str): Your ConnectWise Automate API username.
+            password (str): Your ConnectWise Automate API password.
+            config (Config, optional): Optional additional configuration for API interactions.
+        """
+        self.client_id: str = client_id
+        self.automate_url: str = automate_url
+        self.username: str = username
+        self.password: str = password
+        self.token_expiry_time: datetime = datetime.now(tz=UTC)
+
+        if config:
+            self.config = config
+
+        # The first access token is grabbed by the first request, as __init__ can't await
+        self.access_token: str | None = None
+        self._token_lock = asyncio.Lock()
+
+    # Initializing endpoints
+    @cached_property
+    def commands(self) -> "CommandsEndpoint":
+        from pyconnectwise.endpoints.automate_async.CommandsEndpoint import CommandsEndpoint
+
+        return CommandsEndpoint(self)
+
+    @cached_property
+    def clients(self) -> "ClientsEndpoint":
+        from pyconnectwise.endpoints.automate_async.ClientsEndpoint import ClientsEndpoint
+
+        return ClientsEndpoint(self)
+
+    @cached_property
+    def computers(self) -> "ComputersEndpoint":
+        from pyconnectwise.endpoints.automate_async.ComputersEndpoint import ComputersEndpoint
+
+        return ComputersEndpoint(self)
+
+    @cached_property
+    def services(self) -> "ServicesEndpoint":
+        from pyconnectwise.endpoints.automate_async.ServicesEndpoint import ServicesEndpoint
+
+        return ServicesEndpoint(self)
+
+    @cached_property
+    def contacts(self) -> "ContactsEndpoint":
+        from pyconnectwise.endpoints.automate_async.ContactsEndpoint import ContactsEndpoint
+
+        return ContactsEndpoint(self)
+
+    @cached_property
+    def dataviewfolders(self) -> "DataviewfoldersEndpoint":
+        from pyconnectwise.endpoints.automate_async.DataviewfoldersEndpoint import DataviewfoldersEndpoint
+
+        return DataviewfoldersEndpoint(self)
+
+    @cached_property
+    def dataviews(self) -> "DataviewsEndpoint":
+        from pyconnectwise.endpoints.automate_async.DataviewsEndpoint import DataviewsEndpoint
+
+        return DataviewsEndpoint(self)
+
+    @cached_property
+    def groups(self) -> "GroupsEndpoint":
+        from pyconnectwise.endpoints.automate_async.GroupsEndpoint import GroupsEndpoint
+
+        return GroupsEndpoint(self)
+
+    @cached_property
+    def monitors(self) -> "MonitorsEndpoint":
+        from pyconnectwise.endpoints.automate_async.MonitorsEndpoint import MonitorsEndpoint
+
+        return MonitorsEndpoint(self)
+
+    @cached_property
+    def networkdevices(self) -> "NetworkdevicesEndpoint":
+        from pyconnectwise.endpoints.automate_async.NetworkdevicesEndpoint import NetworkdevicesEndpoint
+
+        return NetworkdevicesEndpoint(self)
+
+    @cached_property
+    def patchactions(self) -> "PatchactionsEndpoint":
+        from pyconnectwise.endpoints.automate_async.PatchactionsEndpoint import PatchactionsEndpoint
+
+        return PatchactionsEndpoint(self)
+
+    @cached_property
+    def locations(self) -> "LocationsEndpoint":
+        from pyconnectwise.endpoints.automate_async.LocationsEndpoint import LocationsEndpoint
+
+        return LocationsEndpoint(self)
+
+    @cached_property
+    def lookups(self) -> "LookupsEndpoint":
+        from pyconnectwise.endpoints.automate_async.LookupsEndpoint import LookupsEndpoint
+
+        return LookupsEndpoint(self)
+
+    @cached_property
+    def probeconfiguration(self) -> "ProbeconfigurationEndpoint":
+        from pyconnectwise.endpoints.automate_async.ProbeconfigurationEndpoint import ProbeconfigurationEndpoint
+
+        return ProbeconfigurationEndpoint(self)
+
+    @cached_property
+    def scriptfolders(self) -> "ScriptfoldersEndpoint":
+        from pyconnectwise.endpoints.automate_async.ScriptfoldersEndpoint import ScriptfoldersEndpoint
+
+        return ScriptfoldersEndpoint(self)
+
+    @cached_property
+    def scripting(self) -> "ScriptingEndpoint":
+        from pyconnectwise.endpoints.automate_async.ScriptingEndpoint import ScriptingEndpoint
+
+        return ScriptingEndpoint(self)
+
+    @cached_property
+    def scripts(self) -> "ScriptsEndpoint":
+        from pyconnectwise.endpoints.automate_async.ScriptsEndpoint import ScriptsEndpoint
+
+        return ScriptsEndpoint(self)
+
+    @cached_property
+    def drives(self) -> "DrivesEndpoint":
+        from pyconnectwise.endpoints.automate_async.DrivesEndpoint import DrivesEndpoint
+
+        return DrivesEndpoint(self)
+
+    @cached_property
+    def statistics(self) -> "StatisticsEndpoint":
+        from pyconnectwise.endpoints.automate_async.StatisticsEndpoint import StatisticsEndpoint
+
+        return StatisticsEndpoint(self)
+
+    @cached_property
+    def system(self) -> "SystemEndpoint":
+        from pyconnectwise.endpoints.automate_async.SystemEndpoint import SystemEndpoint
+
+        return SystemEndpoint(self)
+
+    @cached_property
+    def externalsystemcredentials(self) -> "ExternalsystemcredentialsEndpoint":
+        from pyconnectwise.endpoints.automate_async.ExternalsystemcredentialsEndpoint import (
+            ExternalsystemcredentialsEndpoint,
+        )
+
+        return ExternalsystemcredentialsEndpoint(self)
+
+    @cached_property
+    def permissions(self) -> "PermissionsEndpoint":
+        from pyconnectwise.endpoints.automate_async.PermissionsEndpoint import PermissionsEndpoint
+
+        return PermissionsEndpoint(self)
+
+    @cached_property
+    def userclasses(self) -> "UserclassesEndpoint":
+        from pyconnectwise.endpoints.automate_async.UserclassesEndpoint import UserclassesEndpoint
+
+        return UserclassesEndpoint(self)
+
+    @cached_property
+    def users(self) -> "UsersEndpoint":
+        from pyconnectwise.endpoints.automate_async.UsersEndpoint import UsersEndpoint
+
+        return UsersEndpoint(self)
+
+    def _get_url(self) -> str:
+        """
+        Generates and returns the URL for the ConnectWise Automate API endpoints based on the company url and codebase.
+        Logs in an obtains an access token.
+        Returns:
+            str: API URL.
+        """
+        return f"https://{self.automate_url}/cwa/api/v1"
+
+    async def _get_access_token(self) -> str:
+        """
+        Performs a request to the ConnectWise Automate API to obtain an access token.
+        """
+        auth_response = await self._make_request(
+            "POST",
+            f"{self._get_url()}/apitoken",
+            data={"UserName": self.username, "Password": self.password},
+            headers={"Content-Type": "application/json", "ClientId": self.client_id},
+        )
+        auth_resp_json = auth_response.json()
+        token = auth_resp_json["AccessToken"]
+        self.token_expiry_time = datetime.fromisoformat(auth_resp_json["ExpirationDate"])
+        return token
+
+    async def _refresh_access_token_if_necessary(self) -> None:
+        if self.access_token is not None and datetime.now(tz=UTC) <= self.token_expiry_time:
+            return
+        # Only one of the requests waiting on an expired token needs to refresh it
+        async with self._token_lock:
+            if self.access_token is None or datetime.now(tz=UTC) > self.token_expiry_time:
+                self.access_token = await self._get_access_token()
+
+    async def _get_headers(self) -> dict[str, str]:
+        """
+        Generates and returns the headers required for making API requests. The access token is refreshed if necessary before returning.
+
+        Returns:
+            dict[str, str]: Dictionary of headers including Content-Type, Client ID, and Authorization.
+        """
+        await self._refresh_access_token_if_necessary()
+        return {
+            "Content-Type": "application/json",
+            "clientId": self.client_id,
+            "Authorization": f"Bearer {self.access_token}",
+        }
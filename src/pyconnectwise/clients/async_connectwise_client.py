@@ -0,0 +1,290 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Any, cast
+
+try:
+    import httpx
+except ImportError as e:  # pragma: no cover
+    raise ImportError(  # noqa: TRY003
+        "The async ConnectWise clients require httpx. Install it with `pip install pyconnectwise[async]`."
+    ) from e
+
+from pyconnectwise.clients.connectwise_client import raise_for_status
+from pyconnectwise.config import Config
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from types import TracebackType
+
+    from typing_extensions import Self
+
+    from pyconnectwise.cache import CacheRule, ResponseCache
+    from pyconnectwise.types import RequestData, RequestMethod, RequestParams
+
+
+class AsyncConnectWiseClient(ABC):
+    """
+    Base class for the asyncio ConnectWise clients. Mirrors ConnectWiseClient, but requests are
+    made with a pooled httpx.AsyncClient and every request method is awaitable.
+
+    The client's Config.pool_maxsize caps the number of connections open at once. Requests over
+    that limit wait for a free connection, so any number of requests can be gathered on one event
+    loop while the API only ever sees a bounded amount of concurrency.
+    """
+
+    config: Config = Config()
+    _conditions_param = "conditions"
+    _fields_param = "fields"
+    _http_client: httpx.AsyncClient | None = None
+    _refresh_tasks: set[asyncio.Task] = set()  # noqa: RUF012
+
+    @abstractmethod
+    def _get_headers(self) -> dict[str, str] | Awaitable[dict[str, str]]:
+        """
+        Returns the headers to send with each request. May be a coroutine for clients that need to
+        make a request to build them, such as refreshing an access token.
+        """
+
+    @abstractmethod
+    def _get_url(self) -> str:
+        pass
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Close the client's pooled connections. The client can still be used afterwards,
+        a new connection pool will be created on the next request.
+        """
+        if self._http_client is not None:
+            http_client = self._http_client
+            self._http_client = None
+            await http_client.aclose()
+
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """
+        Returns the client's persistent httpx.AsyncClient, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: The client's connection pool.
+        """
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.config.pool_maxsize,
+                    max_keepalive_connections=self.config.pool_maxsize,
+                ),
+                # Requests queued behind the connection limit shouldn't time out while they wait their turn
+                timeout=None,
+            )
+        return self._http_client
+
+    async def _make_request(
+        self,
+        method: RequestMethod,
+        url: str,
+        data: RequestData | None = None,
+        params: RequestParams | None = None,
+        headers: dict[str, str] | None = None,
+        retry_count: int = 0,
+        stream: bool = False,  # noqa: FBT001, FBT002
+        endpoint_class: type | None = None,
+    ) -> httpx.Response:
+        """
+        Make an API request using the specified method, endpoint, data, and parameters.
+        This function isn't intended for use outside of this class.
+        Please use the available CRUD methods as intended.
+
+        Args:
+            method (str): The HTTP method to use for the request (e.g., GET, POST, PUT, etc.).
+            url (str): The URL to make the request to.
+            data (dict, optional): The request data to send.
+            params (dict, optional): The query parameters to include in the request.
+            stream (bool, optional): Whether to defer reading the response body. Streamed responses must be closed
+                by the caller with `await response.aclose()`.
+            endpoint_class (type, optional): The class of the endpoint making the request, for the response cache.
+
+        Returns:
+            The Response object (see httpx.Response).
+
+        Raises:
+            Exception: If the request returns a status code >= 400.
+        """
+        if not headers:
+            headers = self._get_headers()
+            if inspect.isawaitable(headers):
+                headers = await headers
+
+        single_flight = self.config.single_flight
+        if single_flight is not None and method == "GET" and not stream:
+            key = single_flight.get_key(url, params, headers)  # type: ignore[arg-type]
+            return await single_flight.do_async(
+                key,
+                lambda: self._dispatch_request(method, url, data, params, headers, retry_count, stream, endpoint_class),
+            )
+
+        return await self._dispatch_request(method, url, data, params, headers, retry_count, stream, endpoint_class)
+
+    async def _dispatch_request(
+        self,
+        method: RequestMethod,
+        url: str,
+        data: RequestData | None,
+        params: RequestParams | None,
+        headers: dict[str, str],
+        retry_count: int,
+        stream: bool,  # noqa: FBT001
+        endpoint_class: type | None,
+    ) -> httpx.Response:
+        """
+        Send a request through the response cache, if it applies, or straight to the API.
+        """
+        cache = self.config.response_cache
+        if cache is not None and not stream:
+            if method != "GET":
+                response = await self._send_request(method, url, data, params, headers, retry_count, stream)
+                cache.invalidate_for(method, url)
+                return response
+            rule = cache.get_rule(self._get_cache_path(url), endpoint_class)
+            if rule is not None:
+                return await self._make_cached_request(cache, rule, url, params, headers)
+
+        return await self._send_request(method, url, data, params, headers, retry_count, stream)
+
+    async def _send_request(
+        self,
+        method: RequestMethod,
+        url: str,
+        data: RequestData | None,
+        params: RequestParams | None,
+        headers: dict[str, str],
+        retry_count: int = 0,
+        stream: bool = False,  # noqa: FBT001, FBT002
+    ) -> httpx.Response:
+        """
+        Send a request to the API, retrying it as the Config's retry policy allows.
+        """
+        retry_policy = self.config.retry_policy
+        rate_limiter = self.config.rate_limiter
+        if retry_count == 0:
+            retry_policy.budget.record_request()
+
+        http_client = self._get_http_client()
+        while True:
+            if rate_limiter is not None:
+                await asyncio.sleep(rate_limiter.reserve())
+
+            request = http_client.build_request(
+                method,
+                url,
+                headers=headers,
+                json=data if data else None,
+                params=cast(dict[str, Any], params or {}),
+            )
+            response = await http_client.send(request, stream=stream)
+            if rate_limiter is not None:
+                rate_limiter.record_response(response.status_code)
+            if response.is_success:
+                return response
+
+            if not retry_policy.should_retry(response, retry_count):
+                if stream:
+                    await response.aread()
+                raise_for_status(response)
+                return response
+            await response.aclose()
+            await asyncio.sleep(retry_policy.get_delay(response, retry_count))
+            retry_count += 1
+
+    def _get_cache_path(self, url: str) -> str:
+        base_url = self._get_url().rstrip("/")
+        return url[len(base_url) :].strip("/") if url.startswith(base_url) else url
+
+    async def _make_cached_request(
+        self,
+        cache: ResponseCache,
+        rule: CacheRule,
+        url: str,
+        params: RequestParams | None,
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        key = cache.get_key(url, params, headers)  # type: ignore[arg-type]
+        response, stale = cache.get(key)
+        if response is None:
+            response = await self._fetch_cached_response(cache, rule, key, url, params, headers)
+        elif stale and cache.start_refresh(key):
+            refresh = asyncio.create_task(self._refresh_cached_response(cache, rule, key, url, params, headers))
+            # The event loop only keeps a weak reference to tasks
+            self._refresh_tasks.add(refresh)
+            refresh.add_done_callback(self._refresh_tasks.discard)
+        return response
+
+    async def _fetch_cached_response(
+        self,
+        cache: ResponseCache,
+        rule: CacheRule,
+        key: tuple,
+        url: str,
+        params: RequestParams | None,
+        headers: dict[str, str],
+    ) -> httpx.Response:
+        # If an expired response is still cached (e.g. on disk), only ask for it again if it's changed
+        validators = cache.get_validators(key)
+        response = await self._send_request("GET", url, None, params, {**headers, **validators})
+        if response.status_code == 304:
+            cached_response = cache.revalidate(key, rule)
+            if cached_response is not None:
+                return cached_response
+            response = await self._send_request("GET", url, None, params, headers)
+        cache.set(key, rule, response)
+        return response
+
+    async def _refresh_cached_response(
+        self,
+        cache: ResponseCache,
+        rule: CacheRule,
+        key: tuple,
+        url: str,
+        params: RequestParams | None,
+        headers: dict[str, str],
+    ) -> None:
+        try:
+            await self._fetch_cached_response(cache, rule, key, url, params, headers)
+        except Exception:  # noqa: S110
+            # The stale response keeps being used until it expires, and the next request after that raises
+            pass
+        finally:
+            cache.finish_refresh(key)
+
+
+async def gather_limited(*aws: Any, limit: int) -> list[Any]:  # noqa: ANN401
+    """
+    Await many awaitables concurrently, with at most `limit` of them in flight at once.
+    Results are returned in the same order as the awaitables were given, like asyncio.gather.
+
+    Args:
+        *aws: The awaitables to run, typically endpoint calls such as `client.company.companies.id(1).get()`.
+        limit (int): The maximum number of awaitables to run at the same time.
+
+    Returns:
+        list: The results of the awaitables.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw: Any) -> Any:  # noqa: ANN401
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(run(aw) for aw in aws))
@@ -0,0 +1,206 @@
+import base64
+import typing
+from functools import cached_property
+
+import httpx
+
+from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+from pyconnectwise.clients.connectwise_client import raise_for_status
+from pyconnectwise.clients.manage_client import ManageCodebaseError
+from pyconnectwise.config import Config
+
+if typing.TYPE_CHECKING:
+    from pyconnectwise.endpoints.manage_async.CompanyEndpoint import CompanyEndpoint
+    from pyconnectwise.endpoints.manage_async.ConfigurationsEndpoint import ConfigurationsEndpoint
+    from pyconnectwise.endpoints.manage_async.ExpenseEndpoint import ExpenseEndpoint
+    from pyconnectwise.endpoints.manage_async.FinanceEndpoint import FinanceEndpoint
+    from pyconnectwise.endpoints.manage_async.MarketingEndpoint import MarketingEndpoint
+    from pyconnectwise.endpoints.manage_async.ProcurementEndpoint import ProcurementEndpoint
+    from pyconnectwise.endpoints.manage_async.ProjectEndpoint import ProjectEndpoint
+    from pyconnectwise.endpoints.manage_async.SalesEndpoint import SalesEndpoint
+    from pyconnectwise.endpoints.manage_async.ScheduleEndpoint import ScheduleEndpoint
+    from pyconnectwise.endpoints.manage_async.ServiceEndpoint import ServiceEndpoint
+    from pyconnectwise.endpoints.manage_async.SystemEndpoint import SystemEndpoint
+    from pyconnectwise.endpoints.manage_async.TimeEndpoint import TimeEndpoint
+
+
+class AsyncConnectWiseManageAPIClient(AsyncConnectWiseClient):
+    """
+    ConnectWise Manage API client. Handles the connection to the ConnectWise Manage API
+    and the configuration of all the available endpoints.
+
+    All requests made through this client's endpoints are awaitable.
+    """
+
+    def __init__(
+        self,
+        company_name: str,
+        manage_url: str,
+        client_id: str,
+        public_key: str,
+        private_key: str,
+        codebase: str | None = None,
+        config: Config | None = None,
+    ) -> None:
+        """
+        Initializes the client with the given credentials and optionally a specific codebase.
+        If no codebase is given, it tries to get it from the API.
+
+        Parameters:
+            company_name (str): Name of your company.
+            manage_url (str): URL of your ConnectWise Manage instance.
+            client_id (str): Your ConnectWise Manage API Client ID.
+            public_key (str): Your ConnectWise Manage API Public key.
+            private_key (str): Your ConnectWise Manage API Private key.
+            codebase (str, optional): Your ConnectWise Manage Codebase. If not provided, it will be fetched from the API with a one-off blocking request. Defaults to None.
+            config (Config, optional): Optional additional configuration for API interactions
+        """
+        self.client_id: str = client_id
+        self.company_name: str = company_name
+        self.manage_url: str = manage_url
+        self.public_key: str = public_key
+        self.private_key: str = private_key
+
+        if config:
+            self.config = config
+
+        # Retrieve codebase from the API if not provided
+        if not codebase:
+            codebase = self._try_get_codebase_from_api(
+                manage_url=manage_url,
+                company_name=company_name,
+                headers=self._get_headers(),
+            )
+
+            if codebase is None:
+                # we need to except here
+                raise ManageCodebaseError()
+        self.codebase: str = codebase
+
+    # Initializing endpoints
+    @cached_property
+    def company(self) -> "CompanyEndpoint":
+        from pyconnectwise.endpoints.manage_async.CompanyEndpoint import CompanyEndpoint
+
+        return CompanyEndpoint(self)
+
+    @cached_property
+    def configurations(self) -> "ConfigurationsEndpoint":
+        from pyconnectwise.endpoints.manage_async.ConfigurationsEndpoint import ConfigurationsEndpoint
+
+        return ConfigurationsEndpoint(self)
+
+    @cached_property
+    def expense(self) -> "ExpenseEndpoint":
+        from pyconnectwise.endpoints.manage_async.ExpenseEndpoint import ExpenseEndpoint
+
+        return ExpenseEndpoint(self)
+
+    @cached_property
+    def finance(self) -> "FinanceEndpoint":
+        from pyconnectwise.endpoints.manage_async.FinanceEndpoint import FinanceEndpoint
+
+        return FinanceEndpoint(self)
+
+    @cached_property
+    def marketing(self) -> "MarketingEndpoint":
+        from pyconnectwise.endpoints.manage_async.MarketingEndpoint import MarketingEndpoint
+
+        return MarketingEndpoint(self)
+
+    @cached_property
+    def procurement(self) -> "ProcurementEndpoint":
+        from pyconnectwise.endpoints.manage_async.ProcurementEndpoint import ProcurementEndpoint
+
+        return ProcurementEndpoint(self)
+
+    @cached_property
+    def project(self) -> "ProjectEndpoint":
+        from pyconnectwise.endpoints.manage_async.ProjectEndpoint import ProjectEndpoint
+
+        return ProjectEndpoint(self)
+
+    @cached_property
+    def sales(self) -> "SalesEndpoint":
+        from pyconnectwise.endpoints.manage_async.SalesEndpoint import SalesEndpoint
+
+        return SalesEndpoint(self)
+
+    @cached_property
+    def schedule(self) -> "ScheduleEndpoint":
+        from pyconnectwise.endpoints.manage_async.ScheduleEndpoint import ScheduleEndpoint
+
+        return ScheduleEndpoint(self)
+
+    @cached_property
+    def service(self) -> "ServiceEndpoint":
+        from pyconnectwise.endpoints.manage_async.ServiceEndpoint import ServiceEndpoint
+
+        return ServiceEndpoint(self)
+
+    @cached_property
+    def system(self) -> "SystemEndpoint":
+        from pyconnectwise.endpoints.manage_async.SystemEndpoint import SystemEndpoint
+
+        return SystemEndpoint(self)
+
+    @cached_property
+    def time(self) -> "TimeEndpoint":
+        from pyconnectwise.endpoints.manage_async.TimeEndpoint import TimeEndpoint
+
+        return TimeEndpoint(self)
+
+    def _get_url(self) -> str:
+        """
+        Generates and returns the URL for the ConnectWise Manage API endpoints based on the company url and codebase.
+
+        Returns:
+            str: API URL.
+        """
+        return f"https://{self.manage_url}/{self.codebase.strip('/')}/apis/3.0"
+
+    def _try_get_codebase_from_api(self, manage_url: str, company_name: str, headers: dict[str, str]) -> str:
+        """
+        Tries to retrieve the codebase from the API using the provided company url, company name and headers.
+
+        Parameters:
+            company_url (str): URL of the company.
+            company_name (str): Name of the company.
+            headers (dict[str, str]): Headers to be sent in the request.
+
+        Returns:
+            str: Codebase string or None if an error occurs.
+        """
+        url = f"https://{manage_url}/login/companyinfo/{company_name}"
+        # This runs once from __init__, which can't await, so use a short-lived synchronous request.
+        response = httpx.get(url, headers=headers)
+        if not response.is_success:
+            raise_for_status(response)
+        return response.json().get("Codebase")
+
+    def _get_auth_string(self) -> str:
+        """
+        Creates and returns the base64 encoded authorization string required for API requests.
+
+        Returns:
+            str: Base64 encoded authorization string.
+        """
+        return "Basic " + base64.b64encode(
+            bytes(
+                f"{self.company_name}+{self.public_key}:{self.private_key}",
+                encoding="utf8",
+            )
+        ).decode("ascii")
+
+    def _get_headers(self) -> dict[str, str]:
+        """
+        Generates and returns the headers required for making API requests.
+
+        Returns:
+            dict[str, str]: Dictionary of headers including Content-Type, Client ID, and Authorization.
+        """
+        return {
+            "Content-Type": "application/json",
+            "clientId": self.client_id,
+            "Authorization": self._get_auth_string(),
+        }
@@ -1,5 +1,6 @@
 import typing
 from datetime import UTC, datetime
+from functools import cached_property
 
 from pyconnectwise.clients.connectwise_client import ConnectWiseClient
 from pyconnectwise.config import Config
@@ -45,6 +46,11 @@ class ConnectWiseAutomateAPIClient(ConnectWiseClient):
     and the configuration of all the available endpoints.
     """
 
+    # The Automate API names its filter query parameter "condition", rather than Manage's "conditions"
+    _conditions_param = "condition"
+    # Automate selects fields with "includeFields", and only by their top level name
+    _fields_param = "includeFields"
+
     def __init__(
         self,
         automate_url: str,
@@ -77,145 +83,145 @@ class ConnectWiseAutomateAPIClient(ConnectWiseClient):
         self.access_token: str = self._get_access_token()
 
     # Initializing endpoints
-    @property
+    @cached_property
     def commands(self) -> "CommandsEndpoint":
         from pyconnectwise.endpoints.automate import CommandsEndpoint
 
         return CommandsEndpoint(self)
 
-    @property
+    @cached_property
     def clients(self) -> "ClientsEndpoint":
         from pyconnectwise.endpoints.automate import ClientsEndpoint
 
         return ClientsEndpoint(self)
 
-    @property
+    @cached_property
     def computers(self) -> "ComputersEndpoint":
         from pyconnectwise.endpoints.automate import ComputersEndpoint
 
         return ComputersEndpoint(self)
 
-    @property
+    @cached_property
     def services(self) -> "ServicesEndpoint":
         from pyconnectwise.endpoints.automate import ServicesEndpoint
 
         return ServicesEndpoint(self)
 
-    @property
+    @cached_property
     def contacts(self) -> "ContactsEndpoint":
         from pyconnectwise.endpoints.automate import ContactsEndpoint
 
         return ContactsEndpoint(self)
 
-    @property
+    @cached_property
     def dataviewfolders(self) -> "DataviewfoldersEndpoint":
         from pyconnectwise.endpoints.automate import DataviewfoldersEndpoint
 
         return DataviewfoldersEndpoint(self)
 
-    @property
+    @cached_property
     def dataviews(self) -> "DataviewsEndpoint":
         from pyconnectwise.endpoints.automate import DataviewsEndpoint
 
         return DataviewsEndpoint(self)
 
-    @property
+    @cached_property
     def groups(self) -> "GroupsEndpoint":
         from pyconnectwise.endpoints.automate import GroupsEndpoint
 
         return GroupsEndpoint(self)
 
-    @property
+    @cached_property
     def monitors(self) -> "MonitorsEndpoint":
         from pyconnectwise.endpoints.automate import MonitorsEndpoint
 
         return MonitorsEndpoint(self)
 
-    @property
+    @cached_property
     def networkdevices(self) -> "NetworkdevicesEndpoint":
         from pyconnectwise.endpoints.automate import NetworkdevicesEndpoint
 
         return NetworkdevicesEndpoint(self)
 
-    @property
+    @cached_property
     def patchactions(self) -> "PatchactionsEndpoint":
         from pyconnectwise.endpoints.automate import PatchactionsEndpoint
 
         return PatchactionsEndpoint(self)
 
-    @property
+    @cached_property
     def locations(self) -> "LocationsEndpoint":
         from pyconnectwise.endpoints.automate import LocationsEndpoint
 
         return LocationsEndpoint(self)
 
-    @property
+    @cached_property
     def lookups(self) -> "LookupsEndpoint":
         from pyconnectwise.endpoints.automate import LookupsEndpoint
 
         return LookupsEndpoint(self)
 
-    @property
+    @cached_property
     def probeconfiguration(self) -> "ProbeconfigurationEndpoint":
         from pyconnectwise.endpoints.automate import ProbeconfigurationEndpoint
 
         return ProbeconfigurationEndpoint(self)
 
-    @property
+    @cached_property
     def scriptfolders(self) -> "ScriptfoldersEndpoint":
         from pyconnectwise.endpoints.automate import ScriptfoldersEndpoint
 
         return ScriptfoldersEndpoint(self)
 
-    @property
+    @cached_property
     def scripting(self) -> "ScriptingEndpoint":
         from pyconnectwise.endpoints.automate import ScriptingEndpoint
 
         return ScriptingEndpoint(self)
 
-    @property
+    @cached_property
     def scripts(self) -> "ScriptsEndpoint":
         from pyconnectwise.endpoints.automate import ScriptsEndpoint
 
         return ScriptsEndpoint(self)
 
-    @property
+    @cached_property
     def drives(self) -> "DrivesEndpoint":
         from pyconnectwise.endpoints.automate import DrivesEndpoint
 
         return DrivesEndpoint(self)
 
-    @property
+    @cached_property
     def statistics(self) -> "StatisticsEndpoint":
         from pyconnectwise.endpoints.automate import StatisticsEndpoint
 
         return StatisticsEndpoint(self)
 
-    @property
+    @cached_property
     def system(self) -> "SystemEndpoint":
         from pyconnectwise.endpoints.automate import SystemEndpoint
 
         return SystemEndpoint(self)
 
-    @property
+    @cached_property
     def externalsystemcredentials(self) -> "ExternalsystemcredentialsEndpoint":
         from pyconnectwise.endpoints.automate import ExternalsystemcredentialsEndpoint
 
         return ExternalsystemcredentialsEndpoint(self)
 
-    @property
+    @cached_property
     def permissions(self) -> "PermissionsEndpoint":
         from pyconnectwise.endpoints.automate import PermissionsEndpoint
 
         return PermissionsEndpoint(self)
 
-    @property
+    @cached_property
     def userclasses(self) -> "UserclassesEndpoint":
         from pyconnectwise.endpoints.automate import UserclassesEndpoint
 
         return UserclassesEndpoint(self)
 
-    @property
+    @cached_property
     def users(self) -> "UsersEndpoint":
         from pyconnectwise.endpoints.automate import UsersEndpoint
 
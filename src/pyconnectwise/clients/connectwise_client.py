@@ -2,12 +2,15 @@ from __future__ import annotations
 
 import contextlib
 import json
+import threading
+import time
 import warnings
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any, cast
 
 import requests
 from requests import Response
+from requests.adapters import HTTPAdapter
 from requests.exceptions import Timeout
 
 from pyconnectwise.config import Config
@@ -20,14 +23,27 @@ from pyconnectwise.exceptions import (
     ObjectExistsError,
     PermissionsFailedException,
     ServerError,
+    ServiceUnavailableError,
+    TooManyRequestsException,
 )
+from pyconnectwise.utils.helpers import is_timeout_response
 
 if TYPE_CHECKING:
+    from types import TracebackType
+
+    import httpx
+    from typing_extensions import Self
+
+    from pyconnectwise.cache import CacheRule, ResponseCache
+    from pyconnectwise.interfaces import IPaginateable
     from pyconnectwise.types import RequestData, RequestMethod, RequestParams
 
 
 class ConnectWiseClient(ABC):
     config: Config = Config()
+    _conditions_param = "conditions"
+    _fields_param = "fields"
+    _session: requests.Session | None = None
 
     @abstractmethod
     def _get_headers(self) -> dict[str, str]:
@@ -37,7 +53,85 @@ class ConnectWiseClient(ABC):
     def _get_url(self) -> str:
         pass
 
-    def _make_request(  # noqa: C901
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the client's pooled connections. The client can still be used afterwards,
+        a new connection pool will be created on the next request.
+        """
+        with self._get_session_lock():
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def export(
+        self,
+        endpoint: IPaginateable,
+        path: str,
+        format: str | None = None,  # noqa: A002
+        compression: str | None = None,
+        params: RequestParams | None = None,
+        page_size: int = 1000,
+        checkpoint: str | None = None,
+    ) -> int:
+        """
+        Export every item of an endpoint to an NDJSON, CSV or Parquet file, streaming it a page at a time.
+        See pyconnectwise.export.export() for the details.
+
+        Args:
+            endpoint (IPaginateable): The endpoint to export.
+            path (str): The file to write.
+            format (str, optional): "ndjson", "csv" or "parquet" (default = from the path's extension).
+            compression (str, optional): The compression, e.g. "gzip" (default = from the path's extension).
+            params (dict, optional): The query parameters to send.
+            page_size (int): The number of items to request per page (default = 1000).
+            checkpoint (str, optional): The file to save the export's progress to, so it can be resumed.
+
+        Returns:
+            int: The number of items exported.
+        """
+        from pyconnectwise.export import export
+
+        return export(endpoint, path, format, compression, params, page_size, checkpoint=checkpoint)
+
+    def _get_session(self) -> requests.Session:
+        """
+        Returns the client's persistent session, creating it on first use.
+        The session keeps connections to the API alive between requests, sized using the client's Config.
+
+        Returns:
+            requests.Session: The client's session.
+        """
+        if self._session is None:
+            with self._get_session_lock():
+                if self._session is None:
+                    adapter = HTTPAdapter(
+                        pool_connections=self.config.pool_connections,
+                        pool_maxsize=self.config.pool_maxsize,
+                        pool_block=self.config.pool_block,
+                    )
+                    session = requests.Session()
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    self._session = session
+        return self._session
+
+    def _get_session_lock(self) -> threading.Lock:
+        # Each client has its own lock, created on first use as the clients don't call a base __init__.
+        # dict.setdefault() is atomic, so threads making their first requests at once still share one lock.
+        return self.__dict__.setdefault("_session_lock", threading.Lock())
+
+    def _make_request(
         self,
         method: RequestMethod,
         url: str,
@@ -46,6 +140,7 @@ class ConnectWiseClient(ABC):
         headers: dict[str, str] | None = None,
         retry_count: int = 0,
         stream: bool = False,  # noqa: FBT001, FBT002
+        endpoint_class: type | None = None,
     ) -> Response:
         """
         Make an API request using the specified method, endpoint, data, and parameters.
@@ -57,6 +152,7 @@ class ConnectWiseClient(ABC):
             endpoint (str, optional): The endpoint to make the request to.
             data (dict, optional): The request data to send.
             params (dict, optional): The query parameters to include in the request.
+            endpoint_class (type, optional): The class of the endpoint making the request, for the response cache.
 
         Returns:
             The Response object (see requests.Response).
@@ -68,63 +164,191 @@ class ConnectWiseClient(ABC):
         if not headers:
             headers = self._get_headers()
 
-        # I don't like having to cast the params to a dict, but it's the only way I can get mypy to stop complaining about the type.
-        # TypedDicts aren't compatible with the dict type and this is the best way I can think of to handle this.
-        if data:
-            response = requests.request(  # noqa: S113
-                method,
-                url,
-                headers=headers,
-                json=data,
-                params=cast(dict[str, Any], params or {}),
-                stream=stream,
+        single_flight = self.config.single_flight
+        if single_flight is not None and method == "GET" and not stream:
+            key = single_flight.get_key(url, params, headers)  # type: ignore[arg-type]
+            return single_flight.do(
+                key,
+                lambda: self._dispatch_request(method, url, data, params, headers, retry_count, stream, endpoint_class),
             )
-        else:
-            response = requests.request(  # noqa: S113
+
+        return self._dispatch_request(method, url, data, params, headers, retry_count, stream, endpoint_class)
+
+    def _dispatch_request(
+        self,
+        method: RequestMethod,
+        url: str,
+        data: RequestData | None,
+        params: RequestParams | None,
+        headers: dict[str, str],
+        retry_count: int,
+        stream: bool,  # noqa: FBT001
+        endpoint_class: type | None,
+    ) -> Response:
+        """
+        Send a request through the response cache, if it applies, or straight to the API.
+        """
+        cache = self.config.response_cache
+        if cache is not None and not stream:
+            if method != "GET":
+                response = self._send_request(method, url, data, params, headers, retry_count, stream)
+                cache.invalidate_for(method, url)
+                return response
+            rule = cache.get_rule(self._get_cache_path(url), endpoint_class)
+            if rule is not None:
+                return self._make_cached_request(cache, rule, url, params, headers)
+
+        return self._send_request(method, url, data, params, headers, retry_count, stream)
+
+    def _send_request(
+        self,
+        method: RequestMethod,
+        url: str,
+        data: RequestData | None,
+        params: RequestParams | None,
+        headers: dict[str, str],
+        retry_count: int = 0,
+        stream: bool = False,  # noqa: FBT001, FBT002
+    ) -> Response:
+        """
+        Send a request to the API, retrying it as the Config's retry policy allows.
+        """
+        retry_policy = self.config.retry_policy
+        rate_limiter = self.config.rate_limiter
+        if retry_count == 0:
+            retry_policy.budget.record_request()
+
+        while True:
+            if rate_limiter is not None:
+                time.sleep(rate_limiter.reserve())
+
+            # I don't like having to cast the params to a dict, but it's the only way I can get mypy to stop complaining about the type.
+            # TypedDicts aren't compatible with the dict type and this is the best way I can think of to handle this.
+            response = self._get_session().request(
                 method,
                 url,
                 headers=headers,
+                json=data if data else None,
                 params=cast(dict[str, Any], params or {}),
                 stream=stream,
             )
-        if not response.ok:
-            with contextlib.suppress(json.JSONDecodeError):
-                details: dict = response.json()
-                if response.status_code == 400:  # noqa: SIM102 (Expecting to handle other codes in the future)
-                    if details.get("code") == "InvalidObject":
-                        errors = details.get("errors", [])
-                        if len(errors) > 1:
-                            warnings.warn(
-                                "Found multiple errors - we may be masking some important error details.  Please submit a Github issue with response.status_code and response.content so we can improve this error handling.",
-                                stacklevel=1,
-                            )
-                        for error in errors:
-                            if error.get("code") == "ObjectExists":
-                                error.pop("code")  # Don't need code in message
-                                raise ObjectExistsError(response, extra_message=json.dumps(error, indent=4))
-
-            if response.status_code == 400:
-                raise MalformedRequestException(response)
-            if response.status_code == 401:
-                raise AuthenticationFailedException(response)
-            if response.status_code == 403:
-                raise PermissionsFailedException(response)
-            if response.status_code == 404:
-                raise NotFoundException(response)
-            if response.status_code == 405:
-                raise MethodNotAllowedException(response)
-            if response.status_code == 409:
-                raise ConflictException(response)
-            if response.status_code == 500:
-                # if timeout is mentioned anywhere in the response then we'll retry.
-                # Ideally we'd return immediately on any non-timeout errors (since
-                # retries won't help much there), but err towards classifying too much
-                # as retries instead of too little.
-                if "timeout" in (response.text + response.reason).lower():
-                    if retry_count < self.config.max_retries:
-                        retry_count += 1
-                        return self._make_request(method, url, data, params, headers, retry_count)
-                    raise Timeout(response=response)
-                raise ServerError(response)
+            if rate_limiter is not None:
+                rate_limiter.record_response(response.status_code)
+            if response.ok:
+                return response
+
+            if not retry_policy.should_retry(response, retry_count):
+                raise_for_status(response)
+                return response
+            response.close()
+            time.sleep(retry_policy.get_delay(response, retry_count))
+            retry_count += 1
+
+    def _get_cache_path(self, url: str) -> str:
+        base_url = self._get_url().rstrip("/")
+        return url[len(base_url) :].strip("/") if url.startswith(base_url) else url
+
+    def _make_cached_request(
+        self,
+        cache: ResponseCache,
+        rule: CacheRule,
+        url: str,
+        params: RequestParams | None,
+        headers: dict[str, str],
+    ) -> Response:
+        key = cache.get_key(url, params, headers)  # type: ignore[arg-type]
+        response, stale = cache.get(key)
+        if response is None:
+            response = self._fetch_cached_response(cache, rule, key, url, params, headers)
+        elif stale and cache.start_refresh(key):
+            refresh = threading.Thread(
+                target=self._refresh_cached_response, args=(cache, rule, key, url, params, headers), daemon=True
+            )
+            refresh.start()
+        return response
 
+    def _fetch_cached_response(
+        self,
+        cache: ResponseCache,
+        rule: CacheRule,
+        key: tuple,
+        url: str,
+        params: RequestParams | None,
+        headers: dict[str, str],
+    ) -> Response:
+        # If an expired response is still cached (e.g. on disk), only ask for it again if it's changed
+        validators = cache.get_validators(key)
+        response = self._send_request("GET", url, None, params, {**headers, **validators})
+        if response.status_code == 304:
+            cached_response = cache.revalidate(key, rule)
+            if cached_response is not None:
+                return cached_response
+            response = self._send_request("GET", url, None, params, headers)
+        cache.set(key, rule, response)
         return response
+
+    def _refresh_cached_response(
+        self,
+        cache: ResponseCache,
+        rule: CacheRule,
+        key: tuple,
+        url: str,
+        params: RequestParams | None,
+        headers: dict[str, str],
+    ) -> None:
+        try:
+            self._fetch_cached_response(cache, rule, key, url, params, headers)
+        except Exception:  # noqa: S110
+            # The stale response keeps being used until it expires, and the next request after that raises
+            pass
+        finally:
+            cache.finish_refresh(key)
+
+
+def raise_for_status(response: Response | httpx.Response) -> None:  # noqa: C901
+    """
+    Raises the ConnectWiseException matching an unsuccessful response's status code.
+    Works with both requests and httpx responses so the sync and async clients share error handling.
+
+    Args:
+        response: The unsuccessful response.
+
+    Raises:
+        ConnectWiseException: The exception for the response's status code.
+        Timeout: If the response is a timeout error (see is_timeout_response).
+    """
+    with contextlib.suppress(json.JSONDecodeError):
+        details: dict = response.json()
+        if response.status_code == 400:  # noqa: SIM102 (Expecting to handle other codes in the future)
+            if details.get("code") == "InvalidObject":
+                errors = details.get("errors", [])
+                if len(errors) > 1:
+                    warnings.warn(
+                        "Found multiple errors - we may be masking some important error details.  Please submit a Github issue with response.status_code and response.content so we can improve this error handling.",
+                        stacklevel=1,
+                    )
+                for error in errors:
+                    if error.get("code") == "ObjectExists":
+                        error.pop("code")  # Don't need code in message
+                        raise ObjectExistsError(response, extra_message=json.dumps(error, indent=4))
+
+    if response.status_code == 400:
+        raise MalformedRequestException(response)
+    if response.status_code == 401:
+        raise AuthenticationFailedException(response)
+    if response.status_code == 403:
+        raise PermissionsFailedException(response)
+    if response.status_code == 404:
+        raise NotFoundException(response)
+    if response.status_code == 405:
+        raise MethodNotAllowedException(response)
+    if response.status_code == 409:
+        raise ConflictException(response)
+    if response.status_code == 429:
+        raise TooManyRequestsException(response)
+    if response.status_code == 500:
+        if is_timeout_response(response):
+            raise Timeout(response=response)
+        raise ServerError(response)
+    if response.status_code in (502, 503, 504):
+        raise ServiceUnavailableError(response)
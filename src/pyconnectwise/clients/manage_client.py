@@ -1,5 +1,6 @@
 import base64
 import typing
+from functools import cached_property
 
 from pyconnectwise.clients.connectwise_client import ConnectWiseClient
 from pyconnectwise.config import Config
@@ -64,85 +65,85 @@ class ConnectWiseManageAPIClient(ConnectWiseClient):
 
         # Retrieve codebase from the API if not provided
         if not codebase:
-            codebase_request = self._try_get_codebase_from_api(
+            codebase = self._try_get_codebase_from_api(
                 manage_url=manage_url,
                 company_name=company_name,
                 headers=self._get_headers(),
             )
 
-            if codebase_request is None:
+            if codebase is None:
                 # we need to except here
                 raise ManageCodebaseError()
-            self.codebase: str = codebase_request
+        self.codebase: str = codebase
 
     # Initializing endpoints
-    @property
+    @cached_property
     def company(self) -> "CompanyEndpoint":
         from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
 
         return CompanyEndpoint(self)
 
-    @property
+    @cached_property
     def configurations(self) -> "ConfigurationsEndpoint":
         from pyconnectwise.endpoints.manage.ConfigurationsEndpoint import ConfigurationsEndpoint
 
         return ConfigurationsEndpoint(self)
 
-    @property
+    @cached_property
     def expense(self) -> "ExpenseEndpoint":
         from pyconnectwise.endpoints.manage.ExpenseEndpoint import ExpenseEndpoint
 
         return ExpenseEndpoint(self)
 
-    @property
+    @cached_property
     def finance(self) -> "FinanceEndpoint":
         from pyconnectwise.endpoints.manage.FinanceEndpoint import FinanceEndpoint
 
         return FinanceEndpoint(self)
 
-    @property
+    @cached_property
     def marketing(self) -> "MarketingEndpoint":
         from pyconnectwise.endpoints.manage.MarketingEndpoint import MarketingEndpoint
 
         return MarketingEndpoint(self)
 
-    @property
+    @cached_property
     def procurement(self) -> "ProcurementEndpoint":
         from pyconnectwise.endpoints.manage.ProcurementEndpoint import ProcurementEndpoint
 
         return ProcurementEndpoint(self)
 
-    @property
+    @cached_property
     def project(self) -> "ProjectEndpoint":
         from pyconnectwise.endpoints.manage.ProjectEndpoint import ProjectEndpoint
 
         return ProjectEndpoint(self)
 
-    @property
+    @cached_property
     def sales(self) -> "SalesEndpoint":
         from pyconnectwise.endpoints.manage.SalesEndpoint import SalesEndpoint
 
         return SalesEndpoint(self)
 
-    @property
+    @cached_property
     def schedule(self) -> "ScheduleEndpoint":
         from pyconnectwise.endpoints.manage.ScheduleEndpoint import ScheduleEndpoint
 
         return ScheduleEndpoint(self)
 
-    @property
+    @cached_property
     def service(self) -> "ServiceEndpoint":
         from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
 
         return ServiceEndpoint(self)
 
-    @property
+    @cached_property
     def system(self) -> "SystemEndpoint":
         from pyconnectwise.endpoints.manage.SystemEndpoint import SystemEndpoint
 
         return SystemEndpoint(self)
 
-    @property
+    @cached_property
     def time(self) -> "TimeEndpoint":
         from pyconnectwise.endpoints.manage.TimeEndpoint import TimeEndpoint
 
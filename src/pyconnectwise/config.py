@@ -1,9 +1,46 @@
+from pyconnectwise.retry import RetryPolicy
+
+
 class Config:
-    def __init__(self, max_retries=3) -> None:  # noqa: ANN001
+    def __init__(
+        self,
+        max_retries=3,  # noqa: ANN001
+        pool_connections=10,  # noqa: ANN001
+        pool_maxsize=10,  # noqa: ANN001
+        pool_block=False,  # noqa: ANN001, FBT002
+        retry_policy=None,  # noqa: ANN001
+        rate_limiter=None,  # noqa: ANN001
+        response_mode="model",  # noqa: ANN001
+        response_cache=None,  # noqa: ANN001
+        single_flight=None,  # noqa: ANN001
+    ) -> None:
         """
         Initializes a new instance of the Config class.
 
         Args:
-            max_retries (int): The maximum number of retries for a retryable HTTP operation (500) (default = 3)
+            max_retries (int): The maximum number of retries for a retryable HTTP operation (429, and for idempotent
+                requests 502, 503, 504 and timeout 500s) (default = 3)
+            pool_connections (int): The number of per-host connection pools the client keeps alive (default = 10)
+            pool_maxsize (int): The maximum number of connections kept alive per host (default = 10)
+            pool_block (bool): Whether to block and wait for a free connection when a host's pool is exhausted,
+                instead of opening a throwaway connection (default = False)
+            retry_policy (RetryPolicy, optional): Decides which failed requests are retried and how long to back off
+                between retries (default = RetryPolicy(max_retries=max_retries))
+            rate_limiter (RateLimiter, optional): Paces requests to the API, slowing down when throttled
+                (default = None, no pacing)
+            response_mode (str): How endpoints return response data, either "model" to validate it into models, or "raw"
+                to return the decoded JSON dicts without any validation (default = "model")
+            response_cache (ResponseCache, optional): Caches the responses to GET requests for data that rarely changes,
+                as configured by its rules (default = None, nothing is cached)
+            single_flight (SingleFlight, optional): Coalesces identical GET requests made at the same time into one
+                request to the API (default = None, every request goes to the API)
         """
         self.max_retries = max_retries
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy(max_retries=max_retries)
+        self.rate_limiter = rate_limiter
+        self.response_mode = response_mode
+        self.response_cache = response_cache
+        self.single_flight = single_flight
@@ -36,7 +36,7 @@ class ApitokenEndpoint(
         """
         return self._parse_one(
             AutomateAuthInformation,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -55,5 +55,5 @@ class ApitokenEndpoint(
         """
         return self._parse_one(
             AutomateTokenResult,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
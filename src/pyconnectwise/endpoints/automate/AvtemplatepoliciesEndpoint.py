@@ -33,5 +33,5 @@ class AvtemplatepoliciesEndpoint(
         """
         return self._parse_one(
             LabTechAVTemplatePolicy,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
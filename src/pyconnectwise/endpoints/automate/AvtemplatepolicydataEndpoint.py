@@ -33,5 +33,5 @@ class AvtemplatepolicydataEndpoint(
         """
         return self._parse_one(
             LabTechAVTemplatePolicyData,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
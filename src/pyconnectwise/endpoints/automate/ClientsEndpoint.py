@@ -82,7 +82,7 @@ class ClientsEndpoint(
         Returns:
             list[LabTechClient]: The parsed response data.
         """
-        return self._parse_many(LabTechClient, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechClient, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self,
@@ -100,5 +100,5 @@ class ClientsEndpoint(
         """
         return self._parse_one(
             LabTechClient,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
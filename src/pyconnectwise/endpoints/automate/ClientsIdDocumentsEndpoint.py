@@ -67,5 +67,5 @@ class ClientsIdDocumentsEndpoint(
         """
         return self._parse_many(
             LabTechDocument,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
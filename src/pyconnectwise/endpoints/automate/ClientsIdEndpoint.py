@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ClientsIdDocumentsEndpoint import (
     ClientsIdDocumentsEndpoint,
 )
@@ -33,11 +35,6 @@ class ClientsIdEndpoint(
         IGettable.__init__(self, LabTechClient)
         IPaginateable.__init__(self, LabTechClient)
 
-        self.permissions = self._register_child_endpoint(ClientsIdPermissionsEndpoint(client, parent_endpoint=self))
-        self.licenses = self._register_child_endpoint(ClientsIdLicensesEndpoint(client, parent_endpoint=self))
-        self.documents = self._register_child_endpoint(ClientsIdDocumentsEndpoint(client, parent_endpoint=self))
-        self.productkeys = self._register_child_endpoint(ClientsIdProductkeysEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self,
         page: int,
@@ -82,4 +79,32 @@ class ClientsIdEndpoint(
         Returns:
             LabTechClient: The parsed response data.
         """
-        return self._parse_one(LabTechClient, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LabTechClient, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def documents(self) -> ClientsIdDocumentsEndpoint:
+        """
+        The ClientsIdDocumentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ClientsIdDocumentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def licenses(self) -> ClientsIdLicensesEndpoint:
+        """
+        The ClientsIdLicensesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ClientsIdLicensesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def permissions(self) -> ClientsIdPermissionsEndpoint:
+        """
+        The ClientsIdPermissionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ClientsIdPermissionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def productkeys(self) -> ClientsIdProductkeysEndpoint:
+        """
+        The ClientsIdProductkeysEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ClientsIdProductkeysEndpoint(self.client, parent_endpoint=self))
@@ -70,7 +70,7 @@ class ClientsIdProductkeysEndpoint(
         """
         return self._parse_many(
             LabTechProductKey,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -89,5 +89,5 @@ class ClientsIdProductkeysEndpoint(
         """
         return self._parse_one(
             LabTechProductKey,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
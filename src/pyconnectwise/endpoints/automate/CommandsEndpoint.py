@@ -81,5 +81,5 @@ class CommandsEndpoint(
         """
         return self._parse_many(
             LabTechCommand,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class CommandsIdEndpoint(
         """
         return self._parse_one(
             LabTechCommand,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
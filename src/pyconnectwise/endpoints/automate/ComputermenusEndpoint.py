@@ -70,7 +70,7 @@ class ComputermenusEndpoint(
         """
         return self._parse_many(
             LabTechComputerMenu,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -89,5 +89,5 @@ class ComputermenusEndpoint(
         """
         return self._parse_one(
             LabTechComputerMenu,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
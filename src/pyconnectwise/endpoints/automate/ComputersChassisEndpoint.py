@@ -67,5 +67,5 @@ class ComputersChassisEndpoint(
         """
         return self._parse_many(
             LabTechComputerChassis,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ComputersDrivesEndpoint(
         """
         return self._parse_many(
             LabTechComputerDrive,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
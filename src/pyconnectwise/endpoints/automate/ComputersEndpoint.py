@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ComputersChassisEndpoint import (
     ComputersChassisEndpoint,
 )
@@ -37,14 +39,6 @@ class ComputersEndpoint(
         IGettable.__init__(self, list[LabTechComputer])
         IPaginateable.__init__(self, LabTechComputer)
 
-        self.memoryslots = self._register_child_endpoint(ComputersMemoryslotsEndpoint(client, parent_endpoint=self))
-        self.software = self._register_child_endpoint(ComputersSoftwareEndpoint(client, parent_endpoint=self))
-        self.drives = self._register_child_endpoint(ComputersDrivesEndpoint(client, parent_endpoint=self))
-        self.chassis = self._register_child_endpoint(ComputersChassisEndpoint(client, parent_endpoint=self))
-        self.maintenancemodes = self._register_child_endpoint(
-            ComputersMaintenancemodesEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, id: int) -> ComputersIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized ComputersIdEndpoint object to move down the chain.
@@ -104,5 +98,40 @@ class ComputersEndpoint(
         """
         return self._parse_many(
             LabTechComputer,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
+
+    @cached_property
+    def chassis(self) -> ComputersChassisEndpoint:
+        """
+        The ComputersChassisEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersChassisEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def drives(self) -> ComputersDrivesEndpoint:
+        """
+        The ComputersDrivesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersDrivesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def maintenancemodes(self) -> ComputersMaintenancemodesEndpoint:
+        """
+        The ComputersMaintenancemodesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersMaintenancemodesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def memoryslots(self) -> ComputersMemoryslotsEndpoint:
+        """
+        The ComputersMemoryslotsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersMemoryslotsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def software(self) -> ComputersSoftwareEndpoint:
+        """
+        The ComputersSoftwareEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersSoftwareEndpoint(self.client, parent_endpoint=self))
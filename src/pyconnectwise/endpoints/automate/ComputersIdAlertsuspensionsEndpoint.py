@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ComputersIdAlertsuspensionsMaintenancewindowEndpoint import (
     ComputersIdAlertsuspensionsMaintenancewindowEndpoint,
 )
@@ -11,9 +13,20 @@ class ComputersIdAlertsuspensionsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "Alertsuspensions", parent_endpoint=parent_endpoint)
 
-        self.templatediversion = self._register_child_endpoint(
-            ComputersIdAlertsuspensionsTemplatediversionEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def maintenancewindow(self) -> ComputersIdAlertsuspensionsMaintenancewindowEndpoint:
+        """
+        The ComputersIdAlertsuspensionsMaintenancewindowEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ComputersIdAlertsuspensionsMaintenancewindowEndpoint(self.client, parent_endpoint=self)
         )
-        self.maintenancewindow = self._register_child_endpoint(
-            ComputersIdAlertsuspensionsMaintenancewindowEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def templatediversion(self) -> ComputersIdAlertsuspensionsTemplatediversionEndpoint:
+        """
+        The ComputersIdAlertsuspensionsTemplatediversionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ComputersIdAlertsuspensionsTemplatediversionEndpoint(self.client, parent_endpoint=self)
         )
@@ -67,5 +67,5 @@ class ComputersIdBiosEndpoint(
         """
         return self._parse_one(
             LabTechComputerBios,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ComputersIdCommandhistoryEndpoint(
         """
         return self._parse_many(
             AutomateCommandHistory,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ComputersIdComputerpatchingpoliciesEndpoint(
         """
         return self._parse_many(
             LabTechComputerPatchingPolicy,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ComputersIdDevicesEndpoint(
         """
         return self._parse_many(
             LabTechComputerDevice,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ComputersIdDriversEndpoint(
         """
         return self._parse_many(
             LabTechComputerDriver,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
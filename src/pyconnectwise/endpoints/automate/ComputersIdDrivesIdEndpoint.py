@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ComputersIdDrivesIdSmartdataEndpoint import (
     ComputersIdDrivesIdSmartdataEndpoint,
 )
@@ -8,6 +10,9 @@ class ComputersIdDrivesIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.smartdata = self._register_child_endpoint(
-            ComputersIdDrivesIdSmartdataEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def smartdata(self) -> ComputersIdDrivesIdSmartdataEndpoint:
+        """
+        The ComputersIdDrivesIdSmartdataEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdDrivesIdSmartdataEndpoint(self.client, parent_endpoint=self))
@@ -67,5 +67,5 @@ class ComputersIdDrivesIdSmartdataEndpoint(
         """
         return self._parse_many(
             LabTechSmartData,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ComputersIdEffectivepatchingpolicyEndpoint(
         """
         return self._parse_one(
             LabTechComputerEffectivePatchingPolicy,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
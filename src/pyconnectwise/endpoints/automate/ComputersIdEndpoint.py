@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ComputersIdAlertsEndpoint import (
     ComputersIdAlertsEndpoint,
 )
@@ -108,64 +110,6 @@ class ComputersIdEndpoint(
         IGettable.__init__(self, LabTechComputer)
         IPaginateable.__init__(self, LabTechComputer)
 
-        self.printers = self._register_child_endpoint(ComputersIdPrintersEndpoint(client, parent_endpoint=self))
-        self.commandhistory = self._register_child_endpoint(
-            ComputersIdCommandhistoryEndpoint(client, parent_endpoint=self)
-        )
-        self.alerts = self._register_child_endpoint(ComputersIdAlertsEndpoint(client, parent_endpoint=self))
-        self.operatingsystem = self._register_child_endpoint(
-            ComputersIdOperatingsystemEndpoint(client, parent_endpoint=self)
-        )
-        self.alertsuspensions = self._register_child_endpoint(
-            ComputersIdAlertsuspensionsEndpoint(client, parent_endpoint=self)
-        )
-        self.drives = self._register_child_endpoint(ComputersIdDrivesEndpoint(client, parent_endpoint=self))
-        self.effectivepatchingpolicy = self._register_child_endpoint(
-            ComputersIdEffectivepatchingpolicyEndpoint(client, parent_endpoint=self)
-        )
-        self.scheduledtasks = self._register_child_endpoint(
-            ComputersIdScheduledtasksEndpoint(client, parent_endpoint=self)
-        )
-        self.patchjobs = self._register_child_endpoint(ComputersIdPatchjobsEndpoint(client, parent_endpoint=self))
-        self.drivers = self._register_child_endpoint(ComputersIdDriversEndpoint(client, parent_endpoint=self))
-        self.monitors = self._register_child_endpoint(ComputersIdMonitorsEndpoint(client, parent_endpoint=self))
-        self.scheduledscripts = self._register_child_endpoint(
-            ComputersIdScheduledscriptsEndpoint(client, parent_endpoint=self)
-        )
-        self.bios = self._register_child_endpoint(ComputersIdBiosEndpoint(client, parent_endpoint=self))
-        self.runningscripts = self._register_child_endpoint(
-            ComputersIdRunningscriptsEndpoint(client, parent_endpoint=self)
-        )
-        self.commandexecute = self._register_child_endpoint(
-            ComputersIdCommandexecuteEndpoint(client, parent_endpoint=self)
-        )
-        self.ups = self._register_child_endpoint(ComputersIdUpsEndpoint(client, parent_endpoint=self))
-        self.sensors = self._register_child_endpoint(ComputersIdSensorsEndpoint(client, parent_endpoint=self))
-        self.services = self._register_child_endpoint(ComputersIdServicesEndpoint(client, parent_endpoint=self))
-        self.systemslots = self._register_child_endpoint(ComputersIdSystemslotsEndpoint(client, parent_endpoint=self))
-        self.patchingstats = self._register_child_endpoint(
-            ComputersIdPatchingstatsEndpoint(client, parent_endpoint=self)
-        )
-        self.software = self._register_child_endpoint(ComputersIdSoftwareEndpoint(client, parent_endpoint=self))
-        self.videocards = self._register_child_endpoint(ComputersIdVideocardsEndpoint(client, parent_endpoint=self))
-        self.microsoftupdates = self._register_child_endpoint(
-            ComputersIdMicrosoftupdatesEndpoint(client, parent_endpoint=self)
-        )
-        self.scripthistory = self._register_child_endpoint(
-            ComputersIdScripthistoryEndpoint(client, parent_endpoint=self)
-        )
-        self.devices = self._register_child_endpoint(ComputersIdDevicesEndpoint(client, parent_endpoint=self))
-        self.computerpatchingpolicies = self._register_child_endpoint(
-            ComputersIdComputerpatchingpoliciesEndpoint(client, parent_endpoint=self)
-        )
-        self.processors = self._register_child_endpoint(ComputersIdProcessorsEndpoint(client, parent_endpoint=self))
-        self.thirdpartypatches = self._register_child_endpoint(
-            ComputersIdThirdpartypatchesEndpoint(client, parent_endpoint=self)
-        )
-        self.monitoralertsuspensions = self._register_child_endpoint(
-            ComputersIdMonitoralertsuspensionsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self,
         page: int,
@@ -212,5 +156,214 @@ class ComputersIdEndpoint(
         """
         return self._parse_one(
             LabTechComputer,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
+        )
+
+    @cached_property
+    def alerts(self) -> ComputersIdAlertsEndpoint:
+        """
+        The ComputersIdAlertsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdAlertsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def alertsuspensions(self) -> ComputersIdAlertsuspensionsEndpoint:
+        """
+        The ComputersIdAlertsuspensionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdAlertsuspensionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def bios(self) -> ComputersIdBiosEndpoint:
+        """
+        The ComputersIdBiosEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdBiosEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def commandexecute(self) -> ComputersIdCommandexecuteEndpoint:
+        """
+        The ComputersIdCommandexecuteEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdCommandexecuteEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def commandhistory(self) -> ComputersIdCommandhistoryEndpoint:
+        """
+        The ComputersIdCommandhistoryEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdCommandhistoryEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def computerpatchingpolicies(self) -> ComputersIdComputerpatchingpoliciesEndpoint:
+        """
+        The ComputersIdComputerpatchingpoliciesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ComputersIdComputerpatchingpoliciesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def devices(self) -> ComputersIdDevicesEndpoint:
+        """
+        The ComputersIdDevicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdDevicesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def drivers(self) -> ComputersIdDriversEndpoint:
+        """
+        The ComputersIdDriversEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdDriversEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def drives(self) -> ComputersIdDrivesEndpoint:
+        """
+        The ComputersIdDrivesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdDrivesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def effectivepatchingpolicy(self) -> ComputersIdEffectivepatchingpolicyEndpoint:
+        """
+        The ComputersIdEffectivepatchingpolicyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ComputersIdEffectivepatchingpolicyEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def microsoftupdates(self) -> ComputersIdMicrosoftupdatesEndpoint:
+        """
+        The ComputersIdMicrosoftupdatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdMicrosoftupdatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def monitoralertsuspensions(self) -> ComputersIdMonitoralertsuspensionsEndpoint:
+        """
+        The ComputersIdMonitoralertsuspensionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ComputersIdMonitoralertsuspensionsEndpoint(self.client, parent_endpoint=self)
         )
+
+    @cached_property
+    def monitors(self) -> ComputersIdMonitorsEndpoint:
+        """
+        The ComputersIdMonitorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdMonitorsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def operatingsystem(self) -> ComputersIdOperatingsystemEndpoint:
+        """
+        The ComputersIdOperatingsystemEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdOperatingsystemEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def patchingstats(self) -> ComputersIdPatchingstatsEndpoint:
+        """
+        The ComputersIdPatchingstatsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdPatchingstatsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def patchjobs(self) -> ComputersIdPatchjobsEndpoint:
+        """
+        The ComputersIdPatchjobsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdPatchjobsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def printers(self) -> ComputersIdPrintersEndpoint:
+        """
+        The ComputersIdPrintersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdPrintersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def processors(self) -> ComputersIdProcessorsEndpoint:
+        """
+        The ComputersIdProcessorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdProcessorsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def runningscripts(self) -> ComputersIdRunningscriptsEndpoint:
+        """
+        The ComputersIdRunningscriptsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdRunningscriptsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scheduledscripts(self) -> ComputersIdScheduledscriptsEndpoint:
+        """
+        The ComputersIdScheduledscriptsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdScheduledscriptsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scheduledtasks(self) -> ComputersIdScheduledtasksEndpoint:
+        """
+        The ComputersIdScheduledtasksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdScheduledtasksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scripthistory(self) -> ComputersIdScripthistoryEndpoint:
+        """
+        The ComputersIdScripthistoryEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdScripthistoryEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sensors(self) -> ComputersIdSensorsEndpoint:
+        """
+        The ComputersIdSensorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdSensorsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def services(self) -> ComputersIdServicesEndpoint:
+        """
+        The ComputersIdServicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdServicesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def software(self) -> ComputersIdSoftwareEndpoint:
+        """
+        The ComputersIdSoftwareEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdSoftwareEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def systemslots(self) -> ComputersIdSystemslotsEndpoint:
+        """
+        The ComputersIdSystemslotsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdSystemslotsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def thirdpartypatches(self) -> ComputersIdThirdpartypatchesEndpoint:
+        """
+        The ComputersIdThirdpartypatchesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdThirdpartypatchesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ups(self) -> ComputersIdUpsEndpoint:
+        """
+        The ComputersIdUpsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdUpsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def videocards(self) -> ComputersIdVideocardsEndpoint:
+        """
+        The ComputersIdVideocardsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdVideocardsEndpoint(self.client, parent_endpoint=self))
@@ -33,5 +33,5 @@ class ComputersIdMonitoralertsuspensionsEndpoint(
         """
         return self._parse_one(
             LabTechMonitorAlertSuspension,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
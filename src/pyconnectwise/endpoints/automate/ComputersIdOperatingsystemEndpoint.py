@@ -67,5 +67,5 @@ class ComputersIdOperatingsystemEndpoint(
         """
         return self._parse_one(
             LabTechComputerOperatingSystem,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
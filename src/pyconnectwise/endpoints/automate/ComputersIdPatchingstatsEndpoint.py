@@ -67,5 +67,5 @@ class ComputersIdPatchingstatsEndpoint(
         """
         return self._parse_one(
             AutomateComputerPatchingStats,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ComputersIdPrintersEndpoint(
         """
         return self._parse_many(
             LabTechComputerPrinter,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
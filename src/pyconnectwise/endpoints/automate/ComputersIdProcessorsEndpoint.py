@@ -67,5 +67,5 @@ class ComputersIdProcessorsEndpoint(
         """
         return self._parse_many(
             LabTechComputerProcessor,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
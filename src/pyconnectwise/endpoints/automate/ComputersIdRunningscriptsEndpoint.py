@@ -67,5 +67,5 @@ class ComputersIdRunningscriptsEndpoint(
         """
         return self._parse_many(
             LabTechComputerRunningScript,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
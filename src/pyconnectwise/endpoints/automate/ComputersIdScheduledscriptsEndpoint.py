@@ -86,7 +86,7 @@ class ComputersIdScheduledscriptsEndpoint(
         """
         return self._parse_many(
             LabTechScheduledScript,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -105,5 +105,5 @@ class ComputersIdScheduledscriptsEndpoint(
         """
         return self._parse_one(
             LabTechScheduledScript,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
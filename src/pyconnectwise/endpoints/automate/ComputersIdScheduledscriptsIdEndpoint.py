@@ -67,5 +67,5 @@ class ComputersIdScheduledscriptsIdEndpoint(
         """
         return self._parse_one(
             LabTechScheduledScript,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ComputersIdScripthistoryEndpoint(
         """
         return self._parse_many(
             LabTechComputerScriptHistory,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
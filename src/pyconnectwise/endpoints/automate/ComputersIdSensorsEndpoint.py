@@ -67,5 +67,5 @@ class ComputersIdSensorsEndpoint(
         """
         return self._parse_many(
             LabTechComputerSensor,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ComputersIdServicesEndpoint(
         """
         return self._parse_many(
             LabTechComputerService,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -83,5 +83,5 @@ class ComputersIdSoftwareEndpoint(
         """
         return self._parse_many(
             LabTechComputerSoftware,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
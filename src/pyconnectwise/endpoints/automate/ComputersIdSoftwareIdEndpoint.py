@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ComputersIdSoftwareIdUninstallEndpoint import (
     ComputersIdSoftwareIdUninstallEndpoint,
 )
@@ -8,6 +10,9 @@ class ComputersIdSoftwareIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.uninstall = self._register_child_endpoint(
-            ComputersIdSoftwareIdUninstallEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def uninstall(self) -> ComputersIdSoftwareIdUninstallEndpoint:
+        """
+        The ComputersIdSoftwareIdUninstallEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdSoftwareIdUninstallEndpoint(self.client, parent_endpoint=self))
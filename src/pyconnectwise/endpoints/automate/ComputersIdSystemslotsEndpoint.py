@@ -67,5 +67,5 @@ class ComputersIdSystemslotsEndpoint(
         """
         return self._parse_many(
             LabTechComputerSystemSlot,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
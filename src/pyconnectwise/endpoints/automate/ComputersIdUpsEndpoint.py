@@ -67,5 +67,5 @@ class ComputersIdUpsEndpoint(
         """
         return self._parse_many(
             LabTechComputerUps,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ComputersIdVideocardsEndpoint(
         """
         return self._parse_many(
             LabTechComputerVideoCard,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
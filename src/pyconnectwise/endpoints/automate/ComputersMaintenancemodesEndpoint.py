@@ -67,5 +67,5 @@ class ComputersMaintenancemodesEndpoint(
         """
         return self._parse_many(
             LabTechMaintenanceMode,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ComputersMemoryslotsEndpoint(
         """
         return self._parse_many(
             LabTechComputerMemorySlot,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
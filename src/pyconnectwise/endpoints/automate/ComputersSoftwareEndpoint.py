@@ -67,5 +67,5 @@ class ComputersSoftwareEndpoint(
         """
         return self._parse_many(
             LabTechComputerSoftware,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -84,7 +84,7 @@ class ContactsEndpoint(
         """
         return self._parse_many(
             AutomateContact,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -103,5 +103,5 @@ class ContactsEndpoint(
         """
         return self._parse_one(
             AutomateContact,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
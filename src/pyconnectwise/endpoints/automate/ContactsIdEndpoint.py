@@ -70,7 +70,7 @@ class ContactsIdEndpoint(
         """
         return self._parse_one(
             AutomateContact,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def put(
@@ -89,7 +89,7 @@ class ContactsIdEndpoint(
         """
         return self._parse_one(
             AutomateContact,
-            super()._make_request("PUT", data=data, params=params).json(),
+            super()._make_request("PUT", data=data, params=params).content,
         )
 
     def delete(
@@ -83,5 +83,5 @@ class DataviewfoldersEndpoint(
         """
         return self._parse_many(
             LabTechDataViewFolder,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
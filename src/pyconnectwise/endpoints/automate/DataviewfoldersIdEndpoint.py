@@ -67,5 +67,5 @@ class DataviewfoldersIdEndpoint(
         """
         return self._parse_one(
             LabTechDataViewFolder,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
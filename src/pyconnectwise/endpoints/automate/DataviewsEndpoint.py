@@ -81,5 +81,5 @@ class DataviewsEndpoint(
         """
         return self._parse_many(
             LabTechDataView,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
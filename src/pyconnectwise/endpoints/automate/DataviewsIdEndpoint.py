@@ -67,5 +67,5 @@ class DataviewsIdEndpoint(
         """
         return self._parse_one(
             LabTechDataView,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class DrivesIdDrivestatsDailyEndpoint(
         """
         return self._parse_many(
             LabTechDriveStats,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
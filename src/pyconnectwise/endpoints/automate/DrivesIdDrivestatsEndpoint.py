@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.DrivesIdDrivestatsDailyEndpoint import (
     DrivesIdDrivestatsDailyEndpoint,
 )
@@ -17,7 +19,30 @@ class DrivesIdDrivestatsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "Drivestats", parent_endpoint=parent_endpoint)
 
-        self.yearly = self._register_child_endpoint(DrivesIdDrivestatsYearlyEndpoint(client, parent_endpoint=self))
-        self.weekly = self._register_child_endpoint(DrivesIdDrivestatsWeeklyEndpoint(client, parent_endpoint=self))
-        self.monthly = self._register_child_endpoint(DrivesIdDrivestatsMonthlyEndpoint(client, parent_endpoint=self))
-        self.daily = self._register_child_endpoint(DrivesIdDrivestatsDailyEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def daily(self) -> DrivesIdDrivestatsDailyEndpoint:
+        """
+        The DrivesIdDrivestatsDailyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(DrivesIdDrivestatsDailyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def monthly(self) -> DrivesIdDrivestatsMonthlyEndpoint:
+        """
+        The DrivesIdDrivestatsMonthlyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(DrivesIdDrivestatsMonthlyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def weekly(self) -> DrivesIdDrivestatsWeeklyEndpoint:
+        """
+        The DrivesIdDrivestatsWeeklyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(DrivesIdDrivestatsWeeklyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def yearly(self) -> DrivesIdDrivestatsYearlyEndpoint:
+        """
+        The DrivesIdDrivestatsYearlyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(DrivesIdDrivestatsYearlyEndpoint(self.client, parent_endpoint=self))
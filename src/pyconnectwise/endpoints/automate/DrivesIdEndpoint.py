@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.DrivesIdDrivestatsEndpoint import (
     DrivesIdDrivestatsEndpoint,
 )
@@ -8,4 +10,9 @@ class DrivesIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.drivestats = self._register_child_endpoint(DrivesIdDrivestatsEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def drivestats(self) -> DrivesIdDrivestatsEndpoint:
+        """
+        The DrivesIdDrivestatsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(DrivesIdDrivestatsEndpoint(self.client, parent_endpoint=self))
@@ -67,5 +67,5 @@ class EventlogsEndpoint(
         """
         return self._parse_many(
             LabTechEventLog,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ExternalsystemcredentialsClientsIdEndpoint(
         """
         return self._parse_many(
             LabTechExternalSystemCredentials,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
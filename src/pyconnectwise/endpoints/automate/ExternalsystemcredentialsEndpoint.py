@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ExternalsystemcredentialsClientsEndpoint import (
     ExternalsystemcredentialsClientsEndpoint,
 )
@@ -8,6 +10,11 @@ class ExternalsystemcredentialsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "Externalsystemcredentials", parent_endpoint=parent_endpoint)
 
-        self.clients = self._register_child_endpoint(
-            ExternalsystemcredentialsClientsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def clients(self) -> ExternalsystemcredentialsClientsEndpoint:
+        """
+        The ExternalsystemcredentialsClientsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ExternalsystemcredentialsClientsEndpoint(self.client, parent_endpoint=self)
         )
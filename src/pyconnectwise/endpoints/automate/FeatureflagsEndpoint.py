@@ -30,5 +30,5 @@ class FeatureflagsEndpoint(ConnectWiseEndpoint, IPostable[LabTechFeatureFlag, Co
         """
         return self._parse_one(
             LabTechFeatureFlag,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class GrouppatchingpoliciesEndpoint(
         """
         return self._parse_many(
             AutomateGroupPatchingPolicy,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -82,7 +82,7 @@ class GroupsEndpoint(
         Returns:
             list[LabTechGroup]: The parsed response data.
         """
-        return self._parse_many(LabTechGroup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechGroup, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self,
@@ -98,4 +98,4 @@ class GroupsEndpoint(
         Returns:
             LabTechGroup: The parsed response data.
         """
-        return self._parse_one(LabTechGroup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LabTechGroup, super()._make_request("POST", data=data, params=params).content)
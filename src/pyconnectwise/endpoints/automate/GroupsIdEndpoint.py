@@ -65,4 +65,4 @@ class GroupsIdEndpoint(
         Returns:
             LabTechGroup: The parsed response data.
         """
-        return self._parse_one(LabTechGroup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LabTechGroup, super()._make_request("GET", data=data, params=params).content)
@@ -67,5 +67,5 @@ class LicensedproductsEndpoint(
         """
         return self._parse_many(
             LabTechLicensedProduct,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -65,4 +65,4 @@ class LinksEndpoint(
         Returns:
             list[LabTechLink]: The parsed response data.
         """
-        return self._parse_many(LabTechLink, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechLink, super()._make_request("GET", data=data, params=params).content)
@@ -84,7 +84,7 @@ class LocationsEndpoint(
         """
         return self._parse_many(
             AutomateLocation,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -103,5 +103,5 @@ class LocationsEndpoint(
         """
         return self._parse_one(
             LabTechLocation,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.LocationsIdProbeconfigurationEndpoint import (
     LocationsIdProbeconfigurationEndpoint,
 )
@@ -11,7 +13,16 @@ class LocationsIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.probeconfiguration = self._register_child_endpoint(
-            LocationsIdProbeconfigurationEndpoint(client, parent_endpoint=self)
-        )
-        self.upgradeprobe = self._register_child_endpoint(LocationsIdUpgradeprobeEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def probeconfiguration(self) -> LocationsIdProbeconfigurationEndpoint:
+        """
+        The LocationsIdProbeconfigurationEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(LocationsIdProbeconfigurationEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def upgradeprobe(self) -> LocationsIdUpgradeprobeEndpoint:
+        """
+        The LocationsIdUpgradeprobeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(LocationsIdUpgradeprobeEndpoint(self.client, parent_endpoint=self))
@@ -74,7 +74,7 @@ class LocationsIdProbeconfigurationEndpoint(
         """
         return self._parse_one(
             LabTechProbeConfiguration,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -93,7 +93,7 @@ class LocationsIdProbeconfigurationEndpoint(
         """
         return self._parse_one(
             LabTechProbeConfiguration,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
 
     def delete(
@@ -126,5 +126,5 @@ class LocationsIdProbeconfigurationEndpoint(
         """
         return self._parse_one(
             LabTechProbeConfiguration,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
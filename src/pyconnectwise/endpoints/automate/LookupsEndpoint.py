@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.LookupsProbeeventlevelsEndpoint import (
     LookupsProbeeventlevelsEndpoint,
 )
@@ -20,18 +22,39 @@ class LookupsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "Lookups", parent_endpoint=parent_endpoint)
 
-        self.probeeventlevels = self._register_child_endpoint(
-            LookupsProbeeventlevelsEndpoint(client, parent_endpoint=self)
-        )
-        self.snmphashmethods = self._register_child_endpoint(
-            LookupsSnmphashmethodsEndpoint(client, parent_endpoint=self)
-        )
-        self.snmpencryptionmethods = self._register_child_endpoint(
-            LookupsSnmpencryptionmethodsEndpoint(client, parent_endpoint=self)
-        )
-        self.scanfrequencies = self._register_child_endpoint(
-            LookupsScanfrequenciesEndpoint(client, parent_endpoint=self)
-        )
-        self.statusscannetworkportoptions = self._register_child_endpoint(
-            LookupsStatusscannetworkportoptionsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def probeeventlevels(self) -> LookupsProbeeventlevelsEndpoint:
+        """
+        The LookupsProbeeventlevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(LookupsProbeeventlevelsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scanfrequencies(self) -> LookupsScanfrequenciesEndpoint:
+        """
+        The LookupsScanfrequenciesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(LookupsScanfrequenciesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def snmpencryptionmethods(self) -> LookupsSnmpencryptionmethodsEndpoint:
+        """
+        The LookupsSnmpencryptionmethodsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(LookupsSnmpencryptionmethodsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def snmphashmethods(self) -> LookupsSnmphashmethodsEndpoint:
+        """
+        The LookupsSnmphashmethodsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(LookupsSnmphashmethodsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statusscannetworkportoptions(self) -> LookupsStatusscannetworkportoptionsEndpoint:
+        """
+        The LookupsStatusscannetworkportoptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            LookupsStatusscannetworkportoptionsEndpoint(self.client, parent_endpoint=self)
         )
@@ -67,5 +67,5 @@ class LookupsProbeeventlevelsEndpoint(
         """
         return self._parse_many(
             LabTechProbeEventLevel,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
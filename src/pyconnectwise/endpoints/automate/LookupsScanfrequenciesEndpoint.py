@@ -67,5 +67,5 @@ class LookupsScanfrequenciesEndpoint(
         """
         return self._parse_many(
             LabTechScanFrequency,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class LookupsSnmpencryptionmethodsEndpoint(
         """
         return self._parse_many(
             LabTechEncryptionMethod,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class LookupsSnmphashmethodsEndpoint(
         """
         return self._parse_many(
             LabTechHashMethod,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
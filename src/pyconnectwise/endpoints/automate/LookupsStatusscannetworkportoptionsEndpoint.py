@@ -72,5 +72,5 @@ class LookupsStatusscannetworkportoptionsEndpoint(
         """
         return self._parse_many(
             LabTechStatusScanNetworkPortOption,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
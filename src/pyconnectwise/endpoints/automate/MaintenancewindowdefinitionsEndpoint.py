@@ -72,5 +72,5 @@ class MaintenancewindowdefinitionsEndpoint(
         """
         return self._parse_many(
             AutomateMaintenanceWindowDefinition,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.MonitorsIdCollecteddataDailyaveragesEndpoint import (
     MonitorsIdCollecteddataDailyaveragesEndpoint,
 )
@@ -17,15 +19,38 @@ class MonitorsIdCollecteddataEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "Collecteddata", parent_endpoint=parent_endpoint)
 
-        self.monthlyaverages = self._register_child_endpoint(
-            MonitorsIdCollecteddataMonthlyaveragesEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def dailyaverages(self) -> MonitorsIdCollecteddataDailyaveragesEndpoint:
+        """
+        The MonitorsIdCollecteddataDailyaveragesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MonitorsIdCollecteddataDailyaveragesEndpoint(self.client, parent_endpoint=self)
         )
-        self.weeklyaverages = self._register_child_endpoint(
-            MonitorsIdCollecteddataWeeklyaveragesEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def monthlyaverages(self) -> MonitorsIdCollecteddataMonthlyaveragesEndpoint:
+        """
+        The MonitorsIdCollecteddataMonthlyaveragesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MonitorsIdCollecteddataMonthlyaveragesEndpoint(self.client, parent_endpoint=self)
         )
-        self.dailyaverages = self._register_child_endpoint(
-            MonitorsIdCollecteddataDailyaveragesEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def weeklyaverages(self) -> MonitorsIdCollecteddataWeeklyaveragesEndpoint:
+        """
+        The MonitorsIdCollecteddataWeeklyaveragesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MonitorsIdCollecteddataWeeklyaveragesEndpoint(self.client, parent_endpoint=self)
         )
-        self.yearlyaverages = self._register_child_endpoint(
-            MonitorsIdCollecteddataYearlyaveragesEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def yearlyaverages(self) -> MonitorsIdCollecteddataYearlyaveragesEndpoint:
+        """
+        The MonitorsIdCollecteddataYearlyaveragesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MonitorsIdCollecteddataYearlyaveragesEndpoint(self.client, parent_endpoint=self)
         )
@@ -67,5 +67,5 @@ class MonitorsIdDatacollectionsettingsEndpoint(
         """
         return self._parse_one(
             LabTechMonitorDataCollectionSettings,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.MonitorsIdCollecteddataEndpoint import (
     MonitorsIdCollecteddataEndpoint,
 )
@@ -11,9 +13,18 @@ class MonitorsIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.collecteddata = self._register_child_endpoint(
-            MonitorsIdCollecteddataEndpoint(client, parent_endpoint=self)
-        )
-        self.datacollectionsettings = self._register_child_endpoint(
-            MonitorsIdDatacollectionsettingsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def collecteddata(self) -> MonitorsIdCollecteddataEndpoint:
+        """
+        The MonitorsIdCollecteddataEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MonitorsIdCollecteddataEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def datacollectionsettings(self) -> MonitorsIdDatacollectionsettingsEndpoint:
+        """
+        The MonitorsIdDatacollectionsettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MonitorsIdDatacollectionsettingsEndpoint(self.client, parent_endpoint=self)
         )
@@ -86,7 +86,7 @@ class NetworkdevicesEndpoint(
         """
         return self._parse_many(
             LabTechNetworkDevice,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -105,5 +105,5 @@ class NetworkdevicesEndpoint(
         """
         return self._parse_one(
             LabTechNetworkDevice,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
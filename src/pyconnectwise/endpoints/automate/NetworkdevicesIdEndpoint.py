@@ -71,7 +71,7 @@ class NetworkdevicesIdEndpoint(
         """
         return self._parse_one(
             LabTechNetworkDevice,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def patch(
@@ -90,5 +90,5 @@ class NetworkdevicesIdEndpoint(
         """
         return self._parse_one(
             LabTechNetworkDevice,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.PatchactionsDeployallapprovedEndpoint import (
     PatchactionsDeployallapprovedEndpoint,
 )
@@ -23,21 +25,46 @@ class PatchactionsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "Patchactions", parent_endpoint=parent_endpoint)
 
-        self.settoteststage = self._register_child_endpoint(
-            PatchactionsSettoteststageEndpoint(client, parent_endpoint=self)
-        )
-        self.deployallapproved = self._register_child_endpoint(
-            PatchactionsDeployallapprovedEndpoint(client, parent_endpoint=self)
-        )
-        self.reattemptfailed = self._register_child_endpoint(
-            PatchactionsReattemptfailedEndpoint(client, parent_endpoint=self)
-        )
-        self.deployallsecurity = self._register_child_endpoint(
-            PatchactionsDeployallsecurityEndpoint(client, parent_endpoint=self)
-        )
-        self.settopilotstage = self._register_child_endpoint(
-            PatchactionsSettopilotstageEndpoint(client, parent_endpoint=self)
-        )
-        self.settoproductionstage = self._register_child_endpoint(
-            PatchactionsSettoproductionstageEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def deployallapproved(self) -> PatchactionsDeployallapprovedEndpoint:
+        """
+        The PatchactionsDeployallapprovedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PatchactionsDeployallapprovedEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def deployallsecurity(self) -> PatchactionsDeployallsecurityEndpoint:
+        """
+        The PatchactionsDeployallsecurityEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PatchactionsDeployallsecurityEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reattemptfailed(self) -> PatchactionsReattemptfailedEndpoint:
+        """
+        The PatchactionsReattemptfailedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PatchactionsReattemptfailedEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def settopilotstage(self) -> PatchactionsSettopilotstageEndpoint:
+        """
+        The PatchactionsSettopilotstageEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PatchactionsSettopilotstageEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def settoproductionstage(self) -> PatchactionsSettoproductionstageEndpoint:
+        """
+        The PatchactionsSettoproductionstageEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            PatchactionsSettoproductionstageEndpoint(self.client, parent_endpoint=self)
         )
+
+    @cached_property
+    def settoteststage(self) -> PatchactionsSettoteststageEndpoint:
+        """
+        The PatchactionsSettoteststageEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PatchactionsSettoteststageEndpoint(self.client, parent_endpoint=self))
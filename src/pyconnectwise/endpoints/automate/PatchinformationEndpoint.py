@@ -67,5 +67,5 @@ class PatchinformationEndpoint(
         """
         return self._parse_one(
             LabTechPatchInformation,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
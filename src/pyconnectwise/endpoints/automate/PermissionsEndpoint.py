@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.PermissionsClientsEndpoint import (
     PermissionsClientsEndpoint,
 )
@@ -11,5 +13,16 @@ class PermissionsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "Permissions", parent_endpoint=parent_endpoint)
 
-        self.clients = self._register_child_endpoint(PermissionsClientsEndpoint(client, parent_endpoint=self))
-        self.users = self._register_child_endpoint(PermissionsUsersEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def clients(self) -> PermissionsClientsEndpoint:
+        """
+        The PermissionsClientsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PermissionsClientsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def users(self) -> PermissionsUsersEndpoint:
+        """
+        The PermissionsUsersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PermissionsUsersEndpoint(self.client, parent_endpoint=self))
@@ -33,5 +33,5 @@ class ProbeconfigurationEnableprobeIdEndpoint(
         """
         return self._parse_one(
             LabTechProbeConfiguration,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
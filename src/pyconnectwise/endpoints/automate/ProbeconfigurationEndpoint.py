@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ProbeconfigurationEnableprobeEndpoint import (
     ProbeconfigurationEnableprobeEndpoint,
 )
@@ -11,10 +13,6 @@ class ProbeconfigurationEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "Probeconfiguration", parent_endpoint=parent_endpoint)
 
-        self.enableprobe = self._register_child_endpoint(
-            ProbeconfigurationEnableprobeEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, id: int) -> ProbeconfigurationIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized ProbeconfigurationIdEndpoint object to move down the chain.
@@ -27,3 +25,10 @@ class ProbeconfigurationEndpoint(ConnectWiseEndpoint):
         child = ProbeconfigurationIdEndpoint(self.client, parent_endpoint=self)
         child._id = id
         return child
+
+    @cached_property
+    def enableprobe(self) -> ProbeconfigurationEnableprobeEndpoint:
+        """
+        The ProbeconfigurationEnableprobeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProbeconfigurationEnableprobeEndpoint(self.client, parent_endpoint=self))
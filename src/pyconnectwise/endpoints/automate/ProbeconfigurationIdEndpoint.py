@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ProbeconfigurationIdAgentpushcredentialsEndpoint import (
     ProbeconfigurationIdAgentpushcredentialsEndpoint,
 )
@@ -11,9 +13,20 @@ class ProbeconfigurationIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.agentpushcredentials = self._register_child_endpoint(
-            ProbeconfigurationIdAgentpushcredentialsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def agentpushcredentials(self) -> ProbeconfigurationIdAgentpushcredentialsEndpoint:
+        """
+        The ProbeconfigurationIdAgentpushcredentialsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProbeconfigurationIdAgentpushcredentialsEndpoint(self.client, parent_endpoint=self)
         )
-        self.snmpconfiguration = self._register_child_endpoint(
-            ProbeconfigurationIdSnmpconfigurationEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def snmpconfiguration(self) -> ProbeconfigurationIdSnmpconfigurationEndpoint:
+        """
+        The ProbeconfigurationIdSnmpconfigurationEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProbeconfigurationIdSnmpconfigurationEndpoint(self.client, parent_endpoint=self)
         )
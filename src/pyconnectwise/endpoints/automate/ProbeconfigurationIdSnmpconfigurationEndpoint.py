@@ -71,7 +71,7 @@ class ProbeconfigurationIdSnmpconfigurationEndpoint(
         """
         return self._parse_one(
             LabTechProbeSnmpConfiguration,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def patch(
@@ -90,5 +90,5 @@ class ProbeconfigurationIdSnmpconfigurationEndpoint(
         """
         return self._parse_one(
             LabTechProbeSnmpConfiguration,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
@@ -67,5 +67,5 @@ class ProbeeventsEndpoint(
         """
         return self._parse_many(
             LabTechProbeEvent,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
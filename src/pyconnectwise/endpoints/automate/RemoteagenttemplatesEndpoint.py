@@ -70,7 +70,7 @@ class RemoteagenttemplatesEndpoint(
         """
         return self._parse_many(
             LabTechRemoteAgentTemplate,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -89,5 +89,5 @@ class RemoteagenttemplatesEndpoint(
         """
         return self._parse_one(
             LabTechRemoteAgentTemplate,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
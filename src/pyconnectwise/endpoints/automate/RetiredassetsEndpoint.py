@@ -67,5 +67,5 @@ class RetiredassetsEndpoint(
         """
         return self._parse_many(
             LabTechRetiredAsset,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
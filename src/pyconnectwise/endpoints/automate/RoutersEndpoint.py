@@ -65,4 +65,4 @@ class RoutersEndpoint(
         Returns:
             list[LabTechRouter]: The parsed response data.
         """
-        return self._parse_many(LabTechRouter, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechRouter, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ScriptfoldersHierarchyEndpoint import (
     ScriptfoldersHierarchyEndpoint,
 )
@@ -30,8 +32,6 @@ class ScriptfoldersEndpoint(
         IPostable.__init__(self, LabTechScriptFolder)
         IPaginateable.__init__(self, LabTechScriptFolder)
 
-        self.hierarchy = self._register_child_endpoint(ScriptfoldersHierarchyEndpoint(client, parent_endpoint=self))
-
     def id(self, id: int) -> ScriptfoldersIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized ScriptfoldersIdEndpoint object to move down the chain.
@@ -91,7 +91,7 @@ class ScriptfoldersEndpoint(
         """
         return self._parse_many(
             LabTechScriptFolder,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -110,5 +110,12 @@ class ScriptfoldersEndpoint(
         """
         return self._parse_one(
             LabTechScriptFolder,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
+
+    @cached_property
+    def hierarchy(self) -> ScriptfoldersHierarchyEndpoint:
+        """
+        The ScriptfoldersHierarchyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScriptfoldersHierarchyEndpoint(self.client, parent_endpoint=self))
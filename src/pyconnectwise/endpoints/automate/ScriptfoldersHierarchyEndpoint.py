@@ -33,5 +33,5 @@ class ScriptfoldersHierarchyEndpoint(
         """
         return self._parse_many(
             LabTechScriptFolder,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -71,7 +71,7 @@ class ScriptfoldersIdEndpoint(
         """
         return self._parse_one(
             LabTechScriptFolder,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def delete(
@@ -104,5 +104,5 @@ class ScriptfoldersIdEndpoint(
         """
         return self._parse_one(
             LabTechScriptFolder,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ScriptingRunningscriptsEndpoint import (
     ScriptingRunningscriptsEndpoint,
 )
@@ -11,9 +13,16 @@ class ScriptingEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "Scripting", parent_endpoint=parent_endpoint)
 
-        self.runningscripts = self._register_child_endpoint(
-            ScriptingRunningscriptsEndpoint(client, parent_endpoint=self)
-        )
-        self.scriptschedules = self._register_child_endpoint(
-            ScriptingScriptschedulesEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def runningscripts(self) -> ScriptingRunningscriptsEndpoint:
+        """
+        The ScriptingRunningscriptsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScriptingRunningscriptsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scriptschedules(self) -> ScriptingScriptschedulesEndpoint:
+        """
+        The ScriptingScriptschedulesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScriptingScriptschedulesEndpoint(self.client, parent_endpoint=self))
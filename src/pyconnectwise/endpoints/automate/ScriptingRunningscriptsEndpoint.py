@@ -67,5 +67,5 @@ class ScriptingRunningscriptsEndpoint(
         """
         return self._parse_many(
             AutomateRunningScript,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -83,5 +83,5 @@ class ScriptingScriptschedulesEndpoint(
         """
         return self._parse_many(
             AutomateScheduledScript,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
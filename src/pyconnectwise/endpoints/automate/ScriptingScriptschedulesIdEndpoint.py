@@ -48,5 +48,5 @@ class ScriptingScriptschedulesIdEndpoint(
         """
         return self._parse_one(
             AutomateScheduledScript,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
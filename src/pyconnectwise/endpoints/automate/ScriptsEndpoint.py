@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ScriptsIdEndpoint import ScriptsIdEndpoint
 from pyconnectwise.endpoints.automate.ScriptsScriptfoldersEndpoint import (
     ScriptsScriptfoldersEndpoint,
@@ -18,8 +20,6 @@ class ScriptsEndpoint(ConnectWiseEndpoint, IPostable[AutomateScript, ConnectWise
         ConnectWiseEndpoint.__init__(self, client, "Scripts", parent_endpoint=parent_endpoint)
         IPostable.__init__(self, AutomateScript)
 
-        self.scriptfolders = self._register_child_endpoint(ScriptsScriptfoldersEndpoint(client, parent_endpoint=self))
-
     def id(self, id: int) -> ScriptsIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized ScriptsIdEndpoint object to move down the chain.
@@ -49,5 +49,12 @@ class ScriptsEndpoint(ConnectWiseEndpoint, IPostable[AutomateScript, ConnectWise
         """
         return self._parse_one(
             AutomateScript,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
+
+    @cached_property
+    def scriptfolders(self) -> ScriptsScriptfoldersEndpoint:
+        """
+        The ScriptsScriptfoldersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScriptsScriptfoldersEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ScriptsIdCopyEndpoint import ScriptsIdCopyEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.interfaces import (
@@ -21,8 +23,6 @@ class ScriptsIdEndpoint(
         IGettable.__init__(self, AutomateScript)
         IPuttable.__init__(self, AutomateScript)
 
-        self.copy = self._register_child_endpoint(ScriptsIdCopyEndpoint(client, parent_endpoint=self))
-
     def get(
         self,
         data: JSON | None = None,
@@ -39,7 +39,7 @@ class ScriptsIdEndpoint(
         """
         return self._parse_one(
             AutomateScript,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def put(
@@ -58,7 +58,7 @@ class ScriptsIdEndpoint(
         """
         return self._parse_one(
             AutomateScript,
-            super()._make_request("PUT", data=data, params=params).json(),
+            super()._make_request("PUT", data=data, params=params).content,
         )
 
     def delete(
@@ -74,3 +74,10 @@ class ScriptsIdEndpoint(
             params (dict[str, int | str]): The parameters to send in the request query string.
         """
         super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def copy(self) -> ScriptsIdCopyEndpoint:
+        """
+        The ScriptsIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScriptsIdCopyEndpoint(self.client, parent_endpoint=self))
@@ -49,5 +49,5 @@ class ScriptsScriptfoldersEndpoint(
         """
         return self._parse_one(
             AutomateSubmittableScriptFolder,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
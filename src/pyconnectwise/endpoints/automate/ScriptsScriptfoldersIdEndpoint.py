@@ -33,5 +33,5 @@ class ScriptsScriptfoldersIdEndpoint(
         """
         return self._parse_one(
             AutomateSubmittableScriptFolder,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
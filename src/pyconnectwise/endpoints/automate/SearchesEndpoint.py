@@ -65,4 +65,4 @@ class SearchesEndpoint(
         Returns:
             list[LabTechSearch]: The parsed response data.
         """
-        return self._parse_many(LabTechSearch, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LabTechSearch, super()._make_request("GET", data=data, params=params).content)
@@ -67,5 +67,5 @@ class SensorchecksEndpoint(
         """
         return self._parse_many(
             LabTechSensorCheck,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
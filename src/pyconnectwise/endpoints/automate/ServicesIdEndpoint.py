@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.ServicesIdClassifyEndpoint import (
     ServicesIdClassifyEndpoint,
 )
@@ -8,4 +10,9 @@ class ServicesIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.classify = self._register_child_endpoint(ServicesIdClassifyEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def classify(self) -> ServicesIdClassifyEndpoint:
+        """
+        The ServicesIdClassifyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServicesIdClassifyEndpoint(self.client, parent_endpoint=self))
@@ -33,5 +33,5 @@ class StatisticsDrivesEndpoint(
         """
         return self._parse_many(
             LabTechDriveStatistics,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.StatisticsDrivesEndpoint import (
     StatisticsDrivesEndpoint,
 )
@@ -8,4 +10,9 @@ class StatisticsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "Statistics", parent_endpoint=parent_endpoint)
 
-        self.drives = self._register_child_endpoint(StatisticsDrivesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def drives(self) -> StatisticsDrivesEndpoint:
+        """
+        The StatisticsDrivesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(StatisticsDrivesEndpoint(self.client, parent_endpoint=self))
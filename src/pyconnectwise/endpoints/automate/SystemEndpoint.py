@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.SystemServerinformationEndpoint import (
     SystemServerinformationEndpoint,
 )
@@ -8,6 +10,9 @@ class SystemEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "System", parent_endpoint=parent_endpoint)
 
-        self.serverinformation = self._register_child_endpoint(
-            SystemServerinformationEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def serverinformation(self) -> SystemServerinformationEndpoint:
+        """
+        The SystemServerinformationEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemServerinformationEndpoint(self.client, parent_endpoint=self))
@@ -67,5 +67,5 @@ class SystemServerinformationEndpoint(
         """
         return self._parse_many(
             AutomateServerInformation,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
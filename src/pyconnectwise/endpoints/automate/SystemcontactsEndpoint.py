@@ -67,5 +67,5 @@ class SystemcontactsEndpoint(
         """
         return self._parse_many(
             LabTechContact,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
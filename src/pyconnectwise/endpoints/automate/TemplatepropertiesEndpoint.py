@@ -70,7 +70,7 @@ class TemplatepropertiesEndpoint(
         """
         return self._parse_many(
             LabTechTemplateProperty,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -89,5 +89,5 @@ class TemplatepropertiesEndpoint(
         """
         return self._parse_one(
             LabTechTemplateProperty,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
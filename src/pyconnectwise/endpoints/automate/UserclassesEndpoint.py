@@ -81,5 +81,5 @@ class UserclassesEndpoint(
         """
         return self._parse_many(
             AutomateUserClass,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
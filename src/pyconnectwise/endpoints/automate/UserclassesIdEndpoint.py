@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.UserclassesIdWebextensionsEndpoint import (
     UserclassesIdWebextensionsEndpoint,
 )
@@ -24,10 +26,6 @@ class UserclassesIdEndpoint(
         IGettable.__init__(self, AutomateUserClass)
         IPaginateable.__init__(self, AutomateUserClass)
 
-        self.webextensions = self._register_child_endpoint(
-            UserclassesIdWebextensionsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self,
         page: int,
@@ -74,5 +72,12 @@ class UserclassesIdEndpoint(
         """
         return self._parse_one(
             AutomateUserClass,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
+
+    @cached_property
+    def webextensions(self) -> UserclassesIdWebextensionsEndpoint:
+        """
+        The UserclassesIdWebextensionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UserclassesIdWebextensionsEndpoint(self.client, parent_endpoint=self))
@@ -36,7 +36,7 @@ class UserclassesIdWebextensionsEndpoint(
         """
         return self._parse_many(
             AutomateUserClassWebExtensionViewModel,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def put(
@@ -55,5 +55,5 @@ class UserclassesIdWebextensionsEndpoint(
         """
         return self._parse_many(
             AutomateUserClassWebExtensionViewModel,
-            super()._make_request("PUT", data=data, params=params).json(),
+            super()._make_request("PUT", data=data, params=params).content,
         )
@@ -30,5 +30,5 @@ class UserprofilesEndpoint(ConnectWiseEndpoint, IGettable[LabTechUserProfile, Co
         """
         return self._parse_one(
             LabTechUserProfile,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
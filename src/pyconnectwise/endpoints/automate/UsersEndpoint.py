@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.UsersFoldersEndpoint import UsersFoldersEndpoint
 from pyconnectwise.endpoints.automate.UsersIdEndpoint import UsersIdEndpoint
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -16,8 +18,6 @@ class UsersEndpoint(ConnectWiseEndpoint, IPostable[AutomateUser, ConnectWiseAuto
         ConnectWiseEndpoint.__init__(self, client, "Users", parent_endpoint=parent_endpoint)
         IPostable.__init__(self, AutomateUser)
 
-        self.folders = self._register_child_endpoint(UsersFoldersEndpoint(client, parent_endpoint=self))
-
     def id(self, id: int) -> UsersIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized UsersIdEndpoint object to move down the chain.
@@ -45,4 +45,11 @@ class UsersEndpoint(ConnectWiseEndpoint, IPostable[AutomateUser, ConnectWiseAuto
         Returns:
             AutomateUser: The parsed response data.
         """
-        return self._parse_one(AutomateUser, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AutomateUser, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def folders(self) -> UsersFoldersEndpoint:
+        """
+        The UsersFoldersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UsersFoldersEndpoint(self.client, parent_endpoint=self))
@@ -46,5 +46,5 @@ class UsersFoldersEndpoint(ConnectWiseEndpoint, IPostable[AutomateUserFolder, Co
         """
         return self._parse_one(
             AutomateUserFolder,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
@@ -71,7 +71,7 @@ class UsersFoldersIdEndpoint(
         """
         return self._parse_one(
             AutomateUserFolder,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def delete(
@@ -104,5 +104,5 @@ class UsersFoldersIdEndpoint(
         """
         return self._parse_one(
             AutomateUserFolder,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
@@ -33,5 +33,5 @@ class UsersIdAuthlinkEndpoint(
         """
         return self._parse_one(
             LabTechAuthServiceCredentials,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.automate.UsersIdAuthlinkEndpoint import (
     UsersIdAuthlinkEndpoint,
 )
@@ -40,12 +42,6 @@ class UsersIdEndpoint(
         IPatchable.__init__(self, AutomateUser)
         IPaginateable.__init__(self, AutomateUser)
 
-        self.useraccess = self._register_child_endpoint(UsersIdUseraccessEndpoint(client, parent_endpoint=self))
-        self.settings = self._register_child_endpoint(UsersIdSettingsEndpoint(client, parent_endpoint=self))
-        self.favorites = self._register_child_endpoint(UsersIdFavoritesEndpoint(client, parent_endpoint=self))
-        self.authlink = self._register_child_endpoint(UsersIdAuthlinkEndpoint(client, parent_endpoint=self))
-        self.changepassword = self._register_child_endpoint(UsersIdChangepasswordEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self,
         page: int,
@@ -90,7 +86,7 @@ class UsersIdEndpoint(
         Returns:
             AutomateUser: The parsed response data.
         """
-        return self._parse_one(AutomateUser, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AutomateUser, super()._make_request("GET", data=data, params=params).content)
 
     def delete(
         self,
@@ -122,5 +118,40 @@ class UsersIdEndpoint(
         """
         return self._parse_one(
             AutomateUser,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
+
+    @cached_property
+    def authlink(self) -> UsersIdAuthlinkEndpoint:
+        """
+        The UsersIdAuthlinkEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UsersIdAuthlinkEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def changepassword(self) -> UsersIdChangepasswordEndpoint:
+        """
+        The UsersIdChangepasswordEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UsersIdChangepasswordEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def favorites(self) -> UsersIdFavoritesEndpoint:
+        """
+        The UsersIdFavoritesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UsersIdFavoritesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def settings(self) -> UsersIdSettingsEndpoint:
+        """
+        The UsersIdSettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UsersIdSettingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def useraccess(self) -> UsersIdUseraccessEndpoint:
+        """
+        The UsersIdUseraccessEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UsersIdUseraccessEndpoint(self.client, parent_endpoint=self))
@@ -33,5 +33,5 @@ class UsersIdFavoritesEndpoint(
         """
         return self._parse_one(
             LabTechUserFavorite,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
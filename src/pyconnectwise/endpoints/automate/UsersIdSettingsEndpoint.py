@@ -30,5 +30,5 @@ class UsersIdSettingsEndpoint(ConnectWiseEndpoint, IPostable[LabTechUserSetting,
         """
         return self._parse_one(
             LabTechUserSetting,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
@@ -30,5 +30,5 @@ class UsersIdUseraccessEndpoint(ConnectWiseEndpoint, IGettable[AutomateUserAcces
         """
         return self._parse_one(
             AutomateUserAccess,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -0,0 +1,52 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPostable
+from pyconnectwise.models.automate import AutomateAuthInformation, AutomateTokenResult
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ApitokenEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[AutomateAuthInformation, ConnectWiseAutomateRequestParams],
+    IAsyncPostable[AutomateTokenResult, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Apitoken", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, AutomateAuthInformation)
+        IAsyncPostable.__init__(self, AutomateTokenResult)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateAuthInformation:
+        """
+        Performs a GET request against the /Apitoken endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateAuthInformation: The parsed response data.
+        """
+        return self._parse_one(
+            AutomateAuthInformation, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateTokenResult:
+        """
+        Performs a POST request against the /Apitoken endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateTokenResult: The parsed response data.
+        """
+        return self._parse_one(
+            AutomateTokenResult, (await super()._make_request("POST", data=data, params=params)).content
+        )
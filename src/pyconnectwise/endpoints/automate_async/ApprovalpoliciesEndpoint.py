@@ -0,0 +1,11 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ApprovalpoliciesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Approvalpolicies", parent_endpoint=parent_endpoint)
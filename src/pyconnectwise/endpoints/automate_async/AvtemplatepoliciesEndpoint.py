@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.automate import LabTechAVTemplatePolicy
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class AvtemplatepoliciesEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPostable[LabTechAVTemplatePolicy, ConnectWiseAutomateRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Avtemplatepolicies", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, LabTechAVTemplatePolicy)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechAVTemplatePolicy:
+        """
+        Performs a POST request against the /Avtemplatepolicies endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechAVTemplatePolicy: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechAVTemplatePolicy, (await super()._make_request("POST", data=data, params=params)).content
+        )
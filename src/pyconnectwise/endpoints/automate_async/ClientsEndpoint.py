@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ClientsIdEndpoint import ClientsIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import LabTechClient
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ClientsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechClient], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechClient, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechClient, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Clients", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechClient])
+        IAsyncPostable.__init__(self, LabTechClient)
+        IAsyncPaginateable.__init__(self, LabTechClient)
+
+    def id(self, _id: int) -> ClientsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ClientsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ClientsIdEndpoint: The initialized ClientsIdEndpoint object.
+        """
+        child = ClientsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechClient]:
+        """
+        Performs a GET request against the /Clients endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechClient]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechClient, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechClient]:
+        """
+        Performs a GET request against the /Clients endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechClient]: The parsed response data.
+        """
+        return self._parse_many(LabTechClient, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechClient:
+        """
+        Performs a POST request against the /Clients endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechClient: The parsed response data.
+        """
+        return self._parse_one(LabTechClient, (await super()._make_request("POST", data=data, params=params)).content)
@@ -0,0 +1,57 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.automate import LabTechDocument
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ClientsIdDocumentsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechDocument], ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechDocument, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Documents", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechDocument])
+        IAsyncPaginateable.__init__(self, LabTechDocument)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechDocument]:
+        """
+        Performs a GET request against the /Clients/{id}/Documents endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechDocument]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechDocument, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechDocument]:
+        """
+        Performs a GET request against the /Clients/{id}/Documents endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechDocument]: The parsed response data.
+        """
+        return self._parse_many(LabTechDocument, (await super()._make_request("GET", data=data, params=params)).content)
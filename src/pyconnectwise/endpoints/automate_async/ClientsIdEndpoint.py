@@ -0,0 +1,90 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ClientsIdDocumentsEndpoint import ClientsIdDocumentsEndpoint
+from pyconnectwise.endpoints.automate_async.ClientsIdLicensesEndpoint import ClientsIdLicensesEndpoint
+from pyconnectwise.endpoints.automate_async.ClientsIdPermissionsEndpoint import ClientsIdPermissionsEndpoint
+from pyconnectwise.endpoints.automate_async.ClientsIdProductkeysEndpoint import ClientsIdProductkeysEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.automate import LabTechClient
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ClientsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[LabTechClient, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechClient, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, LabTechClient)
+        IAsyncPaginateable.__init__(self, LabTechClient)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechClient]:
+        """
+        Performs a GET request against the /Clients/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechClient]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechClient, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechClient:
+        """
+        Performs a GET request against the /Clients/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechClient: The parsed response data.
+        """
+        return self._parse_one(LabTechClient, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def documents(self) -> ClientsIdDocumentsEndpoint:
+        """
+        The ClientsIdDocumentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ClientsIdDocumentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def licenses(self) -> ClientsIdLicensesEndpoint:
+        """
+        The ClientsIdLicensesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ClientsIdLicensesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def permissions(self) -> ClientsIdPermissionsEndpoint:
+        """
+        The ClientsIdPermissionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ClientsIdPermissionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def productkeys(self) -> ClientsIdProductkeysEndpoint:
+        """
+        The ClientsIdProductkeysEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ClientsIdProductkeysEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,77 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import LabTechManagedLicense
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ClientsIdLicensesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechManagedLicense], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechManagedLicense, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechManagedLicense, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Licenses", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechManagedLicense])
+        IAsyncPostable.__init__(self, LabTechManagedLicense)
+        IAsyncPaginateable.__init__(self, LabTechManagedLicense)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechManagedLicense]:
+        """
+        Performs a GET request against the /Clients/{id}/Licenses endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechManagedLicense]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechManagedLicense, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechManagedLicense]:
+        """
+        Performs a GET request against the /Clients/{id}/Licenses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechManagedLicense]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechManagedLicense, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechManagedLicense:
+        """
+        Performs a POST request against the /Clients/{id}/Licenses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechManagedLicense: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechManagedLicense, (await super()._make_request("POST", data=data, params=params)).content
+        )
@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ClientsIdPermissionsIdEndpoint import ClientsIdPermissionsIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ClientsIdPermissionsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Permissions", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ClientsIdPermissionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ClientsIdPermissionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ClientsIdPermissionsIdEndpoint: The initialized ClientsIdPermissionsIdEndpoint object.
+        """
+        child = ClientsIdPermissionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
@@ -0,0 +1,77 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import LabTechProductKey
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ClientsIdProductkeysEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechProductKey], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechProductKey, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechProductKey, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Productkeys", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechProductKey])
+        IAsyncPostable.__init__(self, LabTechProductKey)
+        IAsyncPaginateable.__init__(self, LabTechProductKey)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechProductKey]:
+        """
+        Performs a GET request against the /Clients/{id}/Productkeys endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechProductKey]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechProductKey, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechProductKey]:
+        """
+        Performs a GET request against the /Clients/{id}/Productkeys endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechProductKey]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechProductKey, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechProductKey:
+        """
+        Performs a POST request against the /Clients/{id}/Productkeys endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechProductKey: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechProductKey, (await super()._make_request("POST", data=data, params=params)).content
+        )
@@ -0,0 +1,112 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ComputersChassisEndpoint import ComputersChassisEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersDrivesEndpoint import ComputersDrivesEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdEndpoint import ComputersIdEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersMaintenancemodesEndpoint import ComputersMaintenancemodesEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersMemoryslotsEndpoint import ComputersMemoryslotsEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersSoftwareEndpoint import ComputersSoftwareEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.automate import LabTechComputer
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ComputersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechComputer], ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechComputer, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Computers", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechComputer])
+        IAsyncPaginateable.__init__(self, LabTechComputer)
+
+    def id(self, _id: int) -> ComputersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ComputersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ComputersIdEndpoint: The initialized ComputersIdEndpoint object.
+        """
+        child = ComputersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechComputer]:
+        """
+        Performs a GET request against the /Computers endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechComputer]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechComputer, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechComputer]:
+        """
+        Performs a GET request against the /Computers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechComputer]: The parsed response data.
+        """
+        return self._parse_many(LabTechComputer, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def chassis(self) -> ComputersChassisEndpoint:
+        """
+        The ComputersChassisEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersChassisEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def drives(self) -> ComputersDrivesEndpoint:
+        """
+        The ComputersDrivesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersDrivesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def maintenancemodes(self) -> ComputersMaintenancemodesEndpoint:
+        """
+        The ComputersMaintenancemodesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersMaintenancemodesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def memoryslots(self) -> ComputersMemoryslotsEndpoint:
+        """
+        The ComputersMemoryslotsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersMemoryslotsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def software(self) -> ComputersSoftwareEndpoint:
+        """
+        The ComputersSoftwareEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersSoftwareEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ComputersIdAlertsuspensionsMaintenancewindowEndpoint import (
+    ComputersIdAlertsuspensionsMaintenancewindowEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.ComputersIdAlertsuspensionsTemplatediversionEndpoint import (
+    ComputersIdAlertsuspensionsTemplatediversionEndpoint,
+)
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ComputersIdAlertsuspensionsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Alertsuspensions", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def maintenancewindow(self) -> ComputersIdAlertsuspensionsMaintenancewindowEndpoint:
+        """
+        The ComputersIdAlertsuspensionsMaintenancewindowEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ComputersIdAlertsuspensionsMaintenancewindowEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def templatediversion(self) -> ComputersIdAlertsuspensionsTemplatediversionEndpoint:
+        """
+        The ComputersIdAlertsuspensionsTemplatediversionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ComputersIdAlertsuspensionsTemplatediversionEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,77 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import LabTechCommandExecute
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ComputersIdCommandexecuteEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechCommandExecute], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechCommandExecute, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechCommandExecute, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Commandexecute", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechCommandExecute])
+        IAsyncPostable.__init__(self, LabTechCommandExecute)
+        IAsyncPaginateable.__init__(self, LabTechCommandExecute)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechCommandExecute]:
+        """
+        Performs a GET request against the /Computers/{id}/Commandexecute endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechCommandExecute]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechCommandExecute, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechCommandExecute]:
+        """
+        Performs a GET request against the /Computers/{id}/Commandexecute endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechCommandExecute]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechCommandExecute, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechCommandExecute:
+        """
+        Performs a POST request against the /Computers/{id}/Commandexecute endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechCommandExecute: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechCommandExecute, (await super()._make_request("POST", data=data, params=params)).content
+        )
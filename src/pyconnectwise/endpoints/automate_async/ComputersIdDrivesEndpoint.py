@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ComputersIdDrivesIdEndpoint import ComputersIdDrivesIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ComputersIdDrivesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Drives", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ComputersIdDrivesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ComputersIdDrivesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ComputersIdDrivesIdEndpoint: The initialized ComputersIdDrivesIdEndpoint object.
+        """
+        child = ComputersIdDrivesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
@@ -0,0 +1,310 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ComputersIdAlertsEndpoint import ComputersIdAlertsEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdAlertsuspensionsEndpoint import (
+    ComputersIdAlertsuspensionsEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.ComputersIdBiosEndpoint import ComputersIdBiosEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdCommandexecuteEndpoint import ComputersIdCommandexecuteEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdCommandhistoryEndpoint import ComputersIdCommandhistoryEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdComputerpatchingpoliciesEndpoint import (
+    ComputersIdComputerpatchingpoliciesEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.ComputersIdDevicesEndpoint import ComputersIdDevicesEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdDriversEndpoint import ComputersIdDriversEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdDrivesEndpoint import ComputersIdDrivesEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdEffectivepatchingpolicyEndpoint import (
+    ComputersIdEffectivepatchingpolicyEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.ComputersIdMicrosoftupdatesEndpoint import (
+    ComputersIdMicrosoftupdatesEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.ComputersIdMonitoralertsuspensionsEndpoint import (
+    ComputersIdMonitoralertsuspensionsEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.ComputersIdMonitorsEndpoint import ComputersIdMonitorsEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdOperatingsystemEndpoint import ComputersIdOperatingsystemEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdPatchingstatsEndpoint import ComputersIdPatchingstatsEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdPatchjobsEndpoint import ComputersIdPatchjobsEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdPrintersEndpoint import ComputersIdPrintersEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdProcessorsEndpoint import ComputersIdProcessorsEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdRunningscriptsEndpoint import ComputersIdRunningscriptsEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdScheduledscriptsEndpoint import (
+    ComputersIdScheduledscriptsEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.ComputersIdScheduledtasksEndpoint import ComputersIdScheduledtasksEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdScripthistoryEndpoint import ComputersIdScripthistoryEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdSensorsEndpoint import ComputersIdSensorsEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdServicesEndpoint import ComputersIdServicesEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdSoftwareEndpoint import ComputersIdSoftwareEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdSystemslotsEndpoint import ComputersIdSystemslotsEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdThirdpartypatchesEndpoint import (
+    ComputersIdThirdpartypatchesEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.ComputersIdUpsEndpoint import ComputersIdUpsEndpoint
+from pyconnectwise.endpoints.automate_async.ComputersIdVideocardsEndpoint import ComputersIdVideocardsEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.automate import LabTechComputer
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ComputersIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[LabTechComputer, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechComputer, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, LabTechComputer)
+        IAsyncPaginateable.__init__(self, LabTechComputer)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechComputer]:
+        """
+        Performs a GET request against the /Computers/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechComputer]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechComputer, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechComputer:
+        """
+        Performs a GET request against the /Computers/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechComputer: The parsed response data.
+        """
+        return self._parse_one(LabTechComputer, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def alerts(self) -> ComputersIdAlertsEndpoint:
+        """
+        The ComputersIdAlertsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdAlertsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def alertsuspensions(self) -> ComputersIdAlertsuspensionsEndpoint:
+        """
+        The ComputersIdAlertsuspensionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdAlertsuspensionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def bios(self) -> ComputersIdBiosEndpoint:
+        """
+        The ComputersIdBiosEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdBiosEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def commandexecute(self) -> ComputersIdCommandexecuteEndpoint:
+        """
+        The ComputersIdCommandexecuteEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdCommandexecuteEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def commandhistory(self) -> ComputersIdCommandhistoryEndpoint:
+        """
+        The ComputersIdCommandhistoryEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdCommandhistoryEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def computerpatchingpolicies(self) -> ComputersIdComputerpatchingpoliciesEndpoint:
+        """
+        The ComputersIdComputerpatchingpoliciesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ComputersIdComputerpatchingpoliciesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def devices(self) -> ComputersIdDevicesEndpoint:
+        """
+        The ComputersIdDevicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdDevicesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def drivers(self) -> ComputersIdDriversEndpoint:
+        """
+        The ComputersIdDriversEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdDriversEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def drives(self) -> ComputersIdDrivesEndpoint:
+        """
+        The ComputersIdDrivesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdDrivesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def effectivepatchingpolicy(self) -> ComputersIdEffectivepatchingpolicyEndpoint:
+        """
+        The ComputersIdEffectivepatchingpolicyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ComputersIdEffectivepatchingpolicyEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def microsoftupdates(self) -> ComputersIdMicrosoftupdatesEndpoint:
+        """
+        The ComputersIdMicrosoftupdatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdMicrosoftupdatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def monitoralertsuspensions(self) -> ComputersIdMonitoralertsuspensionsEndpoint:
+        """
+        The ComputersIdMonitoralertsuspensionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ComputersIdMonitoralertsuspensionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def monitors(self) -> ComputersIdMonitorsEndpoint:
+        """
+        The ComputersIdMonitorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdMonitorsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def operatingsystem(self) -> ComputersIdOperatingsystemEndpoint:
+        """
+        The ComputersIdOperatingsystemEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdOperatingsystemEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def patchingstats(self) -> ComputersIdPatchingstatsEndpoint:
+        """
+        The ComputersIdPatchingstatsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdPatchingstatsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def patchjobs(self) -> ComputersIdPatchjobsEndpoint:
+        """
+        The ComputersIdPatchjobsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdPatchjobsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def printers(self) -> ComputersIdPrintersEndpoint:
+        """
+        The ComputersIdPrintersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdPrintersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def processors(self) -> ComputersIdProcessorsEndpoint:
+        """
+        The ComputersIdProcessorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdProcessorsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def runningscripts(self) -> ComputersIdRunningscriptsEndpoint:
+        """
+        The ComputersIdRunningscriptsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdRunningscriptsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scheduledscripts(self) -> ComputersIdScheduledscriptsEndpoint:
+        """
+        The ComputersIdScheduledscriptsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdScheduledscriptsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scheduledtasks(self) -> ComputersIdScheduledtasksEndpoint:
+        """
+        The ComputersIdScheduledtasksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdScheduledtasksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scripthistory(self) -> ComputersIdScripthistoryEndpoint:
+        """
+        The ComputersIdScripthistoryEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdScripthistoryEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sensors(self) -> ComputersIdSensorsEndpoint:
+        """
+        The ComputersIdSensorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdSensorsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def services(self) -> ComputersIdServicesEndpoint:
+        """
+        The ComputersIdServicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdServicesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def software(self) -> ComputersIdSoftwareEndpoint:
+        """
+        The ComputersIdSoftwareEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdSoftwareEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def systemslots(self) -> ComputersIdSystemslotsEndpoint:
+        """
+        The ComputersIdSystemslotsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdSystemslotsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def thirdpartypatches(self) -> ComputersIdThirdpartypatchesEndpoint:
+        """
+        The ComputersIdThirdpartypatchesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdThirdpartypatchesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ups(self) -> ComputersIdUpsEndpoint:
+        """
+        The ComputersIdUpsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdUpsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def videocards(self) -> ComputersIdVideocardsEndpoint:
+        """
+        The ComputersIdVideocardsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ComputersIdVideocardsEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,93 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ComputersIdScheduledscriptsIdEndpoint import (
+    ComputersIdScheduledscriptsIdEndpoint,
+)
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import LabTechScheduledScript
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ComputersIdScheduledscriptsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechScheduledScript], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechScheduledScript, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechScheduledScript, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Scheduledscripts", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechScheduledScript])
+        IAsyncPostable.__init__(self, LabTechScheduledScript)
+        IAsyncPaginateable.__init__(self, LabTechScheduledScript)
+
+    def id(self, _id: int) -> ComputersIdScheduledscriptsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ComputersIdScheduledscriptsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ComputersIdScheduledscriptsIdEndpoint: The initialized ComputersIdScheduledscriptsIdEndpoint object.
+        """
+        child = ComputersIdScheduledscriptsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechScheduledScript]:
+        """
+        Performs a GET request against the /Computers/{id}/Scheduledscripts endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechScheduledScript]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechScheduledScript, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechScheduledScript]:
+        """
+        Performs a GET request against the /Computers/{id}/Scheduledscripts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechScheduledScript]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechScheduledScript, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechScheduledScript:
+        """
+        Performs a POST request against the /Computers/{id}/Scheduledscripts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechScheduledScript: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechScheduledScript, (await super()._make_request("POST", data=data, params=params)).content
+        )
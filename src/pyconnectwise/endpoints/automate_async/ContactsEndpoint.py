@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ContactsIdEndpoint import ContactsIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import AutomateContact
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ContactsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AutomateContact], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[AutomateContact, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[AutomateContact, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Contacts", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AutomateContact])
+        IAsyncPostable.__init__(self, AutomateContact)
+        IAsyncPaginateable.__init__(self, AutomateContact)
+
+    def id(self, _id: int) -> ContactsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ContactsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ContactsIdEndpoint: The initialized ContactsIdEndpoint object.
+        """
+        child = ContactsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AutomateContact]:
+        """
+        Performs a GET request against the /Contacts endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AutomateContact]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AutomateContact, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[AutomateContact]:
+        """
+        Performs a GET request against the /Contacts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AutomateContact]: The parsed response data.
+        """
+        return self._parse_many(AutomateContact, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateContact:
+        """
+        Performs a POST request against the /Contacts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateContact: The parsed response data.
+        """
+        return self._parse_one(AutomateContact, (await super()._make_request("POST", data=data, params=params)).content)
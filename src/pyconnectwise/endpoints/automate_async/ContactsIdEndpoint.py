@@ -0,0 +1,83 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPuttable
+from pyconnectwise.models.automate import AutomateContact
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ContactsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[AutomateContact, ConnectWiseAutomateRequestParams],
+    IAsyncPuttable[AutomateContact, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[AutomateContact, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, AutomateContact)
+        IAsyncPuttable.__init__(self, AutomateContact)
+        IAsyncPaginateable.__init__(self, AutomateContact)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AutomateContact]:
+        """
+        Performs a GET request against the /Contacts/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AutomateContact]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AutomateContact, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateContact:
+        """
+        Performs a GET request against the /Contacts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateContact: The parsed response data.
+        """
+        return self._parse_one(AutomateContact, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateContact:
+        """
+        Performs a PUT request against the /Contacts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateContact: The parsed response data.
+        """
+        return self._parse_one(AutomateContact, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /Contacts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
@@ -0,0 +1,73 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.DataviewfoldersIdEndpoint import DataviewfoldersIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.automate import LabTechDataViewFolder
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class DataviewfoldersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechDataViewFolder], ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechDataViewFolder, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Dataviewfolders", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechDataViewFolder])
+        IAsyncPaginateable.__init__(self, LabTechDataViewFolder)
+
+    def id(self, _id: int) -> DataviewfoldersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized DataviewfoldersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            DataviewfoldersIdEndpoint: The initialized DataviewfoldersIdEndpoint object.
+        """
+        child = DataviewfoldersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechDataViewFolder]:
+        """
+        Performs a GET request against the /Dataviewfolders endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechDataViewFolder]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechDataViewFolder, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechDataViewFolder]:
+        """
+        Performs a GET request against the /Dataviewfolders endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechDataViewFolder]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechDataViewFolder, (await super()._make_request("GET", data=data, params=params)).content
+        )
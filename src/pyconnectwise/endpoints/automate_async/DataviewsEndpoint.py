@@ -0,0 +1,71 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.DataviewsIdEndpoint import DataviewsIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.automate import LabTechDataView
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class DataviewsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechDataView], ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechDataView, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Dataviews", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechDataView])
+        IAsyncPaginateable.__init__(self, LabTechDataView)
+
+    def id(self, _id: int) -> DataviewsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized DataviewsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            DataviewsIdEndpoint: The initialized DataviewsIdEndpoint object.
+        """
+        child = DataviewsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechDataView]:
+        """
+        Performs a GET request against the /Dataviews endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechDataView]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechDataView, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechDataView]:
+        """
+        Performs a GET request against the /Dataviews endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechDataView]: The parsed response data.
+        """
+        return self._parse_many(LabTechDataView, (await super()._make_request("GET", data=data, params=params)).content)
@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.DrivesIdEndpoint import DrivesIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class DrivesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Drives", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> DrivesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized DrivesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            DrivesIdEndpoint: The initialized DrivesIdEndpoint object.
+        """
+        child = DrivesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
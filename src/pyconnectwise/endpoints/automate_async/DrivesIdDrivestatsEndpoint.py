@@ -0,0 +1,44 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.DrivesIdDrivestatsDailyEndpoint import DrivesIdDrivestatsDailyEndpoint
+from pyconnectwise.endpoints.automate_async.DrivesIdDrivestatsMonthlyEndpoint import DrivesIdDrivestatsMonthlyEndpoint
+from pyconnectwise.endpoints.automate_async.DrivesIdDrivestatsWeeklyEndpoint import DrivesIdDrivestatsWeeklyEndpoint
+from pyconnectwise.endpoints.automate_async.DrivesIdDrivestatsYearlyEndpoint import DrivesIdDrivestatsYearlyEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class DrivesIdDrivestatsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Drivestats", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def daily(self) -> DrivesIdDrivestatsDailyEndpoint:
+        """
+        The DrivesIdDrivestatsDailyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(DrivesIdDrivestatsDailyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def monthly(self) -> DrivesIdDrivestatsMonthlyEndpoint:
+        """
+        The DrivesIdDrivestatsMonthlyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(DrivesIdDrivestatsMonthlyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def weekly(self) -> DrivesIdDrivestatsWeeklyEndpoint:
+        """
+        The DrivesIdDrivestatsWeeklyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(DrivesIdDrivestatsWeeklyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def yearly(self) -> DrivesIdDrivestatsYearlyEndpoint:
+        """
+        The DrivesIdDrivestatsYearlyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(DrivesIdDrivestatsYearlyEndpoint(self.client, parent_endpoint=self))
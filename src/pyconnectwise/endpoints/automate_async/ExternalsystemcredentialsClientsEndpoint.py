@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ExternalsystemcredentialsClientsIdEndpoint import (
+    ExternalsystemcredentialsClientsIdEndpoint,
+)
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ExternalsystemcredentialsClientsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Clients", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ExternalsystemcredentialsClientsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ExternalsystemcredentialsClientsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ExternalsystemcredentialsClientsIdEndpoint: The initialized ExternalsystemcredentialsClientsIdEndpoint object.
+        """
+        child = ExternalsystemcredentialsClientsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
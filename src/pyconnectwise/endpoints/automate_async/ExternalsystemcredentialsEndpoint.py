@@ -0,0 +1,24 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ExternalsystemcredentialsClientsEndpoint import (
+    ExternalsystemcredentialsClientsEndpoint,
+)
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ExternalsystemcredentialsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Externalsystemcredentials", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def clients(self) -> ExternalsystemcredentialsClientsEndpoint:
+        """
+        The ExternalsystemcredentialsClientsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ExternalsystemcredentialsClientsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.GroupsIdEndpoint import GroupsIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import LabTechGroup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class GroupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechGroup], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechGroup, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechGroup, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Groups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechGroup])
+        IAsyncPostable.__init__(self, LabTechGroup)
+        IAsyncPaginateable.__init__(self, LabTechGroup)
+
+    def id(self, _id: int) -> GroupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized GroupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            GroupsIdEndpoint: The initialized GroupsIdEndpoint object.
+        """
+        child = GroupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechGroup]:
+        """
+        Performs a GET request against the /Groups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechGroup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechGroup, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechGroup]:
+        """
+        Performs a GET request against the /Groups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechGroup]: The parsed response data.
+        """
+        return self._parse_many(LabTechGroup, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechGroup:
+        """
+        Performs a POST request against the /Groups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechGroup: The parsed response data.
+        """
+        return self._parse_one(LabTechGroup, (await super()._make_request("POST", data=data, params=params)).content)
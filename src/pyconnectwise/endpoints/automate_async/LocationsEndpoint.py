@@ -0,0 +1,89 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.LocationsIdEndpoint import LocationsIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import AutomateLocation, LabTechLocation
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class LocationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AutomateLocation], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechLocation, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[AutomateLocation, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Locations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AutomateLocation])
+        IAsyncPostable.__init__(self, LabTechLocation)
+        IAsyncPaginateable.__init__(self, AutomateLocation)
+
+    def id(self, _id: int) -> LocationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized LocationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            LocationsIdEndpoint: The initialized LocationsIdEndpoint object.
+        """
+        child = LocationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AutomateLocation]:
+        """
+        Performs a GET request against the /Locations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AutomateLocation]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AutomateLocation, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[AutomateLocation]:
+        """
+        Performs a GET request against the /Locations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AutomateLocation]: The parsed response data.
+        """
+        return self._parse_many(
+            AutomateLocation, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechLocation:
+        """
+        Performs a POST request against the /Locations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechLocation: The parsed response data.
+        """
+        return self._parse_one(LabTechLocation, (await super()._make_request("POST", data=data, params=params)).content)
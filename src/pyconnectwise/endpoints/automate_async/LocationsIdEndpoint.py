@@ -0,0 +1,30 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.LocationsIdProbeconfigurationEndpoint import (
+    LocationsIdProbeconfigurationEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.LocationsIdUpgradeprobeEndpoint import LocationsIdUpgradeprobeEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class LocationsIdEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def probeconfiguration(self) -> LocationsIdProbeconfigurationEndpoint:
+        """
+        The LocationsIdProbeconfigurationEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(LocationsIdProbeconfigurationEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def upgradeprobe(self) -> LocationsIdUpgradeprobeEndpoint:
+        """
+        The LocationsIdUpgradeprobeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(LocationsIdUpgradeprobeEndpoint(self.client, parent_endpoint=self))
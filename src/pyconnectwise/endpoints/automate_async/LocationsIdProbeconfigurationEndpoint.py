@@ -0,0 +1,105 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPostable
+from pyconnectwise.models.automate import LabTechProbeConfiguration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class LocationsIdProbeconfigurationEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[LabTechProbeConfiguration, ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechProbeConfiguration, ConnectWiseAutomateRequestParams],
+    IAsyncPatchable[LabTechProbeConfiguration, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechProbeConfiguration, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Probeconfiguration", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, LabTechProbeConfiguration)
+        IAsyncPostable.__init__(self, LabTechProbeConfiguration)
+        IAsyncPatchable.__init__(self, LabTechProbeConfiguration)
+        IAsyncPaginateable.__init__(self, LabTechProbeConfiguration)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechProbeConfiguration]:
+        """
+        Performs a GET request against the /Locations/{id}/Probeconfiguration endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechProbeConfiguration]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechProbeConfiguration, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechProbeConfiguration:
+        """
+        Performs a GET request against the /Locations/{id}/Probeconfiguration endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechProbeConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechProbeConfiguration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechProbeConfiguration:
+        """
+        Performs a POST request against the /Locations/{id}/Probeconfiguration endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechProbeConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechProbeConfiguration, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /Locations/{id}/Probeconfiguration endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechProbeConfiguration:
+        """
+        Performs a PATCH request against the /Locations/{id}/Probeconfiguration endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechProbeConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechProbeConfiguration, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
@@ -0,0 +1,58 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.LookupsProbeeventlevelsEndpoint import LookupsProbeeventlevelsEndpoint
+from pyconnectwise.endpoints.automate_async.LookupsScanfrequenciesEndpoint import LookupsScanfrequenciesEndpoint
+from pyconnectwise.endpoints.automate_async.LookupsSnmpencryptionmethodsEndpoint import (
+    LookupsSnmpencryptionmethodsEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.LookupsSnmphashmethodsEndpoint import LookupsSnmphashmethodsEndpoint
+from pyconnectwise.endpoints.automate_async.LookupsStatusscannetworkportoptionsEndpoint import (
+    LookupsStatusscannetworkportoptionsEndpoint,
+)
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class LookupsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Lookups", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def probeeventlevels(self) -> LookupsProbeeventlevelsEndpoint:
+        """
+        The LookupsProbeeventlevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(LookupsProbeeventlevelsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scanfrequencies(self) -> LookupsScanfrequenciesEndpoint:
+        """
+        The LookupsScanfrequenciesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(LookupsScanfrequenciesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def snmpencryptionmethods(self) -> LookupsSnmpencryptionmethodsEndpoint:
+        """
+        The LookupsSnmpencryptionmethodsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(LookupsSnmpencryptionmethodsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def snmphashmethods(self) -> LookupsSnmphashmethodsEndpoint:
+        """
+        The LookupsSnmphashmethodsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(LookupsSnmphashmethodsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statusscannetworkportoptions(self) -> LookupsStatusscannetworkportoptionsEndpoint:
+        """
+        The LookupsStatusscannetworkportoptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            LookupsStatusscannetworkportoptionsEndpoint(self.client, parent_endpoint=self)
+        )
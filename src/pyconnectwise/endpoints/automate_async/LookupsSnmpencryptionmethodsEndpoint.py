@@ -0,0 +1,59 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.automate import LabTechEncryptionMethod
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class LookupsSnmpencryptionmethodsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechEncryptionMethod], ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechEncryptionMethod, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Snmpencryptionmethods", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechEncryptionMethod])
+        IAsyncPaginateable.__init__(self, LabTechEncryptionMethod)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechEncryptionMethod]:
+        """
+        Performs a GET request against the /Lookups/Snmpencryptionmethods endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechEncryptionMethod]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechEncryptionMethod, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechEncryptionMethod]:
+        """
+        Performs a GET request against the /Lookups/Snmpencryptionmethods endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechEncryptionMethod]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechEncryptionMethod, (await super()._make_request("GET", data=data, params=params)).content
+        )
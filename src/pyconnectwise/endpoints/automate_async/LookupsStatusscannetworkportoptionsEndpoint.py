@@ -0,0 +1,64 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.automate import LabTechStatusScanNetworkPortOption
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class LookupsStatusscannetworkportoptionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechStatusScanNetworkPortOption], ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechStatusScanNetworkPortOption, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Statusscannetworkportoptions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechStatusScanNetworkPortOption])
+        IAsyncPaginateable.__init__(self, LabTechStatusScanNetworkPortOption)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechStatusScanNetworkPortOption]:
+        """
+        Performs a GET request against the /Lookups/Statusscannetworkportoptions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechStatusScanNetworkPortOption]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            LabTechStatusScanNetworkPortOption,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechStatusScanNetworkPortOption]:
+        """
+        Performs a GET request against the /Lookups/Statusscannetworkportoptions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechStatusScanNetworkPortOption]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechStatusScanNetworkPortOption, (await super()._make_request("GET", data=data, params=params)).content
+        )
@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.MonitorsIdEndpoint import MonitorsIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MonitorsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Monitors", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> MonitorsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized MonitorsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            MonitorsIdEndpoint: The initialized MonitorsIdEndpoint object.
+        """
+        child = MonitorsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
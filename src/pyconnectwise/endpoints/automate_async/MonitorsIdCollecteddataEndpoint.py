@@ -0,0 +1,60 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.MonitorsIdCollecteddataDailyaveragesEndpoint import (
+    MonitorsIdCollecteddataDailyaveragesEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.MonitorsIdCollecteddataMonthlyaveragesEndpoint import (
+    MonitorsIdCollecteddataMonthlyaveragesEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.MonitorsIdCollecteddataWeeklyaveragesEndpoint import (
+    MonitorsIdCollecteddataWeeklyaveragesEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.MonitorsIdCollecteddataYearlyaveragesEndpoint import (
+    MonitorsIdCollecteddataYearlyaveragesEndpoint,
+)
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MonitorsIdCollecteddataEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Collecteddata", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def dailyaverages(self) -> MonitorsIdCollecteddataDailyaveragesEndpoint:
+        """
+        The MonitorsIdCollecteddataDailyaveragesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MonitorsIdCollecteddataDailyaveragesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def monthlyaverages(self) -> MonitorsIdCollecteddataMonthlyaveragesEndpoint:
+        """
+        The MonitorsIdCollecteddataMonthlyaveragesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MonitorsIdCollecteddataMonthlyaveragesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def weeklyaverages(self) -> MonitorsIdCollecteddataWeeklyaveragesEndpoint:
+        """
+        The MonitorsIdCollecteddataWeeklyaveragesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MonitorsIdCollecteddataWeeklyaveragesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def yearlyaverages(self) -> MonitorsIdCollecteddataYearlyaveragesEndpoint:
+        """
+        The MonitorsIdCollecteddataYearlyaveragesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MonitorsIdCollecteddataYearlyaveragesEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,32 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.MonitorsIdCollecteddataEndpoint import MonitorsIdCollecteddataEndpoint
+from pyconnectwise.endpoints.automate_async.MonitorsIdDatacollectionsettingsEndpoint import (
+    MonitorsIdDatacollectionsettingsEndpoint,
+)
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MonitorsIdEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def collecteddata(self) -> MonitorsIdCollecteddataEndpoint:
+        """
+        The MonitorsIdCollecteddataEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MonitorsIdCollecteddataEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def datacollectionsettings(self) -> MonitorsIdDatacollectionsettingsEndpoint:
+        """
+        The MonitorsIdDatacollectionsettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MonitorsIdDatacollectionsettingsEndpoint(self.client, parent_endpoint=self)
+        )
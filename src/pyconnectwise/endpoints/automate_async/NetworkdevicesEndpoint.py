@@ -0,0 +1,91 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.NetworkdevicesIdEndpoint import NetworkdevicesIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import LabTechNetworkDevice
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class NetworkdevicesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechNetworkDevice], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechNetworkDevice, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechNetworkDevice, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Networkdevices", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechNetworkDevice])
+        IAsyncPostable.__init__(self, LabTechNetworkDevice)
+        IAsyncPaginateable.__init__(self, LabTechNetworkDevice)
+
+    def id(self, _id: int) -> NetworkdevicesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized NetworkdevicesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            NetworkdevicesIdEndpoint: The initialized NetworkdevicesIdEndpoint object.
+        """
+        child = NetworkdevicesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechNetworkDevice]:
+        """
+        Performs a GET request against the /Networkdevices endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechNetworkDevice]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechNetworkDevice, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechNetworkDevice]:
+        """
+        Performs a GET request against the /Networkdevices endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechNetworkDevice]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechNetworkDevice, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechNetworkDevice:
+        """
+        Performs a POST request against the /Networkdevices endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechNetworkDevice: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechNetworkDevice, (await super()._make_request("POST", data=data, params=params)).content
+        )
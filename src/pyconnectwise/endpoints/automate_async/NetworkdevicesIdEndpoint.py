@@ -0,0 +1,77 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable
+from pyconnectwise.models.automate import LabTechNetworkDevice
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class NetworkdevicesIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[LabTechNetworkDevice, ConnectWiseAutomateRequestParams],
+    IAsyncPatchable[LabTechNetworkDevice, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechNetworkDevice, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, LabTechNetworkDevice)
+        IAsyncPatchable.__init__(self, LabTechNetworkDevice)
+        IAsyncPaginateable.__init__(self, LabTechNetworkDevice)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechNetworkDevice]:
+        """
+        Performs a GET request against the /Networkdevices/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechNetworkDevice]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechNetworkDevice, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechNetworkDevice:
+        """
+        Performs a GET request against the /Networkdevices/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechNetworkDevice: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechNetworkDevice, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechNetworkDevice:
+        """
+        Performs a PATCH request against the /Networkdevices/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechNetworkDevice: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechNetworkDevice, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
@@ -0,0 +1,72 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.PatchactionsDeployallapprovedEndpoint import (
+    PatchactionsDeployallapprovedEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.PatchactionsDeployallsecurityEndpoint import (
+    PatchactionsDeployallsecurityEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.PatchactionsReattemptfailedEndpoint import (
+    PatchactionsReattemptfailedEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.PatchactionsSettopilotstageEndpoint import (
+    PatchactionsSettopilotstageEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.PatchactionsSettoproductionstageEndpoint import (
+    PatchactionsSettoproductionstageEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.PatchactionsSettoteststageEndpoint import PatchactionsSettoteststageEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class PatchactionsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Patchactions", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def deployallapproved(self) -> PatchactionsDeployallapprovedEndpoint:
+        """
+        The PatchactionsDeployallapprovedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PatchactionsDeployallapprovedEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def deployallsecurity(self) -> PatchactionsDeployallsecurityEndpoint:
+        """
+        The PatchactionsDeployallsecurityEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PatchactionsDeployallsecurityEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reattemptfailed(self) -> PatchactionsReattemptfailedEndpoint:
+        """
+        The PatchactionsReattemptfailedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PatchactionsReattemptfailedEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def settopilotstage(self) -> PatchactionsSettopilotstageEndpoint:
+        """
+        The PatchactionsSettopilotstageEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PatchactionsSettopilotstageEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def settoproductionstage(self) -> PatchactionsSettoproductionstageEndpoint:
+        """
+        The PatchactionsSettoproductionstageEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            PatchactionsSettoproductionstageEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def settoteststage(self) -> PatchactionsSettoteststageEndpoint:
+        """
+        The PatchactionsSettoteststageEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PatchactionsSettoteststageEndpoint(self.client, parent_endpoint=self))
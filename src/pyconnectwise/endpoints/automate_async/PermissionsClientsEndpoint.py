@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.PermissionsClientsIdEndpoint import PermissionsClientsIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class PermissionsClientsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Clients", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> PermissionsClientsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized PermissionsClientsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            PermissionsClientsIdEndpoint: The initialized PermissionsClientsIdEndpoint object.
+        """
+        child = PermissionsClientsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.PermissionsClientsEndpoint import PermissionsClientsEndpoint
+from pyconnectwise.endpoints.automate_async.PermissionsUsersEndpoint import PermissionsUsersEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class PermissionsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Permissions", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def clients(self) -> PermissionsClientsEndpoint:
+        """
+        The PermissionsClientsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PermissionsClientsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def users(self) -> PermissionsUsersEndpoint:
+        """
+        The PermissionsUsersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(PermissionsUsersEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.automate import LabTechProbeConfiguration
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProbeconfigurationEnableprobeIdEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPostable[LabTechProbeConfiguration, ConnectWiseAutomateRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, LabTechProbeConfiguration)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechProbeConfiguration:
+        """
+        Performs a POST request against the /Probeconfiguration/Enableprobe/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechProbeConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechProbeConfiguration, (await super()._make_request("POST", data=data, params=params)).content
+        )
@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ProbeconfigurationEnableprobeEndpoint import (
+    ProbeconfigurationEnableprobeEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.ProbeconfigurationIdEndpoint import ProbeconfigurationIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProbeconfigurationEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Probeconfiguration", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ProbeconfigurationIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProbeconfigurationIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProbeconfigurationIdEndpoint: The initialized ProbeconfigurationIdEndpoint object.
+        """
+        child = ProbeconfigurationIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def enableprobe(self) -> ProbeconfigurationEnableprobeEndpoint:
+        """
+        The ProbeconfigurationEnableprobeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProbeconfigurationEnableprobeEndpoint(self.client, parent_endpoint=self))
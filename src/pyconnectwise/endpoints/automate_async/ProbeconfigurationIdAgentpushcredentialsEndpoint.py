@@ -0,0 +1,92 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPuttable
+from pyconnectwise.models.automate import LabTechProbeConfigurationCredentials
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProbeconfigurationIdAgentpushcredentialsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechProbeConfigurationCredentials], ConnectWiseAutomateRequestParams],
+    IAsyncPuttable[list[LabTechProbeConfigurationCredentials], ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechProbeConfigurationCredentials, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Agentpushcredentials", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechProbeConfigurationCredentials])
+        IAsyncPuttable.__init__(self, list[LabTechProbeConfigurationCredentials])
+        IAsyncPaginateable.__init__(self, LabTechProbeConfigurationCredentials)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechProbeConfigurationCredentials]:
+        """
+        Performs a GET request against the /Probeconfiguration/{id}/Agentpushcredentials endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechProbeConfigurationCredentials]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            LabTechProbeConfigurationCredentials,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechProbeConfigurationCredentials]:
+        """
+        Performs a GET request against the /Probeconfiguration/{id}/Agentpushcredentials endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechProbeConfigurationCredentials]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechProbeConfigurationCredentials, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechProbeConfigurationCredentials]:
+        """
+        Performs a PUT request against the /Probeconfiguration/{id}/Agentpushcredentials endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechProbeConfigurationCredentials]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechProbeConfigurationCredentials, (await super()._make_request("PUT", data=data, params=params)).content
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /Probeconfiguration/{id}/Agentpushcredentials endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ProbeconfigurationIdAgentpushcredentialsEndpoint import (
+    ProbeconfigurationIdAgentpushcredentialsEndpoint,
+)
+from pyconnectwise.endpoints.automate_async.ProbeconfigurationIdSnmpconfigurationEndpoint import (
+    ProbeconfigurationIdSnmpconfigurationEndpoint,
+)
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProbeconfigurationIdEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def agentpushcredentials(self) -> ProbeconfigurationIdAgentpushcredentialsEndpoint:
+        """
+        The ProbeconfigurationIdAgentpushcredentialsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProbeconfigurationIdAgentpushcredentialsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def snmpconfiguration(self) -> ProbeconfigurationIdSnmpconfigurationEndpoint:
+        """
+        The ProbeconfigurationIdSnmpconfigurationEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProbeconfigurationIdSnmpconfigurationEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,77 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import LabTechRemoteAgentSchedule
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class RemoteagentschedulesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechRemoteAgentSchedule], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechRemoteAgentSchedule, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechRemoteAgentSchedule, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Remoteagentschedules", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechRemoteAgentSchedule])
+        IAsyncPostable.__init__(self, LabTechRemoteAgentSchedule)
+        IAsyncPaginateable.__init__(self, LabTechRemoteAgentSchedule)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechRemoteAgentSchedule]:
+        """
+        Performs a GET request against the /Remoteagentschedules endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechRemoteAgentSchedule]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechRemoteAgentSchedule, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechRemoteAgentSchedule]:
+        """
+        Performs a GET request against the /Remoteagentschedules endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechRemoteAgentSchedule]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechRemoteAgentSchedule, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechRemoteAgentSchedule:
+        """
+        Performs a POST request against the /Remoteagentschedules endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechRemoteAgentSchedule: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechRemoteAgentSchedule, (await super()._make_request("POST", data=data, params=params)).content
+        )
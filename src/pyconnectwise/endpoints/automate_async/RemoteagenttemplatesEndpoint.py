@@ -0,0 +1,77 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import LabTechRemoteAgentTemplate
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class RemoteagenttemplatesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechRemoteAgentTemplate], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechRemoteAgentTemplate, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechRemoteAgentTemplate, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Remoteagenttemplates", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechRemoteAgentTemplate])
+        IAsyncPostable.__init__(self, LabTechRemoteAgentTemplate)
+        IAsyncPaginateable.__init__(self, LabTechRemoteAgentTemplate)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechRemoteAgentTemplate]:
+        """
+        Performs a GET request against the /Remoteagenttemplates endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechRemoteAgentTemplate]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechRemoteAgentTemplate, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechRemoteAgentTemplate]:
+        """
+        Performs a GET request against the /Remoteagenttemplates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechRemoteAgentTemplate]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechRemoteAgentTemplate, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechRemoteAgentTemplate:
+        """
+        Performs a POST request against the /Remoteagenttemplates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechRemoteAgentTemplate: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechRemoteAgentTemplate, (await super()._make_request("POST", data=data, params=params)).content
+        )
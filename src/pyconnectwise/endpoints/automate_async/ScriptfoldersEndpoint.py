@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ScriptfoldersHierarchyEndpoint import ScriptfoldersHierarchyEndpoint
+from pyconnectwise.endpoints.automate_async.ScriptfoldersIdEndpoint import ScriptfoldersIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import LabTechScriptFolder
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScriptfoldersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechScriptFolder], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechScriptFolder, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechScriptFolder, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Scriptfolders", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechScriptFolder])
+        IAsyncPostable.__init__(self, LabTechScriptFolder)
+        IAsyncPaginateable.__init__(self, LabTechScriptFolder)
+
+    def id(self, _id: int) -> ScriptfoldersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ScriptfoldersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ScriptfoldersIdEndpoint: The initialized ScriptfoldersIdEndpoint object.
+        """
+        child = ScriptfoldersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechScriptFolder]:
+        """
+        Performs a GET request against the /Scriptfolders endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechScriptFolder]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechScriptFolder, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechScriptFolder]:
+        """
+        Performs a GET request against the /Scriptfolders endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechScriptFolder]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechScriptFolder, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechScriptFolder:
+        """
+        Performs a POST request against the /Scriptfolders endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechScriptFolder: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechScriptFolder, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def hierarchy(self) -> ScriptfoldersHierarchyEndpoint:
+        """
+        The ScriptfoldersHierarchyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScriptfoldersHierarchyEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable
+from pyconnectwise.models.automate import LabTechScriptFolder
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScriptfoldersIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[LabTechScriptFolder, ConnectWiseAutomateRequestParams],
+    IAsyncPatchable[LabTechScriptFolder, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechScriptFolder, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, LabTechScriptFolder)
+        IAsyncPatchable.__init__(self, LabTechScriptFolder)
+        IAsyncPaginateable.__init__(self, LabTechScriptFolder)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechScriptFolder]:
+        """
+        Performs a GET request against the /Scriptfolders/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechScriptFolder]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LabTechScriptFolder, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechScriptFolder:
+        """
+        Performs a GET request against the /Scriptfolders/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechScriptFolder: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechScriptFolder, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /Scriptfolders/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechScriptFolder:
+        """
+        Performs a PATCH request against the /Scriptfolders/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechScriptFolder: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechScriptFolder, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
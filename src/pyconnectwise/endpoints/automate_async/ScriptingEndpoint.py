@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ScriptingRunningscriptsEndpoint import ScriptingRunningscriptsEndpoint
+from pyconnectwise.endpoints.automate_async.ScriptingScriptschedulesEndpoint import ScriptingScriptschedulesEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScriptingEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Scripting", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def runningscripts(self) -> ScriptingRunningscriptsEndpoint:
+        """
+        The ScriptingRunningscriptsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScriptingRunningscriptsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scriptschedules(self) -> ScriptingScriptschedulesEndpoint:
+        """
+        The ScriptingScriptschedulesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScriptingScriptschedulesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,43 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPatchable
+from pyconnectwise.models.automate import AutomateScheduledScript
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScriptingScriptschedulesIdEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPatchable[AutomateScheduledScript, ConnectWiseAutomateRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncPatchable.__init__(self, AutomateScheduledScript)
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /Scripting/Scriptschedules/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateScheduledScript:
+        """
+        Performs a PATCH request against the /Scripting/Scriptschedules/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateScheduledScript: The parsed response data.
+        """
+        return self._parse_one(
+            AutomateScheduledScript, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
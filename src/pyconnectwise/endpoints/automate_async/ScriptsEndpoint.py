@@ -0,0 +1,52 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ScriptsIdEndpoint import ScriptsIdEndpoint
+from pyconnectwise.endpoints.automate_async.ScriptsScriptfoldersEndpoint import ScriptsScriptfoldersEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.automate import AutomateScript
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScriptsEndpoint(AsyncConnectWiseEndpoint, IAsyncPostable[AutomateScript, ConnectWiseAutomateRequestParams]):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Scripts", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, AutomateScript)
+
+    def id(self, _id: int) -> ScriptsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ScriptsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ScriptsIdEndpoint: The initialized ScriptsIdEndpoint object.
+        """
+        child = ScriptsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateScript:
+        """
+        Performs a POST request against the /Scripts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateScript: The parsed response data.
+        """
+        return self._parse_one(AutomateScript, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def scriptfolders(self) -> ScriptsScriptfoldersEndpoint:
+        """
+        The ScriptsScriptfoldersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScriptsScriptfoldersEndpoint(self.client, parent_endpoint=self))
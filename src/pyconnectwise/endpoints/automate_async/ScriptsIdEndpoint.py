@@ -0,0 +1,67 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ScriptsIdCopyEndpoint import ScriptsIdCopyEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPuttable
+from pyconnectwise.models.automate import AutomateScript
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScriptsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[AutomateScript, ConnectWiseAutomateRequestParams],
+    IAsyncPuttable[AutomateScript, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, AutomateScript)
+        IAsyncPuttable.__init__(self, AutomateScript)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateScript:
+        """
+        Performs a GET request against the /Scripts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateScript: The parsed response data.
+        """
+        return self._parse_one(AutomateScript, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateScript:
+        """
+        Performs a PUT request against the /Scripts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateScript: The parsed response data.
+        """
+        return self._parse_one(AutomateScript, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /Scripts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def copy(self) -> ScriptsIdCopyEndpoint:
+        """
+        The ScriptsIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScriptsIdCopyEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,47 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ScriptsScriptfoldersIdEndpoint import ScriptsScriptfoldersIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.automate import AutomateSubmittableScriptFolder
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScriptsScriptfoldersEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPostable[AutomateSubmittableScriptFolder, ConnectWiseAutomateRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Scriptfolders", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, AutomateSubmittableScriptFolder)
+
+    def id(self, _id: int) -> ScriptsScriptfoldersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ScriptsScriptfoldersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ScriptsScriptfoldersIdEndpoint: The initialized ScriptsScriptfoldersIdEndpoint object.
+        """
+        child = ScriptsScriptfoldersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateSubmittableScriptFolder:
+        """
+        Performs a POST request against the /Scripts/Scriptfolders endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateSubmittableScriptFolder: The parsed response data.
+        """
+        return self._parse_one(
+            AutomateSubmittableScriptFolder, (await super()._make_request("POST", data=data, params=params)).content
+        )
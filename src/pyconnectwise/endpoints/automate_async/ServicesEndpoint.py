@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.ServicesIdEndpoint import ServicesIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServicesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Services", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ServicesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServicesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServicesIdEndpoint: The initialized ServicesIdEndpoint object.
+        """
+        child = ServicesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
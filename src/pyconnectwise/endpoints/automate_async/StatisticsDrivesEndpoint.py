@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable
+from pyconnectwise.models.automate import LabTechDriveStatistics
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class StatisticsDrivesEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncGettable[list[LabTechDriveStatistics], ConnectWiseAutomateRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Drives", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechDriveStatistics])
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechDriveStatistics]:
+        """
+        Performs a GET request against the /Statistics/Drives endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechDriveStatistics]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechDriveStatistics, (await super()._make_request("GET", data=data, params=params)).content
+        )
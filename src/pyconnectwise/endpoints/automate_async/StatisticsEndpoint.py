@@ -0,0 +1,20 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.StatisticsDrivesEndpoint import StatisticsDrivesEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class StatisticsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Statistics", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def drives(self) -> StatisticsDrivesEndpoint:
+        """
+        The StatisticsDrivesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(StatisticsDrivesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,82 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.automate import LabTechTemplateAvailableProperty
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class TemplateavailablepropertiesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LabTechTemplateAvailableProperty], ConnectWiseAutomateRequestParams],
+    IAsyncPostable[LabTechTemplateAvailableProperty, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[LabTechTemplateAvailableProperty, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Templateavailableproperties", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LabTechTemplateAvailableProperty])
+        IAsyncPostable.__init__(self, LabTechTemplateAvailableProperty)
+        IAsyncPaginateable.__init__(self, LabTechTemplateAvailableProperty)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LabTechTemplateAvailableProperty]:
+        """
+        Performs a GET request against the /Templateavailableproperties endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LabTechTemplateAvailableProperty]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            LabTechTemplateAvailableProperty,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[LabTechTemplateAvailableProperty]:
+        """
+        Performs a GET request against the /Templateavailableproperties endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LabTechTemplateAvailableProperty]: The parsed response data.
+        """
+        return self._parse_many(
+            LabTechTemplateAvailableProperty, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechTemplateAvailableProperty:
+        """
+        Performs a POST request against the /Templateavailableproperties endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechTemplateAvailableProperty: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechTemplateAvailableProperty, (await super()._make_request("POST", data=data, params=params)).content
+        )
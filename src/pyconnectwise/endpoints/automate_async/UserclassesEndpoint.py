@@ -0,0 +1,73 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.UserclassesIdEndpoint import UserclassesIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.automate import AutomateUserClass
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class UserclassesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AutomateUserClass], ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[AutomateUserClass, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Userclasses", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AutomateUserClass])
+        IAsyncPaginateable.__init__(self, AutomateUserClass)
+
+    def id(self, _id: int) -> UserclassesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized UserclassesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            UserclassesIdEndpoint: The initialized UserclassesIdEndpoint object.
+        """
+        child = UserclassesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AutomateUserClass]:
+        """
+        Performs a GET request against the /Userclasses endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AutomateUserClass]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AutomateUserClass, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[AutomateUserClass]:
+        """
+        Performs a GET request against the /Userclasses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AutomateUserClass]: The parsed response data.
+        """
+        return self._parse_many(
+            AutomateUserClass, (await super()._make_request("GET", data=data, params=params)).content
+        )
@@ -0,0 +1,68 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.UserclassesIdWebextensionsEndpoint import UserclassesIdWebextensionsEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.automate import AutomateUserClass
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class UserclassesIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[AutomateUserClass, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[AutomateUserClass, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, AutomateUserClass)
+        IAsyncPaginateable.__init__(self, AutomateUserClass)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AutomateUserClass]:
+        """
+        Performs a GET request against the /Userclasses/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AutomateUserClass]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AutomateUserClass, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateUserClass:
+        """
+        Performs a GET request against the /Userclasses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateUserClass: The parsed response data.
+        """
+        return self._parse_one(
+            AutomateUserClass, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def webextensions(self) -> UserclassesIdWebextensionsEndpoint:
+        """
+        The UserclassesIdWebextensionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UserclassesIdWebextensionsEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,54 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPuttable
+from pyconnectwise.models.automate import AutomateUserClassWebExtensionViewModel
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class UserclassesIdWebextensionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AutomateUserClassWebExtensionViewModel], ConnectWiseAutomateRequestParams],
+    IAsyncPuttable[list[AutomateUserClassWebExtensionViewModel], ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Webextensions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AutomateUserClassWebExtensionViewModel])
+        IAsyncPuttable.__init__(self, list[AutomateUserClassWebExtensionViewModel])
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[AutomateUserClassWebExtensionViewModel]:
+        """
+        Performs a GET request against the /Userclasses/{id}/Webextensions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AutomateUserClassWebExtensionViewModel]: The parsed response data.
+        """
+        return self._parse_many(
+            AutomateUserClassWebExtensionViewModel,
+            (await super()._make_request("GET", data=data, params=params)).content,
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> list[AutomateUserClassWebExtensionViewModel]:
+        """
+        Performs a PUT request against the /Userclasses/{id}/Webextensions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AutomateUserClassWebExtensionViewModel]: The parsed response data.
+        """
+        return self._parse_many(
+            AutomateUserClassWebExtensionViewModel,
+            (await super()._make_request("PUT", data=data, params=params)).content,
+        )
@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable
+from pyconnectwise.models.automate import LabTechUserProfile
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class UserprofilesEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncGettable[LabTechUserProfile, ConnectWiseAutomateRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Userprofiles", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, LabTechUserProfile)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechUserProfile:
+        """
+        Performs a GET request against the /Userprofiles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechUserProfile: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechUserProfile, (await super()._make_request("GET", data=data, params=params)).content
+        )
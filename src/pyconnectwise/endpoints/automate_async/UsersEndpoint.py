@@ -0,0 +1,52 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.UsersFoldersEndpoint import UsersFoldersEndpoint
+from pyconnectwise.endpoints.automate_async.UsersIdEndpoint import UsersIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.automate import AutomateUser
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class UsersEndpoint(AsyncConnectWiseEndpoint, IAsyncPostable[AutomateUser, ConnectWiseAutomateRequestParams]):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Users", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, AutomateUser)
+
+    def id(self, _id: int) -> UsersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized UsersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            UsersIdEndpoint: The initialized UsersIdEndpoint object.
+        """
+        child = UsersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateUser:
+        """
+        Performs a POST request against the /Users endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateUser: The parsed response data.
+        """
+        return self._parse_one(AutomateUser, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def folders(self) -> UsersFoldersEndpoint:
+        """
+        The UsersFoldersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UsersFoldersEndpoint(self.client, parent_endpoint=self))
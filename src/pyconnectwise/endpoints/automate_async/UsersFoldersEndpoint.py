@@ -0,0 +1,47 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.UsersFoldersIdEndpoint import UsersFoldersIdEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.automate import AutomateUserFolder
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class UsersFoldersEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPostable[AutomateUserFolder, ConnectWiseAutomateRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Folders", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, AutomateUserFolder)
+
+    def id(self, _id: int) -> UsersFoldersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized UsersFoldersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            UsersFoldersIdEndpoint: The initialized UsersFoldersIdEndpoint object.
+        """
+        child = UsersFoldersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateUserFolder:
+        """
+        Performs a POST request against the /Users/Folders endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateUserFolder: The parsed response data.
+        """
+        return self._parse_one(
+            AutomateUserFolder, (await super()._make_request("POST", data=data, params=params)).content
+        )
@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.automate import LabTechAuthServiceCredentials
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class UsersIdAuthlinkEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPostable[LabTechAuthServiceCredentials, ConnectWiseAutomateRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Authlink", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, LabTechAuthServiceCredentials)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechAuthServiceCredentials:
+        """
+        Performs a POST request against the /Users/{id}/Authlink endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechAuthServiceCredentials: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechAuthServiceCredentials, (await super()._make_request("POST", data=data, params=params)).content
+        )
@@ -0,0 +1,124 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.automate_async.UsersIdAuthlinkEndpoint import UsersIdAuthlinkEndpoint
+from pyconnectwise.endpoints.automate_async.UsersIdChangepasswordEndpoint import UsersIdChangepasswordEndpoint
+from pyconnectwise.endpoints.automate_async.UsersIdFavoritesEndpoint import UsersIdFavoritesEndpoint
+from pyconnectwise.endpoints.automate_async.UsersIdSettingsEndpoint import UsersIdSettingsEndpoint
+from pyconnectwise.endpoints.automate_async.UsersIdUseraccessEndpoint import UsersIdUseraccessEndpoint
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable
+from pyconnectwise.models.automate import AutomateUser
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class UsersIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[AutomateUser, ConnectWiseAutomateRequestParams],
+    IAsyncPatchable[AutomateUser, ConnectWiseAutomateRequestParams],
+    IAsyncPaginateable[AutomateUser, ConnectWiseAutomateRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, AutomateUser)
+        IAsyncPatchable.__init__(self, AutomateUser)
+        IAsyncPaginateable.__init__(self, AutomateUser)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AutomateUser]:
+        """
+        Performs a GET request against the /Users/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AutomateUser]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AutomateUser, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateUser:
+        """
+        Performs a GET request against the /Users/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateUser: The parsed response data.
+        """
+        return self._parse_one(AutomateUser, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /Users/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> AutomateUser:
+        """
+        Performs a PATCH request against the /Users/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutomateUser: The parsed response data.
+        """
+        return self._parse_one(AutomateUser, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    @cached_property
+    def authlink(self) -> UsersIdAuthlinkEndpoint:
+        """
+        The UsersIdAuthlinkEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UsersIdAuthlinkEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def changepassword(self) -> UsersIdChangepasswordEndpoint:
+        """
+        The UsersIdChangepasswordEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UsersIdChangepasswordEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def favorites(self) -> UsersIdFavoritesEndpoint:
+        """
+        The UsersIdFavoritesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UsersIdFavoritesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def settings(self) -> UsersIdSettingsEndpoint:
+        """
+        The UsersIdSettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UsersIdSettingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def useraccess(self) -> UsersIdUseraccessEndpoint:
+        """
+        The UsersIdUseraccessEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(UsersIdUseraccessEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.automate import LabTechUserFavorite
+from pyconnectwise.types import JSON, ConnectWiseAutomateRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class UsersIdFavoritesEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPostable[LabTechUserFavorite, ConnectWiseAutomateRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "Favorites", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, LabTechUserFavorite)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseAutomateRequestParams | None = None
+    ) -> LabTechUserFavorite:
+        """
+        Performs a POST request against the /Users/{id}/Favorites endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LabTechUserFavorite: The parsed response data.
+        """
+        return self._parse_one(
+            LabTechUserFavorite, (await super()._make_request("POST", data=data, params=params)).content
+        )
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    import httpx
+
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+    from pyconnectwise.types import (
+        RequestData,
+        RequestMethod,
+        RequestParams,
+    )
+
+
+class AsyncConnectWiseEndpoint(ConnectWiseEndpoint):
+    """
+    AsyncConnectWiseEndpoint is the base class for all asyncio ConnectWise API endpoint classes.
+    It behaves exactly like ConnectWiseEndpoint (URL building, child endpoints, response parsing),
+    except that requests are made through an AsyncConnectWiseClient and must be awaited.
+
+    Args:
+        client: The AsyncConnectWiseClient instance.
+        endpoint_url (str): The base URL for the specific endpoint.
+        parent_endpoint (AsyncConnectWiseEndpoint, optional): The parent endpoint, if applicable.
+    """
+
+    def __init__(
+        self,
+        client: AsyncConnectWiseClient,
+        endpoint_url: str,
+        parent_endpoint: AsyncConnectWiseEndpoint | None = None,
+    ) -> None:
+        """
+        Initialize an AsyncConnectWiseEndpoint instance with the client and endpoint base.
+
+        Args:
+            client: The AsyncConnectWiseClient instance.
+            endpoint_base (str): The base URL for the specific endpoint.
+        """
+        super().__init__(client, endpoint_url, parent_endpoint=parent_endpoint)  # type: ignore[arg-type]
+
+    async def _make_request(  # type: ignore[override]
+        self,
+        method: RequestMethod,
+        endpoint: AsyncConnectWiseEndpoint | None = None,
+        data: RequestData | None = None,
+        params: RequestParams | None = None,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,  # noqa: FBT001, FBT002
+    ) -> httpx.Response:
+        """
+        Make an API request using the specified method, endpoint, data, and parameters.
+        This function isn't intended for use outside of this class.
+        Please use the available CRUD methods as intended.
+
+        Args:
+            method (str): The HTTP method to use for the request (e.g., GET, POST, PUT, etc.).
+            endpoint (str, optional): The endpoint to make the request to.
+            data (dict, optional): The request data to send.
+            params (dict, optional): The query parameters to include in the request.
+
+        Returns:
+            The Response object (see httpx.Response).
+
+        Raises:
+            Exception: If the request returns a status code >= 400.
+        """
+        url = self._get_endpoint_url()
+        if endpoint:
+            url = self._url_join(url, endpoint)
+
+        return await self.client._make_request(
+            method, url, data, self._get_params(params), headers, stream=stream, endpoint_class=type(self)
+        )
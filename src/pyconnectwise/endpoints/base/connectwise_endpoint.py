@@ -1,16 +1,25 @@
 from __future__ import annotations
 
+import copy
+from functools import cache, cached_property
 from typing import TYPE_CHECKING, Any, TypeVar
 
+from pydantic_core import from_json
+
+from pyconnectwise.utils.helpers import get_list_adapter
+
 if TYPE_CHECKING:
     from pydantic import BaseModel
     from requests import Response
+    from typing_extensions import Self
 
     from pyconnectwise.clients.connectwise_client import ConnectWiseClient
+    from pyconnectwise.models.base.connectwise_model import ConnectWiseModel, FieldPath
     from pyconnectwise.types import (
         RequestData,
         RequestMethod,
         RequestParams,
+        ResponseMode,
     )
 
 TChildEndpoint = TypeVar("TChildEndpoint", bound="ConnectWiseEndpoint")
@@ -38,7 +47,14 @@ class ConnectWiseEndpoint:
 
     ConnectWiseEndpoint also supports handling nested endpoints, which are referred to as
     child endpoints. Child endpoints can be registered and accessed through their parent
-    endpoint, allowing for easy navigation through related resources in the API.
+    endpoint, allowing for easy navigation through related resources in the API. Generated
+    endpoints expose their children as cached properties, so a child is only created the first
+    time it's accessed, and the same instance is returned from then on.
+
+    By default, response data is validated into the endpoint's models. For bulk loads where the API is trusted,
+    the client's Config (or with_response_mode() for a single endpoint) can switch to the "raw" response mode,
+    which returns the decoded JSON dicts instead, without validating anything. select() narrows the requests
+    made through an endpoint down to a few fields, returning slim models with only those fields.
 
     Args:
         client: The ConnectWiseAPIClient instance.
@@ -52,7 +68,7 @@ class ConnectWiseEndpoint:
         model_parser (ModelParser): An instance of the ModelParser class used for parsing API responses.
         _model (Type[TModel]): The model class for the endpoint.
         _id (int): The ID of the current resource, if applicable.
-        _child_endpoints (List[ConnectWiseEndpoint]): A list of registered child endpoints.
+        _child_endpoints (List[ConnectWiseEndpoint]): A list of the child endpoints created so far.
 
     Generic Type:
         TModel: The model class for the endpoint.
@@ -76,6 +92,9 @@ class ConnectWiseEndpoint:
         self._parent_endpoint = parent_endpoint
         self._id = None
         self._child_endpoints: list[ConnectWiseEndpoint] = []
+        self._url_template: tuple[str, tuple[ConnectWiseEndpoint, ...]] | None = None
+        self._response_mode: ResponseMode | None = None
+        self._selection: tuple[type[ConnectWiseModel], type[ConnectWiseModel], str] | None = None
 
     def _register_child_endpoint(self, child_endpoint: TChildEndpoint) -> TChildEndpoint:
         """
@@ -90,6 +109,97 @@ class ConnectWiseEndpoint:
         self._child_endpoints.append(child_endpoint)
         return child_endpoint
 
+    def with_response_mode(self, response_mode: ResponseMode) -> Self:
+        """
+        Get a copy of this endpoint that returns its response data (and its child endpoints' data) in the given
+        response mode, rather than the one set in the client's Config.
+
+        Args:
+            response_mode (str): "model" to validate responses into models, or "raw" to return the decoded
+                JSON dicts without validating them.
+
+        Returns:
+            ConnectWiseEndpoint: The copy of the endpoint.
+
+        Example:
+            for ticket in client.service.tickets.with_response_mode("raw").paginated(1, 1000).all():
+                ticket["summary"]
+        """
+        endpoint = self._copy()
+        endpoint._response_mode = response_mode
+        return endpoint
+
+    def select(self, *fields: FieldPath) -> Self:
+        """
+        Get a copy of this endpoint that only requests the given fields of its model, using the Manage API's
+        "fields" query parameter (or Automate's "includeFields"), and parses them into a slim model with only
+        those fields. This cuts the size of the response and the cost of parsing it, for wide models like Ticket.
+
+        Fields are referred to through the model class, e.g. Ticket.status.name for the name of the ticket's status.
+        Selecting a nested model (e.g. Ticket.company) selects all of its fields. Automate can only select top level
+        fields, so the API returns all fields of any nested models selected into, but only the selected ones are parsed.
+
+        Args:
+            *fields (FieldPath): The fields to request.
+
+        Returns:
+            ConnectWiseEndpoint: The copy of the endpoint.
+
+        Example:
+            for ticket in client.service.tickets.select(Ticket.id, Ticket.status.name).paginated(1, 1000).all():
+                ticket.status.name
+        """
+        models = {field.model for field in fields}
+        if len(models) != 1:
+            raise ValueError("Select at least one field, all of the same model")  # noqa: TRY003
+        model = models.pop()
+        selection_model = model._select(*fields)
+        field_names = selection_model._get_field_names()
+        if self.client._fields_param != "fields":
+            # Only Manage accepts the paths of nested fields
+            field_names = list(dict.fromkeys(name.split("/")[0] for name in field_names))
+
+        endpoint = self._copy()
+        endpoint._selection = (model, selection_model, ",".join(field_names))
+        return endpoint
+
+    def _copy(self) -> Self:
+        endpoint = copy.copy(self)
+        # The original's children (and URL template) would still point back at the original
+        for name in list(vars(endpoint)):
+            if isinstance(getattr(type(endpoint), name, None), cached_property):
+                del vars(endpoint)[name]
+        endpoint._child_endpoints = []
+        endpoint._url_template = None
+        return endpoint
+
+    def _get_params(self, params: RequestParams | None) -> RequestParams | None:
+        """
+        Add the selected fields, if any, to a request's query parameters.
+        """
+        if self._selection is None:
+            return params
+        return {**(params or {}), self.client._fields_param: self._selection[2]}  # type: ignore[return-value]
+
+    def _get_response_model(self, model_type: type[TModel]) -> type[TModel]:
+        """
+        Get the model to parse a response into, which is the slim model if the model's fields were selected.
+        """
+        if self._selection is not None and self._selection[0] is model_type:
+            return self._selection[1]  # type: ignore[return-value]
+        return model_type
+
+    def _get_response_mode(self) -> ResponseMode:
+        """
+        Get the response mode set on this endpoint or its closest parent, or failing that, the client's Config.
+        """
+        endpoint: ConnectWiseEndpoint | None = self
+        while endpoint is not None:
+            if endpoint._response_mode is not None:
+                return endpoint._response_mode
+            endpoint = endpoint._parent_endpoint
+        return self.client.config.response_mode
+
     def _url_join(self, *args) -> str:  # noqa: ANN002
         """
         Join URL parts into a single URL string.
@@ -138,26 +248,65 @@ class ConnectWiseEndpoint:
         if endpoint:
             url = self._url_join(url, endpoint)
 
-        return self.client._make_request(method, url, data, params, headers, stream)
+        return self.client._make_request(
+            method, url, data, self._get_params(params), headers, stream=stream, endpoint_class=type(self)
+        )
+
+    def _get_url_template(self) -> tuple[str, tuple[ConnectWiseEndpoint, ...]]:
+        """
+        Get the endpoint's path below the client URL as a str.format() template with a {} in place of each id,
+        along with the endpoints whose ids fill them in, in order.
+
+        It's built from the parent's template the first time the endpoint's URL is needed and reused afterwards,
+        so building a URL only has to format in the ids rather than walk and join the whole parent chain.
+        """
+        if self._url_template is None:
+            if self._parent_endpoint is None:
+                parent_path, id_endpoints = "", ()
+            else:
+                parent_path, id_endpoints = self._parent_endpoint._get_url_template()
+            if "{id}" in self.endpoint_base:
+                id_endpoints = (*id_endpoints, self)
+            self._url_template = (_join_path_template(parent_path, self.endpoint_base), id_endpoints)
+        return self._url_template
 
     def _build_url(self, other_endpoint: ConnectWiseEndpoint) -> str:
-        if other_endpoint._parent_endpoint is not None:
-            parent_url = self._build_url(other_endpoint._parent_endpoint)
-            if other_endpoint._parent_endpoint._id is not None:
-                return self._url_join(
-                    parent_url,
-                    other_endpoint._get_replaced_url(),
-                )
-            else:  # noqa: RET505
-                return self._url_join(parent_url, other_endpoint._get_replaced_url())
-        else:
-            return self._url_join(self.client._get_url(), other_endpoint._get_replaced_url())
+        return other_endpoint._get_endpoint_url()
 
     def _get_endpoint_url(self) -> str:
-        return self._build_url(self)
+        path, id_endpoints = self._get_url_template()
+        if id_endpoints:
+            path = path.format(*["{id}" if e._id is None else e._id for e in id_endpoints])
+        return f"{self.client._get_url().strip('/')}/{path}"
+
+    def _parse_many(self, model_type: type[TModel], data: bytes | list[dict[str, Any]]) -> list[TModel]:
+        """
+        Validate a list of items into models. Given the raw response body, it's validated straight from the JSON
+        in one pass, rather than decoded into dicts that are then validated one by one.
 
-    def _parse_many(self, model_type: type[TModel], data: list[dict[str, Any]]) -> list[TModel]:
+        In the "raw" response mode, the items are returned as dicts without being validated.
+        """
+        if self._get_response_mode() == "raw":
+            return from_json(data) if isinstance(data, bytes | str) else data  # type: ignore[return-value]
+        model_type = self._get_response_model(model_type)
+        if isinstance(data, bytes | str):
+            return get_list_adapter(model_type).validate_json(data)
         return [model_type.model_validate(d) for d in data]
 
-    def _parse_one(self, model_type: type[TModel], data: dict[str, Any]) -> TModel:
+    def _parse_one(self, model_type: type[TModel], data: bytes | dict[str, Any]) -> TModel:
+        if self._get_response_mode() == "raw":
+            return from_json(data) if isinstance(data, bytes | str) else data  # type: ignore[return-value]
+        model_type = self._get_response_model(model_type)
+        if isinstance(data, bytes | str):
+            return model_type.model_validate_json(data)
         return model_type.model_validate(data)
+
+
+@cache
+def _join_path_template(parent_path: str, endpoint_base: str) -> str:
+    """
+    Append an endpoint's base to its parent's path template, escaping any braces and turning "{id}" into "{}".
+    There's only one template per endpoint in the tree, so they're shared by every instance.
+    """
+    path = endpoint_base.strip("/").replace("{", "{{").replace("}", "}}").replace("{{id}}", "{}")
+    return f"{parent_path.rstrip('/')}/{path}" if parent_path else path
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class CompanyAddressformatsEndpoint(
         IPostable.__init__(self, AddressFormat)
         IPaginateable.__init__(self, AddressFormat)
 
-        self.count = self._register_child_endpoint(CompanyAddressformatsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(CompanyAddressformatsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyAddressformatsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyAddressformatsIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class CompanyAddressformatsEndpoint(
         Returns:
             list[AddressFormat]: The parsed response data.
         """
-        return self._parse_many(AddressFormat, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AddressFormat, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AddressFormat:
         """
@@ -87,4 +85,18 @@ class CompanyAddressformatsEndpoint(
         Returns:
             AddressFormat: The parsed response data.
         """
-        return self._parse_one(AddressFormat, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AddressFormat, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyAddressformatsCountEndpoint:
+        """
+        The CompanyAddressformatsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyAddressformatsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyAddressformatsInfoEndpoint:
+        """
+        The CompanyAddressformatsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyAddressformatsInfoEndpoint(self.client, parent_endpoint=self))
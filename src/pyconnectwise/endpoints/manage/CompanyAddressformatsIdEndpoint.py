@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class CompanyAddressformatsIdEndpoint(
         IPuttable.__init__(self, AddressFormat)
         IPaginateable.__init__(self, AddressFormat)
 
-        self.info = self._register_child_endpoint(CompanyAddressformatsIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[AddressFormat]:
@@ -69,7 +68,7 @@ class CompanyAddressformatsIdEndpoint(
         Returns:
             AddressFormat: The parsed response data.
         """
-        return self._parse_one(AddressFormat, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AddressFormat, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> AddressFormat:
         """
@@ -81,7 +80,7 @@ class CompanyAddressformatsIdEndpoint(
         Returns:
             AddressFormat: The parsed response data.
         """
-        return self._parse_one(AddressFormat, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(AddressFormat, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AddressFormat:
         """
@@ -93,4 +92,11 @@ class CompanyAddressformatsIdEndpoint(
         Returns:
             AddressFormat: The parsed response data.
         """
-        return self._parse_one(AddressFormat, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(AddressFormat, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> CompanyAddressformatsIdInfoEndpoint:
+        """
+        The CompanyAddressformatsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyAddressformatsIdInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class CompanyAddressformatsIdInfoEndpoint(
         Returns:
             AddressFormatInfo: The parsed response data.
         """
-        return self._parse_one(AddressFormatInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AddressFormatInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -11,4 +12,9 @@ class CompanyBillingsetupsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "billingSetups", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(CompanyBillingsetupsInfoEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def info(self) -> CompanyBillingsetupsInfoEndpoint:
+        """
+        The CompanyBillingsetupsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyBillingsetupsInfoEndpoint(self.client, parent_endpoint=self))
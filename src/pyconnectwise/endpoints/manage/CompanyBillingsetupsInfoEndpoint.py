@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -11,4 +12,9 @@ class CompanyBillingsetupsInfoEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "info", parent_endpoint=parent_endpoint)
 
-        self.count = self._register_child_endpoint(CompanyBillingsetupsInfoCountEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def count(self) -> CompanyBillingsetupsInfoCountEndpoint:
+        """
+        The CompanyBillingsetupsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyBillingsetupsInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class CompanyCommunicationtypesEndpoint(
         IPostable.__init__(self, CommunicationType)
         IPaginateable.__init__(self, CommunicationType)
 
-        self.count = self._register_child_endpoint(CompanyCommunicationtypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(CompanyCommunicationtypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyCommunicationtypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCommunicationtypesIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class CompanyCommunicationtypesEndpoint(
         Returns:
             list[CommunicationType]: The parsed response data.
         """
-        return self._parse_many(CommunicationType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CommunicationType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CommunicationType:
         """
@@ -87,4 +85,18 @@ class CompanyCommunicationtypesEndpoint(
         Returns:
             CommunicationType: The parsed response data.
         """
-        return self._parse_one(CommunicationType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CommunicationType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyCommunicationtypesCountEndpoint:
+        """
+        The CompanyCommunicationtypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCommunicationtypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyCommunicationtypesInfoEndpoint:
+        """
+        The CompanyCommunicationtypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCommunicationtypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -30,11 +31,6 @@ class CompanyCommunicationtypesIdEndpoint(
         IPuttable.__init__(self, CommunicationType)
         IPaginateable.__init__(self, CommunicationType)
 
-        self.info = self._register_child_endpoint(CompanyCommunicationtypesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(
-            CompanyCommunicationtypesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[CommunicationType]:
@@ -77,7 +73,7 @@ class CompanyCommunicationtypesIdEndpoint(
         Returns:
             CommunicationType: The parsed response data.
         """
-        return self._parse_one(CommunicationType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CommunicationType, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> CommunicationType:
         """
@@ -89,7 +85,7 @@ class CompanyCommunicationtypesIdEndpoint(
         Returns:
             CommunicationType: The parsed response data.
         """
-        return self._parse_one(CommunicationType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(CommunicationType, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CommunicationType:
         """
@@ -101,4 +97,20 @@ class CompanyCommunicationtypesIdEndpoint(
         Returns:
             CommunicationType: The parsed response data.
         """
-        return self._parse_one(CommunicationType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(CommunicationType, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> CompanyCommunicationtypesIdInfoEndpoint:
+        """
+        The CompanyCommunicationtypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCommunicationtypesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> CompanyCommunicationtypesIdUsagesEndpoint:
+        """
+        The CompanyCommunicationtypesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCommunicationtypesIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
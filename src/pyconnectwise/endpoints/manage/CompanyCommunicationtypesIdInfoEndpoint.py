@@ -54,4 +54,4 @@ class CompanyCommunicationtypesIdInfoEndpoint(
         Returns:
             CommunicationTypeInfo: The parsed response data.
         """
-        return self._parse_one(CommunicationTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CommunicationTypeInfo, super()._make_request("GET", data=data, params=params).content)
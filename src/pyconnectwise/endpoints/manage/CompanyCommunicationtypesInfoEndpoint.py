@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class CompanyCommunicationtypesInfoEndpoint(
         IGettable.__init__(self, list[CommunicationTypeInfo])
         IPaginateable.__init__(self, CommunicationTypeInfo)
 
-        self.count = self._register_child_endpoint(
-            CompanyCommunicationtypesInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[CommunicationTypeInfo]:
@@ -61,4 +58,13 @@ class CompanyCommunicationtypesInfoEndpoint(
         Returns:
             list[CommunicationTypeInfo]: The parsed response data.
         """
-        return self._parse_many(CommunicationTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CommunicationTypeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyCommunicationtypesInfoCountEndpoint:
+        """
+        The CompanyCommunicationtypesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCommunicationtypesInfoCountEndpoint(self.client, parent_endpoint=self)
+        )
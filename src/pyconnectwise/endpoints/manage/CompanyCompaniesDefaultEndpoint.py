@@ -50,4 +50,4 @@ class CompanyCompaniesDefaultEndpoint(
         Returns:
             Company: The parsed response data.
         """
-        return self._parse_one(Company, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Company, super()._make_request("GET", data=data, params=params).content)
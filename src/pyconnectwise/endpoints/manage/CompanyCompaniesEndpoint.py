@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,12 +29,6 @@ class CompanyCompaniesEndpoint(
         IPostable.__init__(self, Company)
         IPaginateable.__init__(self, Company)
 
-        self.count = self._register_child_endpoint(CompanyCompaniesCountEndpoint(client, parent_endpoint=self))
-        self.default = self._register_child_endpoint(CompanyCompaniesDefaultEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(CompanyCompaniesInfoEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(CompanyCompaniesStatusesEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(CompanyCompaniesTypesEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyCompaniesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdEndpoint object to move down the chain.
@@ -77,7 +72,7 @@ class CompanyCompaniesEndpoint(
         Returns:
             list[Company]: The parsed response data.
         """
-        return self._parse_many(Company, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Company, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Company:
         """
@@ -89,4 +84,39 @@ class CompanyCompaniesEndpoint(
         Returns:
             Company: The parsed response data.
         """
-        return self._parse_one(Company, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Company, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesCountEndpoint:
+        """
+        The CompanyCompaniesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def default(self) -> CompanyCompaniesDefaultEndpoint:
+        """
+        The CompanyCompaniesDefaultEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesDefaultEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyCompaniesInfoEndpoint:
+        """
+        The CompanyCompaniesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> CompanyCompaniesStatusesEndpoint:
+        """
+        The CompanyCompaniesStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> CompanyCompaniesTypesEndpoint:
+        """
+        The CompanyCompaniesTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesTypesEndpoint(self.client, parent_endpoint=self))
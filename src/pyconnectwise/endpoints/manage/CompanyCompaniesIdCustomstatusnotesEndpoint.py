@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class CompanyCompaniesIdCustomstatusnotesEndpoint(
         IPostable.__init__(self, CompanyCustomNote)
         IPaginateable.__init__(self, CompanyCustomNote)
 
-        self.count = self._register_child_endpoint(
-            CompanyCompaniesIdCustomstatusnotesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyCompaniesIdCustomstatusnotesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdCustomstatusnotesIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class CompanyCompaniesIdCustomstatusnotesEndpoint(
         Returns:
             list[CompanyCustomNote]: The parsed response data.
         """
-        return self._parse_many(CompanyCustomNote, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyCustomNote, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanyCustomNote:
         """
@@ -91,4 +88,13 @@ class CompanyCompaniesIdCustomstatusnotesEndpoint(
         Returns:
             CompanyCustomNote: The parsed response data.
         """
-        return self._parse_one(CompanyCustomNote, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyCustomNote, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdCustomstatusnotesCountEndpoint:
+        """
+        The CompanyCompaniesIdCustomstatusnotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdCustomstatusnotesCountEndpoint(self.client, parent_endpoint=self)
+        )
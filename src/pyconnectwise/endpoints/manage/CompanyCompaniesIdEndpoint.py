@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -47,30 +48,6 @@ class CompanyCompaniesIdEndpoint(
         IPuttable.__init__(self, Company)
         IPaginateable.__init__(self, Company)
 
-        self.custom_status_notes = self._register_child_endpoint(
-            CompanyCompaniesIdCustomstatusnotesEndpoint(client, parent_endpoint=self)
-        )
-        self.groups = self._register_child_endpoint(CompanyCompaniesIdGroupsEndpoint(client, parent_endpoint=self))
-        self.management_report_notifications = self._register_child_endpoint(
-            CompanyCompaniesIdManagementreportnotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.management_report_setup = self._register_child_endpoint(
-            CompanyCompaniesIdManagementreportsetupEndpoint(client, parent_endpoint=self)
-        )
-        self.management_summary_reports = self._register_child_endpoint(
-            CompanyCompaniesIdManagementsummaryreportsEndpoint(client, parent_endpoint=self)
-        )
-        self.merge = self._register_child_endpoint(CompanyCompaniesIdMergeEndpoint(client, parent_endpoint=self))
-        self.notes = self._register_child_endpoint(CompanyCompaniesIdNotesEndpoint(client, parent_endpoint=self))
-        self.sites = self._register_child_endpoint(CompanyCompaniesIdSitesEndpoint(client, parent_endpoint=self))
-        self.surveys = self._register_child_endpoint(CompanyCompaniesIdSurveysEndpoint(client, parent_endpoint=self))
-        self.teams = self._register_child_endpoint(CompanyCompaniesIdTeamsEndpoint(client, parent_endpoint=self))
-        self.tracks = self._register_child_endpoint(CompanyCompaniesIdTracksEndpoint(client, parent_endpoint=self))
-        self.type_associations = self._register_child_endpoint(
-            CompanyCompaniesIdTypeassociationsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(CompanyCompaniesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Company]:
@@ -111,7 +88,7 @@ class CompanyCompaniesIdEndpoint(
         Returns:
             Company: The parsed response data.
         """
-        return self._parse_one(Company, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Company, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Company:
         """
@@ -123,7 +100,7 @@ class CompanyCompaniesIdEndpoint(
         Returns:
             Company: The parsed response data.
         """
-        return self._parse_one(Company, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Company, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Company:
         """
@@ -135,4 +112,105 @@ class CompanyCompaniesIdEndpoint(
         Returns:
             Company: The parsed response data.
         """
-        return self._parse_one(Company, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Company, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def custom_status_notes(self) -> CompanyCompaniesIdCustomstatusnotesEndpoint:
+        """
+        The CompanyCompaniesIdCustomstatusnotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdCustomstatusnotesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def groups(self) -> CompanyCompaniesIdGroupsEndpoint:
+        """
+        The CompanyCompaniesIdGroupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdGroupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def management_report_notifications(self) -> CompanyCompaniesIdManagementreportnotificationsEndpoint:
+        """
+        The CompanyCompaniesIdManagementreportnotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdManagementreportnotificationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def management_report_setup(self) -> CompanyCompaniesIdManagementreportsetupEndpoint:
+        """
+        The CompanyCompaniesIdManagementreportsetupEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdManagementreportsetupEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def management_summary_reports(self) -> CompanyCompaniesIdManagementsummaryreportsEndpoint:
+        """
+        The CompanyCompaniesIdManagementsummaryreportsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdManagementsummaryreportsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def merge(self) -> CompanyCompaniesIdMergeEndpoint:
+        """
+        The CompanyCompaniesIdMergeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdMergeEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notes(self) -> CompanyCompaniesIdNotesEndpoint:
+        """
+        The CompanyCompaniesIdNotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdNotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sites(self) -> CompanyCompaniesIdSitesEndpoint:
+        """
+        The CompanyCompaniesIdSitesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdSitesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def surveys(self) -> CompanyCompaniesIdSurveysEndpoint:
+        """
+        The CompanyCompaniesIdSurveysEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdSurveysEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def teams(self) -> CompanyCompaniesIdTeamsEndpoint:
+        """
+        The CompanyCompaniesIdTeamsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdTeamsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tracks(self) -> CompanyCompaniesIdTracksEndpoint:
+        """
+        The CompanyCompaniesIdTracksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdTracksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def type_associations(self) -> CompanyCompaniesIdTypeassociationsEndpoint:
+        """
+        The CompanyCompaniesIdTypeassociationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdTypeassociationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> CompanyCompaniesIdUsagesEndpoint:
+        """
+        The CompanyCompaniesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class CompanyCompaniesIdGroupsEndpoint(
         IPostable.__init__(self, CompanyGroup)
         IPaginateable.__init__(self, CompanyGroup)
 
-        self.count = self._register_child_endpoint(CompanyCompaniesIdGroupsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyCompaniesIdGroupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdGroupsIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class CompanyCompaniesIdGroupsEndpoint(
         Returns:
             list[CompanyGroup]: The parsed response data.
         """
-        return self._parse_many(CompanyGroup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyGroup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanyGroup:
         """
@@ -83,4 +82,11 @@ class CompanyCompaniesIdGroupsEndpoint(
         Returns:
             CompanyGroup: The parsed response data.
         """
-        return self._parse_one(CompanyGroup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyGroup, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdGroupsCountEndpoint:
+        """
+        The CompanyCompaniesIdGroupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdGroupsCountEndpoint(self.client, parent_endpoint=self))
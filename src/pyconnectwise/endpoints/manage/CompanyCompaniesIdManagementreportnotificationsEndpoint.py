@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class CompanyCompaniesIdManagementreportnotificationsEndpoint(
         IPostable.__init__(self, ManagementReportNotification)
         IPaginateable.__init__(self, ManagementReportNotification)
 
-        self.count = self._register_child_endpoint(
-            CompanyCompaniesIdManagementreportnotificationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyCompaniesIdManagementreportnotificationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdManagementreportnotificationsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class CompanyCompaniesIdManagementreportnotificationsEndpoint(
             list[ManagementReportNotification]: The parsed response data.
         """
         return self._parse_many(
-            ManagementReportNotification, super()._make_request("GET", data=data, params=params).json()
+            ManagementReportNotification, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class CompanyCompaniesIdManagementreportnotificationsEndpoint(
             ManagementReportNotification: The parsed response data.
         """
         return self._parse_one(
-            ManagementReportNotification, super()._make_request("POST", data=data, params=params).json()
+            ManagementReportNotification, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdManagementreportnotificationsCountEndpoint:
+        """
+        The CompanyCompaniesIdManagementreportnotificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdManagementreportnotificationsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -69,7 +69,7 @@ class CompanyCompaniesIdManagementreportnotificationsIdEndpoint(
             ManagementReportNotification: The parsed response data.
         """
         return self._parse_one(
-            ManagementReportNotification, super()._make_request("GET", data=data, params=params).json()
+            ManagementReportNotification, super()._make_request("GET", data=data, params=params).content
         )
 
     def patch(
@@ -85,7 +85,7 @@ class CompanyCompaniesIdManagementreportnotificationsIdEndpoint(
             ManagementReportNotification: The parsed response data.
         """
         return self._parse_one(
-            ManagementReportNotification, super()._make_request("PATCH", data=data, params=params).json()
+            ManagementReportNotification, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -101,5 +101,5 @@ class CompanyCompaniesIdManagementreportnotificationsIdEndpoint(
             ManagementReportNotification: The parsed response data.
         """
         return self._parse_one(
-            ManagementReportNotification, super()._make_request("PUT", data=data, params=params).json()
+            ManagementReportNotification, super()._make_request("PUT", data=data, params=params).content
         )
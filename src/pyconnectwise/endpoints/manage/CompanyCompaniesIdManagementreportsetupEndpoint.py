@@ -72,7 +72,7 @@ class CompanyCompaniesIdManagementreportsetupEndpoint(
         Returns:
             list[ManagementReportSetup]: The parsed response data.
         """
-        return self._parse_many(ManagementReportSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ManagementReportSetup, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -86,4 +86,4 @@ class CompanyCompaniesIdManagementreportsetupEndpoint(
         Returns:
             ManagementReportSetup: The parsed response data.
         """
-        return self._parse_one(ManagementReportSetup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ManagementReportSetup, super()._make_request("POST", data=data, params=params).content)
@@ -31,7 +31,7 @@ class CompanyCompaniesIdManagementreportsetupIdEndpoint(
         Returns:
             ManagementReportSetup: The parsed response data.
         """
-        return self._parse_one(ManagementReportSetup, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ManagementReportSetup, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -45,4 +45,4 @@ class CompanyCompaniesIdManagementreportsetupIdEndpoint(
         Returns:
             ManagementReportSetup: The parsed response data.
         """
-        return self._parse_one(ManagementReportSetup, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ManagementReportSetup, super()._make_request("PUT", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class CompanyCompaniesIdManagementsummaryreportsEndpoint(
         IPostable.__init__(self, CompanyManagementSummary)
         IPaginateable.__init__(self, CompanyManagementSummary)
 
-        self.count = self._register_child_endpoint(
-            CompanyCompaniesIdManagementsummaryreportsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyCompaniesIdManagementsummaryreportsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdManagementsummaryreportsIdEndpoint object to move down the chain.
@@ -79,7 +76,9 @@ class CompanyCompaniesIdManagementsummaryreportsEndpoint(
         Returns:
             list[CompanyManagementSummary]: The parsed response data.
         """
-        return self._parse_many(CompanyManagementSummary, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(
+            CompanyManagementSummary, super()._make_request("GET", data=data, params=params).content
+        )
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -93,4 +92,15 @@ class CompanyCompaniesIdManagementsummaryreportsEndpoint(
         Returns:
             CompanyManagementSummary: The parsed response data.
         """
-        return self._parse_one(CompanyManagementSummary, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(
+            CompanyManagementSummary, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdManagementsummaryreportsCountEndpoint:
+        """
+        The CompanyCompaniesIdManagementsummaryreportsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdManagementsummaryreportsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class CompanyCompaniesIdNotesEndpoint(
         IPostable.__init__(self, CompanyNote)
         IPaginateable.__init__(self, CompanyNote)
 
-        self.count = self._register_child_endpoint(CompanyCompaniesIdNotesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyCompaniesIdNotesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdNotesIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class CompanyCompaniesIdNotesEndpoint(
         Returns:
             list[CompanyNote]: The parsed response data.
         """
-        return self._parse_many(CompanyNote, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyNote, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanyNote:
         """
@@ -83,4 +82,11 @@ class CompanyCompaniesIdNotesEndpoint(
         Returns:
             CompanyNote: The parsed response data.
         """
-        return self._parse_one(CompanyNote, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyNote, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdNotesCountEndpoint:
+        """
+        The CompanyCompaniesIdNotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdNotesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class CompanyCompaniesIdSitesEndpoint(
         IPostable.__init__(self, CompanySite)
         IPaginateable.__init__(self, CompanySite)
 
-        self.count = self._register_child_endpoint(CompanyCompaniesIdSitesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyCompaniesIdSitesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdSitesIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class CompanyCompaniesIdSitesEndpoint(
         Returns:
             list[CompanySite]: The parsed response data.
         """
-        return self._parse_many(CompanySite, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanySite, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanySite:
         """
@@ -83,4 +82,11 @@ class CompanyCompaniesIdSitesEndpoint(
         Returns:
             CompanySite: The parsed response data.
         """
-        return self._parse_one(CompanySite, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanySite, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdSitesCountEndpoint:
+        """
+        The CompanyCompaniesIdSitesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdSitesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class CompanyCompaniesIdSitesIdEndpoint(
         IPuttable.__init__(self, CompanySite)
         IPaginateable.__init__(self, CompanySite)
 
-        self.usages = self._register_child_endpoint(
-            CompanyCompaniesIdSitesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[CompanySite]:
@@ -73,7 +70,7 @@ class CompanyCompaniesIdSitesIdEndpoint(
         Returns:
             CompanySite: The parsed response data.
         """
-        return self._parse_one(CompanySite, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CompanySite, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> CompanySite:
         """
@@ -85,7 +82,7 @@ class CompanyCompaniesIdSitesIdEndpoint(
         Returns:
             CompanySite: The parsed response data.
         """
-        return self._parse_one(CompanySite, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(CompanySite, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanySite:
         """
@@ -97,4 +94,11 @@ class CompanyCompaniesIdSitesIdEndpoint(
         Returns:
             CompanySite: The parsed response data.
         """
-        return self._parse_one(CompanySite, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(CompanySite, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> CompanyCompaniesIdSitesIdUsagesEndpoint:
+        """
+        The CompanyCompaniesIdSitesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdSitesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class CompanyCompaniesIdSitesIdUsagesEndpoint(
         IGettable.__init__(self, list[Usage])
         IPaginateable.__init__(self, Usage)
 
-        self.list = self._register_child_endpoint(
-            CompanyCompaniesIdSitesIdUsagesListEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Usage]:
@@ -57,4 +54,13 @@ class CompanyCompaniesIdSitesIdUsagesEndpoint(
         Returns:
             list[Usage]: The parsed response data.
         """
-        return self._parse_many(Usage, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Usage, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def list(self) -> CompanyCompaniesIdSitesIdUsagesListEndpoint:
+        """
+        The CompanyCompaniesIdSitesIdUsagesListEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdSitesIdUsagesListEndpoint(self.client, parent_endpoint=self)
+        )
@@ -50,4 +50,4 @@ class CompanyCompaniesIdSitesIdUsagesListEndpoint(
         Returns:
             list[Usage]: The parsed response data.
         """
-        return self._parse_many(Usage, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Usage, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class CompanyCompaniesIdTeamsEndpoint(
         IPostable.__init__(self, CompanyTeam)
         IPaginateable.__init__(self, CompanyTeam)
 
-        self.count = self._register_child_endpoint(CompanyCompaniesIdTeamsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyCompaniesIdTeamsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdTeamsIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class CompanyCompaniesIdTeamsEndpoint(
         Returns:
             list[CompanyTeam]: The parsed response data.
         """
-        return self._parse_many(CompanyTeam, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyTeam, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanyTeam:
         """
@@ -83,4 +82,11 @@ class CompanyCompaniesIdTeamsEndpoint(
         Returns:
             CompanyTeam: The parsed response data.
         """
-        return self._parse_one(CompanyTeam, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyTeam, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdTeamsCountEndpoint:
+        """
+        The CompanyCompaniesIdTeamsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdTeamsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class CompanyCompaniesIdTypeassociationsEndpoint(
         IPostable.__init__(self, CompanyCompanyTypeAssociationCompanyTypeAssociation)
         IPaginateable.__init__(self, CompanyCompanyTypeAssociationCompanyTypeAssociation)
 
-        self.count = self._register_child_endpoint(
-            CompanyCompaniesIdTypeassociationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyCompaniesIdTypeassociationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdTypeassociationsIdEndpoint object to move down the chain.
@@ -86,7 +83,7 @@ class CompanyCompaniesIdTypeassociationsEndpoint(
         """
         return self._parse_many(
             CompanyCompanyTypeAssociationCompanyTypeAssociation,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -103,5 +100,14 @@ class CompanyCompaniesIdTypeassociationsEndpoint(
         """
         return self._parse_one(
             CompanyCompanyTypeAssociationCompanyTypeAssociation,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
+        )
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdTypeassociationsCountEndpoint:
+        """
+        The CompanyCompaniesIdTypeassociationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdTypeassociationsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -75,7 +75,7 @@ class CompanyCompaniesIdTypeassociationsIdEndpoint(
         """
         return self._parse_one(
             CompanyCompanyTypeAssociationCompanyTypeAssociation,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def patch(
@@ -92,7 +92,7 @@ class CompanyCompaniesIdTypeassociationsIdEndpoint(
         """
         return self._parse_one(
             CompanyCompanyTypeAssociationCompanyTypeAssociation,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
 
     def put(
@@ -109,5 +109,5 @@ class CompanyCompaniesIdTypeassociationsIdEndpoint(
         """
         return self._parse_one(
             CompanyCompanyTypeAssociationCompanyTypeAssociation,
-            super()._make_request("PUT", data=data, params=params).json(),
+            super()._make_request("PUT", data=data, params=params).content,
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class CompanyCompaniesIdUsagesEndpoint(
         IGettable.__init__(self, list[Usage])
         IPaginateable.__init__(self, Usage)
 
-        self.list = self._register_child_endpoint(CompanyCompaniesIdUsagesListEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Usage]:
@@ -53,4 +52,11 @@ class CompanyCompaniesIdUsagesEndpoint(
         Returns:
             list[Usage]: The parsed response data.
         """
-        return self._parse_many(Usage, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Usage, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def list(self) -> CompanyCompaniesIdUsagesListEndpoint:
+        """
+        The CompanyCompaniesIdUsagesListEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdUsagesListEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class CompanyCompaniesInfoTypesEndpoint(
         IGettable.__init__(self, list[CompanyTypeInfo])
         IPaginateable.__init__(self, CompanyTypeInfo)
 
-        self.count = self._register_child_endpoint(CompanyCompaniesInfoTypesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyCompaniesInfoTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompaniesInfoTypesIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class CompanyCompaniesInfoTypesEndpoint(
         Returns:
             list[CompanyTypeInfo]: The parsed response data.
         """
-        return self._parse_many(CompanyTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyTypeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesInfoTypesCountEndpoint:
+        """
+        The CompanyCompaniesInfoTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesInfoTypesCountEndpoint(self.client, parent_endpoint=self))
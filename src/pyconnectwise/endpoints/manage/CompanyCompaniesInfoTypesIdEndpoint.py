@@ -52,4 +52,4 @@ class CompanyCompaniesInfoTypesIdEndpoint(
         Returns:
             CompanyTypeInfo: The parsed response data.
         """
-        return self._parse_one(CompanyTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CompanyTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class CompanyCompaniesStatusesEndpoint(
         IPostable.__init__(self, CompanyStatus)
         IPaginateable.__init__(self, CompanyStatus)
 
-        self.count = self._register_child_endpoint(CompanyCompaniesStatusesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyCompaniesStatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompaniesStatusesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class CompanyCompaniesStatusesEndpoint(
         Returns:
             list[CompanyStatus]: The parsed response data.
         """
-        return self._parse_many(CompanyStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanyStatus:
         """
@@ -85,4 +84,11 @@ class CompanyCompaniesStatusesEndpoint(
         Returns:
             CompanyStatus: The parsed response data.
         """
-        return self._parse_one(CompanyStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesStatusesCountEndpoint:
+        """
+        The CompanyCompaniesStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesStatusesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class CompanyCompaniesTypesEndpoint(
         IPostable.__init__(self, CompanyType)
         IPaginateable.__init__(self, CompanyType)
 
-        self.count = self._register_child_endpoint(CompanyCompaniesTypesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyCompaniesTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompaniesTypesIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class CompanyCompaniesTypesEndpoint(
         Returns:
             list[CompanyType]: The parsed response data.
         """
-        return self._parse_many(CompanyType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanyType:
         """
@@ -83,4 +82,11 @@ class CompanyCompaniesTypesEndpoint(
         Returns:
             CompanyType: The parsed response data.
         """
-        return self._parse_one(CompanyType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesTypesCountEndpoint:
+        """
+        The CompanyCompaniesTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesTypesCountEndpoint(self.client, parent_endpoint=self))
@@ -24,4 +24,4 @@ class CompanyCompanyfinanceIdEndpoint(ConnectWiseEndpoint, IPuttable[CompanyFina
         Returns:
             CompanyFinance: The parsed response data.
         """
-        return self._parse_one(CompanyFinance, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(CompanyFinance, super()._make_request("PUT", data=data, params=params).content)
@@ -28,4 +28,4 @@ class CompanyCompanypickeritemsClearEndpoint(
         Returns:
             ClearPickerRequest: The parsed response data.
         """
-        return self._parse_one(ClearPickerRequest, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ClearPickerRequest, super()._make_request("POST", data=data, params=params).content)
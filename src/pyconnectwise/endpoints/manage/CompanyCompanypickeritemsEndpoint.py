@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class CompanyCompanypickeritemsEndpoint(
         IPostable.__init__(self, CompanyPickerItem)
         IPaginateable.__init__(self, CompanyPickerItem)
 
-        self.clear = self._register_child_endpoint(CompanyCompanypickeritemsClearEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyCompanypickeritemsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyCompanypickeritemsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompanypickeritemsIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class CompanyCompanypickeritemsEndpoint(
         Returns:
             list[CompanyPickerItem]: The parsed response data.
         """
-        return self._parse_many(CompanyPickerItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyPickerItem, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanyPickerItem:
         """
@@ -87,4 +85,18 @@ class CompanyCompanypickeritemsEndpoint(
         Returns:
             CompanyPickerItem: The parsed response data.
         """
-        return self._parse_one(CompanyPickerItem, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyPickerItem, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def clear(self) -> CompanyCompanypickeritemsClearEndpoint:
+        """
+        The CompanyCompanypickeritemsClearEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompanypickeritemsClearEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def count(self) -> CompanyCompanypickeritemsCountEndpoint:
+        """
+        The CompanyCompanypickeritemsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompanypickeritemsCountEndpoint(self.client, parent_endpoint=self))
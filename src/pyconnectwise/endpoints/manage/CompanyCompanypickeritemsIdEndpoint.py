@@ -62,4 +62,4 @@ class CompanyCompanypickeritemsIdEndpoint(
         Returns:
             CompanyPickerItem: The parsed response data.
         """
-        return self._parse_one(CompanyPickerItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CompanyPickerItem, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class CompanyCompanytypeassociationsEndpoint(
         IPostable.__init__(self, CompanyCompanyTypeAssociation)
         IPaginateable.__init__(self, CompanyCompanyTypeAssociation)
 
-        self.count = self._register_child_endpoint(
-            CompanyCompanytypeassociationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyCompanytypeassociationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCompanytypeassociationsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class CompanyCompanytypeassociationsEndpoint(
             list[CompanyCompanyTypeAssociation]: The parsed response data.
         """
         return self._parse_many(
-            CompanyCompanyTypeAssociation, super()._make_request("GET", data=data, params=params).json()
+            CompanyCompanyTypeAssociation, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class CompanyCompanytypeassociationsEndpoint(
             CompanyCompanyTypeAssociation: The parsed response data.
         """
         return self._parse_one(
-            CompanyCompanyTypeAssociation, super()._make_request("POST", data=data, params=params).json()
+            CompanyCompanyTypeAssociation, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyCompanytypeassociationsCountEndpoint:
+        """
+        The CompanyCompanytypeassociationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompanytypeassociationsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -69,7 +69,7 @@ class CompanyCompanytypeassociationsIdEndpoint(
             CompanyCompanyTypeAssociation: The parsed response data.
         """
         return self._parse_one(
-            CompanyCompanyTypeAssociation, super()._make_request("GET", data=data, params=params).json()
+            CompanyCompanyTypeAssociation, super()._make_request("GET", data=data, params=params).content
         )
 
     def patch(
@@ -85,7 +85,7 @@ class CompanyCompanytypeassociationsIdEndpoint(
             CompanyCompanyTypeAssociation: The parsed response data.
         """
         return self._parse_one(
-            CompanyCompanyTypeAssociation, super()._make_request("PATCH", data=data, params=params).json()
+            CompanyCompanyTypeAssociation, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -101,5 +101,5 @@ class CompanyCompanytypeassociationsIdEndpoint(
             CompanyCompanyTypeAssociation: The parsed response data.
         """
         return self._parse_one(
-            CompanyCompanyTypeAssociation, super()._make_request("PUT", data=data, params=params).json()
+            CompanyCompanyTypeAssociation, super()._make_request("PUT", data=data, params=params).content
         )
@@ -31,7 +31,7 @@ class CompanyConfigurationsBulkEndpoint(
         Returns:
             BulkResult: The parsed response data.
         """
-        return self._parse_one(BulkResult, super()._make_request("DELETE", data=data, params=params).json())
+        return self._parse_one(BulkResult, super()._make_request("DELETE", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -45,7 +45,7 @@ class CompanyConfigurationsBulkEndpoint(
         Returns:
             CompanyConfiguration: The parsed response data.
         """
-        return self._parse_one(CompanyConfiguration, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyConfiguration, super()._make_request("POST", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -59,4 +59,4 @@ class CompanyConfigurationsBulkEndpoint(
         Returns:
             CompanyConfiguration: The parsed response data.
         """
-        return self._parse_one(CompanyConfiguration, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(CompanyConfiguration, super()._make_request("PUT", data=data, params=params).content)
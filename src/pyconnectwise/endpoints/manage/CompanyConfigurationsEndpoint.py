@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,13 +28,6 @@ class CompanyConfigurationsEndpoint(
         IPostable.__init__(self, CompanyConfiguration)
         IPaginateable.__init__(self, CompanyConfiguration)
 
-        self.bulk = self._register_child_endpoint(CompanyConfigurationsBulkEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(CompanyConfigurationsCountEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(
-            CompanyConfigurationsStatusesEndpoint(client, parent_endpoint=self)
-        )
-        self.types = self._register_child_endpoint(CompanyConfigurationsTypesEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyConfigurationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyConfigurationsIdEndpoint object to move down the chain.
@@ -81,7 +75,7 @@ class CompanyConfigurationsEndpoint(
         Returns:
             list[CompanyConfiguration]: The parsed response data.
         """
-        return self._parse_many(CompanyConfiguration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyConfiguration, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -95,4 +89,32 @@ class CompanyConfigurationsEndpoint(
         Returns:
             CompanyConfiguration: The parsed response data.
         """
-        return self._parse_one(CompanyConfiguration, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyConfiguration, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def bulk(self) -> CompanyConfigurationsBulkEndpoint:
+        """
+        The CompanyConfigurationsBulkEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyConfigurationsBulkEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def count(self) -> CompanyConfigurationsCountEndpoint:
+        """
+        The CompanyConfigurationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyConfigurationsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> CompanyConfigurationsStatusesEndpoint:
+        """
+        The CompanyConfigurationsStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyConfigurationsStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> CompanyConfigurationsTypesEndpoint:
+        """
+        The CompanyConfigurationsTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyConfigurationsTypesEndpoint(self.client, parent_endpoint=self))
@@ -28,4 +28,4 @@ class CompanyConfigurationsIdChangetypeEndpoint(
         Returns:
             CompanyConfiguration: The parsed response data.
         """
-        return self._parse_one(CompanyConfiguration, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(CompanyConfiguration, super()._make_request("PATCH", data=data, params=params).content)
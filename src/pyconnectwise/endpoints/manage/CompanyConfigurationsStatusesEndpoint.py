@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -31,13 +32,6 @@ class CompanyConfigurationsStatusesEndpoint(
         IPostable.__init__(self, ConfigurationStatus)
         IPaginateable.__init__(self, ConfigurationStatus)
 
-        self.count = self._register_child_endpoint(
-            CompanyConfigurationsStatusesCountEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(
-            CompanyConfigurationsStatusesInfoEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyConfigurationsStatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyConfigurationsStatusesIdEndpoint object to move down the chain.
@@ -85,7 +79,7 @@ class CompanyConfigurationsStatusesEndpoint(
         Returns:
             list[ConfigurationStatus]: The parsed response data.
         """
-        return self._parse_many(ConfigurationStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ConfigurationStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -99,4 +93,22 @@ class CompanyConfigurationsStatusesEndpoint(
         Returns:
             ConfigurationStatus: The parsed response data.
         """
-        return self._parse_one(ConfigurationStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ConfigurationStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyConfigurationsStatusesCountEndpoint:
+        """
+        The CompanyConfigurationsStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsStatusesCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> CompanyConfigurationsStatusesInfoEndpoint:
+        """
+        The CompanyConfigurationsStatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsStatusesInfoEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -30,13 +31,6 @@ class CompanyConfigurationsStatusesIdEndpoint(
         IPuttable.__init__(self, ConfigurationStatus)
         IPaginateable.__init__(self, ConfigurationStatus)
 
-        self.info = self._register_child_endpoint(
-            CompanyConfigurationsStatusesIdInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            CompanyConfigurationsStatusesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ConfigurationStatus]:
@@ -81,7 +75,7 @@ class CompanyConfigurationsStatusesIdEndpoint(
         Returns:
             ConfigurationStatus: The parsed response data.
         """
-        return self._parse_one(ConfigurationStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ConfigurationStatus, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -95,7 +89,7 @@ class CompanyConfigurationsStatusesIdEndpoint(
         Returns:
             ConfigurationStatus: The parsed response data.
         """
-        return self._parse_one(ConfigurationStatus, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ConfigurationStatus, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -109,4 +103,22 @@ class CompanyConfigurationsStatusesIdEndpoint(
         Returns:
             ConfigurationStatus: The parsed response data.
         """
-        return self._parse_one(ConfigurationStatus, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ConfigurationStatus, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> CompanyConfigurationsStatusesIdInfoEndpoint:
+        """
+        The CompanyConfigurationsStatusesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsStatusesIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> CompanyConfigurationsStatusesIdUsagesEndpoint:
+        """
+        The CompanyConfigurationsStatusesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsStatusesIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
@@ -54,4 +54,4 @@ class CompanyConfigurationsStatusesIdInfoEndpoint(
         Returns:
             ConfigurationStatusInfo: The parsed response data.
         """
-        return self._parse_one(ConfigurationStatusInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ConfigurationStatusInfo, super()._make_request("GET", data=data, params=params).content)
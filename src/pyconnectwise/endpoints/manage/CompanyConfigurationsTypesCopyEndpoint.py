@@ -32,5 +32,5 @@ class CompanyConfigurationsTypesCopyEndpoint(
         """
         return self._parse_one(
             ConfigurationType,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
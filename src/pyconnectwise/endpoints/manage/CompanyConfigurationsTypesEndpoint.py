@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class CompanyConfigurationsTypesEndpoint(
         IPostable.__init__(self, ConfigurationType)
         IPaginateable.__init__(self, ConfigurationType)
 
-        self.count = self._register_child_endpoint(
-            CompanyConfigurationsTypesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyConfigurationsTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyConfigurationsTypesIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class CompanyConfigurationsTypesEndpoint(
         Returns:
             list[ConfigurationType]: The parsed response data.
         """
-        return self._parse_many(ConfigurationType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ConfigurationType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ConfigurationType:
         """
@@ -89,4 +86,11 @@ class CompanyConfigurationsTypesEndpoint(
         Returns:
             ConfigurationType: The parsed response data.
         """
-        return self._parse_one(ConfigurationType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ConfigurationType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyConfigurationsTypesCountEndpoint:
+        """
+        The CompanyConfigurationsTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyConfigurationsTypesCountEndpoint(self.client, parent_endpoint=self))
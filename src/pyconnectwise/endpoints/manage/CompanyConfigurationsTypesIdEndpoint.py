@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -33,16 +34,6 @@ class CompanyConfigurationsTypesIdEndpoint(
         IPuttable.__init__(self, ConfigurationType)
         IPaginateable.__init__(self, ConfigurationType)
 
-        self.info = self._register_child_endpoint(
-            CompanyConfigurationsTypesIdInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.questions = self._register_child_endpoint(
-            CompanyConfigurationsTypesIdQuestionsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            CompanyConfigurationsTypesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ConfigurationType]:
@@ -85,7 +76,7 @@ class CompanyConfigurationsTypesIdEndpoint(
         Returns:
             ConfigurationType: The parsed response data.
         """
-        return self._parse_one(ConfigurationType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ConfigurationType, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ConfigurationType:
         """
@@ -97,7 +88,7 @@ class CompanyConfigurationsTypesIdEndpoint(
         Returns:
             ConfigurationType: The parsed response data.
         """
-        return self._parse_one(ConfigurationType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ConfigurationType, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ConfigurationType:
         """
@@ -109,4 +100,31 @@ class CompanyConfigurationsTypesIdEndpoint(
         Returns:
             ConfigurationType: The parsed response data.
         """
-        return self._parse_one(ConfigurationType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ConfigurationType, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> CompanyConfigurationsTypesIdInfoEndpoint:
+        """
+        The CompanyConfigurationsTypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsTypesIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def questions(self) -> CompanyConfigurationsTypesIdQuestionsEndpoint:
+        """
+        The CompanyConfigurationsTypesIdQuestionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsTypesIdQuestionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> CompanyConfigurationsTypesIdUsagesEndpoint:
+        """
+        The CompanyConfigurationsTypesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsTypesIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
@@ -54,4 +54,4 @@ class CompanyConfigurationsTypesIdInfoEndpoint(
         Returns:
             ConfigurationTypeInfo: The parsed response data.
         """
-        return self._parse_one(ConfigurationTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ConfigurationTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class CompanyConfigurationsTypesIdQuestionsEndpoint(
         IPostable.__init__(self, ConfigurationTypeQuestion)
         IPaginateable.__init__(self, ConfigurationTypeQuestion)
 
-        self.count = self._register_child_endpoint(
-            CompanyConfigurationsTypesIdQuestionsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyConfigurationsTypesIdQuestionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyConfigurationsTypesIdQuestionsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class CompanyConfigurationsTypesIdQuestionsEndpoint(
             list[ConfigurationTypeQuestion]: The parsed response data.
         """
         return self._parse_many(
-            ConfigurationTypeQuestion, super()._make_request("GET", data=data, params=params).json()
+            ConfigurationTypeQuestion, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class CompanyConfigurationsTypesIdQuestionsEndpoint(
             ConfigurationTypeQuestion: The parsed response data.
         """
         return self._parse_one(
-            ConfigurationTypeQuestion, super()._make_request("POST", data=data, params=params).json()
+            ConfigurationTypeQuestion, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyConfigurationsTypesIdQuestionsCountEndpoint:
+        """
+        The CompanyConfigurationsTypesIdQuestionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsTypesIdQuestionsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class CompanyConfigurationsTypesIdQuestionsIdEndpoint(
         IPuttable.__init__(self, ConfigurationTypeQuestion)
         IPaginateable.__init__(self, ConfigurationTypeQuestion)
 
-        self.values = self._register_child_endpoint(
-            CompanyConfigurationsTypesIdQuestionsIdValuesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ConfigurationTypeQuestion]:
@@ -75,7 +72,9 @@ class CompanyConfigurationsTypesIdQuestionsIdEndpoint(
         Returns:
             ConfigurationTypeQuestion: The parsed response data.
         """
-        return self._parse_one(ConfigurationTypeQuestion, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(
+            ConfigurationTypeQuestion, super()._make_request("GET", data=data, params=params).content
+        )
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -90,7 +89,7 @@ class CompanyConfigurationsTypesIdQuestionsIdEndpoint(
             ConfigurationTypeQuestion: The parsed response data.
         """
         return self._parse_one(
-            ConfigurationTypeQuestion, super()._make_request("PATCH", data=data, params=params).json()
+            ConfigurationTypeQuestion, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -105,4 +104,15 @@ class CompanyConfigurationsTypesIdQuestionsIdEndpoint(
         Returns:
             ConfigurationTypeQuestion: The parsed response data.
         """
-        return self._parse_one(ConfigurationTypeQuestion, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(
+            ConfigurationTypeQuestion, super()._make_request("PUT", data=data, params=params).content
+        )
+
+    @cached_property
+    def values(self) -> CompanyConfigurationsTypesIdQuestionsIdValuesEndpoint:
+        """
+        The CompanyConfigurationsTypesIdQuestionsIdValuesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsTypesIdQuestionsIdValuesEndpoint(self.client, parent_endpoint=self)
+        )
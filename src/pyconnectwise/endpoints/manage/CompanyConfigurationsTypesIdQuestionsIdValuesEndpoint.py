@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class CompanyConfigurationsTypesIdQuestionsIdValuesEndpoint(
         IPostable.__init__(self, ConfigurationTypeQuestionValue)
         IPaginateable.__init__(self, ConfigurationTypeQuestionValue)
 
-        self.count = self._register_child_endpoint(
-            CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class CompanyConfigurationsTypesIdQuestionsIdValuesEndpoint(
             list[ConfigurationTypeQuestionValue]: The parsed response data.
         """
         return self._parse_many(
-            ConfigurationTypeQuestionValue, super()._make_request("GET", data=data, params=params).json()
+            ConfigurationTypeQuestionValue, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class CompanyConfigurationsTypesIdQuestionsIdValuesEndpoint(
             ConfigurationTypeQuestionValue: The parsed response data.
         """
         return self._parse_one(
-            ConfigurationTypeQuestionValue, super()._make_request("POST", data=data, params=params).json()
+            ConfigurationTypeQuestionValue, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint:
+        """
+        The CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint(
         IPuttable.__init__(self, ConfigurationTypeQuestionValue)
         IPaginateable.__init__(self, ConfigurationTypeQuestionValue)
 
-        self.usages = self._register_child_endpoint(
-            CompanyConfigurationsTypesIdQuestionsIdValuesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ConfigurationTypeQuestionValue]:
@@ -76,7 +73,7 @@ class CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint(
             ConfigurationTypeQuestionValue: The parsed response data.
         """
         return self._parse_one(
-            ConfigurationTypeQuestionValue, super()._make_request("GET", data=data, params=params).json()
+            ConfigurationTypeQuestionValue, super()._make_request("GET", data=data, params=params).content
         )
 
     def patch(
@@ -92,7 +89,7 @@ class CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint(
             ConfigurationTypeQuestionValue: The parsed response data.
         """
         return self._parse_one(
-            ConfigurationTypeQuestionValue, super()._make_request("PATCH", data=data, params=params).json()
+            ConfigurationTypeQuestionValue, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -108,5 +105,14 @@ class CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint(
             ConfigurationTypeQuestionValue: The parsed response data.
         """
         return self._parse_one(
-            ConfigurationTypeQuestionValue, super()._make_request("PUT", data=data, params=params).json()
+            ConfigurationTypeQuestionValue, super()._make_request("PUT", data=data, params=params).content
+        )
+
+    @cached_property
+    def usages(self) -> CompanyConfigurationsTypesIdQuestionsIdValuesIdUsagesEndpoint:
+        """
+        The CompanyConfigurationsTypesIdQuestionsIdValuesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsTypesIdQuestionsIdValuesIdUsagesEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.CompanyContactTypesEndpoint import (
     CompanyContactTypesEndpoint,
@@ -8,4 +10,9 @@ class CompanyContactEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "contact", parent_endpoint=parent_endpoint)
 
-        self.types = self._register_child_endpoint(CompanyContactTypesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def types(self) -> CompanyContactTypesEndpoint:
+        """
+        The CompanyContactTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactTypesEndpoint(self.client, parent_endpoint=self))
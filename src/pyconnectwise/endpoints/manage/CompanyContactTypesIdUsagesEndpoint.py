@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.CompanyContactTypesIdUsagesListEndpoint import (
     CompanyContactTypesIdUsagesListEndpoint,
@@ -8,4 +10,9 @@ class CompanyContactTypesIdUsagesEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "usages", parent_endpoint=parent_endpoint)
 
-        self.list = self._register_child_endpoint(CompanyContactTypesIdUsagesListEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def list(self) -> CompanyContactTypesIdUsagesListEndpoint:
+        """
+        The CompanyContactTypesIdUsagesListEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactTypesIdUsagesListEndpoint(self.client, parent_endpoint=self))
@@ -50,4 +50,4 @@ class CompanyContactsDefaultEndpoint(
         Returns:
             Contact: The parsed response data.
         """
-        return self._parse_one(Contact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Contact, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,11 +28,6 @@ class CompanyContactsDepartmentsEndpoint(
         IPostable.__init__(self, ContactDepartment)
         IPaginateable.__init__(self, ContactDepartment)
 
-        self.count = self._register_child_endpoint(
-            CompanyContactsDepartmentsCountEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(CompanyContactsDepartmentsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyContactsDepartmentsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyContactsDepartmentsIdEndpoint object to move down the chain.
@@ -79,7 +75,7 @@ class CompanyContactsDepartmentsEndpoint(
         Returns:
             list[ContactDepartment]: The parsed response data.
         """
-        return self._parse_many(ContactDepartment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactDepartment, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ContactDepartment:
         """
@@ -91,4 +87,18 @@ class CompanyContactsDepartmentsEndpoint(
         Returns:
             ContactDepartment: The parsed response data.
         """
-        return self._parse_one(ContactDepartment, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactDepartment, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyContactsDepartmentsCountEndpoint:
+        """
+        The CompanyContactsDepartmentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsDepartmentsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyContactsDepartmentsInfoEndpoint:
+        """
+        The CompanyContactsDepartmentsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsDepartmentsInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -30,13 +31,6 @@ class CompanyContactsDepartmentsIdEndpoint(
         IPuttable.__init__(self, ContactDepartment)
         IPaginateable.__init__(self, ContactDepartment)
 
-        self.info = self._register_child_endpoint(
-            CompanyContactsDepartmentsIdInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            CompanyContactsDepartmentsIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ContactDepartment]:
@@ -79,7 +73,7 @@ class CompanyContactsDepartmentsIdEndpoint(
         Returns:
             ContactDepartment: The parsed response data.
         """
-        return self._parse_one(ContactDepartment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ContactDepartment, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ContactDepartment:
         """
@@ -91,7 +85,7 @@ class CompanyContactsDepartmentsIdEndpoint(
         Returns:
             ContactDepartment: The parsed response data.
         """
-        return self._parse_one(ContactDepartment, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ContactDepartment, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ContactDepartment:
         """
@@ -103,4 +97,22 @@ class CompanyContactsDepartmentsIdEndpoint(
         Returns:
             ContactDepartment: The parsed response data.
         """
-        return self._parse_one(ContactDepartment, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ContactDepartment, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> CompanyContactsDepartmentsIdInfoEndpoint:
+        """
+        The CompanyContactsDepartmentsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContactsDepartmentsIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> CompanyContactsDepartmentsIdUsagesEndpoint:
+        """
+        The CompanyContactsDepartmentsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContactsDepartmentsIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
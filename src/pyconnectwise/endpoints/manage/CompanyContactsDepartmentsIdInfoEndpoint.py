@@ -54,4 +54,4 @@ class CompanyContactsDepartmentsIdInfoEndpoint(
         Returns:
             ContactDepartmentInfo: The parsed response data.
         """
-        return self._parse_one(ContactDepartmentInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ContactDepartmentInfo, super()._make_request("GET", data=data, params=params).content)
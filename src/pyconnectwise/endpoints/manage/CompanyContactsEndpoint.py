@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -32,22 +33,6 @@ class CompanyContactsEndpoint(
         IPostable.__init__(self, Contact)
         IPaginateable.__init__(self, Contact)
 
-        self.count = self._register_child_endpoint(CompanyContactsCountEndpoint(client, parent_endpoint=self))
-        self.default = self._register_child_endpoint(CompanyContactsDefaultEndpoint(client, parent_endpoint=self))
-        self.departments = self._register_child_endpoint(
-            CompanyContactsDepartmentsEndpoint(client, parent_endpoint=self)
-        )
-        self.relationships = self._register_child_endpoint(
-            CompanyContactsRelationshipsEndpoint(client, parent_endpoint=self)
-        )
-        self.request_password = self._register_child_endpoint(
-            CompanyContactsRequestpasswordEndpoint(client, parent_endpoint=self)
-        )
-        self.types = self._register_child_endpoint(CompanyContactsTypesEndpoint(client, parent_endpoint=self))
-        self.validate_portal_credentials = self._register_child_endpoint(
-            CompanyContactsValidateportalcredentialsEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyContactsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyContactsIdEndpoint object to move down the chain.
@@ -91,7 +76,7 @@ class CompanyContactsEndpoint(
         Returns:
             list[Contact]: The parsed response data.
         """
-        return self._parse_many(Contact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Contact, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Contact:
         """
@@ -103,4 +88,55 @@ class CompanyContactsEndpoint(
         Returns:
             Contact: The parsed response data.
         """
-        return self._parse_one(Contact, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Contact, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyContactsCountEndpoint:
+        """
+        The CompanyContactsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def default(self) -> CompanyContactsDefaultEndpoint:
+        """
+        The CompanyContactsDefaultEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsDefaultEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def departments(self) -> CompanyContactsDepartmentsEndpoint:
+        """
+        The CompanyContactsDepartmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsDepartmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def relationships(self) -> CompanyContactsRelationshipsEndpoint:
+        """
+        The CompanyContactsRelationshipsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsRelationshipsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def request_password(self) -> CompanyContactsRequestpasswordEndpoint:
+        """
+        The CompanyContactsRequestpasswordEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsRequestpasswordEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> CompanyContactsTypesEndpoint:
+        """
+        The CompanyContactsTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsTypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def validate_portal_credentials(self) -> CompanyContactsValidateportalcredentialsEndpoint:
+        """
+        The CompanyContactsValidateportalcredentialsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContactsValidateportalcredentialsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -38,21 +39,6 @@ class CompanyContactsIdEndpoint(
         IPuttable.__init__(self, Contact)
         IPaginateable.__init__(self, Contact)
 
-        self.communications = self._register_child_endpoint(
-            CompanyContactsIdCommunicationsEndpoint(client, parent_endpoint=self)
-        )
-        self.groups = self._register_child_endpoint(CompanyContactsIdGroupsEndpoint(client, parent_endpoint=self))
-        self.image = self._register_child_endpoint(CompanyContactsIdImageEndpoint(client, parent_endpoint=self))
-        self.notes = self._register_child_endpoint(CompanyContactsIdNotesEndpoint(client, parent_endpoint=self))
-        self.portal_security = self._register_child_endpoint(
-            CompanyContactsIdPortalsecurityEndpoint(client, parent_endpoint=self)
-        )
-        self.tracks = self._register_child_endpoint(CompanyContactsIdTracksEndpoint(client, parent_endpoint=self))
-        self.type_associations = self._register_child_endpoint(
-            CompanyContactsIdTypeassociationsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(CompanyContactsIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Contact]:
@@ -93,7 +79,7 @@ class CompanyContactsIdEndpoint(
         Returns:
             Contact: The parsed response data.
         """
-        return self._parse_one(Contact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Contact, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Contact:
         """
@@ -105,7 +91,7 @@ class CompanyContactsIdEndpoint(
         Returns:
             Contact: The parsed response data.
         """
-        return self._parse_one(Contact, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Contact, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Contact:
         """
@@ -117,4 +103,62 @@ class CompanyContactsIdEndpoint(
         Returns:
             Contact: The parsed response data.
         """
-        return self._parse_one(Contact, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Contact, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def communications(self) -> CompanyContactsIdCommunicationsEndpoint:
+        """
+        The CompanyContactsIdCommunicationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdCommunicationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def groups(self) -> CompanyContactsIdGroupsEndpoint:
+        """
+        The CompanyContactsIdGroupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdGroupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def image(self) -> CompanyContactsIdImageEndpoint:
+        """
+        The CompanyContactsIdImageEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdImageEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notes(self) -> CompanyContactsIdNotesEndpoint:
+        """
+        The CompanyContactsIdNotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdNotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def portal_security(self) -> CompanyContactsIdPortalsecurityEndpoint:
+        """
+        The CompanyContactsIdPortalsecurityEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdPortalsecurityEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tracks(self) -> CompanyContactsIdTracksEndpoint:
+        """
+        The CompanyContactsIdTracksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdTracksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def type_associations(self) -> CompanyContactsIdTypeassociationsEndpoint:
+        """
+        The CompanyContactsIdTypeassociationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContactsIdTypeassociationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> CompanyContactsIdUsagesEndpoint:
+        """
+        The CompanyContactsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdUsagesEndpoint(self.client, parent_endpoint=self))
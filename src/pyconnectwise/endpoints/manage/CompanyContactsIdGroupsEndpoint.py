@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class CompanyContactsIdGroupsEndpoint(
         IPostable.__init__(self, ContactGroup)
         IPaginateable.__init__(self, ContactGroup)
 
-        self.count = self._register_child_endpoint(CompanyContactsIdGroupsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyContactsIdGroupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyContactsIdGroupsIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class CompanyContactsIdGroupsEndpoint(
         Returns:
             list[ContactGroup]: The parsed response data.
         """
-        return self._parse_many(ContactGroup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactGroup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ContactGroup:
         """
@@ -83,4 +82,11 @@ class CompanyContactsIdGroupsEndpoint(
         Returns:
             ContactGroup: The parsed response data.
         """
-        return self._parse_one(ContactGroup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactGroup, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyContactsIdGroupsCountEndpoint:
+        """
+        The CompanyContactsIdGroupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdGroupsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class CompanyContactsIdNotesEndpoint(
         IPostable.__init__(self, ContactNote)
         IPaginateable.__init__(self, ContactNote)
 
-        self.count = self._register_child_endpoint(CompanyContactsIdNotesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyContactsIdNotesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyContactsIdNotesIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class CompanyContactsIdNotesEndpoint(
         Returns:
             list[ContactNote]: The parsed response data.
         """
-        return self._parse_many(ContactNote, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactNote, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ContactNote:
         """
@@ -83,4 +82,11 @@ class CompanyContactsIdNotesEndpoint(
         Returns:
             ContactNote: The parsed response data.
         """
-        return self._parse_one(ContactNote, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactNote, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyContactsIdNotesCountEndpoint:
+        """
+        The CompanyContactsIdNotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdNotesCountEndpoint(self.client, parent_endpoint=self))
@@ -54,4 +54,4 @@ class CompanyContactsIdPortalsecurityEndpoint(
         Returns:
             list[PortalSecurity]: The parsed response data.
         """
-        return self._parse_many(PortalSecurity, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PortalSecurity, super()._make_request("GET", data=data, params=params).content)
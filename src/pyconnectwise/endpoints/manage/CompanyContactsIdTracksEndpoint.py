@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class CompanyContactsIdTracksEndpoint(
         IPostable.__init__(self, ContactTrack)
         IPaginateable.__init__(self, ContactTrack)
 
-        self.count = self._register_child_endpoint(CompanyContactsIdTracksCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyContactsIdTracksIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyContactsIdTracksIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class CompanyContactsIdTracksEndpoint(
         Returns:
             list[ContactTrack]: The parsed response data.
         """
-        return self._parse_many(ContactTrack, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactTrack, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ContactTrack:
         """
@@ -83,4 +82,11 @@ class CompanyContactsIdTracksEndpoint(
         Returns:
             ContactTrack: The parsed response data.
         """
-        return self._parse_one(ContactTrack, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactTrack, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyContactsIdTracksCountEndpoint:
+        """
+        The CompanyContactsIdTracksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdTracksCountEndpoint(self.client, parent_endpoint=self))
@@ -62,4 +62,4 @@ class CompanyContactsIdTracksIdEndpoint(
         Returns:
             ContactTrack: The parsed response data.
         """
-        return self._parse_one(ContactTrack, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ContactTrack, super()._make_request("GET", data=data, params=params).content)
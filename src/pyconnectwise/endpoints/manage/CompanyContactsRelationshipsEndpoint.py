@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class CompanyContactsRelationshipsEndpoint(
         IPostable.__init__(self, ContactRelationship)
         IPaginateable.__init__(self, ContactRelationship)
 
-        self.count = self._register_child_endpoint(
-            CompanyContactsRelationshipsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyContactsRelationshipsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyContactsRelationshipsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class CompanyContactsRelationshipsEndpoint(
         Returns:
             list[ContactRelationship]: The parsed response data.
         """
-        return self._parse_many(ContactRelationship, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactRelationship, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -91,4 +88,13 @@ class CompanyContactsRelationshipsEndpoint(
         Returns:
             ContactRelationship: The parsed response data.
         """
-        return self._parse_one(ContactRelationship, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactRelationship, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyContactsRelationshipsCountEndpoint:
+        """
+        The CompanyContactsRelationshipsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContactsRelationshipsCountEndpoint(self.client, parent_endpoint=self)
+        )
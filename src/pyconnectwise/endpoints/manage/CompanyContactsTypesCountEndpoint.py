@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class CompanyContactsTypesCountEndpoint(
         IGettable.__init__(self, Count)
         IPaginateable.__init__(self, Count)
 
-        self.info = self._register_child_endpoint(CompanyContactsTypesCountInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Count]:
@@ -53,4 +52,11 @@ class CompanyContactsTypesCountEndpoint(
         Returns:
             Count: The parsed response data.
         """
-        return self._parse_one(Count, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Count, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> CompanyContactsTypesCountInfoEndpoint:
+        """
+        The CompanyContactsTypesCountInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsTypesCountInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class CompanyContactsTypesEndpoint(
         IPostable.__init__(self, ContactType)
         IPaginateable.__init__(self, ContactType)
 
-        self.count = self._register_child_endpoint(CompanyContactsTypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(CompanyContactsTypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyContactsTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyContactsTypesIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class CompanyContactsTypesEndpoint(
         Returns:
             list[ContactType]: The parsed response data.
         """
-        return self._parse_many(ContactType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ContactType:
         """
@@ -85,4 +83,18 @@ class CompanyContactsTypesEndpoint(
         Returns:
             ContactType: The parsed response data.
         """
-        return self._parse_one(ContactType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ContactType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyContactsTypesCountEndpoint:
+        """
+        The CompanyContactsTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyContactsTypesInfoEndpoint:
+        """
+        The CompanyContactsTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsTypesInfoEndpoint(self.client, parent_endpoint=self))
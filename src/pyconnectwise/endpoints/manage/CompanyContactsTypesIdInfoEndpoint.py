@@ -52,4 +52,4 @@ class CompanyContactsTypesIdInfoEndpoint(
         Returns:
             ContactTypeInfo: The parsed response data.
         """
-        return self._parse_one(ContactTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ContactTypeInfo, super()._make_request("GET", data=data, params=params).content)
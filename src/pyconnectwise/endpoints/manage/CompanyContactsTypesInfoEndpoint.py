@@ -54,4 +54,4 @@ class CompanyContactsTypesInfoEndpoint(
         Returns:
             list[ContactTypeInfo]: The parsed response data.
         """
-        return self._parse_many(ContactTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ContactTypeInfo, super()._make_request("GET", data=data, params=params).content)
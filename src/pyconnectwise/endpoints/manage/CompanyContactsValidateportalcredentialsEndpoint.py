@@ -28,4 +28,4 @@ class CompanyContactsValidateportalcredentialsEndpoint(
         Returns:
             ValidatePortalResponse: The parsed response data.
         """
-        return self._parse_one(ValidatePortalResponse, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ValidatePortalResponse, super()._make_request("POST", data=data, params=params).content)
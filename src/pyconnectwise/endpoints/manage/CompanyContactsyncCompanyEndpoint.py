@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.CompanyContactsyncCompanyCountEndpoint import (
     CompanyContactsyncCompanyCountEndpoint,
@@ -27,8 +29,6 @@ class CompanyContactsyncCompanyEndpoint(
         IGettable.__init__(self, list[M365ContactSyncCompany])
         IPaginateable.__init__(self, M365ContactSyncCompany)
 
-        self.count = self._register_child_endpoint(CompanyContactsyncCompanyCountEndpoint(client, parent_endpoint=self))
-
     def id(self, id: int) -> CompanyContactsyncCompanyIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized CompanyContactsyncCompanyIdEndpoint object to move down the chain.
@@ -88,7 +88,7 @@ class CompanyContactsyncCompanyEndpoint(
         """
         return self._parse_many(
             M365ContactSyncCompany,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def delete(
@@ -104,3 +104,10 @@ class CompanyContactsyncCompanyEndpoint(
             params (dict[str, int | str]): The parameters to send in the request query string.
         """
         super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def count(self) -> CompanyContactsyncCompanyCountEndpoint:
+        """
+        The CompanyContactsyncCompanyCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsyncCompanyCountEndpoint(self.client, parent_endpoint=self))
@@ -67,5 +67,5 @@ class CompanyContactsyncCompanysyncIdEndpoint(
         """
         return self._parse_one(
             M365ContactSyncCompany,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.CompanyContactsyncCompanyEndpoint import (
     CompanyContactsyncCompanyEndpoint,
@@ -11,7 +13,16 @@ class CompanyContactsyncEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "contactsync", parent_endpoint=parent_endpoint)
 
-        self.company = self._register_child_endpoint(CompanyContactsyncCompanyEndpoint(client, parent_endpoint=self))
-        self.companysync = self._register_child_endpoint(
-            CompanyContactsyncCompanysyncEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def company(self) -> CompanyContactsyncCompanyEndpoint:
+        """
+        The CompanyContactsyncCompanyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsyncCompanyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def companysync(self) -> CompanyContactsyncCompanysyncEndpoint:
+        """
+        The CompanyContactsyncCompanysyncEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsyncCompanysyncEndpoint(self.client, parent_endpoint=self))
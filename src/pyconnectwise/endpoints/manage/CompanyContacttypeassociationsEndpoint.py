@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class CompanyContacttypeassociationsEndpoint(
         IPostable.__init__(self, CompanyContactTypeAssociation)
         IPaginateable.__init__(self, CompanyContactTypeAssociation)
 
-        self.count = self._register_child_endpoint(
-            CompanyContacttypeassociationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyContacttypeassociationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyContacttypeassociationsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class CompanyContacttypeassociationsEndpoint(
             list[CompanyContactTypeAssociation]: The parsed response data.
         """
         return self._parse_many(
-            CompanyContactTypeAssociation, super()._make_request("GET", data=data, params=params).json()
+            CompanyContactTypeAssociation, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class CompanyContacttypeassociationsEndpoint(
             CompanyContactTypeAssociation: The parsed response data.
         """
         return self._parse_one(
-            CompanyContactTypeAssociation, super()._make_request("POST", data=data, params=params).json()
+            CompanyContactTypeAssociation, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyContacttypeassociationsCountEndpoint:
+        """
+        The CompanyContacttypeassociationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContacttypeassociationsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class CompanyCountriesEndpoint(
         IPostable.__init__(self, Country)
         IPaginateable.__init__(self, Country)
 
-        self.count = self._register_child_endpoint(CompanyCountriesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(CompanyCountriesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyCountriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyCountriesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class CompanyCountriesEndpoint(
         Returns:
             list[Country]: The parsed response data.
         """
-        return self._parse_many(Country, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Country, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Country:
         """
@@ -83,4 +81,18 @@ class CompanyCountriesEndpoint(
         Returns:
             Country: The parsed response data.
         """
-        return self._parse_one(Country, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Country, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyCountriesCountEndpoint:
+        """
+        The CompanyCountriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCountriesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyCountriesInfoEndpoint:
+        """
+        The CompanyCountriesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCountriesInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class CompanyCountriesIdInfoEndpoint(
         Returns:
             CountryInfo: The parsed response data.
         """
-        return self._parse_one(CountryInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CountryInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -39,59 +40,200 @@ class CompanyEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "company", parent_endpoint=parent_endpoint)
 
-        self.address_formats = self._register_child_endpoint(
-            CompanyAddressformatsEndpoint(client, parent_endpoint=self)
-        )
-        self.billing_setups = self._register_child_endpoint(CompanyBillingsetupsEndpoint(client, parent_endpoint=self))
-        self.communication_types = self._register_child_endpoint(
-            CompanyCommunicationtypesEndpoint(client, parent_endpoint=self)
-        )
-        self.companies = self._register_child_endpoint(CompanyCompaniesEndpoint(client, parent_endpoint=self))
-        self.company_finance = self._register_child_endpoint(
-            CompanyCompanyfinanceEndpoint(client, parent_endpoint=self)
-        )
-        self.company_picker_items = self._register_child_endpoint(
-            CompanyCompanypickeritemsEndpoint(client, parent_endpoint=self)
-        )
-        self.company_type_associations = self._register_child_endpoint(
-            CompanyCompanytypeassociationsEndpoint(client, parent_endpoint=self)
-        )
-        self.configurations = self._register_child_endpoint(CompanyConfigurationsEndpoint(client, parent_endpoint=self))
-        self.contact_type_associations = self._register_child_endpoint(
-            CompanyContacttypeassociationsEndpoint(client, parent_endpoint=self)
-        )
-        self.contacts = self._register_child_endpoint(CompanyContactsEndpoint(client, parent_endpoint=self))
-        self.countries = self._register_child_endpoint(CompanyCountriesEndpoint(client, parent_endpoint=self))
-        self.entity_types = self._register_child_endpoint(CompanyEntitytypesEndpoint(client, parent_endpoint=self))
-        self.entitytypes = self._register_child_endpoint(CompanyEntitytypesEndpoint(client, parent_endpoint=self))
-        self.expense_types = self._register_child_endpoint(CompanyExpensetypesEndpoint(client, parent_endpoint=self))
-        self.managed_devices_integrations = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsEndpoint(client, parent_endpoint=self)
-        )
-        self.management = self._register_child_endpoint(CompanyManagementEndpoint(client, parent_endpoint=self))
-        self.management_backups = self._register_child_endpoint(
-            CompanyManagementbackupsEndpoint(client, parent_endpoint=self)
-        )
-        self.management_it_solutions = self._register_child_endpoint(
-            CompanyManagementitsolutionsEndpoint(client, parent_endpoint=self)
-        )
-        self.market_descriptions = self._register_child_endpoint(
-            CompanyMarketdescriptionsEndpoint(client, parent_endpoint=self)
-        )
-        self.note_types = self._register_child_endpoint(CompanyNotetypesEndpoint(client, parent_endpoint=self))
-        self.ownership_types = self._register_child_endpoint(
-            CompanyOwnershiptypesEndpoint(client, parent_endpoint=self)
-        )
-        self.payment_types = self._register_child_endpoint(CompanyPaymenttypesEndpoint(client, parent_endpoint=self))
-        self.portal_configurations = self._register_child_endpoint(
-            CompanyPortalconfigurationsEndpoint(client, parent_endpoint=self)
-        )
-        self.portal_security_levels = self._register_child_endpoint(
-            CompanyPortalsecuritylevelsEndpoint(client, parent_endpoint=self)
-        )
-        self.portal_security_settings = self._register_child_endpoint(
-            CompanyPortalsecuritysettingsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def address_formats(self) -> CompanyAddressformatsEndpoint:
+        """
+        The CompanyAddressformatsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyAddressformatsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def billing_setups(self) -> CompanyBillingsetupsEndpoint:
+        """
+        The CompanyBillingsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyBillingsetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def communication_types(self) -> CompanyCommunicationtypesEndpoint:
+        """
+        The CompanyCommunicationtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCommunicationtypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def companies(self) -> CompanyCompaniesEndpoint:
+        """
+        The CompanyCompaniesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def company_finance(self) -> CompanyCompanyfinanceEndpoint:
+        """
+        The CompanyCompanyfinanceEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompanyfinanceEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def company_picker_items(self) -> CompanyCompanypickeritemsEndpoint:
+        """
+        The CompanyCompanypickeritemsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompanypickeritemsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def company_type_associations(self) -> CompanyCompanytypeassociationsEndpoint:
+        """
+        The CompanyCompanytypeassociationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompanytypeassociationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def configurations(self) -> CompanyConfigurationsEndpoint:
+        """
+        The CompanyConfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyConfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def contact_type_associations(self) -> CompanyContacttypeassociationsEndpoint:
+        """
+        The CompanyContacttypeassociationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContacttypeassociationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def contacts(self) -> CompanyContactsEndpoint:
+        """
+        The CompanyContactsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def countries(self) -> CompanyCountriesEndpoint:
+        """
+        The CompanyCountriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCountriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def entity_types(self) -> CompanyEntitytypesEndpoint:
+        """
+        The CompanyEntitytypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyEntitytypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def entitytypes(self) -> CompanyEntitytypesEndpoint:
+        """
+        The CompanyEntitytypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyEntitytypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def expense_types(self) -> CompanyExpensetypesEndpoint:
+        """
+        The CompanyExpensetypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyExpensetypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def managed_devices_integrations(self) -> CompanyManageddevicesintegrationsEndpoint:
+        """
+        The CompanyManageddevicesintegrationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsEndpoint(self.client, parent_endpoint=self)
         )
-        self.states = self._register_child_endpoint(CompanyStatesEndpoint(client, parent_endpoint=self))
-        self.team_roles = self._register_child_endpoint(CompanyTeamrolesEndpoint(client, parent_endpoint=self))
-        self.tracks = self._register_child_endpoint(CompanyTracksEndpoint(client, parent_endpoint=self))
+
+    @cached_property
+    def management(self) -> CompanyManagementEndpoint:
+        """
+        The CompanyManagementEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def management_backups(self) -> CompanyManagementbackupsEndpoint:
+        """
+        The CompanyManagementbackupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementbackupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def management_it_solutions(self) -> CompanyManagementitsolutionsEndpoint:
+        """
+        The CompanyManagementitsolutionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementitsolutionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def market_descriptions(self) -> CompanyMarketdescriptionsEndpoint:
+        """
+        The CompanyMarketdescriptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyMarketdescriptionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def note_types(self) -> CompanyNotetypesEndpoint:
+        """
+        The CompanyNotetypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyNotetypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ownership_types(self) -> CompanyOwnershiptypesEndpoint:
+        """
+        The CompanyOwnershiptypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyOwnershiptypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def payment_types(self) -> CompanyPaymenttypesEndpoint:
+        """
+        The CompanyPaymenttypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyPaymenttypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def portal_configurations(self) -> CompanyPortalconfigurationsEndpoint:
+        """
+        The CompanyPortalconfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyPortalconfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def portal_security_levels(self) -> CompanyPortalsecuritylevelsEndpoint:
+        """
+        The CompanyPortalsecuritylevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyPortalsecuritylevelsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def portal_security_settings(self) -> CompanyPortalsecuritysettingsEndpoint:
+        """
+        The CompanyPortalsecuritysettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyPortalsecuritysettingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def states(self) -> CompanyStatesEndpoint:
+        """
+        The CompanyStatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyStatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def team_roles(self) -> CompanyTeamrolesEndpoint:
+        """
+        The CompanyTeamrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTeamrolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tracks(self) -> CompanyTracksEndpoint:
+        """
+        The CompanyTracksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTracksEndpoint(self.client, parent_endpoint=self))
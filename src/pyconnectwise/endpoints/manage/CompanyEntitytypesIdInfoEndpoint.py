@@ -52,4 +52,4 @@ class CompanyEntitytypesIdInfoEndpoint(
         Returns:
             EntityTypeInfo: The parsed response data.
         """
-        return self._parse_one(EntityTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(EntityTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -54,4 +54,4 @@ class CompanyEntitytypesInfoEndpoint(
         Returns:
             list[EntityTypeInfo]: The parsed response data.
         """
-        return self._parse_many(EntityTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(EntityTypeInfo, super()._make_request("GET", data=data, params=params).content)
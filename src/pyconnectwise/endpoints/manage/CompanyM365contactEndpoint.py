@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.CompanyM365contactCountEndpoint import (
     CompanyM365contactCountEndpoint,
@@ -27,8 +29,6 @@ class CompanyM365contactEndpoint(
         IGettable.__init__(self, list[M365Contact])
         IPaginateable.__init__(self, M365Contact)
 
-        self.count = self._register_child_endpoint(CompanyM365contactCountEndpoint(client, parent_endpoint=self))
-
     def id(self, id: int) -> CompanyM365contactIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized CompanyM365contactIdEndpoint object to move down the chain.
@@ -86,4 +86,11 @@ class CompanyM365contactEndpoint(
         Returns:
             list[M365Contact]: The parsed response data.
         """
-        return self._parse_many(M365Contact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(M365Contact, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyM365contactCountEndpoint:
+        """
+        The CompanyM365contactCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyM365contactCountEndpoint(self.client, parent_endpoint=self))
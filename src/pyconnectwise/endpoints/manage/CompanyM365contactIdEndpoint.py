@@ -65,4 +65,4 @@ class CompanyM365contactIdEndpoint(
         Returns:
             M365Contact: The parsed response data.
         """
-        return self._parse_one(M365Contact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(M365Contact, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.CompanyM365contactsyncIdEndpoint import (
     CompanyM365contactsyncIdEndpoint,
@@ -11,10 +13,6 @@ class CompanyM365contactsyncEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "m365contactsync", parent_endpoint=parent_endpoint)
 
-        self.property = self._register_child_endpoint(
-            CompanyM365contactsyncPropertyEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, id: int) -> CompanyM365contactsyncIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized CompanyM365contactsyncIdEndpoint object to move down the chain.
@@ -27,3 +25,10 @@ class CompanyM365contactsyncEndpoint(ConnectWiseEndpoint):
         child = CompanyM365contactsyncIdEndpoint(self.client, parent_endpoint=self)
         child._id = id
         return child
+
+    @cached_property
+    def property(self) -> CompanyM365contactsyncPropertyEndpoint:
+        """
+        The CompanyM365contactsyncPropertyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyM365contactsyncPropertyEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.CompanyM365contactsyncIdPropertyEndpoint import (
     CompanyM365contactsyncIdPropertyEndpoint,
@@ -8,6 +10,11 @@ class CompanyM365contactsyncIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.property = self._register_child_endpoint(
-            CompanyM365contactsyncIdPropertyEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def property(self) -> CompanyM365contactsyncIdPropertyEndpoint:
+        """
+        The CompanyM365contactsyncIdPropertyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyM365contactsyncIdPropertyEndpoint(self.client, parent_endpoint=self)
         )
@@ -67,5 +67,5 @@ class CompanyM365contactsyncIdPropertyEndpoint(
         """
         return self._parse_one(
             M365ContactSyncProperty,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
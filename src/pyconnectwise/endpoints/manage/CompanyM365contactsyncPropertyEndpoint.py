@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.CompanyM365contactsyncPropertyCountEndpoint import (
     CompanyM365contactsyncPropertyCountEndpoint,
@@ -26,16 +28,6 @@ class CompanyM365contactsyncPropertyEndpoint(
         ConnectWiseEndpoint.__init__(self, client, "property", parent_endpoint=parent_endpoint)
         IPostable.__init__(self, M365ContactSyncProperty)
 
-        self.count = self._register_child_endpoint(
-            CompanyM365contactsyncPropertyCountEndpoint(client, parent_endpoint=self)
-        )
-        self.excluded = self._register_child_endpoint(
-            CompanyM365contactsyncPropertyExcludedEndpoint(client, parent_endpoint=self)
-        )
-        self.included = self._register_child_endpoint(
-            CompanyM365contactsyncPropertyIncludedEndpoint(client, parent_endpoint=self)
-        )
-
     def post(
         self,
         data: JSON | None = None,
@@ -52,5 +44,32 @@ class CompanyM365contactsyncPropertyEndpoint(
         """
         return self._parse_one(
             M365ContactSyncProperty,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
+        )
+
+    @cached_property
+    def count(self) -> CompanyM365contactsyncPropertyCountEndpoint:
+        """
+        The CompanyM365contactsyncPropertyCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyM365contactsyncPropertyCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def excluded(self) -> CompanyM365contactsyncPropertyExcludedEndpoint:
+        """
+        The CompanyM365contactsyncPropertyExcludedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyM365contactsyncPropertyExcludedEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def included(self) -> CompanyM365contactsyncPropertyIncludedEndpoint:
+        """
+        The CompanyM365contactsyncPropertyIncludedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyM365contactsyncPropertyIncludedEndpoint(self.client, parent_endpoint=self)
         )
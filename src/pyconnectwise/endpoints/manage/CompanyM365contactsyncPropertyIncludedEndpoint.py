@@ -67,5 +67,5 @@ class CompanyM365contactsyncPropertyIncludedEndpoint(
         """
         return self._parse_many(
             M365ContactSyncProperty,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
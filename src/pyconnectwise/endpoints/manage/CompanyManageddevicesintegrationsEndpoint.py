@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -31,13 +32,6 @@ class CompanyManageddevicesintegrationsEndpoint(
         IPostable.__init__(self, ManagedDevicesIntegration)
         IPaginateable.__init__(self, ManagedDevicesIntegration)
 
-        self.count = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsCountEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsInfoEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyManageddevicesintegrationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyManageddevicesintegrationsIdEndpoint object to move down the chain.
@@ -86,7 +80,7 @@ class CompanyManageddevicesintegrationsEndpoint(
             list[ManagedDevicesIntegration]: The parsed response data.
         """
         return self._parse_many(
-            ManagedDevicesIntegration, super()._make_request("GET", data=data, params=params).json()
+            ManagedDevicesIntegration, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -102,5 +96,23 @@ class CompanyManageddevicesintegrationsEndpoint(
             ManagedDevicesIntegration: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegration, super()._make_request("POST", data=data, params=params).json()
+            ManagedDevicesIntegration, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyManageddevicesintegrationsCountEndpoint:
+        """
+        The CompanyManageddevicesintegrationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> CompanyManageddevicesintegrationsInfoEndpoint:
+        """
+        The CompanyManageddevicesintegrationsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsInfoEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class CompanyManageddevicesintegrationsIdCrossreferencesEndpoint(
         IPostable.__init__(self, ManagedDevicesIntegrationCrossReference)
         IPaginateable.__init__(self, ManagedDevicesIntegrationCrossReference)
 
-        self.count = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint object to move down the chain.
@@ -85,7 +82,7 @@ class CompanyManageddevicesintegrationsIdCrossreferencesEndpoint(
             list[ManagedDevicesIntegrationCrossReference]: The parsed response data.
         """
         return self._parse_many(
-            ManagedDevicesIntegrationCrossReference, super()._make_request("GET", data=data, params=params).json()
+            ManagedDevicesIntegrationCrossReference, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -101,5 +98,14 @@ class CompanyManageddevicesintegrationsIdCrossreferencesEndpoint(
             ManagedDevicesIntegrationCrossReference: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationCrossReference, super()._make_request("POST", data=data, params=params).json()
+            ManagedDevicesIntegrationCrossReference, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint(self.client, parent_endpoint=self)
         )
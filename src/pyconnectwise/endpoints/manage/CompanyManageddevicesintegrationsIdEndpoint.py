@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -39,22 +40,6 @@ class CompanyManageddevicesintegrationsIdEndpoint(
         IPuttable.__init__(self, ManagedDevicesIntegration)
         IPaginateable.__init__(self, ManagedDevicesIntegration)
 
-        self.cross_references = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdCrossreferencesEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.logins = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdLoginsEndpoint(client, parent_endpoint=self)
-        )
-        self.notifications = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdNotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ManagedDevicesIntegration]:
@@ -99,7 +84,9 @@ class CompanyManageddevicesintegrationsIdEndpoint(
         Returns:
             ManagedDevicesIntegration: The parsed response data.
         """
-        return self._parse_one(ManagedDevicesIntegration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(
+            ManagedDevicesIntegration, super()._make_request("GET", data=data, params=params).content
+        )
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -114,7 +101,7 @@ class CompanyManageddevicesintegrationsIdEndpoint(
             ManagedDevicesIntegration: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegration, super()._make_request("PATCH", data=data, params=params).json()
+            ManagedDevicesIntegration, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -129,4 +116,51 @@ class CompanyManageddevicesintegrationsIdEndpoint(
         Returns:
             ManagedDevicesIntegration: The parsed response data.
         """
-        return self._parse_one(ManagedDevicesIntegration, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(
+            ManagedDevicesIntegration, super()._make_request("PUT", data=data, params=params).content
+        )
+
+    @cached_property
+    def cross_references(self) -> CompanyManageddevicesintegrationsIdCrossreferencesEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdCrossreferencesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdCrossreferencesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> CompanyManageddevicesintegrationsIdInfoEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def logins(self) -> CompanyManageddevicesintegrationsIdLoginsEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdLoginsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdLoginsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def notifications(self) -> CompanyManageddevicesintegrationsIdNotificationsEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdNotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdNotificationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> CompanyManageddevicesintegrationsIdUsagesEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
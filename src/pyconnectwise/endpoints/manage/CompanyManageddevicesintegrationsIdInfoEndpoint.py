@@ -55,5 +55,5 @@ class CompanyManageddevicesintegrationsIdInfoEndpoint(
             ManagedDevicesIntegrationInfo: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationInfo, super()._make_request("GET", data=data, params=params).json()
+            ManagedDevicesIntegrationInfo, super()._make_request("GET", data=data, params=params).content
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class CompanyManageddevicesintegrationsIdLoginsEndpoint(
         IPostable.__init__(self, ManagedDevicesIntegrationLogin)
         IPaginateable.__init__(self, ManagedDevicesIntegrationLogin)
 
-        self.count = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdLoginsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyManageddevicesintegrationsIdLoginsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyManageddevicesintegrationsIdLoginsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class CompanyManageddevicesintegrationsIdLoginsEndpoint(
             list[ManagedDevicesIntegrationLogin]: The parsed response data.
         """
         return self._parse_many(
-            ManagedDevicesIntegrationLogin, super()._make_request("GET", data=data, params=params).json()
+            ManagedDevicesIntegrationLogin, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class CompanyManageddevicesintegrationsIdLoginsEndpoint(
             ManagedDevicesIntegrationLogin: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationLogin, super()._make_request("POST", data=data, params=params).json()
+            ManagedDevicesIntegrationLogin, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyManageddevicesintegrationsIdLoginsCountEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdLoginsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdLoginsCountEndpoint(self.client, parent_endpoint=self)
         )
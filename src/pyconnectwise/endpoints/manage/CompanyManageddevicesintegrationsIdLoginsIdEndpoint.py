@@ -61,7 +61,7 @@ class CompanyManageddevicesintegrationsIdLoginsIdEndpoint(
             ManagedDevicesIntegrationLogin: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationLogin, super()._make_request("DELETE", data=data, params=params).json()
+            ManagedDevicesIntegrationLogin, super()._make_request("DELETE", data=data, params=params).content
         )
 
     def get(
@@ -77,7 +77,7 @@ class CompanyManageddevicesintegrationsIdLoginsIdEndpoint(
             ManagedDevicesIntegrationLogin: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationLogin, super()._make_request("GET", data=data, params=params).json()
+            ManagedDevicesIntegrationLogin, super()._make_request("GET", data=data, params=params).content
         )
 
     def patch(
@@ -93,7 +93,7 @@ class CompanyManageddevicesintegrationsIdLoginsIdEndpoint(
             ManagedDevicesIntegrationLogin: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationLogin, super()._make_request("PATCH", data=data, params=params).json()
+            ManagedDevicesIntegrationLogin, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -109,5 +109,5 @@ class CompanyManageddevicesintegrationsIdLoginsIdEndpoint(
             ManagedDevicesIntegrationLogin: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationLogin, super()._make_request("PUT", data=data, params=params).json()
+            ManagedDevicesIntegrationLogin, super()._make_request("PUT", data=data, params=params).content
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class CompanyManageddevicesintegrationsIdNotificationsEndpoint(
         IPostable.__init__(self, ManagedDevicesIntegrationNotification)
         IPaginateable.__init__(self, ManagedDevicesIntegrationNotification)
 
-        self.count = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsIdNotificationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyManageddevicesintegrationsIdNotificationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyManageddevicesintegrationsIdNotificationsIdEndpoint object to move down the chain.
@@ -85,7 +82,7 @@ class CompanyManageddevicesintegrationsIdNotificationsEndpoint(
             list[ManagedDevicesIntegrationNotification]: The parsed response data.
         """
         return self._parse_many(
-            ManagedDevicesIntegrationNotification, super()._make_request("GET", data=data, params=params).json()
+            ManagedDevicesIntegrationNotification, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -101,5 +98,14 @@ class CompanyManageddevicesintegrationsIdNotificationsEndpoint(
             ManagedDevicesIntegrationNotification: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationNotification, super()._make_request("POST", data=data, params=params).json()
+            ManagedDevicesIntegrationNotification, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyManageddevicesintegrationsIdNotificationsCountEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdNotificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdNotificationsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -66,7 +66,7 @@ class CompanyManageddevicesintegrationsIdNotificationsIdEndpoint(
             ManagedDevicesIntegrationNotification: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationNotification, super()._make_request("DELETE", data=data, params=params).json()
+            ManagedDevicesIntegrationNotification, super()._make_request("DELETE", data=data, params=params).content
         )
 
     def get(
@@ -82,7 +82,7 @@ class CompanyManageddevicesintegrationsIdNotificationsIdEndpoint(
             ManagedDevicesIntegrationNotification: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationNotification, super()._make_request("GET", data=data, params=params).json()
+            ManagedDevicesIntegrationNotification, super()._make_request("GET", data=data, params=params).content
         )
 
     def patch(
@@ -98,7 +98,7 @@ class CompanyManageddevicesintegrationsIdNotificationsIdEndpoint(
             ManagedDevicesIntegrationNotification: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationNotification, super()._make_request("PATCH", data=data, params=params).json()
+            ManagedDevicesIntegrationNotification, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -114,5 +114,5 @@ class CompanyManageddevicesintegrationsIdNotificationsIdEndpoint(
             ManagedDevicesIntegrationNotification: The parsed response data.
         """
         return self._parse_one(
-            ManagedDevicesIntegrationNotification, super()._make_request("PUT", data=data, params=params).json()
+            ManagedDevicesIntegrationNotification, super()._make_request("PUT", data=data, params=params).content
         )
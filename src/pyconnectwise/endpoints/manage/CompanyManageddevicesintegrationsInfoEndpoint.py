@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class CompanyManageddevicesintegrationsInfoEndpoint(
         IGettable.__init__(self, list[ManagedDevicesIntegrationInfo])
         IPaginateable.__init__(self, ManagedDevicesIntegrationInfo)
 
-        self.count = self._register_child_endpoint(
-            CompanyManageddevicesintegrationsInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ManagedDevicesIntegrationInfo]:
@@ -62,5 +59,14 @@ class CompanyManageddevicesintegrationsInfoEndpoint(
             list[ManagedDevicesIntegrationInfo]: The parsed response data.
         """
         return self._parse_many(
-            ManagedDevicesIntegrationInfo, super()._make_request("GET", data=data, params=params).json()
+            ManagedDevicesIntegrationInfo, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyManageddevicesintegrationsInfoCountEndpoint:
+        """
+        The CompanyManageddevicesintegrationsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsInfoCountEndpoint(self.client, parent_endpoint=self)
         )
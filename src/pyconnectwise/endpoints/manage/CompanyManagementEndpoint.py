@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class CompanyManagementEndpoint(
         IGettable.__init__(self, list[Management])
         IPaginateable.__init__(self, Management)
 
-        self.count = self._register_child_endpoint(CompanyManagementCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyManagementIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyManagementIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class CompanyManagementEndpoint(
         Returns:
             list[Management]: The parsed response data.
         """
-        return self._parse_many(Management, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Management, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyManagementCountEndpoint:
+        """
+        The CompanyManagementCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -32,15 +33,6 @@ class CompanyManagementIdEndpoint(
         IPuttable.__init__(self, Management)
         IPaginateable.__init__(self, Management)
 
-        self.execute_managed_it_sync = self._register_child_endpoint(
-            CompanyManagementIdExecutemanageditsyncEndpoint(client, parent_endpoint=self)
-        )
-        self.log = self._register_child_endpoint(CompanyManagementIdLogEndpoint(client, parent_endpoint=self))
-        self.logs = self._register_child_endpoint(CompanyManagementIdLogsEndpoint(client, parent_endpoint=self))
-        self.management_report_notifications = self._register_child_endpoint(
-            CompanyManagementIdManagementreportnotificationsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Management]:
@@ -71,7 +63,7 @@ class CompanyManagementIdEndpoint(
         Returns:
             Management: The parsed response data.
         """
-        return self._parse_one(Management, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Management, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Management:
         """
@@ -83,7 +75,7 @@ class CompanyManagementIdEndpoint(
         Returns:
             Management: The parsed response data.
         """
-        return self._parse_one(Management, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Management, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Management:
         """
@@ -95,4 +87,36 @@ class CompanyManagementIdEndpoint(
         Returns:
             Management: The parsed response data.
         """
-        return self._parse_one(Management, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Management, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def execute_managed_it_sync(self) -> CompanyManagementIdExecutemanageditsyncEndpoint:
+        """
+        The CompanyManagementIdExecutemanageditsyncEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManagementIdExecutemanageditsyncEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def log(self) -> CompanyManagementIdLogEndpoint:
+        """
+        The CompanyManagementIdLogEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementIdLogEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def logs(self) -> CompanyManagementIdLogsEndpoint:
+        """
+        The CompanyManagementIdLogsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementIdLogsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def management_report_notifications(self) -> CompanyManagementIdManagementreportnotificationsEndpoint:
+        """
+        The CompanyManagementIdManagementreportnotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManagementIdManagementreportnotificationsEndpoint(self.client, parent_endpoint=self)
+        )
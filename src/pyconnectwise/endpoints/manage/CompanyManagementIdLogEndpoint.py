@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -11,6 +12,9 @@ class CompanyManagementIdLogEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "log", parent_endpoint=parent_endpoint)
 
-        self.download = self._register_child_endpoint(
-            CompanyManagementIdLogDownloadEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def download(self) -> CompanyManagementIdLogDownloadEndpoint:
+        """
+        The CompanyManagementIdLogDownloadEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementIdLogDownloadEndpoint(self.client, parent_endpoint=self))
@@ -55,5 +55,5 @@ class CompanyManagementIdLogsEndpoint(
             list[ManagementLogDocumentInfo]: The parsed response data.
         """
         return self._parse_many(
-            ManagementLogDocumentInfo, super()._make_request("GET", data=data, params=params).json()
+            ManagementLogDocumentInfo, super()._make_request("GET", data=data, params=params).content
         )
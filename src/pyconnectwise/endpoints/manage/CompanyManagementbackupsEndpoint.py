@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class CompanyManagementbackupsEndpoint(
         IPostable.__init__(self, ManagementBackup)
         IPaginateable.__init__(self, ManagementBackup)
 
-        self.count = self._register_child_endpoint(CompanyManagementbackupsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyManagementbackupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyManagementbackupsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class CompanyManagementbackupsEndpoint(
         Returns:
             list[ManagementBackup]: The parsed response data.
         """
-        return self._parse_many(ManagementBackup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ManagementBackup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ManagementBackup:
         """
@@ -85,4 +84,11 @@ class CompanyManagementbackupsEndpoint(
         Returns:
             ManagementBackup: The parsed response data.
         """
-        return self._parse_one(ManagementBackup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ManagementBackup, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyManagementbackupsCountEndpoint:
+        """
+        The CompanyManagementbackupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementbackupsCountEndpoint(self.client, parent_endpoint=self))
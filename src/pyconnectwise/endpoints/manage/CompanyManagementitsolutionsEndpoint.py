@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class CompanyManagementitsolutionsEndpoint(
         IPostable.__init__(self, ManagementItSolution)
         IPaginateable.__init__(self, ManagementItSolution)
 
-        self.count = self._register_child_endpoint(
-            CompanyManagementitsolutionsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyManagementitsolutionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyManagementitsolutionsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class CompanyManagementitsolutionsEndpoint(
         Returns:
             list[ManagementItSolution]: The parsed response data.
         """
-        return self._parse_many(ManagementItSolution, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ManagementItSolution, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -91,4 +88,13 @@ class CompanyManagementitsolutionsEndpoint(
         Returns:
             ManagementItSolution: The parsed response data.
         """
-        return self._parse_one(ManagementItSolution, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ManagementItSolution, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyManagementitsolutionsCountEndpoint:
+        """
+        The CompanyManagementitsolutionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManagementitsolutionsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -30,13 +31,6 @@ class CompanyManagementitsolutionsIdEndpoint(
         IPuttable.__init__(self, ManagementItSolution)
         IPaginateable.__init__(self, ManagementItSolution)
 
-        self.management_products = self._register_child_endpoint(
-            CompanyManagementitsolutionsIdManagementproductsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            CompanyManagementitsolutionsIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ManagementItSolution]:
@@ -81,7 +75,7 @@ class CompanyManagementitsolutionsIdEndpoint(
         Returns:
             ManagementItSolution: The parsed response data.
         """
-        return self._parse_one(ManagementItSolution, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ManagementItSolution, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -95,7 +89,7 @@ class CompanyManagementitsolutionsIdEndpoint(
         Returns:
             ManagementItSolution: The parsed response data.
         """
-        return self._parse_one(ManagementItSolution, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ManagementItSolution, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -109,4 +103,22 @@ class CompanyManagementitsolutionsIdEndpoint(
         Returns:
             ManagementItSolution: The parsed response data.
         """
-        return self._parse_one(ManagementItSolution, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ManagementItSolution, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def management_products(self) -> CompanyManagementitsolutionsIdManagementproductsEndpoint:
+        """
+        The CompanyManagementitsolutionsIdManagementproductsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManagementitsolutionsIdManagementproductsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> CompanyManagementitsolutionsIdUsagesEndpoint:
+        """
+        The CompanyManagementitsolutionsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManagementitsolutionsIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
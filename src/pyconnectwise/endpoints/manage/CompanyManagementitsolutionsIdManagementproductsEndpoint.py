@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class CompanyManagementitsolutionsIdManagementproductsEndpoint(
         IPostable.__init__(self, ManagementItSolutionAgreementInterfaceParameter)
         IPaginateable.__init__(self, ManagementItSolutionAgreementInterfaceParameter)
 
-        self.count = self._register_child_endpoint(
-            CompanyManagementitsolutionsIdManagementproductsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyManagementitsolutionsIdManagementproductsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyManagementitsolutionsIdManagementproductsIdEndpoint object to move down the chain.
@@ -86,7 +83,7 @@ class CompanyManagementitsolutionsIdManagementproductsEndpoint(
         """
         return self._parse_many(
             ManagementItSolutionAgreementInterfaceParameter,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -103,5 +100,14 @@ class CompanyManagementitsolutionsIdManagementproductsEndpoint(
         """
         return self._parse_one(
             ManagementItSolutionAgreementInterfaceParameter,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
+        )
+
+    @cached_property
+    def count(self) -> CompanyManagementitsolutionsIdManagementproductsCountEndpoint:
+        """
+        The CompanyManagementitsolutionsIdManagementproductsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManagementitsolutionsIdManagementproductsCountEndpoint(self.client, parent_endpoint=self)
         )
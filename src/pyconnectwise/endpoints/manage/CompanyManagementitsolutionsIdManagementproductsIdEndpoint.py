@@ -67,7 +67,7 @@ class CompanyManagementitsolutionsIdManagementproductsIdEndpoint(
         """
         return self._parse_one(
             ManagementItSolutionAgreementInterfaceParameter,
-            super()._make_request("DELETE", data=data, params=params).json(),
+            super()._make_request("DELETE", data=data, params=params).content,
         )
 
     def get(
@@ -84,7 +84,7 @@ class CompanyManagementitsolutionsIdManagementproductsIdEndpoint(
         """
         return self._parse_one(
             ManagementItSolutionAgreementInterfaceParameter,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def patch(
@@ -101,7 +101,7 @@ class CompanyManagementitsolutionsIdManagementproductsIdEndpoint(
         """
         return self._parse_one(
             ManagementItSolutionAgreementInterfaceParameter,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
 
     def put(
@@ -118,5 +118,5 @@ class CompanyManagementitsolutionsIdManagementproductsIdEndpoint(
         """
         return self._parse_one(
             ManagementItSolutionAgreementInterfaceParameter,
-            super()._make_request("PUT", data=data, params=params).json(),
+            super()._make_request("PUT", data=data, params=params).content,
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class CompanyMarketdescriptionsEndpoint(
         IPostable.__init__(self, MarketDescription)
         IPaginateable.__init__(self, MarketDescription)
 
-        self.count = self._register_child_endpoint(CompanyMarketdescriptionsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(CompanyMarketdescriptionsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyMarketdescriptionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyMarketdescriptionsIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class CompanyMarketdescriptionsEndpoint(
         Returns:
             list[MarketDescription]: The parsed response data.
         """
-        return self._parse_many(MarketDescription, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MarketDescription, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MarketDescription:
         """
@@ -87,4 +85,18 @@ class CompanyMarketdescriptionsEndpoint(
         Returns:
             MarketDescription: The parsed response data.
         """
-        return self._parse_one(MarketDescription, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MarketDescription, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyMarketdescriptionsCountEndpoint:
+        """
+        The CompanyMarketdescriptionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyMarketdescriptionsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyMarketdescriptionsInfoEndpoint:
+        """
+        The CompanyMarketdescriptionsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyMarketdescriptionsInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -30,11 +31,6 @@ class CompanyMarketdescriptionsIdEndpoint(
         IPuttable.__init__(self, MarketDescription)
         IPaginateable.__init__(self, MarketDescription)
 
-        self.info = self._register_child_endpoint(CompanyMarketdescriptionsIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(
-            CompanyMarketdescriptionsIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[MarketDescription]:
@@ -77,7 +73,7 @@ class CompanyMarketdescriptionsIdEndpoint(
         Returns:
             MarketDescription: The parsed response data.
         """
-        return self._parse_one(MarketDescription, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MarketDescription, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> MarketDescription:
         """
@@ -89,7 +85,7 @@ class CompanyMarketdescriptionsIdEndpoint(
         Returns:
             MarketDescription: The parsed response data.
         """
-        return self._parse_one(MarketDescription, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(MarketDescription, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MarketDescription:
         """
@@ -101,4 +97,20 @@ class CompanyMarketdescriptionsIdEndpoint(
         Returns:
             MarketDescription: The parsed response data.
         """
-        return self._parse_one(MarketDescription, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(MarketDescription, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> CompanyMarketdescriptionsIdInfoEndpoint:
+        """
+        The CompanyMarketdescriptionsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyMarketdescriptionsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> CompanyMarketdescriptionsIdUsagesEndpoint:
+        """
+        The CompanyMarketdescriptionsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyMarketdescriptionsIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
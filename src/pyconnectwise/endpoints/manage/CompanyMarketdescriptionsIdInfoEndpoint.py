@@ -54,4 +54,4 @@ class CompanyMarketdescriptionsIdInfoEndpoint(
         Returns:
             MarketDescriptionInfo: The parsed response data.
         """
-        return self._parse_one(MarketDescriptionInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MarketDescriptionInfo, super()._make_request("GET", data=data, params=params).content)
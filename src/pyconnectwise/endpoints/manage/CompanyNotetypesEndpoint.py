@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class CompanyNotetypesEndpoint(
         IPostable.__init__(self, CompanyNoteType)
         IPaginateable.__init__(self, CompanyNoteType)
 
-        self.count = self._register_child_endpoint(CompanyNotetypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(CompanyNotetypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyNotetypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyNotetypesIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class CompanyNotetypesEndpoint(
         Returns:
             list[CompanyNoteType]: The parsed response data.
         """
-        return self._parse_many(CompanyNoteType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyNoteType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanyNoteType:
         """
@@ -87,4 +85,18 @@ class CompanyNotetypesEndpoint(
         Returns:
             CompanyNoteType: The parsed response data.
         """
-        return self._parse_one(CompanyNoteType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CompanyNoteType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyNotetypesCountEndpoint:
+        """
+        The CompanyNotetypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyNotetypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyNotetypesInfoEndpoint:
+        """
+        The CompanyNotetypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyNotetypesInfoEndpoint(self.client, parent_endpoint=self))
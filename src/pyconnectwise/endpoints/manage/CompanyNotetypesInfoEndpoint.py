@@ -54,4 +54,4 @@ class CompanyNotetypesInfoEndpoint(
         Returns:
             list[CompanyNoteTypeInfo]: The parsed response data.
         """
-        return self._parse_many(CompanyNoteTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CompanyNoteTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class CompanyOwnershiptypesEndpoint(
         IPostable.__init__(self, OwnershipType)
         IPaginateable.__init__(self, OwnershipType)
 
-        self.count = self._register_child_endpoint(CompanyOwnershiptypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(CompanyOwnershiptypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyOwnershiptypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyOwnershiptypesIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class CompanyOwnershiptypesEndpoint(
         Returns:
             list[OwnershipType]: The parsed response data.
         """
-        return self._parse_many(OwnershipType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OwnershipType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> OwnershipType:
         """
@@ -87,4 +85,18 @@ class CompanyOwnershiptypesEndpoint(
         Returns:
             OwnershipType: The parsed response data.
         """
-        return self._parse_one(OwnershipType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(OwnershipType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyOwnershiptypesCountEndpoint:
+        """
+        The CompanyOwnershiptypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyOwnershiptypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyOwnershiptypesInfoEndpoint:
+        """
+        The CompanyOwnershiptypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyOwnershiptypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class CompanyOwnershiptypesIdEndpoint(
         IPuttable.__init__(self, OwnershipType)
         IPaginateable.__init__(self, OwnershipType)
 
-        self.info = self._register_child_endpoint(CompanyOwnershiptypesIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[OwnershipType]:
@@ -69,7 +68,7 @@ class CompanyOwnershiptypesIdEndpoint(
         Returns:
             OwnershipType: The parsed response data.
         """
-        return self._parse_one(OwnershipType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OwnershipType, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> OwnershipType:
         """
@@ -81,7 +80,7 @@ class CompanyOwnershiptypesIdEndpoint(
         Returns:
             OwnershipType: The parsed response data.
         """
-        return self._parse_one(OwnershipType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(OwnershipType, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> OwnershipType:
         """
@@ -93,4 +92,11 @@ class CompanyOwnershiptypesIdEndpoint(
         Returns:
             OwnershipType: The parsed response data.
         """
-        return self._parse_one(OwnershipType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(OwnershipType, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> CompanyOwnershiptypesIdInfoEndpoint:
+        """
+        The CompanyOwnershiptypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyOwnershiptypesIdInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class CompanyOwnershiptypesIdInfoEndpoint(
         Returns:
             OwnershipTypeInfo: The parsed response data.
         """
-        return self._parse_one(OwnershipTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OwnershipTypeInfo, super()._make_request("GET", data=data, params=params).content)
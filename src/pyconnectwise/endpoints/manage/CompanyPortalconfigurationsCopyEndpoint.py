@@ -28,4 +28,4 @@ class CompanyPortalconfigurationsCopyEndpoint(
         Returns:
             PortalConfiguration: The parsed response data.
         """
-        return self._parse_one(PortalConfiguration, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PortalConfiguration, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -32,14 +33,6 @@ class CompanyPortalconfigurationsEndpoint(
         IPostable.__init__(self, PortalConfiguration)
         IPaginateable.__init__(self, PortalConfiguration)
 
-        self.copy = self._register_child_endpoint(CompanyPortalconfigurationsCopyEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(
-            CompanyPortalconfigurationsCountEndpoint(client, parent_endpoint=self)
-        )
-        self.invoice_setup = self._register_child_endpoint(
-            CompanyPortalconfigurationsInvoicesetupEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyPortalconfigurationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsIdEndpoint object to move down the chain.
@@ -87,7 +80,7 @@ class CompanyPortalconfigurationsEndpoint(
         Returns:
             list[PortalConfiguration]: The parsed response data.
         """
-        return self._parse_many(PortalConfiguration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PortalConfiguration, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -101,4 +94,29 @@ class CompanyPortalconfigurationsEndpoint(
         Returns:
             PortalConfiguration: The parsed response data.
         """
-        return self._parse_one(PortalConfiguration, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PortalConfiguration, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> CompanyPortalconfigurationsCopyEndpoint:
+        """
+        The CompanyPortalconfigurationsCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyPortalconfigurationsCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def count(self) -> CompanyPortalconfigurationsCountEndpoint:
+        """
+        The CompanyPortalconfigurationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def invoice_setup(self) -> CompanyPortalconfigurationsInvoicesetupEndpoint:
+        """
+        The CompanyPortalconfigurationsInvoicesetupEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsInvoicesetupEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -39,22 +40,6 @@ class CompanyPortalconfigurationsIdEndpoint(
         IPuttable.__init__(self, PortalConfiguration)
         IPaginateable.__init__(self, PortalConfiguration)
 
-        self.invoice_setups = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdInvoicesetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.opportunity_setups = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdOpportunitysetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.password_email_setups = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.project_setups = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdProjectsetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.service_setups = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdServicesetupsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[PortalConfiguration]:
@@ -99,7 +84,7 @@ class CompanyPortalconfigurationsIdEndpoint(
         Returns:
             PortalConfiguration: The parsed response data.
         """
-        return self._parse_one(PortalConfiguration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(PortalConfiguration, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -113,7 +98,7 @@ class CompanyPortalconfigurationsIdEndpoint(
         Returns:
             PortalConfiguration: The parsed response data.
         """
-        return self._parse_one(PortalConfiguration, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(PortalConfiguration, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -127,4 +112,49 @@ class CompanyPortalconfigurationsIdEndpoint(
         Returns:
             PortalConfiguration: The parsed response data.
         """
-        return self._parse_one(PortalConfiguration, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(PortalConfiguration, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def invoice_setups(self) -> CompanyPortalconfigurationsIdInvoicesetupsEndpoint:
+        """
+        The CompanyPortalconfigurationsIdInvoicesetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdInvoicesetupsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def opportunity_setups(self) -> CompanyPortalconfigurationsIdOpportunitysetupsEndpoint:
+        """
+        The CompanyPortalconfigurationsIdOpportunitysetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdOpportunitysetupsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def password_email_setups(self) -> CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint:
+        """
+        The CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def project_setups(self) -> CompanyPortalconfigurationsIdProjectsetupsEndpoint:
+        """
+        The CompanyPortalconfigurationsIdProjectsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdProjectsetupsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def service_setups(self) -> CompanyPortalconfigurationsIdServicesetupsEndpoint:
+        """
+        The CompanyPortalconfigurationsIdServicesetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdServicesetupsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class CompanyPortalconfigurationsIdInvoicesetupsEndpoint(
         IGettable.__init__(self, list[PortalConfigurationInvoiceSetup])
         IPaginateable.__init__(self, PortalConfigurationInvoiceSetup)
 
-        self.count = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdInvoicesetupsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyPortalconfigurationsIdInvoicesetupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsIdInvoicesetupsIdEndpoint object to move down the chain.
@@ -78,5 +75,14 @@ class CompanyPortalconfigurationsIdInvoicesetupsEndpoint(
             list[PortalConfigurationInvoiceSetup]: The parsed response data.
         """
         return self._parse_many(
-            PortalConfigurationInvoiceSetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationInvoiceSetup, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyPortalconfigurationsIdInvoicesetupsCountEndpoint:
+        """
+        The CompanyPortalconfigurationsIdInvoicesetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdInvoicesetupsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class CompanyPortalconfigurationsIdInvoicesetupsIdEndpoint(
         IPuttable.__init__(self, PortalConfigurationInvoiceSetup)
         IPaginateable.__init__(self, PortalConfigurationInvoiceSetup)
 
-        self.test_transaction = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdInvoicesetupsIdTesttransactionEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[PortalConfigurationInvoiceSetup]:
@@ -66,7 +63,7 @@ class CompanyPortalconfigurationsIdInvoicesetupsIdEndpoint(
             PortalConfigurationInvoiceSetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationInvoiceSetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationInvoiceSetup, super()._make_request("GET", data=data, params=params).content
         )
 
     def patch(
@@ -82,7 +79,7 @@ class CompanyPortalconfigurationsIdInvoicesetupsIdEndpoint(
             PortalConfigurationInvoiceSetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationInvoiceSetup, super()._make_request("PATCH", data=data, params=params).json()
+            PortalConfigurationInvoiceSetup, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -98,5 +95,14 @@ class CompanyPortalconfigurationsIdInvoicesetupsIdEndpoint(
             PortalConfigurationInvoiceSetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationInvoiceSetup, super()._make_request("PUT", data=data, params=params).json()
+            PortalConfigurationInvoiceSetup, super()._make_request("PUT", data=data, params=params).content
+        )
+
+    @cached_property
+    def test_transaction(self) -> CompanyPortalconfigurationsIdInvoicesetupsIdTesttransactionEndpoint:
+        """
+        The CompanyPortalconfigurationsIdInvoicesetupsIdTesttransactionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdInvoicesetupsIdTesttransactionEndpoint(self.client, parent_endpoint=self)
         )
@@ -26,4 +26,4 @@ class CompanyPortalconfigurationsIdInvoicesetupsIdTesttransactionEndpoint(
         Returns:
             SuccessResponse: The parsed response data.
         """
-        return self._parse_one(SuccessResponse, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SuccessResponse, super()._make_request("POST", data=data, params=params).content)
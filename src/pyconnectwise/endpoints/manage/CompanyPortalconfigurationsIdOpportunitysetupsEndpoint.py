@@ -80,7 +80,7 @@ class CompanyPortalconfigurationsIdOpportunitysetupsEndpoint(
             list[PortalConfigurationOpportunitySetup]: The parsed response data.
         """
         return self._parse_many(
-            PortalConfigurationOpportunitySetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationOpportunitySetup, super()._make_request("GET", data=data, params=params).content
         )
 
     def patch(
@@ -96,7 +96,7 @@ class CompanyPortalconfigurationsIdOpportunitysetupsEndpoint(
             PortalConfigurationOpportunitySetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationOpportunitySetup, super()._make_request("PATCH", data=data, params=params).json()
+            PortalConfigurationOpportunitySetup, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -112,5 +112,5 @@ class CompanyPortalconfigurationsIdOpportunitysetupsEndpoint(
             PortalConfigurationOpportunitySetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationOpportunitySetup, super()._make_request("PUT", data=data, params=params).json()
+            PortalConfigurationOpportunitySetup, super()._make_request("PUT", data=data, params=params).content
         )
@@ -64,7 +64,7 @@ class CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint(
             PortalConfigurationOpportunitySetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationOpportunitySetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationOpportunitySetup, super()._make_request("GET", data=data, params=params).content
         )
 
     def patch(
@@ -80,7 +80,7 @@ class CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint(
             PortalConfigurationOpportunitySetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationOpportunitySetup, super()._make_request("PATCH", data=data, params=params).json()
+            PortalConfigurationOpportunitySetup, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -96,5 +96,5 @@ class CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint(
             PortalConfigurationOpportunitySetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationOpportunitySetup, super()._make_request("PUT", data=data, params=params).json()
+            PortalConfigurationOpportunitySetup, super()._make_request("PUT", data=data, params=params).content
         )
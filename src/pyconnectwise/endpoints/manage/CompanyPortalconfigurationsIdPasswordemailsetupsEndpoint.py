@@ -76,5 +76,5 @@ class CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint(
             list[PortalConfigurationPasswordEmailSetup]: The parsed response data.
         """
         return self._parse_many(
-            PortalConfigurationPasswordEmailSetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationPasswordEmailSetup, super()._make_request("GET", data=data, params=params).content
         )
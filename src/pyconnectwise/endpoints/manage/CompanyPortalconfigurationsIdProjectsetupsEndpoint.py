@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class CompanyPortalconfigurationsIdProjectsetupsEndpoint(
         IGettable.__init__(self, list[PortalConfigurationProjectSetup])
         IPaginateable.__init__(self, PortalConfigurationProjectSetup)
 
-        self.count = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdProjectsetupsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyPortalconfigurationsIdProjectsetupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsIdProjectsetupsIdEndpoint object to move down the chain.
@@ -78,5 +75,14 @@ class CompanyPortalconfigurationsIdProjectsetupsEndpoint(
             list[PortalConfigurationProjectSetup]: The parsed response data.
         """
         return self._parse_many(
-            PortalConfigurationProjectSetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationProjectSetup, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyPortalconfigurationsIdProjectsetupsCountEndpoint:
+        """
+        The CompanyPortalconfigurationsIdProjectsetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdProjectsetupsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -59,7 +59,7 @@ class CompanyPortalconfigurationsIdProjectsetupsIdEndpoint(
             PortalConfigurationProjectSetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationProjectSetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationProjectSetup, super()._make_request("GET", data=data, params=params).content
         )
 
     def patch(
@@ -75,7 +75,7 @@ class CompanyPortalconfigurationsIdProjectsetupsIdEndpoint(
             PortalConfigurationProjectSetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationProjectSetup, super()._make_request("PATCH", data=data, params=params).json()
+            PortalConfigurationProjectSetup, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -91,5 +91,5 @@ class CompanyPortalconfigurationsIdProjectsetupsIdEndpoint(
             PortalConfigurationProjectSetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationProjectSetup, super()._make_request("PUT", data=data, params=params).json()
+            PortalConfigurationProjectSetup, super()._make_request("PUT", data=data, params=params).content
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class CompanyPortalconfigurationsIdServicesetupsEndpoint(
         IGettable.__init__(self, list[PortalConfigurationServiceSetup])
         IPaginateable.__init__(self, PortalConfigurationServiceSetup)
 
-        self.count = self._register_child_endpoint(
-            CompanyPortalconfigurationsIdServicesetupsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyPortalconfigurationsIdServicesetupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsIdServicesetupsIdEndpoint object to move down the chain.
@@ -78,5 +75,14 @@ class CompanyPortalconfigurationsIdServicesetupsEndpoint(
             list[PortalConfigurationServiceSetup]: The parsed response data.
         """
         return self._parse_many(
-            PortalConfigurationServiceSetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationServiceSetup, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyPortalconfigurationsIdServicesetupsCountEndpoint:
+        """
+        The CompanyPortalconfigurationsIdServicesetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdServicesetupsCountEndpoint(self.client, parent_endpoint=self)
         )
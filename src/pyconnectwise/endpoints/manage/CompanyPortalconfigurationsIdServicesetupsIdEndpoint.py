@@ -59,7 +59,7 @@ class CompanyPortalconfigurationsIdServicesetupsIdEndpoint(
             PortalConfigurationServiceSetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationServiceSetup, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationServiceSetup, super()._make_request("GET", data=data, params=params).content
         )
 
     def patch(
@@ -75,7 +75,7 @@ class CompanyPortalconfigurationsIdServicesetupsIdEndpoint(
             PortalConfigurationServiceSetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationServiceSetup, super()._make_request("PATCH", data=data, params=params).json()
+            PortalConfigurationServiceSetup, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -91,5 +91,5 @@ class CompanyPortalconfigurationsIdServicesetupsIdEndpoint(
             PortalConfigurationServiceSetup: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationServiceSetup, super()._make_request("PUT", data=data, params=params).json()
+            PortalConfigurationServiceSetup, super()._make_request("PUT", data=data, params=params).content
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint(
         IGettable.__init__(self, list[PortalConfigurationPaymentProcessor])
         IPaginateable.__init__(self, PortalConfigurationPaymentProcessor)
 
-        self.count = self._register_child_endpoint(
-            CompanyPortalconfigurationsInvoicesetupPaymentprocessorsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint object to move down the chain.
@@ -83,5 +80,14 @@ class CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint(
             list[PortalConfigurationPaymentProcessor]: The parsed response data.
         """
         return self._parse_many(
-            PortalConfigurationPaymentProcessor, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationPaymentProcessor, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyPortalconfigurationsInvoicesetupPaymentprocessorsCountEndpoint:
+        """
+        The CompanyPortalconfigurationsInvoicesetupPaymentprocessorsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsInvoicesetupPaymentprocessorsCountEndpoint(self.client, parent_endpoint=self)
         )
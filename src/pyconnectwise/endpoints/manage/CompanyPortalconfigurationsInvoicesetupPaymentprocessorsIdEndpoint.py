@@ -60,5 +60,5 @@ class CompanyPortalconfigurationsInvoicesetupPaymentprocessorsIdEndpoint(
             PortalConfigurationPaymentProcessor: The parsed response data.
         """
         return self._parse_one(
-            PortalConfigurationPaymentProcessor, super()._make_request("GET", data=data, params=params).json()
+            PortalConfigurationPaymentProcessor, super()._make_request("GET", data=data, params=params).content
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,10 +25,6 @@ class CompanyPortalsecuritylevelsEndpoint(
         IGettable.__init__(self, list[PortalSecurityLevel])
         IPaginateable.__init__(self, PortalSecurityLevel)
 
-        self.count = self._register_child_endpoint(
-            CompanyPortalsecuritylevelsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyPortalsecuritylevelsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyPortalsecuritylevelsIdEndpoint object to move down the chain.
@@ -75,4 +72,13 @@ class CompanyPortalsecuritylevelsEndpoint(
         Returns:
             list[PortalSecurityLevel]: The parsed response data.
         """
-        return self._parse_many(PortalSecurityLevel, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PortalSecurityLevel, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyPortalsecuritylevelsCountEndpoint:
+        """
+        The CompanyPortalsecuritylevelsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalsecuritylevelsCountEndpoint(self.client, parent_endpoint=self)
+        )
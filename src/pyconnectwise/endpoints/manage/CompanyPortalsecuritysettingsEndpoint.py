@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class CompanyPortalsecuritysettingsEndpoint(
         IGettable.__init__(self, list[PortalSecuritySetting])
         IPaginateable.__init__(self, PortalSecuritySetting)
 
-        self.count = self._register_child_endpoint(
-            CompanyPortalsecuritysettingsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> CompanyPortalsecuritysettingsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyPortalsecuritysettingsIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class CompanyPortalsecuritysettingsEndpoint(
         Returns:
             list[PortalSecuritySetting]: The parsed response data.
         """
-        return self._parse_many(PortalSecuritySetting, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PortalSecuritySetting, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyPortalsecuritysettingsCountEndpoint:
+        """
+        The CompanyPortalsecuritysettingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalsecuritysettingsCountEndpoint(self.client, parent_endpoint=self)
+        )
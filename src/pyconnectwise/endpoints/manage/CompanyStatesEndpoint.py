@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class CompanyStatesEndpoint(
         IPostable.__init__(self, State)
         IPaginateable.__init__(self, State)
 
-        self.count = self._register_child_endpoint(CompanyStatesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(CompanyStatesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyStatesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyStatesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class CompanyStatesEndpoint(
         Returns:
             list[State]: The parsed response data.
         """
-        return self._parse_many(State, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(State, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> State:
         """
@@ -83,4 +81,18 @@ class CompanyStatesEndpoint(
         Returns:
             State: The parsed response data.
         """
-        return self._parse_one(State, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(State, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyStatesCountEndpoint:
+        """
+        The CompanyStatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyStatesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyStatesInfoEndpoint:
+        """
+        The CompanyStatesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyStatesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class CompanyStatesIdEndpoint(
         IPuttable.__init__(self, State)
         IPaginateable.__init__(self, State)
 
-        self.info = self._register_child_endpoint(CompanyStatesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(CompanyStatesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[State]:
@@ -69,7 +67,7 @@ class CompanyStatesIdEndpoint(
         Returns:
             State: The parsed response data.
         """
-        return self._parse_one(State, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(State, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> State:
         """
@@ -81,7 +79,7 @@ class CompanyStatesIdEndpoint(
         Returns:
             State: The parsed response data.
         """
-        return self._parse_one(State, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(State, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> State:
         """
@@ -93,4 +91,18 @@ class CompanyStatesIdEndpoint(
         Returns:
             State: The parsed response data.
         """
-        return self._parse_one(State, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(State, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> CompanyStatesIdInfoEndpoint:
+        """
+        The CompanyStatesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyStatesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> CompanyStatesIdUsagesEndpoint:
+        """
+        The CompanyStatesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyStatesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -50,4 +50,4 @@ class CompanyStatesIdInfoEndpoint(
         Returns:
             StateInfo: The parsed response data.
         """
-        return self._parse_one(StateInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(StateInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class CompanyStatesInfoEndpoint(
         IGettable.__init__(self, list[StateInfo])
         IPaginateable.__init__(self, StateInfo)
 
-        self.count = self._register_child_endpoint(CompanyStatesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[StateInfo]:
@@ -53,4 +52,11 @@ class CompanyStatesInfoEndpoint(
         Returns:
             list[StateInfo]: The parsed response data.
         """
-        return self._parse_many(StateInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(StateInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyStatesInfoCountEndpoint:
+        """
+        The CompanyStatesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyStatesInfoCountEndpoint(self.client, parent_endpoint=self))
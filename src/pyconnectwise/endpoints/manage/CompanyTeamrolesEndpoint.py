@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class CompanyTeamrolesEndpoint(
         IPostable.__init__(self, TeamRole)
         IPaginateable.__init__(self, TeamRole)
 
-        self.count = self._register_child_endpoint(CompanyTeamrolesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(CompanyTeamrolesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyTeamrolesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyTeamrolesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class CompanyTeamrolesEndpoint(
         Returns:
             list[TeamRole]: The parsed response data.
         """
-        return self._parse_many(TeamRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TeamRole, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TeamRole:
         """
@@ -83,4 +81,18 @@ class CompanyTeamrolesEndpoint(
         Returns:
             TeamRole: The parsed response data.
         """
-        return self._parse_one(TeamRole, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TeamRole, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyTeamrolesCountEndpoint:
+        """
+        The CompanyTeamrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTeamrolesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyTeamrolesInfoEndpoint:
+        """
+        The CompanyTeamrolesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTeamrolesInfoEndpoint(self.client, parent_endpoint=self))
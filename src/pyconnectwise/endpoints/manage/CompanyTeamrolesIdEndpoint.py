@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class CompanyTeamrolesIdEndpoint(
         IPuttable.__init__(self, TeamRole)
         IPaginateable.__init__(self, TeamRole)
 
-        self.info = self._register_child_endpoint(CompanyTeamrolesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(CompanyTeamrolesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[TeamRole]:
@@ -69,7 +67,7 @@ class CompanyTeamrolesIdEndpoint(
         Returns:
             TeamRole: The parsed response data.
         """
-        return self._parse_one(TeamRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TeamRole, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> TeamRole:
         """
@@ -81,7 +79,7 @@ class CompanyTeamrolesIdEndpoint(
         Returns:
             TeamRole: The parsed response data.
         """
-        return self._parse_one(TeamRole, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(TeamRole, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TeamRole:
         """
@@ -93,4 +91,18 @@ class CompanyTeamrolesIdEndpoint(
         Returns:
             TeamRole: The parsed response data.
         """
-        return self._parse_one(TeamRole, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(TeamRole, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> CompanyTeamrolesIdInfoEndpoint:
+        """
+        The CompanyTeamrolesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTeamrolesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> CompanyTeamrolesIdUsagesEndpoint:
+        """
+        The CompanyTeamrolesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTeamrolesIdUsagesEndpoint(self.client, parent_endpoint=self))
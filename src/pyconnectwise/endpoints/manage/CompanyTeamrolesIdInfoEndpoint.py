@@ -52,4 +52,4 @@ class CompanyTeamrolesIdInfoEndpoint(
         Returns:
             TeamRoleInfo: The parsed response data.
         """
-        return self._parse_one(TeamRoleInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TeamRoleInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class CompanyTeamrolesInfoEndpoint(
         IGettable.__init__(self, list[TeamRoleInfo])
         IPaginateable.__init__(self, TeamRoleInfo)
 
-        self.count = self._register_child_endpoint(CompanyTeamrolesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[TeamRoleInfo]:
@@ -55,4 +54,11 @@ class CompanyTeamrolesInfoEndpoint(
         Returns:
             list[TeamRoleInfo]: The parsed response data.
         """
-        return self._parse_many(TeamRoleInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TeamRoleInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyTeamrolesInfoCountEndpoint:
+        """
+        The CompanyTeamrolesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTeamrolesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class CompanyTracksEndpoint(
         IPostable.__init__(self, Track)
         IPaginateable.__init__(self, Track)
 
-        self.count = self._register_child_endpoint(CompanyTracksCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyTracksIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyTracksIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class CompanyTracksEndpoint(
         Returns:
             list[Track]: The parsed response data.
         """
-        return self._parse_many(Track, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Track, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Track:
         """
@@ -81,4 +80,11 @@ class CompanyTracksEndpoint(
         Returns:
             Track: The parsed response data.
         """
-        return self._parse_one(Track, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Track, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyTracksCountEndpoint:
+        """
+        The CompanyTracksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTracksCountEndpoint(self.client, parent_endpoint=self))
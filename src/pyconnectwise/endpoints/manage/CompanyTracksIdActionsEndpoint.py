@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class CompanyTracksIdActionsEndpoint(
         IPostable.__init__(self, TrackAction)
         IPaginateable.__init__(self, TrackAction)
 
-        self.count = self._register_child_endpoint(CompanyTracksIdActionsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> CompanyTracksIdActionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized CompanyTracksIdActionsIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class CompanyTracksIdActionsEndpoint(
         Returns:
             list[TrackAction]: The parsed response data.
         """
-        return self._parse_many(TrackAction, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TrackAction, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TrackAction:
         """
@@ -83,4 +82,11 @@ class CompanyTracksIdActionsEndpoint(
         Returns:
             TrackAction: The parsed response data.
         """
-        return self._parse_one(TrackAction, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TrackAction, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> CompanyTracksIdActionsCountEndpoint:
+        """
+        The CompanyTracksIdActionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTracksIdActionsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class CompanyTracksIdEndpoint(
         IPuttable.__init__(self, Track)
         IPaginateable.__init__(self, Track)
 
-        self.actions = self._register_child_endpoint(CompanyTracksIdActionsEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Track]:
@@ -67,7 +66,7 @@ class CompanyTracksIdEndpoint(
         Returns:
             Track: The parsed response data.
         """
-        return self._parse_one(Track, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Track, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Track:
         """
@@ -79,7 +78,7 @@ class CompanyTracksIdEndpoint(
         Returns:
             Track: The parsed response data.
         """
-        return self._parse_one(Track, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Track, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Track:
         """
@@ -91,4 +90,11 @@ class CompanyTracksIdEndpoint(
         Returns:
             Track: The parsed response data.
         """
-        return self._parse_one(Track, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Track, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def actions(self) -> CompanyTracksIdActionsEndpoint:
+        """
+        The CompanyTracksIdActionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTracksIdActionsEndpoint(self.client, parent_endpoint=self))
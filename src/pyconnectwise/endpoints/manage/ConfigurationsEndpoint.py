@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -11,4 +12,9 @@ class ConfigurationsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "configurations", parent_endpoint=parent_endpoint)
 
-        self.types = self._register_child_endpoint(ConfigurationsTypesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def types(self) -> ConfigurationsTypesEndpoint:
+        """
+        The ConfigurationsTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ConfigurationsTypesEndpoint(self.client, parent_endpoint=self))
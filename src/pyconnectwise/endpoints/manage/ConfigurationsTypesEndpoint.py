@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -12,8 +13,6 @@ class ConfigurationsTypesEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "types", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(ConfigurationsTypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ConfigurationsTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ConfigurationsTypesIdEndpoint object to move down the chain.
@@ -26,3 +25,10 @@ class ConfigurationsTypesEndpoint(ConnectWiseEndpoint):
         child = ConfigurationsTypesIdEndpoint(self.client, parent_endpoint=self)
         child._id = _id
         return child
+
+    @cached_property
+    def info(self) -> ConfigurationsTypesInfoEndpoint:
+        """
+        The ConfigurationsTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ConfigurationsTypesInfoEndpoint(self.client, parent_endpoint=self))
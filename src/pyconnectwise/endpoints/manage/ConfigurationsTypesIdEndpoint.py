@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -11,6 +12,9 @@ class ConfigurationsTypesIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.questions = self._register_child_endpoint(
-            ConfigurationsTypesIdQuestionsEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def questions(self) -> ConfigurationsTypesIdQuestionsEndpoint:
+        """
+        The ConfigurationsTypesIdQuestionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ConfigurationsTypesIdQuestionsEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -16,10 +17,6 @@ class ConfigurationsTypesIdQuestionsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "questions", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(
-            ConfigurationsTypesIdQuestionsInfoEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ConfigurationsTypesIdQuestionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ConfigurationsTypesIdQuestionsIdEndpoint object to move down the chain.
@@ -32,3 +29,12 @@ class ConfigurationsTypesIdQuestionsEndpoint(ConnectWiseEndpoint):
         child = ConfigurationsTypesIdQuestionsIdEndpoint(self.client, parent_endpoint=self)
         child._id = _id
         return child
+
+    @cached_property
+    def info(self) -> ConfigurationsTypesIdQuestionsInfoEndpoint:
+        """
+        The ConfigurationsTypesIdQuestionsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ConfigurationsTypesIdQuestionsInfoEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -16,9 +17,20 @@ class ConfigurationsTypesIdQuestionsIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(
-            ConfigurationsTypesIdQuestionsIdInfoEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def info(self) -> ConfigurationsTypesIdQuestionsIdInfoEndpoint:
+        """
+        The ConfigurationsTypesIdQuestionsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ConfigurationsTypesIdQuestionsIdInfoEndpoint(self.client, parent_endpoint=self)
         )
-        self.values = self._register_child_endpoint(
-            ConfigurationsTypesIdQuestionsIdValuesEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def values(self) -> ConfigurationsTypesIdQuestionsIdValuesEndpoint:
+        """
+        The ConfigurationsTypesIdQuestionsIdValuesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ConfigurationsTypesIdQuestionsIdValuesEndpoint(self.client, parent_endpoint=self)
         )
@@ -55,5 +55,5 @@ class ConfigurationsTypesIdQuestionsIdInfoEndpoint(
             ConfigurationTypeQuestionInfo: The parsed response data.
         """
         return self._parse_one(
-            ConfigurationTypeQuestionInfo, super()._make_request("GET", data=data, params=params).json()
+            ConfigurationTypeQuestionInfo, super()._make_request("GET", data=data, params=params).content
         )
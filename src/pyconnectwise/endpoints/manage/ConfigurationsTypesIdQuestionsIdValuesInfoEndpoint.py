@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint(
         IGettable.__init__(self, list[ConfigurationTypeQuestionValueInfo])
         IPaginateable.__init__(self, ConfigurationTypeQuestionValueInfo)
 
-        self.count = self._register_child_endpoint(
-            ConfigurationsTypesIdQuestionsIdValuesInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ConfigurationTypeQuestionValueInfo]:
@@ -67,5 +64,14 @@ class ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint(
             list[ConfigurationTypeQuestionValueInfo]: The parsed response data.
         """
         return self._parse_many(
-            ConfigurationTypeQuestionValueInfo, super()._make_request("GET", data=data, params=params).json()
+            ConfigurationTypeQuestionValueInfo, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> ConfigurationsTypesIdQuestionsIdValuesInfoCountEndpoint:
+        """
+        The ConfigurationsTypesIdQuestionsIdValuesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ConfigurationsTypesIdQuestionsIdValuesInfoCountEndpoint(self.client, parent_endpoint=self)
         )
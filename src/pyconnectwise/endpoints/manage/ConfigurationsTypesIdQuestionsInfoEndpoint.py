@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class ConfigurationsTypesIdQuestionsInfoEndpoint(
         IGettable.__init__(self, list[ConfigurationTypeQuestionInfo])
         IPaginateable.__init__(self, ConfigurationTypeQuestionInfo)
 
-        self.count = self._register_child_endpoint(
-            ConfigurationsTypesIdQuestionsInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ConfigurationTypeQuestionInfo]:
@@ -62,5 +59,14 @@ class ConfigurationsTypesIdQuestionsInfoEndpoint(
             list[ConfigurationTypeQuestionInfo]: The parsed response data.
         """
         return self._parse_many(
-            ConfigurationTypeQuestionInfo, super()._make_request("GET", data=data, params=params).json()
+            ConfigurationTypeQuestionInfo, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> ConfigurationsTypesIdQuestionsInfoCountEndpoint:
+        """
+        The ConfigurationsTypesIdQuestionsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ConfigurationsTypesIdQuestionsInfoCountEndpoint(self.client, parent_endpoint=self)
         )
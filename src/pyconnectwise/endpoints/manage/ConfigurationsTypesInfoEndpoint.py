@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class ConfigurationsTypesInfoEndpoint(
         IGettable.__init__(self, list[ConfigurationTypeInfo])
         IPaginateable.__init__(self, ConfigurationTypeInfo)
 
-        self.count = self._register_child_endpoint(ConfigurationsTypesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ConfigurationTypeInfo]:
@@ -57,4 +56,11 @@ class ConfigurationsTypesInfoEndpoint(
         Returns:
             list[ConfigurationTypeInfo]: The parsed response data.
         """
-        return self._parse_many(ConfigurationTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ConfigurationTypeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ConfigurationsTypesInfoCountEndpoint:
+        """
+        The ConfigurationsTypesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ConfigurationsTypesInfoCountEndpoint(self.client, parent_endpoint=self))
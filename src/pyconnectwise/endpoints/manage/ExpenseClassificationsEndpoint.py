@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ExpenseClassificationsEndpoint(
         IGettable.__init__(self, list[Classification])
         IPaginateable.__init__(self, Classification)
 
-        self.count = self._register_child_endpoint(ExpenseClassificationsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ExpenseClassificationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ExpenseClassificationsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class ExpenseClassificationsEndpoint(
         Returns:
             list[Classification]: The parsed response data.
         """
-        return self._parse_many(Classification, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Classification, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ExpenseClassificationsCountEndpoint:
+        """
+        The ExpenseClassificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseClassificationsCountEndpoint(self.client, parent_endpoint=self))
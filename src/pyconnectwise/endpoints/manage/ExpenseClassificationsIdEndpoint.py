@@ -52,4 +52,4 @@ class ExpenseClassificationsIdEndpoint(
         Returns:
             Classification: The parsed response data.
         """
-        return self._parse_one(Classification, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Classification, super()._make_request("GET", data=data, params=params).content)
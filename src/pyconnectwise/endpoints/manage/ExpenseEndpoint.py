@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -16,11 +17,44 @@ class ExpenseEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "expense", parent_endpoint=parent_endpoint)
 
-        self.classifications = self._register_child_endpoint(
-            ExpenseClassificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.entries = self._register_child_endpoint(ExpenseEntriesEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ExpenseInfoEndpoint(client, parent_endpoint=self))
-        self.payment_types = self._register_child_endpoint(ExpensePaymenttypesEndpoint(client, parent_endpoint=self))
-        self.reports = self._register_child_endpoint(ExpenseReportsEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(ExpenseTypesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def classifications(self) -> ExpenseClassificationsEndpoint:
+        """
+        The ExpenseClassificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseClassificationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def entries(self) -> ExpenseEntriesEndpoint:
+        """
+        The ExpenseEntriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseEntriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ExpenseInfoEndpoint:
+        """
+        The ExpenseInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def payment_types(self) -> ExpensePaymenttypesEndpoint:
+        """
+        The ExpensePaymenttypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpensePaymenttypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reports(self) -> ExpenseReportsEndpoint:
+        """
+        The ExpenseReportsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseReportsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> ExpenseTypesEndpoint:
+        """
+        The ExpenseTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseTypesEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ExpenseEntriesEndpoint(
         IPostable.__init__(self, ExpenseEntry)
         IPaginateable.__init__(self, ExpenseEntry)
 
-        self.count = self._register_child_endpoint(ExpenseEntriesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ExpenseEntriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ExpenseEntriesIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class ExpenseEntriesEndpoint(
         Returns:
             list[ExpenseEntry]: The parsed response data.
         """
-        return self._parse_many(ExpenseEntry, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ExpenseEntry, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ExpenseEntry:
         """
@@ -83,4 +82,11 @@ class ExpenseEntriesEndpoint(
         Returns:
             ExpenseEntry: The parsed response data.
         """
-        return self._parse_one(ExpenseEntry, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ExpenseEntry, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ExpenseEntriesCountEndpoint:
+        """
+        The ExpenseEntriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseEntriesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ExpenseEntriesIdAuditsEndpoint(
         IGettable.__init__(self, list[ExpenseEntryAudit])
         IPaginateable.__init__(self, ExpenseEntryAudit)
 
-        self.count = self._register_child_endpoint(ExpenseEntriesIdAuditsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ExpenseEntriesIdAuditsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ExpenseEntriesIdAuditsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class ExpenseEntriesIdAuditsEndpoint(
         Returns:
             list[ExpenseEntryAudit]: The parsed response data.
         """
-        return self._parse_many(ExpenseEntryAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ExpenseEntryAudit, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ExpenseEntriesIdAuditsCountEndpoint:
+        """
+        The ExpenseEntriesIdAuditsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseEntriesIdAuditsCountEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ExpenseEntriesIdAuditsIdEndpoint(
         Returns:
             ExpenseEntryAudit: The parsed response data.
         """
-        return self._parse_one(ExpenseEntryAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ExpenseEntryAudit, super()._make_request("GET", data=data, params=params).content)
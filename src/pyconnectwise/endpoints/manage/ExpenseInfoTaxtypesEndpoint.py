@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ExpenseInfoTaxtypesEndpoint(
         IGettable.__init__(self, list[ExpenseTaxTypeInfo])
         IPaginateable.__init__(self, ExpenseTaxTypeInfo)
 
-        self.count = self._register_child_endpoint(ExpenseInfoTaxtypesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ExpenseInfoTaxtypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ExpenseInfoTaxtypesIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class ExpenseInfoTaxtypesEndpoint(
         Returns:
             list[ExpenseTaxTypeInfo]: The parsed response data.
         """
-        return self._parse_many(ExpenseTaxTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ExpenseTaxTypeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ExpenseInfoTaxtypesCountEndpoint:
+        """
+        The ExpenseInfoTaxtypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseInfoTaxtypesCountEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ExpenseInfoTaxtypesIdEndpoint(
         Returns:
             ExpenseTaxTypeInfo: The parsed response data.
         """
-        return self._parse_one(ExpenseTaxTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ExpenseTaxTypeInfo, super()._make_request("GET", data=data, params=params).content)
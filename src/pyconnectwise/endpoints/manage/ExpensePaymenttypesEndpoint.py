@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ExpensePaymenttypesEndpoint(
         IPostable.__init__(self, PaymentType)
         IPaginateable.__init__(self, PaymentType)
 
-        self.count = self._register_child_endpoint(ExpensePaymenttypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ExpensePaymenttypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ExpensePaymenttypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ExpensePaymenttypesIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class ExpensePaymenttypesEndpoint(
         Returns:
             list[PaymentType]: The parsed response data.
         """
-        return self._parse_many(PaymentType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PaymentType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> PaymentType:
         """
@@ -85,4 +83,18 @@ class ExpensePaymenttypesEndpoint(
         Returns:
             PaymentType: The parsed response data.
         """
-        return self._parse_one(PaymentType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PaymentType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ExpensePaymenttypesCountEndpoint:
+        """
+        The ExpensePaymenttypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpensePaymenttypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ExpensePaymenttypesInfoEndpoint:
+        """
+        The ExpensePaymenttypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpensePaymenttypesInfoEndpoint(self.client, parent_endpoint=self))
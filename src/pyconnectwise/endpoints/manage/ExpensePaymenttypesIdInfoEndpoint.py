@@ -52,4 +52,4 @@ class ExpensePaymenttypesIdInfoEndpoint(
         Returns:
             PaymentTypeInfo: The parsed response data.
         """
-        return self._parse_one(PaymentTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(PaymentTypeInfo, super()._make_request("GET", data=data, params=params).content)
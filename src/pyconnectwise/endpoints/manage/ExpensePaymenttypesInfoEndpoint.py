@@ -54,4 +54,4 @@ class ExpensePaymenttypesInfoEndpoint(
         Returns:
             list[PaymentTypeInfo]: The parsed response data.
         """
-        return self._parse_many(PaymentTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PaymentTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ExpenseReportsEndpoint(
         IGettable.__init__(self, list[ExpenseReport])
         IPaginateable.__init__(self, ExpenseReport)
 
-        self.count = self._register_child_endpoint(ExpenseReportsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ExpenseReportsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ExpenseReportsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class ExpenseReportsEndpoint(
         Returns:
             list[ExpenseReport]: The parsed response data.
         """
-        return self._parse_many(ExpenseReport, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ExpenseReport, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ExpenseReportsCountEndpoint:
+        """
+        The ExpenseReportsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseReportsCountEndpoint(self.client, parent_endpoint=self))
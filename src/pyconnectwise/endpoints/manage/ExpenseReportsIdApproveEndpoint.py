@@ -30,5 +30,5 @@ class ExpenseReportsIdApproveEndpoint(ConnectWiseEndpoint, IPostable[SuccessResp
         """
         return self._parse_one(
             SuccessResponse,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ExpenseReportsIdAuditsEndpoint(
         IGettable.__init__(self, list[ExpenseReportAudit])
         IPaginateable.__init__(self, ExpenseReportAudit)
 
-        self.count = self._register_child_endpoint(ExpenseReportsIdAuditsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ExpenseReportsIdAuditsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ExpenseReportsIdAuditsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class ExpenseReportsIdAuditsEndpoint(
         Returns:
             list[ExpenseReportAudit]: The parsed response data.
         """
-        return self._parse_many(ExpenseReportAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ExpenseReportAudit, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ExpenseReportsIdAuditsCountEndpoint:
+        """
+        The ExpenseReportsIdAuditsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseReportsIdAuditsCountEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ExpenseReportsIdAuditsIdEndpoint(
         Returns:
             ExpenseReportAudit: The parsed response data.
         """
-        return self._parse_one(ExpenseReportAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ExpenseReportAudit, super()._make_request("GET", data=data, params=params).content)
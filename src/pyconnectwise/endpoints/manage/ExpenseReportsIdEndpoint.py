@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class ExpenseReportsIdEndpoint(
         IGettable.__init__(self, ExpenseReport)
         IPaginateable.__init__(self, ExpenseReport)
 
-        self.audits = self._register_child_endpoint(ExpenseReportsIdAuditsEndpoint(client, parent_endpoint=self))
-        self.reverse = self._register_child_endpoint(ExpenseReportsIdReverseEndpoint(client, parent_endpoint=self))
-        self.submit = self._register_child_endpoint(ExpenseReportsIdSubmitEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ExpenseReport]:
@@ -59,4 +56,25 @@ class ExpenseReportsIdEndpoint(
         Returns:
             ExpenseReport: The parsed response data.
         """
-        return self._parse_one(ExpenseReport, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ExpenseReport, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def audits(self) -> ExpenseReportsIdAuditsEndpoint:
+        """
+        The ExpenseReportsIdAuditsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseReportsIdAuditsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reverse(self) -> ExpenseReportsIdReverseEndpoint:
+        """
+        The ExpenseReportsIdReverseEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseReportsIdReverseEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def submit(self) -> ExpenseReportsIdSubmitEndpoint:
+        """
+        The ExpenseReportsIdSubmitEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseReportsIdSubmitEndpoint(self.client, parent_endpoint=self))
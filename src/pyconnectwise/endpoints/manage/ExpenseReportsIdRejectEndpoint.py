@@ -30,5 +30,5 @@ class ExpenseReportsIdRejectEndpoint(ConnectWiseEndpoint, IPostable[SuccessRespo
         """
         return self._parse_one(
             SuccessResponse,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
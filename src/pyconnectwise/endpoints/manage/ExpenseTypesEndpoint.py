@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ExpenseTypesEndpoint(
         IPostable.__init__(self, ExpenseType)
         IPaginateable.__init__(self, ExpenseType)
 
-        self.count = self._register_child_endpoint(ExpenseTypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ExpenseTypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ExpenseTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ExpenseTypesIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class ExpenseTypesEndpoint(
         Returns:
             list[ExpenseType]: The parsed response data.
         """
-        return self._parse_many(ExpenseType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ExpenseType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ExpenseType:
         """
@@ -85,4 +83,18 @@ class ExpenseTypesEndpoint(
         Returns:
             ExpenseType: The parsed response data.
         """
-        return self._parse_one(ExpenseType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ExpenseType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ExpenseTypesCountEndpoint:
+        """
+        The ExpenseTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ExpenseTypesInfoEndpoint:
+        """
+        The ExpenseTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseTypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ExpenseTypesIdInfoEndpoint(
         Returns:
             ExpenseTypeInfo: The parsed response data.
         """
-        return self._parse_one(ExpenseTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ExpenseTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -54,4 +54,4 @@ class ExpenseTypesInfoEndpoint(
         Returns:
             list[ExpenseTypeInfo]: The parsed response data.
         """
-        return self._parse_many(ExpenseTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ExpenseTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class FinanceAccountingBatchesEndpoint(
         IPostable.__init__(self, GLExport)
         IPaginateable.__init__(self, AccountingBatch)
 
-        self.count = self._register_child_endpoint(FinanceAccountingBatchesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceAccountingBatchesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAccountingBatchesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class FinanceAccountingBatchesEndpoint(
         Returns:
             list[AccountingBatch]: The parsed response data.
         """
-        return self._parse_many(AccountingBatch, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AccountingBatch, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> GLExport:
         """
@@ -85,4 +84,11 @@ class FinanceAccountingBatchesEndpoint(
         Returns:
             GLExport: The parsed response data.
         """
-        return self._parse_one(GLExport, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(GLExport, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAccountingBatchesCountEndpoint:
+        """
+        The FinanceAccountingBatchesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingBatchesCountEndpoint(self.client, parent_endpoint=self))
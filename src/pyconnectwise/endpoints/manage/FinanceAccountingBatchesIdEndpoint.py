@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,13 +27,6 @@ class FinanceAccountingBatchesIdEndpoint(
         IGettable.__init__(self, AccountingBatch)
         IPaginateable.__init__(self, AccountingBatch)
 
-        self.entries = self._register_child_endpoint(
-            FinanceAccountingBatchesIdEntriesEndpoint(client, parent_endpoint=self)
-        )
-        self.export = self._register_child_endpoint(
-            FinanceAccountingBatchesIdExportEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[AccountingBatch]:
@@ -75,4 +69,22 @@ class FinanceAccountingBatchesIdEndpoint(
         Returns:
             AccountingBatch: The parsed response data.
         """
-        return self._parse_one(AccountingBatch, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AccountingBatch, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def entries(self) -> FinanceAccountingBatchesIdEntriesEndpoint:
+        """
+        The FinanceAccountingBatchesIdEntriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingBatchesIdEntriesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def export(self) -> FinanceAccountingBatchesIdExportEndpoint:
+        """
+        The FinanceAccountingBatchesIdExportEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingBatchesIdExportEndpoint(self.client, parent_endpoint=self)
+        )
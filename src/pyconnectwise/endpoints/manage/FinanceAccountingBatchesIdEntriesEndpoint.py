@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class FinanceAccountingBatchesIdEntriesEndpoint(
         IGettable.__init__(self, list[BatchEntry])
         IPaginateable.__init__(self, BatchEntry)
 
-        self.count = self._register_child_endpoint(
-            FinanceAccountingBatchesIdEntriesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAccountingBatchesIdEntriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAccountingBatchesIdEntriesIdEndpoint object to move down the chain.
@@ -73,4 +70,13 @@ class FinanceAccountingBatchesIdEntriesEndpoint(
         Returns:
             list[BatchEntry]: The parsed response data.
         """
-        return self._parse_many(BatchEntry, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BatchEntry, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAccountingBatchesIdEntriesCountEndpoint:
+        """
+        The FinanceAccountingBatchesIdEntriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingBatchesIdEntriesCountEndpoint(self.client, parent_endpoint=self)
+        )
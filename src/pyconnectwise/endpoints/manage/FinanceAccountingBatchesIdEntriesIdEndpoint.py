@@ -50,4 +50,4 @@ class FinanceAccountingBatchesIdEntriesIdEndpoint(
         Returns:
             BatchEntry: The parsed response data.
         """
-        return self._parse_one(BatchEntry, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BatchEntry, super()._make_request("GET", data=data, params=params).content)
@@ -26,4 +26,4 @@ class FinanceAccountingBatchesIdExportEndpoint(
         Returns:
             GLExport: The parsed response data.
         """
-        return self._parse_one(GLExport, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(GLExport, super()._make_request("POST", data=data, params=params).content)
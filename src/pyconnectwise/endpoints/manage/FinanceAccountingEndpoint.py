@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,14 +22,43 @@ class FinanceAccountingEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "accounting", parent_endpoint=parent_endpoint)
 
-        self.batches = self._register_child_endpoint(FinanceAccountingBatchesEndpoint(client, parent_endpoint=self))
-        self.export = self._register_child_endpoint(FinanceAccountingExportEndpoint(client, parent_endpoint=self))
-        self.unpostedexpenses = self._register_child_endpoint(
-            FinanceAccountingUnpostedexpensesEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def batches(self) -> FinanceAccountingBatchesEndpoint:
+        """
+        The FinanceAccountingBatchesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingBatchesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def export(self) -> FinanceAccountingExportEndpoint:
+        """
+        The FinanceAccountingExportEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingExportEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def unpostedexpenses(self) -> FinanceAccountingUnpostedexpensesEndpoint:
+        """
+        The FinanceAccountingUnpostedexpensesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedexpensesEndpoint(self.client, parent_endpoint=self)
         )
-        self.unpostedinvoices = self._register_child_endpoint(
-            FinanceAccountingUnpostedinvoicesEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def unpostedinvoices(self) -> FinanceAccountingUnpostedinvoicesEndpoint:
+        """
+        The FinanceAccountingUnpostedinvoicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedinvoicesEndpoint(self.client, parent_endpoint=self)
         )
-        self.unpostedprocurement = self._register_child_endpoint(
-            FinanceAccountingUnpostedprocurementEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def unpostedprocurement(self) -> FinanceAccountingUnpostedprocurementEndpoint:
+        """
+        The FinanceAccountingUnpostedprocurementEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedprocurementEndpoint(self.client, parent_endpoint=self)
         )
@@ -24,4 +24,4 @@ class FinanceAccountingExportEndpoint(ConnectWiseEndpoint, IPostable[GLExport, C
         Returns:
             GLExport: The parsed response data.
         """
-        return self._parse_one(GLExport, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(GLExport, super()._make_request("POST", data=data, params=params).content)
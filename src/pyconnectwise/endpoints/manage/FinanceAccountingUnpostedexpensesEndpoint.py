@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class FinanceAccountingUnpostedexpensesEndpoint(
         IGettable.__init__(self, list[UnpostedExpense])
         IPaginateable.__init__(self, UnpostedExpense)
 
-        self.count = self._register_child_endpoint(
-            FinanceAccountingUnpostedexpensesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAccountingUnpostedexpensesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAccountingUnpostedexpensesIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class FinanceAccountingUnpostedexpensesEndpoint(
         Returns:
             list[UnpostedExpense]: The parsed response data.
         """
-        return self._parse_many(UnpostedExpense, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(UnpostedExpense, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAccountingUnpostedexpensesCountEndpoint:
+        """
+        The FinanceAccountingUnpostedexpensesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedexpensesCountEndpoint(self.client, parent_endpoint=self)
+        )
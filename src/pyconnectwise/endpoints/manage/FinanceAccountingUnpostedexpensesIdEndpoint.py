@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class FinanceAccountingUnpostedexpensesIdEndpoint(
         IGettable.__init__(self, UnpostedExpense)
         IPaginateable.__init__(self, UnpostedExpense)
 
-        self.taxable_levels = self._register_child_endpoint(
-            FinanceAccountingUnpostedexpensesIdTaxablelevelsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[UnpostedExpense]:
@@ -59,4 +56,13 @@ class FinanceAccountingUnpostedexpensesIdEndpoint(
         Returns:
             UnpostedExpense: The parsed response data.
         """
-        return self._parse_one(UnpostedExpense, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(UnpostedExpense, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def taxable_levels(self) -> FinanceAccountingUnpostedexpensesIdTaxablelevelsEndpoint:
+        """
+        The FinanceAccountingUnpostedexpensesIdTaxablelevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedexpensesIdTaxablelevelsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class FinanceAccountingUnpostedexpensesIdTaxablelevelsEndpoint(
         IGettable.__init__(self, list[UnpostedExpenseTaxableLevel])
         IPaginateable.__init__(self, UnpostedExpenseTaxableLevel)
 
-        self.count = self._register_child_endpoint(
-            FinanceAccountingUnpostedexpensesIdTaxablelevelsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint object to move down the chain.
@@ -78,5 +75,14 @@ class FinanceAccountingUnpostedexpensesIdTaxablelevelsEndpoint(
             list[UnpostedExpenseTaxableLevel]: The parsed response data.
         """
         return self._parse_many(
-            UnpostedExpenseTaxableLevel, super()._make_request("GET", data=data, params=params).json()
+            UnpostedExpenseTaxableLevel, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAccountingUnpostedexpensesIdTaxablelevelsCountEndpoint:
+        """
+        The FinanceAccountingUnpostedexpensesIdTaxablelevelsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedexpensesIdTaxablelevelsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -55,5 +55,5 @@ class FinanceAccountingUnpostedexpensesIdTaxablelevelsIdEndpoint(
             UnpostedExpenseTaxableLevel: The parsed response data.
         """
         return self._parse_one(
-            UnpostedExpenseTaxableLevel, super()._make_request("GET", data=data, params=params).json()
+            UnpostedExpenseTaxableLevel, super()._make_request("GET", data=data, params=params).content
         )
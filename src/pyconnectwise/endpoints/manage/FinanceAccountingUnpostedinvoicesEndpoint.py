@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class FinanceAccountingUnpostedinvoicesEndpoint(
         IGettable.__init__(self, list[UnpostedInvoice])
         IPaginateable.__init__(self, UnpostedInvoice)
 
-        self.count = self._register_child_endpoint(
-            FinanceAccountingUnpostedinvoicesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAccountingUnpostedinvoicesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAccountingUnpostedinvoicesIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class FinanceAccountingUnpostedinvoicesEndpoint(
         Returns:
             list[UnpostedInvoice]: The parsed response data.
         """
-        return self._parse_many(UnpostedInvoice, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(UnpostedInvoice, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAccountingUnpostedinvoicesCountEndpoint:
+        """
+        The FinanceAccountingUnpostedinvoicesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedinvoicesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class FinanceAccountingUnpostedinvoicesIdEndpoint(
         IGettable.__init__(self, UnpostedInvoice)
         IPaginateable.__init__(self, UnpostedInvoice)
 
-        self.taxable_levels = self._register_child_endpoint(
-            FinanceAccountingUnpostedinvoicesIdTaxablelevelsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[UnpostedInvoice]:
@@ -59,4 +56,13 @@ class FinanceAccountingUnpostedinvoicesIdEndpoint(
         Returns:
             UnpostedInvoice: The parsed response data.
         """
-        return self._parse_one(UnpostedInvoice, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(UnpostedInvoice, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def taxable_levels(self) -> FinanceAccountingUnpostedinvoicesIdTaxablelevelsEndpoint:
+        """
+        The FinanceAccountingUnpostedinvoicesIdTaxablelevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedinvoicesIdTaxablelevelsEndpoint(self.client, parent_endpoint=self)
+        )
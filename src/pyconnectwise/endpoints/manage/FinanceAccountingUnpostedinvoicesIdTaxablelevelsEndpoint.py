@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class FinanceAccountingUnpostedinvoicesIdTaxablelevelsEndpoint(
         IGettable.__init__(self, list[UnpostedInvoiceTaxableLevel])
         IPaginateable.__init__(self, UnpostedInvoiceTaxableLevel)
 
-        self.count = self._register_child_endpoint(
-            FinanceAccountingUnpostedinvoicesIdTaxablelevelsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAccountingUnpostedinvoicesIdTaxablelevelsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAccountingUnpostedinvoicesIdTaxablelevelsIdEndpoint object to move down the chain.
@@ -78,5 +75,14 @@ class FinanceAccountingUnpostedinvoicesIdTaxablelevelsEndpoint(
             list[UnpostedInvoiceTaxableLevel]: The parsed response data.
         """
         return self._parse_many(
-            UnpostedInvoiceTaxableLevel, super()._make_request("GET", data=data, params=params).json()
+            UnpostedInvoiceTaxableLevel, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAccountingUnpostedinvoicesIdTaxablelevelsCountEndpoint:
+        """
+        The FinanceAccountingUnpostedinvoicesIdTaxablelevelsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedinvoicesIdTaxablelevelsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -55,5 +55,5 @@ class FinanceAccountingUnpostedinvoicesIdTaxablelevelsIdEndpoint(
             UnpostedInvoiceTaxableLevel: The parsed response data.
         """
         return self._parse_one(
-            UnpostedInvoiceTaxableLevel, super()._make_request("GET", data=data, params=params).json()
+            UnpostedInvoiceTaxableLevel, super()._make_request("GET", data=data, params=params).content
         )
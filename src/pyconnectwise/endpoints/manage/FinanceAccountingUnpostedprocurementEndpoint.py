@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class FinanceAccountingUnpostedprocurementEndpoint(
         IGettable.__init__(self, list[UnpostedProcurement])
         IPaginateable.__init__(self, UnpostedProcurement)
 
-        self.count = self._register_child_endpoint(
-            FinanceAccountingUnpostedprocurementCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAccountingUnpostedprocurementIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAccountingUnpostedprocurementIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class FinanceAccountingUnpostedprocurementEndpoint(
         Returns:
             list[UnpostedProcurement]: The parsed response data.
         """
-        return self._parse_many(UnpostedProcurement, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(UnpostedProcurement, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAccountingUnpostedprocurementCountEndpoint:
+        """
+        The FinanceAccountingUnpostedprocurementCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedprocurementCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class FinanceAccountingUnpostedprocurementIdEndpoint(
         IGettable.__init__(self, UnpostedProcurement)
         IPaginateable.__init__(self, UnpostedProcurement)
 
-        self.taxable_levels = self._register_child_endpoint(
-            FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[UnpostedProcurement]:
@@ -61,4 +58,13 @@ class FinanceAccountingUnpostedprocurementIdEndpoint(
         Returns:
             UnpostedProcurement: The parsed response data.
         """
-        return self._parse_one(UnpostedProcurement, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(UnpostedProcurement, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def taxable_levels(self) -> FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint:
+        """
+        The FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint(
         IGettable.__init__(self, list[UnpostedProcurementTaxableLevel])
         IPaginateable.__init__(self, UnpostedProcurementTaxableLevel)
 
-        self.count = self._register_child_endpoint(
-            FinanceAccountingUnpostedprocurementIdTaxablelevelsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint object to move down the chain.
@@ -78,5 +75,14 @@ class FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint(
             list[UnpostedProcurementTaxableLevel]: The parsed response data.
         """
         return self._parse_many(
-            UnpostedProcurementTaxableLevel, super()._make_request("GET", data=data, params=params).json()
+            UnpostedProcurementTaxableLevel, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAccountingUnpostedprocurementIdTaxablelevelsCountEndpoint:
+        """
+        The FinanceAccountingUnpostedprocurementIdTaxablelevelsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedprocurementIdTaxablelevelsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -55,5 +55,5 @@ class FinanceAccountingUnpostedprocurementIdTaxablelevelsIdEndpoint(
             UnpostedProcurementTaxableLevel: The parsed response data.
         """
         return self._parse_one(
-            UnpostedProcurementTaxableLevel, super()._make_request("GET", data=data, params=params).json()
+            UnpostedProcurementTaxableLevel, super()._make_request("GET", data=data, params=params).content
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class FinanceAccountingpackagesEndpoint(
         IGettable.__init__(self, list[AccountingPackage])
         IPaginateable.__init__(self, AccountingPackage)
 
-        self.count = self._register_child_endpoint(FinanceAccountingpackagesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceAccountingpackagesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAccountingpackagesIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class FinanceAccountingpackagesEndpoint(
         Returns:
             list[AccountingPackage]: The parsed response data.
         """
-        return self._parse_many(AccountingPackage, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AccountingPackage, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAccountingpackagesCountEndpoint:
+        """
+        The FinanceAccountingpackagesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingpackagesCountEndpoint(self.client, parent_endpoint=self))
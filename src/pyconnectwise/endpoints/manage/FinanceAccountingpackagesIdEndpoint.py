@@ -52,4 +52,4 @@ class FinanceAccountingpackagesIdEndpoint(
         Returns:
             AccountingPackage: The parsed response data.
         """
-        return self._parse_one(AccountingPackage, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AccountingPackage, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class FinanceAccountingpackagesetupEndpoint(
         IGettable.__init__(self, list[AccountingPackageSetup])
         IPaginateable.__init__(self, AccountingPackageSetup)
 
-        self.count = self._register_child_endpoint(
-            FinanceAccountingpackagesetupCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAccountingpackagesetupIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAccountingpackagesetupIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class FinanceAccountingpackagesetupEndpoint(
         Returns:
             list[AccountingPackageSetup]: The parsed response data.
         """
-        return self._parse_many(AccountingPackageSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AccountingPackageSetup, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAccountingpackagesetupCountEndpoint:
+        """
+        The FinanceAccountingpackagesetupCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingpackagesetupCountEndpoint(self.client, parent_endpoint=self)
+        )
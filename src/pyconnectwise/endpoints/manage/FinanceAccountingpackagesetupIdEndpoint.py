@@ -58,7 +58,7 @@ class FinanceAccountingpackagesetupIdEndpoint(
         Returns:
             AccountingPackageSetup: The parsed response data.
         """
-        return self._parse_one(AccountingPackageSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AccountingPackageSetup, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -72,7 +72,7 @@ class FinanceAccountingpackagesetupIdEndpoint(
         Returns:
             AccountingPackageSetup: The parsed response data.
         """
-        return self._parse_one(AccountingPackageSetup, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(AccountingPackageSetup, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -86,4 +86,4 @@ class FinanceAccountingpackagesetupIdEndpoint(
         Returns:
             AccountingPackageSetup: The parsed response data.
         """
-        return self._parse_one(AccountingPackageSetup, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(AccountingPackageSetup, super()._make_request("PUT", data=data, params=params).content)
@@ -67,5 +67,5 @@ class FinanceAgreementrecapIdEndpoint(
         """
         return self._parse_one(
             AgreementRecap,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
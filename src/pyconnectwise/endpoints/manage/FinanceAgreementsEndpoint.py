@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class FinanceAgreementsEndpoint(
         IPostable.__init__(self, Agreement)
         IPaginateable.__init__(self, Agreement)
 
-        self.count = self._register_child_endpoint(FinanceAgreementsCountEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(FinanceAgreementsTypesEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceAgreementsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class FinanceAgreementsEndpoint(
         Returns:
             list[Agreement]: The parsed response data.
         """
-        return self._parse_many(Agreement, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Agreement, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Agreement:
         """
@@ -83,4 +81,18 @@ class FinanceAgreementsEndpoint(
         Returns:
             Agreement: The parsed response data.
         """
-        return self._parse_one(Agreement, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Agreement, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsCountEndpoint:
+        """
+        The FinanceAgreementsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> FinanceAgreementsTypesEndpoint:
+        """
+        The FinanceAgreementsTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsTypesEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class FinanceAgreementsIdAdditionsEndpoint(
         IPostable.__init__(self, Addition)
         IPaginateable.__init__(self, Addition)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsIdAdditionsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAgreementsIdAdditionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdAdditionsIdEndpoint object to move down the chain.
@@ -73,7 +70,7 @@ class FinanceAgreementsIdAdditionsEndpoint(
         Returns:
             list[Addition]: The parsed response data.
         """
-        return self._parse_many(Addition, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Addition, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Addition:
         """
@@ -85,4 +82,13 @@ class FinanceAgreementsIdAdditionsEndpoint(
         Returns:
             Addition: The parsed response data.
         """
-        return self._parse_one(Addition, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Addition, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdAdditionsCountEndpoint:
+        """
+        The FinanceAgreementsIdAdditionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdAdditionsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceAgreementsIdAdjustmentsEndpoint(
         IPostable.__init__(self, AgreementAdjustment)
         IPaginateable.__init__(self, AgreementAdjustment)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsIdAdjustmentsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAgreementsIdAdjustmentsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdAdjustmentsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class FinanceAgreementsIdAdjustmentsEndpoint(
         Returns:
             list[AgreementAdjustment]: The parsed response data.
         """
-        return self._parse_many(AgreementAdjustment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AgreementAdjustment, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -93,4 +90,13 @@ class FinanceAgreementsIdAdjustmentsEndpoint(
         Returns:
             AgreementAdjustment: The parsed response data.
         """
-        return self._parse_one(AgreementAdjustment, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AgreementAdjustment, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdAdjustmentsCountEndpoint:
+        """
+        The FinanceAgreementsIdAdjustmentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdAdjustmentsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -67,5 +67,5 @@ class FinanceAgreementsIdApplicationparametersIdEndpoint(
         """
         return self._parse_one(
             AgreementApplicationParameters,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
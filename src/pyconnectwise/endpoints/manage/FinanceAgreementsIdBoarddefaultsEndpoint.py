@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceAgreementsIdBoarddefaultsEndpoint(
         IPostable.__init__(self, BoardDefault)
         IPaginateable.__init__(self, BoardDefault)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsIdBoarddefaultsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAgreementsIdBoarddefaultsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdBoarddefaultsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class FinanceAgreementsIdBoarddefaultsEndpoint(
         Returns:
             list[BoardDefault]: The parsed response data.
         """
-        return self._parse_many(BoardDefault, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardDefault, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardDefault:
         """
@@ -89,4 +86,13 @@ class FinanceAgreementsIdBoarddefaultsEndpoint(
         Returns:
             BoardDefault: The parsed response data.
         """
-        return self._parse_one(BoardDefault, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BoardDefault, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdBoarddefaultsCountEndpoint:
+        """
+        The FinanceAgreementsIdBoarddefaultsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdBoarddefaultsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -41,32 +42,6 @@ class FinanceAgreementsIdEndpoint(
         IPuttable.__init__(self, Agreement)
         IPaginateable.__init__(self, Agreement)
 
-        self.additions = self._register_child_endpoint(
-            FinanceAgreementsIdAdditionsEndpoint(client, parent_endpoint=self)
-        )
-        self.adjustments = self._register_child_endpoint(
-            FinanceAgreementsIdAdjustmentsEndpoint(client, parent_endpoint=self)
-        )
-        self.board_defaults = self._register_child_endpoint(
-            FinanceAgreementsIdBoarddefaultsEndpoint(client, parent_endpoint=self)
-        )
-        self.configurations = self._register_child_endpoint(
-            FinanceAgreementsIdConfigurationsEndpoint(client, parent_endpoint=self)
-        )
-        self.sites = self._register_child_endpoint(FinanceAgreementsIdSitesEndpoint(client, parent_endpoint=self))
-        self.work_role_exclusions = self._register_child_endpoint(
-            FinanceAgreementsIdWorkroleexclusionsEndpoint(client, parent_endpoint=self)
-        )
-        self.work_type_exclusions = self._register_child_endpoint(
-            FinanceAgreementsIdWorktypeexclusionsEndpoint(client, parent_endpoint=self)
-        )
-        self.workroles = self._register_child_endpoint(
-            FinanceAgreementsIdWorkrolesEndpoint(client, parent_endpoint=self)
-        )
-        self.worktypes = self._register_child_endpoint(
-            FinanceAgreementsIdWorktypesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Agreement]:
@@ -107,7 +82,7 @@ class FinanceAgreementsIdEndpoint(
         Returns:
             Agreement: The parsed response data.
         """
-        return self._parse_one(Agreement, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Agreement, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Agreement:
         """
@@ -119,7 +94,7 @@ class FinanceAgreementsIdEndpoint(
         Returns:
             Agreement: The parsed response data.
         """
-        return self._parse_one(Agreement, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Agreement, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Agreement:
         """
@@ -131,4 +106,75 @@ class FinanceAgreementsIdEndpoint(
         Returns:
             Agreement: The parsed response data.
         """
-        return self._parse_one(Agreement, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Agreement, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def additions(self) -> FinanceAgreementsIdAdditionsEndpoint:
+        """
+        The FinanceAgreementsIdAdditionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsIdAdditionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def adjustments(self) -> FinanceAgreementsIdAdjustmentsEndpoint:
+        """
+        The FinanceAgreementsIdAdjustmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsIdAdjustmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def board_defaults(self) -> FinanceAgreementsIdBoarddefaultsEndpoint:
+        """
+        The FinanceAgreementsIdBoarddefaultsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdBoarddefaultsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def configurations(self) -> FinanceAgreementsIdConfigurationsEndpoint:
+        """
+        The FinanceAgreementsIdConfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdConfigurationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def sites(self) -> FinanceAgreementsIdSitesEndpoint:
+        """
+        The FinanceAgreementsIdSitesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsIdSitesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def work_role_exclusions(self) -> FinanceAgreementsIdWorkroleexclusionsEndpoint:
+        """
+        The FinanceAgreementsIdWorkroleexclusionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdWorkroleexclusionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def work_type_exclusions(self) -> FinanceAgreementsIdWorktypeexclusionsEndpoint:
+        """
+        The FinanceAgreementsIdWorktypeexclusionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdWorktypeexclusionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def workroles(self) -> FinanceAgreementsIdWorkrolesEndpoint:
+        """
+        The FinanceAgreementsIdWorkrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsIdWorkrolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def worktypes(self) -> FinanceAgreementsIdWorktypesEndpoint:
+        """
+        The FinanceAgreementsIdWorktypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsIdWorktypesEndpoint(self.client, parent_endpoint=self))
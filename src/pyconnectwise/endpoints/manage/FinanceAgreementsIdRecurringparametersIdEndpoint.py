@@ -67,5 +67,5 @@ class FinanceAgreementsIdRecurringparametersIdEndpoint(
         """
         return self._parse_one(
             AgreementRecurringParameters,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class FinanceAgreementsIdSitesEndpoint(
         IPostable.__init__(self, AgreementSite)
         IPaginateable.__init__(self, AgreementSite)
 
-        self.count = self._register_child_endpoint(FinanceAgreementsIdSitesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceAgreementsIdSitesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdSitesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class FinanceAgreementsIdSitesEndpoint(
         Returns:
             list[AgreementSite]: The parsed response data.
         """
-        return self._parse_many(AgreementSite, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AgreementSite, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AgreementSite:
         """
@@ -85,4 +84,11 @@ class FinanceAgreementsIdSitesEndpoint(
         Returns:
             AgreementSite: The parsed response data.
         """
-        return self._parse_one(AgreementSite, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AgreementSite, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdSitesCountEndpoint:
+        """
+        The FinanceAgreementsIdSitesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsIdSitesCountEndpoint(self.client, parent_endpoint=self))
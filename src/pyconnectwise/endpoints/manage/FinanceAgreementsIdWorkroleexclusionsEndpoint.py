@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceAgreementsIdWorkroleexclusionsEndpoint(
         IPostable.__init__(self, AgreementWorkRoleExclusion)
         IPaginateable.__init__(self, AgreementWorkRoleExclusion)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsIdWorkroleexclusionsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAgreementsIdWorkroleexclusionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdWorkroleexclusionsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class FinanceAgreementsIdWorkroleexclusionsEndpoint(
             list[AgreementWorkRoleExclusion]: The parsed response data.
         """
         return self._parse_many(
-            AgreementWorkRoleExclusion, super()._make_request("GET", data=data, params=params).json()
+            AgreementWorkRoleExclusion, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class FinanceAgreementsIdWorkroleexclusionsEndpoint(
             AgreementWorkRoleExclusion: The parsed response data.
         """
         return self._parse_one(
-            AgreementWorkRoleExclusion, super()._make_request("POST", data=data, params=params).json()
+            AgreementWorkRoleExclusion, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdWorkroleexclusionsCountEndpoint:
+        """
+        The FinanceAgreementsIdWorkroleexclusionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdWorkroleexclusionsCountEndpoint(self.client, parent_endpoint=self)
         )
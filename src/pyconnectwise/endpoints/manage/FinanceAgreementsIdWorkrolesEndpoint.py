@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class FinanceAgreementsIdWorkrolesEndpoint(
         IPostable.__init__(self, AgreementWorkRole)
         IPaginateable.__init__(self, AgreementWorkRole)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsIdWorkrolesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAgreementsIdWorkrolesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdWorkrolesIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class FinanceAgreementsIdWorkrolesEndpoint(
         Returns:
             list[AgreementWorkRole]: The parsed response data.
         """
-        return self._parse_many(AgreementWorkRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AgreementWorkRole, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AgreementWorkRole:
         """
@@ -89,4 +86,13 @@ class FinanceAgreementsIdWorkrolesEndpoint(
         Returns:
             AgreementWorkRole: The parsed response data.
         """
-        return self._parse_one(AgreementWorkRole, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AgreementWorkRole, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdWorkrolesCountEndpoint:
+        """
+        The FinanceAgreementsIdWorkrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdWorkrolesCountEndpoint(self.client, parent_endpoint=self)
+        )
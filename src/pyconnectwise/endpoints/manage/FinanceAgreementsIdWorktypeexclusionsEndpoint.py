@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceAgreementsIdWorktypeexclusionsEndpoint(
         IPostable.__init__(self, AgreementWorkTypeExclusion)
         IPaginateable.__init__(self, AgreementWorkTypeExclusion)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsIdWorktypeexclusionsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAgreementsIdWorktypeexclusionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdWorktypeexclusionsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class FinanceAgreementsIdWorktypeexclusionsEndpoint(
             list[AgreementWorkTypeExclusion]: The parsed response data.
         """
         return self._parse_many(
-            AgreementWorkTypeExclusion, super()._make_request("GET", data=data, params=params).json()
+            AgreementWorkTypeExclusion, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class FinanceAgreementsIdWorktypeexclusionsEndpoint(
             AgreementWorkTypeExclusion: The parsed response data.
         """
         return self._parse_one(
-            AgreementWorkTypeExclusion, super()._make_request("POST", data=data, params=params).json()
+            AgreementWorkTypeExclusion, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdWorktypeexclusionsCountEndpoint:
+        """
+        The FinanceAgreementsIdWorktypeexclusionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdWorktypeexclusionsCountEndpoint(self.client, parent_endpoint=self)
         )
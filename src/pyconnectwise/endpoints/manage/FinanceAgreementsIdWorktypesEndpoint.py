@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class FinanceAgreementsIdWorktypesEndpoint(
         IPostable.__init__(self, AgreementWorkType)
         IPaginateable.__init__(self, AgreementWorkType)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsIdWorktypesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAgreementsIdWorktypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdWorktypesIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class FinanceAgreementsIdWorktypesEndpoint(
         Returns:
             list[AgreementWorkType]: The parsed response data.
         """
-        return self._parse_many(AgreementWorkType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AgreementWorkType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AgreementWorkType:
         """
@@ -89,4 +86,13 @@ class FinanceAgreementsIdWorktypesEndpoint(
         Returns:
             AgreementWorkType: The parsed response data.
         """
-        return self._parse_one(AgreementWorkType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AgreementWorkType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdWorktypesCountEndpoint:
+        """
+        The FinanceAgreementsIdWorktypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdWorktypesCountEndpoint(self.client, parent_endpoint=self)
+        )
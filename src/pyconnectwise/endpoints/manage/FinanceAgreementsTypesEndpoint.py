@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class FinanceAgreementsTypesEndpoint(
         IPostable.__init__(self, AgreementType)
         IPaginateable.__init__(self, AgreementType)
 
-        self.count = self._register_child_endpoint(FinanceAgreementsTypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(FinanceAgreementsTypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceAgreementsTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementsTypesIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class FinanceAgreementsTypesEndpoint(
         Returns:
             list[AgreementType]: The parsed response data.
         """
-        return self._parse_many(AgreementType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AgreementType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AgreementType:
         """
@@ -87,4 +85,18 @@ class FinanceAgreementsTypesEndpoint(
         Returns:
             AgreementType: The parsed response data.
         """
-        return self._parse_one(AgreementType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AgreementType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsTypesCountEndpoint:
+        """
+        The FinanceAgreementsTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceAgreementsTypesInfoEndpoint:
+        """
+        The FinanceAgreementsTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsTypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -32,5 +32,5 @@ class FinanceAgreementsTypesIdCopyEndpoint(
         """
         return self._parse_one(
             AgreementType,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
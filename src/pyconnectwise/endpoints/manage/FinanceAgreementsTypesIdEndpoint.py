@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,11 +27,6 @@ class FinanceAgreementsTypesIdEndpoint(
         IPuttable.__init__(self, AgreementType)
         IPaginateable.__init__(self, AgreementType)
 
-        self.info = self._register_child_endpoint(FinanceAgreementsTypesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(
-            FinanceAgreementsTypesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[AgreementType]:
@@ -73,7 +69,7 @@ class FinanceAgreementsTypesIdEndpoint(
         Returns:
             AgreementType: The parsed response data.
         """
-        return self._parse_one(AgreementType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AgreementType, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> AgreementType:
         """
@@ -85,7 +81,7 @@ class FinanceAgreementsTypesIdEndpoint(
         Returns:
             AgreementType: The parsed response data.
         """
-        return self._parse_one(AgreementType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(AgreementType, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AgreementType:
         """
@@ -97,4 +93,18 @@ class FinanceAgreementsTypesIdEndpoint(
         Returns:
             AgreementType: The parsed response data.
         """
-        return self._parse_one(AgreementType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(AgreementType, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> FinanceAgreementsTypesIdInfoEndpoint:
+        """
+        The FinanceAgreementsTypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsTypesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> FinanceAgreementsTypesIdUsagesEndpoint:
+        """
+        The FinanceAgreementsTypesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsTypesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class FinanceAgreementsTypesIdInfoEndpoint(
         Returns:
             AgreementTypeInfo: The parsed response data.
         """
-        return self._parse_one(AgreementTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AgreementTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class FinanceAgreementsTypesInfoEndpoint(
         IGettable.__init__(self, list[AgreementTypeInfo])
         IPaginateable.__init__(self, AgreementTypeInfo)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementsTypesInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[AgreementTypeInfo]:
@@ -61,4 +58,11 @@ class FinanceAgreementsTypesInfoEndpoint(
         Returns:
             list[AgreementTypeInfo]: The parsed response data.
         """
-        return self._parse_many(AgreementTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AgreementTypeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsTypesInfoCountEndpoint:
+        """
+        The FinanceAgreementsTypesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsTypesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceAgreementtypesIdBoarddefaultsEndpoint(
         IPostable.__init__(self, AgreementTypeBoardDefault)
         IPaginateable.__init__(self, AgreementTypeBoardDefault)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementtypesIdBoarddefaultsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAgreementtypesIdBoarddefaultsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdBoarddefaultsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class FinanceAgreementtypesIdBoarddefaultsEndpoint(
             list[AgreementTypeBoardDefault]: The parsed response data.
         """
         return self._parse_many(
-            AgreementTypeBoardDefault, super()._make_request("GET", data=data, params=params).json()
+            AgreementTypeBoardDefault, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class FinanceAgreementtypesIdBoarddefaultsEndpoint(
             AgreementTypeBoardDefault: The parsed response data.
         """
         return self._parse_one(
-            AgreementTypeBoardDefault, super()._make_request("POST", data=data, params=params).json()
+            AgreementTypeBoardDefault, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementtypesIdBoarddefaultsCountEndpoint:
+        """
+        The FinanceAgreementtypesIdBoarddefaultsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdBoarddefaultsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,18 +26,47 @@ class FinanceAgreementtypesIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.board_defaults = self._register_child_endpoint(
-            FinanceAgreementtypesIdBoarddefaultsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def board_defaults(self) -> FinanceAgreementtypesIdBoarddefaultsEndpoint:
+        """
+        The FinanceAgreementtypesIdBoarddefaultsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdBoarddefaultsEndpoint(self.client, parent_endpoint=self)
         )
-        self.work_role_exclusions = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorkroleexclusionsEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def work_role_exclusions(self) -> FinanceAgreementtypesIdWorkroleexclusionsEndpoint:
+        """
+        The FinanceAgreementtypesIdWorkroleexclusionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorkroleexclusionsEndpoint(self.client, parent_endpoint=self)
         )
-        self.work_type_exclusions = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorktypeexclusionsEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def work_type_exclusions(self) -> FinanceAgreementtypesIdWorktypeexclusionsEndpoint:
+        """
+        The FinanceAgreementtypesIdWorktypeexclusionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorktypeexclusionsEndpoint(self.client, parent_endpoint=self)
         )
-        self.workroles = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorkrolesEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def workroles(self) -> FinanceAgreementtypesIdWorkrolesEndpoint:
+        """
+        The FinanceAgreementtypesIdWorkrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorkrolesEndpoint(self.client, parent_endpoint=self)
         )
-        self.worktypes = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorktypesEndpoint(client, parent_endpoint=self)
+
+    @cached_property
+    def worktypes(self) -> FinanceAgreementtypesIdWorktypesEndpoint:
+        """
+        The FinanceAgreementtypesIdWorktypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorktypesEndpoint(self.client, parent_endpoint=self)
         )
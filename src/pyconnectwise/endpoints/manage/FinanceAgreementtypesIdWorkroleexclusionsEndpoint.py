@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceAgreementtypesIdWorkroleexclusionsEndpoint(
         IPostable.__init__(self, AgreementTypeWorkRoleExclusion)
         IPaginateable.__init__(self, AgreementTypeWorkRoleExclusion)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorkroleexclusionsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAgreementtypesIdWorkroleexclusionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdWorkroleexclusionsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class FinanceAgreementtypesIdWorkroleexclusionsEndpoint(
             list[AgreementTypeWorkRoleExclusion]: The parsed response data.
         """
         return self._parse_many(
-            AgreementTypeWorkRoleExclusion, super()._make_request("GET", data=data, params=params).json()
+            AgreementTypeWorkRoleExclusion, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class FinanceAgreementtypesIdWorkroleexclusionsEndpoint(
             AgreementTypeWorkRoleExclusion: The parsed response data.
         """
         return self._parse_one(
-            AgreementTypeWorkRoleExclusion, super()._make_request("POST", data=data, params=params).json()
+            AgreementTypeWorkRoleExclusion, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementtypesIdWorkroleexclusionsCountEndpoint:
+        """
+        The FinanceAgreementtypesIdWorkroleexclusionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorkroleexclusionsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -65,5 +65,5 @@ class FinanceAgreementtypesIdWorkroleexclusionsIdEndpoint(
             AgreementTypeWorkRoleExclusion: The parsed response data.
         """
         return self._parse_one(
-            AgreementTypeWorkRoleExclusion, super()._make_request("GET", data=data, params=params).json()
+            AgreementTypeWorkRoleExclusion, super()._make_request("GET", data=data, params=params).content
         )
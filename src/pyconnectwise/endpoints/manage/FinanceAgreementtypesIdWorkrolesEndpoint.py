@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -31,13 +32,6 @@ class FinanceAgreementtypesIdWorkrolesEndpoint(
         IPostable.__init__(self, AgreementTypeWorkRole)
         IPaginateable.__init__(self, AgreementTypeWorkRole)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorkrolesCountEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorkrolesInfoEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAgreementtypesIdWorkrolesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdWorkrolesIdEndpoint object to move down the chain.
@@ -85,7 +79,7 @@ class FinanceAgreementtypesIdWorkrolesEndpoint(
         Returns:
             list[AgreementTypeWorkRole]: The parsed response data.
         """
-        return self._parse_many(AgreementTypeWorkRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AgreementTypeWorkRole, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -99,4 +93,22 @@ class FinanceAgreementtypesIdWorkrolesEndpoint(
         Returns:
             AgreementTypeWorkRole: The parsed response data.
         """
-        return self._parse_one(AgreementTypeWorkRole, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AgreementTypeWorkRole, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementtypesIdWorkrolesCountEndpoint:
+        """
+        The FinanceAgreementtypesIdWorkrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorkrolesCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> FinanceAgreementtypesIdWorkrolesInfoEndpoint:
+        """
+        The FinanceAgreementtypesIdWorkrolesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorkrolesInfoEndpoint(self.client, parent_endpoint=self)
+        )
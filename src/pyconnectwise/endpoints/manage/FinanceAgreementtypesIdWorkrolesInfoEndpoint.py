@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class FinanceAgreementtypesIdWorkrolesInfoEndpoint(
         IGettable.__init__(self, list[AgreementTypeWorkRoleInfo])
         IPaginateable.__init__(self, AgreementTypeWorkRoleInfo)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorkrolesInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAgreementtypesIdWorkrolesInfoIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdWorkrolesInfoIdEndpoint object to move down the chain.
@@ -78,5 +75,14 @@ class FinanceAgreementtypesIdWorkrolesInfoEndpoint(
             list[AgreementTypeWorkRoleInfo]: The parsed response data.
         """
         return self._parse_many(
-            AgreementTypeWorkRoleInfo, super()._make_request("GET", data=data, params=params).json()
+            AgreementTypeWorkRoleInfo, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementtypesIdWorkrolesInfoCountEndpoint:
+        """
+        The FinanceAgreementtypesIdWorkrolesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorkrolesInfoCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -54,4 +54,6 @@ class FinanceAgreementtypesIdWorkrolesInfoIdEndpoint(
         Returns:
             AgreementTypeWorkRoleInfo: The parsed response data.
         """
-        return self._parse_one(AgreementTypeWorkRoleInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(
+            AgreementTypeWorkRoleInfo, super()._make_request("GET", data=data, params=params).content
+        )
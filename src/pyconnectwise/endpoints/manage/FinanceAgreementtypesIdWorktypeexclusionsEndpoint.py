@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceAgreementtypesIdWorktypeexclusionsEndpoint(
         IPostable.__init__(self, AgreementTypeWorkTypeExclusion)
         IPaginateable.__init__(self, AgreementTypeWorkTypeExclusion)
 
-        self.count = self._register_child_endpoint(
-            FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class FinanceAgreementtypesIdWorktypeexclusionsEndpoint(
             list[AgreementTypeWorkTypeExclusion]: The parsed response data.
         """
         return self._parse_many(
-            AgreementTypeWorkTypeExclusion, super()._make_request("GET", data=data, params=params).json()
+            AgreementTypeWorkTypeExclusion, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class FinanceAgreementtypesIdWorktypeexclusionsEndpoint(
             AgreementTypeWorkTypeExclusion: The parsed response data.
         """
         return self._parse_one(
-            AgreementTypeWorkTypeExclusion, super()._make_request("POST", data=data, params=params).json()
+            AgreementTypeWorkTypeExclusion, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint:
+        """
+        The FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint(self.client, parent_endpoint=self)
         )
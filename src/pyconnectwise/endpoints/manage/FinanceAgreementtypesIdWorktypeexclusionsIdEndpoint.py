@@ -65,5 +65,5 @@ class FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint(
             AgreementTypeWorkTypeExclusion: The parsed response data.
         """
         return self._parse_one(
-            AgreementTypeWorkTypeExclusion, super()._make_request("GET", data=data, params=params).json()
+            AgreementTypeWorkTypeExclusion, super()._make_request("GET", data=data, params=params).content
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class FinanceBatchsetupsEndpoint(
         IGettable.__init__(self, list[AgreementBatchSetup])
         IPaginateable.__init__(self, AgreementBatchSetup)
 
-        self.count = self._register_child_endpoint(FinanceBatchsetupsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceBatchsetupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceBatchsetupsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class FinanceBatchsetupsEndpoint(
         Returns:
             list[AgreementBatchSetup]: The parsed response data.
         """
-        return self._parse_many(AgreementBatchSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AgreementBatchSetup, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceBatchsetupsCountEndpoint:
+        """
+        The FinanceBatchsetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBatchsetupsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class FinanceBillingcyclesEndpoint(
         IPostable.__init__(self, BillingCycle)
         IPaginateable.__init__(self, BillingCycle)
 
-        self.count = self._register_child_endpoint(FinanceBillingcyclesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(FinanceBillingcyclesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceBillingcyclesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceBillingcyclesIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class FinanceBillingcyclesEndpoint(
         Returns:
             list[BillingCycle]: The parsed response data.
         """
-        return self._parse_many(BillingCycle, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BillingCycle, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BillingCycle:
         """
@@ -85,4 +83,18 @@ class FinanceBillingcyclesEndpoint(
         Returns:
             BillingCycle: The parsed response data.
         """
-        return self._parse_one(BillingCycle, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BillingCycle, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceBillingcyclesCountEndpoint:
+        """
+        The FinanceBillingcyclesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingcyclesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceBillingcyclesInfoEndpoint:
+        """
+        The FinanceBillingcyclesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingcyclesInfoEndpoint(self.client, parent_endpoint=self))
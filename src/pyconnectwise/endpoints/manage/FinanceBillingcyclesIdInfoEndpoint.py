@@ -52,4 +52,4 @@ class FinanceBillingcyclesIdInfoEndpoint(
         Returns:
             BillingCycleInfo: The parsed response data.
         """
-        return self._parse_one(BillingCycleInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BillingCycleInfo, super()._make_request("GET", data=data, params=params).content)
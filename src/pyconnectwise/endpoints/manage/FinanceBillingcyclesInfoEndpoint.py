@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class FinanceBillingcyclesInfoEndpoint(
         IGettable.__init__(self, list[BillingCycleInfo])
         IPaginateable.__init__(self, BillingCycleInfo)
 
-        self.count = self._register_child_endpoint(FinanceBillingcyclesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[BillingCycleInfo]:
@@ -57,4 +56,11 @@ class FinanceBillingcyclesInfoEndpoint(
         Returns:
             list[BillingCycleInfo]: The parsed response data.
         """
-        return self._parse_many(BillingCycleInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BillingCycleInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceBillingcyclesInfoCountEndpoint:
+        """
+        The FinanceBillingcyclesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingcyclesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class FinanceBillingsetupsEndpoint(
         IPostable.__init__(self, BillingSetup)
         IPaginateable.__init__(self, BillingSetup)
 
-        self.count = self._register_child_endpoint(FinanceBillingsetupsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(FinanceBillingsetupsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceBillingsetupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceBillingsetupsIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class FinanceBillingsetupsEndpoint(
         Returns:
             list[BillingSetup]: The parsed response data.
         """
-        return self._parse_many(BillingSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BillingSetup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BillingSetup:
         """
@@ -85,4 +83,18 @@ class FinanceBillingsetupsEndpoint(
         Returns:
             BillingSetup: The parsed response data.
         """
-        return self._parse_one(BillingSetup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BillingSetup, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceBillingsetupsCountEndpoint:
+        """
+        The FinanceBillingsetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingsetupsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceBillingsetupsInfoEndpoint:
+        """
+        The FinanceBillingsetupsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingsetupsInfoEndpoint(self.client, parent_endpoint=self))
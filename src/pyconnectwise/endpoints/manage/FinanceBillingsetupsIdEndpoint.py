@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,11 +27,6 @@ class FinanceBillingsetupsIdEndpoint(
         IPuttable.__init__(self, BillingSetup)
         IPaginateable.__init__(self, BillingSetup)
 
-        self.info = self._register_child_endpoint(FinanceBillingsetupsIdInfoEndpoint(client, parent_endpoint=self))
-        self.routings = self._register_child_endpoint(
-            FinanceBillingsetupsIdRoutingsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[BillingSetup]:
@@ -73,7 +69,7 @@ class FinanceBillingsetupsIdEndpoint(
         Returns:
             BillingSetup: The parsed response data.
         """
-        return self._parse_one(BillingSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BillingSetup, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> BillingSetup:
         """
@@ -85,7 +81,7 @@ class FinanceBillingsetupsIdEndpoint(
         Returns:
             BillingSetup: The parsed response data.
         """
-        return self._parse_one(BillingSetup, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(BillingSetup, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BillingSetup:
         """
@@ -97,4 +93,18 @@ class FinanceBillingsetupsIdEndpoint(
         Returns:
             BillingSetup: The parsed response data.
         """
-        return self._parse_one(BillingSetup, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(BillingSetup, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> FinanceBillingsetupsIdInfoEndpoint:
+        """
+        The FinanceBillingsetupsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingsetupsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def routings(self) -> FinanceBillingsetupsIdRoutingsEndpoint:
+        """
+        The FinanceBillingsetupsIdRoutingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingsetupsIdRoutingsEndpoint(self.client, parent_endpoint=self))
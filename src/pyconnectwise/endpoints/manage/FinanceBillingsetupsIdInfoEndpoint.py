@@ -52,4 +52,4 @@ class FinanceBillingsetupsIdInfoEndpoint(
         Returns:
             BillingSetupInfo: The parsed response data.
         """
-        return self._parse_one(BillingSetupInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BillingSetupInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceBillingsetupsIdRoutingsEndpoint(
         IPostable.__init__(self, BillingSetupRouting)
         IPaginateable.__init__(self, BillingSetupRouting)
 
-        self.count = self._register_child_endpoint(
-            FinanceBillingsetupsIdRoutingsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceBillingsetupsIdRoutingsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceBillingsetupsIdRoutingsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class FinanceBillingsetupsIdRoutingsEndpoint(
         Returns:
             list[BillingSetupRouting]: The parsed response data.
         """
-        return self._parse_many(BillingSetupRouting, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BillingSetupRouting, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -93,4 +90,13 @@ class FinanceBillingsetupsIdRoutingsEndpoint(
         Returns:
             BillingSetupRouting: The parsed response data.
         """
-        return self._parse_one(BillingSetupRouting, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BillingSetupRouting, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceBillingsetupsIdRoutingsCountEndpoint:
+        """
+        The FinanceBillingsetupsIdRoutingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceBillingsetupsIdRoutingsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -54,4 +54,4 @@ class FinanceBillingsetupsInfoEndpoint(
         Returns:
             list[BillingSetupInfo]: The parsed response data.
         """
-        return self._parse_many(BillingSetupInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BillingSetupInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class FinanceBillingstatusesEndpoint(
         IPostable.__init__(self, BillingStatus)
         IPaginateable.__init__(self, BillingStatus)
 
-        self.count = self._register_child_endpoint(FinanceBillingstatusesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(FinanceBillingstatusesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceBillingstatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceBillingstatusesIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class FinanceBillingstatusesEndpoint(
         Returns:
             list[BillingStatus]: The parsed response data.
         """
-        return self._parse_many(BillingStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BillingStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BillingStatus:
         """
@@ -87,4 +85,18 @@ class FinanceBillingstatusesEndpoint(
         Returns:
             BillingStatus: The parsed response data.
         """
-        return self._parse_one(BillingStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BillingStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceBillingstatusesCountEndpoint:
+        """
+        The FinanceBillingstatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingstatusesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceBillingstatusesInfoEndpoint:
+        """
+        The FinanceBillingstatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingstatusesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,11 +27,6 @@ class FinanceBillingstatusesIdEndpoint(
         IPuttable.__init__(self, BillingStatus)
         IPaginateable.__init__(self, BillingStatus)
 
-        self.info = self._register_child_endpoint(FinanceBillingstatusesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(
-            FinanceBillingstatusesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[BillingStatus]:
@@ -73,7 +69,7 @@ class FinanceBillingstatusesIdEndpoint(
         Returns:
             BillingStatus: The parsed response data.
         """
-        return self._parse_one(BillingStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BillingStatus, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> BillingStatus:
         """
@@ -85,7 +81,7 @@ class FinanceBillingstatusesIdEndpoint(
         Returns:
             BillingStatus: The parsed response data.
         """
-        return self._parse_one(BillingStatus, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(BillingStatus, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BillingStatus:
         """
@@ -97,4 +93,18 @@ class FinanceBillingstatusesIdEndpoint(
         Returns:
             BillingStatus: The parsed response data.
         """
-        return self._parse_one(BillingStatus, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(BillingStatus, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> FinanceBillingstatusesIdInfoEndpoint:
+        """
+        The FinanceBillingstatusesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingstatusesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> FinanceBillingstatusesIdUsagesEndpoint:
+        """
+        The FinanceBillingstatusesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingstatusesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class FinanceBillingstatusesIdInfoEndpoint(
         Returns:
             BillingStatusInfo: The parsed response data.
         """
-        return self._parse_one(BillingStatusInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BillingStatusInfo, super()._make_request("GET", data=data, params=params).content)
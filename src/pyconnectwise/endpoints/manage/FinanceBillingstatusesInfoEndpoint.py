@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class FinanceBillingstatusesInfoEndpoint(
         IGettable.__init__(self, list[BillingStatusInfo])
         IPaginateable.__init__(self, BillingStatusInfo)
 
-        self.count = self._register_child_endpoint(
-            FinanceBillingstatusesInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[BillingStatusInfo]:
@@ -61,4 +58,11 @@ class FinanceBillingstatusesInfoEndpoint(
         Returns:
             list[BillingStatusInfo]: The parsed response data.
         """
-        return self._parse_many(BillingStatusInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BillingStatusInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceBillingstatusesInfoCountEndpoint:
+        """
+        The FinanceBillingstatusesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingstatusesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class FinanceBillingtermsEndpoint(
         IPostable.__init__(self, BillingTerm)
         IPaginateable.__init__(self, BillingTerm)
 
-        self.count = self._register_child_endpoint(FinanceBillingtermsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(FinanceBillingtermsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceBillingtermsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceBillingtermsIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class FinanceBillingtermsEndpoint(
         Returns:
             list[BillingTerm]: The parsed response data.
         """
-        return self._parse_many(BillingTerm, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BillingTerm, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BillingTerm:
         """
@@ -85,4 +83,18 @@ class FinanceBillingtermsEndpoint(
         Returns:
             BillingTerm: The parsed response data.
         """
-        return self._parse_one(BillingTerm, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BillingTerm, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceBillingtermsCountEndpoint:
+        """
+        The FinanceBillingtermsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingtermsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceBillingtermsInfoEndpoint:
+        """
+        The FinanceBillingtermsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingtermsInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class FinanceBillingtermsIdInfoEndpoint(
         Returns:
             BillingTermInfo: The parsed response data.
         """
-        return self._parse_one(BillingTermInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BillingTermInfo, super()._make_request("GET", data=data, params=params).content)
@@ -29,7 +29,7 @@ class FinanceClosedinvoicesIdEndpoint(
         Returns:
             ClosedInvoice: The parsed response data.
         """
-        return self._parse_one(ClosedInvoice, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ClosedInvoice, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ClosedInvoice:
         """
@@ -41,4 +41,4 @@ class FinanceClosedinvoicesIdEndpoint(
         Returns:
             ClosedInvoice: The parsed response data.
         """
-        return self._parse_one(ClosedInvoice, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ClosedInvoice, super()._make_request("PUT", data=data, params=params).content)
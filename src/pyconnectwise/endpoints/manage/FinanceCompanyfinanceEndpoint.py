@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -12,8 +13,6 @@ class FinanceCompanyfinanceEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "companyFinance", parent_endpoint=parent_endpoint)
 
-        self.count = self._register_child_endpoint(FinanceCompanyfinanceCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceCompanyfinanceIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceCompanyfinanceIdEndpoint object to move down the chain.
@@ -26,3 +25,10 @@ class FinanceCompanyfinanceEndpoint(ConnectWiseEndpoint):
         child = FinanceCompanyfinanceIdEndpoint(self.client, parent_endpoint=self)
         child._id = _id
         return child
+
+    @cached_property
+    def count(self) -> FinanceCompanyfinanceCountEndpoint:
+        """
+        The FinanceCompanyfinanceCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCompanyfinanceCountEndpoint(self.client, parent_endpoint=self))
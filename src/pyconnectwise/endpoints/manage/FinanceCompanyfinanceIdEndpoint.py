@@ -54,7 +54,7 @@ class FinanceCompanyfinanceIdEndpoint(
         Returns:
             CompanyFinance: The parsed response data.
         """
-        return self._parse_one(CompanyFinance, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CompanyFinance, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> CompanyFinance:
         """
@@ -66,4 +66,4 @@ class FinanceCompanyfinanceIdEndpoint(
         Returns:
             CompanyFinance: The parsed response data.
         """
-        return self._parse_one(CompanyFinance, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(CompanyFinance, super()._make_request("PATCH", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class FinanceCurrenciesEndpoint(
         IPostable.__init__(self, FinanceCurrency)
         IPaginateable.__init__(self, FinanceCurrency)
 
-        self.count = self._register_child_endpoint(FinanceCurrenciesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(FinanceCurrenciesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceCurrenciesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceCurrenciesIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class FinanceCurrenciesEndpoint(
         Returns:
             list[FinanceCurrency]: The parsed response data.
         """
-        return self._parse_many(FinanceCurrency, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(FinanceCurrency, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> FinanceCurrency:
         """
@@ -87,4 +85,18 @@ class FinanceCurrenciesEndpoint(
         Returns:
             FinanceCurrency: The parsed response data.
         """
-        return self._parse_one(FinanceCurrency, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(FinanceCurrency, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceCurrenciesCountEndpoint:
+        """
+        The FinanceCurrenciesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCurrenciesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceCurrenciesInfoEndpoint:
+        """
+        The FinanceCurrenciesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCurrenciesInfoEndpoint(self.client, parent_endpoint=self))
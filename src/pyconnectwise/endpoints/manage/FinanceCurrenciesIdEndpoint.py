@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class FinanceCurrenciesIdEndpoint(
         IPuttable.__init__(self, FinanceCurrency)
         IPaginateable.__init__(self, FinanceCurrency)
 
-        self.info = self._register_child_endpoint(FinanceCurrenciesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(FinanceCurrenciesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[FinanceCurrency]:
@@ -71,7 +69,7 @@ class FinanceCurrenciesIdEndpoint(
         Returns:
             FinanceCurrency: The parsed response data.
         """
-        return self._parse_one(FinanceCurrency, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(FinanceCurrency, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> FinanceCurrency:
         """
@@ -83,7 +81,7 @@ class FinanceCurrenciesIdEndpoint(
         Returns:
             FinanceCurrency: The parsed response data.
         """
-        return self._parse_one(FinanceCurrency, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(FinanceCurrency, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> FinanceCurrency:
         """
@@ -95,4 +93,18 @@ class FinanceCurrenciesIdEndpoint(
         Returns:
             FinanceCurrency: The parsed response data.
         """
-        return self._parse_one(FinanceCurrency, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(FinanceCurrency, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> FinanceCurrenciesIdInfoEndpoint:
+        """
+        The FinanceCurrenciesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCurrenciesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> FinanceCurrenciesIdUsagesEndpoint:
+        """
+        The FinanceCurrenciesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCurrenciesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class FinanceCurrenciesIdInfoEndpoint(
         Returns:
             CurrencyInfo: The parsed response data.
         """
-        return self._parse_one(CurrencyInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CurrencyInfo, super()._make_request("GET", data=data, params=params).content)
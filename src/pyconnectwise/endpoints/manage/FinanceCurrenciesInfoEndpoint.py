@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class FinanceCurrenciesInfoEndpoint(
         IGettable.__init__(self, list[CurrencyInfo])
         IPaginateable.__init__(self, CurrencyInfo)
 
-        self.count = self._register_child_endpoint(FinanceCurrenciesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[CurrencyInfo]:
@@ -55,4 +54,11 @@ class FinanceCurrenciesInfoEndpoint(
         Returns:
             list[CurrencyInfo]: The parsed response data.
         """
-        return self._parse_many(CurrencyInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CurrencyInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceCurrenciesInfoCountEndpoint:
+        """
+        The FinanceCurrenciesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCurrenciesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class FinanceDeliverymethodsEndpoint(
         IPostable.__init__(self, DeliveryMethod)
         IPaginateable.__init__(self, DeliveryMethod)
 
-        self.count = self._register_child_endpoint(FinanceDeliverymethodsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceDeliverymethodsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceDeliverymethodsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class FinanceDeliverymethodsEndpoint(
         Returns:
             list[DeliveryMethod]: The parsed response data.
         """
-        return self._parse_many(DeliveryMethod, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DeliveryMethod, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> DeliveryMethod:
         """
@@ -85,4 +84,11 @@ class FinanceDeliverymethodsEndpoint(
         Returns:
             DeliveryMethod: The parsed response data.
         """
-        return self._parse_one(DeliveryMethod, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(DeliveryMethod, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceDeliverymethodsCountEndpoint:
+        """
+        The FinanceDeliverymethodsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceDeliverymethodsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -34,49 +35,170 @@ class FinanceEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "finance", parent_endpoint=parent_endpoint)
 
-        self.accounting = self._register_child_endpoint(FinanceAccountingEndpoint(client, parent_endpoint=self))
-        self.accounting_package_setup = self._register_child_endpoint(
-            FinanceAccountingpackagesetupEndpoint(client, parent_endpoint=self)
-        )
-        self.accounting_packages = self._register_child_endpoint(
-            FinanceAccountingpackagesEndpoint(client, parent_endpoint=self)
-        )
-        self.agreement_types = self._register_child_endpoint(
-            FinanceAgreementtypesEndpoint(client, parent_endpoint=self)
-        )
-        self.agreements = self._register_child_endpoint(FinanceAgreementsEndpoint(client, parent_endpoint=self))
-        self.batch_setups = self._register_child_endpoint(FinanceBatchsetupsEndpoint(client, parent_endpoint=self))
-        self.billing_cycles = self._register_child_endpoint(FinanceBillingcyclesEndpoint(client, parent_endpoint=self))
-        self.billing_setups = self._register_child_endpoint(FinanceBillingsetupsEndpoint(client, parent_endpoint=self))
-        self.billing_statuses = self._register_child_endpoint(
-            FinanceBillingstatusesEndpoint(client, parent_endpoint=self)
-        )
-        self.billing_terms = self._register_child_endpoint(FinanceBillingtermsEndpoint(client, parent_endpoint=self))
-        self.closed_invoices = self._register_child_endpoint(
-            FinanceClosedinvoicesEndpoint(client, parent_endpoint=self)
-        )
-        self.company_finance = self._register_child_endpoint(
-            FinanceCompanyfinanceEndpoint(client, parent_endpoint=self)
-        )
-        self.currencies = self._register_child_endpoint(FinanceCurrenciesEndpoint(client, parent_endpoint=self))
-        self.delivery_methods = self._register_child_endpoint(
-            FinanceDeliverymethodsEndpoint(client, parent_endpoint=self)
-        )
-        self.gl_accounts = self._register_child_endpoint(FinanceGlaccountsEndpoint(client, parent_endpoint=self))
-        self.gl_captions = self._register_child_endpoint(FinanceGlcaptionsEndpoint(client, parent_endpoint=self))
-        self.glpaths = self._register_child_endpoint(FinanceGlpathsEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(FinanceInfoEndpoint(client, parent_endpoint=self))
-        self.invoice_email_templates = self._register_child_endpoint(
-            FinanceInvoiceemailtemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.invoice_template_setups = self._register_child_endpoint(
-            FinanceInvoicetemplatesetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.invoice_templates = self._register_child_endpoint(
-            FinanceInvoicetemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.invoices = self._register_child_endpoint(FinanceInvoicesEndpoint(client, parent_endpoint=self))
-        self.tax_codes = self._register_child_endpoint(FinanceTaxcodesEndpoint(client, parent_endpoint=self))
-        self.tax_integrations = self._register_child_endpoint(
-            FinanceTaxintegrationsEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def accounting(self) -> FinanceAccountingEndpoint:
+        """
+        The FinanceAccountingEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def accounting_package_setup(self) -> FinanceAccountingpackagesetupEndpoint:
+        """
+        The FinanceAccountingpackagesetupEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingpackagesetupEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def accounting_packages(self) -> FinanceAccountingpackagesEndpoint:
+        """
+        The FinanceAccountingpackagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingpackagesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def agreement_types(self) -> FinanceAgreementtypesEndpoint:
+        """
+        The FinanceAgreementtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementtypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def agreements(self) -> FinanceAgreementsEndpoint:
+        """
+        The FinanceAgreementsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def batch_setups(self) -> FinanceBatchsetupsEndpoint:
+        """
+        The FinanceBatchsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBatchsetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def billing_cycles(self) -> FinanceBillingcyclesEndpoint:
+        """
+        The FinanceBillingcyclesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingcyclesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def billing_setups(self) -> FinanceBillingsetupsEndpoint:
+        """
+        The FinanceBillingsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingsetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def billing_statuses(self) -> FinanceBillingstatusesEndpoint:
+        """
+        The FinanceBillingstatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingstatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def billing_terms(self) -> FinanceBillingtermsEndpoint:
+        """
+        The FinanceBillingtermsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingtermsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def closed_invoices(self) -> FinanceClosedinvoicesEndpoint:
+        """
+        The FinanceClosedinvoicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceClosedinvoicesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def company_finance(self) -> FinanceCompanyfinanceEndpoint:
+        """
+        The FinanceCompanyfinanceEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCompanyfinanceEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def currencies(self) -> FinanceCurrenciesEndpoint:
+        """
+        The FinanceCurrenciesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCurrenciesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def delivery_methods(self) -> FinanceDeliverymethodsEndpoint:
+        """
+        The FinanceDeliverymethodsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceDeliverymethodsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def gl_accounts(self) -> FinanceGlaccountsEndpoint:
+        """
+        The FinanceGlaccountsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlaccountsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def gl_captions(self) -> FinanceGlcaptionsEndpoint:
+        """
+        The FinanceGlcaptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlcaptionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def glpaths(self) -> FinanceGlpathsEndpoint:
+        """
+        The FinanceGlpathsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlpathsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceInfoEndpoint:
+        """
+        The FinanceInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def invoice_email_templates(self) -> FinanceInvoiceemailtemplatesEndpoint:
+        """
+        The FinanceInvoiceemailtemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoiceemailtemplatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def invoice_template_setups(self) -> FinanceInvoicetemplatesetupsEndpoint:
+        """
+        The FinanceInvoicetemplatesetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoicetemplatesetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def invoice_templates(self) -> FinanceInvoicetemplatesEndpoint:
+        """
+        The FinanceInvoicetemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoicetemplatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def invoices(self) -> FinanceInvoicesEndpoint:
+        """
+        The FinanceInvoicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoicesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tax_codes(self) -> FinanceTaxcodesEndpoint:
+        """
+        The FinanceTaxcodesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tax_integrations(self) -> FinanceTaxintegrationsEndpoint:
+        """
+        The FinanceTaxintegrationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxintegrationsEndpoint(self.client, parent_endpoint=self))
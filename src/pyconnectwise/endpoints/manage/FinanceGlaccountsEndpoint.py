@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,11 +26,6 @@ class FinanceGlaccountsEndpoint(
         IPostable.__init__(self, GLAccount)
         IPaginateable.__init__(self, GLAccount)
 
-        self.count = self._register_child_endpoint(FinanceGlaccountsCountEndpoint(client, parent_endpoint=self))
-        self.mapped_types = self._register_child_endpoint(
-            FinanceGlaccountsMappedtypesEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceGlaccountsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceGlaccountsIdEndpoint object to move down the chain.
@@ -73,7 +69,7 @@ class FinanceGlaccountsEndpoint(
         Returns:
             list[GLAccount]: The parsed response data.
         """
-        return self._parse_many(GLAccount, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(GLAccount, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> GLAccount:
         """
@@ -85,4 +81,18 @@ class FinanceGlaccountsEndpoint(
         Returns:
             GLAccount: The parsed response data.
         """
-        return self._parse_one(GLAccount, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(GLAccount, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceGlaccountsCountEndpoint:
+        """
+        The FinanceGlaccountsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlaccountsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def mapped_types(self) -> FinanceGlaccountsMappedtypesEndpoint:
+        """
+        The FinanceGlaccountsMappedtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlaccountsMappedtypesEndpoint(self.client, parent_endpoint=self))
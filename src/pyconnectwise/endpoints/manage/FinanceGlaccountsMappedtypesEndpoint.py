@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class FinanceGlaccountsMappedtypesEndpoint(
         IGettable.__init__(self, list[MappedType])
         IPaginateable.__init__(self, MappedType)
 
-        self.count = self._register_child_endpoint(
-            FinanceGlaccountsMappedtypesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[MappedType]:
@@ -57,4 +54,13 @@ class FinanceGlaccountsMappedtypesEndpoint(
         Returns:
             list[MappedType]: The parsed response data.
         """
-        return self._parse_many(MappedType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MappedType, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceGlaccountsMappedtypesCountEndpoint:
+        """
+        The FinanceGlaccountsMappedtypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceGlaccountsMappedtypesCountEndpoint(self.client, parent_endpoint=self)
+        )
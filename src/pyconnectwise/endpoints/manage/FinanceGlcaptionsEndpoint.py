@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class FinanceGlcaptionsEndpoint(
         IGettable.__init__(self, list[GLCaption])
         IPaginateable.__init__(self, GLCaption)
 
-        self.count = self._register_child_endpoint(FinanceGlcaptionsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceGlcaptionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceGlcaptionsIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class FinanceGlcaptionsEndpoint(
         Returns:
             list[GLCaption]: The parsed response data.
         """
-        return self._parse_many(GLCaption, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(GLCaption, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceGlcaptionsCountEndpoint:
+        """
+        The FinanceGlcaptionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlcaptionsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class FinanceGlpathsEndpoint(
         IPostable.__init__(self, GLPath)
         IPaginateable.__init__(self, GLPath)
 
-        self.count = self._register_child_endpoint(FinanceGlpathsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceGlpathsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceGlpathsIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class FinanceGlpathsEndpoint(
         Returns:
             list[GLPath]: The parsed response data.
         """
-        return self._parse_many(GLPath, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(GLPath, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> GLPath:
         """
@@ -81,4 +80,11 @@ class FinanceGlpathsEndpoint(
         Returns:
             GLPath: The parsed response data.
         """
-        return self._parse_one(GLPath, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(GLPath, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceGlpathsCountEndpoint:
+        """
+        The FinanceGlpathsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlpathsCountEndpoint(self.client, parent_endpoint=self))
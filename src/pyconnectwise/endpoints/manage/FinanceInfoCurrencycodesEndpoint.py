@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class FinanceInfoCurrencycodesEndpoint(
         IGettable.__init__(self, list[CurrencyCode])
         IPaginateable.__init__(self, CurrencyCode)
 
-        self.count = self._register_child_endpoint(FinanceInfoCurrencycodesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceInfoCurrencycodesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceInfoCurrencycodesIdEndpoint object to move down the chain.
@@ -69,4 +68,11 @@ class FinanceInfoCurrencycodesEndpoint(
         Returns:
             list[CurrencyCode]: The parsed response data.
         """
-        return self._parse_many(CurrencyCode, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CurrencyCode, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceInfoCurrencycodesCountEndpoint:
+        """
+        The FinanceInfoCurrencycodesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInfoCurrencycodesCountEndpoint(self.client, parent_endpoint=self))
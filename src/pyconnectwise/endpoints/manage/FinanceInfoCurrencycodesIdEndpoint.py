@@ -52,4 +52,4 @@ class FinanceInfoCurrencycodesIdEndpoint(
         Returns:
             CurrencyCode: The parsed response data.
         """
-        return self._parse_one(CurrencyCode, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CurrencyCode, super()._make_request("GET", data=data, params=params).content)
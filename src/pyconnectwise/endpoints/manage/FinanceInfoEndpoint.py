@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -13,10 +14,23 @@ class FinanceInfoEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "info", parent_endpoint=parent_endpoint)
 
-        self.currency_codes = self._register_child_endpoint(
-            FinanceInfoCurrencycodesEndpoint(client, parent_endpoint=self)
-        )
-        self.invoice = self._register_child_endpoint(FinanceInfoInvoiceEndpoint(client, parent_endpoint=self))
-        self.tax_integrations = self._register_child_endpoint(
-            FinanceInfoTaxintegrationsEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def currency_codes(self) -> FinanceInfoCurrencycodesEndpoint:
+        """
+        The FinanceInfoCurrencycodesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInfoCurrencycodesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def invoice(self) -> FinanceInfoInvoiceEndpoint:
+        """
+        The FinanceInfoInvoiceEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInfoInvoiceEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tax_integrations(self) -> FinanceInfoTaxintegrationsEndpoint:
+        """
+        The FinanceInfoTaxintegrationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInfoTaxintegrationsEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class FinanceInfoInvoiceIdEndpoint(
         Returns:
             InvoiceInfo: The parsed response data.
         """
-        return self._parse_one(InvoiceInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(InvoiceInfo, super()._make_request("GET", data=data, params=params).content)
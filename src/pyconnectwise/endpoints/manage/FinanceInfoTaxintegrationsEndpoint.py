@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,10 +25,6 @@ class FinanceInfoTaxintegrationsEndpoint(
         IGettable.__init__(self, list[TaxIntegrationInfo])
         IPaginateable.__init__(self, TaxIntegrationInfo)
 
-        self.count = self._register_child_endpoint(
-            FinanceInfoTaxintegrationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceInfoTaxintegrationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceInfoTaxintegrationsIdEndpoint object to move down the chain.
@@ -75,4 +72,11 @@ class FinanceInfoTaxintegrationsEndpoint(
         Returns:
             list[TaxIntegrationInfo]: The parsed response data.
         """
-        return self._parse_many(TaxIntegrationInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxIntegrationInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceInfoTaxintegrationsCountEndpoint:
+        """
+        The FinanceInfoTaxintegrationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInfoTaxintegrationsCountEndpoint(self.client, parent_endpoint=self))
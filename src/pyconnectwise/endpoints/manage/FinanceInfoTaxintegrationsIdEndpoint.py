@@ -52,4 +52,4 @@ class FinanceInfoTaxintegrationsIdEndpoint(
         Returns:
             TaxIntegrationInfo: The parsed response data.
         """
-        return self._parse_one(TaxIntegrationInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TaxIntegrationInfo, super()._make_request("GET", data=data, params=params).content)
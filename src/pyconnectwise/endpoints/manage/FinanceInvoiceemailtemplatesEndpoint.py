@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -29,13 +30,6 @@ class FinanceInvoiceemailtemplatesEndpoint(
         IPostable.__init__(self, InvoiceEmailTemplate)
         IPaginateable.__init__(self, InvoiceEmailTemplate)
 
-        self.count = self._register_child_endpoint(
-            FinanceInvoiceemailtemplatesCountEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(
-            FinanceInvoiceemailtemplatesInfoEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceInvoiceemailtemplatesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceInvoiceemailtemplatesIdEndpoint object to move down the chain.
@@ -83,7 +77,7 @@ class FinanceInvoiceemailtemplatesEndpoint(
         Returns:
             list[InvoiceEmailTemplate]: The parsed response data.
         """
-        return self._parse_many(InvoiceEmailTemplate, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(InvoiceEmailTemplate, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -97,4 +91,22 @@ class FinanceInvoiceemailtemplatesEndpoint(
         Returns:
             InvoiceEmailTemplate: The parsed response data.
         """
-        return self._parse_one(InvoiceEmailTemplate, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(InvoiceEmailTemplate, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceInvoiceemailtemplatesCountEndpoint:
+        """
+        The FinanceInvoiceemailtemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceInvoiceemailtemplatesCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> FinanceInvoiceemailtemplatesInfoEndpoint:
+        """
+        The FinanceInvoiceemailtemplatesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceInvoiceemailtemplatesInfoEndpoint(self.client, parent_endpoint=self)
+        )
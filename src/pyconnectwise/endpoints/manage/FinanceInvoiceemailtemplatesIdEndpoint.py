@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -30,13 +31,6 @@ class FinanceInvoiceemailtemplatesIdEndpoint(
         IPuttable.__init__(self, InvoiceEmailTemplate)
         IPaginateable.__init__(self, InvoiceEmailTemplate)
 
-        self.info = self._register_child_endpoint(
-            FinanceInvoiceemailtemplatesIdInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            FinanceInvoiceemailtemplatesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[InvoiceEmailTemplate]:
@@ -81,7 +75,7 @@ class FinanceInvoiceemailtemplatesIdEndpoint(
         Returns:
             InvoiceEmailTemplate: The parsed response data.
         """
-        return self._parse_one(InvoiceEmailTemplate, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(InvoiceEmailTemplate, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -95,7 +89,7 @@ class FinanceInvoiceemailtemplatesIdEndpoint(
         Returns:
             InvoiceEmailTemplate: The parsed response data.
         """
-        return self._parse_one(InvoiceEmailTemplate, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(InvoiceEmailTemplate, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -109,4 +103,22 @@ class FinanceInvoiceemailtemplatesIdEndpoint(
         Returns:
             InvoiceEmailTemplate: The parsed response data.
         """
-        return self._parse_one(InvoiceEmailTemplate, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(InvoiceEmailTemplate, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> FinanceInvoiceemailtemplatesIdInfoEndpoint:
+        """
+        The FinanceInvoiceemailtemplatesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceInvoiceemailtemplatesIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> FinanceInvoiceemailtemplatesIdUsagesEndpoint:
+        """
+        The FinanceInvoiceemailtemplatesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceInvoiceemailtemplatesIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
@@ -54,4 +54,4 @@ class FinanceInvoiceemailtemplatesIdInfoEndpoint(
         Returns:
             InvoiceEmailTemplateInfo: The parsed response data.
         """
-        return self._parse_one(InvoiceEmailTemplateInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(InvoiceEmailTemplateInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class FinanceInvoiceemailtemplatesInfoEndpoint(
         IGettable.__init__(self, list[InvoiceEmailTemplateInfo])
         IPaginateable.__init__(self, InvoiceEmailTemplateInfo)
 
-        self.count = self._register_child_endpoint(
-            FinanceInvoiceemailtemplatesInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[InvoiceEmailTemplateInfo]:
@@ -61,4 +58,15 @@ class FinanceInvoiceemailtemplatesInfoEndpoint(
         Returns:
             list[InvoiceEmailTemplateInfo]: The parsed response data.
         """
-        return self._parse_many(InvoiceEmailTemplateInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(
+            InvoiceEmailTemplateInfo, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceInvoiceemailtemplatesInfoCountEndpoint:
+        """
+        The FinanceInvoiceemailtemplatesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceInvoiceemailtemplatesInfoCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class FinanceInvoicesEndpoint(
         IPostable.__init__(self, Invoice)
         IPaginateable.__init__(self, Invoice)
 
-        self.count = self._register_child_endpoint(FinanceInvoicesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceInvoicesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceInvoicesIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class FinanceInvoicesEndpoint(
         Returns:
             list[Invoice]: The parsed response data.
         """
-        return self._parse_many(Invoice, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Invoice, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Invoice:
         """
@@ -81,4 +80,11 @@ class FinanceInvoicesEndpoint(
         Returns:
             Invoice: The parsed response data.
         """
-        return self._parse_one(Invoice, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Invoice, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceInvoicesCountEndpoint:
+        """
+        The FinanceInvoicesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoicesCountEndpoint(self.client, parent_endpoint=self))
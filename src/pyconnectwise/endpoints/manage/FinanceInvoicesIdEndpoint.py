@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class FinanceInvoicesIdEndpoint(
         IPuttable.__init__(self, Invoice)
         IPaginateable.__init__(self, Invoice)
 
-        self.payments = self._register_child_endpoint(FinanceInvoicesIdPaymentsEndpoint(client, parent_endpoint=self))
-        self.pdf = self._register_child_endpoint(FinanceInvoicesIdPdfEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Invoice]:
@@ -69,7 +67,7 @@ class FinanceInvoicesIdEndpoint(
         Returns:
             Invoice: The parsed response data.
         """
-        return self._parse_one(Invoice, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Invoice, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Invoice:
         """
@@ -81,7 +79,7 @@ class FinanceInvoicesIdEndpoint(
         Returns:
             Invoice: The parsed response data.
         """
-        return self._parse_one(Invoice, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Invoice, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Invoice:
         """
@@ -93,4 +91,18 @@ class FinanceInvoicesIdEndpoint(
         Returns:
             Invoice: The parsed response data.
         """
-        return self._parse_one(Invoice, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Invoice, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def payments(self) -> FinanceInvoicesIdPaymentsEndpoint:
+        """
+        The FinanceInvoicesIdPaymentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoicesIdPaymentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def pdf(self) -> FinanceInvoicesIdPdfEndpoint:
+        """
+        The FinanceInvoicesIdPdfEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoicesIdPdfEndpoint(self.client, parent_endpoint=self))
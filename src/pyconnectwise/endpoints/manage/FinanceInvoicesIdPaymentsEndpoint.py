@@ -66,7 +66,7 @@ class FinanceInvoicesIdPaymentsEndpoint(
         Returns:
             list[Payment]: The parsed response data.
         """
-        return self._parse_many(Payment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Payment, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Payment:
         """
@@ -78,4 +78,4 @@ class FinanceInvoicesIdPaymentsEndpoint(
         Returns:
             Payment: The parsed response data.
         """
-        return self._parse_one(Payment, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Payment, super()._make_request("POST", data=data, params=params).content)
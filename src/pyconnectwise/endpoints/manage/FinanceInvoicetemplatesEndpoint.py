@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class FinanceInvoicetemplatesEndpoint(
         IPostable.__init__(self, InvoiceTemplate)
         IPaginateable.__init__(self, InvoiceTemplate)
 
-        self.count = self._register_child_endpoint(FinanceInvoicetemplatesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceInvoicetemplatesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceInvoicetemplatesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class FinanceInvoicetemplatesEndpoint(
         Returns:
             list[InvoiceTemplate]: The parsed response data.
         """
-        return self._parse_many(InvoiceTemplate, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(InvoiceTemplate, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> InvoiceTemplate:
         """
@@ -85,4 +84,11 @@ class FinanceInvoicetemplatesEndpoint(
         Returns:
             InvoiceTemplate: The parsed response data.
         """
-        return self._parse_one(InvoiceTemplate, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(InvoiceTemplate, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceInvoicetemplatesCountEndpoint:
+        """
+        The FinanceInvoicetemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoicetemplatesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,10 +25,6 @@ class FinanceInvoicetemplatesetupsEndpoint(
         IGettable.__init__(self, list[InvoiceTemplateSetup])
         IPaginateable.__init__(self, InvoiceTemplateSetup)
 
-        self.count = self._register_child_endpoint(
-            FinanceInvoicetemplatesetupsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceInvoicetemplatesetupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceInvoicetemplatesetupsIdEndpoint object to move down the chain.
@@ -75,4 +72,13 @@ class FinanceInvoicetemplatesetupsEndpoint(
         Returns:
             list[InvoiceTemplateSetup]: The parsed response data.
         """
-        return self._parse_many(InvoiceTemplateSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(InvoiceTemplateSetup, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceInvoicetemplatesetupsCountEndpoint:
+        """
+        The FinanceInvoicetemplatesetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceInvoicetemplatesetupsCountEndpoint(self.client, parent_endpoint=self)
+        )
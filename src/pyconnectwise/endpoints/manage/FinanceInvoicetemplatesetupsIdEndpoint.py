@@ -54,4 +54,4 @@ class FinanceInvoicetemplatesetupsIdEndpoint(
         Returns:
             InvoiceTemplateSetup: The parsed response data.
         """
-        return self._parse_one(InvoiceTemplateSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(InvoiceTemplateSetup, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class FinanceTaxcodesEndpoint(
         IPostable.__init__(self, TaxCode)
         IPaginateable.__init__(self, TaxCode)
 
-        self.count = self._register_child_endpoint(FinanceTaxcodesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(FinanceTaxcodesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceTaxcodesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class FinanceTaxcodesEndpoint(
         Returns:
             list[TaxCode]: The parsed response data.
         """
-        return self._parse_many(TaxCode, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxCode, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TaxCode:
         """
@@ -83,4 +81,18 @@ class FinanceTaxcodesEndpoint(
         Returns:
             TaxCode: The parsed response data.
         """
-        return self._parse_one(TaxCode, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TaxCode, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesCountEndpoint:
+        """
+        The FinanceTaxcodesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceTaxcodesInfoEndpoint:
+        """
+        The FinanceTaxcodesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesInfoEndpoint(self.client, parent_endpoint=self))
@@ -24,4 +24,4 @@ class FinanceTaxcodesIdCopyEndpoint(ConnectWiseEndpoint, IPostable[TaxCode, Conn
         Returns:
             TaxCode: The parsed response data.
         """
-        return self._parse_one(TaxCode, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TaxCode, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -38,25 +39,6 @@ class FinanceTaxcodesIdEndpoint(
         IPuttable.__init__(self, TaxCode)
         IPaginateable.__init__(self, TaxCode)
 
-        self.copy = self._register_child_endpoint(FinanceTaxcodesIdCopyEndpoint(client, parent_endpoint=self))
-        self.expense_type_exemptions = self._register_child_endpoint(
-            FinanceTaxcodesIdExpensetypeexemptionsEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(FinanceTaxcodesIdInfoEndpoint(client, parent_endpoint=self))
-        self.product_type_exemptions = self._register_child_endpoint(
-            FinanceTaxcodesIdProducttypeexemptionsEndpoint(client, parent_endpoint=self)
-        )
-        self.tax_code_levels = self._register_child_endpoint(
-            FinanceTaxcodesIdTaxcodelevelsEndpoint(client, parent_endpoint=self)
-        )
-        self.tax_code_x_refs = self._register_child_endpoint(
-            FinanceTaxcodesIdTaxcodexrefsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(FinanceTaxcodesIdUsagesEndpoint(client, parent_endpoint=self))
-        self.work_role_exemptions = self._register_child_endpoint(
-            FinanceTaxcodesIdWorkroleexemptionsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[TaxCode]:
@@ -97,7 +79,7 @@ class FinanceTaxcodesIdEndpoint(
         Returns:
             TaxCode: The parsed response data.
         """
-        return self._parse_one(TaxCode, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TaxCode, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> TaxCode:
         """
@@ -109,7 +91,7 @@ class FinanceTaxcodesIdEndpoint(
         Returns:
             TaxCode: The parsed response data.
         """
-        return self._parse_one(TaxCode, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(TaxCode, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TaxCode:
         """
@@ -121,4 +103,66 @@ class FinanceTaxcodesIdEndpoint(
         Returns:
             TaxCode: The parsed response data.
         """
-        return self._parse_one(TaxCode, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(TaxCode, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> FinanceTaxcodesIdCopyEndpoint:
+        """
+        The FinanceTaxcodesIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesIdCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def expense_type_exemptions(self) -> FinanceTaxcodesIdExpensetypeexemptionsEndpoint:
+        """
+        The FinanceTaxcodesIdExpensetypeexemptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdExpensetypeexemptionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> FinanceTaxcodesIdInfoEndpoint:
+        """
+        The FinanceTaxcodesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def product_type_exemptions(self) -> FinanceTaxcodesIdProducttypeexemptionsEndpoint:
+        """
+        The FinanceTaxcodesIdProducttypeexemptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdProducttypeexemptionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def tax_code_levels(self) -> FinanceTaxcodesIdTaxcodelevelsEndpoint:
+        """
+        The FinanceTaxcodesIdTaxcodelevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesIdTaxcodelevelsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tax_code_x_refs(self) -> FinanceTaxcodesIdTaxcodexrefsEndpoint:
+        """
+        The FinanceTaxcodesIdTaxcodexrefsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesIdTaxcodexrefsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> FinanceTaxcodesIdUsagesEndpoint:
+        """
+        The FinanceTaxcodesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesIdUsagesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def work_role_exemptions(self) -> FinanceTaxcodesIdWorkroleexemptionsEndpoint:
+        """
+        The FinanceTaxcodesIdWorkroleexemptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdWorkroleexemptionsEndpoint(self.client, parent_endpoint=self)
+        )
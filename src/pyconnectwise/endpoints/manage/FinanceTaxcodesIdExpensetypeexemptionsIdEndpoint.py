@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint(
         IPuttable.__init__(self, ExpenseTypeExemption)
         IPaginateable.__init__(self, ExpenseTypeExemption)
 
-        self.taxable_expense_type_levels = self._register_child_endpoint(
-            FinanceTaxcodesIdExpensetypeexemptionsIdTaxableexpensetypelevelsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ExpenseTypeExemption]:
@@ -75,7 +72,7 @@ class FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint(
         Returns:
             ExpenseTypeExemption: The parsed response data.
         """
-        return self._parse_one(ExpenseTypeExemption, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ExpenseTypeExemption, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -89,7 +86,7 @@ class FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint(
         Returns:
             ExpenseTypeExemption: The parsed response data.
         """
-        return self._parse_one(ExpenseTypeExemption, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ExpenseTypeExemption, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -103,4 +100,13 @@ class FinanceTaxcodesIdExpensetypeexemptionsIdEndpoint(
         Returns:
             ExpenseTypeExemption: The parsed response data.
         """
-        return self._parse_one(ExpenseTypeExemption, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ExpenseTypeExemption, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def taxable_expense_type_levels(self) -> FinanceTaxcodesIdExpensetypeexemptionsIdTaxableexpensetypelevelsEndpoint:
+        """
+        The FinanceTaxcodesIdExpensetypeexemptionsIdTaxableexpensetypelevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdExpensetypeexemptionsIdTaxableexpensetypelevelsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -52,4 +52,4 @@ class FinanceTaxcodesIdInfoEndpoint(
         Returns:
             TaxCodeInfo: The parsed response data.
         """
-        return self._parse_one(TaxCodeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TaxCodeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class FinanceTaxcodesIdProducttypeexemptionsIdEndpoint(
         IPuttable.__init__(self, ProductTypeExemption)
         IPaginateable.__init__(self, ProductTypeExemption)
 
-        self.taxable_product_type_levels = self._register_child_endpoint(
-            FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ProductTypeExemption]:
@@ -75,7 +72,7 @@ class FinanceTaxcodesIdProducttypeexemptionsIdEndpoint(
         Returns:
             ProductTypeExemption: The parsed response data.
         """
-        return self._parse_one(ProductTypeExemption, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProductTypeExemption, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -89,7 +86,7 @@ class FinanceTaxcodesIdProducttypeexemptionsIdEndpoint(
         Returns:
             ProductTypeExemption: The parsed response data.
         """
-        return self._parse_one(ProductTypeExemption, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProductTypeExemption, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -103,4 +100,13 @@ class FinanceTaxcodesIdProducttypeexemptionsIdEndpoint(
         Returns:
             ProductTypeExemption: The parsed response data.
         """
-        return self._parse_one(ProductTypeExemption, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProductTypeExemption, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def taxable_product_type_levels(self) -> FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsEndpoint:
+        """
+        The FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsEndpoint(
         IPostable.__init__(self, TaxableProductTypeLevel)
         IPaginateable.__init__(self, TaxableProductTypeLevel)
 
-        self.count = self._register_child_endpoint(
-            FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsIdEndpoint object to move down the chain.
@@ -81,7 +78,7 @@ class FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsEndpoint(
         Returns:
             list[TaxableProductTypeLevel]: The parsed response data.
         """
-        return self._parse_many(TaxableProductTypeLevel, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxableProductTypeLevel, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -95,4 +92,15 @@ class FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsEndpoint(
         Returns:
             TaxableProductTypeLevel: The parsed response data.
         """
-        return self._parse_one(TaxableProductTypeLevel, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TaxableProductTypeLevel, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsCountEndpoint:
+        """
+        The FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdProducttypeexemptionsIdTaxableproducttypelevelsCountEndpoint(
+                self.client, parent_endpoint=self
+            )
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceTaxcodesIdTaxcodelevelsEndpoint(
         IPostable.__init__(self, TaxCodeLevel)
         IPaginateable.__init__(self, TaxCodeLevel)
 
-        self.count = self._register_child_endpoint(
-            FinanceTaxcodesIdTaxcodelevelsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceTaxcodesIdTaxcodelevelsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdTaxcodelevelsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class FinanceTaxcodesIdTaxcodelevelsEndpoint(
         Returns:
             list[TaxCodeLevel]: The parsed response data.
         """
-        return self._parse_many(TaxCodeLevel, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxCodeLevel, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TaxCodeLevel:
         """
@@ -89,4 +86,13 @@ class FinanceTaxcodesIdTaxcodelevelsEndpoint(
         Returns:
             TaxCodeLevel: The parsed response data.
         """
-        return self._parse_one(TaxCodeLevel, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TaxCodeLevel, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesIdTaxcodelevelsCountEndpoint:
+        """
+        The FinanceTaxcodesIdTaxcodelevelsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdTaxcodelevelsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceTaxcodesIdTaxcodexrefsEndpoint(
         IPostable.__init__(self, TaxCodeXRef)
         IPaginateable.__init__(self, TaxCodeXRef)
 
-        self.count = self._register_child_endpoint(
-            FinanceTaxcodesIdTaxcodexrefsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceTaxcodesIdTaxcodexrefsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdTaxcodexrefsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class FinanceTaxcodesIdTaxcodexrefsEndpoint(
         Returns:
             list[TaxCodeXRef]: The parsed response data.
         """
-        return self._parse_many(TaxCodeXRef, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxCodeXRef, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TaxCodeXRef:
         """
@@ -89,4 +86,13 @@ class FinanceTaxcodesIdTaxcodexrefsEndpoint(
         Returns:
             TaxCodeXRef: The parsed response data.
         """
-        return self._parse_one(TaxCodeXRef, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TaxCodeXRef, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesIdTaxcodexrefsCountEndpoint:
+        """
+        The FinanceTaxcodesIdTaxcodexrefsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdTaxcodexrefsCountEndpoint(self.client, parent_endpoint=self)
+        )
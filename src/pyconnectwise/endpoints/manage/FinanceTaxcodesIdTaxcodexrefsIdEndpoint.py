@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class FinanceTaxcodesIdTaxcodexrefsIdEndpoint(
         IPuttable.__init__(self, TaxCodeXRef)
         IPaginateable.__init__(self, TaxCodeXRef)
 
-        self.taxable_x_ref_levels = self._register_child_endpoint(
-            FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[TaxCodeXRef]:
@@ -73,7 +70,7 @@ class FinanceTaxcodesIdTaxcodexrefsIdEndpoint(
         Returns:
             TaxCodeXRef: The parsed response data.
         """
-        return self._parse_one(TaxCodeXRef, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TaxCodeXRef, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> TaxCodeXRef:
         """
@@ -85,7 +82,7 @@ class FinanceTaxcodesIdTaxcodexrefsIdEndpoint(
         Returns:
             TaxCodeXRef: The parsed response data.
         """
-        return self._parse_one(TaxCodeXRef, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(TaxCodeXRef, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TaxCodeXRef:
         """
@@ -97,4 +94,13 @@ class FinanceTaxcodesIdTaxcodexrefsIdEndpoint(
         Returns:
             TaxCodeXRef: The parsed response data.
         """
-        return self._parse_one(TaxCodeXRef, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(TaxCodeXRef, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def taxable_x_ref_levels(self) -> FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsEndpoint:
+        """
+        The FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsEndpoint(self.client, parent_endpoint=self)
+        )
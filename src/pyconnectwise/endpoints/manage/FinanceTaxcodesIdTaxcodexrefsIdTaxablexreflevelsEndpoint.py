@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsEndpoint(
         IPostable.__init__(self, TaxableXRefLevel)
         IPaginateable.__init__(self, TaxableXRefLevel)
 
-        self.count = self._register_child_endpoint(
-            FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsEndpoint(
         Returns:
             list[TaxableXRefLevel]: The parsed response data.
         """
-        return self._parse_many(TaxableXRefLevel, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxableXRefLevel, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TaxableXRefLevel:
         """
@@ -91,4 +88,13 @@ class FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsEndpoint(
         Returns:
             TaxableXRefLevel: The parsed response data.
         """
-        return self._parse_one(TaxableXRefLevel, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TaxableXRefLevel, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsCountEndpoint:
+        """
+        The FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdTaxcodexrefsIdTaxablexreflevelsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceTaxcodesIdWorkroleexemptionsEndpoint(
         IPostable.__init__(self, WorkRoleExemption)
         IPaginateable.__init__(self, WorkRoleExemption)
 
-        self.count = self._register_child_endpoint(
-            FinanceTaxcodesIdWorkroleexemptionsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceTaxcodesIdWorkroleexemptionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdWorkroleexemptionsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class FinanceTaxcodesIdWorkroleexemptionsEndpoint(
         Returns:
             list[WorkRoleExemption]: The parsed response data.
         """
-        return self._parse_many(WorkRoleExemption, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkRoleExemption, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WorkRoleExemption:
         """
@@ -91,4 +88,13 @@ class FinanceTaxcodesIdWorkroleexemptionsEndpoint(
         Returns:
             WorkRoleExemption: The parsed response data.
         """
-        return self._parse_one(WorkRoleExemption, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WorkRoleExemption, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesIdWorkroleexemptionsCountEndpoint:
+        """
+        The FinanceTaxcodesIdWorkroleexemptionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdWorkroleexemptionsCountEndpoint(self.client, parent_endpoint=self)
+        )
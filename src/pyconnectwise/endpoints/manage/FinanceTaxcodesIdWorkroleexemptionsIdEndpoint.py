@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class FinanceTaxcodesIdWorkroleexemptionsIdEndpoint(
         IPuttable.__init__(self, WorkRoleExemption)
         IPaginateable.__init__(self, WorkRoleExemption)
 
-        self.taxable_work_role_levels = self._register_child_endpoint(
-            FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[WorkRoleExemption]:
@@ -73,7 +70,7 @@ class FinanceTaxcodesIdWorkroleexemptionsIdEndpoint(
         Returns:
             WorkRoleExemption: The parsed response data.
         """
-        return self._parse_one(WorkRoleExemption, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkRoleExemption, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> WorkRoleExemption:
         """
@@ -85,7 +82,7 @@ class FinanceTaxcodesIdWorkroleexemptionsIdEndpoint(
         Returns:
             WorkRoleExemption: The parsed response data.
         """
-        return self._parse_one(WorkRoleExemption, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(WorkRoleExemption, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WorkRoleExemption:
         """
@@ -97,4 +94,13 @@ class FinanceTaxcodesIdWorkroleexemptionsIdEndpoint(
         Returns:
             WorkRoleExemption: The parsed response data.
         """
-        return self._parse_one(WorkRoleExemption, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(WorkRoleExemption, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def taxable_work_role_levels(self) -> FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsEndpoint:
+        """
+        The FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsEndpoint(
         IPostable.__init__(self, TaxableWorkRoleLevel)
         IPaginateable.__init__(self, TaxableWorkRoleLevel)
 
-        self.count = self._register_child_endpoint(
-            FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsEndpoint(
         Returns:
             list[TaxableWorkRoleLevel]: The parsed response data.
         """
-        return self._parse_many(TaxableWorkRoleLevel, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxableWorkRoleLevel, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -93,4 +90,13 @@ class FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsEndpoint(
         Returns:
             TaxableWorkRoleLevel: The parsed response data.
         """
-        return self._parse_one(TaxableWorkRoleLevel, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TaxableWorkRoleLevel, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsCountEndpoint:
+        """
+        The FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdWorkroleexemptionsIdTaxableworkrolelevelsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class FinanceTaxcodesInfoEndpoint(
         IGettable.__init__(self, list[TaxCodeInfo])
         IPaginateable.__init__(self, TaxCodeInfo)
 
-        self.count = self._register_child_endpoint(FinanceTaxcodesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[TaxCodeInfo]:
@@ -55,4 +54,11 @@ class FinanceTaxcodesInfoEndpoint(
         Returns:
             list[TaxCodeInfo]: The parsed response data.
         """
-        return self._parse_many(TaxCodeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxCodeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesInfoCountEndpoint:
+        """
+        The FinanceTaxcodesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class FinanceTaxintegrationsEndpoint(
         IGettable.__init__(self, list[TaxIntegration])
         IPaginateable.__init__(self, TaxIntegration)
 
-        self.count = self._register_child_endpoint(FinanceTaxintegrationsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> FinanceTaxintegrationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized FinanceTaxintegrationsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class FinanceTaxintegrationsEndpoint(
         Returns:
             list[TaxIntegration]: The parsed response data.
         """
-        return self._parse_many(TaxIntegration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TaxIntegration, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> FinanceTaxintegrationsCountEndpoint:
+        """
+        The FinanceTaxintegrationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxintegrationsCountEndpoint(self.client, parent_endpoint=self))
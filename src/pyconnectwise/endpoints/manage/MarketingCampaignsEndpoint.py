@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,11 +28,6 @@ class MarketingCampaignsEndpoint(
         IPostable.__init__(self, Campaign)
         IPaginateable.__init__(self, Campaign)
 
-        self.count = self._register_child_endpoint(MarketingCampaignsCountEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(MarketingCampaignsStatusesEndpoint(client, parent_endpoint=self))
-        self.sub_types = self._register_child_endpoint(MarketingCampaignsSubtypesEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(MarketingCampaignsTypesEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> MarketingCampaignsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdEndpoint object to move down the chain.
@@ -75,7 +71,7 @@ class MarketingCampaignsEndpoint(
         Returns:
             list[Campaign]: The parsed response data.
         """
-        return self._parse_many(Campaign, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Campaign, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Campaign:
         """
@@ -87,4 +83,32 @@ class MarketingCampaignsEndpoint(
         Returns:
             Campaign: The parsed response data.
         """
-        return self._parse_one(Campaign, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Campaign, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsCountEndpoint:
+        """
+        The MarketingCampaignsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> MarketingCampaignsStatusesEndpoint:
+        """
+        The MarketingCampaignsStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sub_types(self) -> MarketingCampaignsSubtypesEndpoint:
+        """
+        The MarketingCampaignsSubtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsSubtypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> MarketingCampaignsTypesEndpoint:
+        """
+        The MarketingCampaignsTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsTypesEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class MarketingCampaignsIdAuditsEndpoint(
         IPostable.__init__(self, CampaignAudit)
         IPaginateable.__init__(self, CampaignAudit)
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsIdAuditsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> MarketingCampaignsIdAuditsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdAuditsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class MarketingCampaignsIdAuditsEndpoint(
         Returns:
             list[CampaignAudit]: The parsed response data.
         """
-        return self._parse_many(CampaignAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CampaignAudit, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CampaignAudit:
         """
@@ -89,4 +86,11 @@ class MarketingCampaignsIdAuditsEndpoint(
         Returns:
             CampaignAudit: The parsed response data.
         """
-        return self._parse_one(CampaignAudit, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CampaignAudit, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsIdAuditsCountEndpoint:
+        """
+        The MarketingCampaignsIdAuditsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsIdAuditsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class MarketingCampaignsIdEmailsopenedEndpoint(
         IPostable.__init__(self, EmailOpened)
         IPaginateable.__init__(self, EmailOpened)
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsIdEmailsopenedCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> MarketingCampaignsIdEmailsopenedIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdEmailsopenedIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class MarketingCampaignsIdEmailsopenedEndpoint(
         Returns:
             list[EmailOpened]: The parsed response data.
         """
-        return self._parse_many(EmailOpened, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(EmailOpened, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> EmailOpened:
         """
@@ -89,4 +86,13 @@ class MarketingCampaignsIdEmailsopenedEndpoint(
         Returns:
             EmailOpened: The parsed response data.
         """
-        return self._parse_one(EmailOpened, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(EmailOpened, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsIdEmailsopenedCountEndpoint:
+        """
+        The MarketingCampaignsIdEmailsopenedCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdEmailsopenedCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -38,23 +39,6 @@ class MarketingCampaignsIdEndpoint(
         IPuttable.__init__(self, Campaign)
         IPaginateable.__init__(self, Campaign)
 
-        self.activities = self._register_child_endpoint(
-            MarketingCampaignsIdActivitiesEndpoint(client, parent_endpoint=self)
-        )
-        self.audits = self._register_child_endpoint(MarketingCampaignsIdAuditsEndpoint(client, parent_endpoint=self))
-        self.emails_opened = self._register_child_endpoint(
-            MarketingCampaignsIdEmailsopenedEndpoint(client, parent_endpoint=self)
-        )
-        self.forms_submitted = self._register_child_endpoint(
-            MarketingCampaignsIdFormssubmittedEndpoint(client, parent_endpoint=self)
-        )
-        self.links_clicked = self._register_child_endpoint(
-            MarketingCampaignsIdLinksclickedEndpoint(client, parent_endpoint=self)
-        )
-        self.opportunities = self._register_child_endpoint(
-            MarketingCampaignsIdOpportunitiesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Campaign]:
@@ -95,7 +79,7 @@ class MarketingCampaignsIdEndpoint(
         Returns:
             Campaign: The parsed response data.
         """
-        return self._parse_one(Campaign, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Campaign, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Campaign:
         """
@@ -107,7 +91,7 @@ class MarketingCampaignsIdEndpoint(
         Returns:
             Campaign: The parsed response data.
         """
-        return self._parse_one(Campaign, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Campaign, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Campaign:
         """
@@ -119,4 +103,54 @@ class MarketingCampaignsIdEndpoint(
         Returns:
             Campaign: The parsed response data.
         """
-        return self._parse_one(Campaign, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Campaign, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def activities(self) -> MarketingCampaignsIdActivitiesEndpoint:
+        """
+        The MarketingCampaignsIdActivitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsIdActivitiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def audits(self) -> MarketingCampaignsIdAuditsEndpoint:
+        """
+        The MarketingCampaignsIdAuditsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsIdAuditsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def emails_opened(self) -> MarketingCampaignsIdEmailsopenedEndpoint:
+        """
+        The MarketingCampaignsIdEmailsopenedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdEmailsopenedEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def forms_submitted(self) -> MarketingCampaignsIdFormssubmittedEndpoint:
+        """
+        The MarketingCampaignsIdFormssubmittedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdFormssubmittedEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def links_clicked(self) -> MarketingCampaignsIdLinksclickedEndpoint:
+        """
+        The MarketingCampaignsIdLinksclickedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdLinksclickedEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def opportunities(self) -> MarketingCampaignsIdOpportunitiesEndpoint:
+        """
+        The MarketingCampaignsIdOpportunitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdOpportunitiesEndpoint(self.client, parent_endpoint=self)
+        )
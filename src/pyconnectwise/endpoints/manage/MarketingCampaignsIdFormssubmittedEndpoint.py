@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class MarketingCampaignsIdFormssubmittedEndpoint(
         IPostable.__init__(self, FormSubmitted)
         IPaginateable.__init__(self, FormSubmitted)
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsIdFormssubmittedCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> MarketingCampaignsIdFormssubmittedIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdFormssubmittedIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class MarketingCampaignsIdFormssubmittedEndpoint(
         Returns:
             list[FormSubmitted]: The parsed response data.
         """
-        return self._parse_many(FormSubmitted, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(FormSubmitted, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> FormSubmitted:
         """
@@ -91,4 +88,13 @@ class MarketingCampaignsIdFormssubmittedEndpoint(
         Returns:
             FormSubmitted: The parsed response data.
         """
-        return self._parse_one(FormSubmitted, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(FormSubmitted, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsIdFormssubmittedCountEndpoint:
+        """
+        The MarketingCampaignsIdFormssubmittedCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdFormssubmittedCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class MarketingCampaignsIdLinksclickedEndpoint(
         IPostable.__init__(self, LinkClicked)
         IPaginateable.__init__(self, LinkClicked)
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsIdLinksclickedCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> MarketingCampaignsIdLinksclickedIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdLinksclickedIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class MarketingCampaignsIdLinksclickedEndpoint(
         Returns:
             list[LinkClicked]: The parsed response data.
         """
-        return self._parse_many(LinkClicked, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LinkClicked, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> LinkClicked:
         """
@@ -89,4 +86,13 @@ class MarketingCampaignsIdLinksclickedEndpoint(
         Returns:
             LinkClicked: The parsed response data.
         """
-        return self._parse_one(LinkClicked, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LinkClicked, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsIdLinksclickedCountEndpoint:
+        """
+        The MarketingCampaignsIdLinksclickedCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdLinksclickedCountEndpoint(self.client, parent_endpoint=self)
+        )
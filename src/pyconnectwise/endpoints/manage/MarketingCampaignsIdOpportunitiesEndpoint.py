@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class MarketingCampaignsIdOpportunitiesEndpoint(
         IGettable.__init__(self, list[OpportunityReference])
         IPaginateable.__init__(self, OpportunityReference)
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsIdOpportunitiesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[OpportunityReference]:
@@ -61,4 +58,13 @@ class MarketingCampaignsIdOpportunitiesEndpoint(
         Returns:
             list[OpportunityReference]: The parsed response data.
         """
-        return self._parse_many(OpportunityReference, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityReference, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsIdOpportunitiesCountEndpoint:
+        """
+        The MarketingCampaignsIdOpportunitiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdOpportunitiesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class MarketingCampaignsStatusesEndpoint(
         IPostable.__init__(self, CampaignStatus)
         IPaginateable.__init__(self, CampaignStatus)
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsStatusesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> MarketingCampaignsStatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized MarketingCampaignsStatusesIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class MarketingCampaignsStatusesEndpoint(
         Returns:
             list[CampaignStatus]: The parsed response data.
         """
-        return self._parse_many(CampaignStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CampaignStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CampaignStatus:
         """
@@ -89,4 +86,11 @@ class MarketingCampaignsStatusesEndpoint(
         Returns:
             CampaignStatus: The parsed response data.
         """
-        return self._parse_one(CampaignStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CampaignStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsStatusesCountEndpoint:
+        """
+        The MarketingCampaignsStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsStatusesCountEndpoint(self.client, parent_endpoint=self))
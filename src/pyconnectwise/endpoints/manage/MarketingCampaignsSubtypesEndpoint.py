@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class MarketingCampaignsSubtypesEndpoint(
         IPostable.__init__(self, CampaignCampaignSubType)
         IPaginateable.__init__(self, CampaignCampaignSubType)
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsSubtypesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> MarketingCampaignsSubtypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized MarketingCampaignsSubtypesIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class MarketingCampaignsSubtypesEndpoint(
         Returns:
             list[CampaignCampaignSubType]: The parsed response data.
         """
-        return self._parse_many(CampaignCampaignSubType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CampaignCampaignSubType, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -91,4 +88,11 @@ class MarketingCampaignsSubtypesEndpoint(
         Returns:
             CampaignCampaignSubType: The parsed response data.
         """
-        return self._parse_one(CampaignCampaignSubType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CampaignCampaignSubType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsSubtypesCountEndpoint:
+        """
+        The MarketingCampaignsSubtypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsSubtypesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class MarketingCampaignsTypesEndpoint(
         IPostable.__init__(self, CampaignType)
         IPaginateable.__init__(self, CampaignType)
 
-        self.count = self._register_child_endpoint(MarketingCampaignsTypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(MarketingCampaignsTypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> MarketingCampaignsTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized MarketingCampaignsTypesIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class MarketingCampaignsTypesEndpoint(
         Returns:
             list[CampaignType]: The parsed response data.
         """
-        return self._parse_many(CampaignType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CampaignType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CampaignType:
         """
@@ -85,4 +83,18 @@ class MarketingCampaignsTypesEndpoint(
         Returns:
             CampaignType: The parsed response data.
         """
-        return self._parse_one(CampaignType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CampaignType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsTypesCountEndpoint:
+        """
+        The MarketingCampaignsTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> MarketingCampaignsTypesInfoEndpoint:
+        """
+        The MarketingCampaignsTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsTypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,11 +29,6 @@ class MarketingCampaignsTypesIdEndpoint(
         IPuttable.__init__(self, CampaignType)
         IPaginateable.__init__(self, CampaignType)
 
-        self.info = self._register_child_endpoint(MarketingCampaignsTypesIdInfoEndpoint(client, parent_endpoint=self))
-        self.sub_types = self._register_child_endpoint(
-            MarketingCampaignsTypesIdSubtypesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[CampaignType]:
@@ -75,7 +71,7 @@ class MarketingCampaignsTypesIdEndpoint(
         Returns:
             CampaignType: The parsed response data.
         """
-        return self._parse_one(CampaignType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CampaignType, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> CampaignType:
         """
@@ -87,7 +83,7 @@ class MarketingCampaignsTypesIdEndpoint(
         Returns:
             CampaignType: The parsed response data.
         """
-        return self._parse_one(CampaignType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(CampaignType, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CampaignType:
         """
@@ -99,4 +95,20 @@ class MarketingCampaignsTypesIdEndpoint(
         Returns:
             CampaignType: The parsed response data.
         """
-        return self._parse_one(CampaignType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(CampaignType, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> MarketingCampaignsTypesIdInfoEndpoint:
+        """
+        The MarketingCampaignsTypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsTypesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sub_types(self) -> MarketingCampaignsTypesIdSubtypesEndpoint:
+        """
+        The MarketingCampaignsTypesIdSubtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsTypesIdSubtypesEndpoint(self.client, parent_endpoint=self)
+        )
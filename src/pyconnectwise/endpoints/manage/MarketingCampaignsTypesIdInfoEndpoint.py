@@ -52,4 +52,4 @@ class MarketingCampaignsTypesIdInfoEndpoint(
         Returns:
             CampaignTypeInfo: The parsed response data.
         """
-        return self._parse_one(CampaignTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CampaignTypeInfo, super()._make_request("GET", data=data, params=params).content)
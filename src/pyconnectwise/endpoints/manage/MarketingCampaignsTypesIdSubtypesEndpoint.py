@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class MarketingCampaignsTypesIdSubtypesEndpoint(
         IGettable.__init__(self, list[TypeCampaignSubType])
         IPaginateable.__init__(self, TypeCampaignSubType)
 
-        self.count = self._register_child_endpoint(
-            MarketingCampaignsTypesIdSubtypesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> MarketingCampaignsTypesIdSubtypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized MarketingCampaignsTypesIdSubtypesIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class MarketingCampaignsTypesIdSubtypesEndpoint(
         Returns:
             list[TypeCampaignSubType]: The parsed response data.
         """
-        return self._parse_many(TypeCampaignSubType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TypeCampaignSubType, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsTypesIdSubtypesCountEndpoint:
+        """
+        The MarketingCampaignsTypesIdSubtypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsTypesIdSubtypesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -54,4 +54,4 @@ class MarketingCampaignsTypesIdSubtypesIdEndpoint(
         Returns:
             TypeCampaignSubType: The parsed response data.
         """
-        return self._parse_one(TypeCampaignSubType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TypeCampaignSubType, super()._make_request("GET", data=data, params=params).content)
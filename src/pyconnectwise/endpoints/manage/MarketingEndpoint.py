@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -12,5 +13,16 @@ class MarketingEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "marketing", parent_endpoint=parent_endpoint)
 
-        self.campaigns = self._register_child_endpoint(MarketingCampaignsEndpoint(client, parent_endpoint=self))
-        self.groups = self._register_child_endpoint(MarketingGroupsEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def campaigns(self) -> MarketingCampaignsEndpoint:
+        """
+        The MarketingCampaignsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def groups(self) -> MarketingGroupsEndpoint:
+        """
+        The MarketingGroupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class MarketingGroupsEndpoint(
         IPostable.__init__(self, Group)
         IPaginateable.__init__(self, Group)
 
-        self.count = self._register_child_endpoint(MarketingGroupsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(MarketingGroupsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> MarketingGroupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized MarketingGroupsIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class MarketingGroupsEndpoint(
         Returns:
             list[Group]: The parsed response data.
         """
-        return self._parse_many(Group, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Group, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Group:
         """
@@ -83,4 +81,18 @@ class MarketingGroupsEndpoint(
         Returns:
             Group: The parsed response data.
         """
-        return self._parse_one(Group, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Group, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingGroupsCountEndpoint:
+        """
+        The MarketingGroupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> MarketingGroupsInfoEndpoint:
+        """
+        The MarketingGroupsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class MarketingGroupsIdCompaniesEndpoint(
         IPostable.__init__(self, MarketingCompany)
         IPaginateable.__init__(self, MarketingCompany)
 
-        self.count = self._register_child_endpoint(
-            MarketingGroupsIdCompaniesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> MarketingGroupsIdCompaniesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized MarketingGroupsIdCompaniesIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class MarketingGroupsIdCompaniesEndpoint(
         Returns:
             list[MarketingCompany]: The parsed response data.
         """
-        return self._parse_many(MarketingCompany, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MarketingCompany, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MarketingCompany:
         """
@@ -89,4 +86,11 @@ class MarketingGroupsIdCompaniesEndpoint(
         Returns:
             MarketingCompany: The parsed response data.
         """
-        return self._parse_one(MarketingCompany, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MarketingCompany, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingGroupsIdCompaniesCountEndpoint:
+        """
+        The MarketingGroupsIdCompaniesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsIdCompaniesCountEndpoint(self.client, parent_endpoint=self))
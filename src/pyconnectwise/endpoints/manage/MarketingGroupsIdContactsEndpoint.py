@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class MarketingGroupsIdContactsEndpoint(
         IPostable.__init__(self, MarketingContact)
         IPaginateable.__init__(self, MarketingContact)
 
-        self.count = self._register_child_endpoint(MarketingGroupsIdContactsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> MarketingGroupsIdContactsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized MarketingGroupsIdContactsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class MarketingGroupsIdContactsEndpoint(
         Returns:
             list[MarketingContact]: The parsed response data.
         """
-        return self._parse_many(MarketingContact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MarketingContact, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MarketingContact:
         """
@@ -85,4 +84,11 @@ class MarketingGroupsIdContactsEndpoint(
         Returns:
             MarketingContact: The parsed response data.
         """
-        return self._parse_one(MarketingContact, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MarketingContact, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingGroupsIdContactsCountEndpoint:
+        """
+        The MarketingGroupsIdContactsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsIdContactsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,11 +29,6 @@ class MarketingGroupsIdEndpoint(
         IPuttable.__init__(self, Group)
         IPaginateable.__init__(self, Group)
 
-        self.companies = self._register_child_endpoint(MarketingGroupsIdCompaniesEndpoint(client, parent_endpoint=self))
-        self.contacts = self._register_child_endpoint(MarketingGroupsIdContactsEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(MarketingGroupsIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(MarketingGroupsIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Group]:
@@ -73,7 +69,7 @@ class MarketingGroupsIdEndpoint(
         Returns:
             Group: The parsed response data.
         """
-        return self._parse_one(Group, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Group, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Group:
         """
@@ -85,7 +81,7 @@ class MarketingGroupsIdEndpoint(
         Returns:
             Group: The parsed response data.
         """
-        return self._parse_one(Group, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Group, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Group:
         """
@@ -97,4 +93,32 @@ class MarketingGroupsIdEndpoint(
         Returns:
             Group: The parsed response data.
         """
-        return self._parse_one(Group, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Group, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def companies(self) -> MarketingGroupsIdCompaniesEndpoint:
+        """
+        The MarketingGroupsIdCompaniesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsIdCompaniesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def contacts(self) -> MarketingGroupsIdContactsEndpoint:
+        """
+        The MarketingGroupsIdContactsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsIdContactsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> MarketingGroupsIdInfoEndpoint:
+        """
+        The MarketingGroupsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> MarketingGroupsIdUsagesEndpoint:
+        """
+        The MarketingGroupsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -50,4 +50,4 @@ class MarketingGroupsIdInfoEndpoint(
         Returns:
             GroupInfo: The parsed response data.
         """
-        return self._parse_one(GroupInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(GroupInfo, super()._make_request("GET", data=data, params=params).content)
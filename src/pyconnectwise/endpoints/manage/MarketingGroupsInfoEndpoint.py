@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class MarketingGroupsInfoEndpoint(
         IGettable.__init__(self, list[GroupInfo])
         IPaginateable.__init__(self, GroupInfo)
 
-        self.count = self._register_child_endpoint(MarketingGroupsInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[GroupInfo]:
@@ -53,4 +52,11 @@ class MarketingGroupsInfoEndpoint(
         Returns:
             list[GroupInfo]: The parsed response data.
         """
-        return self._parse_many(GroupInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(GroupInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> MarketingGroupsInfoCountEndpoint:
+        """
+        The MarketingGroupsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProcurementAdjustmentsEndpoint(
         IPostable.__init__(self, ProcurementAdjustment)
         IPaginateable.__init__(self, ProcurementAdjustment)
 
-        self.count = self._register_child_endpoint(ProcurementAdjustmentsCountEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(ProcurementAdjustmentsTypesEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementAdjustmentsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementAdjustmentsIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class ProcurementAdjustmentsEndpoint(
         Returns:
             list[ProcurementAdjustment]: The parsed response data.
         """
-        return self._parse_many(ProcurementAdjustment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProcurementAdjustment, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -89,4 +87,18 @@ class ProcurementAdjustmentsEndpoint(
         Returns:
             ProcurementAdjustment: The parsed response data.
         """
-        return self._parse_one(ProcurementAdjustment, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProcurementAdjustment, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementAdjustmentsCountEndpoint:
+        """
+        The ProcurementAdjustmentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementAdjustmentsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> ProcurementAdjustmentsTypesEndpoint:
+        """
+        The ProcurementAdjustmentsTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementAdjustmentsTypesEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ProcurementAdjustmentsIdDetailsEndpoint(
         IPostable.__init__(self, AdjustmentDetail)
         IPaginateable.__init__(self, AdjustmentDetail)
 
-        self.count = self._register_child_endpoint(
-            ProcurementAdjustmentsIdDetailsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementAdjustmentsIdDetailsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementAdjustmentsIdDetailsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class ProcurementAdjustmentsIdDetailsEndpoint(
         Returns:
             list[AdjustmentDetail]: The parsed response data.
         """
-        return self._parse_many(AdjustmentDetail, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AdjustmentDetail, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AdjustmentDetail:
         """
@@ -91,4 +88,13 @@ class ProcurementAdjustmentsIdDetailsEndpoint(
         Returns:
             AdjustmentDetail: The parsed response data.
         """
-        return self._parse_one(AdjustmentDetail, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AdjustmentDetail, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementAdjustmentsIdDetailsCountEndpoint:
+        """
+        The ProcurementAdjustmentsIdDetailsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementAdjustmentsIdDetailsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -62,4 +62,4 @@ class ProcurementAdjustmentsIdDetailsIdEndpoint(
         Returns:
             AdjustmentDetail: The parsed response data.
         """
-        return self._parse_one(AdjustmentDetail, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AdjustmentDetail, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class ProcurementAdjustmentsIdEndpoint(
         IPuttable.__init__(self, ProcurementAdjustment)
         IPaginateable.__init__(self, ProcurementAdjustment)
 
-        self.details = self._register_child_endpoint(
-            ProcurementAdjustmentsIdDetailsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ProcurementAdjustment]:
@@ -75,7 +72,7 @@ class ProcurementAdjustmentsIdEndpoint(
         Returns:
             ProcurementAdjustment: The parsed response data.
         """
-        return self._parse_one(ProcurementAdjustment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProcurementAdjustment, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -89,7 +86,7 @@ class ProcurementAdjustmentsIdEndpoint(
         Returns:
             ProcurementAdjustment: The parsed response data.
         """
-        return self._parse_one(ProcurementAdjustment, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProcurementAdjustment, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -103,4 +100,11 @@ class ProcurementAdjustmentsIdEndpoint(
         Returns:
             ProcurementAdjustment: The parsed response data.
         """
-        return self._parse_one(ProcurementAdjustment, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProcurementAdjustment, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def details(self) -> ProcurementAdjustmentsIdDetailsEndpoint:
+        """
+        The ProcurementAdjustmentsIdDetailsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementAdjustmentsIdDetailsEndpoint(self.client, parent_endpoint=self))
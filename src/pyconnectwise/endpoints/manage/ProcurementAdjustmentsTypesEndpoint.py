@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -29,11 +30,6 @@ class ProcurementAdjustmentsTypesEndpoint(
         IPostable.__init__(self, AdjustmentType)
         IPaginateable.__init__(self, AdjustmentType)
 
-        self.count = self._register_child_endpoint(
-            ProcurementAdjustmentsTypesCountEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(ProcurementAdjustmentsTypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementAdjustmentsTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementAdjustmentsTypesIdEndpoint object to move down the chain.
@@ -81,7 +77,7 @@ class ProcurementAdjustmentsTypesEndpoint(
         Returns:
             list[AdjustmentType]: The parsed response data.
         """
-        return self._parse_many(AdjustmentType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AdjustmentType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AdjustmentType:
         """
@@ -93,4 +89,20 @@ class ProcurementAdjustmentsTypesEndpoint(
         Returns:
             AdjustmentType: The parsed response data.
         """
-        return self._parse_one(AdjustmentType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AdjustmentType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementAdjustmentsTypesCountEndpoint:
+        """
+        The ProcurementAdjustmentsTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementAdjustmentsTypesCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> ProcurementAdjustmentsTypesInfoEndpoint:
+        """
+        The ProcurementAdjustmentsTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementAdjustmentsTypesInfoEndpoint(self.client, parent_endpoint=self))
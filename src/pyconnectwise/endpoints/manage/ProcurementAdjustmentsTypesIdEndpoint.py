@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -30,13 +31,6 @@ class ProcurementAdjustmentsTypesIdEndpoint(
         IPuttable.__init__(self, AdjustmentType)
         IPaginateable.__init__(self, AdjustmentType)
 
-        self.info = self._register_child_endpoint(
-            ProcurementAdjustmentsTypesIdInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            ProcurementAdjustmentsTypesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[AdjustmentType]:
@@ -79,7 +73,7 @@ class ProcurementAdjustmentsTypesIdEndpoint(
         Returns:
             AdjustmentType: The parsed response data.
         """
-        return self._parse_one(AdjustmentType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AdjustmentType, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> AdjustmentType:
         """
@@ -91,7 +85,7 @@ class ProcurementAdjustmentsTypesIdEndpoint(
         Returns:
             AdjustmentType: The parsed response data.
         """
-        return self._parse_one(AdjustmentType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(AdjustmentType, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AdjustmentType:
         """
@@ -103,4 +97,22 @@ class ProcurementAdjustmentsTypesIdEndpoint(
         Returns:
             AdjustmentType: The parsed response data.
         """
-        return self._parse_one(AdjustmentType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(AdjustmentType, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ProcurementAdjustmentsTypesIdInfoEndpoint:
+        """
+        The ProcurementAdjustmentsTypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementAdjustmentsTypesIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> ProcurementAdjustmentsTypesIdUsagesEndpoint:
+        """
+        The ProcurementAdjustmentsTypesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementAdjustmentsTypesIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
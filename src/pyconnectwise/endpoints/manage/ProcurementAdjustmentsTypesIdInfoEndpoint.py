@@ -52,4 +52,4 @@ class ProcurementAdjustmentsTypesIdInfoEndpoint(
         Returns:
             AdjustmentTypeInfo: The parsed response data.
         """
-        return self._parse_one(AdjustmentTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AdjustmentTypeInfo, super()._make_request("GET", data=data, params=params).content)
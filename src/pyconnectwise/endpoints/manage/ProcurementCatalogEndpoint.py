@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProcurementCatalogEndpoint(
         IPostable.__init__(self, CatalogItem)
         IPaginateable.__init__(self, CatalogItem)
 
-        self.count = self._register_child_endpoint(ProcurementCatalogCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ProcurementCatalogInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementCatalogIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementCatalogIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class ProcurementCatalogEndpoint(
         Returns:
             list[CatalogItem]: The parsed response data.
         """
-        return self._parse_many(CatalogItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CatalogItem, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CatalogItem:
         """
@@ -85,4 +83,18 @@ class ProcurementCatalogEndpoint(
         Returns:
             CatalogItem: The parsed response data.
         """
-        return self._parse_one(CatalogItem, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CatalogItem, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementCatalogCountEndpoint:
+        """
+        The ProcurementCatalogCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementCatalogInfoEndpoint:
+        """
+        The ProcurementCatalogInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogInfoEndpoint(self.client, parent_endpoint=self))
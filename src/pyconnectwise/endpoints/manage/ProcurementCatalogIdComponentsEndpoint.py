@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ProcurementCatalogIdComponentsEndpoint(
         IPostable.__init__(self, CatalogComponent)
         IPaginateable.__init__(self, CatalogComponent)
 
-        self.count = self._register_child_endpoint(
-            ProcurementCatalogIdComponentsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementCatalogIdComponentsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementCatalogIdComponentsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class ProcurementCatalogIdComponentsEndpoint(
         Returns:
             list[CatalogComponent]: The parsed response data.
         """
-        return self._parse_many(CatalogComponent, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CatalogComponent, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CatalogComponent:
         """
@@ -91,4 +88,13 @@ class ProcurementCatalogIdComponentsEndpoint(
         Returns:
             CatalogComponent: The parsed response data.
         """
-        return self._parse_one(CatalogComponent, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CatalogComponent, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementCatalogIdComponentsCountEndpoint:
+        """
+        The ProcurementCatalogIdComponentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCatalogIdComponentsCountEndpoint(self.client, parent_endpoint=self)
+        )
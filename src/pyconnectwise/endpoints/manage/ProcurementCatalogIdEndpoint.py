@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -34,21 +35,6 @@ class ProcurementCatalogIdEndpoint(
         IPuttable.__init__(self, CatalogItem)
         IPaginateable.__init__(self, CatalogItem)
 
-        self.components = self._register_child_endpoint(
-            ProcurementCatalogIdComponentsEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(ProcurementCatalogIdInfoEndpoint(client, parent_endpoint=self))
-        self.inventory = self._register_child_endpoint(
-            ProcurementCatalogIdInventoryEndpoint(client, parent_endpoint=self)
-        )
-        self.minimum_stock_by_warehouse = self._register_child_endpoint(
-            ProcurementCatalogIdMinimumstockbywarehouseEndpoint(client, parent_endpoint=self)
-        )
-        self.pricing = self._register_child_endpoint(ProcurementCatalogIdPricingEndpoint(client, parent_endpoint=self))
-        self.quantity_on_hand = self._register_child_endpoint(
-            ProcurementCatalogIdQuantityonhandEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[CatalogItem]:
@@ -91,7 +77,7 @@ class ProcurementCatalogIdEndpoint(
         Returns:
             CatalogItem: The parsed response data.
         """
-        return self._parse_one(CatalogItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CatalogItem, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> CatalogItem:
         """
@@ -103,7 +89,7 @@ class ProcurementCatalogIdEndpoint(
         Returns:
             CatalogItem: The parsed response data.
         """
-        return self._parse_one(CatalogItem, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(CatalogItem, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CatalogItem:
         """
@@ -115,4 +101,50 @@ class ProcurementCatalogIdEndpoint(
         Returns:
             CatalogItem: The parsed response data.
         """
-        return self._parse_one(CatalogItem, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(CatalogItem, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def components(self) -> ProcurementCatalogIdComponentsEndpoint:
+        """
+        The ProcurementCatalogIdComponentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogIdComponentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementCatalogIdInfoEndpoint:
+        """
+        The ProcurementCatalogIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def inventory(self) -> ProcurementCatalogIdInventoryEndpoint:
+        """
+        The ProcurementCatalogIdInventoryEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogIdInventoryEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def minimum_stock_by_warehouse(self) -> ProcurementCatalogIdMinimumstockbywarehouseEndpoint:
+        """
+        The ProcurementCatalogIdMinimumstockbywarehouseEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCatalogIdMinimumstockbywarehouseEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def pricing(self) -> ProcurementCatalogIdPricingEndpoint:
+        """
+        The ProcurementCatalogIdPricingEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogIdPricingEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def quantity_on_hand(self) -> ProcurementCatalogIdQuantityonhandEndpoint:
+        """
+        The ProcurementCatalogIdQuantityonhandEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCatalogIdQuantityonhandEndpoint(self.client, parent_endpoint=self)
+        )
@@ -52,4 +52,4 @@ class ProcurementCatalogIdInfoEndpoint(
         Returns:
             CatalogItemInfo: The parsed response data.
         """
-        return self._parse_one(CatalogItemInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CatalogItemInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class ProcurementCatalogIdInventoryEndpoint(
         IGettable.__init__(self, list[CatalogInventory])
         IPaginateable.__init__(self, CatalogInventory)
 
-        self.count = self._register_child_endpoint(
-            ProcurementCatalogIdInventoryCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementCatalogIdInventoryIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementCatalogIdInventoryIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class ProcurementCatalogIdInventoryEndpoint(
         Returns:
             list[CatalogInventory]: The parsed response data.
         """
-        return self._parse_many(CatalogInventory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CatalogInventory, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementCatalogIdInventoryCountEndpoint:
+        """
+        The ProcurementCatalogIdInventoryCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCatalogIdInventoryCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -52,4 +52,4 @@ class ProcurementCatalogIdInventoryIdEndpoint(
         Returns:
             CatalogInventory: The parsed response data.
         """
-        return self._parse_one(CatalogInventory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CatalogInventory, super()._make_request("GET", data=data, params=params).content)
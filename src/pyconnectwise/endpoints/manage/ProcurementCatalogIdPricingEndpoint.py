@@ -26,4 +26,4 @@ class ProcurementCatalogIdPricingEndpoint(
         Returns:
             CatalogPricing: The parsed response data.
         """
-        return self._parse_one(CatalogPricing, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CatalogPricing, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class ProcurementCatalogInfoEndpoint(
         IGettable.__init__(self, list[CatalogItemInfo])
         IPaginateable.__init__(self, CatalogItemInfo)
 
-        self.count = self._register_child_endpoint(ProcurementCatalogInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[CatalogItemInfo]:
@@ -57,4 +56,11 @@ class ProcurementCatalogInfoEndpoint(
         Returns:
             list[CatalogItemInfo]: The parsed response data.
         """
-        return self._parse_many(CatalogItemInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CatalogItemInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementCatalogInfoCountEndpoint:
+        """
+        The ProcurementCatalogInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProcurementCategoriesEndpoint(
         IPostable.__init__(self, Category)
         IPaginateable.__init__(self, Category)
 
-        self.count = self._register_child_endpoint(ProcurementCategoriesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ProcurementCategoriesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementCategoriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementCategoriesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class ProcurementCategoriesEndpoint(
         Returns:
             list[Category]: The parsed response data.
         """
-        return self._parse_many(Category, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Category, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Category:
         """
@@ -83,4 +81,18 @@ class ProcurementCategoriesEndpoint(
         Returns:
             Category: The parsed response data.
         """
-        return self._parse_one(Category, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Category, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementCategoriesCountEndpoint:
+        """
+        The ProcurementCategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCategoriesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementCategoriesInfoEndpoint:
+        """
+        The ProcurementCategoriesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCategoriesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,11 +29,6 @@ class ProcurementCategoriesIdEndpoint(
         IPuttable.__init__(self, Category)
         IPaginateable.__init__(self, Category)
 
-        self.info = self._register_child_endpoint(ProcurementCategoriesIdInfoEndpoint(client, parent_endpoint=self))
-        self.subcategories = self._register_child_endpoint(
-            ProcurementCategoriesIdSubcategoriesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Category]:
@@ -73,7 +69,7 @@ class ProcurementCategoriesIdEndpoint(
         Returns:
             Category: The parsed response data.
         """
-        return self._parse_one(Category, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Category, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Category:
         """
@@ -85,7 +81,7 @@ class ProcurementCategoriesIdEndpoint(
         Returns:
             Category: The parsed response data.
         """
-        return self._parse_one(Category, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Category, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Category:
         """
@@ -97,4 +93,20 @@ class ProcurementCategoriesIdEndpoint(
         Returns:
             Category: The parsed response data.
         """
-        return self._parse_one(Category, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Category, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ProcurementCategoriesIdInfoEndpoint:
+        """
+        The ProcurementCategoriesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCategoriesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def subcategories(self) -> ProcurementCategoriesIdSubcategoriesEndpoint:
+        """
+        The ProcurementCategoriesIdSubcategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCategoriesIdSubcategoriesEndpoint(self.client, parent_endpoint=self)
+        )
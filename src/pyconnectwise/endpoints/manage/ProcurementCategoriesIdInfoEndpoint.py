@@ -52,4 +52,4 @@ class ProcurementCategoriesIdInfoEndpoint(
         Returns:
             CategoryInfo: The parsed response data.
         """
-        return self._parse_one(CategoryInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CategoryInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -19,13 +20,6 @@ class ProcurementCategoriesIdSubcategoriesEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "subcategories", parent_endpoint=parent_endpoint)
 
-        self.count = self._register_child_endpoint(
-            ProcurementCategoriesIdSubcategoriesCountEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(
-            ProcurementCategoriesIdSubcategoriesInfoEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementCategoriesIdSubcategoriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementCategoriesIdSubcategoriesIdEndpoint object to move down the chain.
@@ -38,3 +32,21 @@ class ProcurementCategoriesIdSubcategoriesEndpoint(ConnectWiseEndpoint):
         child = ProcurementCategoriesIdSubcategoriesIdEndpoint(self.client, parent_endpoint=self)
         child._id = _id
         return child
+
+    @cached_property
+    def count(self) -> ProcurementCategoriesIdSubcategoriesCountEndpoint:
+        """
+        The ProcurementCategoriesIdSubcategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCategoriesIdSubcategoriesCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> ProcurementCategoriesIdSubcategoriesInfoEndpoint:
+        """
+        The ProcurementCategoriesIdSubcategoriesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCategoriesIdSubcategoriesInfoEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class ProcurementCategoriesIdSubcategoriesIdEndpoint(
         IPuttable.__init__(self, LegacySubCategory)
         IPaginateable.__init__(self, LegacySubCategory)
 
-        self.info = self._register_child_endpoint(
-            ProcurementCategoriesIdSubcategoriesIdInfoEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[LegacySubCategory]:
@@ -73,7 +70,7 @@ class ProcurementCategoriesIdSubcategoriesIdEndpoint(
         Returns:
             LegacySubCategory: The parsed response data.
         """
-        return self._parse_one(LegacySubCategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LegacySubCategory, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> LegacySubCategory:
         """
@@ -85,7 +82,7 @@ class ProcurementCategoriesIdSubcategoriesIdEndpoint(
         Returns:
             LegacySubCategory: The parsed response data.
         """
-        return self._parse_one(LegacySubCategory, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(LegacySubCategory, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> LegacySubCategory:
         """
@@ -97,4 +94,13 @@ class ProcurementCategoriesIdSubcategoriesIdEndpoint(
         Returns:
             LegacySubCategory: The parsed response data.
         """
-        return self._parse_one(LegacySubCategory, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(LegacySubCategory, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ProcurementCategoriesIdSubcategoriesIdInfoEndpoint:
+        """
+        The ProcurementCategoriesIdSubcategoriesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCategoriesIdSubcategoriesIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
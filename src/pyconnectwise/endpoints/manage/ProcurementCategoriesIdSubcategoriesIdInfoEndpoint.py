@@ -54,4 +54,4 @@ class ProcurementCategoriesIdSubcategoriesIdInfoEndpoint(
         Returns:
             LegacySubCategoryInfo: The parsed response data.
         """
-        return self._parse_one(LegacySubCategoryInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LegacySubCategoryInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class ProcurementCategoriesInfoEndpoint(
         IGettable.__init__(self, list[CategoryInfo])
         IPaginateable.__init__(self, CategoryInfo)
 
-        self.count = self._register_child_endpoint(ProcurementCategoriesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[CategoryInfo]:
@@ -55,4 +54,11 @@ class ProcurementCategoriesInfoEndpoint(
         Returns:
             list[CategoryInfo]: The parsed response data.
         """
-        return self._parse_many(CategoryInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CategoryInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementCategoriesInfoCountEndpoint:
+        """
+        The ProcurementCategoriesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCategoriesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.ProcurementDirectionalsyncsCountEndpoint import (
     ProcurementDirectionalsyncsCountEndpoint,
@@ -30,10 +32,6 @@ class ProcurementDirectionalsyncsEndpoint(
         IPostable.__init__(self, DirectionalSync)
         IPaginateable.__init__(self, DirectionalSync)
 
-        self.count = self._register_child_endpoint(
-            ProcurementDirectionalsyncsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, id: int) -> ProcurementDirectionalsyncsIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized ProcurementDirectionalsyncsIdEndpoint object to move down the chain.
@@ -93,7 +91,7 @@ class ProcurementDirectionalsyncsEndpoint(
         """
         return self._parse_many(
             DirectionalSync,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -112,5 +110,14 @@ class ProcurementDirectionalsyncsEndpoint(
         """
         return self._parse_one(
             DirectionalSync,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
+        )
+
+    @cached_property
+    def count(self) -> ProcurementDirectionalsyncsCountEndpoint:
+        """
+        The ProcurementDirectionalsyncsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementDirectionalsyncsCountEndpoint(self.client, parent_endpoint=self)
         )
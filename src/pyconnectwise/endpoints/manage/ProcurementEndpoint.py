@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -33,46 +34,151 @@ class ProcurementEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "procurement", parent_endpoint=parent_endpoint)
 
-        self.adjustments = self._register_child_endpoint(ProcurementAdjustmentsEndpoint(client, parent_endpoint=self))
-        self.catalog = self._register_child_endpoint(ProcurementCatalogEndpoint(client, parent_endpoint=self))
-        self.categories = self._register_child_endpoint(ProcurementCategoriesEndpoint(client, parent_endpoint=self))
-        self.manufacturers = self._register_child_endpoint(
-            ProcurementManufacturersEndpoint(client, parent_endpoint=self)
-        )
-        self.onhandserialnumbers = self._register_child_endpoint(
-            ProcurementOnhandserialnumbersEndpoint(client, parent_endpoint=self)
-        )
-        self.pricingschedules = self._register_child_endpoint(
-            ProcurementPricingschedulesEndpoint(client, parent_endpoint=self)
-        )
-        self.products = self._register_child_endpoint(ProcurementProductsEndpoint(client, parent_endpoint=self))
-        self.purchaseorders = self._register_child_endpoint(
-            ProcurementPurchaseordersEndpoint(client, parent_endpoint=self)
-        )
-        self.purchaseorderstatuses = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesEndpoint(client, parent_endpoint=self)
-        )
-        self.purchasing_demands = self._register_child_endpoint(
-            ProcurementPurchasingdemandsEndpoint(client, parent_endpoint=self)
-        )
-        self.r_m_a_dispositions = self._register_child_endpoint(
-            ProcurementRmadispositionsEndpoint(client, parent_endpoint=self)
-        )
-        self.rma_actions = self._register_child_endpoint(ProcurementRmaactionsEndpoint(client, parent_endpoint=self))
-        self.rma_statuses = self._register_child_endpoint(ProcurementRmastatusesEndpoint(client, parent_endpoint=self))
-        self.rma_tags = self._register_child_endpoint(ProcurementRmatagsEndpoint(client, parent_endpoint=self))
-        self.settings = self._register_child_endpoint(ProcurementSettingsEndpoint(client, parent_endpoint=self))
-        self.shipmentmethods = self._register_child_endpoint(
-            ProcurementShipmentmethodsEndpoint(client, parent_endpoint=self)
-        )
-        self.subcategories = self._register_child_endpoint(
-            ProcurementSubcategoriesEndpoint(client, parent_endpoint=self)
-        )
-        self.types = self._register_child_endpoint(ProcurementTypesEndpoint(client, parent_endpoint=self))
-        self.unit_of_measures = self._register_child_endpoint(
-            ProcurementUnitofmeasuresEndpoint(client, parent_endpoint=self)
-        )
-        self.warehouse_bins = self._register_child_endpoint(
-            ProcurementWarehousebinsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def adjustments(self) -> ProcurementAdjustmentsEndpoint:
+        """
+        The ProcurementAdjustmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementAdjustmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def catalog(self) -> ProcurementCatalogEndpoint:
+        """
+        The ProcurementCatalogEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def categories(self) -> ProcurementCategoriesEndpoint:
+        """
+        The ProcurementCategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCategoriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def manufacturers(self) -> ProcurementManufacturersEndpoint:
+        """
+        The ProcurementManufacturersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementManufacturersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def onhandserialnumbers(self) -> ProcurementOnhandserialnumbersEndpoint:
+        """
+        The ProcurementOnhandserialnumbersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementOnhandserialnumbersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def pricingschedules(self) -> ProcurementPricingschedulesEndpoint:
+        """
+        The ProcurementPricingschedulesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementPricingschedulesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def products(self) -> ProcurementProductsEndpoint:
+        """
+        The ProcurementProductsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementProductsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def purchaseorders(self) -> ProcurementPurchaseordersEndpoint:
+        """
+        The ProcurementPurchaseordersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementPurchaseordersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def purchaseorderstatuses(self) -> ProcurementPurchaseorderstatusesEndpoint:
+        """
+        The ProcurementPurchaseorderstatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseorderstatusesEndpoint(self.client, parent_endpoint=self)
         )
-        self.warehouses = self._register_child_endpoint(ProcurementWarehousesEndpoint(client, parent_endpoint=self))
+
+    @cached_property
+    def purchasing_demands(self) -> ProcurementPurchasingdemandsEndpoint:
+        """
+        The ProcurementPurchasingdemandsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementPurchasingdemandsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def r_m_a_dispositions(self) -> ProcurementRmadispositionsEndpoint:
+        """
+        The ProcurementRmadispositionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmadispositionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def rma_actions(self) -> ProcurementRmaactionsEndpoint:
+        """
+        The ProcurementRmaactionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmaactionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def rma_statuses(self) -> ProcurementRmastatusesEndpoint:
+        """
+        The ProcurementRmastatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmastatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def rma_tags(self) -> ProcurementRmatagsEndpoint:
+        """
+        The ProcurementRmatagsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmatagsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def settings(self) -> ProcurementSettingsEndpoint:
+        """
+        The ProcurementSettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementSettingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def shipmentmethods(self) -> ProcurementShipmentmethodsEndpoint:
+        """
+        The ProcurementShipmentmethodsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementShipmentmethodsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def subcategories(self) -> ProcurementSubcategoriesEndpoint:
+        """
+        The ProcurementSubcategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementSubcategoriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> ProcurementTypesEndpoint:
+        """
+        The ProcurementTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementTypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def unit_of_measures(self) -> ProcurementUnitofmeasuresEndpoint:
+        """
+        The ProcurementUnitofmeasuresEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementUnitofmeasuresEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def warehouse_bins(self) -> ProcurementWarehousebinsEndpoint:
+        """
+        The ProcurementWarehousebinsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousebinsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def warehouses(self) -> ProcurementWarehousesEndpoint:
+        """
+        The ProcurementWarehousesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousesEndpoint(self.client, parent_endpoint=self))
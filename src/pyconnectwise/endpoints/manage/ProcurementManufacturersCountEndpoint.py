@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class ProcurementManufacturersCountEndpoint(
         IGettable.__init__(self, Count)
         IPaginateable.__init__(self, Count)
 
-        self.info = self._register_child_endpoint(
-            ProcurementManufacturersCountInfoEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Count]:
@@ -57,4 +54,13 @@ class ProcurementManufacturersCountEndpoint(
         Returns:
             Count: The parsed response data.
         """
-        return self._parse_one(Count, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Count, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ProcurementManufacturersCountInfoEndpoint:
+        """
+        The ProcurementManufacturersCountInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementManufacturersCountInfoEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProcurementManufacturersEndpoint(
         IPostable.__init__(self, Manufacturer)
         IPaginateable.__init__(self, Manufacturer)
 
-        self.count = self._register_child_endpoint(ProcurementManufacturersCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ProcurementManufacturersInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementManufacturersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementManufacturersIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class ProcurementManufacturersEndpoint(
         Returns:
             list[Manufacturer]: The parsed response data.
         """
-        return self._parse_many(Manufacturer, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Manufacturer, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Manufacturer:
         """
@@ -85,4 +83,18 @@ class ProcurementManufacturersEndpoint(
         Returns:
             Manufacturer: The parsed response data.
         """
-        return self._parse_one(Manufacturer, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Manufacturer, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementManufacturersCountEndpoint:
+        """
+        The ProcurementManufacturersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementManufacturersCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementManufacturersInfoEndpoint:
+        """
+        The ProcurementManufacturersInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementManufacturersInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ProcurementManufacturersIdInfoEndpoint(
         Returns:
             ManufacturerInfo: The parsed response data.
         """
-        return self._parse_one(ManufacturerInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ManufacturerInfo, super()._make_request("GET", data=data, params=params).content)
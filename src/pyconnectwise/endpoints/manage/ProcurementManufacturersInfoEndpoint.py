@@ -54,4 +54,4 @@ class ProcurementManufacturersInfoEndpoint(
         Returns:
             list[ManufacturerInfo]: The parsed response data.
         """
-        return self._parse_many(ManufacturerInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ManufacturerInfo, super()._make_request("GET", data=data, params=params).content)
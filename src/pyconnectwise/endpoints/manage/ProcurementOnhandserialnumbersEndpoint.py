@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class ProcurementOnhandserialnumbersEndpoint(
         IGettable.__init__(self, list[OnHandSerialNumber])
         IPaginateable.__init__(self, OnHandSerialNumber)
 
-        self.count = self._register_child_endpoint(
-            ProcurementOnhandserialnumbersCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementOnhandserialnumbersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementOnhandserialnumbersIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class ProcurementOnhandserialnumbersEndpoint(
         Returns:
             list[OnHandSerialNumber]: The parsed response data.
         """
-        return self._parse_many(OnHandSerialNumber, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OnHandSerialNumber, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementOnhandserialnumbersCountEndpoint:
+        """
+        The ProcurementOnhandserialnumbersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementOnhandserialnumbersCountEndpoint(self.client, parent_endpoint=self)
+        )
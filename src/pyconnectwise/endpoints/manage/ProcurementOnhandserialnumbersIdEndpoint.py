@@ -52,4 +52,4 @@ class ProcurementOnhandserialnumbersIdEndpoint(
         Returns:
             OnHandSerialNumber: The parsed response data.
         """
-        return self._parse_one(OnHandSerialNumber, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OnHandSerialNumber, super()._make_request("GET", data=data, params=params).content)
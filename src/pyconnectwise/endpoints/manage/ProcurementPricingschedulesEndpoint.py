@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class ProcurementPricingschedulesEndpoint(
         IPostable.__init__(self, PricingSchedule)
         IPaginateable.__init__(self, PricingSchedule)
 
-        self.count = self._register_child_endpoint(
-            ProcurementPricingschedulesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementPricingschedulesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementPricingschedulesIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class ProcurementPricingschedulesEndpoint(
         Returns:
             list[PricingSchedule]: The parsed response data.
         """
-        return self._parse_many(PricingSchedule, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PricingSchedule, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> PricingSchedule:
         """
@@ -89,4 +86,13 @@ class ProcurementPricingschedulesEndpoint(
         Returns:
             PricingSchedule: The parsed response data.
         """
-        return self._parse_one(PricingSchedule, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PricingSchedule, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementPricingschedulesCountEndpoint:
+        """
+        The ProcurementPricingschedulesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPricingschedulesCountEndpoint(self.client, parent_endpoint=self)
+        )
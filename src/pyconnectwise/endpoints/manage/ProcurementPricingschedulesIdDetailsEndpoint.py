@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ProcurementPricingschedulesIdDetailsEndpoint(
         IPostable.__init__(self, PricingDetail)
         IPaginateable.__init__(self, PricingDetail)
 
-        self.count = self._register_child_endpoint(
-            ProcurementPricingschedulesIdDetailsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementPricingschedulesIdDetailsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementPricingschedulesIdDetailsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class ProcurementPricingschedulesIdDetailsEndpoint(
         Returns:
             list[PricingDetail]: The parsed response data.
         """
-        return self._parse_many(PricingDetail, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PricingDetail, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> PricingDetail:
         """
@@ -91,4 +88,13 @@ class ProcurementPricingschedulesIdDetailsEndpoint(
         Returns:
             PricingDetail: The parsed response data.
         """
-        return self._parse_one(PricingDetail, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PricingDetail, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementPricingschedulesIdDetailsCountEndpoint:
+        """
+        The ProcurementPricingschedulesIdDetailsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPricingschedulesIdDetailsCountEndpoint(self.client, parent_endpoint=self)
+        )
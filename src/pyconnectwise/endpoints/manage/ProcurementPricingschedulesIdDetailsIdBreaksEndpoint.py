@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ProcurementPricingschedulesIdDetailsIdBreaksEndpoint(
         IPostable.__init__(self, PricingBreak)
         IPaginateable.__init__(self, PricingBreak)
 
-        self.count = self._register_child_endpoint(
-            ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class ProcurementPricingschedulesIdDetailsIdBreaksEndpoint(
         Returns:
             list[PricingBreak]: The parsed response data.
         """
-        return self._parse_many(PricingBreak, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PricingBreak, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> PricingBreak:
         """
@@ -89,4 +86,13 @@ class ProcurementPricingschedulesIdDetailsIdBreaksEndpoint(
         Returns:
             PricingBreak: The parsed response data.
         """
-        return self._parse_one(PricingBreak, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PricingBreak, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint:
+        """
+        The ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint(self.client, parent_endpoint=self)
+        )
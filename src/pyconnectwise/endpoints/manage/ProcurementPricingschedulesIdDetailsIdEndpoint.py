@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class ProcurementPricingschedulesIdDetailsIdEndpoint(
         IPuttable.__init__(self, PricingDetail)
         IPaginateable.__init__(self, PricingDetail)
 
-        self.breaks = self._register_child_endpoint(
-            ProcurementPricingschedulesIdDetailsIdBreaksEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[PricingDetail]:
@@ -73,7 +70,7 @@ class ProcurementPricingschedulesIdDetailsIdEndpoint(
         Returns:
             PricingDetail: The parsed response data.
         """
-        return self._parse_one(PricingDetail, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(PricingDetail, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> PricingDetail:
         """
@@ -85,7 +82,7 @@ class ProcurementPricingschedulesIdDetailsIdEndpoint(
         Returns:
             PricingDetail: The parsed response data.
         """
-        return self._parse_one(PricingDetail, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(PricingDetail, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> PricingDetail:
         """
@@ -97,4 +94,13 @@ class ProcurementPricingschedulesIdDetailsIdEndpoint(
         Returns:
             PricingDetail: The parsed response data.
         """
-        return self._parse_one(PricingDetail, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(PricingDetail, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def breaks(self) -> ProcurementPricingschedulesIdDetailsIdBreaksEndpoint:
+        """
+        The ProcurementPricingschedulesIdDetailsIdBreaksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPricingschedulesIdDetailsIdBreaksEndpoint(self.client, parent_endpoint=self)
+        )
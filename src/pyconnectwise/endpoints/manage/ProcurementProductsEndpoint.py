@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ProcurementProductsEndpoint(
         IPostable.__init__(self, ProductItem)
         IPaginateable.__init__(self, ProductItem)
 
-        self.count = self._register_child_endpoint(ProcurementProductsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementProductsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementProductsIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class ProcurementProductsEndpoint(
         Returns:
             list[ProductItem]: The parsed response data.
         """
-        return self._parse_many(ProductItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProductItem, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProductItem:
         """
@@ -83,4 +82,11 @@ class ProcurementProductsEndpoint(
         Returns:
             ProductItem: The parsed response data.
         """
-        return self._parse_one(ProductItem, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProductItem, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementProductsCountEndpoint:
+        """
+        The ProcurementProductsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementProductsCountEndpoint(self.client, parent_endpoint=self))
@@ -26,4 +26,4 @@ class ProcurementProductsIdDetachEndpoint(
         Returns:
             ProductDetach: The parsed response data.
         """
-        return self._parse_one(ProductDetach, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProductDetach, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -31,14 +32,6 @@ class ProcurementProductsIdEndpoint(
         IPuttable.__init__(self, ProductItem)
         IPaginateable.__init__(self, ProductItem)
 
-        self.components = self._register_child_endpoint(
-            ProcurementProductsIdComponentsEndpoint(client, parent_endpoint=self)
-        )
-        self.detach = self._register_child_endpoint(ProcurementProductsIdDetachEndpoint(client, parent_endpoint=self))
-        self.picking_shipping_details = self._register_child_endpoint(
-            ProcurementProductsIdPickingshippingdetailsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ProductItem]:
@@ -81,7 +74,7 @@ class ProcurementProductsIdEndpoint(
         Returns:
             ProductItem: The parsed response data.
         """
-        return self._parse_one(ProductItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProductItem, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ProductItem:
         """
@@ -93,7 +86,7 @@ class ProcurementProductsIdEndpoint(
         Returns:
             ProductItem: The parsed response data.
         """
-        return self._parse_one(ProductItem, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProductItem, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProductItem:
         """
@@ -105,4 +98,27 @@ class ProcurementProductsIdEndpoint(
         Returns:
             ProductItem: The parsed response data.
         """
-        return self._parse_one(ProductItem, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProductItem, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def components(self) -> ProcurementProductsIdComponentsEndpoint:
+        """
+        The ProcurementProductsIdComponentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementProductsIdComponentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def detach(self) -> ProcurementProductsIdDetachEndpoint:
+        """
+        The ProcurementProductsIdDetachEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementProductsIdDetachEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def picking_shipping_details(self) -> ProcurementProductsIdPickingshippingdetailsEndpoint:
+        """
+        The ProcurementProductsIdPickingshippingdetailsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementProductsIdPickingshippingdetailsEndpoint(self.client, parent_endpoint=self)
+        )
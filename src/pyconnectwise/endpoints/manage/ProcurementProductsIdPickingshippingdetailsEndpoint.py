@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ProcurementProductsIdPickingshippingdetailsEndpoint(
         IPostable.__init__(self, list[ProductPickingShippingDetail])
         IPaginateable.__init__(self, ProductPickingShippingDetail)
 
-        self.count = self._register_child_endpoint(
-            ProcurementProductsIdPickingshippingdetailsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementProductsIdPickingshippingdetailsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementProductsIdPickingshippingdetailsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class ProcurementProductsIdPickingshippingdetailsEndpoint(
             list[ProductPickingShippingDetail]: The parsed response data.
         """
         return self._parse_many(
-            ProductPickingShippingDetail, super()._make_request("GET", data=data, params=params).json()
+            ProductPickingShippingDetail, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class ProcurementProductsIdPickingshippingdetailsEndpoint(
             list[ProductPickingShippingDetail]: The parsed response data.
         """
         return self._parse_many(
-            ProductPickingShippingDetail, super()._make_request("POST", data=data, params=params).json()
+            ProductPickingShippingDetail, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementProductsIdPickingshippingdetailsCountEndpoint:
+        """
+        The ProcurementProductsIdPickingshippingdetailsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementProductsIdPickingshippingdetailsCountEndpoint(self.client, parent_endpoint=self)
         )
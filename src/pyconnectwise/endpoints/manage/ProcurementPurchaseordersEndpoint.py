@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ProcurementPurchaseordersEndpoint(
         IPostable.__init__(self, PurchaseOrder)
         IPaginateable.__init__(self, PurchaseOrder)
 
-        self.count = self._register_child_endpoint(ProcurementPurchaseordersCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementPurchaseordersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementPurchaseordersIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class ProcurementPurchaseordersEndpoint(
         Returns:
             list[PurchaseOrder]: The parsed response data.
         """
-        return self._parse_many(PurchaseOrder, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PurchaseOrder, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> PurchaseOrder:
         """
@@ -85,4 +84,11 @@ class ProcurementPurchaseordersEndpoint(
         Returns:
             PurchaseOrder: The parsed response data.
         """
-        return self._parse_one(PurchaseOrder, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PurchaseOrder, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementPurchaseordersCountEndpoint:
+        """
+        The ProcurementPurchaseordersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementPurchaseordersCountEndpoint(self.client, parent_endpoint=self))
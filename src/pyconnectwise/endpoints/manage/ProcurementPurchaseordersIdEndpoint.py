@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class ProcurementPurchaseordersIdEndpoint(
         IPuttable.__init__(self, PurchaseOrder)
         IPaginateable.__init__(self, PurchaseOrder)
 
-        self.lineitems = self._register_child_endpoint(
-            ProcurementPurchaseordersIdLineitemsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[PurchaseOrder]:
@@ -73,7 +70,7 @@ class ProcurementPurchaseordersIdEndpoint(
         Returns:
             PurchaseOrder: The parsed response data.
         """
-        return self._parse_one(PurchaseOrder, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(PurchaseOrder, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> PurchaseOrder:
         """
@@ -85,7 +82,7 @@ class ProcurementPurchaseordersIdEndpoint(
         Returns:
             PurchaseOrder: The parsed response data.
         """
-        return self._parse_one(PurchaseOrder, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(PurchaseOrder, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> PurchaseOrder:
         """
@@ -97,4 +94,13 @@ class ProcurementPurchaseordersIdEndpoint(
         Returns:
             PurchaseOrder: The parsed response data.
         """
-        return self._parse_one(PurchaseOrder, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(PurchaseOrder, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def lineitems(self) -> ProcurementPurchaseordersIdLineitemsEndpoint:
+        """
+        The ProcurementPurchaseordersIdLineitemsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseordersIdLineitemsEndpoint(self.client, parent_endpoint=self)
+        )
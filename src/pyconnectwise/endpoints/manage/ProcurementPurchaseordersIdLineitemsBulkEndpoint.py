@@ -31,7 +31,7 @@ class ProcurementPurchaseordersIdLineitemsBulkEndpoint(
         Returns:
             BulkResult: The parsed response data.
         """
-        return self._parse_one(BulkResult, super()._make_request("DELETE", data=data, params=params).json())
+        return self._parse_one(BulkResult, super()._make_request("DELETE", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BulkResult:
         """
@@ -43,7 +43,7 @@ class ProcurementPurchaseordersIdLineitemsBulkEndpoint(
         Returns:
             BulkResult: The parsed response data.
         """
-        return self._parse_one(BulkResult, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BulkResult, super()._make_request("POST", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BulkResult:
         """
@@ -55,4 +55,4 @@ class ProcurementPurchaseordersIdLineitemsBulkEndpoint(
         Returns:
             BulkResult: The parsed response data.
         """
-        return self._parse_one(BulkResult, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(BulkResult, super()._make_request("PUT", data=data, params=params).content)
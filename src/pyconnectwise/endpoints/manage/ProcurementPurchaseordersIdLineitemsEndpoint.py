@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -31,13 +32,6 @@ class ProcurementPurchaseordersIdLineitemsEndpoint(
         IPostable.__init__(self, PurchaseOrderLineItem)
         IPaginateable.__init__(self, PurchaseOrderLineItem)
 
-        self.bulk = self._register_child_endpoint(
-            ProcurementPurchaseordersIdLineitemsBulkEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            ProcurementPurchaseordersIdLineitemsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementPurchaseordersIdLineitemsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementPurchaseordersIdLineitemsIdEndpoint object to move down the chain.
@@ -85,7 +79,7 @@ class ProcurementPurchaseordersIdLineitemsEndpoint(
         Returns:
             list[PurchaseOrderLineItem]: The parsed response data.
         """
-        return self._parse_many(PurchaseOrderLineItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PurchaseOrderLineItem, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -99,4 +93,22 @@ class ProcurementPurchaseordersIdLineitemsEndpoint(
         Returns:
             PurchaseOrderLineItem: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderLineItem, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderLineItem, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def bulk(self) -> ProcurementPurchaseordersIdLineitemsBulkEndpoint:
+        """
+        The ProcurementPurchaseordersIdLineitemsBulkEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseordersIdLineitemsBulkEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def count(self) -> ProcurementPurchaseordersIdLineitemsCountEndpoint:
+        """
+        The ProcurementPurchaseordersIdLineitemsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseordersIdLineitemsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -68,7 +68,7 @@ class ProcurementPurchaseordersIdLineitemsIdEndpoint(
         Returns:
             PurchaseOrderLineItem: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderLineItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderLineItem, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -82,7 +82,7 @@ class ProcurementPurchaseordersIdLineitemsIdEndpoint(
         Returns:
             PurchaseOrderLineItem: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderLineItem, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderLineItem, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -96,4 +96,4 @@ class ProcurementPurchaseordersIdLineitemsIdEndpoint(
         Returns:
             PurchaseOrderLineItem: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderLineItem, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderLineItem, super()._make_request("PUT", data=data, params=params).content)
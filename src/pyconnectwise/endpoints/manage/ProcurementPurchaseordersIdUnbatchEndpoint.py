@@ -32,5 +32,5 @@ class ProcurementPurchaseordersIdUnbatchEndpoint(
         """
         return self._parse_one(
             SuccessResponse,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ProcurementPurchaseorderstatusesEndpoint(
         IPostable.__init__(self, PurchaseOrderStatus)
         IPaginateable.__init__(self, PurchaseOrderStatus)
 
-        self.count = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementPurchaseorderstatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementPurchaseorderstatusesIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class ProcurementPurchaseorderstatusesEndpoint(
         Returns:
             list[PurchaseOrderStatus]: The parsed response data.
         """
-        return self._parse_many(PurchaseOrderStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PurchaseOrderStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -93,4 +90,13 @@ class ProcurementPurchaseorderstatusesEndpoint(
         Returns:
             PurchaseOrderStatus: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementPurchaseorderstatusesCountEndpoint:
+        """
+        The ProcurementPurchaseorderstatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseorderstatusesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -50,4 +50,4 @@ class ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint(
         Returns:
             Count: The parsed response data.
         """
-        return self._parse_one(Count, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Count, super()._make_request("GET", data=data, params=params).content)
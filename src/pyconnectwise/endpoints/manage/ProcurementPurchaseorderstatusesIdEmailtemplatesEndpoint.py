@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -16,10 +17,6 @@ class ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint(ConnectWiseEndpoi
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "emailtemplates", parent_endpoint=parent_endpoint)
 
-        self.count = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint object to move down the chain.
@@ -32,3 +29,12 @@ class ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint(ConnectWiseEndpoi
         child = ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint(self.client, parent_endpoint=self)
         child._id = _id
         return child
+
+    @cached_property
+    def count(self) -> ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint:
+        """
+        The ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -33,16 +34,6 @@ class ProcurementPurchaseorderstatusesIdEndpoint(
         IPuttable.__init__(self, PurchaseOrderStatus)
         IPaginateable.__init__(self, PurchaseOrderStatus)
 
-        self.emailtemplates = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.notifications = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesIdNotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[PurchaseOrderStatus]:
@@ -87,7 +78,7 @@ class ProcurementPurchaseorderstatusesIdEndpoint(
         Returns:
             PurchaseOrderStatus: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderStatus, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -101,7 +92,7 @@ class ProcurementPurchaseorderstatusesIdEndpoint(
         Returns:
             PurchaseOrderStatus: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderStatus, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderStatus, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -115,4 +106,31 @@ class ProcurementPurchaseorderstatusesIdEndpoint(
         Returns:
             PurchaseOrderStatus: The parsed response data.
         """
-        return self._parse_one(PurchaseOrderStatus, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(PurchaseOrderStatus, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def emailtemplates(self) -> ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint:
+        """
+        The ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def notifications(self) -> ProcurementPurchaseorderstatusesIdNotificationsEndpoint:
+        """
+        The ProcurementPurchaseorderstatusesIdNotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseorderstatusesIdNotificationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> ProcurementPurchaseorderstatusesIdUsagesEndpoint:
+        """
+        The ProcurementPurchaseorderstatusesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseorderstatusesIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
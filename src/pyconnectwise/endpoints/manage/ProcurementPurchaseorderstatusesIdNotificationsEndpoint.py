@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ProcurementPurchaseorderstatusesIdNotificationsEndpoint(
         IPostable.__init__(self, PurchaseOrderStatusNotification)
         IPaginateable.__init__(self, PurchaseOrderStatusNotification)
 
-        self.count = self._register_child_endpoint(
-            ProcurementPurchaseorderstatusesIdNotificationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementPurchaseorderstatusesIdNotificationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementPurchaseorderstatusesIdNotificationsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class ProcurementPurchaseorderstatusesIdNotificationsEndpoint(
             list[PurchaseOrderStatusNotification]: The parsed response data.
         """
         return self._parse_many(
-            PurchaseOrderStatusNotification, super()._make_request("GET", data=data, params=params).json()
+            PurchaseOrderStatusNotification, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class ProcurementPurchaseorderstatusesIdNotificationsEndpoint(
             PurchaseOrderStatusNotification: The parsed response data.
         """
         return self._parse_one(
-            PurchaseOrderStatusNotification, super()._make_request("POST", data=data, params=params).json()
+            PurchaseOrderStatusNotification, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementPurchaseorderstatusesIdNotificationsCountEndpoint:
+        """
+        The ProcurementPurchaseorderstatusesIdNotificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseorderstatusesIdNotificationsCountEndpoint(self.client, parent_endpoint=self)
         )
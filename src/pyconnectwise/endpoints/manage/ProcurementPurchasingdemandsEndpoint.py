@@ -26,4 +26,4 @@ class ProcurementPurchasingdemandsEndpoint(
         Returns:
             PurchasingDemand: The parsed response data.
         """
-        return self._parse_one(PurchasingDemand, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PurchasingDemand, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProcurementRmaactionsEndpoint(
         IPostable.__init__(self, RmaAction)
         IPaginateable.__init__(self, RmaAction)
 
-        self.count = self._register_child_endpoint(ProcurementRmaactionsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ProcurementRmaactionsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementRmaactionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementRmaactionsIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class ProcurementRmaactionsEndpoint(
         Returns:
             list[RmaAction]: The parsed response data.
         """
-        return self._parse_many(RmaAction, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(RmaAction, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> RmaAction:
         """
@@ -83,4 +81,18 @@ class ProcurementRmaactionsEndpoint(
         Returns:
             RmaAction: The parsed response data.
         """
-        return self._parse_one(RmaAction, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(RmaAction, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementRmaactionsCountEndpoint:
+        """
+        The ProcurementRmaactionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmaactionsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementRmaactionsInfoEndpoint:
+        """
+        The ProcurementRmaactionsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmaactionsInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ProcurementRmaactionsIdInfoEndpoint(
         Returns:
             RmaActionInfo: The parsed response data.
         """
-        return self._parse_one(RmaActionInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(RmaActionInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,11 +28,6 @@ class ProcurementRmadispositionsEndpoint(
         IPostable.__init__(self, RmaDisposition)
         IPaginateable.__init__(self, RmaDisposition)
 
-        self.count = self._register_child_endpoint(
-            ProcurementRmadispositionsCountEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(ProcurementRmadispositionsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementRmadispositionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementRmadispositionsIdEndpoint object to move down the chain.
@@ -79,7 +75,7 @@ class ProcurementRmadispositionsEndpoint(
         Returns:
             list[RmaDisposition]: The parsed response data.
         """
-        return self._parse_many(RmaDisposition, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(RmaDisposition, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> RmaDisposition:
         """
@@ -91,4 +87,18 @@ class ProcurementRmadispositionsEndpoint(
         Returns:
             RmaDisposition: The parsed response data.
         """
-        return self._parse_one(RmaDisposition, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(RmaDisposition, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementRmadispositionsCountEndpoint:
+        """
+        The ProcurementRmadispositionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmadispositionsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementRmadispositionsInfoEndpoint:
+        """
+        The ProcurementRmadispositionsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmadispositionsInfoEndpoint(self.client, parent_endpoint=self))
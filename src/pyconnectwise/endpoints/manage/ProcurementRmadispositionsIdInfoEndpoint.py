@@ -52,4 +52,4 @@ class ProcurementRmadispositionsIdInfoEndpoint(
         Returns:
             RmaDispositionInfo: The parsed response data.
         """
-        return self._parse_one(RmaDispositionInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(RmaDispositionInfo, super()._make_request("GET", data=data, params=params).content)
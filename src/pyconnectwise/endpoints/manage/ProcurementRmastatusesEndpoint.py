@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProcurementRmastatusesEndpoint(
         IPostable.__init__(self, RmaStatus)
         IPaginateable.__init__(self, RmaStatus)
 
-        self.count = self._register_child_endpoint(ProcurementRmastatusesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ProcurementRmastatusesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementRmastatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementRmastatusesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class ProcurementRmastatusesEndpoint(
         Returns:
             list[RmaStatus]: The parsed response data.
         """
-        return self._parse_many(RmaStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(RmaStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> RmaStatus:
         """
@@ -83,4 +81,18 @@ class ProcurementRmastatusesEndpoint(
         Returns:
             RmaStatus: The parsed response data.
         """
-        return self._parse_one(RmaStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(RmaStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementRmastatusesCountEndpoint:
+        """
+        The ProcurementRmastatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmastatusesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementRmastatusesInfoEndpoint:
+        """
+        The ProcurementRmastatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmastatusesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -32,20 +33,6 @@ class ProcurementRmastatusesIdEndpoint(
         IPuttable.__init__(self, RmaStatus)
         IPaginateable.__init__(self, RmaStatus)
 
-        self.email_templates = self._register_child_endpoint(
-            ProcurementRmastatusesIdEmailtemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.emailtemplates = self._register_child_endpoint(
-            ProcurementRmastatusesIdEmailtemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(ProcurementRmastatusesIdInfoEndpoint(client, parent_endpoint=self))
-        self.notifications = self._register_child_endpoint(
-            ProcurementRmastatusesIdNotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            ProcurementRmastatusesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[RmaStatus]:
@@ -86,7 +73,7 @@ class ProcurementRmastatusesIdEndpoint(
         Returns:
             RmaStatus: The parsed response data.
         """
-        return self._parse_one(RmaStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(RmaStatus, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> RmaStatus:
         """
@@ -98,7 +85,7 @@ class ProcurementRmastatusesIdEndpoint(
         Returns:
             RmaStatus: The parsed response data.
         """
-        return self._parse_one(RmaStatus, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(RmaStatus, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> RmaStatus:
         """
@@ -110,4 +97,45 @@ class ProcurementRmastatusesIdEndpoint(
         Returns:
             RmaStatus: The parsed response data.
         """
-        return self._parse_one(RmaStatus, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(RmaStatus, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def email_templates(self) -> ProcurementRmastatusesIdEmailtemplatesEndpoint:
+        """
+        The ProcurementRmastatusesIdEmailtemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementRmastatusesIdEmailtemplatesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def emailtemplates(self) -> ProcurementRmastatusesIdEmailtemplatesEndpoint:
+        """
+        The ProcurementRmastatusesIdEmailtemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementRmastatusesIdEmailtemplatesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> ProcurementRmastatusesIdInfoEndpoint:
+        """
+        The ProcurementRmastatusesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmastatusesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notifications(self) -> ProcurementRmastatusesIdNotificationsEndpoint:
+        """
+        The ProcurementRmastatusesIdNotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementRmastatusesIdNotificationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> ProcurementRmastatusesIdUsagesEndpoint:
+        """
+        The ProcurementRmastatusesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmastatusesIdUsagesEndpoint(self.client, parent_endpoint=self))
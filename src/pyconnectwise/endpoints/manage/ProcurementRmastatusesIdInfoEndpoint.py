@@ -52,4 +52,4 @@ class ProcurementRmastatusesIdInfoEndpoint(
         Returns:
             RmaStatusInfo: The parsed response data.
         """
-        return self._parse_one(RmaStatusInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(RmaStatusInfo, super()._make_request("GET", data=data, params=params).content)
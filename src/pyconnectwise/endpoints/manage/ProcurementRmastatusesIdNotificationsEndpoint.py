@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ProcurementRmastatusesIdNotificationsEndpoint(
         IPostable.__init__(self, RmaStatusNotification)
         IPaginateable.__init__(self, RmaStatusNotification)
 
-        self.count = self._register_child_endpoint(
-            ProcurementRmastatusesIdNotificationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementRmastatusesIdNotificationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementRmastatusesIdNotificationsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class ProcurementRmastatusesIdNotificationsEndpoint(
         Returns:
             list[RmaStatusNotification]: The parsed response data.
         """
-        return self._parse_many(RmaStatusNotification, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(RmaStatusNotification, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -93,4 +90,13 @@ class ProcurementRmastatusesIdNotificationsEndpoint(
         Returns:
             RmaStatusNotification: The parsed response data.
         """
-        return self._parse_one(RmaStatusNotification, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(RmaStatusNotification, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementRmastatusesIdNotificationsCountEndpoint:
+        """
+        The ProcurementRmastatusesIdNotificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementRmastatusesIdNotificationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class ProcurementRmastatusesInfoEndpoint(
         IGettable.__init__(self, list[RmaStatusInfo])
         IPaginateable.__init__(self, RmaStatusInfo)
 
-        self.count = self._register_child_endpoint(
-            ProcurementRmastatusesInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[RmaStatusInfo]:
@@ -61,4 +58,11 @@ class ProcurementRmastatusesInfoEndpoint(
         Returns:
             list[RmaStatusInfo]: The parsed response data.
         """
-        return self._parse_many(RmaStatusInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(RmaStatusInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementRmastatusesInfoCountEndpoint:
+        """
+        The ProcurementRmastatusesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmastatusesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -50,4 +50,4 @@ class ProcurementRmatagsDefaultEndpoint(
         Returns:
             RmaTag: The parsed response data.
         """
-        return self._parse_one(RmaTag, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(RmaTag, super()._make_request("GET", data=data, params=params).content)
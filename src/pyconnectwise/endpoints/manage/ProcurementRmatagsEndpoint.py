@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProcurementRmatagsEndpoint(
         IPostable.__init__(self, RmaTag)
         IPaginateable.__init__(self, RmaTag)
 
-        self.count = self._register_child_endpoint(ProcurementRmatagsCountEndpoint(client, parent_endpoint=self))
-        self.default = self._register_child_endpoint(ProcurementRmatagsDefaultEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementRmatagsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementRmatagsIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class ProcurementRmatagsEndpoint(
         Returns:
             list[RmaTag]: The parsed response data.
         """
-        return self._parse_many(RmaTag, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(RmaTag, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> RmaTag:
         """
@@ -83,4 +81,18 @@ class ProcurementRmatagsEndpoint(
         Returns:
             RmaTag: The parsed response data.
         """
-        return self._parse_one(RmaTag, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(RmaTag, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementRmatagsCountEndpoint:
+        """
+        The ProcurementRmatagsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmatagsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def default(self) -> ProcurementRmatagsDefaultEndpoint:
+        """
+        The ProcurementRmatagsDefaultEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmatagsDefaultEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ProcurementSettingsEndpoint(
         IGettable.__init__(self, list[ProcurementSetting])
         IPaginateable.__init__(self, ProcurementSetting)
 
-        self.count = self._register_child_endpoint(ProcurementSettingsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementSettingsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementSettingsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class ProcurementSettingsEndpoint(
         Returns:
             list[ProcurementSetting]: The parsed response data.
         """
-        return self._parse_many(ProcurementSetting, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProcurementSetting, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementSettingsCountEndpoint:
+        """
+        The ProcurementSettingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementSettingsCountEndpoint(self.client, parent_endpoint=self))
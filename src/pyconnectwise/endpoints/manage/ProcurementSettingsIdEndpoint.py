@@ -56,7 +56,7 @@ class ProcurementSettingsIdEndpoint(
         Returns:
             ProcurementSetting: The parsed response data.
         """
-        return self._parse_one(ProcurementSetting, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProcurementSetting, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ProcurementSetting:
         """
@@ -68,7 +68,7 @@ class ProcurementSettingsIdEndpoint(
         Returns:
             ProcurementSetting: The parsed response data.
         """
-        return self._parse_one(ProcurementSetting, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProcurementSetting, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProcurementSetting:
         """
@@ -80,4 +80,4 @@ class ProcurementSettingsIdEndpoint(
         Returns:
             ProcurementSetting: The parsed response data.
         """
-        return self._parse_one(ProcurementSetting, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProcurementSetting, super()._make_request("PUT", data=data, params=params).content)
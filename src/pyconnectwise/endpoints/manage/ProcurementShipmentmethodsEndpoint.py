@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,11 +28,6 @@ class ProcurementShipmentmethodsEndpoint(
         IPostable.__init__(self, ShipmentMethod)
         IPaginateable.__init__(self, ShipmentMethod)
 
-        self.count = self._register_child_endpoint(
-            ProcurementShipmentmethodsCountEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(ProcurementShipmentmethodsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementShipmentmethodsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementShipmentmethodsIdEndpoint object to move down the chain.
@@ -79,7 +75,7 @@ class ProcurementShipmentmethodsEndpoint(
         Returns:
             list[ShipmentMethod]: The parsed response data.
         """
-        return self._parse_many(ShipmentMethod, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ShipmentMethod, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ShipmentMethod:
         """
@@ -91,4 +87,18 @@ class ProcurementShipmentmethodsEndpoint(
         Returns:
             ShipmentMethod: The parsed response data.
         """
-        return self._parse_one(ShipmentMethod, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ShipmentMethod, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementShipmentmethodsCountEndpoint:
+        """
+        The ProcurementShipmentmethodsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementShipmentmethodsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementShipmentmethodsInfoEndpoint:
+        """
+        The ProcurementShipmentmethodsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementShipmentmethodsInfoEndpoint(self.client, parent_endpoint=self))
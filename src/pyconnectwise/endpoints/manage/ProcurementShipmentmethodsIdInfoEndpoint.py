@@ -52,4 +52,4 @@ class ProcurementShipmentmethodsIdInfoEndpoint(
         Returns:
             ShipmentMethodInfo: The parsed response data.
         """
-        return self._parse_one(ShipmentMethodInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ShipmentMethodInfo, super()._make_request("GET", data=data, params=params).content)
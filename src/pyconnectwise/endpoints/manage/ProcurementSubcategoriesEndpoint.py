@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -13,9 +14,6 @@ class ProcurementSubcategoriesEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "subcategories", parent_endpoint=parent_endpoint)
 
-        self.count = self._register_child_endpoint(ProcurementSubcategoriesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ProcurementSubcategoriesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementSubcategoriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementSubcategoriesIdEndpoint object to move down the chain.
@@ -28,3 +26,17 @@ class ProcurementSubcategoriesEndpoint(ConnectWiseEndpoint):
         child = ProcurementSubcategoriesIdEndpoint(self.client, parent_endpoint=self)
         child._id = _id
         return child
+
+    @cached_property
+    def count(self) -> ProcurementSubcategoriesCountEndpoint:
+        """
+        The ProcurementSubcategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementSubcategoriesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementSubcategoriesInfoEndpoint:
+        """
+        The ProcurementSubcategoriesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementSubcategoriesInfoEndpoint(self.client, parent_endpoint=self))
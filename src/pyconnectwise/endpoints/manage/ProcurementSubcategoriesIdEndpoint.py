@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,11 +29,6 @@ class ProcurementSubcategoriesIdEndpoint(
         IPuttable.__init__(self, SubCategory)
         IPaginateable.__init__(self, SubCategory)
 
-        self.info = self._register_child_endpoint(ProcurementSubcategoriesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(
-            ProcurementSubcategoriesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[SubCategory]:
@@ -75,7 +71,7 @@ class ProcurementSubcategoriesIdEndpoint(
         Returns:
             SubCategory: The parsed response data.
         """
-        return self._parse_one(SubCategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SubCategory, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> SubCategory:
         """
@@ -87,7 +83,7 @@ class ProcurementSubcategoriesIdEndpoint(
         Returns:
             SubCategory: The parsed response data.
         """
-        return self._parse_one(SubCategory, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(SubCategory, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SubCategory:
         """
@@ -99,4 +95,20 @@ class ProcurementSubcategoriesIdEndpoint(
         Returns:
             SubCategory: The parsed response data.
         """
-        return self._parse_one(SubCategory, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(SubCategory, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ProcurementSubcategoriesIdInfoEndpoint:
+        """
+        The ProcurementSubcategoriesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementSubcategoriesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ProcurementSubcategoriesIdUsagesEndpoint:
+        """
+        The ProcurementSubcategoriesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementSubcategoriesIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
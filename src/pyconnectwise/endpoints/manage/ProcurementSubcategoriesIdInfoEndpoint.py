@@ -52,4 +52,4 @@ class ProcurementSubcategoriesIdInfoEndpoint(
         Returns:
             SubCategoryInfo: The parsed response data.
         """
-        return self._parse_one(SubCategoryInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SubCategoryInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProcurementTypesEndpoint(
         IPostable.__init__(self, ProductType)
         IPaginateable.__init__(self, ProductType)
 
-        self.count = self._register_child_endpoint(ProcurementTypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ProcurementTypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementTypesIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class ProcurementTypesEndpoint(
         Returns:
             list[ProductType]: The parsed response data.
         """
-        return self._parse_many(ProductType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProductType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProductType:
         """
@@ -85,4 +83,18 @@ class ProcurementTypesEndpoint(
         Returns:
             ProductType: The parsed response data.
         """
-        return self._parse_one(ProductType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProductType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementTypesCountEndpoint:
+        """
+        The ProcurementTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementTypesInfoEndpoint:
+        """
+        The ProcurementTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementTypesInfoEndpoint(self.client, parent_endpoint=self))
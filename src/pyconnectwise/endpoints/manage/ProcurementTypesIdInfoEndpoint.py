@@ -52,4 +52,4 @@ class ProcurementTypesIdInfoEndpoint(
         Returns:
             ProductTypeInfo: The parsed response data.
         """
-        return self._parse_one(ProductTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProductTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ProcurementUnitofmeasuresEndpoint(
         IPostable.__init__(self, UnitOfMeasure)
         IPaginateable.__init__(self, UnitOfMeasure)
 
-        self.count = self._register_child_endpoint(ProcurementUnitofmeasuresCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementUnitofmeasuresIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementUnitofmeasuresIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class ProcurementUnitofmeasuresEndpoint(
         Returns:
             list[UnitOfMeasure]: The parsed response data.
         """
-        return self._parse_many(UnitOfMeasure, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(UnitOfMeasure, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> UnitOfMeasure:
         """
@@ -85,4 +84,11 @@ class ProcurementUnitofmeasuresEndpoint(
         Returns:
             UnitOfMeasure: The parsed response data.
         """
-        return self._parse_one(UnitOfMeasure, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(UnitOfMeasure, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementUnitofmeasuresCountEndpoint:
+        """
+        The ProcurementUnitofmeasuresCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementUnitofmeasuresCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ProcurementUnitofmeasuresIdConversionsEndpoint(
         IPostable.__init__(self, Conversion)
         IPaginateable.__init__(self, Conversion)
 
-        self.count = self._register_child_endpoint(
-            ProcurementUnitofmeasuresIdConversionsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementUnitofmeasuresIdConversionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementUnitofmeasuresIdConversionsIdEndpoint object to move down the chain.
@@ -75,7 +72,7 @@ class ProcurementUnitofmeasuresIdConversionsEndpoint(
         Returns:
             list[Conversion]: The parsed response data.
         """
-        return self._parse_many(Conversion, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Conversion, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Conversion:
         """
@@ -87,4 +84,13 @@ class ProcurementUnitofmeasuresIdConversionsEndpoint(
         Returns:
             Conversion: The parsed response data.
         """
-        return self._parse_one(Conversion, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Conversion, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementUnitofmeasuresIdConversionsCountEndpoint:
+        """
+        The ProcurementUnitofmeasuresIdConversionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementUnitofmeasuresIdConversionsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -64,7 +64,7 @@ class ProcurementUnitofmeasuresIdConversionsIdEndpoint(
         Returns:
             Conversion: The parsed response data.
         """
-        return self._parse_one(Conversion, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Conversion, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Conversion:
         """
@@ -76,7 +76,7 @@ class ProcurementUnitofmeasuresIdConversionsIdEndpoint(
         Returns:
             Conversion: The parsed response data.
         """
-        return self._parse_one(Conversion, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Conversion, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Conversion:
         """
@@ -88,4 +88,4 @@ class ProcurementUnitofmeasuresIdConversionsIdEndpoint(
         Returns:
             Conversion: The parsed response data.
         """
-        return self._parse_one(Conversion, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Conversion, super()._make_request("PUT", data=data, params=params).content)
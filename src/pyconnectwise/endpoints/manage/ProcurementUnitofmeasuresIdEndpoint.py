@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class ProcurementUnitofmeasuresIdEndpoint(
         IPuttable.__init__(self, UnitOfMeasure)
         IPaginateable.__init__(self, UnitOfMeasure)
 
-        self.conversions = self._register_child_endpoint(
-            ProcurementUnitofmeasuresIdConversionsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[UnitOfMeasure]:
@@ -73,7 +70,7 @@ class ProcurementUnitofmeasuresIdEndpoint(
         Returns:
             UnitOfMeasure: The parsed response data.
         """
-        return self._parse_one(UnitOfMeasure, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(UnitOfMeasure, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> UnitOfMeasure:
         """
@@ -85,7 +82,7 @@ class ProcurementUnitofmeasuresIdEndpoint(
         Returns:
             UnitOfMeasure: The parsed response data.
         """
-        return self._parse_one(UnitOfMeasure, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(UnitOfMeasure, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> UnitOfMeasure:
         """
@@ -97,4 +94,13 @@ class ProcurementUnitofmeasuresIdEndpoint(
         Returns:
             UnitOfMeasure: The parsed response data.
         """
-        return self._parse_one(UnitOfMeasure, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(UnitOfMeasure, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def conversions(self) -> ProcurementUnitofmeasuresIdConversionsEndpoint:
+        """
+        The ProcurementUnitofmeasuresIdConversionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementUnitofmeasuresIdConversionsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProcurementWarehousebinsEndpoint(
         IPostable.__init__(self, WarehouseBin)
         IPaginateable.__init__(self, WarehouseBin)
 
-        self.count = self._register_child_endpoint(ProcurementWarehousebinsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ProcurementWarehousebinsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementWarehousebinsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementWarehousebinsIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class ProcurementWarehousebinsEndpoint(
         Returns:
             list[WarehouseBin]: The parsed response data.
         """
-        return self._parse_many(WarehouseBin, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WarehouseBin, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WarehouseBin:
         """
@@ -85,4 +83,18 @@ class ProcurementWarehousebinsEndpoint(
         Returns:
             WarehouseBin: The parsed response data.
         """
-        return self._parse_one(WarehouseBin, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WarehouseBin, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementWarehousebinsCountEndpoint:
+        """
+        The ProcurementWarehousebinsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousebinsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementWarehousebinsInfoEndpoint:
+        """
+        The ProcurementWarehousebinsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousebinsInfoEndpoint(self.client, parent_endpoint=self))
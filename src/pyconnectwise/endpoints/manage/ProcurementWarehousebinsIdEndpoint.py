@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,11 +29,6 @@ class ProcurementWarehousebinsIdEndpoint(
         IPuttable.__init__(self, WarehouseBin)
         IPaginateable.__init__(self, WarehouseBin)
 
-        self.info = self._register_child_endpoint(ProcurementWarehousebinsIdInfoEndpoint(client, parent_endpoint=self))
-        self.inventory_on_hand = self._register_child_endpoint(
-            ProcurementWarehousebinsIdInventoryonhandEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[WarehouseBin]:
@@ -75,7 +71,7 @@ class ProcurementWarehousebinsIdEndpoint(
         Returns:
             WarehouseBin: The parsed response data.
         """
-        return self._parse_one(WarehouseBin, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WarehouseBin, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> WarehouseBin:
         """
@@ -87,7 +83,7 @@ class ProcurementWarehousebinsIdEndpoint(
         Returns:
             WarehouseBin: The parsed response data.
         """
-        return self._parse_one(WarehouseBin, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(WarehouseBin, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WarehouseBin:
         """
@@ -99,4 +95,20 @@ class ProcurementWarehousebinsIdEndpoint(
         Returns:
             WarehouseBin: The parsed response data.
         """
-        return self._parse_one(WarehouseBin, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(WarehouseBin, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ProcurementWarehousebinsIdInfoEndpoint:
+        """
+        The ProcurementWarehousebinsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousebinsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def inventory_on_hand(self) -> ProcurementWarehousebinsIdInventoryonhandEndpoint:
+        """
+        The ProcurementWarehousebinsIdInventoryonhandEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementWarehousebinsIdInventoryonhandEndpoint(self.client, parent_endpoint=self)
+        )
@@ -52,4 +52,4 @@ class ProcurementWarehousebinsIdInfoEndpoint(
         Returns:
             WarehouseBinInfo: The parsed response data.
         """
-        return self._parse_one(WarehouseBinInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WarehouseBinInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class ProcurementWarehousebinsIdInventoryonhandEndpoint(
         IGettable.__init__(self, list[InventoryOnHand])
         IPaginateable.__init__(self, InventoryOnHand)
 
-        self.count = self._register_child_endpoint(
-            ProcurementWarehousebinsIdInventoryonhandCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProcurementWarehousebinsIdInventoryonhandIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementWarehousebinsIdInventoryonhandIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class ProcurementWarehousebinsIdInventoryonhandEndpoint(
         Returns:
             list[InventoryOnHand]: The parsed response data.
         """
-        return self._parse_many(InventoryOnHand, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(InventoryOnHand, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementWarehousebinsIdInventoryonhandCountEndpoint:
+        """
+        The ProcurementWarehousebinsIdInventoryonhandCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementWarehousebinsIdInventoryonhandCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -52,4 +52,4 @@ class ProcurementWarehousebinsIdInventoryonhandIdEndpoint(
         Returns:
             InventoryOnHand: The parsed response data.
         """
-        return self._parse_one(InventoryOnHand, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(InventoryOnHand, super()._make_request("GET", data=data, params=params).content)
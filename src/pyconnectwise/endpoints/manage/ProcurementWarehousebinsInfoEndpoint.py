@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class ProcurementWarehousebinsInfoEndpoint(
         IGettable.__init__(self, list[WarehouseBinInfo])
         IPaginateable.__init__(self, WarehouseBinInfo)
 
-        self.count = self._register_child_endpoint(
-            ProcurementWarehousebinsInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[WarehouseBinInfo]:
@@ -61,4 +58,13 @@ class ProcurementWarehousebinsInfoEndpoint(
         Returns:
             list[WarehouseBinInfo]: The parsed response data.
         """
-        return self._parse_many(WarehouseBinInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WarehouseBinInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementWarehousebinsInfoCountEndpoint:
+        """
+        The ProcurementWarehousebinsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementWarehousebinsInfoCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProcurementWarehousesEndpoint(
         IPostable.__init__(self, Warehouse)
         IPaginateable.__init__(self, Warehouse)
 
-        self.count = self._register_child_endpoint(ProcurementWarehousesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ProcurementWarehousesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProcurementWarehousesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProcurementWarehousesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class ProcurementWarehousesEndpoint(
         Returns:
             list[Warehouse]: The parsed response data.
         """
-        return self._parse_many(Warehouse, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Warehouse, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Warehouse:
         """
@@ -83,4 +81,18 @@ class ProcurementWarehousesEndpoint(
         Returns:
             Warehouse: The parsed response data.
         """
-        return self._parse_one(Warehouse, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Warehouse, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProcurementWarehousesCountEndpoint:
+        """
+        The ProcurementWarehousesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementWarehousesInfoEndpoint:
+        """
+        The ProcurementWarehousesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousesInfoEndpoint(self.client, parent_endpoint=self))
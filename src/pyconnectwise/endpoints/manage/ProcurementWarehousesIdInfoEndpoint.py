@@ -52,4 +52,4 @@ class ProcurementWarehousesIdInfoEndpoint(
         Returns:
             WarehouseInfo: The parsed response data.
         """
-        return self._parse_one(WarehouseInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WarehouseInfo, super()._make_request("GET", data=data, params=params).content)
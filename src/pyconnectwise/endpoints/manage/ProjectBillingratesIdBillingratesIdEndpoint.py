@@ -32,5 +32,5 @@ class ProjectBillingratesIdBillingratesIdEndpoint(
         """
         return self._parse_one(
             ProjectBillingRate,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.ProjectBillingratesIdBillingratesEndpoint import (
     ProjectBillingratesIdBillingratesEndpoint,
@@ -8,6 +10,11 @@ class ProjectBillingratesIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.billing_rates = self._register_child_endpoint(
-            ProjectBillingratesIdBillingratesEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def billing_rates(self) -> ProjectBillingratesIdBillingratesEndpoint:
+        """
+        The ProjectBillingratesIdBillingratesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectBillingratesIdBillingratesEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -11,4 +12,9 @@ class ProjectBoardsIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.teams = self._register_child_endpoint(ProjectBoardsIdTeamsEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def teams(self) -> ProjectBoardsIdTeamsEndpoint:
+        """
+        The ProjectBoardsIdTeamsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectBoardsIdTeamsEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProjectBoardsIdTeamsEndpoint(
         IPostable.__init__(self, ProjectBoardTeam)
         IPaginateable.__init__(self, ProjectBoardTeam)
 
-        self.count = self._register_child_endpoint(ProjectBoardsIdTeamsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ProjectBoardsIdTeamsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProjectBoardsIdTeamsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectBoardsIdTeamsIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class ProjectBoardsIdTeamsEndpoint(
         Returns:
             list[ProjectBoardTeam]: The parsed response data.
         """
-        return self._parse_many(ProjectBoardTeam, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectBoardTeam, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectBoardTeam:
         """
@@ -87,4 +85,18 @@ class ProjectBoardsIdTeamsEndpoint(
         Returns:
             ProjectBoardTeam: The parsed response data.
         """
-        return self._parse_one(ProjectBoardTeam, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectBoardTeam, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectBoardsIdTeamsCountEndpoint:
+        """
+        The ProjectBoardsIdTeamsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectBoardsIdTeamsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProjectBoardsIdTeamsInfoEndpoint:
+        """
+        The ProjectBoardsIdTeamsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectBoardsIdTeamsInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,11 +27,6 @@ class ProjectBoardsIdTeamsIdEndpoint(
         IPuttable.__init__(self, ProjectBoardTeam)
         IPaginateable.__init__(self, ProjectBoardTeam)
 
-        self.info = self._register_child_endpoint(ProjectBoardsIdTeamsIdInfoEndpoint(client, parent_endpoint=self))
-        self.members = self._register_child_endpoint(
-            ProjectBoardsIdTeamsIdMembersEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ProjectBoardTeam]:
@@ -73,7 +69,7 @@ class ProjectBoardsIdTeamsIdEndpoint(
         Returns:
             ProjectBoardTeam: The parsed response data.
         """
-        return self._parse_one(ProjectBoardTeam, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProjectBoardTeam, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ProjectBoardTeam:
         """
@@ -85,7 +81,7 @@ class ProjectBoardsIdTeamsIdEndpoint(
         Returns:
             ProjectBoardTeam: The parsed response data.
         """
-        return self._parse_one(ProjectBoardTeam, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProjectBoardTeam, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectBoardTeam:
         """
@@ -97,4 +93,18 @@ class ProjectBoardsIdTeamsIdEndpoint(
         Returns:
             ProjectBoardTeam: The parsed response data.
         """
-        return self._parse_one(ProjectBoardTeam, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProjectBoardTeam, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ProjectBoardsIdTeamsIdInfoEndpoint:
+        """
+        The ProjectBoardsIdTeamsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectBoardsIdTeamsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def members(self) -> ProjectBoardsIdTeamsIdMembersEndpoint:
+        """
+        The ProjectBoardsIdTeamsIdMembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectBoardsIdTeamsIdMembersEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class ProjectBoardsIdTeamsIdInfoEndpoint(
         IGettable.__init__(self, ProjectBoardTeamInfo)
         IPaginateable.__init__(self, ProjectBoardTeamInfo)
 
-        self.count = self._register_child_endpoint(
-            ProjectBoardsIdTeamsIdInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ProjectBoardTeamInfo]:
@@ -61,4 +58,11 @@ class ProjectBoardsIdTeamsIdInfoEndpoint(
         Returns:
             ProjectBoardTeamInfo: The parsed response data.
         """
-        return self._parse_one(ProjectBoardTeamInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProjectBoardTeamInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectBoardsIdTeamsIdInfoCountEndpoint:
+        """
+        The ProjectBoardsIdTeamsIdInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectBoardsIdTeamsIdInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -54,4 +54,4 @@ class ProjectBoardsIdTeamsInfoEndpoint(
         Returns:
             list[ProjectBoardTeamInfo]: The parsed response data.
         """
-        return self._parse_many(ProjectBoardTeamInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectBoardTeamInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -19,14 +20,65 @@ class ProjectEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "project", parent_endpoint=parent_endpoint)
 
-        self.boards = self._register_child_endpoint(ProjectBoardsEndpoint(client, parent_endpoint=self))
-        self.phase_statuses = self._register_child_endpoint(ProjectPhasestatusesEndpoint(client, parent_endpoint=self))
-        self.project_types = self._register_child_endpoint(ProjectProjecttypesEndpoint(client, parent_endpoint=self))
-        self.projects = self._register_child_endpoint(ProjectProjectsEndpoint(client, parent_endpoint=self))
-        self.security_roles = self._register_child_endpoint(ProjectSecurityrolesEndpoint(client, parent_endpoint=self))
-        self.status_indicators = self._register_child_endpoint(
-            ProjectStatusindicatorsEndpoint(client, parent_endpoint=self)
-        )
-        self.statuses = self._register_child_endpoint(ProjectStatusesEndpoint(client, parent_endpoint=self))
-        self.ticket_note = self._register_child_endpoint(ProjectTicketnoteEndpoint(client, parent_endpoint=self))
-        self.tickets = self._register_child_endpoint(ProjectTicketsEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def boards(self) -> ProjectBoardsEndpoint:
+        """
+        The ProjectBoardsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectBoardsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def phase_statuses(self) -> ProjectPhasestatusesEndpoint:
+        """
+        The ProjectPhasestatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectPhasestatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def project_types(self) -> ProjectProjecttypesEndpoint:
+        """
+        The ProjectProjecttypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjecttypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def projects(self) -> ProjectProjectsEndpoint:
+        """
+        The ProjectProjectsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def security_roles(self) -> ProjectSecurityrolesEndpoint:
+        """
+        The ProjectSecurityrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectSecurityrolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def status_indicators(self) -> ProjectStatusindicatorsEndpoint:
+        """
+        The ProjectStatusindicatorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectStatusindicatorsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> ProjectStatusesEndpoint:
+        """
+        The ProjectStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ticket_note(self) -> ProjectTicketnoteEndpoint:
+        """
+        The ProjectTicketnoteEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketnoteEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tickets(self) -> ProjectTicketsEndpoint:
+        """
+        The ProjectTicketsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.ProjectIdBillingratesCountEndpoint import (
     ProjectIdBillingratesCountEndpoint,
@@ -30,8 +32,6 @@ class ProjectIdBillingratesEndpoint(
         IPostable.__init__(self, ProjectBillingRate)
         IPaginateable.__init__(self, ProjectBillingRate)
 
-        self.count = self._register_child_endpoint(ProjectIdBillingratesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, id: int) -> ProjectIdBillingratesIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized ProjectIdBillingratesIdEndpoint object to move down the chain.
@@ -91,7 +91,7 @@ class ProjectIdBillingratesEndpoint(
         """
         return self._parse_many(
             ProjectBillingRate,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -110,5 +110,12 @@ class ProjectIdBillingratesEndpoint(
         """
         return self._parse_one(
             ProjectBillingRate,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
         )
+
+    @cached_property
+    def count(self) -> ProjectIdBillingratesCountEndpoint:
+        """
+        The ProjectIdBillingratesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectIdBillingratesCountEndpoint(self.client, parent_endpoint=self))
@@ -70,7 +70,7 @@ class ProjectIdBillingratesIdEndpoint(
         """
         return self._parse_one(
             ProjectBillingRate,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def delete(
@@ -103,5 +103,5 @@ class ProjectIdBillingratesIdEndpoint(
         """
         return self._parse_one(
             ProjectBillingRate,
-            super()._make_request("PUT", data=data, params=params).json(),
+            super()._make_request("PUT", data=data, params=params).content,
         )
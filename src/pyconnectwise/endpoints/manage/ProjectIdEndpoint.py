@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.ProjectIdBillingratesEndpoint import (
     ProjectIdBillingratesEndpoint,
@@ -8,4 +10,9 @@ class ProjectIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.billing_rates = self._register_child_endpoint(ProjectIdBillingratesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def billing_rates(self) -> ProjectIdBillingratesEndpoint:
+        """
+        The ProjectIdBillingratesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectIdBillingratesEndpoint(self.client, parent_endpoint=self))
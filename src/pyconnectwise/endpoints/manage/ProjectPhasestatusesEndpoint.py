@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ProjectPhasestatusesEndpoint(
         IPostable.__init__(self, PhaseStatus)
         IPaginateable.__init__(self, PhaseStatus)
 
-        self.count = self._register_child_endpoint(ProjectPhasestatusesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProjectPhasestatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectPhasestatusesIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class ProjectPhasestatusesEndpoint(
         Returns:
             list[PhaseStatus]: The parsed response data.
         """
-        return self._parse_many(PhaseStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PhaseStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> PhaseStatus:
         """
@@ -83,4 +82,11 @@ class ProjectPhasestatusesEndpoint(
         Returns:
             PhaseStatus: The parsed response data.
         """
-        return self._parse_one(PhaseStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PhaseStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectPhasestatusesCountEndpoint:
+        """
+        The ProjectPhasestatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectPhasestatusesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ProjectProjectsEndpoint(
         IPostable.__init__(self, Project)
         IPaginateable.__init__(self, Project)
 
-        self.count = self._register_child_endpoint(ProjectProjectsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProjectProjectsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectProjectsIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class ProjectProjectsEndpoint(
         Returns:
             list[Project]: The parsed response data.
         """
-        return self._parse_many(Project, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Project, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Project:
         """
@@ -81,4 +80,11 @@ class ProjectProjectsEndpoint(
         Returns:
             Project: The parsed response data.
         """
-        return self._parse_one(Project, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Project, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectProjectsCountEndpoint:
+        """
+        The ProjectProjectsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsCountEndpoint(self.client, parent_endpoint=self))
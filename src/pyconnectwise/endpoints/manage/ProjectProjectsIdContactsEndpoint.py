@@ -70,7 +70,7 @@ class ProjectProjectsIdContactsEndpoint(
         Returns:
             list[ProjectContact]: The parsed response data.
         """
-        return self._parse_many(ProjectContact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectContact, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectContact:
         """
@@ -82,4 +82,4 @@ class ProjectProjectsIdContactsEndpoint(
         Returns:
             ProjectContact: The parsed response data.
         """
-        return self._parse_one(ProjectContact, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectContact, super()._make_request("POST", data=data, params=params).content)
@@ -62,4 +62,4 @@ class ProjectProjectsIdContactsIdEndpoint(
         Returns:
             ProjectContact: The parsed response data.
         """
-        return self._parse_one(ProjectContact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProjectContact, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,13 +29,6 @@ class ProjectProjectsIdEndpoint(
         IPuttable.__init__(self, Project)
         IPaginateable.__init__(self, Project)
 
-        self.contacts = self._register_child_endpoint(ProjectProjectsIdContactsEndpoint(client, parent_endpoint=self))
-        self.notes = self._register_child_endpoint(ProjectProjectsIdNotesEndpoint(client, parent_endpoint=self))
-        self.phases = self._register_child_endpoint(ProjectProjectsIdPhasesEndpoint(client, parent_endpoint=self))
-        self.team_members = self._register_child_endpoint(
-            ProjectProjectsIdTeammembersEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Project]:
@@ -75,7 +69,7 @@ class ProjectProjectsIdEndpoint(
         Returns:
             Project: The parsed response data.
         """
-        return self._parse_one(Project, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Project, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Project:
         """
@@ -87,7 +81,7 @@ class ProjectProjectsIdEndpoint(
         Returns:
             Project: The parsed response data.
         """
-        return self._parse_one(Project, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Project, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Project:
         """
@@ -99,4 +93,32 @@ class ProjectProjectsIdEndpoint(
         Returns:
             Project: The parsed response data.
         """
-        return self._parse_one(Project, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Project, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def contacts(self) -> ProjectProjectsIdContactsEndpoint:
+        """
+        The ProjectProjectsIdContactsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsIdContactsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notes(self) -> ProjectProjectsIdNotesEndpoint:
+        """
+        The ProjectProjectsIdNotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsIdNotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def phases(self) -> ProjectProjectsIdPhasesEndpoint:
+        """
+        The ProjectProjectsIdPhasesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsIdPhasesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def team_members(self) -> ProjectProjectsIdTeammembersEndpoint:
+        """
+        The ProjectProjectsIdTeammembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsIdTeammembersEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ProjectProjectsIdNotesEndpoint(
         IPostable.__init__(self, ProjectNote)
         IPaginateable.__init__(self, ProjectNote)
 
-        self.count = self._register_child_endpoint(ProjectProjectsIdNotesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProjectProjectsIdNotesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectProjectsIdNotesIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class ProjectProjectsIdNotesEndpoint(
         Returns:
             list[ProjectNote]: The parsed response data.
         """
-        return self._parse_many(ProjectNote, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectNote, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectNote:
         """
@@ -83,4 +82,11 @@ class ProjectProjectsIdNotesEndpoint(
         Returns:
             ProjectNote: The parsed response data.
         """
-        return self._parse_one(ProjectNote, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectNote, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectProjectsIdNotesCountEndpoint:
+        """
+        The ProjectProjectsIdNotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsIdNotesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ProjectProjectsIdPhasesEndpoint(
         IPostable.__init__(self, ProjectPhase)
         IPaginateable.__init__(self, ProjectPhase)
 
-        self.count = self._register_child_endpoint(ProjectProjectsIdPhasesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProjectProjectsIdPhasesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectProjectsIdPhasesIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class ProjectProjectsIdPhasesEndpoint(
         Returns:
             list[ProjectPhase]: The parsed response data.
         """
-        return self._parse_many(ProjectPhase, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectPhase, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectPhase:
         """
@@ -83,4 +82,11 @@ class ProjectProjectsIdPhasesEndpoint(
         Returns:
             ProjectPhase: The parsed response data.
         """
-        return self._parse_one(ProjectPhase, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectPhase, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectProjectsIdPhasesCountEndpoint:
+        """
+        The ProjectProjectsIdPhasesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsIdPhasesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.ProjectProjectsIdProjectworkplanCountEndpoint import (
     ProjectProjectsIdProjectworkplanCountEndpoint,
@@ -27,10 +29,6 @@ class ProjectProjectsIdProjectworkplanEndpoint(
         IGettable.__init__(self, list[ProjectWorkplan])
         IPaginateable.__init__(self, ProjectWorkplan)
 
-        self.count = self._register_child_endpoint(
-            ProjectProjectsIdProjectworkplanCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, id: int) -> ProjectProjectsIdProjectworkplanIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized ProjectProjectsIdProjectworkplanIdEndpoint object to move down the chain.
@@ -90,5 +88,14 @@ class ProjectProjectsIdProjectworkplanEndpoint(
         """
         return self._parse_many(
             ProjectWorkplan,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
+        )
+
+    @cached_property
+    def count(self) -> ProjectProjectsIdProjectworkplanCountEndpoint:
+        """
+        The ProjectProjectsIdProjectworkplanCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectProjectsIdProjectworkplanCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -67,5 +67,5 @@ class ProjectProjectsIdProjectworkplanIdEndpoint(
         """
         return self._parse_one(
             ProjectWorkplan,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
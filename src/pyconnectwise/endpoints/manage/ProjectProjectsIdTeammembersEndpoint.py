@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class ProjectProjectsIdTeammembersEndpoint(
         IPostable.__init__(self, ProjectTeamMember)
         IPaginateable.__init__(self, ProjectTeamMember)
 
-        self.count = self._register_child_endpoint(
-            ProjectProjectsIdTeammembersCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProjectProjectsIdTeammembersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectProjectsIdTeammembersIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class ProjectProjectsIdTeammembersEndpoint(
         Returns:
             list[ProjectTeamMember]: The parsed response data.
         """
-        return self._parse_many(ProjectTeamMember, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectTeamMember, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectTeamMember:
         """
@@ -89,4 +86,13 @@ class ProjectProjectsIdTeammembersEndpoint(
         Returns:
             ProjectTeamMember: The parsed response data.
         """
-        return self._parse_one(ProjectTeamMember, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectTeamMember, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectProjectsIdTeammembersCountEndpoint:
+        """
+        The ProjectProjectsIdTeammembersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectProjectsIdTeammembersCountEndpoint(self.client, parent_endpoint=self)
+        )
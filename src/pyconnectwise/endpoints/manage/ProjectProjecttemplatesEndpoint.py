@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.ProjectProjecttemplatesCountEndpoint import (
     ProjectProjecttemplatesCountEndpoint,
@@ -11,8 +13,6 @@ class ProjectProjecttemplatesEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "projectTemplates", parent_endpoint=parent_endpoint)
 
-        self.count = self._register_child_endpoint(ProjectProjecttemplatesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, id: int) -> ProjectProjecttemplatesIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized ProjectProjecttemplatesIdEndpoint object to move down the chain.
@@ -25,3 +25,10 @@ class ProjectProjecttemplatesEndpoint(ConnectWiseEndpoint):
         child = ProjectProjecttemplatesIdEndpoint(self.client, parent_endpoint=self)
         child._id = id
         return child
+
+    @cached_property
+    def count(self) -> ProjectProjecttemplatesCountEndpoint:
+        """
+        The ProjectProjecttemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjecttemplatesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsEndpoint import (
     ProjectProjecttemplatesIdProjecttemplateticketsEndpoint,
@@ -34,13 +36,6 @@ class ProjectProjecttemplatesIdEndpoint(
         IPatchable.__init__(self, ProjectTemplate)
         IPaginateable.__init__(self, ProjectTemplate)
 
-        self.project_template_tickets = self._register_child_endpoint(
-            ProjectProjecttemplatesIdProjecttemplateticketsEndpoint(client, parent_endpoint=self)
-        )
-        self.workplan = self._register_child_endpoint(
-            ProjectProjecttemplatesIdWorkplanEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self,
         page: int,
@@ -87,7 +82,7 @@ class ProjectProjecttemplatesIdEndpoint(
         """
         return self._parse_one(
             ProjectTemplate,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def delete(
@@ -120,7 +115,7 @@ class ProjectProjecttemplatesIdEndpoint(
         """
         return self._parse_one(
             ProjectTemplate,
-            super()._make_request("PUT", data=data, params=params).json(),
+            super()._make_request("PUT", data=data, params=params).content,
         )
 
     def patch(
@@ -139,5 +134,23 @@ class ProjectProjecttemplatesIdEndpoint(
         """
         return self._parse_one(
             ProjectTemplate,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
+        )
+
+    @cached_property
+    def project_template_tickets(self) -> ProjectProjecttemplatesIdProjecttemplateticketsEndpoint:
+        """
+        The ProjectProjecttemplatesIdProjecttemplateticketsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectProjecttemplatesIdProjecttemplateticketsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def workplan(self) -> ProjectProjecttemplatesIdWorkplanEndpoint:
+        """
+        The ProjectProjecttemplatesIdWorkplanEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectProjecttemplatesIdWorkplanEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint import (
     ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint,
@@ -30,10 +32,6 @@ class ProjectProjecttemplatesIdProjecttemplateticketsEndpoint(
         IPostable.__init__(self, ProjectTemplateTicket)
         IPaginateable.__init__(self, ProjectTemplateTicket)
 
-        self.count = self._register_child_endpoint(
-            ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, id: int) -> ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint object to move down the chain.
@@ -93,7 +91,7 @@ class ProjectProjecttemplatesIdProjecttemplateticketsEndpoint(
         """
         return self._parse_many(
             ProjectTemplateTicket,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -112,5 +110,14 @@ class ProjectProjecttemplatesIdProjecttemplateticketsEndpoint(
         """
         return self._parse_one(
             ProjectTemplateTicket,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
+        )
+
+    @cached_property
+    def count(self) -> ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint:
+        """
+        The ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint(self.client, parent_endpoint=self)
         )
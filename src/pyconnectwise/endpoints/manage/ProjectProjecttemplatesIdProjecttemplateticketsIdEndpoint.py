@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsIdTasksEndpoint import (
     ProjectProjecttemplatesIdProjecttemplateticketsIdTasksEndpoint,
@@ -31,10 +33,6 @@ class ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint(
         IPatchable.__init__(self, ProjectTemplateTicket)
         IPaginateable.__init__(self, ProjectTemplateTicket)
 
-        self.tasks = self._register_child_endpoint(
-            ProjectProjecttemplatesIdProjecttemplateticketsIdTasksEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self,
         page: int,
@@ -81,7 +79,7 @@ class ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint(
         """
         return self._parse_one(
             ProjectTemplateTicket,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def delete(
@@ -114,7 +112,7 @@ class ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint(
         """
         return self._parse_one(
             ProjectTemplateTicket,
-            super()._make_request("PUT", data=data, params=params).json(),
+            super()._make_request("PUT", data=data, params=params).content,
         )
 
     def patch(
@@ -133,5 +131,14 @@ class ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint(
         """
         return self._parse_one(
             ProjectTemplateTicket,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
+        )
+
+    @cached_property
+    def tasks(self) -> ProjectProjecttemplatesIdProjecttemplateticketsIdTasksEndpoint:
+        """
+        The ProjectProjecttemplatesIdProjecttemplateticketsIdTasksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectProjecttemplatesIdProjecttemplateticketsIdTasksEndpoint(self.client, parent_endpoint=self)
         )
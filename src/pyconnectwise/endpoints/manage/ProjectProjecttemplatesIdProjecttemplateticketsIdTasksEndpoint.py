@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.ProjectProjecttemplatesIdProjecttemplateticketsIdTasksCountEndpoint import (
     ProjectProjecttemplatesIdProjecttemplateticketsIdTasksCountEndpoint,
@@ -30,10 +32,6 @@ class ProjectProjecttemplatesIdProjecttemplateticketsIdTasksEndpoint(
         IPostable.__init__(self, ProjectTemplateTask)
         IPaginateable.__init__(self, ProjectTemplateTask)
 
-        self.count = self._register_child_endpoint(
-            ProjectProjecttemplatesIdProjecttemplateticketsIdTasksCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, id: int) -> ProjectProjecttemplatesIdProjecttemplateticketsIdTasksIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized ProjectProjecttemplatesIdProjecttemplateticketsIdTasksIdEndpoint object to move down the chain.
@@ -93,7 +91,7 @@ class ProjectProjecttemplatesIdProjecttemplateticketsIdTasksEndpoint(
         """
         return self._parse_many(
             ProjectTemplateTask,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -112,5 +110,14 @@ class ProjectProjecttemplatesIdProjecttemplateticketsIdTasksEndpoint(
         """
         return self._parse_one(
             ProjectTemplateTask,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
+        )
+
+    @cached_property
+    def count(self) -> ProjectProjecttemplatesIdProjecttemplateticketsIdTasksCountEndpoint:
+        """
+        The ProjectProjecttemplatesIdProjecttemplateticketsIdTasksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectProjecttemplatesIdProjecttemplateticketsIdTasksCountEndpoint(self.client, parent_endpoint=self)
         )
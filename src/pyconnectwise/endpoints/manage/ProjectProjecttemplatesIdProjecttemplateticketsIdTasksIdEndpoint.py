@@ -74,7 +74,7 @@ class ProjectProjecttemplatesIdProjecttemplateticketsIdTasksIdEndpoint(
         """
         return self._parse_one(
             ProjectTemplateTask,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def delete(
@@ -107,7 +107,7 @@ class ProjectProjecttemplatesIdProjecttemplateticketsIdTasksIdEndpoint(
         """
         return self._parse_one(
             ProjectTemplateTask,
-            super()._make_request("PUT", data=data, params=params).json(),
+            super()._make_request("PUT", data=data, params=params).content,
         )
 
     def patch(
@@ -126,5 +126,5 @@ class ProjectProjecttemplatesIdProjecttemplateticketsIdTasksIdEndpoint(
         """
         return self._parse_one(
             ProjectTemplateTask,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
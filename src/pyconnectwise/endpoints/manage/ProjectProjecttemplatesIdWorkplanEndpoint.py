@@ -67,5 +67,5 @@ class ProjectProjecttemplatesIdWorkplanEndpoint(
         """
         return self._parse_many(
             ProjectTemplateWorkPlan,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
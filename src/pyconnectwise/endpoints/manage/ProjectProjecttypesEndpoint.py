@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProjectProjecttypesEndpoint(
         IPostable.__init__(self, ProjectType)
         IPaginateable.__init__(self, ProjectType)
 
-        self.count = self._register_child_endpoint(ProjectProjecttypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ProjectProjecttypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProjectProjecttypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectProjecttypesIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class ProjectProjecttypesEndpoint(
         Returns:
             list[ProjectType]: The parsed response data.
         """
-        return self._parse_many(ProjectType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectType:
         """
@@ -85,4 +83,18 @@ class ProjectProjecttypesEndpoint(
         Returns:
             ProjectType: The parsed response data.
         """
-        return self._parse_one(ProjectType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectProjecttypesCountEndpoint:
+        """
+        The ProjectProjecttypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjecttypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProjectProjecttypesInfoEndpoint:
+        """
+        The ProjectProjecttypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjecttypesInfoEndpoint(self.client, parent_endpoint=self))
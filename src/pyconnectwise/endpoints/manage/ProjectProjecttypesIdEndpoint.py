@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class ProjectProjecttypesIdEndpoint(
         IPuttable.__init__(self, ProjectType)
         IPaginateable.__init__(self, ProjectType)
 
-        self.info = self._register_child_endpoint(ProjectProjecttypesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(ProjectProjecttypesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ProjectType]:
@@ -71,7 +69,7 @@ class ProjectProjecttypesIdEndpoint(
         Returns:
             ProjectType: The parsed response data.
         """
-        return self._parse_one(ProjectType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProjectType, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ProjectType:
         """
@@ -83,7 +81,7 @@ class ProjectProjecttypesIdEndpoint(
         Returns:
             ProjectType: The parsed response data.
         """
-        return self._parse_one(ProjectType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProjectType, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectType:
         """
@@ -95,4 +93,18 @@ class ProjectProjecttypesIdEndpoint(
         Returns:
             ProjectType: The parsed response data.
         """
-        return self._parse_one(ProjectType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProjectType, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ProjectProjecttypesIdInfoEndpoint:
+        """
+        The ProjectProjecttypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjecttypesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ProjectProjecttypesIdUsagesEndpoint:
+        """
+        The ProjectProjecttypesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjecttypesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ProjectProjecttypesIdInfoEndpoint(
         Returns:
             ProjectTypeInfo: The parsed response data.
         """
-        return self._parse_one(ProjectTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProjectTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class ProjectProjecttypesInfoEndpoint(
         IGettable.__init__(self, list[ProjectTypeInfo])
         IPaginateable.__init__(self, ProjectTypeInfo)
 
-        self.count = self._register_child_endpoint(ProjectProjecttypesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ProjectTypeInfo]:
@@ -57,4 +56,11 @@ class ProjectProjecttypesInfoEndpoint(
         Returns:
             list[ProjectTypeInfo]: The parsed response data.
         """
-        return self._parse_many(ProjectTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectTypeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectProjecttypesInfoCountEndpoint:
+        """
+        The ProjectProjecttypesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjecttypesInfoCountEndpoint(self.client, parent_endpoint=self))
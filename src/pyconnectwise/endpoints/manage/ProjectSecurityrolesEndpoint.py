@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ProjectSecurityrolesEndpoint(
         IPostable.__init__(self, ProjectSecurityRole)
         IPaginateable.__init__(self, ProjectSecurityRole)
 
-        self.count = self._register_child_endpoint(ProjectSecurityrolesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProjectSecurityrolesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectSecurityrolesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class ProjectSecurityrolesEndpoint(
         Returns:
             list[ProjectSecurityRole]: The parsed response data.
         """
-        return self._parse_many(ProjectSecurityRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectSecurityRole, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -87,4 +86,11 @@ class ProjectSecurityrolesEndpoint(
         Returns:
             ProjectSecurityRole: The parsed response data.
         """
-        return self._parse_one(ProjectSecurityRole, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectSecurityRole, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectSecurityrolesCountEndpoint:
+        """
+        The ProjectSecurityrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectSecurityrolesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,10 +26,6 @@ class ProjectSecurityrolesIdEndpoint(
         IPuttable.__init__(self, ProjectSecurityRole)
         IPaginateable.__init__(self, ProjectSecurityRole)
 
-        self.settings = self._register_child_endpoint(
-            ProjectSecurityrolesIdSettingsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ProjectSecurityRole]:
@@ -73,7 +70,7 @@ class ProjectSecurityrolesIdEndpoint(
         Returns:
             ProjectSecurityRole: The parsed response data.
         """
-        return self._parse_one(ProjectSecurityRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProjectSecurityRole, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -87,7 +84,7 @@ class ProjectSecurityrolesIdEndpoint(
         Returns:
             ProjectSecurityRole: The parsed response data.
         """
-        return self._parse_one(ProjectSecurityRole, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProjectSecurityRole, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -101,4 +98,11 @@ class ProjectSecurityrolesIdEndpoint(
         Returns:
             ProjectSecurityRole: The parsed response data.
         """
-        return self._parse_one(ProjectSecurityRole, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProjectSecurityRole, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def settings(self) -> ProjectSecurityrolesIdSettingsEndpoint:
+        """
+        The ProjectSecurityrolesIdSettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectSecurityrolesIdSettingsEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class ProjectSecurityrolesIdSettingsEndpoint(
         IGettable.__init__(self, list[ProjectSecurityRoleSetting])
         IPaginateable.__init__(self, ProjectSecurityRoleSetting)
 
-        self.count = self._register_child_endpoint(
-            ProjectSecurityrolesIdSettingsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProjectSecurityrolesIdSettingsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectSecurityrolesIdSettingsIdEndpoint object to move down the chain.
@@ -78,5 +75,14 @@ class ProjectSecurityrolesIdSettingsEndpoint(
             list[ProjectSecurityRoleSetting]: The parsed response data.
         """
         return self._parse_many(
-            ProjectSecurityRoleSetting, super()._make_request("GET", data=data, params=params).json()
+            ProjectSecurityRoleSetting, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> ProjectSecurityrolesIdSettingsCountEndpoint:
+        """
+        The ProjectSecurityrolesIdSettingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectSecurityrolesIdSettingsCountEndpoint(self.client, parent_endpoint=self)
         )
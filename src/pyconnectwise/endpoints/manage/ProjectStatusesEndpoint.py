@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProjectStatusesEndpoint(
         IPostable.__init__(self, ProjectStatus)
         IPaginateable.__init__(self, ProjectStatus)
 
-        self.count = self._register_child_endpoint(ProjectStatusesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ProjectStatusesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProjectStatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectStatusesIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class ProjectStatusesEndpoint(
         Returns:
             list[ProjectStatus]: The parsed response data.
         """
-        return self._parse_many(ProjectStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectStatus:
         """
@@ -87,4 +85,18 @@ class ProjectStatusesEndpoint(
         Returns:
             ProjectStatus: The parsed response data.
         """
-        return self._parse_one(ProjectStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectStatusesCountEndpoint:
+        """
+        The ProjectStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectStatusesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProjectStatusesInfoEndpoint:
+        """
+        The ProjectStatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectStatusesInfoEndpoint(self.client, parent_endpoint=self))
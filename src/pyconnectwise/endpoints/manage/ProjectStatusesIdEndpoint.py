@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class ProjectStatusesIdEndpoint(
         IPuttable.__init__(self, ProjectStatus)
         IPaginateable.__init__(self, ProjectStatus)
 
-        self.info = self._register_child_endpoint(ProjectStatusesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(ProjectStatusesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ProjectStatus]:
@@ -71,7 +69,7 @@ class ProjectStatusesIdEndpoint(
         Returns:
             ProjectStatus: The parsed response data.
         """
-        return self._parse_one(ProjectStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProjectStatus, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ProjectStatus:
         """
@@ -83,7 +81,7 @@ class ProjectStatusesIdEndpoint(
         Returns:
             ProjectStatus: The parsed response data.
         """
-        return self._parse_one(ProjectStatus, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProjectStatus, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectStatus:
         """
@@ -95,4 +93,18 @@ class ProjectStatusesIdEndpoint(
         Returns:
             ProjectStatus: The parsed response data.
         """
-        return self._parse_one(ProjectStatus, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProjectStatus, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ProjectStatusesIdInfoEndpoint:
+        """
+        The ProjectStatusesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectStatusesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ProjectStatusesIdUsagesEndpoint:
+        """
+        The ProjectStatusesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectStatusesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ProjectStatusesIdInfoEndpoint(
         Returns:
             ProjectStatusInfo: The parsed response data.
         """
-        return self._parse_one(ProjectStatusInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProjectStatusInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class ProjectStatusesInfoEndpoint(
         IGettable.__init__(self, list[ProjectStatusInfo])
         IPaginateable.__init__(self, ProjectStatusInfo)
 
-        self.count = self._register_child_endpoint(ProjectStatusesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ProjectStatusInfo]:
@@ -57,4 +56,11 @@ class ProjectStatusesInfoEndpoint(
         Returns:
             list[ProjectStatusInfo]: The parsed response data.
         """
-        return self._parse_many(ProjectStatusInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectStatusInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectStatusesInfoCountEndpoint:
+        """
+        The ProjectStatusesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectStatusesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ProjectStatusindicatorsEndpoint(
         IGettable.__init__(self, list[StatusIndicator])
         IPaginateable.__init__(self, StatusIndicator)
 
-        self.count = self._register_child_endpoint(ProjectStatusindicatorsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProjectStatusindicatorsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectStatusindicatorsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class ProjectStatusindicatorsEndpoint(
         Returns:
             list[StatusIndicator]: The parsed response data.
         """
-        return self._parse_many(StatusIndicator, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(StatusIndicator, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectStatusindicatorsCountEndpoint:
+        """
+        The ProjectStatusindicatorsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectStatusindicatorsCountEndpoint(self.client, parent_endpoint=self))
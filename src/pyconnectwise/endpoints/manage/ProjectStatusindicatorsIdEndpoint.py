@@ -52,4 +52,4 @@ class ProjectStatusindicatorsIdEndpoint(
         Returns:
             StatusIndicator: The parsed response data.
         """
-        return self._parse_one(StatusIndicator, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(StatusIndicator, super()._make_request("GET", data=data, params=params).content)
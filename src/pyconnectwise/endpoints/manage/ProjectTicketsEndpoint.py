@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ProjectTicketsEndpoint(
         IPostable.__init__(self, ProjectTicket)
         IPaginateable.__init__(self, ProjectTicket)
 
-        self.count = self._register_child_endpoint(ProjectTicketsCountEndpoint(client, parent_endpoint=self))
-        self.search = self._register_child_endpoint(ProjectTicketsSearchEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProjectTicketsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectTicketsIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class ProjectTicketsEndpoint(
         Returns:
             list[ProjectTicket]: The parsed response data.
         """
-        return self._parse_many(ProjectTicket, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectTicket, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectTicket:
         """
@@ -87,4 +85,18 @@ class ProjectTicketsEndpoint(
         Returns:
             ProjectTicket: The parsed response data.
         """
-        return self._parse_one(ProjectTicket, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ProjectTicket, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectTicketsCountEndpoint:
+        """
+        The ProjectTicketsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def search(self) -> ProjectTicketsSearchEndpoint:
+        """
+        The ProjectTicketsSearchEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsSearchEndpoint(self.client, parent_endpoint=self))
@@ -54,4 +54,4 @@ class ProjectTicketsIdAllnotesEndpoint(
         Returns:
             list[ProjectTicketNote]: The parsed response data.
         """
-        return self._parse_many(ProjectTicketNote, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProjectTicketNote, super()._make_request("GET", data=data, params=params).content)
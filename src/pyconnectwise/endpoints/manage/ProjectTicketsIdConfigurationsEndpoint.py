@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ProjectTicketsIdConfigurationsEndpoint(
         IPostable.__init__(self, ConfigurationReference)
         IPaginateable.__init__(self, ConfigurationReference)
 
-        self.count = self._register_child_endpoint(
-            ProjectTicketsIdConfigurationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ProjectTicketsIdConfigurationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectTicketsIdConfigurationsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class ProjectTicketsIdConfigurationsEndpoint(
         Returns:
             list[ConfigurationReference]: The parsed response data.
         """
-        return self._parse_many(ConfigurationReference, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ConfigurationReference, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -93,4 +90,13 @@ class ProjectTicketsIdConfigurationsEndpoint(
         Returns:
             ConfigurationReference: The parsed response data.
         """
-        return self._parse_one(ConfigurationReference, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ConfigurationReference, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectTicketsIdConfigurationsCountEndpoint:
+        """
+        The ProjectTicketsIdConfigurationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectTicketsIdConfigurationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -64,4 +64,4 @@ class ProjectTicketsIdConfigurationsIdEndpoint(
         Returns:
             ConfigurationReference: The parsed response data.
         """
-        return self._parse_one(ConfigurationReference, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ConfigurationReference, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class ProjectTicketsIdDocumentsEndpoint(
         IGettable.__init__(self, list[DocumentReference])
         IPaginateable.__init__(self, DocumentReference)
 
-        self.count = self._register_child_endpoint(ProjectTicketsIdDocumentsCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[DocumentReference]:
@@ -57,4 +56,11 @@ class ProjectTicketsIdDocumentsEndpoint(
         Returns:
             list[DocumentReference]: The parsed response data.
         """
-        return self._parse_many(DocumentReference, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DocumentReference, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectTicketsIdDocumentsCountEndpoint:
+        """
+        The ProjectTicketsIdDocumentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdDocumentsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -36,25 +37,6 @@ class ProjectTicketsIdEndpoint(
         IPuttable.__init__(self, ProjectTicket)
         IPaginateable.__init__(self, ProjectTicket)
 
-        self.activities = self._register_child_endpoint(
-            ProjectTicketsIdActivitiesEndpoint(client, parent_endpoint=self)
-        )
-        self.all_notes = self._register_child_endpoint(ProjectTicketsIdAllnotesEndpoint(client, parent_endpoint=self))
-        self.configurations = self._register_child_endpoint(
-            ProjectTicketsIdConfigurationsEndpoint(client, parent_endpoint=self)
-        )
-        self.convert = self._register_child_endpoint(ProjectTicketsIdConvertEndpoint(client, parent_endpoint=self))
-        self.documents = self._register_child_endpoint(ProjectTicketsIdDocumentsEndpoint(client, parent_endpoint=self))
-        self.notes = self._register_child_endpoint(ProjectTicketsIdNotesEndpoint(client, parent_endpoint=self))
-        self.products = self._register_child_endpoint(ProjectTicketsIdProductsEndpoint(client, parent_endpoint=self))
-        self.scheduleentries = self._register_child_endpoint(
-            ProjectTicketsIdScheduleentriesEndpoint(client, parent_endpoint=self)
-        )
-        self.tasks = self._register_child_endpoint(ProjectTicketsIdTasksEndpoint(client, parent_endpoint=self))
-        self.timeentries = self._register_child_endpoint(
-            ProjectTicketsIdTimeentriesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ProjectTicket]:
@@ -97,7 +79,7 @@ class ProjectTicketsIdEndpoint(
         Returns:
             ProjectTicket: The parsed response data.
         """
-        return self._parse_one(ProjectTicket, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ProjectTicket, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ProjectTicket:
         """
@@ -109,7 +91,7 @@ class ProjectTicketsIdEndpoint(
         Returns:
             ProjectTicket: The parsed response data.
         """
-        return self._parse_one(ProjectTicket, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ProjectTicket, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectTicket:
         """
@@ -121,4 +103,74 @@ class ProjectTicketsIdEndpoint(
         Returns:
             ProjectTicket: The parsed response data.
         """
-        return self._parse_one(ProjectTicket, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ProjectTicket, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def activities(self) -> ProjectTicketsIdActivitiesEndpoint:
+        """
+        The ProjectTicketsIdActivitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdActivitiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def all_notes(self) -> ProjectTicketsIdAllnotesEndpoint:
+        """
+        The ProjectTicketsIdAllnotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdAllnotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def configurations(self) -> ProjectTicketsIdConfigurationsEndpoint:
+        """
+        The ProjectTicketsIdConfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdConfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def convert(self) -> ProjectTicketsIdConvertEndpoint:
+        """
+        The ProjectTicketsIdConvertEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdConvertEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def documents(self) -> ProjectTicketsIdDocumentsEndpoint:
+        """
+        The ProjectTicketsIdDocumentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdDocumentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notes(self) -> ProjectTicketsIdNotesEndpoint:
+        """
+        The ProjectTicketsIdNotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdNotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def products(self) -> ProjectTicketsIdProductsEndpoint:
+        """
+        The ProjectTicketsIdProductsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdProductsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scheduleentries(self) -> ProjectTicketsIdScheduleentriesEndpoint:
+        """
+        The ProjectTicketsIdScheduleentriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdScheduleentriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tasks(self) -> ProjectTicketsIdTasksEndpoint:
+        """
+        The ProjectTicketsIdTasksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdTasksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def timeentries(self) -> ProjectTicketsIdTimeentriesEndpoint:
+        """
+        The ProjectTicketsIdTimeentriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdTimeentriesEndpoint(self.client, parent_endpoint=self))
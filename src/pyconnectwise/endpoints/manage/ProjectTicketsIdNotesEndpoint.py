@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ProjectTicketsIdNotesEndpoint(
         IPostable.__init__(self, TicketNote)
         IPaginateable.__init__(self, TicketNote)
 
-        self.count = self._register_child_endpoint(ProjectTicketsIdNotesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProjectTicketsIdNotesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectTicketsIdNotesIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class ProjectTicketsIdNotesEndpoint(
         Returns:
             list[TicketNote]: The parsed response data.
         """
-        return self._parse_many(TicketNote, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TicketNote, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TicketNote:
         """
@@ -81,4 +80,11 @@ class ProjectTicketsIdNotesEndpoint(
         Returns:
             TicketNote: The parsed response data.
         """
-        return self._parse_one(TicketNote, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TicketNote, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectTicketsIdNotesCountEndpoint:
+        """
+        The ProjectTicketsIdNotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdNotesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ProjectTicketsIdTasksEndpoint(
         IPostable.__init__(self, TicketTask)
         IPaginateable.__init__(self, TicketTask)
 
-        self.count = self._register_child_endpoint(ProjectTicketsIdTasksCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ProjectTicketsIdTasksIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ProjectTicketsIdTasksIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class ProjectTicketsIdTasksEndpoint(
         Returns:
             list[TicketTask]: The parsed response data.
         """
-        return self._parse_many(TicketTask, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TicketTask, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TicketTask:
         """
@@ -81,4 +80,11 @@ class ProjectTicketsIdTasksEndpoint(
         Returns:
             TicketTask: The parsed response data.
         """
-        return self._parse_one(TicketTask, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TicketTask, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ProjectTicketsIdTasksCountEndpoint:
+        """
+        The ProjectTicketsIdTasksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdTasksCountEndpoint(self.client, parent_endpoint=self))
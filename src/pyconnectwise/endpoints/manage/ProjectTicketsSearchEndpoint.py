@@ -26,4 +26,4 @@ class ProjectTicketsSearchEndpoint(ConnectWiseEndpoint, IPostable[list[ProjectTi
         Returns:
             list[ProjectTicket]: The parsed response data.
         """
-        return self._parse_many(ProjectTicket, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_many(ProjectTicket, super()._make_request("POST", data=data, params=params).content)
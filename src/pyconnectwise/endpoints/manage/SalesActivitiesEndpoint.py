@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class SalesActivitiesEndpoint(
         IPostable.__init__(self, Activity)
         IPaginateable.__init__(self, Activity)
 
-        self.count = self._register_child_endpoint(SalesActivitiesCountEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(SalesActivitiesStatusesEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(SalesActivitiesTypesEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesActivitiesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesActivitiesIdEndpoint object to move down the chain.
@@ -73,7 +70,7 @@ class SalesActivitiesEndpoint(
         Returns:
             list[Activity]: The parsed response data.
         """
-        return self._parse_many(Activity, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Activity, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Activity:
         """
@@ -85,4 +82,25 @@ class SalesActivitiesEndpoint(
         Returns:
             Activity: The parsed response data.
         """
-        return self._parse_one(Activity, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Activity, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesActivitiesCountEndpoint:
+        """
+        The SalesActivitiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> SalesActivitiesStatusesEndpoint:
+        """
+        The SalesActivitiesStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> SalesActivitiesTypesEndpoint:
+        """
+        The SalesActivitiesTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesTypesEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SalesActivitiesStatusesEndpoint(
         IPostable.__init__(self, ActivityStatus)
         IPaginateable.__init__(self, ActivityStatus)
 
-        self.count = self._register_child_endpoint(SalesActivitiesStatusesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SalesActivitiesStatusesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesActivitiesStatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesActivitiesStatusesIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class SalesActivitiesStatusesEndpoint(
         Returns:
             list[ActivityStatus]: The parsed response data.
         """
-        return self._parse_many(ActivityStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ActivityStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ActivityStatus:
         """
@@ -87,4 +85,18 @@ class SalesActivitiesStatusesEndpoint(
         Returns:
             ActivityStatus: The parsed response data.
         """
-        return self._parse_one(ActivityStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ActivityStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesActivitiesStatusesCountEndpoint:
+        """
+        The SalesActivitiesStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesStatusesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SalesActivitiesStatusesInfoEndpoint:
+        """
+        The SalesActivitiesStatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesStatusesInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class SalesActivitiesStatusesIdInfoEndpoint(
         Returns:
             ActivityStatusInfo: The parsed response data.
         """
-        return self._parse_one(ActivityStatusInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ActivityStatusInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class SalesActivitiesStatusesInfoEndpoint(
         IGettable.__init__(self, list[ActivityStatusInfo])
         IPaginateable.__init__(self, ActivityStatusInfo)
 
-        self.count = self._register_child_endpoint(
-            SalesActivitiesStatusesInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ActivityStatusInfo]:
@@ -61,4 +58,13 @@ class SalesActivitiesStatusesInfoEndpoint(
         Returns:
             list[ActivityStatusInfo]: The parsed response data.
         """
-        return self._parse_many(ActivityStatusInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ActivityStatusInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesActivitiesStatusesInfoCountEndpoint:
+        """
+        The SalesActivitiesStatusesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesActivitiesStatusesInfoCountEndpoint(self.client, parent_endpoint=self)
+        )
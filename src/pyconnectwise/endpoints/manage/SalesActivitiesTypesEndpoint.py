@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SalesActivitiesTypesEndpoint(
         IPostable.__init__(self, ActivityType)
         IPaginateable.__init__(self, ActivityType)
 
-        self.count = self._register_child_endpoint(SalesActivitiesTypesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesActivitiesTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesActivitiesTypesIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class SalesActivitiesTypesEndpoint(
         Returns:
             list[ActivityType]: The parsed response data.
         """
-        return self._parse_many(ActivityType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ActivityType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ActivityType:
         """
@@ -83,4 +82,11 @@ class SalesActivitiesTypesEndpoint(
         Returns:
             ActivityType: The parsed response data.
         """
-        return self._parse_one(ActivityType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ActivityType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesActivitiesTypesCountEndpoint:
+        """
+        The SalesActivitiesTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesTypesCountEndpoint(self.client, parent_endpoint=self))
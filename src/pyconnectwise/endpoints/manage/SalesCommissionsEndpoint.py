@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SalesCommissionsEndpoint(
         IPostable.__init__(self, Commission)
         IPaginateable.__init__(self, Commission)
 
-        self.count = self._register_child_endpoint(SalesCommissionsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesCommissionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesCommissionsIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class SalesCommissionsEndpoint(
         Returns:
             list[Commission]: The parsed response data.
         """
-        return self._parse_many(Commission, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Commission, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Commission:
         """
@@ -81,4 +80,11 @@ class SalesCommissionsEndpoint(
         Returns:
             Commission: The parsed response data.
         """
-        return self._parse_one(Commission, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Commission, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesCommissionsCountEndpoint:
+        """
+        The SalesCommissionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesCommissionsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,14 +22,79 @@ class SalesEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "sales", parent_endpoint=parent_endpoint)
 
-        self.activities = self._register_child_endpoint(SalesActivitiesEndpoint(client, parent_endpoint=self))
-        self.commissions = self._register_child_endpoint(SalesCommissionsEndpoint(client, parent_endpoint=self))
-        self.opportunities = self._register_child_endpoint(SalesOpportunitiesEndpoint(client, parent_endpoint=self))
-        self.orders = self._register_child_endpoint(SalesOrdersEndpoint(client, parent_endpoint=self))
-        self.probabilities = self._register_child_endpoint(SalesProbabilitiesEndpoint(client, parent_endpoint=self))
-        self.quotas = self._register_child_endpoint(SalesQuotasEndpoint(client, parent_endpoint=self))
-        self.roles = self._register_child_endpoint(SalesRolesEndpoint(client, parent_endpoint=self))
-        self.sales_teams = self._register_child_endpoint(SalesSalesteamsEndpoint(client, parent_endpoint=self))
-        self.schedule = self._register_child_endpoint(SalesScheduleEndpoint(client, parent_endpoint=self))
-        self.service = self._register_child_endpoint(SalesServiceEndpoint(client, parent_endpoint=self))
-        self.stages = self._register_child_endpoint(SalesStagesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def activities(self) -> SalesActivitiesEndpoint:
+        """
+        The SalesActivitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def commissions(self) -> SalesCommissionsEndpoint:
+        """
+        The SalesCommissionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesCommissionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def opportunities(self) -> SalesOpportunitiesEndpoint:
+        """
+        The SalesOpportunitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def orders(self) -> SalesOrdersEndpoint:
+        """
+        The SalesOrdersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOrdersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def probabilities(self) -> SalesProbabilitiesEndpoint:
+        """
+        The SalesProbabilitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesProbabilitiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def quotas(self) -> SalesQuotasEndpoint:
+        """
+        The SalesQuotasEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesQuotasEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def roles(self) -> SalesRolesEndpoint:
+        """
+        The SalesRolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesRolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sales_teams(self) -> SalesSalesteamsEndpoint:
+        """
+        The SalesSalesteamsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesSalesteamsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def schedule(self) -> SalesScheduleEndpoint:
+        """
+        The SalesScheduleEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesScheduleEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def service(self) -> SalesServiceEndpoint:
+        """
+        The SalesServiceEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesServiceEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def stages(self) -> SalesStagesEndpoint:
+        """
+        The SalesStagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesStagesEndpoint(self.client, parent_endpoint=self))
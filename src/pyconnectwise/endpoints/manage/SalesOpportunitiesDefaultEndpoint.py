@@ -52,4 +52,4 @@ class SalesOpportunitiesDefaultEndpoint(
         Returns:
             Opportunity: The parsed response data.
         """
-        return self._parse_one(Opportunity, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Opportunity, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,12 +29,6 @@ class SalesOpportunitiesEndpoint(
         IPostable.__init__(self, Opportunity)
         IPaginateable.__init__(self, Opportunity)
 
-        self.count = self._register_child_endpoint(SalesOpportunitiesCountEndpoint(client, parent_endpoint=self))
-        self.default = self._register_child_endpoint(SalesOpportunitiesDefaultEndpoint(client, parent_endpoint=self))
-        self.ratings = self._register_child_endpoint(SalesOpportunitiesRatingsEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(SalesOpportunitiesStatusesEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(SalesOpportunitiesTypesEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesOpportunitiesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesOpportunitiesIdEndpoint object to move down the chain.
@@ -79,7 +74,7 @@ class SalesOpportunitiesEndpoint(
         Returns:
             list[Opportunity]: The parsed response data.
         """
-        return self._parse_many(Opportunity, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Opportunity, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Opportunity:
         """
@@ -91,4 +86,39 @@ class SalesOpportunitiesEndpoint(
         Returns:
             Opportunity: The parsed response data.
         """
-        return self._parse_one(Opportunity, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Opportunity, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesCountEndpoint:
+        """
+        The SalesOpportunitiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def default(self) -> SalesOpportunitiesDefaultEndpoint:
+        """
+        The SalesOpportunitiesDefaultEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesDefaultEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ratings(self) -> SalesOpportunitiesRatingsEndpoint:
+        """
+        The SalesOpportunitiesRatingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesRatingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> SalesOpportunitiesStatusesEndpoint:
+        """
+        The SalesOpportunitiesStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> SalesOpportunitiesTypesEndpoint:
+        """
+        The SalesOpportunitiesTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesTypesEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class SalesOpportunitiesIdContactsEndpoint(
         IPostable.__init__(self, OpportunityContact)
         IPaginateable.__init__(self, OpportunityContact)
 
-        self.count = self._register_child_endpoint(
-            SalesOpportunitiesIdContactsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SalesOpportunitiesIdContactsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesOpportunitiesIdContactsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class SalesOpportunitiesIdContactsEndpoint(
         Returns:
             list[OpportunityContact]: The parsed response data.
         """
-        return self._parse_many(OpportunityContact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityContact, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -91,4 +88,13 @@ class SalesOpportunitiesIdContactsEndpoint(
         Returns:
             OpportunityContact: The parsed response data.
         """
-        return self._parse_one(OpportunityContact, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(OpportunityContact, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesIdContactsCountEndpoint:
+        """
+        The SalesOpportunitiesIdContactsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdContactsCountEndpoint(self.client, parent_endpoint=self)
+        )
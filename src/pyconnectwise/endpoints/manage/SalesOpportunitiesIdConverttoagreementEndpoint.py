@@ -26,4 +26,4 @@ class SalesOpportunitiesIdConverttoagreementEndpoint(
         Returns:
             Agreement: The parsed response data.
         """
-        return self._parse_one(Agreement, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Agreement, super()._make_request("POST", data=data, params=params).content)
@@ -26,4 +26,4 @@ class SalesOpportunitiesIdConverttoprojectEndpoint(
         Returns:
             Project: The parsed response data.
         """
-        return self._parse_one(Project, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Project, super()._make_request("POST", data=data, params=params).content)
@@ -26,4 +26,4 @@ class SalesOpportunitiesIdConverttosalesorderEndpoint(
         Returns:
             Order: The parsed response data.
         """
-        return self._parse_one(Order, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Order, super()._make_request("POST", data=data, params=params).content)
@@ -26,4 +26,4 @@ class SalesOpportunitiesIdConverttoserviceticketEndpoint(
         Returns:
             Ticket: The parsed response data.
         """
-        return self._parse_one(Ticket, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Ticket, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -40,27 +41,6 @@ class SalesOpportunitiesIdEndpoint(
         IPuttable.__init__(self, Opportunity)
         IPaginateable.__init__(self, Opportunity)
 
-        self.contacts = self._register_child_endpoint(
-            SalesOpportunitiesIdContactsEndpoint(client, parent_endpoint=self)
-        )
-        self.convert_to_agreement = self._register_child_endpoint(
-            SalesOpportunitiesIdConverttoagreementEndpoint(client, parent_endpoint=self)
-        )
-        self.convert_to_project = self._register_child_endpoint(
-            SalesOpportunitiesIdConverttoprojectEndpoint(client, parent_endpoint=self)
-        )
-        self.convert_to_sales_order = self._register_child_endpoint(
-            SalesOpportunitiesIdConverttosalesorderEndpoint(client, parent_endpoint=self)
-        )
-        self.convert_to_service_ticket = self._register_child_endpoint(
-            SalesOpportunitiesIdConverttoserviceticketEndpoint(client, parent_endpoint=self)
-        )
-        self.forecast = self._register_child_endpoint(
-            SalesOpportunitiesIdForecastEndpoint(client, parent_endpoint=self)
-        )
-        self.notes = self._register_child_endpoint(SalesOpportunitiesIdNotesEndpoint(client, parent_endpoint=self))
-        self.team = self._register_child_endpoint(SalesOpportunitiesIdTeamEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Opportunity]:
@@ -103,7 +83,7 @@ class SalesOpportunitiesIdEndpoint(
         Returns:
             Opportunity: The parsed response data.
         """
-        return self._parse_one(Opportunity, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Opportunity, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Opportunity:
         """
@@ -115,7 +95,7 @@ class SalesOpportunitiesIdEndpoint(
         Returns:
             Opportunity: The parsed response data.
         """
-        return self._parse_one(Opportunity, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Opportunity, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Opportunity:
         """
@@ -127,4 +107,68 @@ class SalesOpportunitiesIdEndpoint(
         Returns:
             Opportunity: The parsed response data.
         """
-        return self._parse_one(Opportunity, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Opportunity, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def contacts(self) -> SalesOpportunitiesIdContactsEndpoint:
+        """
+        The SalesOpportunitiesIdContactsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesIdContactsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def convert_to_agreement(self) -> SalesOpportunitiesIdConverttoagreementEndpoint:
+        """
+        The SalesOpportunitiesIdConverttoagreementEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdConverttoagreementEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def convert_to_project(self) -> SalesOpportunitiesIdConverttoprojectEndpoint:
+        """
+        The SalesOpportunitiesIdConverttoprojectEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdConverttoprojectEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def convert_to_sales_order(self) -> SalesOpportunitiesIdConverttosalesorderEndpoint:
+        """
+        The SalesOpportunitiesIdConverttosalesorderEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdConverttosalesorderEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def convert_to_service_ticket(self) -> SalesOpportunitiesIdConverttoserviceticketEndpoint:
+        """
+        The SalesOpportunitiesIdConverttoserviceticketEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdConverttoserviceticketEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def forecast(self) -> SalesOpportunitiesIdForecastEndpoint:
+        """
+        The SalesOpportunitiesIdForecastEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesIdForecastEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notes(self) -> SalesOpportunitiesIdNotesEndpoint:
+        """
+        The SalesOpportunitiesIdNotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesIdNotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def team(self) -> SalesOpportunitiesIdTeamEndpoint:
+        """
+        The SalesOpportunitiesIdTeamEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesIdTeamEndpoint(self.client, parent_endpoint=self))
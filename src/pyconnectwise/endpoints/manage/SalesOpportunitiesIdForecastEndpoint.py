@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -29,13 +30,6 @@ class SalesOpportunitiesIdForecastEndpoint(
         IPostable.__init__(self, Forecast)
         IPaginateable.__init__(self, Forecast)
 
-        self.copy = self._register_child_endpoint(
-            SalesOpportunitiesIdForecastCopyEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            SalesOpportunitiesIdForecastCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SalesOpportunitiesIdForecastIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesOpportunitiesIdForecastIdEndpoint object to move down the chain.
@@ -79,7 +73,7 @@ class SalesOpportunitiesIdForecastEndpoint(
         Returns:
             list[Forecast]: The parsed response data.
         """
-        return self._parse_many(Forecast, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Forecast, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Forecast:
         """
@@ -91,4 +85,22 @@ class SalesOpportunitiesIdForecastEndpoint(
         Returns:
             Forecast: The parsed response data.
         """
-        return self._parse_one(Forecast, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Forecast, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> SalesOpportunitiesIdForecastCopyEndpoint:
+        """
+        The SalesOpportunitiesIdForecastCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdForecastCopyEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesIdForecastCountEndpoint:
+        """
+        The SalesOpportunitiesIdForecastCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdForecastCountEndpoint(self.client, parent_endpoint=self)
+        )
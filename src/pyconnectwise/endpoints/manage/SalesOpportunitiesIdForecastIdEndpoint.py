@@ -68,7 +68,7 @@ class SalesOpportunitiesIdForecastIdEndpoint(
         Returns:
             ForecastItem: The parsed response data.
         """
-        return self._parse_one(ForecastItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ForecastItem, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ForecastItem:
         """
@@ -80,7 +80,7 @@ class SalesOpportunitiesIdForecastIdEndpoint(
         Returns:
             ForecastItem: The parsed response data.
         """
-        return self._parse_one(ForecastItem, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ForecastItem, super()._make_request("PATCH", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ForecastItem:
         """
@@ -92,7 +92,7 @@ class SalesOpportunitiesIdForecastIdEndpoint(
         Returns:
             ForecastItem: The parsed response data.
         """
-        return self._parse_one(ForecastItem, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ForecastItem, super()._make_request("POST", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ForecastItem:
         """
@@ -104,4 +104,4 @@ class SalesOpportunitiesIdForecastIdEndpoint(
         Returns:
             ForecastItem: The parsed response data.
         """
-        return self._parse_one(ForecastItem, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ForecastItem, super()._make_request("PUT", data=data, params=params).content)
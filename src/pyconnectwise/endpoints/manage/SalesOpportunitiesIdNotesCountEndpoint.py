@@ -54,4 +54,4 @@ class SalesOpportunitiesIdNotesCountEndpoint(
         Returns:
             list[OpportunityNote]: The parsed response data.
         """
-        return self._parse_many(OpportunityNote, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityNote, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SalesOpportunitiesIdNotesEndpoint(
         IPostable.__init__(self, OpportunityNote)
         IPaginateable.__init__(self, OpportunityNote)
 
-        self.count = self._register_child_endpoint(SalesOpportunitiesIdNotesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesOpportunitiesIdNotesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesOpportunitiesIdNotesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SalesOpportunitiesIdNotesEndpoint(
         Returns:
             list[OpportunityNote]: The parsed response data.
         """
-        return self._parse_many(OpportunityNote, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityNote, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> OpportunityNote:
         """
@@ -85,4 +84,11 @@ class SalesOpportunitiesIdNotesEndpoint(
         Returns:
             OpportunityNote: The parsed response data.
         """
-        return self._parse_one(OpportunityNote, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(OpportunityNote, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesIdNotesCountEndpoint:
+        """
+        The SalesOpportunitiesIdNotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesIdNotesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SalesOpportunitiesIdTeamEndpoint(
         IPostable.__init__(self, Team)
         IPaginateable.__init__(self, Team)
 
-        self.count = self._register_child_endpoint(SalesOpportunitiesIdTeamCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesOpportunitiesIdTeamIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesOpportunitiesIdTeamIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class SalesOpportunitiesIdTeamEndpoint(
         Returns:
             list[Team]: The parsed response data.
         """
-        return self._parse_many(Team, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Team, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Team:
         """
@@ -81,4 +80,11 @@ class SalesOpportunitiesIdTeamEndpoint(
         Returns:
             Team: The parsed response data.
         """
-        return self._parse_one(Team, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Team, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesIdTeamCountEndpoint:
+        """
+        The SalesOpportunitiesIdTeamCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesIdTeamCountEndpoint(self.client, parent_endpoint=self))
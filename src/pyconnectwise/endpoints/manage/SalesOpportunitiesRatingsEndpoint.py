@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SalesOpportunitiesRatingsEndpoint(
         IPostable.__init__(self, OpportunityRating)
         IPaginateable.__init__(self, OpportunityRating)
 
-        self.count = self._register_child_endpoint(SalesOpportunitiesRatingsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SalesOpportunitiesRatingsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesOpportunitiesRatingsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesOpportunitiesRatingsIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class SalesOpportunitiesRatingsEndpoint(
         Returns:
             list[OpportunityRating]: The parsed response data.
         """
-        return self._parse_many(OpportunityRating, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityRating, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> OpportunityRating:
         """
@@ -87,4 +85,18 @@ class SalesOpportunitiesRatingsEndpoint(
         Returns:
             OpportunityRating: The parsed response data.
         """
-        return self._parse_one(OpportunityRating, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(OpportunityRating, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesRatingsCountEndpoint:
+        """
+        The SalesOpportunitiesRatingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesRatingsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SalesOpportunitiesRatingsInfoEndpoint:
+        """
+        The SalesOpportunitiesRatingsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesRatingsInfoEndpoint(self.client, parent_endpoint=self))
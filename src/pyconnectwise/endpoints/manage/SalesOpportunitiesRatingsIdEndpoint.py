@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,8 +28,6 @@ class SalesOpportunitiesRatingsIdEndpoint(
         IPuttable.__init__(self, OpportunityRating)
         IPaginateable.__init__(self, OpportunityRating)
 
-        self.info = self._register_child_endpoint(SalesOpportunitiesRatingsIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[OpportunityRating]:
@@ -71,7 +70,7 @@ class SalesOpportunitiesRatingsIdEndpoint(
         Returns:
             OpportunityRating: The parsed response data.
         """
-        return self._parse_one(OpportunityRating, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OpportunityRating, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> OpportunityRating:
         """
@@ -83,7 +82,7 @@ class SalesOpportunitiesRatingsIdEndpoint(
         Returns:
             OpportunityRating: The parsed response data.
         """
-        return self._parse_one(OpportunityRating, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(OpportunityRating, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> OpportunityRating:
         """
@@ -95,4 +94,11 @@ class SalesOpportunitiesRatingsIdEndpoint(
         Returns:
             OpportunityRating: The parsed response data.
         """
-        return self._parse_one(OpportunityRating, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(OpportunityRating, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SalesOpportunitiesRatingsIdInfoEndpoint:
+        """
+        The SalesOpportunitiesRatingsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesRatingsIdInfoEndpoint(self.client, parent_endpoint=self))
@@ -54,4 +54,4 @@ class SalesOpportunitiesRatingsIdInfoEndpoint(
         Returns:
             OpportunityRatingInfo: The parsed response data.
         """
-        return self._parse_one(OpportunityRatingInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OpportunityRatingInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,11 +28,6 @@ class SalesOpportunitiesStatusesEndpoint(
         IPostable.__init__(self, OpportunityStatus)
         IPaginateable.__init__(self, OpportunityStatus)
 
-        self.count = self._register_child_endpoint(
-            SalesOpportunitiesStatusesCountEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(SalesOpportunitiesStatusesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesOpportunitiesStatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesOpportunitiesStatusesIdEndpoint object to move down the chain.
@@ -79,7 +75,7 @@ class SalesOpportunitiesStatusesEndpoint(
         Returns:
             list[OpportunityStatus]: The parsed response data.
         """
-        return self._parse_many(OpportunityStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> OpportunityStatus:
         """
@@ -91,4 +87,18 @@ class SalesOpportunitiesStatusesEndpoint(
         Returns:
             OpportunityStatus: The parsed response data.
         """
-        return self._parse_one(OpportunityStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(OpportunityStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesStatusesCountEndpoint:
+        """
+        The SalesOpportunitiesStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesStatusesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SalesOpportunitiesStatusesInfoEndpoint:
+        """
+        The SalesOpportunitiesStatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesStatusesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -30,13 +31,6 @@ class SalesOpportunitiesStatusesIdEndpoint(
         IPuttable.__init__(self, OpportunityStatus)
         IPaginateable.__init__(self, OpportunityStatus)
 
-        self.info = self._register_child_endpoint(
-            SalesOpportunitiesStatusesIdInfoEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            SalesOpportunitiesStatusesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[OpportunityStatus]:
@@ -79,7 +73,7 @@ class SalesOpportunitiesStatusesIdEndpoint(
         Returns:
             OpportunityStatus: The parsed response data.
         """
-        return self._parse_one(OpportunityStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OpportunityStatus, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> OpportunityStatus:
         """
@@ -91,7 +85,7 @@ class SalesOpportunitiesStatusesIdEndpoint(
         Returns:
             OpportunityStatus: The parsed response data.
         """
-        return self._parse_one(OpportunityStatus, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(OpportunityStatus, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> OpportunityStatus:
         """
@@ -103,4 +97,22 @@ class SalesOpportunitiesStatusesIdEndpoint(
         Returns:
             OpportunityStatus: The parsed response data.
         """
-        return self._parse_one(OpportunityStatus, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(OpportunityStatus, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SalesOpportunitiesStatusesIdInfoEndpoint:
+        """
+        The SalesOpportunitiesStatusesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesStatusesIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> SalesOpportunitiesStatusesIdUsagesEndpoint:
+        """
+        The SalesOpportunitiesStatusesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesStatusesIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
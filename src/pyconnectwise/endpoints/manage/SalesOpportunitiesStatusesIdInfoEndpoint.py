@@ -54,4 +54,4 @@ class SalesOpportunitiesStatusesIdInfoEndpoint(
         Returns:
             OpportunityStatusInfo: The parsed response data.
         """
-        return self._parse_one(OpportunityStatusInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OpportunityStatusInfo, super()._make_request("GET", data=data, params=params).content)
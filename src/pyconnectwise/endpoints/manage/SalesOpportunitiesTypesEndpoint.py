@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SalesOpportunitiesTypesEndpoint(
         IPostable.__init__(self, OpportunityType)
         IPaginateable.__init__(self, OpportunityType)
 
-        self.count = self._register_child_endpoint(SalesOpportunitiesTypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SalesOpportunitiesTypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesOpportunitiesTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesOpportunitiesTypesIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class SalesOpportunitiesTypesEndpoint(
         Returns:
             list[OpportunityType]: The parsed response data.
         """
-        return self._parse_many(OpportunityType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> OpportunityType:
         """
@@ -87,4 +85,18 @@ class SalesOpportunitiesTypesEndpoint(
         Returns:
             OpportunityType: The parsed response data.
         """
-        return self._parse_one(OpportunityType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(OpportunityType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesTypesCountEndpoint:
+        """
+        The SalesOpportunitiesTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SalesOpportunitiesTypesInfoEndpoint:
+        """
+        The SalesOpportunitiesTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesTypesInfoEndpoint(self.client, parent_endpoint=self))
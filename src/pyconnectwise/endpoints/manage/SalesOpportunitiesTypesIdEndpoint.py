@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,11 +29,6 @@ class SalesOpportunitiesTypesIdEndpoint(
         IPuttable.__init__(self, OpportunityType)
         IPaginateable.__init__(self, OpportunityType)
 
-        self.info = self._register_child_endpoint(SalesOpportunitiesTypesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(
-            SalesOpportunitiesTypesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[OpportunityType]:
@@ -75,7 +71,7 @@ class SalesOpportunitiesTypesIdEndpoint(
         Returns:
             OpportunityType: The parsed response data.
         """
-        return self._parse_one(OpportunityType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OpportunityType, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> OpportunityType:
         """
@@ -87,7 +83,7 @@ class SalesOpportunitiesTypesIdEndpoint(
         Returns:
             OpportunityType: The parsed response data.
         """
-        return self._parse_one(OpportunityType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(OpportunityType, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> OpportunityType:
         """
@@ -99,4 +95,18 @@ class SalesOpportunitiesTypesIdEndpoint(
         Returns:
             OpportunityType: The parsed response data.
         """
-        return self._parse_one(OpportunityType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(OpportunityType, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SalesOpportunitiesTypesIdInfoEndpoint:
+        """
+        The SalesOpportunitiesTypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesTypesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> SalesOpportunitiesTypesIdUsagesEndpoint:
+        """
+        The SalesOpportunitiesTypesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesTypesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -54,4 +54,4 @@ class SalesOpportunitiesTypesIdInfoEndpoint(
         Returns:
             OpportunityTypeInfo: The parsed response data.
         """
-        return self._parse_one(OpportunityTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OpportunityTypeInfo, super()._make_request("GET", data=data, params=params).content)
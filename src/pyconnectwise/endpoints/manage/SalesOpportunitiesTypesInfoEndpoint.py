@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class SalesOpportunitiesTypesInfoEndpoint(
         IGettable.__init__(self, list[OpportunityTypeInfo])
         IPaginateable.__init__(self, OpportunityTypeInfo)
 
-        self.count = self._register_child_endpoint(
-            SalesOpportunitiesTypesInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[OpportunityTypeInfo]:
@@ -61,4 +58,13 @@ class SalesOpportunitiesTypesInfoEndpoint(
         Returns:
             list[OpportunityTypeInfo]: The parsed response data.
         """
-        return self._parse_many(OpportunityTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityTypeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesTypesInfoCountEndpoint:
+        """
+        The SalesOpportunitiesTypesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesTypesInfoCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SalesOrdersEndpoint(
         IPostable.__init__(self, Order)
         IPaginateable.__init__(self, Order)
 
-        self.count = self._register_child_endpoint(SalesOrdersCountEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(SalesOrdersStatusesEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesOrdersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesOrdersIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class SalesOrdersEndpoint(
         Returns:
             list[Order]: The parsed response data.
         """
-        return self._parse_many(Order, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Order, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Order:
         """
@@ -83,4 +81,18 @@ class SalesOrdersEndpoint(
         Returns:
             Order: The parsed response data.
         """
-        return self._parse_one(Order, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Order, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesOrdersCountEndpoint:
+        """
+        The SalesOrdersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOrdersCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> SalesOrdersStatusesEndpoint:
+        """
+        The SalesOrdersStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOrdersStatusesEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class SalesOrdersIdEndpoint(
         IPuttable.__init__(self, Order)
         IPaginateable.__init__(self, Order)
 
-        self.convert_to_service_ticket = self._register_child_endpoint(
-            SalesOrdersIdConverttoserviceticketEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Order]:
@@ -71,7 +68,7 @@ class SalesOrdersIdEndpoint(
         Returns:
             Order: The parsed response data.
         """
-        return self._parse_one(Order, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Order, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Order:
         """
@@ -83,7 +80,7 @@ class SalesOrdersIdEndpoint(
         Returns:
             Order: The parsed response data.
         """
-        return self._parse_one(Order, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Order, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Order:
         """
@@ -95,4 +92,13 @@ class SalesOrdersIdEndpoint(
         Returns:
             Order: The parsed response data.
         """
-        return self._parse_one(Order, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Order, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def convert_to_service_ticket(self) -> SalesOrdersIdConverttoserviceticketEndpoint:
+        """
+        The SalesOrdersIdConverttoserviceticketEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOrdersIdConverttoserviceticketEndpoint(self.client, parent_endpoint=self)
+        )
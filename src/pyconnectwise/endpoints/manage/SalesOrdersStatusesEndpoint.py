@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SalesOrdersStatusesEndpoint(
         IPostable.__init__(self, list[OrderStatus])
         IPaginateable.__init__(self, OrderStatus)
 
-        self.count = self._register_child_endpoint(SalesOrdersStatusesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SalesOrdersStatusesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesOrdersStatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesOrdersStatusesIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class SalesOrdersStatusesEndpoint(
         Returns:
             list[OrderStatus]: The parsed response data.
         """
-        return self._parse_many(OrderStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OrderStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[OrderStatus]:
         """
@@ -85,4 +83,18 @@ class SalesOrdersStatusesEndpoint(
         Returns:
             list[OrderStatus]: The parsed response data.
         """
-        return self._parse_many(OrderStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_many(OrderStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesOrdersStatusesCountEndpoint:
+        """
+        The SalesOrdersStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOrdersStatusesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SalesOrdersStatusesInfoEndpoint:
+        """
+        The SalesOrdersStatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOrdersStatusesInfoEndpoint(self.client, parent_endpoint=self))
@@ -68,7 +68,7 @@ class SalesOrdersStatusesIdEmailtemplatesIdEndpoint(
         Returns:
             OrderStatusEmailTemplate: The parsed response data.
         """
-        return self._parse_one(OrderStatusEmailTemplate, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OrderStatusEmailTemplate, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -83,7 +83,7 @@ class SalesOrdersStatusesIdEmailtemplatesIdEndpoint(
             OrderStatusEmailTemplate: The parsed response data.
         """
         return self._parse_one(
-            OrderStatusEmailTemplate, super()._make_request("PATCH", data=data, params=params).json()
+            OrderStatusEmailTemplate, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -98,4 +98,4 @@ class SalesOrdersStatusesIdEmailtemplatesIdEndpoint(
         Returns:
             OrderStatusEmailTemplate: The parsed response data.
         """
-        return self._parse_one(OrderStatusEmailTemplate, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(OrderStatusEmailTemplate, super()._make_request("PUT", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -32,15 +33,6 @@ class SalesOrdersStatusesIdEndpoint(
         IPuttable.__init__(self, OrderStatus)
         IPaginateable.__init__(self, OrderStatus)
 
-        self.emailtemplates = self._register_child_endpoint(
-            SalesOrdersStatusesIdEmailtemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(SalesOrdersStatusesIdInfoEndpoint(client, parent_endpoint=self))
-        self.notifications = self._register_child_endpoint(
-            SalesOrdersStatusesIdNotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(SalesOrdersStatusesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[OrderStatus]:
@@ -83,7 +75,7 @@ class SalesOrdersStatusesIdEndpoint(
         Returns:
             OrderStatus: The parsed response data.
         """
-        return self._parse_one(OrderStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OrderStatus, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> OrderStatus:
         """
@@ -95,7 +87,7 @@ class SalesOrdersStatusesIdEndpoint(
         Returns:
             OrderStatus: The parsed response data.
         """
-        return self._parse_one(OrderStatus, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(OrderStatus, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> OrderStatus:
         """
@@ -107,4 +99,36 @@ class SalesOrdersStatusesIdEndpoint(
         Returns:
             OrderStatus: The parsed response data.
         """
-        return self._parse_one(OrderStatus, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(OrderStatus, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def emailtemplates(self) -> SalesOrdersStatusesIdEmailtemplatesEndpoint:
+        """
+        The SalesOrdersStatusesIdEmailtemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOrdersStatusesIdEmailtemplatesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> SalesOrdersStatusesIdInfoEndpoint:
+        """
+        The SalesOrdersStatusesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOrdersStatusesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notifications(self) -> SalesOrdersStatusesIdNotificationsEndpoint:
+        """
+        The SalesOrdersStatusesIdNotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOrdersStatusesIdNotificationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> SalesOrdersStatusesIdUsagesEndpoint:
+        """
+        The SalesOrdersStatusesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOrdersStatusesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class SalesOrdersStatusesIdInfoEndpoint(
         Returns:
             OrderStatusInfo: The parsed response data.
         """
-        return self._parse_one(OrderStatusInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OrderStatusInfo, super()._make_request("GET", data=data, params=params).content)
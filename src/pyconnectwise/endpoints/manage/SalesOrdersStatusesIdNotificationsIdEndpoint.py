@@ -68,7 +68,7 @@ class SalesOrdersStatusesIdNotificationsIdEndpoint(
         Returns:
             OrderStatusNotification: The parsed response data.
         """
-        return self._parse_one(OrderStatusNotification, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OrderStatusNotification, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -82,7 +82,9 @@ class SalesOrdersStatusesIdNotificationsIdEndpoint(
         Returns:
             OrderStatusNotification: The parsed response data.
         """
-        return self._parse_one(OrderStatusNotification, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(
+            OrderStatusNotification, super()._make_request("PATCH", data=data, params=params).content
+        )
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -96,4 +98,4 @@ class SalesOrdersStatusesIdNotificationsIdEndpoint(
         Returns:
             OrderStatusNotification: The parsed response data.
         """
-        return self._parse_one(OrderStatusNotification, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(OrderStatusNotification, super()._make_request("PUT", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SalesProbabilitiesEndpoint(
         IPostable.__init__(self, SalesProbability)
         IPaginateable.__init__(self, SalesProbability)
 
-        self.count = self._register_child_endpoint(SalesProbabilitiesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SalesProbabilitiesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesProbabilitiesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesProbabilitiesIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class SalesProbabilitiesEndpoint(
         Returns:
             list[SalesProbability]: The parsed response data.
         """
-        return self._parse_many(SalesProbability, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SalesProbability, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SalesProbability:
         """
@@ -87,4 +85,18 @@ class SalesProbabilitiesEndpoint(
         Returns:
             SalesProbability: The parsed response data.
         """
-        return self._parse_one(SalesProbability, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SalesProbability, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesProbabilitiesCountEndpoint:
+        """
+        The SalesProbabilitiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesProbabilitiesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SalesProbabilitiesInfoEndpoint:
+        """
+        The SalesProbabilitiesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesProbabilitiesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class SalesProbabilitiesIdEndpoint(
         IPuttable.__init__(self, SalesProbability)
         IPaginateable.__init__(self, SalesProbability)
 
-        self.info = self._register_child_endpoint(SalesProbabilitiesIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[SalesProbability]:
@@ -69,7 +68,7 @@ class SalesProbabilitiesIdEndpoint(
         Returns:
             SalesProbability: The parsed response data.
         """
-        return self._parse_one(SalesProbability, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SalesProbability, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> SalesProbability:
         """
@@ -81,7 +80,7 @@ class SalesProbabilitiesIdEndpoint(
         Returns:
             SalesProbability: The parsed response data.
         """
-        return self._parse_one(SalesProbability, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(SalesProbability, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SalesProbability:
         """
@@ -93,4 +92,11 @@ class SalesProbabilitiesIdEndpoint(
         Returns:
             SalesProbability: The parsed response data.
         """
-        return self._parse_one(SalesProbability, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(SalesProbability, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SalesProbabilitiesIdInfoEndpoint:
+        """
+        The SalesProbabilitiesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesProbabilitiesIdInfoEndpoint(self.client, parent_endpoint=self))
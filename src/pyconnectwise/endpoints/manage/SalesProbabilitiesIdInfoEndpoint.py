@@ -54,4 +54,4 @@ class SalesProbabilitiesIdInfoEndpoint(
         Returns:
             SalesProbabilityInfo: The parsed response data.
         """
-        return self._parse_one(SalesProbabilityInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SalesProbabilityInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SalesQuotasEndpoint(
         IPostable.__init__(self, SalesQuota)
         IPaginateable.__init__(self, SalesQuota)
 
-        self.count = self._register_child_endpoint(SalesQuotasCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesQuotasIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesQuotasIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class SalesQuotasEndpoint(
         Returns:
             list[SalesQuota]: The parsed response data.
         """
-        return self._parse_many(SalesQuota, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SalesQuota, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SalesQuota:
         """
@@ -81,4 +80,11 @@ class SalesQuotasEndpoint(
         Returns:
             SalesQuota: The parsed response data.
         """
-        return self._parse_one(SalesQuota, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SalesQuota, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesQuotasCountEndpoint:
+        """
+        The SalesQuotasCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesQuotasCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SalesRolesEndpoint(
         IPostable.__init__(self, Role)
         IPaginateable.__init__(self, Role)
 
-        self.count = self._register_child_endpoint(SalesRolesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesRolesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesRolesIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class SalesRolesEndpoint(
         Returns:
             list[Role]: The parsed response data.
         """
-        return self._parse_many(Role, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Role, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Role:
         """
@@ -81,4 +80,11 @@ class SalesRolesEndpoint(
         Returns:
             Role: The parsed response data.
         """
-        return self._parse_one(Role, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Role, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesRolesCountEndpoint:
+        """
+        The SalesRolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesRolesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SalesSalesteamsEndpoint(
         IPostable.__init__(self, SalesTeam)
         IPaginateable.__init__(self, SalesTeam)
 
-        self.count = self._register_child_endpoint(SalesSalesteamsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesSalesteamsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesSalesteamsIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class SalesSalesteamsEndpoint(
         Returns:
             list[SalesTeam]: The parsed response data.
         """
-        return self._parse_many(SalesTeam, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SalesTeam, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SalesTeam:
         """
@@ -81,4 +80,11 @@ class SalesSalesteamsEndpoint(
         Returns:
             SalesTeam: The parsed response data.
         """
-        return self._parse_one(SalesTeam, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SalesTeam, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesSalesteamsCountEndpoint:
+        """
+        The SalesSalesteamsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesSalesteamsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SalesSalesteamsIdMembersEndpoint(
         IPostable.__init__(self, SalesTeamMember)
         IPaginateable.__init__(self, SalesTeamMember)
 
-        self.count = self._register_child_endpoint(SalesSalesteamsIdMembersCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesSalesteamsIdMembersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesSalesteamsIdMembersIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SalesSalesteamsIdMembersEndpoint(
         Returns:
             list[SalesTeamMember]: The parsed response data.
         """
-        return self._parse_many(SalesTeamMember, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SalesTeamMember, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SalesTeamMember:
         """
@@ -85,4 +84,11 @@ class SalesSalesteamsIdMembersEndpoint(
         Returns:
             SalesTeamMember: The parsed response data.
         """
-        return self._parse_one(SalesTeamMember, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SalesTeamMember, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesSalesteamsIdMembersCountEndpoint:
+        """
+        The SalesSalesteamsIdMembersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesSalesteamsIdMembersCountEndpoint(self.client, parent_endpoint=self))
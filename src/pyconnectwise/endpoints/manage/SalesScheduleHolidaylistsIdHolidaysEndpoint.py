@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -13,6 +14,11 @@ class SalesScheduleHolidaylistsIdHolidaysEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "holidays", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(
-            SalesScheduleHolidaylistsIdHolidaysInfoEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def info(self) -> SalesScheduleHolidaylistsIdHolidaysInfoEndpoint:
+        """
+        The SalesScheduleHolidaylistsIdHolidaysInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesScheduleHolidaylistsIdHolidaysInfoEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -13,6 +14,11 @@ class SalesScheduleHolidaylistsIdHolidaysInfoEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "info", parent_endpoint=parent_endpoint)
 
-        self.count = self._register_child_endpoint(
-            SalesScheduleHolidaylistsIdHolidaysInfoCountEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def count(self) -> SalesScheduleHolidaylistsIdHolidaysInfoCountEndpoint:
+        """
+        The SalesScheduleHolidaylistsIdHolidaysInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesScheduleHolidaylistsIdHolidaysInfoCountEndpoint(self.client, parent_endpoint=self)
         )
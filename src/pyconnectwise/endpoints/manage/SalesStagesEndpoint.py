@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SalesStagesEndpoint(
         IPostable.__init__(self, OpportunityStage)
         IPaginateable.__init__(self, OpportunityStage)
 
-        self.count = self._register_child_endpoint(SalesStagesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SalesStagesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SalesStagesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SalesStagesIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class SalesStagesEndpoint(
         Returns:
             list[OpportunityStage]: The parsed response data.
         """
-        return self._parse_many(OpportunityStage, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityStage, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> OpportunityStage:
         """
@@ -87,4 +85,18 @@ class SalesStagesEndpoint(
         Returns:
             OpportunityStage: The parsed response data.
         """
-        return self._parse_one(OpportunityStage, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(OpportunityStage, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesStagesCountEndpoint:
+        """
+        The SalesStagesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesStagesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SalesStagesInfoEndpoint:
+        """
+        The SalesStagesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesStagesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class SalesStagesIdEndpoint(
         IPuttable.__init__(self, OpportunityStage)
         IPaginateable.__init__(self, OpportunityStage)
 
-        self.info = self._register_child_endpoint(SalesStagesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(SalesStagesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[OpportunityStage]:
@@ -71,7 +69,7 @@ class SalesStagesIdEndpoint(
         Returns:
             OpportunityStage: The parsed response data.
         """
-        return self._parse_one(OpportunityStage, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OpportunityStage, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> OpportunityStage:
         """
@@ -83,7 +81,7 @@ class SalesStagesIdEndpoint(
         Returns:
             OpportunityStage: The parsed response data.
         """
-        return self._parse_one(OpportunityStage, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(OpportunityStage, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> OpportunityStage:
         """
@@ -95,4 +93,18 @@ class SalesStagesIdEndpoint(
         Returns:
             OpportunityStage: The parsed response data.
         """
-        return self._parse_one(OpportunityStage, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(OpportunityStage, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SalesStagesIdInfoEndpoint:
+        """
+        The SalesStagesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesStagesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> SalesStagesIdUsagesEndpoint:
+        """
+        The SalesStagesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesStagesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -54,4 +54,4 @@ class SalesStagesIdInfoEndpoint(
         Returns:
             OpportunityStageInfo: The parsed response data.
         """
-        return self._parse_one(OpportunityStageInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(OpportunityStageInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class SalesStagesInfoEndpoint(
         IGettable.__init__(self, list[OpportunityStageInfo])
         IPaginateable.__init__(self, OpportunityStageInfo)
 
-        self.count = self._register_child_endpoint(SalesStagesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[OpportunityStageInfo]:
@@ -57,4 +56,11 @@ class SalesStagesInfoEndpoint(
         Returns:
             list[OpportunityStageInfo]: The parsed response data.
         """
-        return self._parse_many(OpportunityStageInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OpportunityStageInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SalesStagesInfoCountEndpoint:
+        """
+        The SalesStagesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesStagesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -50,4 +50,4 @@ class ScheduleCalendarsCountEndpoint(
         Returns:
             Calendar: The parsed response data.
         """
-        return self._parse_one(Calendar, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Calendar, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ScheduleCalendarsEndpoint(
         IPostable.__init__(self, Calendar)
         IPaginateable.__init__(self, Calendar)
 
-        self.count = self._register_child_endpoint(ScheduleCalendarsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ScheduleCalendarsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ScheduleCalendarsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ScheduleCalendarsIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class ScheduleCalendarsEndpoint(
         Returns:
             list[Calendar]: The parsed response data.
         """
-        return self._parse_many(Calendar, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Calendar, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Calendar:
         """
@@ -83,4 +81,18 @@ class ScheduleCalendarsEndpoint(
         Returns:
             Calendar: The parsed response data.
         """
-        return self._parse_one(Calendar, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Calendar, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ScheduleCalendarsCountEndpoint:
+        """
+        The ScheduleCalendarsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleCalendarsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ScheduleCalendarsInfoEndpoint:
+        """
+        The ScheduleCalendarsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleCalendarsInfoEndpoint(self.client, parent_endpoint=self))
@@ -24,4 +24,4 @@ class ScheduleCalendarsIdCopyEndpoint(ConnectWiseEndpoint, IPostable[Calendar, C
         Returns:
             Calendar: The parsed response data.
         """
-        return self._parse_one(Calendar, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Calendar, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class ScheduleCalendarsIdEndpoint(
         IPuttable.__init__(self, Calendar)
         IPaginateable.__init__(self, Calendar)
 
-        self.copy = self._register_child_endpoint(ScheduleCalendarsIdCopyEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ScheduleCalendarsIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(ScheduleCalendarsIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Calendar]:
@@ -71,7 +68,7 @@ class ScheduleCalendarsIdEndpoint(
         Returns:
             Calendar: The parsed response data.
         """
-        return self._parse_one(Calendar, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Calendar, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Calendar:
         """
@@ -83,7 +80,7 @@ class ScheduleCalendarsIdEndpoint(
         Returns:
             Calendar: The parsed response data.
         """
-        return self._parse_one(Calendar, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Calendar, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Calendar:
         """
@@ -95,4 +92,25 @@ class ScheduleCalendarsIdEndpoint(
         Returns:
             Calendar: The parsed response data.
         """
-        return self._parse_one(Calendar, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Calendar, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> ScheduleCalendarsIdCopyEndpoint:
+        """
+        The ScheduleCalendarsIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleCalendarsIdCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ScheduleCalendarsIdInfoEndpoint:
+        """
+        The ScheduleCalendarsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleCalendarsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ScheduleCalendarsIdUsagesEndpoint:
+        """
+        The ScheduleCalendarsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleCalendarsIdUsagesEndpoint(self.client, parent_endpoint=self))
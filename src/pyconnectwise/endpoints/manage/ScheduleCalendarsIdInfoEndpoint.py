@@ -52,4 +52,4 @@ class ScheduleCalendarsIdInfoEndpoint(
         Returns:
             CalendarInfo: The parsed response data.
         """
-        return self._parse_one(CalendarInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CalendarInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class ScheduleCalendarsInfoEndpoint(
         IGettable.__init__(self, list[CalendarInfo])
         IPaginateable.__init__(self, CalendarInfo)
 
-        self.count = self._register_child_endpoint(ScheduleCalendarsInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[CalendarInfo]:
@@ -55,4 +54,11 @@ class ScheduleCalendarsInfoEndpoint(
         Returns:
             list[CalendarInfo]: The parsed response data.
         """
-        return self._parse_many(CalendarInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CalendarInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ScheduleCalendarsInfoCountEndpoint:
+        """
+        The ScheduleCalendarsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleCalendarsInfoCountEndpoint(self.client, parent_endpoint=self))
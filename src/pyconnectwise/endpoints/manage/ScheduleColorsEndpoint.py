@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,9 +24,6 @@ class ScheduleColorsEndpoint(
         IGettable.__init__(self, list[ScheduleColor])
         IPaginateable.__init__(self, ScheduleColor)
 
-        self.count = self._register_child_endpoint(ScheduleColorsCountEndpoint(client, parent_endpoint=self))
-        self.reset = self._register_child_endpoint(ScheduleColorsResetEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ScheduleColorsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ScheduleColorsIdEndpoint object to move down the chain.
@@ -73,4 +71,18 @@ class ScheduleColorsEndpoint(
         Returns:
             list[ScheduleColor]: The parsed response data.
         """
-        return self._parse_many(ScheduleColor, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ScheduleColor, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ScheduleColorsCountEndpoint:
+        """
+        The ScheduleColorsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleColorsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reset(self) -> ScheduleColorsResetEndpoint:
+        """
+        The ScheduleColorsResetEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleColorsResetEndpoint(self.client, parent_endpoint=self))
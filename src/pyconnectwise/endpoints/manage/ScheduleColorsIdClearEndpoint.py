@@ -24,4 +24,4 @@ class ScheduleColorsIdClearEndpoint(ConnectWiseEndpoint, IPostable[ScheduleColor
         Returns:
             ScheduleColor: The parsed response data.
         """
-        return self._parse_one(ScheduleColor, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ScheduleColor, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class ScheduleColorsIdEndpoint(
         IPuttable.__init__(self, ScheduleColor)
         IPaginateable.__init__(self, ScheduleColor)
 
-        self.clear = self._register_child_endpoint(ScheduleColorsIdClearEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ScheduleColor]:
@@ -59,7 +58,7 @@ class ScheduleColorsIdEndpoint(
         Returns:
             ScheduleColor: The parsed response data.
         """
-        return self._parse_one(ScheduleColor, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ScheduleColor, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ScheduleColor:
         """
@@ -71,7 +70,7 @@ class ScheduleColorsIdEndpoint(
         Returns:
             ScheduleColor: The parsed response data.
         """
-        return self._parse_one(ScheduleColor, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ScheduleColor, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ScheduleColor:
         """
@@ -83,4 +82,11 @@ class ScheduleColorsIdEndpoint(
         Returns:
             ScheduleColor: The parsed response data.
         """
-        return self._parse_one(ScheduleColor, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ScheduleColor, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def clear(self) -> ScheduleColorsIdClearEndpoint:
+        """
+        The ScheduleColorsIdClearEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleColorsIdClearEndpoint(self.client, parent_endpoint=self))
@@ -26,4 +26,4 @@ class ScheduleColorsResetEndpoint(ConnectWiseEndpoint, IPostable[list[ScheduleCo
         Returns:
             list[ScheduleColor]: The parsed response data.
         """
-        return self._parse_many(ScheduleColor, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_many(ScheduleColor, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ScheduleDetailsEndpoint(
         IGettable.__init__(self, list[ScheduleEntryDetail])
         IPaginateable.__init__(self, ScheduleEntryDetail)
 
-        self.count = self._register_child_endpoint(ScheduleDetailsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ScheduleDetailsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ScheduleDetailsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class ScheduleDetailsEndpoint(
         Returns:
             list[ScheduleEntryDetail]: The parsed response data.
         """
-        return self._parse_many(ScheduleEntryDetail, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ScheduleEntryDetail, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ScheduleDetailsCountEndpoint:
+        """
+        The ScheduleDetailsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleDetailsCountEndpoint(self.client, parent_endpoint=self))
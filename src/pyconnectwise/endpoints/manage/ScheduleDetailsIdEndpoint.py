@@ -54,4 +54,4 @@ class ScheduleDetailsIdEndpoint(
         Returns:
             ScheduleEntryDetail: The parsed response data.
         """
-        return self._parse_one(ScheduleEntryDetail, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ScheduleEntryDetail, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -19,15 +20,72 @@ class ScheduleEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "schedule", parent_endpoint=parent_endpoint)
 
-        self.calendars = self._register_child_endpoint(ScheduleCalendarsEndpoint(client, parent_endpoint=self))
-        self.colors = self._register_child_endpoint(ScheduleColorsEndpoint(client, parent_endpoint=self))
-        self.details = self._register_child_endpoint(ScheduleDetailsEndpoint(client, parent_endpoint=self))
-        self.entries = self._register_child_endpoint(ScheduleEntriesEndpoint(client, parent_endpoint=self))
-        self.holiday_lists = self._register_child_endpoint(ScheduleHolidaylistsEndpoint(client, parent_endpoint=self))
-        self.holidaylists = self._register_child_endpoint(ScheduleHolidaylistsEndpoint(client, parent_endpoint=self))
-        self.portalcalendars = self._register_child_endpoint(
-            SchedulePortalcalendarsEndpoint(client, parent_endpoint=self)
-        )
-        self.reminder_times = self._register_child_endpoint(ScheduleRemindertimesEndpoint(client, parent_endpoint=self))
-        self.statuses = self._register_child_endpoint(ScheduleStatusesEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(ScheduleTypesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def calendars(self) -> ScheduleCalendarsEndpoint:
+        """
+        The ScheduleCalendarsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleCalendarsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def colors(self) -> ScheduleColorsEndpoint:
+        """
+        The ScheduleColorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleColorsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def details(self) -> ScheduleDetailsEndpoint:
+        """
+        The ScheduleDetailsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleDetailsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def entries(self) -> ScheduleEntriesEndpoint:
+        """
+        The ScheduleEntriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleEntriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def holiday_lists(self) -> ScheduleHolidaylistsEndpoint:
+        """
+        The ScheduleHolidaylistsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleHolidaylistsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def holidaylists(self) -> ScheduleHolidaylistsEndpoint:
+        """
+        The ScheduleHolidaylistsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleHolidaylistsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def portalcalendars(self) -> SchedulePortalcalendarsEndpoint:
+        """
+        The SchedulePortalcalendarsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SchedulePortalcalendarsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reminder_times(self) -> ScheduleRemindertimesEndpoint:
+        """
+        The ScheduleRemindertimesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleRemindertimesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> ScheduleStatusesEndpoint:
+        """
+        The ScheduleStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> ScheduleTypesEndpoint:
+        """
+        The ScheduleTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleTypesEndpoint(self.client, parent_endpoint=self))
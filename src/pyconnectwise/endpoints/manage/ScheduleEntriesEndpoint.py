@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ScheduleEntriesEndpoint(
         IPostable.__init__(self, ScheduleEntry)
         IPaginateable.__init__(self, ScheduleEntry)
 
-        self.count = self._register_child_endpoint(ScheduleEntriesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ScheduleEntriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ScheduleEntriesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class ScheduleEntriesEndpoint(
         Returns:
             list[ScheduleEntry]: The parsed response data.
         """
-        return self._parse_many(ScheduleEntry, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ScheduleEntry, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ScheduleEntry:
         """
@@ -85,4 +84,11 @@ class ScheduleEntriesEndpoint(
         Returns:
             ScheduleEntry: The parsed response data.
         """
-        return self._parse_one(ScheduleEntry, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ScheduleEntry, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ScheduleEntriesCountEndpoint:
+        """
+        The ScheduleEntriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleEntriesCountEndpoint(self.client, parent_endpoint=self))
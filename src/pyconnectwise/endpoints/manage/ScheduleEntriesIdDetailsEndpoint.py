@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ScheduleEntriesIdDetailsEndpoint(
         IGettable.__init__(self, list[ScheduleDetail])
         IPaginateable.__init__(self, ScheduleDetail)
 
-        self.count = self._register_child_endpoint(ScheduleEntriesIdDetailsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ScheduleEntriesIdDetailsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ScheduleEntriesIdDetailsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class ScheduleEntriesIdDetailsEndpoint(
         Returns:
             list[ScheduleDetail]: The parsed response data.
         """
-        return self._parse_many(ScheduleDetail, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ScheduleDetail, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ScheduleEntriesIdDetailsCountEndpoint:
+        """
+        The ScheduleEntriesIdDetailsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleEntriesIdDetailsCountEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ScheduleEntriesIdDetailsIdEndpoint(
         Returns:
             ScheduleDetail: The parsed response data.
         """
-        return self._parse_one(ScheduleDetail, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ScheduleDetail, super()._make_request("GET", data=data, params=params).content)
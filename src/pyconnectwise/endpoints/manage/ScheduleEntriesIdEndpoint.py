@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class ScheduleEntriesIdEndpoint(
         IPuttable.__init__(self, ScheduleEntry)
         IPaginateable.__init__(self, ScheduleEntry)
 
-        self.details = self._register_child_endpoint(ScheduleEntriesIdDetailsEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ScheduleEntry]:
@@ -69,7 +68,7 @@ class ScheduleEntriesIdEndpoint(
         Returns:
             ScheduleEntry: The parsed response data.
         """
-        return self._parse_one(ScheduleEntry, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ScheduleEntry, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ScheduleEntry:
         """
@@ -81,7 +80,7 @@ class ScheduleEntriesIdEndpoint(
         Returns:
             ScheduleEntry: The parsed response data.
         """
-        return self._parse_one(ScheduleEntry, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ScheduleEntry, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ScheduleEntry:
         """
@@ -93,4 +92,11 @@ class ScheduleEntriesIdEndpoint(
         Returns:
             ScheduleEntry: The parsed response data.
         """
-        return self._parse_one(ScheduleEntry, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ScheduleEntry, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def details(self) -> ScheduleEntriesIdDetailsEndpoint:
+        """
+        The ScheduleEntriesIdDetailsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleEntriesIdDetailsEndpoint(self.client, parent_endpoint=self))
@@ -24,4 +24,4 @@ class ScheduleHolidaylistsCopyEndpoint(ConnectWiseEndpoint, IPostable[HolidayLis
         Returns:
             HolidayList: The parsed response data.
         """
-        return self._parse_one(HolidayList, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(HolidayList, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -12,8 +13,6 @@ class ScheduleHolidaylistsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "holidaylists", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(ScheduleHolidaylistsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ScheduleHolidaylistsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ScheduleHolidaylistsIdEndpoint object to move down the chain.
@@ -26,3 +25,10 @@ class ScheduleHolidaylistsEndpoint(ConnectWiseEndpoint):
         child = ScheduleHolidaylistsIdEndpoint(self.client, parent_endpoint=self)
         child._id = _id
         return child
+
+    @cached_property
+    def info(self) -> ScheduleHolidaylistsInfoEndpoint:
+        """
+        The ScheduleHolidaylistsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleHolidaylistsInfoEndpoint(self.client, parent_endpoint=self))
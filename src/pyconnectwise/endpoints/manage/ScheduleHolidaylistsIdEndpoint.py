@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -12,7 +13,16 @@ class ScheduleHolidaylistsIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.holidays = self._register_child_endpoint(
-            ScheduleHolidaylistsIdHolidaysEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(ScheduleHolidaylistsIdInfoEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def holidays(self) -> ScheduleHolidaylistsIdHolidaysEndpoint:
+        """
+        The ScheduleHolidaylistsIdHolidaysEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleHolidaylistsIdHolidaysEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ScheduleHolidaylistsIdInfoEndpoint:
+        """
+        The ScheduleHolidaylistsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleHolidaylistsIdInfoEndpoint(self.client, parent_endpoint=self))
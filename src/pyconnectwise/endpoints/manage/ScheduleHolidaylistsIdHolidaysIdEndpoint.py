@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -13,6 +14,11 @@ class ScheduleHolidaylistsIdHolidaysIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(
-            ScheduleHolidaylistsIdHolidaysIdInfoEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def info(self) -> ScheduleHolidaylistsIdHolidaysIdInfoEndpoint:
+        """
+        The ScheduleHolidaylistsIdHolidaysIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ScheduleHolidaylistsIdHolidaysIdInfoEndpoint(self.client, parent_endpoint=self)
         )
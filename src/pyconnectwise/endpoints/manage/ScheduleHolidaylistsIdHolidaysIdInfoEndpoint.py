@@ -52,4 +52,4 @@ class ScheduleHolidaylistsIdHolidaysIdInfoEndpoint(
         Returns:
             HolidayInfo: The parsed response data.
         """
-        return self._parse_one(HolidayInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(HolidayInfo, super()._make_request("GET", data=data, params=params).content)
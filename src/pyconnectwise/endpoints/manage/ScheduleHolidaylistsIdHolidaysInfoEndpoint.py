@@ -52,4 +52,4 @@ class ScheduleHolidaylistsIdHolidaysInfoEndpoint(
         Returns:
             list[HolidayInfo]: The parsed response data.
         """
-        return self._parse_many(HolidayInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(HolidayInfo, super()._make_request("GET", data=data, params=params).content)
@@ -52,4 +52,4 @@ class ScheduleHolidaylistsIdInfoEndpoint(
         Returns:
             HolidayListInfo: The parsed response data.
         """
-        return self._parse_one(HolidayListInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(HolidayListInfo, super()._make_request("GET", data=data, params=params).content)
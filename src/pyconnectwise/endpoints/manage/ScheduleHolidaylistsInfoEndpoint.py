@@ -54,4 +54,4 @@ class ScheduleHolidaylistsInfoEndpoint(
         Returns:
             list[HolidayListInfo]: The parsed response data.
         """
-        return self._parse_many(HolidayListInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(HolidayListInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SchedulePortalcalendarsEndpoint(
         IGettable.__init__(self, list[PortalCalendar])
         IPaginateable.__init__(self, PortalCalendar)
 
-        self.count = self._register_child_endpoint(SchedulePortalcalendarsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SchedulePortalcalendarsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SchedulePortalcalendarsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class SchedulePortalcalendarsEndpoint(
         Returns:
             list[PortalCalendar]: The parsed response data.
         """
-        return self._parse_many(PortalCalendar, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PortalCalendar, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SchedulePortalcalendarsCountEndpoint:
+        """
+        The SchedulePortalcalendarsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SchedulePortalcalendarsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ScheduleRemindertimesEndpoint(
         IGettable.__init__(self, list[ScheduleReminderTime])
         IPaginateable.__init__(self, ScheduleReminderTime)
 
-        self.count = self._register_child_endpoint(ScheduleRemindertimesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ScheduleRemindertimesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ScheduleRemindertimesIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class ScheduleRemindertimesEndpoint(
         Returns:
             list[ScheduleReminderTime]: The parsed response data.
         """
-        return self._parse_many(ScheduleReminderTime, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ScheduleReminderTime, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ScheduleRemindertimesCountEndpoint:
+        """
+        The ScheduleRemindertimesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleRemindertimesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ScheduleStatusesEndpoint(
         IPostable.__init__(self, ScheduleStatus)
         IPaginateable.__init__(self, ScheduleStatus)
 
-        self.count = self._register_child_endpoint(ScheduleStatusesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ScheduleStatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ScheduleStatusesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class ScheduleStatusesEndpoint(
         Returns:
             list[ScheduleStatus]: The parsed response data.
         """
-        return self._parse_many(ScheduleStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ScheduleStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ScheduleStatus:
         """
@@ -85,4 +84,11 @@ class ScheduleStatusesEndpoint(
         Returns:
             ScheduleStatus: The parsed response data.
         """
-        return self._parse_one(ScheduleStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ScheduleStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ScheduleStatusesCountEndpoint:
+        """
+        The ScheduleStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleStatusesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ScheduleTypesEndpoint(
         IPostable.__init__(self, ScheduleType)
         IPaginateable.__init__(self, ScheduleType)
 
-        self.count = self._register_child_endpoint(ScheduleTypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ScheduleTypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ScheduleTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ScheduleTypesIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class ScheduleTypesEndpoint(
         Returns:
             list[ScheduleType]: The parsed response data.
         """
-        return self._parse_many(ScheduleType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ScheduleType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ScheduleType:
         """
@@ -85,4 +83,18 @@ class ScheduleTypesEndpoint(
         Returns:
             ScheduleType: The parsed response data.
         """
-        return self._parse_one(ScheduleType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ScheduleType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ScheduleTypesCountEndpoint:
+        """
+        The ScheduleTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ScheduleTypesInfoEndpoint:
+        """
+        The ScheduleTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleTypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ScheduleTypesIdInfoEndpoint(
         Returns:
             ScheduleTypeInfo: The parsed response data.
         """
-        return self._parse_one(ScheduleTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ScheduleTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -24,4 +24,4 @@ class ServiceBoardsCopyEndpoint(ConnectWiseEndpoint, IPostable[Board, ConnectWis
         Returns:
             Board: The parsed response data.
         """
-        return self._parse_one(Board, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Board, super()._make_request("POST", data=data, params=params).content)
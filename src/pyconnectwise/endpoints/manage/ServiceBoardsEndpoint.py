@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ServiceBoardsEndpoint(
         IPostable.__init__(self, Board)
         IPaginateable.__init__(self, Board)
 
-        self.copy = self._register_child_endpoint(ServiceBoardsCopyEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(ServiceBoardsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceBoardsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceBoardsIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class ServiceBoardsEndpoint(
         Returns:
             list[Board]: The parsed response data.
         """
-        return self._parse_many(Board, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Board, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Board:
         """
@@ -83,4 +81,18 @@ class ServiceBoardsEndpoint(
         Returns:
             Board: The parsed response data.
         """
-        return self._parse_one(Board, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Board, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> ServiceBoardsCopyEndpoint:
+        """
+        The ServiceBoardsCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def count(self) -> ServiceBoardsCountEndpoint:
+        """
+        The ServiceBoardsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsCountEndpoint(self.client, parent_endpoint=self))
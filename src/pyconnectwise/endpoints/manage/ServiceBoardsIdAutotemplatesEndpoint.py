@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class ServiceBoardsIdAutotemplatesEndpoint(
         IPostable.__init__(self, BoardAutoTemplate)
         IPaginateable.__init__(self, BoardAutoTemplate)
 
-        self.count = self._register_child_endpoint(
-            ServiceBoardsIdAutotemplatesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ServiceBoardsIdAutotemplatesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceBoardsIdAutotemplatesIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class ServiceBoardsIdAutotemplatesEndpoint(
         Returns:
             list[BoardAutoTemplate]: The parsed response data.
         """
-        return self._parse_many(BoardAutoTemplate, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardAutoTemplate, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardAutoTemplate:
         """
@@ -89,4 +86,13 @@ class ServiceBoardsIdAutotemplatesEndpoint(
         Returns:
             BoardAutoTemplate: The parsed response data.
         """
-        return self._parse_one(BoardAutoTemplate, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BoardAutoTemplate, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdAutotemplatesCountEndpoint:
+        """
+        The ServiceBoardsIdAutotemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdAutotemplatesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -39,28 +40,6 @@ class ServiceBoardsIdEndpoint(
         IPuttable.__init__(self, Board)
         IPaginateable.__init__(self, Board)
 
-        self.auto_assign_resources = self._register_child_endpoint(
-            ServiceBoardsIdAutoassignresourcesEndpoint(client, parent_endpoint=self)
-        )
-        self.auto_templates = self._register_child_endpoint(
-            ServiceBoardsIdAutotemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.excluded_members = self._register_child_endpoint(
-            ServiceBoardsIdExcludedmembersEndpoint(client, parent_endpoint=self)
-        )
-        self.items = self._register_child_endpoint(ServiceBoardsIdItemsEndpoint(client, parent_endpoint=self))
-        self.notifications = self._register_child_endpoint(
-            ServiceBoardsIdNotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.statuses = self._register_child_endpoint(ServiceBoardsIdStatusesEndpoint(client, parent_endpoint=self))
-        self.subtypes = self._register_child_endpoint(ServiceBoardsIdSubtypesEndpoint(client, parent_endpoint=self))
-        self.teams = self._register_child_endpoint(ServiceBoardsIdTeamsEndpoint(client, parent_endpoint=self))
-        self.type_sub_type_item_associations = self._register_child_endpoint(
-            ServiceBoardsIdTypesubtypeitemassociationsEndpoint(client, parent_endpoint=self)
-        )
-        self.types = self._register_child_endpoint(ServiceBoardsIdTypesEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(ServiceBoardsIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Board]:
@@ -101,7 +80,7 @@ class ServiceBoardsIdEndpoint(
         Returns:
             Board: The parsed response data.
         """
-        return self._parse_one(Board, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Board, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Board:
         """
@@ -113,7 +92,7 @@ class ServiceBoardsIdEndpoint(
         Returns:
             Board: The parsed response data.
         """
-        return self._parse_one(Board, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Board, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Board:
         """
@@ -125,4 +104,85 @@ class ServiceBoardsIdEndpoint(
         Returns:
             Board: The parsed response data.
         """
-        return self._parse_one(Board, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Board, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def auto_assign_resources(self) -> ServiceBoardsIdAutoassignresourcesEndpoint:
+        """
+        The ServiceBoardsIdAutoassignresourcesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdAutoassignresourcesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def auto_templates(self) -> ServiceBoardsIdAutotemplatesEndpoint:
+        """
+        The ServiceBoardsIdAutotemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdAutotemplatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def excluded_members(self) -> ServiceBoardsIdExcludedmembersEndpoint:
+        """
+        The ServiceBoardsIdExcludedmembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdExcludedmembersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def items(self) -> ServiceBoardsIdItemsEndpoint:
+        """
+        The ServiceBoardsIdItemsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdItemsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notifications(self) -> ServiceBoardsIdNotificationsEndpoint:
+        """
+        The ServiceBoardsIdNotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdNotificationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> ServiceBoardsIdStatusesEndpoint:
+        """
+        The ServiceBoardsIdStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def subtypes(self) -> ServiceBoardsIdSubtypesEndpoint:
+        """
+        The ServiceBoardsIdSubtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdSubtypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def teams(self) -> ServiceBoardsIdTeamsEndpoint:
+        """
+        The ServiceBoardsIdTeamsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdTeamsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def type_sub_type_item_associations(self) -> ServiceBoardsIdTypesubtypeitemassociationsEndpoint:
+        """
+        The ServiceBoardsIdTypesubtypeitemassociationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdTypesubtypeitemassociationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def types(self) -> ServiceBoardsIdTypesEndpoint:
+        """
+        The ServiceBoardsIdTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdTypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ServiceBoardsIdUsagesEndpoint:
+        """
+        The ServiceBoardsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -64,4 +64,4 @@ class ServiceBoardsIdExcludedmembersIdEndpoint(
         Returns:
             BoardExcludedMember: The parsed response data.
         """
-        return self._parse_one(BoardExcludedMember, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BoardExcludedMember, super()._make_request("GET", data=data, params=params).content)
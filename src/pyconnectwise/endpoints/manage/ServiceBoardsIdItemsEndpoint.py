@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ServiceBoardsIdItemsEndpoint(
         IPostable.__init__(self, BoardItem)
         IPaginateable.__init__(self, BoardItem)
 
-        self.count = self._register_child_endpoint(ServiceBoardsIdItemsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceBoardsIdItemsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceBoardsIdItemsIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class ServiceBoardsIdItemsEndpoint(
         Returns:
             list[BoardItem]: The parsed response data.
         """
-        return self._parse_many(BoardItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardItem, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardItem:
         """
@@ -81,4 +80,11 @@ class ServiceBoardsIdItemsEndpoint(
         Returns:
             BoardItem: The parsed response data.
         """
-        return self._parse_one(BoardItem, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BoardItem, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdItemsCountEndpoint:
+        """
+        The ServiceBoardsIdItemsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdItemsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class ServiceBoardsIdItemsIdAssociationsEndpoint(
         IGettable.__init__(self, list[BoardItemAssociation])
         IPaginateable.__init__(self, BoardItemAssociation)
 
-        self.count = self._register_child_endpoint(
-            ServiceBoardsIdItemsIdAssociationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ServiceBoardsIdItemsIdAssociationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceBoardsIdItemsIdAssociationsIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class ServiceBoardsIdItemsIdAssociationsEndpoint(
         Returns:
             list[BoardItemAssociation]: The parsed response data.
         """
-        return self._parse_many(BoardItemAssociation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardItemAssociation, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdItemsIdAssociationsCountEndpoint:
+        """
+        The ServiceBoardsIdItemsIdAssociationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdItemsIdAssociationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,11 +29,6 @@ class ServiceBoardsIdItemsIdEndpoint(
         IPuttable.__init__(self, BoardItem)
         IPaginateable.__init__(self, BoardItem)
 
-        self.associations = self._register_child_endpoint(
-            ServiceBoardsIdItemsIdAssociationsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(ServiceBoardsIdItemsIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[BoardItem]:
@@ -73,7 +69,7 @@ class ServiceBoardsIdItemsIdEndpoint(
         Returns:
             BoardItem: The parsed response data.
         """
-        return self._parse_one(BoardItem, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BoardItem, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> BoardItem:
         """
@@ -85,7 +81,7 @@ class ServiceBoardsIdItemsIdEndpoint(
         Returns:
             BoardItem: The parsed response data.
         """
-        return self._parse_one(BoardItem, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(BoardItem, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardItem:
         """
@@ -97,4 +93,20 @@ class ServiceBoardsIdItemsIdEndpoint(
         Returns:
             BoardItem: The parsed response data.
         """
-        return self._parse_one(BoardItem, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(BoardItem, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def associations(self) -> ServiceBoardsIdItemsIdAssociationsEndpoint:
+        """
+        The ServiceBoardsIdItemsIdAssociationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdItemsIdAssociationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> ServiceBoardsIdItemsIdUsagesEndpoint:
+        """
+        The ServiceBoardsIdItemsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdItemsIdUsagesEndpoint(self.client, parent_endpoint=self))
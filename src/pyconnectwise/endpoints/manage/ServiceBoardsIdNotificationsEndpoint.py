@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class ServiceBoardsIdNotificationsEndpoint(
         IPostable.__init__(self, BoardNotification)
         IPaginateable.__init__(self, BoardNotification)
 
-        self.count = self._register_child_endpoint(
-            ServiceBoardsIdNotificationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ServiceBoardsIdNotificationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceBoardsIdNotificationsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class ServiceBoardsIdNotificationsEndpoint(
         Returns:
             list[BoardNotification]: The parsed response data.
         """
-        return self._parse_many(BoardNotification, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardNotification, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardNotification:
         """
@@ -89,4 +86,13 @@ class ServiceBoardsIdNotificationsEndpoint(
         Returns:
             BoardNotification: The parsed response data.
         """
-        return self._parse_one(BoardNotification, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BoardNotification, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdNotificationsCountEndpoint:
+        """
+        The ServiceBoardsIdNotificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdNotificationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ServiceBoardsIdStatusesEndpoint(
         IPostable.__init__(self, BoardStatus)
         IPaginateable.__init__(self, BoardStatus)
 
-        self.count = self._register_child_endpoint(ServiceBoardsIdStatusesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceBoardsIdStatusesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceBoardsIdStatusesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceBoardsIdStatusesIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class ServiceBoardsIdStatusesEndpoint(
         Returns:
             list[BoardStatus]: The parsed response data.
         """
-        return self._parse_many(BoardStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardStatus, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardStatus:
         """
@@ -85,4 +83,18 @@ class ServiceBoardsIdStatusesEndpoint(
         Returns:
             BoardStatus: The parsed response data.
         """
-        return self._parse_one(BoardStatus, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BoardStatus, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdStatusesCountEndpoint:
+        """
+        The ServiceBoardsIdStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdStatusesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceBoardsIdStatusesInfoEndpoint:
+        """
+        The ServiceBoardsIdStatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdStatusesInfoEndpoint(self.client, parent_endpoint=self))
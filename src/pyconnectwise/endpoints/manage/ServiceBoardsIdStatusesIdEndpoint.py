@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -31,14 +32,6 @@ class ServiceBoardsIdStatusesIdEndpoint(
         IPuttable.__init__(self, BoardStatus)
         IPaginateable.__init__(self, BoardStatus)
 
-        self.info = self._register_child_endpoint(ServiceBoardsIdStatusesIdInfoEndpoint(client, parent_endpoint=self))
-        self.notifications = self._register_child_endpoint(
-            ServiceBoardsIdStatusesIdNotificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(
-            ServiceBoardsIdStatusesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[BoardStatus]:
@@ -81,7 +74,7 @@ class ServiceBoardsIdStatusesIdEndpoint(
         Returns:
             BoardStatus: The parsed response data.
         """
-        return self._parse_one(BoardStatus, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BoardStatus, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> BoardStatus:
         """
@@ -93,7 +86,7 @@ class ServiceBoardsIdStatusesIdEndpoint(
         Returns:
             BoardStatus: The parsed response data.
         """
-        return self._parse_one(BoardStatus, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(BoardStatus, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardStatus:
         """
@@ -105,4 +98,27 @@ class ServiceBoardsIdStatusesIdEndpoint(
         Returns:
             BoardStatus: The parsed response data.
         """
-        return self._parse_one(BoardStatus, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(BoardStatus, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ServiceBoardsIdStatusesIdInfoEndpoint:
+        """
+        The ServiceBoardsIdStatusesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdStatusesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notifications(self) -> ServiceBoardsIdStatusesIdNotificationsEndpoint:
+        """
+        The ServiceBoardsIdStatusesIdNotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdStatusesIdNotificationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> ServiceBoardsIdStatusesIdUsagesEndpoint:
+        """
+        The ServiceBoardsIdStatusesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdStatusesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ServiceBoardsIdStatusesIdInfoEndpoint(
         Returns:
             BoardStatusInfo: The parsed response data.
         """
-        return self._parse_one(BoardStatusInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BoardStatusInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ServiceBoardsIdStatusesIdNotificationsEndpoint(
         IPostable.__init__(self, BoardStatusNotification)
         IPaginateable.__init__(self, BoardStatusNotification)
 
-        self.count = self._register_child_endpoint(
-            ServiceBoardsIdStatusesIdNotificationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ServiceBoardsIdStatusesIdNotificationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceBoardsIdStatusesIdNotificationsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class ServiceBoardsIdStatusesIdNotificationsEndpoint(
         Returns:
             list[BoardStatusNotification]: The parsed response data.
         """
-        return self._parse_many(BoardStatusNotification, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardStatusNotification, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -93,4 +90,13 @@ class ServiceBoardsIdStatusesIdNotificationsEndpoint(
         Returns:
             BoardStatusNotification: The parsed response data.
         """
-        return self._parse_one(BoardStatusNotification, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BoardStatusNotification, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdStatusesIdNotificationsCountEndpoint:
+        """
+        The ServiceBoardsIdStatusesIdNotificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdStatusesIdNotificationsCountEndpoint(self.client, parent_endpoint=self)
+        )
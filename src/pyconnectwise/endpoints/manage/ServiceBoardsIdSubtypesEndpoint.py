@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ServiceBoardsIdSubtypesEndpoint(
         IPostable.__init__(self, BoardSubType)
         IPaginateable.__init__(self, BoardSubType)
 
-        self.count = self._register_child_endpoint(ServiceBoardsIdSubtypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceBoardsIdSubtypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceBoardsIdSubtypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceBoardsIdSubtypesIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class ServiceBoardsIdSubtypesEndpoint(
         Returns:
             list[BoardSubType]: The parsed response data.
         """
-        return self._parse_many(BoardSubType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardSubType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardSubType:
         """
@@ -85,4 +83,18 @@ class ServiceBoardsIdSubtypesEndpoint(
         Returns:
             BoardSubType: The parsed response data.
         """
-        return self._parse_one(BoardSubType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BoardSubType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdSubtypesCountEndpoint:
+        """
+        The ServiceBoardsIdSubtypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdSubtypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceBoardsIdSubtypesInfoEndpoint:
+        """
+        The ServiceBoardsIdSubtypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdSubtypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,11 +29,6 @@ class ServiceBoardsIdSubtypesIdEndpoint(
         IPuttable.__init__(self, BoardSubType)
         IPaginateable.__init__(self, BoardSubType)
 
-        self.info = self._register_child_endpoint(ServiceBoardsIdSubtypesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(
-            ServiceBoardsIdSubtypesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[BoardSubType]:
@@ -75,7 +71,7 @@ class ServiceBoardsIdSubtypesIdEndpoint(
         Returns:
             BoardSubType: The parsed response data.
         """
-        return self._parse_one(BoardSubType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BoardSubType, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> BoardSubType:
         """
@@ -87,7 +83,7 @@ class ServiceBoardsIdSubtypesIdEndpoint(
         Returns:
             BoardSubType: The parsed response data.
         """
-        return self._parse_one(BoardSubType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(BoardSubType, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardSubType:
         """
@@ -99,4 +95,18 @@ class ServiceBoardsIdSubtypesIdEndpoint(
         Returns:
             BoardSubType: The parsed response data.
         """
-        return self._parse_one(BoardSubType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(BoardSubType, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ServiceBoardsIdSubtypesIdInfoEndpoint:
+        """
+        The ServiceBoardsIdSubtypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdSubtypesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ServiceBoardsIdSubtypesIdUsagesEndpoint:
+        """
+        The ServiceBoardsIdSubtypesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdSubtypesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ServiceBoardsIdSubtypesIdInfoEndpoint(
         Returns:
             BoardSubTypeInfo: The parsed response data.
         """
-        return self._parse_one(BoardSubTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BoardSubTypeInfo, super()._make_request("GET", data=data, params=params).content)
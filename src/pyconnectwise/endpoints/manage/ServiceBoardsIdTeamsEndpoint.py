@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ServiceBoardsIdTeamsEndpoint(
         IPostable.__init__(self, BoardTeam)
         IPaginateable.__init__(self, BoardTeam)
 
-        self.count = self._register_child_endpoint(ServiceBoardsIdTeamsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceBoardsIdTeamsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceBoardsIdTeamsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceBoardsIdTeamsIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class ServiceBoardsIdTeamsEndpoint(
         Returns:
             list[BoardTeam]: The parsed response data.
         """
-        return self._parse_many(BoardTeam, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardTeam, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardTeam:
         """
@@ -83,4 +81,18 @@ class ServiceBoardsIdTeamsEndpoint(
         Returns:
             BoardTeam: The parsed response data.
         """
-        return self._parse_one(BoardTeam, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BoardTeam, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdTeamsCountEndpoint:
+        """
+        The ServiceBoardsIdTeamsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdTeamsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceBoardsIdTeamsInfoEndpoint:
+        """
+        The ServiceBoardsIdTeamsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdTeamsInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class ServiceBoardsIdTeamsIdEndpoint(
         IPuttable.__init__(self, BoardTeam)
         IPaginateable.__init__(self, BoardTeam)
 
-        self.info = self._register_child_endpoint(ServiceBoardsIdTeamsIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(ServiceBoardsIdTeamsIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[BoardTeam]:
@@ -69,7 +67,7 @@ class ServiceBoardsIdTeamsIdEndpoint(
         Returns:
             BoardTeam: The parsed response data.
         """
-        return self._parse_one(BoardTeam, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BoardTeam, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> BoardTeam:
         """
@@ -81,7 +79,7 @@ class ServiceBoardsIdTeamsIdEndpoint(
         Returns:
             BoardTeam: The parsed response data.
         """
-        return self._parse_one(BoardTeam, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(BoardTeam, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardTeam:
         """
@@ -93,4 +91,18 @@ class ServiceBoardsIdTeamsIdEndpoint(
         Returns:
             BoardTeam: The parsed response data.
         """
-        return self._parse_one(BoardTeam, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(BoardTeam, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ServiceBoardsIdTeamsIdInfoEndpoint:
+        """
+        The ServiceBoardsIdTeamsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdTeamsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ServiceBoardsIdTeamsIdUsagesEndpoint:
+        """
+        The ServiceBoardsIdTeamsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdTeamsIdUsagesEndpoint(self.client, parent_endpoint=self))
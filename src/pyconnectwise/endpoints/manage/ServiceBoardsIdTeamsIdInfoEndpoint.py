@@ -52,4 +52,4 @@ class ServiceBoardsIdTeamsIdInfoEndpoint(
         Returns:
             BoardTeamInfo: The parsed response data.
         """
-        return self._parse_one(BoardTeamInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BoardTeamInfo, super()._make_request("GET", data=data, params=params).content)
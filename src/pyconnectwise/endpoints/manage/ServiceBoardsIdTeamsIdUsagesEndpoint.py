@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -13,6 +14,11 @@ class ServiceBoardsIdTeamsIdUsagesEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "usages", parent_endpoint=parent_endpoint)
 
-        self.list = self._register_child_endpoint(
-            ServiceBoardsIdTeamsIdUsagesListEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def list(self) -> ServiceBoardsIdTeamsIdUsagesListEndpoint:
+        """
+        The ServiceBoardsIdTeamsIdUsagesListEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdTeamsIdUsagesListEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ServiceBoardsIdTypesEndpoint(
         IPostable.__init__(self, BoardType)
         IPaginateable.__init__(self, BoardType)
 
-        self.count = self._register_child_endpoint(ServiceBoardsIdTypesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceBoardsIdTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceBoardsIdTypesIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class ServiceBoardsIdTypesEndpoint(
         Returns:
             list[BoardType]: The parsed response data.
         """
-        return self._parse_many(BoardType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardType:
         """
@@ -81,4 +80,11 @@ class ServiceBoardsIdTypesEndpoint(
         Returns:
             BoardType: The parsed response data.
         """
-        return self._parse_one(BoardType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BoardType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdTypesCountEndpoint:
+        """
+        The ServiceBoardsIdTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdTypesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class ServiceBoardsIdTypesubtypeitemassociationsEndpoint(
         IGettable.__init__(self, list[BoardTypeSubTypeItemAssociation])
         IPaginateable.__init__(self, BoardTypeSubTypeItemAssociation)
 
-        self.count = self._register_child_endpoint(
-            ServiceBoardsIdTypesubtypeitemassociationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ServiceBoardsIdTypesubtypeitemassociationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceBoardsIdTypesubtypeitemassociationsIdEndpoint object to move down the chain.
@@ -78,5 +75,14 @@ class ServiceBoardsIdTypesubtypeitemassociationsEndpoint(
             list[BoardTypeSubTypeItemAssociation]: The parsed response data.
         """
         return self._parse_many(
-            BoardTypeSubTypeItemAssociation, super()._make_request("GET", data=data, params=params).json()
+            BoardTypeSubTypeItemAssociation, super()._make_request("GET", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdTypesubtypeitemassociationsCountEndpoint:
+        """
+        The ServiceBoardsIdTypesubtypeitemassociationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdTypesubtypeitemassociationsCountEndpoint(self.client, parent_endpoint=self)
         )
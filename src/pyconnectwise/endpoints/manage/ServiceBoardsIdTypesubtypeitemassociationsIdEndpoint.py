@@ -55,5 +55,5 @@ class ServiceBoardsIdTypesubtypeitemassociationsIdEndpoint(
             BoardTypeSubTypeItemAssociation: The parsed response data.
         """
         return self._parse_one(
-            BoardTypeSubTypeItemAssociation, super()._make_request("GET", data=data, params=params).json()
+            BoardTypeSubTypeItemAssociation, super()._make_request("GET", data=data, params=params).content
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ServiceCodesEndpoint(
         IPostable.__init__(self, Code)
         IPaginateable.__init__(self, Code)
 
-        self.count = self._register_child_endpoint(ServiceCodesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceCodesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceCodesIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class ServiceCodesEndpoint(
         Returns:
             list[Code]: The parsed response data.
         """
-        return self._parse_many(Code, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Code, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Code:
         """
@@ -81,4 +80,11 @@ class ServiceCodesEndpoint(
         Returns:
             Code: The parsed response data.
         """
-        return self._parse_one(Code, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Code, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceCodesCountEndpoint:
+        """
+        The ServiceCodesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceCodesCountEndpoint(self.client, parent_endpoint=self))
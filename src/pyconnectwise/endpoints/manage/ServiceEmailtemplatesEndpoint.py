@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ServiceEmailtemplatesEndpoint(
         IPostable.__init__(self, ServiceEmailTemplate)
         IPaginateable.__init__(self, ServiceEmailTemplate)
 
-        self.count = self._register_child_endpoint(ServiceEmailtemplatesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceEmailtemplatesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceEmailtemplatesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class ServiceEmailtemplatesEndpoint(
         Returns:
             list[ServiceEmailTemplate]: The parsed response data.
         """
-        return self._parse_many(ServiceEmailTemplate, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceEmailTemplate, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -87,4 +86,11 @@ class ServiceEmailtemplatesEndpoint(
         Returns:
             ServiceEmailTemplate: The parsed response data.
         """
-        return self._parse_one(ServiceEmailTemplate, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ServiceEmailTemplate, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceEmailtemplatesCountEndpoint:
+        """
+        The ServiceEmailtemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceEmailtemplatesCountEndpoint(self.client, parent_endpoint=self))
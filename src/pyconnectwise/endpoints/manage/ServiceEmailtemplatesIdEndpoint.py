@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class ServiceEmailtemplatesIdEndpoint(
         IPuttable.__init__(self, ServiceEmailTemplate)
         IPaginateable.__init__(self, ServiceEmailTemplate)
 
-        self.usages = self._register_child_endpoint(ServiceEmailtemplatesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ServiceEmailTemplate]:
@@ -71,7 +70,7 @@ class ServiceEmailtemplatesIdEndpoint(
         Returns:
             ServiceEmailTemplate: The parsed response data.
         """
-        return self._parse_one(ServiceEmailTemplate, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceEmailTemplate, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -85,7 +84,7 @@ class ServiceEmailtemplatesIdEndpoint(
         Returns:
             ServiceEmailTemplate: The parsed response data.
         """
-        return self._parse_one(ServiceEmailTemplate, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ServiceEmailTemplate, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -99,4 +98,11 @@ class ServiceEmailtemplatesIdEndpoint(
         Returns:
             ServiceEmailTemplate: The parsed response data.
         """
-        return self._parse_one(ServiceEmailTemplate, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ServiceEmailTemplate, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> ServiceEmailtemplatesIdUsagesEndpoint:
+        """
+        The ServiceEmailtemplatesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceEmailtemplatesIdUsagesEndpoint(self.client, parent_endpoint=self))
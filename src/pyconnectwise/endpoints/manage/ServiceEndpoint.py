@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -36,40 +37,179 @@ class ServiceEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "service", parent_endpoint=parent_endpoint)
 
-        self.boards = self._register_child_endpoint(ServiceBoardsEndpoint(client, parent_endpoint=self))
-        self.codes = self._register_child_endpoint(ServiceCodesEndpoint(client, parent_endpoint=self))
-        self.email_templates = self._register_child_endpoint(
-            ServiceEmailtemplatesEndpoint(client, parent_endpoint=self)
-        )
-        self.impacts = self._register_child_endpoint(ServiceImpactsEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceInfoEndpoint(client, parent_endpoint=self))
-        self.knowledge_base_articles = self._register_child_endpoint(
-            ServiceKnowledgebasearticlesEndpoint(client, parent_endpoint=self)
-        )
-        self.knowledge_base_categories = self._register_child_endpoint(
-            ServiceKnowledgebasecategoriesEndpoint(client, parent_endpoint=self)
-        )
-        self.knowledge_base_sub_categories = self._register_child_endpoint(
-            ServiceKnowledgebasesubcategoriesEndpoint(client, parent_endpoint=self)
-        )
-        self.knowledgebasesettings = self._register_child_endpoint(
-            ServiceKnowledgebasesettingsEndpoint(client, parent_endpoint=self)
-        )
-        self.locations = self._register_child_endpoint(ServiceLocationsEndpoint(client, parent_endpoint=self))
-        self.priorities = self._register_child_endpoint(ServicePrioritiesEndpoint(client, parent_endpoint=self))
-        self.priority = self._register_child_endpoint(ServicePriorityEndpoint(client, parent_endpoint=self))
-        self.s_l_as = self._register_child_endpoint(ServiceSlasEndpoint(client, parent_endpoint=self))
-        self.scheduling = self._register_child_endpoint(ServiceSchedulingEndpoint(client, parent_endpoint=self))
-        self.service_signoff = self._register_child_endpoint(
-            ServiceServicesignoffEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def boards(self) -> ServiceBoardsEndpoint:
+        """
+        The ServiceBoardsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def codes(self) -> ServiceCodesEndpoint:
+        """
+        The ServiceCodesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceCodesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def email_templates(self) -> ServiceEmailtemplatesEndpoint:
+        """
+        The ServiceEmailtemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceEmailtemplatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def impacts(self) -> ServiceImpactsEndpoint:
+        """
+        The ServiceImpactsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceImpactsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceInfoEndpoint:
+        """
+        The ServiceInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def knowledge_base_articles(self) -> ServiceKnowledgebasearticlesEndpoint:
+        """
+        The ServiceKnowledgebasearticlesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceKnowledgebasearticlesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def knowledge_base_categories(self) -> ServiceKnowledgebasecategoriesEndpoint:
+        """
+        The ServiceKnowledgebasecategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceKnowledgebasecategoriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def knowledge_base_sub_categories(self) -> ServiceKnowledgebasesubcategoriesEndpoint:
+        """
+        The ServiceKnowledgebasesubcategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceKnowledgebasesubcategoriesEndpoint(self.client, parent_endpoint=self)
         )
-        self.severities = self._register_child_endpoint(ServiceSeveritiesEndpoint(client, parent_endpoint=self))
-        self.slas = self._register_child_endpoint(ServiceSlasEndpoint(client, parent_endpoint=self))
-        self.sources = self._register_child_endpoint(ServiceSourcesEndpoint(client, parent_endpoint=self))
-        self.surveys = self._register_child_endpoint(ServiceSurveysEndpoint(client, parent_endpoint=self))
-        self.team_members = self._register_child_endpoint(ServiceTeammembersEndpoint(client, parent_endpoint=self))
-        self.teams = self._register_child_endpoint(ServiceTeamsEndpoint(client, parent_endpoint=self))
-        self.templates = self._register_child_endpoint(ServiceTemplatesEndpoint(client, parent_endpoint=self))
-        self.ticket_links = self._register_child_endpoint(ServiceTicketlinksEndpoint(client, parent_endpoint=self))
-        self.ticket_syncs = self._register_child_endpoint(ServiceTicketsyncsEndpoint(client, parent_endpoint=self))
-        self.tickets = self._register_child_endpoint(ServiceTicketsEndpoint(client, parent_endpoint=self))
+
+    @cached_property
+    def knowledgebasesettings(self) -> ServiceKnowledgebasesettingsEndpoint:
+        """
+        The ServiceKnowledgebasesettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceKnowledgebasesettingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def locations(self) -> ServiceLocationsEndpoint:
+        """
+        The ServiceLocationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceLocationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def priorities(self) -> ServicePrioritiesEndpoint:
+        """
+        The ServicePrioritiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServicePrioritiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def priority(self) -> ServicePriorityEndpoint:
+        """
+        The ServicePriorityEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServicePriorityEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def s_l_as(self) -> ServiceSlasEndpoint:
+        """
+        The ServiceSlasEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSlasEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scheduling(self) -> ServiceSchedulingEndpoint:
+        """
+        The ServiceSchedulingEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSchedulingEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def service_signoff(self) -> ServiceServicesignoffEndpoint:
+        """
+        The ServiceServicesignoffEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceServicesignoffEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def severities(self) -> ServiceSeveritiesEndpoint:
+        """
+        The ServiceSeveritiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSeveritiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def slas(self) -> ServiceSlasEndpoint:
+        """
+        The ServiceSlasEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSlasEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sources(self) -> ServiceSourcesEndpoint:
+        """
+        The ServiceSourcesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSourcesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def surveys(self) -> ServiceSurveysEndpoint:
+        """
+        The ServiceSurveysEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def team_members(self) -> ServiceTeammembersEndpoint:
+        """
+        The ServiceTeammembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTeammembersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def teams(self) -> ServiceTeamsEndpoint:
+        """
+        The ServiceTeamsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTeamsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def templates(self) -> ServiceTemplatesEndpoint:
+        """
+        The ServiceTemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTemplatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ticket_links(self) -> ServiceTicketlinksEndpoint:
+        """
+        The ServiceTicketlinksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketlinksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ticket_syncs(self) -> ServiceTicketsyncsEndpoint:
+        """
+        The ServiceTicketsyncsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsyncsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tickets(self) -> ServiceTicketsEndpoint:
+        """
+        The ServiceTicketsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsEndpoint(self.client, parent_endpoint=self))
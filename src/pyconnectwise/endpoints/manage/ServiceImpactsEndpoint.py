@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ServiceImpactsEndpoint(
         IGettable.__init__(self, list[Impact])
         IPaginateable.__init__(self, Impact)
 
-        self.count = self._register_child_endpoint(ServiceImpactsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceImpactsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceImpactsIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class ServiceImpactsEndpoint(
         Returns:
             list[Impact]: The parsed response data.
         """
-        return self._parse_many(Impact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Impact, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceImpactsCountEndpoint:
+        """
+        The ServiceImpactsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceImpactsCountEndpoint(self.client, parent_endpoint=self))
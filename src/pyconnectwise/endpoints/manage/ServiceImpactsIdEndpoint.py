@@ -54,7 +54,7 @@ class ServiceImpactsIdEndpoint(
         Returns:
             Impact: The parsed response data.
         """
-        return self._parse_one(Impact, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Impact, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Impact:
         """
@@ -66,7 +66,7 @@ class ServiceImpactsIdEndpoint(
         Returns:
             Impact: The parsed response data.
         """
-        return self._parse_one(Impact, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Impact, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Impact:
         """
@@ -78,4 +78,4 @@ class ServiceImpactsIdEndpoint(
         Returns:
             Impact: The parsed response data.
         """
-        return self._parse_one(Impact, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Impact, super()._make_request("PUT", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ServiceInfoBoardsEndpoint(
         IGettable.__init__(self, list[BoardInfo])
         IPaginateable.__init__(self, BoardInfo)
 
-        self.count = self._register_child_endpoint(ServiceInfoBoardsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceInfoBoardsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceInfoBoardsIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class ServiceInfoBoardsEndpoint(
         Returns:
             list[BoardInfo]: The parsed response data.
         """
-        return self._parse_many(BoardInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceInfoBoardsCountEndpoint:
+        """
+        The ServiceInfoBoardsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceInfoBoardsCountEndpoint(self.client, parent_endpoint=self))
@@ -50,4 +50,4 @@ class ServiceInfoBoardsIdEndpoint(
         Returns:
             BoardInfo: The parsed response data.
         """
-        return self._parse_one(BoardInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BoardInfo, super()._make_request("GET", data=data, params=params).content)
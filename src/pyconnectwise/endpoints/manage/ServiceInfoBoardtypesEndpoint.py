@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ServiceInfoBoardtypesEndpoint(
         IGettable.__init__(self, list[BoardTypeInfo])
         IPaginateable.__init__(self, BoardTypeInfo)
 
-        self.count = self._register_child_endpoint(ServiceInfoBoardtypesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceInfoBoardtypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceInfoBoardtypesIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class ServiceInfoBoardtypesEndpoint(
         Returns:
             list[BoardTypeInfo]: The parsed response data.
         """
-        return self._parse_many(BoardTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(BoardTypeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceInfoBoardtypesCountEndpoint:
+        """
+        The ServiceInfoBoardtypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceInfoBoardtypesCountEndpoint(self.client, parent_endpoint=self))
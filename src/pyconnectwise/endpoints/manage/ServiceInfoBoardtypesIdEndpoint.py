@@ -52,4 +52,4 @@ class ServiceInfoBoardtypesIdEndpoint(
         Returns:
             BoardTypeInfo: The parsed response data.
         """
-        return self._parse_one(BoardTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(BoardTypeInfo, super()._make_request("GET", data=data, params=params).content)
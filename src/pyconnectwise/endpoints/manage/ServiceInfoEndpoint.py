@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -12,5 +13,16 @@ class ServiceInfoEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "info", parent_endpoint=parent_endpoint)
 
-        self.boards = self._register_child_endpoint(ServiceInfoBoardsEndpoint(client, parent_endpoint=self))
-        self.boardtypes = self._register_child_endpoint(ServiceInfoBoardtypesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def boards(self) -> ServiceInfoBoardsEndpoint:
+        """
+        The ServiceInfoBoardsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceInfoBoardsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def boardtypes(self) -> ServiceInfoBoardtypesEndpoint:
+        """
+        The ServiceInfoBoardtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceInfoBoardtypesEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class ServiceKnowledgebasearticlesEndpoint(
         IPostable.__init__(self, KnowledgeBaseArticle)
         IPaginateable.__init__(self, KnowledgeBaseArticle)
 
-        self.count = self._register_child_endpoint(
-            ServiceKnowledgebasearticlesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ServiceKnowledgebasearticlesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceKnowledgebasearticlesIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class ServiceKnowledgebasearticlesEndpoint(
         Returns:
             list[KnowledgeBaseArticle]: The parsed response data.
         """
-        return self._parse_many(KnowledgeBaseArticle, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(KnowledgeBaseArticle, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -91,4 +88,13 @@ class ServiceKnowledgebasearticlesEndpoint(
         Returns:
             KnowledgeBaseArticle: The parsed response data.
         """
-        return self._parse_one(KnowledgeBaseArticle, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(KnowledgeBaseArticle, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceKnowledgebasearticlesCountEndpoint:
+        """
+        The ServiceKnowledgebasearticlesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceKnowledgebasearticlesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -70,7 +70,7 @@ class ServiceKnowledgebasesettingsEndpoint(
         Returns:
             KnowledgeBaseSettings: The parsed response data.
         """
-        return self._parse_one(KnowledgeBaseSettings, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(KnowledgeBaseSettings, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -84,4 +84,4 @@ class ServiceKnowledgebasesettingsEndpoint(
         Returns:
             KnowledgeBaseSettings: The parsed response data.
         """
-        return self._parse_one(KnowledgeBaseSettings, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(KnowledgeBaseSettings, super()._make_request("POST", data=data, params=params).content)
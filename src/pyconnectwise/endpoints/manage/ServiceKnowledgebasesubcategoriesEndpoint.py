@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ServiceKnowledgebasesubcategoriesEndpoint(
         IPostable.__init__(self, KnowledgeBaseSubCategory)
         IPaginateable.__init__(self, KnowledgeBaseSubCategory)
 
-        self.count = self._register_child_endpoint(
-            ServiceKnowledgebasesubcategoriesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ServiceKnowledgebasesubcategoriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceKnowledgebasesubcategoriesIdEndpoint object to move down the chain.
@@ -79,7 +76,9 @@ class ServiceKnowledgebasesubcategoriesEndpoint(
         Returns:
             list[KnowledgeBaseSubCategory]: The parsed response data.
         """
-        return self._parse_many(KnowledgeBaseSubCategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(
+            KnowledgeBaseSubCategory, super()._make_request("GET", data=data, params=params).content
+        )
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -93,4 +92,15 @@ class ServiceKnowledgebasesubcategoriesEndpoint(
         Returns:
             KnowledgeBaseSubCategory: The parsed response data.
         """
-        return self._parse_one(KnowledgeBaseSubCategory, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(
+            KnowledgeBaseSubCategory, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> ServiceKnowledgebasesubcategoriesCountEndpoint:
+        """
+        The ServiceKnowledgebasesubcategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceKnowledgebasesubcategoriesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class ServiceKnowledgebasesubcategoriesIdEndpoint(
         IPuttable.__init__(self, KnowledgeBaseSubCategory)
         IPaginateable.__init__(self, KnowledgeBaseSubCategory)
 
-        self.usages = self._register_child_endpoint(
-            ServiceKnowledgebasesubcategoriesIdUsagesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[KnowledgeBaseSubCategory]:
@@ -75,7 +72,7 @@ class ServiceKnowledgebasesubcategoriesIdEndpoint(
         Returns:
             KnowledgeBaseSubCategory: The parsed response data.
         """
-        return self._parse_one(KnowledgeBaseSubCategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(KnowledgeBaseSubCategory, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -90,7 +87,7 @@ class ServiceKnowledgebasesubcategoriesIdEndpoint(
             KnowledgeBaseSubCategory: The parsed response data.
         """
         return self._parse_one(
-            KnowledgeBaseSubCategory, super()._make_request("PATCH", data=data, params=params).json()
+            KnowledgeBaseSubCategory, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -105,4 +102,13 @@ class ServiceKnowledgebasesubcategoriesIdEndpoint(
         Returns:
             KnowledgeBaseSubCategory: The parsed response data.
         """
-        return self._parse_one(KnowledgeBaseSubCategory, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(KnowledgeBaseSubCategory, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def usages(self) -> ServiceKnowledgebasesubcategoriesIdUsagesEndpoint:
+        """
+        The ServiceKnowledgebasesubcategoriesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceKnowledgebasesubcategoriesIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
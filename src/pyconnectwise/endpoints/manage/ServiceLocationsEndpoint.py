@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ServiceLocationsEndpoint(
         IPostable.__init__(self, ServiceLocation)
         IPaginateable.__init__(self, ServiceLocation)
 
-        self.count = self._register_child_endpoint(ServiceLocationsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceLocationsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceLocationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceLocationsIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class ServiceLocationsEndpoint(
         Returns:
             list[ServiceLocation]: The parsed response data.
         """
-        return self._parse_many(ServiceLocation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceLocation, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ServiceLocation:
         """
@@ -87,4 +85,18 @@ class ServiceLocationsEndpoint(
         Returns:
             ServiceLocation: The parsed response data.
         """
-        return self._parse_one(ServiceLocation, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ServiceLocation, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceLocationsCountEndpoint:
+        """
+        The ServiceLocationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceLocationsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceLocationsInfoEndpoint:
+        """
+        The ServiceLocationsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceLocationsInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class ServiceLocationsIdEndpoint(
         IPuttable.__init__(self, ServiceLocation)
         IPaginateable.__init__(self, ServiceLocation)
 
-        self.info = self._register_child_endpoint(ServiceLocationsIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ServiceLocation]:
@@ -69,7 +68,7 @@ class ServiceLocationsIdEndpoint(
         Returns:
             ServiceLocation: The parsed response data.
         """
-        return self._parse_one(ServiceLocation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceLocation, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ServiceLocation:
         """
@@ -81,7 +80,7 @@ class ServiceLocationsIdEndpoint(
         Returns:
             ServiceLocation: The parsed response data.
         """
-        return self._parse_one(ServiceLocation, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ServiceLocation, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ServiceLocation:
         """
@@ -93,4 +92,11 @@ class ServiceLocationsIdEndpoint(
         Returns:
             ServiceLocation: The parsed response data.
         """
-        return self._parse_one(ServiceLocation, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ServiceLocation, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ServiceLocationsIdInfoEndpoint:
+        """
+        The ServiceLocationsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceLocationsIdInfoEndpoint(self.client, parent_endpoint=self))
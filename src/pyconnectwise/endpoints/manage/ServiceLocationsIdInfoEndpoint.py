@@ -54,4 +54,4 @@ class ServiceLocationsIdInfoEndpoint(
         Returns:
             ServiceLocationInfo: The parsed response data.
         """
-        return self._parse_one(ServiceLocationInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceLocationInfo, super()._make_request("GET", data=data, params=params).content)
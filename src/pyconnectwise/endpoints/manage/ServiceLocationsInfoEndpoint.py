@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class ServiceLocationsInfoEndpoint(
         IGettable.__init__(self, list[ServiceLocationInfo])
         IPaginateable.__init__(self, ServiceLocationInfo)
 
-        self.count = self._register_child_endpoint(ServiceLocationsInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ServiceLocationInfo]:
@@ -57,4 +56,11 @@ class ServiceLocationsInfoEndpoint(
         Returns:
             list[ServiceLocationInfo]: The parsed response data.
         """
-        return self._parse_many(ServiceLocationInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceLocationInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceLocationsInfoCountEndpoint:
+        """
+        The ServiceLocationsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceLocationsInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ServicePrioritiesEndpoint(
         IPostable.__init__(self, Priority)
         IPaginateable.__init__(self, Priority)
 
-        self.count = self._register_child_endpoint(ServicePrioritiesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServicePrioritiesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServicePrioritiesIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class ServicePrioritiesEndpoint(
         Returns:
             list[Priority]: The parsed response data.
         """
-        return self._parse_many(Priority, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Priority, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Priority:
         """
@@ -81,4 +80,11 @@ class ServicePrioritiesEndpoint(
         Returns:
             Priority: The parsed response data.
         """
-        return self._parse_one(Priority, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Priority, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServicePrioritiesCountEndpoint:
+        """
+        The ServicePrioritiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServicePrioritiesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class ServicePrioritiesIdEndpoint(
         IPuttable.__init__(self, Priority)
         IPaginateable.__init__(self, Priority)
 
-        self.image = self._register_child_endpoint(ServicePrioritiesIdImageEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(ServicePrioritiesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Priority]:
@@ -69,7 +67,7 @@ class ServicePrioritiesIdEndpoint(
         Returns:
             Priority: The parsed response data.
         """
-        return self._parse_one(Priority, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Priority, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Priority:
         """
@@ -81,7 +79,7 @@ class ServicePrioritiesIdEndpoint(
         Returns:
             Priority: The parsed response data.
         """
-        return self._parse_one(Priority, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Priority, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Priority:
         """
@@ -93,4 +91,18 @@ class ServicePrioritiesIdEndpoint(
         Returns:
             Priority: The parsed response data.
         """
-        return self._parse_one(Priority, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Priority, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def image(self) -> ServicePrioritiesIdImageEndpoint:
+        """
+        The ServicePrioritiesIdImageEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServicePrioritiesIdImageEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ServicePrioritiesIdUsagesEndpoint:
+        """
+        The ServicePrioritiesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServicePrioritiesIdUsagesEndpoint(self.client, parent_endpoint=self))
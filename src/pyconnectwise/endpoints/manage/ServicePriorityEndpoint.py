@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -12,8 +13,6 @@ class ServicePriorityEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "priority", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(ServicePriorityInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServicePriorityIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServicePriorityIdEndpoint object to move down the chain.
@@ -26,3 +25,10 @@ class ServicePriorityEndpoint(ConnectWiseEndpoint):
         child = ServicePriorityIdEndpoint(self.client, parent_endpoint=self)
         child._id = _id
         return child
+
+    @cached_property
+    def info(self) -> ServicePriorityInfoEndpoint:
+        """
+        The ServicePriorityInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServicePriorityInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ServicePriorityIdInfoEndpoint(
         Returns:
             PriorityInfo: The parsed response data.
         """
-        return self._parse_one(PriorityInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(PriorityInfo, super()._make_request("GET", data=data, params=params).content)
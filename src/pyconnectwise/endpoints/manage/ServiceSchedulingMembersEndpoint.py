@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -12,8 +13,6 @@ class ServiceSchedulingMembersEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "members", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(ServiceSchedulingMembersInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceSchedulingMembersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceSchedulingMembersIdEndpoint object to move down the chain.
@@ -26,3 +25,10 @@ class ServiceSchedulingMembersEndpoint(ConnectWiseEndpoint):
         child = ServiceSchedulingMembersIdEndpoint(self.client, parent_endpoint=self)
         child._id = _id
         return child
+
+    @cached_property
+    def info(self) -> ServiceSchedulingMembersInfoEndpoint:
+        """
+        The ServiceSchedulingMembersInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSchedulingMembersInfoEndpoint(self.client, parent_endpoint=self))
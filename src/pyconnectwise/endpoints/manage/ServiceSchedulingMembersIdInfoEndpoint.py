@@ -54,4 +54,4 @@ class ServiceSchedulingMembersIdInfoEndpoint(
         Returns:
             SchedulingMemberInfo: The parsed response data.
         """
-        return self._parse_one(SchedulingMemberInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SchedulingMemberInfo, super()._make_request("GET", data=data, params=params).content)
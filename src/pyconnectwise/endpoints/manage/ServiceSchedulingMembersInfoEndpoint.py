@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class ServiceSchedulingMembersInfoEndpoint(
         IGettable.__init__(self, list[SchedulingMemberInfo])
         IPaginateable.__init__(self, SchedulingMemberInfo)
 
-        self.count = self._register_child_endpoint(
-            ServiceSchedulingMembersInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[SchedulingMemberInfo]:
@@ -61,4 +58,13 @@ class ServiceSchedulingMembersInfoEndpoint(
         Returns:
             list[SchedulingMemberInfo]: The parsed response data.
         """
-        return self._parse_many(SchedulingMemberInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SchedulingMemberInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceSchedulingMembersInfoCountEndpoint:
+        """
+        The ServiceSchedulingMembersInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceSchedulingMembersInfoCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ServiceServicesignoffEndpoint(
         IPostable.__init__(self, ServiceSignoff)
         IPaginateable.__init__(self, ServiceSignoff)
 
-        self.count = self._register_child_endpoint(ServiceServicesignoffCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceServicesignoffInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceServicesignoffIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceServicesignoffIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class ServiceServicesignoffEndpoint(
         Returns:
             list[ServiceSignoff]: The parsed response data.
         """
-        return self._parse_many(ServiceSignoff, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceSignoff, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ServiceSignoff:
         """
@@ -87,4 +85,18 @@ class ServiceServicesignoffEndpoint(
         Returns:
             ServiceSignoff: The parsed response data.
         """
-        return self._parse_one(ServiceSignoff, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ServiceSignoff, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceServicesignoffCountEndpoint:
+        """
+        The ServiceServicesignoffCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceServicesignoffCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceServicesignoffInfoEndpoint:
+        """
+        The ServiceServicesignoffInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceServicesignoffInfoEndpoint(self.client, parent_endpoint=self))
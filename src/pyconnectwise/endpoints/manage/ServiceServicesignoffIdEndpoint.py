@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class ServiceServicesignoffIdEndpoint(
         IPuttable.__init__(self, ServiceSignoff)
         IPaginateable.__init__(self, ServiceSignoff)
 
-        self.info = self._register_child_endpoint(ServiceServicesignoffIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(ServiceServicesignoffIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ServiceSignoff]:
@@ -71,7 +69,7 @@ class ServiceServicesignoffIdEndpoint(
         Returns:
             ServiceSignoff: The parsed response data.
         """
-        return self._parse_one(ServiceSignoff, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceSignoff, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ServiceSignoff:
         """
@@ -83,7 +81,7 @@ class ServiceServicesignoffIdEndpoint(
         Returns:
             ServiceSignoff: The parsed response data.
         """
-        return self._parse_one(ServiceSignoff, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ServiceSignoff, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ServiceSignoff:
         """
@@ -95,4 +93,18 @@ class ServiceServicesignoffIdEndpoint(
         Returns:
             ServiceSignoff: The parsed response data.
         """
-        return self._parse_one(ServiceSignoff, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ServiceSignoff, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ServiceServicesignoffIdInfoEndpoint:
+        """
+        The ServiceServicesignoffIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceServicesignoffIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ServiceServicesignoffIdUsagesEndpoint:
+        """
+        The ServiceServicesignoffIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceServicesignoffIdUsagesEndpoint(self.client, parent_endpoint=self))
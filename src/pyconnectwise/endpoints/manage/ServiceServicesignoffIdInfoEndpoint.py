@@ -52,4 +52,4 @@ class ServiceServicesignoffIdInfoEndpoint(
         Returns:
             ServiceSignoffInfo: The parsed response data.
         """
-        return self._parse_one(ServiceSignoffInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceSignoffInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint import (
     ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint,
@@ -30,10 +32,6 @@ class ServiceServicesignoffIdSignoffcustomfieldsEndpoint(
         IPostable.__init__(self, ServiceSignoffCustomField)
         IPaginateable.__init__(self, ServiceSignoffCustomField)
 
-        self.count = self._register_child_endpoint(
-            ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, id: int) -> ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint object to move down the chain.
@@ -93,7 +91,7 @@ class ServiceServicesignoffIdSignoffcustomfieldsEndpoint(
         """
         return self._parse_many(
             ServiceSignoffCustomField,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def post(
@@ -112,5 +110,14 @@ class ServiceServicesignoffIdSignoffcustomfieldsEndpoint(
         """
         return self._parse_one(
             ServiceSignoffCustomField,
-            super()._make_request("POST", data=data, params=params).json(),
+            super()._make_request("POST", data=data, params=params).content,
+        )
+
+    @cached_property
+    def count(self) -> ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint:
+        """
+        The ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint(self.client, parent_endpoint=self)
         )
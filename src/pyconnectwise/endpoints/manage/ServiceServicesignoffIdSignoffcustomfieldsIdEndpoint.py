@@ -74,7 +74,7 @@ class ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint(
         """
         return self._parse_one(
             ServiceSignoffCustomField,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def put(
@@ -93,7 +93,7 @@ class ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint(
         """
         return self._parse_one(
             ServiceSignoffCustomField,
-            super()._make_request("PUT", data=data, params=params).json(),
+            super()._make_request("PUT", data=data, params=params).content,
         )
 
     def delete(
@@ -126,5 +126,5 @@ class ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint(
         """
         return self._parse_one(
             ServiceSignoffCustomField,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
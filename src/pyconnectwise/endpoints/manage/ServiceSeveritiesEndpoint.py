@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ServiceSeveritiesEndpoint(
         IGettable.__init__(self, list[Severity])
         IPaginateable.__init__(self, Severity)
 
-        self.count = self._register_child_endpoint(ServiceSeveritiesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceSeveritiesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceSeveritiesIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class ServiceSeveritiesEndpoint(
         Returns:
             list[Severity]: The parsed response data.
         """
-        return self._parse_many(Severity, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Severity, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceSeveritiesCountEndpoint:
+        """
+        The ServiceSeveritiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSeveritiesCountEndpoint(self.client, parent_endpoint=self))
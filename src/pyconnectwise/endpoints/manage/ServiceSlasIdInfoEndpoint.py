@@ -50,4 +50,4 @@ class ServiceSlasIdInfoEndpoint(
         Returns:
             SLAInfo: The parsed response data.
         """
-        return self._parse_one(SLAInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SLAInfo, super()._make_request("GET", data=data, params=params).content)
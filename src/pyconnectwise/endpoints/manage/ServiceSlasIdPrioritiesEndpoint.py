@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ServiceSlasIdPrioritiesEndpoint(
         IPostable.__init__(self, SLAPriority)
         IPaginateable.__init__(self, SLAPriority)
 
-        self.count = self._register_child_endpoint(ServiceSlasIdPrioritiesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceSlasIdPrioritiesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceSlasIdPrioritiesIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class ServiceSlasIdPrioritiesEndpoint(
         Returns:
             list[SLAPriority]: The parsed response data.
         """
-        return self._parse_many(SLAPriority, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SLAPriority, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SLAPriority:
         """
@@ -83,4 +82,11 @@ class ServiceSlasIdPrioritiesEndpoint(
         Returns:
             SLAPriority: The parsed response data.
         """
-        return self._parse_one(SLAPriority, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SLAPriority, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceSlasIdPrioritiesCountEndpoint:
+        """
+        The ServiceSlasIdPrioritiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSlasIdPrioritiesCountEndpoint(self.client, parent_endpoint=self))
@@ -50,4 +50,4 @@ class ServiceSlasInfoEndpoint(
         Returns:
             list[SLAInfo]: The parsed response data.
         """
-        return self._parse_many(SLAInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SLAInfo, super()._make_request("GET", data=data, params=params).content)
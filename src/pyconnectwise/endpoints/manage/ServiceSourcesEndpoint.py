@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ServiceSourcesEndpoint(
         IPostable.__init__(self, Source)
         IPaginateable.__init__(self, Source)
 
-        self.count = self._register_child_endpoint(ServiceSourcesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceSourcesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceSourcesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceSourcesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class ServiceSourcesEndpoint(
         Returns:
             list[Source]: The parsed response data.
         """
-        return self._parse_many(Source, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Source, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Source:
         """
@@ -83,4 +81,18 @@ class ServiceSourcesEndpoint(
         Returns:
             Source: The parsed response data.
         """
-        return self._parse_one(Source, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Source, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceSourcesCountEndpoint:
+        """
+        The ServiceSourcesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSourcesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceSourcesInfoEndpoint:
+        """
+        The ServiceSourcesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSourcesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class ServiceSourcesIdEndpoint(
         IPuttable.__init__(self, Source)
         IPaginateable.__init__(self, Source)
 
-        self.info = self._register_child_endpoint(ServiceSourcesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(ServiceSourcesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Source]:
@@ -69,7 +67,7 @@ class ServiceSourcesIdEndpoint(
         Returns:
             Source: The parsed response data.
         """
-        return self._parse_one(Source, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Source, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Source:
         """
@@ -81,7 +79,7 @@ class ServiceSourcesIdEndpoint(
         Returns:
             Source: The parsed response data.
         """
-        return self._parse_one(Source, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Source, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Source:
         """
@@ -93,4 +91,18 @@ class ServiceSourcesIdEndpoint(
         Returns:
             Source: The parsed response data.
         """
-        return self._parse_one(Source, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Source, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> ServiceSourcesIdInfoEndpoint:
+        """
+        The ServiceSourcesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSourcesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ServiceSourcesIdUsagesEndpoint:
+        """
+        The ServiceSourcesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSourcesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -50,4 +50,4 @@ class ServiceSourcesIdInfoEndpoint(
         Returns:
             SourceInfo: The parsed response data.
         """
-        return self._parse_one(SourceInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SourceInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class ServiceSourcesInfoEndpoint(
         IGettable.__init__(self, list[SourceInfo])
         IPaginateable.__init__(self, SourceInfo)
 
-        self.count = self._register_child_endpoint(ServiceSourcesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[SourceInfo]:
@@ -53,4 +52,11 @@ class ServiceSourcesInfoEndpoint(
         Returns:
             list[SourceInfo]: The parsed response data.
         """
-        return self._parse_many(SourceInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SourceInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceSourcesInfoCountEndpoint:
+        """
+        The ServiceSourcesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSourcesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ServiceSurveysEndpoint(
         IPostable.__init__(self, ServiceSurvey)
         IPaginateable.__init__(self, ServiceSurvey)
 
-        self.count = self._register_child_endpoint(ServiceSurveysCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceSurveysIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceSurveysIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class ServiceSurveysEndpoint(
         Returns:
             list[ServiceSurvey]: The parsed response data.
         """
-        return self._parse_many(ServiceSurvey, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceSurvey, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ServiceSurvey:
         """
@@ -85,4 +84,11 @@ class ServiceSurveysEndpoint(
         Returns:
             ServiceSurvey: The parsed response data.
         """
-        return self._parse_one(ServiceSurvey, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ServiceSurvey, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceSurveysCountEndpoint:
+        """
+        The ServiceSurveysCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysCountEndpoint(self.client, parent_endpoint=self))
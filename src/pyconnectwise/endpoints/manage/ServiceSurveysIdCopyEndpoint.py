@@ -24,4 +24,4 @@ class ServiceSurveysIdCopyEndpoint(ConnectWiseEndpoint, IPostable[ServiceSurvey,
         Returns:
             ServiceSurvey: The parsed response data.
         """
-        return self._parse_one(ServiceSurvey, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ServiceSurvey, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,11 +29,6 @@ class ServiceSurveysIdEndpoint(
         IPuttable.__init__(self, ServiceSurvey)
         IPaginateable.__init__(self, ServiceSurvey)
 
-        self.copy = self._register_child_endpoint(ServiceSurveysIdCopyEndpoint(client, parent_endpoint=self))
-        self.questions = self._register_child_endpoint(ServiceSurveysIdQuestionsEndpoint(client, parent_endpoint=self))
-        self.results = self._register_child_endpoint(ServiceSurveysIdResultsEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(ServiceSurveysIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ServiceSurvey]:
@@ -75,7 +71,7 @@ class ServiceSurveysIdEndpoint(
         Returns:
             ServiceSurvey: The parsed response data.
         """
-        return self._parse_one(ServiceSurvey, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceSurvey, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ServiceSurvey:
         """
@@ -87,7 +83,7 @@ class ServiceSurveysIdEndpoint(
         Returns:
             ServiceSurvey: The parsed response data.
         """
-        return self._parse_one(ServiceSurvey, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ServiceSurvey, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ServiceSurvey:
         """
@@ -99,4 +95,32 @@ class ServiceSurveysIdEndpoint(
         Returns:
             ServiceSurvey: The parsed response data.
         """
-        return self._parse_one(ServiceSurvey, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ServiceSurvey, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> ServiceSurveysIdCopyEndpoint:
+        """
+        The ServiceSurveysIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def questions(self) -> ServiceSurveysIdQuestionsEndpoint:
+        """
+        The ServiceSurveysIdQuestionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdQuestionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def results(self) -> ServiceSurveysIdResultsEndpoint:
+        """
+        The ServiceSurveysIdResultsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdResultsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ServiceSurveysIdUsagesEndpoint:
+        """
+        The ServiceSurveysIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdUsagesEndpoint(self.client, parent_endpoint=self))
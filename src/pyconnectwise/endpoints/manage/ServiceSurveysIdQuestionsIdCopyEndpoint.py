@@ -28,4 +28,4 @@ class ServiceSurveysIdQuestionsIdCopyEndpoint(
         Returns:
             ServiceSurveyQuestion: The parsed response data.
         """
-        return self._parse_one(ServiceSurveyQuestion, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ServiceSurveyQuestion, super()._make_request("POST", data=data, params=params).content)
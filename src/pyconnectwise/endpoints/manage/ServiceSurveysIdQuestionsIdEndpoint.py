@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -30,11 +31,6 @@ class ServiceSurveysIdQuestionsIdEndpoint(
         IPuttable.__init__(self, ServiceSurveyQuestion)
         IPaginateable.__init__(self, ServiceSurveyQuestion)
 
-        self.copy = self._register_child_endpoint(ServiceSurveysIdQuestionsIdCopyEndpoint(client, parent_endpoint=self))
-        self.options = self._register_child_endpoint(
-            ServiceSurveysIdQuestionsIdOptionsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ServiceSurveyQuestion]:
@@ -79,7 +75,7 @@ class ServiceSurveysIdQuestionsIdEndpoint(
         Returns:
             ServiceSurveyQuestion: The parsed response data.
         """
-        return self._parse_one(ServiceSurveyQuestion, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceSurveyQuestion, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -93,7 +89,7 @@ class ServiceSurveysIdQuestionsIdEndpoint(
         Returns:
             ServiceSurveyQuestion: The parsed response data.
         """
-        return self._parse_one(ServiceSurveyQuestion, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ServiceSurveyQuestion, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -107,4 +103,20 @@ class ServiceSurveysIdQuestionsIdEndpoint(
         Returns:
             ServiceSurveyQuestion: The parsed response data.
         """
-        return self._parse_one(ServiceSurveyQuestion, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ServiceSurveyQuestion, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> ServiceSurveysIdQuestionsIdCopyEndpoint:
+        """
+        The ServiceSurveysIdQuestionsIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdQuestionsIdCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def options(self) -> ServiceSurveysIdQuestionsIdOptionsEndpoint:
+        """
+        The ServiceSurveysIdQuestionsIdOptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceSurveysIdQuestionsIdOptionsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class ServiceSurveysIdQuestionsIdOptionsEndpoint(
         IPostable.__init__(self, SurveyOption)
         IPaginateable.__init__(self, SurveyOption)
 
-        self.count = self._register_child_endpoint(
-            ServiceSurveysIdQuestionsIdOptionsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> ServiceSurveysIdQuestionsIdOptionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceSurveysIdQuestionsIdOptionsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class ServiceSurveysIdQuestionsIdOptionsEndpoint(
         Returns:
             list[SurveyOption]: The parsed response data.
         """
-        return self._parse_many(SurveyOption, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SurveyOption, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SurveyOption:
         """
@@ -89,4 +86,13 @@ class ServiceSurveysIdQuestionsIdOptionsEndpoint(
         Returns:
             SurveyOption: The parsed response data.
         """
-        return self._parse_one(SurveyOption, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SurveyOption, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceSurveysIdQuestionsIdOptionsCountEndpoint:
+        """
+        The ServiceSurveysIdQuestionsIdOptionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceSurveysIdQuestionsIdOptionsCountEndpoint(self.client, parent_endpoint=self)
+        )
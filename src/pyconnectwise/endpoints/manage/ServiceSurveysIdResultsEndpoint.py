@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ServiceSurveysIdResultsEndpoint(
         IPostable.__init__(self, SurveyResult)
         IPaginateable.__init__(self, SurveyResult)
 
-        self.count = self._register_child_endpoint(ServiceSurveysIdResultsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceSurveysIdResultsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceSurveysIdResultsIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class ServiceSurveysIdResultsEndpoint(
         Returns:
             list[SurveyResult]: The parsed response data.
         """
-        return self._parse_many(SurveyResult, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SurveyResult, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SurveyResult:
         """
@@ -83,4 +82,11 @@ class ServiceSurveysIdResultsEndpoint(
         Returns:
             SurveyResult: The parsed response data.
         """
-        return self._parse_one(SurveyResult, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SurveyResult, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceSurveysIdResultsCountEndpoint:
+        """
+        The ServiceSurveysIdResultsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdResultsCountEndpoint(self.client, parent_endpoint=self))
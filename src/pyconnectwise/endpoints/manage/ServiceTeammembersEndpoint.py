@@ -24,4 +24,4 @@ class ServiceTeammembersEndpoint(ConnectWiseEndpoint, IPostable[TeamMember, Conn
         Returns:
             TeamMember: The parsed response data.
         """
-        return self._parse_one(TeamMember, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TeamMember, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class ServiceTeamsEndpoint(
         IGettable.__init__(self, list[ServiceTeam])
         IPaginateable.__init__(self, ServiceTeam)
 
-        self.count = self._register_child_endpoint(ServiceTeamsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceTeamsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceTeamsIdEndpoint object to move down the chain.
@@ -69,4 +68,11 @@ class ServiceTeamsEndpoint(
         Returns:
             list[ServiceTeam]: The parsed response data.
         """
-        return self._parse_many(ServiceTeam, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceTeam, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceTeamsCountEndpoint:
+        """
+        The ServiceTeamsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTeamsCountEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class ServiceTeamsIdEndpoint(
         Returns:
             ServiceTeam: The parsed response data.
         """
-        return self._parse_one(ServiceTeam, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceTeam, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,9 +24,6 @@ class ServiceTemplatesEndpoint(
         IGettable.__init__(self, list[ServiceTemplate])
         IPaginateable.__init__(self, ServiceTemplate)
 
-        self.count = self._register_child_endpoint(ServiceTemplatesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceTemplatesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceTemplatesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceTemplatesIdEndpoint object to move down the chain.
@@ -73,4 +71,18 @@ class ServiceTemplatesEndpoint(
         Returns:
             list[ServiceTemplate]: The parsed response data.
         """
-        return self._parse_many(ServiceTemplate, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceTemplate, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceTemplatesCountEndpoint:
+        """
+        The ServiceTemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTemplatesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceTemplatesInfoEndpoint:
+        """
+        The ServiceTemplatesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTemplatesInfoEndpoint(self.client, parent_endpoint=self))
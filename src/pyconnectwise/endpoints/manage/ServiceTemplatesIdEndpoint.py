@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,9 +23,6 @@ class ServiceTemplatesIdEndpoint(
         IGettable.__init__(self, ServiceTemplate)
         IPaginateable.__init__(self, ServiceTemplate)
 
-        self.generate = self._register_child_endpoint(ServiceTemplatesIdGenerateEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceTemplatesIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ServiceTemplate]:
@@ -57,4 +55,18 @@ class ServiceTemplatesIdEndpoint(
         Returns:
             ServiceTemplate: The parsed response data.
         """
-        return self._parse_one(ServiceTemplate, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceTemplate, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def generate(self) -> ServiceTemplatesIdGenerateEndpoint:
+        """
+        The ServiceTemplatesIdGenerateEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTemplatesIdGenerateEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceTemplatesIdInfoEndpoint:
+        """
+        The ServiceTemplatesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTemplatesIdInfoEndpoint(self.client, parent_endpoint=self))
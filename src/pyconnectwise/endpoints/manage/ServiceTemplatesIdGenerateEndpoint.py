@@ -29,5 +29,5 @@ class ServiceTemplatesIdGenerateEndpoint(
             TemplateGeneratedCountsModel: The parsed response data.
         """
         return self._parse_one(
-            TemplateGeneratedCountsModel, super()._make_request("POST", data=data, params=params).json()
+            TemplateGeneratedCountsModel, super()._make_request("POST", data=data, params=params).content
         )
@@ -54,4 +54,4 @@ class ServiceTemplatesIdInfoEndpoint(
         Returns:
             ServiceTemplateInfo: The parsed response data.
         """
-        return self._parse_one(ServiceTemplateInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceTemplateInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class ServiceTicketlinksEndpoint(
         IPostable.__init__(self, ServiceTicketLink)
         IPaginateable.__init__(self, ServiceTicketLink)
 
-        self.count = self._register_child_endpoint(ServiceTicketlinksCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceTicketlinksInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceTicketlinksIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceTicketlinksIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class ServiceTicketlinksEndpoint(
         Returns:
             list[ServiceTicketLink]: The parsed response data.
         """
-        return self._parse_many(ServiceTicketLink, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceTicketLink, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ServiceTicketLink:
         """
@@ -87,4 +85,18 @@ class ServiceTicketlinksEndpoint(
         Returns:
             ServiceTicketLink: The parsed response data.
         """
-        return self._parse_one(ServiceTicketLink, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ServiceTicketLink, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceTicketlinksCountEndpoint:
+        """
+        The ServiceTicketlinksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketlinksCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceTicketlinksInfoEndpoint:
+        """
+        The ServiceTicketlinksInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketlinksInfoEndpoint(self.client, parent_endpoint=self))
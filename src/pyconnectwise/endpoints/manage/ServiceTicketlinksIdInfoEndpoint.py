@@ -54,4 +54,4 @@ class ServiceTicketlinksIdInfoEndpoint(
         Returns:
             ServiceTicketLinkInfo: The parsed response data.
         """
-        return self._parse_one(ServiceTicketLinkInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceTicketLinkInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class ServiceTicketlinksInfoEndpoint(
         IGettable.__init__(self, list[ServiceTicketLinkInfo])
         IPaginateable.__init__(self, ServiceTicketLinkInfo)
 
-        self.count = self._register_child_endpoint(ServiceTicketlinksInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ServiceTicketLinkInfo]:
@@ -57,4 +56,11 @@ class ServiceTicketlinksInfoEndpoint(
         Returns:
             list[ServiceTicketLinkInfo]: The parsed response data.
         """
-        return self._parse_many(ServiceTicketLinkInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceTicketLinkInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceTicketlinksInfoCountEndpoint:
+        """
+        The ServiceTicketlinksInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketlinksInfoCountEndpoint(self.client, parent_endpoint=self))
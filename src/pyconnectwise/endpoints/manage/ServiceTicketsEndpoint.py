@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class ServiceTicketsEndpoint(
         IPostable.__init__(self, Ticket)
         IPaginateable.__init__(self, Ticket)
 
-        self.count = self._register_child_endpoint(ServiceTicketsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceTicketsInfoEndpoint(client, parent_endpoint=self))
-        self.search = self._register_child_endpoint(ServiceTicketsSearchEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceTicketsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceTicketsIdEndpoint object to move down the chain.
@@ -73,7 +70,7 @@ class ServiceTicketsEndpoint(
         Returns:
             list[Ticket]: The parsed response data.
         """
-        return self._parse_many(Ticket, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Ticket, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Ticket:
         """
@@ -85,4 +82,25 @@ class ServiceTicketsEndpoint(
         Returns:
             Ticket: The parsed response data.
         """
-        return self._parse_one(Ticket, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Ticket, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceTicketsCountEndpoint:
+        """
+        The ServiceTicketsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceTicketsInfoEndpoint:
+        """
+        The ServiceTicketsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def search(self) -> ServiceTicketsSearchEndpoint:
+        """
+        The ServiceTicketsSearchEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsSearchEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class ServiceTicketsIdActivitiesEndpoint(
         IGettable.__init__(self, list[ActivityReference])
         IPaginateable.__init__(self, ActivityReference)
 
-        self.count = self._register_child_endpoint(
-            ServiceTicketsIdActivitiesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ActivityReference]:
@@ -61,4 +58,11 @@ class ServiceTicketsIdActivitiesEndpoint(
         Returns:
             list[ActivityReference]: The parsed response data.
         """
-        return self._parse_many(ActivityReference, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ActivityReference, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceTicketsIdActivitiesCountEndpoint:
+        """
+        The ServiceTicketsIdActivitiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdActivitiesCountEndpoint(self.client, parent_endpoint=self))
@@ -54,4 +54,4 @@ class ServiceTicketsIdAllnotesEndpoint(
         Returns:
             list[ServiceTicketNote]: The parsed response data.
         """
-        return self._parse_many(ServiceTicketNote, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceTicketNote, super()._make_request("GET", data=data, params=params).content)
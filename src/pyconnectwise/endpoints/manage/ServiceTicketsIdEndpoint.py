@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -39,30 +40,6 @@ class ServiceTicketsIdEndpoint(
         IPuttable.__init__(self, Ticket)
         IPaginateable.__init__(self, Ticket)
 
-        self.activities = self._register_child_endpoint(
-            ServiceTicketsIdActivitiesEndpoint(client, parent_endpoint=self)
-        )
-        self.all_notes = self._register_child_endpoint(ServiceTicketsIdAllnotesEndpoint(client, parent_endpoint=self))
-        self.attach_children = self._register_child_endpoint(
-            ServiceTicketsIdAttachchildrenEndpoint(client, parent_endpoint=self)
-        )
-        self.configurations = self._register_child_endpoint(
-            ServiceTicketsIdConfigurationsEndpoint(client, parent_endpoint=self)
-        )
-        self.convert = self._register_child_endpoint(ServiceTicketsIdConvertEndpoint(client, parent_endpoint=self))
-        self.documents = self._register_child_endpoint(ServiceTicketsIdDocumentsEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(ServiceTicketsIdInfoEndpoint(client, parent_endpoint=self))
-        self.merge = self._register_child_endpoint(ServiceTicketsIdMergeEndpoint(client, parent_endpoint=self))
-        self.notes = self._register_child_endpoint(ServiceTicketsIdNotesEndpoint(client, parent_endpoint=self))
-        self.products = self._register_child_endpoint(ServiceTicketsIdProductsEndpoint(client, parent_endpoint=self))
-        self.scheduleentries = self._register_child_endpoint(
-            ServiceTicketsIdScheduleentriesEndpoint(client, parent_endpoint=self)
-        )
-        self.tasks = self._register_child_endpoint(ServiceTicketsIdTasksEndpoint(client, parent_endpoint=self))
-        self.timeentries = self._register_child_endpoint(
-            ServiceTicketsIdTimeentriesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Ticket]:
@@ -103,7 +80,7 @@ class ServiceTicketsIdEndpoint(
         Returns:
             Ticket: The parsed response data.
         """
-        return self._parse_one(Ticket, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Ticket, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Ticket:
         """
@@ -115,7 +92,7 @@ class ServiceTicketsIdEndpoint(
         Returns:
             Ticket: The parsed response data.
         """
-        return self._parse_one(Ticket, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Ticket, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Ticket:
         """
@@ -127,4 +104,95 @@ class ServiceTicketsIdEndpoint(
         Returns:
             Ticket: The parsed response data.
         """
-        return self._parse_one(Ticket, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Ticket, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def activities(self) -> ServiceTicketsIdActivitiesEndpoint:
+        """
+        The ServiceTicketsIdActivitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdActivitiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def all_notes(self) -> ServiceTicketsIdAllnotesEndpoint:
+        """
+        The ServiceTicketsIdAllnotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdAllnotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def attach_children(self) -> ServiceTicketsIdAttachchildrenEndpoint:
+        """
+        The ServiceTicketsIdAttachchildrenEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdAttachchildrenEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def configurations(self) -> ServiceTicketsIdConfigurationsEndpoint:
+        """
+        The ServiceTicketsIdConfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdConfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def convert(self) -> ServiceTicketsIdConvertEndpoint:
+        """
+        The ServiceTicketsIdConvertEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdConvertEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def documents(self) -> ServiceTicketsIdDocumentsEndpoint:
+        """
+        The ServiceTicketsIdDocumentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdDocumentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceTicketsIdInfoEndpoint:
+        """
+        The ServiceTicketsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def merge(self) -> ServiceTicketsIdMergeEndpoint:
+        """
+        The ServiceTicketsIdMergeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdMergeEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notes(self) -> ServiceTicketsIdNotesEndpoint:
+        """
+        The ServiceTicketsIdNotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdNotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def products(self) -> ServiceTicketsIdProductsEndpoint:
+        """
+        The ServiceTicketsIdProductsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdProductsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scheduleentries(self) -> ServiceTicketsIdScheduleentriesEndpoint:
+        """
+        The ServiceTicketsIdScheduleentriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdScheduleentriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tasks(self) -> ServiceTicketsIdTasksEndpoint:
+        """
+        The ServiceTicketsIdTasksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdTasksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def timeentries(self) -> ServiceTicketsIdTimeentriesEndpoint:
+        """
+        The ServiceTicketsIdTimeentriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdTimeentriesEndpoint(self.client, parent_endpoint=self))
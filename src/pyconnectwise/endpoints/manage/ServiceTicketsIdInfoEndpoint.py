@@ -50,4 +50,4 @@ class ServiceTicketsIdInfoEndpoint(
         Returns:
             TicketInfo: The parsed response data.
         """
-        return self._parse_one(TicketInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TicketInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ServiceTicketsIdNotesEndpoint(
         IPostable.__init__(self, ServiceNote)
         IPaginateable.__init__(self, ServiceNote)
 
-        self.count = self._register_child_endpoint(ServiceTicketsIdNotesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceTicketsIdNotesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceTicketsIdNotesIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class ServiceTicketsIdNotesEndpoint(
         Returns:
             list[ServiceNote]: The parsed response data.
         """
-        return self._parse_many(ServiceNote, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceNote, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ServiceNote:
         """
@@ -83,4 +82,11 @@ class ServiceTicketsIdNotesEndpoint(
         Returns:
             ServiceNote: The parsed response data.
         """
-        return self._parse_one(ServiceNote, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ServiceNote, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceTicketsIdNotesCountEndpoint:
+        """
+        The ServiceTicketsIdNotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdNotesCountEndpoint(self.client, parent_endpoint=self))
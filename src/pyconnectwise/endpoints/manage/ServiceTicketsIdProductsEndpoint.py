@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class ServiceTicketsIdProductsEndpoint(
         IGettable.__init__(self, list[ProductReference])
         IPaginateable.__init__(self, ProductReference)
 
-        self.count = self._register_child_endpoint(ServiceTicketsIdProductsCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ProductReference]:
@@ -57,4 +56,11 @@ class ServiceTicketsIdProductsEndpoint(
         Returns:
             list[ProductReference]: The parsed response data.
         """
-        return self._parse_many(ProductReference, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ProductReference, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceTicketsIdProductsCountEndpoint:
+        """
+        The ServiceTicketsIdProductsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdProductsCountEndpoint(self.client, parent_endpoint=self))
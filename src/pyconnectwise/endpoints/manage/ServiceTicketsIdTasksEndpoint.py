@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ServiceTicketsIdTasksEndpoint(
         IPostable.__init__(self, Task)
         IPaginateable.__init__(self, Task)
 
-        self.count = self._register_child_endpoint(ServiceTicketsIdTasksCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceTicketsIdTasksIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceTicketsIdTasksIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class ServiceTicketsIdTasksEndpoint(
         Returns:
             list[Task]: The parsed response data.
         """
-        return self._parse_many(Task, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Task, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Task:
         """
@@ -81,4 +80,11 @@ class ServiceTicketsIdTasksEndpoint(
         Returns:
             Task: The parsed response data.
         """
-        return self._parse_one(Task, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Task, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceTicketsIdTasksCountEndpoint:
+        """
+        The ServiceTicketsIdTasksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdTasksCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class ServiceTicketsInfoEndpoint(
         IGettable.__init__(self, list[TicketInfo])
         IPaginateable.__init__(self, TicketInfo)
 
-        self.count = self._register_child_endpoint(ServiceTicketsInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[TicketInfo]:
@@ -53,4 +52,11 @@ class ServiceTicketsInfoEndpoint(
         Returns:
             list[TicketInfo]: The parsed response data.
         """
-        return self._parse_many(TicketInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TicketInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceTicketsInfoCountEndpoint:
+        """
+        The ServiceTicketsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -24,4 +24,4 @@ class ServiceTicketsSearchEndpoint(ConnectWiseEndpoint, IPostable[list[Ticket],
         Returns:
             list[Ticket]: The parsed response data.
         """
-        return self._parse_many(Ticket, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_many(Ticket, super()._make_request("POST", data=data, params=params).content)
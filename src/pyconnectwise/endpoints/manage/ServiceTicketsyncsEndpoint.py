@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class ServiceTicketsyncsEndpoint(
         IPostable.__init__(self, TicketSync)
         IPaginateable.__init__(self, TicketSync)
 
-        self.count = self._register_child_endpoint(ServiceTicketsyncsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> ServiceTicketsyncsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized ServiceTicketsyncsIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class ServiceTicketsyncsEndpoint(
         Returns:
             list[TicketSync]: The parsed response data.
         """
-        return self._parse_many(TicketSync, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TicketSync, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TicketSync:
         """
@@ -81,4 +80,11 @@ class ServiceTicketsyncsEndpoint(
         Returns:
             TicketSync: The parsed response data.
         """
-        return self._parse_one(TicketSync, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TicketSync, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> ServiceTicketsyncsCountEndpoint:
+        """
+        The ServiceTicketsyncsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsyncsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemAllowedoriginsEndpoint(
         IPostable.__init__(self, AllowedOrigin)
         IPaginateable.__init__(self, AllowedOrigin)
 
-        self.count = self._register_child_endpoint(SystemAllowedoriginsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemAllowedoriginsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemAllowedoriginsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemAllowedoriginsEndpoint(
         Returns:
             list[AllowedOrigin]: The parsed response data.
         """
-        return self._parse_many(AllowedOrigin, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AllowedOrigin, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AllowedOrigin:
         """
@@ -85,4 +84,11 @@ class SystemAllowedoriginsEndpoint(
         Returns:
             AllowedOrigin: The parsed response data.
         """
-        return self._parse_one(AllowedOrigin, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AllowedOrigin, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemAllowedoriginsCountEndpoint:
+        """
+        The SystemAllowedoriginsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAllowedoriginsCountEndpoint(self.client, parent_endpoint=self))
@@ -50,4 +50,4 @@ class SystemApimembersDefaultEndpoint(
         Returns:
             ApiMember: The parsed response data.
         """
-        return self._parse_one(ApiMember, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ApiMember, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SystemApimembersEndpoint(
         IPostable.__init__(self, ApiMember)
         IPaginateable.__init__(self, ApiMember)
 
-        self.count = self._register_child_endpoint(SystemApimembersCountEndpoint(client, parent_endpoint=self))
-        self.default = self._register_child_endpoint(SystemApimembersDefaultEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemApimembersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemApimembersIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class SystemApimembersEndpoint(
         Returns:
             list[ApiMember]: The parsed response data.
         """
-        return self._parse_many(ApiMember, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ApiMember, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ApiMember:
         """
@@ -83,4 +81,18 @@ class SystemApimembersEndpoint(
         Returns:
             ApiMember: The parsed response data.
         """
-        return self._parse_one(ApiMember, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ApiMember, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemApimembersCountEndpoint:
+        """
+        The SystemApimembersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemApimembersCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def default(self) -> SystemApimembersDefaultEndpoint:
+        """
+        The SystemApimembersDefaultEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemApimembersDefaultEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,11 +24,6 @@ class SystemAuthanvilsEndpoint(
         IGettable.__init__(self, list[AuthAnvil])
         IPaginateable.__init__(self, AuthAnvil)
 
-        self.count = self._register_child_endpoint(SystemAuthanvilsCountEndpoint(client, parent_endpoint=self))
-        self.test_connection = self._register_child_endpoint(
-            SystemAuthanvilsTestconnectionEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemAuthanvilsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemAuthanvilsIdEndpoint object to move down the chain.
@@ -71,4 +67,18 @@ class SystemAuthanvilsEndpoint(
         Returns:
             list[AuthAnvil]: The parsed response data.
         """
-        return self._parse_many(AuthAnvil, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AuthAnvil, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemAuthanvilsCountEndpoint:
+        """
+        The SystemAuthanvilsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAuthanvilsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def test_connection(self) -> SystemAuthanvilsTestconnectionEndpoint:
+        """
+        The SystemAuthanvilsTestconnectionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAuthanvilsTestconnectionEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemAutosynctimeEndpoint(
         IPostable.__init__(self, AutoSyncTime)
         IPaginateable.__init__(self, AutoSyncTime)
 
-        self.count = self._register_child_endpoint(SystemAutosynctimeCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemAutosynctimeIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemAutosynctimeIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class SystemAutosynctimeEndpoint(
         Returns:
             list[AutoSyncTime]: The parsed response data.
         """
-        return self._parse_many(AutoSyncTime, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(AutoSyncTime, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AutoSyncTime:
         """
@@ -83,4 +82,11 @@ class SystemAutosynctimeEndpoint(
         Returns:
             AutoSyncTime: The parsed response data.
         """
-        return self._parse_one(AutoSyncTime, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(AutoSyncTime, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemAutosynctimeCountEndpoint:
+        """
+        The SystemAutosynctimeCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAutosynctimeCountEndpoint(self.client, parent_endpoint=self))
@@ -66,7 +66,7 @@ class SystemAutosynctimeIdEndpoint(
         Returns:
             AutoSyncTime: The parsed response data.
         """
-        return self._parse_one(AutoSyncTime, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(AutoSyncTime, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> AutoSyncTime:
         """
@@ -78,7 +78,7 @@ class SystemAutosynctimeIdEndpoint(
         Returns:
             AutoSyncTime: The parsed response data.
         """
-        return self._parse_one(AutoSyncTime, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(AutoSyncTime, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> AutoSyncTime:
         """
@@ -90,4 +90,4 @@ class SystemAutosynctimeIdEndpoint(
         Returns:
             AutoSyncTime: The parsed response data.
         """
-        return self._parse_one(AutoSyncTime, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(AutoSyncTime, super()._make_request("PUT", data=data, params=params).content)
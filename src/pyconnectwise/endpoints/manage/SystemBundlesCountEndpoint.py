@@ -28,4 +28,4 @@ class SystemBundlesCountEndpoint(
         Returns:
             BundleResultsCollection: The parsed response data.
         """
-        return self._parse_one(BundleResultsCollection, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BundleResultsCollection, super()._make_request("POST", data=data, params=params).content)
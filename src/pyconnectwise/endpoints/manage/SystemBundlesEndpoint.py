@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -15,8 +16,6 @@ class SystemBundlesEndpoint(ConnectWiseEndpoint, IPostable[BundleResultsCollecti
         ConnectWiseEndpoint.__init__(self, client, "bundles", parent_endpoint=parent_endpoint)
         IPostable.__init__(self, BundleResultsCollection)
 
-        self.count = self._register_child_endpoint(SystemBundlesCountEndpoint(client, parent_endpoint=self))
-
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
     ) -> BundleResultsCollection:
@@ -29,4 +28,11 @@ class SystemBundlesEndpoint(ConnectWiseEndpoint, IPostable[BundleResultsCollecti
         Returns:
             BundleResultsCollection: The parsed response data.
         """
-        return self._parse_one(BundleResultsCollection, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(BundleResultsCollection, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemBundlesCountEndpoint:
+        """
+        The SystemBundlesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemBundlesCountEndpoint(self.client, parent_endpoint=self))
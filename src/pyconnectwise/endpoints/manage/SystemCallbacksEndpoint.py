@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemCallbacksEndpoint(
         IPostable.__init__(self, CallbackEntry)
         IPaginateable.__init__(self, CallbackEntry)
 
-        self.count = self._register_child_endpoint(SystemCallbacksCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemCallbacksIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemCallbacksIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemCallbacksEndpoint(
         Returns:
             list[CallbackEntry]: The parsed response data.
         """
-        return self._parse_many(CallbackEntry, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CallbackEntry, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CallbackEntry:
         """
@@ -85,4 +84,11 @@ class SystemCallbacksEndpoint(
         Returns:
             CallbackEntry: The parsed response data.
         """
-        return self._parse_one(CallbackEntry, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CallbackEntry, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemCallbacksCountEndpoint:
+        """
+        The SystemCallbacksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCallbacksCountEndpoint(self.client, parent_endpoint=self))
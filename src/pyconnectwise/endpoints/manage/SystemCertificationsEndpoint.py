@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemCertificationsEndpoint(
         IPostable.__init__(self, Certification)
         IPaginateable.__init__(self, Certification)
 
-        self.count = self._register_child_endpoint(SystemCertificationsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemCertificationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemCertificationsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemCertificationsEndpoint(
         Returns:
             list[Certification]: The parsed response data.
         """
-        return self._parse_many(Certification, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Certification, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Certification:
         """
@@ -85,4 +84,11 @@ class SystemCertificationsEndpoint(
         Returns:
             Certification: The parsed response data.
         """
-        return self._parse_one(Certification, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Certification, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemCertificationsCountEndpoint:
+        """
+        The SystemCertificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCertificationsCountEndpoint(self.client, parent_endpoint=self))
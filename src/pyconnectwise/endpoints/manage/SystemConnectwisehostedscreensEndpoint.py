@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class SystemConnectwisehostedscreensEndpoint(
         IGettable.__init__(self, list[ConnectWiseHostedScreen])
         IPaginateable.__init__(self, ConnectWiseHostedScreen)
 
-        self.count = self._register_child_endpoint(
-            SystemConnectwisehostedscreensCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemConnectwisehostedscreensIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemConnectwisehostedscreensIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class SystemConnectwisehostedscreensEndpoint(
         Returns:
             list[ConnectWiseHostedScreen]: The parsed response data.
         """
-        return self._parse_many(ConnectWiseHostedScreen, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ConnectWiseHostedScreen, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemConnectwisehostedscreensCountEndpoint:
+        """
+        The SystemConnectwisehostedscreensCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemConnectwisehostedscreensCountEndpoint(self.client, parent_endpoint=self)
+        )
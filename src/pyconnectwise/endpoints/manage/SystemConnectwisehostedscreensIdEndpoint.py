@@ -54,4 +54,4 @@ class SystemConnectwisehostedscreensIdEndpoint(
         Returns:
             ConnectWiseHostedScreen: The parsed response data.
         """
-        return self._parse_one(ConnectWiseHostedScreen, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ConnectWiseHostedScreen, super()._make_request("GET", data=data, params=params).content)
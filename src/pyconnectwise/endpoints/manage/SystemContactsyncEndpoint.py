@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringEndpoint import (
     SystemContactsyncMonitoringEndpoint,
@@ -8,6 +10,9 @@ class SystemContactsyncEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "contactsync", parent_endpoint=parent_endpoint)
 
-        self.monitoring = self._register_child_endpoint(
-            SystemContactsyncMonitoringEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def monitoring(self) -> SystemContactsyncMonitoringEndpoint:
+        """
+        The SystemContactsyncMonitoringEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemContactsyncMonitoringEndpoint(self.client, parent_endpoint=self))
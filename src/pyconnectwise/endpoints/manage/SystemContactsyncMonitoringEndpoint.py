@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.SystemContactsyncMonitoringCountEndpoint import (
     SystemContactsyncMonitoringCountEndpoint,
@@ -33,14 +35,6 @@ class SystemContactsyncMonitoringEndpoint(
         IGettable.__init__(self, list[M365ContactSyncMonitoring])
         IPaginateable.__init__(self, M365ContactSyncMonitoring)
 
-        self.notificationtype = self._register_child_endpoint(
-            SystemContactsyncMonitoringNotificationtypeEndpoint(client, parent_endpoint=self)
-        )
-        self.count = self._register_child_endpoint(
-            SystemContactsyncMonitoringCountEndpoint(client, parent_endpoint=self)
-        )
-        self.type = self._register_child_endpoint(SystemContactsyncMonitoringTypeEndpoint(client, parent_endpoint=self))
-
     def id(self, id: int) -> SystemContactsyncMonitoringIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized SystemContactsyncMonitoringIdEndpoint object to move down the chain.
@@ -100,5 +94,30 @@ class SystemContactsyncMonitoringEndpoint(
         """
         return self._parse_many(
             M365ContactSyncMonitoring,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
+        )
+
+    @cached_property
+    def count(self) -> SystemContactsyncMonitoringCountEndpoint:
+        """
+        The SystemContactsyncMonitoringCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemContactsyncMonitoringCountEndpoint(self.client, parent_endpoint=self)
         )
+
+    @cached_property
+    def notificationtype(self) -> SystemContactsyncMonitoringNotificationtypeEndpoint:
+        """
+        The SystemContactsyncMonitoringNotificationtypeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemContactsyncMonitoringNotificationtypeEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def type(self) -> SystemContactsyncMonitoringTypeEndpoint:
+        """
+        The SystemContactsyncMonitoringTypeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemContactsyncMonitoringTypeEndpoint(self.client, parent_endpoint=self))
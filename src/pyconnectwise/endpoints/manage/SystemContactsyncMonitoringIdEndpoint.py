@@ -67,5 +67,5 @@ class SystemContactsyncMonitoringIdEndpoint(
         """
         return self._parse_one(
             M365ContactSyncMonitoring,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
@@ -67,7 +67,7 @@ class SystemContactsyncMonitoringTypeIdEndpoint(
         """
         return self._parse_one(
             M365ContactSyncMonitoring,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def delete(
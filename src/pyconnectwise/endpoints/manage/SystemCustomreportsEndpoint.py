@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemCustomreportsEndpoint(
         IPostable.__init__(self, CustomReport)
         IPaginateable.__init__(self, CustomReport)
 
-        self.count = self._register_child_endpoint(SystemCustomreportsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemCustomreportsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemCustomreportsIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class SystemCustomreportsEndpoint(
         Returns:
             list[CustomReport]: The parsed response data.
         """
-        return self._parse_many(CustomReport, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CustomReport, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CustomReport:
         """
@@ -83,4 +82,11 @@ class SystemCustomreportsEndpoint(
         Returns:
             CustomReport: The parsed response data.
         """
-        return self._parse_one(CustomReport, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(CustomReport, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemCustomreportsCountEndpoint:
+        """
+        The SystemCustomreportsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCustomreportsCountEndpoint(self.client, parent_endpoint=self))
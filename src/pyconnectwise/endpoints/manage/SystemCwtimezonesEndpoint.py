@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemCwtimezonesEndpoint(
         IGettable.__init__(self, list[CwTimeZone])
         IPaginateable.__init__(self, CwTimeZone)
 
-        self.count = self._register_child_endpoint(SystemCwtimezonesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemCwtimezonesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemCwtimezonesIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class SystemCwtimezonesEndpoint(
         Returns:
             list[CwTimeZone]: The parsed response data.
         """
-        return self._parse_many(CwTimeZone, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CwTimeZone, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemCwtimezonesCountEndpoint:
+        """
+        The SystemCwtimezonesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCwtimezonesCountEndpoint(self.client, parent_endpoint=self))
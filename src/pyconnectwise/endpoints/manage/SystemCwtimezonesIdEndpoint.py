@@ -50,4 +50,4 @@ class SystemCwtimezonesIdEndpoint(
         Returns:
             CwTimeZone: The parsed response data.
         """
-        return self._parse_one(CwTimeZone, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CwTimeZone, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemDepartmentsEndpoint(
         IPostable.__init__(self, Department)
         IPaginateable.__init__(self, Department)
 
-        self.count = self._register_child_endpoint(SystemDepartmentsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemDepartmentsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemDepartmentsIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class SystemDepartmentsEndpoint(
         Returns:
             list[Department]: The parsed response data.
         """
-        return self._parse_many(Department, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Department, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Department:
         """
@@ -81,4 +80,11 @@ class SystemDepartmentsEndpoint(
         Returns:
             Department: The parsed response data.
         """
-        return self._parse_one(Department, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Department, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemDepartmentsCountEndpoint:
+        """
+        The SystemDepartmentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDepartmentsCountEndpoint(self.client, parent_endpoint=self))
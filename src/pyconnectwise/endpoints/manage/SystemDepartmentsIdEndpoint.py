@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,11 +27,6 @@ class SystemDepartmentsIdEndpoint(
         IPuttable.__init__(self, Department)
         IPaginateable.__init__(self, Department)
 
-        self.locations = self._register_child_endpoint(
-            SystemDepartmentsIdLocationsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(SystemDepartmentsIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Department]:
@@ -71,7 +67,7 @@ class SystemDepartmentsIdEndpoint(
         Returns:
             Department: The parsed response data.
         """
-        return self._parse_one(Department, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Department, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Department:
         """
@@ -83,7 +79,7 @@ class SystemDepartmentsIdEndpoint(
         Returns:
             Department: The parsed response data.
         """
-        return self._parse_one(Department, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Department, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Department:
         """
@@ -95,4 +91,18 @@ class SystemDepartmentsIdEndpoint(
         Returns:
             Department: The parsed response data.
         """
-        return self._parse_one(Department, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Department, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def locations(self) -> SystemDepartmentsIdLocationsEndpoint:
+        """
+        The SystemDepartmentsIdLocationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDepartmentsIdLocationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> SystemDepartmentsIdUsagesEndpoint:
+        """
+        The SystemDepartmentsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDepartmentsIdUsagesEndpoint(self.client, parent_endpoint=self))
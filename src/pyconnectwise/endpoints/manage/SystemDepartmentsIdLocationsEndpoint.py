@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class SystemDepartmentsIdLocationsEndpoint(
         IPostable.__init__(self, DepartmentLocation)
         IPaginateable.__init__(self, DepartmentLocation)
 
-        self.count = self._register_child_endpoint(
-            SystemDepartmentsIdLocationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemDepartmentsIdLocationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemDepartmentsIdLocationsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class SystemDepartmentsIdLocationsEndpoint(
         Returns:
             list[DepartmentLocation]: The parsed response data.
         """
-        return self._parse_many(DepartmentLocation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DepartmentLocation, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -91,4 +88,13 @@ class SystemDepartmentsIdLocationsEndpoint(
         Returns:
             DepartmentLocation: The parsed response data.
         """
-        return self._parse_one(DepartmentLocation, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(DepartmentLocation, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemDepartmentsIdLocationsCountEndpoint:
+        """
+        The SystemDepartmentsIdLocationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemDepartmentsIdLocationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.SystemDirectionalsyncsIdEndpoint import (
     SystemDirectionalsyncsIdEndpoint,
@@ -11,8 +13,6 @@ class SystemDirectionalsyncsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "directionalSyncs", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(SystemDirectionalsyncsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, id: int) -> SystemDirectionalsyncsIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized SystemDirectionalsyncsIdEndpoint object to move down the chain.
@@ -25,3 +25,10 @@ class SystemDirectionalsyncsEndpoint(ConnectWiseEndpoint):
         child = SystemDirectionalsyncsIdEndpoint(self.client, parent_endpoint=self)
         child._id = id
         return child
+
+    @cached_property
+    def info(self) -> SystemDirectionalsyncsInfoEndpoint:
+        """
+        The SystemDirectionalsyncsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDirectionalsyncsInfoEndpoint(self.client, parent_endpoint=self))
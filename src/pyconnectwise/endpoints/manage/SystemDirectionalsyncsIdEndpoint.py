@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.SystemDirectionalsyncsIdInfoEndpoint import (
     SystemDirectionalsyncsIdInfoEndpoint,
@@ -8,4 +10,9 @@ class SystemDirectionalsyncsIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(SystemDirectionalsyncsIdInfoEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def info(self) -> SystemDirectionalsyncsIdInfoEndpoint:
+        """
+        The SystemDirectionalsyncsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDirectionalsyncsIdInfoEndpoint(self.client, parent_endpoint=self))
@@ -67,5 +67,5 @@ class SystemDirectionalsyncsIdInfoEndpoint(
         """
         return self._parse_one(
             DirectionalSyncInfo,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
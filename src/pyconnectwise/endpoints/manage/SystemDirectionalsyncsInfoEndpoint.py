@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.SystemDirectionalsyncsInfoCountEndpoint import (
     SystemDirectionalsyncsInfoCountEndpoint,
@@ -24,10 +26,6 @@ class SystemDirectionalsyncsInfoEndpoint(
         IGettable.__init__(self, list[DirectionalSyncInfo])
         IPaginateable.__init__(self, DirectionalSyncInfo)
 
-        self.count = self._register_child_endpoint(
-            SystemDirectionalsyncsInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self,
         page: int,
@@ -74,5 +72,12 @@ class SystemDirectionalsyncsInfoEndpoint(
         """
         return self._parse_many(
             DirectionalSyncInfo,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
+
+    @cached_property
+    def count(self) -> SystemDirectionalsyncsInfoCountEndpoint:
+        """
+        The SystemDirectionalsyncsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDirectionalsyncsInfoCountEndpoint(self.client, parent_endpoint=self))
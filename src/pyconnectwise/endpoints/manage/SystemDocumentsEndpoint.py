@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,11 +26,6 @@ class SystemDocumentsEndpoint(
         IPostable.__init__(self, DocumentInfo)
         IPaginateable.__init__(self, DocumentInfo)
 
-        self.count = self._register_child_endpoint(SystemDocumentsCountEndpoint(client, parent_endpoint=self))
-        self.uploadsample = self._register_child_endpoint(
-            SystemDocumentsUploadsampleEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemDocumentsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemDocumentsIdEndpoint object to move down the chain.
@@ -75,7 +71,7 @@ class SystemDocumentsEndpoint(
         Returns:
             list[DocumentInfo]: The parsed response data.
         """
-        return self._parse_many(DocumentInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DocumentInfo, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> DocumentInfo:
         """
@@ -87,4 +83,18 @@ class SystemDocumentsEndpoint(
         Returns:
             DocumentInfo: The parsed response data.
         """
-        return self._parse_one(DocumentInfo, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(DocumentInfo, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemDocumentsCountEndpoint:
+        """
+        The SystemDocumentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumentsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def uploadsample(self) -> SystemDocumentsUploadsampleEndpoint:
+        """
+        The SystemDocumentsUploadsampleEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumentsUploadsampleEndpoint(self.client, parent_endpoint=self))
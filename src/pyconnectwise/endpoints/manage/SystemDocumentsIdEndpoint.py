@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,9 +25,6 @@ class SystemDocumentsIdEndpoint(
         IPostable.__init__(self, DocumentInfo)
         IPaginateable.__init__(self, DocumentInfo)
 
-        self.download = self._register_child_endpoint(SystemDocumentsIdDownloadEndpoint(client, parent_endpoint=self))
-        self.thumbnail = self._register_child_endpoint(SystemDocumentsIdThumbnailEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[DocumentInfo]:
@@ -69,7 +67,7 @@ class SystemDocumentsIdEndpoint(
         Returns:
             DocumentInfo: The parsed response data.
         """
-        return self._parse_one(DocumentInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(DocumentInfo, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> DocumentInfo:
         """
@@ -81,4 +79,18 @@ class SystemDocumentsIdEndpoint(
         Returns:
             DocumentInfo: The parsed response data.
         """
-        return self._parse_one(DocumentInfo, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(DocumentInfo, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def download(self) -> SystemDocumentsIdDownloadEndpoint:
+        """
+        The SystemDocumentsIdDownloadEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumentsIdDownloadEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def thumbnail(self) -> SystemDocumentsIdThumbnailEndpoint:
+        """
+        The SystemDocumentsIdThumbnailEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumentsIdThumbnailEndpoint(self.client, parent_endpoint=self))
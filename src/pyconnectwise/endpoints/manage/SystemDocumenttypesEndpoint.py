@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.SystemDocumenttypesIdEndpoint import (
     SystemDocumenttypesIdEndpoint,
@@ -11,8 +13,6 @@ class SystemDocumenttypesEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "documentTypes", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(SystemDocumenttypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, id: int) -> SystemDocumenttypesIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized SystemDocumenttypesIdEndpoint object to move down the chain.
@@ -25,3 +25,10 @@ class SystemDocumenttypesEndpoint(ConnectWiseEndpoint):
         child = SystemDocumenttypesIdEndpoint(self.client, parent_endpoint=self)
         child._id = id
         return child
+
+    @cached_property
+    def info(self) -> SystemDocumenttypesInfoEndpoint:
+        """
+        The SystemDocumenttypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumenttypesInfoEndpoint(self.client, parent_endpoint=self))
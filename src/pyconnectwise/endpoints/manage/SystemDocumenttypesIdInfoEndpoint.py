@@ -65,4 +65,4 @@ class SystemDocumenttypesIdInfoEndpoint(
         Returns:
             DocumentType: The parsed response data.
         """
-        return self._parse_one(DocumentType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(DocumentType, super()._make_request("GET", data=data, params=params).content)
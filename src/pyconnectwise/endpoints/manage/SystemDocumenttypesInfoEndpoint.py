@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.SystemDocumenttypesInfoCountEndpoint import (
     SystemDocumenttypesInfoCountEndpoint,
@@ -24,8 +26,6 @@ class SystemDocumenttypesInfoEndpoint(
         IGettable.__init__(self, list[DocumentType])
         IPaginateable.__init__(self, DocumentType)
 
-        self.count = self._register_child_endpoint(SystemDocumenttypesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self,
         page: int,
@@ -70,4 +70,11 @@ class SystemDocumenttypesInfoEndpoint(
         Returns:
             list[DocumentType]: The parsed response data.
         """
-        return self._parse_many(DocumentType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DocumentType, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemDocumenttypesInfoCountEndpoint:
+        """
+        The SystemDocumenttypesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumenttypesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SystemEmailconnectorsEndpoint(
         IPostable.__init__(self, EmailConnector)
         IPaginateable.__init__(self, EmailConnector)
 
-        self.count = self._register_child_endpoint(SystemEmailconnectorsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemEmailconnectorsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemEmailconnectorsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemEmailconnectorsIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class SystemEmailconnectorsEndpoint(
         Returns:
             list[EmailConnector]: The parsed response data.
         """
-        return self._parse_many(EmailConnector, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(EmailConnector, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> EmailConnector:
         """
@@ -87,4 +85,18 @@ class SystemEmailconnectorsEndpoint(
         Returns:
             EmailConnector: The parsed response data.
         """
-        return self._parse_one(EmailConnector, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(EmailConnector, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemEmailconnectorsCountEndpoint:
+        """
+        The SystemEmailconnectorsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailconnectorsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemEmailconnectorsInfoEndpoint:
+        """
+        The SystemEmailconnectorsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailconnectorsInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,11 +29,6 @@ class SystemEmailconnectorsIdEndpoint(
         IPuttable.__init__(self, EmailConnector)
         IPaginateable.__init__(self, EmailConnector)
 
-        self.info = self._register_child_endpoint(SystemEmailconnectorsIdInfoEndpoint(client, parent_endpoint=self))
-        self.parsing_styles = self._register_child_endpoint(
-            SystemEmailconnectorsIdParsingstylesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[EmailConnector]:
@@ -75,7 +71,7 @@ class SystemEmailconnectorsIdEndpoint(
         Returns:
             EmailConnector: The parsed response data.
         """
-        return self._parse_one(EmailConnector, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(EmailConnector, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> EmailConnector:
         """
@@ -87,7 +83,7 @@ class SystemEmailconnectorsIdEndpoint(
         Returns:
             EmailConnector: The parsed response data.
         """
-        return self._parse_one(EmailConnector, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(EmailConnector, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> EmailConnector:
         """
@@ -99,4 +95,20 @@ class SystemEmailconnectorsIdEndpoint(
         Returns:
             EmailConnector: The parsed response data.
         """
-        return self._parse_one(EmailConnector, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(EmailConnector, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SystemEmailconnectorsIdInfoEndpoint:
+        """
+        The SystemEmailconnectorsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailconnectorsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def parsing_styles(self) -> SystemEmailconnectorsIdParsingstylesEndpoint:
+        """
+        The SystemEmailconnectorsIdParsingstylesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemEmailconnectorsIdParsingstylesEndpoint(self.client, parent_endpoint=self)
+        )
@@ -52,4 +52,4 @@ class SystemEmailconnectorsIdInfoEndpoint(
         Returns:
             EmailConnectorInfo: The parsed response data.
         """
-        return self._parse_one(EmailConnectorInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(EmailConnectorInfo, super()._make_request("GET", data=data, params=params).content)
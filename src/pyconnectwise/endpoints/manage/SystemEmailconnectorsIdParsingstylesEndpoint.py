@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class SystemEmailconnectorsIdParsingstylesEndpoint(
         IPostable.__init__(self, EmailConnectorParsingStyle)
         IPaginateable.__init__(self, EmailConnectorParsingStyle)
 
-        self.count = self._register_child_endpoint(
-            SystemEmailconnectorsIdParsingstylesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemEmailconnectorsIdParsingstylesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemEmailconnectorsIdParsingstylesIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class SystemEmailconnectorsIdParsingstylesEndpoint(
             list[EmailConnectorParsingStyle]: The parsed response data.
         """
         return self._parse_many(
-            EmailConnectorParsingStyle, super()._make_request("GET", data=data, params=params).json()
+            EmailConnectorParsingStyle, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class SystemEmailconnectorsIdParsingstylesEndpoint(
             EmailConnectorParsingStyle: The parsed response data.
         """
         return self._parse_one(
-            EmailConnectorParsingStyle, super()._make_request("POST", data=data, params=params).json()
+            EmailConnectorParsingStyle, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> SystemEmailconnectorsIdParsingstylesCountEndpoint:
+        """
+        The SystemEmailconnectorsIdParsingstylesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemEmailconnectorsIdParsingstylesCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class SystemEmailconnectorsIdParsingstylesIdEndpoint(
         IPuttable.__init__(self, EmailConnectorParsingStyle)
         IPaginateable.__init__(self, EmailConnectorParsingStyle)
 
-        self.parsing_rules = self._register_child_endpoint(
-            SystemEmailconnectorsIdParsingstylesIdParsingrulesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[EmailConnectorParsingStyle]:
@@ -76,7 +73,7 @@ class SystemEmailconnectorsIdParsingstylesIdEndpoint(
             EmailConnectorParsingStyle: The parsed response data.
         """
         return self._parse_one(
-            EmailConnectorParsingStyle, super()._make_request("GET", data=data, params=params).json()
+            EmailConnectorParsingStyle, super()._make_request("GET", data=data, params=params).content
         )
 
     def patch(
@@ -92,7 +89,7 @@ class SystemEmailconnectorsIdParsingstylesIdEndpoint(
             EmailConnectorParsingStyle: The parsed response data.
         """
         return self._parse_one(
-            EmailConnectorParsingStyle, super()._make_request("PATCH", data=data, params=params).json()
+            EmailConnectorParsingStyle, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -108,5 +105,14 @@ class SystemEmailconnectorsIdParsingstylesIdEndpoint(
             EmailConnectorParsingStyle: The parsed response data.
         """
         return self._parse_one(
-            EmailConnectorParsingStyle, super()._make_request("PUT", data=data, params=params).json()
+            EmailConnectorParsingStyle, super()._make_request("PUT", data=data, params=params).content
+        )
+
+    @cached_property
+    def parsing_rules(self) -> SystemEmailconnectorsIdParsingstylesIdParsingrulesEndpoint:
+        """
+        The SystemEmailconnectorsIdParsingstylesIdParsingrulesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemEmailconnectorsIdParsingstylesIdParsingrulesEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class SystemEmailconnectorsIdParsingstylesIdParsingrulesEndpoint(
         IPostable.__init__(self, EmailConnectorParsingRule)
         IPaginateable.__init__(self, EmailConnectorParsingRule)
 
-        self.count = self._register_child_endpoint(
-            SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class SystemEmailconnectorsIdParsingstylesIdParsingrulesEndpoint(
             list[EmailConnectorParsingRule]: The parsed response data.
         """
         return self._parse_many(
-            EmailConnectorParsingRule, super()._make_request("GET", data=data, params=params).json()
+            EmailConnectorParsingRule, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class SystemEmailconnectorsIdParsingstylesIdParsingrulesEndpoint(
             EmailConnectorParsingRule: The parsed response data.
         """
         return self._parse_one(
-            EmailConnectorParsingRule, super()._make_request("POST", data=data, params=params).json()
+            EmailConnectorParsingRule, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint:
+        """
+        The SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint(self.client, parent_endpoint=self)
         )
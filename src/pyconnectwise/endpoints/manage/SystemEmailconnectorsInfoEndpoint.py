@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class SystemEmailconnectorsInfoEndpoint(
         IGettable.__init__(self, list[EmailConnectorInfo])
         IPaginateable.__init__(self, EmailConnectorInfo)
 
-        self.count = self._register_child_endpoint(SystemEmailconnectorsInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[EmailConnectorInfo]:
@@ -57,4 +56,11 @@ class SystemEmailconnectorsInfoEndpoint(
         Returns:
             list[EmailConnectorInfo]: The parsed response data.
         """
-        return self._parse_many(EmailConnectorInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(EmailConnectorInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemEmailconnectorsInfoCountEndpoint:
+        """
+        The SystemEmailconnectorsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailconnectorsInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemEmailexclusionsEndpoint(
         IPostable.__init__(self, EmailExclusion)
         IPaginateable.__init__(self, EmailExclusion)
 
-        self.count = self._register_child_endpoint(SystemEmailexclusionsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemEmailexclusionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemEmailexclusionsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemEmailexclusionsEndpoint(
         Returns:
             list[EmailExclusion]: The parsed response data.
         """
-        return self._parse_many(EmailExclusion, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(EmailExclusion, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> EmailExclusion:
         """
@@ -85,4 +84,11 @@ class SystemEmailexclusionsEndpoint(
         Returns:
             EmailExclusion: The parsed response data.
         """
-        return self._parse_one(EmailExclusion, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(EmailExclusion, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemEmailexclusionsCountEndpoint:
+        """
+        The SystemEmailexclusionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailexclusionsCountEndpoint(self.client, parent_endpoint=self))
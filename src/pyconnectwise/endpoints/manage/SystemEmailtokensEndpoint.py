@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemEmailtokensEndpoint(
         IGettable.__init__(self, list[EmailToken])
         IPaginateable.__init__(self, EmailToken)
 
-        self.count = self._register_child_endpoint(SystemEmailtokensCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemEmailtokensIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemEmailtokensIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class SystemEmailtokensEndpoint(
         Returns:
             list[EmailToken]: The parsed response data.
         """
-        return self._parse_many(EmailToken, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(EmailToken, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemEmailtokensCountEndpoint:
+        """
+        The SystemEmailtokensCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailtokensCountEndpoint(self.client, parent_endpoint=self))
@@ -50,4 +50,4 @@ class SystemEmailtokensIdEndpoint(
         Returns:
             EmailToken: The parsed response data.
         """
-        return self._parse_one(EmailToken, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(EmailToken, super()._make_request("GET", data=data, params=params).content)
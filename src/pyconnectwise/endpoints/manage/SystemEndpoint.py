@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -77,118 +78,487 @@ class SystemEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "system", parent_endpoint=parent_endpoint)
 
-        self.allowed_file_types = self._register_child_endpoint(
-            SystemAllowedfiletypesEndpoint(client, parent_endpoint=self)
-        )
-        self.allowedfiletypes = self._register_child_endpoint(
-            SystemAllowedfiletypesEndpoint(client, parent_endpoint=self)
-        )
-        self.allowedorigins = self._register_child_endpoint(SystemAllowedoriginsEndpoint(client, parent_endpoint=self))
-        self.api_members = self._register_child_endpoint(SystemApimembersEndpoint(client, parent_endpoint=self))
-        self.audittrail = self._register_child_endpoint(SystemAudittrailEndpoint(client, parent_endpoint=self))
-        self.auth_anvils = self._register_child_endpoint(SystemAuthanvilsEndpoint(client, parent_endpoint=self))
-        self.auto_sync_time = self._register_child_endpoint(SystemAutosynctimeEndpoint(client, parent_endpoint=self))
-        self.bundles = self._register_child_endpoint(SystemBundlesEndpoint(client, parent_endpoint=self))
-        self.callbacks = self._register_child_endpoint(SystemCallbacksEndpoint(client, parent_endpoint=self))
-        self.certifications = self._register_child_endpoint(SystemCertificationsEndpoint(client, parent_endpoint=self))
-        self.connect_wise_hosted_screens = self._register_child_endpoint(
-            SystemConnectwisehostedscreensEndpoint(client, parent_endpoint=self)
-        )
-        self.connectwisehostedsetups = self._register_child_endpoint(
-            SystemConnectwisehostedsetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.custom_reports = self._register_child_endpoint(SystemCustomreportsEndpoint(client, parent_endpoint=self))
-        self.cw_time_zones = self._register_child_endpoint(SystemCwtimezonesEndpoint(client, parent_endpoint=self))
-        self.departments = self._register_child_endpoint(SystemDepartmentsEndpoint(client, parent_endpoint=self))
-        self.documents = self._register_child_endpoint(SystemDocumentsEndpoint(client, parent_endpoint=self))
-        self.e_pay_configurations = self._register_child_endpoint(
-            SystemEpayconfigurationsEndpoint(client, parent_endpoint=self)
-        )
-        self.email_connectors = self._register_child_endpoint(
-            SystemEmailconnectorsEndpoint(client, parent_endpoint=self)
-        )
-        self.email_exclusions = self._register_child_endpoint(
-            SystemEmailexclusionsEndpoint(client, parent_endpoint=self)
-        )
-        self.email_tokens = self._register_child_endpoint(SystemEmailtokensEndpoint(client, parent_endpoint=self))
-        self.experiments = self._register_child_endpoint(SystemExperimentsEndpoint(client, parent_endpoint=self))
-        self.fileuploadsettings = self._register_child_endpoint(
-            SystemFileuploadsettingsEndpoint(client, parent_endpoint=self)
-        )
-        self.googleemailsetup = self._register_child_endpoint(
-            SystemGoogleemailsetupEndpoint(client, parent_endpoint=self)
-        )
-        self.imaps = self._register_child_endpoint(SystemImapsEndpoint(client, parent_endpoint=self))
-        self.import_mass_maintenance = self._register_child_endpoint(
-            SystemImportmassmaintenanceEndpoint(client, parent_endpoint=self)
-        )
-        self.in_out_boards = self._register_child_endpoint(SystemInoutboardsEndpoint(client, parent_endpoint=self))
-        self.in_out_types = self._register_child_endpoint(SystemInouttypesEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemInfoEndpoint(client, parent_endpoint=self))
-        self.integrator_tags = self._register_child_endpoint(SystemIntegratortagsEndpoint(client, parent_endpoint=self))
-        self.integratorlogins = self._register_child_endpoint(
-            SystemIntegratorloginsEndpoint(client, parent_endpoint=self)
-        )
-        self.kpi_categories = self._register_child_endpoint(SystemKpicategoriesEndpoint(client, parent_endpoint=self))
-        self.kpis = self._register_child_endpoint(SystemKpisEndpoint(client, parent_endpoint=self))
-        self.ldap_configurations = self._register_child_endpoint(
-            SystemLdapconfigurationsEndpoint(client, parent_endpoint=self)
-        )
-        self.links = self._register_child_endpoint(SystemLinksEndpoint(client, parent_endpoint=self))
-        self.locations = self._register_child_endpoint(SystemLocationsEndpoint(client, parent_endpoint=self))
-        self.management_network_securities = self._register_child_endpoint(
-            SystemManagementnetworksecuritiesEndpoint(client, parent_endpoint=self)
-        )
-        self.marketplaceimport = self._register_child_endpoint(
-            SystemMarketplaceimportEndpoint(client, parent_endpoint=self)
-        )
-        self.members = self._register_child_endpoint(SystemMembersEndpoint(client, parent_endpoint=self))
-        self.menu_entries = self._register_child_endpoint(SystemMenuentriesEndpoint(client, parent_endpoint=self))
-        self.menuentries = self._register_child_endpoint(SystemMenuentriesEndpoint(client, parent_endpoint=self))
-        self.my_account = self._register_child_endpoint(SystemMyaccountEndpoint(client, parent_endpoint=self))
-        self.my_company = self._register_child_endpoint(SystemMycompanyEndpoint(client, parent_endpoint=self))
-        self.my_members = self._register_child_endpoint(SystemMymembersEndpoint(client, parent_endpoint=self))
-        self.my_security = self._register_child_endpoint(SystemMysecurityEndpoint(client, parent_endpoint=self))
-        self.mycompany = self._register_child_endpoint(SystemMycompanyEndpoint(client, parent_endpoint=self))
-        self.notification_recipients = self._register_child_endpoint(
-            SystemNotificationrecipientsEndpoint(client, parent_endpoint=self)
-        )
-        self.office365 = self._register_child_endpoint(SystemOffice365Endpoint(client, parent_endpoint=self))
-        self.osgradeweights = self._register_child_endpoint(SystemOsgradeweightsEndpoint(client, parent_endpoint=self))
-        self.parsing_types = self._register_child_endpoint(SystemParsingtypesEndpoint(client, parent_endpoint=self))
-        self.parsing_variables = self._register_child_endpoint(
-            SystemParsingvariablesEndpoint(client, parent_endpoint=self)
-        )
-        self.portal_reports = self._register_child_endpoint(SystemPortalreportsEndpoint(client, parent_endpoint=self))
-        self.quote_link_setup = self._register_child_endpoint(
-            SystemQuotelinksetupEndpoint(client, parent_endpoint=self)
-        )
-        self.report_cards = self._register_child_endpoint(SystemReportcardsEndpoint(client, parent_endpoint=self))
-        self.reports = self._register_child_endpoint(SystemReportsEndpoint(client, parent_endpoint=self))
-        self.security_roles = self._register_child_endpoint(SystemSecurityrolesEndpoint(client, parent_endpoint=self))
-        self.securityroles = self._register_child_endpoint(SystemSecurityrolesEndpoint(client, parent_endpoint=self))
-        self.settings = self._register_child_endpoint(SystemSettingsEndpoint(client, parent_endpoint=self))
-        self.setup_screens = self._register_child_endpoint(SystemSetupscreensEndpoint(client, parent_endpoint=self))
-        self.skill_categories = self._register_child_endpoint(
-            SystemSkillcategoriesEndpoint(client, parent_endpoint=self)
-        )
-        self.skills = self._register_child_endpoint(SystemSkillsEndpoint(client, parent_endpoint=self))
-        self.sso_configurations = self._register_child_endpoint(
-            SystemSsoconfigurationsEndpoint(client, parent_endpoint=self)
-        )
-        self.sso_users = self._register_child_endpoint(SystemSsousersEndpoint(client, parent_endpoint=self))
-        self.standard_notes = self._register_child_endpoint(SystemStandardnotesEndpoint(client, parent_endpoint=self))
-        self.surveys = self._register_child_endpoint(SystemSurveysEndpoint(client, parent_endpoint=self))
-        self.time_zone_setups = self._register_child_endpoint(
-            SystemTimezonesetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.today_page_categories = self._register_child_endpoint(
-            SystemTodaypagecategoriesEndpoint(client, parent_endpoint=self)
-        )
-        self.user_defined_fields = self._register_child_endpoint(
-            SystemUserdefinedfieldsEndpoint(client, parent_endpoint=self)
-        )
-        self.workflow_actions = self._register_child_endpoint(
-            SystemWorkflowactionsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def allowed_file_types(self) -> SystemAllowedfiletypesEndpoint:
+        """
+        The SystemAllowedfiletypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAllowedfiletypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def allowedfiletypes(self) -> SystemAllowedfiletypesEndpoint:
+        """
+        The SystemAllowedfiletypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAllowedfiletypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def allowedorigins(self) -> SystemAllowedoriginsEndpoint:
+        """
+        The SystemAllowedoriginsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAllowedoriginsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def api_members(self) -> SystemApimembersEndpoint:
+        """
+        The SystemApimembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemApimembersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def audittrail(self) -> SystemAudittrailEndpoint:
+        """
+        The SystemAudittrailEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAudittrailEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def auth_anvils(self) -> SystemAuthanvilsEndpoint:
+        """
+        The SystemAuthanvilsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAuthanvilsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def auto_sync_time(self) -> SystemAutosynctimeEndpoint:
+        """
+        The SystemAutosynctimeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAutosynctimeEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def bundles(self) -> SystemBundlesEndpoint:
+        """
+        The SystemBundlesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemBundlesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def callbacks(self) -> SystemCallbacksEndpoint:
+        """
+        The SystemCallbacksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCallbacksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def certifications(self) -> SystemCertificationsEndpoint:
+        """
+        The SystemCertificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCertificationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def connect_wise_hosted_screens(self) -> SystemConnectwisehostedscreensEndpoint:
+        """
+        The SystemConnectwisehostedscreensEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemConnectwisehostedscreensEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def connectwisehostedsetups(self) -> SystemConnectwisehostedsetupsEndpoint:
+        """
+        The SystemConnectwisehostedsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemConnectwisehostedsetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def custom_reports(self) -> SystemCustomreportsEndpoint:
+        """
+        The SystemCustomreportsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCustomreportsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def cw_time_zones(self) -> SystemCwtimezonesEndpoint:
+        """
+        The SystemCwtimezonesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCwtimezonesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def departments(self) -> SystemDepartmentsEndpoint:
+        """
+        The SystemDepartmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDepartmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def documents(self) -> SystemDocumentsEndpoint:
+        """
+        The SystemDocumentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def e_pay_configurations(self) -> SystemEpayconfigurationsEndpoint:
+        """
+        The SystemEpayconfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEpayconfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def email_connectors(self) -> SystemEmailconnectorsEndpoint:
+        """
+        The SystemEmailconnectorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailconnectorsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def email_exclusions(self) -> SystemEmailexclusionsEndpoint:
+        """
+        The SystemEmailexclusionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailexclusionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def email_tokens(self) -> SystemEmailtokensEndpoint:
+        """
+        The SystemEmailtokensEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailtokensEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def experiments(self) -> SystemExperimentsEndpoint:
+        """
+        The SystemExperimentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemExperimentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def fileuploadsettings(self) -> SystemFileuploadsettingsEndpoint:
+        """
+        The SystemFileuploadsettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemFileuploadsettingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def googleemailsetup(self) -> SystemGoogleemailsetupEndpoint:
+        """
+        The SystemGoogleemailsetupEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemGoogleemailsetupEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def imaps(self) -> SystemImapsEndpoint:
+        """
+        The SystemImapsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemImapsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def import_mass_maintenance(self) -> SystemImportmassmaintenanceEndpoint:
+        """
+        The SystemImportmassmaintenanceEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemImportmassmaintenanceEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def in_out_boards(self) -> SystemInoutboardsEndpoint:
+        """
+        The SystemInoutboardsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInoutboardsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def in_out_types(self) -> SystemInouttypesEndpoint:
+        """
+        The SystemInouttypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInouttypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemInfoEndpoint:
+        """
+        The SystemInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def integrator_tags(self) -> SystemIntegratortagsEndpoint:
+        """
+        The SystemIntegratortagsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemIntegratortagsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def integratorlogins(self) -> SystemIntegratorloginsEndpoint:
+        """
+        The SystemIntegratorloginsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemIntegratorloginsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def kpi_categories(self) -> SystemKpicategoriesEndpoint:
+        """
+        The SystemKpicategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemKpicategoriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def kpis(self) -> SystemKpisEndpoint:
+        """
+        The SystemKpisEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemKpisEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ldap_configurations(self) -> SystemLdapconfigurationsEndpoint:
+        """
+        The SystemLdapconfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLdapconfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def links(self) -> SystemLinksEndpoint:
+        """
+        The SystemLinksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLinksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def locations(self) -> SystemLocationsEndpoint:
+        """
+        The SystemLocationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLocationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def management_network_securities(self) -> SystemManagementnetworksecuritiesEndpoint:
+        """
+        The SystemManagementnetworksecuritiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemManagementnetworksecuritiesEndpoint(self.client, parent_endpoint=self)
         )
-        self.workflows = self._register_child_endpoint(SystemWorkflowsEndpoint(client, parent_endpoint=self))
+
+    @cached_property
+    def marketplaceimport(self) -> SystemMarketplaceimportEndpoint:
+        """
+        The SystemMarketplaceimportEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMarketplaceimportEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def members(self) -> SystemMembersEndpoint:
+        """
+        The SystemMembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def menu_entries(self) -> SystemMenuentriesEndpoint:
+        """
+        The SystemMenuentriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMenuentriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def menuentries(self) -> SystemMenuentriesEndpoint:
+        """
+        The SystemMenuentriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMenuentriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def my_account(self) -> SystemMyaccountEndpoint:
+        """
+        The SystemMyaccountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMyaccountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def my_company(self) -> SystemMycompanyEndpoint:
+        """
+        The SystemMycompanyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def my_members(self) -> SystemMymembersEndpoint:
+        """
+        The SystemMymembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMymembersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def my_security(self) -> SystemMysecurityEndpoint:
+        """
+        The SystemMysecurityEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMysecurityEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def mycompany(self) -> SystemMycompanyEndpoint:
+        """
+        The SystemMycompanyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notification_recipients(self) -> SystemNotificationrecipientsEndpoint:
+        """
+        The SystemNotificationrecipientsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemNotificationrecipientsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def office365(self) -> SystemOffice365Endpoint:
+        """
+        The SystemOffice365Endpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemOffice365Endpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def osgradeweights(self) -> SystemOsgradeweightsEndpoint:
+        """
+        The SystemOsgradeweightsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemOsgradeweightsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def parsing_types(self) -> SystemParsingtypesEndpoint:
+        """
+        The SystemParsingtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemParsingtypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def parsing_variables(self) -> SystemParsingvariablesEndpoint:
+        """
+        The SystemParsingvariablesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemParsingvariablesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def portal_reports(self) -> SystemPortalreportsEndpoint:
+        """
+        The SystemPortalreportsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemPortalreportsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def quote_link_setup(self) -> SystemQuotelinksetupEndpoint:
+        """
+        The SystemQuotelinksetupEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemQuotelinksetupEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def report_cards(self) -> SystemReportcardsEndpoint:
+        """
+        The SystemReportcardsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportcardsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reports(self) -> SystemReportsEndpoint:
+        """
+        The SystemReportsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def security_roles(self) -> SystemSecurityrolesEndpoint:
+        """
+        The SystemSecurityrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSecurityrolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def securityroles(self) -> SystemSecurityrolesEndpoint:
+        """
+        The SystemSecurityrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSecurityrolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def settings(self) -> SystemSettingsEndpoint:
+        """
+        The SystemSettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSettingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def setup_screens(self) -> SystemSetupscreensEndpoint:
+        """
+        The SystemSetupscreensEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSetupscreensEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def skill_categories(self) -> SystemSkillcategoriesEndpoint:
+        """
+        The SystemSkillcategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSkillcategoriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def skills(self) -> SystemSkillsEndpoint:
+        """
+        The SystemSkillsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSkillsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sso_configurations(self) -> SystemSsoconfigurationsEndpoint:
+        """
+        The SystemSsoconfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSsoconfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sso_users(self) -> SystemSsousersEndpoint:
+        """
+        The SystemSsousersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSsousersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def standard_notes(self) -> SystemStandardnotesEndpoint:
+        """
+        The SystemStandardnotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemStandardnotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def surveys(self) -> SystemSurveysEndpoint:
+        """
+        The SystemSurveysEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSurveysEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def time_zone_setups(self) -> SystemTimezonesetupsEndpoint:
+        """
+        The SystemTimezonesetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemTimezonesetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def today_page_categories(self) -> SystemTodaypagecategoriesEndpoint:
+        """
+        The SystemTodaypagecategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemTodaypagecategoriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def user_defined_fields(self) -> SystemUserdefinedfieldsEndpoint:
+        """
+        The SystemUserdefinedfieldsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemUserdefinedfieldsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def workflow_actions(self) -> SystemWorkflowactionsEndpoint:
+        """
+        The SystemWorkflowactionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowactionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def workflows(self) -> SystemWorkflowsEndpoint:
+        """
+        The SystemWorkflowsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsEndpoint(self.client, parent_endpoint=self))
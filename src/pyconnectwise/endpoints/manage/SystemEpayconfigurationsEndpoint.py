@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemEpayconfigurationsEndpoint(
         IPostable.__init__(self, EPayConfiguration)
         IPaginateable.__init__(self, EPayConfiguration)
 
-        self.count = self._register_child_endpoint(SystemEpayconfigurationsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemEpayconfigurationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemEpayconfigurationsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemEpayconfigurationsEndpoint(
         Returns:
             list[EPayConfiguration]: The parsed response data.
         """
-        return self._parse_many(EPayConfiguration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(EPayConfiguration, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> EPayConfiguration:
         """
@@ -85,4 +84,11 @@ class SystemEpayconfigurationsEndpoint(
         Returns:
             EPayConfiguration: The parsed response data.
         """
-        return self._parse_one(EPayConfiguration, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(EPayConfiguration, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemEpayconfigurationsCountEndpoint:
+        """
+        The SystemEpayconfigurationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEpayconfigurationsCountEndpoint(self.client, parent_endpoint=self))
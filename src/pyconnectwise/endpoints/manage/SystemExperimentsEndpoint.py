@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemExperimentsEndpoint(
         IGettable.__init__(self, list[Experiment])
         IPaginateable.__init__(self, Experiment)
 
-        self.count = self._register_child_endpoint(SystemExperimentsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemExperimentsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemExperimentsIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class SystemExperimentsEndpoint(
         Returns:
             list[Experiment]: The parsed response data.
         """
-        return self._parse_many(Experiment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Experiment, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemExperimentsCountEndpoint:
+        """
+        The SystemExperimentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemExperimentsCountEndpoint(self.client, parent_endpoint=self))
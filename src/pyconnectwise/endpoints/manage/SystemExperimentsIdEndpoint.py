@@ -50,4 +50,4 @@ class SystemExperimentsIdEndpoint(
         Returns:
             Experiment: The parsed response data.
         """
-        return self._parse_one(Experiment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Experiment, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -12,8 +13,6 @@ class SystemFileuploadsettingsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "fileuploadsettings", parent_endpoint=parent_endpoint)
 
-        self.count = self._register_child_endpoint(SystemFileuploadsettingsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemFileuploadsettingsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemFileuploadsettingsIdEndpoint object to move down the chain.
@@ -26,3 +25,10 @@ class SystemFileuploadsettingsEndpoint(ConnectWiseEndpoint):
         child = SystemFileuploadsettingsIdEndpoint(self.client, parent_endpoint=self)
         child._id = _id
         return child
+
+    @cached_property
+    def count(self) -> SystemFileuploadsettingsCountEndpoint:
+        """
+        The SystemFileuploadsettingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemFileuploadsettingsCountEndpoint(self.client, parent_endpoint=self))
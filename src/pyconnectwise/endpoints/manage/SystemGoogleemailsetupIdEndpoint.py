@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class SystemGoogleemailsetupIdEndpoint(
         IPuttable.__init__(self, GoogleEmailSetup)
         IPaginateable.__init__(self, GoogleEmailSetup)
 
-        self.test_connection = self._register_child_endpoint(
-            SystemGoogleemailsetupIdTestconnectionEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[GoogleEmailSetup]:
@@ -73,7 +70,7 @@ class SystemGoogleemailsetupIdEndpoint(
         Returns:
             GoogleEmailSetup: The parsed response data.
         """
-        return self._parse_one(GoogleEmailSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(GoogleEmailSetup, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> GoogleEmailSetup:
         """
@@ -85,7 +82,7 @@ class SystemGoogleemailsetupIdEndpoint(
         Returns:
             GoogleEmailSetup: The parsed response data.
         """
-        return self._parse_one(GoogleEmailSetup, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(GoogleEmailSetup, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> GoogleEmailSetup:
         """
@@ -97,4 +94,13 @@ class SystemGoogleemailsetupIdEndpoint(
         Returns:
             GoogleEmailSetup: The parsed response data.
         """
-        return self._parse_one(GoogleEmailSetup, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(GoogleEmailSetup, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def test_connection(self) -> SystemGoogleemailsetupIdTestconnectionEndpoint:
+        """
+        The SystemGoogleemailsetupIdTestconnectionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemGoogleemailsetupIdTestconnectionEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SystemImapsEndpoint(
         IPostable.__init__(self, Imap)
         IPaginateable.__init__(self, Imap)
 
-        self.count = self._register_child_endpoint(SystemImapsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemImapsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemImapsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemImapsIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class SystemImapsEndpoint(
         Returns:
             list[Imap]: The parsed response data.
         """
-        return self._parse_many(Imap, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Imap, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Imap:
         """
@@ -83,4 +81,18 @@ class SystemImapsEndpoint(
         Returns:
             Imap: The parsed response data.
         """
-        return self._parse_one(Imap, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Imap, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemImapsCountEndpoint:
+        """
+        The SystemImapsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemImapsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemImapsInfoEndpoint:
+        """
+        The SystemImapsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemImapsInfoEndpoint(self.client, parent_endpoint=self))
@@ -50,4 +50,4 @@ class SystemImapsIdInfoEndpoint(
         Returns:
             ImapInfo: The parsed response data.
         """
-        return self._parse_one(ImapInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ImapInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class SystemImapsInfoEndpoint(
         IGettable.__init__(self, list[ImapInfo])
         IPaginateable.__init__(self, ImapInfo)
 
-        self.count = self._register_child_endpoint(SystemImapsInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ImapInfo]:
@@ -53,4 +52,11 @@ class SystemImapsInfoEndpoint(
         Returns:
             list[ImapInfo]: The parsed response data.
         """
-        return self._parse_many(ImapInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ImapInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemImapsInfoCountEndpoint:
+        """
+        The SystemImapsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemImapsInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -28,4 +28,4 @@ class SystemImportmassmaintenanceIdEndpoint(
         Returns:
             ImportMassMaintenance: The parsed response data.
         """
-        return self._parse_one(ImportMassMaintenance, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ImportMassMaintenance, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class SystemInfoDepartmentlocationsEndpoint(
         IGettable.__init__(self, list[DepartmentLocationInfo])
         IPaginateable.__init__(self, DepartmentLocationInfo)
 
-        self.count = self._register_child_endpoint(
-            SystemInfoDepartmentlocationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemInfoDepartmentlocationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemInfoDepartmentlocationsIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class SystemInfoDepartmentlocationsEndpoint(
         Returns:
             list[DepartmentLocationInfo]: The parsed response data.
         """
-        return self._parse_many(DepartmentLocationInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DepartmentLocationInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemInfoDepartmentlocationsCountEndpoint:
+        """
+        The SystemInfoDepartmentlocationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemInfoDepartmentlocationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -54,4 +54,4 @@ class SystemInfoDepartmentlocationsIdEndpoint(
         Returns:
             DepartmentLocationInfo: The parsed response data.
         """
-        return self._parse_one(DepartmentLocationInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(DepartmentLocationInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemInfoDepartmentsEndpoint(
         IGettable.__init__(self, list[DepartmentInfo])
         IPaginateable.__init__(self, DepartmentInfo)
 
-        self.count = self._register_child_endpoint(SystemInfoDepartmentsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemInfoDepartmentsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemInfoDepartmentsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class SystemInfoDepartmentsEndpoint(
         Returns:
             list[DepartmentInfo]: The parsed response data.
         """
-        return self._parse_many(DepartmentInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DepartmentInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemInfoDepartmentsCountEndpoint:
+        """
+        The SystemInfoDepartmentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoDepartmentsCountEndpoint(self.client, parent_endpoint=self))
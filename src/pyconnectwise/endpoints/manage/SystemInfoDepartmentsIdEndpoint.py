@@ -52,4 +52,4 @@ class SystemInfoDepartmentsIdEndpoint(
         Returns:
             DepartmentInfo: The parsed response data.
         """
-        return self._parse_one(DepartmentInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(DepartmentInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,19 +29,6 @@ class SystemInfoEndpoint(
         IGettable.__init__(self, Info)
         IPaginateable.__init__(self, Info)
 
-        self.departmentlocations = self._register_child_endpoint(
-            SystemInfoDepartmentlocationsEndpoint(client, parent_endpoint=self)
-        )
-        self.departments = self._register_child_endpoint(SystemInfoDepartmentsEndpoint(client, parent_endpoint=self))
-        self.links = self._register_child_endpoint(SystemInfoLinksEndpoint(client, parent_endpoint=self))
-        self.locales = self._register_child_endpoint(SystemInfoLocalesEndpoint(client, parent_endpoint=self))
-        self.locations = self._register_child_endpoint(SystemInfoLocationsEndpoint(client, parent_endpoint=self))
-        self.members = self._register_child_endpoint(SystemInfoMembersEndpoint(client, parent_endpoint=self))
-        self.personas = self._register_child_endpoint(SystemInfoPersonasEndpoint(client, parent_endpoint=self))
-        self.standard_notes = self._register_child_endpoint(
-            SystemInfoStandardnotesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Info]:
@@ -71,4 +59,60 @@ class SystemInfoEndpoint(
         Returns:
             Info: The parsed response data.
         """
-        return self._parse_one(Info, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Info, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def departmentlocations(self) -> SystemInfoDepartmentlocationsEndpoint:
+        """
+        The SystemInfoDepartmentlocationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoDepartmentlocationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def departments(self) -> SystemInfoDepartmentsEndpoint:
+        """
+        The SystemInfoDepartmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoDepartmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def links(self) -> SystemInfoLinksEndpoint:
+        """
+        The SystemInfoLinksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoLinksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def locales(self) -> SystemInfoLocalesEndpoint:
+        """
+        The SystemInfoLocalesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoLocalesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def locations(self) -> SystemInfoLocationsEndpoint:
+        """
+        The SystemInfoLocationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoLocationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def members(self) -> SystemInfoMembersEndpoint:
+        """
+        The SystemInfoMembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoMembersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def personas(self) -> SystemInfoPersonasEndpoint:
+        """
+        The SystemInfoPersonasEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoPersonasEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def standard_notes(self) -> SystemInfoStandardnotesEndpoint:
+        """
+        The SystemInfoStandardnotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoStandardnotesEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemInfoLinksEndpoint(
         IGettable.__init__(self, list[LinkInfo])
         IPaginateable.__init__(self, LinkInfo)
 
-        self.count = self._register_child_endpoint(SystemInfoLinksCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemInfoLinksIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemInfoLinksIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class SystemInfoLinksEndpoint(
         Returns:
             list[LinkInfo]: The parsed response data.
         """
-        return self._parse_many(LinkInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LinkInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemInfoLinksCountEndpoint:
+        """
+        The SystemInfoLinksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoLinksCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,10 +22,6 @@ class SystemInfoLinksIdEndpoint(
         IGettable.__init__(self, LinkInfo)
         IPaginateable.__init__(self, LinkInfo)
 
-        self.resolveurl = self._register_child_endpoint(
-            SystemInfoLinksIdResolveurlEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[LinkInfo]:
@@ -55,4 +52,11 @@ class SystemInfoLinksIdEndpoint(
         Returns:
             LinkInfo: The parsed response data.
         """
-        return self._parse_one(LinkInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LinkInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def resolveurl(self) -> SystemInfoLinksIdResolveurlEndpoint:
+        """
+        The SystemInfoLinksIdResolveurlEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoLinksIdResolveurlEndpoint(self.client, parent_endpoint=self))
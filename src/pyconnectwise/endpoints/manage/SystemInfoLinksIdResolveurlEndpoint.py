@@ -28,4 +28,4 @@ class SystemInfoLinksIdResolveurlEndpoint(
         Returns:
             LinkResolveUrlInfo: The parsed response data.
         """
-        return self._parse_one(LinkResolveUrlInfo, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LinkResolveUrlInfo, super()._make_request("POST", data=data, params=params).content)
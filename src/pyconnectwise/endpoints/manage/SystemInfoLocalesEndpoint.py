@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemInfoLocalesEndpoint(
         IGettable.__init__(self, list[LocaleInfo])
         IPaginateable.__init__(self, LocaleInfo)
 
-        self.count = self._register_child_endpoint(SystemInfoLocalesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemInfoLocalesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemInfoLocalesIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class SystemInfoLocalesEndpoint(
         Returns:
             list[LocaleInfo]: The parsed response data.
         """
-        return self._parse_many(LocaleInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LocaleInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemInfoLocalesCountEndpoint:
+        """
+        The SystemInfoLocalesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoLocalesCountEndpoint(self.client, parent_endpoint=self))
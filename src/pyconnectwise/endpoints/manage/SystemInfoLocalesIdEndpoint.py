@@ -50,4 +50,4 @@ class SystemInfoLocalesIdEndpoint(
         Returns:
             LocaleInfo: The parsed response data.
         """
-        return self._parse_one(LocaleInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LocaleInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemInfoLocationsEndpoint(
         IGettable.__init__(self, list[LocationInfo])
         IPaginateable.__init__(self, LocationInfo)
 
-        self.count = self._register_child_endpoint(SystemInfoLocationsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemInfoLocationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemInfoLocationsIdEndpoint object to move down the chain.
@@ -69,4 +68,11 @@ class SystemInfoLocationsEndpoint(
         Returns:
             list[LocationInfo]: The parsed response data.
         """
-        return self._parse_many(LocationInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LocationInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemInfoLocationsCountEndpoint:
+        """
+        The SystemInfoLocationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoLocationsCountEndpoint(self.client, parent_endpoint=self))
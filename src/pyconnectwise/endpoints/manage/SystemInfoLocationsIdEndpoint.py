@@ -52,4 +52,4 @@ class SystemInfoLocationsIdEndpoint(
         Returns:
             LocationInfo: The parsed response data.
         """
-        return self._parse_one(LocationInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LocationInfo, super()._make_request("GET", data=data, params=params).content)
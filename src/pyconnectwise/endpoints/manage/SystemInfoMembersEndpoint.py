@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemInfoMembersEndpoint(
         IGettable.__init__(self, list[MemberInfo])
         IPaginateable.__init__(self, MemberInfo)
 
-        self.count = self._register_child_endpoint(SystemInfoMembersCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemInfoMembersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemInfoMembersIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class SystemInfoMembersEndpoint(
         Returns:
             list[MemberInfo]: The parsed response data.
         """
-        return self._parse_many(MemberInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemInfoMembersCountEndpoint:
+        """
+        The SystemInfoMembersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoMembersCountEndpoint(self.client, parent_endpoint=self))
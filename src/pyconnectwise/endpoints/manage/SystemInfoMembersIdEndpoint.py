@@ -50,4 +50,4 @@ class SystemInfoMembersIdEndpoint(
         Returns:
             MemberInfo: The parsed response data.
         """
-        return self._parse_one(MemberInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MemberInfo, super()._make_request("GET", data=data, params=params).content)
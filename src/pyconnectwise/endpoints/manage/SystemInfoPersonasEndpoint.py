@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemInfoPersonasEndpoint(
         IGettable.__init__(self, list[PersonasInfo])
         IPaginateable.__init__(self, PersonasInfo)
 
-        self.count = self._register_child_endpoint(SystemInfoPersonasCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemInfoPersonasIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemInfoPersonasIdEndpoint object to move down the chain.
@@ -69,4 +68,11 @@ class SystemInfoPersonasEndpoint(
         Returns:
             list[PersonasInfo]: The parsed response data.
         """
-        return self._parse_many(PersonasInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PersonasInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemInfoPersonasCountEndpoint:
+        """
+        The SystemInfoPersonasCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoPersonasCountEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class SystemInfoPersonasIdEndpoint(
         Returns:
             PersonasInfo: The parsed response data.
         """
-        return self._parse_one(PersonasInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(PersonasInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemInfoStandardnotesEndpoint(
         IGettable.__init__(self, list[StandardNoteInfo])
         IPaginateable.__init__(self, StandardNoteInfo)
 
-        self.count = self._register_child_endpoint(SystemInfoStandardnotesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemInfoStandardnotesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemInfoStandardnotesIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class SystemInfoStandardnotesEndpoint(
         Returns:
             list[StandardNoteInfo]: The parsed response data.
         """
-        return self._parse_many(StandardNoteInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(StandardNoteInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemInfoStandardnotesCountEndpoint:
+        """
+        The SystemInfoStandardnotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoStandardnotesCountEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class SystemInfoStandardnotesIdEndpoint(
         Returns:
             StandardNoteInfo: The parsed response data.
         """
-        return self._parse_one(StandardNoteInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(StandardNoteInfo, super()._make_request("GET", data=data, params=params).content)
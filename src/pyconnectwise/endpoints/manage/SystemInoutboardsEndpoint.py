@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemInoutboardsEndpoint(
         IPostable.__init__(self, InOutBoard)
         IPaginateable.__init__(self, InOutBoard)
 
-        self.count = self._register_child_endpoint(SystemInoutboardsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemInoutboardsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemInoutboardsIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class SystemInoutboardsEndpoint(
         Returns:
             list[InOutBoard]: The parsed response data.
         """
-        return self._parse_many(InOutBoard, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(InOutBoard, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> InOutBoard:
         """
@@ -81,4 +80,11 @@ class SystemInoutboardsEndpoint(
         Returns:
             InOutBoard: The parsed response data.
         """
-        return self._parse_one(InOutBoard, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(InOutBoard, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemInoutboardsCountEndpoint:
+        """
+        The SystemInoutboardsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInoutboardsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SystemInouttypesEndpoint(
         IPostable.__init__(self, InOutType)
         IPaginateable.__init__(self, InOutType)
 
-        self.count = self._register_child_endpoint(SystemInouttypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemInouttypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemInouttypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemInouttypesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class SystemInouttypesEndpoint(
         Returns:
             list[InOutType]: The parsed response data.
         """
-        return self._parse_many(InOutType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(InOutType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> InOutType:
         """
@@ -83,4 +81,18 @@ class SystemInouttypesEndpoint(
         Returns:
             InOutType: The parsed response data.
         """
-        return self._parse_one(InOutType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(InOutType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemInouttypesCountEndpoint:
+        """
+        The SystemInouttypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInouttypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemInouttypesInfoEndpoint:
+        """
+        The SystemInouttypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInouttypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class SystemInouttypesIdEndpoint(
         IPuttable.__init__(self, InOutType)
         IPaginateable.__init__(self, InOutType)
 
-        self.info = self._register_child_endpoint(SystemInouttypesIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[InOutType]:
@@ -67,7 +66,7 @@ class SystemInouttypesIdEndpoint(
         Returns:
             InOutType: The parsed response data.
         """
-        return self._parse_one(InOutType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(InOutType, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> InOutType:
         """
@@ -79,7 +78,7 @@ class SystemInouttypesIdEndpoint(
         Returns:
             InOutType: The parsed response data.
         """
-        return self._parse_one(InOutType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(InOutType, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> InOutType:
         """
@@ -91,4 +90,11 @@ class SystemInouttypesIdEndpoint(
         Returns:
             InOutType: The parsed response data.
         """
-        return self._parse_one(InOutType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(InOutType, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SystemInouttypesIdInfoEndpoint:
+        """
+        The SystemInouttypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInouttypesIdInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class SystemInouttypesIdInfoEndpoint(
         Returns:
             InOutTypeInfo: The parsed response data.
         """
-        return self._parse_one(InOutTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(InOutTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -54,4 +54,4 @@ class SystemInouttypesInfoEndpoint(
         Returns:
             list[InOutTypeInfo]: The parsed response data.
         """
-        return self._parse_many(InOutTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(InOutTypeInfo, super()._make_request("GET", data=data, params=params).content)
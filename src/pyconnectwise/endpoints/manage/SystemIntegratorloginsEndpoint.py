@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemIntegratorloginsEndpoint(
         IPostable.__init__(self, IntegratorLogin)
         IPaginateable.__init__(self, IntegratorLogin)
 
-        self.count = self._register_child_endpoint(SystemIntegratorloginsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemIntegratorloginsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemIntegratorloginsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemIntegratorloginsEndpoint(
         Returns:
             list[IntegratorLogin]: The parsed response data.
         """
-        return self._parse_many(IntegratorLogin, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(IntegratorLogin, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> IntegratorLogin:
         """
@@ -85,4 +84,11 @@ class SystemIntegratorloginsEndpoint(
         Returns:
             IntegratorLogin: The parsed response data.
         """
-        return self._parse_one(IntegratorLogin, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(IntegratorLogin, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemIntegratorloginsCountEndpoint:
+        """
+        The SystemIntegratorloginsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemIntegratorloginsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemIntegratortagsEndpoint(
         IPostable.__init__(self, IntegratorTag)
         IPaginateable.__init__(self, IntegratorTag)
 
-        self.count = self._register_child_endpoint(SystemIntegratortagsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemIntegratortagsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemIntegratortagsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemIntegratortagsEndpoint(
         Returns:
             list[IntegratorTag]: The parsed response data.
         """
-        return self._parse_many(IntegratorTag, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(IntegratorTag, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> IntegratorTag:
         """
@@ -85,4 +84,11 @@ class SystemIntegratortagsEndpoint(
         Returns:
             IntegratorTag: The parsed response data.
         """
-        return self._parse_one(IntegratorTag, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(IntegratorTag, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemIntegratortagsCountEndpoint:
+        """
+        The SystemIntegratortagsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemIntegratortagsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemKpicategoriesEndpoint(
         IGettable.__init__(self, list[KPICategory])
         IPaginateable.__init__(self, KPICategory)
 
-        self.count = self._register_child_endpoint(SystemKpicategoriesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemKpicategoriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemKpicategoriesIdEndpoint object to move down the chain.
@@ -69,4 +68,11 @@ class SystemKpicategoriesEndpoint(
         Returns:
             list[KPICategory]: The parsed response data.
         """
-        return self._parse_many(KPICategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(KPICategory, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemKpicategoriesCountEndpoint:
+        """
+        The SystemKpicategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemKpicategoriesCountEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class SystemKpicategoriesIdEndpoint(
         Returns:
             KPICategory: The parsed response data.
         """
-        return self._parse_one(KPICategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(KPICategory, super()._make_request("GET", data=data, params=params).content)
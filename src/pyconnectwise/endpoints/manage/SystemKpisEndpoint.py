@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemKpisEndpoint(
         IGettable.__init__(self, list[KPI])
         IPaginateable.__init__(self, KPI)
 
-        self.count = self._register_child_endpoint(SystemKpisCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemKpisIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemKpisIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class SystemKpisEndpoint(
         Returns:
             list[KPI]: The parsed response data.
         """
-        return self._parse_many(KPI, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(KPI, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemKpisCountEndpoint:
+        """
+        The SystemKpisCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemKpisCountEndpoint(self.client, parent_endpoint=self))
@@ -50,4 +50,4 @@ class SystemKpisIdEndpoint(
         Returns:
             KPI: The parsed response data.
         """
-        return self._parse_one(KPI, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(KPI, super()._make_request("GET", data=data, params=params).content)
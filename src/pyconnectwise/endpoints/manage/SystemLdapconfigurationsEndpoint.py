@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,12 +29,6 @@ class SystemLdapconfigurationsEndpoint(
         IPostable.__init__(self, LdapConfiguration)
         IPaginateable.__init__(self, LdapConfiguration)
 
-        self.count = self._register_child_endpoint(SystemLdapconfigurationsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemLdapconfigurationsInfoEndpoint(client, parent_endpoint=self))
-        self.test_link = self._register_child_endpoint(
-            SystemLdapconfigurationsTestlinkEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemLdapconfigurationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemLdapconfigurationsIdEndpoint object to move down the chain.
@@ -81,7 +76,7 @@ class SystemLdapconfigurationsEndpoint(
         Returns:
             list[LdapConfiguration]: The parsed response data.
         """
-        return self._parse_many(LdapConfiguration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LdapConfiguration, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> LdapConfiguration:
         """
@@ -93,4 +88,27 @@ class SystemLdapconfigurationsEndpoint(
         Returns:
             LdapConfiguration: The parsed response data.
         """
-        return self._parse_one(LdapConfiguration, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(LdapConfiguration, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemLdapconfigurationsCountEndpoint:
+        """
+        The SystemLdapconfigurationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLdapconfigurationsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemLdapconfigurationsInfoEndpoint:
+        """
+        The SystemLdapconfigurationsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLdapconfigurationsInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def test_link(self) -> SystemLdapconfigurationsTestlinkEndpoint:
+        """
+        The SystemLdapconfigurationsTestlinkEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemLdapconfigurationsTestlinkEndpoint(self.client, parent_endpoint=self)
+        )
@@ -54,4 +54,4 @@ class SystemLdapconfigurationsIdInfoEndpoint(
         Returns:
             LdapConfigurationInfo: The parsed response data.
         """
-        return self._parse_one(LdapConfigurationInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LdapConfigurationInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemLinksEndpoint(
         IPostable.__init__(self, Link)
         IPaginateable.__init__(self, Link)
 
-        self.count = self._register_child_endpoint(SystemLinksCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemLinksIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemLinksIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class SystemLinksEndpoint(
         Returns:
             list[Link]: The parsed response data.
         """
-        return self._parse_many(Link, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Link, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Link:
         """
@@ -81,4 +80,11 @@ class SystemLinksEndpoint(
         Returns:
             Link: The parsed response data.
         """
-        return self._parse_one(Link, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Link, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemLinksCountEndpoint:
+        """
+        The SystemLinksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLinksCountEndpoint(self.client, parent_endpoint=self))
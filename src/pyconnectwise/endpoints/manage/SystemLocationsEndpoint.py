@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemLocationsEndpoint(
         IPostable.__init__(self, Location)
         IPaginateable.__init__(self, Location)
 
-        self.count = self._register_child_endpoint(SystemLocationsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemLocationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemLocationsIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class SystemLocationsEndpoint(
         Returns:
             list[Location]: The parsed response data.
         """
-        return self._parse_many(Location, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Location, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Location:
         """
@@ -81,4 +80,11 @@ class SystemLocationsEndpoint(
         Returns:
             Location: The parsed response data.
         """
-        return self._parse_one(Location, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Location, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemLocationsCountEndpoint:
+        """
+        The SystemLocationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLocationsCountEndpoint(self.client, parent_endpoint=self))
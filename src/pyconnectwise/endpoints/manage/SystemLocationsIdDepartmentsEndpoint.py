@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,10 +25,6 @@ class SystemLocationsIdDepartmentsEndpoint(
         IGettable.__init__(self, list[LocationDepartment])
         IPaginateable.__init__(self, LocationDepartment)
 
-        self.count = self._register_child_endpoint(
-            SystemLocationsIdDepartmentsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemLocationsIdDepartmentsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemLocationsIdDepartmentsIdEndpoint object to move down the chain.
@@ -75,4 +72,13 @@ class SystemLocationsIdDepartmentsEndpoint(
         Returns:
             list[LocationDepartment]: The parsed response data.
         """
-        return self._parse_many(LocationDepartment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LocationDepartment, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemLocationsIdDepartmentsCountEndpoint:
+        """
+        The SystemLocationsIdDepartmentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemLocationsIdDepartmentsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -52,4 +52,4 @@ class SystemLocationsIdDepartmentsIdEndpoint(
         Returns:
             LocationDepartment: The parsed response data.
         """
-        return self._parse_one(LocationDepartment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LocationDepartment, super()._make_request("GET", data=data, params=params).content)
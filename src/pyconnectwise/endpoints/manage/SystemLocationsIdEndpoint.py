@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,14 +28,6 @@ class SystemLocationsIdEndpoint(
         IPuttable.__init__(self, Location)
         IPaginateable.__init__(self, Location)
 
-        self.departments = self._register_child_endpoint(
-            SystemLocationsIdDepartmentsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(SystemLocationsIdUsagesEndpoint(client, parent_endpoint=self))
-        self.work_roles = self._register_child_endpoint(
-            SystemLocationsIdWorkrolesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Location]:
@@ -75,7 +68,7 @@ class SystemLocationsIdEndpoint(
         Returns:
             Location: The parsed response data.
         """
-        return self._parse_one(Location, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Location, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Location:
         """
@@ -87,7 +80,7 @@ class SystemLocationsIdEndpoint(
         Returns:
             Location: The parsed response data.
         """
-        return self._parse_one(Location, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Location, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Location:
         """
@@ -99,4 +92,25 @@ class SystemLocationsIdEndpoint(
         Returns:
             Location: The parsed response data.
         """
-        return self._parse_one(Location, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Location, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def departments(self) -> SystemLocationsIdDepartmentsEndpoint:
+        """
+        The SystemLocationsIdDepartmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLocationsIdDepartmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> SystemLocationsIdUsagesEndpoint:
+        """
+        The SystemLocationsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLocationsIdUsagesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def work_roles(self) -> SystemLocationsIdWorkrolesEndpoint:
+        """
+        The SystemLocationsIdWorkrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLocationsIdWorkrolesEndpoint(self.client, parent_endpoint=self))
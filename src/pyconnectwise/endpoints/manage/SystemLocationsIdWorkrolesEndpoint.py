@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,10 +25,6 @@ class SystemLocationsIdWorkrolesEndpoint(
         IGettable.__init__(self, list[LocationWorkRole])
         IPaginateable.__init__(self, LocationWorkRole)
 
-        self.count = self._register_child_endpoint(
-            SystemLocationsIdWorkrolesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemLocationsIdWorkrolesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemLocationsIdWorkrolesIdEndpoint object to move down the chain.
@@ -75,4 +72,11 @@ class SystemLocationsIdWorkrolesEndpoint(
         Returns:
             list[LocationWorkRole]: The parsed response data.
         """
-        return self._parse_many(LocationWorkRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(LocationWorkRole, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemLocationsIdWorkrolesCountEndpoint:
+        """
+        The SystemLocationsIdWorkrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLocationsIdWorkrolesCountEndpoint(self.client, parent_endpoint=self))
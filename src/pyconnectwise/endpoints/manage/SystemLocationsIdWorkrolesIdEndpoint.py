@@ -52,4 +52,4 @@ class SystemLocationsIdWorkrolesIdEndpoint(
         Returns:
             LocationWorkRole: The parsed response data.
         """
-        return self._parse_one(LocationWorkRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(LocationWorkRole, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.SystemM365contactsyncAuthorizeEndpoint import (
     SystemM365contactsyncAuthorizeEndpoint,
@@ -23,20 +25,6 @@ class SystemM365contactsyncEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "m365contactsync", parent_endpoint=parent_endpoint)
 
-        self.info = self._register_child_endpoint(SystemM365contactsyncInfoEndpoint(client, parent_endpoint=self))
-        self.authorize = self._register_child_endpoint(
-            SystemM365contactsyncAuthorizeEndpoint(client, parent_endpoint=self)
-        )
-        self.notifydeactivation = self._register_child_endpoint(
-            SystemM365contactsyncNotifydeactivationEndpoint(client, parent_endpoint=self)
-        )
-        self.notifyerror = self._register_child_endpoint(
-            SystemM365contactsyncNotifyerrorEndpoint(client, parent_endpoint=self)
-        )
-        self.checkvalidsync = self._register_child_endpoint(
-            SystemM365contactsyncCheckvalidsyncEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, id: int) -> SystemM365contactsyncIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized SystemM365contactsyncIdEndpoint object to move down the chain.
@@ -49,3 +37,44 @@ class SystemM365contactsyncEndpoint(ConnectWiseEndpoint):
         child = SystemM365contactsyncIdEndpoint(self.client, parent_endpoint=self)
         child._id = id
         return child
+
+    @cached_property
+    def authorize(self) -> SystemM365contactsyncAuthorizeEndpoint:
+        """
+        The SystemM365contactsyncAuthorizeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemM365contactsyncAuthorizeEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def checkvalidsync(self) -> SystemM365contactsyncCheckvalidsyncEndpoint:
+        """
+        The SystemM365contactsyncCheckvalidsyncEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemM365contactsyncCheckvalidsyncEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> SystemM365contactsyncInfoEndpoint:
+        """
+        The SystemM365contactsyncInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemM365contactsyncInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notifydeactivation(self) -> SystemM365contactsyncNotifydeactivationEndpoint:
+        """
+        The SystemM365contactsyncNotifydeactivationEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemM365contactsyncNotifydeactivationEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def notifyerror(self) -> SystemM365contactsyncNotifyerrorEndpoint:
+        """
+        The SystemM365contactsyncNotifyerrorEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemM365contactsyncNotifyerrorEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.SystemM365contactsyncIdInfoEndpoint import (
     SystemM365contactsyncIdInfoEndpoint,
@@ -14,8 +16,23 @@ class SystemM365contactsyncIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.test = self._register_child_endpoint(SystemM365contactsyncIdTestEndpoint(client, parent_endpoint=self))
-        self.viewauth = self._register_child_endpoint(
-            SystemM365contactsyncIdViewauthEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(SystemM365contactsyncIdInfoEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def info(self) -> SystemM365contactsyncIdInfoEndpoint:
+        """
+        The SystemM365contactsyncIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemM365contactsyncIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def test(self) -> SystemM365contactsyncIdTestEndpoint:
+        """
+        The SystemM365contactsyncIdTestEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemM365contactsyncIdTestEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def viewauth(self) -> SystemM365contactsyncIdViewauthEndpoint:
+        """
+        The SystemM365contactsyncIdViewauthEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemM365contactsyncIdViewauthEndpoint(self.client, parent_endpoint=self))
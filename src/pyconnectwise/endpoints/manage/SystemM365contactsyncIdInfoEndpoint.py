@@ -67,5 +67,5 @@ class SystemM365contactsyncIdInfoEndpoint(
         """
         return self._parse_one(
             M365ContactSyncInfo,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
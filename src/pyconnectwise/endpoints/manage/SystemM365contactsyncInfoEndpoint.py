@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.SystemM365contactsyncInfoCountEndpoint import (
     SystemM365contactsyncInfoCountEndpoint,
@@ -24,8 +26,6 @@ class SystemM365contactsyncInfoEndpoint(
         IGettable.__init__(self, list[M365ContactSyncInfo])
         IPaginateable.__init__(self, M365ContactSyncInfo)
 
-        self.count = self._register_child_endpoint(SystemM365contactsyncInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self,
         page: int,
@@ -72,5 +72,12 @@ class SystemM365contactsyncInfoEndpoint(
         """
         return self._parse_many(
             M365ContactSyncInfo,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
+
+    @cached_property
+    def count(self) -> SystemM365contactsyncInfoCountEndpoint:
+        """
+        The SystemM365contactsyncInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemM365contactsyncInfoCountEndpoint(self.client, parent_endpoint=self))
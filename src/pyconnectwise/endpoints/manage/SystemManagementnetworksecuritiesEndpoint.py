@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class SystemManagementnetworksecuritiesEndpoint(
         IPostable.__init__(self, ManagementNetworkSecurity)
         IPaginateable.__init__(self, ManagementNetworkSecurity)
 
-        self.count = self._register_child_endpoint(
-            SystemManagementnetworksecuritiesCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemManagementnetworksecuritiesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemManagementnetworksecuritiesIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class SystemManagementnetworksecuritiesEndpoint(
             list[ManagementNetworkSecurity]: The parsed response data.
         """
         return self._parse_many(
-            ManagementNetworkSecurity, super()._make_request("GET", data=data, params=params).json()
+            ManagementNetworkSecurity, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class SystemManagementnetworksecuritiesEndpoint(
             ManagementNetworkSecurity: The parsed response data.
         """
         return self._parse_one(
-            ManagementNetworkSecurity, super()._make_request("POST", data=data, params=params).json()
+            ManagementNetworkSecurity, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> SystemManagementnetworksecuritiesCountEndpoint:
+        """
+        The SystemManagementnetworksecuritiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemManagementnetworksecuritiesCountEndpoint(self.client, parent_endpoint=self)
         )
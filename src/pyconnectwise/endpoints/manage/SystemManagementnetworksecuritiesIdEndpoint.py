@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class SystemManagementnetworksecuritiesIdEndpoint(
         IPuttable.__init__(self, ManagementNetworkSecurity)
         IPaginateable.__init__(self, ManagementNetworkSecurity)
 
-        self.test_credentials = self._register_child_endpoint(
-            SystemManagementnetworksecuritiesIdTestcredentialsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ManagementNetworkSecurity]:
@@ -75,7 +72,9 @@ class SystemManagementnetworksecuritiesIdEndpoint(
         Returns:
             ManagementNetworkSecurity: The parsed response data.
         """
-        return self._parse_one(ManagementNetworkSecurity, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(
+            ManagementNetworkSecurity, super()._make_request("GET", data=data, params=params).content
+        )
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -90,7 +89,7 @@ class SystemManagementnetworksecuritiesIdEndpoint(
             ManagementNetworkSecurity: The parsed response data.
         """
         return self._parse_one(
-            ManagementNetworkSecurity, super()._make_request("PATCH", data=data, params=params).json()
+            ManagementNetworkSecurity, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -105,4 +104,15 @@ class SystemManagementnetworksecuritiesIdEndpoint(
         Returns:
             ManagementNetworkSecurity: The parsed response data.
         """
-        return self._parse_one(ManagementNetworkSecurity, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(
+            ManagementNetworkSecurity, super()._make_request("PUT", data=data, params=params).content
+        )
+
+    @cached_property
+    def test_credentials(self) -> SystemManagementnetworksecuritiesIdTestcredentialsEndpoint:
+        """
+        The SystemManagementnetworksecuritiesIdTestcredentialsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemManagementnetworksecuritiesIdTestcredentialsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -52,4 +52,4 @@ class SystemManagementnetworksecuritiesIdTestcredentialsEndpoint(
         Returns:
             SuccessResponse: The parsed response data.
         """
-        return self._parse_one(SuccessResponse, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SuccessResponse, super()._make_request("GET", data=data, params=params).content)
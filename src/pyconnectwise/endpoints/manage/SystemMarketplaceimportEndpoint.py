@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -14,9 +15,18 @@ class SystemMarketplaceimportEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "marketplaceimport", parent_endpoint=parent_endpoint)
 
-        self.getdefinition = self._register_child_endpoint(
-            SystemMarketplaceimportGetdefinitionEndpoint(client, parent_endpoint=self)
-        )
-        self.import_ = self._register_child_endpoint(
-            SystemMarketplaceimportImportEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def getdefinition(self) -> SystemMarketplaceimportGetdefinitionEndpoint:
+        """
+        The SystemMarketplaceimportGetdefinitionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMarketplaceimportGetdefinitionEndpoint(self.client, parent_endpoint=self)
         )
+
+    @cached_property
+    def import_(self) -> SystemMarketplaceimportImportEndpoint:
+        """
+        The SystemMarketplaceimportImportEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMarketplaceimportImportEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class SystemMarketplaceimportGetdefinitionIdEndpoint(
         Returns:
             MarketplaceImport: The parsed response data.
         """
-        return self._parse_one(MarketplaceImport, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MarketplaceImport, super()._make_request("GET", data=data, params=params).content)
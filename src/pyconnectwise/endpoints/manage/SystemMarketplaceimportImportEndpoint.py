@@ -26,4 +26,4 @@ class SystemMarketplaceimportImportEndpoint(
         Returns:
             MarketplaceImport: The parsed response data.
         """
-        return self._parse_one(MarketplaceImport, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MarketplaceImport, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class SystemMembersEndpoint(
         IPostable.__init__(self, Member)
         IPaginateable.__init__(self, Member)
 
-        self.count = self._register_child_endpoint(SystemMembersCountEndpoint(client, parent_endpoint=self))
-        self.types = self._register_child_endpoint(SystemMembersTypesEndpoint(client, parent_endpoint=self))
-        self.with_sso = self._register_child_endpoint(SystemMembersWithssoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemMembersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMembersIdEndpoint object to move down the chain.
@@ -73,7 +70,7 @@ class SystemMembersEndpoint(
         Returns:
             list[Member]: The parsed response data.
         """
-        return self._parse_many(Member, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Member, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Member:
         """
@@ -85,4 +82,25 @@ class SystemMembersEndpoint(
         Returns:
             Member: The parsed response data.
         """
-        return self._parse_one(Member, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Member, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMembersCountEndpoint:
+        """
+        The SystemMembersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> SystemMembersTypesEndpoint:
+        """
+        The SystemMembersTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersTypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def with_sso(self) -> SystemMembersWithssoEndpoint:
+        """
+        The SystemMembersWithssoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersWithssoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemMembersIdAccrualsEndpoint(
         IPostable.__init__(self, MemberAccrual)
         IPaginateable.__init__(self, MemberAccrual)
 
-        self.count = self._register_child_endpoint(SystemMembersIdAccrualsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemMembersIdAccrualsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMembersIdAccrualsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemMembersIdAccrualsEndpoint(
         Returns:
             list[MemberAccrual]: The parsed response data.
         """
-        return self._parse_many(MemberAccrual, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberAccrual, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MemberAccrual:
         """
@@ -85,4 +84,11 @@ class SystemMembersIdAccrualsEndpoint(
         Returns:
             MemberAccrual: The parsed response data.
         """
-        return self._parse_one(MemberAccrual, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MemberAccrual, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMembersIdAccrualsCountEndpoint:
+        """
+        The SystemMembersIdAccrualsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdAccrualsCountEndpoint(self.client, parent_endpoint=self))
@@ -28,4 +28,4 @@ class SystemMembersIdDeactivateEndpoint(
         Returns:
             MemberDeactivation: The parsed response data.
         """
-        return self._parse_one(MemberDeactivation, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MemberDeactivation, super()._make_request("POST", data=data, params=params).content)
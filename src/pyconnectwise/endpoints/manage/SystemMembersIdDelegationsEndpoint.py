@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class SystemMembersIdDelegationsEndpoint(
         IPostable.__init__(self, MemberDelegation)
         IPaginateable.__init__(self, MemberDelegation)
 
-        self.count = self._register_child_endpoint(
-            SystemMembersIdDelegationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemMembersIdDelegationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMembersIdDelegationsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class SystemMembersIdDelegationsEndpoint(
         Returns:
             list[MemberDelegation]: The parsed response data.
         """
-        return self._parse_many(MemberDelegation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberDelegation, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MemberDelegation:
         """
@@ -89,4 +86,11 @@ class SystemMembersIdDelegationsEndpoint(
         Returns:
             MemberDelegation: The parsed response data.
         """
-        return self._parse_one(MemberDelegation, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MemberDelegation, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMembersIdDelegationsCountEndpoint:
+        """
+        The SystemMembersIdDelegationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdDelegationsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -48,39 +49,6 @@ class SystemMembersIdEndpoint(
         IPuttable.__init__(self, Member)
         IPaginateable.__init__(self, Member)
 
-        self.accruals = self._register_child_endpoint(SystemMembersIdAccrualsEndpoint(client, parent_endpoint=self))
-        self.certifications = self._register_child_endpoint(
-            SystemMembersIdCertificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.deactivate = self._register_child_endpoint(SystemMembersIdDeactivateEndpoint(client, parent_endpoint=self))
-        self.delegations = self._register_child_endpoint(
-            SystemMembersIdDelegationsEndpoint(client, parent_endpoint=self)
-        )
-        self.image = self._register_child_endpoint(SystemMembersIdImageEndpoint(client, parent_endpoint=self))
-        self.link_sso_user = self._register_child_endpoint(
-            SystemMembersIdLinkssouserEndpoint(client, parent_endpoint=self)
-        )
-        self.managed_device_accounts = self._register_child_endpoint(
-            SystemMembersIdManageddeviceaccountsEndpoint(client, parent_endpoint=self)
-        )
-        self.mycertifications = self._register_child_endpoint(
-            SystemMembersIdMycertificationsEndpoint(client, parent_endpoint=self)
-        )
-        self.notification_settings = self._register_child_endpoint(
-            SystemMembersIdNotificationsettingsEndpoint(client, parent_endpoint=self)
-        )
-        self.personas = self._register_child_endpoint(SystemMembersIdPersonasEndpoint(client, parent_endpoint=self))
-        self.skills = self._register_child_endpoint(SystemMembersIdSkillsEndpoint(client, parent_endpoint=self))
-        self.submit = self._register_child_endpoint(SystemMembersIdSubmitEndpoint(client, parent_endpoint=self))
-        self.tokens = self._register_child_endpoint(SystemMembersIdTokensEndpoint(client, parent_endpoint=self))
-        self.unlink_sso_user = self._register_child_endpoint(
-            SystemMembersIdUnlinkssouserEndpoint(client, parent_endpoint=self)
-        )
-        self.unused_time_sheets = self._register_child_endpoint(
-            SystemMembersIdUnusedtimesheetsEndpoint(client, parent_endpoint=self)
-        )
-        self.usages = self._register_child_endpoint(SystemMembersIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Member]:
@@ -111,7 +79,7 @@ class SystemMembersIdEndpoint(
         Returns:
             Member: The parsed response data.
         """
-        return self._parse_one(Member, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Member, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Member:
         """
@@ -123,7 +91,7 @@ class SystemMembersIdEndpoint(
         Returns:
             Member: The parsed response data.
         """
-        return self._parse_one(Member, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Member, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Member:
         """
@@ -135,4 +103,120 @@ class SystemMembersIdEndpoint(
         Returns:
             Member: The parsed response data.
         """
-        return self._parse_one(Member, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Member, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def accruals(self) -> SystemMembersIdAccrualsEndpoint:
+        """
+        The SystemMembersIdAccrualsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdAccrualsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def certifications(self) -> SystemMembersIdCertificationsEndpoint:
+        """
+        The SystemMembersIdCertificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdCertificationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def deactivate(self) -> SystemMembersIdDeactivateEndpoint:
+        """
+        The SystemMembersIdDeactivateEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdDeactivateEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def delegations(self) -> SystemMembersIdDelegationsEndpoint:
+        """
+        The SystemMembersIdDelegationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdDelegationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def image(self) -> SystemMembersIdImageEndpoint:
+        """
+        The SystemMembersIdImageEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdImageEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def link_sso_user(self) -> SystemMembersIdLinkssouserEndpoint:
+        """
+        The SystemMembersIdLinkssouserEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdLinkssouserEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def managed_device_accounts(self) -> SystemMembersIdManageddeviceaccountsEndpoint:
+        """
+        The SystemMembersIdManageddeviceaccountsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMembersIdManageddeviceaccountsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def mycertifications(self) -> SystemMembersIdMycertificationsEndpoint:
+        """
+        The SystemMembersIdMycertificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdMycertificationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notification_settings(self) -> SystemMembersIdNotificationsettingsEndpoint:
+        """
+        The SystemMembersIdNotificationsettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMembersIdNotificationsettingsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def personas(self) -> SystemMembersIdPersonasEndpoint:
+        """
+        The SystemMembersIdPersonasEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdPersonasEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def skills(self) -> SystemMembersIdSkillsEndpoint:
+        """
+        The SystemMembersIdSkillsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdSkillsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def submit(self) -> SystemMembersIdSubmitEndpoint:
+        """
+        The SystemMembersIdSubmitEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdSubmitEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tokens(self) -> SystemMembersIdTokensEndpoint:
+        """
+        The SystemMembersIdTokensEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdTokensEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def unlink_sso_user(self) -> SystemMembersIdUnlinkssouserEndpoint:
+        """
+        The SystemMembersIdUnlinkssouserEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdUnlinkssouserEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def unused_time_sheets(self) -> SystemMembersIdUnusedtimesheetsEndpoint:
+        """
+        The SystemMembersIdUnusedtimesheetsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdUnusedtimesheetsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> SystemMembersIdUsagesEndpoint:
+        """
+        The SystemMembersIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -29,7 +29,7 @@ class SystemMembersIdManageddeviceaccountsBulkEndpoint(
         Returns:
             BulkResult: The parsed response data.
         """
-        return self._parse_one(BulkResult, super()._make_request("DELETE", data=data, params=params).json())
+        return self._parse_one(BulkResult, super()._make_request("DELETE", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BulkResult:
         """
@@ -41,4 +41,4 @@ class SystemMembersIdManageddeviceaccountsBulkEndpoint(
         Returns:
             BulkResult: The parsed response data.
         """
-        return self._parse_one(BulkResult, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(BulkResult, super()._make_request("PUT", data=data, params=params).content)
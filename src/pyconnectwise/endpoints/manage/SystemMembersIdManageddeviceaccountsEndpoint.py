@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class SystemMembersIdManageddeviceaccountsEndpoint(
         IGettable.__init__(self, list[ManagedDeviceAccount])
         IPaginateable.__init__(self, ManagedDeviceAccount)
 
-        self.bulk = self._register_child_endpoint(
-            SystemMembersIdManageddeviceaccountsBulkEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ManagedDeviceAccount]:
@@ -61,4 +58,13 @@ class SystemMembersIdManageddeviceaccountsEndpoint(
         Returns:
             list[ManagedDeviceAccount]: The parsed response data.
         """
-        return self._parse_many(ManagedDeviceAccount, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ManagedDeviceAccount, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def bulk(self) -> SystemMembersIdManageddeviceaccountsBulkEndpoint:
+        """
+        The SystemMembersIdManageddeviceaccountsBulkEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMembersIdManageddeviceaccountsBulkEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class SystemMembersIdMycertificationsEndpoint(
         IPostable.__init__(self, MemberCertification)
         IPaginateable.__init__(self, MemberCertification)
 
-        self.count = self._register_child_endpoint(
-            SystemMembersIdMycertificationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemMembersIdMycertificationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMembersIdMycertificationsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class SystemMembersIdMycertificationsEndpoint(
         Returns:
             list[MemberCertification]: The parsed response data.
         """
-        return self._parse_many(MemberCertification, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberCertification, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -93,4 +90,13 @@ class SystemMembersIdMycertificationsEndpoint(
         Returns:
             MemberCertification: The parsed response data.
         """
-        return self._parse_one(MemberCertification, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MemberCertification, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMembersIdMycertificationsCountEndpoint:
+        """
+        The SystemMembersIdMycertificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMembersIdMycertificationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class SystemMembersIdNotificationsettingsEndpoint(
         IPostable.__init__(self, MemberNotificationSetting)
         IPaginateable.__init__(self, MemberNotificationSetting)
 
-        self.count = self._register_child_endpoint(
-            SystemMembersIdNotificationsettingsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemMembersIdNotificationsettingsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMembersIdNotificationsettingsIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class SystemMembersIdNotificationsettingsEndpoint(
             list[MemberNotificationSetting]: The parsed response data.
         """
         return self._parse_many(
-            MemberNotificationSetting, super()._make_request("GET", data=data, params=params).json()
+            MemberNotificationSetting, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class SystemMembersIdNotificationsettingsEndpoint(
             MemberNotificationSetting: The parsed response data.
         """
         return self._parse_one(
-            MemberNotificationSetting, super()._make_request("POST", data=data, params=params).json()
+            MemberNotificationSetting, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> SystemMembersIdNotificationsettingsCountEndpoint:
+        """
+        The SystemMembersIdNotificationsettingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMembersIdNotificationsettingsCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -68,7 +68,9 @@ class SystemMembersIdNotificationsettingsIdEndpoint(
         Returns:
             MemberNotificationSetting: The parsed response data.
         """
-        return self._parse_one(MemberNotificationSetting, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(
+            MemberNotificationSetting, super()._make_request("GET", data=data, params=params).content
+        )
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -83,7 +85,7 @@ class SystemMembersIdNotificationsettingsIdEndpoint(
             MemberNotificationSetting: The parsed response data.
         """
         return self._parse_one(
-            MemberNotificationSetting, super()._make_request("PATCH", data=data, params=params).json()
+            MemberNotificationSetting, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -98,4 +100,6 @@ class SystemMembersIdNotificationsettingsIdEndpoint(
         Returns:
             MemberNotificationSetting: The parsed response data.
         """
-        return self._parse_one(MemberNotificationSetting, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(
+            MemberNotificationSetting, super()._make_request("PUT", data=data, params=params).content
+        )
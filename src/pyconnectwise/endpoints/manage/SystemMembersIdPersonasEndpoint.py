@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemMembersIdPersonasEndpoint(
         IGettable.__init__(self, list[MemberPersona])
         IPaginateable.__init__(self, MemberPersona)
 
-        self.count = self._register_child_endpoint(SystemMembersIdPersonasCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemMembersIdPersonasIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMembersIdPersonasIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class SystemMembersIdPersonasEndpoint(
         Returns:
             list[MemberPersona]: The parsed response data.
         """
-        return self._parse_many(MemberPersona, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberPersona, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMembersIdPersonasCountEndpoint:
+        """
+        The SystemMembersIdPersonasCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdPersonasCountEndpoint(self.client, parent_endpoint=self))
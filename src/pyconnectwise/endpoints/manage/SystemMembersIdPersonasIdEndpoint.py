@@ -52,4 +52,4 @@ class SystemMembersIdPersonasIdEndpoint(
         Returns:
             MemberPersona: The parsed response data.
         """
-        return self._parse_one(MemberPersona, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MemberPersona, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemMembersIdSkillsEndpoint(
         IPostable.__init__(self, MemberSkill)
         IPaginateable.__init__(self, MemberSkill)
 
-        self.count = self._register_child_endpoint(SystemMembersIdSkillsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemMembersIdSkillsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMembersIdSkillsIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class SystemMembersIdSkillsEndpoint(
         Returns:
             list[MemberSkill]: The parsed response data.
         """
-        return self._parse_many(MemberSkill, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberSkill, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MemberSkill:
         """
@@ -83,4 +82,11 @@ class SystemMembersIdSkillsEndpoint(
         Returns:
             MemberSkill: The parsed response data.
         """
-        return self._parse_one(MemberSkill, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MemberSkill, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMembersIdSkillsCountEndpoint:
+        """
+        The SystemMembersIdSkillsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdSkillsCountEndpoint(self.client, parent_endpoint=self))
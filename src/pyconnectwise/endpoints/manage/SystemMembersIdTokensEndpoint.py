@@ -24,4 +24,4 @@ class SystemMembersIdTokensEndpoint(ConnectWiseEndpoint, IPostable[Token, Connec
         Returns:
             Token: The parsed response data.
         """
-        return self._parse_one(Token, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Token, super()._make_request("POST", data=data, params=params).content)
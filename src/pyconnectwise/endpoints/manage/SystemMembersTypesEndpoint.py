@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SystemMembersTypesEndpoint(
         IPostable.__init__(self, MemberType)
         IPaginateable.__init__(self, MemberType)
 
-        self.count = self._register_child_endpoint(SystemMembersTypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemMembersTypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemMembersTypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMembersTypesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class SystemMembersTypesEndpoint(
         Returns:
             list[MemberType]: The parsed response data.
         """
-        return self._parse_many(MemberType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MemberType:
         """
@@ -83,4 +81,18 @@ class SystemMembersTypesEndpoint(
         Returns:
             MemberType: The parsed response data.
         """
-        return self._parse_one(MemberType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MemberType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMembersTypesCountEndpoint:
+        """
+        The SystemMembersTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemMembersTypesInfoEndpoint:
+        """
+        The SystemMembersTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersTypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class SystemMembersTypesIdEndpoint(
         IPuttable.__init__(self, MemberType)
         IPaginateable.__init__(self, MemberType)
 
-        self.info = self._register_child_endpoint(SystemMembersTypesIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[MemberType]:
@@ -67,7 +66,7 @@ class SystemMembersTypesIdEndpoint(
         Returns:
             MemberType: The parsed response data.
         """
-        return self._parse_one(MemberType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MemberType, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> MemberType:
         """
@@ -79,7 +78,7 @@ class SystemMembersTypesIdEndpoint(
         Returns:
             MemberType: The parsed response data.
         """
-        return self._parse_one(MemberType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(MemberType, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MemberType:
         """
@@ -91,4 +90,11 @@ class SystemMembersTypesIdEndpoint(
         Returns:
             MemberType: The parsed response data.
         """
-        return self._parse_one(MemberType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(MemberType, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SystemMembersTypesIdInfoEndpoint:
+        """
+        The SystemMembersTypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersTypesIdInfoEndpoint(self.client, parent_endpoint=self))
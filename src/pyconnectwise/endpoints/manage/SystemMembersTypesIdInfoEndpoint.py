@@ -52,4 +52,4 @@ class SystemMembersTypesIdInfoEndpoint(
         Returns:
             MemberTypeInfo: The parsed response data.
         """
-        return self._parse_one(MemberTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MemberTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -50,4 +50,4 @@ class SystemMembersWithssoEndpoint(
         Returns:
             list[Member]: The parsed response data.
         """
-        return self._parse_many(Member, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Member, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.SystemMembertemplatesCountEndpoint import (
     SystemMembertemplatesCountEndpoint,
@@ -11,8 +13,6 @@ class SystemMembertemplatesEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "membertemplates", parent_endpoint=parent_endpoint)
 
-        self.count = self._register_child_endpoint(SystemMembertemplatesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, id: int) -> SystemMembertemplatesIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized SystemMembertemplatesIdEndpoint object to move down the chain.
@@ -25,3 +25,10 @@ class SystemMembertemplatesEndpoint(ConnectWiseEndpoint):
         child = SystemMembertemplatesIdEndpoint(self.client, parent_endpoint=self)
         child._id = id
         return child
+
+    @cached_property
+    def count(self) -> SystemMembertemplatesCountEndpoint:
+        """
+        The SystemMembertemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembertemplatesCountEndpoint(self.client, parent_endpoint=self))
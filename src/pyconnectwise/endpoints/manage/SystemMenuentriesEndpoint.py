@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemMenuentriesEndpoint(
         IPostable.__init__(self, MenuEntry)
         IPaginateable.__init__(self, MenuEntry)
 
-        self.count = self._register_child_endpoint(SystemMenuentriesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemMenuentriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMenuentriesIdEndpoint object to move down the chain.
@@ -69,7 +68,7 @@ class SystemMenuentriesEndpoint(
         Returns:
             list[MenuEntry]: The parsed response data.
         """
-        return self._parse_many(MenuEntry, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MenuEntry, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MenuEntry:
         """
@@ -81,4 +80,11 @@ class SystemMenuentriesEndpoint(
         Returns:
             MenuEntry: The parsed response data.
         """
-        return self._parse_one(MenuEntry, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MenuEntry, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMenuentriesCountEndpoint:
+        """
+        The SystemMenuentriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMenuentriesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class SystemMenuentriesIdEndpoint(
         IPuttable.__init__(self, MenuEntry)
         IPaginateable.__init__(self, MenuEntry)
 
-        self.image = self._register_child_endpoint(SystemMenuentriesIdImageEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[MenuEntry]:
@@ -67,7 +66,7 @@ class SystemMenuentriesIdEndpoint(
         Returns:
             MenuEntry: The parsed response data.
         """
-        return self._parse_one(MenuEntry, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MenuEntry, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> MenuEntry:
         """
@@ -79,7 +78,7 @@ class SystemMenuentriesIdEndpoint(
         Returns:
             MenuEntry: The parsed response data.
         """
-        return self._parse_one(MenuEntry, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(MenuEntry, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MenuEntry:
         """
@@ -91,4 +90,11 @@ class SystemMenuentriesIdEndpoint(
         Returns:
             MenuEntry: The parsed response data.
         """
-        return self._parse_one(MenuEntry, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(MenuEntry, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def image(self) -> SystemMenuentriesIdImageEndpoint:
+        """
+        The SystemMenuentriesIdImageEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMenuentriesIdImageEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class SystemMenuentriesIdLocationsEndpoint(
         IPostable.__init__(self, MenuEntryLocation)
         IPaginateable.__init__(self, MenuEntryLocation)
 
-        self.count = self._register_child_endpoint(
-            SystemMenuentriesIdLocationsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemMenuentriesIdLocationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMenuentriesIdLocationsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class SystemMenuentriesIdLocationsEndpoint(
         Returns:
             list[MenuEntryLocation]: The parsed response data.
         """
-        return self._parse_many(MenuEntryLocation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MenuEntryLocation, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MenuEntryLocation:
         """
@@ -89,4 +86,13 @@ class SystemMenuentriesIdLocationsEndpoint(
         Returns:
             MenuEntryLocation: The parsed response data.
         """
-        return self._parse_one(MenuEntryLocation, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MenuEntryLocation, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMenuentriesIdLocationsCountEndpoint:
+        """
+        The SystemMenuentriesIdLocationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMenuentriesIdLocationsCountEndpoint(self.client, parent_endpoint=self)
+        )
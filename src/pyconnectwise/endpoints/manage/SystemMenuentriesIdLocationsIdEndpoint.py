@@ -62,4 +62,4 @@ class SystemMenuentriesIdLocationsIdEndpoint(
         Returns:
             MenuEntryLocation: The parsed response data.
         """
-        return self._parse_one(MenuEntryLocation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MenuEntryLocation, super()._make_request("GET", data=data, params=params).content)
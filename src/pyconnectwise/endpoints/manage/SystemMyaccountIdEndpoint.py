@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,11 +27,6 @@ class SystemMyaccountIdEndpoint(
         IPuttable.__init__(self, MyAccount)
         IPaginateable.__init__(self, MyAccount)
 
-        self.delegations = self._register_child_endpoint(
-            SystemMyaccountIdDelegationsEndpoint(client, parent_endpoint=self)
-        )
-        self.skills = self._register_child_endpoint(SystemMyaccountIdSkillsEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[MyAccount]:
@@ -61,7 +57,7 @@ class SystemMyaccountIdEndpoint(
         Returns:
             MyAccount: The parsed response data.
         """
-        return self._parse_one(MyAccount, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MyAccount, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> MyAccount:
         """
@@ -73,7 +69,7 @@ class SystemMyaccountIdEndpoint(
         Returns:
             MyAccount: The parsed response data.
         """
-        return self._parse_one(MyAccount, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(MyAccount, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MyAccount:
         """
@@ -85,4 +81,18 @@ class SystemMyaccountIdEndpoint(
         Returns:
             MyAccount: The parsed response data.
         """
-        return self._parse_one(MyAccount, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(MyAccount, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def delegations(self) -> SystemMyaccountIdDelegationsEndpoint:
+        """
+        The SystemMyaccountIdDelegationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMyaccountIdDelegationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def skills(self) -> SystemMyaccountIdSkillsEndpoint:
+        """
+        The SystemMyaccountIdSkillsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMyaccountIdSkillsEndpoint(self.client, parent_endpoint=self))
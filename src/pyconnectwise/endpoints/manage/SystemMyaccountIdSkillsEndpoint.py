@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemMyaccountIdSkillsEndpoint(
         IPostable.__init__(self, MemberSkill)
         IPaginateable.__init__(self, MemberSkill)
 
-        self.count = self._register_child_endpoint(SystemMyaccountIdSkillsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemMyaccountIdSkillsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMyaccountIdSkillsIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class SystemMyaccountIdSkillsEndpoint(
         Returns:
             list[MemberSkill]: The parsed response data.
         """
-        return self._parse_many(MemberSkill, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MemberSkill, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MemberSkill:
         """
@@ -83,4 +82,11 @@ class SystemMyaccountIdSkillsEndpoint(
         Returns:
             MemberSkill: The parsed response data.
         """
-        return self._parse_one(MemberSkill, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(MemberSkill, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMyaccountIdSkillsCountEndpoint:
+        """
+        The SystemMyaccountIdSkillsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMyaccountIdSkillsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -29,13 +30,6 @@ class SystemMycompanyCorporatestructureEndpoint(
         IGettable.__init__(self, list[CorporateStructure])
         IPaginateable.__init__(self, CorporateStructure)
 
-        self.count = self._register_child_endpoint(
-            SystemMycompanyCorporatestructureCountEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(
-            SystemMycompanyCorporatestructureInfoEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemMycompanyCorporatestructureIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMycompanyCorporatestructureIdEndpoint object to move down the chain.
@@ -83,4 +77,22 @@ class SystemMycompanyCorporatestructureEndpoint(
         Returns:
             list[CorporateStructure]: The parsed response data.
         """
-        return self._parse_many(CorporateStructure, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CorporateStructure, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMycompanyCorporatestructureCountEndpoint:
+        """
+        The SystemMycompanyCorporatestructureCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMycompanyCorporatestructureCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> SystemMycompanyCorporatestructureInfoEndpoint:
+        """
+        The SystemMycompanyCorporatestructureInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMycompanyCorporatestructureInfoEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class SystemMycompanyCorporatestructureIdEndpoint(
         IPuttable.__init__(self, CorporateStructure)
         IPaginateable.__init__(self, CorporateStructure)
 
-        self.info = self._register_child_endpoint(
-            SystemMycompanyCorporatestructureIdInfoEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[CorporateStructure]:
@@ -63,7 +60,7 @@ class SystemMycompanyCorporatestructureIdEndpoint(
         Returns:
             CorporateStructure: The parsed response data.
         """
-        return self._parse_one(CorporateStructure, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CorporateStructure, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> CorporateStructure:
         """
@@ -75,7 +72,7 @@ class SystemMycompanyCorporatestructureIdEndpoint(
         Returns:
             CorporateStructure: The parsed response data.
         """
-        return self._parse_one(CorporateStructure, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(CorporateStructure, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CorporateStructure:
         """
@@ -87,4 +84,13 @@ class SystemMycompanyCorporatestructureIdEndpoint(
         Returns:
             CorporateStructure: The parsed response data.
         """
-        return self._parse_one(CorporateStructure, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(CorporateStructure, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SystemMycompanyCorporatestructureIdInfoEndpoint:
+        """
+        The SystemMycompanyCorporatestructureIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMycompanyCorporatestructureIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
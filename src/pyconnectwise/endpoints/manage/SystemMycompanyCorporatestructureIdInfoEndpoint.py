@@ -54,4 +54,4 @@ class SystemMycompanyCorporatestructureIdInfoEndpoint(
         Returns:
             CorporateStructureInfo: The parsed response data.
         """
-        return self._parse_one(CorporateStructureInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CorporateStructureInfo, super()._make_request("GET", data=data, params=params).content)
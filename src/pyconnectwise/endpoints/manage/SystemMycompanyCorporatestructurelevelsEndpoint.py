@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class SystemMycompanyCorporatestructurelevelsEndpoint(
         IGettable.__init__(self, list[CorporateStructureLevel])
         IPaginateable.__init__(self, CorporateStructureLevel)
 
-        self.count = self._register_child_endpoint(
-            SystemMycompanyCorporatestructurelevelsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemMycompanyCorporatestructurelevelsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMycompanyCorporatestructurelevelsIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class SystemMycompanyCorporatestructurelevelsEndpoint(
         Returns:
             list[CorporateStructureLevel]: The parsed response data.
         """
-        return self._parse_many(CorporateStructureLevel, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CorporateStructureLevel, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMycompanyCorporatestructurelevelsCountEndpoint:
+        """
+        The SystemMycompanyCorporatestructurelevelsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMycompanyCorporatestructurelevelsCountEndpoint(self.client, parent_endpoint=self)
+        )
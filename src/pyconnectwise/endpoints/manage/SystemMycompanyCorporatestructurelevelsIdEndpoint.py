@@ -54,4 +54,4 @@ class SystemMycompanyCorporatestructurelevelsIdEndpoint(
         Returns:
             CorporateStructureLevel: The parsed response data.
         """
-        return self._parse_one(CorporateStructureLevel, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CorporateStructureLevel, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,9 +24,6 @@ class SystemMycompanyCrmEndpoint(
         IGettable.__init__(self, list[Crm])
         IPaginateable.__init__(self, Crm)
 
-        self.count = self._register_child_endpoint(SystemMycompanyCrmCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemMycompanyCrmInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemMycompanyCrmIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMycompanyCrmIdEndpoint object to move down the chain.
@@ -69,4 +67,18 @@ class SystemMycompanyCrmEndpoint(
         Returns:
             list[Crm]: The parsed response data.
         """
-        return self._parse_many(Crm, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Crm, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMycompanyCrmCountEndpoint:
+        """
+        The SystemMycompanyCrmCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyCrmCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemMycompanyCrmInfoEndpoint:
+        """
+        The SystemMycompanyCrmInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyCrmInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class SystemMycompanyCrmIdEndpoint(
         IPuttable.__init__(self, Crm)
         IPaginateable.__init__(self, Crm)
 
-        self.info = self._register_child_endpoint(SystemMycompanyCrmIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Crm]:
@@ -57,7 +56,7 @@ class SystemMycompanyCrmIdEndpoint(
         Returns:
             Crm: The parsed response data.
         """
-        return self._parse_one(Crm, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Crm, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Crm:
         """
@@ -69,7 +68,7 @@ class SystemMycompanyCrmIdEndpoint(
         Returns:
             Crm: The parsed response data.
         """
-        return self._parse_one(Crm, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Crm, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Crm:
         """
@@ -81,4 +80,11 @@ class SystemMycompanyCrmIdEndpoint(
         Returns:
             Crm: The parsed response data.
         """
-        return self._parse_one(Crm, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Crm, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SystemMycompanyCrmIdInfoEndpoint:
+        """
+        The SystemMycompanyCrmIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyCrmIdInfoEndpoint(self.client, parent_endpoint=self))
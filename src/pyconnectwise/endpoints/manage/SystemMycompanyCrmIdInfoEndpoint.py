@@ -50,4 +50,4 @@ class SystemMycompanyCrmIdInfoEndpoint(
         Returns:
             CrmInfo: The parsed response data.
         """
-        return self._parse_one(CrmInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(CrmInfo, super()._make_request("GET", data=data, params=params).content)
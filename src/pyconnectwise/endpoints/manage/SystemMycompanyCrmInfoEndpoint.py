@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class SystemMycompanyCrmInfoEndpoint(
         IGettable.__init__(self, list[CrmInfo])
         IPaginateable.__init__(self, CrmInfo)
 
-        self.count = self._register_child_endpoint(SystemMycompanyCrmInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[CrmInfo]:
@@ -53,4 +52,11 @@ class SystemMycompanyCrmInfoEndpoint(
         Returns:
             list[CrmInfo]: The parsed response data.
         """
-        return self._parse_many(CrmInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(CrmInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMycompanyCrmInfoCountEndpoint:
+        """
+        The SystemMycompanyCrmInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyCrmInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -68,4 +68,4 @@ class SystemMycompanyDocumentsEndpoint(
         Returns:
             list[DocumentSetup]: The parsed response data.
         """
-        return self._parse_many(DocumentSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(DocumentSetup, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -16,9 +17,32 @@ class SystemMycompanyEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "mycompany", parent_endpoint=parent_endpoint)
 
-        self.documents = self._register_child_endpoint(SystemMycompanyDocumentsEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemMycompanyInfoEndpoint(client, parent_endpoint=self))
-        self.reporting_services = self._register_child_endpoint(
-            SystemMycompanyReportingservicesEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def documents(self) -> SystemMycompanyDocumentsEndpoint:
+        """
+        The SystemMycompanyDocumentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyDocumentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemMycompanyInfoEndpoint:
+        """
+        The SystemMycompanyInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reporting_services(self) -> SystemMycompanyReportingservicesEndpoint:
+        """
+        The SystemMycompanyReportingservicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMycompanyReportingservicesEndpoint(self.client, parent_endpoint=self)
         )
-        self.services = self._register_child_endpoint(SystemMycompanyServicesEndpoint(client, parent_endpoint=self))
+
+    @cached_property
+    def services(self) -> SystemMycompanyServicesEndpoint:
+        """
+        The SystemMycompanyServicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyServicesEndpoint(self.client, parent_endpoint=self))
@@ -66,4 +66,4 @@ class SystemMycompanyInfoServicesEndpoint(
         Returns:
             list[ServiceInfo]: The parsed response data.
         """
-        return self._parse_many(ServiceInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ServiceInfo, super()._make_request("GET", data=data, params=params).content)
@@ -52,4 +52,4 @@ class SystemMycompanyInfoServicesIdEndpoint(
         Returns:
             ServiceInfo: The parsed response data.
         """
-        return self._parse_one(ServiceInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ServiceInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemMycompanyOtherEndpoint(
         IGettable.__init__(self, list[Other])
         IPaginateable.__init__(self, Other)
 
-        self.count = self._register_child_endpoint(SystemMycompanyOtherCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemMycompanyOtherIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMycompanyOtherIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class SystemMycompanyOtherEndpoint(
         Returns:
             list[Other]: The parsed response data.
         """
-        return self._parse_many(Other, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Other, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMycompanyOtherCountEndpoint:
+        """
+        The SystemMycompanyOtherCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyOtherCountEndpoint(self.client, parent_endpoint=self))
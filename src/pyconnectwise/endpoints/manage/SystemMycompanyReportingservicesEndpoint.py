@@ -70,4 +70,4 @@ class SystemMycompanyReportingservicesEndpoint(
         Returns:
             list[ReportingService]: The parsed response data.
         """
-        return self._parse_many(ReportingService, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ReportingService, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class SystemMycompanyReportingservicesIdEndpoint(
         IPuttable.__init__(self, ReportingService)
         IPaginateable.__init__(self, ReportingService)
 
-        self.test_connection = self._register_child_endpoint(
-            SystemMycompanyReportingservicesIdTestconnectionEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ReportingService]:
@@ -63,7 +60,7 @@ class SystemMycompanyReportingservicesIdEndpoint(
         Returns:
             ReportingService: The parsed response data.
         """
-        return self._parse_one(ReportingService, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ReportingService, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ReportingService:
         """
@@ -75,7 +72,7 @@ class SystemMycompanyReportingservicesIdEndpoint(
         Returns:
             ReportingService: The parsed response data.
         """
-        return self._parse_one(ReportingService, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ReportingService, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ReportingService:
         """
@@ -87,4 +84,13 @@ class SystemMycompanyReportingservicesIdEndpoint(
         Returns:
             ReportingService: The parsed response data.
         """
-        return self._parse_one(ReportingService, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ReportingService, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def test_connection(self) -> SystemMycompanyReportingservicesIdTestconnectionEndpoint:
+        """
+        The SystemMycompanyReportingservicesIdTestconnectionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMycompanyReportingservicesIdTestconnectionEndpoint(self.client, parent_endpoint=self)
+        )
@@ -64,4 +64,4 @@ class SystemMycompanyServicesEndpoint(
         Returns:
             list[Service]: The parsed response data.
         """
-        return self._parse_many(Service, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Service, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,10 +25,6 @@ class SystemMycompanyTimeexpenseEndpoint(
         IGettable.__init__(self, list[TimeExpense])
         IPaginateable.__init__(self, TimeExpense)
 
-        self.count = self._register_child_endpoint(
-            SystemMycompanyTimeexpenseCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemMycompanyTimeexpenseIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemMycompanyTimeexpenseIdEndpoint object to move down the chain.
@@ -73,4 +70,11 @@ class SystemMycompanyTimeexpenseEndpoint(
         Returns:
             list[TimeExpense]: The parsed response data.
         """
-        return self._parse_many(TimeExpense, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeExpense, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemMycompanyTimeexpenseCountEndpoint:
+        """
+        The SystemMycompanyTimeexpenseCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyTimeexpenseCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class SystemMymembersEndpoint(
         IGettable.__init__(self, MyMember)
         IPaginateable.__init__(self, MyMember)
 
-        self.info = self._register_child_endpoint(SystemMymembersInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[MyMember]:
@@ -53,4 +52,11 @@ class SystemMymembersEndpoint(
         Returns:
             MyMember: The parsed response data.
         """
-        return self._parse_one(MyMember, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MyMember, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SystemMymembersInfoEndpoint:
+        """
+        The SystemMymembersInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMymembersInfoEndpoint(self.client, parent_endpoint=self))
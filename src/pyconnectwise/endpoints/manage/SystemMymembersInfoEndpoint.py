@@ -52,4 +52,4 @@ class SystemMymembersInfoEndpoint(
         Returns:
             MyMemberInfo: The parsed response data.
         """
-        return self._parse_one(MyMemberInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(MyMemberInfo, super()._make_request("GET", data=data, params=params).content)
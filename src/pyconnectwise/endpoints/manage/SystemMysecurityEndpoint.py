@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,10 +22,6 @@ class SystemMysecurityEndpoint(
         IGettable.__init__(self, list[MySecurity])
         IPaginateable.__init__(self, MySecurity)
 
-        self.customize_items = self._register_child_endpoint(
-            SystemMysecurityCustomizeitemsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[MySecurity]:
@@ -55,4 +52,11 @@ class SystemMysecurityEndpoint(
         Returns:
             list[MySecurity]: The parsed response data.
         """
-        return self._parse_many(MySecurity, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(MySecurity, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def customize_items(self) -> SystemMysecurityCustomizeitemsEndpoint:
+        """
+        The SystemMysecurityCustomizeitemsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMysecurityCustomizeitemsEndpoint(self.client, parent_endpoint=self))
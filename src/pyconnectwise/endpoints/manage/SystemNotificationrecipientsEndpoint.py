@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,10 +25,6 @@ class SystemNotificationrecipientsEndpoint(
         IGettable.__init__(self, list[NotificationRecipient])
         IPaginateable.__init__(self, NotificationRecipient)
 
-        self.count = self._register_child_endpoint(
-            SystemNotificationrecipientsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemNotificationrecipientsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemNotificationrecipientsIdEndpoint object to move down the chain.
@@ -75,4 +72,13 @@ class SystemNotificationrecipientsEndpoint(
         Returns:
             list[NotificationRecipient]: The parsed response data.
         """
-        return self._parse_many(NotificationRecipient, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(NotificationRecipient, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemNotificationrecipientsCountEndpoint:
+        """
+        The SystemNotificationrecipientsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemNotificationrecipientsCountEndpoint(self.client, parent_endpoint=self)
+        )
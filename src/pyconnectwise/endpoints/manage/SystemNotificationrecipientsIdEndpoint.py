@@ -54,4 +54,4 @@ class SystemNotificationrecipientsIdEndpoint(
         Returns:
             NotificationRecipient: The parsed response data.
         """
-        return self._parse_one(NotificationRecipient, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(NotificationRecipient, super()._make_request("GET", data=data, params=params).content)
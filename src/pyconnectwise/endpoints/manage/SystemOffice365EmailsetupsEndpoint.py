@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class SystemOffice365EmailsetupsEndpoint(
         IPostable.__init__(self, Office365EmailSetup)
         IPaginateable.__init__(self, Office365EmailSetup)
 
-        self.count = self._register_child_endpoint(
-            SystemOffice365EmailsetupsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemOffice365EmailsetupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemOffice365EmailsetupsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class SystemOffice365EmailsetupsEndpoint(
         Returns:
             list[Office365EmailSetup]: The parsed response data.
         """
-        return self._parse_many(Office365EmailSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Office365EmailSetup, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -91,4 +88,11 @@ class SystemOffice365EmailsetupsEndpoint(
         Returns:
             Office365EmailSetup: The parsed response data.
         """
-        return self._parse_one(Office365EmailSetup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Office365EmailSetup, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemOffice365EmailsetupsCountEndpoint:
+        """
+        The SystemOffice365EmailsetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemOffice365EmailsetupsCountEndpoint(self.client, parent_endpoint=self))
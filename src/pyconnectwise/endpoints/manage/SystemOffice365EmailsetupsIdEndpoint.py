@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -30,13 +31,6 @@ class SystemOffice365EmailsetupsIdEndpoint(
         IPuttable.__init__(self, Office365EmailSetup)
         IPaginateable.__init__(self, Office365EmailSetup)
 
-        self.authorize = self._register_child_endpoint(
-            SystemOffice365EmailsetupsIdAuthorizeEndpoint(client, parent_endpoint=self)
-        )
-        self.test_connection = self._register_child_endpoint(
-            SystemOffice365EmailsetupsIdTestconnectionEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Office365EmailSetup]:
@@ -81,7 +75,7 @@ class SystemOffice365EmailsetupsIdEndpoint(
         Returns:
             Office365EmailSetup: The parsed response data.
         """
-        return self._parse_one(Office365EmailSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Office365EmailSetup, super()._make_request("GET", data=data, params=params).content)
 
     def patch(
         self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
@@ -95,7 +89,7 @@ class SystemOffice365EmailsetupsIdEndpoint(
         Returns:
             Office365EmailSetup: The parsed response data.
         """
-        return self._parse_one(Office365EmailSetup, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Office365EmailSetup, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -109,4 +103,22 @@ class SystemOffice365EmailsetupsIdEndpoint(
         Returns:
             Office365EmailSetup: The parsed response data.
         """
-        return self._parse_one(Office365EmailSetup, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Office365EmailSetup, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def authorize(self) -> SystemOffice365EmailsetupsIdAuthorizeEndpoint:
+        """
+        The SystemOffice365EmailsetupsIdAuthorizeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemOffice365EmailsetupsIdAuthorizeEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def test_connection(self) -> SystemOffice365EmailsetupsIdTestconnectionEndpoint:
+        """
+        The SystemOffice365EmailsetupsIdTestconnectionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemOffice365EmailsetupsIdTestconnectionEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -11,6 +12,9 @@ class SystemOffice365Endpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "office365", parent_endpoint=parent_endpoint)
 
-        self.email_setups = self._register_child_endpoint(
-            SystemOffice365EmailsetupsEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def email_setups(self) -> SystemOffice365EmailsetupsEndpoint:
+        """
+        The SystemOffice365EmailsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemOffice365EmailsetupsEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
 from pyconnectwise.endpoints.manage.SystemOnpremisesearchsettingCountEndpoint import (
     SystemOnpremisesearchsettingCountEndpoint,
@@ -11,10 +13,6 @@ class SystemOnpremisesearchsettingEndpoint(ConnectWiseEndpoint):
     def __init__(self, client, parent_endpoint=None) -> None:  # noqa: ANN001
         ConnectWiseEndpoint.__init__(self, client, "onPremiseSearchSetting", parent_endpoint=parent_endpoint)
 
-        self.count = self._register_child_endpoint(
-            SystemOnpremisesearchsettingCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, id: int) -> SystemOnpremisesearchsettingIdEndpoint:  # noqa: A002
         """
         Sets the ID for this endpoint and returns an initialized SystemOnpremisesearchsettingIdEndpoint object to move down the chain.
@@ -27,3 +25,12 @@ class SystemOnpremisesearchsettingEndpoint(ConnectWiseEndpoint):
         child = SystemOnpremisesearchsettingIdEndpoint(self.client, parent_endpoint=self)
         child._id = id
         return child
+
+    @cached_property
+    def count(self) -> SystemOnpremisesearchsettingCountEndpoint:
+        """
+        The SystemOnpremisesearchsettingCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemOnpremisesearchsettingCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -74,7 +74,7 @@ class SystemOnpremisesearchsettingIdEndpoint(
         """
         return self._parse_one(
             OnPremiseSearchSetting,
-            super()._make_request("GET", data=data, params=params).json(),
+            super()._make_request("GET", data=data, params=params).content,
         )
 
     def put(
@@ -93,7 +93,7 @@ class SystemOnpremisesearchsettingIdEndpoint(
         """
         return self._parse_one(
             OnPremiseSearchSetting,
-            super()._make_request("PUT", data=data, params=params).json(),
+            super()._make_request("PUT", data=data, params=params).content,
         )
 
     def patch(
@@ -112,5 +112,5 @@ class SystemOnpremisesearchsettingIdEndpoint(
         """
         return self._parse_one(
             OnPremiseSearchSetting,
-            super()._make_request("PATCH", data=data, params=params).json(),
+            super()._make_request("PATCH", data=data, params=params).content,
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemOsgradeweightsEndpoint(
         IGettable.__init__(self, list[OsGradeWeight])
         IPaginateable.__init__(self, OsGradeWeight)
 
-        self.count = self._register_child_endpoint(SystemOsgradeweightsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemOsgradeweightsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemOsgradeweightsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class SystemOsgradeweightsEndpoint(
         Returns:
             list[OsGradeWeight]: The parsed response data.
         """
-        return self._parse_many(OsGradeWeight, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(OsGradeWeight, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemOsgradeweightsCountEndpoint:
+        """
+        The SystemOsgradeweightsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemOsgradeweightsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemParsingtypesEndpoint(
         IGettable.__init__(self, list[ParsingType])
         IPaginateable.__init__(self, ParsingType)
 
-        self.count = self._register_child_endpoint(SystemParsingtypesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemParsingtypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemParsingtypesIdEndpoint object to move down the chain.
@@ -69,4 +68,11 @@ class SystemParsingtypesEndpoint(
         Returns:
             list[ParsingType]: The parsed response data.
         """
-        return self._parse_many(ParsingType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ParsingType, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemParsingtypesCountEndpoint:
+        """
+        The SystemParsingtypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemParsingtypesCountEndpoint(self.client, parent_endpoint=self))
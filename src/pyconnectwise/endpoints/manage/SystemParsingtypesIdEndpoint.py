@@ -52,4 +52,4 @@ class SystemParsingtypesIdEndpoint(
         Returns:
             ParsingType: The parsed response data.
         """
-        return self._parse_one(ParsingType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ParsingType, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemParsingvariablesEndpoint(
         IGettable.__init__(self, list[ParsingVariable])
         IPaginateable.__init__(self, ParsingVariable)
 
-        self.count = self._register_child_endpoint(SystemParsingvariablesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemParsingvariablesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemParsingvariablesIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class SystemParsingvariablesEndpoint(
         Returns:
             list[ParsingVariable]: The parsed response data.
         """
-        return self._parse_many(ParsingVariable, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ParsingVariable, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemParsingvariablesCountEndpoint:
+        """
+        The SystemParsingvariablesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemParsingvariablesCountEndpoint(self.client, parent_endpoint=self))
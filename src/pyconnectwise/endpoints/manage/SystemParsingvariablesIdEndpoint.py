@@ -52,4 +52,4 @@ class SystemParsingvariablesIdEndpoint(
         Returns:
             ParsingVariable: The parsed response data.
         """
-        return self._parse_one(ParsingVariable, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ParsingVariable, super()._make_request("GET", data=data, params=params).content)
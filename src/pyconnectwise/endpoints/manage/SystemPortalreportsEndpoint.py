@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemPortalreportsEndpoint(
         IPostable.__init__(self, PortalReport)
         IPaginateable.__init__(self, PortalReport)
 
-        self.count = self._register_child_endpoint(SystemPortalreportsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemPortalreportsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemPortalreportsIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class SystemPortalreportsEndpoint(
         Returns:
             list[PortalReport]: The parsed response data.
         """
-        return self._parse_many(PortalReport, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(PortalReport, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> PortalReport:
         """
@@ -83,4 +82,11 @@ class SystemPortalreportsEndpoint(
         Returns:
             PortalReport: The parsed response data.
         """
-        return self._parse_one(PortalReport, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(PortalReport, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemPortalreportsCountEndpoint:
+        """
+        The SystemPortalreportsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemPortalreportsCountEndpoint(self.client, parent_endpoint=self))
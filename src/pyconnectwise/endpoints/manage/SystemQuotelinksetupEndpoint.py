@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,11 +28,6 @@ class SystemQuotelinksetupEndpoint(
         IPostable.__init__(self, QuoteLink)
         IPaginateable.__init__(self, QuoteLink)
 
-        self.count = self._register_child_endpoint(SystemQuotelinksetupCountEndpoint(client, parent_endpoint=self))
-        self.test_connection = self._register_child_endpoint(
-            SystemQuotelinksetupTestconnectionEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemQuotelinksetupIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemQuotelinksetupIdEndpoint object to move down the chain.
@@ -75,7 +71,7 @@ class SystemQuotelinksetupEndpoint(
         Returns:
             list[QuoteLink]: The parsed response data.
         """
-        return self._parse_many(QuoteLink, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(QuoteLink, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> QuoteLink:
         """
@@ -87,4 +83,20 @@ class SystemQuotelinksetupEndpoint(
         Returns:
             QuoteLink: The parsed response data.
         """
-        return self._parse_one(QuoteLink, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(QuoteLink, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemQuotelinksetupCountEndpoint:
+        """
+        The SystemQuotelinksetupCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemQuotelinksetupCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def test_connection(self) -> SystemQuotelinksetupTestconnectionEndpoint:
+        """
+        The SystemQuotelinksetupTestconnectionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemQuotelinksetupTestconnectionEndpoint(self.client, parent_endpoint=self)
+        )
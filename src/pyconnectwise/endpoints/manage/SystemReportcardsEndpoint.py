@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SystemReportcardsEndpoint(
         IPostable.__init__(self, ReportCard)
         IPaginateable.__init__(self, ReportCard)
 
-        self.count = self._register_child_endpoint(SystemReportcardsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemReportcardsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemReportcardsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemReportcardsIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class SystemReportcardsEndpoint(
         Returns:
             list[ReportCard]: The parsed response data.
         """
-        return self._parse_many(ReportCard, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ReportCard, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ReportCard:
         """
@@ -83,4 +81,18 @@ class SystemReportcardsEndpoint(
         Returns:
             ReportCard: The parsed response data.
         """
-        return self._parse_one(ReportCard, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ReportCard, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemReportcardsCountEndpoint:
+        """
+        The SystemReportcardsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportcardsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemReportcardsInfoEndpoint:
+        """
+        The SystemReportcardsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportcardsInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class SystemReportcardsIdDetailsEndpoint(
         IPostable.__init__(self, ReportCardDetail)
         IPaginateable.__init__(self, ReportCardDetail)
 
-        self.count = self._register_child_endpoint(
-            SystemReportcardsIdDetailsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemReportcardsIdDetailsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemReportcardsIdDetailsIdEndpoint object to move down the chain.
@@ -77,7 +74,7 @@ class SystemReportcardsIdDetailsEndpoint(
         Returns:
             list[ReportCardDetail]: The parsed response data.
         """
-        return self._parse_many(ReportCardDetail, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ReportCardDetail, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ReportCardDetail:
         """
@@ -89,4 +86,11 @@ class SystemReportcardsIdDetailsEndpoint(
         Returns:
             ReportCardDetail: The parsed response data.
         """
-        return self._parse_one(ReportCardDetail, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ReportCardDetail, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemReportcardsIdDetailsCountEndpoint:
+        """
+        The SystemReportcardsIdDetailsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportcardsIdDetailsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class SystemReportcardsIdEndpoint(
         IPuttable.__init__(self, ReportCard)
         IPaginateable.__init__(self, ReportCard)
 
-        self.details = self._register_child_endpoint(SystemReportcardsIdDetailsEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemReportcardsIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ReportCard]:
@@ -69,7 +67,7 @@ class SystemReportcardsIdEndpoint(
         Returns:
             ReportCard: The parsed response data.
         """
-        return self._parse_one(ReportCard, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ReportCard, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ReportCard:
         """
@@ -81,7 +79,7 @@ class SystemReportcardsIdEndpoint(
         Returns:
             ReportCard: The parsed response data.
         """
-        return self._parse_one(ReportCard, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ReportCard, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ReportCard:
         """
@@ -93,4 +91,18 @@ class SystemReportcardsIdEndpoint(
         Returns:
             ReportCard: The parsed response data.
         """
-        return self._parse_one(ReportCard, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ReportCard, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def details(self) -> SystemReportcardsIdDetailsEndpoint:
+        """
+        The SystemReportcardsIdDetailsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportcardsIdDetailsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemReportcardsIdInfoEndpoint:
+        """
+        The SystemReportcardsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportcardsIdInfoEndpoint(self.client, parent_endpoint=self))
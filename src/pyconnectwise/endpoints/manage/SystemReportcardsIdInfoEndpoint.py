@@ -52,4 +52,4 @@ class SystemReportcardsIdInfoEndpoint(
         Returns:
             ReportCardInfo: The parsed response data.
         """
-        return self._parse_one(ReportCardInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ReportCardInfo, super()._make_request("GET", data=data, params=params).content)
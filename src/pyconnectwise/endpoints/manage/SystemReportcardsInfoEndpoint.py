@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class SystemReportcardsInfoEndpoint(
         IGettable.__init__(self, list[ReportCardInfo])
         IPaginateable.__init__(self, ReportCardInfo)
 
-        self.count = self._register_child_endpoint(SystemReportcardsInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ReportCardInfo]:
@@ -57,4 +56,11 @@ class SystemReportcardsInfoEndpoint(
         Returns:
             list[ReportCardInfo]: The parsed response data.
         """
-        return self._parse_many(ReportCardInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ReportCardInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemReportcardsInfoCountEndpoint:
+        """
+        The SystemReportcardsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportcardsInfoCountEndpoint(self.client, parent_endpoint=self))
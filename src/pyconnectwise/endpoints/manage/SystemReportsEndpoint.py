@@ -64,4 +64,4 @@ class SystemReportsEndpoint(
         Returns:
             list[Report]: The parsed response data.
         """
-        return self._parse_many(Report, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Report, super()._make_request("GET", data=data, params=params).content)
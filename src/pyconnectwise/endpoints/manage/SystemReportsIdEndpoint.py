@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,9 +23,6 @@ class SystemReportsIdEndpoint(
         IGettable.__init__(self, ReportDataResponse)
         IPaginateable.__init__(self, ReportDataResponse)
 
-        self.columns = self._register_child_endpoint(SystemReportsIdColumnsEndpoint(client, parent_endpoint=self))
-        self.count = self._register_child_endpoint(SystemReportsIdCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ReportDataResponse]:
@@ -57,4 +55,18 @@ class SystemReportsIdEndpoint(
         Returns:
             ReportDataResponse: The parsed response data.
         """
-        return self._parse_one(ReportDataResponse, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ReportDataResponse, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def columns(self) -> SystemReportsIdColumnsEndpoint:
+        """
+        The SystemReportsIdColumnsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportsIdColumnsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def count(self) -> SystemReportsIdCountEndpoint:
+        """
+        The SystemReportsIdCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportsIdCountEndpoint(self.client, parent_endpoint=self))
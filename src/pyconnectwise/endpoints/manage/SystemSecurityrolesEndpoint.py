@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SystemSecurityrolesEndpoint(
         IPostable.__init__(self, SecurityRole)
         IPaginateable.__init__(self, SecurityRole)
 
-        self.count = self._register_child_endpoint(SystemSecurityrolesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemSecurityrolesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemSecurityrolesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemSecurityrolesIdEndpoint object to move down the chain.
@@ -73,7 +71,7 @@ class SystemSecurityrolesEndpoint(
         Returns:
             list[SecurityRole]: The parsed response data.
         """
-        return self._parse_many(SecurityRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SecurityRole, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SecurityRole:
         """
@@ -85,4 +83,18 @@ class SystemSecurityrolesEndpoint(
         Returns:
             SecurityRole: The parsed response data.
         """
-        return self._parse_one(SecurityRole, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SecurityRole, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemSecurityrolesCountEndpoint:
+        """
+        The SystemSecurityrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSecurityrolesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemSecurityrolesInfoEndpoint:
+        """
+        The SystemSecurityrolesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSecurityrolesInfoEndpoint(self.client, parent_endpoint=self))
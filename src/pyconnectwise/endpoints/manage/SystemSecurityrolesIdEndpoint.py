@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class SystemSecurityrolesIdEndpoint(
         IGettable.__init__(self, SecurityRole)
         IPaginateable.__init__(self, SecurityRole)
 
-        self.info = self._register_child_endpoint(SystemSecurityrolesIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[SecurityRole]:
@@ -65,4 +64,11 @@ class SystemSecurityrolesIdEndpoint(
         Returns:
             SecurityRole: The parsed response data.
         """
-        return self._parse_one(SecurityRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SecurityRole, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SystemSecurityrolesIdInfoEndpoint:
+        """
+        The SystemSecurityrolesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSecurityrolesIdInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class SystemSecurityrolesIdInfoEndpoint(
         Returns:
             SecurityRoleInfo: The parsed response data.
         """
-        return self._parse_one(SecurityRoleInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SecurityRoleInfo, super()._make_request("GET", data=data, params=params).content)
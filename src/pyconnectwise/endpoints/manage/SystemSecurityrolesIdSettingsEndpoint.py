@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class SystemSecurityrolesIdSettingsEndpoint(
         IGettable.__init__(self, list[SecurityRoleSetting])
         IPaginateable.__init__(self, SecurityRoleSetting)
 
-        self.count = self._register_child_endpoint(
-            SystemSecurityrolesIdSettingsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemSecurityrolesIdSettingsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemSecurityrolesIdSettingsIdEndpoint object to move down the chain.
@@ -77,4 +74,13 @@ class SystemSecurityrolesIdSettingsEndpoint(
         Returns:
             list[SecurityRoleSetting]: The parsed response data.
         """
-        return self._parse_many(SecurityRoleSetting, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SecurityRoleSetting, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemSecurityrolesIdSettingsCountEndpoint:
+        """
+        The SystemSecurityrolesIdSettingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemSecurityrolesIdSettingsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -54,4 +54,4 @@ class SystemSecurityrolesIdSettingsIdEndpoint(
         Returns:
             SecurityRoleSetting: The parsed response data.
         """
-        return self._parse_one(SecurityRoleSetting, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SecurityRoleSetting, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemSettingsEndpoint(
         IGettable.__init__(self, list[SystemSetting])
         IPaginateable.__init__(self, SystemSetting)
 
-        self.count = self._register_child_endpoint(SystemSettingsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemSettingsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemSettingsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class SystemSettingsEndpoint(
         Returns:
             list[SystemSetting]: The parsed response data.
         """
-        return self._parse_many(SystemSetting, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SystemSetting, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemSettingsCountEndpoint:
+        """
+        The SystemSettingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSettingsCountEndpoint(self.client, parent_endpoint=self))
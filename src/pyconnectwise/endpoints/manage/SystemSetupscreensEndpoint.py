@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemSetupscreensEndpoint(
         IGettable.__init__(self, list[SetupScreen])
         IPaginateable.__init__(self, SetupScreen)
 
-        self.count = self._register_child_endpoint(SystemSetupscreensCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemSetupscreensIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemSetupscreensIdEndpoint object to move down the chain.
@@ -69,4 +68,11 @@ class SystemSetupscreensEndpoint(
         Returns:
             list[SetupScreen]: The parsed response data.
         """
-        return self._parse_many(SetupScreen, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SetupScreen, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemSetupscreensCountEndpoint:
+        """
+        The SystemSetupscreensCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSetupscreensCountEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class SystemSetupscreensIdEndpoint(
         Returns:
             SetupScreen: The parsed response data.
         """
-        return self._parse_one(SetupScreen, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SetupScreen, super()._make_request("GET", data=data, params=params).content)
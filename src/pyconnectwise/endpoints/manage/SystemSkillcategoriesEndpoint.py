@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemSkillcategoriesEndpoint(
         IPostable.__init__(self, SkillCategory)
         IPaginateable.__init__(self, SkillCategory)
 
-        self.count = self._register_child_endpoint(SystemSkillcategoriesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemSkillcategoriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemSkillcategoriesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemSkillcategoriesEndpoint(
         Returns:
             list[SkillCategory]: The parsed response data.
         """
-        return self._parse_many(SkillCategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SkillCategory, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SkillCategory:
         """
@@ -85,4 +84,11 @@ class SystemSkillcategoriesEndpoint(
         Returns:
             SkillCategory: The parsed response data.
         """
-        return self._parse_one(SkillCategory, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SkillCategory, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemSkillcategoriesCountEndpoint:
+        """
+        The SystemSkillcategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSkillcategoriesCountEndpoint(self.client, parent_endpoint=self))
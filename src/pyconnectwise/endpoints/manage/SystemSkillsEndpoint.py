@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SystemSkillsEndpoint(
         IPostable.__init__(self, Skill)
         IPaginateable.__init__(self, Skill)
 
-        self.count = self._register_child_endpoint(SystemSkillsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemSkillsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemSkillsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemSkillsIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class SystemSkillsEndpoint(
         Returns:
             list[Skill]: The parsed response data.
         """
-        return self._parse_many(Skill, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Skill, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Skill:
         """
@@ -83,4 +81,18 @@ class SystemSkillsEndpoint(
         Returns:
             Skill: The parsed response data.
         """
-        return self._parse_one(Skill, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Skill, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemSkillsCountEndpoint:
+        """
+        The SystemSkillsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSkillsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemSkillsInfoEndpoint:
+        """
+        The SystemSkillsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSkillsInfoEndpoint(self.client, parent_endpoint=self))
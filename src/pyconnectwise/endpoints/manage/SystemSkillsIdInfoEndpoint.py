@@ -50,4 +50,4 @@ class SystemSkillsIdInfoEndpoint(
         Returns:
             SkillInfo: The parsed response data.
         """
-        return self._parse_one(SkillInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SkillInfo, super()._make_request("GET", data=data, params=params).content)
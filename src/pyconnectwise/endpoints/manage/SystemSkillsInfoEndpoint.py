@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class SystemSkillsInfoEndpoint(
         IGettable.__init__(self, list[SkillInfo])
         IPaginateable.__init__(self, SkillInfo)
 
-        self.count = self._register_child_endpoint(SystemSkillsInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[SkillInfo]:
@@ -53,4 +52,11 @@ class SystemSkillsInfoEndpoint(
         Returns:
             list[SkillInfo]: The parsed response data.
         """
-        return self._parse_many(SkillInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SkillInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemSkillsInfoCountEndpoint:
+        """
+        The SystemSkillsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSkillsInfoCountEndpoint(self.client, parent_endpoint=self))
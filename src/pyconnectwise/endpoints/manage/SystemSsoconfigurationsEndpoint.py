@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemSsoconfigurationsEndpoint(
         IPostable.__init__(self, SsoConfiguration)
         IPaginateable.__init__(self, SsoConfiguration)
 
-        self.count = self._register_child_endpoint(SystemSsoconfigurationsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemSsoconfigurationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemSsoconfigurationsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemSsoconfigurationsEndpoint(
         Returns:
             list[SsoConfiguration]: The parsed response data.
         """
-        return self._parse_many(SsoConfiguration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SsoConfiguration, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SsoConfiguration:
         """
@@ -85,4 +84,11 @@ class SystemSsoconfigurationsEndpoint(
         Returns:
             SsoConfiguration: The parsed response data.
         """
-        return self._parse_one(SsoConfiguration, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SsoConfiguration, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemSsoconfigurationsCountEndpoint:
+        """
+        The SystemSsoconfigurationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSsoconfigurationsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -30,13 +31,6 @@ class SystemSsoconfigurationsIdEndpoint(
         IPuttable.__init__(self, SsoConfiguration)
         IPaginateable.__init__(self, SsoConfiguration)
 
-        self.registertoken = self._register_child_endpoint(
-            SystemSsoconfigurationsIdRegistertokenEndpoint(client, parent_endpoint=self)
-        )
-        self.submitmembers = self._register_child_endpoint(
-            SystemSsoconfigurationsIdSubmitmembersEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[SsoConfiguration]:
@@ -79,7 +73,7 @@ class SystemSsoconfigurationsIdEndpoint(
         Returns:
             SsoConfiguration: The parsed response data.
         """
-        return self._parse_one(SsoConfiguration, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SsoConfiguration, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> SsoConfiguration:
         """
@@ -91,7 +85,7 @@ class SystemSsoconfigurationsIdEndpoint(
         Returns:
             SsoConfiguration: The parsed response data.
         """
-        return self._parse_one(SsoConfiguration, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(SsoConfiguration, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SsoConfiguration:
         """
@@ -103,4 +97,22 @@ class SystemSsoconfigurationsIdEndpoint(
         Returns:
             SsoConfiguration: The parsed response data.
         """
-        return self._parse_one(SsoConfiguration, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(SsoConfiguration, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def registertoken(self) -> SystemSsoconfigurationsIdRegistertokenEndpoint:
+        """
+        The SystemSsoconfigurationsIdRegistertokenEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemSsoconfigurationsIdRegistertokenEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def submitmembers(self) -> SystemSsoconfigurationsIdSubmitmembersEndpoint:
+        """
+        The SystemSsoconfigurationsIdSubmitmembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemSsoconfigurationsIdSubmitmembersEndpoint(self.client, parent_endpoint=self)
+        )
@@ -26,4 +26,4 @@ class SystemSsoconfigurationsIdRegistertokenEndpoint(
         Returns:
             SsoConfiguration: The parsed response data.
         """
-        return self._parse_one(SsoConfiguration, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SsoConfiguration, super()._make_request("POST", data=data, params=params).content)
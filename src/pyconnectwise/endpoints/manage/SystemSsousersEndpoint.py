@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemSsousersEndpoint(
         IGettable.__init__(self, list[SsoUser])
         IPaginateable.__init__(self, SsoUser)
 
-        self.count = self._register_child_endpoint(SystemSsousersCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemSsousersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemSsousersIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class SystemSsousersEndpoint(
         Returns:
             list[SsoUser]: The parsed response data.
         """
-        return self._parse_many(SsoUser, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SsoUser, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemSsousersCountEndpoint:
+        """
+        The SystemSsousersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSsousersCountEndpoint(self.client, parent_endpoint=self))
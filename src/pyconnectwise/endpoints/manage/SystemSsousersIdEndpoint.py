@@ -50,4 +50,4 @@ class SystemSsousersIdEndpoint(
         Returns:
             SsoUser: The parsed response data.
         """
-        return self._parse_one(SsoUser, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SsoUser, super()._make_request("GET", data=data, params=params).content)
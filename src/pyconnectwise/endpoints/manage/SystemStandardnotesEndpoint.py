@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemStandardnotesEndpoint(
         IPostable.__init__(self, StandardNote)
         IPaginateable.__init__(self, StandardNote)
 
-        self.count = self._register_child_endpoint(SystemStandardnotesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemStandardnotesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemStandardnotesIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class SystemStandardnotesEndpoint(
         Returns:
             list[StandardNote]: The parsed response data.
         """
-        return self._parse_many(StandardNote, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(StandardNote, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> StandardNote:
         """
@@ -83,4 +82,11 @@ class SystemStandardnotesEndpoint(
         Returns:
             StandardNote: The parsed response data.
         """
-        return self._parse_one(StandardNote, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(StandardNote, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemStandardnotesCountEndpoint:
+        """
+        The SystemStandardnotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemStandardnotesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SystemSurveysEndpoint(
         IPostable.__init__(self, Survey)
         IPaginateable.__init__(self, Survey)
 
-        self.count = self._register_child_endpoint(SystemSurveysCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemSurveysInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemSurveysIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemSurveysIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class SystemSurveysEndpoint(
         Returns:
             list[Survey]: The parsed response data.
         """
-        return self._parse_many(Survey, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Survey, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Survey:
         """
@@ -83,4 +81,18 @@ class SystemSurveysEndpoint(
         Returns:
             Survey: The parsed response data.
         """
-        return self._parse_one(Survey, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Survey, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemSurveysCountEndpoint:
+        """
+        The SystemSurveysCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSurveysCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemSurveysInfoEndpoint:
+        """
+        The SystemSurveysInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSurveysInfoEndpoint(self.client, parent_endpoint=self))
@@ -24,4 +24,4 @@ class SystemSurveysIdCopyEndpoint(ConnectWiseEndpoint, IPostable[Survey, Connect
         Returns:
             Survey: The parsed response data.
         """
-        return self._parse_one(Survey, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Survey, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class SystemSurveysIdEndpoint(
         IPuttable.__init__(self, Survey)
         IPaginateable.__init__(self, Survey)
 
-        self.copy = self._register_child_endpoint(SystemSurveysIdCopyEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemSurveysIdInfoEndpoint(client, parent_endpoint=self))
-        self.questions = self._register_child_endpoint(SystemSurveysIdQuestionsEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Survey]:
@@ -71,7 +68,7 @@ class SystemSurveysIdEndpoint(
         Returns:
             Survey: The parsed response data.
         """
-        return self._parse_one(Survey, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Survey, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Survey:
         """
@@ -83,7 +80,7 @@ class SystemSurveysIdEndpoint(
         Returns:
             Survey: The parsed response data.
         """
-        return self._parse_one(Survey, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Survey, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Survey:
         """
@@ -95,4 +92,25 @@ class SystemSurveysIdEndpoint(
         Returns:
             Survey: The parsed response data.
         """
-        return self._parse_one(Survey, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Survey, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def copy(self) -> SystemSurveysIdCopyEndpoint:
+        """
+        The SystemSurveysIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSurveysIdCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemSurveysIdInfoEndpoint:
+        """
+        The SystemSurveysIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSurveysIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def questions(self) -> SystemSurveysIdQuestionsEndpoint:
+        """
+        The SystemSurveysIdQuestionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSurveysIdQuestionsEndpoint(self.client, parent_endpoint=self))
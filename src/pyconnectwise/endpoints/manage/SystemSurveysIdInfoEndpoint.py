@@ -50,4 +50,4 @@ class SystemSurveysIdInfoEndpoint(
         Returns:
             SurveyInfo: The parsed response data.
         """
-        return self._parse_one(SurveyInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SurveyInfo, super()._make_request("GET", data=data, params=params).content)
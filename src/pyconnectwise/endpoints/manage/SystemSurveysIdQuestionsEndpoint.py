@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemSurveysIdQuestionsEndpoint(
         IPostable.__init__(self, SurveyQuestion)
         IPaginateable.__init__(self, SurveyQuestion)
 
-        self.count = self._register_child_endpoint(SystemSurveysIdQuestionsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemSurveysIdQuestionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemSurveysIdQuestionsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemSurveysIdQuestionsEndpoint(
         Returns:
             list[SurveyQuestion]: The parsed response data.
         """
-        return self._parse_many(SurveyQuestion, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SurveyQuestion, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SurveyQuestion:
         """
@@ -85,4 +84,11 @@ class SystemSurveysIdQuestionsEndpoint(
         Returns:
             SurveyQuestion: The parsed response data.
         """
-        return self._parse_one(SurveyQuestion, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SurveyQuestion, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemSurveysIdQuestionsCountEndpoint:
+        """
+        The SystemSurveysIdQuestionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSurveysIdQuestionsCountEndpoint(self.client, parent_endpoint=self))
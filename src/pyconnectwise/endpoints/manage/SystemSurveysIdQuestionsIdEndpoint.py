@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class SystemSurveysIdQuestionsIdEndpoint(
         IPuttable.__init__(self, SurveyQuestion)
         IPaginateable.__init__(self, SurveyQuestion)
 
-        self.values = self._register_child_endpoint(
-            SystemSurveysIdQuestionsIdValuesEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[SurveyQuestion]:
@@ -73,7 +70,7 @@ class SystemSurveysIdQuestionsIdEndpoint(
         Returns:
             SurveyQuestion: The parsed response data.
         """
-        return self._parse_one(SurveyQuestion, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(SurveyQuestion, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> SurveyQuestion:
         """
@@ -85,7 +82,7 @@ class SystemSurveysIdQuestionsIdEndpoint(
         Returns:
             SurveyQuestion: The parsed response data.
         """
-        return self._parse_one(SurveyQuestion, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(SurveyQuestion, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SurveyQuestion:
         """
@@ -97,4 +94,13 @@ class SystemSurveysIdQuestionsIdEndpoint(
         Returns:
             SurveyQuestion: The parsed response data.
         """
-        return self._parse_one(SurveyQuestion, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(SurveyQuestion, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def values(self) -> SystemSurveysIdQuestionsIdValuesEndpoint:
+        """
+        The SystemSurveysIdQuestionsIdValuesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemSurveysIdQuestionsIdValuesEndpoint(self.client, parent_endpoint=self)
+        )
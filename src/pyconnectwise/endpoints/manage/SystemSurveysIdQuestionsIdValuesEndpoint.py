@@ -72,7 +72,7 @@ class SystemSurveysIdQuestionsIdValuesEndpoint(
         Returns:
             list[SurveyQuestionValue]: The parsed response data.
         """
-        return self._parse_many(SurveyQuestionValue, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SurveyQuestionValue, super()._make_request("GET", data=data, params=params).content)
 
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
@@ -86,4 +86,4 @@ class SystemSurveysIdQuestionsIdValuesEndpoint(
         Returns:
             SurveyQuestionValue: The parsed response data.
         """
-        return self._parse_one(SurveyQuestionValue, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SurveyQuestionValue, super()._make_request("POST", data=data, params=params).content)
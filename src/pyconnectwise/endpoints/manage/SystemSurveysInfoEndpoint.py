@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class SystemSurveysInfoEndpoint(
         IGettable.__init__(self, list[SurveyInfo])
         IPaginateable.__init__(self, SurveyInfo)
 
-        self.count = self._register_child_endpoint(SystemSurveysInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[SurveyInfo]:
@@ -53,4 +52,11 @@ class SystemSurveysInfoEndpoint(
         Returns:
             list[SurveyInfo]: The parsed response data.
         """
-        return self._parse_many(SurveyInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(SurveyInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemSurveysInfoCountEndpoint:
+        """
+        The SystemSurveysInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSurveysInfoCountEndpoint(self.client, parent_endpoint=self))
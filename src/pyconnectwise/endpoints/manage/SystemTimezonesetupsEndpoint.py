@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SystemTimezonesetupsEndpoint(
         IPostable.__init__(self, TimeZoneSetup)
         IPaginateable.__init__(self, TimeZoneSetup)
 
-        self.count = self._register_child_endpoint(SystemTimezonesetupsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemTimezonesetupsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemTimezonesetupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemTimezonesetupsIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class SystemTimezonesetupsEndpoint(
         Returns:
             list[TimeZoneSetup]: The parsed response data.
         """
-        return self._parse_many(TimeZoneSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeZoneSetup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TimeZoneSetup:
         """
@@ -87,4 +85,18 @@ class SystemTimezonesetupsEndpoint(
         Returns:
             TimeZoneSetup: The parsed response data.
         """
-        return self._parse_one(TimeZoneSetup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TimeZoneSetup, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemTimezonesetupsCountEndpoint:
+        """
+        The SystemTimezonesetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemTimezonesetupsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemTimezonesetupsInfoEndpoint:
+        """
+        The SystemTimezonesetupsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemTimezonesetupsInfoEndpoint(self.client, parent_endpoint=self))
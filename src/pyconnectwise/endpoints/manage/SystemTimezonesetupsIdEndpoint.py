@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,8 +26,6 @@ class SystemTimezonesetupsIdEndpoint(
         IPuttable.__init__(self, TimeZoneSetup)
         IPaginateable.__init__(self, TimeZoneSetup)
 
-        self.info = self._register_child_endpoint(SystemTimezonesetupsIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[TimeZoneSetup]:
@@ -69,7 +68,7 @@ class SystemTimezonesetupsIdEndpoint(
         Returns:
             TimeZoneSetup: The parsed response data.
         """
-        return self._parse_one(TimeZoneSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TimeZoneSetup, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> TimeZoneSetup:
         """
@@ -81,7 +80,7 @@ class SystemTimezonesetupsIdEndpoint(
         Returns:
             TimeZoneSetup: The parsed response data.
         """
-        return self._parse_one(TimeZoneSetup, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(TimeZoneSetup, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TimeZoneSetup:
         """
@@ -93,4 +92,11 @@ class SystemTimezonesetupsIdEndpoint(
         Returns:
             TimeZoneSetup: The parsed response data.
         """
-        return self._parse_one(TimeZoneSetup, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(TimeZoneSetup, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SystemTimezonesetupsIdInfoEndpoint:
+        """
+        The SystemTimezonesetupsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemTimezonesetupsIdInfoEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class SystemTimezonesetupsIdInfoEndpoint(
         Returns:
             TimeZoneSetupInfo: The parsed response data.
         """
-        return self._parse_one(TimeZoneSetupInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TimeZoneSetupInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class SystemTimezonesetupsInfoEndpoint(
         IGettable.__init__(self, list[TimeZoneSetupInfo])
         IPaginateable.__init__(self, TimeZoneSetupInfo)
 
-        self.count = self._register_child_endpoint(SystemTimezonesetupsInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[TimeZoneSetupInfo]:
@@ -57,4 +56,11 @@ class SystemTimezonesetupsInfoEndpoint(
         Returns:
             list[TimeZoneSetupInfo]: The parsed response data.
         """
-        return self._parse_many(TimeZoneSetupInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeZoneSetupInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemTimezonesetupsInfoCountEndpoint:
+        """
+        The SystemTimezonesetupsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemTimezonesetupsInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemTodaypagecategoriesEndpoint(
         IPostable.__init__(self, TodayPageCategory)
         IPaginateable.__init__(self, TodayPageCategory)
 
-        self.count = self._register_child_endpoint(SystemTodaypagecategoriesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemTodaypagecategoriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemTodaypagecategoriesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemTodaypagecategoriesEndpoint(
         Returns:
             list[TodayPageCategory]: The parsed response data.
         """
-        return self._parse_many(TodayPageCategory, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TodayPageCategory, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TodayPageCategory:
         """
@@ -85,4 +84,11 @@ class SystemTodaypagecategoriesEndpoint(
         Returns:
             TodayPageCategory: The parsed response data.
         """
-        return self._parse_one(TodayPageCategory, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TodayPageCategory, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemTodaypagecategoriesCountEndpoint:
+        """
+        The SystemTodaypagecategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemTodaypagecategoriesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class SystemUserdefinedfieldsEndpoint(
         IPostable.__init__(self, UserDefinedField)
         IPaginateable.__init__(self, UserDefinedField)
 
-        self.count = self._register_child_endpoint(SystemUserdefinedfieldsCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemUserdefinedfieldsInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemUserdefinedfieldsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemUserdefinedfieldsIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class SystemUserdefinedfieldsEndpoint(
         Returns:
             list[UserDefinedField]: The parsed response data.
         """
-        return self._parse_many(UserDefinedField, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(UserDefinedField, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> UserDefinedField:
         """
@@ -87,4 +85,18 @@ class SystemUserdefinedfieldsEndpoint(
         Returns:
             UserDefinedField: The parsed response data.
         """
-        return self._parse_one(UserDefinedField, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(UserDefinedField, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemUserdefinedfieldsCountEndpoint:
+        """
+        The SystemUserdefinedfieldsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemUserdefinedfieldsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemUserdefinedfieldsInfoEndpoint:
+        """
+        The SystemUserdefinedfieldsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemUserdefinedfieldsInfoEndpoint(self.client, parent_endpoint=self))
@@ -54,4 +54,4 @@ class SystemUserdefinedfieldsIdInfoEndpoint(
         Returns:
             UserDefinedFieldInfo: The parsed response data.
         """
-        return self._parse_one(UserDefinedFieldInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(UserDefinedFieldInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class SystemWorkflowactionsIdAutomateparametersEndpoint(
         IPostable.__init__(self, WorkflowActionAutomateParameter)
         IPaginateable.__init__(self, WorkflowActionAutomateParameter)
 
-        self.count = self._register_child_endpoint(
-            SystemWorkflowactionsIdAutomateparametersCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemWorkflowactionsIdAutomateparametersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemWorkflowactionsIdAutomateparametersIdEndpoint object to move down the chain.
@@ -80,7 +77,7 @@ class SystemWorkflowactionsIdAutomateparametersEndpoint(
             list[WorkflowActionAutomateParameter]: The parsed response data.
         """
         return self._parse_many(
-            WorkflowActionAutomateParameter, super()._make_request("GET", data=data, params=params).json()
+            WorkflowActionAutomateParameter, super()._make_request("GET", data=data, params=params).content
         )
 
     def post(
@@ -96,5 +93,14 @@ class SystemWorkflowactionsIdAutomateparametersEndpoint(
             WorkflowActionAutomateParameter: The parsed response data.
         """
         return self._parse_one(
-            WorkflowActionAutomateParameter, super()._make_request("POST", data=data, params=params).json()
+            WorkflowActionAutomateParameter, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def count(self) -> SystemWorkflowactionsIdAutomateparametersCountEndpoint:
+        """
+        The SystemWorkflowactionsIdAutomateparametersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowactionsIdAutomateparametersCountEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -13,6 +14,11 @@ class SystemWorkflowactionsIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.automate_parameters = self._register_child_endpoint(
-            SystemWorkflowactionsIdAutomateparametersEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def automate_parameters(self) -> SystemWorkflowactionsIdAutomateparametersEndpoint:
+        """
+        The SystemWorkflowactionsIdAutomateparametersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowactionsIdAutomateparametersEndpoint(self.client, parent_endpoint=self)
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,14 +29,6 @@ class SystemWorkflowsEndpoint(
         IPostable.__init__(self, Workflow)
         IPaginateable.__init__(self, Workflow)
 
-        self.count = self._register_child_endpoint(SystemWorkflowsCountEndpoint(client, parent_endpoint=self))
-        self.table_types = self._register_child_endpoint(
-            SystemWorkflowsTabletypesEndpoint(client, parent_endpoint=self)
-        )
-        self.userdefinedfields = self._register_child_endpoint(
-            SystemWorkflowsUserdefinedfieldsEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemWorkflowsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdEndpoint object to move down the chain.
@@ -79,7 +72,7 @@ class SystemWorkflowsEndpoint(
         Returns:
             list[Workflow]: The parsed response data.
         """
-        return self._parse_many(Workflow, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(Workflow, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Workflow:
         """
@@ -91,4 +84,27 @@ class SystemWorkflowsEndpoint(
         Returns:
             Workflow: The parsed response data.
         """
-        return self._parse_one(Workflow, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Workflow, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemWorkflowsCountEndpoint:
+        """
+        The SystemWorkflowsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def table_types(self) -> SystemWorkflowsTabletypesEndpoint:
+        """
+        The SystemWorkflowsTabletypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsTabletypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def userdefinedfields(self) -> SystemWorkflowsUserdefinedfieldsEndpoint:
+        """
+        The SystemWorkflowsUserdefinedfieldsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsUserdefinedfieldsEndpoint(self.client, parent_endpoint=self)
+        )
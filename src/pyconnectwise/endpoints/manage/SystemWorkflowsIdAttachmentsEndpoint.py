@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,10 +25,6 @@ class SystemWorkflowsIdAttachmentsEndpoint(
         IGettable.__init__(self, list[WorkflowAttachment])
         IPaginateable.__init__(self, WorkflowAttachment)
 
-        self.count = self._register_child_endpoint(
-            SystemWorkflowsIdAttachmentsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemWorkflowsIdAttachmentsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdAttachmentsIdEndpoint object to move down the chain.
@@ -75,4 +72,13 @@ class SystemWorkflowsIdAttachmentsEndpoint(
         Returns:
             list[WorkflowAttachment]: The parsed response data.
         """
-        return self._parse_many(WorkflowAttachment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkflowAttachment, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemWorkflowsIdAttachmentsCountEndpoint:
+        """
+        The SystemWorkflowsIdAttachmentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdAttachmentsCountEndpoint(self.client, parent_endpoint=self)
+        )
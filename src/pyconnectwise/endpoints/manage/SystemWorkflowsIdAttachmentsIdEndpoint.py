@@ -52,4 +52,4 @@ class SystemWorkflowsIdAttachmentsIdEndpoint(
         Returns:
             WorkflowAttachment: The parsed response data.
         """
-        return self._parse_one(WorkflowAttachment, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkflowAttachment, super()._make_request("GET", data=data, params=params).content)
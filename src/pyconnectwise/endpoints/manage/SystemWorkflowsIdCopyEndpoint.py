@@ -24,4 +24,4 @@ class SystemWorkflowsIdCopyEndpoint(ConnectWiseEndpoint, IPostable[Workflow, Con
         Returns:
             Workflow: The parsed response data.
         """
-        return self._parse_one(Workflow, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(Workflow, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -29,16 +30,6 @@ class SystemWorkflowsIdEndpoint(
         IPuttable.__init__(self, Workflow)
         IPaginateable.__init__(self, Workflow)
 
-        self.attachments = self._register_child_endpoint(
-            SystemWorkflowsIdAttachmentsEndpoint(client, parent_endpoint=self)
-        )
-        self.copy = self._register_child_endpoint(SystemWorkflowsIdCopyEndpoint(client, parent_endpoint=self))
-        self.events = self._register_child_endpoint(SystemWorkflowsIdEventsEndpoint(client, parent_endpoint=self))
-        self.notify_types = self._register_child_endpoint(
-            SystemWorkflowsIdNotifytypesEndpoint(client, parent_endpoint=self)
-        )
-        self.triggers = self._register_child_endpoint(SystemWorkflowsIdTriggersEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[Workflow]:
@@ -79,7 +70,7 @@ class SystemWorkflowsIdEndpoint(
         Returns:
             Workflow: The parsed response data.
         """
-        return self._parse_one(Workflow, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(Workflow, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Workflow:
         """
@@ -91,7 +82,7 @@ class SystemWorkflowsIdEndpoint(
         Returns:
             Workflow: The parsed response data.
         """
-        return self._parse_one(Workflow, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(Workflow, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Workflow:
         """
@@ -103,4 +94,39 @@ class SystemWorkflowsIdEndpoint(
         Returns:
             Workflow: The parsed response data.
         """
-        return self._parse_one(Workflow, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(Workflow, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def attachments(self) -> SystemWorkflowsIdAttachmentsEndpoint:
+        """
+        The SystemWorkflowsIdAttachmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdAttachmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def copy(self) -> SystemWorkflowsIdCopyEndpoint:
+        """
+        The SystemWorkflowsIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def events(self) -> SystemWorkflowsIdEventsEndpoint:
+        """
+        The SystemWorkflowsIdEventsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdEventsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notify_types(self) -> SystemWorkflowsIdNotifytypesEndpoint:
+        """
+        The SystemWorkflowsIdNotifytypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdNotifytypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def triggers(self) -> SystemWorkflowsIdTriggersEndpoint:
+        """
+        The SystemWorkflowsIdTriggersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdTriggersEndpoint(self.client, parent_endpoint=self))
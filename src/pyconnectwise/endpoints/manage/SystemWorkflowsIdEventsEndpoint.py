@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class SystemWorkflowsIdEventsEndpoint(
         IPostable.__init__(self, WorkflowEvent)
         IPaginateable.__init__(self, WorkflowEvent)
 
-        self.count = self._register_child_endpoint(SystemWorkflowsIdEventsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemWorkflowsIdEventsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdEventsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class SystemWorkflowsIdEventsEndpoint(
         Returns:
             list[WorkflowEvent]: The parsed response data.
         """
-        return self._parse_many(WorkflowEvent, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkflowEvent, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WorkflowEvent:
         """
@@ -85,4 +84,11 @@ class SystemWorkflowsIdEventsEndpoint(
         Returns:
             WorkflowEvent: The parsed response data.
         """
-        return self._parse_one(WorkflowEvent, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WorkflowEvent, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemWorkflowsIdEventsCountEndpoint:
+        """
+        The SystemWorkflowsIdEventsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdEventsCountEndpoint(self.client, parent_endpoint=self))
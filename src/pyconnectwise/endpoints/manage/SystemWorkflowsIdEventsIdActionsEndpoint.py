@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -28,10 +29,6 @@ class SystemWorkflowsIdEventsIdActionsEndpoint(
         IPostable.__init__(self, WorkflowAction)
         IPaginateable.__init__(self, WorkflowAction)
 
-        self.count = self._register_child_endpoint(
-            SystemWorkflowsIdEventsIdActionsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemWorkflowsIdEventsIdActionsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdEventsIdActionsIdEndpoint object to move down the chain.
@@ -79,7 +76,7 @@ class SystemWorkflowsIdEventsIdActionsEndpoint(
         Returns:
             list[WorkflowAction]: The parsed response data.
         """
-        return self._parse_many(WorkflowAction, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkflowAction, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WorkflowAction:
         """
@@ -91,4 +88,13 @@ class SystemWorkflowsIdEventsIdActionsEndpoint(
         Returns:
             WorkflowAction: The parsed response data.
         """
-        return self._parse_one(WorkflowAction, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WorkflowAction, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemWorkflowsIdEventsIdActionsCountEndpoint:
+        """
+        The SystemWorkflowsIdEventsIdActionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdEventsIdActionsCountEndpoint(self.client, parent_endpoint=self)
+        )
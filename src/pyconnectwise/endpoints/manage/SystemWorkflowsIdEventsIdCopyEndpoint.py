@@ -26,4 +26,4 @@ class SystemWorkflowsIdEventsIdCopyEndpoint(
         Returns:
             WorkflowEvent: The parsed response data.
         """
-        return self._parse_one(WorkflowEvent, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WorkflowEvent, super()._make_request("POST", data=data, params=params).content)
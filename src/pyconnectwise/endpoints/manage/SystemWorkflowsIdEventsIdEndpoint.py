@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -29,12 +30,6 @@ class SystemWorkflowsIdEventsIdEndpoint(
         IPuttable.__init__(self, WorkflowEvent)
         IPaginateable.__init__(self, WorkflowEvent)
 
-        self.actions = self._register_child_endpoint(
-            SystemWorkflowsIdEventsIdActionsEndpoint(client, parent_endpoint=self)
-        )
-        self.copy = self._register_child_endpoint(SystemWorkflowsIdEventsIdCopyEndpoint(client, parent_endpoint=self))
-        self.test = self._register_child_endpoint(SystemWorkflowsIdEventsIdTestEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[WorkflowEvent]:
@@ -77,7 +72,7 @@ class SystemWorkflowsIdEventsIdEndpoint(
         Returns:
             WorkflowEvent: The parsed response data.
         """
-        return self._parse_one(WorkflowEvent, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkflowEvent, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> WorkflowEvent:
         """
@@ -89,7 +84,7 @@ class SystemWorkflowsIdEventsIdEndpoint(
         Returns:
             WorkflowEvent: The parsed response data.
         """
-        return self._parse_one(WorkflowEvent, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(WorkflowEvent, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WorkflowEvent:
         """
@@ -101,4 +96,27 @@ class SystemWorkflowsIdEventsIdEndpoint(
         Returns:
             WorkflowEvent: The parsed response data.
         """
-        return self._parse_one(WorkflowEvent, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(WorkflowEvent, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def actions(self) -> SystemWorkflowsIdEventsIdActionsEndpoint:
+        """
+        The SystemWorkflowsIdEventsIdActionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdEventsIdActionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def copy(self) -> SystemWorkflowsIdEventsIdCopyEndpoint:
+        """
+        The SystemWorkflowsIdEventsIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdEventsIdCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def test(self) -> SystemWorkflowsIdEventsIdTestEndpoint:
+        """
+        The SystemWorkflowsIdEventsIdTestEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdEventsIdTestEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,13 +28,6 @@ class SystemWorkflowsIdNotifytypesEndpoint(
         IGettable.__init__(self, list[WorkflowNotifyType])
         IPaginateable.__init__(self, WorkflowNotifyType)
 
-        self.count = self._register_child_endpoint(
-            SystemWorkflowsIdNotifytypesCountEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(
-            SystemWorkflowsIdNotifytypesInfoEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemWorkflowsIdNotifytypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdNotifytypesIdEndpoint object to move down the chain.
@@ -81,4 +75,22 @@ class SystemWorkflowsIdNotifytypesEndpoint(
         Returns:
             list[WorkflowNotifyType]: The parsed response data.
         """
-        return self._parse_many(WorkflowNotifyType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkflowNotifyType, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemWorkflowsIdNotifytypesCountEndpoint:
+        """
+        The SystemWorkflowsIdNotifytypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdNotifytypesCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> SystemWorkflowsIdNotifytypesInfoEndpoint:
+        """
+        The SystemWorkflowsIdNotifytypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdNotifytypesInfoEndpoint(self.client, parent_endpoint=self)
+        )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class SystemWorkflowsIdNotifytypesIdEndpoint(
         IGettable.__init__(self, WorkflowNotifyType)
         IPaginateable.__init__(self, WorkflowNotifyType)
 
-        self.info = self._register_child_endpoint(
-            SystemWorkflowsIdNotifytypesIdInfoEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[WorkflowNotifyType]:
@@ -59,4 +56,13 @@ class SystemWorkflowsIdNotifytypesIdEndpoint(
         Returns:
             WorkflowNotifyType: The parsed response data.
         """
-        return self._parse_one(WorkflowNotifyType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkflowNotifyType, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SystemWorkflowsIdNotifytypesIdInfoEndpoint:
+        """
+        The SystemWorkflowsIdNotifytypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdNotifytypesIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
@@ -54,4 +54,4 @@ class SystemWorkflowsIdNotifytypesIdInfoEndpoint(
         Returns:
             WorkflowNotifyTypeInfo: The parsed response data.
         """
-        return self._parse_one(WorkflowNotifyTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkflowNotifyTypeInfo, super()._make_request("GET", data=data, params=params).content)
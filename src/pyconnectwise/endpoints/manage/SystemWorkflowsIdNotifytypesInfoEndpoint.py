@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class SystemWorkflowsIdNotifytypesInfoEndpoint(
         IGettable.__init__(self, list[WorkflowNotifyTypeInfo])
         IPaginateable.__init__(self, WorkflowNotifyTypeInfo)
 
-        self.count = self._register_child_endpoint(
-            SystemWorkflowsIdNotifytypesInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[WorkflowNotifyTypeInfo]:
@@ -61,4 +58,13 @@ class SystemWorkflowsIdNotifytypesInfoEndpoint(
         Returns:
             list[WorkflowNotifyTypeInfo]: The parsed response data.
         """
-        return self._parse_many(WorkflowNotifyTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkflowNotifyTypeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemWorkflowsIdNotifytypesInfoCountEndpoint:
+        """
+        The SystemWorkflowsIdNotifytypesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdNotifytypesInfoCountEndpoint(self.client, parent_endpoint=self)
+        )
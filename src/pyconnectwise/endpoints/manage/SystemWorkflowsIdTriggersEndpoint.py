@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class SystemWorkflowsIdTriggersEndpoint(
         IGettable.__init__(self, list[WorkflowTrigger])
         IPaginateable.__init__(self, WorkflowTrigger)
 
-        self.count = self._register_child_endpoint(SystemWorkflowsIdTriggersCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemWorkflowsIdTriggersIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdTriggersIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class SystemWorkflowsIdTriggersEndpoint(
         Returns:
             list[WorkflowTrigger]: The parsed response data.
         """
-        return self._parse_many(WorkflowTrigger, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkflowTrigger, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemWorkflowsIdTriggersCountEndpoint:
+        """
+        The SystemWorkflowsIdTriggersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdTriggersCountEndpoint(self.client, parent_endpoint=self))
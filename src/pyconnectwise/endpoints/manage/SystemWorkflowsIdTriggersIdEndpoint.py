@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -13,6 +14,11 @@ class SystemWorkflowsIdTriggersIdEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
 
-        self.options = self._register_child_endpoint(
-            SystemWorkflowsIdTriggersIdOptionsEndpoint(client, parent_endpoint=self)
+    @cached_property
+    def options(self) -> SystemWorkflowsIdTriggersIdOptionsEndpoint:
+        """
+        The SystemWorkflowsIdTriggersIdOptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdTriggersIdOptionsEndpoint(self.client, parent_endpoint=self)
         )
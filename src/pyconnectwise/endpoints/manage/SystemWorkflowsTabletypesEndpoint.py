@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,9 +24,6 @@ class SystemWorkflowsTabletypesEndpoint(
         IGettable.__init__(self, list[WorkflowTableType])
         IPaginateable.__init__(self, WorkflowTableType)
 
-        self.count = self._register_child_endpoint(SystemWorkflowsTabletypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(SystemWorkflowsTabletypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> SystemWorkflowsTabletypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemWorkflowsTabletypesIdEndpoint object to move down the chain.
@@ -73,4 +71,18 @@ class SystemWorkflowsTabletypesEndpoint(
         Returns:
             list[WorkflowTableType]: The parsed response data.
         """
-        return self._parse_many(WorkflowTableType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkflowTableType, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemWorkflowsTabletypesCountEndpoint:
+        """
+        The SystemWorkflowsTabletypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsTabletypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemWorkflowsTabletypesInfoEndpoint:
+        """
+        The SystemWorkflowsTabletypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsTabletypesInfoEndpoint(self.client, parent_endpoint=self))
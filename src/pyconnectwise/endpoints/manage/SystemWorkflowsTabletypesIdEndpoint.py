@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,8 +24,6 @@ class SystemWorkflowsTabletypesIdEndpoint(
         IGettable.__init__(self, WorkflowTableType)
         IPaginateable.__init__(self, WorkflowTableType)
 
-        self.info = self._register_child_endpoint(SystemWorkflowsTabletypesIdInfoEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[WorkflowTableType]:
@@ -57,4 +56,11 @@ class SystemWorkflowsTabletypesIdEndpoint(
         Returns:
             WorkflowTableType: The parsed response data.
         """
-        return self._parse_one(WorkflowTableType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkflowTableType, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> SystemWorkflowsTabletypesIdInfoEndpoint:
+        """
+        The SystemWorkflowsTabletypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsTabletypesIdInfoEndpoint(self.client, parent_endpoint=self))
@@ -54,4 +54,4 @@ class SystemWorkflowsTabletypesIdInfoEndpoint(
         Returns:
             WorkflowTableTypeInfo: The parsed response data.
         """
-        return self._parse_one(WorkflowTableTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkflowTableTypeInfo, super()._make_request("GET", data=data, params=params).content)
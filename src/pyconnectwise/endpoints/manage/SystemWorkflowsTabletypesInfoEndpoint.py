@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -23,10 +24,6 @@ class SystemWorkflowsTabletypesInfoEndpoint(
         IGettable.__init__(self, list[WorkflowTableTypeInfo])
         IPaginateable.__init__(self, WorkflowTableTypeInfo)
 
-        self.count = self._register_child_endpoint(
-            SystemWorkflowsTabletypesInfoCountEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[WorkflowTableTypeInfo]:
@@ -61,4 +58,13 @@ class SystemWorkflowsTabletypesInfoEndpoint(
         Returns:
             list[WorkflowTableTypeInfo]: The parsed response data.
         """
-        return self._parse_many(WorkflowTableTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkflowTableTypeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> SystemWorkflowsTabletypesInfoCountEndpoint:
+        """
+        The SystemWorkflowsTabletypesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsTabletypesInfoCountEndpoint(self.client, parent_endpoint=self)
+        )
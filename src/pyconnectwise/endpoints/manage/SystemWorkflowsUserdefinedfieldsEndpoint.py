@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -19,13 +20,6 @@ class SystemWorkflowsUserdefinedfieldsEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "userdefinedfields", parent_endpoint=parent_endpoint)
 
-        self.actions = self._register_child_endpoint(
-            SystemWorkflowsUserdefinedfieldsActionsEndpoint(client, parent_endpoint=self)
-        )
-        self.events = self._register_child_endpoint(
-            SystemWorkflowsUserdefinedfieldsEventsEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> SystemWorkflowsUserdefinedfieldsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized SystemWorkflowsUserdefinedfieldsIdEndpoint object to move down the chain.
@@ -38,3 +32,21 @@ class SystemWorkflowsUserdefinedfieldsEndpoint(ConnectWiseEndpoint):
         child = SystemWorkflowsUserdefinedfieldsIdEndpoint(self.client, parent_endpoint=self)
         child._id = _id
         return child
+
+    @cached_property
+    def actions(self) -> SystemWorkflowsUserdefinedfieldsActionsEndpoint:
+        """
+        The SystemWorkflowsUserdefinedfieldsActionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsUserdefinedfieldsActionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def events(self) -> SystemWorkflowsUserdefinedfieldsEventsEndpoint:
+        """
+        The SystemWorkflowsUserdefinedfieldsEventsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsUserdefinedfieldsEventsEndpoint(self.client, parent_endpoint=self)
+        )
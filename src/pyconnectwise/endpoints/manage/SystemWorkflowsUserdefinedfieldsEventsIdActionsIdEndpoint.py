@@ -55,5 +55,5 @@ class SystemWorkflowsUserdefinedfieldsEventsIdActionsIdEndpoint(
             list[WorkflowActionUserDefinedField]: The parsed response data.
         """
         return self._parse_many(
-            WorkflowActionUserDefinedField, super()._make_request("GET", data=data, params=params).json()
+            WorkflowActionUserDefinedField, super()._make_request("GET", data=data, params=params).content
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -19,10 +20,6 @@ class SystemWorkflowsUserdefinedfieldsEventsIdEndpoint(
         ConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
         IPostable.__init__(self, WorkflowActionUserDefinedField)
 
-        self.actions = self._register_child_endpoint(
-            SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint(client, parent_endpoint=self)
-        )
-
     def post(
         self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
     ) -> WorkflowActionUserDefinedField:
@@ -36,5 +33,14 @@ class SystemWorkflowsUserdefinedfieldsEventsIdEndpoint(
             WorkflowActionUserDefinedField: The parsed response data.
         """
         return self._parse_one(
-            WorkflowActionUserDefinedField, super()._make_request("POST", data=data, params=params).json()
+            WorkflowActionUserDefinedField, super()._make_request("POST", data=data, params=params).content
+        )
+
+    @cached_property
+    def actions(self) -> SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint:
+        """
+        The SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint(self.client, parent_endpoint=self)
         )
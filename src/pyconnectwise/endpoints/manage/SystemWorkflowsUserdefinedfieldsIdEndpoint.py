@@ -32,7 +32,7 @@ class SystemWorkflowsUserdefinedfieldsIdEndpoint(
             WorkflowActionUserDefinedField: The parsed response data.
         """
         return self._parse_one(
-            WorkflowActionUserDefinedField, super()._make_request("PATCH", data=data, params=params).json()
+            WorkflowActionUserDefinedField, super()._make_request("PATCH", data=data, params=params).content
         )
 
     def put(
@@ -48,5 +48,5 @@ class SystemWorkflowsUserdefinedfieldsIdEndpoint(
             WorkflowActionUserDefinedField: The parsed response data.
         """
         return self._parse_one(
-            WorkflowActionUserDefinedField, super()._make_request("PUT", data=data, params=params).json()
+            WorkflowActionUserDefinedField, super()._make_request("PUT", data=data, params=params).content
         )
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class TimeAccrualsEndpoint(
         IPostable.__init__(self, TimeAccrual)
         IPaginateable.__init__(self, TimeAccrual)
 
-        self.count = self._register_child_endpoint(TimeAccrualsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeAccrualsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeAccrualsIdEndpoint object to move down the chain.
@@ -71,7 +70,7 @@ class TimeAccrualsEndpoint(
         Returns:
             list[TimeAccrual]: The parsed response data.
         """
-        return self._parse_many(TimeAccrual, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeAccrual, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TimeAccrual:
         """
@@ -83,4 +82,11 @@ class TimeAccrualsEndpoint(
         Returns:
             TimeAccrual: The parsed response data.
         """
-        return self._parse_one(TimeAccrual, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TimeAccrual, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeAccrualsCountEndpoint:
+        """
+        The TimeAccrualsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeAccrualsCountEndpoint(self.client, parent_endpoint=self))
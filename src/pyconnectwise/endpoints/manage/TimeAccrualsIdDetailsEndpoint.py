@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class TimeAccrualsIdDetailsEndpoint(
         IGettable.__init__(self, list[TimeAccrualDetail])
         IPaginateable.__init__(self, TimeAccrualDetail)
 
-        self.count = self._register_child_endpoint(TimeAccrualsIdDetailsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeAccrualsIdDetailsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeAccrualsIdDetailsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class TimeAccrualsIdDetailsEndpoint(
         Returns:
             list[TimeAccrualDetail]: The parsed response data.
         """
-        return self._parse_many(TimeAccrualDetail, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeAccrualDetail, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeAccrualsIdDetailsCountEndpoint:
+        """
+        The TimeAccrualsIdDetailsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeAccrualsIdDetailsCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class TimeActivitystopwatchesEndpoint(
         IPostable.__init__(self, ActivityStopwatch)
         IPaginateable.__init__(self, ActivityStopwatch)
 
-        self.count = self._register_child_endpoint(TimeActivitystopwatchesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeActivitystopwatchesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeActivitystopwatchesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class TimeActivitystopwatchesEndpoint(
         Returns:
             list[ActivityStopwatch]: The parsed response data.
         """
-        return self._parse_many(ActivityStopwatch, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ActivityStopwatch, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ActivityStopwatch:
         """
@@ -85,4 +84,11 @@ class TimeActivitystopwatchesEndpoint(
         Returns:
             ActivityStopwatch: The parsed response data.
         """
-        return self._parse_one(ActivityStopwatch, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ActivityStopwatch, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeActivitystopwatchesCountEndpoint:
+        """
+        The TimeActivitystopwatchesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeActivitystopwatchesCountEndpoint(self.client, parent_endpoint=self))
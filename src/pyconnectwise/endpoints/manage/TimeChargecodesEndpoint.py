@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class TimeChargecodesEndpoint(
         IPostable.__init__(self, ChargeCode)
         IPaginateable.__init__(self, ChargeCode)
 
-        self.count = self._register_child_endpoint(TimeChargecodesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(TimeChargecodesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeChargecodesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeChargecodesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class TimeChargecodesEndpoint(
         Returns:
             list[ChargeCode]: The parsed response data.
         """
-        return self._parse_many(ChargeCode, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ChargeCode, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ChargeCode:
         """
@@ -83,4 +81,18 @@ class TimeChargecodesEndpoint(
         Returns:
             ChargeCode: The parsed response data.
         """
-        return self._parse_one(ChargeCode, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ChargeCode, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeChargecodesCountEndpoint:
+        """
+        The TimeChargecodesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeChargecodesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> TimeChargecodesInfoEndpoint:
+        """
+        The TimeChargecodesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeChargecodesInfoEndpoint(self.client, parent_endpoint=self))
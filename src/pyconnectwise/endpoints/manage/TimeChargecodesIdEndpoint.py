@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,12 +28,6 @@ class TimeChargecodesIdEndpoint(
         IPuttable.__init__(self, ChargeCode)
         IPaginateable.__init__(self, ChargeCode)
 
-        self.expense_types = self._register_child_endpoint(
-            TimeChargecodesIdExpensetypesEndpoint(client, parent_endpoint=self)
-        )
-        self.info = self._register_child_endpoint(TimeChargecodesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(TimeChargecodesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ChargeCode]:
@@ -73,7 +68,7 @@ class TimeChargecodesIdEndpoint(
         Returns:
             ChargeCode: The parsed response data.
         """
-        return self._parse_one(ChargeCode, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ChargeCode, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> ChargeCode:
         """
@@ -85,7 +80,7 @@ class TimeChargecodesIdEndpoint(
         Returns:
             ChargeCode: The parsed response data.
         """
-        return self._parse_one(ChargeCode, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(ChargeCode, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ChargeCode:
         """
@@ -97,4 +92,25 @@ class TimeChargecodesIdEndpoint(
         Returns:
             ChargeCode: The parsed response data.
         """
-        return self._parse_one(ChargeCode, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(ChargeCode, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def expense_types(self) -> TimeChargecodesIdExpensetypesEndpoint:
+        """
+        The TimeChargecodesIdExpensetypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeChargecodesIdExpensetypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> TimeChargecodesIdInfoEndpoint:
+        """
+        The TimeChargecodesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeChargecodesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> TimeChargecodesIdUsagesEndpoint:
+        """
+        The TimeChargecodesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeChargecodesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -52,4 +52,4 @@ class TimeChargecodesIdInfoEndpoint(
         Returns:
             ChargeCodeInfo: The parsed response data.
         """
-        return self._parse_one(ChargeCodeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(ChargeCodeInfo, super()._make_request("GET", data=data, params=params).content)
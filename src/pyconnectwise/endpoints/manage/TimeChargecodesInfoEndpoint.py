@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class TimeChargecodesInfoEndpoint(
         IGettable.__init__(self, list[ChargeCodeInfo])
         IPaginateable.__init__(self, ChargeCodeInfo)
 
-        self.count = self._register_child_endpoint(TimeChargecodesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[ChargeCodeInfo]:
@@ -57,4 +56,11 @@ class TimeChargecodesInfoEndpoint(
         Returns:
             list[ChargeCodeInfo]: The parsed response data.
         """
-        return self._parse_many(ChargeCodeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ChargeCodeInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeChargecodesInfoCountEndpoint:
+        """
+        The TimeChargecodesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeChargecodesInfoCountEndpoint(self.client, parent_endpoint=self))
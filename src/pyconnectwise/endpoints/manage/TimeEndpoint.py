@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,22 +22,79 @@ class TimeEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "time", parent_endpoint=parent_endpoint)
 
-        self.accruals = self._register_child_endpoint(TimeAccrualsEndpoint(client, parent_endpoint=self))
-        self.activitystopwatches = self._register_child_endpoint(
-            TimeActivitystopwatchesEndpoint(client, parent_endpoint=self)
-        )
-        self.charge_codes = self._register_child_endpoint(TimeChargecodesEndpoint(client, parent_endpoint=self))
-        self.entries = self._register_child_endpoint(TimeEntriesEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(TimeInfoEndpoint(client, parent_endpoint=self))
-        self.schedulestopwatches = self._register_child_endpoint(
-            TimeSchedulestopwatchesEndpoint(client, parent_endpoint=self)
-        )
-        self.sheets = self._register_child_endpoint(TimeSheetsEndpoint(client, parent_endpoint=self))
-        self.ticketstopwatches = self._register_child_endpoint(
-            TimeTicketstopwatchesEndpoint(client, parent_endpoint=self)
-        )
-        self.time_period_setups = self._register_child_endpoint(
-            TimeTimeperiodsetupsEndpoint(client, parent_endpoint=self)
-        )
-        self.work_roles = self._register_child_endpoint(TimeWorkrolesEndpoint(client, parent_endpoint=self))
-        self.work_types = self._register_child_endpoint(TimeWorktypesEndpoint(client, parent_endpoint=self))
+    @cached_property
+    def accruals(self) -> TimeAccrualsEndpoint:
+        """
+        The TimeAccrualsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeAccrualsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def activitystopwatches(self) -> TimeActivitystopwatchesEndpoint:
+        """
+        The TimeActivitystopwatchesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeActivitystopwatchesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def charge_codes(self) -> TimeChargecodesEndpoint:
+        """
+        The TimeChargecodesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeChargecodesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def entries(self) -> TimeEntriesEndpoint:
+        """
+        The TimeEntriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeEntriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> TimeInfoEndpoint:
+        """
+        The TimeInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def schedulestopwatches(self) -> TimeSchedulestopwatchesEndpoint:
+        """
+        The TimeSchedulestopwatchesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSchedulestopwatchesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sheets(self) -> TimeSheetsEndpoint:
+        """
+        The TimeSheetsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ticketstopwatches(self) -> TimeTicketstopwatchesEndpoint:
+        """
+        The TimeTicketstopwatchesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeTicketstopwatchesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def time_period_setups(self) -> TimeTimeperiodsetupsEndpoint:
+        """
+        The TimeTimeperiodsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeTimeperiodsetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def work_roles(self) -> TimeWorkrolesEndpoint:
+        """
+        The TimeWorkrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorkrolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def work_types(self) -> TimeWorktypesEndpoint:
+        """
+        The TimeWorktypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorktypesEndpoint(self.client, parent_endpoint=self))
@@ -24,4 +24,4 @@ class TimeEntriesDefaultsEndpoint(ConnectWiseEndpoint, IPostable[TimeEntry, Conn
         Returns:
             TimeEntry: The parsed response data.
         """
-        return self._parse_one(TimeEntry, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TimeEntry, super()._make_request("POST", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class TimeEntriesEndpoint(
         IPostable.__init__(self, TimeEntry)
         IPaginateable.__init__(self, TimeEntry)
 
-        self.count = self._register_child_endpoint(TimeEntriesCountEndpoint(client, parent_endpoint=self))
-        self.defaults = self._register_child_endpoint(TimeEntriesDefaultsEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeEntriesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeEntriesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class TimeEntriesEndpoint(
         Returns:
             list[TimeEntry]: The parsed response data.
         """
-        return self._parse_many(TimeEntry, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeEntry, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TimeEntry:
         """
@@ -83,4 +81,18 @@ class TimeEntriesEndpoint(
         Returns:
             TimeEntry: The parsed response data.
         """
-        return self._parse_one(TimeEntry, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TimeEntry, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeEntriesCountEndpoint:
+        """
+        The TimeEntriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeEntriesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def defaults(self) -> TimeEntriesDefaultsEndpoint:
+        """
+        The TimeEntriesDefaultsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeEntriesDefaultsEndpoint(self.client, parent_endpoint=self))
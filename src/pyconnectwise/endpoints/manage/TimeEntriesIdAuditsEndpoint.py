@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class TimeEntriesIdAuditsEndpoint(
         IGettable.__init__(self, list[TimeEntryAudit])
         IPaginateable.__init__(self, TimeEntryAudit)
 
-        self.count = self._register_child_endpoint(TimeEntriesIdAuditsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeEntriesIdAuditsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeEntriesIdAuditsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class TimeEntriesIdAuditsEndpoint(
         Returns:
             list[TimeEntryAudit]: The parsed response data.
         """
-        return self._parse_many(TimeEntryAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeEntryAudit, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeEntriesIdAuditsCountEndpoint:
+        """
+        The TimeEntriesIdAuditsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeEntriesIdAuditsCountEndpoint(self.client, parent_endpoint=self))
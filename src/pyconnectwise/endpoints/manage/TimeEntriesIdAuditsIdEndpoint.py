@@ -52,4 +52,4 @@ class TimeEntriesIdAuditsIdEndpoint(
         Returns:
             TimeEntryAudit: The parsed response data.
         """
-        return self._parse_one(TimeEntryAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TimeEntryAudit, super()._make_request("GET", data=data, params=params).content)
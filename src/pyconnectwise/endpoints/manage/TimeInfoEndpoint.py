@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -11,6 +12,9 @@ class TimeInfoEndpoint(ConnectWiseEndpoint):
     def __init__(self, client: "ConnectWiseClient", parent_endpoint: ConnectWiseEndpoint = None) -> None:
         ConnectWiseEndpoint.__init__(self, client, "info", parent_endpoint=parent_endpoint)
 
-        self.charge_code_expense_types = self._register_child_endpoint(
-            TimeInfoChargecodeexpensetypesEndpoint(client, parent_endpoint=self)
-        )
+    @cached_property
+    def charge_code_expense_types(self) -> TimeInfoChargecodeexpensetypesEndpoint:
+        """
+        The TimeInfoChargecodeexpensetypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeInfoChargecodeexpensetypesEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class TimeSchedulestopwatchesEndpoint(
         IPostable.__init__(self, ScheduleStopwatch)
         IPaginateable.__init__(self, ScheduleStopwatch)
 
-        self.count = self._register_child_endpoint(TimeSchedulestopwatchesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeSchedulestopwatchesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeSchedulestopwatchesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class TimeSchedulestopwatchesEndpoint(
         Returns:
             list[ScheduleStopwatch]: The parsed response data.
         """
-        return self._parse_many(ScheduleStopwatch, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(ScheduleStopwatch, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ScheduleStopwatch:
         """
@@ -85,4 +84,11 @@ class TimeSchedulestopwatchesEndpoint(
         Returns:
             ScheduleStopwatch: The parsed response data.
         """
-        return self._parse_one(ScheduleStopwatch, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(ScheduleStopwatch, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeSchedulestopwatchesCountEndpoint:
+        """
+        The TimeSchedulestopwatchesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSchedulestopwatchesCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class TimeSheetsEndpoint(
         IGettable.__init__(self, list[TimeSheet])
         IPaginateable.__init__(self, TimeSheet)
 
-        self.count = self._register_child_endpoint(TimeSheetsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeSheetsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeSheetsIdEndpoint object to move down the chain.
@@ -67,4 +66,11 @@ class TimeSheetsEndpoint(
         Returns:
             list[TimeSheet]: The parsed response data.
         """
-        return self._parse_many(TimeSheet, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeSheet, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeSheetsCountEndpoint:
+        """
+        The TimeSheetsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsCountEndpoint(self.client, parent_endpoint=self))
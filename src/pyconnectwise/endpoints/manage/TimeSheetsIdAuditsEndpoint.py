@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -22,8 +23,6 @@ class TimeSheetsIdAuditsEndpoint(
         IGettable.__init__(self, list[TimeSheetAudit])
         IPaginateable.__init__(self, TimeSheetAudit)
 
-        self.count = self._register_child_endpoint(TimeSheetsIdAuditsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeSheetsIdAuditsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeSheetsIdAuditsIdEndpoint object to move down the chain.
@@ -71,4 +70,11 @@ class TimeSheetsIdAuditsEndpoint(
         Returns:
             list[TimeSheetAudit]: The parsed response data.
         """
-        return self._parse_many(TimeSheetAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimeSheetAudit, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeSheetsIdAuditsCountEndpoint:
+        """
+        The TimeSheetsIdAuditsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsIdAuditsCountEndpoint(self.client, parent_endpoint=self))
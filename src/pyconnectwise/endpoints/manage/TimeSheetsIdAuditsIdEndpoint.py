@@ -52,4 +52,4 @@ class TimeSheetsIdAuditsIdEndpoint(
         Returns:
             TimeSheetAudit: The parsed response data.
         """
-        return self._parse_one(TimeSheetAudit, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TimeSheetAudit, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,12 +26,6 @@ class TimeSheetsIdEndpoint(
         IGettable.__init__(self, TimeSheet)
         IPaginateable.__init__(self, TimeSheet)
 
-        self.approve = self._register_child_endpoint(TimeSheetsIdApproveEndpoint(client, parent_endpoint=self))
-        self.audits = self._register_child_endpoint(TimeSheetsIdAuditsEndpoint(client, parent_endpoint=self))
-        self.reject = self._register_child_endpoint(TimeSheetsIdRejectEndpoint(client, parent_endpoint=self))
-        self.reverse = self._register_child_endpoint(TimeSheetsIdReverseEndpoint(client, parent_endpoint=self))
-        self.submit = self._register_child_endpoint(TimeSheetsIdSubmitEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[TimeSheet]:
@@ -61,4 +56,39 @@ class TimeSheetsIdEndpoint(
         Returns:
             TimeSheet: The parsed response data.
         """
-        return self._parse_one(TimeSheet, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TimeSheet, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def approve(self) -> TimeSheetsIdApproveEndpoint:
+        """
+        The TimeSheetsIdApproveEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsIdApproveEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def audits(self) -> TimeSheetsIdAuditsEndpoint:
+        """
+        The TimeSheetsIdAuditsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsIdAuditsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reject(self) -> TimeSheetsIdRejectEndpoint:
+        """
+        The TimeSheetsIdRejectEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsIdRejectEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reverse(self) -> TimeSheetsIdReverseEndpoint:
+        """
+        The TimeSheetsIdReverseEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsIdReverseEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def submit(self) -> TimeSheetsIdSubmitEndpoint:
+        """
+        The TimeSheetsIdSubmitEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsIdSubmitEndpoint(self.client, parent_endpoint=self))
@@ -24,4 +24,4 @@ class TimeSheetsIdRejectEndpoint(ConnectWiseEndpoint, IPostable[SuccessResponse,
         Returns:
             SuccessResponse: The parsed response data.
         """
-        return self._parse_one(SuccessResponse, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(SuccessResponse, super()._make_request("POST", data=data, params=params).content)
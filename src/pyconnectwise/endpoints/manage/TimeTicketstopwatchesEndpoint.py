@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class TimeTicketstopwatchesEndpoint(
         IPostable.__init__(self, TicketStopwatch)
         IPaginateable.__init__(self, TicketStopwatch)
 
-        self.count = self._register_child_endpoint(TimeTicketstopwatchesCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeTicketstopwatchesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeTicketstopwatchesIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class TimeTicketstopwatchesEndpoint(
         Returns:
             list[TicketStopwatch]: The parsed response data.
         """
-        return self._parse_many(TicketStopwatch, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TicketStopwatch, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TicketStopwatch:
         """
@@ -85,4 +84,11 @@ class TimeTicketstopwatchesEndpoint(
         Returns:
             TicketStopwatch: The parsed response data.
         """
-        return self._parse_one(TicketStopwatch, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TicketStopwatch, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeTicketstopwatchesCountEndpoint:
+        """
+        The TimeTicketstopwatchesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeTicketstopwatchesCountEndpoint(self.client, parent_endpoint=self))
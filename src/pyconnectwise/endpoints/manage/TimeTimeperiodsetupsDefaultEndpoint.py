@@ -54,4 +54,4 @@ class TimeTimeperiodsetupsDefaultEndpoint(
         Returns:
             TimePeriodSetupDefaults: The parsed response data.
         """
-        return self._parse_one(TimePeriodSetupDefaults, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TimePeriodSetupDefaults, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class TimeTimeperiodsetupsEndpoint(
         IPostable.__init__(self, TimePeriodSetup)
         IPaginateable.__init__(self, TimePeriodSetup)
 
-        self.count = self._register_child_endpoint(TimeTimeperiodsetupsCountEndpoint(client, parent_endpoint=self))
-        self.default = self._register_child_endpoint(TimeTimeperiodsetupsDefaultEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeTimeperiodsetupsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeTimeperiodsetupsIdEndpoint object to move down the chain.
@@ -75,7 +73,7 @@ class TimeTimeperiodsetupsEndpoint(
         Returns:
             list[TimePeriodSetup]: The parsed response data.
         """
-        return self._parse_many(TimePeriodSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimePeriodSetup, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TimePeriodSetup:
         """
@@ -87,4 +85,18 @@ class TimeTimeperiodsetupsEndpoint(
         Returns:
             TimePeriodSetup: The parsed response data.
         """
-        return self._parse_one(TimePeriodSetup, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(TimePeriodSetup, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeTimeperiodsetupsCountEndpoint:
+        """
+        The TimeTimeperiodsetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeTimeperiodsetupsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def default(self) -> TimeTimeperiodsetupsDefaultEndpoint:
+        """
+        The TimeTimeperiodsetupsDefaultEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeTimeperiodsetupsDefaultEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,10 +26,6 @@ class TimeTimeperiodsetupsIdEndpoint(
         IPuttable.__init__(self, TimePeriodSetup)
         IPaginateable.__init__(self, TimePeriodSetup)
 
-        self.periods = self._register_child_endpoint(
-            TimeTimeperiodsetupsIdPeriodsEndpoint(client, parent_endpoint=self)
-        )
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[TimePeriodSetup]:
@@ -71,7 +68,7 @@ class TimeTimeperiodsetupsIdEndpoint(
         Returns:
             TimePeriodSetup: The parsed response data.
         """
-        return self._parse_one(TimePeriodSetup, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TimePeriodSetup, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> TimePeriodSetup:
         """
@@ -83,7 +80,7 @@ class TimeTimeperiodsetupsIdEndpoint(
         Returns:
             TimePeriodSetup: The parsed response data.
         """
-        return self._parse_one(TimePeriodSetup, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(TimePeriodSetup, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TimePeriodSetup:
         """
@@ -95,4 +92,11 @@ class TimeTimeperiodsetupsIdEndpoint(
         Returns:
             TimePeriodSetup: The parsed response data.
         """
-        return self._parse_one(TimePeriodSetup, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(TimePeriodSetup, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def periods(self) -> TimeTimeperiodsetupsIdPeriodsEndpoint:
+        """
+        The TimeTimeperiodsetupsIdPeriodsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeTimeperiodsetupsIdPeriodsEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,10 +27,6 @@ class TimeTimeperiodsetupsIdPeriodsEndpoint(
         IGettable.__init__(self, list[TimePeriod])
         IPaginateable.__init__(self, TimePeriod)
 
-        self.count = self._register_child_endpoint(
-            TimeTimeperiodsetupsIdPeriodsCountEndpoint(client, parent_endpoint=self)
-        )
-
     def id(self, _id: int) -> TimeTimeperiodsetupsIdPeriodsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeTimeperiodsetupsIdPeriodsIdEndpoint object to move down the chain.
@@ -73,4 +70,13 @@ class TimeTimeperiodsetupsIdPeriodsEndpoint(
         Returns:
             list[TimePeriod]: The parsed response data.
         """
-        return self._parse_many(TimePeriod, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(TimePeriod, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeTimeperiodsetupsIdPeriodsCountEndpoint:
+        """
+        The TimeTimeperiodsetupsIdPeriodsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            TimeTimeperiodsetupsIdPeriodsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -50,4 +50,4 @@ class TimeTimeperiodsetupsIdPeriodsIdEndpoint(
         Returns:
             TimePeriod: The parsed response data.
         """
-        return self._parse_one(TimePeriod, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(TimePeriod, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class TimeWorkrolesEndpoint(
         IPostable.__init__(self, WorkRole)
         IPaginateable.__init__(self, WorkRole)
 
-        self.count = self._register_child_endpoint(TimeWorkrolesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(TimeWorkrolesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeWorkrolesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeWorkrolesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class TimeWorkrolesEndpoint(
         Returns:
             list[WorkRole]: The parsed response data.
         """
-        return self._parse_many(WorkRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkRole, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WorkRole:
         """
@@ -83,4 +81,18 @@ class TimeWorkrolesEndpoint(
         Returns:
             WorkRole: The parsed response data.
         """
-        return self._parse_one(WorkRole, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WorkRole, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeWorkrolesCountEndpoint:
+        """
+        The TimeWorkrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorkrolesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> TimeWorkrolesInfoEndpoint:
+        """
+        The TimeWorkrolesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorkrolesInfoEndpoint(self.client, parent_endpoint=self))
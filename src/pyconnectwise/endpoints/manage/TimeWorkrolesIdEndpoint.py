@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -27,10 +28,6 @@ class TimeWorkrolesIdEndpoint(
         IPuttable.__init__(self, WorkRole)
         IPaginateable.__init__(self, WorkRole)
 
-        self.info = self._register_child_endpoint(TimeWorkrolesIdInfoEndpoint(client, parent_endpoint=self))
-        self.locations = self._register_child_endpoint(TimeWorkrolesIdLocationsEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(TimeWorkrolesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[WorkRole]:
@@ -71,7 +68,7 @@ class TimeWorkrolesIdEndpoint(
         Returns:
             WorkRole: The parsed response data.
         """
-        return self._parse_one(WorkRole, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkRole, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> WorkRole:
         """
@@ -83,7 +80,7 @@ class TimeWorkrolesIdEndpoint(
         Returns:
             WorkRole: The parsed response data.
         """
-        return self._parse_one(WorkRole, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(WorkRole, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WorkRole:
         """
@@ -95,4 +92,25 @@ class TimeWorkrolesIdEndpoint(
         Returns:
             WorkRole: The parsed response data.
         """
-        return self._parse_one(WorkRole, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(WorkRole, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> TimeWorkrolesIdInfoEndpoint:
+        """
+        The TimeWorkrolesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorkrolesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def locations(self) -> TimeWorkrolesIdLocationsEndpoint:
+        """
+        The TimeWorkrolesIdLocationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorkrolesIdLocationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> TimeWorkrolesIdUsagesEndpoint:
+        """
+        The TimeWorkrolesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorkrolesIdUsagesEndpoint(self.client, parent_endpoint=self))
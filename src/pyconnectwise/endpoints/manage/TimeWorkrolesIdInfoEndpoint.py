@@ -52,4 +52,4 @@ class TimeWorkrolesIdInfoEndpoint(
         Returns:
             WorkRoleInfo: The parsed response data.
         """
-        return self._parse_one(WorkRoleInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkRoleInfo, super()._make_request("GET", data=data, params=params).content)
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -24,8 +25,6 @@ class TimeWorkrolesIdLocationsEndpoint(
         IPostable.__init__(self, WorkRoleLocation)
         IPaginateable.__init__(self, WorkRoleLocation)
 
-        self.count = self._register_child_endpoint(TimeWorkrolesIdLocationsCountEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeWorkrolesIdLocationsIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeWorkrolesIdLocationsIdEndpoint object to move down the chain.
@@ -73,7 +72,7 @@ class TimeWorkrolesIdLocationsEndpoint(
         Returns:
             list[WorkRoleLocation]: The parsed response data.
         """
-        return self._parse_many(WorkRoleLocation, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkRoleLocation, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WorkRoleLocation:
         """
@@ -85,4 +84,11 @@ class TimeWorkrolesIdLocationsEndpoint(
         Returns:
             WorkRoleLocation: The parsed response data.
         """
-        return self._parse_one(WorkRoleLocation, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WorkRoleLocation, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeWorkrolesIdLocationsCountEndpoint:
+        """
+        The TimeWorkrolesIdLocationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorkrolesIdLocationsCountEndpoint(self.client, parent_endpoint=self))
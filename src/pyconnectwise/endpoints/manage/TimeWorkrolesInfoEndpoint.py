@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -21,8 +22,6 @@ class TimeWorkrolesInfoEndpoint(
         IGettable.__init__(self, list[WorkRoleInfo])
         IPaginateable.__init__(self, WorkRoleInfo)
 
-        self.count = self._register_child_endpoint(TimeWorkrolesInfoCountEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[WorkRoleInfo]:
@@ -55,4 +54,11 @@ class TimeWorkrolesInfoEndpoint(
         Returns:
             list[WorkRoleInfo]: The parsed response data.
         """
-        return self._parse_many(WorkRoleInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkRoleInfo, super()._make_request("GET", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeWorkrolesInfoCountEndpoint:
+        """
+        The TimeWorkrolesInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorkrolesInfoCountEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -25,9 +26,6 @@ class TimeWorktypesEndpoint(
         IPostable.__init__(self, WorkType)
         IPaginateable.__init__(self, WorkType)
 
-        self.count = self._register_child_endpoint(TimeWorktypesCountEndpoint(client, parent_endpoint=self))
-        self.info = self._register_child_endpoint(TimeWorktypesInfoEndpoint(client, parent_endpoint=self))
-
     def id(self, _id: int) -> TimeWorktypesIdEndpoint:
         """
         Sets the ID for this endpoint and returns an initialized TimeWorktypesIdEndpoint object to move down the chain.
@@ -71,7 +69,7 @@ class TimeWorktypesEndpoint(
         Returns:
             list[WorkType]: The parsed response data.
         """
-        return self._parse_many(WorkType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_many(WorkType, super()._make_request("GET", data=data, params=params).content)
 
     def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WorkType:
         """
@@ -83,4 +81,18 @@ class TimeWorktypesEndpoint(
         Returns:
             WorkType: The parsed response data.
         """
-        return self._parse_one(WorkType, super()._make_request("POST", data=data, params=params).json())
+        return self._parse_one(WorkType, super()._make_request("POST", data=data, params=params).content)
+
+    @cached_property
+    def count(self) -> TimeWorktypesCountEndpoint:
+        """
+        The TimeWorktypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorktypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> TimeWorktypesInfoEndpoint:
+        """
+        The TimeWorktypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorktypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -1,3 +1,4 @@
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from pyconnectwise.endpoints.base.connectwise_endpoint import ConnectWiseEndpoint
@@ -26,9 +27,6 @@ class TimeWorktypesIdEndpoint(
         IPuttable.__init__(self, WorkType)
         IPaginateable.__init__(self, WorkType)
 
-        self.info = self._register_child_endpoint(TimeWorktypesIdInfoEndpoint(client, parent_endpoint=self))
-        self.usages = self._register_child_endpoint(TimeWorktypesIdUsagesEndpoint(client, parent_endpoint=self))
-
     def paginated(
         self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
     ) -> PaginatedResponse[WorkType]:
@@ -69,7 +67,7 @@ class TimeWorktypesIdEndpoint(
         Returns:
             WorkType: The parsed response data.
         """
-        return self._parse_one(WorkType, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkType, super()._make_request("GET", data=data, params=params).content)
 
     def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> WorkType:
         """
@@ -81,7 +79,7 @@ class TimeWorktypesIdEndpoint(
         Returns:
             WorkType: The parsed response data.
         """
-        return self._parse_one(WorkType, super()._make_request("PATCH", data=data, params=params).json())
+        return self._parse_one(WorkType, super()._make_request("PATCH", data=data, params=params).content)
 
     def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WorkType:
         """
@@ -93,4 +91,18 @@ class TimeWorktypesIdEndpoint(
         Returns:
             WorkType: The parsed response data.
         """
-        return self._parse_one(WorkType, super()._make_request("PUT", data=data, params=params).json())
+        return self._parse_one(WorkType, super()._make_request("PUT", data=data, params=params).content)
+
+    @cached_property
+    def info(self) -> TimeWorktypesIdInfoEndpoint:
+        """
+        The TimeWorktypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorktypesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> TimeWorktypesIdUsagesEndpoint:
+        """
+        The TimeWorktypesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorktypesIdUsagesEndpoint(self.client, parent_endpoint=self))
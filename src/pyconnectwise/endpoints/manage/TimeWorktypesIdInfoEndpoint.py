@@ -52,4 +52,4 @@ class TimeWorktypesIdInfoEndpoint(
         Returns:
             WorkTypeInfo: The parsed response data.
         """
-        return self._parse_one(WorkTypeInfo, super()._make_request("GET", data=data, params=params).json())
+        return self._parse_one(WorkTypeInfo, super()._make_request("GET", data=data, params=params).content)
@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyAddressformatsCountEndpoint import CompanyAddressformatsCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyAddressformatsIdEndpoint import CompanyAddressformatsIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyAddressformatsInfoEndpoint import CompanyAddressformatsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AddressFormat
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyAddressformatsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AddressFormat], ConnectWiseManageRequestParams],
+    IAsyncPostable[AddressFormat, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AddressFormat, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "addressFormats", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AddressFormat])
+        IAsyncPostable.__init__(self, AddressFormat)
+        IAsyncPaginateable.__init__(self, AddressFormat)
+
+    def id(self, _id: int) -> CompanyAddressformatsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyAddressformatsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyAddressformatsIdEndpoint: The initialized CompanyAddressformatsIdEndpoint object.
+        """
+        child = CompanyAddressformatsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AddressFormat]:
+        """
+        Performs a GET request against the /company/addressFormats endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AddressFormat]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AddressFormat, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AddressFormat]:
+        """
+        Performs a GET request against the /company/addressFormats endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AddressFormat]: The parsed response data.
+        """
+        return self._parse_many(AddressFormat, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AddressFormat:
+        """
+        Performs a POST request against the /company/addressFormats endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AddressFormat: The parsed response data.
+        """
+        return self._parse_one(AddressFormat, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyAddressformatsCountEndpoint:
+        """
+        The CompanyAddressformatsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyAddressformatsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyAddressformatsInfoEndpoint:
+        """
+        The CompanyAddressformatsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyAddressformatsInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,59 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import AddressFormatInfo
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyAddressformatsIdInfoEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[AddressFormatInfo, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AddressFormatInfo, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "info", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, AddressFormatInfo)
+        IAsyncPaginateable.__init__(self, AddressFormatInfo)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AddressFormatInfo]:
+        """
+        Performs a GET request against the /company/addressFormats/{id}/info endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AddressFormatInfo]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AddressFormatInfo, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AddressFormatInfo:
+        """
+        Performs a GET request against the /company/addressFormats/{id}/info endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AddressFormatInfo: The parsed response data.
+        """
+        return self._parse_one(
+            AddressFormatInfo, (await super()._make_request("GET", data=data, params=params)).content
+        )
@@ -0,0 +1,22 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyBillingsetupsInfoCountEndpoint import (
+    CompanyBillingsetupsInfoCountEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyBillingsetupsInfoEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "info", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def count(self) -> CompanyBillingsetupsInfoCountEndpoint:
+        """
+        The CompanyBillingsetupsInfoCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyBillingsetupsInfoCountEndpoint(self.client, parent_endpoint=self))
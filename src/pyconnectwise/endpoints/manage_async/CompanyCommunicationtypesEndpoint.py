@@ -0,0 +1,112 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCommunicationtypesCountEndpoint import (
+    CompanyCommunicationtypesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCommunicationtypesIdEndpoint import CompanyCommunicationtypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCommunicationtypesInfoEndpoint import (
+    CompanyCommunicationtypesInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CommunicationType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCommunicationtypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CommunicationType], ConnectWiseManageRequestParams],
+    IAsyncPostable[CommunicationType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CommunicationType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "communicationTypes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CommunicationType])
+        IAsyncPostable.__init__(self, CommunicationType)
+        IAsyncPaginateable.__init__(self, CommunicationType)
+
+    def id(self, _id: int) -> CompanyCommunicationtypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCommunicationtypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCommunicationtypesIdEndpoint: The initialized CompanyCommunicationtypesIdEndpoint object.
+        """
+        child = CompanyCommunicationtypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CommunicationType]:
+        """
+        Performs a GET request against the /company/communicationTypes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CommunicationType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CommunicationType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CommunicationType]:
+        """
+        Performs a GET request against the /company/communicationTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CommunicationType]: The parsed response data.
+        """
+        return self._parse_many(
+            CommunicationType, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CommunicationType:
+        """
+        Performs a POST request against the /company/communicationTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CommunicationType: The parsed response data.
+        """
+        return self._parse_one(
+            CommunicationType, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyCommunicationtypesCountEndpoint:
+        """
+        The CompanyCommunicationtypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCommunicationtypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyCommunicationtypesInfoEndpoint:
+        """
+        The CompanyCommunicationtypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCommunicationtypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,128 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCommunicationtypesIdInfoEndpoint import (
+    CompanyCommunicationtypesIdInfoEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCommunicationtypesIdUsagesEndpoint import (
+    CompanyCommunicationtypesIdUsagesEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import CommunicationType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCommunicationtypesIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[CommunicationType, ConnectWiseManageRequestParams],
+    IAsyncPatchable[CommunicationType, ConnectWiseManageRequestParams],
+    IAsyncPuttable[CommunicationType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CommunicationType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, CommunicationType)
+        IAsyncPatchable.__init__(self, CommunicationType)
+        IAsyncPuttable.__init__(self, CommunicationType)
+        IAsyncPaginateable.__init__(self, CommunicationType)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CommunicationType]:
+        """
+        Performs a GET request against the /company/communicationTypes/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CommunicationType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CommunicationType, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /company/communicationTypes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CommunicationType:
+        """
+        Performs a GET request against the /company/communicationTypes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CommunicationType: The parsed response data.
+        """
+        return self._parse_one(
+            CommunicationType, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> CommunicationType:
+        """
+        Performs a PATCH request against the /company/communicationTypes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CommunicationType: The parsed response data.
+        """
+        return self._parse_one(
+            CommunicationType, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CommunicationType:
+        """
+        Performs a PUT request against the /company/communicationTypes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CommunicationType: The parsed response data.
+        """
+        return self._parse_one(
+            CommunicationType, (await super()._make_request("PUT", data=data, params=params)).content
+        )
+
+    @cached_property
+    def info(self) -> CompanyCommunicationtypesIdInfoEndpoint:
+        """
+        The CompanyCommunicationtypesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCommunicationtypesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> CompanyCommunicationtypesIdUsagesEndpoint:
+        """
+        The CompanyCommunicationtypesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCommunicationtypesIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,126 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesCountEndpoint import CompanyCompaniesCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesDefaultEndpoint import CompanyCompaniesDefaultEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdEndpoint import CompanyCompaniesIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesInfoEndpoint import CompanyCompaniesInfoEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesStatusesEndpoint import CompanyCompaniesStatusesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesTypesEndpoint import CompanyCompaniesTypesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Company
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Company], ConnectWiseManageRequestParams],
+    IAsyncPostable[Company, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Company, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "companies", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Company])
+        IAsyncPostable.__init__(self, Company)
+        IAsyncPaginateable.__init__(self, Company)
+
+    def id(self, _id: int) -> CompanyCompaniesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompaniesIdEndpoint: The initialized CompanyCompaniesIdEndpoint object.
+        """
+        child = CompanyCompaniesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Company]:
+        """
+        Performs a GET request against the /company/companies endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Company]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Company, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Company]:
+        """
+        Performs a GET request against the /company/companies endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Company]: The parsed response data.
+        """
+        return self._parse_many(Company, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Company:
+        """
+        Performs a POST request against the /company/companies endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Company: The parsed response data.
+        """
+        return self._parse_one(Company, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesCountEndpoint:
+        """
+        The CompanyCompaniesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def default(self) -> CompanyCompaniesDefaultEndpoint:
+        """
+        The CompanyCompaniesDefaultEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesDefaultEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyCompaniesInfoEndpoint:
+        """
+        The CompanyCompaniesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> CompanyCompaniesStatusesEndpoint:
+        """
+        The CompanyCompaniesStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> CompanyCompaniesTypesEndpoint:
+        """
+        The CompanyCompaniesTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesTypesEndpoint(self.client, parent_endpoint=self))
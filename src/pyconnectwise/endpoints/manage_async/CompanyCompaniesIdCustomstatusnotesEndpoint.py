@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdCustomstatusnotesCountEndpoint import (
+    CompanyCompaniesIdCustomstatusnotesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdCustomstatusnotesIdEndpoint import (
+    CompanyCompaniesIdCustomstatusnotesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanyCustomNote
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesIdCustomstatusnotesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanyCustomNote], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanyCustomNote, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyCustomNote, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "customStatusNotes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanyCustomNote])
+        IAsyncPostable.__init__(self, CompanyCustomNote)
+        IAsyncPaginateable.__init__(self, CompanyCustomNote)
+
+    def id(self, _id: int) -> CompanyCompaniesIdCustomstatusnotesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdCustomstatusnotesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompaniesIdCustomstatusnotesIdEndpoint: The initialized CompanyCompaniesIdCustomstatusnotesIdEndpoint object.
+        """
+        child = CompanyCompaniesIdCustomstatusnotesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyCustomNote]:
+        """
+        Performs a GET request against the /company/companies/{id}/customStatusNotes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyCustomNote]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CompanyCustomNote, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanyCustomNote]:
+        """
+        Performs a GET request against the /company/companies/{id}/customStatusNotes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyCustomNote]: The parsed response data.
+        """
+        return self._parse_many(
+            CompanyCustomNote, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CompanyCustomNote:
+        """
+        Performs a POST request against the /company/companies/{id}/customStatusNotes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyCustomNote: The parsed response data.
+        """
+        return self._parse_one(
+            CompanyCustomNote, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdCustomstatusnotesCountEndpoint:
+        """
+        The CompanyCompaniesIdCustomstatusnotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdCustomstatusnotesCountEndpoint(self.client, parent_endpoint=self)
+        )
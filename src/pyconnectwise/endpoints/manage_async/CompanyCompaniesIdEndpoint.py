@@ -0,0 +1,218 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdCustomstatusnotesEndpoint import (
+    CompanyCompaniesIdCustomstatusnotesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdGroupsEndpoint import CompanyCompaniesIdGroupsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdManagementreportnotificationsEndpoint import (
+    CompanyCompaniesIdManagementreportnotificationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdManagementreportsetupEndpoint import (
+    CompanyCompaniesIdManagementreportsetupEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdManagementsummaryreportsEndpoint import (
+    CompanyCompaniesIdManagementsummaryreportsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdMergeEndpoint import CompanyCompaniesIdMergeEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdNotesEndpoint import CompanyCompaniesIdNotesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdSitesEndpoint import CompanyCompaniesIdSitesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdSurveysEndpoint import CompanyCompaniesIdSurveysEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdTeamsEndpoint import CompanyCompaniesIdTeamsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdTracksEndpoint import CompanyCompaniesIdTracksEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdTypeassociationsEndpoint import (
+    CompanyCompaniesIdTypeassociationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdUsagesEndpoint import CompanyCompaniesIdUsagesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Company
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Company, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Company, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Company, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Company, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Company)
+        IAsyncPatchable.__init__(self, Company)
+        IAsyncPuttable.__init__(self, Company)
+        IAsyncPaginateable.__init__(self, Company)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Company]:
+        """
+        Performs a GET request against the /company/companies/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Company]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Company, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /company/companies/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Company:
+        """
+        Performs a GET request against the /company/companies/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Company: The parsed response data.
+        """
+        return self._parse_one(Company, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Company:
+        """
+        Performs a PATCH request against the /company/companies/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Company: The parsed response data.
+        """
+        return self._parse_one(Company, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Company:
+        """
+        Performs a PUT request against the /company/companies/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Company: The parsed response data.
+        """
+        return self._parse_one(Company, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def custom_status_notes(self) -> CompanyCompaniesIdCustomstatusnotesEndpoint:
+        """
+        The CompanyCompaniesIdCustomstatusnotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdCustomstatusnotesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def groups(self) -> CompanyCompaniesIdGroupsEndpoint:
+        """
+        The CompanyCompaniesIdGroupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdGroupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def management_report_notifications(self) -> CompanyCompaniesIdManagementreportnotificationsEndpoint:
+        """
+        The CompanyCompaniesIdManagementreportnotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdManagementreportnotificationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def management_report_setup(self) -> CompanyCompaniesIdManagementreportsetupEndpoint:
+        """
+        The CompanyCompaniesIdManagementreportsetupEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdManagementreportsetupEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def management_summary_reports(self) -> CompanyCompaniesIdManagementsummaryreportsEndpoint:
+        """
+        The CompanyCompaniesIdManagementsummaryreportsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdManagementsummaryreportsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def merge(self) -> CompanyCompaniesIdMergeEndpoint:
+        """
+        The CompanyCompaniesIdMergeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdMergeEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notes(self) -> CompanyCompaniesIdNotesEndpoint:
+        """
+        The CompanyCompaniesIdNotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdNotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sites(self) -> CompanyCompaniesIdSitesEndpoint:
+        """
+        The CompanyCompaniesIdSitesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdSitesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def surveys(self) -> CompanyCompaniesIdSurveysEndpoint:
+        """
+        The CompanyCompaniesIdSurveysEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdSurveysEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def teams(self) -> CompanyCompaniesIdTeamsEndpoint:
+        """
+        The CompanyCompaniesIdTeamsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdTeamsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tracks(self) -> CompanyCompaniesIdTracksEndpoint:
+        """
+        The CompanyCompaniesIdTracksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdTracksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def type_associations(self) -> CompanyCompaniesIdTypeassociationsEndpoint:
+        """
+        The CompanyCompaniesIdTypeassociationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdTypeassociationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> CompanyCompaniesIdUsagesEndpoint:
+        """
+        The CompanyCompaniesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdGroupsCountEndpoint import (
+    CompanyCompaniesIdGroupsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdGroupsIdEndpoint import CompanyCompaniesIdGroupsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanyGroup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesIdGroupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanyGroup], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanyGroup, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyGroup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "groups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanyGroup])
+        IAsyncPostable.__init__(self, CompanyGroup)
+        IAsyncPaginateable.__init__(self, CompanyGroup)
+
+    def id(self, _id: int) -> CompanyCompaniesIdGroupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdGroupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompaniesIdGroupsIdEndpoint: The initialized CompanyCompaniesIdGroupsIdEndpoint object.
+        """
+        child = CompanyCompaniesIdGroupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyGroup]:
+        """
+        Performs a GET request against the /company/companies/{id}/groups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyGroup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CompanyGroup, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanyGroup]:
+        """
+        Performs a GET request against the /company/companies/{id}/groups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyGroup]: The parsed response data.
+        """
+        return self._parse_many(CompanyGroup, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CompanyGroup:
+        """
+        Performs a POST request against the /company/companies/{id}/groups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyGroup: The parsed response data.
+        """
+        return self._parse_one(CompanyGroup, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdGroupsCountEndpoint:
+        """
+        The CompanyCompaniesIdGroupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdGroupsCountEndpoint(self.client, parent_endpoint=self))
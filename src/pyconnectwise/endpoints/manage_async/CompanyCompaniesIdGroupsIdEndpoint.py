@@ -0,0 +1,93 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import CompanyGroup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesIdGroupsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[CompanyGroup, ConnectWiseManageRequestParams],
+    IAsyncPatchable[CompanyGroup, ConnectWiseManageRequestParams],
+    IAsyncPuttable[CompanyGroup, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyGroup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, CompanyGroup)
+        IAsyncPatchable.__init__(self, CompanyGroup)
+        IAsyncPuttable.__init__(self, CompanyGroup)
+        IAsyncPaginateable.__init__(self, CompanyGroup)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyGroup]:
+        """
+        Performs a GET request against the /company/companies/{id}/groups/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyGroup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CompanyGroup, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /company/companies/{id}/groups/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanyGroup:
+        """
+        Performs a GET request against the /company/companies/{id}/groups/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyGroup: The parsed response data.
+        """
+        return self._parse_one(CompanyGroup, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> CompanyGroup:
+        """
+        Performs a PATCH request against the /company/companies/{id}/groups/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyGroup: The parsed response data.
+        """
+        return self._parse_one(CompanyGroup, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanyGroup:
+        """
+        Performs a PUT request against the /company/companies/{id}/groups/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyGroup: The parsed response data.
+        """
+        return self._parse_one(CompanyGroup, (await super()._make_request("PUT", data=data, params=params)).content)
@@ -0,0 +1,93 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdManagementreportsetupIdEndpoint import (
+    CompanyCompaniesIdManagementreportsetupIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ManagementReportSetup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesIdManagementreportsetupEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ManagementReportSetup], ConnectWiseManageRequestParams],
+    IAsyncPostable[ManagementReportSetup, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ManagementReportSetup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "managementReportSetup", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ManagementReportSetup])
+        IAsyncPostable.__init__(self, ManagementReportSetup)
+        IAsyncPaginateable.__init__(self, ManagementReportSetup)
+
+    def id(self, _id: int) -> CompanyCompaniesIdManagementreportsetupIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdManagementreportsetupIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompaniesIdManagementreportsetupIdEndpoint: The initialized CompanyCompaniesIdManagementreportsetupIdEndpoint object.
+        """
+        child = CompanyCompaniesIdManagementreportsetupIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ManagementReportSetup]:
+        """
+        Performs a GET request against the /company/companies/{id}/managementReportSetup endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ManagementReportSetup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ManagementReportSetup, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ManagementReportSetup]:
+        """
+        Performs a GET request against the /company/companies/{id}/managementReportSetup endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ManagementReportSetup]: The parsed response data.
+        """
+        return self._parse_many(
+            ManagementReportSetup, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagementReportSetup:
+        """
+        Performs a POST request against the /company/companies/{id}/managementReportSetup endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagementReportSetup: The parsed response data.
+        """
+        return self._parse_one(
+            ManagementReportSetup, (await super()._make_request("POST", data=data, params=params)).content
+        )
@@ -0,0 +1,52 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import ManagementReportSetup
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesIdManagementreportsetupIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncPatchable[ManagementReportSetup, ConnectWiseManageRequestParams],
+    IAsyncPuttable[ManagementReportSetup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncPatchable.__init__(self, ManagementReportSetup)
+        IAsyncPuttable.__init__(self, ManagementReportSetup)
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagementReportSetup:
+        """
+        Performs a PATCH request against the /company/companies/{id}/managementReportSetup/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagementReportSetup: The parsed response data.
+        """
+        return self._parse_one(
+            ManagementReportSetup, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagementReportSetup:
+        """
+        Performs a PUT request against the /company/companies/{id}/managementReportSetup/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagementReportSetup: The parsed response data.
+        """
+        return self._parse_one(
+            ManagementReportSetup, (await super()._make_request("PUT", data=data, params=params)).content
+        )
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdManagementsummaryreportsCountEndpoint import (
+    CompanyCompaniesIdManagementsummaryreportsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdManagementsummaryreportsIdEndpoint import (
+    CompanyCompaniesIdManagementsummaryreportsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanyManagementSummary
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesIdManagementsummaryreportsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanyManagementSummary], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanyManagementSummary, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyManagementSummary, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "managementSummaryReports", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanyManagementSummary])
+        IAsyncPostable.__init__(self, CompanyManagementSummary)
+        IAsyncPaginateable.__init__(self, CompanyManagementSummary)
+
+    def id(self, _id: int) -> CompanyCompaniesIdManagementsummaryreportsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdManagementsummaryreportsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompaniesIdManagementsummaryreportsIdEndpoint: The initialized CompanyCompaniesIdManagementsummaryreportsIdEndpoint object.
+        """
+        child = CompanyCompaniesIdManagementsummaryreportsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyManagementSummary]:
+        """
+        Performs a GET request against the /company/companies/{id}/managementSummaryReports endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyManagementSummary]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CompanyManagementSummary, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanyManagementSummary]:
+        """
+        Performs a GET request against the /company/companies/{id}/managementSummaryReports endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyManagementSummary]: The parsed response data.
+        """
+        return self._parse_many(
+            CompanyManagementSummary, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CompanyManagementSummary:
+        """
+        Performs a POST request against the /company/companies/{id}/managementSummaryReports endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyManagementSummary: The parsed response data.
+        """
+        return self._parse_one(
+            CompanyManagementSummary, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdManagementsummaryreportsCountEndpoint:
+        """
+        The CompanyCompaniesIdManagementsummaryreportsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdManagementsummaryreportsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdSitesCountEndpoint import (
+    CompanyCompaniesIdSitesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdSitesIdEndpoint import CompanyCompaniesIdSitesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanySite
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesIdSitesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanySite], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanySite, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanySite, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "sites", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanySite])
+        IAsyncPostable.__init__(self, CompanySite)
+        IAsyncPaginateable.__init__(self, CompanySite)
+
+    def id(self, _id: int) -> CompanyCompaniesIdSitesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdSitesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompaniesIdSitesIdEndpoint: The initialized CompanyCompaniesIdSitesIdEndpoint object.
+        """
+        child = CompanyCompaniesIdSitesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanySite]:
+        """
+        Performs a GET request against the /company/companies/{id}/sites endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanySite]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CompanySite, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanySite]:
+        """
+        Performs a GET request against the /company/companies/{id}/sites endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanySite]: The parsed response data.
+        """
+        return self._parse_many(CompanySite, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanySite:
+        """
+        Performs a POST request against the /company/companies/{id}/sites endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanySite: The parsed response data.
+        """
+        return self._parse_one(CompanySite, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdSitesCountEndpoint:
+        """
+        The CompanyCompaniesIdSitesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdSitesCountEndpoint(self.client, parent_endpoint=self))
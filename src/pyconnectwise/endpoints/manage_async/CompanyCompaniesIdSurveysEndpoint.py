@@ -0,0 +1,22 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdSurveysCountEndpoint import (
+    CompanyCompaniesIdSurveysCountEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesIdSurveysEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "surveys", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdSurveysCountEndpoint:
+        """
+        The CompanyCompaniesIdSurveysCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdSurveysCountEndpoint(self.client, parent_endpoint=self))
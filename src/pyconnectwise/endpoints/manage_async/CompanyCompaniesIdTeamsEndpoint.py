@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdTeamsCountEndpoint import (
+    CompanyCompaniesIdTeamsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdTeamsIdEndpoint import CompanyCompaniesIdTeamsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanyTeam
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesIdTeamsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanyTeam], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanyTeam, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyTeam, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "teams", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanyTeam])
+        IAsyncPostable.__init__(self, CompanyTeam)
+        IAsyncPaginateable.__init__(self, CompanyTeam)
+
+    def id(self, _id: int) -> CompanyCompaniesIdTeamsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdTeamsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompaniesIdTeamsIdEndpoint: The initialized CompanyCompaniesIdTeamsIdEndpoint object.
+        """
+        child = CompanyCompaniesIdTeamsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyTeam]:
+        """
+        Performs a GET request against the /company/companies/{id}/teams endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyTeam]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CompanyTeam, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanyTeam]:
+        """
+        Performs a GET request against the /company/companies/{id}/teams endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyTeam]: The parsed response data.
+        """
+        return self._parse_many(CompanyTeam, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanyTeam:
+        """
+        Performs a POST request against the /company/companies/{id}/teams endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyTeam: The parsed response data.
+        """
+        return self._parse_one(CompanyTeam, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdTeamsCountEndpoint:
+        """
+        The CompanyCompaniesIdTeamsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdTeamsCountEndpoint(self.client, parent_endpoint=self))
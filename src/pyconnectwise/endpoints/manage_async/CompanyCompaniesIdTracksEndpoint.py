@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdTracksCountEndpoint import (
+    CompanyCompaniesIdTracksCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdTracksIdEndpoint import CompanyCompaniesIdTracksIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ContactTrack
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesIdTracksEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ContactTrack], ConnectWiseManageRequestParams],
+    IAsyncPostable[ContactTrack, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ContactTrack, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "tracks", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ContactTrack])
+        IAsyncPostable.__init__(self, ContactTrack)
+        IAsyncPaginateable.__init__(self, ContactTrack)
+
+    def id(self, _id: int) -> CompanyCompaniesIdTracksIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdTracksIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompaniesIdTracksIdEndpoint: The initialized CompanyCompaniesIdTracksIdEndpoint object.
+        """
+        child = CompanyCompaniesIdTracksIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ContactTrack]:
+        """
+        Performs a GET request against the /company/companies/{id}/tracks endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ContactTrack]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ContactTrack, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ContactTrack]:
+        """
+        Performs a GET request against the /company/companies/{id}/tracks endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ContactTrack]: The parsed response data.
+        """
+        return self._parse_many(ContactTrack, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ContactTrack:
+        """
+        Performs a POST request against the /company/companies/{id}/tracks endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ContactTrack: The parsed response data.
+        """
+        return self._parse_one(ContactTrack, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdTracksCountEndpoint:
+        """
+        The CompanyCompaniesIdTracksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesIdTracksCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,113 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdTypeassociationsCountEndpoint import (
+    CompanyCompaniesIdTypeassociationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesIdTypeassociationsIdEndpoint import (
+    CompanyCompaniesIdTypeassociationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanyCompanyTypeAssociationCompanyTypeAssociation
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesIdTypeassociationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanyCompanyTypeAssociationCompanyTypeAssociation], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanyCompanyTypeAssociationCompanyTypeAssociation, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyCompanyTypeAssociationCompanyTypeAssociation, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "typeAssociations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanyCompanyTypeAssociationCompanyTypeAssociation])
+        IAsyncPostable.__init__(self, CompanyCompanyTypeAssociationCompanyTypeAssociation)
+        IAsyncPaginateable.__init__(self, CompanyCompanyTypeAssociationCompanyTypeAssociation)
+
+    def id(self, _id: int) -> CompanyCompaniesIdTypeassociationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompaniesIdTypeassociationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompaniesIdTypeassociationsIdEndpoint: The initialized CompanyCompaniesIdTypeassociationsIdEndpoint object.
+        """
+        child = CompanyCompaniesIdTypeassociationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyCompanyTypeAssociationCompanyTypeAssociation]:
+        """
+        Performs a GET request against the /company/companies/{id}/typeAssociations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyCompanyTypeAssociationCompanyTypeAssociation]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            CompanyCompanyTypeAssociationCompanyTypeAssociation,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanyCompanyTypeAssociationCompanyTypeAssociation]:
+        """
+        Performs a GET request against the /company/companies/{id}/typeAssociations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyCompanyTypeAssociationCompanyTypeAssociation]: The parsed response data.
+        """
+        return self._parse_many(
+            CompanyCompanyTypeAssociationCompanyTypeAssociation,
+            (await super()._make_request("GET", data=data, params=params)).content,
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CompanyCompanyTypeAssociationCompanyTypeAssociation:
+        """
+        Performs a POST request against the /company/companies/{id}/typeAssociations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyCompanyTypeAssociationCompanyTypeAssociation: The parsed response data.
+        """
+        return self._parse_one(
+            CompanyCompanyTypeAssociationCompanyTypeAssociation,
+            (await super()._make_request("POST", data=data, params=params)).content,
+        )
+
+    @cached_property
+    def count(self) -> CompanyCompaniesIdTypeassociationsCountEndpoint:
+        """
+        The CompanyCompaniesIdTypeassociationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompaniesIdTypeassociationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesStatusesCountEndpoint import (
+    CompanyCompaniesStatusesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesStatusesIdEndpoint import CompanyCompaniesStatusesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanyStatus
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesStatusesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanyStatus], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanyStatus, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyStatus, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "statuses", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanyStatus])
+        IAsyncPostable.__init__(self, CompanyStatus)
+        IAsyncPaginateable.__init__(self, CompanyStatus)
+
+    def id(self, _id: int) -> CompanyCompaniesStatusesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompaniesStatusesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompaniesStatusesIdEndpoint: The initialized CompanyCompaniesStatusesIdEndpoint object.
+        """
+        child = CompanyCompaniesStatusesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyStatus]:
+        """
+        Performs a GET request against the /company/companies/statuses endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyStatus]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CompanyStatus, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanyStatus]:
+        """
+        Performs a GET request against the /company/companies/statuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyStatus]: The parsed response data.
+        """
+        return self._parse_many(CompanyStatus, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CompanyStatus:
+        """
+        Performs a POST request against the /company/companies/statuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyStatus: The parsed response data.
+        """
+        return self._parse_one(CompanyStatus, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesStatusesCountEndpoint:
+        """
+        The CompanyCompaniesStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesStatusesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesTypesCountEndpoint import CompanyCompaniesTypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesTypesIdEndpoint import CompanyCompaniesTypesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanyType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompaniesTypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanyType], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanyType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "types", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanyType])
+        IAsyncPostable.__init__(self, CompanyType)
+        IAsyncPaginateable.__init__(self, CompanyType)
+
+    def id(self, _id: int) -> CompanyCompaniesTypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompaniesTypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompaniesTypesIdEndpoint: The initialized CompanyCompaniesTypesIdEndpoint object.
+        """
+        child = CompanyCompaniesTypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyType]:
+        """
+        Performs a GET request against the /company/companies/types endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CompanyType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanyType]:
+        """
+        Performs a GET request against the /company/companies/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyType]: The parsed response data.
+        """
+        return self._parse_many(CompanyType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CompanyType:
+        """
+        Performs a POST request against the /company/companies/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyType: The parsed response data.
+        """
+        return self._parse_one(CompanyType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyCompaniesTypesCountEndpoint:
+        """
+        The CompanyCompaniesTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesTypesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,31 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPuttable
+from pyconnectwise.models.manage import CompanyFinance
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompanyfinanceIdEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPuttable[CompanyFinance, ConnectWiseManageRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncPuttable.__init__(self, CompanyFinance)
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CompanyFinance:
+        """
+        Performs a PUT request against the /company/companyFinance/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyFinance: The parsed response data.
+        """
+        return self._parse_one(CompanyFinance, (await super()._make_request("PUT", data=data, params=params)).content)
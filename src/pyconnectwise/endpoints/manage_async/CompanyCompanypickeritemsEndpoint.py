@@ -0,0 +1,112 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompanypickeritemsClearEndpoint import (
+    CompanyCompanypickeritemsClearEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompanypickeritemsCountEndpoint import (
+    CompanyCompanypickeritemsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompanypickeritemsIdEndpoint import CompanyCompanypickeritemsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanyPickerItem
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompanypickeritemsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanyPickerItem], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanyPickerItem, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyPickerItem, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "companyPickerItems", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanyPickerItem])
+        IAsyncPostable.__init__(self, CompanyPickerItem)
+        IAsyncPaginateable.__init__(self, CompanyPickerItem)
+
+    def id(self, _id: int) -> CompanyCompanypickeritemsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompanypickeritemsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompanypickeritemsIdEndpoint: The initialized CompanyCompanypickeritemsIdEndpoint object.
+        """
+        child = CompanyCompanypickeritemsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyPickerItem]:
+        """
+        Performs a GET request against the /company/companyPickerItems endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyPickerItem]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CompanyPickerItem, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanyPickerItem]:
+        """
+        Performs a GET request against the /company/companyPickerItems endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyPickerItem]: The parsed response data.
+        """
+        return self._parse_many(
+            CompanyPickerItem, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CompanyPickerItem:
+        """
+        Performs a POST request against the /company/companyPickerItems endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyPickerItem: The parsed response data.
+        """
+        return self._parse_one(
+            CompanyPickerItem, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def clear(self) -> CompanyCompanypickeritemsClearEndpoint:
+        """
+        The CompanyCompanypickeritemsClearEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompanypickeritemsClearEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def count(self) -> CompanyCompanypickeritemsCountEndpoint:
+        """
+        The CompanyCompanypickeritemsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompanypickeritemsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,111 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompanytypeassociationsCountEndpoint import (
+    CompanyCompanytypeassociationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCompanytypeassociationsIdEndpoint import (
+    CompanyCompanytypeassociationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanyCompanyTypeAssociation
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCompanytypeassociationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanyCompanyTypeAssociation], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanyCompanyTypeAssociation, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyCompanyTypeAssociation, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "companyTypeAssociations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanyCompanyTypeAssociation])
+        IAsyncPostable.__init__(self, CompanyCompanyTypeAssociation)
+        IAsyncPaginateable.__init__(self, CompanyCompanyTypeAssociation)
+
+    def id(self, _id: int) -> CompanyCompanytypeassociationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCompanytypeassociationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCompanytypeassociationsIdEndpoint: The initialized CompanyCompanytypeassociationsIdEndpoint object.
+        """
+        child = CompanyCompanytypeassociationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyCompanyTypeAssociation]:
+        """
+        Performs a GET request against the /company/companyTypeAssociations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyCompanyTypeAssociation]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            CompanyCompanyTypeAssociation,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanyCompanyTypeAssociation]:
+        """
+        Performs a GET request against the /company/companyTypeAssociations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyCompanyTypeAssociation]: The parsed response data.
+        """
+        return self._parse_many(
+            CompanyCompanyTypeAssociation, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CompanyCompanyTypeAssociation:
+        """
+        Performs a POST request against the /company/companyTypeAssociations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyCompanyTypeAssociation: The parsed response data.
+        """
+        return self._parse_one(
+            CompanyCompanyTypeAssociation, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyCompanytypeassociationsCountEndpoint:
+        """
+        The CompanyCompanytypeassociationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyCompanytypeassociationsCountEndpoint(self.client, parent_endpoint=self)
+        )
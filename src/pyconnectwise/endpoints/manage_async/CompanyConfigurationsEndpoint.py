@@ -0,0 +1,126 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsBulkEndpoint import CompanyConfigurationsBulkEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsCountEndpoint import CompanyConfigurationsCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsIdEndpoint import CompanyConfigurationsIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsStatusesEndpoint import (
+    CompanyConfigurationsStatusesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsTypesEndpoint import CompanyConfigurationsTypesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanyConfiguration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyConfigurationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanyConfiguration], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanyConfiguration, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyConfiguration, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "configurations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanyConfiguration])
+        IAsyncPostable.__init__(self, CompanyConfiguration)
+        IAsyncPaginateable.__init__(self, CompanyConfiguration)
+
+    def id(self, _id: int) -> CompanyConfigurationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyConfigurationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyConfigurationsIdEndpoint: The initialized CompanyConfigurationsIdEndpoint object.
+        """
+        child = CompanyConfigurationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyConfiguration]:
+        """
+        Performs a GET request against the /company/configurations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyConfiguration]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CompanyConfiguration, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanyConfiguration]:
+        """
+        Performs a GET request against the /company/configurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyConfiguration]: The parsed response data.
+        """
+        return self._parse_many(
+            CompanyConfiguration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CompanyConfiguration:
+        """
+        Performs a POST request against the /company/configurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            CompanyConfiguration, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def bulk(self) -> CompanyConfigurationsBulkEndpoint:
+        """
+        The CompanyConfigurationsBulkEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyConfigurationsBulkEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def count(self) -> CompanyConfigurationsCountEndpoint:
+        """
+        The CompanyConfigurationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyConfigurationsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> CompanyConfigurationsStatusesEndpoint:
+        """
+        The CompanyConfigurationsStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyConfigurationsStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> CompanyConfigurationsTypesEndpoint:
+        """
+        The CompanyConfigurationsTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyConfigurationsTypesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPatchable
+from pyconnectwise.models.manage import CompanyConfiguration
+from pyconnectwise.types import ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyConfigurationsIdChangetypeEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPatchable[CompanyConfiguration, ConnectWiseManageRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "changeType", parent_endpoint=parent_endpoint)
+        IAsyncPatchable.__init__(self, CompanyConfiguration)
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> CompanyConfiguration:
+        """
+        Performs a PATCH request against the /company/configurations/{id}/changeType endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            CompanyConfiguration, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
@@ -0,0 +1,118 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsStatusesCountEndpoint import (
+    CompanyConfigurationsStatusesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsStatusesIdEndpoint import (
+    CompanyConfigurationsStatusesIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsStatusesInfoEndpoint import (
+    CompanyConfigurationsStatusesInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ConfigurationStatus
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyConfigurationsStatusesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ConfigurationStatus], ConnectWiseManageRequestParams],
+    IAsyncPostable[ConfigurationStatus, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ConfigurationStatus, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "statuses", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ConfigurationStatus])
+        IAsyncPostable.__init__(self, ConfigurationStatus)
+        IAsyncPaginateable.__init__(self, ConfigurationStatus)
+
+    def id(self, _id: int) -> CompanyConfigurationsStatusesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyConfigurationsStatusesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyConfigurationsStatusesIdEndpoint: The initialized CompanyConfigurationsStatusesIdEndpoint object.
+        """
+        child = CompanyConfigurationsStatusesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ConfigurationStatus]:
+        """
+        Performs a GET request against the /company/configurations/statuses endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ConfigurationStatus]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ConfigurationStatus, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ConfigurationStatus]:
+        """
+        Performs a GET request against the /company/configurations/statuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ConfigurationStatus]: The parsed response data.
+        """
+        return self._parse_many(
+            ConfigurationStatus, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ConfigurationStatus:
+        """
+        Performs a POST request against the /company/configurations/statuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ConfigurationStatus: The parsed response data.
+        """
+        return self._parse_one(
+            ConfigurationStatus, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyConfigurationsStatusesCountEndpoint:
+        """
+        The CompanyConfigurationsStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsStatusesCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> CompanyConfigurationsStatusesInfoEndpoint:
+        """
+        The CompanyConfigurationsStatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsStatusesInfoEndpoint(self.client, parent_endpoint=self)
+        )
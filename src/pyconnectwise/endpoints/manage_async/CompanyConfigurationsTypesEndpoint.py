@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsTypesCountEndpoint import (
+    CompanyConfigurationsTypesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsTypesIdEndpoint import (
+    CompanyConfigurationsTypesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ConfigurationType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyConfigurationsTypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ConfigurationType], ConnectWiseManageRequestParams],
+    IAsyncPostable[ConfigurationType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ConfigurationType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "types", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ConfigurationType])
+        IAsyncPostable.__init__(self, ConfigurationType)
+        IAsyncPaginateable.__init__(self, ConfigurationType)
+
+    def id(self, _id: int) -> CompanyConfigurationsTypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyConfigurationsTypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyConfigurationsTypesIdEndpoint: The initialized CompanyConfigurationsTypesIdEndpoint object.
+        """
+        child = CompanyConfigurationsTypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ConfigurationType]:
+        """
+        Performs a GET request against the /company/configurations/types endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ConfigurationType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ConfigurationType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ConfigurationType]:
+        """
+        Performs a GET request against the /company/configurations/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ConfigurationType]: The parsed response data.
+        """
+        return self._parse_many(
+            ConfigurationType, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ConfigurationType:
+        """
+        Performs a POST request against the /company/configurations/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ConfigurationType: The parsed response data.
+        """
+        return self._parse_one(
+            ConfigurationType, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyConfigurationsTypesCountEndpoint:
+        """
+        The CompanyConfigurationsTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyConfigurationsTypesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsTypesIdQuestionsCountEndpoint import (
+    CompanyConfigurationsTypesIdQuestionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsTypesIdQuestionsIdEndpoint import (
+    CompanyConfigurationsTypesIdQuestionsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ConfigurationTypeQuestion
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyConfigurationsTypesIdQuestionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ConfigurationTypeQuestion], ConnectWiseManageRequestParams],
+    IAsyncPostable[ConfigurationTypeQuestion, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ConfigurationTypeQuestion, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "questions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ConfigurationTypeQuestion])
+        IAsyncPostable.__init__(self, ConfigurationTypeQuestion)
+        IAsyncPaginateable.__init__(self, ConfigurationTypeQuestion)
+
+    def id(self, _id: int) -> CompanyConfigurationsTypesIdQuestionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyConfigurationsTypesIdQuestionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyConfigurationsTypesIdQuestionsIdEndpoint: The initialized CompanyConfigurationsTypesIdQuestionsIdEndpoint object.
+        """
+        child = CompanyConfigurationsTypesIdQuestionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ConfigurationTypeQuestion]:
+        """
+        Performs a GET request against the /company/configurations/types/{id}/questions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ConfigurationTypeQuestion]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ConfigurationTypeQuestion, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ConfigurationTypeQuestion]:
+        """
+        Performs a GET request against the /company/configurations/types/{id}/questions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ConfigurationTypeQuestion]: The parsed response data.
+        """
+        return self._parse_many(
+            ConfigurationTypeQuestion, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ConfigurationTypeQuestion:
+        """
+        Performs a POST request against the /company/configurations/types/{id}/questions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ConfigurationTypeQuestion: The parsed response data.
+        """
+        return self._parse_one(
+            ConfigurationTypeQuestion, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyConfigurationsTypesIdQuestionsCountEndpoint:
+        """
+        The CompanyConfigurationsTypesIdQuestionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsTypesIdQuestionsCountEndpoint(self.client, parent_endpoint=self)
+        )
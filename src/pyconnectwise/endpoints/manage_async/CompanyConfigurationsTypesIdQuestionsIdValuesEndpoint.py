@@ -0,0 +1,111 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint import (
+    CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint import (
+    CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ConfigurationTypeQuestionValue
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyConfigurationsTypesIdQuestionsIdValuesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ConfigurationTypeQuestionValue], ConnectWiseManageRequestParams],
+    IAsyncPostable[ConfigurationTypeQuestionValue, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ConfigurationTypeQuestionValue, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "values", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ConfigurationTypeQuestionValue])
+        IAsyncPostable.__init__(self, ConfigurationTypeQuestionValue)
+        IAsyncPaginateable.__init__(self, ConfigurationTypeQuestionValue)
+
+    def id(self, _id: int) -> CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint: The initialized CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint object.
+        """
+        child = CompanyConfigurationsTypesIdQuestionsIdValuesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ConfigurationTypeQuestionValue]:
+        """
+        Performs a GET request against the /company/configurations/types/{id}/questions/{id}/values endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ConfigurationTypeQuestionValue]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            ConfigurationTypeQuestionValue,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ConfigurationTypeQuestionValue]:
+        """
+        Performs a GET request against the /company/configurations/types/{id}/questions/{id}/values endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ConfigurationTypeQuestionValue]: The parsed response data.
+        """
+        return self._parse_many(
+            ConfigurationTypeQuestionValue, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ConfigurationTypeQuestionValue:
+        """
+        Performs a POST request against the /company/configurations/types/{id}/questions/{id}/values endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ConfigurationTypeQuestionValue: The parsed response data.
+        """
+        return self._parse_one(
+            ConfigurationTypeQuestionValue, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint:
+        """
+        The CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyConfigurationsTypesIdQuestionsIdValuesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactTypesIdEndpoint import CompanyContactTypesIdEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactTypesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "types", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> CompanyContactTypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyContactTypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyContactTypesIdEndpoint: The initialized CompanyContactTypesIdEndpoint object.
+        """
+        child = CompanyContactTypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
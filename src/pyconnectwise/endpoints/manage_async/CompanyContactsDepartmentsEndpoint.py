@@ -0,0 +1,114 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsDepartmentsCountEndpoint import (
+    CompanyContactsDepartmentsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsDepartmentsIdEndpoint import (
+    CompanyContactsDepartmentsIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsDepartmentsInfoEndpoint import (
+    CompanyContactsDepartmentsInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ContactDepartment
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsDepartmentsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ContactDepartment], ConnectWiseManageRequestParams],
+    IAsyncPostable[ContactDepartment, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ContactDepartment, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "departments", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ContactDepartment])
+        IAsyncPostable.__init__(self, ContactDepartment)
+        IAsyncPaginateable.__init__(self, ContactDepartment)
+
+    def id(self, _id: int) -> CompanyContactsDepartmentsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyContactsDepartmentsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyContactsDepartmentsIdEndpoint: The initialized CompanyContactsDepartmentsIdEndpoint object.
+        """
+        child = CompanyContactsDepartmentsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ContactDepartment]:
+        """
+        Performs a GET request against the /company/contacts/departments endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ContactDepartment]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ContactDepartment, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ContactDepartment]:
+        """
+        Performs a GET request against the /company/contacts/departments endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ContactDepartment]: The parsed response data.
+        """
+        return self._parse_many(
+            ContactDepartment, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ContactDepartment:
+        """
+        Performs a POST request against the /company/contacts/departments endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ContactDepartment: The parsed response data.
+        """
+        return self._parse_one(
+            ContactDepartment, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyContactsDepartmentsCountEndpoint:
+        """
+        The CompanyContactsDepartmentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsDepartmentsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyContactsDepartmentsInfoEndpoint:
+        """
+        The CompanyContactsDepartmentsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsDepartmentsInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,130 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsDepartmentsIdInfoEndpoint import (
+    CompanyContactsDepartmentsIdInfoEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsDepartmentsIdUsagesEndpoint import (
+    CompanyContactsDepartmentsIdUsagesEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import ContactDepartment
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsDepartmentsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[ContactDepartment, ConnectWiseManageRequestParams],
+    IAsyncPatchable[ContactDepartment, ConnectWiseManageRequestParams],
+    IAsyncPuttable[ContactDepartment, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ContactDepartment, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, ContactDepartment)
+        IAsyncPatchable.__init__(self, ContactDepartment)
+        IAsyncPuttable.__init__(self, ContactDepartment)
+        IAsyncPaginateable.__init__(self, ContactDepartment)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ContactDepartment]:
+        """
+        Performs a GET request against the /company/contacts/departments/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ContactDepartment]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ContactDepartment, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /company/contacts/departments/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ContactDepartment:
+        """
+        Performs a GET request against the /company/contacts/departments/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ContactDepartment: The parsed response data.
+        """
+        return self._parse_one(
+            ContactDepartment, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> ContactDepartment:
+        """
+        Performs a PATCH request against the /company/contacts/departments/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ContactDepartment: The parsed response data.
+        """
+        return self._parse_one(
+            ContactDepartment, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ContactDepartment:
+        """
+        Performs a PUT request against the /company/contacts/departments/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ContactDepartment: The parsed response data.
+        """
+        return self._parse_one(
+            ContactDepartment, (await super()._make_request("PUT", data=data, params=params)).content
+        )
+
+    @cached_property
+    def info(self) -> CompanyContactsDepartmentsIdInfoEndpoint:
+        """
+        The CompanyContactsDepartmentsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContactsDepartmentsIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> CompanyContactsDepartmentsIdUsagesEndpoint:
+        """
+        The CompanyContactsDepartmentsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContactsDepartmentsIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
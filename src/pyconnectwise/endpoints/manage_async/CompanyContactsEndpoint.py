@@ -0,0 +1,150 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsCountEndpoint import CompanyContactsCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsDefaultEndpoint import CompanyContactsDefaultEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsDepartmentsEndpoint import CompanyContactsDepartmentsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdEndpoint import CompanyContactsIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsRelationshipsEndpoint import (
+    CompanyContactsRelationshipsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsRequestpasswordEndpoint import (
+    CompanyContactsRequestpasswordEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsTypesEndpoint import CompanyContactsTypesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsValidateportalcredentialsEndpoint import (
+    CompanyContactsValidateportalcredentialsEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Contact
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Contact], ConnectWiseManageRequestParams],
+    IAsyncPostable[Contact, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Contact, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "contacts", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Contact])
+        IAsyncPostable.__init__(self, Contact)
+        IAsyncPaginateable.__init__(self, Contact)
+
+    def id(self, _id: int) -> CompanyContactsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyContactsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyContactsIdEndpoint: The initialized CompanyContactsIdEndpoint object.
+        """
+        child = CompanyContactsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Contact]:
+        """
+        Performs a GET request against the /company/contacts endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Contact]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Contact, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Contact]:
+        """
+        Performs a GET request against the /company/contacts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Contact]: The parsed response data.
+        """
+        return self._parse_many(Contact, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Contact:
+        """
+        Performs a POST request against the /company/contacts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Contact: The parsed response data.
+        """
+        return self._parse_one(Contact, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyContactsCountEndpoint:
+        """
+        The CompanyContactsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def default(self) -> CompanyContactsDefaultEndpoint:
+        """
+        The CompanyContactsDefaultEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsDefaultEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def departments(self) -> CompanyContactsDepartmentsEndpoint:
+        """
+        The CompanyContactsDepartmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsDepartmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def relationships(self) -> CompanyContactsRelationshipsEndpoint:
+        """
+        The CompanyContactsRelationshipsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsRelationshipsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def request_password(self) -> CompanyContactsRequestpasswordEndpoint:
+        """
+        The CompanyContactsRequestpasswordEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsRequestpasswordEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> CompanyContactsTypesEndpoint:
+        """
+        The CompanyContactsTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsTypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def validate_portal_credentials(self) -> CompanyContactsValidateportalcredentialsEndpoint:
+        """
+        The CompanyContactsValidateportalcredentialsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContactsValidateportalcredentialsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdCommunicationsCountEndpoint import (
+    CompanyContactsIdCommunicationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdCommunicationsIdEndpoint import (
+    CompanyContactsIdCommunicationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ContactCommunication
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsIdCommunicationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ContactCommunication], ConnectWiseManageRequestParams],
+    IAsyncPostable[ContactCommunication, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ContactCommunication, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "communications", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ContactCommunication])
+        IAsyncPostable.__init__(self, ContactCommunication)
+        IAsyncPaginateable.__init__(self, ContactCommunication)
+
+    def id(self, _id: int) -> CompanyContactsIdCommunicationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyContactsIdCommunicationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyContactsIdCommunicationsIdEndpoint: The initialized CompanyContactsIdCommunicationsIdEndpoint object.
+        """
+        child = CompanyContactsIdCommunicationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ContactCommunication]:
+        """
+        Performs a GET request against the /company/contacts/{id}/communications endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ContactCommunication]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ContactCommunication, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ContactCommunication]:
+        """
+        Performs a GET request against the /company/contacts/{id}/communications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ContactCommunication]: The parsed response data.
+        """
+        return self._parse_many(
+            ContactCommunication, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ContactCommunication:
+        """
+        Performs a POST request against the /company/contacts/{id}/communications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ContactCommunication: The parsed response data.
+        """
+        return self._parse_one(
+            ContactCommunication, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyContactsIdCommunicationsCountEndpoint:
+        """
+        The CompanyContactsIdCommunicationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContactsIdCommunicationsCountEndpoint(self.client, parent_endpoint=self)
+        )
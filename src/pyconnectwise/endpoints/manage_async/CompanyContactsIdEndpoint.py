@@ -0,0 +1,166 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdCommunicationsEndpoint import (
+    CompanyContactsIdCommunicationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdGroupsEndpoint import CompanyContactsIdGroupsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdImageEndpoint import CompanyContactsIdImageEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdNotesEndpoint import CompanyContactsIdNotesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdPortalsecurityEndpoint import (
+    CompanyContactsIdPortalsecurityEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdTracksEndpoint import CompanyContactsIdTracksEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdTypeassociationsEndpoint import (
+    CompanyContactsIdTypeassociationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdUsagesEndpoint import CompanyContactsIdUsagesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Contact
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Contact, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Contact, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Contact, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Contact, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Contact)
+        IAsyncPatchable.__init__(self, Contact)
+        IAsyncPuttable.__init__(self, Contact)
+        IAsyncPaginateable.__init__(self, Contact)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Contact]:
+        """
+        Performs a GET request against the /company/contacts/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Contact]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Contact, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /company/contacts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Contact:
+        """
+        Performs a GET request against the /company/contacts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Contact: The parsed response data.
+        """
+        return self._parse_one(Contact, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Contact:
+        """
+        Performs a PATCH request against the /company/contacts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Contact: The parsed response data.
+        """
+        return self._parse_one(Contact, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Contact:
+        """
+        Performs a PUT request against the /company/contacts/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Contact: The parsed response data.
+        """
+        return self._parse_one(Contact, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def communications(self) -> CompanyContactsIdCommunicationsEndpoint:
+        """
+        The CompanyContactsIdCommunicationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdCommunicationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def groups(self) -> CompanyContactsIdGroupsEndpoint:
+        """
+        The CompanyContactsIdGroupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdGroupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def image(self) -> CompanyContactsIdImageEndpoint:
+        """
+        The CompanyContactsIdImageEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdImageEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notes(self) -> CompanyContactsIdNotesEndpoint:
+        """
+        The CompanyContactsIdNotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdNotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def portal_security(self) -> CompanyContactsIdPortalsecurityEndpoint:
+        """
+        The CompanyContactsIdPortalsecurityEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdPortalsecurityEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tracks(self) -> CompanyContactsIdTracksEndpoint:
+        """
+        The CompanyContactsIdTracksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdTracksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def type_associations(self) -> CompanyContactsIdTypeassociationsEndpoint:
+        """
+        The CompanyContactsIdTypeassociationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContactsIdTypeassociationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> CompanyContactsIdUsagesEndpoint:
+        """
+        The CompanyContactsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdGroupsCountEndpoint import (
+    CompanyContactsIdGroupsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdGroupsIdEndpoint import CompanyContactsIdGroupsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ContactGroup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsIdGroupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ContactGroup], ConnectWiseManageRequestParams],
+    IAsyncPostable[ContactGroup, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ContactGroup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "groups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ContactGroup])
+        IAsyncPostable.__init__(self, ContactGroup)
+        IAsyncPaginateable.__init__(self, ContactGroup)
+
+    def id(self, _id: int) -> CompanyContactsIdGroupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyContactsIdGroupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyContactsIdGroupsIdEndpoint: The initialized CompanyContactsIdGroupsIdEndpoint object.
+        """
+        child = CompanyContactsIdGroupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ContactGroup]:
+        """
+        Performs a GET request against the /company/contacts/{id}/groups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ContactGroup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ContactGroup, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ContactGroup]:
+        """
+        Performs a GET request against the /company/contacts/{id}/groups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ContactGroup]: The parsed response data.
+        """
+        return self._parse_many(ContactGroup, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ContactGroup:
+        """
+        Performs a POST request against the /company/contacts/{id}/groups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ContactGroup: The parsed response data.
+        """
+        return self._parse_one(ContactGroup, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyContactsIdGroupsCountEndpoint:
+        """
+        The CompanyContactsIdGroupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdGroupsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdNotesCountEndpoint import CompanyContactsIdNotesCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdNotesIdEndpoint import CompanyContactsIdNotesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ContactNote
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsIdNotesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ContactNote], ConnectWiseManageRequestParams],
+    IAsyncPostable[ContactNote, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ContactNote, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "notes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ContactNote])
+        IAsyncPostable.__init__(self, ContactNote)
+        IAsyncPaginateable.__init__(self, ContactNote)
+
+    def id(self, _id: int) -> CompanyContactsIdNotesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyContactsIdNotesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyContactsIdNotesIdEndpoint: The initialized CompanyContactsIdNotesIdEndpoint object.
+        """
+        child = CompanyContactsIdNotesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ContactNote]:
+        """
+        Performs a GET request against the /company/contacts/{id}/notes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ContactNote]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ContactNote, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ContactNote]:
+        """
+        Performs a GET request against the /company/contacts/{id}/notes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ContactNote]: The parsed response data.
+        """
+        return self._parse_many(ContactNote, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ContactNote:
+        """
+        Performs a POST request against the /company/contacts/{id}/notes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ContactNote: The parsed response data.
+        """
+        return self._parse_one(ContactNote, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyContactsIdNotesCountEndpoint:
+        """
+        The CompanyContactsIdNotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsIdNotesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,113 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdTypeassociationsCountEndpoint import (
+    CompanyContactsIdTypeassociationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsIdTypeassociationsIdEndpoint import (
+    CompanyContactsIdTypeassociationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ContactContactTypeAssociationContactTypeAssociation
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsIdTypeassociationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ContactContactTypeAssociationContactTypeAssociation], ConnectWiseManageRequestParams],
+    IAsyncPostable[ContactContactTypeAssociationContactTypeAssociation, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ContactContactTypeAssociationContactTypeAssociation, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "typeAssociations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ContactContactTypeAssociationContactTypeAssociation])
+        IAsyncPostable.__init__(self, ContactContactTypeAssociationContactTypeAssociation)
+        IAsyncPaginateable.__init__(self, ContactContactTypeAssociationContactTypeAssociation)
+
+    def id(self, _id: int) -> CompanyContactsIdTypeassociationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyContactsIdTypeassociationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyContactsIdTypeassociationsIdEndpoint: The initialized CompanyContactsIdTypeassociationsIdEndpoint object.
+        """
+        child = CompanyContactsIdTypeassociationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ContactContactTypeAssociationContactTypeAssociation]:
+        """
+        Performs a GET request against the /company/contacts/{id}/typeAssociations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ContactContactTypeAssociationContactTypeAssociation]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            ContactContactTypeAssociationContactTypeAssociation,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ContactContactTypeAssociationContactTypeAssociation]:
+        """
+        Performs a GET request against the /company/contacts/{id}/typeAssociations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ContactContactTypeAssociationContactTypeAssociation]: The parsed response data.
+        """
+        return self._parse_many(
+            ContactContactTypeAssociationContactTypeAssociation,
+            (await super()._make_request("GET", data=data, params=params)).content,
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ContactContactTypeAssociationContactTypeAssociation:
+        """
+        Performs a POST request against the /company/contacts/{id}/typeAssociations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ContactContactTypeAssociationContactTypeAssociation: The parsed response data.
+        """
+        return self._parse_one(
+            ContactContactTypeAssociationContactTypeAssociation,
+            (await super()._make_request("POST", data=data, params=params)).content,
+        )
+
+    @cached_property
+    def count(self) -> CompanyContactsIdTypeassociationsCountEndpoint:
+        """
+        The CompanyContactsIdTypeassociationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContactsIdTypeassociationsCountEndpoint(self.client, parent_endpoint=self)
+        )
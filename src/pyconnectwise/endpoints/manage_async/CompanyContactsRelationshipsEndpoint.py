@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsRelationshipsCountEndpoint import (
+    CompanyContactsRelationshipsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsRelationshipsIdEndpoint import (
+    CompanyContactsRelationshipsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ContactRelationship
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsRelationshipsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ContactRelationship], ConnectWiseManageRequestParams],
+    IAsyncPostable[ContactRelationship, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ContactRelationship, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "relationships", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ContactRelationship])
+        IAsyncPostable.__init__(self, ContactRelationship)
+        IAsyncPaginateable.__init__(self, ContactRelationship)
+
+    def id(self, _id: int) -> CompanyContactsRelationshipsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyContactsRelationshipsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyContactsRelationshipsIdEndpoint: The initialized CompanyContactsRelationshipsIdEndpoint object.
+        """
+        child = CompanyContactsRelationshipsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ContactRelationship]:
+        """
+        Performs a GET request against the /company/contacts/relationships endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ContactRelationship]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ContactRelationship, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ContactRelationship]:
+        """
+        Performs a GET request against the /company/contacts/relationships endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ContactRelationship]: The parsed response data.
+        """
+        return self._parse_many(
+            ContactRelationship, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ContactRelationship:
+        """
+        Performs a POST request against the /company/contacts/relationships endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ContactRelationship: The parsed response data.
+        """
+        return self._parse_one(
+            ContactRelationship, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyContactsRelationshipsCountEndpoint:
+        """
+        The CompanyContactsRelationshipsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContactsRelationshipsCountEndpoint(self.client, parent_endpoint=self)
+        )
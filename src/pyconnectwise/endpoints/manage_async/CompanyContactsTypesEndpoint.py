@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsTypesCountEndpoint import CompanyContactsTypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsTypesIdEndpoint import CompanyContactsTypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsTypesInfoEndpoint import CompanyContactsTypesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ContactType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsTypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ContactType], ConnectWiseManageRequestParams],
+    IAsyncPostable[ContactType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ContactType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "types", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ContactType])
+        IAsyncPostable.__init__(self, ContactType)
+        IAsyncPaginateable.__init__(self, ContactType)
+
+    def id(self, _id: int) -> CompanyContactsTypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyContactsTypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyContactsTypesIdEndpoint: The initialized CompanyContactsTypesIdEndpoint object.
+        """
+        child = CompanyContactsTypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ContactType]:
+        """
+        Performs a GET request against the /company/contacts/types endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ContactType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ContactType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ContactType]:
+        """
+        Performs a GET request against the /company/contacts/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ContactType]: The parsed response data.
+        """
+        return self._parse_many(ContactType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ContactType:
+        """
+        Performs a POST request against the /company/contacts/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ContactType: The parsed response data.
+        """
+        return self._parse_one(ContactType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyContactsTypesCountEndpoint:
+        """
+        The CompanyContactsTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyContactsTypesInfoEndpoint:
+        """
+        The CompanyContactsTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsTypesInfoEndpoint(self.client, parent_endpoint=self))
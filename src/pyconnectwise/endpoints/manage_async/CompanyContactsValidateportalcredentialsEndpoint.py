@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.manage import ValidatePortalResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsValidateportalcredentialsEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPostable[ValidatePortalResponse, ConnectWiseManageRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "validatePortalCredentials", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, ValidatePortalResponse)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ValidatePortalResponse:
+        """
+        Performs a POST request against the /company/contacts/validatePortalCredentials endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ValidatePortalResponse: The parsed response data.
+        """
+        return self._parse_one(
+            ValidatePortalResponse, (await super()._make_request("POST", data=data, params=params)).content
+        )
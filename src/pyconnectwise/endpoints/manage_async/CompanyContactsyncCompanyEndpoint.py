@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsyncCompanyCountEndpoint import (
+    CompanyContactsyncCompanyCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContactsyncCompanyIdEndpoint import CompanyContactsyncCompanyIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import M365ContactSyncCompany
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsyncCompanyEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[M365ContactSyncCompany], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[M365ContactSyncCompany, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "company", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[M365ContactSyncCompany])
+        IAsyncPaginateable.__init__(self, M365ContactSyncCompany)
+
+    def id(self, _id: int) -> CompanyContactsyncCompanyIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyContactsyncCompanyIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyContactsyncCompanyIdEndpoint: The initialized CompanyContactsyncCompanyIdEndpoint object.
+        """
+        child = CompanyContactsyncCompanyIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[M365ContactSyncCompany]:
+        """
+        Performs a GET request against the /company/contactsync/company endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[M365ContactSyncCompany]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), M365ContactSyncCompany, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[M365ContactSyncCompany]:
+        """
+        Performs a GET request against the /company/contactsync/company endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[M365ContactSyncCompany]: The parsed response data.
+        """
+        return self._parse_many(
+            M365ContactSyncCompany, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /company/contactsync/company endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    @cached_property
+    def count(self) -> CompanyContactsyncCompanyCountEndpoint:
+        """
+        The CompanyContactsyncCompanyCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsyncCompanyCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsyncCompanysyncIdEndpoint import (
+    CompanyContactsyncCompanysyncIdEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsyncCompanysyncEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "companysync", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> CompanyContactsyncCompanysyncIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyContactsyncCompanysyncIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyContactsyncCompanysyncIdEndpoint: The initialized CompanyContactsyncCompanysyncIdEndpoint object.
+        """
+        child = CompanyContactsyncCompanysyncIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
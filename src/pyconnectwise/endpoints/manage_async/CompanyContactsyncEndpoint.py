@@ -0,0 +1,30 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsyncCompanyEndpoint import CompanyContactsyncCompanyEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsyncCompanysyncEndpoint import (
+    CompanyContactsyncCompanysyncEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContactsyncEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "contactsync", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def company(self) -> CompanyContactsyncCompanyEndpoint:
+        """
+        The CompanyContactsyncCompanyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsyncCompanyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def companysync(self) -> CompanyContactsyncCompanysyncEndpoint:
+        """
+        The CompanyContactsyncCompanysyncEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsyncCompanysyncEndpoint(self.client, parent_endpoint=self))
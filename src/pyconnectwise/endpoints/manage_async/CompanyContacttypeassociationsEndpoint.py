@@ -0,0 +1,111 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContacttypeassociationsCountEndpoint import (
+    CompanyContacttypeassociationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyContacttypeassociationsIdEndpoint import (
+    CompanyContacttypeassociationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanyContactTypeAssociation
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyContacttypeassociationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanyContactTypeAssociation], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanyContactTypeAssociation, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyContactTypeAssociation, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "contactTypeAssociations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanyContactTypeAssociation])
+        IAsyncPostable.__init__(self, CompanyContactTypeAssociation)
+        IAsyncPaginateable.__init__(self, CompanyContactTypeAssociation)
+
+    def id(self, _id: int) -> CompanyContacttypeassociationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyContacttypeassociationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyContacttypeassociationsIdEndpoint: The initialized CompanyContacttypeassociationsIdEndpoint object.
+        """
+        child = CompanyContacttypeassociationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyContactTypeAssociation]:
+        """
+        Performs a GET request against the /company/contactTypeAssociations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyContactTypeAssociation]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            CompanyContactTypeAssociation,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanyContactTypeAssociation]:
+        """
+        Performs a GET request against the /company/contactTypeAssociations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyContactTypeAssociation]: The parsed response data.
+        """
+        return self._parse_many(
+            CompanyContactTypeAssociation, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CompanyContactTypeAssociation:
+        """
+        Performs a POST request against the /company/contactTypeAssociations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyContactTypeAssociation: The parsed response data.
+        """
+        return self._parse_one(
+            CompanyContactTypeAssociation, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyContacttypeassociationsCountEndpoint:
+        """
+        The CompanyContacttypeassociationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyContacttypeassociationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCountriesCountEndpoint import CompanyCountriesCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCountriesIdEndpoint import CompanyCountriesIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCountriesInfoEndpoint import CompanyCountriesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Country
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyCountriesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Country], ConnectWiseManageRequestParams],
+    IAsyncPostable[Country, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Country, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "countries", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Country])
+        IAsyncPostable.__init__(self, Country)
+        IAsyncPaginateable.__init__(self, Country)
+
+    def id(self, _id: int) -> CompanyCountriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyCountriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyCountriesIdEndpoint: The initialized CompanyCountriesIdEndpoint object.
+        """
+        child = CompanyCountriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Country]:
+        """
+        Performs a GET request against the /company/countries endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Country]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Country, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Country]:
+        """
+        Performs a GET request against the /company/countries endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Country]: The parsed response data.
+        """
+        return self._parse_many(Country, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Country:
+        """
+        Performs a POST request against the /company/countries endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Country: The parsed response data.
+        """
+        return self._parse_one(Country, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyCountriesCountEndpoint:
+        """
+        The CompanyCountriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCountriesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyCountriesInfoEndpoint:
+        """
+        The CompanyCountriesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCountriesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,247 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyAddressformatsEndpoint import CompanyAddressformatsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyBillingsetupsEndpoint import CompanyBillingsetupsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCommunicationtypesEndpoint import CompanyCommunicationtypesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompaniesEndpoint import CompanyCompaniesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompanyfinanceEndpoint import CompanyCompanyfinanceEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompanypickeritemsEndpoint import CompanyCompanypickeritemsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyCompanytypeassociationsEndpoint import (
+    CompanyCompanytypeassociationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyConfigurationsEndpoint import CompanyConfigurationsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContactsEndpoint import CompanyContactsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyContacttypeassociationsEndpoint import (
+    CompanyContacttypeassociationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyCountriesEndpoint import CompanyCountriesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyEntitytypesEndpoint import CompanyEntitytypesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyExpensetypesEndpoint import CompanyExpensetypesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsEndpoint import (
+    CompanyManageddevicesintegrationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManagementbackupsEndpoint import CompanyManagementbackupsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManagementEndpoint import CompanyManagementEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManagementitsolutionsEndpoint import (
+    CompanyManagementitsolutionsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyMarketdescriptionsEndpoint import CompanyMarketdescriptionsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyNotetypesEndpoint import CompanyNotetypesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyOwnershiptypesEndpoint import CompanyOwnershiptypesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyPaymenttypesEndpoint import CompanyPaymenttypesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsEndpoint import CompanyPortalconfigurationsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyPortalsecuritylevelsEndpoint import CompanyPortalsecuritylevelsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyPortalsecuritysettingsEndpoint import (
+    CompanyPortalsecuritysettingsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyStatesEndpoint import CompanyStatesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyTeamrolesEndpoint import CompanyTeamrolesEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyTracksEndpoint import CompanyTracksEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "company", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def address_formats(self) -> CompanyAddressformatsEndpoint:
+        """
+        The CompanyAddressformatsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyAddressformatsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def billing_setups(self) -> CompanyBillingsetupsEndpoint:
+        """
+        The CompanyBillingsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyBillingsetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def communication_types(self) -> CompanyCommunicationtypesEndpoint:
+        """
+        The CompanyCommunicationtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCommunicationtypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def companies(self) -> CompanyCompaniesEndpoint:
+        """
+        The CompanyCompaniesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompaniesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def company_finance(self) -> CompanyCompanyfinanceEndpoint:
+        """
+        The CompanyCompanyfinanceEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompanyfinanceEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def company_picker_items(self) -> CompanyCompanypickeritemsEndpoint:
+        """
+        The CompanyCompanypickeritemsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompanypickeritemsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def company_type_associations(self) -> CompanyCompanytypeassociationsEndpoint:
+        """
+        The CompanyCompanytypeassociationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCompanytypeassociationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def configurations(self) -> CompanyConfigurationsEndpoint:
+        """
+        The CompanyConfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyConfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def contact_type_associations(self) -> CompanyContacttypeassociationsEndpoint:
+        """
+        The CompanyContacttypeassociationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContacttypeassociationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def contacts(self) -> CompanyContactsEndpoint:
+        """
+        The CompanyContactsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyContactsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def countries(self) -> CompanyCountriesEndpoint:
+        """
+        The CompanyCountriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyCountriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def entity_types(self) -> CompanyEntitytypesEndpoint:
+        """
+        The CompanyEntitytypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyEntitytypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def entitytypes(self) -> CompanyEntitytypesEndpoint:
+        """
+        The CompanyEntitytypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyEntitytypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def expense_types(self) -> CompanyExpensetypesEndpoint:
+        """
+        The CompanyExpensetypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyExpensetypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def managed_devices_integrations(self) -> CompanyManageddevicesintegrationsEndpoint:
+        """
+        The CompanyManageddevicesintegrationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def management(self) -> CompanyManagementEndpoint:
+        """
+        The CompanyManagementEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def management_backups(self) -> CompanyManagementbackupsEndpoint:
+        """
+        The CompanyManagementbackupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementbackupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def management_it_solutions(self) -> CompanyManagementitsolutionsEndpoint:
+        """
+        The CompanyManagementitsolutionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementitsolutionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def market_descriptions(self) -> CompanyMarketdescriptionsEndpoint:
+        """
+        The CompanyMarketdescriptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyMarketdescriptionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def note_types(self) -> CompanyNotetypesEndpoint:
+        """
+        The CompanyNotetypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyNotetypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ownership_types(self) -> CompanyOwnershiptypesEndpoint:
+        """
+        The CompanyOwnershiptypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyOwnershiptypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def payment_types(self) -> CompanyPaymenttypesEndpoint:
+        """
+        The CompanyPaymenttypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyPaymenttypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def portal_configurations(self) -> CompanyPortalconfigurationsEndpoint:
+        """
+        The CompanyPortalconfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyPortalconfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def portal_security_levels(self) -> CompanyPortalsecuritylevelsEndpoint:
+        """
+        The CompanyPortalsecuritylevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyPortalsecuritylevelsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def portal_security_settings(self) -> CompanyPortalsecuritysettingsEndpoint:
+        """
+        The CompanyPortalsecuritysettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyPortalsecuritysettingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def states(self) -> CompanyStatesEndpoint:
+        """
+        The CompanyStatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyStatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def team_roles(self) -> CompanyTeamrolesEndpoint:
+        """
+        The CompanyTeamrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTeamrolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tracks(self) -> CompanyTracksEndpoint:
+        """
+        The CompanyTracksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTracksEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyEntitytypesIdEndpoint import CompanyEntitytypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyEntitytypesInfoEndpoint import CompanyEntitytypesInfoEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyEntitytypesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "entitytypes", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> CompanyEntitytypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyEntitytypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyEntitytypesIdEndpoint: The initialized CompanyEntitytypesIdEndpoint object.
+        """
+        child = CompanyEntitytypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def info(self) -> CompanyEntitytypesInfoEndpoint:
+        """
+        The CompanyEntitytypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyEntitytypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyM365contactCountEndpoint import CompanyM365contactCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyM365contactIdEndpoint import CompanyM365contactIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import M365Contact
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyM365contactEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[M365Contact], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[M365Contact, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "m365contact", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[M365Contact])
+        IAsyncPaginateable.__init__(self, M365Contact)
+
+    def id(self, _id: int) -> CompanyM365contactIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyM365contactIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyM365contactIdEndpoint: The initialized CompanyM365contactIdEndpoint object.
+        """
+        child = CompanyM365contactIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[M365Contact]:
+        """
+        Performs a GET request against the /company/m365contact endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[M365Contact]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), M365Contact, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[M365Contact]:
+        """
+        Performs a GET request against the /company/m365contact endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[M365Contact]: The parsed response data.
+        """
+        return self._parse_many(M365Contact, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyM365contactCountEndpoint:
+        """
+        The CompanyM365contactCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyM365contactCountEndpoint(self.client, parent_endpoint=self))
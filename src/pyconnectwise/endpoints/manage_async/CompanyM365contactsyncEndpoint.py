@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyM365contactsyncIdEndpoint import CompanyM365contactsyncIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyM365contactsyncPropertyEndpoint import (
+    CompanyM365contactsyncPropertyEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyM365contactsyncEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "m365contactsync", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> CompanyM365contactsyncIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyM365contactsyncIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyM365contactsyncIdEndpoint: The initialized CompanyM365contactsyncIdEndpoint object.
+        """
+        child = CompanyM365contactsyncIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def property(self) -> CompanyM365contactsyncPropertyEndpoint:
+        """
+        The CompanyM365contactsyncPropertyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyM365contactsyncPropertyEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,59 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import M365ContactSyncProperty
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyM365contactsyncIdPropertyEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[M365ContactSyncProperty, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[M365ContactSyncProperty, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "property", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, M365ContactSyncProperty)
+        IAsyncPaginateable.__init__(self, M365ContactSyncProperty)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[M365ContactSyncProperty]:
+        """
+        Performs a GET request against the /company/m365contactsync/{id}/property endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[M365ContactSyncProperty]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), M365ContactSyncProperty, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> M365ContactSyncProperty:
+        """
+        Performs a GET request against the /company/m365contactsync/{id}/property endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            M365ContactSyncProperty: The parsed response data.
+        """
+        return self._parse_one(
+            M365ContactSyncProperty, (await super()._make_request("GET", data=data, params=params)).content
+        )
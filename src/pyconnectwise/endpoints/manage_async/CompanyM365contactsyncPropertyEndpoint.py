@@ -0,0 +1,70 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyM365contactsyncPropertyCountEndpoint import (
+    CompanyM365contactsyncPropertyCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyM365contactsyncPropertyExcludedEndpoint import (
+    CompanyM365contactsyncPropertyExcludedEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyM365contactsyncPropertyIncludedEndpoint import (
+    CompanyM365contactsyncPropertyIncludedEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.manage import M365ContactSyncProperty
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyM365contactsyncPropertyEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPostable[M365ContactSyncProperty, ConnectWiseManageRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "property", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, M365ContactSyncProperty)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> M365ContactSyncProperty:
+        """
+        Performs a POST request against the /company/m365contactsync/property endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            M365ContactSyncProperty: The parsed response data.
+        """
+        return self._parse_one(
+            M365ContactSyncProperty, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyM365contactsyncPropertyCountEndpoint:
+        """
+        The CompanyM365contactsyncPropertyCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyM365contactsyncPropertyCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def excluded(self) -> CompanyM365contactsyncPropertyExcludedEndpoint:
+        """
+        The CompanyM365contactsyncPropertyExcludedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyM365contactsyncPropertyExcludedEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def included(self) -> CompanyM365contactsyncPropertyIncludedEndpoint:
+        """
+        The CompanyM365contactsyncPropertyIncludedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyM365contactsyncPropertyIncludedEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,118 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsCountEndpoint import (
+    CompanyManageddevicesintegrationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsIdEndpoint import (
+    CompanyManageddevicesintegrationsIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsInfoEndpoint import (
+    CompanyManageddevicesintegrationsInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ManagedDevicesIntegration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyManageddevicesintegrationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ManagedDevicesIntegration], ConnectWiseManageRequestParams],
+    IAsyncPostable[ManagedDevicesIntegration, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ManagedDevicesIntegration, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "managedDevicesIntegrations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ManagedDevicesIntegration])
+        IAsyncPostable.__init__(self, ManagedDevicesIntegration)
+        IAsyncPaginateable.__init__(self, ManagedDevicesIntegration)
+
+    def id(self, _id: int) -> CompanyManageddevicesintegrationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyManageddevicesintegrationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyManageddevicesintegrationsIdEndpoint: The initialized CompanyManageddevicesintegrationsIdEndpoint object.
+        """
+        child = CompanyManageddevicesintegrationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ManagedDevicesIntegration]:
+        """
+        Performs a GET request against the /company/managedDevicesIntegrations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ManagedDevicesIntegration]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ManagedDevicesIntegration, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ManagedDevicesIntegration]:
+        """
+        Performs a GET request against the /company/managedDevicesIntegrations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ManagedDevicesIntegration]: The parsed response data.
+        """
+        return self._parse_many(
+            ManagedDevicesIntegration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagedDevicesIntegration:
+        """
+        Performs a POST request against the /company/managedDevicesIntegrations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagedDevicesIntegration: The parsed response data.
+        """
+        return self._parse_one(
+            ManagedDevicesIntegration, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyManageddevicesintegrationsCountEndpoint:
+        """
+        The CompanyManageddevicesintegrationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> CompanyManageddevicesintegrationsInfoEndpoint:
+        """
+        The CompanyManageddevicesintegrationsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsInfoEndpoint(self.client, parent_endpoint=self)
+        )
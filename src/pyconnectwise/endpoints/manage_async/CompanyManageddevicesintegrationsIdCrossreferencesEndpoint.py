@@ -0,0 +1,113 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint import (
+    CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint import (
+    CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ManagedDevicesIntegrationCrossReference
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyManageddevicesintegrationsIdCrossreferencesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ManagedDevicesIntegrationCrossReference], ConnectWiseManageRequestParams],
+    IAsyncPostable[ManagedDevicesIntegrationCrossReference, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ManagedDevicesIntegrationCrossReference, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "crossReferences", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ManagedDevicesIntegrationCrossReference])
+        IAsyncPostable.__init__(self, ManagedDevicesIntegrationCrossReference)
+        IAsyncPaginateable.__init__(self, ManagedDevicesIntegrationCrossReference)
+
+    def id(self, _id: int) -> CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint: The initialized CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint object.
+        """
+        child = CompanyManageddevicesintegrationsIdCrossreferencesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ManagedDevicesIntegrationCrossReference]:
+        """
+        Performs a GET request against the /company/managedDevicesIntegrations/{id}/crossReferences endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ManagedDevicesIntegrationCrossReference]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            ManagedDevicesIntegrationCrossReference,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ManagedDevicesIntegrationCrossReference]:
+        """
+        Performs a GET request against the /company/managedDevicesIntegrations/{id}/crossReferences endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ManagedDevicesIntegrationCrossReference]: The parsed response data.
+        """
+        return self._parse_many(
+            ManagedDevicesIntegrationCrossReference,
+            (await super()._make_request("GET", data=data, params=params)).content,
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagedDevicesIntegrationCrossReference:
+        """
+        Performs a POST request against the /company/managedDevicesIntegrations/{id}/crossReferences endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagedDevicesIntegrationCrossReference: The parsed response data.
+        """
+        return self._parse_one(
+            ManagedDevicesIntegrationCrossReference,
+            (await super()._make_request("POST", data=data, params=params)).content,
+        )
+
+    @cached_property
+    def count(self) -> CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdCrossreferencesCountEndpoint(self.client, parent_endpoint=self)
+        )
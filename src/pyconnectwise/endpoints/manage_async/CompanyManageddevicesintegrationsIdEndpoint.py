@@ -0,0 +1,166 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsIdCrossreferencesEndpoint import (
+    CompanyManageddevicesintegrationsIdCrossreferencesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsIdInfoEndpoint import (
+    CompanyManageddevicesintegrationsIdInfoEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsIdLoginsEndpoint import (
+    CompanyManageddevicesintegrationsIdLoginsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsIdNotificationsEndpoint import (
+    CompanyManageddevicesintegrationsIdNotificationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsIdUsagesEndpoint import (
+    CompanyManageddevicesintegrationsIdUsagesEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import ManagedDevicesIntegration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyManageddevicesintegrationsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[ManagedDevicesIntegration, ConnectWiseManageRequestParams],
+    IAsyncPatchable[ManagedDevicesIntegration, ConnectWiseManageRequestParams],
+    IAsyncPuttable[ManagedDevicesIntegration, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ManagedDevicesIntegration, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, ManagedDevicesIntegration)
+        IAsyncPatchable.__init__(self, ManagedDevicesIntegration)
+        IAsyncPuttable.__init__(self, ManagedDevicesIntegration)
+        IAsyncPaginateable.__init__(self, ManagedDevicesIntegration)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ManagedDevicesIntegration]:
+        """
+        Performs a GET request against the /company/managedDevicesIntegrations/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ManagedDevicesIntegration]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ManagedDevicesIntegration, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /company/managedDevicesIntegrations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagedDevicesIntegration:
+        """
+        Performs a GET request against the /company/managedDevicesIntegrations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagedDevicesIntegration: The parsed response data.
+        """
+        return self._parse_one(
+            ManagedDevicesIntegration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagedDevicesIntegration:
+        """
+        Performs a PATCH request against the /company/managedDevicesIntegrations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagedDevicesIntegration: The parsed response data.
+        """
+        return self._parse_one(
+            ManagedDevicesIntegration, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagedDevicesIntegration:
+        """
+        Performs a PUT request against the /company/managedDevicesIntegrations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagedDevicesIntegration: The parsed response data.
+        """
+        return self._parse_one(
+            ManagedDevicesIntegration, (await super()._make_request("PUT", data=data, params=params)).content
+        )
+
+    @cached_property
+    def cross_references(self) -> CompanyManageddevicesintegrationsIdCrossreferencesEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdCrossreferencesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdCrossreferencesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> CompanyManageddevicesintegrationsIdInfoEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def logins(self) -> CompanyManageddevicesintegrationsIdLoginsEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdLoginsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdLoginsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def notifications(self) -> CompanyManageddevicesintegrationsIdNotificationsEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdNotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdNotificationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> CompanyManageddevicesintegrationsIdUsagesEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdUsagesEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,111 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsIdLoginsCountEndpoint import (
+    CompanyManageddevicesintegrationsIdLoginsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsIdLoginsIdEndpoint import (
+    CompanyManageddevicesintegrationsIdLoginsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ManagedDevicesIntegrationLogin
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyManageddevicesintegrationsIdLoginsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ManagedDevicesIntegrationLogin], ConnectWiseManageRequestParams],
+    IAsyncPostable[ManagedDevicesIntegrationLogin, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ManagedDevicesIntegrationLogin, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "logins", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ManagedDevicesIntegrationLogin])
+        IAsyncPostable.__init__(self, ManagedDevicesIntegrationLogin)
+        IAsyncPaginateable.__init__(self, ManagedDevicesIntegrationLogin)
+
+    def id(self, _id: int) -> CompanyManageddevicesintegrationsIdLoginsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyManageddevicesintegrationsIdLoginsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyManageddevicesintegrationsIdLoginsIdEndpoint: The initialized CompanyManageddevicesintegrationsIdLoginsIdEndpoint object.
+        """
+        child = CompanyManageddevicesintegrationsIdLoginsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ManagedDevicesIntegrationLogin]:
+        """
+        Performs a GET request against the /company/managedDevicesIntegrations/{id}/logins endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ManagedDevicesIntegrationLogin]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            ManagedDevicesIntegrationLogin,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ManagedDevicesIntegrationLogin]:
+        """
+        Performs a GET request against the /company/managedDevicesIntegrations/{id}/logins endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ManagedDevicesIntegrationLogin]: The parsed response data.
+        """
+        return self._parse_many(
+            ManagedDevicesIntegrationLogin, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagedDevicesIntegrationLogin:
+        """
+        Performs a POST request against the /company/managedDevicesIntegrations/{id}/logins endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagedDevicesIntegrationLogin: The parsed response data.
+        """
+        return self._parse_one(
+            ManagedDevicesIntegrationLogin, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyManageddevicesintegrationsIdLoginsCountEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdLoginsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdLoginsCountEndpoint(self.client, parent_endpoint=self)
+        )
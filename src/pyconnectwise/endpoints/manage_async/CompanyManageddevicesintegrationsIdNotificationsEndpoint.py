@@ -0,0 +1,113 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsIdNotificationsCountEndpoint import (
+    CompanyManageddevicesintegrationsIdNotificationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManageddevicesintegrationsIdNotificationsIdEndpoint import (
+    CompanyManageddevicesintegrationsIdNotificationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ManagedDevicesIntegrationNotification
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyManageddevicesintegrationsIdNotificationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ManagedDevicesIntegrationNotification], ConnectWiseManageRequestParams],
+    IAsyncPostable[ManagedDevicesIntegrationNotification, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ManagedDevicesIntegrationNotification, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "notifications", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ManagedDevicesIntegrationNotification])
+        IAsyncPostable.__init__(self, ManagedDevicesIntegrationNotification)
+        IAsyncPaginateable.__init__(self, ManagedDevicesIntegrationNotification)
+
+    def id(self, _id: int) -> CompanyManageddevicesintegrationsIdNotificationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyManageddevicesintegrationsIdNotificationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyManageddevicesintegrationsIdNotificationsIdEndpoint: The initialized CompanyManageddevicesintegrationsIdNotificationsIdEndpoint object.
+        """
+        child = CompanyManageddevicesintegrationsIdNotificationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ManagedDevicesIntegrationNotification]:
+        """
+        Performs a GET request against the /company/managedDevicesIntegrations/{id}/notifications endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ManagedDevicesIntegrationNotification]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            ManagedDevicesIntegrationNotification,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ManagedDevicesIntegrationNotification]:
+        """
+        Performs a GET request against the /company/managedDevicesIntegrations/{id}/notifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ManagedDevicesIntegrationNotification]: The parsed response data.
+        """
+        return self._parse_many(
+            ManagedDevicesIntegrationNotification,
+            (await super()._make_request("GET", data=data, params=params)).content,
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagedDevicesIntegrationNotification:
+        """
+        Performs a POST request against the /company/managedDevicesIntegrations/{id}/notifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagedDevicesIntegrationNotification: The parsed response data.
+        """
+        return self._parse_one(
+            ManagedDevicesIntegrationNotification,
+            (await super()._make_request("POST", data=data, params=params)).content,
+        )
+
+    @cached_property
+    def count(self) -> CompanyManageddevicesintegrationsIdNotificationsCountEndpoint:
+        """
+        The CompanyManageddevicesintegrationsIdNotificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManageddevicesintegrationsIdNotificationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManagementCountEndpoint import CompanyManagementCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManagementIdEndpoint import CompanyManagementIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import Management
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyManagementEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Management], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Management, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "management", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Management])
+        IAsyncPaginateable.__init__(self, Management)
+
+    def id(self, _id: int) -> CompanyManagementIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyManagementIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyManagementIdEndpoint: The initialized CompanyManagementIdEndpoint object.
+        """
+        child = CompanyManagementIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Management]:
+        """
+        Performs a GET request against the /company/management endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Management]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Management, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Management]:
+        """
+        Performs a GET request against the /company/management endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Management]: The parsed response data.
+        """
+        return self._parse_many(Management, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyManagementCountEndpoint:
+        """
+        The CompanyManagementCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,124 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManagementIdExecutemanageditsyncEndpoint import (
+    CompanyManagementIdExecutemanageditsyncEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManagementIdLogEndpoint import CompanyManagementIdLogEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManagementIdLogsEndpoint import CompanyManagementIdLogsEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManagementIdManagementreportnotificationsEndpoint import (
+    CompanyManagementIdManagementreportnotificationsEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Management
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyManagementIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Management, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Management, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Management, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Management, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Management)
+        IAsyncPatchable.__init__(self, Management)
+        IAsyncPuttable.__init__(self, Management)
+        IAsyncPaginateable.__init__(self, Management)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Management]:
+        """
+        Performs a GET request against the /company/management/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Management]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Management, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Management:
+        """
+        Performs a GET request against the /company/management/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Management: The parsed response data.
+        """
+        return self._parse_one(Management, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Management:
+        """
+        Performs a PATCH request against the /company/management/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Management: The parsed response data.
+        """
+        return self._parse_one(Management, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Management:
+        """
+        Performs a PUT request against the /company/management/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Management: The parsed response data.
+        """
+        return self._parse_one(Management, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def execute_managed_it_sync(self) -> CompanyManagementIdExecutemanageditsyncEndpoint:
+        """
+        The CompanyManagementIdExecutemanageditsyncEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManagementIdExecutemanageditsyncEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def log(self) -> CompanyManagementIdLogEndpoint:
+        """
+        The CompanyManagementIdLogEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementIdLogEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def logs(self) -> CompanyManagementIdLogsEndpoint:
+        """
+        The CompanyManagementIdLogsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementIdLogsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def management_report_notifications(self) -> CompanyManagementIdManagementreportnotificationsEndpoint:
+        """
+        The CompanyManagementIdManagementreportnotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManagementIdManagementreportnotificationsEndpoint(self.client, parent_endpoint=self)
+        )
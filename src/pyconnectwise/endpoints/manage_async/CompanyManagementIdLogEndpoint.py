@@ -0,0 +1,22 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManagementIdLogDownloadEndpoint import (
+    CompanyManagementIdLogDownloadEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyManagementIdLogEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "log", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def download(self) -> CompanyManagementIdLogDownloadEndpoint:
+        """
+        The CompanyManagementIdLogDownloadEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementIdLogDownloadEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,113 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManagementIdManagementreportnotificationsCountEndpoint import (
+    CompanyManagementIdManagementreportnotificationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManagementIdManagementreportnotificationsIdEndpoint import (
+    CompanyManagementIdManagementreportnotificationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ManagementReportNotification
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyManagementIdManagementreportnotificationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ManagementReportNotification], ConnectWiseManageRequestParams],
+    IAsyncPostable[ManagementReportNotification, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ManagementReportNotification, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(
+            self, client, "managementReportNotifications", parent_endpoint=parent_endpoint
+        )
+        IAsyncGettable.__init__(self, list[ManagementReportNotification])
+        IAsyncPostable.__init__(self, ManagementReportNotification)
+        IAsyncPaginateable.__init__(self, ManagementReportNotification)
+
+    def id(self, _id: int) -> CompanyManagementIdManagementreportnotificationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyManagementIdManagementreportnotificationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyManagementIdManagementreportnotificationsIdEndpoint: The initialized CompanyManagementIdManagementreportnotificationsIdEndpoint object.
+        """
+        child = CompanyManagementIdManagementreportnotificationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ManagementReportNotification]:
+        """
+        Performs a GET request against the /company/management/{id}/managementReportNotifications endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ManagementReportNotification]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            ManagementReportNotification,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ManagementReportNotification]:
+        """
+        Performs a GET request against the /company/management/{id}/managementReportNotifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ManagementReportNotification]: The parsed response data.
+        """
+        return self._parse_many(
+            ManagementReportNotification, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagementReportNotification:
+        """
+        Performs a POST request against the /company/management/{id}/managementReportNotifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagementReportNotification: The parsed response data.
+        """
+        return self._parse_one(
+            ManagementReportNotification, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyManagementIdManagementreportnotificationsCountEndpoint:
+        """
+        The CompanyManagementIdManagementreportnotificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManagementIdManagementreportnotificationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManagementbackupsCountEndpoint import (
+    CompanyManagementbackupsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManagementbackupsIdEndpoint import CompanyManagementbackupsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ManagementBackup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyManagementbackupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ManagementBackup], ConnectWiseManageRequestParams],
+    IAsyncPostable[ManagementBackup, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ManagementBackup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "managementBackups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ManagementBackup])
+        IAsyncPostable.__init__(self, ManagementBackup)
+        IAsyncPaginateable.__init__(self, ManagementBackup)
+
+    def id(self, _id: int) -> CompanyManagementbackupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyManagementbackupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyManagementbackupsIdEndpoint: The initialized CompanyManagementbackupsIdEndpoint object.
+        """
+        child = CompanyManagementbackupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ManagementBackup]:
+        """
+        Performs a GET request against the /company/managementBackups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ManagementBackup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ManagementBackup, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ManagementBackup]:
+        """
+        Performs a GET request against the /company/managementBackups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ManagementBackup]: The parsed response data.
+        """
+        return self._parse_many(
+            ManagementBackup, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagementBackup:
+        """
+        Performs a POST request against the /company/managementBackups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagementBackup: The parsed response data.
+        """
+        return self._parse_one(
+            ManagementBackup, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyManagementbackupsCountEndpoint:
+        """
+        The CompanyManagementbackupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyManagementbackupsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManagementitsolutionsCountEndpoint import (
+    CompanyManagementitsolutionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManagementitsolutionsIdEndpoint import (
+    CompanyManagementitsolutionsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ManagementItSolution
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyManagementitsolutionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ManagementItSolution], ConnectWiseManageRequestParams],
+    IAsyncPostable[ManagementItSolution, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ManagementItSolution, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "managementItSolutions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ManagementItSolution])
+        IAsyncPostable.__init__(self, ManagementItSolution)
+        IAsyncPaginateable.__init__(self, ManagementItSolution)
+
+    def id(self, _id: int) -> CompanyManagementitsolutionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyManagementitsolutionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyManagementitsolutionsIdEndpoint: The initialized CompanyManagementitsolutionsIdEndpoint object.
+        """
+        child = CompanyManagementitsolutionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ManagementItSolution]:
+        """
+        Performs a GET request against the /company/managementItSolutions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ManagementItSolution]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ManagementItSolution, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ManagementItSolution]:
+        """
+        Performs a GET request against the /company/managementItSolutions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ManagementItSolution]: The parsed response data.
+        """
+        return self._parse_many(
+            ManagementItSolution, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagementItSolution:
+        """
+        Performs a POST request against the /company/managementItSolutions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagementItSolution: The parsed response data.
+        """
+        return self._parse_one(
+            ManagementItSolution, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyManagementitsolutionsCountEndpoint:
+        """
+        The CompanyManagementitsolutionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManagementitsolutionsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,113 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyManagementitsolutionsIdManagementproductsCountEndpoint import (
+    CompanyManagementitsolutionsIdManagementproductsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyManagementitsolutionsIdManagementproductsIdEndpoint import (
+    CompanyManagementitsolutionsIdManagementproductsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ManagementItSolutionAgreementInterfaceParameter
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyManagementitsolutionsIdManagementproductsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ManagementItSolutionAgreementInterfaceParameter], ConnectWiseManageRequestParams],
+    IAsyncPostable[ManagementItSolutionAgreementInterfaceParameter, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ManagementItSolutionAgreementInterfaceParameter, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "managementProducts", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ManagementItSolutionAgreementInterfaceParameter])
+        IAsyncPostable.__init__(self, ManagementItSolutionAgreementInterfaceParameter)
+        IAsyncPaginateable.__init__(self, ManagementItSolutionAgreementInterfaceParameter)
+
+    def id(self, _id: int) -> CompanyManagementitsolutionsIdManagementproductsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyManagementitsolutionsIdManagementproductsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyManagementitsolutionsIdManagementproductsIdEndpoint: The initialized CompanyManagementitsolutionsIdManagementproductsIdEndpoint object.
+        """
+        child = CompanyManagementitsolutionsIdManagementproductsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ManagementItSolutionAgreementInterfaceParameter]:
+        """
+        Performs a GET request against the /company/managementItSolutions/{id}/managementProducts endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ManagementItSolutionAgreementInterfaceParameter]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            ManagementItSolutionAgreementInterfaceParameter,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ManagementItSolutionAgreementInterfaceParameter]:
+        """
+        Performs a GET request against the /company/managementItSolutions/{id}/managementProducts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ManagementItSolutionAgreementInterfaceParameter]: The parsed response data.
+        """
+        return self._parse_many(
+            ManagementItSolutionAgreementInterfaceParameter,
+            (await super()._make_request("GET", data=data, params=params)).content,
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagementItSolutionAgreementInterfaceParameter:
+        """
+        Performs a POST request against the /company/managementItSolutions/{id}/managementProducts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagementItSolutionAgreementInterfaceParameter: The parsed response data.
+        """
+        return self._parse_one(
+            ManagementItSolutionAgreementInterfaceParameter,
+            (await super()._make_request("POST", data=data, params=params)).content,
+        )
+
+    @cached_property
+    def count(self) -> CompanyManagementitsolutionsIdManagementproductsCountEndpoint:
+        """
+        The CompanyManagementitsolutionsIdManagementproductsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyManagementitsolutionsIdManagementproductsCountEndpoint(self.client, parent_endpoint=self)
+        )
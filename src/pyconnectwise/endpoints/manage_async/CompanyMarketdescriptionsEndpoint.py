@@ -0,0 +1,112 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyMarketdescriptionsCountEndpoint import (
+    CompanyMarketdescriptionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyMarketdescriptionsIdEndpoint import CompanyMarketdescriptionsIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyMarketdescriptionsInfoEndpoint import (
+    CompanyMarketdescriptionsInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import MarketDescription
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyMarketdescriptionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MarketDescription], ConnectWiseManageRequestParams],
+    IAsyncPostable[MarketDescription, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MarketDescription, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "marketDescriptions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MarketDescription])
+        IAsyncPostable.__init__(self, MarketDescription)
+        IAsyncPaginateable.__init__(self, MarketDescription)
+
+    def id(self, _id: int) -> CompanyMarketdescriptionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyMarketdescriptionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyMarketdescriptionsIdEndpoint: The initialized CompanyMarketdescriptionsIdEndpoint object.
+        """
+        child = CompanyMarketdescriptionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MarketDescription]:
+        """
+        Performs a GET request against the /company/marketDescriptions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MarketDescription]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MarketDescription, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MarketDescription]:
+        """
+        Performs a GET request against the /company/marketDescriptions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MarketDescription]: The parsed response data.
+        """
+        return self._parse_many(
+            MarketDescription, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> MarketDescription:
+        """
+        Performs a POST request against the /company/marketDescriptions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MarketDescription: The parsed response data.
+        """
+        return self._parse_one(
+            MarketDescription, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> CompanyMarketdescriptionsCountEndpoint:
+        """
+        The CompanyMarketdescriptionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyMarketdescriptionsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyMarketdescriptionsInfoEndpoint:
+        """
+        The CompanyMarketdescriptionsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyMarketdescriptionsInfoEndpoint(self.client, parent_endpoint=self))
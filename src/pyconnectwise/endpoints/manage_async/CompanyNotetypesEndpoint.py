@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyNotetypesCountEndpoint import CompanyNotetypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyNotetypesIdEndpoint import CompanyNotetypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyNotetypesInfoEndpoint import CompanyNotetypesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CompanyNoteType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyNotetypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CompanyNoteType], ConnectWiseManageRequestParams],
+    IAsyncPostable[CompanyNoteType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CompanyNoteType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "noteTypes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CompanyNoteType])
+        IAsyncPostable.__init__(self, CompanyNoteType)
+        IAsyncPaginateable.__init__(self, CompanyNoteType)
+
+    def id(self, _id: int) -> CompanyNotetypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyNotetypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyNotetypesIdEndpoint: The initialized CompanyNotetypesIdEndpoint object.
+        """
+        child = CompanyNotetypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CompanyNoteType]:
+        """
+        Performs a GET request against the /company/noteTypes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CompanyNoteType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CompanyNoteType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CompanyNoteType]:
+        """
+        Performs a GET request against the /company/noteTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CompanyNoteType]: The parsed response data.
+        """
+        return self._parse_many(CompanyNoteType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CompanyNoteType:
+        """
+        Performs a POST request against the /company/noteTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CompanyNoteType: The parsed response data.
+        """
+        return self._parse_one(CompanyNoteType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyNotetypesCountEndpoint:
+        """
+        The CompanyNotetypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyNotetypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyNotetypesInfoEndpoint:
+        """
+        The CompanyNotetypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyNotetypesInfoEndpoint(self.client, parent_endpoint=self))
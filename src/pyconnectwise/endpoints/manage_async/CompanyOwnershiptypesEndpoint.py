@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyOwnershiptypesCountEndpoint import CompanyOwnershiptypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyOwnershiptypesIdEndpoint import CompanyOwnershiptypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyOwnershiptypesInfoEndpoint import CompanyOwnershiptypesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import OwnershipType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyOwnershiptypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[OwnershipType], ConnectWiseManageRequestParams],
+    IAsyncPostable[OwnershipType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[OwnershipType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "ownershipTypes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[OwnershipType])
+        IAsyncPostable.__init__(self, OwnershipType)
+        IAsyncPaginateable.__init__(self, OwnershipType)
+
+    def id(self, _id: int) -> CompanyOwnershiptypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyOwnershiptypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyOwnershiptypesIdEndpoint: The initialized CompanyOwnershiptypesIdEndpoint object.
+        """
+        child = CompanyOwnershiptypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[OwnershipType]:
+        """
+        Performs a GET request against the /company/ownershipTypes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[OwnershipType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), OwnershipType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[OwnershipType]:
+        """
+        Performs a GET request against the /company/ownershipTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[OwnershipType]: The parsed response data.
+        """
+        return self._parse_many(OwnershipType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> OwnershipType:
+        """
+        Performs a POST request against the /company/ownershipTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            OwnershipType: The parsed response data.
+        """
+        return self._parse_one(OwnershipType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyOwnershiptypesCountEndpoint:
+        """
+        The CompanyOwnershiptypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyOwnershiptypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyOwnershiptypesInfoEndpoint:
+        """
+        The CompanyOwnershiptypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyOwnershiptypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,128 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsCopyEndpoint import (
+    CompanyPortalconfigurationsCopyEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsCountEndpoint import (
+    CompanyPortalconfigurationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsIdEndpoint import (
+    CompanyPortalconfigurationsIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsInvoicesetupEndpoint import (
+    CompanyPortalconfigurationsInvoicesetupEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import PortalConfiguration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyPortalconfigurationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[PortalConfiguration], ConnectWiseManageRequestParams],
+    IAsyncPostable[PortalConfiguration, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PortalConfiguration, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "portalConfigurations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[PortalConfiguration])
+        IAsyncPostable.__init__(self, PortalConfiguration)
+        IAsyncPaginateable.__init__(self, PortalConfiguration)
+
+    def id(self, _id: int) -> CompanyPortalconfigurationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyPortalconfigurationsIdEndpoint: The initialized CompanyPortalconfigurationsIdEndpoint object.
+        """
+        child = CompanyPortalconfigurationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PortalConfiguration]:
+        """
+        Performs a GET request against the /company/portalConfigurations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PortalConfiguration]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), PortalConfiguration, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[PortalConfiguration]:
+        """
+        Performs a GET request against the /company/portalConfigurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PortalConfiguration]: The parsed response data.
+        """
+        return self._parse_many(
+            PortalConfiguration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> PortalConfiguration:
+        """
+        Performs a POST request against the /company/portalConfigurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            PortalConfiguration, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def copy(self) -> CompanyPortalconfigurationsCopyEndpoint:
+        """
+        The CompanyPortalconfigurationsCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyPortalconfigurationsCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def count(self) -> CompanyPortalconfigurationsCountEndpoint:
+        """
+        The CompanyPortalconfigurationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def invoice_setup(self) -> CompanyPortalconfigurationsInvoicesetupEndpoint:
+        """
+        The CompanyPortalconfigurationsInvoicesetupEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsInvoicesetupEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,166 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsIdInvoicesetupsEndpoint import (
+    CompanyPortalconfigurationsIdInvoicesetupsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsIdOpportunitysetupsEndpoint import (
+    CompanyPortalconfigurationsIdOpportunitysetupsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint import (
+    CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsIdProjectsetupsEndpoint import (
+    CompanyPortalconfigurationsIdProjectsetupsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsIdServicesetupsEndpoint import (
+    CompanyPortalconfigurationsIdServicesetupsEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import PortalConfiguration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyPortalconfigurationsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[PortalConfiguration, ConnectWiseManageRequestParams],
+    IAsyncPatchable[PortalConfiguration, ConnectWiseManageRequestParams],
+    IAsyncPuttable[PortalConfiguration, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PortalConfiguration, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, PortalConfiguration)
+        IAsyncPatchable.__init__(self, PortalConfiguration)
+        IAsyncPuttable.__init__(self, PortalConfiguration)
+        IAsyncPaginateable.__init__(self, PortalConfiguration)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PortalConfiguration]:
+        """
+        Performs a GET request against the /company/portalConfigurations/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PortalConfiguration]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), PortalConfiguration, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /company/portalConfigurations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> PortalConfiguration:
+        """
+        Performs a GET request against the /company/portalConfigurations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            PortalConfiguration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> PortalConfiguration:
+        """
+        Performs a PATCH request against the /company/portalConfigurations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            PortalConfiguration, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> PortalConfiguration:
+        """
+        Performs a PUT request against the /company/portalConfigurations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            PortalConfiguration, (await super()._make_request("PUT", data=data, params=params)).content
+        )
+
+    @cached_property
+    def invoice_setups(self) -> CompanyPortalconfigurationsIdInvoicesetupsEndpoint:
+        """
+        The CompanyPortalconfigurationsIdInvoicesetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdInvoicesetupsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def opportunity_setups(self) -> CompanyPortalconfigurationsIdOpportunitysetupsEndpoint:
+        """
+        The CompanyPortalconfigurationsIdOpportunitysetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdOpportunitysetupsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def password_email_setups(self) -> CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint:
+        """
+        The CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def project_setups(self) -> CompanyPortalconfigurationsIdProjectsetupsEndpoint:
+        """
+        The CompanyPortalconfigurationsIdProjectsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdProjectsetupsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def service_setups(self) -> CompanyPortalconfigurationsIdServicesetupsEndpoint:
+        """
+        The CompanyPortalconfigurationsIdServicesetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsIdServicesetupsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,117 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint import (
+    CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import PortalConfigurationOpportunitySetup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyPortalconfigurationsIdOpportunitysetupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[PortalConfigurationOpportunitySetup], ConnectWiseManageRequestParams],
+    IAsyncPatchable[PortalConfigurationOpportunitySetup, ConnectWiseManageRequestParams],
+    IAsyncPuttable[PortalConfigurationOpportunitySetup, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PortalConfigurationOpportunitySetup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "opportunitySetups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[PortalConfigurationOpportunitySetup])
+        IAsyncPatchable.__init__(self, PortalConfigurationOpportunitySetup)
+        IAsyncPuttable.__init__(self, PortalConfigurationOpportunitySetup)
+        IAsyncPaginateable.__init__(self, PortalConfigurationOpportunitySetup)
+
+    def id(self, _id: int) -> CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint: The initialized CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint object.
+        """
+        child = CompanyPortalconfigurationsIdOpportunitysetupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PortalConfigurationOpportunitySetup]:
+        """
+        Performs a GET request against the /company/portalConfigurations/{id}/opportunitySetups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PortalConfigurationOpportunitySetup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            PortalConfigurationOpportunitySetup,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[PortalConfigurationOpportunitySetup]:
+        """
+        Performs a GET request against the /company/portalConfigurations/{id}/opportunitySetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PortalConfigurationOpportunitySetup]: The parsed response data.
+        """
+        return self._parse_many(
+            PortalConfigurationOpportunitySetup, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> PortalConfigurationOpportunitySetup:
+        """
+        Performs a PATCH request against the /company/portalConfigurations/{id}/opportunitySetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalConfigurationOpportunitySetup: The parsed response data.
+        """
+        return self._parse_one(
+            PortalConfigurationOpportunitySetup,
+            (await super()._make_request("PATCH", data=data, params=params)).content,
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> PortalConfigurationOpportunitySetup:
+        """
+        Performs a PUT request against the /company/portalConfigurations/{id}/opportunitySetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalConfigurationOpportunitySetup: The parsed response data.
+        """
+        return self._parse_one(
+            PortalConfigurationOpportunitySetup, (await super()._make_request("PUT", data=data, params=params)).content
+        )
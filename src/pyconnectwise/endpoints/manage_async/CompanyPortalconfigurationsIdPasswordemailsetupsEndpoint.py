@@ -0,0 +1,81 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint import (
+    CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import PortalConfigurationPasswordEmailSetup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyPortalconfigurationsIdPasswordemailsetupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[PortalConfigurationPasswordEmailSetup], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PortalConfigurationPasswordEmailSetup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "passwordEmailSetups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[PortalConfigurationPasswordEmailSetup])
+        IAsyncPaginateable.__init__(self, PortalConfigurationPasswordEmailSetup)
+
+    def id(self, _id: int) -> CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint: The initialized CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint object.
+        """
+        child = CompanyPortalconfigurationsIdPasswordemailsetupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PortalConfigurationPasswordEmailSetup]:
+        """
+        Performs a GET request against the /company/portalConfigurations/{id}/passwordEmailSetups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PortalConfigurationPasswordEmailSetup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            PortalConfigurationPasswordEmailSetup,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[PortalConfigurationPasswordEmailSetup]:
+        """
+        Performs a GET request against the /company/portalConfigurations/{id}/passwordEmailSetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PortalConfigurationPasswordEmailSetup]: The parsed response data.
+        """
+        return self._parse_many(
+            PortalConfigurationPasswordEmailSetup,
+            (await super()._make_request("GET", data=data, params=params)).content,
+        )
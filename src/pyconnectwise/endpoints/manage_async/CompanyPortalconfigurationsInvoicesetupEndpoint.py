@@ -0,0 +1,24 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint import (
+    CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyPortalconfigurationsInvoicesetupEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "invoiceSetup", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def payment_processors(self) -> CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint:
+        """
+        The CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            CompanyPortalconfigurationsInvoicesetupPaymentprocessorsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,95 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import PortalSecuritySetting
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyPortalsecuritysettingsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[PortalSecuritySetting, ConnectWiseManageRequestParams],
+    IAsyncPatchable[PortalSecuritySetting, ConnectWiseManageRequestParams],
+    IAsyncPuttable[PortalSecuritySetting, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PortalSecuritySetting, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, PortalSecuritySetting)
+        IAsyncPatchable.__init__(self, PortalSecuritySetting)
+        IAsyncPuttable.__init__(self, PortalSecuritySetting)
+        IAsyncPaginateable.__init__(self, PortalSecuritySetting)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PortalSecuritySetting]:
+        """
+        Performs a GET request against the /company/portalSecuritySettings/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PortalSecuritySetting]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), PortalSecuritySetting, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> PortalSecuritySetting:
+        """
+        Performs a GET request against the /company/portalSecuritySettings/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalSecuritySetting: The parsed response data.
+        """
+        return self._parse_one(
+            PortalSecuritySetting, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> PortalSecuritySetting:
+        """
+        Performs a PATCH request against the /company/portalSecuritySettings/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalSecuritySetting: The parsed response data.
+        """
+        return self._parse_one(
+            PortalSecuritySetting, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> PortalSecuritySetting:
+        """
+        Performs a PUT request against the /company/portalSecuritySettings/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalSecuritySetting: The parsed response data.
+        """
+        return self._parse_one(
+            PortalSecuritySetting, (await super()._make_request("PUT", data=data, params=params)).content
+        )
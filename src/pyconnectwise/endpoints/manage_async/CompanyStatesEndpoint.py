@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyStatesCountEndpoint import CompanyStatesCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyStatesIdEndpoint import CompanyStatesIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyStatesInfoEndpoint import CompanyStatesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import State
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyStatesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[State], ConnectWiseManageRequestParams],
+    IAsyncPostable[State, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[State, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "states", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[State])
+        IAsyncPostable.__init__(self, State)
+        IAsyncPaginateable.__init__(self, State)
+
+    def id(self, _id: int) -> CompanyStatesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyStatesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyStatesIdEndpoint: The initialized CompanyStatesIdEndpoint object.
+        """
+        child = CompanyStatesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[State]:
+        """
+        Performs a GET request against the /company/states endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[State]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), State, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[State]:
+        """
+        Performs a GET request against the /company/states endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[State]: The parsed response data.
+        """
+        return self._parse_many(State, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> State:
+        """
+        Performs a POST request against the /company/states endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            State: The parsed response data.
+        """
+        return self._parse_one(State, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyStatesCountEndpoint:
+        """
+        The CompanyStatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyStatesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyStatesInfoEndpoint:
+        """
+        The CompanyStatesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyStatesInfoEndpoint(self.client, parent_endpoint=self))
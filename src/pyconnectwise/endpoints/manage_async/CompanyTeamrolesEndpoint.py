@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyTeamrolesCountEndpoint import CompanyTeamrolesCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyTeamrolesIdEndpoint import CompanyTeamrolesIdEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyTeamrolesInfoEndpoint import CompanyTeamrolesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TeamRole
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyTeamrolesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TeamRole], ConnectWiseManageRequestParams],
+    IAsyncPostable[TeamRole, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TeamRole, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "teamRoles", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TeamRole])
+        IAsyncPostable.__init__(self, TeamRole)
+        IAsyncPaginateable.__init__(self, TeamRole)
+
+    def id(self, _id: int) -> CompanyTeamrolesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyTeamrolesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyTeamrolesIdEndpoint: The initialized CompanyTeamrolesIdEndpoint object.
+        """
+        child = CompanyTeamrolesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TeamRole]:
+        """
+        Performs a GET request against the /company/teamRoles endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TeamRole]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TeamRole, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TeamRole]:
+        """
+        Performs a GET request against the /company/teamRoles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TeamRole]: The parsed response data.
+        """
+        return self._parse_many(TeamRole, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TeamRole:
+        """
+        Performs a POST request against the /company/teamRoles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TeamRole: The parsed response data.
+        """
+        return self._parse_one(TeamRole, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyTeamrolesCountEndpoint:
+        """
+        The CompanyTeamrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTeamrolesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> CompanyTeamrolesInfoEndpoint:
+        """
+        The CompanyTeamrolesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTeamrolesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,92 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyTracksCountEndpoint import CompanyTracksCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyTracksIdEndpoint import CompanyTracksIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Track
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyTracksEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Track], ConnectWiseManageRequestParams],
+    IAsyncPostable[Track, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Track, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "tracks", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Track])
+        IAsyncPostable.__init__(self, Track)
+        IAsyncPaginateable.__init__(self, Track)
+
+    def id(self, _id: int) -> CompanyTracksIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyTracksIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyTracksIdEndpoint: The initialized CompanyTracksIdEndpoint object.
+        """
+        child = CompanyTracksIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Track]:
+        """
+        Performs a GET request against the /company/tracks endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Track]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Track, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Track]:
+        """
+        Performs a GET request against the /company/tracks endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Track]: The parsed response data.
+        """
+        return self._parse_many(Track, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Track:
+        """
+        Performs a POST request against the /company/tracks endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Track: The parsed response data.
+        """
+        return self._parse_one(Track, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyTracksCountEndpoint:
+        """
+        The CompanyTracksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTracksCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyTracksIdActionsCountEndpoint import CompanyTracksIdActionsCountEndpoint
+from pyconnectwise.endpoints.manage_async.CompanyTracksIdActionsIdEndpoint import CompanyTracksIdActionsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TrackAction
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class CompanyTracksIdActionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TrackAction], ConnectWiseManageRequestParams],
+    IAsyncPostable[TrackAction, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TrackAction, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "actions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TrackAction])
+        IAsyncPostable.__init__(self, TrackAction)
+        IAsyncPaginateable.__init__(self, TrackAction)
+
+    def id(self, _id: int) -> CompanyTracksIdActionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized CompanyTracksIdActionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            CompanyTracksIdActionsIdEndpoint: The initialized CompanyTracksIdActionsIdEndpoint object.
+        """
+        child = CompanyTracksIdActionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TrackAction]:
+        """
+        Performs a GET request against the /company/tracks/{id}/actions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TrackAction]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TrackAction, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TrackAction]:
+        """
+        Performs a GET request against the /company/tracks/{id}/actions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TrackAction]: The parsed response data.
+        """
+        return self._parse_many(TrackAction, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TrackAction:
+        """
+        Performs a POST request against the /company/tracks/{id}/actions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TrackAction: The parsed response data.
+        """
+        return self._parse_one(TrackAction, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> CompanyTracksIdActionsCountEndpoint:
+        """
+        The CompanyTracksIdActionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(CompanyTracksIdActionsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ConfigurationsTypesIdEndpoint import ConfigurationsTypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.ConfigurationsTypesInfoEndpoint import ConfigurationsTypesInfoEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ConfigurationsTypesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "types", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ConfigurationsTypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ConfigurationsTypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ConfigurationsTypesIdEndpoint: The initialized ConfigurationsTypesIdEndpoint object.
+        """
+        child = ConfigurationsTypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def info(self) -> ConfigurationsTypesInfoEndpoint:
+        """
+        The ConfigurationsTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ConfigurationsTypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,40 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ConfigurationsTypesIdQuestionsIdEndpoint import (
+    ConfigurationsTypesIdQuestionsIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ConfigurationsTypesIdQuestionsInfoEndpoint import (
+    ConfigurationsTypesIdQuestionsInfoEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ConfigurationsTypesIdQuestionsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "questions", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ConfigurationsTypesIdQuestionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ConfigurationsTypesIdQuestionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ConfigurationsTypesIdQuestionsIdEndpoint: The initialized ConfigurationsTypesIdQuestionsIdEndpoint object.
+        """
+        child = ConfigurationsTypesIdQuestionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def info(self) -> ConfigurationsTypesIdQuestionsInfoEndpoint:
+        """
+        The ConfigurationsTypesIdQuestionsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ConfigurationsTypesIdQuestionsInfoEndpoint(self.client, parent_endpoint=self)
+        )
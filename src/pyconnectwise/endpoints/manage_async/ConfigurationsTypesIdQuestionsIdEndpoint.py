@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ConfigurationsTypesIdQuestionsIdInfoEndpoint import (
+    ConfigurationsTypesIdQuestionsIdInfoEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ConfigurationsTypesIdQuestionsIdValuesEndpoint import (
+    ConfigurationsTypesIdQuestionsIdValuesEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ConfigurationsTypesIdQuestionsIdEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def info(self) -> ConfigurationsTypesIdQuestionsIdInfoEndpoint:
+        """
+        The ConfigurationsTypesIdQuestionsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ConfigurationsTypesIdQuestionsIdInfoEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def values(self) -> ConfigurationsTypesIdQuestionsIdValuesEndpoint:
+        """
+        The ConfigurationsTypesIdQuestionsIdValuesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ConfigurationsTypesIdQuestionsIdValuesEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,40 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ConfigurationsTypesIdQuestionsIdValuesIdEndpoint import (
+    ConfigurationsTypesIdQuestionsIdValuesIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint import (
+    ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ConfigurationsTypesIdQuestionsIdValuesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "values", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ConfigurationsTypesIdQuestionsIdValuesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ConfigurationsTypesIdQuestionsIdValuesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ConfigurationsTypesIdQuestionsIdValuesIdEndpoint: The initialized ConfigurationsTypesIdQuestionsIdValuesIdEndpoint object.
+        """
+        child = ConfigurationsTypesIdQuestionsIdValuesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def info(self) -> ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint:
+        """
+        The ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ConfigurationsTypesIdQuestionsIdValuesInfoEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,60 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseClassificationsEndpoint import ExpenseClassificationsEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseEntriesEndpoint import ExpenseEntriesEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseInfoEndpoint import ExpenseInfoEndpoint
+from pyconnectwise.endpoints.manage_async.ExpensePaymenttypesEndpoint import ExpensePaymenttypesEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseReportsEndpoint import ExpenseReportsEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseTypesEndpoint import ExpenseTypesEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ExpenseEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "expense", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def classifications(self) -> ExpenseClassificationsEndpoint:
+        """
+        The ExpenseClassificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseClassificationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def entries(self) -> ExpenseEntriesEndpoint:
+        """
+        The ExpenseEntriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseEntriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ExpenseInfoEndpoint:
+        """
+        The ExpenseInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def payment_types(self) -> ExpensePaymenttypesEndpoint:
+        """
+        The ExpensePaymenttypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpensePaymenttypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reports(self) -> ExpenseReportsEndpoint:
+        """
+        The ExpenseReportsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseReportsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> ExpenseTypesEndpoint:
+        """
+        The ExpenseTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseTypesEndpoint(self.client, parent_endpoint=self))
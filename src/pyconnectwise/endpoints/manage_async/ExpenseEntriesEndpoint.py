@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseEntriesCountEndpoint import ExpenseEntriesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseEntriesIdEndpoint import ExpenseEntriesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ExpenseEntry
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ExpenseEntriesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ExpenseEntry], ConnectWiseManageRequestParams],
+    IAsyncPostable[ExpenseEntry, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ExpenseEntry, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "entries", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ExpenseEntry])
+        IAsyncPostable.__init__(self, ExpenseEntry)
+        IAsyncPaginateable.__init__(self, ExpenseEntry)
+
+    def id(self, _id: int) -> ExpenseEntriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ExpenseEntriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ExpenseEntriesIdEndpoint: The initialized ExpenseEntriesIdEndpoint object.
+        """
+        child = ExpenseEntriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ExpenseEntry]:
+        """
+        Performs a GET request against the /expense/entries endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ExpenseEntry]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ExpenseEntry, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ExpenseEntry]:
+        """
+        Performs a GET request against the /expense/entries endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ExpenseEntry]: The parsed response data.
+        """
+        return self._parse_many(ExpenseEntry, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ExpenseEntry:
+        """
+        Performs a POST request against the /expense/entries endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ExpenseEntry: The parsed response data.
+        """
+        return self._parse_one(ExpenseEntry, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ExpenseEntriesCountEndpoint:
+        """
+        The ExpenseEntriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseEntriesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ExpensePaymenttypesCountEndpoint import ExpensePaymenttypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ExpensePaymenttypesIdEndpoint import ExpensePaymenttypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.ExpensePaymenttypesInfoEndpoint import ExpensePaymenttypesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import PaymentType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ExpensePaymenttypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[PaymentType], ConnectWiseManageRequestParams],
+    IAsyncPostable[PaymentType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PaymentType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "paymentTypes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[PaymentType])
+        IAsyncPostable.__init__(self, PaymentType)
+        IAsyncPaginateable.__init__(self, PaymentType)
+
+    def id(self, _id: int) -> ExpensePaymenttypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ExpensePaymenttypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ExpensePaymenttypesIdEndpoint: The initialized ExpensePaymenttypesIdEndpoint object.
+        """
+        child = ExpensePaymenttypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PaymentType]:
+        """
+        Performs a GET request against the /expense/paymentTypes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PaymentType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), PaymentType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[PaymentType]:
+        """
+        Performs a GET request against the /expense/paymentTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PaymentType]: The parsed response data.
+        """
+        return self._parse_many(PaymentType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> PaymentType:
+        """
+        Performs a POST request against the /expense/paymentTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PaymentType: The parsed response data.
+        """
+        return self._parse_one(PaymentType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ExpensePaymenttypesCountEndpoint:
+        """
+        The ExpensePaymenttypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpensePaymenttypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ExpensePaymenttypesInfoEndpoint:
+        """
+        The ExpensePaymenttypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpensePaymenttypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,82 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseReportsIdAuditsEndpoint import ExpenseReportsIdAuditsEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseReportsIdReverseEndpoint import ExpenseReportsIdReverseEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseReportsIdSubmitEndpoint import ExpenseReportsIdSubmitEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import ExpenseReport
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ExpenseReportsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[ExpenseReport, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ExpenseReport, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, ExpenseReport)
+        IAsyncPaginateable.__init__(self, ExpenseReport)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ExpenseReport]:
+        """
+        Performs a GET request against the /expense/reports/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ExpenseReport]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ExpenseReport, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ExpenseReport:
+        """
+        Performs a GET request against the /expense/reports/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ExpenseReport: The parsed response data.
+        """
+        return self._parse_one(ExpenseReport, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def audits(self) -> ExpenseReportsIdAuditsEndpoint:
+        """
+        The ExpenseReportsIdAuditsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseReportsIdAuditsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reverse(self) -> ExpenseReportsIdReverseEndpoint:
+        """
+        The ExpenseReportsIdReverseEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseReportsIdReverseEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def submit(self) -> ExpenseReportsIdSubmitEndpoint:
+        """
+        The ExpenseReportsIdSubmitEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseReportsIdSubmitEndpoint(self.client, parent_endpoint=self))
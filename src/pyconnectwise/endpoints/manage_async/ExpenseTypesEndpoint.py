@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseTypesCountEndpoint import ExpenseTypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseTypesIdEndpoint import ExpenseTypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.ExpenseTypesInfoEndpoint import ExpenseTypesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ExpenseType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ExpenseTypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ExpenseType], ConnectWiseManageRequestParams],
+    IAsyncPostable[ExpenseType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ExpenseType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "types", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ExpenseType])
+        IAsyncPostable.__init__(self, ExpenseType)
+        IAsyncPaginateable.__init__(self, ExpenseType)
+
+    def id(self, _id: int) -> ExpenseTypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ExpenseTypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ExpenseTypesIdEndpoint: The initialized ExpenseTypesIdEndpoint object.
+        """
+        child = ExpenseTypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ExpenseType]:
+        """
+        Performs a GET request against the /expense/types endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ExpenseType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ExpenseType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ExpenseType]:
+        """
+        Performs a GET request against the /expense/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ExpenseType]: The parsed response data.
+        """
+        return self._parse_many(ExpenseType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ExpenseType:
+        """
+        Performs a POST request against the /expense/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ExpenseType: The parsed response data.
+        """
+        return self._parse_one(ExpenseType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ExpenseTypesCountEndpoint:
+        """
+        The ExpenseTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ExpenseTypesInfoEndpoint:
+        """
+        The ExpenseTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ExpenseTypesInfoEndpoint(self.client, parent_endpoint=self))
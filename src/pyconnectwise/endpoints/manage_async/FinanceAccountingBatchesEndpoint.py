@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingBatchesCountEndpoint import (
+    FinanceAccountingBatchesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAccountingBatchesIdEndpoint import FinanceAccountingBatchesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AccountingBatch, GLExport
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAccountingBatchesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AccountingBatch], ConnectWiseManageRequestParams],
+    IAsyncPostable[GLExport, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AccountingBatch, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "batches", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AccountingBatch])
+        IAsyncPostable.__init__(self, GLExport)
+        IAsyncPaginateable.__init__(self, AccountingBatch)
+
+    def id(self, _id: int) -> FinanceAccountingBatchesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAccountingBatchesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAccountingBatchesIdEndpoint: The initialized FinanceAccountingBatchesIdEndpoint object.
+        """
+        child = FinanceAccountingBatchesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AccountingBatch]:
+        """
+        Performs a GET request against the /finance/accounting/batches endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AccountingBatch]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AccountingBatch, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AccountingBatch]:
+        """
+        Performs a GET request against the /finance/accounting/batches endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AccountingBatch]: The parsed response data.
+        """
+        return self._parse_many(AccountingBatch, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> GLExport:
+        """
+        Performs a POST request against the /finance/accounting/batches endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            GLExport: The parsed response data.
+        """
+        return self._parse_one(GLExport, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceAccountingBatchesCountEndpoint:
+        """
+        The FinanceAccountingBatchesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingBatchesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,92 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingBatchesIdEntriesEndpoint import (
+    FinanceAccountingBatchesIdEntriesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAccountingBatchesIdExportEndpoint import (
+    FinanceAccountingBatchesIdExportEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import AccountingBatch
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAccountingBatchesIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[AccountingBatch, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AccountingBatch, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, AccountingBatch)
+        IAsyncPaginateable.__init__(self, AccountingBatch)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AccountingBatch]:
+        """
+        Performs a GET request against the /finance/accounting/batches/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AccountingBatch]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AccountingBatch, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /finance/accounting/batches/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AccountingBatch:
+        """
+        Performs a GET request against the /finance/accounting/batches/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AccountingBatch: The parsed response data.
+        """
+        return self._parse_one(AccountingBatch, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def entries(self) -> FinanceAccountingBatchesIdEntriesEndpoint:
+        """
+        The FinanceAccountingBatchesIdEntriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingBatchesIdEntriesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def export(self) -> FinanceAccountingBatchesIdExportEndpoint:
+        """
+        The FinanceAccountingBatchesIdExportEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingBatchesIdExportEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,86 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingBatchesIdEntriesCountEndpoint import (
+    FinanceAccountingBatchesIdEntriesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAccountingBatchesIdEntriesIdEndpoint import (
+    FinanceAccountingBatchesIdEntriesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import BatchEntry
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAccountingBatchesIdEntriesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[BatchEntry], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[BatchEntry, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "entries", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[BatchEntry])
+        IAsyncPaginateable.__init__(self, BatchEntry)
+
+    def id(self, _id: int) -> FinanceAccountingBatchesIdEntriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAccountingBatchesIdEntriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAccountingBatchesIdEntriesIdEndpoint: The initialized FinanceAccountingBatchesIdEntriesIdEndpoint object.
+        """
+        child = FinanceAccountingBatchesIdEntriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[BatchEntry]:
+        """
+        Performs a GET request against the /finance/accounting/batches/{id}/entries endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[BatchEntry]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), BatchEntry, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[BatchEntry]:
+        """
+        Performs a GET request against the /finance/accounting/batches/{id}/entries endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[BatchEntry]: The parsed response data.
+        """
+        return self._parse_many(BatchEntry, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceAccountingBatchesIdEntriesCountEndpoint:
+        """
+        The FinanceAccountingBatchesIdEntriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingBatchesIdEntriesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,64 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingBatchesEndpoint import FinanceAccountingBatchesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingExportEndpoint import FinanceAccountingExportEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingUnpostedexpensesEndpoint import (
+    FinanceAccountingUnpostedexpensesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAccountingUnpostedinvoicesEndpoint import (
+    FinanceAccountingUnpostedinvoicesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAccountingUnpostedprocurementEndpoint import (
+    FinanceAccountingUnpostedprocurementEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAccountingEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "accounting", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def batches(self) -> FinanceAccountingBatchesEndpoint:
+        """
+        The FinanceAccountingBatchesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingBatchesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def export(self) -> FinanceAccountingExportEndpoint:
+        """
+        The FinanceAccountingExportEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingExportEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def unpostedexpenses(self) -> FinanceAccountingUnpostedexpensesEndpoint:
+        """
+        The FinanceAccountingUnpostedexpensesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedexpensesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def unpostedinvoices(self) -> FinanceAccountingUnpostedinvoicesEndpoint:
+        """
+        The FinanceAccountingUnpostedinvoicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedinvoicesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def unpostedprocurement(self) -> FinanceAccountingUnpostedprocurementEndpoint:
+        """
+        The FinanceAccountingUnpostedprocurementEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedprocurementEndpoint(self.client, parent_endpoint=self)
+        )
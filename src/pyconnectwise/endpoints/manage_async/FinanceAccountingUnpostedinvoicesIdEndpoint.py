@@ -0,0 +1,70 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingUnpostedinvoicesIdTaxablelevelsEndpoint import (
+    FinanceAccountingUnpostedinvoicesIdTaxablelevelsEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import UnpostedInvoice
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAccountingUnpostedinvoicesIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[UnpostedInvoice, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[UnpostedInvoice, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, UnpostedInvoice)
+        IAsyncPaginateable.__init__(self, UnpostedInvoice)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[UnpostedInvoice]:
+        """
+        Performs a GET request against the /finance/accounting/unpostedinvoices/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[UnpostedInvoice]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), UnpostedInvoice, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> UnpostedInvoice:
+        """
+        Performs a GET request against the /finance/accounting/unpostedinvoices/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            UnpostedInvoice: The parsed response data.
+        """
+        return self._parse_one(UnpostedInvoice, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def taxable_levels(self) -> FinanceAccountingUnpostedinvoicesIdTaxablelevelsEndpoint:
+        """
+        The FinanceAccountingUnpostedinvoicesIdTaxablelevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedinvoicesIdTaxablelevelsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,93 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingUnpostedinvoicesIdTaxablelevelsCountEndpoint import (
+    FinanceAccountingUnpostedinvoicesIdTaxablelevelsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAccountingUnpostedinvoicesIdTaxablelevelsIdEndpoint import (
+    FinanceAccountingUnpostedinvoicesIdTaxablelevelsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import UnpostedInvoiceTaxableLevel
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAccountingUnpostedinvoicesIdTaxablelevelsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[UnpostedInvoiceTaxableLevel], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[UnpostedInvoiceTaxableLevel, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "taxableLevels", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[UnpostedInvoiceTaxableLevel])
+        IAsyncPaginateable.__init__(self, UnpostedInvoiceTaxableLevel)
+
+    def id(self, _id: int) -> FinanceAccountingUnpostedinvoicesIdTaxablelevelsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAccountingUnpostedinvoicesIdTaxablelevelsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAccountingUnpostedinvoicesIdTaxablelevelsIdEndpoint: The initialized FinanceAccountingUnpostedinvoicesIdTaxablelevelsIdEndpoint object.
+        """
+        child = FinanceAccountingUnpostedinvoicesIdTaxablelevelsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[UnpostedInvoiceTaxableLevel]:
+        """
+        Performs a GET request against the /finance/accounting/unpostedinvoices/{id}/taxableLevels endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[UnpostedInvoiceTaxableLevel]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            UnpostedInvoiceTaxableLevel,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[UnpostedInvoiceTaxableLevel]:
+        """
+        Performs a GET request against the /finance/accounting/unpostedinvoices/{id}/taxableLevels endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[UnpostedInvoiceTaxableLevel]: The parsed response data.
+        """
+        return self._parse_many(
+            UnpostedInvoiceTaxableLevel, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAccountingUnpostedinvoicesIdTaxablelevelsCountEndpoint:
+        """
+        The FinanceAccountingUnpostedinvoicesIdTaxablelevelsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedinvoicesIdTaxablelevelsCountEndpoint(self.client, parent_endpoint=self)
+        )
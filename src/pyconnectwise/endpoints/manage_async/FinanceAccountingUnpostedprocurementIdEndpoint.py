@@ -0,0 +1,72 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint import (
+    FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import UnpostedProcurement
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAccountingUnpostedprocurementIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[UnpostedProcurement, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[UnpostedProcurement, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, UnpostedProcurement)
+        IAsyncPaginateable.__init__(self, UnpostedProcurement)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[UnpostedProcurement]:
+        """
+        Performs a GET request against the /finance/accounting/unpostedprocurement/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[UnpostedProcurement]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), UnpostedProcurement, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> UnpostedProcurement:
+        """
+        Performs a GET request against the /finance/accounting/unpostedprocurement/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            UnpostedProcurement: The parsed response data.
+        """
+        return self._parse_one(
+            UnpostedProcurement, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def taxable_levels(self) -> FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint:
+        """
+        The FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAccountingUnpostedprocurementIdTaxablelevelsEndpoint(self.client, parent_endpoint=self)
+        )
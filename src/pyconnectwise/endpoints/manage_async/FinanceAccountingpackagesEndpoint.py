@@ -0,0 +1,84 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingpackagesCountEndpoint import (
+    FinanceAccountingpackagesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAccountingpackagesIdEndpoint import FinanceAccountingpackagesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import AccountingPackage
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAccountingpackagesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AccountingPackage], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AccountingPackage, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "accountingPackages", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AccountingPackage])
+        IAsyncPaginateable.__init__(self, AccountingPackage)
+
+    def id(self, _id: int) -> FinanceAccountingpackagesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAccountingpackagesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAccountingpackagesIdEndpoint: The initialized FinanceAccountingpackagesIdEndpoint object.
+        """
+        child = FinanceAccountingpackagesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AccountingPackage]:
+        """
+        Performs a GET request against the /finance/accountingPackages endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AccountingPackage]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AccountingPackage, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AccountingPackage]:
+        """
+        Performs a GET request against the /finance/accountingPackages endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AccountingPackage]: The parsed response data.
+        """
+        return self._parse_many(
+            AccountingPackage, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAccountingpackagesCountEndpoint:
+        """
+        The FinanceAccountingpackagesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingpackagesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsCountEndpoint import FinanceAgreementsCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdEndpoint import FinanceAgreementsIdEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsTypesEndpoint import FinanceAgreementsTypesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Agreement
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Agreement], ConnectWiseManageRequestParams],
+    IAsyncPostable[Agreement, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Agreement, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "agreements", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Agreement])
+        IAsyncPostable.__init__(self, Agreement)
+        IAsyncPaginateable.__init__(self, Agreement)
+
+    def id(self, _id: int) -> FinanceAgreementsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAgreementsIdEndpoint: The initialized FinanceAgreementsIdEndpoint object.
+        """
+        child = FinanceAgreementsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Agreement]:
+        """
+        Performs a GET request against the /finance/agreements endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Agreement]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Agreement, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Agreement]:
+        """
+        Performs a GET request against the /finance/agreements endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Agreement]: The parsed response data.
+        """
+        return self._parse_many(Agreement, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Agreement:
+        """
+        Performs a POST request against the /finance/agreements endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Agreement: The parsed response data.
+        """
+        return self._parse_one(Agreement, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsCountEndpoint:
+        """
+        The FinanceAgreementsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> FinanceAgreementsTypesEndpoint:
+        """
+        The FinanceAgreementsTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsTypesEndpoint(self.client, parent_endpoint=self))
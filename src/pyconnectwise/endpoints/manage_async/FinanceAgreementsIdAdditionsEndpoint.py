@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdAdditionsCountEndpoint import (
+    FinanceAgreementsIdAdditionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdAdditionsIdEndpoint import (
+    FinanceAgreementsIdAdditionsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Addition
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementsIdAdditionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Addition], ConnectWiseManageRequestParams],
+    IAsyncPostable[Addition, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Addition, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "additions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Addition])
+        IAsyncPostable.__init__(self, Addition)
+        IAsyncPaginateable.__init__(self, Addition)
+
+    def id(self, _id: int) -> FinanceAgreementsIdAdditionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdAdditionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAgreementsIdAdditionsIdEndpoint: The initialized FinanceAgreementsIdAdditionsIdEndpoint object.
+        """
+        child = FinanceAgreementsIdAdditionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Addition]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/additions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Addition]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Addition, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Addition]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/additions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Addition]: The parsed response data.
+        """
+        return self._parse_many(Addition, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Addition:
+        """
+        Performs a POST request against the /finance/agreements/{id}/additions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Addition: The parsed response data.
+        """
+        return self._parse_one(Addition, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdAdditionsCountEndpoint:
+        """
+        The FinanceAgreementsIdAdditionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdAdditionsCountEndpoint(self.client, parent_endpoint=self)
+        )
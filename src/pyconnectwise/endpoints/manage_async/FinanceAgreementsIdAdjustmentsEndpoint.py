@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdAdjustmentsCountEndpoint import (
+    FinanceAgreementsIdAdjustmentsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdAdjustmentsIdEndpoint import (
+    FinanceAgreementsIdAdjustmentsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AgreementAdjustment
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementsIdAdjustmentsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AgreementAdjustment], ConnectWiseManageRequestParams],
+    IAsyncPostable[AgreementAdjustment, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AgreementAdjustment, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "adjustments", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AgreementAdjustment])
+        IAsyncPostable.__init__(self, AgreementAdjustment)
+        IAsyncPaginateable.__init__(self, AgreementAdjustment)
+
+    def id(self, _id: int) -> FinanceAgreementsIdAdjustmentsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdAdjustmentsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAgreementsIdAdjustmentsIdEndpoint: The initialized FinanceAgreementsIdAdjustmentsIdEndpoint object.
+        """
+        child = FinanceAgreementsIdAdjustmentsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AgreementAdjustment]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/adjustments endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AgreementAdjustment]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AgreementAdjustment, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AgreementAdjustment]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/adjustments endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AgreementAdjustment]: The parsed response data.
+        """
+        return self._parse_many(
+            AgreementAdjustment, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AgreementAdjustment:
+        """
+        Performs a POST request against the /finance/agreements/{id}/adjustments endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AgreementAdjustment: The parsed response data.
+        """
+        return self._parse_one(
+            AgreementAdjustment, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdAdjustmentsCountEndpoint:
+        """
+        The FinanceAgreementsIdAdjustmentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdAdjustmentsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdBoarddefaultsCountEndpoint import (
+    FinanceAgreementsIdBoarddefaultsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdBoarddefaultsIdEndpoint import (
+    FinanceAgreementsIdBoarddefaultsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import BoardDefault
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementsIdBoarddefaultsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[BoardDefault], ConnectWiseManageRequestParams],
+    IAsyncPostable[BoardDefault, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[BoardDefault, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "boardDefaults", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[BoardDefault])
+        IAsyncPostable.__init__(self, BoardDefault)
+        IAsyncPaginateable.__init__(self, BoardDefault)
+
+    def id(self, _id: int) -> FinanceAgreementsIdBoarddefaultsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdBoarddefaultsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAgreementsIdBoarddefaultsIdEndpoint: The initialized FinanceAgreementsIdBoarddefaultsIdEndpoint object.
+        """
+        child = FinanceAgreementsIdBoarddefaultsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[BoardDefault]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/boardDefaults endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[BoardDefault]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), BoardDefault, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[BoardDefault]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/boardDefaults endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[BoardDefault]: The parsed response data.
+        """
+        return self._parse_many(BoardDefault, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> BoardDefault:
+        """
+        Performs a POST request against the /finance/agreements/{id}/boardDefaults endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BoardDefault: The parsed response data.
+        """
+        return self._parse_one(BoardDefault, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdBoarddefaultsCountEndpoint:
+        """
+        The FinanceAgreementsIdBoarddefaultsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdBoarddefaultsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,190 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdAdditionsEndpoint import (
+    FinanceAgreementsIdAdditionsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdAdjustmentsEndpoint import (
+    FinanceAgreementsIdAdjustmentsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdBoarddefaultsEndpoint import (
+    FinanceAgreementsIdBoarddefaultsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdConfigurationsEndpoint import (
+    FinanceAgreementsIdConfigurationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdSitesEndpoint import FinanceAgreementsIdSitesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdWorkroleexclusionsEndpoint import (
+    FinanceAgreementsIdWorkroleexclusionsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdWorkrolesEndpoint import (
+    FinanceAgreementsIdWorkrolesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdWorktypeexclusionsEndpoint import (
+    FinanceAgreementsIdWorktypeexclusionsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdWorktypesEndpoint import (
+    FinanceAgreementsIdWorktypesEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Agreement
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Agreement, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Agreement, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Agreement, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Agreement, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Agreement)
+        IAsyncPatchable.__init__(self, Agreement)
+        IAsyncPuttable.__init__(self, Agreement)
+        IAsyncPaginateable.__init__(self, Agreement)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Agreement]:
+        """
+        Performs a GET request against the /finance/agreements/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Agreement]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Agreement, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /finance/agreements/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Agreement:
+        """
+        Performs a GET request against the /finance/agreements/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Agreement: The parsed response data.
+        """
+        return self._parse_one(Agreement, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Agreement:
+        """
+        Performs a PATCH request against the /finance/agreements/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Agreement: The parsed response data.
+        """
+        return self._parse_one(Agreement, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Agreement:
+        """
+        Performs a PUT request against the /finance/agreements/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Agreement: The parsed response data.
+        """
+        return self._parse_one(Agreement, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def additions(self) -> FinanceAgreementsIdAdditionsEndpoint:
+        """
+        The FinanceAgreementsIdAdditionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsIdAdditionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def adjustments(self) -> FinanceAgreementsIdAdjustmentsEndpoint:
+        """
+        The FinanceAgreementsIdAdjustmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsIdAdjustmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def board_defaults(self) -> FinanceAgreementsIdBoarddefaultsEndpoint:
+        """
+        The FinanceAgreementsIdBoarddefaultsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdBoarddefaultsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def configurations(self) -> FinanceAgreementsIdConfigurationsEndpoint:
+        """
+        The FinanceAgreementsIdConfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdConfigurationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def sites(self) -> FinanceAgreementsIdSitesEndpoint:
+        """
+        The FinanceAgreementsIdSitesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsIdSitesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def work_role_exclusions(self) -> FinanceAgreementsIdWorkroleexclusionsEndpoint:
+        """
+        The FinanceAgreementsIdWorkroleexclusionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdWorkroleexclusionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def work_type_exclusions(self) -> FinanceAgreementsIdWorktypeexclusionsEndpoint:
+        """
+        The FinanceAgreementsIdWorktypeexclusionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdWorktypeexclusionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def workroles(self) -> FinanceAgreementsIdWorkrolesEndpoint:
+        """
+        The FinanceAgreementsIdWorkrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsIdWorkrolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def worktypes(self) -> FinanceAgreementsIdWorktypesEndpoint:
+        """
+        The FinanceAgreementsIdWorktypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsIdWorktypesEndpoint(self.client, parent_endpoint=self))
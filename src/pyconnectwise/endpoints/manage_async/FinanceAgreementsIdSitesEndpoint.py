@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdSitesCountEndpoint import (
+    FinanceAgreementsIdSitesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdSitesIdEndpoint import FinanceAgreementsIdSitesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AgreementSite
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementsIdSitesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AgreementSite], ConnectWiseManageRequestParams],
+    IAsyncPostable[AgreementSite, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AgreementSite, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "sites", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AgreementSite])
+        IAsyncPostable.__init__(self, AgreementSite)
+        IAsyncPaginateable.__init__(self, AgreementSite)
+
+    def id(self, _id: int) -> FinanceAgreementsIdSitesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdSitesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAgreementsIdSitesIdEndpoint: The initialized FinanceAgreementsIdSitesIdEndpoint object.
+        """
+        child = FinanceAgreementsIdSitesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AgreementSite]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/sites endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AgreementSite]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AgreementSite, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AgreementSite]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/sites endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AgreementSite]: The parsed response data.
+        """
+        return self._parse_many(AgreementSite, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AgreementSite:
+        """
+        Performs a POST request against the /finance/agreements/{id}/sites endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AgreementSite: The parsed response data.
+        """
+        return self._parse_one(AgreementSite, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdSitesCountEndpoint:
+        """
+        The FinanceAgreementsIdSitesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsIdSitesCountEndpoint(self.client, parent_endpoint=self))
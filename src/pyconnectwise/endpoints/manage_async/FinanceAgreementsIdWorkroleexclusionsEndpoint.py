@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdWorkroleexclusionsCountEndpoint import (
+    FinanceAgreementsIdWorkroleexclusionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdWorkroleexclusionsIdEndpoint import (
+    FinanceAgreementsIdWorkroleexclusionsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AgreementWorkRoleExclusion
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementsIdWorkroleexclusionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AgreementWorkRoleExclusion], ConnectWiseManageRequestParams],
+    IAsyncPostable[AgreementWorkRoleExclusion, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AgreementWorkRoleExclusion, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "workRoleExclusions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AgreementWorkRoleExclusion])
+        IAsyncPostable.__init__(self, AgreementWorkRoleExclusion)
+        IAsyncPaginateable.__init__(self, AgreementWorkRoleExclusion)
+
+    def id(self, _id: int) -> FinanceAgreementsIdWorkroleexclusionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdWorkroleexclusionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAgreementsIdWorkroleexclusionsIdEndpoint: The initialized FinanceAgreementsIdWorkroleexclusionsIdEndpoint object.
+        """
+        child = FinanceAgreementsIdWorkroleexclusionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AgreementWorkRoleExclusion]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/workRoleExclusions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AgreementWorkRoleExclusion]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AgreementWorkRoleExclusion, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AgreementWorkRoleExclusion]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/workRoleExclusions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AgreementWorkRoleExclusion]: The parsed response data.
+        """
+        return self._parse_many(
+            AgreementWorkRoleExclusion, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AgreementWorkRoleExclusion:
+        """
+        Performs a POST request against the /finance/agreements/{id}/workRoleExclusions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AgreementWorkRoleExclusion: The parsed response data.
+        """
+        return self._parse_one(
+            AgreementWorkRoleExclusion, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdWorkroleexclusionsCountEndpoint:
+        """
+        The FinanceAgreementsIdWorkroleexclusionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdWorkroleexclusionsCountEndpoint(self.client, parent_endpoint=self)
+        )
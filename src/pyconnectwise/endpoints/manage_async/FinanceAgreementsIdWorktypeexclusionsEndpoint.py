@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdWorktypeexclusionsCountEndpoint import (
+    FinanceAgreementsIdWorktypeexclusionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdWorktypeexclusionsIdEndpoint import (
+    FinanceAgreementsIdWorktypeexclusionsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AgreementWorkTypeExclusion
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementsIdWorktypeexclusionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AgreementWorkTypeExclusion], ConnectWiseManageRequestParams],
+    IAsyncPostable[AgreementWorkTypeExclusion, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AgreementWorkTypeExclusion, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "workTypeExclusions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AgreementWorkTypeExclusion])
+        IAsyncPostable.__init__(self, AgreementWorkTypeExclusion)
+        IAsyncPaginateable.__init__(self, AgreementWorkTypeExclusion)
+
+    def id(self, _id: int) -> FinanceAgreementsIdWorktypeexclusionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdWorktypeexclusionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAgreementsIdWorktypeexclusionsIdEndpoint: The initialized FinanceAgreementsIdWorktypeexclusionsIdEndpoint object.
+        """
+        child = FinanceAgreementsIdWorktypeexclusionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AgreementWorkTypeExclusion]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/workTypeExclusions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AgreementWorkTypeExclusion]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AgreementWorkTypeExclusion, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AgreementWorkTypeExclusion]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/workTypeExclusions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AgreementWorkTypeExclusion]: The parsed response data.
+        """
+        return self._parse_many(
+            AgreementWorkTypeExclusion, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AgreementWorkTypeExclusion:
+        """
+        Performs a POST request against the /finance/agreements/{id}/workTypeExclusions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AgreementWorkTypeExclusion: The parsed response data.
+        """
+        return self._parse_one(
+            AgreementWorkTypeExclusion, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdWorktypeexclusionsCountEndpoint:
+        """
+        The FinanceAgreementsIdWorktypeexclusionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdWorktypeexclusionsCountEndpoint(self.client, parent_endpoint=self)
+        )
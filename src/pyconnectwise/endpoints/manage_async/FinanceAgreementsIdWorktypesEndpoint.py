@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdWorktypesCountEndpoint import (
+    FinanceAgreementsIdWorktypesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsIdWorktypesIdEndpoint import (
+    FinanceAgreementsIdWorktypesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AgreementWorkType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementsIdWorktypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AgreementWorkType], ConnectWiseManageRequestParams],
+    IAsyncPostable[AgreementWorkType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AgreementWorkType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "worktypes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AgreementWorkType])
+        IAsyncPostable.__init__(self, AgreementWorkType)
+        IAsyncPaginateable.__init__(self, AgreementWorkType)
+
+    def id(self, _id: int) -> FinanceAgreementsIdWorktypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAgreementsIdWorktypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAgreementsIdWorktypesIdEndpoint: The initialized FinanceAgreementsIdWorktypesIdEndpoint object.
+        """
+        child = FinanceAgreementsIdWorktypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AgreementWorkType]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/worktypes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AgreementWorkType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AgreementWorkType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AgreementWorkType]:
+        """
+        Performs a GET request against the /finance/agreements/{id}/worktypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AgreementWorkType]: The parsed response data.
+        """
+        return self._parse_many(
+            AgreementWorkType, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AgreementWorkType:
+        """
+        Performs a POST request against the /finance/agreements/{id}/worktypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AgreementWorkType: The parsed response data.
+        """
+        return self._parse_one(
+            AgreementWorkType, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementsIdWorktypesCountEndpoint:
+        """
+        The FinanceAgreementsIdWorktypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementsIdWorktypesCountEndpoint(self.client, parent_endpoint=self)
+        )
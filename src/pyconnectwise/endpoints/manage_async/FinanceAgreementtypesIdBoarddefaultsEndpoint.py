@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdBoarddefaultsCountEndpoint import (
+    FinanceAgreementtypesIdBoarddefaultsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdBoarddefaultsIdEndpoint import (
+    FinanceAgreementtypesIdBoarddefaultsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AgreementTypeBoardDefault
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementtypesIdBoarddefaultsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AgreementTypeBoardDefault], ConnectWiseManageRequestParams],
+    IAsyncPostable[AgreementTypeBoardDefault, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AgreementTypeBoardDefault, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "boardDefaults", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AgreementTypeBoardDefault])
+        IAsyncPostable.__init__(self, AgreementTypeBoardDefault)
+        IAsyncPaginateable.__init__(self, AgreementTypeBoardDefault)
+
+    def id(self, _id: int) -> FinanceAgreementtypesIdBoarddefaultsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdBoarddefaultsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAgreementtypesIdBoarddefaultsIdEndpoint: The initialized FinanceAgreementtypesIdBoarddefaultsIdEndpoint object.
+        """
+        child = FinanceAgreementtypesIdBoarddefaultsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AgreementTypeBoardDefault]:
+        """
+        Performs a GET request against the /finance/agreementTypes/{id}/boardDefaults endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AgreementTypeBoardDefault]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AgreementTypeBoardDefault, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AgreementTypeBoardDefault]:
+        """
+        Performs a GET request against the /finance/agreementTypes/{id}/boardDefaults endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AgreementTypeBoardDefault]: The parsed response data.
+        """
+        return self._parse_many(
+            AgreementTypeBoardDefault, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AgreementTypeBoardDefault:
+        """
+        Performs a POST request against the /finance/agreementTypes/{id}/boardDefaults endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AgreementTypeBoardDefault: The parsed response data.
+        """
+        return self._parse_one(
+            AgreementTypeBoardDefault, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementtypesIdBoarddefaultsCountEndpoint:
+        """
+        The FinanceAgreementtypesIdBoarddefaultsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdBoarddefaultsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,72 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdBoarddefaultsEndpoint import (
+    FinanceAgreementtypesIdBoarddefaultsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdWorkroleexclusionsEndpoint import (
+    FinanceAgreementtypesIdWorkroleexclusionsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdWorkrolesEndpoint import (
+    FinanceAgreementtypesIdWorkrolesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdWorktypeexclusionsEndpoint import (
+    FinanceAgreementtypesIdWorktypeexclusionsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdWorktypesEndpoint import (
+    FinanceAgreementtypesIdWorktypesEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementtypesIdEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def board_defaults(self) -> FinanceAgreementtypesIdBoarddefaultsEndpoint:
+        """
+        The FinanceAgreementtypesIdBoarddefaultsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdBoarddefaultsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def work_role_exclusions(self) -> FinanceAgreementtypesIdWorkroleexclusionsEndpoint:
+        """
+        The FinanceAgreementtypesIdWorkroleexclusionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorkroleexclusionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def work_type_exclusions(self) -> FinanceAgreementtypesIdWorktypeexclusionsEndpoint:
+        """
+        The FinanceAgreementtypesIdWorktypeexclusionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorktypeexclusionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def workroles(self) -> FinanceAgreementtypesIdWorkrolesEndpoint:
+        """
+        The FinanceAgreementtypesIdWorkrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorkrolesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def worktypes(self) -> FinanceAgreementtypesIdWorktypesEndpoint:
+        """
+        The FinanceAgreementtypesIdWorktypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorktypesEndpoint(self.client, parent_endpoint=self)
+        )
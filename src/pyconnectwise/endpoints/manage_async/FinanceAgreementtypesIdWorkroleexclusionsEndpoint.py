@@ -0,0 +1,111 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdWorkroleexclusionsCountEndpoint import (
+    FinanceAgreementtypesIdWorkroleexclusionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdWorkroleexclusionsIdEndpoint import (
+    FinanceAgreementtypesIdWorkroleexclusionsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AgreementTypeWorkRoleExclusion
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementtypesIdWorkroleexclusionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AgreementTypeWorkRoleExclusion], ConnectWiseManageRequestParams],
+    IAsyncPostable[AgreementTypeWorkRoleExclusion, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AgreementTypeWorkRoleExclusion, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "workRoleExclusions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AgreementTypeWorkRoleExclusion])
+        IAsyncPostable.__init__(self, AgreementTypeWorkRoleExclusion)
+        IAsyncPaginateable.__init__(self, AgreementTypeWorkRoleExclusion)
+
+    def id(self, _id: int) -> FinanceAgreementtypesIdWorkroleexclusionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdWorkroleexclusionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAgreementtypesIdWorkroleexclusionsIdEndpoint: The initialized FinanceAgreementtypesIdWorkroleexclusionsIdEndpoint object.
+        """
+        child = FinanceAgreementtypesIdWorkroleexclusionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AgreementTypeWorkRoleExclusion]:
+        """
+        Performs a GET request against the /finance/agreementTypes/{id}/workRoleExclusions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AgreementTypeWorkRoleExclusion]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            AgreementTypeWorkRoleExclusion,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AgreementTypeWorkRoleExclusion]:
+        """
+        Performs a GET request against the /finance/agreementTypes/{id}/workRoleExclusions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AgreementTypeWorkRoleExclusion]: The parsed response data.
+        """
+        return self._parse_many(
+            AgreementTypeWorkRoleExclusion, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AgreementTypeWorkRoleExclusion:
+        """
+        Performs a POST request against the /finance/agreementTypes/{id}/workRoleExclusions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AgreementTypeWorkRoleExclusion: The parsed response data.
+        """
+        return self._parse_one(
+            AgreementTypeWorkRoleExclusion, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementtypesIdWorkroleexclusionsCountEndpoint:
+        """
+        The FinanceAgreementtypesIdWorkroleexclusionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorkroleexclusionsCountEndpoint(self.client, parent_endpoint=self)
+        )
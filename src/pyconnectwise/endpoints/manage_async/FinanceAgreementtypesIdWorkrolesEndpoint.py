@@ -0,0 +1,118 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdWorkrolesCountEndpoint import (
+    FinanceAgreementtypesIdWorkrolesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdWorkrolesIdEndpoint import (
+    FinanceAgreementtypesIdWorkrolesIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdWorkrolesInfoEndpoint import (
+    FinanceAgreementtypesIdWorkrolesInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AgreementTypeWorkRole
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementtypesIdWorkrolesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AgreementTypeWorkRole], ConnectWiseManageRequestParams],
+    IAsyncPostable[AgreementTypeWorkRole, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AgreementTypeWorkRole, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "workroles", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AgreementTypeWorkRole])
+        IAsyncPostable.__init__(self, AgreementTypeWorkRole)
+        IAsyncPaginateable.__init__(self, AgreementTypeWorkRole)
+
+    def id(self, _id: int) -> FinanceAgreementtypesIdWorkrolesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdWorkrolesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAgreementtypesIdWorkrolesIdEndpoint: The initialized FinanceAgreementtypesIdWorkrolesIdEndpoint object.
+        """
+        child = FinanceAgreementtypesIdWorkrolesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AgreementTypeWorkRole]:
+        """
+        Performs a GET request against the /finance/agreementTypes/{id}/workroles endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AgreementTypeWorkRole]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AgreementTypeWorkRole, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AgreementTypeWorkRole]:
+        """
+        Performs a GET request against the /finance/agreementTypes/{id}/workroles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AgreementTypeWorkRole]: The parsed response data.
+        """
+        return self._parse_many(
+            AgreementTypeWorkRole, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AgreementTypeWorkRole:
+        """
+        Performs a POST request against the /finance/agreementTypes/{id}/workroles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AgreementTypeWorkRole: The parsed response data.
+        """
+        return self._parse_one(
+            AgreementTypeWorkRole, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementtypesIdWorkrolesCountEndpoint:
+        """
+        The FinanceAgreementtypesIdWorkrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorkrolesCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> FinanceAgreementtypesIdWorkrolesInfoEndpoint:
+        """
+        The FinanceAgreementtypesIdWorkrolesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorkrolesInfoEndpoint(self.client, parent_endpoint=self)
+        )
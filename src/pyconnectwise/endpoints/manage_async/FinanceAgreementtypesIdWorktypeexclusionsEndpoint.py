@@ -0,0 +1,111 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint import (
+    FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint import (
+    FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AgreementTypeWorkTypeExclusion
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceAgreementtypesIdWorktypeexclusionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AgreementTypeWorkTypeExclusion], ConnectWiseManageRequestParams],
+    IAsyncPostable[AgreementTypeWorkTypeExclusion, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AgreementTypeWorkTypeExclusion, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "workTypeExclusions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AgreementTypeWorkTypeExclusion])
+        IAsyncPostable.__init__(self, AgreementTypeWorkTypeExclusion)
+        IAsyncPaginateable.__init__(self, AgreementTypeWorkTypeExclusion)
+
+    def id(self, _id: int) -> FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint: The initialized FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint object.
+        """
+        child = FinanceAgreementtypesIdWorktypeexclusionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AgreementTypeWorkTypeExclusion]:
+        """
+        Performs a GET request against the /finance/agreementTypes/{id}/workTypeExclusions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AgreementTypeWorkTypeExclusion]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            AgreementTypeWorkTypeExclusion,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AgreementTypeWorkTypeExclusion]:
+        """
+        Performs a GET request against the /finance/agreementTypes/{id}/workTypeExclusions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AgreementTypeWorkTypeExclusion]: The parsed response data.
+        """
+        return self._parse_many(
+            AgreementTypeWorkTypeExclusion, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AgreementTypeWorkTypeExclusion:
+        """
+        Performs a POST request against the /finance/agreementTypes/{id}/workTypeExclusions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AgreementTypeWorkTypeExclusion: The parsed response data.
+        """
+        return self._parse_one(
+            AgreementTypeWorkTypeExclusion, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint:
+        """
+        The FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceAgreementtypesIdWorktypeexclusionsCountEndpoint(self.client, parent_endpoint=self)
+        )
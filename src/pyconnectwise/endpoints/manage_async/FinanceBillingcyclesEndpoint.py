@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingcyclesCountEndpoint import FinanceBillingcyclesCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingcyclesIdEndpoint import FinanceBillingcyclesIdEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingcyclesInfoEndpoint import FinanceBillingcyclesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import BillingCycle
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceBillingcyclesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[BillingCycle], ConnectWiseManageRequestParams],
+    IAsyncPostable[BillingCycle, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[BillingCycle, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "billingCycles", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[BillingCycle])
+        IAsyncPostable.__init__(self, BillingCycle)
+        IAsyncPaginateable.__init__(self, BillingCycle)
+
+    def id(self, _id: int) -> FinanceBillingcyclesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceBillingcyclesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceBillingcyclesIdEndpoint: The initialized FinanceBillingcyclesIdEndpoint object.
+        """
+        child = FinanceBillingcyclesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[BillingCycle]:
+        """
+        Performs a GET request against the /finance/billingCycles endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[BillingCycle]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), BillingCycle, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[BillingCycle]:
+        """
+        Performs a GET request against the /finance/billingCycles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[BillingCycle]: The parsed response data.
+        """
+        return self._parse_many(BillingCycle, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> BillingCycle:
+        """
+        Performs a POST request against the /finance/billingCycles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BillingCycle: The parsed response data.
+        """
+        return self._parse_one(BillingCycle, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceBillingcyclesCountEndpoint:
+        """
+        The FinanceBillingcyclesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingcyclesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceBillingcyclesInfoEndpoint:
+        """
+        The FinanceBillingcyclesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingcyclesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingsetupsCountEndpoint import FinanceBillingsetupsCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingsetupsIdEndpoint import FinanceBillingsetupsIdEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingsetupsInfoEndpoint import FinanceBillingsetupsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import BillingSetup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceBillingsetupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[BillingSetup], ConnectWiseManageRequestParams],
+    IAsyncPostable[BillingSetup, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[BillingSetup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "billingSetups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[BillingSetup])
+        IAsyncPostable.__init__(self, BillingSetup)
+        IAsyncPaginateable.__init__(self, BillingSetup)
+
+    def id(self, _id: int) -> FinanceBillingsetupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceBillingsetupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceBillingsetupsIdEndpoint: The initialized FinanceBillingsetupsIdEndpoint object.
+        """
+        child = FinanceBillingsetupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[BillingSetup]:
+        """
+        Performs a GET request against the /finance/billingSetups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[BillingSetup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), BillingSetup, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[BillingSetup]:
+        """
+        Performs a GET request against the /finance/billingSetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[BillingSetup]: The parsed response data.
+        """
+        return self._parse_many(BillingSetup, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> BillingSetup:
+        """
+        Performs a POST request against the /finance/billingSetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BillingSetup: The parsed response data.
+        """
+        return self._parse_one(BillingSetup, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceBillingsetupsCountEndpoint:
+        """
+        The FinanceBillingsetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingsetupsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceBillingsetupsInfoEndpoint:
+        """
+        The FinanceBillingsetupsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingsetupsInfoEndpoint(self.client, parent_endpoint=self))
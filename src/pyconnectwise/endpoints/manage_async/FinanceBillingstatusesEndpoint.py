@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingstatusesCountEndpoint import FinanceBillingstatusesCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingstatusesIdEndpoint import FinanceBillingstatusesIdEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingstatusesInfoEndpoint import FinanceBillingstatusesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import BillingStatus
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceBillingstatusesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[BillingStatus], ConnectWiseManageRequestParams],
+    IAsyncPostable[BillingStatus, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[BillingStatus, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "billingStatuses", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[BillingStatus])
+        IAsyncPostable.__init__(self, BillingStatus)
+        IAsyncPaginateable.__init__(self, BillingStatus)
+
+    def id(self, _id: int) -> FinanceBillingstatusesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceBillingstatusesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceBillingstatusesIdEndpoint: The initialized FinanceBillingstatusesIdEndpoint object.
+        """
+        child = FinanceBillingstatusesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[BillingStatus]:
+        """
+        Performs a GET request against the /finance/billingStatuses endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[BillingStatus]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), BillingStatus, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[BillingStatus]:
+        """
+        Performs a GET request against the /finance/billingStatuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[BillingStatus]: The parsed response data.
+        """
+        return self._parse_many(BillingStatus, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> BillingStatus:
+        """
+        Performs a POST request against the /finance/billingStatuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BillingStatus: The parsed response data.
+        """
+        return self._parse_one(BillingStatus, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceBillingstatusesCountEndpoint:
+        """
+        The FinanceBillingstatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingstatusesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceBillingstatusesInfoEndpoint:
+        """
+        The FinanceBillingstatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingstatusesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingtermsCountEndpoint import FinanceBillingtermsCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingtermsIdEndpoint import FinanceBillingtermsIdEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingtermsInfoEndpoint import FinanceBillingtermsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import BillingTerm
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceBillingtermsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[BillingTerm], ConnectWiseManageRequestParams],
+    IAsyncPostable[BillingTerm, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[BillingTerm, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "billingTerms", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[BillingTerm])
+        IAsyncPostable.__init__(self, BillingTerm)
+        IAsyncPaginateable.__init__(self, BillingTerm)
+
+    def id(self, _id: int) -> FinanceBillingtermsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceBillingtermsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceBillingtermsIdEndpoint: The initialized FinanceBillingtermsIdEndpoint object.
+        """
+        child = FinanceBillingtermsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[BillingTerm]:
+        """
+        Performs a GET request against the /finance/billingTerms endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[BillingTerm]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), BillingTerm, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[BillingTerm]:
+        """
+        Performs a GET request against the /finance/billingTerms endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[BillingTerm]: The parsed response data.
+        """
+        return self._parse_many(BillingTerm, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BillingTerm:
+        """
+        Performs a POST request against the /finance/billingTerms endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BillingTerm: The parsed response data.
+        """
+        return self._parse_one(BillingTerm, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceBillingtermsCountEndpoint:
+        """
+        The FinanceBillingtermsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingtermsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceBillingtermsInfoEndpoint:
+        """
+        The FinanceBillingtermsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingtermsInfoEndpoint(self.client, parent_endpoint=self))
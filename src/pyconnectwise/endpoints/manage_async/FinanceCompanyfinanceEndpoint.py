@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceCompanyfinanceCountEndpoint import FinanceCompanyfinanceCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceCompanyfinanceIdEndpoint import FinanceCompanyfinanceIdEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceCompanyfinanceEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "companyFinance", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> FinanceCompanyfinanceIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceCompanyfinanceIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceCompanyfinanceIdEndpoint: The initialized FinanceCompanyfinanceIdEndpoint object.
+        """
+        child = FinanceCompanyfinanceIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def count(self) -> FinanceCompanyfinanceCountEndpoint:
+        """
+        The FinanceCompanyfinanceCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCompanyfinanceCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceCurrenciesCountEndpoint import FinanceCurrenciesCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceCurrenciesIdEndpoint import FinanceCurrenciesIdEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceCurrenciesInfoEndpoint import FinanceCurrenciesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import FinanceCurrency
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceCurrenciesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[FinanceCurrency], ConnectWiseManageRequestParams],
+    IAsyncPostable[FinanceCurrency, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[FinanceCurrency, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "currencies", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[FinanceCurrency])
+        IAsyncPostable.__init__(self, FinanceCurrency)
+        IAsyncPaginateable.__init__(self, FinanceCurrency)
+
+    def id(self, _id: int) -> FinanceCurrenciesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceCurrenciesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceCurrenciesIdEndpoint: The initialized FinanceCurrenciesIdEndpoint object.
+        """
+        child = FinanceCurrenciesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[FinanceCurrency]:
+        """
+        Performs a GET request against the /finance/currencies endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[FinanceCurrency]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), FinanceCurrency, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[FinanceCurrency]:
+        """
+        Performs a GET request against the /finance/currencies endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[FinanceCurrency]: The parsed response data.
+        """
+        return self._parse_many(FinanceCurrency, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> FinanceCurrency:
+        """
+        Performs a POST request against the /finance/currencies endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            FinanceCurrency: The parsed response data.
+        """
+        return self._parse_one(FinanceCurrency, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceCurrenciesCountEndpoint:
+        """
+        The FinanceCurrenciesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCurrenciesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceCurrenciesInfoEndpoint:
+        """
+        The FinanceCurrenciesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCurrenciesInfoEndpoint(self.client, parent_endpoint=self))
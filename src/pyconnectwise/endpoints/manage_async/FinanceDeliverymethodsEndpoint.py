@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceDeliverymethodsCountEndpoint import FinanceDeliverymethodsCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceDeliverymethodsIdEndpoint import FinanceDeliverymethodsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import DeliveryMethod
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceDeliverymethodsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[DeliveryMethod], ConnectWiseManageRequestParams],
+    IAsyncPostable[DeliveryMethod, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[DeliveryMethod, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "deliveryMethods", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[DeliveryMethod])
+        IAsyncPostable.__init__(self, DeliveryMethod)
+        IAsyncPaginateable.__init__(self, DeliveryMethod)
+
+    def id(self, _id: int) -> FinanceDeliverymethodsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceDeliverymethodsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceDeliverymethodsIdEndpoint: The initialized FinanceDeliverymethodsIdEndpoint object.
+        """
+        child = FinanceDeliverymethodsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[DeliveryMethod]:
+        """
+        Performs a GET request against the /finance/deliveryMethods endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[DeliveryMethod]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), DeliveryMethod, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[DeliveryMethod]:
+        """
+        Performs a GET request against the /finance/deliveryMethods endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[DeliveryMethod]: The parsed response data.
+        """
+        return self._parse_many(DeliveryMethod, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> DeliveryMethod:
+        """
+        Performs a POST request against the /finance/deliveryMethods endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            DeliveryMethod: The parsed response data.
+        """
+        return self._parse_one(DeliveryMethod, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceDeliverymethodsCountEndpoint:
+        """
+        The FinanceDeliverymethodsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceDeliverymethodsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,210 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingEndpoint import FinanceAccountingEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingpackagesEndpoint import FinanceAccountingpackagesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAccountingpackagesetupEndpoint import (
+    FinanceAccountingpackagesetupEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceAgreementsEndpoint import FinanceAgreementsEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceAgreementtypesEndpoint import FinanceAgreementtypesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBatchsetupsEndpoint import FinanceBatchsetupsEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingcyclesEndpoint import FinanceBillingcyclesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingsetupsEndpoint import FinanceBillingsetupsEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingstatusesEndpoint import FinanceBillingstatusesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceBillingtermsEndpoint import FinanceBillingtermsEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceClosedinvoicesEndpoint import FinanceClosedinvoicesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceCompanyfinanceEndpoint import FinanceCompanyfinanceEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceCurrenciesEndpoint import FinanceCurrenciesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceDeliverymethodsEndpoint import FinanceDeliverymethodsEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceGlaccountsEndpoint import FinanceGlaccountsEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceGlcaptionsEndpoint import FinanceGlcaptionsEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceGlpathsEndpoint import FinanceGlpathsEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceInfoEndpoint import FinanceInfoEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceInvoiceemailtemplatesEndpoint import (
+    FinanceInvoiceemailtemplatesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceInvoicesEndpoint import FinanceInvoicesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceInvoicetemplatesEndpoint import FinanceInvoicetemplatesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceInvoicetemplatesetupsEndpoint import (
+    FinanceInvoicetemplatesetupsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesEndpoint import FinanceTaxcodesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceTaxintegrationsEndpoint import FinanceTaxintegrationsEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "finance", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def accounting(self) -> FinanceAccountingEndpoint:
+        """
+        The FinanceAccountingEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def accounting_package_setup(self) -> FinanceAccountingpackagesetupEndpoint:
+        """
+        The FinanceAccountingpackagesetupEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingpackagesetupEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def accounting_packages(self) -> FinanceAccountingpackagesEndpoint:
+        """
+        The FinanceAccountingpackagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAccountingpackagesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def agreement_types(self) -> FinanceAgreementtypesEndpoint:
+        """
+        The FinanceAgreementtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementtypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def agreements(self) -> FinanceAgreementsEndpoint:
+        """
+        The FinanceAgreementsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceAgreementsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def batch_setups(self) -> FinanceBatchsetupsEndpoint:
+        """
+        The FinanceBatchsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBatchsetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def billing_cycles(self) -> FinanceBillingcyclesEndpoint:
+        """
+        The FinanceBillingcyclesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingcyclesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def billing_setups(self) -> FinanceBillingsetupsEndpoint:
+        """
+        The FinanceBillingsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingsetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def billing_statuses(self) -> FinanceBillingstatusesEndpoint:
+        """
+        The FinanceBillingstatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingstatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def billing_terms(self) -> FinanceBillingtermsEndpoint:
+        """
+        The FinanceBillingtermsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceBillingtermsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def closed_invoices(self) -> FinanceClosedinvoicesEndpoint:
+        """
+        The FinanceClosedinvoicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceClosedinvoicesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def company_finance(self) -> FinanceCompanyfinanceEndpoint:
+        """
+        The FinanceCompanyfinanceEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCompanyfinanceEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def currencies(self) -> FinanceCurrenciesEndpoint:
+        """
+        The FinanceCurrenciesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceCurrenciesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def delivery_methods(self) -> FinanceDeliverymethodsEndpoint:
+        """
+        The FinanceDeliverymethodsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceDeliverymethodsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def gl_accounts(self) -> FinanceGlaccountsEndpoint:
+        """
+        The FinanceGlaccountsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlaccountsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def gl_captions(self) -> FinanceGlcaptionsEndpoint:
+        """
+        The FinanceGlcaptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlcaptionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def glpaths(self) -> FinanceGlpathsEndpoint:
+        """
+        The FinanceGlpathsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlpathsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceInfoEndpoint:
+        """
+        The FinanceInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def invoice_email_templates(self) -> FinanceInvoiceemailtemplatesEndpoint:
+        """
+        The FinanceInvoiceemailtemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoiceemailtemplatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def invoice_template_setups(self) -> FinanceInvoicetemplatesetupsEndpoint:
+        """
+        The FinanceInvoicetemplatesetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoicetemplatesetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def invoice_templates(self) -> FinanceInvoicetemplatesEndpoint:
+        """
+        The FinanceInvoicetemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoicetemplatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def invoices(self) -> FinanceInvoicesEndpoint:
+        """
+        The FinanceInvoicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoicesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tax_codes(self) -> FinanceTaxcodesEndpoint:
+        """
+        The FinanceTaxcodesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tax_integrations(self) -> FinanceTaxintegrationsEndpoint:
+        """
+        The FinanceTaxintegrationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxintegrationsEndpoint(self.client, parent_endpoint=self))
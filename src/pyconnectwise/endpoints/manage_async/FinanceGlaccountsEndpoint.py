@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceGlaccountsCountEndpoint import FinanceGlaccountsCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceGlaccountsIdEndpoint import FinanceGlaccountsIdEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceGlaccountsMappedtypesEndpoint import (
+    FinanceGlaccountsMappedtypesEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import GLAccount
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceGlaccountsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[GLAccount], ConnectWiseManageRequestParams],
+    IAsyncPostable[GLAccount, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[GLAccount, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "glAccounts", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[GLAccount])
+        IAsyncPostable.__init__(self, GLAccount)
+        IAsyncPaginateable.__init__(self, GLAccount)
+
+    def id(self, _id: int) -> FinanceGlaccountsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceGlaccountsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceGlaccountsIdEndpoint: The initialized FinanceGlaccountsIdEndpoint object.
+        """
+        child = FinanceGlaccountsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[GLAccount]:
+        """
+        Performs a GET request against the /finance/glAccounts endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[GLAccount]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), GLAccount, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[GLAccount]:
+        """
+        Performs a GET request against the /finance/glAccounts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[GLAccount]: The parsed response data.
+        """
+        return self._parse_many(GLAccount, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> GLAccount:
+        """
+        Performs a POST request against the /finance/glAccounts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            GLAccount: The parsed response data.
+        """
+        return self._parse_one(GLAccount, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceGlaccountsCountEndpoint:
+        """
+        The FinanceGlaccountsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlaccountsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def mapped_types(self) -> FinanceGlaccountsMappedtypesEndpoint:
+        """
+        The FinanceGlaccountsMappedtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlaccountsMappedtypesEndpoint(self.client, parent_endpoint=self))
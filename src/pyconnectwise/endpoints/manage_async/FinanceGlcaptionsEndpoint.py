@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceGlcaptionsCountEndpoint import FinanceGlcaptionsCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceGlcaptionsIdEndpoint import FinanceGlcaptionsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import GLCaption
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceGlcaptionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[GLCaption], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[GLCaption, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "glCaptions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[GLCaption])
+        IAsyncPaginateable.__init__(self, GLCaption)
+
+    def id(self, _id: int) -> FinanceGlcaptionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceGlcaptionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceGlcaptionsIdEndpoint: The initialized FinanceGlcaptionsIdEndpoint object.
+        """
+        child = FinanceGlcaptionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[GLCaption]:
+        """
+        Performs a GET request against the /finance/glCaptions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[GLCaption]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), GLCaption, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[GLCaption]:
+        """
+        Performs a GET request against the /finance/glCaptions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[GLCaption]: The parsed response data.
+        """
+        return self._parse_many(GLCaption, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceGlcaptionsCountEndpoint:
+        """
+        The FinanceGlcaptionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlcaptionsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,92 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceGlpathsCountEndpoint import FinanceGlpathsCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceGlpathsIdEndpoint import FinanceGlpathsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import GLPath
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceGlpathsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[GLPath], ConnectWiseManageRequestParams],
+    IAsyncPostable[GLPath, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[GLPath, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "glpaths", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[GLPath])
+        IAsyncPostable.__init__(self, GLPath)
+        IAsyncPaginateable.__init__(self, GLPath)
+
+    def id(self, _id: int) -> FinanceGlpathsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceGlpathsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceGlpathsIdEndpoint: The initialized FinanceGlpathsIdEndpoint object.
+        """
+        child = FinanceGlpathsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[GLPath]:
+        """
+        Performs a GET request against the /finance/glpaths endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[GLPath]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), GLPath, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[GLPath]:
+        """
+        Performs a GET request against the /finance/glpaths endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[GLPath]: The parsed response data.
+        """
+        return self._parse_many(GLPath, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> GLPath:
+        """
+        Performs a POST request against the /finance/glpaths endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            GLPath: The parsed response data.
+        """
+        return self._parse_one(GLPath, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceGlpathsCountEndpoint:
+        """
+        The FinanceGlpathsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceGlpathsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceInfoCurrencycodesEndpoint import FinanceInfoCurrencycodesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceInfoInvoiceEndpoint import FinanceInfoInvoiceEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceInfoTaxintegrationsEndpoint import FinanceInfoTaxintegrationsEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceInfoEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "info", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def currency_codes(self) -> FinanceInfoCurrencycodesEndpoint:
+        """
+        The FinanceInfoCurrencycodesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInfoCurrencycodesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def invoice(self) -> FinanceInfoInvoiceEndpoint:
+        """
+        The FinanceInfoInvoiceEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInfoInvoiceEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tax_integrations(self) -> FinanceInfoTaxintegrationsEndpoint:
+        """
+        The FinanceInfoTaxintegrationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInfoTaxintegrationsEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,118 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceInvoiceemailtemplatesCountEndpoint import (
+    FinanceInvoiceemailtemplatesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceInvoiceemailtemplatesIdEndpoint import (
+    FinanceInvoiceemailtemplatesIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceInvoiceemailtemplatesInfoEndpoint import (
+    FinanceInvoiceemailtemplatesInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import InvoiceEmailTemplate
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceInvoiceemailtemplatesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[InvoiceEmailTemplate], ConnectWiseManageRequestParams],
+    IAsyncPostable[InvoiceEmailTemplate, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[InvoiceEmailTemplate, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "invoiceEmailTemplates", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[InvoiceEmailTemplate])
+        IAsyncPostable.__init__(self, InvoiceEmailTemplate)
+        IAsyncPaginateable.__init__(self, InvoiceEmailTemplate)
+
+    def id(self, _id: int) -> FinanceInvoiceemailtemplatesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceInvoiceemailtemplatesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceInvoiceemailtemplatesIdEndpoint: The initialized FinanceInvoiceemailtemplatesIdEndpoint object.
+        """
+        child = FinanceInvoiceemailtemplatesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[InvoiceEmailTemplate]:
+        """
+        Performs a GET request against the /finance/invoiceEmailTemplates endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[InvoiceEmailTemplate]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), InvoiceEmailTemplate, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[InvoiceEmailTemplate]:
+        """
+        Performs a GET request against the /finance/invoiceEmailTemplates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[InvoiceEmailTemplate]: The parsed response data.
+        """
+        return self._parse_many(
+            InvoiceEmailTemplate, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> InvoiceEmailTemplate:
+        """
+        Performs a POST request against the /finance/invoiceEmailTemplates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            InvoiceEmailTemplate: The parsed response data.
+        """
+        return self._parse_one(
+            InvoiceEmailTemplate, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceInvoiceemailtemplatesCountEndpoint:
+        """
+        The FinanceInvoiceemailtemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceInvoiceemailtemplatesCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> FinanceInvoiceemailtemplatesInfoEndpoint:
+        """
+        The FinanceInvoiceemailtemplatesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceInvoiceemailtemplatesInfoEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceInvoicesCountEndpoint import FinanceInvoicesCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceInvoicesIdEndpoint import FinanceInvoicesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Invoice
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceInvoicesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Invoice], ConnectWiseManageRequestParams],
+    IAsyncPostable[Invoice, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Invoice, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "invoices", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Invoice])
+        IAsyncPostable.__init__(self, Invoice)
+        IAsyncPaginateable.__init__(self, Invoice)
+
+    def id(self, _id: int) -> FinanceInvoicesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceInvoicesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceInvoicesIdEndpoint: The initialized FinanceInvoicesIdEndpoint object.
+        """
+        child = FinanceInvoicesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Invoice]:
+        """
+        Performs a GET request against the /finance/invoices endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Invoice]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Invoice, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Invoice]:
+        """
+        Performs a GET request against the /finance/invoices endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Invoice]: The parsed response data.
+        """
+        return self._parse_many(Invoice, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Invoice:
+        """
+        Performs a POST request against the /finance/invoices endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Invoice: The parsed response data.
+        """
+        return self._parse_one(Invoice, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceInvoicesCountEndpoint:
+        """
+        The FinanceInvoicesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceInvoicesCountEndpoint(self.client, parent_endpoint=self))
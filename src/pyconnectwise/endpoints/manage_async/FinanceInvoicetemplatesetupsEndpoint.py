@@ -0,0 +1,88 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceInvoicetemplatesetupsCountEndpoint import (
+    FinanceInvoicetemplatesetupsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceInvoicetemplatesetupsIdEndpoint import (
+    FinanceInvoicetemplatesetupsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import InvoiceTemplateSetup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceInvoicetemplatesetupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[InvoiceTemplateSetup], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[InvoiceTemplateSetup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "invoiceTemplateSetups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[InvoiceTemplateSetup])
+        IAsyncPaginateable.__init__(self, InvoiceTemplateSetup)
+
+    def id(self, _id: int) -> FinanceInvoicetemplatesetupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceInvoicetemplatesetupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceInvoicetemplatesetupsIdEndpoint: The initialized FinanceInvoicetemplatesetupsIdEndpoint object.
+        """
+        child = FinanceInvoicetemplatesetupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[InvoiceTemplateSetup]:
+        """
+        Performs a GET request against the /finance/invoiceTemplateSetups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[InvoiceTemplateSetup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), InvoiceTemplateSetup, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[InvoiceTemplateSetup]:
+        """
+        Performs a GET request against the /finance/invoiceTemplateSetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[InvoiceTemplateSetup]: The parsed response data.
+        """
+        return self._parse_many(
+            InvoiceTemplateSetup, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceInvoicetemplatesetupsCountEndpoint:
+        """
+        The FinanceInvoicetemplatesetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceInvoicetemplatesetupsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesCountEndpoint import FinanceTaxcodesCountEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdEndpoint import FinanceTaxcodesIdEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesInfoEndpoint import FinanceTaxcodesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TaxCode
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceTaxcodesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TaxCode], ConnectWiseManageRequestParams],
+    IAsyncPostable[TaxCode, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TaxCode, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "taxCodes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TaxCode])
+        IAsyncPostable.__init__(self, TaxCode)
+        IAsyncPaginateable.__init__(self, TaxCode)
+
+    def id(self, _id: int) -> FinanceTaxcodesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceTaxcodesIdEndpoint: The initialized FinanceTaxcodesIdEndpoint object.
+        """
+        child = FinanceTaxcodesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TaxCode]:
+        """
+        Performs a GET request against the /finance/taxCodes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TaxCode]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TaxCode, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TaxCode]:
+        """
+        Performs a GET request against the /finance/taxCodes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TaxCode]: The parsed response data.
+        """
+        return self._parse_many(TaxCode, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TaxCode:
+        """
+        Performs a POST request against the /finance/taxCodes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TaxCode: The parsed response data.
+        """
+        return self._parse_one(TaxCode, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesCountEndpoint:
+        """
+        The FinanceTaxcodesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> FinanceTaxcodesInfoEndpoint:
+        """
+        The FinanceTaxcodesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,174 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdCopyEndpoint import FinanceTaxcodesIdCopyEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdExpensetypeexemptionsEndpoint import (
+    FinanceTaxcodesIdExpensetypeexemptionsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdInfoEndpoint import FinanceTaxcodesIdInfoEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdProducttypeexemptionsEndpoint import (
+    FinanceTaxcodesIdProducttypeexemptionsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdTaxcodelevelsEndpoint import (
+    FinanceTaxcodesIdTaxcodelevelsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdTaxcodexrefsEndpoint import (
+    FinanceTaxcodesIdTaxcodexrefsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdUsagesEndpoint import FinanceTaxcodesIdUsagesEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdWorkroleexemptionsEndpoint import (
+    FinanceTaxcodesIdWorkroleexemptionsEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import TaxCode
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceTaxcodesIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[TaxCode, ConnectWiseManageRequestParams],
+    IAsyncPatchable[TaxCode, ConnectWiseManageRequestParams],
+    IAsyncPuttable[TaxCode, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TaxCode, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, TaxCode)
+        IAsyncPatchable.__init__(self, TaxCode)
+        IAsyncPuttable.__init__(self, TaxCode)
+        IAsyncPaginateable.__init__(self, TaxCode)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TaxCode]:
+        """
+        Performs a GET request against the /finance/taxCodes/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TaxCode]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TaxCode, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /finance/taxCodes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TaxCode:
+        """
+        Performs a GET request against the /finance/taxCodes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TaxCode: The parsed response data.
+        """
+        return self._parse_one(TaxCode, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> TaxCode:
+        """
+        Performs a PATCH request against the /finance/taxCodes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TaxCode: The parsed response data.
+        """
+        return self._parse_one(TaxCode, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TaxCode:
+        """
+        Performs a PUT request against the /finance/taxCodes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TaxCode: The parsed response data.
+        """
+        return self._parse_one(TaxCode, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def copy(self) -> FinanceTaxcodesIdCopyEndpoint:
+        """
+        The FinanceTaxcodesIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesIdCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def expense_type_exemptions(self) -> FinanceTaxcodesIdExpensetypeexemptionsEndpoint:
+        """
+        The FinanceTaxcodesIdExpensetypeexemptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdExpensetypeexemptionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> FinanceTaxcodesIdInfoEndpoint:
+        """
+        The FinanceTaxcodesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def product_type_exemptions(self) -> FinanceTaxcodesIdProducttypeexemptionsEndpoint:
+        """
+        The FinanceTaxcodesIdProducttypeexemptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdProducttypeexemptionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def tax_code_levels(self) -> FinanceTaxcodesIdTaxcodelevelsEndpoint:
+        """
+        The FinanceTaxcodesIdTaxcodelevelsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesIdTaxcodelevelsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tax_code_x_refs(self) -> FinanceTaxcodesIdTaxcodexrefsEndpoint:
+        """
+        The FinanceTaxcodesIdTaxcodexrefsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesIdTaxcodexrefsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> FinanceTaxcodesIdUsagesEndpoint:
+        """
+        The FinanceTaxcodesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(FinanceTaxcodesIdUsagesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def work_role_exemptions(self) -> FinanceTaxcodesIdWorkroleexemptionsEndpoint:
+        """
+        The FinanceTaxcodesIdWorkroleexemptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdWorkroleexemptionsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdProducttypeexemptionsCountEndpoint import (
+    FinanceTaxcodesIdProducttypeexemptionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdProducttypeexemptionsIdEndpoint import (
+    FinanceTaxcodesIdProducttypeexemptionsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProductTypeExemption
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceTaxcodesIdProducttypeexemptionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProductTypeExemption], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProductTypeExemption, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProductTypeExemption, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "productTypeExemptions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProductTypeExemption])
+        IAsyncPostable.__init__(self, ProductTypeExemption)
+        IAsyncPaginateable.__init__(self, ProductTypeExemption)
+
+    def id(self, _id: int) -> FinanceTaxcodesIdProducttypeexemptionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdProducttypeexemptionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceTaxcodesIdProducttypeexemptionsIdEndpoint: The initialized FinanceTaxcodesIdProducttypeexemptionsIdEndpoint object.
+        """
+        child = FinanceTaxcodesIdProducttypeexemptionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProductTypeExemption]:
+        """
+        Performs a GET request against the /finance/taxCodes/{id}/productTypeExemptions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProductTypeExemption]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProductTypeExemption, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProductTypeExemption]:
+        """
+        Performs a GET request against the /finance/taxCodes/{id}/productTypeExemptions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProductTypeExemption]: The parsed response data.
+        """
+        return self._parse_many(
+            ProductTypeExemption, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProductTypeExemption:
+        """
+        Performs a POST request against the /finance/taxCodes/{id}/productTypeExemptions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProductTypeExemption: The parsed response data.
+        """
+        return self._parse_one(
+            ProductTypeExemption, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesIdProducttypeexemptionsCountEndpoint:
+        """
+        The FinanceTaxcodesIdProducttypeexemptionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdProducttypeexemptionsCountEndpoint(self.client, parent_endpoint=self)
+        )
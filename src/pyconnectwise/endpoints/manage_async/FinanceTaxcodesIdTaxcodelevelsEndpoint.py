@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdTaxcodelevelsCountEndpoint import (
+    FinanceTaxcodesIdTaxcodelevelsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdTaxcodelevelsIdEndpoint import (
+    FinanceTaxcodesIdTaxcodelevelsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TaxCodeLevel
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceTaxcodesIdTaxcodelevelsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TaxCodeLevel], ConnectWiseManageRequestParams],
+    IAsyncPostable[TaxCodeLevel, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TaxCodeLevel, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "taxCodeLevels", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TaxCodeLevel])
+        IAsyncPostable.__init__(self, TaxCodeLevel)
+        IAsyncPaginateable.__init__(self, TaxCodeLevel)
+
+    def id(self, _id: int) -> FinanceTaxcodesIdTaxcodelevelsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdTaxcodelevelsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceTaxcodesIdTaxcodelevelsIdEndpoint: The initialized FinanceTaxcodesIdTaxcodelevelsIdEndpoint object.
+        """
+        child = FinanceTaxcodesIdTaxcodelevelsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TaxCodeLevel]:
+        """
+        Performs a GET request against the /finance/taxCodes/{id}/taxCodeLevels endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TaxCodeLevel]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TaxCodeLevel, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TaxCodeLevel]:
+        """
+        Performs a GET request against the /finance/taxCodes/{id}/taxCodeLevels endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TaxCodeLevel]: The parsed response data.
+        """
+        return self._parse_many(TaxCodeLevel, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> TaxCodeLevel:
+        """
+        Performs a POST request against the /finance/taxCodes/{id}/taxCodeLevels endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TaxCodeLevel: The parsed response data.
+        """
+        return self._parse_one(TaxCodeLevel, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesIdTaxcodelevelsCountEndpoint:
+        """
+        The FinanceTaxcodesIdTaxcodelevelsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdTaxcodelevelsCountEndpoint(self.client, parent_endpoint=self)
+        )
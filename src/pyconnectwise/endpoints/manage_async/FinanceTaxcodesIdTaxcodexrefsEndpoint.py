@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdTaxcodexrefsCountEndpoint import (
+    FinanceTaxcodesIdTaxcodexrefsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdTaxcodexrefsIdEndpoint import (
+    FinanceTaxcodesIdTaxcodexrefsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TaxCodeXRef
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceTaxcodesIdTaxcodexrefsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TaxCodeXRef], ConnectWiseManageRequestParams],
+    IAsyncPostable[TaxCodeXRef, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TaxCodeXRef, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "taxCodeXRefs", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TaxCodeXRef])
+        IAsyncPostable.__init__(self, TaxCodeXRef)
+        IAsyncPaginateable.__init__(self, TaxCodeXRef)
+
+    def id(self, _id: int) -> FinanceTaxcodesIdTaxcodexrefsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdTaxcodexrefsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceTaxcodesIdTaxcodexrefsIdEndpoint: The initialized FinanceTaxcodesIdTaxcodexrefsIdEndpoint object.
+        """
+        child = FinanceTaxcodesIdTaxcodexrefsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TaxCodeXRef]:
+        """
+        Performs a GET request against the /finance/taxCodes/{id}/taxCodeXRefs endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TaxCodeXRef]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TaxCodeXRef, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TaxCodeXRef]:
+        """
+        Performs a GET request against the /finance/taxCodes/{id}/taxCodeXRefs endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TaxCodeXRef]: The parsed response data.
+        """
+        return self._parse_many(TaxCodeXRef, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TaxCodeXRef:
+        """
+        Performs a POST request against the /finance/taxCodes/{id}/taxCodeXRefs endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TaxCodeXRef: The parsed response data.
+        """
+        return self._parse_one(TaxCodeXRef, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesIdTaxcodexrefsCountEndpoint:
+        """
+        The FinanceTaxcodesIdTaxcodexrefsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdTaxcodexrefsCountEndpoint(self.client, parent_endpoint=self)
+        )
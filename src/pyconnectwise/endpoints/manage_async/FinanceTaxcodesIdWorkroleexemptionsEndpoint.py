@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdWorkroleexemptionsCountEndpoint import (
+    FinanceTaxcodesIdWorkroleexemptionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.FinanceTaxcodesIdWorkroleexemptionsIdEndpoint import (
+    FinanceTaxcodesIdWorkroleexemptionsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import WorkRoleExemption
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class FinanceTaxcodesIdWorkroleexemptionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[WorkRoleExemption], ConnectWiseManageRequestParams],
+    IAsyncPostable[WorkRoleExemption, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[WorkRoleExemption, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "workRoleExemptions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[WorkRoleExemption])
+        IAsyncPostable.__init__(self, WorkRoleExemption)
+        IAsyncPaginateable.__init__(self, WorkRoleExemption)
+
+    def id(self, _id: int) -> FinanceTaxcodesIdWorkroleexemptionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized FinanceTaxcodesIdWorkroleexemptionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            FinanceTaxcodesIdWorkroleexemptionsIdEndpoint: The initialized FinanceTaxcodesIdWorkroleexemptionsIdEndpoint object.
+        """
+        child = FinanceTaxcodesIdWorkroleexemptionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[WorkRoleExemption]:
+        """
+        Performs a GET request against the /finance/taxCodes/{id}/workRoleExemptions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[WorkRoleExemption]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), WorkRoleExemption, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[WorkRoleExemption]:
+        """
+        Performs a GET request against the /finance/taxCodes/{id}/workRoleExemptions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[WorkRoleExemption]: The parsed response data.
+        """
+        return self._parse_many(
+            WorkRoleExemption, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> WorkRoleExemption:
+        """
+        Performs a POST request against the /finance/taxCodes/{id}/workRoleExemptions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkRoleExemption: The parsed response data.
+        """
+        return self._parse_one(
+            WorkRoleExemption, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> FinanceTaxcodesIdWorkroleexemptionsCountEndpoint:
+        """
+        The FinanceTaxcodesIdWorkroleexemptionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            FinanceTaxcodesIdWorkroleexemptionsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,118 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsCountEndpoint import MarketingCampaignsCountEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdEndpoint import MarketingCampaignsIdEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsStatusesEndpoint import MarketingCampaignsStatusesEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsSubtypesEndpoint import MarketingCampaignsSubtypesEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsTypesEndpoint import MarketingCampaignsTypesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Campaign
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MarketingCampaignsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Campaign], ConnectWiseManageRequestParams],
+    IAsyncPostable[Campaign, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Campaign, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "campaigns", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Campaign])
+        IAsyncPostable.__init__(self, Campaign)
+        IAsyncPaginateable.__init__(self, Campaign)
+
+    def id(self, _id: int) -> MarketingCampaignsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            MarketingCampaignsIdEndpoint: The initialized MarketingCampaignsIdEndpoint object.
+        """
+        child = MarketingCampaignsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Campaign]:
+        """
+        Performs a GET request against the /marketing/campaigns endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Campaign]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Campaign, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Campaign]:
+        """
+        Performs a GET request against the /marketing/campaigns endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Campaign]: The parsed response data.
+        """
+        return self._parse_many(Campaign, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Campaign:
+        """
+        Performs a POST request against the /marketing/campaigns endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Campaign: The parsed response data.
+        """
+        return self._parse_one(Campaign, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsCountEndpoint:
+        """
+        The MarketingCampaignsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> MarketingCampaignsStatusesEndpoint:
+        """
+        The MarketingCampaignsStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sub_types(self) -> MarketingCampaignsSubtypesEndpoint:
+        """
+        The MarketingCampaignsSubtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsSubtypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> MarketingCampaignsTypesEndpoint:
+        """
+        The MarketingCampaignsTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsTypesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdAuditsCountEndpoint import (
+    MarketingCampaignsIdAuditsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdAuditsIdEndpoint import (
+    MarketingCampaignsIdAuditsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CampaignAudit
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MarketingCampaignsIdAuditsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CampaignAudit], ConnectWiseManageRequestParams],
+    IAsyncPostable[CampaignAudit, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CampaignAudit, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "audits", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CampaignAudit])
+        IAsyncPostable.__init__(self, CampaignAudit)
+        IAsyncPaginateable.__init__(self, CampaignAudit)
+
+    def id(self, _id: int) -> MarketingCampaignsIdAuditsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdAuditsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            MarketingCampaignsIdAuditsIdEndpoint: The initialized MarketingCampaignsIdAuditsIdEndpoint object.
+        """
+        child = MarketingCampaignsIdAuditsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CampaignAudit]:
+        """
+        Performs a GET request against the /marketing/campaigns/{id}/audits endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CampaignAudit]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CampaignAudit, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CampaignAudit]:
+        """
+        Performs a GET request against the /marketing/campaigns/{id}/audits endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CampaignAudit]: The parsed response data.
+        """
+        return self._parse_many(CampaignAudit, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CampaignAudit:
+        """
+        Performs a POST request against the /marketing/campaigns/{id}/audits endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CampaignAudit: The parsed response data.
+        """
+        return self._parse_one(CampaignAudit, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsIdAuditsCountEndpoint:
+        """
+        The MarketingCampaignsIdAuditsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsIdAuditsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdEmailsopenedCountEndpoint import (
+    MarketingCampaignsIdEmailsopenedCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdEmailsopenedIdEndpoint import (
+    MarketingCampaignsIdEmailsopenedIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import EmailOpened
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MarketingCampaignsIdEmailsopenedEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[EmailOpened], ConnectWiseManageRequestParams],
+    IAsyncPostable[EmailOpened, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[EmailOpened, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "emailsOpened", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[EmailOpened])
+        IAsyncPostable.__init__(self, EmailOpened)
+        IAsyncPaginateable.__init__(self, EmailOpened)
+
+    def id(self, _id: int) -> MarketingCampaignsIdEmailsopenedIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdEmailsopenedIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            MarketingCampaignsIdEmailsopenedIdEndpoint: The initialized MarketingCampaignsIdEmailsopenedIdEndpoint object.
+        """
+        child = MarketingCampaignsIdEmailsopenedIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[EmailOpened]:
+        """
+        Performs a GET request against the /marketing/campaigns/{id}/emailsOpened endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[EmailOpened]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), EmailOpened, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[EmailOpened]:
+        """
+        Performs a GET request against the /marketing/campaigns/{id}/emailsOpened endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[EmailOpened]: The parsed response data.
+        """
+        return self._parse_many(EmailOpened, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> EmailOpened:
+        """
+        Performs a POST request against the /marketing/campaigns/{id}/emailsOpened endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            EmailOpened: The parsed response data.
+        """
+        return self._parse_one(EmailOpened, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsIdEmailsopenedCountEndpoint:
+        """
+        The MarketingCampaignsIdEmailsopenedCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdEmailsopenedCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,160 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdActivitiesEndpoint import (
+    MarketingCampaignsIdActivitiesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdAuditsEndpoint import MarketingCampaignsIdAuditsEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdEmailsopenedEndpoint import (
+    MarketingCampaignsIdEmailsopenedEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdFormssubmittedEndpoint import (
+    MarketingCampaignsIdFormssubmittedEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdLinksclickedEndpoint import (
+    MarketingCampaignsIdLinksclickedEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdOpportunitiesEndpoint import (
+    MarketingCampaignsIdOpportunitiesEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Campaign
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MarketingCampaignsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Campaign, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Campaign, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Campaign, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Campaign, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Campaign)
+        IAsyncPatchable.__init__(self, Campaign)
+        IAsyncPuttable.__init__(self, Campaign)
+        IAsyncPaginateable.__init__(self, Campaign)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Campaign]:
+        """
+        Performs a GET request against the /marketing/campaigns/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Campaign]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Campaign, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /marketing/campaigns/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Campaign:
+        """
+        Performs a GET request against the /marketing/campaigns/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Campaign: The parsed response data.
+        """
+        return self._parse_one(Campaign, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Campaign:
+        """
+        Performs a PATCH request against the /marketing/campaigns/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Campaign: The parsed response data.
+        """
+        return self._parse_one(Campaign, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Campaign:
+        """
+        Performs a PUT request against the /marketing/campaigns/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Campaign: The parsed response data.
+        """
+        return self._parse_one(Campaign, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def activities(self) -> MarketingCampaignsIdActivitiesEndpoint:
+        """
+        The MarketingCampaignsIdActivitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsIdActivitiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def audits(self) -> MarketingCampaignsIdAuditsEndpoint:
+        """
+        The MarketingCampaignsIdAuditsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsIdAuditsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def emails_opened(self) -> MarketingCampaignsIdEmailsopenedEndpoint:
+        """
+        The MarketingCampaignsIdEmailsopenedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdEmailsopenedEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def forms_submitted(self) -> MarketingCampaignsIdFormssubmittedEndpoint:
+        """
+        The MarketingCampaignsIdFormssubmittedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdFormssubmittedEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def links_clicked(self) -> MarketingCampaignsIdLinksclickedEndpoint:
+        """
+        The MarketingCampaignsIdLinksclickedEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdLinksclickedEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def opportunities(self) -> MarketingCampaignsIdOpportunitiesEndpoint:
+        """
+        The MarketingCampaignsIdOpportunitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdOpportunitiesEndpoint(self.client, parent_endpoint=self)
+        )
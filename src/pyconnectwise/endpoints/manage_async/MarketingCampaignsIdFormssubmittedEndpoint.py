@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdFormssubmittedCountEndpoint import (
+    MarketingCampaignsIdFormssubmittedCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdFormssubmittedIdEndpoint import (
+    MarketingCampaignsIdFormssubmittedIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import FormSubmitted
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MarketingCampaignsIdFormssubmittedEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[FormSubmitted], ConnectWiseManageRequestParams],
+    IAsyncPostable[FormSubmitted, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[FormSubmitted, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "formsSubmitted", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[FormSubmitted])
+        IAsyncPostable.__init__(self, FormSubmitted)
+        IAsyncPaginateable.__init__(self, FormSubmitted)
+
+    def id(self, _id: int) -> MarketingCampaignsIdFormssubmittedIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdFormssubmittedIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            MarketingCampaignsIdFormssubmittedIdEndpoint: The initialized MarketingCampaignsIdFormssubmittedIdEndpoint object.
+        """
+        child = MarketingCampaignsIdFormssubmittedIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[FormSubmitted]:
+        """
+        Performs a GET request against the /marketing/campaigns/{id}/formsSubmitted endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[FormSubmitted]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), FormSubmitted, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[FormSubmitted]:
+        """
+        Performs a GET request against the /marketing/campaigns/{id}/formsSubmitted endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[FormSubmitted]: The parsed response data.
+        """
+        return self._parse_many(FormSubmitted, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> FormSubmitted:
+        """
+        Performs a POST request against the /marketing/campaigns/{id}/formsSubmitted endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            FormSubmitted: The parsed response data.
+        """
+        return self._parse_one(FormSubmitted, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsIdFormssubmittedCountEndpoint:
+        """
+        The MarketingCampaignsIdFormssubmittedCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdFormssubmittedCountEndpoint(self.client, parent_endpoint=self)
+        )
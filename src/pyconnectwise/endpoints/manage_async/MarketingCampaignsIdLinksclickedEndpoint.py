@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdLinksclickedCountEndpoint import (
+    MarketingCampaignsIdLinksclickedCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsIdLinksclickedIdEndpoint import (
+    MarketingCampaignsIdLinksclickedIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import LinkClicked
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MarketingCampaignsIdLinksclickedEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LinkClicked], ConnectWiseManageRequestParams],
+    IAsyncPostable[LinkClicked, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[LinkClicked, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "linksClicked", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LinkClicked])
+        IAsyncPostable.__init__(self, LinkClicked)
+        IAsyncPaginateable.__init__(self, LinkClicked)
+
+    def id(self, _id: int) -> MarketingCampaignsIdLinksclickedIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized MarketingCampaignsIdLinksclickedIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            MarketingCampaignsIdLinksclickedIdEndpoint: The initialized MarketingCampaignsIdLinksclickedIdEndpoint object.
+        """
+        child = MarketingCampaignsIdLinksclickedIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LinkClicked]:
+        """
+        Performs a GET request against the /marketing/campaigns/{id}/linksClicked endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LinkClicked]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LinkClicked, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[LinkClicked]:
+        """
+        Performs a GET request against the /marketing/campaigns/{id}/linksClicked endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LinkClicked]: The parsed response data.
+        """
+        return self._parse_many(LinkClicked, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> LinkClicked:
+        """
+        Performs a POST request against the /marketing/campaigns/{id}/linksClicked endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LinkClicked: The parsed response data.
+        """
+        return self._parse_one(LinkClicked, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> MarketingCampaignsIdLinksclickedCountEndpoint:
+        """
+        The MarketingCampaignsIdLinksclickedCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsIdLinksclickedCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,88 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsTypesIdSubtypesCountEndpoint import (
+    MarketingCampaignsTypesIdSubtypesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsTypesIdSubtypesIdEndpoint import (
+    MarketingCampaignsTypesIdSubtypesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import TypeCampaignSubType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MarketingCampaignsTypesIdSubtypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TypeCampaignSubType], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TypeCampaignSubType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "subTypes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TypeCampaignSubType])
+        IAsyncPaginateable.__init__(self, TypeCampaignSubType)
+
+    def id(self, _id: int) -> MarketingCampaignsTypesIdSubtypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized MarketingCampaignsTypesIdSubtypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            MarketingCampaignsTypesIdSubtypesIdEndpoint: The initialized MarketingCampaignsTypesIdSubtypesIdEndpoint object.
+        """
+        child = MarketingCampaignsTypesIdSubtypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TypeCampaignSubType]:
+        """
+        Performs a GET request against the /marketing/campaigns/types/{id}/subTypes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TypeCampaignSubType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TypeCampaignSubType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TypeCampaignSubType]:
+        """
+        Performs a GET request against the /marketing/campaigns/types/{id}/subTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TypeCampaignSubType]: The parsed response data.
+        """
+        return self._parse_many(
+            TypeCampaignSubType, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> MarketingCampaignsTypesIdSubtypesCountEndpoint:
+        """
+        The MarketingCampaignsTypesIdSubtypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            MarketingCampaignsTypesIdSubtypesCountEndpoint(self.client, parent_endpoint=self)
+        )
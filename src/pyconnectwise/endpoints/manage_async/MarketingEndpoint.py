@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingCampaignsEndpoint import MarketingCampaignsEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingGroupsEndpoint import MarketingGroupsEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MarketingEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "marketing", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def campaigns(self) -> MarketingCampaignsEndpoint:
+        """
+        The MarketingCampaignsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingCampaignsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def groups(self) -> MarketingGroupsEndpoint:
+        """
+        The MarketingGroupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsEndpoint(self.client, parent_endpoint=self))
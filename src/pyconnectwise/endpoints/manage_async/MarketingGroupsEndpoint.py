@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingGroupsCountEndpoint import MarketingGroupsCountEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingGroupsIdEndpoint import MarketingGroupsIdEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingGroupsInfoEndpoint import MarketingGroupsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Group
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MarketingGroupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Group], ConnectWiseManageRequestParams],
+    IAsyncPostable[Group, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Group, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "groups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Group])
+        IAsyncPostable.__init__(self, Group)
+        IAsyncPaginateable.__init__(self, Group)
+
+    def id(self, _id: int) -> MarketingGroupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized MarketingGroupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            MarketingGroupsIdEndpoint: The initialized MarketingGroupsIdEndpoint object.
+        """
+        child = MarketingGroupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Group]:
+        """
+        Performs a GET request against the /marketing/groups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Group]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Group, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Group]:
+        """
+        Performs a GET request against the /marketing/groups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Group]: The parsed response data.
+        """
+        return self._parse_many(Group, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Group:
+        """
+        Performs a POST request against the /marketing/groups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Group: The parsed response data.
+        """
+        return self._parse_one(Group, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> MarketingGroupsCountEndpoint:
+        """
+        The MarketingGroupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> MarketingGroupsInfoEndpoint:
+        """
+        The MarketingGroupsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingGroupsIdCompaniesCountEndpoint import (
+    MarketingGroupsIdCompaniesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.MarketingGroupsIdCompaniesIdEndpoint import (
+    MarketingGroupsIdCompaniesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import MarketingCompany
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MarketingGroupsIdCompaniesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MarketingCompany], ConnectWiseManageRequestParams],
+    IAsyncPostable[MarketingCompany, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MarketingCompany, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "companies", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MarketingCompany])
+        IAsyncPostable.__init__(self, MarketingCompany)
+        IAsyncPaginateable.__init__(self, MarketingCompany)
+
+    def id(self, _id: int) -> MarketingGroupsIdCompaniesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized MarketingGroupsIdCompaniesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            MarketingGroupsIdCompaniesIdEndpoint: The initialized MarketingGroupsIdCompaniesIdEndpoint object.
+        """
+        child = MarketingGroupsIdCompaniesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MarketingCompany]:
+        """
+        Performs a GET request against the /marketing/groups/{id}/companies endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MarketingCompany]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MarketingCompany, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MarketingCompany]:
+        """
+        Performs a GET request against the /marketing/groups/{id}/companies endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MarketingCompany]: The parsed response data.
+        """
+        return self._parse_many(
+            MarketingCompany, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> MarketingCompany:
+        """
+        Performs a POST request against the /marketing/groups/{id}/companies endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MarketingCompany: The parsed response data.
+        """
+        return self._parse_one(
+            MarketingCompany, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> MarketingGroupsIdCompaniesCountEndpoint:
+        """
+        The MarketingGroupsIdCompaniesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsIdCompaniesCountEndpoint(self.client, parent_endpoint=self))
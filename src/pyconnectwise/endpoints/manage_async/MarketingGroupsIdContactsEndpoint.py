@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingGroupsIdContactsCountEndpoint import (
+    MarketingGroupsIdContactsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.MarketingGroupsIdContactsIdEndpoint import MarketingGroupsIdContactsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import MarketingContact
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MarketingGroupsIdContactsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MarketingContact], ConnectWiseManageRequestParams],
+    IAsyncPostable[MarketingContact, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MarketingContact, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "contacts", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MarketingContact])
+        IAsyncPostable.__init__(self, MarketingContact)
+        IAsyncPaginateable.__init__(self, MarketingContact)
+
+    def id(self, _id: int) -> MarketingGroupsIdContactsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized MarketingGroupsIdContactsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            MarketingGroupsIdContactsIdEndpoint: The initialized MarketingGroupsIdContactsIdEndpoint object.
+        """
+        child = MarketingGroupsIdContactsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MarketingContact]:
+        """
+        Performs a GET request against the /marketing/groups/{id}/contacts endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MarketingContact]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MarketingContact, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MarketingContact]:
+        """
+        Performs a GET request against the /marketing/groups/{id}/contacts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MarketingContact]: The parsed response data.
+        """
+        return self._parse_many(
+            MarketingContact, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> MarketingContact:
+        """
+        Performs a POST request against the /marketing/groups/{id}/contacts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MarketingContact: The parsed response data.
+        """
+        return self._parse_one(
+            MarketingContact, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> MarketingGroupsIdContactsCountEndpoint:
+        """
+        The MarketingGroupsIdContactsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsIdContactsCountEndpoint(self.client, parent_endpoint=self))
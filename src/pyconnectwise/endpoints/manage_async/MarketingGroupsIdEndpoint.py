@@ -0,0 +1,126 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingGroupsIdCompaniesEndpoint import MarketingGroupsIdCompaniesEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingGroupsIdContactsEndpoint import MarketingGroupsIdContactsEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingGroupsIdInfoEndpoint import MarketingGroupsIdInfoEndpoint
+from pyconnectwise.endpoints.manage_async.MarketingGroupsIdUsagesEndpoint import MarketingGroupsIdUsagesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Group
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class MarketingGroupsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Group, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Group, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Group, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Group, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Group)
+        IAsyncPatchable.__init__(self, Group)
+        IAsyncPuttable.__init__(self, Group)
+        IAsyncPaginateable.__init__(self, Group)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Group]:
+        """
+        Performs a GET request against the /marketing/groups/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Group]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Group, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /marketing/groups/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Group:
+        """
+        Performs a GET request against the /marketing/groups/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Group: The parsed response data.
+        """
+        return self._parse_one(Group, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Group:
+        """
+        Performs a PATCH request against the /marketing/groups/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Group: The parsed response data.
+        """
+        return self._parse_one(Group, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Group:
+        """
+        Performs a PUT request against the /marketing/groups/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Group: The parsed response data.
+        """
+        return self._parse_one(Group, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def companies(self) -> MarketingGroupsIdCompaniesEndpoint:
+        """
+        The MarketingGroupsIdCompaniesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsIdCompaniesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def contacts(self) -> MarketingGroupsIdContactsEndpoint:
+        """
+        The MarketingGroupsIdContactsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsIdContactsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> MarketingGroupsIdInfoEndpoint:
+        """
+        The MarketingGroupsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> MarketingGroupsIdUsagesEndpoint:
+        """
+        The MarketingGroupsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(MarketingGroupsIdUsagesEndpoint(self.client, parent_endpoint=self))
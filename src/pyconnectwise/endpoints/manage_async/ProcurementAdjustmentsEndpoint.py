@@ -0,0 +1,108 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementAdjustmentsCountEndpoint import ProcurementAdjustmentsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementAdjustmentsIdEndpoint import ProcurementAdjustmentsIdEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementAdjustmentsTypesEndpoint import ProcurementAdjustmentsTypesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProcurementAdjustment
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementAdjustmentsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProcurementAdjustment], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProcurementAdjustment, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProcurementAdjustment, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "adjustments", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProcurementAdjustment])
+        IAsyncPostable.__init__(self, ProcurementAdjustment)
+        IAsyncPaginateable.__init__(self, ProcurementAdjustment)
+
+    def id(self, _id: int) -> ProcurementAdjustmentsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementAdjustmentsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementAdjustmentsIdEndpoint: The initialized ProcurementAdjustmentsIdEndpoint object.
+        """
+        child = ProcurementAdjustmentsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProcurementAdjustment]:
+        """
+        Performs a GET request against the /procurement/adjustments endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProcurementAdjustment]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProcurementAdjustment, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProcurementAdjustment]:
+        """
+        Performs a GET request against the /procurement/adjustments endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProcurementAdjustment]: The parsed response data.
+        """
+        return self._parse_many(
+            ProcurementAdjustment, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProcurementAdjustment:
+        """
+        Performs a POST request against the /procurement/adjustments endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProcurementAdjustment: The parsed response data.
+        """
+        return self._parse_one(
+            ProcurementAdjustment, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementAdjustmentsCountEndpoint:
+        """
+        The ProcurementAdjustmentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementAdjustmentsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> ProcurementAdjustmentsTypesEndpoint:
+        """
+        The ProcurementAdjustmentsTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementAdjustmentsTypesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementAdjustmentsIdDetailsCountEndpoint import (
+    ProcurementAdjustmentsIdDetailsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementAdjustmentsIdDetailsIdEndpoint import (
+    ProcurementAdjustmentsIdDetailsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AdjustmentDetail
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementAdjustmentsIdDetailsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AdjustmentDetail], ConnectWiseManageRequestParams],
+    IAsyncPostable[AdjustmentDetail, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AdjustmentDetail, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "details", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AdjustmentDetail])
+        IAsyncPostable.__init__(self, AdjustmentDetail)
+        IAsyncPaginateable.__init__(self, AdjustmentDetail)
+
+    def id(self, _id: int) -> ProcurementAdjustmentsIdDetailsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementAdjustmentsIdDetailsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementAdjustmentsIdDetailsIdEndpoint: The initialized ProcurementAdjustmentsIdDetailsIdEndpoint object.
+        """
+        child = ProcurementAdjustmentsIdDetailsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AdjustmentDetail]:
+        """
+        Performs a GET request against the /procurement/adjustments/{id}/details endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AdjustmentDetail]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AdjustmentDetail, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AdjustmentDetail]:
+        """
+        Performs a GET request against the /procurement/adjustments/{id}/details endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AdjustmentDetail]: The parsed response data.
+        """
+        return self._parse_many(
+            AdjustmentDetail, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AdjustmentDetail:
+        """
+        Performs a POST request against the /procurement/adjustments/{id}/details endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AdjustmentDetail: The parsed response data.
+        """
+        return self._parse_one(
+            AdjustmentDetail, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementAdjustmentsIdDetailsCountEndpoint:
+        """
+        The ProcurementAdjustmentsIdDetailsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementAdjustmentsIdDetailsCountEndpoint(self.client, parent_endpoint=self)
+        )
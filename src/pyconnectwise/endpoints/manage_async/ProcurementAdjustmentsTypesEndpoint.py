@@ -0,0 +1,112 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementAdjustmentsTypesCountEndpoint import (
+    ProcurementAdjustmentsTypesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementAdjustmentsTypesIdEndpoint import (
+    ProcurementAdjustmentsTypesIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementAdjustmentsTypesInfoEndpoint import (
+    ProcurementAdjustmentsTypesInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AdjustmentType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementAdjustmentsTypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AdjustmentType], ConnectWiseManageRequestParams],
+    IAsyncPostable[AdjustmentType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AdjustmentType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "types", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AdjustmentType])
+        IAsyncPostable.__init__(self, AdjustmentType)
+        IAsyncPaginateable.__init__(self, AdjustmentType)
+
+    def id(self, _id: int) -> ProcurementAdjustmentsTypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementAdjustmentsTypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementAdjustmentsTypesIdEndpoint: The initialized ProcurementAdjustmentsTypesIdEndpoint object.
+        """
+        child = ProcurementAdjustmentsTypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AdjustmentType]:
+        """
+        Performs a GET request against the /procurement/adjustments/types endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AdjustmentType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AdjustmentType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AdjustmentType]:
+        """
+        Performs a GET request against the /procurement/adjustments/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AdjustmentType]: The parsed response data.
+        """
+        return self._parse_many(AdjustmentType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AdjustmentType:
+        """
+        Performs a POST request against the /procurement/adjustments/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AdjustmentType: The parsed response data.
+        """
+        return self._parse_one(AdjustmentType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementAdjustmentsTypesCountEndpoint:
+        """
+        The ProcurementAdjustmentsTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementAdjustmentsTypesCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> ProcurementAdjustmentsTypesInfoEndpoint:
+        """
+        The ProcurementAdjustmentsTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementAdjustmentsTypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogCountEndpoint import ProcurementCatalogCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogIdEndpoint import ProcurementCatalogIdEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogInfoEndpoint import ProcurementCatalogInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CatalogItem
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementCatalogEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CatalogItem], ConnectWiseManageRequestParams],
+    IAsyncPostable[CatalogItem, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CatalogItem, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "catalog", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CatalogItem])
+        IAsyncPostable.__init__(self, CatalogItem)
+        IAsyncPaginateable.__init__(self, CatalogItem)
+
+    def id(self, _id: int) -> ProcurementCatalogIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementCatalogIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementCatalogIdEndpoint: The initialized ProcurementCatalogIdEndpoint object.
+        """
+        child = ProcurementCatalogIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CatalogItem]:
+        """
+        Performs a GET request against the /procurement/catalog endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CatalogItem]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CatalogItem, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CatalogItem]:
+        """
+        Performs a GET request against the /procurement/catalog endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CatalogItem]: The parsed response data.
+        """
+        return self._parse_many(CatalogItem, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CatalogItem:
+        """
+        Performs a POST request against the /procurement/catalog endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CatalogItem: The parsed response data.
+        """
+        return self._parse_one(CatalogItem, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementCatalogCountEndpoint:
+        """
+        The ProcurementCatalogCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementCatalogInfoEndpoint:
+        """
+        The ProcurementCatalogInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogIdComponentsCountEndpoint import (
+    ProcurementCatalogIdComponentsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogIdComponentsIdEndpoint import (
+    ProcurementCatalogIdComponentsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CatalogComponent
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementCatalogIdComponentsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CatalogComponent], ConnectWiseManageRequestParams],
+    IAsyncPostable[CatalogComponent, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CatalogComponent, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "components", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CatalogComponent])
+        IAsyncPostable.__init__(self, CatalogComponent)
+        IAsyncPaginateable.__init__(self, CatalogComponent)
+
+    def id(self, _id: int) -> ProcurementCatalogIdComponentsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementCatalogIdComponentsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementCatalogIdComponentsIdEndpoint: The initialized ProcurementCatalogIdComponentsIdEndpoint object.
+        """
+        child = ProcurementCatalogIdComponentsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CatalogComponent]:
+        """
+        Performs a GET request against the /procurement/catalog/{id}/components endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CatalogComponent]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CatalogComponent, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CatalogComponent]:
+        """
+        Performs a GET request against the /procurement/catalog/{id}/components endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CatalogComponent]: The parsed response data.
+        """
+        return self._parse_many(
+            CatalogComponent, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CatalogComponent:
+        """
+        Performs a POST request against the /procurement/catalog/{id}/components endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CatalogComponent: The parsed response data.
+        """
+        return self._parse_one(
+            CatalogComponent, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementCatalogIdComponentsCountEndpoint:
+        """
+        The ProcurementCatalogIdComponentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCatalogIdComponentsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,154 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogIdComponentsEndpoint import (
+    ProcurementCatalogIdComponentsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogIdInfoEndpoint import ProcurementCatalogIdInfoEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogIdInventoryEndpoint import (
+    ProcurementCatalogIdInventoryEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogIdMinimumstockbywarehouseEndpoint import (
+    ProcurementCatalogIdMinimumstockbywarehouseEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogIdPricingEndpoint import ProcurementCatalogIdPricingEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogIdQuantityonhandEndpoint import (
+    ProcurementCatalogIdQuantityonhandEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import CatalogItem
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementCatalogIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[CatalogItem, ConnectWiseManageRequestParams],
+    IAsyncPatchable[CatalogItem, ConnectWiseManageRequestParams],
+    IAsyncPuttable[CatalogItem, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CatalogItem, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, CatalogItem)
+        IAsyncPatchable.__init__(self, CatalogItem)
+        IAsyncPuttable.__init__(self, CatalogItem)
+        IAsyncPaginateable.__init__(self, CatalogItem)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CatalogItem]:
+        """
+        Performs a GET request against the /procurement/catalog/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CatalogItem]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CatalogItem, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /procurement/catalog/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CatalogItem:
+        """
+        Performs a GET request against the /procurement/catalog/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CatalogItem: The parsed response data.
+        """
+        return self._parse_one(CatalogItem, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> CatalogItem:
+        """
+        Performs a PATCH request against the /procurement/catalog/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CatalogItem: The parsed response data.
+        """
+        return self._parse_one(CatalogItem, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> CatalogItem:
+        """
+        Performs a PUT request against the /procurement/catalog/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CatalogItem: The parsed response data.
+        """
+        return self._parse_one(CatalogItem, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def components(self) -> ProcurementCatalogIdComponentsEndpoint:
+        """
+        The ProcurementCatalogIdComponentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogIdComponentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementCatalogIdInfoEndpoint:
+        """
+        The ProcurementCatalogIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def inventory(self) -> ProcurementCatalogIdInventoryEndpoint:
+        """
+        The ProcurementCatalogIdInventoryEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogIdInventoryEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def minimum_stock_by_warehouse(self) -> ProcurementCatalogIdMinimumstockbywarehouseEndpoint:
+        """
+        The ProcurementCatalogIdMinimumstockbywarehouseEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCatalogIdMinimumstockbywarehouseEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def pricing(self) -> ProcurementCatalogIdPricingEndpoint:
+        """
+        The ProcurementCatalogIdPricingEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogIdPricingEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def quantity_on_hand(self) -> ProcurementCatalogIdQuantityonhandEndpoint:
+        """
+        The ProcurementCatalogIdQuantityonhandEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCatalogIdQuantityonhandEndpoint(self.client, parent_endpoint=self)
+        )
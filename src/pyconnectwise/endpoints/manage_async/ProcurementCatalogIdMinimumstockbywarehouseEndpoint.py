@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogIdMinimumstockbywarehouseCountEndpoint import (
+    ProcurementCatalogIdMinimumstockbywarehouseCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogIdMinimumstockbywarehouseIdEndpoint import (
+    ProcurementCatalogIdMinimumstockbywarehouseIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import MinimumStockByWarehouse
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementCatalogIdMinimumstockbywarehouseEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MinimumStockByWarehouse], ConnectWiseManageRequestParams],
+    IAsyncPostable[MinimumStockByWarehouse, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MinimumStockByWarehouse, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "minimumStockByWarehouse", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MinimumStockByWarehouse])
+        IAsyncPostable.__init__(self, MinimumStockByWarehouse)
+        IAsyncPaginateable.__init__(self, MinimumStockByWarehouse)
+
+    def id(self, _id: int) -> ProcurementCatalogIdMinimumstockbywarehouseIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementCatalogIdMinimumstockbywarehouseIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementCatalogIdMinimumstockbywarehouseIdEndpoint: The initialized ProcurementCatalogIdMinimumstockbywarehouseIdEndpoint object.
+        """
+        child = ProcurementCatalogIdMinimumstockbywarehouseIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MinimumStockByWarehouse]:
+        """
+        Performs a GET request against the /procurement/catalog/{id}/minimumStockByWarehouse endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MinimumStockByWarehouse]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MinimumStockByWarehouse, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MinimumStockByWarehouse]:
+        """
+        Performs a GET request against the /procurement/catalog/{id}/minimumStockByWarehouse endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MinimumStockByWarehouse]: The parsed response data.
+        """
+        return self._parse_many(
+            MinimumStockByWarehouse, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> MinimumStockByWarehouse:
+        """
+        Performs a POST request against the /procurement/catalog/{id}/minimumStockByWarehouse endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MinimumStockByWarehouse: The parsed response data.
+        """
+        return self._parse_one(
+            MinimumStockByWarehouse, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementCatalogIdMinimumstockbywarehouseCountEndpoint:
+        """
+        The ProcurementCatalogIdMinimumstockbywarehouseCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCatalogIdMinimumstockbywarehouseCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCategoriesCountEndpoint import ProcurementCategoriesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCategoriesIdEndpoint import ProcurementCategoriesIdEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCategoriesInfoEndpoint import ProcurementCategoriesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Category
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementCategoriesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Category], ConnectWiseManageRequestParams],
+    IAsyncPostable[Category, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Category, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "categories", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Category])
+        IAsyncPostable.__init__(self, Category)
+        IAsyncPaginateable.__init__(self, Category)
+
+    def id(self, _id: int) -> ProcurementCategoriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementCategoriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementCategoriesIdEndpoint: The initialized ProcurementCategoriesIdEndpoint object.
+        """
+        child = ProcurementCategoriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Category]:
+        """
+        Performs a GET request against the /procurement/categories endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Category]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Category, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Category]:
+        """
+        Performs a GET request against the /procurement/categories endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Category]: The parsed response data.
+        """
+        return self._parse_many(Category, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Category:
+        """
+        Performs a POST request against the /procurement/categories endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Category: The parsed response data.
+        """
+        return self._parse_one(Category, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementCategoriesCountEndpoint:
+        """
+        The ProcurementCategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCategoriesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementCategoriesInfoEndpoint:
+        """
+        The ProcurementCategoriesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCategoriesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,52 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCategoriesIdSubcategoriesCountEndpoint import (
+    ProcurementCategoriesIdSubcategoriesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementCategoriesIdSubcategoriesIdEndpoint import (
+    ProcurementCategoriesIdSubcategoriesIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementCategoriesIdSubcategoriesInfoEndpoint import (
+    ProcurementCategoriesIdSubcategoriesInfoEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementCategoriesIdSubcategoriesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "subcategories", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ProcurementCategoriesIdSubcategoriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementCategoriesIdSubcategoriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementCategoriesIdSubcategoriesIdEndpoint: The initialized ProcurementCategoriesIdSubcategoriesIdEndpoint object.
+        """
+        child = ProcurementCategoriesIdSubcategoriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def count(self) -> ProcurementCategoriesIdSubcategoriesCountEndpoint:
+        """
+        The ProcurementCategoriesIdSubcategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCategoriesIdSubcategoriesCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> ProcurementCategoriesIdSubcategoriesInfoEndpoint:
+        """
+        The ProcurementCategoriesIdSubcategoriesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementCategoriesIdSubcategoriesInfoEndpoint(self.client, parent_endpoint=self)
+        )
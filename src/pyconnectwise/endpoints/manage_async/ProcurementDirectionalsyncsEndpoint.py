@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementDirectionalsyncsCountEndpoint import (
+    ProcurementDirectionalsyncsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementDirectionalsyncsIdEndpoint import (
+    ProcurementDirectionalsyncsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import DirectionalSync
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementDirectionalsyncsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[DirectionalSync], ConnectWiseManageRequestParams],
+    IAsyncPostable[DirectionalSync, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[DirectionalSync, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "directionalSyncs", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[DirectionalSync])
+        IAsyncPostable.__init__(self, DirectionalSync)
+        IAsyncPaginateable.__init__(self, DirectionalSync)
+
+    def id(self, _id: int) -> ProcurementDirectionalsyncsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementDirectionalsyncsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementDirectionalsyncsIdEndpoint: The initialized ProcurementDirectionalsyncsIdEndpoint object.
+        """
+        child = ProcurementDirectionalsyncsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[DirectionalSync]:
+        """
+        Performs a GET request against the /procurement/directionalSyncs endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[DirectionalSync]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), DirectionalSync, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[DirectionalSync]:
+        """
+        Performs a GET request against the /procurement/directionalSyncs endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[DirectionalSync]: The parsed response data.
+        """
+        return self._parse_many(DirectionalSync, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> DirectionalSync:
+        """
+        Performs a POST request against the /procurement/directionalSyncs endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            DirectionalSync: The parsed response data.
+        """
+        return self._parse_one(DirectionalSync, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementDirectionalsyncsCountEndpoint:
+        """
+        The ProcurementDirectionalsyncsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementDirectionalsyncsCountEndpoint(self.client, parent_endpoint=self)
+        )
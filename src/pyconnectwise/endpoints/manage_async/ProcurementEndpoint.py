@@ -0,0 +1,188 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementAdjustmentsEndpoint import ProcurementAdjustmentsEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCatalogEndpoint import ProcurementCatalogEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementCategoriesEndpoint import ProcurementCategoriesEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementManufacturersEndpoint import ProcurementManufacturersEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementOnhandserialnumbersEndpoint import (
+    ProcurementOnhandserialnumbersEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementPricingschedulesEndpoint import ProcurementPricingschedulesEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementProductsEndpoint import ProcurementProductsEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseordersEndpoint import ProcurementPurchaseordersEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseorderstatusesEndpoint import (
+    ProcurementPurchaseorderstatusesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementPurchasingdemandsEndpoint import (
+    ProcurementPurchasingdemandsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementRmaactionsEndpoint import ProcurementRmaactionsEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementRmadispositionsEndpoint import ProcurementRmadispositionsEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementRmastatusesEndpoint import ProcurementRmastatusesEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementRmatagsEndpoint import ProcurementRmatagsEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementSettingsEndpoint import ProcurementSettingsEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementShipmentmethodsEndpoint import ProcurementShipmentmethodsEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementSubcategoriesEndpoint import ProcurementSubcategoriesEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementTypesEndpoint import ProcurementTypesEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementUnitofmeasuresEndpoint import ProcurementUnitofmeasuresEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementWarehousebinsEndpoint import ProcurementWarehousebinsEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementWarehousesEndpoint import ProcurementWarehousesEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "procurement", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def adjustments(self) -> ProcurementAdjustmentsEndpoint:
+        """
+        The ProcurementAdjustmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementAdjustmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def catalog(self) -> ProcurementCatalogEndpoint:
+        """
+        The ProcurementCatalogEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCatalogEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def categories(self) -> ProcurementCategoriesEndpoint:
+        """
+        The ProcurementCategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementCategoriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def manufacturers(self) -> ProcurementManufacturersEndpoint:
+        """
+        The ProcurementManufacturersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementManufacturersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def onhandserialnumbers(self) -> ProcurementOnhandserialnumbersEndpoint:
+        """
+        The ProcurementOnhandserialnumbersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementOnhandserialnumbersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def pricingschedules(self) -> ProcurementPricingschedulesEndpoint:
+        """
+        The ProcurementPricingschedulesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementPricingschedulesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def products(self) -> ProcurementProductsEndpoint:
+        """
+        The ProcurementProductsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementProductsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def purchaseorders(self) -> ProcurementPurchaseordersEndpoint:
+        """
+        The ProcurementPurchaseordersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementPurchaseordersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def purchaseorderstatuses(self) -> ProcurementPurchaseorderstatusesEndpoint:
+        """
+        The ProcurementPurchaseorderstatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseorderstatusesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def purchasing_demands(self) -> ProcurementPurchasingdemandsEndpoint:
+        """
+        The ProcurementPurchasingdemandsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementPurchasingdemandsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def r_m_a_dispositions(self) -> ProcurementRmadispositionsEndpoint:
+        """
+        The ProcurementRmadispositionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmadispositionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def rma_actions(self) -> ProcurementRmaactionsEndpoint:
+        """
+        The ProcurementRmaactionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmaactionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def rma_statuses(self) -> ProcurementRmastatusesEndpoint:
+        """
+        The ProcurementRmastatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmastatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def rma_tags(self) -> ProcurementRmatagsEndpoint:
+        """
+        The ProcurementRmatagsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmatagsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def settings(self) -> ProcurementSettingsEndpoint:
+        """
+        The ProcurementSettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementSettingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def shipmentmethods(self) -> ProcurementShipmentmethodsEndpoint:
+        """
+        The ProcurementShipmentmethodsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementShipmentmethodsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def subcategories(self) -> ProcurementSubcategoriesEndpoint:
+        """
+        The ProcurementSubcategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementSubcategoriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> ProcurementTypesEndpoint:
+        """
+        The ProcurementTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementTypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def unit_of_measures(self) -> ProcurementUnitofmeasuresEndpoint:
+        """
+        The ProcurementUnitofmeasuresEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementUnitofmeasuresEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def warehouse_bins(self) -> ProcurementWarehousebinsEndpoint:
+        """
+        The ProcurementWarehousebinsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousebinsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def warehouses(self) -> ProcurementWarehousesEndpoint:
+        """
+        The ProcurementWarehousesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,108 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementManufacturersCountEndpoint import (
+    ProcurementManufacturersCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementManufacturersIdEndpoint import ProcurementManufacturersIdEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementManufacturersInfoEndpoint import (
+    ProcurementManufacturersInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Manufacturer
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementManufacturersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Manufacturer], ConnectWiseManageRequestParams],
+    IAsyncPostable[Manufacturer, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Manufacturer, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "manufacturers", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Manufacturer])
+        IAsyncPostable.__init__(self, Manufacturer)
+        IAsyncPaginateable.__init__(self, Manufacturer)
+
+    def id(self, _id: int) -> ProcurementManufacturersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementManufacturersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementManufacturersIdEndpoint: The initialized ProcurementManufacturersIdEndpoint object.
+        """
+        child = ProcurementManufacturersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Manufacturer]:
+        """
+        Performs a GET request against the /procurement/manufacturers endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Manufacturer]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Manufacturer, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Manufacturer]:
+        """
+        Performs a GET request against the /procurement/manufacturers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Manufacturer]: The parsed response data.
+        """
+        return self._parse_many(Manufacturer, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> Manufacturer:
+        """
+        Performs a POST request against the /procurement/manufacturers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Manufacturer: The parsed response data.
+        """
+        return self._parse_one(Manufacturer, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementManufacturersCountEndpoint:
+        """
+        The ProcurementManufacturersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementManufacturersCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementManufacturersInfoEndpoint:
+        """
+        The ProcurementManufacturersInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementManufacturersInfoEndpoint(self.client, parent_endpoint=self))
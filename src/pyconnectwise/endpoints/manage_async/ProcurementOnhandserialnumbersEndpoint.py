@@ -0,0 +1,88 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementOnhandserialnumbersCountEndpoint import (
+    ProcurementOnhandserialnumbersCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementOnhandserialnumbersIdEndpoint import (
+    ProcurementOnhandserialnumbersIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import OnHandSerialNumber
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementOnhandserialnumbersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[OnHandSerialNumber], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[OnHandSerialNumber, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "onhandserialnumbers", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[OnHandSerialNumber])
+        IAsyncPaginateable.__init__(self, OnHandSerialNumber)
+
+    def id(self, _id: int) -> ProcurementOnhandserialnumbersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementOnhandserialnumbersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementOnhandserialnumbersIdEndpoint: The initialized ProcurementOnhandserialnumbersIdEndpoint object.
+        """
+        child = ProcurementOnhandserialnumbersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[OnHandSerialNumber]:
+        """
+        Performs a GET request against the /procurement/onhandserialnumbers endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[OnHandSerialNumber]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), OnHandSerialNumber, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[OnHandSerialNumber]:
+        """
+        Performs a GET request against the /procurement/onhandserialnumbers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[OnHandSerialNumber]: The parsed response data.
+        """
+        return self._parse_many(
+            OnHandSerialNumber, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementOnhandserialnumbersCountEndpoint:
+        """
+        The ProcurementOnhandserialnumbersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementOnhandserialnumbersCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint import (
+    ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint import (
+    ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import PricingBreak
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementPricingschedulesIdDetailsIdBreaksEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[PricingBreak], ConnectWiseManageRequestParams],
+    IAsyncPostable[PricingBreak, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PricingBreak, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "breaks", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[PricingBreak])
+        IAsyncPostable.__init__(self, PricingBreak)
+        IAsyncPaginateable.__init__(self, PricingBreak)
+
+    def id(self, _id: int) -> ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint: The initialized ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint object.
+        """
+        child = ProcurementPricingschedulesIdDetailsIdBreaksIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PricingBreak]:
+        """
+        Performs a GET request against the /procurement/pricingschedules/{id}/details/{id}/breaks endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PricingBreak]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), PricingBreak, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[PricingBreak]:
+        """
+        Performs a GET request against the /procurement/pricingschedules/{id}/details/{id}/breaks endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PricingBreak]: The parsed response data.
+        """
+        return self._parse_many(PricingBreak, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> PricingBreak:
+        """
+        Performs a POST request against the /procurement/pricingschedules/{id}/details/{id}/breaks endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PricingBreak: The parsed response data.
+        """
+        return self._parse_one(PricingBreak, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint:
+        """
+        The ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPricingschedulesIdDetailsIdBreaksCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementProductsCountEndpoint import ProcurementProductsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementProductsIdEndpoint import ProcurementProductsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProductItem
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementProductsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProductItem], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProductItem, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProductItem, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "products", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProductItem])
+        IAsyncPostable.__init__(self, ProductItem)
+        IAsyncPaginateable.__init__(self, ProductItem)
+
+    def id(self, _id: int) -> ProcurementProductsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementProductsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementProductsIdEndpoint: The initialized ProcurementProductsIdEndpoint object.
+        """
+        child = ProcurementProductsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProductItem]:
+        """
+        Performs a GET request against the /procurement/products endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProductItem]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProductItem, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProductItem]:
+        """
+        Performs a GET request against the /procurement/products endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProductItem]: The parsed response data.
+        """
+        return self._parse_many(ProductItem, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProductItem:
+        """
+        Performs a POST request against the /procurement/products endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProductItem: The parsed response data.
+        """
+        return self._parse_one(ProductItem, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementProductsCountEndpoint:
+        """
+        The ProcurementProductsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementProductsCountEndpoint(self.client, parent_endpoint=self))
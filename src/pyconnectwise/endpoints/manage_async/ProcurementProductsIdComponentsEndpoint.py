@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementProductsIdComponentsCountEndpoint import (
+    ProcurementProductsIdComponentsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementProductsIdComponentsIdEndpoint import (
+    ProcurementProductsIdComponentsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProductComponent
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementProductsIdComponentsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProductComponent], ConnectWiseManageRequestParams],
+    IAsyncPostable[list[ProductComponent], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProductComponent, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "components", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProductComponent])
+        IAsyncPostable.__init__(self, list[ProductComponent])
+        IAsyncPaginateable.__init__(self, ProductComponent)
+
+    def id(self, _id: int) -> ProcurementProductsIdComponentsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementProductsIdComponentsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementProductsIdComponentsIdEndpoint: The initialized ProcurementProductsIdComponentsIdEndpoint object.
+        """
+        child = ProcurementProductsIdComponentsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProductComponent]:
+        """
+        Performs a GET request against the /procurement/products/{id}/components endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProductComponent]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProductComponent, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProductComponent]:
+        """
+        Performs a GET request against the /procurement/products/{id}/components endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProductComponent]: The parsed response data.
+        """
+        return self._parse_many(
+            ProductComponent, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProductComponent]:
+        """
+        Performs a POST request against the /procurement/products/{id}/components endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProductComponent]: The parsed response data.
+        """
+        return self._parse_many(
+            ProductComponent, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementProductsIdComponentsCountEndpoint:
+        """
+        The ProcurementProductsIdComponentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementProductsIdComponentsCountEndpoint(self.client, parent_endpoint=self)
+        )
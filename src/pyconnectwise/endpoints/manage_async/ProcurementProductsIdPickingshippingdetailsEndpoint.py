@@ -0,0 +1,111 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementProductsIdPickingshippingdetailsCountEndpoint import (
+    ProcurementProductsIdPickingshippingdetailsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementProductsIdPickingshippingdetailsIdEndpoint import (
+    ProcurementProductsIdPickingshippingdetailsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProductPickingShippingDetail
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementProductsIdPickingshippingdetailsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProductPickingShippingDetail], ConnectWiseManageRequestParams],
+    IAsyncPostable[list[ProductPickingShippingDetail], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProductPickingShippingDetail, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "pickingShippingDetails", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProductPickingShippingDetail])
+        IAsyncPostable.__init__(self, list[ProductPickingShippingDetail])
+        IAsyncPaginateable.__init__(self, ProductPickingShippingDetail)
+
+    def id(self, _id: int) -> ProcurementProductsIdPickingshippingdetailsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementProductsIdPickingshippingdetailsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementProductsIdPickingshippingdetailsIdEndpoint: The initialized ProcurementProductsIdPickingshippingdetailsIdEndpoint object.
+        """
+        child = ProcurementProductsIdPickingshippingdetailsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProductPickingShippingDetail]:
+        """
+        Performs a GET request against the /procurement/products/{id}/pickingShippingDetails endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProductPickingShippingDetail]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            ProductPickingShippingDetail,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProductPickingShippingDetail]:
+        """
+        Performs a GET request against the /procurement/products/{id}/pickingShippingDetails endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProductPickingShippingDetail]: The parsed response data.
+        """
+        return self._parse_many(
+            ProductPickingShippingDetail, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProductPickingShippingDetail]:
+        """
+        Performs a POST request against the /procurement/products/{id}/pickingShippingDetails endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProductPickingShippingDetail]: The parsed response data.
+        """
+        return self._parse_many(
+            ProductPickingShippingDetail, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementProductsIdPickingshippingdetailsCountEndpoint:
+        """
+        The ProcurementProductsIdPickingshippingdetailsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementProductsIdPickingshippingdetailsCountEndpoint(self.client, parent_endpoint=self)
+        )
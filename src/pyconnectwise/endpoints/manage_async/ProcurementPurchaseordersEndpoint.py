@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseordersCountEndpoint import (
+    ProcurementPurchaseordersCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseordersIdEndpoint import ProcurementPurchaseordersIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import PurchaseOrder
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementPurchaseordersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[PurchaseOrder], ConnectWiseManageRequestParams],
+    IAsyncPostable[PurchaseOrder, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PurchaseOrder, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "purchaseorders", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[PurchaseOrder])
+        IAsyncPostable.__init__(self, PurchaseOrder)
+        IAsyncPaginateable.__init__(self, PurchaseOrder)
+
+    def id(self, _id: int) -> ProcurementPurchaseordersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementPurchaseordersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementPurchaseordersIdEndpoint: The initialized ProcurementPurchaseordersIdEndpoint object.
+        """
+        child = ProcurementPurchaseordersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PurchaseOrder]:
+        """
+        Performs a GET request against the /procurement/purchaseorders endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PurchaseOrder]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), PurchaseOrder, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[PurchaseOrder]:
+        """
+        Performs a GET request against the /procurement/purchaseorders endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PurchaseOrder]: The parsed response data.
+        """
+        return self._parse_many(PurchaseOrder, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> PurchaseOrder:
+        """
+        Performs a POST request against the /procurement/purchaseorders endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PurchaseOrder: The parsed response data.
+        """
+        return self._parse_one(PurchaseOrder, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementPurchaseordersCountEndpoint:
+        """
+        The ProcurementPurchaseordersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementPurchaseordersCountEndpoint(self.client, parent_endpoint=self))
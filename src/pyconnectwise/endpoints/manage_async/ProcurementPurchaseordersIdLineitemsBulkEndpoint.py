@@ -0,0 +1,60 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncDeleteable, IAsyncPostable, IAsyncPuttable
+from pyconnectwise.models.manage import BulkResult
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementPurchaseordersIdLineitemsBulkEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncDeleteable[ConnectWiseManageRequestParams],
+    IAsyncPostable[BulkResult, ConnectWiseManageRequestParams],
+    IAsyncPuttable[BulkResult, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "bulk", parent_endpoint=parent_endpoint)
+        IAsyncDeleteable.__init__(self, None)
+        IAsyncPostable.__init__(self, BulkResult)
+        IAsyncPuttable.__init__(self, BulkResult)
+
+    async def delete(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> BulkResult:
+        """
+        Performs a DELETE request against the /procurement/purchaseorders/{id}/lineitems/bulk endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BulkResult: The parsed response data.
+        """
+        return self._parse_one(BulkResult, (await super()._make_request("DELETE", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BulkResult:
+        """
+        Performs a POST request against the /procurement/purchaseorders/{id}/lineitems/bulk endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BulkResult: The parsed response data.
+        """
+        return self._parse_one(BulkResult, (await super()._make_request("POST", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BulkResult:
+        """
+        Performs a PUT request against the /procurement/purchaseorders/{id}/lineitems/bulk endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BulkResult: The parsed response data.
+        """
+        return self._parse_one(BulkResult, (await super()._make_request("PUT", data=data, params=params)).content)
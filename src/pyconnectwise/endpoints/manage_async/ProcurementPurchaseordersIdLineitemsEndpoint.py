@@ -0,0 +1,118 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseordersIdLineitemsBulkEndpoint import (
+    ProcurementPurchaseordersIdLineitemsBulkEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseordersIdLineitemsCountEndpoint import (
+    ProcurementPurchaseordersIdLineitemsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseordersIdLineitemsIdEndpoint import (
+    ProcurementPurchaseordersIdLineitemsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import PurchaseOrderLineItem
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementPurchaseordersIdLineitemsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[PurchaseOrderLineItem], ConnectWiseManageRequestParams],
+    IAsyncPostable[PurchaseOrderLineItem, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PurchaseOrderLineItem, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "lineitems", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[PurchaseOrderLineItem])
+        IAsyncPostable.__init__(self, PurchaseOrderLineItem)
+        IAsyncPaginateable.__init__(self, PurchaseOrderLineItem)
+
+    def id(self, _id: int) -> ProcurementPurchaseordersIdLineitemsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementPurchaseordersIdLineitemsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementPurchaseordersIdLineitemsIdEndpoint: The initialized ProcurementPurchaseordersIdLineitemsIdEndpoint object.
+        """
+        child = ProcurementPurchaseordersIdLineitemsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PurchaseOrderLineItem]:
+        """
+        Performs a GET request against the /procurement/purchaseorders/{id}/lineitems endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PurchaseOrderLineItem]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), PurchaseOrderLineItem, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[PurchaseOrderLineItem]:
+        """
+        Performs a GET request against the /procurement/purchaseorders/{id}/lineitems endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PurchaseOrderLineItem]: The parsed response data.
+        """
+        return self._parse_many(
+            PurchaseOrderLineItem, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> PurchaseOrderLineItem:
+        """
+        Performs a POST request against the /procurement/purchaseorders/{id}/lineitems endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PurchaseOrderLineItem: The parsed response data.
+        """
+        return self._parse_one(
+            PurchaseOrderLineItem, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def bulk(self) -> ProcurementPurchaseordersIdLineitemsBulkEndpoint:
+        """
+        The ProcurementPurchaseordersIdLineitemsBulkEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseordersIdLineitemsBulkEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def count(self) -> ProcurementPurchaseordersIdLineitemsCountEndpoint:
+        """
+        The ProcurementPurchaseordersIdLineitemsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseordersIdLineitemsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseorderstatusesCountEndpoint import (
+    ProcurementPurchaseorderstatusesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseorderstatusesIdEndpoint import (
+    ProcurementPurchaseorderstatusesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import PurchaseOrderStatus
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementPurchaseorderstatusesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[PurchaseOrderStatus], ConnectWiseManageRequestParams],
+    IAsyncPostable[PurchaseOrderStatus, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PurchaseOrderStatus, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "purchaseorderstatuses", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[PurchaseOrderStatus])
+        IAsyncPostable.__init__(self, PurchaseOrderStatus)
+        IAsyncPaginateable.__init__(self, PurchaseOrderStatus)
+
+    def id(self, _id: int) -> ProcurementPurchaseorderstatusesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementPurchaseorderstatusesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementPurchaseorderstatusesIdEndpoint: The initialized ProcurementPurchaseorderstatusesIdEndpoint object.
+        """
+        child = ProcurementPurchaseorderstatusesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PurchaseOrderStatus]:
+        """
+        Performs a GET request against the /procurement/purchaseorderstatuses endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PurchaseOrderStatus]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), PurchaseOrderStatus, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[PurchaseOrderStatus]:
+        """
+        Performs a GET request against the /procurement/purchaseorderstatuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PurchaseOrderStatus]: The parsed response data.
+        """
+        return self._parse_many(
+            PurchaseOrderStatus, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> PurchaseOrderStatus:
+        """
+        Performs a POST request against the /procurement/purchaseorderstatuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PurchaseOrderStatus: The parsed response data.
+        """
+        return self._parse_one(
+            PurchaseOrderStatus, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementPurchaseorderstatusesCountEndpoint:
+        """
+        The ProcurementPurchaseorderstatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseorderstatusesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,40 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint import (
+    ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint import (
+    ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementPurchaseorderstatusesIdEmailtemplatesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "emailtemplates", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint: The initialized ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint object.
+        """
+        child = ProcurementPurchaseorderstatusesIdEmailtemplatesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def count(self) -> ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint:
+        """
+        The ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseorderstatusesIdEmailtemplatesCountEndpoint(self.client, parent_endpoint=self)
+        )
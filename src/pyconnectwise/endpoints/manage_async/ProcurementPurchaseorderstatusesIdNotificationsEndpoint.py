@@ -0,0 +1,111 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseorderstatusesIdNotificationsCountEndpoint import (
+    ProcurementPurchaseorderstatusesIdNotificationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementPurchaseorderstatusesIdNotificationsIdEndpoint import (
+    ProcurementPurchaseorderstatusesIdNotificationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import PurchaseOrderStatusNotification
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementPurchaseorderstatusesIdNotificationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[PurchaseOrderStatusNotification], ConnectWiseManageRequestParams],
+    IAsyncPostable[PurchaseOrderStatusNotification, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PurchaseOrderStatusNotification, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "notifications", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[PurchaseOrderStatusNotification])
+        IAsyncPostable.__init__(self, PurchaseOrderStatusNotification)
+        IAsyncPaginateable.__init__(self, PurchaseOrderStatusNotification)
+
+    def id(self, _id: int) -> ProcurementPurchaseorderstatusesIdNotificationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementPurchaseorderstatusesIdNotificationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementPurchaseorderstatusesIdNotificationsIdEndpoint: The initialized ProcurementPurchaseorderstatusesIdNotificationsIdEndpoint object.
+        """
+        child = ProcurementPurchaseorderstatusesIdNotificationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PurchaseOrderStatusNotification]:
+        """
+        Performs a GET request against the /procurement/purchaseorderstatuses/{id}/notifications endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PurchaseOrderStatusNotification]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            PurchaseOrderStatusNotification,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[PurchaseOrderStatusNotification]:
+        """
+        Performs a GET request against the /procurement/purchaseorderstatuses/{id}/notifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PurchaseOrderStatusNotification]: The parsed response data.
+        """
+        return self._parse_many(
+            PurchaseOrderStatusNotification, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> PurchaseOrderStatusNotification:
+        """
+        Performs a POST request against the /procurement/purchaseorderstatuses/{id}/notifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PurchaseOrderStatusNotification: The parsed response data.
+        """
+        return self._parse_one(
+            PurchaseOrderStatusNotification, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementPurchaseorderstatusesIdNotificationsCountEndpoint:
+        """
+        The ProcurementPurchaseorderstatusesIdNotificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementPurchaseorderstatusesIdNotificationsCountEndpoint(self.client, parent_endpoint=self)
+        )
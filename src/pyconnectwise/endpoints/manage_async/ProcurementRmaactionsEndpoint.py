@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementRmaactionsCountEndpoint import ProcurementRmaactionsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementRmaactionsIdEndpoint import ProcurementRmaactionsIdEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementRmaactionsInfoEndpoint import ProcurementRmaactionsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import RmaAction
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementRmaactionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[RmaAction], ConnectWiseManageRequestParams],
+    IAsyncPostable[RmaAction, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[RmaAction, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "rmaActions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[RmaAction])
+        IAsyncPostable.__init__(self, RmaAction)
+        IAsyncPaginateable.__init__(self, RmaAction)
+
+    def id(self, _id: int) -> ProcurementRmaactionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementRmaactionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementRmaactionsIdEndpoint: The initialized ProcurementRmaactionsIdEndpoint object.
+        """
+        child = ProcurementRmaactionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[RmaAction]:
+        """
+        Performs a GET request against the /procurement/rmaActions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[RmaAction]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), RmaAction, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[RmaAction]:
+        """
+        Performs a GET request against the /procurement/rmaActions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[RmaAction]: The parsed response data.
+        """
+        return self._parse_many(RmaAction, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> RmaAction:
+        """
+        Performs a POST request against the /procurement/rmaActions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            RmaAction: The parsed response data.
+        """
+        return self._parse_one(RmaAction, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementRmaactionsCountEndpoint:
+        """
+        The ProcurementRmaactionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmaactionsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementRmaactionsInfoEndpoint:
+        """
+        The ProcurementRmaactionsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmaactionsInfoEndpoint(self.client, parent_endpoint=self))
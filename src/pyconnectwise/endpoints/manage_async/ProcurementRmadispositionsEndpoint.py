@@ -0,0 +1,110 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementRmadispositionsCountEndpoint import (
+    ProcurementRmadispositionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementRmadispositionsIdEndpoint import (
+    ProcurementRmadispositionsIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementRmadispositionsInfoEndpoint import (
+    ProcurementRmadispositionsInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import RmaDisposition
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementRmadispositionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[RmaDisposition], ConnectWiseManageRequestParams],
+    IAsyncPostable[RmaDisposition, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[RmaDisposition, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "RMADispositions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[RmaDisposition])
+        IAsyncPostable.__init__(self, RmaDisposition)
+        IAsyncPaginateable.__init__(self, RmaDisposition)
+
+    def id(self, _id: int) -> ProcurementRmadispositionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementRmadispositionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementRmadispositionsIdEndpoint: The initialized ProcurementRmadispositionsIdEndpoint object.
+        """
+        child = ProcurementRmadispositionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[RmaDisposition]:
+        """
+        Performs a GET request against the /procurement/RMADispositions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[RmaDisposition]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), RmaDisposition, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[RmaDisposition]:
+        """
+        Performs a GET request against the /procurement/RMADispositions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[RmaDisposition]: The parsed response data.
+        """
+        return self._parse_many(RmaDisposition, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> RmaDisposition:
+        """
+        Performs a POST request against the /procurement/RMADispositions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            RmaDisposition: The parsed response data.
+        """
+        return self._parse_one(RmaDisposition, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementRmadispositionsCountEndpoint:
+        """
+        The ProcurementRmadispositionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmadispositionsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementRmadispositionsInfoEndpoint:
+        """
+        The ProcurementRmadispositionsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmadispositionsInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementRmastatusesIdNotificationsCountEndpoint import (
+    ProcurementRmastatusesIdNotificationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementRmastatusesIdNotificationsIdEndpoint import (
+    ProcurementRmastatusesIdNotificationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import RmaStatusNotification
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementRmastatusesIdNotificationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[RmaStatusNotification], ConnectWiseManageRequestParams],
+    IAsyncPostable[RmaStatusNotification, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[RmaStatusNotification, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "notifications", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[RmaStatusNotification])
+        IAsyncPostable.__init__(self, RmaStatusNotification)
+        IAsyncPaginateable.__init__(self, RmaStatusNotification)
+
+    def id(self, _id: int) -> ProcurementRmastatusesIdNotificationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementRmastatusesIdNotificationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementRmastatusesIdNotificationsIdEndpoint: The initialized ProcurementRmastatusesIdNotificationsIdEndpoint object.
+        """
+        child = ProcurementRmastatusesIdNotificationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[RmaStatusNotification]:
+        """
+        Performs a GET request against the /procurement/rmaStatuses/{id}/notifications endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[RmaStatusNotification]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), RmaStatusNotification, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[RmaStatusNotification]:
+        """
+        Performs a GET request against the /procurement/rmaStatuses/{id}/notifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[RmaStatusNotification]: The parsed response data.
+        """
+        return self._parse_many(
+            RmaStatusNotification, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> RmaStatusNotification:
+        """
+        Performs a POST request against the /procurement/rmaStatuses/{id}/notifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            RmaStatusNotification: The parsed response data.
+        """
+        return self._parse_one(
+            RmaStatusNotification, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementRmastatusesIdNotificationsCountEndpoint:
+        """
+        The ProcurementRmastatusesIdNotificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementRmastatusesIdNotificationsCountEndpoint(self.client, parent_endpoint=self)
+        )
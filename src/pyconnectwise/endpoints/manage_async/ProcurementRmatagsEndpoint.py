@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementRmatagsCountEndpoint import ProcurementRmatagsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementRmatagsDefaultEndpoint import ProcurementRmatagsDefaultEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementRmatagsIdEndpoint import ProcurementRmatagsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import RmaTag
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementRmatagsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[RmaTag], ConnectWiseManageRequestParams],
+    IAsyncPostable[RmaTag, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[RmaTag, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "rmaTags", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[RmaTag])
+        IAsyncPostable.__init__(self, RmaTag)
+        IAsyncPaginateable.__init__(self, RmaTag)
+
+    def id(self, _id: int) -> ProcurementRmatagsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementRmatagsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementRmatagsIdEndpoint: The initialized ProcurementRmatagsIdEndpoint object.
+        """
+        child = ProcurementRmatagsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[RmaTag]:
+        """
+        Performs a GET request against the /procurement/rmaTags endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[RmaTag]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), RmaTag, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[RmaTag]:
+        """
+        Performs a GET request against the /procurement/rmaTags endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[RmaTag]: The parsed response data.
+        """
+        return self._parse_many(RmaTag, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> RmaTag:
+        """
+        Performs a POST request against the /procurement/rmaTags endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            RmaTag: The parsed response data.
+        """
+        return self._parse_one(RmaTag, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementRmatagsCountEndpoint:
+        """
+        The ProcurementRmatagsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmatagsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def default(self) -> ProcurementRmatagsDefaultEndpoint:
+        """
+        The ProcurementRmatagsDefaultEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementRmatagsDefaultEndpoint(self.client, parent_endpoint=self))
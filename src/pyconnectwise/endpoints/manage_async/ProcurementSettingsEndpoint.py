@@ -0,0 +1,82 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementSettingsCountEndpoint import ProcurementSettingsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementSettingsIdEndpoint import ProcurementSettingsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import ProcurementSetting
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementSettingsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProcurementSetting], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProcurementSetting, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "settings", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProcurementSetting])
+        IAsyncPaginateable.__init__(self, ProcurementSetting)
+
+    def id(self, _id: int) -> ProcurementSettingsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementSettingsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementSettingsIdEndpoint: The initialized ProcurementSettingsIdEndpoint object.
+        """
+        child = ProcurementSettingsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProcurementSetting]:
+        """
+        Performs a GET request against the /procurement/settings endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProcurementSetting]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProcurementSetting, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProcurementSetting]:
+        """
+        Performs a GET request against the /procurement/settings endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProcurementSetting]: The parsed response data.
+        """
+        return self._parse_many(
+            ProcurementSetting, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProcurementSettingsCountEndpoint:
+        """
+        The ProcurementSettingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementSettingsCountEndpoint(self.client, parent_endpoint=self))
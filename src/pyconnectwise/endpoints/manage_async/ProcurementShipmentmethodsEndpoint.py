@@ -0,0 +1,110 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementShipmentmethodsCountEndpoint import (
+    ProcurementShipmentmethodsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementShipmentmethodsIdEndpoint import (
+    ProcurementShipmentmethodsIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementShipmentmethodsInfoEndpoint import (
+    ProcurementShipmentmethodsInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ShipmentMethod
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementShipmentmethodsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ShipmentMethod], ConnectWiseManageRequestParams],
+    IAsyncPostable[ShipmentMethod, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ShipmentMethod, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "shipmentmethods", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ShipmentMethod])
+        IAsyncPostable.__init__(self, ShipmentMethod)
+        IAsyncPaginateable.__init__(self, ShipmentMethod)
+
+    def id(self, _id: int) -> ProcurementShipmentmethodsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementShipmentmethodsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementShipmentmethodsIdEndpoint: The initialized ProcurementShipmentmethodsIdEndpoint object.
+        """
+        child = ProcurementShipmentmethodsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ShipmentMethod]:
+        """
+        Performs a GET request against the /procurement/shipmentmethods endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ShipmentMethod]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ShipmentMethod, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ShipmentMethod]:
+        """
+        Performs a GET request against the /procurement/shipmentmethods endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ShipmentMethod]: The parsed response data.
+        """
+        return self._parse_many(ShipmentMethod, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ShipmentMethod:
+        """
+        Performs a POST request against the /procurement/shipmentmethods endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ShipmentMethod: The parsed response data.
+        """
+        return self._parse_one(ShipmentMethod, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementShipmentmethodsCountEndpoint:
+        """
+        The ProcurementShipmentmethodsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementShipmentmethodsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementShipmentmethodsInfoEndpoint:
+        """
+        The ProcurementShipmentmethodsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementShipmentmethodsInfoEndpoint(self.client, parent_endpoint=self))
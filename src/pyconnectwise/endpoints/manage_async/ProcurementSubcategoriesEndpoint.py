@@ -0,0 +1,46 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementSubcategoriesCountEndpoint import (
+    ProcurementSubcategoriesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementSubcategoriesIdEndpoint import ProcurementSubcategoriesIdEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementSubcategoriesInfoEndpoint import (
+    ProcurementSubcategoriesInfoEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementSubcategoriesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "subcategories", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ProcurementSubcategoriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementSubcategoriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementSubcategoriesIdEndpoint: The initialized ProcurementSubcategoriesIdEndpoint object.
+        """
+        child = ProcurementSubcategoriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def count(self) -> ProcurementSubcategoriesCountEndpoint:
+        """
+        The ProcurementSubcategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementSubcategoriesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementSubcategoriesInfoEndpoint:
+        """
+        The ProcurementSubcategoriesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementSubcategoriesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementTypesCountEndpoint import ProcurementTypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementTypesIdEndpoint import ProcurementTypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementTypesInfoEndpoint import ProcurementTypesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProductType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementTypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProductType], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProductType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProductType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "types", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProductType])
+        IAsyncPostable.__init__(self, ProductType)
+        IAsyncPaginateable.__init__(self, ProductType)
+
+    def id(self, _id: int) -> ProcurementTypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementTypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementTypesIdEndpoint: The initialized ProcurementTypesIdEndpoint object.
+        """
+        child = ProcurementTypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProductType]:
+        """
+        Performs a GET request against the /procurement/types endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProductType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProductType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProductType]:
+        """
+        Performs a GET request against the /procurement/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProductType]: The parsed response data.
+        """
+        return self._parse_many(ProductType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProductType:
+        """
+        Performs a POST request against the /procurement/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProductType: The parsed response data.
+        """
+        return self._parse_one(ProductType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementTypesCountEndpoint:
+        """
+        The ProcurementTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementTypesInfoEndpoint:
+        """
+        The ProcurementTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementTypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementUnitofmeasuresCountEndpoint import (
+    ProcurementUnitofmeasuresCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementUnitofmeasuresIdEndpoint import ProcurementUnitofmeasuresIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import UnitOfMeasure
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementUnitofmeasuresEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[UnitOfMeasure], ConnectWiseManageRequestParams],
+    IAsyncPostable[UnitOfMeasure, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[UnitOfMeasure, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "unitOfMeasures", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[UnitOfMeasure])
+        IAsyncPostable.__init__(self, UnitOfMeasure)
+        IAsyncPaginateable.__init__(self, UnitOfMeasure)
+
+    def id(self, _id: int) -> ProcurementUnitofmeasuresIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementUnitofmeasuresIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementUnitofmeasuresIdEndpoint: The initialized ProcurementUnitofmeasuresIdEndpoint object.
+        """
+        child = ProcurementUnitofmeasuresIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[UnitOfMeasure]:
+        """
+        Performs a GET request against the /procurement/unitOfMeasures endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[UnitOfMeasure]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), UnitOfMeasure, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[UnitOfMeasure]:
+        """
+        Performs a GET request against the /procurement/unitOfMeasures endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[UnitOfMeasure]: The parsed response data.
+        """
+        return self._parse_many(UnitOfMeasure, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> UnitOfMeasure:
+        """
+        Performs a POST request against the /procurement/unitOfMeasures endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            UnitOfMeasure: The parsed response data.
+        """
+        return self._parse_one(UnitOfMeasure, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementUnitofmeasuresCountEndpoint:
+        """
+        The ProcurementUnitofmeasuresCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementUnitofmeasuresCountEndpoint(self.client, parent_endpoint=self))
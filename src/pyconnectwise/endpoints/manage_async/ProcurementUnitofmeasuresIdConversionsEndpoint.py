@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementUnitofmeasuresIdConversionsCountEndpoint import (
+    ProcurementUnitofmeasuresIdConversionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementUnitofmeasuresIdConversionsIdEndpoint import (
+    ProcurementUnitofmeasuresIdConversionsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Conversion
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementUnitofmeasuresIdConversionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Conversion], ConnectWiseManageRequestParams],
+    IAsyncPostable[Conversion, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Conversion, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "conversions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Conversion])
+        IAsyncPostable.__init__(self, Conversion)
+        IAsyncPaginateable.__init__(self, Conversion)
+
+    def id(self, _id: int) -> ProcurementUnitofmeasuresIdConversionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementUnitofmeasuresIdConversionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementUnitofmeasuresIdConversionsIdEndpoint: The initialized ProcurementUnitofmeasuresIdConversionsIdEndpoint object.
+        """
+        child = ProcurementUnitofmeasuresIdConversionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Conversion]:
+        """
+        Performs a GET request against the /procurement/unitOfMeasures/{id}/conversions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Conversion]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Conversion, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Conversion]:
+        """
+        Performs a GET request against the /procurement/unitOfMeasures/{id}/conversions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Conversion]: The parsed response data.
+        """
+        return self._parse_many(Conversion, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Conversion:
+        """
+        Performs a POST request against the /procurement/unitOfMeasures/{id}/conversions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Conversion: The parsed response data.
+        """
+        return self._parse_one(Conversion, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementUnitofmeasuresIdConversionsCountEndpoint:
+        """
+        The ProcurementUnitofmeasuresIdConversionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProcurementUnitofmeasuresIdConversionsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,108 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementWarehousebinsCountEndpoint import (
+    ProcurementWarehousebinsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProcurementWarehousebinsIdEndpoint import ProcurementWarehousebinsIdEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementWarehousebinsInfoEndpoint import (
+    ProcurementWarehousebinsInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import WarehouseBin
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementWarehousebinsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[WarehouseBin], ConnectWiseManageRequestParams],
+    IAsyncPostable[WarehouseBin, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[WarehouseBin, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "warehouseBins", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[WarehouseBin])
+        IAsyncPostable.__init__(self, WarehouseBin)
+        IAsyncPaginateable.__init__(self, WarehouseBin)
+
+    def id(self, _id: int) -> ProcurementWarehousebinsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementWarehousebinsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementWarehousebinsIdEndpoint: The initialized ProcurementWarehousebinsIdEndpoint object.
+        """
+        child = ProcurementWarehousebinsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[WarehouseBin]:
+        """
+        Performs a GET request against the /procurement/warehouseBins endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[WarehouseBin]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), WarehouseBin, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[WarehouseBin]:
+        """
+        Performs a GET request against the /procurement/warehouseBins endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[WarehouseBin]: The parsed response data.
+        """
+        return self._parse_many(WarehouseBin, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> WarehouseBin:
+        """
+        Performs a POST request against the /procurement/warehouseBins endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WarehouseBin: The parsed response data.
+        """
+        return self._parse_one(WarehouseBin, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementWarehousebinsCountEndpoint:
+        """
+        The ProcurementWarehousebinsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousebinsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementWarehousebinsInfoEndpoint:
+        """
+        The ProcurementWarehousebinsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousebinsInfoEndpoint(self.client, parent_endpoint=self))
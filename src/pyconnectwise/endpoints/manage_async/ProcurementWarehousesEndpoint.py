@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementWarehousesCountEndpoint import ProcurementWarehousesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementWarehousesIdEndpoint import ProcurementWarehousesIdEndpoint
+from pyconnectwise.endpoints.manage_async.ProcurementWarehousesInfoEndpoint import ProcurementWarehousesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Warehouse
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProcurementWarehousesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Warehouse], ConnectWiseManageRequestParams],
+    IAsyncPostable[Warehouse, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Warehouse, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "warehouses", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Warehouse])
+        IAsyncPostable.__init__(self, Warehouse)
+        IAsyncPaginateable.__init__(self, Warehouse)
+
+    def id(self, _id: int) -> ProcurementWarehousesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProcurementWarehousesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProcurementWarehousesIdEndpoint: The initialized ProcurementWarehousesIdEndpoint object.
+        """
+        child = ProcurementWarehousesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Warehouse]:
+        """
+        Performs a GET request against the /procurement/warehouses endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Warehouse]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Warehouse, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Warehouse]:
+        """
+        Performs a GET request against the /procurement/warehouses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Warehouse]: The parsed response data.
+        """
+        return self._parse_many(Warehouse, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Warehouse:
+        """
+        Performs a POST request against the /procurement/warehouses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Warehouse: The parsed response data.
+        """
+        return self._parse_one(Warehouse, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProcurementWarehousesCountEndpoint:
+        """
+        The ProcurementWarehousesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProcurementWarehousesInfoEndpoint:
+        """
+        The ProcurementWarehousesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProcurementWarehousesInfoEndpoint(self.client, parent_endpoint=self))
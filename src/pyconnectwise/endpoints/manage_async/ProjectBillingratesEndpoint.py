@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectBillingratesIdEndpoint import ProjectBillingratesIdEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectBillingratesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "billingRates", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ProjectBillingratesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectBillingratesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectBillingratesIdEndpoint: The initialized ProjectBillingratesIdEndpoint object.
+        """
+        child = ProjectBillingratesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
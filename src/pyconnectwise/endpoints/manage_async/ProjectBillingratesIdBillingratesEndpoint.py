@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectBillingratesIdBillingratesIdEndpoint import (
+    ProjectBillingratesIdBillingratesIdEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectBillingratesIdBillingratesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "billingRates", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ProjectBillingratesIdBillingratesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectBillingratesIdBillingratesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectBillingratesIdBillingratesIdEndpoint: The initialized ProjectBillingratesIdBillingratesIdEndpoint object.
+        """
+        child = ProjectBillingratesIdBillingratesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectBoardsIdEndpoint import ProjectBoardsIdEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectBoardsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "boards", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ProjectBoardsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectBoardsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectBoardsIdEndpoint: The initialized ProjectBoardsIdEndpoint object.
+        """
+        child = ProjectBoardsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
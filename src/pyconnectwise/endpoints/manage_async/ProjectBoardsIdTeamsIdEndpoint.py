@@ -0,0 +1,120 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectBoardsIdTeamsIdInfoEndpoint import ProjectBoardsIdTeamsIdInfoEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectBoardsIdTeamsIdMembersEndpoint import (
+    ProjectBoardsIdTeamsIdMembersEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import ProjectBoardTeam
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectBoardsIdTeamsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[ProjectBoardTeam, ConnectWiseManageRequestParams],
+    IAsyncPatchable[ProjectBoardTeam, ConnectWiseManageRequestParams],
+    IAsyncPuttable[ProjectBoardTeam, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectBoardTeam, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, ProjectBoardTeam)
+        IAsyncPatchable.__init__(self, ProjectBoardTeam)
+        IAsyncPuttable.__init__(self, ProjectBoardTeam)
+        IAsyncPaginateable.__init__(self, ProjectBoardTeam)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectBoardTeam]:
+        """
+        Performs a GET request against the /project/boards/{id}/teams/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectBoardTeam]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectBoardTeam, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /project/boards/{id}/teams/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectBoardTeam:
+        """
+        Performs a GET request against the /project/boards/{id}/teams/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectBoardTeam: The parsed response data.
+        """
+        return self._parse_one(ProjectBoardTeam, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectBoardTeam:
+        """
+        Performs a PATCH request against the /project/boards/{id}/teams/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectBoardTeam: The parsed response data.
+        """
+        return self._parse_one(
+            ProjectBoardTeam, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectBoardTeam:
+        """
+        Performs a PUT request against the /project/boards/{id}/teams/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectBoardTeam: The parsed response data.
+        """
+        return self._parse_one(ProjectBoardTeam, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def info(self) -> ProjectBoardsIdTeamsIdInfoEndpoint:
+        """
+        The ProjectBoardsIdTeamsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectBoardsIdTeamsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def members(self) -> ProjectBoardsIdTeamsIdMembersEndpoint:
+        """
+        The ProjectBoardsIdTeamsIdMembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectBoardsIdTeamsIdMembersEndpoint(self.client, parent_endpoint=self))
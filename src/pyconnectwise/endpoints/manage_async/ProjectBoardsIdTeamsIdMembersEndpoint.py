@@ -0,0 +1,93 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectBoardsIdTeamsIdMembersIdEndpoint import (
+    ProjectBoardsIdTeamsIdMembersIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProjectBoardTeamMember
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectBoardsIdTeamsIdMembersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProjectBoardTeamMember], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProjectBoardTeamMember, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectBoardTeamMember, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "members", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProjectBoardTeamMember])
+        IAsyncPostable.__init__(self, ProjectBoardTeamMember)
+        IAsyncPaginateable.__init__(self, ProjectBoardTeamMember)
+
+    def id(self, _id: int) -> ProjectBoardsIdTeamsIdMembersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectBoardsIdTeamsIdMembersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectBoardsIdTeamsIdMembersIdEndpoint: The initialized ProjectBoardsIdTeamsIdMembersIdEndpoint object.
+        """
+        child = ProjectBoardsIdTeamsIdMembersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectBoardTeamMember]:
+        """
+        Performs a GET request against the /project/boards/{id}/teams/{id}/members endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectBoardTeamMember]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectBoardTeamMember, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProjectBoardTeamMember]:
+        """
+        Performs a GET request against the /project/boards/{id}/teams/{id}/members endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProjectBoardTeamMember]: The parsed response data.
+        """
+        return self._parse_many(
+            ProjectBoardTeamMember, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectBoardTeamMember:
+        """
+        Performs a POST request against the /project/boards/{id}/teams/{id}/members endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectBoardTeamMember: The parsed response data.
+        """
+        return self._parse_one(
+            ProjectBoardTeamMember, (await super()._make_request("POST", data=data, params=params)).content
+        )
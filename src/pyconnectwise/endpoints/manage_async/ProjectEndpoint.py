@@ -0,0 +1,84 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectBoardsEndpoint import ProjectBoardsEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectPhasestatusesEndpoint import ProjectPhasestatusesEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjectsEndpoint import ProjectProjectsEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjecttypesEndpoint import ProjectProjecttypesEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectSecurityrolesEndpoint import ProjectSecurityrolesEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectStatusesEndpoint import ProjectStatusesEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectStatusindicatorsEndpoint import ProjectStatusindicatorsEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketnoteEndpoint import ProjectTicketnoteEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsEndpoint import ProjectTicketsEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "project", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def boards(self) -> ProjectBoardsEndpoint:
+        """
+        The ProjectBoardsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectBoardsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def phase_statuses(self) -> ProjectPhasestatusesEndpoint:
+        """
+        The ProjectPhasestatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectPhasestatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def project_types(self) -> ProjectProjecttypesEndpoint:
+        """
+        The ProjectProjecttypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjecttypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def projects(self) -> ProjectProjectsEndpoint:
+        """
+        The ProjectProjectsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def security_roles(self) -> ProjectSecurityrolesEndpoint:
+        """
+        The ProjectSecurityrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectSecurityrolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def status_indicators(self) -> ProjectStatusindicatorsEndpoint:
+        """
+        The ProjectStatusindicatorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectStatusindicatorsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> ProjectStatusesEndpoint:
+        """
+        The ProjectStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ticket_note(self) -> ProjectTicketnoteEndpoint:
+        """
+        The ProjectTicketnoteEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketnoteEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tickets(self) -> ProjectTicketsEndpoint:
+        """
+        The ProjectTicketsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsEndpoint(self.client, parent_endpoint=self))
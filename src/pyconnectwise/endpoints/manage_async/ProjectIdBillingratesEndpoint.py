@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectIdBillingratesCountEndpoint import ProjectIdBillingratesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectIdBillingratesIdEndpoint import ProjectIdBillingratesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProjectBillingRate
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectIdBillingratesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProjectBillingRate], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProjectBillingRate, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectBillingRate, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "billingRates", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProjectBillingRate])
+        IAsyncPostable.__init__(self, ProjectBillingRate)
+        IAsyncPaginateable.__init__(self, ProjectBillingRate)
+
+    def id(self, _id: int) -> ProjectIdBillingratesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectIdBillingratesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectIdBillingratesIdEndpoint: The initialized ProjectIdBillingratesIdEndpoint object.
+        """
+        child = ProjectIdBillingratesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectBillingRate]:
+        """
+        Performs a GET request against the /project/{id}/billingRates endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectBillingRate]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectBillingRate, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProjectBillingRate]:
+        """
+        Performs a GET request against the /project/{id}/billingRates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProjectBillingRate]: The parsed response data.
+        """
+        return self._parse_many(
+            ProjectBillingRate, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectBillingRate:
+        """
+        Performs a POST request against the /project/{id}/billingRates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectBillingRate: The parsed response data.
+        """
+        return self._parse_one(
+            ProjectBillingRate, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProjectIdBillingratesCountEndpoint:
+        """
+        The ProjectIdBillingratesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectIdBillingratesCountEndpoint(self.client, parent_endpoint=self))
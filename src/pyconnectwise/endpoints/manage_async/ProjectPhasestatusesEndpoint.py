@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectPhasestatusesCountEndpoint import ProjectPhasestatusesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectPhasestatusesIdEndpoint import ProjectPhasestatusesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import PhaseStatus
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectPhasestatusesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[PhaseStatus], ConnectWiseManageRequestParams],
+    IAsyncPostable[PhaseStatus, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PhaseStatus, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "phaseStatuses", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[PhaseStatus])
+        IAsyncPostable.__init__(self, PhaseStatus)
+        IAsyncPaginateable.__init__(self, PhaseStatus)
+
+    def id(self, _id: int) -> ProjectPhasestatusesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectPhasestatusesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectPhasestatusesIdEndpoint: The initialized ProjectPhasestatusesIdEndpoint object.
+        """
+        child = ProjectPhasestatusesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PhaseStatus]:
+        """
+        Performs a GET request against the /project/phaseStatuses endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PhaseStatus]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), PhaseStatus, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[PhaseStatus]:
+        """
+        Performs a GET request against the /project/phaseStatuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PhaseStatus]: The parsed response data.
+        """
+        return self._parse_many(PhaseStatus, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> PhaseStatus:
+        """
+        Performs a POST request against the /project/phaseStatuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PhaseStatus: The parsed response data.
+        """
+        return self._parse_one(PhaseStatus, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProjectPhasestatusesCountEndpoint:
+        """
+        The ProjectPhasestatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectPhasestatusesCountEndpoint(self.client, parent_endpoint=self))
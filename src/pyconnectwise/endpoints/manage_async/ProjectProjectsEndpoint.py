@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjectsCountEndpoint import ProjectProjectsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdEndpoint import ProjectProjectsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Project
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectProjectsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Project], ConnectWiseManageRequestParams],
+    IAsyncPostable[Project, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Project, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "projects", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Project])
+        IAsyncPostable.__init__(self, Project)
+        IAsyncPaginateable.__init__(self, Project)
+
+    def id(self, _id: int) -> ProjectProjectsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectProjectsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectProjectsIdEndpoint: The initialized ProjectProjectsIdEndpoint object.
+        """
+        child = ProjectProjectsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Project]:
+        """
+        Performs a GET request against the /project/projects endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Project]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Project, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Project]:
+        """
+        Performs a GET request against the /project/projects endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Project]: The parsed response data.
+        """
+        return self._parse_many(Project, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Project:
+        """
+        Performs a POST request against the /project/projects endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Project: The parsed response data.
+        """
+        return self._parse_one(Project, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProjectProjectsCountEndpoint:
+        """
+        The ProjectProjectsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsCountEndpoint(self.client, parent_endpoint=self))
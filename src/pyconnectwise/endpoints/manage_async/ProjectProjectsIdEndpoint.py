@@ -0,0 +1,128 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdContactsEndpoint import ProjectProjectsIdContactsEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdNotesEndpoint import ProjectProjectsIdNotesEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdPhasesEndpoint import ProjectProjectsIdPhasesEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdTeammembersEndpoint import (
+    ProjectProjectsIdTeammembersEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Project
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectProjectsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Project, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Project, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Project, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Project, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Project)
+        IAsyncPatchable.__init__(self, Project)
+        IAsyncPuttable.__init__(self, Project)
+        IAsyncPaginateable.__init__(self, Project)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Project]:
+        """
+        Performs a GET request against the /project/projects/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Project]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Project, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /project/projects/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Project:
+        """
+        Performs a GET request against the /project/projects/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Project: The parsed response data.
+        """
+        return self._parse_one(Project, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Project:
+        """
+        Performs a PATCH request against the /project/projects/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Project: The parsed response data.
+        """
+        return self._parse_one(Project, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Project:
+        """
+        Performs a PUT request against the /project/projects/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Project: The parsed response data.
+        """
+        return self._parse_one(Project, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def contacts(self) -> ProjectProjectsIdContactsEndpoint:
+        """
+        The ProjectProjectsIdContactsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsIdContactsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notes(self) -> ProjectProjectsIdNotesEndpoint:
+        """
+        The ProjectProjectsIdNotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsIdNotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def phases(self) -> ProjectProjectsIdPhasesEndpoint:
+        """
+        The ProjectProjectsIdPhasesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsIdPhasesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def team_members(self) -> ProjectProjectsIdTeammembersEndpoint:
+        """
+        The ProjectProjectsIdTeammembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsIdTeammembersEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdNotesCountEndpoint import ProjectProjectsIdNotesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdNotesIdEndpoint import ProjectProjectsIdNotesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProjectNote
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectProjectsIdNotesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProjectNote], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProjectNote, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectNote, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "notes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProjectNote])
+        IAsyncPostable.__init__(self, ProjectNote)
+        IAsyncPaginateable.__init__(self, ProjectNote)
+
+    def id(self, _id: int) -> ProjectProjectsIdNotesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectProjectsIdNotesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectProjectsIdNotesIdEndpoint: The initialized ProjectProjectsIdNotesIdEndpoint object.
+        """
+        child = ProjectProjectsIdNotesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectNote]:
+        """
+        Performs a GET request against the /project/projects/{id}/notes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectNote]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectNote, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProjectNote]:
+        """
+        Performs a GET request against the /project/projects/{id}/notes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProjectNote]: The parsed response data.
+        """
+        return self._parse_many(ProjectNote, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectNote:
+        """
+        Performs a POST request against the /project/projects/{id}/notes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectNote: The parsed response data.
+        """
+        return self._parse_one(ProjectNote, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProjectProjectsIdNotesCountEndpoint:
+        """
+        The ProjectProjectsIdNotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsIdNotesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdPhasesCountEndpoint import (
+    ProjectProjectsIdPhasesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdPhasesIdEndpoint import ProjectProjectsIdPhasesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProjectPhase
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectProjectsIdPhasesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProjectPhase], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProjectPhase, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectPhase, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "phases", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProjectPhase])
+        IAsyncPostable.__init__(self, ProjectPhase)
+        IAsyncPaginateable.__init__(self, ProjectPhase)
+
+    def id(self, _id: int) -> ProjectProjectsIdPhasesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectProjectsIdPhasesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectProjectsIdPhasesIdEndpoint: The initialized ProjectProjectsIdPhasesIdEndpoint object.
+        """
+        child = ProjectProjectsIdPhasesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectPhase]:
+        """
+        Performs a GET request against the /project/projects/{id}/phases endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectPhase]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectPhase, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProjectPhase]:
+        """
+        Performs a GET request against the /project/projects/{id}/phases endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProjectPhase]: The parsed response data.
+        """
+        return self._parse_many(ProjectPhase, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectPhase:
+        """
+        Performs a POST request against the /project/projects/{id}/phases endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectPhase: The parsed response data.
+        """
+        return self._parse_one(ProjectPhase, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProjectProjectsIdPhasesCountEndpoint:
+        """
+        The ProjectProjectsIdPhasesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjectsIdPhasesCountEndpoint(self.client, parent_endpoint=self))
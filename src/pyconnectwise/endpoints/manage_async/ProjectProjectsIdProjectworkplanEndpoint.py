@@ -0,0 +1,86 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdProjectworkplanCountEndpoint import (
+    ProjectProjectsIdProjectworkplanCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdProjectworkplanIdEndpoint import (
+    ProjectProjectsIdProjectworkplanIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import ProjectWorkplan
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectProjectsIdProjectworkplanEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProjectWorkplan], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectWorkplan, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "projectWorkplan", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProjectWorkplan])
+        IAsyncPaginateable.__init__(self, ProjectWorkplan)
+
+    def id(self, _id: int) -> ProjectProjectsIdProjectworkplanIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectProjectsIdProjectworkplanIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectProjectsIdProjectworkplanIdEndpoint: The initialized ProjectProjectsIdProjectworkplanIdEndpoint object.
+        """
+        child = ProjectProjectsIdProjectworkplanIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectWorkplan]:
+        """
+        Performs a GET request against the /project/projects/{id}/projectWorkplan endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectWorkplan]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectWorkplan, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProjectWorkplan]:
+        """
+        Performs a GET request against the /project/projects/{id}/projectWorkplan endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProjectWorkplan]: The parsed response data.
+        """
+        return self._parse_many(ProjectWorkplan, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProjectProjectsIdProjectworkplanCountEndpoint:
+        """
+        The ProjectProjectsIdProjectworkplanCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectProjectsIdProjectworkplanCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdTeammembersCountEndpoint import (
+    ProjectProjectsIdTeammembersCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProjectProjectsIdTeammembersIdEndpoint import (
+    ProjectProjectsIdTeammembersIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProjectTeamMember
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectProjectsIdTeammembersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProjectTeamMember], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProjectTeamMember, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectTeamMember, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "teamMembers", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProjectTeamMember])
+        IAsyncPostable.__init__(self, ProjectTeamMember)
+        IAsyncPaginateable.__init__(self, ProjectTeamMember)
+
+    def id(self, _id: int) -> ProjectProjectsIdTeammembersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectProjectsIdTeammembersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectProjectsIdTeammembersIdEndpoint: The initialized ProjectProjectsIdTeammembersIdEndpoint object.
+        """
+        child = ProjectProjectsIdTeammembersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectTeamMember]:
+        """
+        Performs a GET request against the /project/projects/{id}/teamMembers endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectTeamMember]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectTeamMember, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProjectTeamMember]:
+        """
+        Performs a GET request against the /project/projects/{id}/teamMembers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProjectTeamMember]: The parsed response data.
+        """
+        return self._parse_many(
+            ProjectTeamMember, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectTeamMember:
+        """
+        Performs a POST request against the /project/projects/{id}/teamMembers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTeamMember: The parsed response data.
+        """
+        return self._parse_one(
+            ProjectTeamMember, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProjectProjectsIdTeammembersCountEndpoint:
+        """
+        The ProjectProjectsIdTeammembersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectProjectsIdTeammembersCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjecttemplatesCountEndpoint import (
+    ProjectProjecttemplatesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProjectProjecttemplatesIdEndpoint import ProjectProjecttemplatesIdEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectProjecttemplatesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "projectTemplates", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ProjectProjecttemplatesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectProjecttemplatesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectProjecttemplatesIdEndpoint: The initialized ProjectProjecttemplatesIdEndpoint object.
+        """
+        child = ProjectProjecttemplatesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def count(self) -> ProjectProjecttemplatesCountEndpoint:
+        """
+        The ProjectProjecttemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjecttemplatesCountEndpoint(self.client, parent_endpoint=self))
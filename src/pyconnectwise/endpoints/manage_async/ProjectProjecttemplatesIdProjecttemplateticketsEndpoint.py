@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint import (
+    ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint import (
+    ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProjectTemplateTicket
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectProjecttemplatesIdProjecttemplateticketsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProjectTemplateTicket], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProjectTemplateTicket, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectTemplateTicket, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "projectTemplateTickets", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProjectTemplateTicket])
+        IAsyncPostable.__init__(self, ProjectTemplateTicket)
+        IAsyncPaginateable.__init__(self, ProjectTemplateTicket)
+
+    def id(self, _id: int) -> ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint: The initialized ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint object.
+        """
+        child = ProjectProjecttemplatesIdProjecttemplateticketsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectTemplateTicket]:
+        """
+        Performs a GET request against the /project/projectTemplates/{id}/projectTemplateTickets endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectTemplateTicket]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectTemplateTicket, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProjectTemplateTicket]:
+        """
+        Performs a GET request against the /project/projectTemplates/{id}/projectTemplateTickets endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProjectTemplateTicket]: The parsed response data.
+        """
+        return self._parse_many(
+            ProjectTemplateTicket, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectTemplateTicket:
+        """
+        Performs a POST request against the /project/projectTemplates/{id}/projectTemplateTickets endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTemplateTicket: The parsed response data.
+        """
+        return self._parse_one(
+            ProjectTemplateTicket, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint:
+        """
+        The ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectProjecttemplatesIdProjecttemplateticketsCountEndpoint(self.client, parent_endpoint=self)
+        )
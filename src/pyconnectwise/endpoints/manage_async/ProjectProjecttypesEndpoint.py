@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjecttypesCountEndpoint import ProjectProjecttypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjecttypesIdEndpoint import ProjectProjecttypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectProjecttypesInfoEndpoint import ProjectProjecttypesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProjectType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectProjecttypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProjectType], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProjectType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "projectTypes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProjectType])
+        IAsyncPostable.__init__(self, ProjectType)
+        IAsyncPaginateable.__init__(self, ProjectType)
+
+    def id(self, _id: int) -> ProjectProjecttypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectProjecttypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectProjecttypesIdEndpoint: The initialized ProjectProjecttypesIdEndpoint object.
+        """
+        child = ProjectProjecttypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectType]:
+        """
+        Performs a GET request against the /project/projectTypes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProjectType]:
+        """
+        Performs a GET request against the /project/projectTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProjectType]: The parsed response data.
+        """
+        return self._parse_many(ProjectType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ProjectType:
+        """
+        Performs a POST request against the /project/projectTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectType: The parsed response data.
+        """
+        return self._parse_one(ProjectType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProjectProjecttypesCountEndpoint:
+        """
+        The ProjectProjecttypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjecttypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProjectProjecttypesInfoEndpoint:
+        """
+        The ProjectProjecttypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectProjecttypesInfoEndpoint(self.client, parent_endpoint=self))
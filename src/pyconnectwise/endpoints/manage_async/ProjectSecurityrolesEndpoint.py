@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectSecurityrolesCountEndpoint import ProjectSecurityrolesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectSecurityrolesIdEndpoint import ProjectSecurityrolesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProjectSecurityRole
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectSecurityrolesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProjectSecurityRole], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProjectSecurityRole, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectSecurityRole, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "securityRoles", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProjectSecurityRole])
+        IAsyncPostable.__init__(self, ProjectSecurityRole)
+        IAsyncPaginateable.__init__(self, ProjectSecurityRole)
+
+    def id(self, _id: int) -> ProjectSecurityrolesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectSecurityrolesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectSecurityrolesIdEndpoint: The initialized ProjectSecurityrolesIdEndpoint object.
+        """
+        child = ProjectSecurityrolesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectSecurityRole]:
+        """
+        Performs a GET request against the /project/securityRoles endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectSecurityRole]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectSecurityRole, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProjectSecurityRole]:
+        """
+        Performs a GET request against the /project/securityRoles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProjectSecurityRole]: The parsed response data.
+        """
+        return self._parse_many(
+            ProjectSecurityRole, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectSecurityRole:
+        """
+        Performs a POST request against the /project/securityRoles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectSecurityRole: The parsed response data.
+        """
+        return self._parse_one(
+            ProjectSecurityRole, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProjectSecurityrolesCountEndpoint:
+        """
+        The ProjectSecurityrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectSecurityrolesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectStatusesCountEndpoint import ProjectStatusesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectStatusesIdEndpoint import ProjectStatusesIdEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectStatusesInfoEndpoint import ProjectStatusesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProjectStatus
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectStatusesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProjectStatus], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProjectStatus, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectStatus, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "statuses", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProjectStatus])
+        IAsyncPostable.__init__(self, ProjectStatus)
+        IAsyncPaginateable.__init__(self, ProjectStatus)
+
+    def id(self, _id: int) -> ProjectStatusesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectStatusesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectStatusesIdEndpoint: The initialized ProjectStatusesIdEndpoint object.
+        """
+        child = ProjectStatusesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectStatus]:
+        """
+        Performs a GET request against the /project/statuses endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectStatus]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectStatus, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProjectStatus]:
+        """
+        Performs a GET request against the /project/statuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProjectStatus]: The parsed response data.
+        """
+        return self._parse_many(ProjectStatus, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectStatus:
+        """
+        Performs a POST request against the /project/statuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectStatus: The parsed response data.
+        """
+        return self._parse_one(ProjectStatus, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProjectStatusesCountEndpoint:
+        """
+        The ProjectStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectStatusesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ProjectStatusesInfoEndpoint:
+        """
+        The ProjectStatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectStatusesInfoEndpoint(self.client, parent_endpoint=self))
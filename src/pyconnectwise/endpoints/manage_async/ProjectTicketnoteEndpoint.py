@@ -0,0 +1,25 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketnoteIdEndpoint import ProjectTicketnoteIdEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectTicketnoteEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "ticketNote", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ProjectTicketnoteIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectTicketnoteIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectTicketnoteIdEndpoint: The initialized ProjectTicketnoteIdEndpoint object.
+        """
+        child = ProjectTicketnoteIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
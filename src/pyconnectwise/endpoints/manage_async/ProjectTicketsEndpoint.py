@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsCountEndpoint import ProjectTicketsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdEndpoint import ProjectTicketsIdEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsSearchEndpoint import ProjectTicketsSearchEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ProjectTicket
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectTicketsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ProjectTicket], ConnectWiseManageRequestParams],
+    IAsyncPostable[ProjectTicket, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectTicket, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "tickets", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ProjectTicket])
+        IAsyncPostable.__init__(self, ProjectTicket)
+        IAsyncPaginateable.__init__(self, ProjectTicket)
+
+    def id(self, _id: int) -> ProjectTicketsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectTicketsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectTicketsIdEndpoint: The initialized ProjectTicketsIdEndpoint object.
+        """
+        child = ProjectTicketsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectTicket]:
+        """
+        Performs a GET request against the /project/tickets endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectTicket]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectTicket, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ProjectTicket]:
+        """
+        Performs a GET request against the /project/tickets endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ProjectTicket]: The parsed response data.
+        """
+        return self._parse_many(ProjectTicket, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectTicket:
+        """
+        Performs a POST request against the /project/tickets endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTicket: The parsed response data.
+        """
+        return self._parse_one(ProjectTicket, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProjectTicketsCountEndpoint:
+        """
+        The ProjectTicketsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def search(self) -> ProjectTicketsSearchEndpoint:
+        """
+        The ProjectTicketsSearchEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsSearchEndpoint(self.client, parent_endpoint=self))
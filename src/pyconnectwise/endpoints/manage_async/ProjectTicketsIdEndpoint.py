@@ -0,0 +1,184 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdActivitiesEndpoint import ProjectTicketsIdActivitiesEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdAllnotesEndpoint import ProjectTicketsIdAllnotesEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdConfigurationsEndpoint import (
+    ProjectTicketsIdConfigurationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdConvertEndpoint import ProjectTicketsIdConvertEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdDocumentsEndpoint import ProjectTicketsIdDocumentsEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdNotesEndpoint import ProjectTicketsIdNotesEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdProductsEndpoint import ProjectTicketsIdProductsEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdScheduleentriesEndpoint import (
+    ProjectTicketsIdScheduleentriesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdTasksEndpoint import ProjectTicketsIdTasksEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdTimeentriesEndpoint import ProjectTicketsIdTimeentriesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import ProjectTicket
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectTicketsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[ProjectTicket, ConnectWiseManageRequestParams],
+    IAsyncPatchable[ProjectTicket, ConnectWiseManageRequestParams],
+    IAsyncPuttable[ProjectTicket, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ProjectTicket, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, ProjectTicket)
+        IAsyncPatchable.__init__(self, ProjectTicket)
+        IAsyncPuttable.__init__(self, ProjectTicket)
+        IAsyncPaginateable.__init__(self, ProjectTicket)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ProjectTicket]:
+        """
+        Performs a GET request against the /project/tickets/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ProjectTicket]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ProjectTicket, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /project/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectTicket:
+        """
+        Performs a GET request against the /project/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTicket: The parsed response data.
+        """
+        return self._parse_one(ProjectTicket, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectTicket:
+        """
+        Performs a PATCH request against the /project/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTicket: The parsed response data.
+        """
+        return self._parse_one(ProjectTicket, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ProjectTicket:
+        """
+        Performs a PUT request against the /project/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ProjectTicket: The parsed response data.
+        """
+        return self._parse_one(ProjectTicket, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def activities(self) -> ProjectTicketsIdActivitiesEndpoint:
+        """
+        The ProjectTicketsIdActivitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdActivitiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def all_notes(self) -> ProjectTicketsIdAllnotesEndpoint:
+        """
+        The ProjectTicketsIdAllnotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdAllnotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def configurations(self) -> ProjectTicketsIdConfigurationsEndpoint:
+        """
+        The ProjectTicketsIdConfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdConfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def convert(self) -> ProjectTicketsIdConvertEndpoint:
+        """
+        The ProjectTicketsIdConvertEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdConvertEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def documents(self) -> ProjectTicketsIdDocumentsEndpoint:
+        """
+        The ProjectTicketsIdDocumentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdDocumentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notes(self) -> ProjectTicketsIdNotesEndpoint:
+        """
+        The ProjectTicketsIdNotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdNotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def products(self) -> ProjectTicketsIdProductsEndpoint:
+        """
+        The ProjectTicketsIdProductsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdProductsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scheduleentries(self) -> ProjectTicketsIdScheduleentriesEndpoint:
+        """
+        The ProjectTicketsIdScheduleentriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdScheduleentriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tasks(self) -> ProjectTicketsIdTasksEndpoint:
+        """
+        The ProjectTicketsIdTasksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdTasksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def timeentries(self) -> ProjectTicketsIdTimeentriesEndpoint:
+        """
+        The ProjectTicketsIdTimeentriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdTimeentriesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,72 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdScheduleentriesCountEndpoint import (
+    ProjectTicketsIdScheduleentriesCountEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import ScheduleEntryReference
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectTicketsIdScheduleentriesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ScheduleEntryReference], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ScheduleEntryReference, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "scheduleentries", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ScheduleEntryReference])
+        IAsyncPaginateable.__init__(self, ScheduleEntryReference)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ScheduleEntryReference]:
+        """
+        Performs a GET request against the /project/tickets/{id}/scheduleentries endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ScheduleEntryReference]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ScheduleEntryReference, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ScheduleEntryReference]:
+        """
+        Performs a GET request against the /project/tickets/{id}/scheduleentries endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ScheduleEntryReference]: The parsed response data.
+        """
+        return self._parse_many(
+            ScheduleEntryReference, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ProjectTicketsIdScheduleentriesCountEndpoint:
+        """
+        The ProjectTicketsIdScheduleentriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ProjectTicketsIdScheduleentriesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdTasksCountEndpoint import ProjectTicketsIdTasksCountEndpoint
+from pyconnectwise.endpoints.manage_async.ProjectTicketsIdTasksIdEndpoint import ProjectTicketsIdTasksIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TicketTask
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ProjectTicketsIdTasksEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TicketTask], ConnectWiseManageRequestParams],
+    IAsyncPostable[TicketTask, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TicketTask, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "tasks", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TicketTask])
+        IAsyncPostable.__init__(self, TicketTask)
+        IAsyncPaginateable.__init__(self, TicketTask)
+
+    def id(self, _id: int) -> ProjectTicketsIdTasksIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ProjectTicketsIdTasksIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ProjectTicketsIdTasksIdEndpoint: The initialized ProjectTicketsIdTasksIdEndpoint object.
+        """
+        child = ProjectTicketsIdTasksIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TicketTask]:
+        """
+        Performs a GET request against the /project/tickets/{id}/tasks endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TicketTask]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TicketTask, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TicketTask]:
+        """
+        Performs a GET request against the /project/tickets/{id}/tasks endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TicketTask]: The parsed response data.
+        """
+        return self._parse_many(TicketTask, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TicketTask:
+        """
+        Performs a POST request against the /project/tickets/{id}/tasks endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TicketTask: The parsed response data.
+        """
+        return self._parse_one(TicketTask, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ProjectTicketsIdTasksCountEndpoint:
+        """
+        The ProjectTicketsIdTasksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ProjectTicketsIdTasksCountEndpoint(self.client, parent_endpoint=self))
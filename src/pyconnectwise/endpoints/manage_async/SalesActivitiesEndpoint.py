@@ -0,0 +1,110 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesActivitiesCountEndpoint import SalesActivitiesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SalesActivitiesIdEndpoint import SalesActivitiesIdEndpoint
+from pyconnectwise.endpoints.manage_async.SalesActivitiesStatusesEndpoint import SalesActivitiesStatusesEndpoint
+from pyconnectwise.endpoints.manage_async.SalesActivitiesTypesEndpoint import SalesActivitiesTypesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Activity
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesActivitiesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Activity], ConnectWiseManageRequestParams],
+    IAsyncPostable[Activity, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Activity, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "activities", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Activity])
+        IAsyncPostable.__init__(self, Activity)
+        IAsyncPaginateable.__init__(self, Activity)
+
+    def id(self, _id: int) -> SalesActivitiesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesActivitiesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesActivitiesIdEndpoint: The initialized SalesActivitiesIdEndpoint object.
+        """
+        child = SalesActivitiesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Activity]:
+        """
+        Performs a GET request against the /sales/activities endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Activity]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Activity, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Activity]:
+        """
+        Performs a GET request against the /sales/activities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Activity]: The parsed response data.
+        """
+        return self._parse_many(Activity, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Activity:
+        """
+        Performs a POST request against the /sales/activities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Activity: The parsed response data.
+        """
+        return self._parse_one(Activity, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SalesActivitiesCountEndpoint:
+        """
+        The SalesActivitiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> SalesActivitiesStatusesEndpoint:
+        """
+        The SalesActivitiesStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> SalesActivitiesTypesEndpoint:
+        """
+        The SalesActivitiesTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesTypesEndpoint(self.client, parent_endpoint=self))
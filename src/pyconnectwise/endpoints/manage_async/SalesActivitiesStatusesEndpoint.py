@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesActivitiesStatusesCountEndpoint import (
+    SalesActivitiesStatusesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesActivitiesStatusesIdEndpoint import SalesActivitiesStatusesIdEndpoint
+from pyconnectwise.endpoints.manage_async.SalesActivitiesStatusesInfoEndpoint import SalesActivitiesStatusesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ActivityStatus
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesActivitiesStatusesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ActivityStatus], ConnectWiseManageRequestParams],
+    IAsyncPostable[ActivityStatus, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ActivityStatus, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "statuses", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ActivityStatus])
+        IAsyncPostable.__init__(self, ActivityStatus)
+        IAsyncPaginateable.__init__(self, ActivityStatus)
+
+    def id(self, _id: int) -> SalesActivitiesStatusesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesActivitiesStatusesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesActivitiesStatusesIdEndpoint: The initialized SalesActivitiesStatusesIdEndpoint object.
+        """
+        child = SalesActivitiesStatusesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ActivityStatus]:
+        """
+        Performs a GET request against the /sales/activities/statuses endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ActivityStatus]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ActivityStatus, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ActivityStatus]:
+        """
+        Performs a GET request against the /sales/activities/statuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ActivityStatus]: The parsed response data.
+        """
+        return self._parse_many(ActivityStatus, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ActivityStatus:
+        """
+        Performs a POST request against the /sales/activities/statuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ActivityStatus: The parsed response data.
+        """
+        return self._parse_one(ActivityStatus, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SalesActivitiesStatusesCountEndpoint:
+        """
+        The SalesActivitiesStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesStatusesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SalesActivitiesStatusesInfoEndpoint:
+        """
+        The SalesActivitiesStatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesStatusesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesCommissionsCountEndpoint import SalesCommissionsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SalesCommissionsIdEndpoint import SalesCommissionsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Commission
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesCommissionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Commission], ConnectWiseManageRequestParams],
+    IAsyncPostable[Commission, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Commission, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "commissions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Commission])
+        IAsyncPostable.__init__(self, Commission)
+        IAsyncPaginateable.__init__(self, Commission)
+
+    def id(self, _id: int) -> SalesCommissionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesCommissionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesCommissionsIdEndpoint: The initialized SalesCommissionsIdEndpoint object.
+        """
+        child = SalesCommissionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Commission]:
+        """
+        Performs a GET request against the /sales/commissions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Commission]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Commission, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Commission]:
+        """
+        Performs a GET request against the /sales/commissions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Commission]: The parsed response data.
+        """
+        return self._parse_many(Commission, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Commission:
+        """
+        Performs a POST request against the /sales/commissions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Commission: The parsed response data.
+        """
+        return self._parse_one(Commission, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SalesCommissionsCountEndpoint:
+        """
+        The SalesCommissionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesCommissionsCountEndpoint(self.client, parent_endpoint=self))
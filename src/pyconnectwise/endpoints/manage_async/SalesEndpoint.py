@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesActivitiesEndpoint import SalesActivitiesEndpoint
+from pyconnectwise.endpoints.manage_async.SalesCommissionsEndpoint import SalesCommissionsEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesEndpoint import SalesOpportunitiesEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOrdersEndpoint import SalesOrdersEndpoint
+from pyconnectwise.endpoints.manage_async.SalesProbabilitiesEndpoint import SalesProbabilitiesEndpoint
+from pyconnectwise.endpoints.manage_async.SalesQuotasEndpoint import SalesQuotasEndpoint
+from pyconnectwise.endpoints.manage_async.SalesRolesEndpoint import SalesRolesEndpoint
+from pyconnectwise.endpoints.manage_async.SalesSalesteamsEndpoint import SalesSalesteamsEndpoint
+from pyconnectwise.endpoints.manage_async.SalesScheduleEndpoint import SalesScheduleEndpoint
+from pyconnectwise.endpoints.manage_async.SalesServiceEndpoint import SalesServiceEndpoint
+from pyconnectwise.endpoints.manage_async.SalesStagesEndpoint import SalesStagesEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "sales", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def activities(self) -> SalesActivitiesEndpoint:
+        """
+        The SalesActivitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesActivitiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def commissions(self) -> SalesCommissionsEndpoint:
+        """
+        The SalesCommissionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesCommissionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def opportunities(self) -> SalesOpportunitiesEndpoint:
+        """
+        The SalesOpportunitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def orders(self) -> SalesOrdersEndpoint:
+        """
+        The SalesOrdersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOrdersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def probabilities(self) -> SalesProbabilitiesEndpoint:
+        """
+        The SalesProbabilitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesProbabilitiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def quotas(self) -> SalesQuotasEndpoint:
+        """
+        The SalesQuotasEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesQuotasEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def roles(self) -> SalesRolesEndpoint:
+        """
+        The SalesRolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesRolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sales_teams(self) -> SalesSalesteamsEndpoint:
+        """
+        The SalesSalesteamsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesSalesteamsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def schedule(self) -> SalesScheduleEndpoint:
+        """
+        The SalesScheduleEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesScheduleEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def service(self) -> SalesServiceEndpoint:
+        """
+        The SalesServiceEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesServiceEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def stages(self) -> SalesStagesEndpoint:
+        """
+        The SalesStagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesStagesEndpoint(self.client, parent_endpoint=self))
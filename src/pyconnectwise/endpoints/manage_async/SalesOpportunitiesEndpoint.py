@@ -0,0 +1,126 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesCountEndpoint import SalesOpportunitiesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesDefaultEndpoint import SalesOpportunitiesDefaultEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdEndpoint import SalesOpportunitiesIdEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesRatingsEndpoint import SalesOpportunitiesRatingsEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesStatusesEndpoint import SalesOpportunitiesStatusesEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesTypesEndpoint import SalesOpportunitiesTypesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Opportunity
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesOpportunitiesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Opportunity], ConnectWiseManageRequestParams],
+    IAsyncPostable[Opportunity, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Opportunity, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "opportunities", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Opportunity])
+        IAsyncPostable.__init__(self, Opportunity)
+        IAsyncPaginateable.__init__(self, Opportunity)
+
+    def id(self, _id: int) -> SalesOpportunitiesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesOpportunitiesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesOpportunitiesIdEndpoint: The initialized SalesOpportunitiesIdEndpoint object.
+        """
+        child = SalesOpportunitiesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Opportunity]:
+        """
+        Performs a GET request against the /sales/opportunities endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Opportunity]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Opportunity, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Opportunity]:
+        """
+        Performs a GET request against the /sales/opportunities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Opportunity]: The parsed response data.
+        """
+        return self._parse_many(Opportunity, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Opportunity:
+        """
+        Performs a POST request against the /sales/opportunities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Opportunity: The parsed response data.
+        """
+        return self._parse_one(Opportunity, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesCountEndpoint:
+        """
+        The SalesOpportunitiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def default(self) -> SalesOpportunitiesDefaultEndpoint:
+        """
+        The SalesOpportunitiesDefaultEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesDefaultEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ratings(self) -> SalesOpportunitiesRatingsEndpoint:
+        """
+        The SalesOpportunitiesRatingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesRatingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> SalesOpportunitiesStatusesEndpoint:
+        """
+        The SalesOpportunitiesStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> SalesOpportunitiesTypesEndpoint:
+        """
+        The SalesOpportunitiesTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesTypesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdContactsCountEndpoint import (
+    SalesOpportunitiesIdContactsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdContactsIdEndpoint import (
+    SalesOpportunitiesIdContactsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import OpportunityContact
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesOpportunitiesIdContactsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[OpportunityContact], ConnectWiseManageRequestParams],
+    IAsyncPostable[OpportunityContact, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[OpportunityContact, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "contacts", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[OpportunityContact])
+        IAsyncPostable.__init__(self, OpportunityContact)
+        IAsyncPaginateable.__init__(self, OpportunityContact)
+
+    def id(self, _id: int) -> SalesOpportunitiesIdContactsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesOpportunitiesIdContactsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesOpportunitiesIdContactsIdEndpoint: The initialized SalesOpportunitiesIdContactsIdEndpoint object.
+        """
+        child = SalesOpportunitiesIdContactsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[OpportunityContact]:
+        """
+        Performs a GET request against the /sales/opportunities/{id}/contacts endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[OpportunityContact]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), OpportunityContact, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[OpportunityContact]:
+        """
+        Performs a GET request against the /sales/opportunities/{id}/contacts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[OpportunityContact]: The parsed response data.
+        """
+        return self._parse_many(
+            OpportunityContact, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> OpportunityContact:
+        """
+        Performs a POST request against the /sales/opportunities/{id}/contacts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            OpportunityContact: The parsed response data.
+        """
+        return self._parse_one(
+            OpportunityContact, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesIdContactsCountEndpoint:
+        """
+        The SalesOpportunitiesIdContactsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdContactsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,178 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdContactsEndpoint import (
+    SalesOpportunitiesIdContactsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdConverttoagreementEndpoint import (
+    SalesOpportunitiesIdConverttoagreementEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdConverttoprojectEndpoint import (
+    SalesOpportunitiesIdConverttoprojectEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdConverttosalesorderEndpoint import (
+    SalesOpportunitiesIdConverttosalesorderEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdConverttoserviceticketEndpoint import (
+    SalesOpportunitiesIdConverttoserviceticketEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdForecastEndpoint import (
+    SalesOpportunitiesIdForecastEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdNotesEndpoint import SalesOpportunitiesIdNotesEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdTeamEndpoint import SalesOpportunitiesIdTeamEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Opportunity
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesOpportunitiesIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Opportunity, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Opportunity, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Opportunity, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Opportunity, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Opportunity)
+        IAsyncPatchable.__init__(self, Opportunity)
+        IAsyncPuttable.__init__(self, Opportunity)
+        IAsyncPaginateable.__init__(self, Opportunity)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Opportunity]:
+        """
+        Performs a GET request against the /sales/opportunities/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Opportunity]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Opportunity, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /sales/opportunities/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Opportunity:
+        """
+        Performs a GET request against the /sales/opportunities/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Opportunity: The parsed response data.
+        """
+        return self._parse_one(Opportunity, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Opportunity:
+        """
+        Performs a PATCH request against the /sales/opportunities/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Opportunity: The parsed response data.
+        """
+        return self._parse_one(Opportunity, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Opportunity:
+        """
+        Performs a PUT request against the /sales/opportunities/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Opportunity: The parsed response data.
+        """
+        return self._parse_one(Opportunity, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def contacts(self) -> SalesOpportunitiesIdContactsEndpoint:
+        """
+        The SalesOpportunitiesIdContactsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesIdContactsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def convert_to_agreement(self) -> SalesOpportunitiesIdConverttoagreementEndpoint:
+        """
+        The SalesOpportunitiesIdConverttoagreementEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdConverttoagreementEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def convert_to_project(self) -> SalesOpportunitiesIdConverttoprojectEndpoint:
+        """
+        The SalesOpportunitiesIdConverttoprojectEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdConverttoprojectEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def convert_to_sales_order(self) -> SalesOpportunitiesIdConverttosalesorderEndpoint:
+        """
+        The SalesOpportunitiesIdConverttosalesorderEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdConverttosalesorderEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def convert_to_service_ticket(self) -> SalesOpportunitiesIdConverttoserviceticketEndpoint:
+        """
+        The SalesOpportunitiesIdConverttoserviceticketEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdConverttoserviceticketEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def forecast(self) -> SalesOpportunitiesIdForecastEndpoint:
+        """
+        The SalesOpportunitiesIdForecastEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesIdForecastEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notes(self) -> SalesOpportunitiesIdNotesEndpoint:
+        """
+        The SalesOpportunitiesIdNotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesIdNotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def team(self) -> SalesOpportunitiesIdTeamEndpoint:
+        """
+        The SalesOpportunitiesIdTeamEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesIdTeamEndpoint(self.client, parent_endpoint=self))
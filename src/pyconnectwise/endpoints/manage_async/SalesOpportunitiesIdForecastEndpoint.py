@@ -0,0 +1,112 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdForecastCopyEndpoint import (
+    SalesOpportunitiesIdForecastCopyEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdForecastCountEndpoint import (
+    SalesOpportunitiesIdForecastCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesIdForecastIdEndpoint import (
+    SalesOpportunitiesIdForecastIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Forecast
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesOpportunitiesIdForecastEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Forecast], ConnectWiseManageRequestParams],
+    IAsyncPostable[Forecast, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Forecast, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "forecast", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Forecast])
+        IAsyncPostable.__init__(self, Forecast)
+        IAsyncPaginateable.__init__(self, Forecast)
+
+    def id(self, _id: int) -> SalesOpportunitiesIdForecastIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesOpportunitiesIdForecastIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesOpportunitiesIdForecastIdEndpoint: The initialized SalesOpportunitiesIdForecastIdEndpoint object.
+        """
+        child = SalesOpportunitiesIdForecastIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Forecast]:
+        """
+        Performs a GET request against the /sales/opportunities/{id}/forecast endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Forecast]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Forecast, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Forecast]:
+        """
+        Performs a GET request against the /sales/opportunities/{id}/forecast endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Forecast]: The parsed response data.
+        """
+        return self._parse_many(Forecast, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Forecast:
+        """
+        Performs a POST request against the /sales/opportunities/{id}/forecast endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Forecast: The parsed response data.
+        """
+        return self._parse_one(Forecast, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def copy(self) -> SalesOpportunitiesIdForecastCopyEndpoint:
+        """
+        The SalesOpportunitiesIdForecastCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdForecastCopyEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesIdForecastCountEndpoint:
+        """
+        The SalesOpportunitiesIdForecastCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOpportunitiesIdForecastCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,112 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesRatingsCountEndpoint import (
+    SalesOpportunitiesRatingsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesRatingsIdEndpoint import SalesOpportunitiesRatingsIdEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesRatingsInfoEndpoint import (
+    SalesOpportunitiesRatingsInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import OpportunityRating
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesOpportunitiesRatingsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[OpportunityRating], ConnectWiseManageRequestParams],
+    IAsyncPostable[OpportunityRating, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[OpportunityRating, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "ratings", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[OpportunityRating])
+        IAsyncPostable.__init__(self, OpportunityRating)
+        IAsyncPaginateable.__init__(self, OpportunityRating)
+
+    def id(self, _id: int) -> SalesOpportunitiesRatingsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesOpportunitiesRatingsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesOpportunitiesRatingsIdEndpoint: The initialized SalesOpportunitiesRatingsIdEndpoint object.
+        """
+        child = SalesOpportunitiesRatingsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[OpportunityRating]:
+        """
+        Performs a GET request against the /sales/opportunities/ratings endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[OpportunityRating]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), OpportunityRating, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[OpportunityRating]:
+        """
+        Performs a GET request against the /sales/opportunities/ratings endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[OpportunityRating]: The parsed response data.
+        """
+        return self._parse_many(
+            OpportunityRating, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> OpportunityRating:
+        """
+        Performs a POST request against the /sales/opportunities/ratings endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            OpportunityRating: The parsed response data.
+        """
+        return self._parse_one(
+            OpportunityRating, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesRatingsCountEndpoint:
+        """
+        The SalesOpportunitiesRatingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesRatingsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SalesOpportunitiesRatingsInfoEndpoint:
+        """
+        The SalesOpportunitiesRatingsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesRatingsInfoEndpoint(self.client, parent_endpoint=self))
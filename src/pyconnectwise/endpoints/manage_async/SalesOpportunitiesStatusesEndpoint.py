@@ -0,0 +1,114 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesStatusesCountEndpoint import (
+    SalesOpportunitiesStatusesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesStatusesIdEndpoint import (
+    SalesOpportunitiesStatusesIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOpportunitiesStatusesInfoEndpoint import (
+    SalesOpportunitiesStatusesInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import OpportunityStatus
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesOpportunitiesStatusesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[OpportunityStatus], ConnectWiseManageRequestParams],
+    IAsyncPostable[OpportunityStatus, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[OpportunityStatus, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "statuses", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[OpportunityStatus])
+        IAsyncPostable.__init__(self, OpportunityStatus)
+        IAsyncPaginateable.__init__(self, OpportunityStatus)
+
+    def id(self, _id: int) -> SalesOpportunitiesStatusesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesOpportunitiesStatusesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesOpportunitiesStatusesIdEndpoint: The initialized SalesOpportunitiesStatusesIdEndpoint object.
+        """
+        child = SalesOpportunitiesStatusesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[OpportunityStatus]:
+        """
+        Performs a GET request against the /sales/opportunities/statuses endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[OpportunityStatus]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), OpportunityStatus, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[OpportunityStatus]:
+        """
+        Performs a GET request against the /sales/opportunities/statuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[OpportunityStatus]: The parsed response data.
+        """
+        return self._parse_many(
+            OpportunityStatus, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> OpportunityStatus:
+        """
+        Performs a POST request against the /sales/opportunities/statuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            OpportunityStatus: The parsed response data.
+        """
+        return self._parse_one(
+            OpportunityStatus, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SalesOpportunitiesStatusesCountEndpoint:
+        """
+        The SalesOpportunitiesStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesStatusesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SalesOpportunitiesStatusesInfoEndpoint:
+        """
+        The SalesOpportunitiesStatusesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOpportunitiesStatusesInfoEndpoint(self.client, parent_endpoint=self))
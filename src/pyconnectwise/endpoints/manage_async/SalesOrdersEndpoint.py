@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOrdersCountEndpoint import SalesOrdersCountEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOrdersIdEndpoint import SalesOrdersIdEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOrdersStatusesEndpoint import SalesOrdersStatusesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Order
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesOrdersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Order], ConnectWiseManageRequestParams],
+    IAsyncPostable[Order, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Order, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "orders", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Order])
+        IAsyncPostable.__init__(self, Order)
+        IAsyncPaginateable.__init__(self, Order)
+
+    def id(self, _id: int) -> SalesOrdersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesOrdersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesOrdersIdEndpoint: The initialized SalesOrdersIdEndpoint object.
+        """
+        child = SalesOrdersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Order]:
+        """
+        Performs a GET request against the /sales/orders endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Order]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Order, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Order]:
+        """
+        Performs a GET request against the /sales/orders endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Order]: The parsed response data.
+        """
+        return self._parse_many(Order, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Order:
+        """
+        Performs a POST request against the /sales/orders endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Order: The parsed response data.
+        """
+        return self._parse_one(Order, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SalesOrdersCountEndpoint:
+        """
+        The SalesOrdersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOrdersCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> SalesOrdersStatusesEndpoint:
+        """
+        The SalesOrdersStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesOrdersStatusesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesOrdersStatusesIdNotificationsCountEndpoint import (
+    SalesOrdersStatusesIdNotificationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesOrdersStatusesIdNotificationsIdEndpoint import (
+    SalesOrdersStatusesIdNotificationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import OrderStatusNotification
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesOrdersStatusesIdNotificationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[OrderStatusNotification], ConnectWiseManageRequestParams],
+    IAsyncPostable[OrderStatusNotification, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[OrderStatusNotification, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "notifications", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[OrderStatusNotification])
+        IAsyncPostable.__init__(self, OrderStatusNotification)
+        IAsyncPaginateable.__init__(self, OrderStatusNotification)
+
+    def id(self, _id: int) -> SalesOrdersStatusesIdNotificationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesOrdersStatusesIdNotificationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesOrdersStatusesIdNotificationsIdEndpoint: The initialized SalesOrdersStatusesIdNotificationsIdEndpoint object.
+        """
+        child = SalesOrdersStatusesIdNotificationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[OrderStatusNotification]:
+        """
+        Performs a GET request against the /sales/orders/statuses/{id}/notifications endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[OrderStatusNotification]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), OrderStatusNotification, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[OrderStatusNotification]:
+        """
+        Performs a GET request against the /sales/orders/statuses/{id}/notifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[OrderStatusNotification]: The parsed response data.
+        """
+        return self._parse_many(
+            OrderStatusNotification, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> OrderStatusNotification:
+        """
+        Performs a POST request against the /sales/orders/statuses/{id}/notifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            OrderStatusNotification: The parsed response data.
+        """
+        return self._parse_one(
+            OrderStatusNotification, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SalesOrdersStatusesIdNotificationsCountEndpoint:
+        """
+        The SalesOrdersStatusesIdNotificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SalesOrdersStatusesIdNotificationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,108 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesProbabilitiesCountEndpoint import SalesProbabilitiesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SalesProbabilitiesIdEndpoint import SalesProbabilitiesIdEndpoint
+from pyconnectwise.endpoints.manage_async.SalesProbabilitiesInfoEndpoint import SalesProbabilitiesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import SalesProbability
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesProbabilitiesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SalesProbability], ConnectWiseManageRequestParams],
+    IAsyncPostable[SalesProbability, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SalesProbability, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "probabilities", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SalesProbability])
+        IAsyncPostable.__init__(self, SalesProbability)
+        IAsyncPaginateable.__init__(self, SalesProbability)
+
+    def id(self, _id: int) -> SalesProbabilitiesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesProbabilitiesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesProbabilitiesIdEndpoint: The initialized SalesProbabilitiesIdEndpoint object.
+        """
+        child = SalesProbabilitiesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SalesProbability]:
+        """
+        Performs a GET request against the /sales/probabilities endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SalesProbability]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SalesProbability, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SalesProbability]:
+        """
+        Performs a GET request against the /sales/probabilities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SalesProbability]: The parsed response data.
+        """
+        return self._parse_many(
+            SalesProbability, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> SalesProbability:
+        """
+        Performs a POST request against the /sales/probabilities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SalesProbability: The parsed response data.
+        """
+        return self._parse_one(
+            SalesProbability, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SalesProbabilitiesCountEndpoint:
+        """
+        The SalesProbabilitiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesProbabilitiesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SalesProbabilitiesInfoEndpoint:
+        """
+        The SalesProbabilitiesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesProbabilitiesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesQuotasCountEndpoint import SalesQuotasCountEndpoint
+from pyconnectwise.endpoints.manage_async.SalesQuotasIdEndpoint import SalesQuotasIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import SalesQuota
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesQuotasEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SalesQuota], ConnectWiseManageRequestParams],
+    IAsyncPostable[SalesQuota, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SalesQuota, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "quotas", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SalesQuota])
+        IAsyncPostable.__init__(self, SalesQuota)
+        IAsyncPaginateable.__init__(self, SalesQuota)
+
+    def id(self, _id: int) -> SalesQuotasIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesQuotasIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesQuotasIdEndpoint: The initialized SalesQuotasIdEndpoint object.
+        """
+        child = SalesQuotasIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SalesQuota]:
+        """
+        Performs a GET request against the /sales/quotas endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SalesQuota]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SalesQuota, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SalesQuota]:
+        """
+        Performs a GET request against the /sales/quotas endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SalesQuota]: The parsed response data.
+        """
+        return self._parse_many(SalesQuota, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SalesQuota:
+        """
+        Performs a POST request against the /sales/quotas endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SalesQuota: The parsed response data.
+        """
+        return self._parse_one(SalesQuota, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SalesQuotasCountEndpoint:
+        """
+        The SalesQuotasCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesQuotasCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,92 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesRolesCountEndpoint import SalesRolesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SalesRolesIdEndpoint import SalesRolesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Role
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesRolesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Role], ConnectWiseManageRequestParams],
+    IAsyncPostable[Role, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Role, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "roles", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Role])
+        IAsyncPostable.__init__(self, Role)
+        IAsyncPaginateable.__init__(self, Role)
+
+    def id(self, _id: int) -> SalesRolesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesRolesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesRolesIdEndpoint: The initialized SalesRolesIdEndpoint object.
+        """
+        child = SalesRolesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Role]:
+        """
+        Performs a GET request against the /sales/roles endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Role]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Role, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Role]:
+        """
+        Performs a GET request against the /sales/roles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Role]: The parsed response data.
+        """
+        return self._parse_many(Role, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Role:
+        """
+        Performs a POST request against the /sales/roles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Role: The parsed response data.
+        """
+        return self._parse_one(Role, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SalesRolesCountEndpoint:
+        """
+        The SalesRolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesRolesCountEndpoint(self.client, parent_endpoint=self))
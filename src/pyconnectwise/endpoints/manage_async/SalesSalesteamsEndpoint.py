@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesSalesteamsCountEndpoint import SalesSalesteamsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SalesSalesteamsIdEndpoint import SalesSalesteamsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import SalesTeam
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesSalesteamsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SalesTeam], ConnectWiseManageRequestParams],
+    IAsyncPostable[SalesTeam, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SalesTeam, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "salesTeams", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SalesTeam])
+        IAsyncPostable.__init__(self, SalesTeam)
+        IAsyncPaginateable.__init__(self, SalesTeam)
+
+    def id(self, _id: int) -> SalesSalesteamsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesSalesteamsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesSalesteamsIdEndpoint: The initialized SalesSalesteamsIdEndpoint object.
+        """
+        child = SalesSalesteamsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SalesTeam]:
+        """
+        Performs a GET request against the /sales/salesTeams endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SalesTeam]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SalesTeam, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SalesTeam]:
+        """
+        Performs a GET request against the /sales/salesTeams endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SalesTeam]: The parsed response data.
+        """
+        return self._parse_many(SalesTeam, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SalesTeam:
+        """
+        Performs a POST request against the /sales/salesTeams endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SalesTeam: The parsed response data.
+        """
+        return self._parse_one(SalesTeam, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SalesSalesteamsCountEndpoint:
+        """
+        The SalesSalesteamsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesSalesteamsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesSalesteamsIdMembersCountEndpoint import (
+    SalesSalesteamsIdMembersCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SalesSalesteamsIdMembersIdEndpoint import SalesSalesteamsIdMembersIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import SalesTeamMember
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesSalesteamsIdMembersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SalesTeamMember], ConnectWiseManageRequestParams],
+    IAsyncPostable[SalesTeamMember, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SalesTeamMember, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "members", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SalesTeamMember])
+        IAsyncPostable.__init__(self, SalesTeamMember)
+        IAsyncPaginateable.__init__(self, SalesTeamMember)
+
+    def id(self, _id: int) -> SalesSalesteamsIdMembersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesSalesteamsIdMembersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesSalesteamsIdMembersIdEndpoint: The initialized SalesSalesteamsIdMembersIdEndpoint object.
+        """
+        child = SalesSalesteamsIdMembersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SalesTeamMember]:
+        """
+        Performs a GET request against the /sales/salesTeams/{id}/members endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SalesTeamMember]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SalesTeamMember, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SalesTeamMember]:
+        """
+        Performs a GET request against the /sales/salesTeams/{id}/members endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SalesTeamMember]: The parsed response data.
+        """
+        return self._parse_many(SalesTeamMember, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> SalesTeamMember:
+        """
+        Performs a POST request against the /sales/salesTeams/{id}/members endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SalesTeamMember: The parsed response data.
+        """
+        return self._parse_one(SalesTeamMember, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SalesSalesteamsIdMembersCountEndpoint:
+        """
+        The SalesSalesteamsIdMembersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesSalesteamsIdMembersCountEndpoint(self.client, parent_endpoint=self))
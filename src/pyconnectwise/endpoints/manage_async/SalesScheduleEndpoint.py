@@ -0,0 +1,20 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesScheduleHolidaylistsEndpoint import SalesScheduleHolidaylistsEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesScheduleEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "schedule", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def holidaylists(self) -> SalesScheduleHolidaylistsEndpoint:
+        """
+        The SalesScheduleHolidaylistsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesScheduleHolidaylistsEndpoint(self.client, parent_endpoint=self))
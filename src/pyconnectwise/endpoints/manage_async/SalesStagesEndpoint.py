@@ -0,0 +1,108 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SalesStagesCountEndpoint import SalesStagesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SalesStagesIdEndpoint import SalesStagesIdEndpoint
+from pyconnectwise.endpoints.manage_async.SalesStagesInfoEndpoint import SalesStagesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import OpportunityStage
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SalesStagesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[OpportunityStage], ConnectWiseManageRequestParams],
+    IAsyncPostable[OpportunityStage, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[OpportunityStage, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "stages", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[OpportunityStage])
+        IAsyncPostable.__init__(self, OpportunityStage)
+        IAsyncPaginateable.__init__(self, OpportunityStage)
+
+    def id(self, _id: int) -> SalesStagesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SalesStagesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SalesStagesIdEndpoint: The initialized SalesStagesIdEndpoint object.
+        """
+        child = SalesStagesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[OpportunityStage]:
+        """
+        Performs a GET request against the /sales/stages endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[OpportunityStage]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), OpportunityStage, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[OpportunityStage]:
+        """
+        Performs a GET request against the /sales/stages endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[OpportunityStage]: The parsed response data.
+        """
+        return self._parse_many(
+            OpportunityStage, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> OpportunityStage:
+        """
+        Performs a POST request against the /sales/stages endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            OpportunityStage: The parsed response data.
+        """
+        return self._parse_one(
+            OpportunityStage, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SalesStagesCountEndpoint:
+        """
+        The SalesStagesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesStagesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SalesStagesInfoEndpoint:
+        """
+        The SalesStagesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SalesStagesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleCalendarsCountEndpoint import ScheduleCalendarsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleCalendarsIdEndpoint import ScheduleCalendarsIdEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleCalendarsInfoEndpoint import ScheduleCalendarsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Calendar
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScheduleCalendarsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Calendar], ConnectWiseManageRequestParams],
+    IAsyncPostable[Calendar, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Calendar, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "calendars", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Calendar])
+        IAsyncPostable.__init__(self, Calendar)
+        IAsyncPaginateable.__init__(self, Calendar)
+
+    def id(self, _id: int) -> ScheduleCalendarsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ScheduleCalendarsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ScheduleCalendarsIdEndpoint: The initialized ScheduleCalendarsIdEndpoint object.
+        """
+        child = ScheduleCalendarsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Calendar]:
+        """
+        Performs a GET request against the /schedule/calendars endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Calendar]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Calendar, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Calendar]:
+        """
+        Performs a GET request against the /schedule/calendars endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Calendar]: The parsed response data.
+        """
+        return self._parse_many(Calendar, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Calendar:
+        """
+        Performs a POST request against the /schedule/calendars endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Calendar: The parsed response data.
+        """
+        return self._parse_one(Calendar, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ScheduleCalendarsCountEndpoint:
+        """
+        The ScheduleCalendarsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleCalendarsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ScheduleCalendarsInfoEndpoint:
+        """
+        The ScheduleCalendarsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleCalendarsInfoEndpoint(self.client, parent_endpoint=self))
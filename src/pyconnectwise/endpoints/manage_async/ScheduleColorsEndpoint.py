@@ -0,0 +1,88 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleColorsCountEndpoint import ScheduleColorsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleColorsIdEndpoint import ScheduleColorsIdEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleColorsResetEndpoint import ScheduleColorsResetEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import ScheduleColor
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScheduleColorsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ScheduleColor], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ScheduleColor, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "colors", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ScheduleColor])
+        IAsyncPaginateable.__init__(self, ScheduleColor)
+
+    def id(self, _id: int) -> ScheduleColorsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ScheduleColorsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ScheduleColorsIdEndpoint: The initialized ScheduleColorsIdEndpoint object.
+        """
+        child = ScheduleColorsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ScheduleColor]:
+        """
+        Performs a GET request against the /schedule/colors endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ScheduleColor]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ScheduleColor, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ScheduleColor]:
+        """
+        Performs a GET request against the /schedule/colors endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ScheduleColor]: The parsed response data.
+        """
+        return self._parse_many(ScheduleColor, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ScheduleColorsCountEndpoint:
+        """
+        The ScheduleColorsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleColorsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reset(self) -> ScheduleColorsResetEndpoint:
+        """
+        The ScheduleColorsResetEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleColorsResetEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,82 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleDetailsCountEndpoint import ScheduleDetailsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleDetailsIdEndpoint import ScheduleDetailsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import ScheduleEntryDetail
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScheduleDetailsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ScheduleEntryDetail], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ScheduleEntryDetail, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "details", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ScheduleEntryDetail])
+        IAsyncPaginateable.__init__(self, ScheduleEntryDetail)
+
+    def id(self, _id: int) -> ScheduleDetailsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ScheduleDetailsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ScheduleDetailsIdEndpoint: The initialized ScheduleDetailsIdEndpoint object.
+        """
+        child = ScheduleDetailsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ScheduleEntryDetail]:
+        """
+        Performs a GET request against the /schedule/details endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ScheduleEntryDetail]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ScheduleEntryDetail, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ScheduleEntryDetail]:
+        """
+        Performs a GET request against the /schedule/details endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ScheduleEntryDetail]: The parsed response data.
+        """
+        return self._parse_many(
+            ScheduleEntryDetail, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ScheduleDetailsCountEndpoint:
+        """
+        The ScheduleDetailsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleDetailsCountEndpoint(self.client, parent_endpoint=self))
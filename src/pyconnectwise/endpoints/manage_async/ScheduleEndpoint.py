@@ -0,0 +1,91 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleCalendarsEndpoint import ScheduleCalendarsEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleColorsEndpoint import ScheduleColorsEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleDetailsEndpoint import ScheduleDetailsEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleEntriesEndpoint import ScheduleEntriesEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleHolidaylistsEndpoint import ScheduleHolidaylistsEndpoint
+from pyconnectwise.endpoints.manage_async.SchedulePortalcalendarsEndpoint import SchedulePortalcalendarsEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleRemindertimesEndpoint import ScheduleRemindertimesEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleStatusesEndpoint import ScheduleStatusesEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleTypesEndpoint import ScheduleTypesEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScheduleEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "schedule", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def calendars(self) -> ScheduleCalendarsEndpoint:
+        """
+        The ScheduleCalendarsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleCalendarsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def colors(self) -> ScheduleColorsEndpoint:
+        """
+        The ScheduleColorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleColorsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def details(self) -> ScheduleDetailsEndpoint:
+        """
+        The ScheduleDetailsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleDetailsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def entries(self) -> ScheduleEntriesEndpoint:
+        """
+        The ScheduleEntriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleEntriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def holiday_lists(self) -> ScheduleHolidaylistsEndpoint:
+        """
+        The ScheduleHolidaylistsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleHolidaylistsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def holidaylists(self) -> ScheduleHolidaylistsEndpoint:
+        """
+        The ScheduleHolidaylistsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleHolidaylistsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def portalcalendars(self) -> SchedulePortalcalendarsEndpoint:
+        """
+        The SchedulePortalcalendarsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SchedulePortalcalendarsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reminder_times(self) -> ScheduleRemindertimesEndpoint:
+        """
+        The ScheduleRemindertimesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleRemindertimesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> ScheduleStatusesEndpoint:
+        """
+        The ScheduleStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> ScheduleTypesEndpoint:
+        """
+        The ScheduleTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleTypesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleEntriesCountEndpoint import ScheduleEntriesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleEntriesIdEndpoint import ScheduleEntriesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ScheduleEntry
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScheduleEntriesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ScheduleEntry], ConnectWiseManageRequestParams],
+    IAsyncPostable[ScheduleEntry, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ScheduleEntry, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "entries", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ScheduleEntry])
+        IAsyncPostable.__init__(self, ScheduleEntry)
+        IAsyncPaginateable.__init__(self, ScheduleEntry)
+
+    def id(self, _id: int) -> ScheduleEntriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ScheduleEntriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ScheduleEntriesIdEndpoint: The initialized ScheduleEntriesIdEndpoint object.
+        """
+        child = ScheduleEntriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ScheduleEntry]:
+        """
+        Performs a GET request against the /schedule/entries endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ScheduleEntry]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ScheduleEntry, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ScheduleEntry]:
+        """
+        Performs a GET request against the /schedule/entries endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ScheduleEntry]: The parsed response data.
+        """
+        return self._parse_many(ScheduleEntry, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ScheduleEntry:
+        """
+        Performs a POST request against the /schedule/entries endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ScheduleEntry: The parsed response data.
+        """
+        return self._parse_one(ScheduleEntry, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ScheduleEntriesCountEndpoint:
+        """
+        The ScheduleEntriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleEntriesCountEndpoint(self.client, parent_endpoint=self))
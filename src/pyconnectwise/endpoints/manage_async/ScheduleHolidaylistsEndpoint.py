@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleHolidaylistsIdEndpoint import ScheduleHolidaylistsIdEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleHolidaylistsInfoEndpoint import ScheduleHolidaylistsInfoEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScheduleHolidaylistsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "holidaylists", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ScheduleHolidaylistsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ScheduleHolidaylistsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ScheduleHolidaylistsIdEndpoint: The initialized ScheduleHolidaylistsIdEndpoint object.
+        """
+        child = ScheduleHolidaylistsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def info(self) -> ScheduleHolidaylistsInfoEndpoint:
+        """
+        The ScheduleHolidaylistsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleHolidaylistsInfoEndpoint(self.client, parent_endpoint=self))
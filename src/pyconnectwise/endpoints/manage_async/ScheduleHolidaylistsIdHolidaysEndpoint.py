@@ -0,0 +1,40 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleHolidaylistsIdHolidaysIdEndpoint import (
+    ScheduleHolidaylistsIdHolidaysIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ScheduleHolidaylistsIdHolidaysInfoEndpoint import (
+    ScheduleHolidaylistsIdHolidaysInfoEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScheduleHolidaylistsIdHolidaysEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "holidays", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ScheduleHolidaylistsIdHolidaysIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ScheduleHolidaylistsIdHolidaysIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ScheduleHolidaylistsIdHolidaysIdEndpoint: The initialized ScheduleHolidaylistsIdHolidaysIdEndpoint object.
+        """
+        child = ScheduleHolidaylistsIdHolidaysIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def info(self) -> ScheduleHolidaylistsIdHolidaysInfoEndpoint:
+        """
+        The ScheduleHolidaylistsIdHolidaysInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ScheduleHolidaylistsIdHolidaysInfoEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,95 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import ScheduleReminderTime
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScheduleRemindertimesIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[ScheduleReminderTime, ConnectWiseManageRequestParams],
+    IAsyncPatchable[ScheduleReminderTime, ConnectWiseManageRequestParams],
+    IAsyncPuttable[ScheduleReminderTime, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ScheduleReminderTime, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, ScheduleReminderTime)
+        IAsyncPatchable.__init__(self, ScheduleReminderTime)
+        IAsyncPuttable.__init__(self, ScheduleReminderTime)
+        IAsyncPaginateable.__init__(self, ScheduleReminderTime)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ScheduleReminderTime]:
+        """
+        Performs a GET request against the /schedule/reminderTimes/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ScheduleReminderTime]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ScheduleReminderTime, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ScheduleReminderTime:
+        """
+        Performs a GET request against the /schedule/reminderTimes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ScheduleReminderTime: The parsed response data.
+        """
+        return self._parse_one(
+            ScheduleReminderTime, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> ScheduleReminderTime:
+        """
+        Performs a PATCH request against the /schedule/reminderTimes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ScheduleReminderTime: The parsed response data.
+        """
+        return self._parse_one(
+            ScheduleReminderTime, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ScheduleReminderTime:
+        """
+        Performs a PUT request against the /schedule/reminderTimes/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ScheduleReminderTime: The parsed response data.
+        """
+        return self._parse_one(
+            ScheduleReminderTime, (await super()._make_request("PUT", data=data, params=params)).content
+        )
@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleStatusesCountEndpoint import ScheduleStatusesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleStatusesIdEndpoint import ScheduleStatusesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ScheduleStatus
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScheduleStatusesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ScheduleStatus], ConnectWiseManageRequestParams],
+    IAsyncPostable[ScheduleStatus, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ScheduleStatus, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "statuses", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ScheduleStatus])
+        IAsyncPostable.__init__(self, ScheduleStatus)
+        IAsyncPaginateable.__init__(self, ScheduleStatus)
+
+    def id(self, _id: int) -> ScheduleStatusesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ScheduleStatusesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ScheduleStatusesIdEndpoint: The initialized ScheduleStatusesIdEndpoint object.
+        """
+        child = ScheduleStatusesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ScheduleStatus]:
+        """
+        Performs a GET request against the /schedule/statuses endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ScheduleStatus]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ScheduleStatus, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ScheduleStatus]:
+        """
+        Performs a GET request against the /schedule/statuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ScheduleStatus]: The parsed response data.
+        """
+        return self._parse_many(ScheduleStatus, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ScheduleStatus:
+        """
+        Performs a POST request against the /schedule/statuses endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ScheduleStatus: The parsed response data.
+        """
+        return self._parse_one(ScheduleStatus, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ScheduleStatusesCountEndpoint:
+        """
+        The ScheduleStatusesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleStatusesCountEndpoint(self.client, parent_endpoint=self))
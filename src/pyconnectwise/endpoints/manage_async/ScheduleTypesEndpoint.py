@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleTypesCountEndpoint import ScheduleTypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleTypesIdEndpoint import ScheduleTypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.ScheduleTypesInfoEndpoint import ScheduleTypesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ScheduleType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ScheduleTypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ScheduleType], ConnectWiseManageRequestParams],
+    IAsyncPostable[ScheduleType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ScheduleType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "types", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ScheduleType])
+        IAsyncPostable.__init__(self, ScheduleType)
+        IAsyncPaginateable.__init__(self, ScheduleType)
+
+    def id(self, _id: int) -> ScheduleTypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ScheduleTypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ScheduleTypesIdEndpoint: The initialized ScheduleTypesIdEndpoint object.
+        """
+        child = ScheduleTypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ScheduleType]:
+        """
+        Performs a GET request against the /schedule/types endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ScheduleType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ScheduleType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ScheduleType]:
+        """
+        Performs a GET request against the /schedule/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ScheduleType]: The parsed response data.
+        """
+        return self._parse_many(ScheduleType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ScheduleType:
+        """
+        Performs a POST request against the /schedule/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ScheduleType: The parsed response data.
+        """
+        return self._parse_one(ScheduleType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ScheduleTypesCountEndpoint:
+        """
+        The ScheduleTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ScheduleTypesInfoEndpoint:
+        """
+        The ScheduleTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ScheduleTypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsCopyEndpoint import ServiceBoardsCopyEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsCountEndpoint import ServiceBoardsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdEndpoint import ServiceBoardsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Board
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceBoardsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Board], ConnectWiseManageRequestParams],
+    IAsyncPostable[Board, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Board, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "boards", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Board])
+        IAsyncPostable.__init__(self, Board)
+        IAsyncPaginateable.__init__(self, Board)
+
+    def id(self, _id: int) -> ServiceBoardsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceBoardsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceBoardsIdEndpoint: The initialized ServiceBoardsIdEndpoint object.
+        """
+        child = ServiceBoardsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Board]:
+        """
+        Performs a GET request against the /service/boards endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Board]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Board, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Board]:
+        """
+        Performs a GET request against the /service/boards endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Board]: The parsed response data.
+        """
+        return self._parse_many(Board, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Board:
+        """
+        Performs a POST request against the /service/boards endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Board: The parsed response data.
+        """
+        return self._parse_one(Board, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def copy(self) -> ServiceBoardsCopyEndpoint:
+        """
+        The ServiceBoardsCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def count(self) -> ServiceBoardsCountEndpoint:
+        """
+        The ServiceBoardsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsCountEndpoint(self.client, parent_endpoint=self))
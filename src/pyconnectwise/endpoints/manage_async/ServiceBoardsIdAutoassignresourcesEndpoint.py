@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdAutoassignresourcesCountEndpoint import (
+    ServiceBoardsIdAutoassignresourcesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdAutoassignresourcesIdEndpoint import (
+    ServiceBoardsIdAutoassignresourcesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import BoardAutoAssignResource
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceBoardsIdAutoassignresourcesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[BoardAutoAssignResource], ConnectWiseManageRequestParams],
+    IAsyncPostable[BoardAutoAssignResource, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[BoardAutoAssignResource, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "autoAssignResources", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[BoardAutoAssignResource])
+        IAsyncPostable.__init__(self, BoardAutoAssignResource)
+        IAsyncPaginateable.__init__(self, BoardAutoAssignResource)
+
+    def id(self, _id: int) -> ServiceBoardsIdAutoassignresourcesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceBoardsIdAutoassignresourcesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceBoardsIdAutoassignresourcesIdEndpoint: The initialized ServiceBoardsIdAutoassignresourcesIdEndpoint object.
+        """
+        child = ServiceBoardsIdAutoassignresourcesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[BoardAutoAssignResource]:
+        """
+        Performs a GET request against the /service/boards/{id}/autoAssignResources endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[BoardAutoAssignResource]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), BoardAutoAssignResource, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[BoardAutoAssignResource]:
+        """
+        Performs a GET request against the /service/boards/{id}/autoAssignResources endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[BoardAutoAssignResource]: The parsed response data.
+        """
+        return self._parse_many(
+            BoardAutoAssignResource, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> BoardAutoAssignResource:
+        """
+        Performs a POST request against the /service/boards/{id}/autoAssignResources endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BoardAutoAssignResource: The parsed response data.
+        """
+        return self._parse_one(
+            BoardAutoAssignResource, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdAutoassignresourcesCountEndpoint:
+        """
+        The ServiceBoardsIdAutoassignresourcesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdAutoassignresourcesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdAutotemplatesCountEndpoint import (
+    ServiceBoardsIdAutotemplatesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdAutotemplatesIdEndpoint import (
+    ServiceBoardsIdAutotemplatesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import BoardAutoTemplate
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceBoardsIdAutotemplatesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[BoardAutoTemplate], ConnectWiseManageRequestParams],
+    IAsyncPostable[BoardAutoTemplate, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[BoardAutoTemplate, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "autoTemplates", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[BoardAutoTemplate])
+        IAsyncPostable.__init__(self, BoardAutoTemplate)
+        IAsyncPaginateable.__init__(self, BoardAutoTemplate)
+
+    def id(self, _id: int) -> ServiceBoardsIdAutotemplatesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceBoardsIdAutotemplatesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceBoardsIdAutotemplatesIdEndpoint: The initialized ServiceBoardsIdAutotemplatesIdEndpoint object.
+        """
+        child = ServiceBoardsIdAutotemplatesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[BoardAutoTemplate]:
+        """
+        Performs a GET request against the /service/boards/{id}/autoTemplates endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[BoardAutoTemplate]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), BoardAutoTemplate, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[BoardAutoTemplate]:
+        """
+        Performs a GET request against the /service/boards/{id}/autoTemplates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[BoardAutoTemplate]: The parsed response data.
+        """
+        return self._parse_many(
+            BoardAutoTemplate, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> BoardAutoTemplate:
+        """
+        Performs a POST request against the /service/boards/{id}/autoTemplates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BoardAutoTemplate: The parsed response data.
+        """
+        return self._parse_one(
+            BoardAutoTemplate, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdAutotemplatesCountEndpoint:
+        """
+        The ServiceBoardsIdAutotemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdAutotemplatesCountEndpoint(self.client, parent_endpoint=self)
+        )
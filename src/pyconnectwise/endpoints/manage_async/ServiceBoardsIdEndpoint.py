@@ -0,0 +1,196 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdAutoassignresourcesEndpoint import (
+    ServiceBoardsIdAutoassignresourcesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdAutotemplatesEndpoint import (
+    ServiceBoardsIdAutotemplatesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdExcludedmembersEndpoint import (
+    ServiceBoardsIdExcludedmembersEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdItemsEndpoint import ServiceBoardsIdItemsEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdNotificationsEndpoint import (
+    ServiceBoardsIdNotificationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdStatusesEndpoint import ServiceBoardsIdStatusesEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdSubtypesEndpoint import ServiceBoardsIdSubtypesEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdTeamsEndpoint import ServiceBoardsIdTeamsEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdTypesEndpoint import ServiceBoardsIdTypesEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdTypesubtypeitemassociationsEndpoint import (
+    ServiceBoardsIdTypesubtypeitemassociationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdUsagesEndpoint import ServiceBoardsIdUsagesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Board
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceBoardsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Board, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Board, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Board, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Board, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Board)
+        IAsyncPatchable.__init__(self, Board)
+        IAsyncPuttable.__init__(self, Board)
+        IAsyncPaginateable.__init__(self, Board)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Board]:
+        """
+        Performs a GET request against the /service/boards/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Board]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Board, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /service/boards/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Board:
+        """
+        Performs a GET request against the /service/boards/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Board: The parsed response data.
+        """
+        return self._parse_one(Board, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Board:
+        """
+        Performs a PATCH request against the /service/boards/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Board: The parsed response data.
+        """
+        return self._parse_one(Board, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Board:
+        """
+        Performs a PUT request against the /service/boards/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Board: The parsed response data.
+        """
+        return self._parse_one(Board, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def auto_assign_resources(self) -> ServiceBoardsIdAutoassignresourcesEndpoint:
+        """
+        The ServiceBoardsIdAutoassignresourcesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdAutoassignresourcesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def auto_templates(self) -> ServiceBoardsIdAutotemplatesEndpoint:
+        """
+        The ServiceBoardsIdAutotemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdAutotemplatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def excluded_members(self) -> ServiceBoardsIdExcludedmembersEndpoint:
+        """
+        The ServiceBoardsIdExcludedmembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdExcludedmembersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def items(self) -> ServiceBoardsIdItemsEndpoint:
+        """
+        The ServiceBoardsIdItemsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdItemsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notifications(self) -> ServiceBoardsIdNotificationsEndpoint:
+        """
+        The ServiceBoardsIdNotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdNotificationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def statuses(self) -> ServiceBoardsIdStatusesEndpoint:
+        """
+        The ServiceBoardsIdStatusesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdStatusesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def subtypes(self) -> ServiceBoardsIdSubtypesEndpoint:
+        """
+        The ServiceBoardsIdSubtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdSubtypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def teams(self) -> ServiceBoardsIdTeamsEndpoint:
+        """
+        The ServiceBoardsIdTeamsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdTeamsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def type_sub_type_item_associations(self) -> ServiceBoardsIdTypesubtypeitemassociationsEndpoint:
+        """
+        The ServiceBoardsIdTypesubtypeitemassociationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdTypesubtypeitemassociationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def types(self) -> ServiceBoardsIdTypesEndpoint:
+        """
+        The ServiceBoardsIdTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdTypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ServiceBoardsIdUsagesEndpoint:
+        """
+        The ServiceBoardsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdUsagesEndpoint(self.client, parent_endpoint=self))
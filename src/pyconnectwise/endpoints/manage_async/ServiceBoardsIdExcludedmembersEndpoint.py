@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdExcludedmembersCountEndpoint import (
+    ServiceBoardsIdExcludedmembersCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdExcludedmembersIdEndpoint import (
+    ServiceBoardsIdExcludedmembersIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import BoardExcludedMember
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceBoardsIdExcludedmembersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[BoardExcludedMember], ConnectWiseManageRequestParams],
+    IAsyncPostable[BoardExcludedMember, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[BoardExcludedMember, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "excludedMembers", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[BoardExcludedMember])
+        IAsyncPostable.__init__(self, BoardExcludedMember)
+        IAsyncPaginateable.__init__(self, BoardExcludedMember)
+
+    def id(self, _id: int) -> ServiceBoardsIdExcludedmembersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceBoardsIdExcludedmembersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceBoardsIdExcludedmembersIdEndpoint: The initialized ServiceBoardsIdExcludedmembersIdEndpoint object.
+        """
+        child = ServiceBoardsIdExcludedmembersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[BoardExcludedMember]:
+        """
+        Performs a GET request against the /service/boards/{id}/excludedMembers endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[BoardExcludedMember]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), BoardExcludedMember, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[BoardExcludedMember]:
+        """
+        Performs a GET request against the /service/boards/{id}/excludedMembers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[BoardExcludedMember]: The parsed response data.
+        """
+        return self._parse_many(
+            BoardExcludedMember, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> BoardExcludedMember:
+        """
+        Performs a POST request against the /service/boards/{id}/excludedMembers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BoardExcludedMember: The parsed response data.
+        """
+        return self._parse_one(
+            BoardExcludedMember, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdExcludedmembersCountEndpoint:
+        """
+        The ServiceBoardsIdExcludedmembersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdExcludedmembersCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdItemsCountEndpoint import ServiceBoardsIdItemsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdItemsIdEndpoint import ServiceBoardsIdItemsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import BoardItem
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceBoardsIdItemsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[BoardItem], ConnectWiseManageRequestParams],
+    IAsyncPostable[BoardItem, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[BoardItem, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "items", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[BoardItem])
+        IAsyncPostable.__init__(self, BoardItem)
+        IAsyncPaginateable.__init__(self, BoardItem)
+
+    def id(self, _id: int) -> ServiceBoardsIdItemsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceBoardsIdItemsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceBoardsIdItemsIdEndpoint: The initialized ServiceBoardsIdItemsIdEndpoint object.
+        """
+        child = ServiceBoardsIdItemsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[BoardItem]:
+        """
+        Performs a GET request against the /service/boards/{id}/items endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[BoardItem]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), BoardItem, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[BoardItem]:
+        """
+        Performs a GET request against the /service/boards/{id}/items endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[BoardItem]: The parsed response data.
+        """
+        return self._parse_many(BoardItem, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardItem:
+        """
+        Performs a POST request against the /service/boards/{id}/items endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BoardItem: The parsed response data.
+        """
+        return self._parse_one(BoardItem, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceBoardsIdItemsCountEndpoint:
+        """
+        The ServiceBoardsIdItemsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdItemsCountEndpoint(self.client, parent_endpoint=self))
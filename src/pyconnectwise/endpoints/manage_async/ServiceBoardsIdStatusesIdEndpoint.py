@@ -0,0 +1,126 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdStatusesIdInfoEndpoint import (
+    ServiceBoardsIdStatusesIdInfoEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdStatusesIdNotificationsEndpoint import (
+    ServiceBoardsIdStatusesIdNotificationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceBoardsIdStatusesIdUsagesEndpoint import (
+    ServiceBoardsIdStatusesIdUsagesEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import BoardStatus
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceBoardsIdStatusesIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[BoardStatus, ConnectWiseManageRequestParams],
+    IAsyncPatchable[BoardStatus, ConnectWiseManageRequestParams],
+    IAsyncPuttable[BoardStatus, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[BoardStatus, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, BoardStatus)
+        IAsyncPatchable.__init__(self, BoardStatus)
+        IAsyncPuttable.__init__(self, BoardStatus)
+        IAsyncPaginateable.__init__(self, BoardStatus)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[BoardStatus]:
+        """
+        Performs a GET request against the /service/boards/{id}/statuses/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[BoardStatus]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), BoardStatus, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /service/boards/{id}/statuses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardStatus:
+        """
+        Performs a GET request against the /service/boards/{id}/statuses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BoardStatus: The parsed response data.
+        """
+        return self._parse_one(BoardStatus, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> BoardStatus:
+        """
+        Performs a PATCH request against the /service/boards/{id}/statuses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BoardStatus: The parsed response data.
+        """
+        return self._parse_one(BoardStatus, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> BoardStatus:
+        """
+        Performs a PUT request against the /service/boards/{id}/statuses/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BoardStatus: The parsed response data.
+        """
+        return self._parse_one(BoardStatus, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def info(self) -> ServiceBoardsIdStatusesIdInfoEndpoint:
+        """
+        The ServiceBoardsIdStatusesIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdStatusesIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notifications(self) -> ServiceBoardsIdStatusesIdNotificationsEndpoint:
+        """
+        The ServiceBoardsIdStatusesIdNotificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceBoardsIdStatusesIdNotificationsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def usages(self) -> ServiceBoardsIdStatusesIdUsagesEndpoint:
+        """
+        The ServiceBoardsIdStatusesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsIdStatusesIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,92 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceCodesCountEndpoint import ServiceCodesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceCodesIdEndpoint import ServiceCodesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Code
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceCodesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Code], ConnectWiseManageRequestParams],
+    IAsyncPostable[Code, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Code, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "codes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Code])
+        IAsyncPostable.__init__(self, Code)
+        IAsyncPaginateable.__init__(self, Code)
+
+    def id(self, _id: int) -> ServiceCodesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceCodesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceCodesIdEndpoint: The initialized ServiceCodesIdEndpoint object.
+        """
+        child = ServiceCodesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Code]:
+        """
+        Performs a GET request against the /service/codes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Code]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Code, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Code]:
+        """
+        Performs a GET request against the /service/codes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Code]: The parsed response data.
+        """
+        return self._parse_many(Code, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Code:
+        """
+        Performs a POST request against the /service/codes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Code: The parsed response data.
+        """
+        return self._parse_one(Code, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceCodesCountEndpoint:
+        """
+        The ServiceCodesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceCodesCountEndpoint(self.client, parent_endpoint=self))
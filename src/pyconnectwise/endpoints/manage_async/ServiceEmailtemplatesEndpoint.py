@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceEmailtemplatesCountEndpoint import ServiceEmailtemplatesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceEmailtemplatesIdEndpoint import ServiceEmailtemplatesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ServiceEmailTemplate
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceEmailtemplatesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ServiceEmailTemplate], ConnectWiseManageRequestParams],
+    IAsyncPostable[ServiceEmailTemplate, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ServiceEmailTemplate, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "emailTemplates", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ServiceEmailTemplate])
+        IAsyncPostable.__init__(self, ServiceEmailTemplate)
+        IAsyncPaginateable.__init__(self, ServiceEmailTemplate)
+
+    def id(self, _id: int) -> ServiceEmailtemplatesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceEmailtemplatesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceEmailtemplatesIdEndpoint: The initialized ServiceEmailtemplatesIdEndpoint object.
+        """
+        child = ServiceEmailtemplatesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ServiceEmailTemplate]:
+        """
+        Performs a GET request against the /service/emailTemplates endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ServiceEmailTemplate]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ServiceEmailTemplate, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ServiceEmailTemplate]:
+        """
+        Performs a GET request against the /service/emailTemplates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ServiceEmailTemplate]: The parsed response data.
+        """
+        return self._parse_many(
+            ServiceEmailTemplate, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceEmailTemplate:
+        """
+        Performs a POST request against the /service/emailTemplates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceEmailTemplate: The parsed response data.
+        """
+        return self._parse_one(
+            ServiceEmailTemplate, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ServiceEmailtemplatesCountEndpoint:
+        """
+        The ServiceEmailtemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceEmailtemplatesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,116 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceEmailtemplatesIdUsagesEndpoint import (
+    ServiceEmailtemplatesIdUsagesEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import ServiceEmailTemplate
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceEmailtemplatesIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[ServiceEmailTemplate, ConnectWiseManageRequestParams],
+    IAsyncPatchable[ServiceEmailTemplate, ConnectWiseManageRequestParams],
+    IAsyncPuttable[ServiceEmailTemplate, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ServiceEmailTemplate, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, ServiceEmailTemplate)
+        IAsyncPatchable.__init__(self, ServiceEmailTemplate)
+        IAsyncPuttable.__init__(self, ServiceEmailTemplate)
+        IAsyncPaginateable.__init__(self, ServiceEmailTemplate)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ServiceEmailTemplate]:
+        """
+        Performs a GET request against the /service/emailTemplates/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ServiceEmailTemplate]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ServiceEmailTemplate, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /service/emailTemplates/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceEmailTemplate:
+        """
+        Performs a GET request against the /service/emailTemplates/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceEmailTemplate: The parsed response data.
+        """
+        return self._parse_one(
+            ServiceEmailTemplate, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceEmailTemplate:
+        """
+        Performs a PATCH request against the /service/emailTemplates/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceEmailTemplate: The parsed response data.
+        """
+        return self._parse_one(
+            ServiceEmailTemplate, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceEmailTemplate:
+        """
+        Performs a PUT request against the /service/emailTemplates/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceEmailTemplate: The parsed response data.
+        """
+        return self._parse_one(
+            ServiceEmailTemplate, (await super()._make_request("PUT", data=data, params=params)).content
+        )
+
+    @cached_property
+    def usages(self) -> ServiceEmailtemplatesIdUsagesEndpoint:
+        """
+        The ServiceEmailtemplatesIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceEmailtemplatesIdUsagesEndpoint(self.client, parent_endpoint=self))
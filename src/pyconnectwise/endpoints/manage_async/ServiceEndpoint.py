@@ -0,0 +1,221 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceBoardsEndpoint import ServiceBoardsEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceCodesEndpoint import ServiceCodesEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceEmailtemplatesEndpoint import ServiceEmailtemplatesEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceImpactsEndpoint import ServiceImpactsEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceInfoEndpoint import ServiceInfoEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceKnowledgebasearticlesEndpoint import (
+    ServiceKnowledgebasearticlesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceKnowledgebasecategoriesEndpoint import (
+    ServiceKnowledgebasecategoriesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceKnowledgebasesettingsEndpoint import (
+    ServiceKnowledgebasesettingsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceKnowledgebasesubcategoriesEndpoint import (
+    ServiceKnowledgebasesubcategoriesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceLocationsEndpoint import ServiceLocationsEndpoint
+from pyconnectwise.endpoints.manage_async.ServicePrioritiesEndpoint import ServicePrioritiesEndpoint
+from pyconnectwise.endpoints.manage_async.ServicePriorityEndpoint import ServicePriorityEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSchedulingEndpoint import ServiceSchedulingEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceServicesignoffEndpoint import ServiceServicesignoffEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSeveritiesEndpoint import ServiceSeveritiesEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSlasEndpoint import ServiceSlasEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSourcesEndpoint import ServiceSourcesEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSurveysEndpoint import ServiceSurveysEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTeammembersEndpoint import ServiceTeammembersEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTeamsEndpoint import ServiceTeamsEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTemplatesEndpoint import ServiceTemplatesEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketlinksEndpoint import ServiceTicketlinksEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsEndpoint import ServiceTicketsEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsyncsEndpoint import ServiceTicketsyncsEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "service", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def boards(self) -> ServiceBoardsEndpoint:
+        """
+        The ServiceBoardsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceBoardsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def codes(self) -> ServiceCodesEndpoint:
+        """
+        The ServiceCodesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceCodesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def email_templates(self) -> ServiceEmailtemplatesEndpoint:
+        """
+        The ServiceEmailtemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceEmailtemplatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def impacts(self) -> ServiceImpactsEndpoint:
+        """
+        The ServiceImpactsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceImpactsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceInfoEndpoint:
+        """
+        The ServiceInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def knowledge_base_articles(self) -> ServiceKnowledgebasearticlesEndpoint:
+        """
+        The ServiceKnowledgebasearticlesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceKnowledgebasearticlesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def knowledge_base_categories(self) -> ServiceKnowledgebasecategoriesEndpoint:
+        """
+        The ServiceKnowledgebasecategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceKnowledgebasecategoriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def knowledge_base_sub_categories(self) -> ServiceKnowledgebasesubcategoriesEndpoint:
+        """
+        The ServiceKnowledgebasesubcategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceKnowledgebasesubcategoriesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def knowledgebasesettings(self) -> ServiceKnowledgebasesettingsEndpoint:
+        """
+        The ServiceKnowledgebasesettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceKnowledgebasesettingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def locations(self) -> ServiceLocationsEndpoint:
+        """
+        The ServiceLocationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceLocationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def priorities(self) -> ServicePrioritiesEndpoint:
+        """
+        The ServicePrioritiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServicePrioritiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def priority(self) -> ServicePriorityEndpoint:
+        """
+        The ServicePriorityEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServicePriorityEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def s_l_as(self) -> ServiceSlasEndpoint:
+        """
+        The ServiceSlasEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSlasEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scheduling(self) -> ServiceSchedulingEndpoint:
+        """
+        The ServiceSchedulingEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSchedulingEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def service_signoff(self) -> ServiceServicesignoffEndpoint:
+        """
+        The ServiceServicesignoffEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceServicesignoffEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def severities(self) -> ServiceSeveritiesEndpoint:
+        """
+        The ServiceSeveritiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSeveritiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def slas(self) -> ServiceSlasEndpoint:
+        """
+        The ServiceSlasEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSlasEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sources(self) -> ServiceSourcesEndpoint:
+        """
+        The ServiceSourcesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSourcesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def surveys(self) -> ServiceSurveysEndpoint:
+        """
+        The ServiceSurveysEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def team_members(self) -> ServiceTeammembersEndpoint:
+        """
+        The ServiceTeammembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTeammembersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def teams(self) -> ServiceTeamsEndpoint:
+        """
+        The ServiceTeamsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTeamsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def templates(self) -> ServiceTemplatesEndpoint:
+        """
+        The ServiceTemplatesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTemplatesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ticket_links(self) -> ServiceTicketlinksEndpoint:
+        """
+        The ServiceTicketlinksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketlinksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ticket_syncs(self) -> ServiceTicketsyncsEndpoint:
+        """
+        The ServiceTicketsyncsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsyncsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tickets(self) -> ServiceTicketsEndpoint:
+        """
+        The ServiceTicketsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsEndpoint(self.client, parent_endpoint=self))
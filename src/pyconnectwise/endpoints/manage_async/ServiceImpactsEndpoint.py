@@ -0,0 +1,78 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceImpactsCountEndpoint import ServiceImpactsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceImpactsIdEndpoint import ServiceImpactsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import Impact
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceImpactsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Impact], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Impact, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "impacts", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Impact])
+        IAsyncPaginateable.__init__(self, Impact)
+
+    def id(self, _id: int) -> ServiceImpactsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceImpactsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceImpactsIdEndpoint: The initialized ServiceImpactsIdEndpoint object.
+        """
+        child = ServiceImpactsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Impact]:
+        """
+        Performs a GET request against the /service/impacts endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Impact]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Impact, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Impact]:
+        """
+        Performs a GET request against the /service/impacts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Impact]: The parsed response data.
+        """
+        return self._parse_many(Impact, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceImpactsCountEndpoint:
+        """
+        The ServiceImpactsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceImpactsCountEndpoint(self.client, parent_endpoint=self))
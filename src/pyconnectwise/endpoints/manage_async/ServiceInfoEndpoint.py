@@ -0,0 +1,28 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceInfoBoardsEndpoint import ServiceInfoBoardsEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceInfoBoardtypesEndpoint import ServiceInfoBoardtypesEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceInfoEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "info", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def boards(self) -> ServiceInfoBoardsEndpoint:
+        """
+        The ServiceInfoBoardsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceInfoBoardsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def boardtypes(self) -> ServiceInfoBoardtypesEndpoint:
+        """
+        The ServiceInfoBoardtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceInfoBoardtypesEndpoint(self.client, parent_endpoint=self))
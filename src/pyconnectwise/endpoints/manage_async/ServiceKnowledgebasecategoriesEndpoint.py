@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceKnowledgebasecategoriesCountEndpoint import (
+    ServiceKnowledgebasecategoriesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceKnowledgebasecategoriesIdEndpoint import (
+    ServiceKnowledgebasecategoriesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import KnowledgeBaseCategory
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceKnowledgebasecategoriesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[KnowledgeBaseCategory], ConnectWiseManageRequestParams],
+    IAsyncPostable[KnowledgeBaseCategory, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[KnowledgeBaseCategory, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "knowledgeBaseCategories", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[KnowledgeBaseCategory])
+        IAsyncPostable.__init__(self, KnowledgeBaseCategory)
+        IAsyncPaginateable.__init__(self, KnowledgeBaseCategory)
+
+    def id(self, _id: int) -> ServiceKnowledgebasecategoriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceKnowledgebasecategoriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceKnowledgebasecategoriesIdEndpoint: The initialized ServiceKnowledgebasecategoriesIdEndpoint object.
+        """
+        child = ServiceKnowledgebasecategoriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[KnowledgeBaseCategory]:
+        """
+        Performs a GET request against the /service/knowledgeBaseCategories endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[KnowledgeBaseCategory]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), KnowledgeBaseCategory, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[KnowledgeBaseCategory]:
+        """
+        Performs a GET request against the /service/knowledgeBaseCategories endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[KnowledgeBaseCategory]: The parsed response data.
+        """
+        return self._parse_many(
+            KnowledgeBaseCategory, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> KnowledgeBaseCategory:
+        """
+        Performs a POST request against the /service/knowledgeBaseCategories endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            KnowledgeBaseCategory: The parsed response data.
+        """
+        return self._parse_one(
+            KnowledgeBaseCategory, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ServiceKnowledgebasecategoriesCountEndpoint:
+        """
+        The ServiceKnowledgebasecategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceKnowledgebasecategoriesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,93 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceKnowledgebasesettingsIdEndpoint import (
+    ServiceKnowledgebasesettingsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import KnowledgeBaseSettings
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceKnowledgebasesettingsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[KnowledgeBaseSettings, ConnectWiseManageRequestParams],
+    IAsyncPostable[KnowledgeBaseSettings, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[KnowledgeBaseSettings, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "knowledgebasesettings", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, KnowledgeBaseSettings)
+        IAsyncPostable.__init__(self, KnowledgeBaseSettings)
+        IAsyncPaginateable.__init__(self, KnowledgeBaseSettings)
+
+    def id(self, _id: int) -> ServiceKnowledgebasesettingsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceKnowledgebasesettingsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceKnowledgebasesettingsIdEndpoint: The initialized ServiceKnowledgebasesettingsIdEndpoint object.
+        """
+        child = ServiceKnowledgebasesettingsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[KnowledgeBaseSettings]:
+        """
+        Performs a GET request against the /service/knowledgebasesettings endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[KnowledgeBaseSettings]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), KnowledgeBaseSettings, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> KnowledgeBaseSettings:
+        """
+        Performs a GET request against the /service/knowledgebasesettings endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            KnowledgeBaseSettings: The parsed response data.
+        """
+        return self._parse_one(
+            KnowledgeBaseSettings, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> KnowledgeBaseSettings:
+        """
+        Performs a POST request against the /service/knowledgebasesettings endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            KnowledgeBaseSettings: The parsed response data.
+        """
+        return self._parse_one(
+            KnowledgeBaseSettings, (await super()._make_request("POST", data=data, params=params)).content
+        )
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceKnowledgebasesubcategoriesCountEndpoint import (
+    ServiceKnowledgebasesubcategoriesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceKnowledgebasesubcategoriesIdEndpoint import (
+    ServiceKnowledgebasesubcategoriesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import KnowledgeBaseSubCategory
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceKnowledgebasesubcategoriesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[KnowledgeBaseSubCategory], ConnectWiseManageRequestParams],
+    IAsyncPostable[KnowledgeBaseSubCategory, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[KnowledgeBaseSubCategory, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "knowledgeBaseSubCategories", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[KnowledgeBaseSubCategory])
+        IAsyncPostable.__init__(self, KnowledgeBaseSubCategory)
+        IAsyncPaginateable.__init__(self, KnowledgeBaseSubCategory)
+
+    def id(self, _id: int) -> ServiceKnowledgebasesubcategoriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceKnowledgebasesubcategoriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceKnowledgebasesubcategoriesIdEndpoint: The initialized ServiceKnowledgebasesubcategoriesIdEndpoint object.
+        """
+        child = ServiceKnowledgebasesubcategoriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[KnowledgeBaseSubCategory]:
+        """
+        Performs a GET request against the /service/knowledgeBaseSubCategories endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[KnowledgeBaseSubCategory]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), KnowledgeBaseSubCategory, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[KnowledgeBaseSubCategory]:
+        """
+        Performs a GET request against the /service/knowledgeBaseSubCategories endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[KnowledgeBaseSubCategory]: The parsed response data.
+        """
+        return self._parse_many(
+            KnowledgeBaseSubCategory, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> KnowledgeBaseSubCategory:
+        """
+        Performs a POST request against the /service/knowledgeBaseSubCategories endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            KnowledgeBaseSubCategory: The parsed response data.
+        """
+        return self._parse_one(
+            KnowledgeBaseSubCategory, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ServiceKnowledgebasesubcategoriesCountEndpoint:
+        """
+        The ServiceKnowledgebasesubcategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceKnowledgebasesubcategoriesCountEndpoint(self.client, parent_endpoint=self)
+        )
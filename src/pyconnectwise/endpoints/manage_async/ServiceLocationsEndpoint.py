@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceLocationsCountEndpoint import ServiceLocationsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceLocationsIdEndpoint import ServiceLocationsIdEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceLocationsInfoEndpoint import ServiceLocationsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ServiceLocation
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceLocationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ServiceLocation], ConnectWiseManageRequestParams],
+    IAsyncPostable[ServiceLocation, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ServiceLocation, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "locations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ServiceLocation])
+        IAsyncPostable.__init__(self, ServiceLocation)
+        IAsyncPaginateable.__init__(self, ServiceLocation)
+
+    def id(self, _id: int) -> ServiceLocationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceLocationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceLocationsIdEndpoint: The initialized ServiceLocationsIdEndpoint object.
+        """
+        child = ServiceLocationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ServiceLocation]:
+        """
+        Performs a GET request against the /service/locations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ServiceLocation]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ServiceLocation, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ServiceLocation]:
+        """
+        Performs a GET request against the /service/locations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ServiceLocation]: The parsed response data.
+        """
+        return self._parse_many(ServiceLocation, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceLocation:
+        """
+        Performs a POST request against the /service/locations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceLocation: The parsed response data.
+        """
+        return self._parse_one(ServiceLocation, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceLocationsCountEndpoint:
+        """
+        The ServiceLocationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceLocationsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceLocationsInfoEndpoint:
+        """
+        The ServiceLocationsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceLocationsInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServicePrioritiesCountEndpoint import ServicePrioritiesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServicePrioritiesIdEndpoint import ServicePrioritiesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Priority
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServicePrioritiesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Priority], ConnectWiseManageRequestParams],
+    IAsyncPostable[Priority, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Priority, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "priorities", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Priority])
+        IAsyncPostable.__init__(self, Priority)
+        IAsyncPaginateable.__init__(self, Priority)
+
+    def id(self, _id: int) -> ServicePrioritiesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServicePrioritiesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServicePrioritiesIdEndpoint: The initialized ServicePrioritiesIdEndpoint object.
+        """
+        child = ServicePrioritiesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Priority]:
+        """
+        Performs a GET request against the /service/priorities endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Priority]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Priority, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Priority]:
+        """
+        Performs a GET request against the /service/priorities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Priority]: The parsed response data.
+        """
+        return self._parse_many(Priority, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Priority:
+        """
+        Performs a POST request against the /service/priorities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Priority: The parsed response data.
+        """
+        return self._parse_one(Priority, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServicePrioritiesCountEndpoint:
+        """
+        The ServicePrioritiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServicePrioritiesCountEndpoint(self.client, parent_endpoint=self))
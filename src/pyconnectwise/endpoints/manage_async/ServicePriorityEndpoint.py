@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServicePriorityIdEndpoint import ServicePriorityIdEndpoint
+from pyconnectwise.endpoints.manage_async.ServicePriorityInfoEndpoint import ServicePriorityInfoEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServicePriorityEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "priority", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ServicePriorityIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServicePriorityIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServicePriorityIdEndpoint: The initialized ServicePriorityIdEndpoint object.
+        """
+        child = ServicePriorityIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def info(self) -> ServicePriorityInfoEndpoint:
+        """
+        The ServicePriorityInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServicePriorityInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSchedulingMembersIdEndpoint import ServiceSchedulingMembersIdEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSchedulingMembersInfoEndpoint import (
+    ServiceSchedulingMembersInfoEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceSchedulingMembersEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "members", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ServiceSchedulingMembersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceSchedulingMembersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceSchedulingMembersIdEndpoint: The initialized ServiceSchedulingMembersIdEndpoint object.
+        """
+        child = ServiceSchedulingMembersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def info(self) -> ServiceSchedulingMembersInfoEndpoint:
+        """
+        The ServiceSchedulingMembersInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSchedulingMembersInfoEndpoint(self.client, parent_endpoint=self))
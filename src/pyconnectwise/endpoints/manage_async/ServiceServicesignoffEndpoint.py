@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceServicesignoffCountEndpoint import ServiceServicesignoffCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceServicesignoffIdEndpoint import ServiceServicesignoffIdEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceServicesignoffInfoEndpoint import ServiceServicesignoffInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ServiceSignoff
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceServicesignoffEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ServiceSignoff], ConnectWiseManageRequestParams],
+    IAsyncPostable[ServiceSignoff, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ServiceSignoff, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "serviceSignoff", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ServiceSignoff])
+        IAsyncPostable.__init__(self, ServiceSignoff)
+        IAsyncPaginateable.__init__(self, ServiceSignoff)
+
+    def id(self, _id: int) -> ServiceServicesignoffIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceServicesignoffIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceServicesignoffIdEndpoint: The initialized ServiceServicesignoffIdEndpoint object.
+        """
+        child = ServiceServicesignoffIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ServiceSignoff]:
+        """
+        Performs a GET request against the /service/serviceSignoff endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ServiceSignoff]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ServiceSignoff, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ServiceSignoff]:
+        """
+        Performs a GET request against the /service/serviceSignoff endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ServiceSignoff]: The parsed response data.
+        """
+        return self._parse_many(ServiceSignoff, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceSignoff:
+        """
+        Performs a POST request against the /service/serviceSignoff endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceSignoff: The parsed response data.
+        """
+        return self._parse_one(ServiceSignoff, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceServicesignoffCountEndpoint:
+        """
+        The ServiceServicesignoffCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceServicesignoffCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceServicesignoffInfoEndpoint:
+        """
+        The ServiceServicesignoffInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceServicesignoffInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint import (
+    ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint import (
+    ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ServiceSignoffCustomField
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceServicesignoffIdSignoffcustomfieldsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ServiceSignoffCustomField], ConnectWiseManageRequestParams],
+    IAsyncPostable[ServiceSignoffCustomField, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ServiceSignoffCustomField, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "signoffcustomfields", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ServiceSignoffCustomField])
+        IAsyncPostable.__init__(self, ServiceSignoffCustomField)
+        IAsyncPaginateable.__init__(self, ServiceSignoffCustomField)
+
+    def id(self, _id: int) -> ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint: The initialized ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint object.
+        """
+        child = ServiceServicesignoffIdSignoffcustomfieldsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ServiceSignoffCustomField]:
+        """
+        Performs a GET request against the /service/serviceSignoff/{id}/signoffcustomfields endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ServiceSignoffCustomField]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ServiceSignoffCustomField, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ServiceSignoffCustomField]:
+        """
+        Performs a GET request against the /service/serviceSignoff/{id}/signoffcustomfields endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ServiceSignoffCustomField]: The parsed response data.
+        """
+        return self._parse_many(
+            ServiceSignoffCustomField, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceSignoffCustomField:
+        """
+        Performs a POST request against the /service/serviceSignoff/{id}/signoffcustomfields endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceSignoffCustomField: The parsed response data.
+        """
+        return self._parse_one(
+            ServiceSignoffCustomField, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint:
+        """
+        The ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceServicesignoffIdSignoffcustomfieldsCountEndpoint(self.client, parent_endpoint=self)
+        )
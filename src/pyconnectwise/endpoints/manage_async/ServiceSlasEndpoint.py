@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSlasIdEndpoint import ServiceSlasIdEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSlasInfoEndpoint import ServiceSlasInfoEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceSlasEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "slas", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> ServiceSlasIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceSlasIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceSlasIdEndpoint: The initialized ServiceSlasIdEndpoint object.
+        """
+        child = ServiceSlasIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def info(self) -> ServiceSlasInfoEndpoint:
+        """
+        The ServiceSlasInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSlasInfoEndpoint(self.client, parent_endpoint=self))
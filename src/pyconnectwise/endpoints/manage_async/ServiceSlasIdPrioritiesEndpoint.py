@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSlasIdPrioritiesCountEndpoint import (
+    ServiceSlasIdPrioritiesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceSlasIdPrioritiesIdEndpoint import ServiceSlasIdPrioritiesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import SLAPriority
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceSlasIdPrioritiesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SLAPriority], ConnectWiseManageRequestParams],
+    IAsyncPostable[SLAPriority, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SLAPriority, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "priorities", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SLAPriority])
+        IAsyncPostable.__init__(self, SLAPriority)
+        IAsyncPaginateable.__init__(self, SLAPriority)
+
+    def id(self, _id: int) -> ServiceSlasIdPrioritiesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceSlasIdPrioritiesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceSlasIdPrioritiesIdEndpoint: The initialized ServiceSlasIdPrioritiesIdEndpoint object.
+        """
+        child = ServiceSlasIdPrioritiesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SLAPriority]:
+        """
+        Performs a GET request against the /service/SLAs/{id}/priorities endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SLAPriority]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SLAPriority, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SLAPriority]:
+        """
+        Performs a GET request against the /service/SLAs/{id}/priorities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SLAPriority]: The parsed response data.
+        """
+        return self._parse_many(SLAPriority, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> SLAPriority:
+        """
+        Performs a POST request against the /service/SLAs/{id}/priorities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SLAPriority: The parsed response data.
+        """
+        return self._parse_one(SLAPriority, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceSlasIdPrioritiesCountEndpoint:
+        """
+        The ServiceSlasIdPrioritiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSlasIdPrioritiesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSourcesCountEndpoint import ServiceSourcesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSourcesIdEndpoint import ServiceSourcesIdEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSourcesInfoEndpoint import ServiceSourcesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Source
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceSourcesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Source], ConnectWiseManageRequestParams],
+    IAsyncPostable[Source, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Source, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "sources", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Source])
+        IAsyncPostable.__init__(self, Source)
+        IAsyncPaginateable.__init__(self, Source)
+
+    def id(self, _id: int) -> ServiceSourcesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceSourcesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceSourcesIdEndpoint: The initialized ServiceSourcesIdEndpoint object.
+        """
+        child = ServiceSourcesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Source]:
+        """
+        Performs a GET request against the /service/sources endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Source]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Source, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Source]:
+        """
+        Performs a GET request against the /service/sources endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Source]: The parsed response data.
+        """
+        return self._parse_many(Source, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Source:
+        """
+        Performs a POST request against the /service/sources endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Source: The parsed response data.
+        """
+        return self._parse_one(Source, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceSourcesCountEndpoint:
+        """
+        The ServiceSourcesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSourcesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceSourcesInfoEndpoint:
+        """
+        The ServiceSourcesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSourcesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSurveysCountEndpoint import ServiceSurveysCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdEndpoint import ServiceSurveysIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ServiceSurvey
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceSurveysEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ServiceSurvey], ConnectWiseManageRequestParams],
+    IAsyncPostable[ServiceSurvey, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ServiceSurvey, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "surveys", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ServiceSurvey])
+        IAsyncPostable.__init__(self, ServiceSurvey)
+        IAsyncPaginateable.__init__(self, ServiceSurvey)
+
+    def id(self, _id: int) -> ServiceSurveysIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceSurveysIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceSurveysIdEndpoint: The initialized ServiceSurveysIdEndpoint object.
+        """
+        child = ServiceSurveysIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ServiceSurvey]:
+        """
+        Performs a GET request against the /service/surveys endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ServiceSurvey]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ServiceSurvey, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ServiceSurvey]:
+        """
+        Performs a GET request against the /service/surveys endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ServiceSurvey]: The parsed response data.
+        """
+        return self._parse_many(ServiceSurvey, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceSurvey:
+        """
+        Performs a POST request against the /service/surveys endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceSurvey: The parsed response data.
+        """
+        return self._parse_one(ServiceSurvey, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceSurveysCountEndpoint:
+        """
+        The ServiceSurveysCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,132 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdCopyEndpoint import ServiceSurveysIdCopyEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdQuestionsEndpoint import ServiceSurveysIdQuestionsEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdResultsEndpoint import ServiceSurveysIdResultsEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdUsagesEndpoint import ServiceSurveysIdUsagesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import ServiceSurvey
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceSurveysIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[ServiceSurvey, ConnectWiseManageRequestParams],
+    IAsyncPatchable[ServiceSurvey, ConnectWiseManageRequestParams],
+    IAsyncPuttable[ServiceSurvey, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ServiceSurvey, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, ServiceSurvey)
+        IAsyncPatchable.__init__(self, ServiceSurvey)
+        IAsyncPuttable.__init__(self, ServiceSurvey)
+        IAsyncPaginateable.__init__(self, ServiceSurvey)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ServiceSurvey]:
+        """
+        Performs a GET request against the /service/surveys/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ServiceSurvey]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ServiceSurvey, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /service/surveys/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceSurvey:
+        """
+        Performs a GET request against the /service/surveys/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceSurvey: The parsed response data.
+        """
+        return self._parse_one(ServiceSurvey, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceSurvey:
+        """
+        Performs a PATCH request against the /service/surveys/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceSurvey: The parsed response data.
+        """
+        return self._parse_one(ServiceSurvey, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceSurvey:
+        """
+        Performs a PUT request against the /service/surveys/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceSurvey: The parsed response data.
+        """
+        return self._parse_one(ServiceSurvey, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def copy(self) -> ServiceSurveysIdCopyEndpoint:
+        """
+        The ServiceSurveysIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def questions(self) -> ServiceSurveysIdQuestionsEndpoint:
+        """
+        The ServiceSurveysIdQuestionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdQuestionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def results(self) -> ServiceSurveysIdResultsEndpoint:
+        """
+        The ServiceSurveysIdResultsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdResultsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> ServiceSurveysIdUsagesEndpoint:
+        """
+        The ServiceSurveysIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdQuestionsCountEndpoint import (
+    ServiceSurveysIdQuestionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdQuestionsIdEndpoint import ServiceSurveysIdQuestionsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ServiceSurveyQuestion
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceSurveysIdQuestionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ServiceSurveyQuestion], ConnectWiseManageRequestParams],
+    IAsyncPostable[ServiceSurveyQuestion, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ServiceSurveyQuestion, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "questions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ServiceSurveyQuestion])
+        IAsyncPostable.__init__(self, ServiceSurveyQuestion)
+        IAsyncPaginateable.__init__(self, ServiceSurveyQuestion)
+
+    def id(self, _id: int) -> ServiceSurveysIdQuestionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceSurveysIdQuestionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceSurveysIdQuestionsIdEndpoint: The initialized ServiceSurveysIdQuestionsIdEndpoint object.
+        """
+        child = ServiceSurveysIdQuestionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ServiceSurveyQuestion]:
+        """
+        Performs a GET request against the /service/surveys/{id}/questions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ServiceSurveyQuestion]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ServiceSurveyQuestion, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ServiceSurveyQuestion]:
+        """
+        Performs a GET request against the /service/surveys/{id}/questions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ServiceSurveyQuestion]: The parsed response data.
+        """
+        return self._parse_many(
+            ServiceSurveyQuestion, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceSurveyQuestion:
+        """
+        Performs a POST request against the /service/surveys/{id}/questions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceSurveyQuestion: The parsed response data.
+        """
+        return self._parse_one(
+            ServiceSurveyQuestion, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ServiceSurveysIdQuestionsCountEndpoint:
+        """
+        The ServiceSurveysIdQuestionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdQuestionsCountEndpoint(self.client, parent_endpoint=self))
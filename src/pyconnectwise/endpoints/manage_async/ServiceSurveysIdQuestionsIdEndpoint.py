@@ -0,0 +1,128 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdQuestionsIdCopyEndpoint import (
+    ServiceSurveysIdQuestionsIdCopyEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdQuestionsIdOptionsEndpoint import (
+    ServiceSurveysIdQuestionsIdOptionsEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import ServiceSurveyQuestion
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceSurveysIdQuestionsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[ServiceSurveyQuestion, ConnectWiseManageRequestParams],
+    IAsyncPatchable[ServiceSurveyQuestion, ConnectWiseManageRequestParams],
+    IAsyncPuttable[ServiceSurveyQuestion, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ServiceSurveyQuestion, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, ServiceSurveyQuestion)
+        IAsyncPatchable.__init__(self, ServiceSurveyQuestion)
+        IAsyncPuttable.__init__(self, ServiceSurveyQuestion)
+        IAsyncPaginateable.__init__(self, ServiceSurveyQuestion)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ServiceSurveyQuestion]:
+        """
+        Performs a GET request against the /service/surveys/{id}/questions/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ServiceSurveyQuestion]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ServiceSurveyQuestion, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /service/surveys/{id}/questions/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceSurveyQuestion:
+        """
+        Performs a GET request against the /service/surveys/{id}/questions/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceSurveyQuestion: The parsed response data.
+        """
+        return self._parse_one(
+            ServiceSurveyQuestion, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceSurveyQuestion:
+        """
+        Performs a PATCH request against the /service/surveys/{id}/questions/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceSurveyQuestion: The parsed response data.
+        """
+        return self._parse_one(
+            ServiceSurveyQuestion, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceSurveyQuestion:
+        """
+        Performs a PUT request against the /service/surveys/{id}/questions/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceSurveyQuestion: The parsed response data.
+        """
+        return self._parse_one(
+            ServiceSurveyQuestion, (await super()._make_request("PUT", data=data, params=params)).content
+        )
+
+    @cached_property
+    def copy(self) -> ServiceSurveysIdQuestionsIdCopyEndpoint:
+        """
+        The ServiceSurveysIdQuestionsIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdQuestionsIdCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def options(self) -> ServiceSurveysIdQuestionsIdOptionsEndpoint:
+        """
+        The ServiceSurveysIdQuestionsIdOptionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceSurveysIdQuestionsIdOptionsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdQuestionsIdOptionsCountEndpoint import (
+    ServiceSurveysIdQuestionsIdOptionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdQuestionsIdOptionsIdEndpoint import (
+    ServiceSurveysIdQuestionsIdOptionsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import SurveyOption
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceSurveysIdQuestionsIdOptionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SurveyOption], ConnectWiseManageRequestParams],
+    IAsyncPostable[SurveyOption, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SurveyOption, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "options", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SurveyOption])
+        IAsyncPostable.__init__(self, SurveyOption)
+        IAsyncPaginateable.__init__(self, SurveyOption)
+
+    def id(self, _id: int) -> ServiceSurveysIdQuestionsIdOptionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceSurveysIdQuestionsIdOptionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceSurveysIdQuestionsIdOptionsIdEndpoint: The initialized ServiceSurveysIdQuestionsIdOptionsIdEndpoint object.
+        """
+        child = ServiceSurveysIdQuestionsIdOptionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SurveyOption]:
+        """
+        Performs a GET request against the /service/surveys/{id}/questions/{id}/options endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SurveyOption]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SurveyOption, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SurveyOption]:
+        """
+        Performs a GET request against the /service/surveys/{id}/questions/{id}/options endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SurveyOption]: The parsed response data.
+        """
+        return self._parse_many(SurveyOption, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> SurveyOption:
+        """
+        Performs a POST request against the /service/surveys/{id}/questions/{id}/options endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SurveyOption: The parsed response data.
+        """
+        return self._parse_one(SurveyOption, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceSurveysIdQuestionsIdOptionsCountEndpoint:
+        """
+        The ServiceSurveysIdQuestionsIdOptionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            ServiceSurveysIdQuestionsIdOptionsCountEndpoint(self.client, parent_endpoint=self)
+        )
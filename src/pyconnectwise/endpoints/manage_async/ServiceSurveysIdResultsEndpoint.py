@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdResultsCountEndpoint import (
+    ServiceSurveysIdResultsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceSurveysIdResultsIdEndpoint import ServiceSurveysIdResultsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import SurveyResult
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceSurveysIdResultsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SurveyResult], ConnectWiseManageRequestParams],
+    IAsyncPostable[SurveyResult, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SurveyResult, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "results", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SurveyResult])
+        IAsyncPostable.__init__(self, SurveyResult)
+        IAsyncPaginateable.__init__(self, SurveyResult)
+
+    def id(self, _id: int) -> ServiceSurveysIdResultsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceSurveysIdResultsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceSurveysIdResultsIdEndpoint: The initialized ServiceSurveysIdResultsIdEndpoint object.
+        """
+        child = ServiceSurveysIdResultsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SurveyResult]:
+        """
+        Performs a GET request against the /service/surveys/{id}/results endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SurveyResult]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SurveyResult, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SurveyResult]:
+        """
+        Performs a GET request against the /service/surveys/{id}/results endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SurveyResult]: The parsed response data.
+        """
+        return self._parse_many(SurveyResult, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> SurveyResult:
+        """
+        Performs a POST request against the /service/surveys/{id}/results endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SurveyResult: The parsed response data.
+        """
+        return self._parse_one(SurveyResult, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceSurveysIdResultsCountEndpoint:
+        """
+        The ServiceSurveysIdResultsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceSurveysIdResultsCountEndpoint(self.client, parent_endpoint=self))
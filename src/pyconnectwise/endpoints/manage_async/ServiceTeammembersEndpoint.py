@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.manage import TeamMember
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceTeammembersEndpoint(AsyncConnectWiseEndpoint, IAsyncPostable[TeamMember, ConnectWiseManageRequestParams]):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "teamMembers", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, TeamMember)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TeamMember:
+        """
+        Performs a POST request against the /service/teamMembers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TeamMember: The parsed response data.
+        """
+        return self._parse_one(TeamMember, (await super()._make_request("POST", data=data, params=params)).content)
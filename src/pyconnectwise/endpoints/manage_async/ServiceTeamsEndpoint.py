@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTeamsCountEndpoint import ServiceTeamsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTeamsIdEndpoint import ServiceTeamsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import ServiceTeam
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceTeamsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ServiceTeam], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ServiceTeam, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "teams", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ServiceTeam])
+        IAsyncPaginateable.__init__(self, ServiceTeam)
+
+    def id(self, _id: int) -> ServiceTeamsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceTeamsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceTeamsIdEndpoint: The initialized ServiceTeamsIdEndpoint object.
+        """
+        child = ServiceTeamsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ServiceTeam]:
+        """
+        Performs a GET request against the /service/teams endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ServiceTeam]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ServiceTeam, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ServiceTeam]:
+        """
+        Performs a GET request against the /service/teams endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ServiceTeam]: The parsed response data.
+        """
+        return self._parse_many(ServiceTeam, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceTeamsCountEndpoint:
+        """
+        The ServiceTeamsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTeamsCountEndpoint(self.client, parent_endpoint=self))
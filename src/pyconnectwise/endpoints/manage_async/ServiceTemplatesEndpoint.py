@@ -0,0 +1,88 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTemplatesCountEndpoint import ServiceTemplatesCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTemplatesIdEndpoint import ServiceTemplatesIdEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTemplatesInfoEndpoint import ServiceTemplatesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import ServiceTemplate
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceTemplatesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ServiceTemplate], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ServiceTemplate, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "templates", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ServiceTemplate])
+        IAsyncPaginateable.__init__(self, ServiceTemplate)
+
+    def id(self, _id: int) -> ServiceTemplatesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceTemplatesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceTemplatesIdEndpoint: The initialized ServiceTemplatesIdEndpoint object.
+        """
+        child = ServiceTemplatesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ServiceTemplate]:
+        """
+        Performs a GET request against the /service/templates endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ServiceTemplate]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ServiceTemplate, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ServiceTemplate]:
+        """
+        Performs a GET request against the /service/templates endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ServiceTemplate]: The parsed response data.
+        """
+        return self._parse_many(ServiceTemplate, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceTemplatesCountEndpoint:
+        """
+        The ServiceTemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTemplatesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceTemplatesInfoEndpoint:
+        """
+        The ServiceTemplatesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTemplatesInfoEndpoint(self.client, parent_endpoint=self))
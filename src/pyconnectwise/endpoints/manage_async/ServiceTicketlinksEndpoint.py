@@ -0,0 +1,108 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketlinksCountEndpoint import ServiceTicketlinksCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketlinksIdEndpoint import ServiceTicketlinksIdEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketlinksInfoEndpoint import ServiceTicketlinksInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ServiceTicketLink
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceTicketlinksEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ServiceTicketLink], ConnectWiseManageRequestParams],
+    IAsyncPostable[ServiceTicketLink, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ServiceTicketLink, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "ticketLinks", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ServiceTicketLink])
+        IAsyncPostable.__init__(self, ServiceTicketLink)
+        IAsyncPaginateable.__init__(self, ServiceTicketLink)
+
+    def id(self, _id: int) -> ServiceTicketlinksIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceTicketlinksIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceTicketlinksIdEndpoint: The initialized ServiceTicketlinksIdEndpoint object.
+        """
+        child = ServiceTicketlinksIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ServiceTicketLink]:
+        """
+        Performs a GET request against the /service/ticketLinks endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ServiceTicketLink]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ServiceTicketLink, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ServiceTicketLink]:
+        """
+        Performs a GET request against the /service/ticketLinks endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ServiceTicketLink]: The parsed response data.
+        """
+        return self._parse_many(
+            ServiceTicketLink, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ServiceTicketLink:
+        """
+        Performs a POST request against the /service/ticketLinks endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ServiceTicketLink: The parsed response data.
+        """
+        return self._parse_one(
+            ServiceTicketLink, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> ServiceTicketlinksCountEndpoint:
+        """
+        The ServiceTicketlinksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketlinksCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceTicketlinksInfoEndpoint:
+        """
+        The ServiceTicketlinksInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketlinksInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,108 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsCountEndpoint import ServiceTicketsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdEndpoint import ServiceTicketsIdEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsInfoEndpoint import ServiceTicketsInfoEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsSearchEndpoint import ServiceTicketsSearchEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Ticket
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceTicketsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Ticket], ConnectWiseManageRequestParams],
+    IAsyncPostable[Ticket, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Ticket, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "tickets", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Ticket])
+        IAsyncPostable.__init__(self, Ticket)
+        IAsyncPaginateable.__init__(self, Ticket)
+
+    def id(self, _id: int) -> ServiceTicketsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceTicketsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceTicketsIdEndpoint: The initialized ServiceTicketsIdEndpoint object.
+        """
+        child = ServiceTicketsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Ticket]:
+        """
+        Performs a GET request against the /service/tickets endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Ticket]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Ticket, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Ticket]:
+        """
+        Performs a GET request against the /service/tickets endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Ticket]: The parsed response data.
+        """
+        return self._parse_many(Ticket, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Ticket:
+        """
+        Performs a POST request against the /service/tickets endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Ticket: The parsed response data.
+        """
+        return self._parse_one(Ticket, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceTicketsCountEndpoint:
+        """
+        The ServiceTicketsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceTicketsInfoEndpoint:
+        """
+        The ServiceTicketsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def search(self) -> ServiceTicketsSearchEndpoint:
+        """
+        The ServiceTicketsSearchEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsSearchEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,204 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdActivitiesEndpoint import ServiceTicketsIdActivitiesEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdAllnotesEndpoint import ServiceTicketsIdAllnotesEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdAttachchildrenEndpoint import (
+    ServiceTicketsIdAttachchildrenEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdConfigurationsEndpoint import (
+    ServiceTicketsIdConfigurationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdConvertEndpoint import ServiceTicketsIdConvertEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdDocumentsEndpoint import ServiceTicketsIdDocumentsEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdInfoEndpoint import ServiceTicketsIdInfoEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdMergeEndpoint import ServiceTicketsIdMergeEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdNotesEndpoint import ServiceTicketsIdNotesEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdProductsEndpoint import ServiceTicketsIdProductsEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdScheduleentriesEndpoint import (
+    ServiceTicketsIdScheduleentriesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdTasksEndpoint import ServiceTicketsIdTasksEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsIdTimeentriesEndpoint import ServiceTicketsIdTimeentriesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Ticket
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceTicketsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Ticket, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Ticket, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Ticket, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Ticket, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Ticket)
+        IAsyncPatchable.__init__(self, Ticket)
+        IAsyncPuttable.__init__(self, Ticket)
+        IAsyncPaginateable.__init__(self, Ticket)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Ticket]:
+        """
+        Performs a GET request against the /service/tickets/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Ticket]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Ticket, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /service/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Ticket:
+        """
+        Performs a GET request against the /service/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Ticket: The parsed response data.
+        """
+        return self._parse_one(Ticket, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Ticket:
+        """
+        Performs a PATCH request against the /service/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Ticket: The parsed response data.
+        """
+        return self._parse_one(Ticket, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Ticket:
+        """
+        Performs a PUT request against the /service/tickets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Ticket: The parsed response data.
+        """
+        return self._parse_one(Ticket, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def activities(self) -> ServiceTicketsIdActivitiesEndpoint:
+        """
+        The ServiceTicketsIdActivitiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdActivitiesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def all_notes(self) -> ServiceTicketsIdAllnotesEndpoint:
+        """
+        The ServiceTicketsIdAllnotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdAllnotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def attach_children(self) -> ServiceTicketsIdAttachchildrenEndpoint:
+        """
+        The ServiceTicketsIdAttachchildrenEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdAttachchildrenEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def configurations(self) -> ServiceTicketsIdConfigurationsEndpoint:
+        """
+        The ServiceTicketsIdConfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdConfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def convert(self) -> ServiceTicketsIdConvertEndpoint:
+        """
+        The ServiceTicketsIdConvertEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdConvertEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def documents(self) -> ServiceTicketsIdDocumentsEndpoint:
+        """
+        The ServiceTicketsIdDocumentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdDocumentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> ServiceTicketsIdInfoEndpoint:
+        """
+        The ServiceTicketsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def merge(self) -> ServiceTicketsIdMergeEndpoint:
+        """
+        The ServiceTicketsIdMergeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdMergeEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notes(self) -> ServiceTicketsIdNotesEndpoint:
+        """
+        The ServiceTicketsIdNotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdNotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def products(self) -> ServiceTicketsIdProductsEndpoint:
+        """
+        The ServiceTicketsIdProductsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdProductsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def scheduleentries(self) -> ServiceTicketsIdScheduleentriesEndpoint:
+        """
+        The ServiceTicketsIdScheduleentriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdScheduleentriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tasks(self) -> ServiceTicketsIdTasksEndpoint:
+        """
+        The ServiceTicketsIdTasksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdTasksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def timeentries(self) -> ServiceTicketsIdTimeentriesEndpoint:
+        """
+        The ServiceTicketsIdTimeentriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsIdTimeentriesEndpoint(self.client, parent_endpoint=self))
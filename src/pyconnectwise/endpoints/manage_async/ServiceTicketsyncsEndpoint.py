@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsyncsCountEndpoint import ServiceTicketsyncsCountEndpoint
+from pyconnectwise.endpoints.manage_async.ServiceTicketsyncsIdEndpoint import ServiceTicketsyncsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TicketSync
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class ServiceTicketsyncsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TicketSync], ConnectWiseManageRequestParams],
+    IAsyncPostable[TicketSync, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TicketSync, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "ticketSyncs", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TicketSync])
+        IAsyncPostable.__init__(self, TicketSync)
+        IAsyncPaginateable.__init__(self, TicketSync)
+
+    def id(self, _id: int) -> ServiceTicketsyncsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized ServiceTicketsyncsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            ServiceTicketsyncsIdEndpoint: The initialized ServiceTicketsyncsIdEndpoint object.
+        """
+        child = ServiceTicketsyncsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TicketSync]:
+        """
+        Performs a GET request against the /service/ticketSyncs endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TicketSync]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TicketSync, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TicketSync]:
+        """
+        Performs a GET request against the /service/ticketSyncs endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TicketSync]: The parsed response data.
+        """
+        return self._parse_many(TicketSync, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TicketSync:
+        """
+        Performs a POST request against the /service/ticketSyncs endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TicketSync: The parsed response data.
+        """
+        return self._parse_one(TicketSync, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> ServiceTicketsyncsCountEndpoint:
+        """
+        The ServiceTicketsyncsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(ServiceTicketsyncsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAllowedfiletypesCountEndpoint import SystemAllowedfiletypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAllowedfiletypesIdEndpoint import SystemAllowedfiletypesIdEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemAllowedfiletypesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "allowedfiletypes", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> SystemAllowedfiletypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemAllowedfiletypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemAllowedfiletypesIdEndpoint: The initialized SystemAllowedfiletypesIdEndpoint object.
+        """
+        child = SystemAllowedfiletypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def count(self) -> SystemAllowedfiletypesCountEndpoint:
+        """
+        The SystemAllowedfiletypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAllowedfiletypesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAllowedoriginsCountEndpoint import SystemAllowedoriginsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAllowedoriginsIdEndpoint import SystemAllowedoriginsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AllowedOrigin
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemAllowedoriginsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AllowedOrigin], ConnectWiseManageRequestParams],
+    IAsyncPostable[AllowedOrigin, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AllowedOrigin, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "allowedorigins", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AllowedOrigin])
+        IAsyncPostable.__init__(self, AllowedOrigin)
+        IAsyncPaginateable.__init__(self, AllowedOrigin)
+
+    def id(self, _id: int) -> SystemAllowedoriginsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemAllowedoriginsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemAllowedoriginsIdEndpoint: The initialized SystemAllowedoriginsIdEndpoint object.
+        """
+        child = SystemAllowedoriginsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AllowedOrigin]:
+        """
+        Performs a GET request against the /system/allowedorigins endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AllowedOrigin]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AllowedOrigin, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AllowedOrigin]:
+        """
+        Performs a GET request against the /system/allowedorigins endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AllowedOrigin]: The parsed response data.
+        """
+        return self._parse_many(AllowedOrigin, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AllowedOrigin:
+        """
+        Performs a POST request against the /system/allowedorigins endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AllowedOrigin: The parsed response data.
+        """
+        return self._parse_one(AllowedOrigin, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemAllowedoriginsCountEndpoint:
+        """
+        The SystemAllowedoriginsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAllowedoriginsCountEndpoint(self.client, parent_endpoint=self))
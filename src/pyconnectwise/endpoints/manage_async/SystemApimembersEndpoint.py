@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemApimembersCountEndpoint import SystemApimembersCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemApimembersDefaultEndpoint import SystemApimembersDefaultEndpoint
+from pyconnectwise.endpoints.manage_async.SystemApimembersIdEndpoint import SystemApimembersIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ApiMember
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemApimembersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ApiMember], ConnectWiseManageRequestParams],
+    IAsyncPostable[ApiMember, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ApiMember, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "apiMembers", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ApiMember])
+        IAsyncPostable.__init__(self, ApiMember)
+        IAsyncPaginateable.__init__(self, ApiMember)
+
+    def id(self, _id: int) -> SystemApimembersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemApimembersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemApimembersIdEndpoint: The initialized SystemApimembersIdEndpoint object.
+        """
+        child = SystemApimembersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ApiMember]:
+        """
+        Performs a GET request against the /system/apiMembers endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ApiMember]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ApiMember, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ApiMember]:
+        """
+        Performs a GET request against the /system/apiMembers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ApiMember]: The parsed response data.
+        """
+        return self._parse_many(ApiMember, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ApiMember:
+        """
+        Performs a POST request against the /system/apiMembers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ApiMember: The parsed response data.
+        """
+        return self._parse_one(ApiMember, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemApimembersCountEndpoint:
+        """
+        The SystemApimembersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemApimembersCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def default(self) -> SystemApimembersDefaultEndpoint:
+        """
+        The SystemApimembersDefaultEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemApimembersDefaultEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,66 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAudittrailCountEndpoint import SystemAudittrailCountEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import AuditTrailEntry
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemAudittrailEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AuditTrailEntry], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AuditTrailEntry, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "audittrail", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AuditTrailEntry])
+        IAsyncPaginateable.__init__(self, AuditTrailEntry)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AuditTrailEntry]:
+        """
+        Performs a GET request against the /system/audittrail endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AuditTrailEntry]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AuditTrailEntry, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AuditTrailEntry]:
+        """
+        Performs a GET request against the /system/audittrail endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AuditTrailEntry]: The parsed response data.
+        """
+        return self._parse_many(AuditTrailEntry, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemAudittrailCountEndpoint:
+        """
+        The SystemAudittrailCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAudittrailCountEndpoint(self.client, parent_endpoint=self))
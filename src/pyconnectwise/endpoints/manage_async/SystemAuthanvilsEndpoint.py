@@ -0,0 +1,90 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAuthanvilsCountEndpoint import SystemAuthanvilsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAuthanvilsIdEndpoint import SystemAuthanvilsIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAuthanvilsTestconnectionEndpoint import (
+    SystemAuthanvilsTestconnectionEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import AuthAnvil
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemAuthanvilsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AuthAnvil], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AuthAnvil, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "authAnvils", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AuthAnvil])
+        IAsyncPaginateable.__init__(self, AuthAnvil)
+
+    def id(self, _id: int) -> SystemAuthanvilsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemAuthanvilsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemAuthanvilsIdEndpoint: The initialized SystemAuthanvilsIdEndpoint object.
+        """
+        child = SystemAuthanvilsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AuthAnvil]:
+        """
+        Performs a GET request against the /system/authAnvils endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AuthAnvil]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AuthAnvil, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AuthAnvil]:
+        """
+        Performs a GET request against the /system/authAnvils endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AuthAnvil]: The parsed response data.
+        """
+        return self._parse_many(AuthAnvil, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemAuthanvilsCountEndpoint:
+        """
+        The SystemAuthanvilsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAuthanvilsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def test_connection(self) -> SystemAuthanvilsTestconnectionEndpoint:
+        """
+        The SystemAuthanvilsTestconnectionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAuthanvilsTestconnectionEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAutosynctimeCountEndpoint import SystemAutosynctimeCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAutosynctimeIdEndpoint import SystemAutosynctimeIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import AutoSyncTime
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemAutosynctimeEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[AutoSyncTime], ConnectWiseManageRequestParams],
+    IAsyncPostable[AutoSyncTime, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[AutoSyncTime, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "autoSyncTime", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[AutoSyncTime])
+        IAsyncPostable.__init__(self, AutoSyncTime)
+        IAsyncPaginateable.__init__(self, AutoSyncTime)
+
+    def id(self, _id: int) -> SystemAutosynctimeIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemAutosynctimeIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemAutosynctimeIdEndpoint: The initialized SystemAutosynctimeIdEndpoint object.
+        """
+        child = SystemAutosynctimeIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[AutoSyncTime]:
+        """
+        Performs a GET request against the /system/autoSyncTime endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[AutoSyncTime]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), AutoSyncTime, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[AutoSyncTime]:
+        """
+        Performs a GET request against the /system/autoSyncTime endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[AutoSyncTime]: The parsed response data.
+        """
+        return self._parse_many(AutoSyncTime, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> AutoSyncTime:
+        """
+        Performs a POST request against the /system/autoSyncTime endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AutoSyncTime: The parsed response data.
+        """
+        return self._parse_one(AutoSyncTime, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemAutosynctimeCountEndpoint:
+        """
+        The SystemAutosynctimeCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAutosynctimeCountEndpoint(self.client, parent_endpoint=self))
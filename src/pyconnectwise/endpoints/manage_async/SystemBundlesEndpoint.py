@@ -0,0 +1,42 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemBundlesCountEndpoint import SystemBundlesCountEndpoint
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.manage import BundleResultsCollection
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemBundlesEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPostable[BundleResultsCollection, ConnectWiseManageRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "bundles", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, BundleResultsCollection)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> BundleResultsCollection:
+        """
+        Performs a POST request against the /system/bundles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            BundleResultsCollection: The parsed response data.
+        """
+        return self._parse_one(
+            BundleResultsCollection, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemBundlesCountEndpoint:
+        """
+        The SystemBundlesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemBundlesCountEndpoint(self.client, parent_endpoint=self))
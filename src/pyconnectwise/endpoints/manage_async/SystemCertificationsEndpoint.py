@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemCertificationsCountEndpoint import SystemCertificationsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemCertificationsIdEndpoint import SystemCertificationsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Certification
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemCertificationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Certification], ConnectWiseManageRequestParams],
+    IAsyncPostable[Certification, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Certification, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "certifications", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Certification])
+        IAsyncPostable.__init__(self, Certification)
+        IAsyncPaginateable.__init__(self, Certification)
+
+    def id(self, _id: int) -> SystemCertificationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemCertificationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemCertificationsIdEndpoint: The initialized SystemCertificationsIdEndpoint object.
+        """
+        child = SystemCertificationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Certification]:
+        """
+        Performs a GET request against the /system/certifications endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Certification]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Certification, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Certification]:
+        """
+        Performs a GET request against the /system/certifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Certification]: The parsed response data.
+        """
+        return self._parse_many(Certification, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> Certification:
+        """
+        Performs a POST request against the /system/certifications endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Certification: The parsed response data.
+        """
+        return self._parse_one(Certification, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemCertificationsCountEndpoint:
+        """
+        The SystemCertificationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCertificationsCountEndpoint(self.client, parent_endpoint=self))
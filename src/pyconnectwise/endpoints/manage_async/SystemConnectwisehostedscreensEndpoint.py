@@ -0,0 +1,88 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemConnectwisehostedscreensCountEndpoint import (
+    SystemConnectwisehostedscreensCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemConnectwisehostedscreensIdEndpoint import (
+    SystemConnectwisehostedscreensIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import ConnectWiseHostedScreen
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemConnectwisehostedscreensEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ConnectWiseHostedScreen], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ConnectWiseHostedScreen, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "connectWiseHostedScreens", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ConnectWiseHostedScreen])
+        IAsyncPaginateable.__init__(self, ConnectWiseHostedScreen)
+
+    def id(self, _id: int) -> SystemConnectwisehostedscreensIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemConnectwisehostedscreensIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemConnectwisehostedscreensIdEndpoint: The initialized SystemConnectwisehostedscreensIdEndpoint object.
+        """
+        child = SystemConnectwisehostedscreensIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ConnectWiseHostedScreen]:
+        """
+        Performs a GET request against the /system/connectWiseHostedScreens endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ConnectWiseHostedScreen]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ConnectWiseHostedScreen, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ConnectWiseHostedScreen]:
+        """
+        Performs a GET request against the /system/connectWiseHostedScreens endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ConnectWiseHostedScreen]: The parsed response data.
+        """
+        return self._parse_many(
+            ConnectWiseHostedScreen, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemConnectwisehostedscreensCountEndpoint:
+        """
+        The SystemConnectwisehostedscreensCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemConnectwisehostedscreensCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemConnectwisehostedsetupsCountEndpoint import (
+    SystemConnectwisehostedsetupsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemConnectwisehostedsetupsIdEndpoint import (
+    SystemConnectwisehostedsetupsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ConnectWiseHostedSetup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemConnectwisehostedsetupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ConnectWiseHostedSetup], ConnectWiseManageRequestParams],
+    IAsyncPostable[ConnectWiseHostedSetup, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ConnectWiseHostedSetup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "connectwisehostedsetups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ConnectWiseHostedSetup])
+        IAsyncPostable.__init__(self, ConnectWiseHostedSetup)
+        IAsyncPaginateable.__init__(self, ConnectWiseHostedSetup)
+
+    def id(self, _id: int) -> SystemConnectwisehostedsetupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemConnectwisehostedsetupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemConnectwisehostedsetupsIdEndpoint: The initialized SystemConnectwisehostedsetupsIdEndpoint object.
+        """
+        child = SystemConnectwisehostedsetupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ConnectWiseHostedSetup]:
+        """
+        Performs a GET request against the /system/connectwisehostedsetups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ConnectWiseHostedSetup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ConnectWiseHostedSetup, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ConnectWiseHostedSetup]:
+        """
+        Performs a GET request against the /system/connectwisehostedsetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ConnectWiseHostedSetup]: The parsed response data.
+        """
+        return self._parse_many(
+            ConnectWiseHostedSetup, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ConnectWiseHostedSetup:
+        """
+        Performs a POST request against the /system/connectwisehostedsetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ConnectWiseHostedSetup: The parsed response data.
+        """
+        return self._parse_one(
+            ConnectWiseHostedSetup, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemConnectwisehostedsetupsCountEndpoint:
+        """
+        The SystemConnectwisehostedsetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemConnectwisehostedsetupsCountEndpoint(self.client, parent_endpoint=self)
+        )
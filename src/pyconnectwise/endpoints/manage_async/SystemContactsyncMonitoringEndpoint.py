@@ -0,0 +1,110 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemContactsyncMonitoringCountEndpoint import (
+    SystemContactsyncMonitoringCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemContactsyncMonitoringIdEndpoint import (
+    SystemContactsyncMonitoringIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemContactsyncMonitoringNotificationtypeEndpoint import (
+    SystemContactsyncMonitoringNotificationtypeEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemContactsyncMonitoringTypeEndpoint import (
+    SystemContactsyncMonitoringTypeEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import M365ContactSyncMonitoring
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemContactsyncMonitoringEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[M365ContactSyncMonitoring], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[M365ContactSyncMonitoring, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "monitoring", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[M365ContactSyncMonitoring])
+        IAsyncPaginateable.__init__(self, M365ContactSyncMonitoring)
+
+    def id(self, _id: int) -> SystemContactsyncMonitoringIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemContactsyncMonitoringIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemContactsyncMonitoringIdEndpoint: The initialized SystemContactsyncMonitoringIdEndpoint object.
+        """
+        child = SystemContactsyncMonitoringIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[M365ContactSyncMonitoring]:
+        """
+        Performs a GET request against the /system/contactsync/monitoring endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[M365ContactSyncMonitoring]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), M365ContactSyncMonitoring, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[M365ContactSyncMonitoring]:
+        """
+        Performs a GET request against the /system/contactsync/monitoring endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[M365ContactSyncMonitoring]: The parsed response data.
+        """
+        return self._parse_many(
+            M365ContactSyncMonitoring, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemContactsyncMonitoringCountEndpoint:
+        """
+        The SystemContactsyncMonitoringCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemContactsyncMonitoringCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def notificationtype(self) -> SystemContactsyncMonitoringNotificationtypeEndpoint:
+        """
+        The SystemContactsyncMonitoringNotificationtypeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemContactsyncMonitoringNotificationtypeEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def type(self) -> SystemContactsyncMonitoringTypeEndpoint:
+        """
+        The SystemContactsyncMonitoringTypeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemContactsyncMonitoringTypeEndpoint(self.client, parent_endpoint=self))
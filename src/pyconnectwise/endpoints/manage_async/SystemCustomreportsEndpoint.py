@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemCustomreportsCountEndpoint import SystemCustomreportsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemCustomreportsIdEndpoint import SystemCustomreportsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CustomReport
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemCustomreportsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CustomReport], ConnectWiseManageRequestParams],
+    IAsyncPostable[CustomReport, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CustomReport, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "customReports", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CustomReport])
+        IAsyncPostable.__init__(self, CustomReport)
+        IAsyncPaginateable.__init__(self, CustomReport)
+
+    def id(self, _id: int) -> SystemCustomreportsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemCustomreportsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemCustomreportsIdEndpoint: The initialized SystemCustomreportsIdEndpoint object.
+        """
+        child = SystemCustomreportsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CustomReport]:
+        """
+        Performs a GET request against the /system/customReports endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CustomReport]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CustomReport, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CustomReport]:
+        """
+        Performs a GET request against the /system/customReports endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CustomReport]: The parsed response data.
+        """
+        return self._parse_many(CustomReport, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CustomReport:
+        """
+        Performs a POST request against the /system/customReports endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CustomReport: The parsed response data.
+        """
+        return self._parse_one(CustomReport, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemCustomreportsCountEndpoint:
+        """
+        The SystemCustomreportsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCustomreportsCountEndpoint(self.client, parent_endpoint=self))
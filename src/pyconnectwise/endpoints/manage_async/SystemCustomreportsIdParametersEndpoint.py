@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemCustomreportsIdParametersCountEndpoint import (
+    SystemCustomreportsIdParametersCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemCustomreportsIdParametersIdEndpoint import (
+    SystemCustomreportsIdParametersIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import CustomReportParameter
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemCustomreportsIdParametersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CustomReportParameter], ConnectWiseManageRequestParams],
+    IAsyncPostable[CustomReportParameter, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CustomReportParameter, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "parameters", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CustomReportParameter])
+        IAsyncPostable.__init__(self, CustomReportParameter)
+        IAsyncPaginateable.__init__(self, CustomReportParameter)
+
+    def id(self, _id: int) -> SystemCustomreportsIdParametersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemCustomreportsIdParametersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemCustomreportsIdParametersIdEndpoint: The initialized SystemCustomreportsIdParametersIdEndpoint object.
+        """
+        child = SystemCustomreportsIdParametersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CustomReportParameter]:
+        """
+        Performs a GET request against the /system/customReports/{id}/parameters endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CustomReportParameter]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CustomReportParameter, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CustomReportParameter]:
+        """
+        Performs a GET request against the /system/customReports/{id}/parameters endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CustomReportParameter]: The parsed response data.
+        """
+        return self._parse_many(
+            CustomReportParameter, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> CustomReportParameter:
+        """
+        Performs a POST request against the /system/customReports/{id}/parameters endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            CustomReportParameter: The parsed response data.
+        """
+        return self._parse_one(
+            CustomReportParameter, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemCustomreportsIdParametersCountEndpoint:
+        """
+        The SystemCustomreportsIdParametersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemCustomreportsIdParametersCountEndpoint(self.client, parent_endpoint=self)
+        )
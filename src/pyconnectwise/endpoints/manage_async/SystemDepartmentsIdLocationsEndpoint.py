@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemDepartmentsIdLocationsCountEndpoint import (
+    SystemDepartmentsIdLocationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemDepartmentsIdLocationsIdEndpoint import (
+    SystemDepartmentsIdLocationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import DepartmentLocation
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemDepartmentsIdLocationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[DepartmentLocation], ConnectWiseManageRequestParams],
+    IAsyncPostable[DepartmentLocation, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[DepartmentLocation, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "locations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[DepartmentLocation])
+        IAsyncPostable.__init__(self, DepartmentLocation)
+        IAsyncPaginateable.__init__(self, DepartmentLocation)
+
+    def id(self, _id: int) -> SystemDepartmentsIdLocationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemDepartmentsIdLocationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemDepartmentsIdLocationsIdEndpoint: The initialized SystemDepartmentsIdLocationsIdEndpoint object.
+        """
+        child = SystemDepartmentsIdLocationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[DepartmentLocation]:
+        """
+        Performs a GET request against the /system/departments/{id}/locations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[DepartmentLocation]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), DepartmentLocation, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[DepartmentLocation]:
+        """
+        Performs a GET request against the /system/departments/{id}/locations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[DepartmentLocation]: The parsed response data.
+        """
+        return self._parse_many(
+            DepartmentLocation, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> DepartmentLocation:
+        """
+        Performs a POST request against the /system/departments/{id}/locations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            DepartmentLocation: The parsed response data.
+        """
+        return self._parse_one(
+            DepartmentLocation, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemDepartmentsIdLocationsCountEndpoint:
+        """
+        The SystemDepartmentsIdLocationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemDepartmentsIdLocationsCountEndpoint(self.client, parent_endpoint=self)
+        )
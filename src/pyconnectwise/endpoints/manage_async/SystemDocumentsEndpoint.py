@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemDocumentsCountEndpoint import SystemDocumentsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemDocumentsIdEndpoint import SystemDocumentsIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemDocumentsUploadsampleEndpoint import SystemDocumentsUploadsampleEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import DocumentInfo
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemDocumentsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[DocumentInfo], ConnectWiseManageRequestParams],
+    IAsyncPostable[DocumentInfo, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[DocumentInfo, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "documents", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[DocumentInfo])
+        IAsyncPostable.__init__(self, DocumentInfo)
+        IAsyncPaginateable.__init__(self, DocumentInfo)
+
+    def id(self, _id: int) -> SystemDocumentsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemDocumentsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemDocumentsIdEndpoint: The initialized SystemDocumentsIdEndpoint object.
+        """
+        child = SystemDocumentsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[DocumentInfo]:
+        """
+        Performs a GET request against the /system/documents endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[DocumentInfo]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), DocumentInfo, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[DocumentInfo]:
+        """
+        Performs a GET request against the /system/documents endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[DocumentInfo]: The parsed response data.
+        """
+        return self._parse_many(DocumentInfo, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> DocumentInfo:
+        """
+        Performs a POST request against the /system/documents endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            DocumentInfo: The parsed response data.
+        """
+        return self._parse_one(DocumentInfo, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemDocumentsCountEndpoint:
+        """
+        The SystemDocumentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumentsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def uploadsample(self) -> SystemDocumentsUploadsampleEndpoint:
+        """
+        The SystemDocumentsUploadsampleEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumentsUploadsampleEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,20 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemDocumentsIdDownloadEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "download", parent_endpoint=parent_endpoint)
+
+    async def stream(self) -> "Response":
+        """
+        Performs a GET request against the /system/documents/{id}/download endpoint and returns the response object, supporting streaming.
+        The response must be closed with `await response.aclose()` once it has been read.
+        """
+        return await super()._make_request("GET", stream=True)
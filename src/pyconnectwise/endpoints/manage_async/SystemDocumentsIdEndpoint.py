@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemDocumentsIdDownloadEndpoint import SystemDocumentsIdDownloadEndpoint
+from pyconnectwise.endpoints.manage_async.SystemDocumentsIdThumbnailEndpoint import SystemDocumentsIdThumbnailEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import DocumentInfo
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemDocumentsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[DocumentInfo, ConnectWiseManageRequestParams],
+    IAsyncPostable[DocumentInfo, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[DocumentInfo, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, DocumentInfo)
+        IAsyncPostable.__init__(self, DocumentInfo)
+        IAsyncPaginateable.__init__(self, DocumentInfo)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[DocumentInfo]:
+        """
+        Performs a GET request against the /system/documents/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[DocumentInfo]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), DocumentInfo, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /system/documents/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> DocumentInfo:
+        """
+        Performs a GET request against the /system/documents/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            DocumentInfo: The parsed response data.
+        """
+        return self._parse_one(DocumentInfo, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> DocumentInfo:
+        """
+        Performs a POST request against the /system/documents/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            DocumentInfo: The parsed response data.
+        """
+        return self._parse_one(DocumentInfo, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def download(self) -> SystemDocumentsIdDownloadEndpoint:
+        """
+        The SystemDocumentsIdDownloadEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumentsIdDownloadEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def thumbnail(self) -> SystemDocumentsIdThumbnailEndpoint:
+        """
+        The SystemDocumentsIdThumbnailEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumentsIdThumbnailEndpoint(self.client, parent_endpoint=self))
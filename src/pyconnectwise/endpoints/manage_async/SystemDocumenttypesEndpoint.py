@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemDocumenttypesIdEndpoint import SystemDocumenttypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemDocumenttypesInfoEndpoint import SystemDocumenttypesInfoEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemDocumenttypesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "documentTypes", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> SystemDocumenttypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemDocumenttypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemDocumenttypesIdEndpoint: The initialized SystemDocumenttypesIdEndpoint object.
+        """
+        child = SystemDocumenttypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def info(self) -> SystemDocumenttypesInfoEndpoint:
+        """
+        The SystemDocumenttypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumenttypesInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEmailconnectorsCountEndpoint import SystemEmailconnectorsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEmailconnectorsIdEndpoint import SystemEmailconnectorsIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEmailconnectorsInfoEndpoint import SystemEmailconnectorsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import EmailConnector
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemEmailconnectorsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[EmailConnector], ConnectWiseManageRequestParams],
+    IAsyncPostable[EmailConnector, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[EmailConnector, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "emailConnectors", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[EmailConnector])
+        IAsyncPostable.__init__(self, EmailConnector)
+        IAsyncPaginateable.__init__(self, EmailConnector)
+
+    def id(self, _id: int) -> SystemEmailconnectorsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemEmailconnectorsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemEmailconnectorsIdEndpoint: The initialized SystemEmailconnectorsIdEndpoint object.
+        """
+        child = SystemEmailconnectorsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[EmailConnector]:
+        """
+        Performs a GET request against the /system/emailConnectors endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[EmailConnector]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), EmailConnector, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[EmailConnector]:
+        """
+        Performs a GET request against the /system/emailConnectors endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[EmailConnector]: The parsed response data.
+        """
+        return self._parse_many(EmailConnector, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> EmailConnector:
+        """
+        Performs a POST request against the /system/emailConnectors endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            EmailConnector: The parsed response data.
+        """
+        return self._parse_one(EmailConnector, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemEmailconnectorsCountEndpoint:
+        """
+        The SystemEmailconnectorsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailconnectorsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemEmailconnectorsInfoEndpoint:
+        """
+        The SystemEmailconnectorsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailconnectorsInfoEndpoint(self.client, parent_endpoint=self))
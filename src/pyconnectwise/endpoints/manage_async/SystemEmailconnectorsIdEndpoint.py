@@ -0,0 +1,120 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEmailconnectorsIdInfoEndpoint import SystemEmailconnectorsIdInfoEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEmailconnectorsIdParsingstylesEndpoint import (
+    SystemEmailconnectorsIdParsingstylesEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import EmailConnector
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemEmailconnectorsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[EmailConnector, ConnectWiseManageRequestParams],
+    IAsyncPatchable[EmailConnector, ConnectWiseManageRequestParams],
+    IAsyncPuttable[EmailConnector, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[EmailConnector, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, EmailConnector)
+        IAsyncPatchable.__init__(self, EmailConnector)
+        IAsyncPuttable.__init__(self, EmailConnector)
+        IAsyncPaginateable.__init__(self, EmailConnector)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[EmailConnector]:
+        """
+        Performs a GET request against the /system/emailConnectors/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[EmailConnector]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), EmailConnector, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /system/emailConnectors/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> EmailConnector:
+        """
+        Performs a GET request against the /system/emailConnectors/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            EmailConnector: The parsed response data.
+        """
+        return self._parse_one(EmailConnector, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> EmailConnector:
+        """
+        Performs a PATCH request against the /system/emailConnectors/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            EmailConnector: The parsed response data.
+        """
+        return self._parse_one(EmailConnector, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> EmailConnector:
+        """
+        Performs a PUT request against the /system/emailConnectors/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            EmailConnector: The parsed response data.
+        """
+        return self._parse_one(EmailConnector, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def info(self) -> SystemEmailconnectorsIdInfoEndpoint:
+        """
+        The SystemEmailconnectorsIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailconnectorsIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def parsing_styles(self) -> SystemEmailconnectorsIdParsingstylesEndpoint:
+        """
+        The SystemEmailconnectorsIdParsingstylesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemEmailconnectorsIdParsingstylesEndpoint(self.client, parent_endpoint=self)
+        )
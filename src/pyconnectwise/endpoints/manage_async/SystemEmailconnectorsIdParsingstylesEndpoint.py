@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEmailconnectorsIdParsingstylesCountEndpoint import (
+    SystemEmailconnectorsIdParsingstylesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemEmailconnectorsIdParsingstylesIdEndpoint import (
+    SystemEmailconnectorsIdParsingstylesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import EmailConnectorParsingStyle
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemEmailconnectorsIdParsingstylesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[EmailConnectorParsingStyle], ConnectWiseManageRequestParams],
+    IAsyncPostable[EmailConnectorParsingStyle, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[EmailConnectorParsingStyle, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "parsingStyles", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[EmailConnectorParsingStyle])
+        IAsyncPostable.__init__(self, EmailConnectorParsingStyle)
+        IAsyncPaginateable.__init__(self, EmailConnectorParsingStyle)
+
+    def id(self, _id: int) -> SystemEmailconnectorsIdParsingstylesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemEmailconnectorsIdParsingstylesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemEmailconnectorsIdParsingstylesIdEndpoint: The initialized SystemEmailconnectorsIdParsingstylesIdEndpoint object.
+        """
+        child = SystemEmailconnectorsIdParsingstylesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[EmailConnectorParsingStyle]:
+        """
+        Performs a GET request against the /system/emailConnectors/{id}/parsingStyles endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[EmailConnectorParsingStyle]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), EmailConnectorParsingStyle, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[EmailConnectorParsingStyle]:
+        """
+        Performs a GET request against the /system/emailConnectors/{id}/parsingStyles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[EmailConnectorParsingStyle]: The parsed response data.
+        """
+        return self._parse_many(
+            EmailConnectorParsingStyle, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> EmailConnectorParsingStyle:
+        """
+        Performs a POST request against the /system/emailConnectors/{id}/parsingStyles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            EmailConnectorParsingStyle: The parsed response data.
+        """
+        return self._parse_one(
+            EmailConnectorParsingStyle, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemEmailconnectorsIdParsingstylesCountEndpoint:
+        """
+        The SystemEmailconnectorsIdParsingstylesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemEmailconnectorsIdParsingstylesCountEndpoint(self.client, parent_endpoint=self)
+        )
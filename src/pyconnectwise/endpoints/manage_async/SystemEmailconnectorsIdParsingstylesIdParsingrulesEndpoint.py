@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint import (
+    SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint import (
+    SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import EmailConnectorParsingRule
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemEmailconnectorsIdParsingstylesIdParsingrulesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[EmailConnectorParsingRule], ConnectWiseManageRequestParams],
+    IAsyncPostable[EmailConnectorParsingRule, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[EmailConnectorParsingRule, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "parsingRules", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[EmailConnectorParsingRule])
+        IAsyncPostable.__init__(self, EmailConnectorParsingRule)
+        IAsyncPaginateable.__init__(self, EmailConnectorParsingRule)
+
+    def id(self, _id: int) -> SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint: The initialized SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint object.
+        """
+        child = SystemEmailconnectorsIdParsingstylesIdParsingrulesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[EmailConnectorParsingRule]:
+        """
+        Performs a GET request against the /system/emailConnectors/{id}/parsingStyles/{id}/parsingRules endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[EmailConnectorParsingRule]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), EmailConnectorParsingRule, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[EmailConnectorParsingRule]:
+        """
+        Performs a GET request against the /system/emailConnectors/{id}/parsingStyles/{id}/parsingRules endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[EmailConnectorParsingRule]: The parsed response data.
+        """
+        return self._parse_many(
+            EmailConnectorParsingRule, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> EmailConnectorParsingRule:
+        """
+        Performs a POST request against the /system/emailConnectors/{id}/parsingStyles/{id}/parsingRules endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            EmailConnectorParsingRule: The parsed response data.
+        """
+        return self._parse_one(
+            EmailConnectorParsingRule, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint:
+        """
+        The SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemEmailconnectorsIdParsingstylesIdParsingrulesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEmailtokensCountEndpoint import SystemEmailtokensCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEmailtokensIdEndpoint import SystemEmailtokensIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import EmailToken
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemEmailtokensEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[EmailToken], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[EmailToken, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "emailTokens", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[EmailToken])
+        IAsyncPaginateable.__init__(self, EmailToken)
+
+    def id(self, _id: int) -> SystemEmailtokensIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemEmailtokensIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemEmailtokensIdEndpoint: The initialized SystemEmailtokensIdEndpoint object.
+        """
+        child = SystemEmailtokensIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[EmailToken]:
+        """
+        Performs a GET request against the /system/emailTokens endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[EmailToken]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), EmailToken, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[EmailToken]:
+        """
+        Performs a GET request against the /system/emailTokens endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[EmailToken]: The parsed response data.
+        """
+        return self._parse_many(EmailToken, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemEmailtokensCountEndpoint:
+        """
+        The SystemEmailtokensCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailtokensCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,570 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAllowedfiletypesEndpoint import SystemAllowedfiletypesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAllowedoriginsEndpoint import SystemAllowedoriginsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemApimembersEndpoint import SystemApimembersEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAudittrailEndpoint import SystemAudittrailEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAuthanvilsEndpoint import SystemAuthanvilsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemAutosynctimeEndpoint import SystemAutosynctimeEndpoint
+from pyconnectwise.endpoints.manage_async.SystemBundlesEndpoint import SystemBundlesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemCallbacksEndpoint import SystemCallbacksEndpoint
+from pyconnectwise.endpoints.manage_async.SystemCertificationsEndpoint import SystemCertificationsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemConnectwisehostedscreensEndpoint import (
+    SystemConnectwisehostedscreensEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemConnectwisehostedsetupsEndpoint import (
+    SystemConnectwisehostedsetupsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemCustomreportsEndpoint import SystemCustomreportsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemCwtimezonesEndpoint import SystemCwtimezonesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemDepartmentsEndpoint import SystemDepartmentsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemDocumentsEndpoint import SystemDocumentsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEmailconnectorsEndpoint import SystemEmailconnectorsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEmailexclusionsEndpoint import SystemEmailexclusionsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEmailtokensEndpoint import SystemEmailtokensEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEpayconfigurationsEndpoint import SystemEpayconfigurationsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemExperimentsEndpoint import SystemExperimentsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemFileuploadsettingsEndpoint import SystemFileuploadsettingsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemGoogleemailsetupEndpoint import SystemGoogleemailsetupEndpoint
+from pyconnectwise.endpoints.manage_async.SystemImapsEndpoint import SystemImapsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemImportmassmaintenanceEndpoint import SystemImportmassmaintenanceEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInfoEndpoint import SystemInfoEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInoutboardsEndpoint import SystemInoutboardsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInouttypesEndpoint import SystemInouttypesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemIntegratorloginsEndpoint import SystemIntegratorloginsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemIntegratortagsEndpoint import SystemIntegratortagsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemKpicategoriesEndpoint import SystemKpicategoriesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemKpisEndpoint import SystemKpisEndpoint
+from pyconnectwise.endpoints.manage_async.SystemLdapconfigurationsEndpoint import SystemLdapconfigurationsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemLinksEndpoint import SystemLinksEndpoint
+from pyconnectwise.endpoints.manage_async.SystemLocationsEndpoint import SystemLocationsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemManagementnetworksecuritiesEndpoint import (
+    SystemManagementnetworksecuritiesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMarketplaceimportEndpoint import SystemMarketplaceimportEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersEndpoint import SystemMembersEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMenuentriesEndpoint import SystemMenuentriesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMyaccountEndpoint import SystemMyaccountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMycompanyEndpoint import SystemMycompanyEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMymembersEndpoint import SystemMymembersEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMysecurityEndpoint import SystemMysecurityEndpoint
+from pyconnectwise.endpoints.manage_async.SystemNotificationrecipientsEndpoint import (
+    SystemNotificationrecipientsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemOffice365Endpoint import SystemOffice365Endpoint
+from pyconnectwise.endpoints.manage_async.SystemOsgradeweightsEndpoint import SystemOsgradeweightsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemParsingtypesEndpoint import SystemParsingtypesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemParsingvariablesEndpoint import SystemParsingvariablesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemPortalreportsEndpoint import SystemPortalreportsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemQuotelinksetupEndpoint import SystemQuotelinksetupEndpoint
+from pyconnectwise.endpoints.manage_async.SystemReportcardsEndpoint import SystemReportcardsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemReportsEndpoint import SystemReportsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSecurityrolesEndpoint import SystemSecurityrolesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSettingsEndpoint import SystemSettingsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSetupscreensEndpoint import SystemSetupscreensEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSkillcategoriesEndpoint import SystemSkillcategoriesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSkillsEndpoint import SystemSkillsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSsoconfigurationsEndpoint import SystemSsoconfigurationsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSsousersEndpoint import SystemSsousersEndpoint
+from pyconnectwise.endpoints.manage_async.SystemStandardnotesEndpoint import SystemStandardnotesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSurveysEndpoint import SystemSurveysEndpoint
+from pyconnectwise.endpoints.manage_async.SystemTimezonesetupsEndpoint import SystemTimezonesetupsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemTodaypagecategoriesEndpoint import SystemTodaypagecategoriesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemUserdefinedfieldsEndpoint import SystemUserdefinedfieldsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowactionsEndpoint import SystemWorkflowactionsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsEndpoint import SystemWorkflowsEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "system", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def allowed_file_types(self) -> SystemAllowedfiletypesEndpoint:
+        """
+        The SystemAllowedfiletypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAllowedfiletypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def allowedfiletypes(self) -> SystemAllowedfiletypesEndpoint:
+        """
+        The SystemAllowedfiletypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAllowedfiletypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def allowedorigins(self) -> SystemAllowedoriginsEndpoint:
+        """
+        The SystemAllowedoriginsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAllowedoriginsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def api_members(self) -> SystemApimembersEndpoint:
+        """
+        The SystemApimembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemApimembersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def audittrail(self) -> SystemAudittrailEndpoint:
+        """
+        The SystemAudittrailEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAudittrailEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def auth_anvils(self) -> SystemAuthanvilsEndpoint:
+        """
+        The SystemAuthanvilsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAuthanvilsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def auto_sync_time(self) -> SystemAutosynctimeEndpoint:
+        """
+        The SystemAutosynctimeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemAutosynctimeEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def bundles(self) -> SystemBundlesEndpoint:
+        """
+        The SystemBundlesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemBundlesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def callbacks(self) -> SystemCallbacksEndpoint:
+        """
+        The SystemCallbacksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCallbacksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def certifications(self) -> SystemCertificationsEndpoint:
+        """
+        The SystemCertificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCertificationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def connect_wise_hosted_screens(self) -> SystemConnectwisehostedscreensEndpoint:
+        """
+        The SystemConnectwisehostedscreensEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemConnectwisehostedscreensEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def connectwisehostedsetups(self) -> SystemConnectwisehostedsetupsEndpoint:
+        """
+        The SystemConnectwisehostedsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemConnectwisehostedsetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def custom_reports(self) -> SystemCustomreportsEndpoint:
+        """
+        The SystemCustomreportsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCustomreportsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def cw_time_zones(self) -> SystemCwtimezonesEndpoint:
+        """
+        The SystemCwtimezonesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemCwtimezonesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def departments(self) -> SystemDepartmentsEndpoint:
+        """
+        The SystemDepartmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDepartmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def documents(self) -> SystemDocumentsEndpoint:
+        """
+        The SystemDocumentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemDocumentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def e_pay_configurations(self) -> SystemEpayconfigurationsEndpoint:
+        """
+        The SystemEpayconfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEpayconfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def email_connectors(self) -> SystemEmailconnectorsEndpoint:
+        """
+        The SystemEmailconnectorsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailconnectorsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def email_exclusions(self) -> SystemEmailexclusionsEndpoint:
+        """
+        The SystemEmailexclusionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailexclusionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def email_tokens(self) -> SystemEmailtokensEndpoint:
+        """
+        The SystemEmailtokensEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEmailtokensEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def experiments(self) -> SystemExperimentsEndpoint:
+        """
+        The SystemExperimentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemExperimentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def fileuploadsettings(self) -> SystemFileuploadsettingsEndpoint:
+        """
+        The SystemFileuploadsettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemFileuploadsettingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def googleemailsetup(self) -> SystemGoogleemailsetupEndpoint:
+        """
+        The SystemGoogleemailsetupEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemGoogleemailsetupEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def imaps(self) -> SystemImapsEndpoint:
+        """
+        The SystemImapsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemImapsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def import_mass_maintenance(self) -> SystemImportmassmaintenanceEndpoint:
+        """
+        The SystemImportmassmaintenanceEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemImportmassmaintenanceEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def in_out_boards(self) -> SystemInoutboardsEndpoint:
+        """
+        The SystemInoutboardsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInoutboardsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def in_out_types(self) -> SystemInouttypesEndpoint:
+        """
+        The SystemInouttypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInouttypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemInfoEndpoint:
+        """
+        The SystemInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def integrator_tags(self) -> SystemIntegratortagsEndpoint:
+        """
+        The SystemIntegratortagsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemIntegratortagsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def integratorlogins(self) -> SystemIntegratorloginsEndpoint:
+        """
+        The SystemIntegratorloginsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemIntegratorloginsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def kpi_categories(self) -> SystemKpicategoriesEndpoint:
+        """
+        The SystemKpicategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemKpicategoriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def kpis(self) -> SystemKpisEndpoint:
+        """
+        The SystemKpisEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemKpisEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ldap_configurations(self) -> SystemLdapconfigurationsEndpoint:
+        """
+        The SystemLdapconfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLdapconfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def links(self) -> SystemLinksEndpoint:
+        """
+        The SystemLinksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLinksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def locations(self) -> SystemLocationsEndpoint:
+        """
+        The SystemLocationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLocationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def management_network_securities(self) -> SystemManagementnetworksecuritiesEndpoint:
+        """
+        The SystemManagementnetworksecuritiesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemManagementnetworksecuritiesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def marketplaceimport(self) -> SystemMarketplaceimportEndpoint:
+        """
+        The SystemMarketplaceimportEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMarketplaceimportEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def members(self) -> SystemMembersEndpoint:
+        """
+        The SystemMembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def menu_entries(self) -> SystemMenuentriesEndpoint:
+        """
+        The SystemMenuentriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMenuentriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def menuentries(self) -> SystemMenuentriesEndpoint:
+        """
+        The SystemMenuentriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMenuentriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def my_account(self) -> SystemMyaccountEndpoint:
+        """
+        The SystemMyaccountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMyaccountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def my_company(self) -> SystemMycompanyEndpoint:
+        """
+        The SystemMycompanyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def my_members(self) -> SystemMymembersEndpoint:
+        """
+        The SystemMymembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMymembersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def my_security(self) -> SystemMysecurityEndpoint:
+        """
+        The SystemMysecurityEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMysecurityEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def mycompany(self) -> SystemMycompanyEndpoint:
+        """
+        The SystemMycompanyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notification_recipients(self) -> SystemNotificationrecipientsEndpoint:
+        """
+        The SystemNotificationrecipientsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemNotificationrecipientsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def office365(self) -> SystemOffice365Endpoint:
+        """
+        The SystemOffice365Endpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemOffice365Endpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def osgradeweights(self) -> SystemOsgradeweightsEndpoint:
+        """
+        The SystemOsgradeweightsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemOsgradeweightsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def parsing_types(self) -> SystemParsingtypesEndpoint:
+        """
+        The SystemParsingtypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemParsingtypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def parsing_variables(self) -> SystemParsingvariablesEndpoint:
+        """
+        The SystemParsingvariablesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemParsingvariablesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def portal_reports(self) -> SystemPortalreportsEndpoint:
+        """
+        The SystemPortalreportsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemPortalreportsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def quote_link_setup(self) -> SystemQuotelinksetupEndpoint:
+        """
+        The SystemQuotelinksetupEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemQuotelinksetupEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def report_cards(self) -> SystemReportcardsEndpoint:
+        """
+        The SystemReportcardsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportcardsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reports(self) -> SystemReportsEndpoint:
+        """
+        The SystemReportsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def security_roles(self) -> SystemSecurityrolesEndpoint:
+        """
+        The SystemSecurityrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSecurityrolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def securityroles(self) -> SystemSecurityrolesEndpoint:
+        """
+        The SystemSecurityrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSecurityrolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def settings(self) -> SystemSettingsEndpoint:
+        """
+        The SystemSettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSettingsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def setup_screens(self) -> SystemSetupscreensEndpoint:
+        """
+        The SystemSetupscreensEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSetupscreensEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def skill_categories(self) -> SystemSkillcategoriesEndpoint:
+        """
+        The SystemSkillcategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSkillcategoriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def skills(self) -> SystemSkillsEndpoint:
+        """
+        The SystemSkillsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSkillsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sso_configurations(self) -> SystemSsoconfigurationsEndpoint:
+        """
+        The SystemSsoconfigurationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSsoconfigurationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sso_users(self) -> SystemSsousersEndpoint:
+        """
+        The SystemSsousersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSsousersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def standard_notes(self) -> SystemStandardnotesEndpoint:
+        """
+        The SystemStandardnotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemStandardnotesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def surveys(self) -> SystemSurveysEndpoint:
+        """
+        The SystemSurveysEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSurveysEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def time_zone_setups(self) -> SystemTimezonesetupsEndpoint:
+        """
+        The SystemTimezonesetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemTimezonesetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def today_page_categories(self) -> SystemTodaypagecategoriesEndpoint:
+        """
+        The SystemTodaypagecategoriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemTodaypagecategoriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def user_defined_fields(self) -> SystemUserdefinedfieldsEndpoint:
+        """
+        The SystemUserdefinedfieldsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemUserdefinedfieldsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def workflow_actions(self) -> SystemWorkflowactionsEndpoint:
+        """
+        The SystemWorkflowactionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowactionsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def workflows(self) -> SystemWorkflowsEndpoint:
+        """
+        The SystemWorkflowsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemEpayconfigurationsCountEndpoint import (
+    SystemEpayconfigurationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemEpayconfigurationsIdEndpoint import SystemEpayconfigurationsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import EPayConfiguration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemEpayconfigurationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[EPayConfiguration], ConnectWiseManageRequestParams],
+    IAsyncPostable[EPayConfiguration, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[EPayConfiguration, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "ePayConfigurations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[EPayConfiguration])
+        IAsyncPostable.__init__(self, EPayConfiguration)
+        IAsyncPaginateable.__init__(self, EPayConfiguration)
+
+    def id(self, _id: int) -> SystemEpayconfigurationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemEpayconfigurationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemEpayconfigurationsIdEndpoint: The initialized SystemEpayconfigurationsIdEndpoint object.
+        """
+        child = SystemEpayconfigurationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[EPayConfiguration]:
+        """
+        Performs a GET request against the /system/ePayConfigurations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[EPayConfiguration]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), EPayConfiguration, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[EPayConfiguration]:
+        """
+        Performs a GET request against the /system/ePayConfigurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[EPayConfiguration]: The parsed response data.
+        """
+        return self._parse_many(
+            EPayConfiguration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> EPayConfiguration:
+        """
+        Performs a POST request against the /system/ePayConfigurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            EPayConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            EPayConfiguration, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemEpayconfigurationsCountEndpoint:
+        """
+        The SystemEpayconfigurationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemEpayconfigurationsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemExperimentsCountEndpoint import SystemExperimentsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemExperimentsIdEndpoint import SystemExperimentsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import Experiment
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemExperimentsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Experiment], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Experiment, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "experiments", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Experiment])
+        IAsyncPaginateable.__init__(self, Experiment)
+
+    def id(self, _id: int) -> SystemExperimentsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemExperimentsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemExperimentsIdEndpoint: The initialized SystemExperimentsIdEndpoint object.
+        """
+        child = SystemExperimentsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Experiment]:
+        """
+        Performs a GET request against the /system/experiments endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Experiment]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Experiment, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Experiment]:
+        """
+        Performs a GET request against the /system/experiments endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Experiment]: The parsed response data.
+        """
+        return self._parse_many(Experiment, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemExperimentsCountEndpoint:
+        """
+        The SystemExperimentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemExperimentsCountEndpoint(self.client, parent_endpoint=self))
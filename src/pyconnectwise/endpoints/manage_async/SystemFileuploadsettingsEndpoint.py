@@ -0,0 +1,36 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemFileuploadsettingsCountEndpoint import (
+    SystemFileuploadsettingsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemFileuploadsettingsIdEndpoint import SystemFileuploadsettingsIdEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemFileuploadsettingsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "fileuploadsettings", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> SystemFileuploadsettingsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemFileuploadsettingsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemFileuploadsettingsIdEndpoint: The initialized SystemFileuploadsettingsIdEndpoint object.
+        """
+        child = SystemFileuploadsettingsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def count(self) -> SystemFileuploadsettingsCountEndpoint:
+        """
+        The SystemFileuploadsettingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemFileuploadsettingsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemGoogleemailsetupCountEndpoint import SystemGoogleemailsetupCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemGoogleemailsetupIdEndpoint import SystemGoogleemailsetupIdEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemGoogleemailsetupEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "googleemailsetup", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> SystemGoogleemailsetupIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemGoogleemailsetupIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemGoogleemailsetupIdEndpoint: The initialized SystemGoogleemailsetupIdEndpoint object.
+        """
+        child = SystemGoogleemailsetupIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def count(self) -> SystemGoogleemailsetupCountEndpoint:
+        """
+        The SystemGoogleemailsetupCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemGoogleemailsetupCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemImapsCountEndpoint import SystemImapsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemImapsIdEndpoint import SystemImapsIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemImapsInfoEndpoint import SystemImapsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Imap
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemImapsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Imap], ConnectWiseManageRequestParams],
+    IAsyncPostable[Imap, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Imap, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "imaps", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Imap])
+        IAsyncPostable.__init__(self, Imap)
+        IAsyncPaginateable.__init__(self, Imap)
+
+    def id(self, _id: int) -> SystemImapsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemImapsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemImapsIdEndpoint: The initialized SystemImapsIdEndpoint object.
+        """
+        child = SystemImapsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Imap]:
+        """
+        Performs a GET request against the /system/imaps endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Imap]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Imap, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Imap]:
+        """
+        Performs a GET request against the /system/imaps endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Imap]: The parsed response data.
+        """
+        return self._parse_many(Imap, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Imap:
+        """
+        Performs a POST request against the /system/imaps endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Imap: The parsed response data.
+        """
+        return self._parse_one(Imap, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemImapsCountEndpoint:
+        """
+        The SystemImapsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemImapsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemImapsInfoEndpoint:
+        """
+        The SystemImapsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemImapsInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,88 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInfoDepartmentlocationsCountEndpoint import (
+    SystemInfoDepartmentlocationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemInfoDepartmentlocationsIdEndpoint import (
+    SystemInfoDepartmentlocationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import DepartmentLocationInfo
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemInfoDepartmentlocationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[DepartmentLocationInfo], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[DepartmentLocationInfo, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "departmentlocations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[DepartmentLocationInfo])
+        IAsyncPaginateable.__init__(self, DepartmentLocationInfo)
+
+    def id(self, _id: int) -> SystemInfoDepartmentlocationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemInfoDepartmentlocationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemInfoDepartmentlocationsIdEndpoint: The initialized SystemInfoDepartmentlocationsIdEndpoint object.
+        """
+        child = SystemInfoDepartmentlocationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[DepartmentLocationInfo]:
+        """
+        Performs a GET request against the /system/info/departmentlocations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[DepartmentLocationInfo]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), DepartmentLocationInfo, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[DepartmentLocationInfo]:
+        """
+        Performs a GET request against the /system/info/departmentlocations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[DepartmentLocationInfo]: The parsed response data.
+        """
+        return self._parse_many(
+            DepartmentLocationInfo, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemInfoDepartmentlocationsCountEndpoint:
+        """
+        The SystemInfoDepartmentlocationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemInfoDepartmentlocationsCountEndpoint(self.client, parent_endpoint=self)
+        )
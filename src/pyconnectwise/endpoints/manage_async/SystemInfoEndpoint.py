@@ -0,0 +1,122 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInfoDepartmentlocationsEndpoint import (
+    SystemInfoDepartmentlocationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemInfoDepartmentsEndpoint import SystemInfoDepartmentsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInfoLinksEndpoint import SystemInfoLinksEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInfoLocalesEndpoint import SystemInfoLocalesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInfoLocationsEndpoint import SystemInfoLocationsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInfoMembersEndpoint import SystemInfoMembersEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInfoPersonasEndpoint import SystemInfoPersonasEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInfoStandardnotesEndpoint import SystemInfoStandardnotesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import Info
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemInfoEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Info, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Info, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "info", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Info)
+        IAsyncPaginateable.__init__(self, Info)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Info]:
+        """
+        Performs a GET request against the /system/info endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Info]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Info, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Info:
+        """
+        Performs a GET request against the /system/info endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Info: The parsed response data.
+        """
+        return self._parse_one(Info, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def departmentlocations(self) -> SystemInfoDepartmentlocationsEndpoint:
+        """
+        The SystemInfoDepartmentlocationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoDepartmentlocationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def departments(self) -> SystemInfoDepartmentsEndpoint:
+        """
+        The SystemInfoDepartmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoDepartmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def links(self) -> SystemInfoLinksEndpoint:
+        """
+        The SystemInfoLinksEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoLinksEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def locales(self) -> SystemInfoLocalesEndpoint:
+        """
+        The SystemInfoLocalesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoLocalesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def locations(self) -> SystemInfoLocationsEndpoint:
+        """
+        The SystemInfoLocationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoLocationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def members(self) -> SystemInfoMembersEndpoint:
+        """
+        The SystemInfoMembersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoMembersEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def personas(self) -> SystemInfoPersonasEndpoint:
+        """
+        The SystemInfoPersonasEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoPersonasEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def standard_notes(self) -> SystemInfoStandardnotesEndpoint:
+        """
+        The SystemInfoStandardnotesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoStandardnotesEndpoint(self.client, parent_endpoint=self))
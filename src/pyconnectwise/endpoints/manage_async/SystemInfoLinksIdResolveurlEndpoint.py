@@ -0,0 +1,33 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.manage import LinkResolveUrlInfo
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemInfoLinksIdResolveurlEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPostable[LinkResolveUrlInfo, ConnectWiseManageRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "resolveurl", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, LinkResolveUrlInfo)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> LinkResolveUrlInfo:
+        """
+        Performs a POST request against the /system/info/links/{id}/resolveurl endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LinkResolveUrlInfo: The parsed response data.
+        """
+        return self._parse_one(
+            LinkResolveUrlInfo, (await super()._make_request("POST", data=data, params=params)).content
+        )
@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInfoMembersCountEndpoint import SystemInfoMembersCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInfoMembersIdEndpoint import SystemInfoMembersIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import MemberInfo
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemInfoMembersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MemberInfo], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MemberInfo, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "members", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MemberInfo])
+        IAsyncPaginateable.__init__(self, MemberInfo)
+
+    def id(self, _id: int) -> SystemInfoMembersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemInfoMembersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemInfoMembersIdEndpoint: The initialized SystemInfoMembersIdEndpoint object.
+        """
+        child = SystemInfoMembersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MemberInfo]:
+        """
+        Performs a GET request against the /system/info/members endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MemberInfo]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MemberInfo, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MemberInfo]:
+        """
+        Performs a GET request against the /system/info/members endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MemberInfo]: The parsed response data.
+        """
+        return self._parse_many(MemberInfo, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemInfoMembersCountEndpoint:
+        """
+        The SystemInfoMembersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInfoMembersCountEndpoint(self.client, parent_endpoint=self))
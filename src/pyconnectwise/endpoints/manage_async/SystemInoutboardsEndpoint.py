@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInoutboardsCountEndpoint import SystemInoutboardsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInoutboardsIdEndpoint import SystemInoutboardsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import InOutBoard
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemInoutboardsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[InOutBoard], ConnectWiseManageRequestParams],
+    IAsyncPostable[InOutBoard, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[InOutBoard, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "inOutBoards", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[InOutBoard])
+        IAsyncPostable.__init__(self, InOutBoard)
+        IAsyncPaginateable.__init__(self, InOutBoard)
+
+    def id(self, _id: int) -> SystemInoutboardsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemInoutboardsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemInoutboardsIdEndpoint: The initialized SystemInoutboardsIdEndpoint object.
+        """
+        child = SystemInoutboardsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[InOutBoard]:
+        """
+        Performs a GET request against the /system/inOutBoards endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[InOutBoard]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), InOutBoard, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[InOutBoard]:
+        """
+        Performs a GET request against the /system/inOutBoards endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[InOutBoard]: The parsed response data.
+        """
+        return self._parse_many(InOutBoard, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> InOutBoard:
+        """
+        Performs a POST request against the /system/inOutBoards endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            InOutBoard: The parsed response data.
+        """
+        return self._parse_one(InOutBoard, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemInoutboardsCountEndpoint:
+        """
+        The SystemInoutboardsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInoutboardsCountEndpoint(self.client, parent_endpoint=self))
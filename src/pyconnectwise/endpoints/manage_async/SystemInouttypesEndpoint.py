@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInouttypesCountEndpoint import SystemInouttypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInouttypesIdEndpoint import SystemInouttypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemInouttypesInfoEndpoint import SystemInouttypesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import InOutType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemInouttypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[InOutType], ConnectWiseManageRequestParams],
+    IAsyncPostable[InOutType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[InOutType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "inOutTypes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[InOutType])
+        IAsyncPostable.__init__(self, InOutType)
+        IAsyncPaginateable.__init__(self, InOutType)
+
+    def id(self, _id: int) -> SystemInouttypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemInouttypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemInouttypesIdEndpoint: The initialized SystemInouttypesIdEndpoint object.
+        """
+        child = SystemInouttypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[InOutType]:
+        """
+        Performs a GET request against the /system/inOutTypes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[InOutType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), InOutType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[InOutType]:
+        """
+        Performs a GET request against the /system/inOutTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[InOutType]: The parsed response data.
+        """
+        return self._parse_many(InOutType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> InOutType:
+        """
+        Performs a POST request against the /system/inOutTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            InOutType: The parsed response data.
+        """
+        return self._parse_one(InOutType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemInouttypesCountEndpoint:
+        """
+        The SystemInouttypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInouttypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemInouttypesInfoEndpoint:
+        """
+        The SystemInouttypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemInouttypesInfoEndpoint(self.client, parent_endpoint=self))
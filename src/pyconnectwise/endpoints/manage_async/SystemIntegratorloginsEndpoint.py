@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemIntegratorloginsCountEndpoint import SystemIntegratorloginsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemIntegratorloginsIdEndpoint import SystemIntegratorloginsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import IntegratorLogin
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemIntegratorloginsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[IntegratorLogin], ConnectWiseManageRequestParams],
+    IAsyncPostable[IntegratorLogin, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[IntegratorLogin, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "integratorlogins", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[IntegratorLogin])
+        IAsyncPostable.__init__(self, IntegratorLogin)
+        IAsyncPaginateable.__init__(self, IntegratorLogin)
+
+    def id(self, _id: int) -> SystemIntegratorloginsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemIntegratorloginsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemIntegratorloginsIdEndpoint: The initialized SystemIntegratorloginsIdEndpoint object.
+        """
+        child = SystemIntegratorloginsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[IntegratorLogin]:
+        """
+        Performs a GET request against the /system/integratorlogins endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[IntegratorLogin]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), IntegratorLogin, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[IntegratorLogin]:
+        """
+        Performs a GET request against the /system/integratorlogins endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[IntegratorLogin]: The parsed response data.
+        """
+        return self._parse_many(IntegratorLogin, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> IntegratorLogin:
+        """
+        Performs a POST request against the /system/integratorlogins endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            IntegratorLogin: The parsed response data.
+        """
+        return self._parse_one(IntegratorLogin, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemIntegratorloginsCountEndpoint:
+        """
+        The SystemIntegratorloginsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemIntegratorloginsCountEndpoint(self.client, parent_endpoint=self))
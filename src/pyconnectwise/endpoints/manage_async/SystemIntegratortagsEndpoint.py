@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemIntegratortagsCountEndpoint import SystemIntegratortagsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemIntegratortagsIdEndpoint import SystemIntegratortagsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import IntegratorTag
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemIntegratortagsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[IntegratorTag], ConnectWiseManageRequestParams],
+    IAsyncPostable[IntegratorTag, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[IntegratorTag, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "integratorTags", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[IntegratorTag])
+        IAsyncPostable.__init__(self, IntegratorTag)
+        IAsyncPaginateable.__init__(self, IntegratorTag)
+
+    def id(self, _id: int) -> SystemIntegratortagsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemIntegratortagsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemIntegratortagsIdEndpoint: The initialized SystemIntegratortagsIdEndpoint object.
+        """
+        child = SystemIntegratortagsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[IntegratorTag]:
+        """
+        Performs a GET request against the /system/integratorTags endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[IntegratorTag]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), IntegratorTag, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[IntegratorTag]:
+        """
+        Performs a GET request against the /system/integratorTags endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[IntegratorTag]: The parsed response data.
+        """
+        return self._parse_many(IntegratorTag, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> IntegratorTag:
+        """
+        Performs a POST request against the /system/integratorTags endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            IntegratorTag: The parsed response data.
+        """
+        return self._parse_one(IntegratorTag, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemIntegratortagsCountEndpoint:
+        """
+        The SystemIntegratortagsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemIntegratortagsCountEndpoint(self.client, parent_endpoint=self))
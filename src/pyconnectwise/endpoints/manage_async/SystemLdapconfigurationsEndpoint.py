@@ -0,0 +1,124 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemLdapconfigurationsCountEndpoint import (
+    SystemLdapconfigurationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemLdapconfigurationsIdEndpoint import SystemLdapconfigurationsIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemLdapconfigurationsInfoEndpoint import (
+    SystemLdapconfigurationsInfoEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemLdapconfigurationsTestlinkEndpoint import (
+    SystemLdapconfigurationsTestlinkEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import LdapConfiguration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemLdapconfigurationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LdapConfiguration], ConnectWiseManageRequestParams],
+    IAsyncPostable[LdapConfiguration, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[LdapConfiguration, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "ldapConfigurations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LdapConfiguration])
+        IAsyncPostable.__init__(self, LdapConfiguration)
+        IAsyncPaginateable.__init__(self, LdapConfiguration)
+
+    def id(self, _id: int) -> SystemLdapconfigurationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemLdapconfigurationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemLdapconfigurationsIdEndpoint: The initialized SystemLdapconfigurationsIdEndpoint object.
+        """
+        child = SystemLdapconfigurationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LdapConfiguration]:
+        """
+        Performs a GET request against the /system/ldapConfigurations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LdapConfiguration]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LdapConfiguration, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[LdapConfiguration]:
+        """
+        Performs a GET request against the /system/ldapConfigurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LdapConfiguration]: The parsed response data.
+        """
+        return self._parse_many(
+            LdapConfiguration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> LdapConfiguration:
+        """
+        Performs a POST request against the /system/ldapConfigurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            LdapConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            LdapConfiguration, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemLdapconfigurationsCountEndpoint:
+        """
+        The SystemLdapconfigurationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLdapconfigurationsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemLdapconfigurationsInfoEndpoint:
+        """
+        The SystemLdapconfigurationsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLdapconfigurationsInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def test_link(self) -> SystemLdapconfigurationsTestlinkEndpoint:
+        """
+        The SystemLdapconfigurationsTestlinkEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemLdapconfigurationsTestlinkEndpoint(self.client, parent_endpoint=self)
+        )
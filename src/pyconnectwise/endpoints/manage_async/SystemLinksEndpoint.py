@@ -0,0 +1,92 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemLinksCountEndpoint import SystemLinksCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemLinksIdEndpoint import SystemLinksIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Link
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemLinksEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Link], ConnectWiseManageRequestParams],
+    IAsyncPostable[Link, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Link, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "links", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Link])
+        IAsyncPostable.__init__(self, Link)
+        IAsyncPaginateable.__init__(self, Link)
+
+    def id(self, _id: int) -> SystemLinksIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemLinksIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemLinksIdEndpoint: The initialized SystemLinksIdEndpoint object.
+        """
+        child = SystemLinksIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Link]:
+        """
+        Performs a GET request against the /system/links endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Link]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Link, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Link]:
+        """
+        Performs a GET request against the /system/links endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Link]: The parsed response data.
+        """
+        return self._parse_many(Link, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Link:
+        """
+        Performs a POST request against the /system/links endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Link: The parsed response data.
+        """
+        return self._parse_one(Link, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemLinksCountEndpoint:
+        """
+        The SystemLinksCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLinksCountEndpoint(self.client, parent_endpoint=self))
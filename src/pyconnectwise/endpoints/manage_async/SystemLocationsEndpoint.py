@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemLocationsCountEndpoint import SystemLocationsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemLocationsIdEndpoint import SystemLocationsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Location
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemLocationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Location], ConnectWiseManageRequestParams],
+    IAsyncPostable[Location, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Location, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "locations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Location])
+        IAsyncPostable.__init__(self, Location)
+        IAsyncPaginateable.__init__(self, Location)
+
+    def id(self, _id: int) -> SystemLocationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemLocationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemLocationsIdEndpoint: The initialized SystemLocationsIdEndpoint object.
+        """
+        child = SystemLocationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Location]:
+        """
+        Performs a GET request against the /system/locations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Location]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Location, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Location]:
+        """
+        Performs a GET request against the /system/locations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Location]: The parsed response data.
+        """
+        return self._parse_many(Location, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Location:
+        """
+        Performs a POST request against the /system/locations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Location: The parsed response data.
+        """
+        return self._parse_one(Location, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemLocationsCountEndpoint:
+        """
+        The SystemLocationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLocationsCountEndpoint(self.client, parent_endpoint=self))
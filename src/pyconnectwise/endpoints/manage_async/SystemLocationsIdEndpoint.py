@@ -0,0 +1,120 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemLocationsIdDepartmentsEndpoint import (
+    SystemLocationsIdDepartmentsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemLocationsIdUsagesEndpoint import SystemLocationsIdUsagesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemLocationsIdWorkrolesEndpoint import SystemLocationsIdWorkrolesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Location
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemLocationsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Location, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Location, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Location, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Location, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Location)
+        IAsyncPatchable.__init__(self, Location)
+        IAsyncPuttable.__init__(self, Location)
+        IAsyncPaginateable.__init__(self, Location)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Location]:
+        """
+        Performs a GET request against the /system/locations/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Location]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Location, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /system/locations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Location:
+        """
+        Performs a GET request against the /system/locations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Location: The parsed response data.
+        """
+        return self._parse_one(Location, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Location:
+        """
+        Performs a PATCH request against the /system/locations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Location: The parsed response data.
+        """
+        return self._parse_one(Location, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Location:
+        """
+        Performs a PUT request against the /system/locations/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Location: The parsed response data.
+        """
+        return self._parse_one(Location, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def departments(self) -> SystemLocationsIdDepartmentsEndpoint:
+        """
+        The SystemLocationsIdDepartmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLocationsIdDepartmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> SystemLocationsIdUsagesEndpoint:
+        """
+        The SystemLocationsIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLocationsIdUsagesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def work_roles(self) -> SystemLocationsIdWorkrolesEndpoint:
+        """
+        The SystemLocationsIdWorkrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLocationsIdWorkrolesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,86 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemLocationsIdWorkrolesCountEndpoint import (
+    SystemLocationsIdWorkrolesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemLocationsIdWorkrolesIdEndpoint import (
+    SystemLocationsIdWorkrolesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import LocationWorkRole
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemLocationsIdWorkrolesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[LocationWorkRole], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[LocationWorkRole, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "workRoles", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[LocationWorkRole])
+        IAsyncPaginateable.__init__(self, LocationWorkRole)
+
+    def id(self, _id: int) -> SystemLocationsIdWorkrolesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemLocationsIdWorkrolesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemLocationsIdWorkrolesIdEndpoint: The initialized SystemLocationsIdWorkrolesIdEndpoint object.
+        """
+        child = SystemLocationsIdWorkrolesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[LocationWorkRole]:
+        """
+        Performs a GET request against the /system/locations/{id}/workRoles endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[LocationWorkRole]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), LocationWorkRole, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[LocationWorkRole]:
+        """
+        Performs a GET request against the /system/locations/{id}/workRoles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[LocationWorkRole]: The parsed response data.
+        """
+        return self._parse_many(
+            LocationWorkRole, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemLocationsIdWorkrolesCountEndpoint:
+        """
+        The SystemLocationsIdWorkrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemLocationsIdWorkrolesCountEndpoint(self.client, parent_endpoint=self))
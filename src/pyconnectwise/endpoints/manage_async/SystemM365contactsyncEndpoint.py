@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemM365contactsyncAuthorizeEndpoint import (
+    SystemM365contactsyncAuthorizeEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemM365contactsyncCheckvalidsyncEndpoint import (
+    SystemM365contactsyncCheckvalidsyncEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemM365contactsyncIdEndpoint import SystemM365contactsyncIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemM365contactsyncInfoEndpoint import SystemM365contactsyncInfoEndpoint
+from pyconnectwise.endpoints.manage_async.SystemM365contactsyncNotifydeactivationEndpoint import (
+    SystemM365contactsyncNotifydeactivationEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemM365contactsyncNotifyerrorEndpoint import (
+    SystemM365contactsyncNotifyerrorEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemM365contactsyncEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "m365contactsync", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> SystemM365contactsyncIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemM365contactsyncIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemM365contactsyncIdEndpoint: The initialized SystemM365contactsyncIdEndpoint object.
+        """
+        child = SystemM365contactsyncIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def authorize(self) -> SystemM365contactsyncAuthorizeEndpoint:
+        """
+        The SystemM365contactsyncAuthorizeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemM365contactsyncAuthorizeEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def checkvalidsync(self) -> SystemM365contactsyncCheckvalidsyncEndpoint:
+        """
+        The SystemM365contactsyncCheckvalidsyncEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemM365contactsyncCheckvalidsyncEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> SystemM365contactsyncInfoEndpoint:
+        """
+        The SystemM365contactsyncInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemM365contactsyncInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notifydeactivation(self) -> SystemM365contactsyncNotifydeactivationEndpoint:
+        """
+        The SystemM365contactsyncNotifydeactivationEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemM365contactsyncNotifydeactivationEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def notifyerror(self) -> SystemM365contactsyncNotifyerrorEndpoint:
+        """
+        The SystemM365contactsyncNotifyerrorEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemM365contactsyncNotifyerrorEndpoint(self.client, parent_endpoint=self)
+        )
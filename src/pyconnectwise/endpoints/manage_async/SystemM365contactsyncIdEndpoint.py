@@ -0,0 +1,38 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemM365contactsyncIdInfoEndpoint import SystemM365contactsyncIdInfoEndpoint
+from pyconnectwise.endpoints.manage_async.SystemM365contactsyncIdTestEndpoint import SystemM365contactsyncIdTestEndpoint
+from pyconnectwise.endpoints.manage_async.SystemM365contactsyncIdViewauthEndpoint import (
+    SystemM365contactsyncIdViewauthEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemM365contactsyncIdEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def info(self) -> SystemM365contactsyncIdInfoEndpoint:
+        """
+        The SystemM365contactsyncIdInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemM365contactsyncIdInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def test(self) -> SystemM365contactsyncIdTestEndpoint:
+        """
+        The SystemM365contactsyncIdTestEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemM365contactsyncIdTestEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def viewauth(self) -> SystemM365contactsyncIdViewauthEndpoint:
+        """
+        The SystemM365contactsyncIdViewauthEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemM365contactsyncIdViewauthEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemManagementnetworksecuritiesCountEndpoint import (
+    SystemManagementnetworksecuritiesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemManagementnetworksecuritiesIdEndpoint import (
+    SystemManagementnetworksecuritiesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ManagementNetworkSecurity
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemManagementnetworksecuritiesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ManagementNetworkSecurity], ConnectWiseManageRequestParams],
+    IAsyncPostable[ManagementNetworkSecurity, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ManagementNetworkSecurity, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "managementNetworkSecurities", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ManagementNetworkSecurity])
+        IAsyncPostable.__init__(self, ManagementNetworkSecurity)
+        IAsyncPaginateable.__init__(self, ManagementNetworkSecurity)
+
+    def id(self, _id: int) -> SystemManagementnetworksecuritiesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemManagementnetworksecuritiesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemManagementnetworksecuritiesIdEndpoint: The initialized SystemManagementnetworksecuritiesIdEndpoint object.
+        """
+        child = SystemManagementnetworksecuritiesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ManagementNetworkSecurity]:
+        """
+        Performs a GET request against the /system/managementNetworkSecurities endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ManagementNetworkSecurity]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ManagementNetworkSecurity, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ManagementNetworkSecurity]:
+        """
+        Performs a GET request against the /system/managementNetworkSecurities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ManagementNetworkSecurity]: The parsed response data.
+        """
+        return self._parse_many(
+            ManagementNetworkSecurity, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ManagementNetworkSecurity:
+        """
+        Performs a POST request against the /system/managementNetworkSecurities endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ManagementNetworkSecurity: The parsed response data.
+        """
+        return self._parse_one(
+            ManagementNetworkSecurity, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemManagementnetworksecuritiesCountEndpoint:
+        """
+        The SystemManagementnetworksecuritiesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemManagementnetworksecuritiesCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMarketplaceimportGetdefinitionEndpoint import (
+    SystemMarketplaceimportGetdefinitionEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMarketplaceimportImportEndpoint import (
+    SystemMarketplaceimportImportEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMarketplaceimportEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "marketplaceimport", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def getdefinition(self) -> SystemMarketplaceimportGetdefinitionEndpoint:
+        """
+        The SystemMarketplaceimportGetdefinitionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMarketplaceimportGetdefinitionEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def import_(self) -> SystemMarketplaceimportImportEndpoint:
+        """
+        The SystemMarketplaceimportImportEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMarketplaceimportImportEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMarketplaceimportGetdefinitionIdEndpoint import (
+    SystemMarketplaceimportGetdefinitionIdEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMarketplaceimportGetdefinitionEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "getdefinition", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> SystemMarketplaceimportGetdefinitionIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMarketplaceimportGetdefinitionIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMarketplaceimportGetdefinitionIdEndpoint: The initialized SystemMarketplaceimportGetdefinitionIdEndpoint object.
+        """
+        child = SystemMarketplaceimportGetdefinitionIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
@@ -0,0 +1,108 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersCountEndpoint import SystemMembersCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdEndpoint import SystemMembersIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersTypesEndpoint import SystemMembersTypesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersWithssoEndpoint import SystemMembersWithssoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Member
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMembersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Member], ConnectWiseManageRequestParams],
+    IAsyncPostable[Member, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Member, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "members", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Member])
+        IAsyncPostable.__init__(self, Member)
+        IAsyncPaginateable.__init__(self, Member)
+
+    def id(self, _id: int) -> SystemMembersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMembersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMembersIdEndpoint: The initialized SystemMembersIdEndpoint object.
+        """
+        child = SystemMembersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Member]:
+        """
+        Performs a GET request against the /system/members endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Member]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Member, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Member]:
+        """
+        Performs a GET request against the /system/members endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Member]: The parsed response data.
+        """
+        return self._parse_many(Member, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Member:
+        """
+        Performs a POST request against the /system/members endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Member: The parsed response data.
+        """
+        return self._parse_one(Member, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemMembersCountEndpoint:
+        """
+        The SystemMembersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def types(self) -> SystemMembersTypesEndpoint:
+        """
+        The SystemMembersTypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersTypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def with_sso(self) -> SystemMembersWithssoEndpoint:
+        """
+        The SystemMembersWithssoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersWithssoEndpoint(self.client, parent_endpoint=self))
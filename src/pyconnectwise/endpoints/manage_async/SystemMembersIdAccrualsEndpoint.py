@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdAccrualsCountEndpoint import (
+    SystemMembersIdAccrualsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMembersIdAccrualsIdEndpoint import SystemMembersIdAccrualsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import MemberAccrual
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMembersIdAccrualsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MemberAccrual], ConnectWiseManageRequestParams],
+    IAsyncPostable[MemberAccrual, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MemberAccrual, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "accruals", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MemberAccrual])
+        IAsyncPostable.__init__(self, MemberAccrual)
+        IAsyncPaginateable.__init__(self, MemberAccrual)
+
+    def id(self, _id: int) -> SystemMembersIdAccrualsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMembersIdAccrualsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMembersIdAccrualsIdEndpoint: The initialized SystemMembersIdAccrualsIdEndpoint object.
+        """
+        child = SystemMembersIdAccrualsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MemberAccrual]:
+        """
+        Performs a GET request against the /system/members/{id}/accruals endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MemberAccrual]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MemberAccrual, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MemberAccrual]:
+        """
+        Performs a GET request against the /system/members/{id}/accruals endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MemberAccrual]: The parsed response data.
+        """
+        return self._parse_many(MemberAccrual, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> MemberAccrual:
+        """
+        Performs a POST request against the /system/members/{id}/accruals endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MemberAccrual: The parsed response data.
+        """
+        return self._parse_one(MemberAccrual, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemMembersIdAccrualsCountEndpoint:
+        """
+        The SystemMembersIdAccrualsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdAccrualsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,228 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdAccrualsEndpoint import SystemMembersIdAccrualsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdCertificationsEndpoint import (
+    SystemMembersIdCertificationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMembersIdDeactivateEndpoint import SystemMembersIdDeactivateEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdDelegationsEndpoint import SystemMembersIdDelegationsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdImageEndpoint import SystemMembersIdImageEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdLinkssouserEndpoint import SystemMembersIdLinkssouserEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdManageddeviceaccountsEndpoint import (
+    SystemMembersIdManageddeviceaccountsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMembersIdMycertificationsEndpoint import (
+    SystemMembersIdMycertificationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMembersIdNotificationsettingsEndpoint import (
+    SystemMembersIdNotificationsettingsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMembersIdPersonasEndpoint import SystemMembersIdPersonasEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdSkillsEndpoint import SystemMembersIdSkillsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdSubmitEndpoint import SystemMembersIdSubmitEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdTokensEndpoint import SystemMembersIdTokensEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdUnlinkssouserEndpoint import (
+    SystemMembersIdUnlinkssouserEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMembersIdUnusedtimesheetsEndpoint import (
+    SystemMembersIdUnusedtimesheetsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMembersIdUsagesEndpoint import SystemMembersIdUsagesEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Member
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMembersIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Member, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Member, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Member, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Member, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Member)
+        IAsyncPatchable.__init__(self, Member)
+        IAsyncPuttable.__init__(self, Member)
+        IAsyncPaginateable.__init__(self, Member)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Member]:
+        """
+        Performs a GET request against the /system/members/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Member]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Member, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Member:
+        """
+        Performs a GET request against the /system/members/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Member: The parsed response data.
+        """
+        return self._parse_one(Member, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Member:
+        """
+        Performs a PATCH request against the /system/members/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Member: The parsed response data.
+        """
+        return self._parse_one(Member, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Member:
+        """
+        Performs a PUT request against the /system/members/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Member: The parsed response data.
+        """
+        return self._parse_one(Member, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def accruals(self) -> SystemMembersIdAccrualsEndpoint:
+        """
+        The SystemMembersIdAccrualsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdAccrualsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def certifications(self) -> SystemMembersIdCertificationsEndpoint:
+        """
+        The SystemMembersIdCertificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdCertificationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def deactivate(self) -> SystemMembersIdDeactivateEndpoint:
+        """
+        The SystemMembersIdDeactivateEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdDeactivateEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def delegations(self) -> SystemMembersIdDelegationsEndpoint:
+        """
+        The SystemMembersIdDelegationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdDelegationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def image(self) -> SystemMembersIdImageEndpoint:
+        """
+        The SystemMembersIdImageEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdImageEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def link_sso_user(self) -> SystemMembersIdLinkssouserEndpoint:
+        """
+        The SystemMembersIdLinkssouserEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdLinkssouserEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def managed_device_accounts(self) -> SystemMembersIdManageddeviceaccountsEndpoint:
+        """
+        The SystemMembersIdManageddeviceaccountsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMembersIdManageddeviceaccountsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def mycertifications(self) -> SystemMembersIdMycertificationsEndpoint:
+        """
+        The SystemMembersIdMycertificationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdMycertificationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notification_settings(self) -> SystemMembersIdNotificationsettingsEndpoint:
+        """
+        The SystemMembersIdNotificationsettingsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMembersIdNotificationsettingsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def personas(self) -> SystemMembersIdPersonasEndpoint:
+        """
+        The SystemMembersIdPersonasEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdPersonasEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def skills(self) -> SystemMembersIdSkillsEndpoint:
+        """
+        The SystemMembersIdSkillsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdSkillsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def submit(self) -> SystemMembersIdSubmitEndpoint:
+        """
+        The SystemMembersIdSubmitEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdSubmitEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def tokens(self) -> SystemMembersIdTokensEndpoint:
+        """
+        The SystemMembersIdTokensEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdTokensEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def unlink_sso_user(self) -> SystemMembersIdUnlinkssouserEndpoint:
+        """
+        The SystemMembersIdUnlinkssouserEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdUnlinkssouserEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def unused_time_sheets(self) -> SystemMembersIdUnusedtimesheetsEndpoint:
+        """
+        The SystemMembersIdUnusedtimesheetsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdUnusedtimesheetsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def usages(self) -> SystemMembersIdUsagesEndpoint:
+        """
+        The SystemMembersIdUsagesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdUsagesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,72 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdManageddeviceaccountsBulkEndpoint import (
+    SystemMembersIdManageddeviceaccountsBulkEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import ManagedDeviceAccount
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMembersIdManageddeviceaccountsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ManagedDeviceAccount], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ManagedDeviceAccount, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "managedDeviceAccounts", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ManagedDeviceAccount])
+        IAsyncPaginateable.__init__(self, ManagedDeviceAccount)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ManagedDeviceAccount]:
+        """
+        Performs a GET request against the /system/members/{id}/managedDeviceAccounts endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ManagedDeviceAccount]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ManagedDeviceAccount, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ManagedDeviceAccount]:
+        """
+        Performs a GET request against the /system/members/{id}/managedDeviceAccounts endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ManagedDeviceAccount]: The parsed response data.
+        """
+        return self._parse_many(
+            ManagedDeviceAccount, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def bulk(self) -> SystemMembersIdManageddeviceaccountsBulkEndpoint:
+        """
+        The SystemMembersIdManageddeviceaccountsBulkEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMembersIdManageddeviceaccountsBulkEndpoint(self.client, parent_endpoint=self)
+        )
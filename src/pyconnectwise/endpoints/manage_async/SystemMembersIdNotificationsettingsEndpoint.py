@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdNotificationsettingsCountEndpoint import (
+    SystemMembersIdNotificationsettingsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMembersIdNotificationsettingsIdEndpoint import (
+    SystemMembersIdNotificationsettingsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import MemberNotificationSetting
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMembersIdNotificationsettingsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MemberNotificationSetting], ConnectWiseManageRequestParams],
+    IAsyncPostable[MemberNotificationSetting, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MemberNotificationSetting, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "notificationSettings", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MemberNotificationSetting])
+        IAsyncPostable.__init__(self, MemberNotificationSetting)
+        IAsyncPaginateable.__init__(self, MemberNotificationSetting)
+
+    def id(self, _id: int) -> SystemMembersIdNotificationsettingsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMembersIdNotificationsettingsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMembersIdNotificationsettingsIdEndpoint: The initialized SystemMembersIdNotificationsettingsIdEndpoint object.
+        """
+        child = SystemMembersIdNotificationsettingsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MemberNotificationSetting]:
+        """
+        Performs a GET request against the /system/members/{id}/notificationSettings endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MemberNotificationSetting]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MemberNotificationSetting, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MemberNotificationSetting]:
+        """
+        Performs a GET request against the /system/members/{id}/notificationSettings endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MemberNotificationSetting]: The parsed response data.
+        """
+        return self._parse_many(
+            MemberNotificationSetting, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> MemberNotificationSetting:
+        """
+        Performs a POST request against the /system/members/{id}/notificationSettings endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MemberNotificationSetting: The parsed response data.
+        """
+        return self._parse_one(
+            MemberNotificationSetting, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemMembersIdNotificationsettingsCountEndpoint:
+        """
+        The SystemMembersIdNotificationsettingsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMembersIdNotificationsettingsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,82 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdPersonasCountEndpoint import (
+    SystemMembersIdPersonasCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMembersIdPersonasIdEndpoint import SystemMembersIdPersonasIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import MemberPersona
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMembersIdPersonasEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MemberPersona], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MemberPersona, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "personas", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MemberPersona])
+        IAsyncPaginateable.__init__(self, MemberPersona)
+
+    def id(self, _id: int) -> SystemMembersIdPersonasIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMembersIdPersonasIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMembersIdPersonasIdEndpoint: The initialized SystemMembersIdPersonasIdEndpoint object.
+        """
+        child = SystemMembersIdPersonasIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MemberPersona]:
+        """
+        Performs a GET request against the /system/members/{id}/personas endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MemberPersona]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MemberPersona, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MemberPersona]:
+        """
+        Performs a GET request against the /system/members/{id}/personas endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MemberPersona]: The parsed response data.
+        """
+        return self._parse_many(MemberPersona, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemMembersIdPersonasCountEndpoint:
+        """
+        The SystemMembersIdPersonasCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdPersonasCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdSkillsCountEndpoint import SystemMembersIdSkillsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersIdSkillsIdEndpoint import SystemMembersIdSkillsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import MemberSkill
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMembersIdSkillsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MemberSkill], ConnectWiseManageRequestParams],
+    IAsyncPostable[MemberSkill, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MemberSkill, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "skills", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MemberSkill])
+        IAsyncPostable.__init__(self, MemberSkill)
+        IAsyncPaginateable.__init__(self, MemberSkill)
+
+    def id(self, _id: int) -> SystemMembersIdSkillsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMembersIdSkillsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMembersIdSkillsIdEndpoint: The initialized SystemMembersIdSkillsIdEndpoint object.
+        """
+        child = SystemMembersIdSkillsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MemberSkill]:
+        """
+        Performs a GET request against the /system/members/{id}/skills endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MemberSkill]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MemberSkill, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MemberSkill]:
+        """
+        Performs a GET request against the /system/members/{id}/skills endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MemberSkill]: The parsed response data.
+        """
+        return self._parse_many(MemberSkill, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MemberSkill:
+        """
+        Performs a POST request against the /system/members/{id}/skills endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MemberSkill: The parsed response data.
+        """
+        return self._parse_one(MemberSkill, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemMembersIdSkillsCountEndpoint:
+        """
+        The SystemMembersIdSkillsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersIdSkillsCountEndpoint(self.client, parent_endpoint=self))
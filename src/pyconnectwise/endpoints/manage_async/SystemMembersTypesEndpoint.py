@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersTypesCountEndpoint import SystemMembersTypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersTypesIdEndpoint import SystemMembersTypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembersTypesInfoEndpoint import SystemMembersTypesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import MemberType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMembersTypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MemberType], ConnectWiseManageRequestParams],
+    IAsyncPostable[MemberType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MemberType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "types", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MemberType])
+        IAsyncPostable.__init__(self, MemberType)
+        IAsyncPaginateable.__init__(self, MemberType)
+
+    def id(self, _id: int) -> SystemMembersTypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMembersTypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMembersTypesIdEndpoint: The initialized SystemMembersTypesIdEndpoint object.
+        """
+        child = SystemMembersTypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MemberType]:
+        """
+        Performs a GET request against the /system/members/types endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MemberType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MemberType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MemberType]:
+        """
+        Performs a GET request against the /system/members/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MemberType]: The parsed response data.
+        """
+        return self._parse_many(MemberType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MemberType:
+        """
+        Performs a POST request against the /system/members/types endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MemberType: The parsed response data.
+        """
+        return self._parse_one(MemberType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemMembersTypesCountEndpoint:
+        """
+        The SystemMembersTypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersTypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemMembersTypesInfoEndpoint:
+        """
+        The SystemMembersTypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembersTypesInfoEndpoint(self.client, parent_endpoint=self))
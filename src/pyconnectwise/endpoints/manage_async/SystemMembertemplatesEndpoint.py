@@ -0,0 +1,34 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembertemplatesCountEndpoint import SystemMembertemplatesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMembertemplatesIdEndpoint import SystemMembertemplatesIdEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMembertemplatesEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "membertemplates", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> SystemMembertemplatesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMembertemplatesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMembertemplatesIdEndpoint: The initialized SystemMembertemplatesIdEndpoint object.
+        """
+        child = SystemMembertemplatesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def count(self) -> SystemMembertemplatesCountEndpoint:
+        """
+        The SystemMembertemplatesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMembertemplatesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMenuentriesCountEndpoint import SystemMenuentriesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMenuentriesIdEndpoint import SystemMenuentriesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import MenuEntry
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMenuentriesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MenuEntry], ConnectWiseManageRequestParams],
+    IAsyncPostable[MenuEntry, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MenuEntry, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "menuentries", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MenuEntry])
+        IAsyncPostable.__init__(self, MenuEntry)
+        IAsyncPaginateable.__init__(self, MenuEntry)
+
+    def id(self, _id: int) -> SystemMenuentriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMenuentriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMenuentriesIdEndpoint: The initialized SystemMenuentriesIdEndpoint object.
+        """
+        child = SystemMenuentriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MenuEntry]:
+        """
+        Performs a GET request against the /system/menuentries endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MenuEntry]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MenuEntry, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MenuEntry]:
+        """
+        Performs a GET request against the /system/menuentries endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MenuEntry]: The parsed response data.
+        """
+        return self._parse_many(MenuEntry, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MenuEntry:
+        """
+        Performs a POST request against the /system/menuentries endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MenuEntry: The parsed response data.
+        """
+        return self._parse_one(MenuEntry, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemMenuentriesCountEndpoint:
+        """
+        The SystemMenuentriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMenuentriesCountEndpoint(self.client, parent_endpoint=self))
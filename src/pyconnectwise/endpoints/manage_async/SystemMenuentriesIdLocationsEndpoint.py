@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMenuentriesIdLocationsCountEndpoint import (
+    SystemMenuentriesIdLocationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMenuentriesIdLocationsIdEndpoint import (
+    SystemMenuentriesIdLocationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import MenuEntryLocation
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMenuentriesIdLocationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MenuEntryLocation], ConnectWiseManageRequestParams],
+    IAsyncPostable[MenuEntryLocation, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MenuEntryLocation, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "locations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MenuEntryLocation])
+        IAsyncPostable.__init__(self, MenuEntryLocation)
+        IAsyncPaginateable.__init__(self, MenuEntryLocation)
+
+    def id(self, _id: int) -> SystemMenuentriesIdLocationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMenuentriesIdLocationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMenuentriesIdLocationsIdEndpoint: The initialized SystemMenuentriesIdLocationsIdEndpoint object.
+        """
+        child = SystemMenuentriesIdLocationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MenuEntryLocation]:
+        """
+        Performs a GET request against the /system/menuEntries/{id}/locations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MenuEntryLocation]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MenuEntryLocation, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MenuEntryLocation]:
+        """
+        Performs a GET request against the /system/menuEntries/{id}/locations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MenuEntryLocation]: The parsed response data.
+        """
+        return self._parse_many(
+            MenuEntryLocation, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> MenuEntryLocation:
+        """
+        Performs a POST request against the /system/menuEntries/{id}/locations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MenuEntryLocation: The parsed response data.
+        """
+        return self._parse_one(
+            MenuEntryLocation, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemMenuentriesIdLocationsCountEndpoint:
+        """
+        The SystemMenuentriesIdLocationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMenuentriesIdLocationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMyaccountIdDelegationsCountEndpoint import (
+    SystemMyaccountIdDelegationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMyaccountIdDelegationsIdEndpoint import (
+    SystemMyaccountIdDelegationsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import MemberDelegation
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMyaccountIdDelegationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MemberDelegation], ConnectWiseManageRequestParams],
+    IAsyncPostable[MemberDelegation, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MemberDelegation, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "delegations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MemberDelegation])
+        IAsyncPostable.__init__(self, MemberDelegation)
+        IAsyncPaginateable.__init__(self, MemberDelegation)
+
+    def id(self, _id: int) -> SystemMyaccountIdDelegationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMyaccountIdDelegationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMyaccountIdDelegationsIdEndpoint: The initialized SystemMyaccountIdDelegationsIdEndpoint object.
+        """
+        child = SystemMyaccountIdDelegationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MemberDelegation]:
+        """
+        Performs a GET request against the /system/myAccount/{id}/delegations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MemberDelegation]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MemberDelegation, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MemberDelegation]:
+        """
+        Performs a GET request against the /system/myAccount/{id}/delegations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MemberDelegation]: The parsed response data.
+        """
+        return self._parse_many(
+            MemberDelegation, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> MemberDelegation:
+        """
+        Performs a POST request against the /system/myAccount/{id}/delegations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MemberDelegation: The parsed response data.
+        """
+        return self._parse_one(
+            MemberDelegation, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemMyaccountIdDelegationsCountEndpoint:
+        """
+        The SystemMyaccountIdDelegationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMyaccountIdDelegationsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMyaccountIdDelegationsEndpoint import (
+    SystemMyaccountIdDelegationsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMyaccountIdSkillsEndpoint import SystemMyaccountIdSkillsEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import MyAccount
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMyaccountIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[MyAccount, ConnectWiseManageRequestParams],
+    IAsyncPatchable[MyAccount, ConnectWiseManageRequestParams],
+    IAsyncPuttable[MyAccount, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MyAccount, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, MyAccount)
+        IAsyncPatchable.__init__(self, MyAccount)
+        IAsyncPuttable.__init__(self, MyAccount)
+        IAsyncPaginateable.__init__(self, MyAccount)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MyAccount]:
+        """
+        Performs a GET request against the /system/myAccount/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MyAccount]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MyAccount, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MyAccount:
+        """
+        Performs a GET request against the /system/myAccount/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MyAccount: The parsed response data.
+        """
+        return self._parse_one(MyAccount, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> MyAccount:
+        """
+        Performs a PATCH request against the /system/myAccount/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MyAccount: The parsed response data.
+        """
+        return self._parse_one(MyAccount, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> MyAccount:
+        """
+        Performs a PUT request against the /system/myAccount/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            MyAccount: The parsed response data.
+        """
+        return self._parse_one(MyAccount, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def delegations(self) -> SystemMyaccountIdDelegationsEndpoint:
+        """
+        The SystemMyaccountIdDelegationsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMyaccountIdDelegationsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def skills(self) -> SystemMyaccountIdSkillsEndpoint:
+        """
+        The SystemMyaccountIdSkillsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMyaccountIdSkillsEndpoint(self.client, parent_endpoint=self))
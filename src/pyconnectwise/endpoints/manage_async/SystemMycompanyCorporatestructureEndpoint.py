@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMycompanyCorporatestructureCountEndpoint import (
+    SystemMycompanyCorporatestructureCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMycompanyCorporatestructureIdEndpoint import (
+    SystemMycompanyCorporatestructureIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMycompanyCorporatestructureInfoEndpoint import (
+    SystemMycompanyCorporatestructureInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import CorporateStructure
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMycompanyCorporatestructureEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[CorporateStructure], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[CorporateStructure, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "corporateStructure", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[CorporateStructure])
+        IAsyncPaginateable.__init__(self, CorporateStructure)
+
+    def id(self, _id: int) -> SystemMycompanyCorporatestructureIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMycompanyCorporatestructureIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMycompanyCorporatestructureIdEndpoint: The initialized SystemMycompanyCorporatestructureIdEndpoint object.
+        """
+        child = SystemMycompanyCorporatestructureIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[CorporateStructure]:
+        """
+        Performs a GET request against the /system/myCompany/corporateStructure endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[CorporateStructure]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), CorporateStructure, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[CorporateStructure]:
+        """
+        Performs a GET request against the /system/myCompany/corporateStructure endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[CorporateStructure]: The parsed response data.
+        """
+        return self._parse_many(
+            CorporateStructure, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemMycompanyCorporatestructureCountEndpoint:
+        """
+        The SystemMycompanyCorporatestructureCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMycompanyCorporatestructureCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> SystemMycompanyCorporatestructureInfoEndpoint:
+        """
+        The SystemMycompanyCorporatestructureInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMycompanyCorporatestructureInfoEndpoint(self.client, parent_endpoint=self)
+        )
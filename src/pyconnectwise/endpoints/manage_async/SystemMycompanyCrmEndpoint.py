@@ -0,0 +1,86 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMycompanyCrmCountEndpoint import SystemMycompanyCrmCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMycompanyCrmIdEndpoint import SystemMycompanyCrmIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMycompanyCrmInfoEndpoint import SystemMycompanyCrmInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import Crm
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMycompanyCrmEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Crm], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Crm, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "crm", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Crm])
+        IAsyncPaginateable.__init__(self, Crm)
+
+    def id(self, _id: int) -> SystemMycompanyCrmIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMycompanyCrmIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMycompanyCrmIdEndpoint: The initialized SystemMycompanyCrmIdEndpoint object.
+        """
+        child = SystemMycompanyCrmIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Crm]:
+        """
+        Performs a GET request against the /system/myCompany/crm endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Crm]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Crm, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Crm]:
+        """
+        Performs a GET request against the /system/myCompany/crm endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Crm]: The parsed response data.
+        """
+        return self._parse_many(Crm, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemMycompanyCrmCountEndpoint:
+        """
+        The SystemMycompanyCrmCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyCrmCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemMycompanyCrmInfoEndpoint:
+        """
+        The SystemMycompanyCrmInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyCrmInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,48 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMycompanyDocumentsEndpoint import SystemMycompanyDocumentsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMycompanyInfoEndpoint import SystemMycompanyInfoEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMycompanyReportingservicesEndpoint import (
+    SystemMycompanyReportingservicesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMycompanyServicesEndpoint import SystemMycompanyServicesEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMycompanyEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "mycompany", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def documents(self) -> SystemMycompanyDocumentsEndpoint:
+        """
+        The SystemMycompanyDocumentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyDocumentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemMycompanyInfoEndpoint:
+        """
+        The SystemMycompanyInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reporting_services(self) -> SystemMycompanyReportingservicesEndpoint:
+        """
+        The SystemMycompanyReportingservicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMycompanyReportingservicesEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def services(self) -> SystemMycompanyServicesEndpoint:
+        """
+        The SystemMycompanyServicesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyServicesEndpoint(self.client, parent_endpoint=self))
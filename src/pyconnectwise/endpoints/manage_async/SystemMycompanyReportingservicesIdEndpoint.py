@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMycompanyReportingservicesIdTestconnectionEndpoint import (
+    SystemMycompanyReportingservicesIdTestconnectionEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import ReportingService
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMycompanyReportingservicesIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[ReportingService, ConnectWiseManageRequestParams],
+    IAsyncPatchable[ReportingService, ConnectWiseManageRequestParams],
+    IAsyncPuttable[ReportingService, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ReportingService, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, ReportingService)
+        IAsyncPatchable.__init__(self, ReportingService)
+        IAsyncPuttable.__init__(self, ReportingService)
+        IAsyncPaginateable.__init__(self, ReportingService)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ReportingService]:
+        """
+        Performs a GET request against the /system/mycompany/reportingServices/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ReportingService]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ReportingService, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ReportingService:
+        """
+        Performs a GET request against the /system/mycompany/reportingServices/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ReportingService: The parsed response data.
+        """
+        return self._parse_one(ReportingService, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> ReportingService:
+        """
+        Performs a PATCH request against the /system/mycompany/reportingServices/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ReportingService: The parsed response data.
+        """
+        return self._parse_one(
+            ReportingService, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ReportingService:
+        """
+        Performs a PUT request against the /system/mycompany/reportingServices/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ReportingService: The parsed response data.
+        """
+        return self._parse_one(ReportingService, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def test_connection(self) -> SystemMycompanyReportingservicesIdTestconnectionEndpoint:
+        """
+        The SystemMycompanyReportingservicesIdTestconnectionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemMycompanyReportingservicesIdTestconnectionEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,84 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMycompanyTimeexpenseCountEndpoint import (
+    SystemMycompanyTimeexpenseCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemMycompanyTimeexpenseIdEndpoint import (
+    SystemMycompanyTimeexpenseIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import TimeExpense
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMycompanyTimeexpenseEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TimeExpense], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TimeExpense, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "timeExpense", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TimeExpense])
+        IAsyncPaginateable.__init__(self, TimeExpense)
+
+    def id(self, _id: int) -> SystemMycompanyTimeexpenseIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemMycompanyTimeexpenseIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemMycompanyTimeexpenseIdEndpoint: The initialized SystemMycompanyTimeexpenseIdEndpoint object.
+        """
+        child = SystemMycompanyTimeexpenseIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TimeExpense]:
+        """
+        Performs a GET request against the /system/myCompany/timeExpense endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TimeExpense]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TimeExpense, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TimeExpense]:
+        """
+        Performs a GET request against the /system/myCompany/timeExpense endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TimeExpense]: The parsed response data.
+        """
+        return self._parse_many(TimeExpense, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemMycompanyTimeexpenseCountEndpoint:
+        """
+        The SystemMycompanyTimeexpenseCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMycompanyTimeexpenseCountEndpoint(self.client, parent_endpoint=self))
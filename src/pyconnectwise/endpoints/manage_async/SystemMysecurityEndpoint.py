@@ -0,0 +1,68 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemMysecurityCustomizeitemsEndpoint import (
+    SystemMysecurityCustomizeitemsEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import MySecurity
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemMysecurityEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[MySecurity], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[MySecurity, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "mySecurity", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[MySecurity])
+        IAsyncPaginateable.__init__(self, MySecurity)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[MySecurity]:
+        """
+        Performs a GET request against the /system/mySecurity endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[MySecurity]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), MySecurity, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[MySecurity]:
+        """
+        Performs a GET request against the /system/mySecurity endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[MySecurity]: The parsed response data.
+        """
+        return self._parse_many(MySecurity, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def customize_items(self) -> SystemMysecurityCustomizeitemsEndpoint:
+        """
+        The SystemMysecurityCustomizeitemsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemMysecurityCustomizeitemsEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemOffice365EmailsetupsCountEndpoint import (
+    SystemOffice365EmailsetupsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemOffice365EmailsetupsIdEndpoint import (
+    SystemOffice365EmailsetupsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Office365EmailSetup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemOffice365EmailsetupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Office365EmailSetup], ConnectWiseManageRequestParams],
+    IAsyncPostable[Office365EmailSetup, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Office365EmailSetup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "emailSetups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Office365EmailSetup])
+        IAsyncPostable.__init__(self, Office365EmailSetup)
+        IAsyncPaginateable.__init__(self, Office365EmailSetup)
+
+    def id(self, _id: int) -> SystemOffice365EmailsetupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemOffice365EmailsetupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemOffice365EmailsetupsIdEndpoint: The initialized SystemOffice365EmailsetupsIdEndpoint object.
+        """
+        child = SystemOffice365EmailsetupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Office365EmailSetup]:
+        """
+        Performs a GET request against the /system/office365/emailSetups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Office365EmailSetup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Office365EmailSetup, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Office365EmailSetup]:
+        """
+        Performs a GET request against the /system/office365/emailSetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Office365EmailSetup]: The parsed response data.
+        """
+        return self._parse_many(
+            Office365EmailSetup, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> Office365EmailSetup:
+        """
+        Performs a POST request against the /system/office365/emailSetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Office365EmailSetup: The parsed response data.
+        """
+        return self._parse_one(
+            Office365EmailSetup, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemOffice365EmailsetupsCountEndpoint:
+        """
+        The SystemOffice365EmailsetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemOffice365EmailsetupsCountEndpoint(self.client, parent_endpoint=self))
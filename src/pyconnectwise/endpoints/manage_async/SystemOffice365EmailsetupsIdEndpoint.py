@@ -0,0 +1,130 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemOffice365EmailsetupsIdAuthorizeEndpoint import (
+    SystemOffice365EmailsetupsIdAuthorizeEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemOffice365EmailsetupsIdTestconnectionEndpoint import (
+    SystemOffice365EmailsetupsIdTestconnectionEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Office365EmailSetup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemOffice365EmailsetupsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Office365EmailSetup, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Office365EmailSetup, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Office365EmailSetup, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Office365EmailSetup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Office365EmailSetup)
+        IAsyncPatchable.__init__(self, Office365EmailSetup)
+        IAsyncPuttable.__init__(self, Office365EmailSetup)
+        IAsyncPaginateable.__init__(self, Office365EmailSetup)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Office365EmailSetup]:
+        """
+        Performs a GET request against the /system/office365/emailSetups/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Office365EmailSetup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Office365EmailSetup, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /system/office365/emailSetups/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> Office365EmailSetup:
+        """
+        Performs a GET request against the /system/office365/emailSetups/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Office365EmailSetup: The parsed response data.
+        """
+        return self._parse_one(
+            Office365EmailSetup, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> Office365EmailSetup:
+        """
+        Performs a PATCH request against the /system/office365/emailSetups/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Office365EmailSetup: The parsed response data.
+        """
+        return self._parse_one(
+            Office365EmailSetup, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> Office365EmailSetup:
+        """
+        Performs a PUT request against the /system/office365/emailSetups/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Office365EmailSetup: The parsed response data.
+        """
+        return self._parse_one(
+            Office365EmailSetup, (await super()._make_request("PUT", data=data, params=params)).content
+        )
+
+    @cached_property
+    def authorize(self) -> SystemOffice365EmailsetupsIdAuthorizeEndpoint:
+        """
+        The SystemOffice365EmailsetupsIdAuthorizeEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemOffice365EmailsetupsIdAuthorizeEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def test_connection(self) -> SystemOffice365EmailsetupsIdTestconnectionEndpoint:
+        """
+        The SystemOffice365EmailsetupsIdTestconnectionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemOffice365EmailsetupsIdTestconnectionEndpoint(self.client, parent_endpoint=self)
+        )
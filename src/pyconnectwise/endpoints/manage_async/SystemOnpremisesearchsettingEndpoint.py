@@ -0,0 +1,40 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemOnpremisesearchsettingCountEndpoint import (
+    SystemOnpremisesearchsettingCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemOnpremisesearchsettingIdEndpoint import (
+    SystemOnpremisesearchsettingIdEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemOnpremisesearchsettingEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "onPremiseSearchSetting", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> SystemOnpremisesearchsettingIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemOnpremisesearchsettingIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemOnpremisesearchsettingIdEndpoint: The initialized SystemOnpremisesearchsettingIdEndpoint object.
+        """
+        child = SystemOnpremisesearchsettingIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def count(self) -> SystemOnpremisesearchsettingCountEndpoint:
+        """
+        The SystemOnpremisesearchsettingCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemOnpremisesearchsettingCountEndpoint(self.client, parent_endpoint=self)
+        )
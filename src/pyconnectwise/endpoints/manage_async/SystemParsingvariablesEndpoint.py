@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemParsingvariablesCountEndpoint import SystemParsingvariablesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemParsingvariablesIdEndpoint import SystemParsingvariablesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import ParsingVariable
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemParsingvariablesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ParsingVariable], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ParsingVariable, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "parsingVariables", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ParsingVariable])
+        IAsyncPaginateable.__init__(self, ParsingVariable)
+
+    def id(self, _id: int) -> SystemParsingvariablesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemParsingvariablesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemParsingvariablesIdEndpoint: The initialized SystemParsingvariablesIdEndpoint object.
+        """
+        child = SystemParsingvariablesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ParsingVariable]:
+        """
+        Performs a GET request against the /system/parsingVariables endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ParsingVariable]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ParsingVariable, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ParsingVariable]:
+        """
+        Performs a GET request against the /system/parsingVariables endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ParsingVariable]: The parsed response data.
+        """
+        return self._parse_many(ParsingVariable, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemParsingvariablesCountEndpoint:
+        """
+        The SystemParsingvariablesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemParsingvariablesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemPortalreportsCountEndpoint import SystemPortalreportsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemPortalreportsIdEndpoint import SystemPortalreportsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import PortalReport
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemPortalreportsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[PortalReport], ConnectWiseManageRequestParams],
+    IAsyncPostable[PortalReport, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[PortalReport, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "portalReports", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[PortalReport])
+        IAsyncPostable.__init__(self, PortalReport)
+        IAsyncPaginateable.__init__(self, PortalReport)
+
+    def id(self, _id: int) -> SystemPortalreportsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemPortalreportsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemPortalreportsIdEndpoint: The initialized SystemPortalreportsIdEndpoint object.
+        """
+        child = SystemPortalreportsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[PortalReport]:
+        """
+        Performs a GET request against the /system/portalReports endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[PortalReport]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), PortalReport, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[PortalReport]:
+        """
+        Performs a GET request against the /system/portalReports endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[PortalReport]: The parsed response data.
+        """
+        return self._parse_many(PortalReport, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> PortalReport:
+        """
+        Performs a POST request against the /system/portalReports endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            PortalReport: The parsed response data.
+        """
+        return self._parse_one(PortalReport, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemPortalreportsCountEndpoint:
+        """
+        The SystemPortalreportsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemPortalreportsCountEndpoint(self.client, parent_endpoint=self))
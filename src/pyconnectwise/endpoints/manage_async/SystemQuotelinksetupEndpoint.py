@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemQuotelinksetupCountEndpoint import SystemQuotelinksetupCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemQuotelinksetupIdEndpoint import SystemQuotelinksetupIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemQuotelinksetupTestconnectionEndpoint import (
+    SystemQuotelinksetupTestconnectionEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import QuoteLink
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemQuotelinksetupEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[QuoteLink], ConnectWiseManageRequestParams],
+    IAsyncPostable[QuoteLink, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[QuoteLink, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "quoteLinkSetup", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[QuoteLink])
+        IAsyncPostable.__init__(self, QuoteLink)
+        IAsyncPaginateable.__init__(self, QuoteLink)
+
+    def id(self, _id: int) -> SystemQuotelinksetupIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemQuotelinksetupIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemQuotelinksetupIdEndpoint: The initialized SystemQuotelinksetupIdEndpoint object.
+        """
+        child = SystemQuotelinksetupIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[QuoteLink]:
+        """
+        Performs a GET request against the /system/quoteLinkSetup endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[QuoteLink]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), QuoteLink, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[QuoteLink]:
+        """
+        Performs a GET request against the /system/quoteLinkSetup endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[QuoteLink]: The parsed response data.
+        """
+        return self._parse_many(QuoteLink, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> QuoteLink:
+        """
+        Performs a POST request against the /system/quoteLinkSetup endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            QuoteLink: The parsed response data.
+        """
+        return self._parse_one(QuoteLink, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemQuotelinksetupCountEndpoint:
+        """
+        The SystemQuotelinksetupCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemQuotelinksetupCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def test_connection(self) -> SystemQuotelinksetupTestconnectionEndpoint:
+        """
+        The SystemQuotelinksetupTestconnectionEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemQuotelinksetupTestconnectionEndpoint(self.client, parent_endpoint=self)
+        )
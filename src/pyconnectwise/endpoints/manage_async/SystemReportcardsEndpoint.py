@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemReportcardsCountEndpoint import SystemReportcardsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemReportcardsIdEndpoint import SystemReportcardsIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemReportcardsInfoEndpoint import SystemReportcardsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ReportCard
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemReportcardsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ReportCard], ConnectWiseManageRequestParams],
+    IAsyncPostable[ReportCard, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ReportCard, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "reportCards", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ReportCard])
+        IAsyncPostable.__init__(self, ReportCard)
+        IAsyncPaginateable.__init__(self, ReportCard)
+
+    def id(self, _id: int) -> SystemReportcardsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemReportcardsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemReportcardsIdEndpoint: The initialized SystemReportcardsIdEndpoint object.
+        """
+        child = SystemReportcardsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ReportCard]:
+        """
+        Performs a GET request against the /system/reportCards endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ReportCard]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ReportCard, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ReportCard]:
+        """
+        Performs a GET request against the /system/reportCards endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ReportCard]: The parsed response data.
+        """
+        return self._parse_many(ReportCard, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ReportCard:
+        """
+        Performs a POST request against the /system/reportCards endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ReportCard: The parsed response data.
+        """
+        return self._parse_one(ReportCard, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemReportcardsCountEndpoint:
+        """
+        The SystemReportcardsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportcardsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemReportcardsInfoEndpoint:
+        """
+        The SystemReportcardsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportcardsInfoEndpoint(self.client, parent_endpoint=self))
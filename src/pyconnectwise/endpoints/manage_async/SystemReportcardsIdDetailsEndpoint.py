@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemReportcardsIdDetailsCountEndpoint import (
+    SystemReportcardsIdDetailsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemReportcardsIdDetailsIdEndpoint import (
+    SystemReportcardsIdDetailsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ReportCardDetail
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemReportcardsIdDetailsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ReportCardDetail], ConnectWiseManageRequestParams],
+    IAsyncPostable[ReportCardDetail, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ReportCardDetail, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "details", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ReportCardDetail])
+        IAsyncPostable.__init__(self, ReportCardDetail)
+        IAsyncPaginateable.__init__(self, ReportCardDetail)
+
+    def id(self, _id: int) -> SystemReportcardsIdDetailsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemReportcardsIdDetailsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemReportcardsIdDetailsIdEndpoint: The initialized SystemReportcardsIdDetailsIdEndpoint object.
+        """
+        child = SystemReportcardsIdDetailsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ReportCardDetail]:
+        """
+        Performs a GET request against the /system/reportCards/{id}/details endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ReportCardDetail]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ReportCardDetail, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ReportCardDetail]:
+        """
+        Performs a GET request against the /system/reportCards/{id}/details endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ReportCardDetail]: The parsed response data.
+        """
+        return self._parse_many(
+            ReportCardDetail, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ReportCardDetail:
+        """
+        Performs a POST request against the /system/reportCards/{id}/details endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ReportCardDetail: The parsed response data.
+        """
+        return self._parse_one(
+            ReportCardDetail, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemReportcardsIdDetailsCountEndpoint:
+        """
+        The SystemReportcardsIdDetailsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemReportcardsIdDetailsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSecurityrolesCountEndpoint import SystemSecurityrolesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSecurityrolesIdEndpoint import SystemSecurityrolesIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSecurityrolesInfoEndpoint import SystemSecurityrolesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import SecurityRole
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemSecurityrolesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SecurityRole], ConnectWiseManageRequestParams],
+    IAsyncPostable[SecurityRole, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SecurityRole, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "securityroles", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SecurityRole])
+        IAsyncPostable.__init__(self, SecurityRole)
+        IAsyncPaginateable.__init__(self, SecurityRole)
+
+    def id(self, _id: int) -> SystemSecurityrolesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemSecurityrolesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemSecurityrolesIdEndpoint: The initialized SystemSecurityrolesIdEndpoint object.
+        """
+        child = SystemSecurityrolesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SecurityRole]:
+        """
+        Performs a GET request against the /system/securityroles endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SecurityRole]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SecurityRole, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SecurityRole]:
+        """
+        Performs a GET request against the /system/securityroles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SecurityRole]: The parsed response data.
+        """
+        return self._parse_many(SecurityRole, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> SecurityRole:
+        """
+        Performs a POST request against the /system/securityroles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SecurityRole: The parsed response data.
+        """
+        return self._parse_one(SecurityRole, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemSecurityrolesCountEndpoint:
+        """
+        The SystemSecurityrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSecurityrolesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemSecurityrolesInfoEndpoint:
+        """
+        The SystemSecurityrolesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSecurityrolesInfoEndpoint(self.client, parent_endpoint=self))
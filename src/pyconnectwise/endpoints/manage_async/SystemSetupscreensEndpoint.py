@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSetupscreensCountEndpoint import SystemSetupscreensCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSetupscreensIdEndpoint import SystemSetupscreensIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import SetupScreen
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemSetupscreensEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SetupScreen], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SetupScreen, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "setupScreens", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SetupScreen])
+        IAsyncPaginateable.__init__(self, SetupScreen)
+
+    def id(self, _id: int) -> SystemSetupscreensIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemSetupscreensIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemSetupscreensIdEndpoint: The initialized SystemSetupscreensIdEndpoint object.
+        """
+        child = SystemSetupscreensIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SetupScreen]:
+        """
+        Performs a GET request against the /system/setupScreens endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SetupScreen]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SetupScreen, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SetupScreen]:
+        """
+        Performs a GET request against the /system/setupScreens endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SetupScreen]: The parsed response data.
+        """
+        return self._parse_many(SetupScreen, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemSetupscreensCountEndpoint:
+        """
+        The SystemSetupscreensCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSetupscreensCountEndpoint(self.client, parent_endpoint=self))
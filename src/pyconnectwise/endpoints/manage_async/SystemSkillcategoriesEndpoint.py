@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSkillcategoriesCountEndpoint import SystemSkillcategoriesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSkillcategoriesIdEndpoint import SystemSkillcategoriesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import SkillCategory
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemSkillcategoriesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SkillCategory], ConnectWiseManageRequestParams],
+    IAsyncPostable[SkillCategory, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SkillCategory, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "skillCategories", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SkillCategory])
+        IAsyncPostable.__init__(self, SkillCategory)
+        IAsyncPaginateable.__init__(self, SkillCategory)
+
+    def id(self, _id: int) -> SystemSkillcategoriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemSkillcategoriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemSkillcategoriesIdEndpoint: The initialized SystemSkillcategoriesIdEndpoint object.
+        """
+        child = SystemSkillcategoriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SkillCategory]:
+        """
+        Performs a GET request against the /system/skillCategories endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SkillCategory]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SkillCategory, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SkillCategory]:
+        """
+        Performs a GET request against the /system/skillCategories endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SkillCategory]: The parsed response data.
+        """
+        return self._parse_many(SkillCategory, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> SkillCategory:
+        """
+        Performs a POST request against the /system/skillCategories endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SkillCategory: The parsed response data.
+        """
+        return self._parse_one(SkillCategory, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemSkillcategoriesCountEndpoint:
+        """
+        The SystemSkillcategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSkillcategoriesCountEndpoint(self.client, parent_endpoint=self))
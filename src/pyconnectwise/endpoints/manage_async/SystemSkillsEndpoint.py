@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSkillsCountEndpoint import SystemSkillsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSkillsIdEndpoint import SystemSkillsIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSkillsInfoEndpoint import SystemSkillsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Skill
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemSkillsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Skill], ConnectWiseManageRequestParams],
+    IAsyncPostable[Skill, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Skill, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "skills", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Skill])
+        IAsyncPostable.__init__(self, Skill)
+        IAsyncPaginateable.__init__(self, Skill)
+
+    def id(self, _id: int) -> SystemSkillsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemSkillsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemSkillsIdEndpoint: The initialized SystemSkillsIdEndpoint object.
+        """
+        child = SystemSkillsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Skill]:
+        """
+        Performs a GET request against the /system/skills endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Skill]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Skill, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Skill]:
+        """
+        Performs a GET request against the /system/skills endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Skill]: The parsed response data.
+        """
+        return self._parse_many(Skill, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Skill:
+        """
+        Performs a POST request against the /system/skills endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Skill: The parsed response data.
+        """
+        return self._parse_one(Skill, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemSkillsCountEndpoint:
+        """
+        The SystemSkillsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSkillsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemSkillsInfoEndpoint:
+        """
+        The SystemSkillsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSkillsInfoEndpoint(self.client, parent_endpoint=self))
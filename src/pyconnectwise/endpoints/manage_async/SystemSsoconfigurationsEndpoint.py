@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSsoconfigurationsCountEndpoint import (
+    SystemSsoconfigurationsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemSsoconfigurationsIdEndpoint import SystemSsoconfigurationsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import SsoConfiguration
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemSsoconfigurationsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SsoConfiguration], ConnectWiseManageRequestParams],
+    IAsyncPostable[SsoConfiguration, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SsoConfiguration, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "ssoConfigurations", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SsoConfiguration])
+        IAsyncPostable.__init__(self, SsoConfiguration)
+        IAsyncPaginateable.__init__(self, SsoConfiguration)
+
+    def id(self, _id: int) -> SystemSsoconfigurationsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemSsoconfigurationsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemSsoconfigurationsIdEndpoint: The initialized SystemSsoconfigurationsIdEndpoint object.
+        """
+        child = SystemSsoconfigurationsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SsoConfiguration]:
+        """
+        Performs a GET request against the /system/ssoConfigurations endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SsoConfiguration]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SsoConfiguration, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SsoConfiguration]:
+        """
+        Performs a GET request against the /system/ssoConfigurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SsoConfiguration]: The parsed response data.
+        """
+        return self._parse_many(
+            SsoConfiguration, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> SsoConfiguration:
+        """
+        Performs a POST request against the /system/ssoConfigurations endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SsoConfiguration: The parsed response data.
+        """
+        return self._parse_one(
+            SsoConfiguration, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemSsoconfigurationsCountEndpoint:
+        """
+        The SystemSsoconfigurationsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSsoconfigurationsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSsousersCountEndpoint import SystemSsousersCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSsousersIdEndpoint import SystemSsousersIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import SsoUser
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemSsousersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SsoUser], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SsoUser, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "ssoUsers", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SsoUser])
+        IAsyncPaginateable.__init__(self, SsoUser)
+
+    def id(self, _id: int) -> SystemSsousersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemSsousersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemSsousersIdEndpoint: The initialized SystemSsousersIdEndpoint object.
+        """
+        child = SystemSsousersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SsoUser]:
+        """
+        Performs a GET request against the /system/ssoUsers endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SsoUser]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SsoUser, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SsoUser]:
+        """
+        Performs a GET request against the /system/ssoUsers endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SsoUser]: The parsed response data.
+        """
+        return self._parse_many(SsoUser, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemSsousersCountEndpoint:
+        """
+        The SystemSsousersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSsousersCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemStandardnotesCountEndpoint import SystemStandardnotesCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemStandardnotesIdEndpoint import SystemStandardnotesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import StandardNote
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemStandardnotesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[StandardNote], ConnectWiseManageRequestParams],
+    IAsyncPostable[StandardNote, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[StandardNote, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "standardNotes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[StandardNote])
+        IAsyncPostable.__init__(self, StandardNote)
+        IAsyncPaginateable.__init__(self, StandardNote)
+
+    def id(self, _id: int) -> SystemStandardnotesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemStandardnotesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemStandardnotesIdEndpoint: The initialized SystemStandardnotesIdEndpoint object.
+        """
+        child = SystemStandardnotesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[StandardNote]:
+        """
+        Performs a GET request against the /system/standardNotes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[StandardNote]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), StandardNote, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[StandardNote]:
+        """
+        Performs a GET request against the /system/standardNotes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[StandardNote]: The parsed response data.
+        """
+        return self._parse_many(StandardNote, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> StandardNote:
+        """
+        Performs a POST request against the /system/standardNotes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            StandardNote: The parsed response data.
+        """
+        return self._parse_one(StandardNote, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemStandardnotesCountEndpoint:
+        """
+        The SystemStandardnotesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemStandardnotesCountEndpoint(self.client, parent_endpoint=self))
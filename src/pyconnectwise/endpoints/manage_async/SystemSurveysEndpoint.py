@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSurveysCountEndpoint import SystemSurveysCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSurveysIdEndpoint import SystemSurveysIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSurveysInfoEndpoint import SystemSurveysInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Survey
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemSurveysEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Survey], ConnectWiseManageRequestParams],
+    IAsyncPostable[Survey, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Survey, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "surveys", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Survey])
+        IAsyncPostable.__init__(self, Survey)
+        IAsyncPaginateable.__init__(self, Survey)
+
+    def id(self, _id: int) -> SystemSurveysIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemSurveysIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemSurveysIdEndpoint: The initialized SystemSurveysIdEndpoint object.
+        """
+        child = SystemSurveysIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Survey]:
+        """
+        Performs a GET request against the /system/surveys endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Survey]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Survey, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> list[Survey]:
+        """
+        Performs a GET request against the /system/surveys endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Survey]: The parsed response data.
+        """
+        return self._parse_many(Survey, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Survey:
+        """
+        Performs a POST request against the /system/surveys endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Survey: The parsed response data.
+        """
+        return self._parse_one(Survey, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemSurveysCountEndpoint:
+        """
+        The SystemSurveysCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSurveysCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemSurveysInfoEndpoint:
+        """
+        The SystemSurveysInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSurveysInfoEndpoint(self.client, parent_endpoint=self))
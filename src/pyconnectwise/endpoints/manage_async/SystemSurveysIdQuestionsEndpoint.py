@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSurveysIdQuestionsCountEndpoint import (
+    SystemSurveysIdQuestionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemSurveysIdQuestionsIdEndpoint import SystemSurveysIdQuestionsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import SurveyQuestion
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemSurveysIdQuestionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SurveyQuestion], ConnectWiseManageRequestParams],
+    IAsyncPostable[SurveyQuestion, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SurveyQuestion, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "questions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SurveyQuestion])
+        IAsyncPostable.__init__(self, SurveyQuestion)
+        IAsyncPaginateable.__init__(self, SurveyQuestion)
+
+    def id(self, _id: int) -> SystemSurveysIdQuestionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemSurveysIdQuestionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemSurveysIdQuestionsIdEndpoint: The initialized SystemSurveysIdQuestionsIdEndpoint object.
+        """
+        child = SystemSurveysIdQuestionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SurveyQuestion]:
+        """
+        Performs a GET request against the /system/surveys/{id}/questions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SurveyQuestion]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SurveyQuestion, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SurveyQuestion]:
+        """
+        Performs a GET request against the /system/surveys/{id}/questions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SurveyQuestion]: The parsed response data.
+        """
+        return self._parse_many(SurveyQuestion, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> SurveyQuestion:
+        """
+        Performs a POST request against the /system/surveys/{id}/questions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SurveyQuestion: The parsed response data.
+        """
+        return self._parse_one(SurveyQuestion, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemSurveysIdQuestionsCountEndpoint:
+        """
+        The SystemSurveysIdQuestionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemSurveysIdQuestionsCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,93 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemSurveysIdQuestionsIdValuesIdEndpoint import (
+    SystemSurveysIdQuestionsIdValuesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import SurveyQuestionValue
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemSurveysIdQuestionsIdValuesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[SurveyQuestionValue], ConnectWiseManageRequestParams],
+    IAsyncPostable[SurveyQuestionValue, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[SurveyQuestionValue, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "values", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[SurveyQuestionValue])
+        IAsyncPostable.__init__(self, SurveyQuestionValue)
+        IAsyncPaginateable.__init__(self, SurveyQuestionValue)
+
+    def id(self, _id: int) -> SystemSurveysIdQuestionsIdValuesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemSurveysIdQuestionsIdValuesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemSurveysIdQuestionsIdValuesIdEndpoint: The initialized SystemSurveysIdQuestionsIdValuesIdEndpoint object.
+        """
+        child = SystemSurveysIdQuestionsIdValuesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[SurveyQuestionValue]:
+        """
+        Performs a GET request against the /system/surveys/{id}/questions/{id}/values endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[SurveyQuestionValue]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), SurveyQuestionValue, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[SurveyQuestionValue]:
+        """
+        Performs a GET request against the /system/surveys/{id}/questions/{id}/values endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[SurveyQuestionValue]: The parsed response data.
+        """
+        return self._parse_many(
+            SurveyQuestionValue, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> SurveyQuestionValue:
+        """
+        Performs a POST request against the /system/surveys/{id}/questions/{id}/values endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            SurveyQuestionValue: The parsed response data.
+        """
+        return self._parse_one(
+            SurveyQuestionValue, (await super()._make_request("POST", data=data, params=params)).content
+        )
@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemTimezonesetupsCountEndpoint import SystemTimezonesetupsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemTimezonesetupsIdEndpoint import SystemTimezonesetupsIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemTimezonesetupsInfoEndpoint import SystemTimezonesetupsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TimeZoneSetup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemTimezonesetupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TimeZoneSetup], ConnectWiseManageRequestParams],
+    IAsyncPostable[TimeZoneSetup, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TimeZoneSetup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "timeZoneSetups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TimeZoneSetup])
+        IAsyncPostable.__init__(self, TimeZoneSetup)
+        IAsyncPaginateable.__init__(self, TimeZoneSetup)
+
+    def id(self, _id: int) -> SystemTimezonesetupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemTimezonesetupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemTimezonesetupsIdEndpoint: The initialized SystemTimezonesetupsIdEndpoint object.
+        """
+        child = SystemTimezonesetupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TimeZoneSetup]:
+        """
+        Performs a GET request against the /system/timeZoneSetups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TimeZoneSetup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TimeZoneSetup, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TimeZoneSetup]:
+        """
+        Performs a GET request against the /system/timeZoneSetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TimeZoneSetup]: The parsed response data.
+        """
+        return self._parse_many(TimeZoneSetup, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> TimeZoneSetup:
+        """
+        Performs a POST request against the /system/timeZoneSetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TimeZoneSetup: The parsed response data.
+        """
+        return self._parse_one(TimeZoneSetup, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemTimezonesetupsCountEndpoint:
+        """
+        The SystemTimezonesetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemTimezonesetupsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemTimezonesetupsInfoEndpoint:
+        """
+        The SystemTimezonesetupsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemTimezonesetupsInfoEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemTodaypagecategoriesCountEndpoint import (
+    SystemTodaypagecategoriesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemTodaypagecategoriesIdEndpoint import SystemTodaypagecategoriesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TodayPageCategory
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemTodaypagecategoriesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TodayPageCategory], ConnectWiseManageRequestParams],
+    IAsyncPostable[TodayPageCategory, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TodayPageCategory, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "todayPageCategories", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TodayPageCategory])
+        IAsyncPostable.__init__(self, TodayPageCategory)
+        IAsyncPaginateable.__init__(self, TodayPageCategory)
+
+    def id(self, _id: int) -> SystemTodaypagecategoriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemTodaypagecategoriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemTodaypagecategoriesIdEndpoint: The initialized SystemTodaypagecategoriesIdEndpoint object.
+        """
+        child = SystemTodaypagecategoriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TodayPageCategory]:
+        """
+        Performs a GET request against the /system/todayPageCategories endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TodayPageCategory]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TodayPageCategory, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TodayPageCategory]:
+        """
+        Performs a GET request against the /system/todayPageCategories endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TodayPageCategory]: The parsed response data.
+        """
+        return self._parse_many(
+            TodayPageCategory, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> TodayPageCategory:
+        """
+        Performs a POST request against the /system/todayPageCategories endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TodayPageCategory: The parsed response data.
+        """
+        return self._parse_one(
+            TodayPageCategory, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemTodaypagecategoriesCountEndpoint:
+        """
+        The SystemTodaypagecategoriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemTodaypagecategoriesCountEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,110 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemUserdefinedfieldsCountEndpoint import (
+    SystemUserdefinedfieldsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemUserdefinedfieldsIdEndpoint import SystemUserdefinedfieldsIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemUserdefinedfieldsInfoEndpoint import SystemUserdefinedfieldsInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import UserDefinedField
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemUserdefinedfieldsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[UserDefinedField], ConnectWiseManageRequestParams],
+    IAsyncPostable[UserDefinedField, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[UserDefinedField, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "userDefinedFields", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[UserDefinedField])
+        IAsyncPostable.__init__(self, UserDefinedField)
+        IAsyncPaginateable.__init__(self, UserDefinedField)
+
+    def id(self, _id: int) -> SystemUserdefinedfieldsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemUserdefinedfieldsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemUserdefinedfieldsIdEndpoint: The initialized SystemUserdefinedfieldsIdEndpoint object.
+        """
+        child = SystemUserdefinedfieldsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[UserDefinedField]:
+        """
+        Performs a GET request against the /system/userDefinedFields endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[UserDefinedField]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), UserDefinedField, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[UserDefinedField]:
+        """
+        Performs a GET request against the /system/userDefinedFields endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[UserDefinedField]: The parsed response data.
+        """
+        return self._parse_many(
+            UserDefinedField, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> UserDefinedField:
+        """
+        Performs a POST request against the /system/userDefinedFields endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            UserDefinedField: The parsed response data.
+        """
+        return self._parse_one(
+            UserDefinedField, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemUserdefinedfieldsCountEndpoint:
+        """
+        The SystemUserdefinedfieldsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemUserdefinedfieldsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> SystemUserdefinedfieldsInfoEndpoint:
+        """
+        The SystemUserdefinedfieldsInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemUserdefinedfieldsInfoEndpoint(self.client, parent_endpoint=self))
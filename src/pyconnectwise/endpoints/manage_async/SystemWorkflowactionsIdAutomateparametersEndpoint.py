@@ -0,0 +1,111 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowactionsIdAutomateparametersCountEndpoint import (
+    SystemWorkflowactionsIdAutomateparametersCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemWorkflowactionsIdAutomateparametersIdEndpoint import (
+    SystemWorkflowactionsIdAutomateparametersIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import WorkflowActionAutomateParameter
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemWorkflowactionsIdAutomateparametersEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[WorkflowActionAutomateParameter], ConnectWiseManageRequestParams],
+    IAsyncPostable[WorkflowActionAutomateParameter, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[WorkflowActionAutomateParameter, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "automateParameters", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[WorkflowActionAutomateParameter])
+        IAsyncPostable.__init__(self, WorkflowActionAutomateParameter)
+        IAsyncPaginateable.__init__(self, WorkflowActionAutomateParameter)
+
+    def id(self, _id: int) -> SystemWorkflowactionsIdAutomateparametersIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemWorkflowactionsIdAutomateparametersIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemWorkflowactionsIdAutomateparametersIdEndpoint: The initialized SystemWorkflowactionsIdAutomateparametersIdEndpoint object.
+        """
+        child = SystemWorkflowactionsIdAutomateparametersIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[WorkflowActionAutomateParameter]:
+        """
+        Performs a GET request against the /system/workflowActions/{id}/automateParameters endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[WorkflowActionAutomateParameter]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params),
+            WorkflowActionAutomateParameter,
+            self,
+            page,
+            page_size,
+            params,
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[WorkflowActionAutomateParameter]:
+        """
+        Performs a GET request against the /system/workflowActions/{id}/automateParameters endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[WorkflowActionAutomateParameter]: The parsed response data.
+        """
+        return self._parse_many(
+            WorkflowActionAutomateParameter, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> WorkflowActionAutomateParameter:
+        """
+        Performs a POST request against the /system/workflowActions/{id}/automateParameters endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkflowActionAutomateParameter: The parsed response data.
+        """
+        return self._parse_one(
+            WorkflowActionAutomateParameter, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemWorkflowactionsIdAutomateparametersCountEndpoint:
+        """
+        The SystemWorkflowactionsIdAutomateparametersCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowactionsIdAutomateparametersCountEndpoint(self.client, parent_endpoint=self)
+        )
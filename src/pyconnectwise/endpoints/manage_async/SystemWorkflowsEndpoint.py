@@ -0,0 +1,114 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsCountEndpoint import SystemWorkflowsCountEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdEndpoint import SystemWorkflowsIdEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsTabletypesEndpoint import SystemWorkflowsTabletypesEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsUserdefinedfieldsEndpoint import (
+    SystemWorkflowsUserdefinedfieldsEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import Workflow
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemWorkflowsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[Workflow], ConnectWiseManageRequestParams],
+    IAsyncPostable[Workflow, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Workflow, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "workflows", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[Workflow])
+        IAsyncPostable.__init__(self, Workflow)
+        IAsyncPaginateable.__init__(self, Workflow)
+
+    def id(self, _id: int) -> SystemWorkflowsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemWorkflowsIdEndpoint: The initialized SystemWorkflowsIdEndpoint object.
+        """
+        child = SystemWorkflowsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Workflow]:
+        """
+        Performs a GET request against the /system/workflows endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Workflow]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Workflow, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[Workflow]:
+        """
+        Performs a GET request against the /system/workflows endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[Workflow]: The parsed response data.
+        """
+        return self._parse_many(Workflow, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Workflow:
+        """
+        Performs a POST request against the /system/workflows endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Workflow: The parsed response data.
+        """
+        return self._parse_one(Workflow, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemWorkflowsCountEndpoint:
+        """
+        The SystemWorkflowsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def table_types(self) -> SystemWorkflowsTabletypesEndpoint:
+        """
+        The SystemWorkflowsTabletypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsTabletypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def userdefinedfields(self) -> SystemWorkflowsUserdefinedfieldsEndpoint:
+        """
+        The SystemWorkflowsUserdefinedfieldsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsUserdefinedfieldsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,88 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdAttachmentsCountEndpoint import (
+    SystemWorkflowsIdAttachmentsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdAttachmentsIdEndpoint import (
+    SystemWorkflowsIdAttachmentsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import WorkflowAttachment
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemWorkflowsIdAttachmentsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[WorkflowAttachment], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[WorkflowAttachment, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "attachments", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[WorkflowAttachment])
+        IAsyncPaginateable.__init__(self, WorkflowAttachment)
+
+    def id(self, _id: int) -> SystemWorkflowsIdAttachmentsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdAttachmentsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemWorkflowsIdAttachmentsIdEndpoint: The initialized SystemWorkflowsIdAttachmentsIdEndpoint object.
+        """
+        child = SystemWorkflowsIdAttachmentsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[WorkflowAttachment]:
+        """
+        Performs a GET request against the /system/workflows/{id}/attachments endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[WorkflowAttachment]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), WorkflowAttachment, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[WorkflowAttachment]:
+        """
+        Performs a GET request against the /system/workflows/{id}/attachments endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[WorkflowAttachment]: The parsed response data.
+        """
+        return self._parse_many(
+            WorkflowAttachment, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemWorkflowsIdAttachmentsCountEndpoint:
+        """
+        The SystemWorkflowsIdAttachmentsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdAttachmentsCountEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,138 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdAttachmentsEndpoint import (
+    SystemWorkflowsIdAttachmentsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdCopyEndpoint import SystemWorkflowsIdCopyEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdEventsEndpoint import SystemWorkflowsIdEventsEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdNotifytypesEndpoint import (
+    SystemWorkflowsIdNotifytypesEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdTriggersEndpoint import SystemWorkflowsIdTriggersEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import Workflow
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemWorkflowsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[Workflow, ConnectWiseManageRequestParams],
+    IAsyncPatchable[Workflow, ConnectWiseManageRequestParams],
+    IAsyncPuttable[Workflow, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[Workflow, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, Workflow)
+        IAsyncPatchable.__init__(self, Workflow)
+        IAsyncPuttable.__init__(self, Workflow)
+        IAsyncPaginateable.__init__(self, Workflow)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[Workflow]:
+        """
+        Performs a GET request against the /system/workflows/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[Workflow]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), Workflow, self, page, page_size, params
+        )
+
+    async def delete(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> None:
+        """
+        Performs a DELETE request against the /system/workflows/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        """
+        await super()._make_request("DELETE", data=data, params=params)
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Workflow:
+        """
+        Performs a GET request against the /system/workflows/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Workflow: The parsed response data.
+        """
+        return self._parse_one(Workflow, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def patch(self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None) -> Workflow:
+        """
+        Performs a PATCH request against the /system/workflows/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Workflow: The parsed response data.
+        """
+        return self._parse_one(Workflow, (await super()._make_request("PATCH", data=data, params=params)).content)
+
+    async def put(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> Workflow:
+        """
+        Performs a PUT request against the /system/workflows/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            Workflow: The parsed response data.
+        """
+        return self._parse_one(Workflow, (await super()._make_request("PUT", data=data, params=params)).content)
+
+    @cached_property
+    def attachments(self) -> SystemWorkflowsIdAttachmentsEndpoint:
+        """
+        The SystemWorkflowsIdAttachmentsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdAttachmentsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def copy(self) -> SystemWorkflowsIdCopyEndpoint:
+        """
+        The SystemWorkflowsIdCopyEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdCopyEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def events(self) -> SystemWorkflowsIdEventsEndpoint:
+        """
+        The SystemWorkflowsIdEventsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdEventsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def notify_types(self) -> SystemWorkflowsIdNotifytypesEndpoint:
+        """
+        The SystemWorkflowsIdNotifytypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdNotifytypesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def triggers(self) -> SystemWorkflowsIdTriggersEndpoint:
+        """
+        The SystemWorkflowsIdTriggersEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdTriggersEndpoint(self.client, parent_endpoint=self))
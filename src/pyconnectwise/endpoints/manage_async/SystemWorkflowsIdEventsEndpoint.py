@@ -0,0 +1,98 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdEventsCountEndpoint import (
+    SystemWorkflowsIdEventsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdEventsIdEndpoint import SystemWorkflowsIdEventsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import WorkflowEvent
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemWorkflowsIdEventsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[WorkflowEvent], ConnectWiseManageRequestParams],
+    IAsyncPostable[WorkflowEvent, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[WorkflowEvent, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "events", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[WorkflowEvent])
+        IAsyncPostable.__init__(self, WorkflowEvent)
+        IAsyncPaginateable.__init__(self, WorkflowEvent)
+
+    def id(self, _id: int) -> SystemWorkflowsIdEventsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdEventsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemWorkflowsIdEventsIdEndpoint: The initialized SystemWorkflowsIdEventsIdEndpoint object.
+        """
+        child = SystemWorkflowsIdEventsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[WorkflowEvent]:
+        """
+        Performs a GET request against the /system/workflows/{id}/events endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[WorkflowEvent]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), WorkflowEvent, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[WorkflowEvent]:
+        """
+        Performs a GET request against the /system/workflows/{id}/events endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[WorkflowEvent]: The parsed response data.
+        """
+        return self._parse_many(WorkflowEvent, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> WorkflowEvent:
+        """
+        Performs a POST request against the /system/workflows/{id}/events endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkflowEvent: The parsed response data.
+        """
+        return self._parse_one(WorkflowEvent, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemWorkflowsIdEventsCountEndpoint:
+        """
+        The SystemWorkflowsIdEventsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(SystemWorkflowsIdEventsCountEndpoint(self.client, parent_endpoint=self))
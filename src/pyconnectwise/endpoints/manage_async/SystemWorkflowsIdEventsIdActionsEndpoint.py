@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdEventsIdActionsCountEndpoint import (
+    SystemWorkflowsIdEventsIdActionsCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdEventsIdActionsIdEndpoint import (
+    SystemWorkflowsIdEventsIdActionsIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import WorkflowAction
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemWorkflowsIdEventsIdActionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[WorkflowAction], ConnectWiseManageRequestParams],
+    IAsyncPostable[WorkflowAction, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[WorkflowAction, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "actions", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[WorkflowAction])
+        IAsyncPostable.__init__(self, WorkflowAction)
+        IAsyncPaginateable.__init__(self, WorkflowAction)
+
+    def id(self, _id: int) -> SystemWorkflowsIdEventsIdActionsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdEventsIdActionsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemWorkflowsIdEventsIdActionsIdEndpoint: The initialized SystemWorkflowsIdEventsIdActionsIdEndpoint object.
+        """
+        child = SystemWorkflowsIdEventsIdActionsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[WorkflowAction]:
+        """
+        Performs a GET request against the /system/workflows/{id}/events/{id}/actions endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[WorkflowAction]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), WorkflowAction, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[WorkflowAction]:
+        """
+        Performs a GET request against the /system/workflows/{id}/events/{id}/actions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[WorkflowAction]: The parsed response data.
+        """
+        return self._parse_many(WorkflowAction, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> WorkflowAction:
+        """
+        Performs a POST request against the /system/workflows/{id}/events/{id}/actions endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkflowAction: The parsed response data.
+        """
+        return self._parse_one(WorkflowAction, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> SystemWorkflowsIdEventsIdActionsCountEndpoint:
+        """
+        The SystemWorkflowsIdEventsIdActionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdEventsIdActionsCountEndpoint(self.client, parent_endpoint=self)
+        )
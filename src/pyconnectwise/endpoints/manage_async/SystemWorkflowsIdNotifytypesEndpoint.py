@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdNotifytypesCountEndpoint import (
+    SystemWorkflowsIdNotifytypesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdNotifytypesIdEndpoint import (
+    SystemWorkflowsIdNotifytypesIdEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdNotifytypesInfoEndpoint import (
+    SystemWorkflowsIdNotifytypesInfoEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import WorkflowNotifyType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemWorkflowsIdNotifytypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[WorkflowNotifyType], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[WorkflowNotifyType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "notifyTypes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[WorkflowNotifyType])
+        IAsyncPaginateable.__init__(self, WorkflowNotifyType)
+
+    def id(self, _id: int) -> SystemWorkflowsIdNotifytypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemWorkflowsIdNotifytypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemWorkflowsIdNotifytypesIdEndpoint: The initialized SystemWorkflowsIdNotifytypesIdEndpoint object.
+        """
+        child = SystemWorkflowsIdNotifytypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[WorkflowNotifyType]:
+        """
+        Performs a GET request against the /system/workflows/{id}/notifyTypes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[WorkflowNotifyType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), WorkflowNotifyType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[WorkflowNotifyType]:
+        """
+        Performs a GET request against the /system/workflows/{id}/notifyTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[WorkflowNotifyType]: The parsed response data.
+        """
+        return self._parse_many(
+            WorkflowNotifyType, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemWorkflowsIdNotifytypesCountEndpoint:
+        """
+        The SystemWorkflowsIdNotifytypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdNotifytypesCountEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def info(self) -> SystemWorkflowsIdNotifytypesInfoEndpoint:
+        """
+        The SystemWorkflowsIdNotifytypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdNotifytypesInfoEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,72 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsIdTriggersIdOptionsCountEndpoint import (
+    SystemWorkflowsIdTriggersIdOptionsCountEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import WorkflowTriggerOption
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemWorkflowsIdTriggersIdOptionsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[WorkflowTriggerOption], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[WorkflowTriggerOption, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "options", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[WorkflowTriggerOption])
+        IAsyncPaginateable.__init__(self, WorkflowTriggerOption)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[WorkflowTriggerOption]:
+        """
+        Performs a GET request against the /system/workflows/{id}/triggers/{id}/options endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[WorkflowTriggerOption]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), WorkflowTriggerOption, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[WorkflowTriggerOption]:
+        """
+        Performs a GET request against the /system/workflows/{id}/triggers/{id}/options endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[WorkflowTriggerOption]: The parsed response data.
+        """
+        return self._parse_many(
+            WorkflowTriggerOption, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> SystemWorkflowsIdTriggersIdOptionsCountEndpoint:
+        """
+        The SystemWorkflowsIdTriggersIdOptionsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsIdTriggersIdOptionsCountEndpoint(self.client, parent_endpoint=self)
+        )
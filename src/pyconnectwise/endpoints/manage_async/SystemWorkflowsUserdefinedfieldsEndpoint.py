@@ -0,0 +1,52 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsUserdefinedfieldsActionsEndpoint import (
+    SystemWorkflowsUserdefinedfieldsActionsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsUserdefinedfieldsEventsEndpoint import (
+    SystemWorkflowsUserdefinedfieldsEventsEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsUserdefinedfieldsIdEndpoint import (
+    SystemWorkflowsUserdefinedfieldsIdEndpoint,
+)
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemWorkflowsUserdefinedfieldsEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "userdefinedfields", parent_endpoint=parent_endpoint)
+
+    def id(self, _id: int) -> SystemWorkflowsUserdefinedfieldsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized SystemWorkflowsUserdefinedfieldsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            SystemWorkflowsUserdefinedfieldsIdEndpoint: The initialized SystemWorkflowsUserdefinedfieldsIdEndpoint object.
+        """
+        child = SystemWorkflowsUserdefinedfieldsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    @cached_property
+    def actions(self) -> SystemWorkflowsUserdefinedfieldsActionsEndpoint:
+        """
+        The SystemWorkflowsUserdefinedfieldsActionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsUserdefinedfieldsActionsEndpoint(self.client, parent_endpoint=self)
+        )
+
+    @cached_property
+    def events(self) -> SystemWorkflowsUserdefinedfieldsEventsEndpoint:
+        """
+        The SystemWorkflowsUserdefinedfieldsEventsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsUserdefinedfieldsEventsEndpoint(self.client, parent_endpoint=self)
+        )
@@ -0,0 +1,46 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint import (
+    SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncPostable
+from pyconnectwise.models.manage import WorkflowActionUserDefinedField
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemWorkflowsUserdefinedfieldsEventsIdEndpoint(
+    AsyncConnectWiseEndpoint, IAsyncPostable[WorkflowActionUserDefinedField, ConnectWiseManageRequestParams]
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncPostable.__init__(self, WorkflowActionUserDefinedField)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> WorkflowActionUserDefinedField:
+        """
+        Performs a POST request against the /system/workflows/userdefinedfields/events/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkflowActionUserDefinedField: The parsed response data.
+        """
+        return self._parse_one(
+            WorkflowActionUserDefinedField, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def actions(self) -> SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint:
+        """
+        The SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            SystemWorkflowsUserdefinedfieldsEventsIdActionsEndpoint(self.client, parent_endpoint=self)
+        )
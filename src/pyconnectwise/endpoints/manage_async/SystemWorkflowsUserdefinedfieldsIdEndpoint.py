@@ -0,0 +1,52 @@
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.interfaces import IAsyncPatchable, IAsyncPuttable
+from pyconnectwise.models.manage import WorkflowActionUserDefinedField
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams, PatchRequestData
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class SystemWorkflowsUserdefinedfieldsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncPatchable[WorkflowActionUserDefinedField, ConnectWiseManageRequestParams],
+    IAsyncPuttable[WorkflowActionUserDefinedField, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncPatchable.__init__(self, WorkflowActionUserDefinedField)
+        IAsyncPuttable.__init__(self, WorkflowActionUserDefinedField)
+
+    async def patch(
+        self, data: PatchRequestData, params: ConnectWiseManageRequestParams | None = None
+    ) -> WorkflowActionUserDefinedField:
+        """
+        Performs a PATCH request against the /system/workflows/userdefinedfields/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkflowActionUserDefinedField: The parsed response data.
+        """
+        return self._parse_one(
+            WorkflowActionUserDefinedField, (await super()._make_request("PATCH", data=data, params=params)).content
+        )
+
+    async def put(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> WorkflowActionUserDefinedField:
+        """
+        Performs a PUT request against the /system/workflows/userdefinedfields/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkflowActionUserDefinedField: The parsed response data.
+        """
+        return self._parse_one(
+            WorkflowActionUserDefinedField, (await super()._make_request("PUT", data=data, params=params)).content
+        )
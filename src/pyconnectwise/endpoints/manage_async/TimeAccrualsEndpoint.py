@@ -0,0 +1,94 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.TimeAccrualsCountEndpoint import TimeAccrualsCountEndpoint
+from pyconnectwise.endpoints.manage_async.TimeAccrualsIdEndpoint import TimeAccrualsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TimeAccrual
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class TimeAccrualsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TimeAccrual], ConnectWiseManageRequestParams],
+    IAsyncPostable[TimeAccrual, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TimeAccrual, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "accruals", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TimeAccrual])
+        IAsyncPostable.__init__(self, TimeAccrual)
+        IAsyncPaginateable.__init__(self, TimeAccrual)
+
+    def id(self, _id: int) -> TimeAccrualsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized TimeAccrualsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            TimeAccrualsIdEndpoint: The initialized TimeAccrualsIdEndpoint object.
+        """
+        child = TimeAccrualsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TimeAccrual]:
+        """
+        Performs a GET request against the /time/accruals endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TimeAccrual]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TimeAccrual, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TimeAccrual]:
+        """
+        Performs a GET request against the /time/accruals endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TimeAccrual]: The parsed response data.
+        """
+        return self._parse_many(TimeAccrual, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TimeAccrual:
+        """
+        Performs a POST request against the /time/accruals endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TimeAccrual: The parsed response data.
+        """
+        return self._parse_one(TimeAccrual, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> TimeAccrualsCountEndpoint:
+        """
+        The TimeAccrualsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeAccrualsCountEndpoint(self.client, parent_endpoint=self))
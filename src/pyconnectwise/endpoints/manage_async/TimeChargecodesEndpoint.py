@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.TimeChargecodesCountEndpoint import TimeChargecodesCountEndpoint
+from pyconnectwise.endpoints.manage_async.TimeChargecodesIdEndpoint import TimeChargecodesIdEndpoint
+from pyconnectwise.endpoints.manage_async.TimeChargecodesInfoEndpoint import TimeChargecodesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ChargeCode
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class TimeChargecodesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ChargeCode], ConnectWiseManageRequestParams],
+    IAsyncPostable[ChargeCode, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ChargeCode, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "chargeCodes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ChargeCode])
+        IAsyncPostable.__init__(self, ChargeCode)
+        IAsyncPaginateable.__init__(self, ChargeCode)
+
+    def id(self, _id: int) -> TimeChargecodesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized TimeChargecodesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            TimeChargecodesIdEndpoint: The initialized TimeChargecodesIdEndpoint object.
+        """
+        child = TimeChargecodesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ChargeCode]:
+        """
+        Performs a GET request against the /time/chargeCodes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ChargeCode]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ChargeCode, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ChargeCode]:
+        """
+        Performs a GET request against the /time/chargeCodes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ChargeCode]: The parsed response data.
+        """
+        return self._parse_many(ChargeCode, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> ChargeCode:
+        """
+        Performs a POST request against the /time/chargeCodes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ChargeCode: The parsed response data.
+        """
+        return self._parse_one(ChargeCode, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> TimeChargecodesCountEndpoint:
+        """
+        The TimeChargecodesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeChargecodesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> TimeChargecodesInfoEndpoint:
+        """
+        The TimeChargecodesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeChargecodesInfoEndpoint(self.client, parent_endpoint=self))
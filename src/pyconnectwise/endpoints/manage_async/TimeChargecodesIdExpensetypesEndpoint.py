@@ -0,0 +1,106 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.TimeChargecodesIdExpensetypesCountEndpoint import (
+    TimeChargecodesIdExpensetypesCountEndpoint,
+)
+from pyconnectwise.endpoints.manage_async.TimeChargecodesIdExpensetypesIdEndpoint import (
+    TimeChargecodesIdExpensetypesIdEndpoint,
+)
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import ChargeCodeExpenseType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class TimeChargecodesIdExpensetypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[ChargeCodeExpenseType], ConnectWiseManageRequestParams],
+    IAsyncPostable[ChargeCodeExpenseType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[ChargeCodeExpenseType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "expenseTypes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[ChargeCodeExpenseType])
+        IAsyncPostable.__init__(self, ChargeCodeExpenseType)
+        IAsyncPaginateable.__init__(self, ChargeCodeExpenseType)
+
+    def id(self, _id: int) -> TimeChargecodesIdExpensetypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized TimeChargecodesIdExpensetypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            TimeChargecodesIdExpensetypesIdEndpoint: The initialized TimeChargecodesIdExpensetypesIdEndpoint object.
+        """
+        child = TimeChargecodesIdExpensetypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[ChargeCodeExpenseType]:
+        """
+        Performs a GET request against the /time/chargeCodes/{id}/expenseTypes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[ChargeCodeExpenseType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), ChargeCodeExpenseType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[ChargeCodeExpenseType]:
+        """
+        Performs a GET request against the /time/chargeCodes/{id}/expenseTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[ChargeCodeExpenseType]: The parsed response data.
+        """
+        return self._parse_many(
+            ChargeCodeExpenseType, (await super()._make_request("GET", data=data, params=params)).content
+        )
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> ChargeCodeExpenseType:
+        """
+        Performs a POST request against the /time/chargeCodes/{id}/expenseTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            ChargeCodeExpenseType: The parsed response data.
+        """
+        return self._parse_one(
+            ChargeCodeExpenseType, (await super()._make_request("POST", data=data, params=params)).content
+        )
+
+    @cached_property
+    def count(self) -> TimeChargecodesIdExpensetypesCountEndpoint:
+        """
+        The TimeChargecodesIdExpensetypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(
+            TimeChargecodesIdExpensetypesCountEndpoint(self.client, parent_endpoint=self)
+        )
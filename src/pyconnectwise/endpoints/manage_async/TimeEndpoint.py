@@ -0,0 +1,100 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.TimeAccrualsEndpoint import TimeAccrualsEndpoint
+from pyconnectwise.endpoints.manage_async.TimeActivitystopwatchesEndpoint import TimeActivitystopwatchesEndpoint
+from pyconnectwise.endpoints.manage_async.TimeChargecodesEndpoint import TimeChargecodesEndpoint
+from pyconnectwise.endpoints.manage_async.TimeEntriesEndpoint import TimeEntriesEndpoint
+from pyconnectwise.endpoints.manage_async.TimeInfoEndpoint import TimeInfoEndpoint
+from pyconnectwise.endpoints.manage_async.TimeSchedulestopwatchesEndpoint import TimeSchedulestopwatchesEndpoint
+from pyconnectwise.endpoints.manage_async.TimeSheetsEndpoint import TimeSheetsEndpoint
+from pyconnectwise.endpoints.manage_async.TimeTicketstopwatchesEndpoint import TimeTicketstopwatchesEndpoint
+from pyconnectwise.endpoints.manage_async.TimeTimeperiodsetupsEndpoint import TimeTimeperiodsetupsEndpoint
+from pyconnectwise.endpoints.manage_async.TimeWorkrolesEndpoint import TimeWorkrolesEndpoint
+from pyconnectwise.endpoints.manage_async.TimeWorktypesEndpoint import TimeWorktypesEndpoint
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class TimeEndpoint(AsyncConnectWiseEndpoint):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "time", parent_endpoint=parent_endpoint)
+
+    @cached_property
+    def accruals(self) -> TimeAccrualsEndpoint:
+        """
+        The TimeAccrualsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeAccrualsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def activitystopwatches(self) -> TimeActivitystopwatchesEndpoint:
+        """
+        The TimeActivitystopwatchesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeActivitystopwatchesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def charge_codes(self) -> TimeChargecodesEndpoint:
+        """
+        The TimeChargecodesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeChargecodesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def entries(self) -> TimeEntriesEndpoint:
+        """
+        The TimeEntriesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeEntriesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> TimeInfoEndpoint:
+        """
+        The TimeInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeInfoEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def schedulestopwatches(self) -> TimeSchedulestopwatchesEndpoint:
+        """
+        The TimeSchedulestopwatchesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSchedulestopwatchesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def sheets(self) -> TimeSheetsEndpoint:
+        """
+        The TimeSheetsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def ticketstopwatches(self) -> TimeTicketstopwatchesEndpoint:
+        """
+        The TimeTicketstopwatchesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeTicketstopwatchesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def time_period_setups(self) -> TimeTimeperiodsetupsEndpoint:
+        """
+        The TimeTimeperiodsetupsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeTimeperiodsetupsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def work_roles(self) -> TimeWorkrolesEndpoint:
+        """
+        The TimeWorkrolesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorkrolesEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def work_types(self) -> TimeWorktypesEndpoint:
+        """
+        The TimeWorktypesEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorktypesEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.TimeEntriesCountEndpoint import TimeEntriesCountEndpoint
+from pyconnectwise.endpoints.manage_async.TimeEntriesDefaultsEndpoint import TimeEntriesDefaultsEndpoint
+from pyconnectwise.endpoints.manage_async.TimeEntriesIdEndpoint import TimeEntriesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TimeEntry
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class TimeEntriesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TimeEntry], ConnectWiseManageRequestParams],
+    IAsyncPostable[TimeEntry, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TimeEntry, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "entries", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TimeEntry])
+        IAsyncPostable.__init__(self, TimeEntry)
+        IAsyncPaginateable.__init__(self, TimeEntry)
+
+    def id(self, _id: int) -> TimeEntriesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized TimeEntriesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            TimeEntriesIdEndpoint: The initialized TimeEntriesIdEndpoint object.
+        """
+        child = TimeEntriesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TimeEntry]:
+        """
+        Performs a GET request against the /time/entries endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TimeEntry]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TimeEntry, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TimeEntry]:
+        """
+        Performs a GET request against the /time/entries endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TimeEntry]: The parsed response data.
+        """
+        return self._parse_many(TimeEntry, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TimeEntry:
+        """
+        Performs a POST request against the /time/entries endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TimeEntry: The parsed response data.
+        """
+        return self._parse_one(TimeEntry, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> TimeEntriesCountEndpoint:
+        """
+        The TimeEntriesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeEntriesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def defaults(self) -> TimeEntriesDefaultsEndpoint:
+        """
+        The TimeEntriesDefaultsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeEntriesDefaultsEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,80 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.TimeSheetsCountEndpoint import TimeSheetsCountEndpoint
+from pyconnectwise.endpoints.manage_async.TimeSheetsIdEndpoint import TimeSheetsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import TimeSheet
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class TimeSheetsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TimeSheet], ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TimeSheet, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "sheets", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TimeSheet])
+        IAsyncPaginateable.__init__(self, TimeSheet)
+
+    def id(self, _id: int) -> TimeSheetsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized TimeSheetsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            TimeSheetsIdEndpoint: The initialized TimeSheetsIdEndpoint object.
+        """
+        child = TimeSheetsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TimeSheet]:
+        """
+        Performs a GET request against the /time/sheets endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TimeSheet]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TimeSheet, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TimeSheet]:
+        """
+        Performs a GET request against the /time/sheets endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TimeSheet]: The parsed response data.
+        """
+        return self._parse_many(TimeSheet, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> TimeSheetsCountEndpoint:
+        """
+        The TimeSheetsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsCountEndpoint(self.client, parent_endpoint=self))
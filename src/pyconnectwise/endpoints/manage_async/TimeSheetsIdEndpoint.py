@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.TimeSheetsIdApproveEndpoint import TimeSheetsIdApproveEndpoint
+from pyconnectwise.endpoints.manage_async.TimeSheetsIdAuditsEndpoint import TimeSheetsIdAuditsEndpoint
+from pyconnectwise.endpoints.manage_async.TimeSheetsIdRejectEndpoint import TimeSheetsIdRejectEndpoint
+from pyconnectwise.endpoints.manage_async.TimeSheetsIdReverseEndpoint import TimeSheetsIdReverseEndpoint
+from pyconnectwise.endpoints.manage_async.TimeSheetsIdSubmitEndpoint import TimeSheetsIdSubmitEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable
+from pyconnectwise.models.manage import TimeSheet
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class TimeSheetsIdEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[TimeSheet, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TimeSheet, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "{id}", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, TimeSheet)
+        IAsyncPaginateable.__init__(self, TimeSheet)
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TimeSheet]:
+        """
+        Performs a GET request against the /time/sheets/{id} endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TimeSheet]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TimeSheet, self, page, page_size, params
+        )
+
+    async def get(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> TimeSheet:
+        """
+        Performs a GET request against the /time/sheets/{id} endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TimeSheet: The parsed response data.
+        """
+        return self._parse_one(TimeSheet, (await super()._make_request("GET", data=data, params=params)).content)
+
+    @cached_property
+    def approve(self) -> TimeSheetsIdApproveEndpoint:
+        """
+        The TimeSheetsIdApproveEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsIdApproveEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def audits(self) -> TimeSheetsIdAuditsEndpoint:
+        """
+        The TimeSheetsIdAuditsEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsIdAuditsEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reject(self) -> TimeSheetsIdRejectEndpoint:
+        """
+        The TimeSheetsIdRejectEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsIdRejectEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def reverse(self) -> TimeSheetsIdReverseEndpoint:
+        """
+        The TimeSheetsIdReverseEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsIdReverseEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def submit(self) -> TimeSheetsIdSubmitEndpoint:
+        """
+        The TimeSheetsIdSubmitEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeSheetsIdSubmitEndpoint(self.client, parent_endpoint=self))
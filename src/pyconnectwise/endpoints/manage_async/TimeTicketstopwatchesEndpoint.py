@@ -0,0 +1,96 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.TimeTicketstopwatchesCountEndpoint import TimeTicketstopwatchesCountEndpoint
+from pyconnectwise.endpoints.manage_async.TimeTicketstopwatchesIdEndpoint import TimeTicketstopwatchesIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TicketStopwatch
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class TimeTicketstopwatchesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TicketStopwatch], ConnectWiseManageRequestParams],
+    IAsyncPostable[TicketStopwatch, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TicketStopwatch, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "ticketstopwatches", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TicketStopwatch])
+        IAsyncPostable.__init__(self, TicketStopwatch)
+        IAsyncPaginateable.__init__(self, TicketStopwatch)
+
+    def id(self, _id: int) -> TimeTicketstopwatchesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized TimeTicketstopwatchesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            TimeTicketstopwatchesIdEndpoint: The initialized TimeTicketstopwatchesIdEndpoint object.
+        """
+        child = TimeTicketstopwatchesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TicketStopwatch]:
+        """
+        Performs a GET request against the /time/ticketstopwatches endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TicketStopwatch]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TicketStopwatch, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TicketStopwatch]:
+        """
+        Performs a GET request against the /time/ticketstopwatches endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TicketStopwatch]: The parsed response data.
+        """
+        return self._parse_many(TicketStopwatch, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> TicketStopwatch:
+        """
+        Performs a POST request against the /time/ticketstopwatches endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TicketStopwatch: The parsed response data.
+        """
+        return self._parse_one(TicketStopwatch, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> TimeTicketstopwatchesCountEndpoint:
+        """
+        The TimeTicketstopwatchesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeTicketstopwatchesCountEndpoint(self.client, parent_endpoint=self))
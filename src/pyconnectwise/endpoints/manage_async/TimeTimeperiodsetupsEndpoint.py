@@ -0,0 +1,104 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.TimeTimeperiodsetupsCountEndpoint import TimeTimeperiodsetupsCountEndpoint
+from pyconnectwise.endpoints.manage_async.TimeTimeperiodsetupsDefaultEndpoint import TimeTimeperiodsetupsDefaultEndpoint
+from pyconnectwise.endpoints.manage_async.TimeTimeperiodsetupsIdEndpoint import TimeTimeperiodsetupsIdEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import TimePeriodSetup
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class TimeTimeperiodsetupsEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[TimePeriodSetup], ConnectWiseManageRequestParams],
+    IAsyncPostable[TimePeriodSetup, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[TimePeriodSetup, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "timePeriodSetups", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[TimePeriodSetup])
+        IAsyncPostable.__init__(self, TimePeriodSetup)
+        IAsyncPaginateable.__init__(self, TimePeriodSetup)
+
+    def id(self, _id: int) -> TimeTimeperiodsetupsIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized TimeTimeperiodsetupsIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            TimeTimeperiodsetupsIdEndpoint: The initialized TimeTimeperiodsetupsIdEndpoint object.
+        """
+        child = TimeTimeperiodsetupsIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[TimePeriodSetup]:
+        """
+        Performs a GET request against the /time/timePeriodSetups endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[TimePeriodSetup]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), TimePeriodSetup, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[TimePeriodSetup]:
+        """
+        Performs a GET request against the /time/timePeriodSetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[TimePeriodSetup]: The parsed response data.
+        """
+        return self._parse_many(TimePeriodSetup, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> TimePeriodSetup:
+        """
+        Performs a POST request against the /time/timePeriodSetups endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            TimePeriodSetup: The parsed response data.
+        """
+        return self._parse_one(TimePeriodSetup, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> TimeTimeperiodsetupsCountEndpoint:
+        """
+        The TimeTimeperiodsetupsCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeTimeperiodsetupsCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def default(self) -> TimeTimeperiodsetupsDefaultEndpoint:
+        """
+        The TimeTimeperiodsetupsDefaultEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeTimeperiodsetupsDefaultEndpoint(self.client, parent_endpoint=self))
@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.TimeWorkrolesCountEndpoint import TimeWorkrolesCountEndpoint
+from pyconnectwise.endpoints.manage_async.TimeWorkrolesIdEndpoint import TimeWorkrolesIdEndpoint
+from pyconnectwise.endpoints.manage_async.TimeWorkrolesInfoEndpoint import TimeWorkrolesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import WorkRole
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class TimeWorkrolesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[WorkRole], ConnectWiseManageRequestParams],
+    IAsyncPostable[WorkRole, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[WorkRole, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "workRoles", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[WorkRole])
+        IAsyncPostable.__init__(self, WorkRole)
+        IAsyncPaginateable.__init__(self, WorkRole)
+
+    def id(self, _id: int) -> TimeWorkrolesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized TimeWorkrolesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            TimeWorkrolesIdEndpoint: The initialized TimeWorkrolesIdEndpoint object.
+        """
+        child = TimeWorkrolesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[WorkRole]:
+        """
+        Performs a GET request against the /time/workRoles endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[WorkRole]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), WorkRole, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[WorkRole]:
+        """
+        Performs a GET request against the /time/workRoles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[WorkRole]: The parsed response data.
+        """
+        return self._parse_many(WorkRole, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WorkRole:
+        """
+        Performs a POST request against the /time/workRoles endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkRole: The parsed response data.
+        """
+        return self._parse_one(WorkRole, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> TimeWorkrolesCountEndpoint:
+        """
+        The TimeWorkrolesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorkrolesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> TimeWorkrolesInfoEndpoint:
+        """
+        The TimeWorkrolesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorkrolesInfoEndpoint(self.client, parent_endpoint=self))
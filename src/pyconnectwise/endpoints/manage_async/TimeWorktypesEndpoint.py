@@ -0,0 +1,102 @@
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+from pyconnectwise.endpoints.base.async_connectwise_endpoint import AsyncConnectWiseEndpoint
+from pyconnectwise.endpoints.manage_async.TimeWorktypesCountEndpoint import TimeWorktypesCountEndpoint
+from pyconnectwise.endpoints.manage_async.TimeWorktypesIdEndpoint import TimeWorktypesIdEndpoint
+from pyconnectwise.endpoints.manage_async.TimeWorktypesInfoEndpoint import TimeWorktypesInfoEndpoint
+from pyconnectwise.interfaces import IAsyncGettable, IAsyncPaginateable, IAsyncPostable
+from pyconnectwise.models.manage import WorkType
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.types import JSON, ConnectWiseManageRequestParams
+
+if TYPE_CHECKING:
+    from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient
+
+
+class TimeWorktypesEndpoint(
+    AsyncConnectWiseEndpoint,
+    IAsyncGettable[list[WorkType], ConnectWiseManageRequestParams],
+    IAsyncPostable[WorkType, ConnectWiseManageRequestParams],
+    IAsyncPaginateable[WorkType, ConnectWiseManageRequestParams],
+):
+    def __init__(self, client: "AsyncConnectWiseClient", parent_endpoint: AsyncConnectWiseEndpoint = None) -> None:
+        AsyncConnectWiseEndpoint.__init__(self, client, "workTypes", parent_endpoint=parent_endpoint)
+        IAsyncGettable.__init__(self, list[WorkType])
+        IAsyncPostable.__init__(self, WorkType)
+        IAsyncPaginateable.__init__(self, WorkType)
+
+    def id(self, _id: int) -> TimeWorktypesIdEndpoint:
+        """
+        Sets the ID for this endpoint and returns an initialized TimeWorktypesIdEndpoint object to move down the chain.
+
+        Parameters:
+            _id (int): The ID to set.
+        Returns:
+            TimeWorktypesIdEndpoint: The initialized TimeWorktypesIdEndpoint object.
+        """
+        child = TimeWorktypesIdEndpoint(self.client, parent_endpoint=self)
+        child._id = _id
+        return child
+
+    async def paginated(
+        self, page: int, page_size: int, params: ConnectWiseManageRequestParams | None = None
+    ) -> AsyncPaginatedResponse[WorkType]:
+        """
+        Performs a GET request against the /time/workTypes endpoint and returns an initialized AsyncPaginatedResponse object.
+
+        Parameters:
+            page (int): The page number to request.
+            page_size (int): The number of results to return per page.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            AsyncPaginatedResponse[WorkType]: The initialized AsyncPaginatedResponse object.
+        """
+        if params:
+            params["page"] = page
+            params["pageSize"] = page_size
+        else:
+            params = {"page": page, "pageSize": page_size}
+        return AsyncPaginatedResponse(
+            await super()._make_request("GET", params=params), WorkType, self, page, page_size, params
+        )
+
+    async def get(
+        self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None
+    ) -> list[WorkType]:
+        """
+        Performs a GET request against the /time/workTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            list[WorkType]: The parsed response data.
+        """
+        return self._parse_many(WorkType, (await super()._make_request("GET", data=data, params=params)).content)
+
+    async def post(self, data: JSON | None = None, params: ConnectWiseManageRequestParams | None = None) -> WorkType:
+        """
+        Performs a POST request against the /time/workTypes endpoint.
+
+        Parameters:
+            data (dict[str, Any]): The data to send in the request body.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Returns:
+            WorkType: The parsed response data.
+        """
+        return self._parse_one(WorkType, (await super()._make_request("POST", data=data, params=params)).content)
+
+    @cached_property
+    def count(self) -> TimeWorktypesCountEndpoint:
+        """
+        The TimeWorktypesCountEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorktypesCountEndpoint(self.client, parent_endpoint=self))
+
+    @cached_property
+    def info(self) -> TimeWorktypesInfoEndpoint:
+        """
+        The TimeWorktypesInfoEndpoint child endpoint, created on first access and reused afterwards.
+        """
+        return self._register_child_endpoint(TimeWorktypesInfoEndpoint(self.client, parent_endpoint=self))
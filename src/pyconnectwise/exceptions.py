@@ -1,15 +1,21 @@
+from __future__ import annotations
+
 import json
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar
 from urllib.parse import urlsplit, urlunsplit
 
-from requests import JSONDecodeError, Response
+from pyconnectwise.utils.helpers import get_reason_phrase
+
+if TYPE_CHECKING:
+    import httpx
+    from requests import Response
 
 
 class ConnectWiseException(Exception):  # noqa: N818
     _code_explanation: ClassVar[str] = ""  # Ex: for 404 "Not Found"
     _error_suggestion: ClassVar[str] = ""  # Ex: for 404 "Check the URL you are using is correct"
 
-    def __init__(self, req_response: Response, *, extra_message: str = "") -> None:
+    def __init__(self, req_response: Response | httpx.Response, *, extra_message: str = "") -> None:
         self.response = req_response
         self.extra_message = extra_message
         super().__init__(self.message())
@@ -18,7 +24,7 @@ class ConnectWiseException(Exception):  # noqa: N818
         """
         Simplify URL down to method, hostname, and path.
         """
-        url_components = urlsplit(self.response.url)
+        url_components = urlsplit(str(self.response.url))
         return urlunsplit(
             (
                 url_components.scheme,
@@ -33,13 +39,13 @@ class ConnectWiseException(Exception):  # noqa: N818
         try:
             # If response was json, then format it nicely
             return json.dumps(self.response.json(), indent=4)
-        except JSONDecodeError:
+        except json.JSONDecodeError:
             return self.response.text
 
     def message(self) -> str:
         return (
             f"A HTTP {self.response.status_code} ({self._code_explanation}) error has occurred while requesting"
-            f" {self._get_sanitized_url()}.\n{self.response.reason}\n{self._error_suggestion}\n{self.extra_message}"
+            f" {self._get_sanitized_url()}.\n{get_reason_phrase(self.response)}\n{self._error_suggestion}\n{self.extra_message}"
         ).strip()  # Remove extra whitespace (Ex: if extra_message == "")
 
 
@@ -76,10 +82,23 @@ class ConflictException(ConnectWiseException):
     _error_suggestion = "This resource is possibly in use or conflicts with another record."
 
 
+class TooManyRequestsException(ConnectWiseException):
+    _code_explanation = "Too Many Requests"
+    _error_suggestion = (
+        "The API is rate limiting your requests. Consider lowering your request rate with a RateLimiter, or allowing"
+        " more retries with a RetryPolicy (see pyconnectwise.config.Config)."
+    )
+
+
 class ServerError(ConnectWiseException):
     _code_explanation = "Internal Server Error"
 
 
+class ServiceUnavailableError(ServerError):
+    _code_explanation = "Service Unavailable"
+    _error_suggestion = "The API or a proxy in front of it is temporarily unavailable or overloaded. Try again later."
+
+
 class ObjectExistsError(ConnectWiseException):
     _code_explanation = "Object Exists"
     _error_suggestion = "This resource already exists."
@@ -0,0 +1,416 @@
+from __future__ import annotations
+
+import bz2
+import contextlib
+import csv
+import gzip
+import hashlib
+import io
+import json
+import lzma
+import os
+import queue
+import threading
+from abc import ABC, abstractmethod
+from typing import IO, TYPE_CHECKING, Any
+
+from pyconnectwise.hydration import _get_id_alias
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from pyconnectwise.interfaces import IPaginateable
+    from pyconnectwise.types import RequestParams
+
+FORMATS = ("ndjson", "csv", "parquet")
+# The compression for NDJSON and CSV files, by name and by file extension. Each page is compressed on its own, which
+# concatenate into a file any gzip, bz2 or xz reader can read, so a checkpointed export can be cut back to its last
+# committed page and appended to
+COMPRESSIONS: dict[str, Callable[[bytes], bytes]] = {"gzip": gzip.compress, "bz2": bz2.compress, "xz": lzma.compress}
+COMPRESSION_EXTENSIONS = {".gz": "gzip", ".bz2": "bz2", ".xz": "xz"}
+# How the field catalog's types are written to Parquet. Anything else (strings, dates, literals, UUIDs, and nested
+# dicts and lists as JSON) is written as a string
+PARQUET_TYPES = {"int": "int64", "float": "float64", "bool": "bool_"}
+
+
+def export(
+    endpoint: IPaginateable,
+    path: str,
+    format: str | None = None,  # noqa: A002
+    compression: str | None = None,
+    params: RequestParams | None = None,
+    page_size: int = 1000,
+    queue_size: int = 4,
+    row_group_size: int = 50_000,
+    checkpoint: str | None = None,
+    header: bool = True,  # noqa: FBT001, FBT002
+) -> int:
+    """
+    Export every item of an endpoint to a file, a page at a time, without holding more than a few pages in memory.
+    Pages are fetched on a background thread while the previous ones are written, through a queue of at most
+    queue_size pages, so the API and the disk are kept busy at the same time.
+
+    NDJSON files get an item per line, as the API returns it. CSV and Parquet files get a column per field of the
+    endpoint's model, with the fields of nested models flattened into their own columns by path (e.g. company/id);
+    any other nested dicts and lists are written as JSON. Parquet needs pyarrow, and is written a row group at a time.
+
+    Long exports can be checkpointed, so they can be resumed after a crash, a deploy or an expired token instead of
+    starting over. Once each page is written and synced to disk, the id of its last item and the size of the file are
+    saved to the checkpoint file. Running the same export with the same checkpoint cuts the file back to the last
+    committed page and carries on after it, so no item is written twice. The checkpoint is deleted once the export
+    finishes. A checkpoint only resumes the export it was saved by: the same endpoint, parameters, format and
+    compression, and the same version of the endpoint's model.
+
+    Also available as client.export(endpoint, path, ...).
+
+    Args:
+        endpoint (IPaginateable): The endpoint to export.
+        path (str): The file to write.
+        format (str, optional): "ndjson", "csv" or "parquet" (default = from the path's extension, e.g.
+            "tickets.csv.gz").
+        compression (str, optional): For NDJSON and CSV, "gzip", "bz2" or "xz". For Parquet, any codec pyarrow
+            supports, e.g. "snappy" or "zstd" (default = from the path's extension for NDJSON and CSV, or none;
+            "snappy" for Parquet).
+        params (dict, optional): The query parameters to send, e.g. conditions to export some of the items.
+        page_size (int): The number of items to request per page (default = 1000).
+        queue_size (int): The most pages fetched ahead of the writer (default = 4).
+        row_group_size (int): The number of rows per Parquet row group (default = 50,000).
+        checkpoint (str, optional): The file to save the export's progress to, and resume it from. Parquet
+            exports can't be checkpointed, as a Parquet file can't be appended to.
+        header (bool): Whether to start a CSV file with a row of column names (default = True).
+
+    Returns:
+        int: The number of items exported, including any exported before the export was resumed.
+
+    Example:
+        client.export(client.time.entries, "time_entries.parquet", params={"conditions": "dateEntered > [2024-01-01]"})
+    """
+    format, compression = _get_format(path, format, compression)  # noqa: A001
+    model: Any = endpoint.model
+    if format == "parquet":
+        if checkpoint is not None:
+            message = "Parquet exports can't be checkpointed, export to NDJSON or CSV to resume them"
+            raise ValueError(message)
+        writer: _Writer = _ParquetWriter(path, model, compression or "snappy", row_group_size)
+        return _write(writer, _get_pages(endpoint, params, page_size), queue_size)
+
+    extract = {
+        "url": endpoint._get_endpoint_url(),  # type: ignore[attr-defined]
+        "params": {key: str(value) for key, value in sorted((params or {}).items())},
+        "format": format,
+        "compression": compression,
+        "schema": _get_schema_hash(model),
+    }
+    saved = _Checkpoint(checkpoint, extract, _get_id_alias(model)) if checkpoint is not None else None
+    offset = saved.offset if saved is not None and saved.last_id is not None else None
+    file = open(path, "r+b" if offset is not None else "wb")  # noqa: PTH123, SIM115
+    if offset is not None:
+        if file.seek(0, os.SEEK_END) < offset:
+            file.close()
+            message = f"{path!r} is shorter than its checkpoint says, so the export can't be resumed from it"
+            raise ValueError(message)
+        # Anything after the last committed page is cut, as it will be fetched and written again
+        file.truncate(offset)
+        file.seek(offset)
+    if format == "ndjson":
+        writer = _NDJSONWriter(file, compression)
+    else:
+        writer = _CSVWriter(file, compression, model, header=header and offset is None)
+
+    pages = _get_pages(endpoint, params, page_size, saved.last_id if saved is not None else None)
+    count = _write(writer, pages, queue_size, saved)
+    if saved is not None:
+        saved.remove()
+    return count
+
+
+def _get_format(path: str, format: str | None, compression: str | None) -> tuple[str, str | None]:  # noqa: A002
+    """
+    Work out the format and compression of an export, from the path's extension where they aren't given.
+    """
+    suffixes = [suffix.lower() for suffix in path.rsplit("/", 1)[-1].split(".")[1:]]
+    if compression is None and suffixes and f".{suffixes[-1]}" in COMPRESSION_EXTENSIONS:
+        compression = COMPRESSION_EXTENSIONS[f".{suffixes.pop()}"]
+    if format is None:
+        format = suffixes[-1] if suffixes else None  # noqa: A001
+        format = "ndjson" if format in ("jsonl", "json") else format  # noqa: A001
+    if format not in FORMATS:
+        message = f"Can't export to {path!r}, choose a format from {', '.join(FORMATS)}"
+        raise ValueError(message)
+    if format != "parquet" and compression is not None and compression not in COMPRESSIONS:
+        message = f"Can't compress {format} files with {compression!r}, choose from {', '.join(COMPRESSIONS)}"
+        raise ValueError(message)
+    return format, compression
+
+
+def _get_schema_hash(model: Any) -> str:  # noqa: ANN401
+    """
+    Hash the fields of a model, and their types, to tell whether a checkpoint was saved with a different version.
+    """
+    fields = json.dumps(model._get_field_names_and_types(), sort_keys=True)
+    return hashlib.sha256(fields.encode()).hexdigest()
+
+
+def _get_pages(
+    endpoint: IPaginateable,
+    params: RequestParams | None,
+    page_size: int,
+    after: Any = None,  # noqa: ANN401
+) -> Iterator[list[dict]]:
+    # The items are written as they came from the API, so there's no need to validate them into models
+    raw_endpoint = endpoint.with_response_mode("raw")  # type: ignore[attr-defined]
+    pages = raw_endpoint.keyset_paginated(page_size, dict(params) if params else None, after=after)
+    while pages.has_data:
+        yield pages.data
+        pages.get_next_page()
+
+
+def _write(writer: _Writer, pages: Iterator[list[dict]], queue_size: int, checkpoint: _Checkpoint | None = None) -> int:
+    count = checkpoint.rows if checkpoint is not None else 0
+    try:
+        for page in _prefetch(pages, queue_size):
+            writer.write(page)
+            count += len(page)
+            if checkpoint is not None:
+                checkpoint.save(page, count, writer.commit())
+    finally:
+        writer.close()
+    return count
+
+
+class _Checkpoint:
+    """
+    The progress of a checkpointed export, saved to a JSON file after every committed page. The file is replaced
+    atomically, so a crash mid-write leaves the previous checkpoint.
+    """
+
+    def __init__(self, path: str, extract: dict[str, Any], id_alias: str) -> None:
+        self.path = path
+        self.extract = extract
+        self.id_alias = id_alias
+        self.pages = 0
+        self.rows = 0
+        self.offset = 0
+        self.last_id: Any = None
+        try:
+            with open(path) as f:  # noqa: PTH123
+                data = json.load(f)
+        except FileNotFoundError:
+            return
+        if data["extract"] != extract:
+            message = f"The checkpoint {path!r} is for a different export, delete it to start this one over"
+            raise ValueError(message)
+        self.pages = data["pages"]
+        self.rows = data["rows"]
+        self.offset = data["offset"]
+        self.last_id = data["last_id"]
+
+    def save(self, page: list[dict], rows: int, offset: int) -> None:
+        self.pages += 1
+        self.rows = rows
+        self.offset = offset
+        self.last_id = page[-1][self.id_alias]
+        data = {
+            "extract": self.extract,
+            "pages": self.pages,
+            "rows": self.rows,
+            "offset": self.offset,
+            "last_id": self.last_id,
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w") as f:  # noqa: PTH123
+            json.dump(data, f)
+        os.replace(temp_path, self.path)  # noqa: PTH105
+
+    def remove(self) -> None:
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)  # noqa: PTH107
+
+
+class _Done:
+    pass
+
+
+def _prefetch(pages: Iterator[list[dict]], queue_size: int) -> Iterator[list[dict]]:
+    """
+    Fetch pages on a background thread, at most queue_size pages ahead of the caller.
+    """
+    pending: queue.Queue[Any] = queue.Queue(queue_size)
+    stopped = threading.Event()
+    fetcher = threading.Thread(target=_fetch, args=(pages, pending, stopped), daemon=True)
+    fetcher.start()
+    try:
+        while True:
+            item = pending.get()
+            if item is _Done:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        stopped.set()
+        fetcher.join()
+
+
+def _fetch(pages: Iterator[list[dict]], pending: queue.Queue[Any], stopped: threading.Event) -> None:
+    try:
+        for page in pages:
+            if not _put(pending, stopped, page):
+                return
+        _put(pending, stopped, _Done)
+    except Exception as e:
+        _put(pending, stopped, e)
+
+
+def _put(pending: queue.Queue[Any], stopped: threading.Event, item: Any) -> bool:  # noqa: ANN401
+    # Gives up once the caller has stopped reading, e.g. because writing failed
+    while not stopped.is_set():
+        try:
+            pending.put(item, timeout=0.1)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+class _Flattener:
+    """
+    Flattens items into rows with a column per field of a model, by the field's path (e.g. company/id). Fields that
+    are dicts or lists, rather than nested models, are written as JSON.
+
+    Items only have some of the fields, so rather than looking up every column in each item, the item's own fields
+    are walked and placed into their columns.
+    """
+
+    def __init__(self, model: Any, booleans: tuple[Any, Any] = (False, True)) -> None:  # noqa: ANN401
+        self.columns: list[str] = model._get_field_names()
+        self.booleans = booleans
+        # The column index of each field, by path, as a tree of dicts
+        self.tree: dict[str, Any] = {}
+        for index, name in enumerate(self.columns):
+            *parents, field = name.split("/")
+            node = self.tree
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            node[field] = index
+
+    def flatten(self, item: dict[str, Any]) -> list[Any]:
+        row: list[Any] = [None] * len(self.columns)
+        self._fill(row, item, self.tree)
+        return row
+
+    def _fill(self, row: list[Any], item: dict[str, Any], tree: dict[str, Any]) -> None:
+        for name, value in item.items():
+            column = tree.get(name)
+            if column is None:
+                continue
+            if isinstance(column, dict):
+                if isinstance(value, dict):
+                    self._fill(row, value, column)
+            elif isinstance(value, dict | list):
+                row[column] = json.dumps(value)
+            elif isinstance(value, bool):
+                row[column] = self.booleans[value]
+            else:
+                row[column] = value
+
+
+class _Writer(ABC):
+    @abstractmethod
+    def write(self, items: list[dict]) -> None:
+        pass
+
+    @abstractmethod
+    def commit(self) -> int:
+        """
+        Make sure everything written so far is on disk, and return the size of the file.
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        pass
+
+
+class _TextWriter(_Writer):
+    def __init__(self, file: IO[bytes], compression: str | None) -> None:
+        self.file = file
+        self.compress = COMPRESSIONS[compression] if compression is not None else None
+
+    def _write_text(self, text: str) -> None:
+        data = text.encode()
+        self.file.write(self.compress(data) if self.compress is not None else data)
+
+    def commit(self) -> int:
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        return self.file.tell()
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _NDJSONWriter(_TextWriter):
+    def write(self, items: list[dict]) -> None:
+        self._write_text("".join(f"{json.dumps(item)}\n" for item in items))
+
+
+class _CSVWriter(_TextWriter):
+    def __init__(
+        self, file: IO[bytes], compression: str | None, model: Any, *, header: bool = True  # noqa: ANN401
+    ) -> None:
+        super().__init__(file, compression)
+        self.flattener = _Flattener(model, booleans=("false", "true"))
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+        if header:
+            self.writer.writerow(self.flattener.columns)
+
+    def write(self, items: list[dict]) -> None:
+        self.writer.writerows([self.flattener.flatten(item) for item in items])
+        self._write_text(self.buffer.getvalue())
+        self.buffer.seek(0)
+        self.buffer.truncate()
+
+
+class _ParquetWriter(_Writer):
+    def __init__(self, path: str, model: Any, compression: str, row_group_size: int) -> None:  # noqa: ANN401
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError(  # noqa: TRY003
+                "Exporting to Parquet requires pyarrow. Install it with `pip install pyconnectwise[parquet]`."
+            ) from e
+
+        self.pa = pa
+        self.flattener = _Flattener(model)
+        field_types = model._get_field_names_and_types()
+        self.schema = pa.schema(
+            [
+                (name, getattr(pa, PARQUET_TYPES.get(field_types.get(name, ""), "string"))())
+                for name in self.flattener.columns
+            ]
+        )
+        self.writer = pq.ParquetWriter(path, self.schema, compression=compression)
+        self.row_group_size = row_group_size
+        self.rows: list[list[Any]] = []
+
+    def write(self, items: list[dict]) -> None:
+        self.rows.extend(self.flattener.flatten(item) for item in items)
+        if len(self.rows) >= self.row_group_size:
+            self._write_row_group()
+
+    def _write_row_group(self) -> None:
+        columns = [list(column) for column in zip(*self.rows, strict=True)]
+        self.writer.write_table(self.pa.Table.from_arrays(columns, schema=self.schema))
+        self.rows = []
+
+    def commit(self) -> int:
+        # A Parquet file can only be read once it's closed and has its footer, so it can't be resumed part way
+        message = "Parquet exports can't be checkpointed, export to NDJSON or CSV to resume them"
+        raise ValueError(message)
+
+    def close(self) -> None:
+        if self.rows:
+            self._write_row_group()
+        self.writer.close()
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pyconnectwise.models.base.connectwise_model import FieldPath
+
+# A reference to hydrate, e.g. Ticket.company, and the endpoint to look up the full objects from,
+# e.g. client.company.companies
+Reference = tuple["FieldPath", Any]
+
+
+class Hydrator:
+    """
+    Looks up the full objects that references in models refer to (like a ticket's CompanyReference, which only has
+    the company's id, identifier and name), without looking each one up on its own.
+
+    For each reference, the distinct ids referred to across all of the items are looked up together with the
+    endpoint's get_many_by_ids(), in concurrent chunks, and each kind of object is looked up at the same time.
+    Each object is only looked up once per hydrator: it keeps every object it's found in an identity map, keyed by
+    model and id, so reusing the hydrator for more pages (or other references to the same kind of object, like
+    a ticket's owner and the member who last updated it) reuses them, and items referring to the same object share
+    one instance.
+
+        hydrator = Hydrator()
+        tickets = client.service.tickets.paginated(1, 1000).data
+        hydrator.prefetch(
+            tickets,
+            (Ticket.company, client.company.companies),
+            (Ticket.owner, client.system.members),
+        )
+        hydrator.resolve(tickets[0], Ticket.company).address_line1  # the ticket's Company
+
+    prefetch() leaves the items as they are, so they still validate and dump as their own model (a Company doesn't
+    fit in a ticket's CompanyReference field), and resolve() gets the object a reference refers to. Works in both
+    response modes, with models or dicts.
+    """
+
+    def __init__(self) -> None:
+        self._objects: dict[tuple[type, Any], Any] = {}
+        # The model of the objects each hydrated reference refers to, by the model and names of its path
+        self._references: dict[tuple[type, tuple[str, ...]], type] = {}
+
+    def get(self, model: type, id_: Any) -> Any:  # noqa: ANN401
+        """
+        Get an object that's been looked up, by its model and id.
+
+        Returns:
+            The object, or None if it hasn't been looked up or wasn't found.
+        """
+        return self._objects.get((model, id_))
+
+    def resolve(self, item: Any, path: FieldPath) -> Any:  # noqa: ANN401
+        """
+        Get the full object that one of an item's hydrated references refers to.
+
+        Args:
+            item: The item, e.g. a ticket.
+            path (FieldPath): The reference, e.g. Ticket.company.
+
+        Returns:
+            The object, or None if the item has no reference, or it hasn't been hydrated or wasn't found.
+        """
+        model = self._references.get((path.model, path.names))
+        if model is None:
+            return None
+        return self._objects.get((model, _get_value(_get_reference(item, path), "id", _get_id_alias(model))))
+
+    def prefetch(self, items: Iterable[Any], *references: Reference) -> None:
+        """
+        Look up the objects the given references in each of the items refer to, to get with resolve().
+
+        Args:
+            items (Iterable): The items, e.g. a page of models.
+            *references (tuple[FieldPath, endpoint]): The references to hydrate, each along with the endpoint to look
+                up the objects they refer to from.
+        """
+        items = list(items)
+        missing = self._get_missing_ids(items, references)
+        if missing:
+            with ThreadPoolExecutor(len(missing)) as executor:
+                found = list(executor.map(lambda endpoint: endpoint.get_many_by_ids(missing[endpoint]), missing))
+            for endpoint, objects in zip(missing, found, strict=True):
+                self._add_objects(endpoint, missing[endpoint], objects)
+
+    def _get_missing_ids(self, items: list[Any], references: tuple[Reference, ...]) -> dict[Any, list[Any]]:
+        """
+        Collect the distinct ids referred to that haven't been looked up yet, by the endpoint to look them up from.
+        References to the same model are looked up together, from the first endpoint given for it.
+        """
+        endpoints: dict[type, Any] = {}
+        missing: dict[Any, dict[Any, None]] = {}
+        for path, endpoint in references:
+            endpoint = endpoints.setdefault(endpoint.model, endpoint)
+            self._references[(path.model, path.names)] = endpoint.model
+            ids = missing.setdefault(endpoint, {})
+            id_alias = _get_id_alias(endpoint.model)
+            for item in items:
+                id_ = _get_value(_get_reference(item, path), "id", id_alias)
+                if id_ is not None and (endpoint.model, id_) not in self._objects:
+                    ids[id_] = None
+        return {endpoint: list(ids) for endpoint, ids in missing.items() if ids}
+
+    def _add_objects(self, endpoint: Any, ids: list[Any], objects: list[Any]) -> None:  # noqa: ANN401
+        id_alias = _get_id_alias(endpoint.model)
+        for id_ in ids:
+            # Ids that aren't found are remembered too, so they aren't looked up again
+            self._objects[(endpoint.model, id_)] = None
+        for obj in objects:
+            self._objects[(endpoint.model, _get_value(obj, "id", id_alias))] = obj
+
+
+class AsyncHydrator(Hydrator):
+    """
+    Hydrator for the async clients' endpoints, see Hydrator.
+    """
+
+    async def prefetch(self, items: Iterable[Any], *references: Reference) -> None:  # type: ignore[override]
+        """
+        Look up the objects the given references in each of the items refer to. See Hydrator.prefetch().
+        """
+        items = list(items)
+        missing = self._get_missing_ids(items, references)
+        found = await asyncio.gather(*(endpoint.get_many_by_ids(ids) for endpoint, ids in missing.items()))
+        for endpoint, objects in zip(missing, found, strict=True):
+            self._add_objects(endpoint, missing[endpoint], objects)
+
+
+def _get_id_alias(model: type) -> str:
+    id_field = getattr(model, "id", None)
+    return id_field.path if id_field is not None else "id"
+
+
+def _get_value(obj: Any, name: str, alias: str) -> Any:  # noqa: ANN401
+    if obj is None:
+        return None
+    if isinstance(obj, dict):
+        return obj.get(alias)
+    return getattr(obj, name, None)
+
+
+def _get_reference(item: Any, path: FieldPath) -> Any:  # noqa: ANN401
+    for name, alias in zip(path.names, path.path.split("/"), strict=True):
+        item = _get_value(item, name, alias)
+    return item
@@ -1,6 +1,12 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Generic, TypeVar
+from collections.abc import AsyncIterator, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from pyconnectwise.responses.async_keyset_paginated_response import AsyncKeysetPaginatedResponse
+from pyconnectwise.responses.async_paginated_response import AsyncPaginatedResponse
+from pyconnectwise.responses.keyset_paginated_response import KeysetPaginatedResponse
 from pyconnectwise.responses.paginated_response import PaginatedResponse
 from pyconnectwise.types import (
     JSON,
@@ -8,11 +14,18 @@ from pyconnectwise.types import (
     ConnectWiseManageRequestParams,
     PatchRequestData,
 )
+from pyconnectwise.utils.helpers import parse_link_headers
+from pyconnectwise.utils.streaming import STREAM_CHUNK_SIZE, aiter_json_array, iter_json_array
 
 if TYPE_CHECKING:
     from pydantic import BaseModel
 
 TModel = TypeVar("TModel", bound="BaseModel")
+# Ids are looked up a chunk at a time, keeping the URL-encoded "id in (...)" condition short enough that the whole
+# query string stays under the 2048 characters IIS (which hosts the API) accepts by default
+MAX_ID_CONDITION_LENGTH = 1500
+# Endpoints return at most 1000 items per request
+MAX_IDS_PER_REQUEST = 1000
 TRequestParams = TypeVar(
     "TRequestParams",
     bound=ConnectWiseManageRequestParams | ConnectWiseAutomateRequestParams,
@@ -37,6 +50,87 @@ class IPaginateable(IMethodBase, Generic[TModel, TRequestParams]):
     ) -> PaginatedResponse[TModel]:
         pass
 
+    def keyset_paginated(
+        self,
+        page_size: int,
+        params: TRequestParams | None = None,
+        key: str = "id",
+        after: Any = None,  # noqa: ANN401
+    ) -> KeysetPaginatedResponse[TModel]:
+        """
+        Page through the endpoint in order of a unique key, starting from the first page, or after the given key.
+        See KeysetPaginatedResponse for how this differs from paginated().
+
+        Parameters:
+            page_size (int): The number of results to return per page, at most 1000.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+            key (str): The model field to page by. It must be unique and sortable. Defaults to "id".
+            after (optional): The key to start after, e.g. the last_key of an earlier scan to resume it.
+        Returns:
+            KeysetPaginatedResponse[TModel]: The initialized KeysetPaginatedResponse object.
+        """
+        return KeysetPaginatedResponse(self, page_size, params, key, after)
+
+    def stream_all(self, page_size: int = 1000, params: TRequestParams | None = None) -> Iterator[TModel]:
+        """
+        Iterate through every item across all pages, decoding and validating each item as it arrives from
+        the network instead of reading whole pages into memory first. Peak memory stays around one item,
+        no matter how large the page size is.
+
+        Parameters:
+            page_size (int): The number of results to request per page. Defaults to 1000.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Yields:
+            TModel: Each item, in order (as a dict in the "raw" response mode).
+        """
+        raw = self._get_response_mode() == "raw"  # type: ignore[attr-defined]
+        model = self._get_response_model(self.model)  # type: ignore[attr-defined]
+        page = 1
+        while True:
+            page_params: dict[str, Any] = {**(params or {}), "page": page, "pageSize": page_size}
+            response = self._make_request("GET", params=page_params, stream=True)  # type: ignore[attr-defined]
+            try:
+                count = 0
+                for item in iter_json_array(response.iter_content(STREAM_CHUNK_SIZE)):
+                    count += 1
+                    yield item if raw else model.model_validate(item)
+            finally:
+                response.close()
+            if not _has_next_page(response.headers, count, page_size):
+                return
+            page += 1
+
+    def get_many_by_ids(
+        self, ids: Iterable[int], chunk_size: int | None = None, params: TRequestParams | None = None
+    ) -> list[TModel]:
+        """
+        Get the items with the given ids. A long list of ids is split into chunks, each looked up with an
+        "id in (...)" condition short enough to fit in a URL, and the chunks are requested concurrently over the
+        client's connection pool (up to Config.pool_maxsize at once). Where the endpoint has a POST search
+        endpoint, like /service/tickets/search, the condition is sent in the request body instead, so each
+        request can look up a whole page of ids.
+
+        Parameters:
+            ids (Iterable[int]): The ids to look up. Repeated ids are only looked up once.
+            chunk_size (int, optional): The most ids to look up per request. Defaults to as many as fit.
+            params (dict[str, int | str]): The parameters to send in the request query string. Any conditions
+                are combined with the ids condition.
+        Returns:
+            list[TModel]: The items found, in the order of the given ids. Ids that aren't found are left out.
+        """
+        ids = list(dict.fromkeys(ids))
+        id_requests = _get_id_requests(self, ids, chunk_size, params)
+        if len(id_requests) <= 1:
+            pages = [self._get_id_request(*request) for request in id_requests]
+        else:
+            with ThreadPoolExecutor(min(len(id_requests), self.client.config.pool_maxsize)) as executor:  # type: ignore[attr-defined]
+                pages = list(executor.map(lambda request: self._get_id_request(*request), id_requests))
+        return _merge_by_id(self, ids, pages)
+
+    def _get_id_request(self, path: str | None, data: dict[str, Any] | None, params: dict[str, Any]) -> list[TModel]:
+        response = self._make_request("POST" if path else "GET", path, data=data, params=params)  # type: ignore[attr-defined]
+        return self._parse_many(self.model, response.content)  # type: ignore[attr-defined]
+
 
 class IGettable(IMethodBase, Generic[TModel, TRequestParams]):
     def __init__(self, model: TModel) -> None:
@@ -101,3 +195,236 @@ class IDeleteable(IMethodBase, Generic[TRequestParams]):
         params: TRequestParams | None = None,
     ) -> None:
         pass
+
+
+class IAsyncPaginateable(IMethodBase, Generic[TModel, TRequestParams]):
+    def __init__(self, model: TModel) -> None:
+        super().__init__(model)
+
+    @abstractmethod
+    async def paginated(
+        self,
+        page: int,
+        page_size: int,
+        params: TRequestParams | None = None,
+    ) -> AsyncPaginatedResponse[TModel]:
+        pass
+
+    async def keyset_paginated(
+        self,
+        page_size: int,
+        params: TRequestParams | None = None,
+        key: str = "id",
+        after: Any = None,  # noqa: ANN401
+    ) -> AsyncKeysetPaginatedResponse[TModel]:
+        """
+        Page through the endpoint in order of a unique key, starting from the first page, or after the given key.
+        See KeysetPaginatedResponse for how this differs from paginated().
+
+        Parameters:
+            page_size (int): The number of results to return per page, at most 1000.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+            key (str): The model field to page by. It must be unique and sortable. Defaults to "id".
+            after (optional): The key to start after, e.g. the last_key of an earlier scan to resume it.
+        Returns:
+            AsyncKeysetPaginatedResponse[TModel]: The initialized AsyncKeysetPaginatedResponse object.
+        """
+        return await AsyncKeysetPaginatedResponse(self, page_size, params, key, after).get_next_page()
+
+    async def stream_all(self, page_size: int = 1000, params: TRequestParams | None = None) -> AsyncIterator[TModel]:
+        """
+        Iterate through every item across all pages, decoding and validating each item as it arrives from
+        the network instead of reading whole pages into memory first. Peak memory stays around one item,
+        no matter how large the page size is.
+
+        Parameters:
+            page_size (int): The number of results to request per page. Defaults to 1000.
+            params (dict[str, int | str]): The parameters to send in the request query string.
+        Yields:
+            TModel: Each item, in order (as a dict in the "raw" response mode).
+        """
+        raw = self._get_response_mode() == "raw"  # type: ignore[attr-defined]
+        model = self._get_response_model(self.model)  # type: ignore[attr-defined]
+        page = 1
+        while True:
+            page_params: dict[str, Any] = {**(params or {}), "page": page, "pageSize": page_size}
+            response = await self._make_request("GET", params=page_params, stream=True)  # type: ignore[attr-defined]
+            try:
+                count = 0
+                async for item in aiter_json_array(response.aiter_bytes(STREAM_CHUNK_SIZE)):
+                    count += 1
+                    yield item if raw else model.model_validate(item)
+            finally:
+                await response.aclose()
+            if not _has_next_page(response.headers, count, page_size):
+                return
+            page += 1
+
+    async def get_many_by_ids(
+        self, ids: Iterable[int], chunk_size: int | None = None, params: TRequestParams | None = None
+    ) -> list[TModel]:
+        """
+        Get the items with the given ids. A long list of ids is split into chunks, each looked up with an
+        "id in (...)" condition short enough to fit in a URL, and the chunks are requested concurrently (up to
+        Config.pool_maxsize at once). See IPaginateable.get_many_by_ids() for details.
+
+        Parameters:
+            ids (Iterable[int]): The ids to look up. Repeated ids are only looked up once.
+            chunk_size (int, optional): The most ids to look up per request. Defaults to as many as fit.
+            params (dict[str, int | str]): The parameters to send in the request query string. Any conditions
+                are combined with the ids condition.
+        Returns:
+            list[TModel]: The items found, in the order of the given ids. Ids that aren't found are left out.
+        """
+        from pyconnectwise.clients.async_connectwise_client import gather_limited
+
+        ids = list(dict.fromkeys(ids))
+        id_requests = _get_id_requests(self, ids, chunk_size, params)
+        pages = await gather_limited(
+            *(self._get_id_request(*request) for request in id_requests),
+            limit=self.client.config.pool_maxsize,  # type: ignore[attr-defined]
+        )
+        return _merge_by_id(self, ids, pages)
+
+    async def _get_id_request(
+        self, path: str | None, data: dict[str, Any] | None, params: dict[str, Any]
+    ) -> list[TModel]:
+        response = await self._make_request("POST" if path else "GET", path, data=data, params=params)  # type: ignore[attr-defined]
+        return self._parse_many(self.model, response.content)  # type: ignore[attr-defined]
+
+
+class IAsyncGettable(IMethodBase, Generic[TModel, TRequestParams]):
+    def __init__(self, model: TModel) -> None:
+        super().__init__(model)
+
+    @abstractmethod
+    async def get(
+        self,
+        data: JSON | None = None,
+        params: TRequestParams | None = None,
+    ) -> TModel:
+        pass
+
+
+class IAsyncPostable(IMethodBase, Generic[TModel, TRequestParams]):
+    def __init__(self, model: TModel) -> None:
+        super().__init__(model)
+
+    @abstractmethod
+    async def post(
+        self,
+        data: JSON | None = None,
+        params: TRequestParams | None = None,
+    ) -> TModel:
+        pass
+
+
+class IAsyncPatchable(IMethodBase, Generic[TModel, TRequestParams]):
+    def __init__(self, model: TModel) -> None:
+        super().__init__(model)
+
+    @abstractmethod
+    async def patch(
+        self,
+        data: PatchRequestData,
+        params: TRequestParams | None = None,
+    ) -> TModel:
+        pass
+
+
+class IAsyncPuttable(IMethodBase, Generic[TModel, TRequestParams]):
+    def __init__(self, model: TModel) -> None:
+        super().__init__(model)
+
+    @abstractmethod
+    async def put(
+        self,
+        data: JSON | None = None,
+        params: TRequestParams | None = None,
+    ) -> TModel:
+        pass
+
+
+class IAsyncDeleteable(IMethodBase, Generic[TRequestParams]):
+    def __init__(self, model: TModel) -> None:
+        super().__init__(model)
+
+    @abstractmethod
+    async def delete(
+        self,
+        data: JSON | None = None,
+        params: TRequestParams | None = None,
+    ) -> None:
+        pass
+
+
+def _has_next_page(headers: Any, count: int, page_size: int) -> bool:  # noqa: ANN401
+    """
+    Work out whether there's another page after a streamed one. Manage says so in its Link header,
+    Automate doesn't, so for Automate a full page means there may be more.
+    """
+    parsed_link_headers = parse_link_headers(headers)
+    if parsed_link_headers is not None:
+        return parsed_link_headers.get("has_next_page", False)
+    return count >= page_size
+
+
+def _get_id_requests(
+    endpoint: Any,  # noqa: ANN401
+    ids: list[int],
+    chunk_size: int | None,
+    params: dict[str, Any] | None,
+) -> list[tuple[str | None, dict[str, Any] | None, dict[str, Any]]]:
+    """
+    Split the ids into chunks and build the request for each one, as the path to POST to (None to GET the endpoint
+    itself), the request body and the query parameters.
+    """
+    conditions_param = endpoint.client._conditions_param
+    conditions = (params or {}).get(conditions_param)
+    # The generated endpoints expose a POST search endpoint as their "search" child
+    search = isinstance(getattr(type(endpoint), "search", None), cached_property)
+    id_field = getattr(endpoint.model, "id", None)
+    id_path = id_field.path if id_field is not None else "id"
+
+    id_requests = []
+    max_ids = min(chunk_size or MAX_IDS_PER_REQUEST, MAX_IDS_PER_REQUEST)
+    max_length = None if search else MAX_ID_CONDITION_LENGTH
+    for chunk in _chunk_ids(ids, max_ids, max_length):
+        ids_condition = f"{id_path} in ({','.join(str(i) for i in chunk)})"
+        condition = f"({conditions}) and {ids_condition}" if conditions else ids_condition
+        request_params = {**(params or {}), "page": 1, "pageSize": len(chunk)}
+        if search:
+            request_params.pop(conditions_param, None)
+            id_requests.append(("search", {"conditions": condition}, request_params))
+        else:
+            id_requests.append((None, None, {**request_params, conditions_param: condition}))
+    return id_requests
+
+
+def _chunk_ids(ids: list[int], max_ids: int, max_length: int | None) -> Iterator[list[int]]:
+    chunk: list[int] = []
+    length = 0
+    for id_ in ids:
+        # Each id is followed by a comma, which is URL-encoded as %2C
+        id_length = len(str(id_)) + 3
+        if chunk and (len(chunk) >= max_ids or (max_length is not None and length + id_length > max_length)):
+            yield chunk
+            chunk, length = [], 0
+        chunk.append(id_)
+        length += id_length
+    if chunk:
+        yield chunk
+
+
+def _merge_by_id(endpoint: Any, ids: list[int], pages: list[list[Any]]) -> list[Any]:  # noqa: ANN401
+    """
+    Merge the items from each chunk's response, in the order of the given ids, with any duplicates dropped.
+    """
+    id_field = getattr(endpoint.model, "id", None)
+    alias = id_field.path if id_field is not None else "id"
+    by_id = {}
+    for page in pages:
+        for item in page:
+            id_ = item.get(alias) if isinstance(item, dict) else getattr(item, "id", None)
+            by_id.setdefault(id_, item)
+    return [by_id[id_] for id_ in ids if id_ in by_id]
@@ -0,0 +1,465 @@
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.hydration import _get_id_alias
+from pyconnectwise.sync import DeltaSync, SyncResult, SyncSink, SyncState
+from pyconnectwise.utils.helpers import get_list_adapter
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pyconnectwise.interfaces import IPaginateable
+    from pyconnectwise.models.base.conditions import ConditionExpression
+    from pyconnectwise.types import RequestParams
+
+# How the field catalog's types are stored. Anything else (strings, dates, literals, UUIDs) is stored as text,
+# compared case-insensitively like the API does
+COLUMN_TYPES = {"int": "INTEGER", "float": "REAL", "bool": "INTEGER"}
+TEXT_COLUMN = "TEXT COLLATE NOCASE"
+
+
+class Mirror:
+    """
+    A local SQLite copy of some of the API's endpoints, for read-heavy workloads like dashboards and reports that
+    would otherwise send the same queries to the API all day. Each endpoint added gets a table, with a column per
+    field (and the fields of the references it holds, like company/id), and is queried with the same conditions
+    syntax the API takes, in milliseconds.
+
+    sync() brings the tables up to date. Manage endpoints are synced with a DeltaSync, so only the items changed
+    since the last sync are fetched (the sync state is kept in the database too). Endpoints whose items have no
+    _info.lastUpdated, like Automate's, are fetched in full on every sync.
+
+        mirror = Mirror("connectwise.db")
+        tickets = mirror.add(client.service.tickets, params={"conditions": "closedFlag = false"})
+        mirror.add(client.company.companies)
+        mirror.sync()
+        tickets.query('board/name = "Help Desk" and priority/id in (1, 2)', order_by="lastUpdated desc", limit=50)
+
+    Args:
+        path (str): The database file. It's created if it doesn't exist (default = ":memory:", not kept on disk).
+    """
+
+    def __init__(self, path: str = ":memory:") -> None:
+        self.path = path
+        self.tables: dict[str, MirrorTable] = {}
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("CREATE TABLE IF NOT EXISTS sync_state (key TEXT PRIMARY KEY, state TEXT NOT NULL)")
+
+    def __enter__(self) -> Mirror:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def add(self, endpoint: IPaginateable, name: str | None = None, params: RequestParams | None = None) -> MirrorTable:
+        """
+        Mirror an endpoint in a table, creating the table if it doesn't exist.
+
+        Args:
+            endpoint (IPaginateable): The endpoint to mirror. Queries return its models, or dicts if its response mode
+                is "raw".
+            name (str, optional): The table's name (default = the endpoint's path, e.g. "service_tickets").
+            params (dict, optional): The query parameters to send when syncing, e.g. conditions to only mirror some
+                of the items.
+
+        Returns:
+            MirrorTable: The table.
+        """
+        if name is None:
+            name = endpoint._get_url_template()[0].strip("/").replace("/", "_").lower()  # type: ignore[attr-defined]
+        table = MirrorTable(self, name, endpoint, params)
+        self.tables[name] = table
+        return table
+
+    def __getitem__(self, name: str) -> MirrorTable:
+        return self.tables[name]
+
+    def sync(self) -> dict[str, SyncResult]:
+        """
+        Bring every table up to date with its endpoint.
+
+        Returns:
+            dict[str, SyncResult]: What was synced, by table name.
+        """
+        return {name: table.sync() for name, table in self.tables.items()}
+
+    def execute(self, sql: str, parameters: tuple | list = ()) -> list[tuple]:
+        """
+        Run SQL against the mirror, e.g. to join tables, and return the rows.
+        """
+        with self._lock:
+            return self._connection.execute(sql, parameters).fetchall()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._connection
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def _get_state(self, key: str) -> SyncState | None:
+        rows = self.execute("SELECT state FROM sync_state WHERE key = ?", (key,))
+        return SyncState.from_dict(json.loads(rows[0][0])) if rows else None
+
+    def _set_state(self, key: str, state: SyncState) -> None:
+        self.execute("INSERT OR REPLACE INTO sync_state VALUES (?, ?)", (key, json.dumps(state.to_dict())))
+
+
+class MirrorTable(SyncSink):
+    """
+    An endpoint's table in a Mirror. See Mirror.add().
+    """
+
+    def __init__(
+        self,
+        mirror: Mirror,
+        name: str,
+        endpoint: IPaginateable,
+        params: RequestParams | None = None,
+    ) -> None:
+        self.mirror = mirror
+        self.name = name
+        self.endpoint = endpoint
+        self.params = params
+        self.model: Any = endpoint.model
+        self.raw = endpoint._get_response_mode() == "raw"  # type: ignore[attr-defined]
+        self.id_column = _get_id_alias(self.model)
+        self.columns = _get_columns(self.model)
+        # Items are read a reference at a time: first the item's own fields, then each reference's fields
+        self._fields = [column for column in self.columns if "/" not in column and column != "lastUpdated"]
+        self._references: dict[str, list[str]] = {}
+        for column in self.columns:
+            if "/" in column:
+                reference, name = column.split("/")
+                self._references.setdefault(reference, []).append(name)
+        if "lastUpdated" in self.columns:
+            self._references.setdefault("_info", []).append("lastUpdated")
+        self._create()
+
+    def _create(self) -> None:
+        columns = ", ".join(
+            f"{_quote(column)} {column_type}{' PRIMARY KEY' if column == self.id_column else ''}"
+            for column, column_type in self.columns.items()
+        )
+        with self.mirror._transaction() as connection:
+            connection.execute(f"CREATE TABLE IF NOT EXISTS {_quote(self.name)} ({columns}, _data TEXT NOT NULL)")
+            # The columns queries most often filter and join by: the references' ids and when items were updated
+            for column in self.columns:
+                if column.endswith("/id") or column == "lastUpdated":
+                    index = _quote(f"{self.name}_{column}")
+                    connection.execute(f"CREATE INDEX IF NOT EXISTS {index} ON {_quote(self.name)} ({_quote(column)})")
+
+    def sync(self) -> SyncResult:
+        """
+        Bring the table up to date with the endpoint.
+
+        Returns:
+            SyncResult: What was synced.
+        """
+        endpoint = self.endpoint.with_response_mode("raw")  # type: ignore[attr-defined]
+        if "lastUpdated" in self.columns:
+            store = _MirrorSyncStateStore(self.mirror)
+            return DeltaSync(endpoint, self, store, self.params).run()
+        return self._reload(endpoint)
+
+    def _reload(self, endpoint: Any) -> SyncResult:  # noqa: ANN401
+        result = SyncResult(full=True, checked_deletions=True)
+        ids = set()
+        pages = endpoint.keyset_paginated(1000, dict(self.params) if self.params else None, "id")
+        while pages.has_data:
+            self.upsert(pages.data)
+            result.upserted += len(pages.data)
+            # Compared as text, as Automate's ids are numbers stored in text columns
+            ids.update(str(item[self.id_column]) for item in pages.data)
+            pages.get_next_page()
+        sql = f"SELECT {_quote(self.id_column)} FROM {_quote(self.name)}"  # noqa: S608
+        stored = [row[0] for row in self.mirror.execute(sql)]
+        deleted = [id_ for id_ in stored if str(id_) not in ids]
+        self.delete(deleted)
+        result.deleted = len(deleted)
+        return result
+
+    def upsert(self, items: list[Any]) -> None:
+        columns = [
+            *self._fields,
+            *(
+                "lastUpdated" if reference == "_info" else f"{reference}/{name}"
+                for reference, names in self._references.items()
+                for name in names
+            ),
+            "_data",
+        ]
+        column_list = ", ".join(_quote(column) for column in columns)
+        placeholders = ", ".join("?" * len(columns))
+        sql = f"INSERT OR REPLACE INTO {_quote(self.name)} ({column_list}) VALUES ({placeholders})"  # noqa: S608
+        rows = [self._get_row(item if isinstance(item, dict) else _dump(item)) for item in items]
+        with self.mirror._transaction() as connection:
+            connection.executemany(sql, rows)
+
+    def delete(self, ids: list[Any]) -> None:
+        sql = f"DELETE FROM {_quote(self.name)} WHERE {_quote(self.id_column)} = ?"  # noqa: S608
+        with self.mirror._transaction() as connection:
+            connection.executemany(sql, [(id_,) for id_ in ids])
+
+    def _get_row(self, item: dict[str, Any]) -> list[Any]:
+        get = item.get
+        row = [get(name) for name in self._fields]
+        for reference, names in self._references.items():
+            value = get(reference)
+            if isinstance(value, dict):
+                get_field = value.get
+                row.extend([get_field(name) for name in names])
+            else:
+                row.extend([None] * len(names))
+        row.append(json.dumps(item))
+        return row
+
+    def query(
+        self,
+        conditions: str | ConditionExpression | None = None,
+        order_by: str | None = None,
+        limit: int | None = None,
+        offset: int = 0,
+    ) -> list[Any]:
+        """
+        Query the table with the API's conditions syntax.
+
+        Args:
+            conditions (str | ConditionExpression, optional): Which items to return, as they'd be sent to the API in
+                the conditions query parameter, e.g. 'status/name = "New" and id > 1000' (or built by comparing model
+                fields, e.g. (Ticket.status.name == "New") & (Ticket.id > 1000)). Fields of references can be
+                queried by their id, identifier and name (e.g. company/name), and the last updated time as
+                lastUpdated.
+            order_by (str, optional): How to sort the items, as sent to the API in the orderBy query parameter, e.g.
+                "lastUpdated desc, id".
+            limit (int, optional): The most items to return.
+            offset (int): How many items to skip.
+
+        Returns:
+            list: The items, as models (or dicts if the endpoint's response mode is "raw").
+        """
+        where, parameters = self._compile(conditions)
+        sql = f"SELECT _data FROM {_quote(self.name)}{where}"  # noqa: S608
+        if order_by:
+            sql += f" ORDER BY {self._compile_order_by(order_by)}"
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            parameters = [*parameters, limit if limit is not None else -1, offset]
+        data = [row[0] for row in self.mirror.execute(sql, parameters)]
+        if self.raw:
+            return [json.loads(d) for d in data]
+        return get_list_adapter(self.model).validate_json(f"[{','.join(data)}]")
+
+    def count(self, conditions: str | ConditionExpression | None = None) -> int:
+        """
+        Count the items matching the conditions. See query().
+        """
+        where, parameters = self._compile(conditions)
+        return self.mirror.execute(f"SELECT COUNT(*) FROM {_quote(self.name)}{where}", parameters)[0][0]  # noqa: S608
+
+    def _compile(self, conditions: str | ConditionExpression | None) -> tuple[str, list[Any]]:
+        if conditions is None or not str(conditions).strip():
+            return "", []
+        sql, parameters = _ConditionCompiler(str(conditions), self.columns).compile()
+        return f" WHERE {sql}", parameters
+
+    def _compile_order_by(self, order_by: str) -> str:
+        terms = []
+        for term in order_by.split(","):
+            column, _, direction = term.strip().partition(" ")
+            if column not in self.columns or direction.strip().lower() not in ("", "asc", "desc"):
+                message = f"Can't order the {self.name} table by {term.strip()!r}"
+                raise ValueError(message)
+            terms.append(f"{_quote(column)} {direction.strip().upper() or 'ASC'}")
+        return ", ".join(terms)
+
+
+class _MirrorSyncStateStore:
+    def __init__(self, mirror: Mirror) -> None:
+        self.mirror = mirror
+
+    def get(self, key: str) -> SyncState | None:
+        return self.mirror._get_state(key)
+
+    def set(self, key: str, state: SyncState) -> None:  # noqa: A003
+        self.mirror._set_state(key, state)
+
+
+class _ConditionCompiler:
+    """
+    Compiles the API's conditions syntax into an SQL expression over a mirror table's columns.
+    """
+
+    TOKEN = re.compile(
+        r'\s*(?:(?P<string>"(?:[^"\\]|\\.)*")|(?P<date>\[[^\]]*\])|(?P<number>-?\d+(?:\.\d+)?(?![\w/]))'
+        r"|(?P<operator><=|>=|!=|<>|=|<|>)|(?P<punctuation>[(),])|(?P<word>[A-Za-z_][\w/]*))"
+    )
+
+    def __init__(self, conditions: str, columns: dict[str, str]) -> None:
+        self.conditions = conditions
+        self.columns = columns
+        self.tokens = self._tokenize(conditions)
+        self.position = 0
+        self.parameters: list[Any] = []
+
+    def _tokenize(self, conditions: str) -> list[tuple[str, str]]:
+        tokens = []
+        position = 0
+        conditions = conditions.rstrip()
+        while position < len(conditions):
+            match = self.TOKEN.match(conditions, position)
+            if match is None or match.end() == position:
+                self._fail(f"unexpected {conditions[position:].strip()[:20]!r}")
+            kind = match.lastgroup
+            tokens.append((kind, match.group(kind)))  # type: ignore[arg-type]
+            position = match.end()
+        return tokens
+
+    def _fail(self, reason: str) -> None:
+        message = f"Can't query {self.conditions!r} locally: {reason}"
+        raise ValueError(message)
+
+    def _peek(self) -> tuple[str, str] | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self) -> tuple[str, str]:
+        token = self._peek()
+        if token is None:
+            self._fail("it ends too soon")
+        self.position += 1
+        return token  # type: ignore[return-value]
+
+    def _accept_word(self, *words: str) -> bool:
+        token = self._peek()
+        if token is not None and token[0] == "word" and token[1].lower() in words:
+            self.position += 1
+            return True
+        return False
+
+    def compile(self) -> tuple[str, list[Any]]:  # noqa: A003
+        sql = self._or()
+        if self._peek() is not None:
+            self._fail(f"unexpected {self._peek()[1]!r}")  # type: ignore[index]
+        return sql, self.parameters
+
+    def _or(self) -> str:
+        terms = [self._and()]
+        while self._accept_word("or"):
+            terms.append(self._and())
+        return " OR ".join(terms)
+
+    def _and(self) -> str:
+        factors = [self._factor()]
+        while self._accept_word("and"):
+            factors.append(self._factor())
+        return " AND ".join(factors)
+
+    def _factor(self) -> str:
+        if self._peek() == ("punctuation", "("):
+            self.position += 1
+            sql = self._or()
+            if self._next() != ("punctuation", ")"):
+                self._fail("a parenthesis isn't closed")
+            return f"({sql})"
+        return self._comparison()
+
+    def _comparison(self) -> str:
+        kind, field = self._next()
+        if kind != "word" or field not in self.columns:
+            self._fail(f"{field!r} isn't a field of the table")
+        column = _quote(field)
+        negated = self._accept_word("not")
+        if self._accept_word("in"):
+            values = self._values()
+            self.parameters.extend(values)
+            return f"{column} {'NOT IN' if negated else 'IN'} ({', '.join('?' * len(values))})"
+        if self._accept_word("like", "contains"):
+            keyword = self.tokens[self.position - 1][1].lower()
+            pattern = str(self._value())
+            if keyword == "contains":
+                pattern = "%" + re.sub(r"([%_\\])", r"\\\1", pattern) + "%"
+            else:
+                pattern = pattern.replace("*", "%")
+            self.parameters.append(pattern)
+            return f"{column} {'NOT LIKE' if negated else 'LIKE'} ? ESCAPE '\\'"
+        if negated:
+            self._fail("'not' must be followed by 'like', 'contains' or 'in'")
+        kind, operator = self._next()
+        if kind != "operator":
+            self._fail(f"expected an operator after {field!r}")
+        operator = "!=" if operator == "<>" else operator
+        value = self._value()
+        if value is None:
+            if operator not in ("=", "!="):
+                self._fail(f"can't compare {field!r} to null with {operator}")
+            return f"{column} IS {'NOT ' if operator == '!=' else ''}NULL"
+        self.parameters.append(value)
+        return f"{column} {operator} ?"
+
+    def _values(self) -> list[Any]:
+        if self._next() != ("punctuation", "("):
+            self._fail("'in' must be followed by a list of values in parentheses")
+        values = [self._value()]
+        while self._peek() == ("punctuation", ","):
+            self.position += 1
+            values.append(self._value())
+        if self._next() != ("punctuation", ")"):
+            self._fail("a list of values isn't closed")
+        return values
+
+    def _value(self) -> Any:  # noqa: ANN401
+        kind, value = self._next()
+        if kind == "string":
+            return re.sub(r"\\(.)", r"\1", value[1:-1])
+        if kind == "date":
+            return value[1:-1]
+        if kind == "number":
+            return float(value) if "." in value else int(value)
+        if kind == "word" and value.lower() in ("true", "false"):
+            return int(value.lower() == "true")
+        if kind == "word" and value.lower() == "null":
+            return None
+        self._fail(f"{value!r} isn't a value")
+        return None
+
+
+def _get_columns(model: Any) -> dict[str, str]:  # noqa: ANN401
+    """
+    Get a mirror table's columns from a model's field catalog: its own fields, and the fields of the models it
+    holds directly (like a ticket's company/id and company/name). Anything nested deeper is only kept in the item's
+    JSON.
+    """
+    field_types = model._get_field_names_and_types()
+    columns = {}
+    for path, field_type in field_types.items():
+        if path.count("/") > 1 or path.split("/")[-1] == "_info" or field_type in ("dict", "list"):
+            continue
+        columns[path] = COLUMN_TYPES.get(field_type, TEXT_COLUMN)
+    if "_info" in field_types:
+        # The API's conditions call _info.lastUpdated lastUpdated
+        columns["lastUpdated"] = TEXT_COLUMN
+    return columns
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _dump(item: Any) -> dict[str, Any]:  # noqa: ANN401
+    return item.model_dump(mode="json", by_alias=True, exclude_unset=True)
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAddIpRestrictionsBatchRequest(ConnectWiseModel):
+    ip_restriction_rules: list[AutomateIpRestrictionRule] | None = Field(default=None, alias="IpRestrictionRules")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_ip_restriction_rule import AutomateIpRestrictionRule
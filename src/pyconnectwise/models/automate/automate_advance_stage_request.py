@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAdvanceStageRequest(ConnectWiseModel):
+    hotfixes_to_advance: list[AutomateHotfixOperatingSystemCombination] | None = Field(
+        default=None, alias="HotfixesToAdvance"
+    )
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_hotfix_operating_system_combination import (
+    AutomateHotfixOperatingSystemCombination,
+)
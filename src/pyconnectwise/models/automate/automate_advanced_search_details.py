@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAdvancedSearchDetails(ConnectWiseModel):
+    search: AutomateSearch | None = Field(default=None, alias="Search")
+    advanced_search_filter: AutomateAdvancedSearchFilter | None = Field(default=None, alias="AdvancedSearchFilter")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_advanced_search_filter import AutomateAdvancedSearchFilter
+from pyconnectwise.models.automate.automate_search import AutomateSearch
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAdvancedSearchDynamicLookup(ConnectWiseModel):
+    search_key: str | None = Field(default=None, alias="SearchKey")
+    advanced_search_data_lookups: list[AutomateAdvancedSearchDataLookup] | None = Field(
+        default=None, alias="AdvancedSearchDataLookups"
+    )
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_advanced_search_data_lookup import AutomateAdvancedSearchDataLookup
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAdvancedSearchFilter(ConnectWiseModel):
+    node_type: Literal["AndNode", "OrNode", "ComparisonNode", "AnyMeetsNode", "NotNode"] | None = Field(
+        default=None, alias="NodeType"
+    )
+    node_name: str | None = Field(default=None, alias="NodeName")
+    filter_criterias: list[AutomateFilterCriteria] | None = Field(default=None, alias="FilterCriterias")
+    child_nodes: list[AutomateAdvancedSearchFilter] | None = Field(default=None, alias="ChildNodes")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_filter_criteria import AutomateFilterCriteria
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAdvancedSearchLookUp(ConnectWiseModel):
+    look_up_nodes: list[AutomateSearchLookUpBase] | None = Field(default=None, alias="LookUpNodes")
+    collection_nodes: list[str] | None = Field(default=None, alias="CollectionNodes")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_search_look_up_base import AutomateSearchLookUpBase
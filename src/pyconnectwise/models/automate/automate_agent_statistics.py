@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAgentStatistics(ConnectWiseModel):
+    total_agents_purchased: int | None = Field(default=None, alias="TotalAgentsPurchased")
+    total_agents_deployed: int | None = Field(default=None, alias="TotalAgentsDeployed")
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAlert(ConnectWiseModel):
+    alert_id: int | None = Field(default=None, alias="AlertId")
+    client: AutomateAlertClient | None = Field(default=None, alias="Client")
+    computer: AutomateAlertComputer | None = Field(default=None, alias="Computer")
+    device: AutomateAlertDevice | None = Field(default=None, alias="Device")
+    location: AutomateAlertLocation | None = Field(default=None, alias="Location")
+    monitor: AutomateAlertMonitor | None = Field(default=None, alias="Monitor")
+    alert_date: datetime | None = Field(default=None, alias="AlertDate")
+    severity: AutomateAlertSeverityItem | None = Field(default=None, alias="Severity")
+    source: str | None = Field(default=None, alias="Source")
+    message: str | None = Field(default=None, alias="Message")
+    field_name: str | None = Field(default=None, alias="FieldName")
+    alert_age: str | None = Field(default=None, alias="AlertAge")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_alert_client import AutomateAlertClient
+from pyconnectwise.models.automate.automate_alert_computer import AutomateAlertComputer
+from pyconnectwise.models.automate.automate_alert_device import AutomateAlertDevice
+from pyconnectwise.models.automate.automate_alert_location import AutomateAlertLocation
+from pyconnectwise.models.automate.automate_alert_monitor import AutomateAlertMonitor
+from pyconnectwise.models.automate.automate_alert_severity_item import AutomateAlertSeverityItem
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAlertTemplate(ConnectWiseModel):
+    template_id: int | None = Field(default=None, alias="TemplateId")
+    template_name: str | None = Field(default=None, alias="TemplateName")
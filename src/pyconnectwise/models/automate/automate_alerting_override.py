@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAlertingOverride(ConnectWiseModel):
+    alert_template: AutomateAlertTemplate | None = Field(default=None, alias="AlertTemplate")
+    ticket_category: AutomateTicketCategory | None = Field(default=None, alias="TicketCategory")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_alert_template import AutomateAlertTemplate
+from pyconnectwise.models.automate.automate_ticket_category import AutomateTicketCategory
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAlertingSettings(ConnectWiseModel):
+    is_alerting_enabled: bool | None = Field(default=None, alias="IsAlertingEnabled")
+    alert_template: AutomateAlertTemplate | None = Field(default=None, alias="AlertTemplate")
+    alert_style_type: AutomateAlertStyleType | None = Field(default=None, alias="AlertStyleType")
+    alert_success_subject: str | None = Field(default=None, alias="AlertSuccessSubject")
+    alert_success_message: str | None = Field(default=None, alias="AlertSuccessMessage")
+    alert_failure_subject: str | None = Field(default=None, alias="AlertFailureSubject")
+    alert_failure_message: str | None = Field(default=None, alias="AlertFailureMessage")
+    should_run_script: bool | None = Field(default=None, alias="ShouldRunScript")
+    alert_script: AutomateAlertScript | None = Field(default=None, alias="AlertScript")
+    ticket_category: AutomateTicketCategory | None = Field(default=None, alias="TicketCategory")
+    report_category: AutomateReportCategory | None = Field(default=None, alias="ReportCategory")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_alert_script import AutomateAlertScript
+from pyconnectwise.models.automate.automate_alert_style_type import AutomateAlertStyleType
+from pyconnectwise.models.automate.automate_alert_template import AutomateAlertTemplate
+from pyconnectwise.models.automate.automate_report_category import AutomateReportCategory
+from pyconnectwise.models.automate.automate_ticket_category import AutomateTicketCategory
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateApprovalPolicy(ConnectWiseModel):
+    id: int | None = Field(default=None, alias="Id")
+    name: str | None = Field(default=None, alias="Name")
+    is_default_policy: bool | None = Field(default=None, alias="IsDefaultPolicy")
+    has_staging: bool | None = Field(default=None, alias="HasStaging")
+    test_duration: int | None = Field(default=None, alias="TestDuration")
+    pilot_duration: int | None = Field(default=None, alias="PilotDuration")
+    automatic_approval_settings: AutomateAutomaticApprovalSettings | None = Field(
+        default=None, alias="AutomaticApprovalSettings"
+    )
+    automatic_ignore_settings: AutomateAutomaticPolicySettings | None = Field(
+        default=None, alias="AutomaticIgnoreSettings"
+    )
+    automatic_deny_settings: AutomateAutomaticPolicySettings | None = Field(default=None, alias="AutomaticDenySettings")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_automatic_approval_settings import AutomateAutomaticApprovalSettings
+from pyconnectwise.models.automate.automate_automatic_policy_settings import AutomateAutomaticPolicySettings
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateApprovalPolicyThirdPartyPatchRequest(ConnectWiseModel):
+    patch_policies: list[AutomateApprovalPolicyThirdPartyPatchSetting] | None = Field(
+        default=None, alias="PatchPolicies"
+    )
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_approval_policy_third_party_patch_setting import (
+    AutomateApprovalPolicyThirdPartyPatchSetting,
+)
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAuditAnalyticsBundle(ConnectWiseModel):
+    audit_action_id: int | None = Field(default=None, alias="AuditActionId")
+    external_id: int | None = Field(default=None, alias="ExternalId")
+    secondary_identifier: str | None = Field(default=None, alias="SecondaryIdentifier")
+    unsanitized_base_message: str | None = Field(default=None, alias="UnsanitizedBaseMessage")
+    extra_log_values: list[SystemString] | None = Field(default=None, alias="ExtraLogValues")
+    sanitized_analytics_description: str | None = Field(default=None, alias="SanitizedAnalyticsDescription")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.system_string import SystemString
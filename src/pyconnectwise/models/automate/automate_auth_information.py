@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAuthInformation(ConnectWiseModel):
+    allow_direct: bool | None = Field(default=None, alias="AllowDirect")
+    allow_service_registration: bool | None = Field(default=None, alias="AllowServiceRegistration")
+    automate_redirect_uri: str | None = Field(default=None, alias="AutomateRedirectUri")
+    services: list[AutomateAuthService] | None = Field(default=None, alias="Services")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_auth_service import AutomateAuthService
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateAutoJoinSettings(ConnectWiseModel):
+    computer_search_settings: AutomateSearchSettings | None = Field(default=None, alias="ComputerSearchSettings")
+    network_device_search_settings: AutomateSearchSettings | None = Field(
+        default=None, alias="NetworkDeviceSearchSettings"
+    )
+    contact_search_settings: AutomateContactSearchSettings | None = Field(default=None, alias="ContactSearchSettings")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_contact_search_settings import AutomateContactSearchSettings
+from pyconnectwise.models.automate.automate_search_settings import AutomateSearchSettings
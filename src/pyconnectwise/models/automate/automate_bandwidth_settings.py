@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateBandwidthSettings(ConnectWiseModel):
+    ip_address: str | None = Field(default=None, alias="IpAddress")
+    snmp_version_id: int | None = Field(default=None, alias="SnmpVersionId")
+    community_string: str | None = Field(default=None, alias="CommunityString")
+    data_to_watch_id: int | None = Field(default=None, alias="DataToWatchId")
+    index_to_watch: str | None = Field(default=None, alias="IndexToWatch")
+    snmp_v3_user_name: str | None = Field(default=None, alias="SnmpV3UserName")
+    snmp_v3_auth_password: str | None = Field(default=None, alias="SnmpV3AuthPassword")
+    snmp_v3_auth_method_id: int | None = Field(default=None, alias="SnmpV3AuthMethodId")
+    snmp_v3_encryption_password: str | None = Field(default=None, alias="SnmpV3EncryptionPassword")
+    snmp_v3_encryption_method_id: int | None = Field(default=None, alias="SnmpV3EncryptionMethodId")
@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateBinaryExtension(ConnectWiseModel):
+    category: str | None = Field(default=None, alias="Category")
+    description: str | None = Field(default=None, alias="Description")
+    file_data: str | None = Field(default=None, alias="FileData")
+    is_enabled: bool | None = Field(default=None, alias="IsEnabled")
+    is_loaded_in_automation_server: bool | None = Field(default=None, alias="IsLoadedInAutomationServer")
+    is_loaded_in_iis: bool | None = Field(default=None, alias="IsLoadedInIIS")
+    is_remote_agent_extension: bool | None = Field(default=None, alias="IsRemoteAgentExtension")
+    release_date: datetime | None = Field(default=None, alias="ReleaseDate")
+    run_style: AutomateRunStyle | None = Field(default=None, alias="RunStyle")
+    author: str | None = Field(default=None, alias="Author")
+    file_checksum: str | None = Field(default=None, alias="FileChecksum")
+    file_name: str | None = Field(default=None, alias="FileName")
+    extension_name: str | None = Field(default=None, alias="ExtensionName")
+    extension_guid: UUID | None = Field(
+        default=None,
+        alias="ExtensionGuid",
+        examples=["00000000-0000-0000-0000-000000000000"],
+    )
+    extension_id: int | None = Field(default=None, alias="ExtensionId")
+    version: str | None = Field(default=None, alias="Version")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_run_style import AutomateRunStyle
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateCheckType(ConnectWiseModel):
+    check_type_id: int | None = Field(default=None, alias="CheckTypeId")
+    legacy_check_type_id: int | None = Field(default=None, alias="LegacyCheckTypeId")
+    name: str | None = Field(default=None, alias="Name")
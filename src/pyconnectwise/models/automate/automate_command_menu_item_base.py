@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateCommandMenuItemBase(ConnectWiseModel):
+    command_key: str | None = Field(default=None, alias="CommandKey")
+    display_name: str | None = Field(default=None, alias="DisplayName")
+    display_order: int | None = Field(default=None, alias="DisplayOrder")
+    route: str | None = Field(default=None, alias="Route")
+    require_confirmation: bool | None = Field(default=None, alias="RequireConfirmation")
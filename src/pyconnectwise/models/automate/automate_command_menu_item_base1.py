@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateCommandMenuItemBase1(ConnectWiseModel):
+    display_name: str | None = Field(default=None, alias="DisplayName")
+    display_order: int | None = Field(default=None, alias="DisplayOrder")
+    menu_key: str | None = Field(default=None, alias="MenuKey")
+    sub_menus: list[AutomateCommandMenuItemBase1] | None = Field(default=None, alias="SubMenus")
+    menu_items: list[AutomateCommandMenuItemBase] | None = Field(default=None, alias="MenuItems")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_command_menu_item_base import AutomateCommandMenuItemBase
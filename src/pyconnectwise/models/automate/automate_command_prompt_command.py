@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateCommandPromptCommand(ConnectWiseModel):
+    run_as_admin: bool | None = Field(default=None, alias="RunAsAdmin")
+    use_power_shell: bool | None = Field(default=None, alias="UsePowerShell")
+    command_text: str | None = Field(default=None, alias="CommandText")
+    directory: str | None = Field(default=None, alias="Directory")
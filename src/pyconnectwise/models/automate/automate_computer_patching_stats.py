@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateComputerPatchingStats(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    overall_compliance: float | None = Field(default=None, alias="OverallCompliance")
+    installed_patch_count: int | None = Field(default=None, alias="InstalledPatchCount")
+    missing_patch_count: int | None = Field(default=None, alias="MissingPatchCount")
+    failed_patch_count: int | None = Field(default=None, alias="FailedPatchCount")
+    compliant_software_count: int | None = Field(default=None, alias="CompliantSoftwareCount")
+    non_compliant_software_count: int | None = Field(default=None, alias="NonCompliantSoftwareCount")
+    failed_software_count: int | None = Field(default=None, alias="FailedSoftwareCount")
+    incorrect_software_count: int | None = Field(default=None, alias="IncorrectSoftwareCount")
+    stage: str | None = Field(default=None, alias="Stage")
+    no_patch_inventory: bool | None = Field(default=None, alias="NoPatchInventory")
+    wsus_enabled: bool | None = Field(default=None, alias="WSUSEnabled")
+    patch_job_running: bool | None = Field(default=None, alias="PatchJobRunning")
+    daytime_patching_enabled: bool | None = Field(default=None, alias="DaytimePatchingEnabled")
+    wua_out_of_date: bool | None = Field(default=None, alias="WUAOutOfDate")
+    missing_baseline_patches: bool | None = Field(default=None, alias="MissingBaselinePatches")
+    wua_version: str | None = Field(default=None, alias="WUAVersion")
+    last_install_window: datetime | None = Field(default=None, alias="LastInstallWindow")
+    next_install_window: datetime | None = Field(default=None, alias="NextInstallWindow")
+    last_software_window: datetime | None = Field(default=None, alias="LastSoftwareWindow")
+    next_software_window: datetime | None = Field(default=None, alias="NextSoftwareWindow")
+    last_patched_date: datetime | None = Field(default=None, alias="LastPatchedDate")
+    last_microsoft_patched_date: datetime | None = Field(default=None, alias="LastMicrosoftPatchedDate")
+    last_third_party_patched_date: datetime | None = Field(default=None, alias="LastThirdPartyPatchedDate")
+    last_patch_inventory: datetime | None = Field(default=None, alias="LastPatchInventory")
+    is_microsoft_managed: bool | None = Field(default=None, alias="IsMicrosoftManaged")
+    is_third_party_managed: bool | None = Field(default=None, alias="IsThirdPartyManaged")
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateCondition(ConnectWiseModel):
+    condition_type_id: int | None = Field(default=None, alias="ConditionTypeId")
+    comparand: str | None = Field(default=None, alias="Comparand")
+    normal_state_condition: AutomateStateCondition | None = Field(default=None, alias="NormalStateCondition")
+    warning_state_condition: AutomateStateCondition | None = Field(default=None, alias="WarningStateCondition")
+    error_state_condition: AutomateStateCondition | None = Field(default=None, alias="ErrorStateCondition")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_state_condition import AutomateStateCondition
@@ -0,0 +1,56 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateConfiguration(ConnectWiseModel):
+    check_type: AutomateCheckType | None = Field(default=None, alias="CheckType")
+    interval: AutomateCheckInterval | None = Field(default=None, alias="Interval")
+    condition: AutomateCondition | None = Field(default=None, alias="Condition")
+    ping_settings: AutomatePingSettings | None = Field(default=None, alias="PingSettings")
+    latency_settings: AutomateLatencySettings | None = Field(default=None, alias="LatencySettings")
+    tcp_settings: AutomateTcpSettings | None = Field(default=None, alias="TcpSettings")
+    udp_settings: AutomateUdpSettings | None = Field(default=None, alias="UdpSettings")
+    snmp_settings: AutomateSnmpSettings | None = Field(default=None, alias="SnmpSettings")
+    performance_counter_settings: AutomatePerformanceCounterSettings | None = Field(
+        default=None, alias="PerformanceCounterSettings"
+    )
+    file_or_directory_settings: AutomateFileOrDirectorySettings | None = Field(
+        default=None, alias="FileOrDirectorySettings"
+    )
+    service_settings: AutomateServiceSettings | None = Field(default=None, alias="ServiceSettings")
+    disk_space_settings: AutomateDiskSpaceSettings | None = Field(default=None, alias="DiskSpaceSettings")
+    registry_settings: AutomateRegistrySettings | None = Field(default=None, alias="RegistrySettings")
+    process_settings: AutomateProcessSettings | None = Field(default=None, alias="ProcessSettings")
+    event_log_settings: AutomateEventLogSettings | None = Field(default=None, alias="EventLogSettings")
+    executable_settings: AutomateExecutableSettings | None = Field(default=None, alias="ExecutableSettings")
+    wmi_settings: AutomateWmiSettings | None = Field(default=None, alias="WmiSettings")
+    bandwidth_settings: AutomateBandwidthSettings | None = Field(default=None, alias="BandwidthSettings")
+    sensor_settings: AutomateSensorSettings | None = Field(default=None, alias="SensorSettings")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_bandwidth_settings import AutomateBandwidthSettings
+from pyconnectwise.models.automate.automate_check_interval import AutomateCheckInterval
+from pyconnectwise.models.automate.automate_check_type import AutomateCheckType
+from pyconnectwise.models.automate.automate_condition import AutomateCondition
+from pyconnectwise.models.automate.automate_disk_space_settings import AutomateDiskSpaceSettings
+from pyconnectwise.models.automate.automate_event_log_settings import AutomateEventLogSettings
+from pyconnectwise.models.automate.automate_executable_settings import AutomateExecutableSettings
+from pyconnectwise.models.automate.automate_file_or_directory_settings import AutomateFileOrDirectorySettings
+from pyconnectwise.models.automate.automate_latency_settings import AutomateLatencySettings
+from pyconnectwise.models.automate.automate_performance_counter_settings import AutomatePerformanceCounterSettings
+from pyconnectwise.models.automate.automate_ping_settings import AutomatePingSettings
+from pyconnectwise.models.automate.automate_process_settings import AutomateProcessSettings
+from pyconnectwise.models.automate.automate_registry_settings import AutomateRegistrySettings
+from pyconnectwise.models.automate.automate_sensor_settings import AutomateSensorSettings
+from pyconnectwise.models.automate.automate_service_settings import AutomateServiceSettings
+from pyconnectwise.models.automate.automate_snmp_settings import AutomateSnmpSettings
+from pyconnectwise.models.automate.automate_tcp_settings import AutomateTcpSettings
+from pyconnectwise.models.automate.automate_udp_settings import AutomateUdpSettings
+from pyconnectwise.models.automate.automate_wmi_settings import AutomateWmiSettings
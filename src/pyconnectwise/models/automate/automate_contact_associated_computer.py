@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateContactAssociatedComputer(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    computer_name: str | None = Field(default=None, alias="ComputerName")
+    has_primary_contact: bool | None = Field(default=None, alias="HasPrimaryContact")
+    is_primary_contact: bool | None = Field(default=None, alias="IsPrimaryContact")
+    can_user_set_primary_status: bool | None = Field(default=None, alias="CanUserSetPrimaryStatus")
+    client_name: str | None = Field(default=None, alias="ClientName")
+    location_name: str | None = Field(default=None, alias="LocationName")
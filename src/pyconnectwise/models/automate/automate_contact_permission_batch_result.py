@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateContactPermissionBatchResult(ConnectWiseModel):
+    contact_id: int | None = Field(default=None, alias="ContactId")
+    result_details: AutomateResponseResult | None = Field(default=None, alias="ResultDetails")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_response_result import AutomateResponseResult
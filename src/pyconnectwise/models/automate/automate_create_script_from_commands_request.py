@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateCreateScriptFromCommandsRequest(ConnectWiseModel):
+    script_folder_id: int | None = Field(default=None, alias="ScriptFolderId")
+    commands: list[AutomateRemoteCommand] | None = Field(default=None, alias="Commands")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_remote_command import AutomateRemoteCommand
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDailyScheduleFrequency(ConnectWiseModel):
+    runs_at: str | None = Field(default=None, alias="RunsAt")
+    daily_interval: int | None = Field(default=None, alias="DailyInterval")
+    days_of_week_settings: AutomateDaysOfWeekSettings | None = Field(default=None, alias="DaysOfWeekSettings")
+    daily_repeat_settings: AutomateDailyRepeatSettings | None = Field(default=None, alias="DailyRepeatSettings")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_daily_repeat_settings import AutomateDailyRepeatSettings
+from pyconnectwise.models.automate.automate_days_of_week_settings import AutomateDaysOfWeekSettings
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDaysScheduleSettings(ConnectWiseModel):
+    monthly_occurrence: list[str] | None = Field(default=None, alias="MonthlyOccurrence")
+    weekly_occurrence: list[str] | None = Field(default=None, alias="WeeklyOccurrence")
+    daily_occurrence: list[str] | None = Field(default=None, alias="DailyOccurrence")
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDaytimePatchingOptions(ConnectWiseModel):
+    allow_daytime_patching: bool | None = Field(default=None, alias="AllowDaytimePatching")
+    require_minimum_uptime: bool | None = Field(default=None, alias="RequireMinimumUptime")
+    minimum_uptime: str | None = Field(default=None, alias="MinimumUptime")
+    update_only: bool | None = Field(default=None, alias="UpdateOnly")
+    prompt_interval: str | None = Field(default=None, alias="PromptInterval")
+    prompt_deadline: int | None = Field(default=None, alias="PromptDeadline")
+    prompt_message: str | None = Field(default=None, alias="PromptMessage")
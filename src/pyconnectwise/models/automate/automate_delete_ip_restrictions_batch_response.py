@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDeleteIpRestrictionsBatchResponse(ConnectWiseModel):
+    ip_restrictions_results: list[AutomateDeleteIpRestrictionsBatchResult] | None = Field(
+        default=None, alias="IpRestrictionsResults"
+    )
+    contains_unsuccessful_results: bool | None = Field(default=None, alias="ContainsUnsuccessfulResults")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_delete_ip_restrictions_batch_result import (
+    AutomateDeleteIpRestrictionsBatchResult,
+)
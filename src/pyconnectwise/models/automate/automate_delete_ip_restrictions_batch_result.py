@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDeleteIpRestrictionsBatchResult(ConnectWiseModel):
+    ip_restrictions_id: UUID | None = Field(
+        default=None,
+        alias="IpRestrictionsId",
+        examples=["00000000-0000-0000-0000-000000000000"],
+    )
+    result_details: AutomateResponseResult | None = Field(default=None, alias="ResultDetails")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_response_result import AutomateResponseResult
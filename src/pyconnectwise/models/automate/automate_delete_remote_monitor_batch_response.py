@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDeleteRemoteMonitorBatchResponse(ConnectWiseModel):
+    remote_monitor_results: list[AutomateDeleteRemoteMonitorBatchResult] | None = Field(
+        default=None, alias="RemoteMonitorResults"
+    )
+    contains_unsuccessful_results: bool | None = Field(default=None, alias="ContainsUnsuccessfulResults")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_delete_remote_monitor_batch_result import (
+    AutomateDeleteRemoteMonitorBatchResult,
+)
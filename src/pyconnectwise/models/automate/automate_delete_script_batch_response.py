@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDeleteScriptBatchResponse(ConnectWiseModel):
+    script_results: list[AutomateDeleteScriptBatchResult] | None = Field(default=None, alias="ScriptResults")
+    contains_unsuccessful_results: bool | None = Field(default=None, alias="ContainsUnsuccessfulResults")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_delete_script_batch_result import AutomateDeleteScriptBatchResult
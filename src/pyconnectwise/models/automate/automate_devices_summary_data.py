@@ -0,0 +1,43 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDevicesSummaryData(ConnectWiseModel):
+    compliance_score: float | None = Field(default=None, alias="ComplianceScore")
+    devices_affecting_compliance_count: int | None = Field(default=None, alias="DevicesAffectingComplianceCount")
+    devices_affecting_pilot_stage_compliance_count: int | None = Field(
+        default=None, alias="DevicesAffectingPilotStageComplianceCount"
+    )
+    devices_affecting_production_stage_compliance_count: int | None = Field(
+        default=None, alias="DevicesAffectingProductionStageComplianceCount"
+    )
+    devices_affecting_test_stage_compliance_count: int | None = Field(
+        default=None, alias="DevicesAffectingTestStageComplianceCount"
+    )
+    devices_needing_attention_count: int | None = Field(default=None, alias="DevicesNeedingAttentionCount")
+    enabled_wsus_count: int | None = Field(default=None, alias="EnabledWsusCount")
+    entity_id: int | None = Field(default=None, alias="EntityId")
+    entity_name: str | None = Field(default=None, alias="EntityName")
+    in_daytime_patching_count: int | None = Field(default=None, alias="InDaytimePatchingCount")
+    last_patch_job_failed_count: int | None = Field(default=None, alias="LastPatchJobFailedCount")
+    missing_baseline_patches_count: int | None = Field(default=None, alias="MissingBaselinePatchesCount")
+    missing_patch_inventory_count: int | None = Field(default=None, alias="MissingPatchInventoryCount")
+    out_of_date_wua_count: int | None = Field(default=None, alias="OutOfDateWuaCount")
+    pending_reboot_count: int | None = Field(default=None, alias="PendingRebootCount")
+    pending_update_count: int | None = Field(default=None, alias="PendingUpdateCount")
+    pilot_stage_compliance_score: float | None = Field(default=None, alias="PilotStageComplianceScore")
+    production_stage_compliance_score: float | None = Field(default=None, alias="ProductionStageComplianceScore")
+    running_patch_installation_count: int | None = Field(default=None, alias="RunningPatchInstallationCount")
+    servers_affecting_compliance_count: int | None = Field(default=None, alias="ServersAffectingComplianceCount")
+    servers_compliance_score: float | None = Field(default=None, alias="ServersComplianceScore")
+    test_stage_compliance_score: float | None = Field(default=None, alias="TestStageComplianceScore")
+    workstations_affecting_compliance_count: int | None = Field(
+        default=None, alias="WorkstationsAffectingComplianceCount"
+    )
+    workstations_compliance_score: float | None = Field(default=None, alias="WorkstationsComplianceScore")
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDisableServerPatchRebootServerSettings(ConnectWiseModel):
+    alert_template: AutomateAlertTemplate | None = Field(default=None, alias="AlertTemplate")
+    alert_message: str | None = Field(default=None, alias="AlertMessage")
+    ticket_category: AutomateTicketCategory | None = Field(default=None, alias="TicketCategory")
+    report_category: AutomateReportCategory | None = Field(default=None, alias="ReportCategory")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_alert_template import AutomateAlertTemplate
+from pyconnectwise.models.automate.automate_report_category import AutomateReportCategory
+from pyconnectwise.models.automate.automate_ticket_category import AutomateTicketCategory
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDisableServerPatchRebootSettings(ConnectWiseModel):
+    server_settings: AutomateDisableServerPatchRebootServerSettings | None = Field(default=None, alias="ServerSettings")
+    workstation_settings: AutomateDisableServerPatchRebootWorkstationSettings | None = Field(
+        default=None, alias="WorkstationSettings"
+    )
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_disable_server_patch_reboot_server_settings import (
+    AutomateDisableServerPatchRebootServerSettings,
+)
+from pyconnectwise.models.automate.automate_disable_server_patch_reboot_workstation_settings import (
+    AutomateDisableServerPatchRebootWorkstationSettings,
+)
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDistributionWindow(ConnectWiseModel):
+    distribution_window_type: AutomateDistributionWindowType | None = Field(
+        default=None, alias="DistributionWindowType"
+    )
+    amount: int | None = Field(default=None, alias="Amount")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_distribution_window_type import AutomateDistributionWindowType
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateDropdownSettings(ConnectWiseModel):
+    available_options: dict[str, str] | None = Field(default=None, alias="AvailableOptions")
+    selected_value: str | None = Field(default=None, alias="SelectedValue")
+    default_value: str | None = Field(default=None, alias="DefaultValue")
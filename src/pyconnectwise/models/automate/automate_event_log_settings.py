@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateEventLogSettings(ConnectWiseModel):
+    log_file_name: str | None = Field(default=None, alias="LogFileName")
+    event_type_id: int | None = Field(default=None, alias="EventTypeId")
+    source: str | None = Field(default=None, alias="Source")
+    event_id: str | None = Field(default=None, alias="EventId")
+    message_regex: str | None = Field(default=None, alias="MessageRegex")
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExecuteDeviceScriptRequest(ConnectWiseModel):
+    script_id: int | None = Field(default=None, alias="ScriptId")
+    parameter_list: list[str] | None = Field(default=None, alias="ParameterList")
+    device_id_list: list[int] | None = Field(default=None, alias="DeviceIdList")
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExecutePatchActionRequest(ConnectWiseModel):
+    patch_action_detail_list: list[AutomatePatchActionInformation] | None = Field(
+        default=None, alias="PatchActionDetailList"
+    )
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_patch_action_information import AutomatePatchActionInformation
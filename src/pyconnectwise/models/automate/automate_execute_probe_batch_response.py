@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExecuteProbeBatchResponse(ConnectWiseModel):
+    probe_command_results: list[AutomateExecuteProbeCommandResult] | None = Field(
+        default=None, alias="ProbeCommandResults"
+    )
+    contains_unsuccessful_results: bool | None = Field(default=None, alias="ContainsUnsuccessfulResults")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_execute_probe_command_result import AutomateExecuteProbeCommandResult
@@ -0,0 +1,54 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExecuteToggleServiceUserCommandBatchRequest(ConnectWiseModel):
+    use_local_account: bool | None = Field(default=None, alias="UseLocalAccount")
+    local_account_credentials: AutomateToggleServiceUserLocalAccountCredentials | None = Field(
+        default=None, alias="LocalAccountCredentials"
+    )
+    entity_type: Literal[
+        "System",
+        "Computer",
+        "Site",
+        "Company",
+        "Probe",
+        "NetworkDevice",
+        "Ticket",
+        "Group",
+        "MobileDevice",
+        "Vendor",
+        "VendorProduct",
+        "Possibility",
+        "Opportunity",
+        "Contact",
+        "User",
+        "Script",
+        "Plugin",
+        "Service",
+        "ServiceBundle",
+        "Search",
+        "SearchFolder",
+        "Dataview",
+        "DataviewFolder",
+        "UserFolder",
+        "UserClass",
+        "ScriptFolder",
+        "RemoteMonitorTemplate",
+        "ExtraField",
+    ] | None = Field(default=None, alias="EntityType")
+    entity_ids: list[int] | None = Field(default=None, alias="EntityIds")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_toggle_service_user_local_account_credentials import (
+    AutomateToggleServiceUserLocalAccountCredentials,
+)
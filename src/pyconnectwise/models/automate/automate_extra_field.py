@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateExtraField(ConnectWiseModel):
+    target_id: int | None = Field(default=None, alias="TargetId")
+    extra_field_definition_id: int | None = Field(default=None, alias="ExtraFieldDefinitionId")
+    title: str | None = Field(default=None, alias="Title")
+    display_format: AutomateExtraFieldDisplayFormat | None = Field(default=None, alias="DisplayFormat")
+    location: AutomateExtraFieldLocation | None = Field(default=None, alias="Location")
+    title_format: AutomateExtraFieldTitleFormat | None = Field(default=None, alias="TitleFormat")
+    section: str | None = Field(default=None, alias="Section")
+    tooltip: str | None = Field(default=None, alias="Tooltip")
+    is_read_only: bool | None = Field(default=None, alias="IsReadOnly")
+    text_field_settings: AutomateTextFieldSettings | None = Field(default=None, alias="TextFieldSettings")
+    dropdown_settings: AutomateDropdownSettings | None = Field(default=None, alias="DropdownSettings")
+    checkbox_settings: AutomateCheckboxSettings | None = Field(default=None, alias="CheckboxSettings")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_checkbox_settings import AutomateCheckboxSettings
+from pyconnectwise.models.automate.automate_dropdown_settings import AutomateDropdownSettings
+from pyconnectwise.models.automate.automate_extra_field_display_format import AutomateExtraFieldDisplayFormat
+from pyconnectwise.models.automate.automate_extra_field_location import AutomateExtraFieldLocation
+from pyconnectwise.models.automate.automate_extra_field_title_format import AutomateExtraFieldTitleFormat
+from pyconnectwise.models.automate.automate_text_field_settings import AutomateTextFieldSettings
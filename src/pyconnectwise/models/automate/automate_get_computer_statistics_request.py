@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGetComputerStatisticsRequest(ConnectWiseModel):
+    number_of_days: int | None = Field(default=None, alias="NumberOfDays")
+    entity_ids: list[int] | None = Field(default=None, alias="EntityIds")
+    entity_type: str | None = Field(default=None, alias="EntityType")
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGetScriptStatisticsResponse(ConnectWiseModel):
+    script_history_count: int | None = Field(default=None, alias="ScriptHistoryCount")
+    script_pending_count: int | None = Field(default=None, alias="ScriptPendingCount")
+    script_running_count: int | None = Field(default=None, alias="ScriptRunningCount")
+    script_failure_count: int | None = Field(default=None, alias="ScriptFailureCount")
+    script_success_count: int | None = Field(default=None, alias="ScriptSuccessCount")
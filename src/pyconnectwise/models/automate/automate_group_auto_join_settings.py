@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGroupAutoJoinSettings(ConnectWiseModel):
+    computer_auto_join_search: AutomateSearch | None = Field(default=None, alias="ComputerAutoJoinSearch")
+    is_limited_to_computer_auto_join: bool | None = Field(default=None, alias="IsLimitedToComputerAutoJoin")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_search import AutomateSearch
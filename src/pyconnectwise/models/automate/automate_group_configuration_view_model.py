@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGroupConfigurationViewModel(ConnectWiseModel):
+    group_type_information: AutomateGroupTypeInformation | None = Field(default=None, alias="GroupTypeInformation")
+    remote_agent_template_information: AutomateRemoteAgentTemplateInformation | None = Field(
+        default=None, alias="RemoteAgentTemplateInformation"
+    )
+    computer_search_information: AutomateComputerSearchInformation | None = Field(
+        default=None, alias="ComputerSearchInformation"
+    )
+    network_device_searches: list[AutomateSearch] | None = Field(default=None, alias="NetworkDeviceSearches")
+    contact_searches: list[AutomateSearch] | None = Field(default=None, alias="ContactSearches")
+    clients: list[AutomateClient] | None = Field(default=None, alias="Clients")
+    locations: list[AutomateLocation] | None = Field(default=None, alias="Locations")
+    maintenance_windows: list[AutomateMaintenanceWindow] | None = Field(default=None, alias="MaintenanceWindows")
+    user_classes: list[AutomateUserClass] | None = Field(default=None, alias="UserClasses")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_client import AutomateClient
+from pyconnectwise.models.automate.automate_computer_search_information import AutomateComputerSearchInformation
+from pyconnectwise.models.automate.automate_group_type_information import AutomateGroupTypeInformation
+from pyconnectwise.models.automate.automate_location import AutomateLocation
+from pyconnectwise.models.automate.automate_maintenance_window import AutomateMaintenanceWindow
+from pyconnectwise.models.automate.automate_remote_agent_template_information import (
+    AutomateRemoteAgentTemplateInformation,
+)
+from pyconnectwise.models.automate.automate_search import AutomateSearch
+from pyconnectwise.models.automate.automate_user_class import AutomateUserClass
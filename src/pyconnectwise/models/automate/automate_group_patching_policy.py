@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGroupPatchingPolicy(ConnectWiseModel):
+    approval_policies: list[AutomateApprovalPolicy] | None = Field(default=None, alias="ApprovalPolicies")
+    group_id: int | None = Field(default=None, alias="GroupId")
+    group_name: str | None = Field(default=None, alias="GroupName")
+    is_manual: bool | None = Field(default=None, alias="IsManual")
+    is_patching_group: bool | None = Field(default=None, alias="IsPatchingGroup")
+    microsoft_update_policy: AutomateMicrosoftUpdatePolicy | None = Field(default=None, alias="MicrosoftUpdatePolicy")
+    priority: int | None = Field(default=None, alias="Priority")
+    reboot_policy: AutomateRebootPolicy | None = Field(default=None, alias="RebootPolicy")
+    third_party_update_policy: AutomateThirdPartyUpdatePolicy | None = Field(
+        default=None, alias="ThirdPartyUpdatePolicy"
+    )
+    auto_join_settings: AutomateGroupAutoJoinSettings | None = Field(default=None, alias="AutoJoinSettings")
+    windows_computer_count: int | None = Field(default=None, alias="WindowsComputerCount")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_approval_policy import AutomateApprovalPolicy
+from pyconnectwise.models.automate.automate_group_auto_join_settings import AutomateGroupAutoJoinSettings
+from pyconnectwise.models.automate.automate_microsoft_update_policy import AutomateMicrosoftUpdatePolicy
+from pyconnectwise.models.automate.automate_reboot_policy import AutomateRebootPolicy
+from pyconnectwise.models.automate.automate_third_party_update_policy import AutomateThirdPartyUpdatePolicy
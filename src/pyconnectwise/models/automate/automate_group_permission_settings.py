@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGroupPermissionSettings(ConnectWiseModel):
+    is_inherited: bool | None = Field(default=None, alias="IsInherited")
+    computer_permission_settings: dict[str, list[str]] | None = Field(default=None, alias="ComputerPermissionSettings")
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGroupTypeInformation(ConnectWiseModel):
+    inherited_group_type_id: int | None = Field(default=None, alias="InheritedGroupTypeId")
+    is_modifiable: bool | None = Field(default=None, alias="IsModifiable")
+    group_types: list[AutomateGroupType] | None = Field(default=None, alias="GroupTypes")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_group_type import AutomateGroupType
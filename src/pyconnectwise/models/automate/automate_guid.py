@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateGuid(ConnectWiseModel):
+    id: UUID | None = Field(default=None, alias="Id", examples=["00000000-0000-0000-0000-000000000000"])
+    name: str | None = Field(default=None, alias="Name")
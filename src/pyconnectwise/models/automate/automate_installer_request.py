@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateInstallerRequest(ConnectWiseModel):
+    location_id: int | None = Field(default=None, alias="LocationId")
+    installer_type: int | None = Field(default=None, alias="InstallerType")
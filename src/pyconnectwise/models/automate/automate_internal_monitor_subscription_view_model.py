@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateInternalMonitorSubscriptionViewModel(ConnectWiseModel):
+    alert_templates: list[AutomateAlertTemplate] | None = Field(default=None, alias="AlertTemplates")
+    ticket_categories: list[AutomateTicketCategory] | None = Field(default=None, alias="TicketCategories")
+    is_group_subscribed: bool | None = Field(default=None, alias="IsGroupSubscribed")
+    is_subscription_inherited: bool | None = Field(default=None, alias="IsSubscriptionInherited")
+    is_override_applied: bool | None = Field(default=None, alias="IsOverrideApplied")
+    monitor_alert_template_id: int | None = Field(default=None, alias="MonitorAlertTemplateId")
+    monitor_ticket_category_id: int | None = Field(default=None, alias="MonitorTicketCategoryId")
+    overridden_alert_template_id: int | None = Field(default=None, alias="OverriddenAlertTemplateId")
+    overridden_ticket_category_id: int | None = Field(default=None, alias="OverriddenTicketCategoryId")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_alert_template import AutomateAlertTemplate
+from pyconnectwise.models.automate.automate_ticket_category import AutomateTicketCategory
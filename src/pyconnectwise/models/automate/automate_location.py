@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateLocation(ConnectWiseModel):
+    location_id: int | None = Field(default=None, alias="LocationId")
+    name: str | None = Field(default=None, alias="Name")
+    client: AutomateClient | None = Field(default=None, alias="Client")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_client import AutomateClient
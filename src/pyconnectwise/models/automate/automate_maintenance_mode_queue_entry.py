@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMaintenanceModeQueueEntry(ConnectWiseModel):
+    maintenance_mode_queue_id: int | None = Field(default=None, alias="MaintenanceModeQueueId")
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    start_date: datetime | None = Field(default=None, alias="StartDate")
+    duration_in_minutes: int | None = Field(default=None, alias="DurationInMinutes")
+    mode: str | None = Field(default=None, alias="Mode")
+    user_id: int | None = Field(default=None, alias="UserId")
+    comments: str | None = Field(default=None, alias="Comments")
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.automate.lab_tech_maintenance_window_definition import LabTechMaintenanceWindowDefinition
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMaintenanceWindowDefinition(LabTechMaintenanceWindowDefinition):
+    pass
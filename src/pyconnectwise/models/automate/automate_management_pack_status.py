@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateManagementPackStatus(ConnectWiseModel):
+    is_installed: bool | None = Field(default=None, alias="IsInstalled")
+    is_enabled: bool | None = Field(default=None, alias="IsEnabled")
+    alert_level: str | None = Field(default=None, alias="AlertLevel")
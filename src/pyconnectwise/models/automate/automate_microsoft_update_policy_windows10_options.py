@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMicrosoftUpdatePolicyWindows10Options(ConnectWiseModel):
+    service_branch_settings: AutomateServiceBranchSettings | None = Field(default=None, alias="ServiceBranchSettings")
+    feature_update_deferment_settings: AutomateUpdateDefermentSettings | None = Field(
+        default=None, alias="FeatureUpdateDefermentSettings"
+    )
+    quality_update_deferment_settings: AutomateUpdateDefermentSettings | None = Field(
+        default=None, alias="QualityUpdateDefermentSettings"
+    )
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_service_branch_settings import AutomateServiceBranchSettings
+from pyconnectwise.models.automate.automate_update_deferment_settings import AutomateUpdateDefermentSettings
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMonitor(ConnectWiseModel):
+    monitor_id: int | None = Field(default=None, alias="MonitorId")
+    name: str | None = Field(default=None, alias="Name")
+    groups: list[AutomateGroup] | None = Field(default=None, alias="Groups")
+    target_computer: AutomateComputer | None = Field(default=None, alias="TargetComputer")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_computer import AutomateComputer
+from pyconnectwise.models.automate.automate_group import AutomateGroup
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMonitorAlertPolicy(ConnectWiseModel):
+    effective_policy_type_id: int | None = Field(default=None, alias="EffectivePolicyTypeId")
+    effective_policy_type_name: str | None = Field(default=None, alias="EffectivePolicyTypeName")
+    is_alert_template_overridden: bool | None = Field(default=None, alias="IsAlertTemplateOverridden")
+    alert_template_id: int | None = Field(default=None, alias="AlertTemplateId")
+    alert_template_name: str | None = Field(default=None, alias="AlertTemplateName")
+    alert_template_description: str | None = Field(default=None, alias="AlertTemplateDescription")
+    is_ticket_category_overridden: bool | None = Field(default=None, alias="IsTicketCategoryOverridden")
+    ticket_category_id: int | None = Field(default=None, alias="TicketCategoryId")
+    ticket_category_name: str | None = Field(default=None, alias="TicketCategoryName")
+    inheritance_source_name: str | None = Field(default=None, alias="InheritanceSourceName")
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMonitorCount(ConnectWiseModel):
+    internal_monitor_total_count: int | None = Field(default=None, alias="InternalMonitorTotalCount")
+    internal_monitor_total_disable_count: int | None = Field(default=None, alias="InternalMonitorTotalDisableCount")
+    internal_monitor_total_detected_count: int | None = Field(default=None, alias="InternalMonitorTotalDetectedCount")
+    remote_monitor_total_count: int | None = Field(default=None, alias="RemoteMonitorTotalCount")
+    remote_monitor_total_failure_count: int | None = Field(default=None, alias="RemoteMonitorTotalFailureCount")
+    remote_monitor_total_warning_count: int | None = Field(default=None, alias="RemoteMonitorTotalWarningCount")
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateMonthlyScheduleFrequency(ConnectWiseModel):
+    runs_at: str | None = Field(default=None, alias="RunsAt")
+    monthly_interval: int | None = Field(default=None, alias="MonthlyInterval")
+    day: int | None = Field(default=None, alias="Day")
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePasswordResetTokenRequest(ConnectWiseModel):
+    username: str | None = Field(default=None, alias="Username")
+    password_reset_token: str | None = Field(default=None, alias="PasswordResetToken")
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePatchingPolicies(ConnectWiseModel):
+    microsoft_update_policy: AutomateMicrosoftUpdatePolicy | None = Field(default=None, alias="MicrosoftUpdatePolicy")
+    reboot_policy: AutomateRebootPolicy | None = Field(default=None, alias="RebootPolicy")
+    third_party_update_policy: AutomateThirdPartyUpdatePolicy | None = Field(
+        default=None, alias="ThirdPartyUpdatePolicy"
+    )
+    approval_policies: list[AutomateApprovalPolicy] | None = Field(default=None, alias="ApprovalPolicies")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_approval_policy import AutomateApprovalPolicy
+from pyconnectwise.models.automate.automate_microsoft_update_policy import AutomateMicrosoftUpdatePolicy
+from pyconnectwise.models.automate.automate_reboot_policy import AutomateRebootPolicy
+from pyconnectwise.models.automate.automate_third_party_update_policy import AutomateThirdPartyUpdatePolicy
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePatchingPolicyScriptOptions(ConnectWiseModel):
+    before_script_options: AutomatePatchingPolicyScript | None = Field(default=None, alias="BeforeScriptOptions")
+    after_script_options: AutomatePatchingPolicyScript | None = Field(default=None, alias="AfterScriptOptions")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_patching_policy_script import AutomatePatchingPolicyScript
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.automate.lab_tech_performance_counter_query_parameters import (
+    LabTechPerformanceCounterQueryParameters,
+)
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePerformanceCounterSettings(LabTechPerformanceCounterQueryParameters):
+    pass
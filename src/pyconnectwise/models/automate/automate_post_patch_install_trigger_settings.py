@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePostPatchInstallTriggerSettings(ConnectWiseModel):
+    limit_to_microsoft_update_policy_window: bool | None = Field(
+        default=None, alias="LimitToMicrosoftUpdatePolicyWindow"
+    )
+    window_extension: str | None = Field(default=None, alias="WindowExtension")
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateProbeCommandHistoryEntry(ConnectWiseModel):
+    probe_command_history_id: int | None = Field(default=None, alias="ProbeCommandHistoryId")
+    probe_id: int | None = Field(default=None, alias="ProbeId")
+    date_executed: datetime | None = Field(default=None, alias="DateExecuted")
+    status: AutomateProbeCommandStatus | None = Field(default=None, alias="Status")
+    probe_remote_command: AutomateProbeRemoteCommand | None = Field(default=None, alias="ProbeRemoteCommand")
+    output: str | None = Field(default=None, alias="Output")
+    user: str | None = Field(default=None, alias="User")
+    date_finished: datetime | None = Field(default=None, alias="DateFinished")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_probe_command_status import AutomateProbeCommandStatus
+from pyconnectwise.models.automate.automate_probe_remote_command import AutomateProbeRemoteCommand
@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomatePromptWithoutDeadlineSettings(ConnectWiseModel):
+    reboot_trigger_type: str | None = Field(default=None, alias="RebootTriggerType")
+    post_patch_install_trigger_settings: AutomatePostPatchInstallTriggerSettings | None = Field(
+        default=None, alias="PostPatchInstallTriggerSettings"
+    )
+    schedule_trigger_settings: AutomatePatchingPolicySchedule | None = Field(
+        default=None, alias="ScheduleTriggerSettings"
+    )
+    prompt_settings: AutomateRebootPolicyPromptSettings | None = Field(default=None, alias="PromptSettings")
+    reboot_prior_to_patch_job_installs: bool | None = Field(default=None, alias="RebootPriorToPatchJobInstalls")
+    maintenance_mode_options: AutomateRebootPolicyMaintenanceModeOptions | None = Field(
+        default=None, alias="MaintenanceModeOptions"
+    )
+    script_options: AutomatePatchingPolicyScriptOptions | None = Field(default=None, alias="ScriptOptions")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_patching_policy_schedule import AutomatePatchingPolicySchedule
+from pyconnectwise.models.automate.automate_patching_policy_script_options import AutomatePatchingPolicyScriptOptions
+from pyconnectwise.models.automate.automate_post_patch_install_trigger_settings import (
+    AutomatePostPatchInstallTriggerSettings,
+)
+from pyconnectwise.models.automate.automate_reboot_policy_maintenance_mode_options import (
+    AutomateRebootPolicyMaintenanceModeOptions,
+)
+from pyconnectwise.models.automate.automate_reboot_policy_prompt_settings import AutomateRebootPolicyPromptSettings
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRebootPolicy(ConnectWiseModel):
+    policy_id: int | None = Field(default=None, alias="PolicyId")
+    policy_name: str | None = Field(default=None, alias="PolicyName")
+    reboot_policy_type: str | None = Field(default=None, alias="RebootPolicyType")
+    disable_server_patch_reboot_settings: AutomateDisableServerPatchRebootSettings | None = Field(
+        default=None, alias="DisableServerPatchRebootSettings"
+    )
+    prompt_without_deadline_settings: AutomatePromptWithoutDeadlineSettings | None = Field(
+        default=None, alias="PromptWithoutDeadlineSettings"
+    )
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_disable_server_patch_reboot_settings import (
+    AutomateDisableServerPatchRebootSettings,
+)
+from pyconnectwise.models.automate.automate_prompt_without_deadline_settings import (
+    AutomatePromptWithoutDeadlineSettings,
+)
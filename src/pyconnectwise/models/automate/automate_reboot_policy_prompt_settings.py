@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRebootPolicyPromptSettings(ConnectWiseModel):
+    use_prompt: bool | None = Field(default=None, alias="UsePrompt")
+    requires_confirmation: bool | None = Field(default=None, alias="RequiresConfirmation")
+    reboot_if_no_user_logged_on: bool | None = Field(default=None, alias="RebootIfNoUserLoggedOn")
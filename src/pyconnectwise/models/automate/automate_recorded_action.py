@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRecordedAction(ConnectWiseModel):
+    type: AutomateRecordedActionType | None = Field(default=None, alias="Type")
+    object_id: int | None = Field(default=None, alias="ObjectId")
+    secondary_identifier: str | None = Field(default=None, alias="SecondaryIdentifier")
+    description: str | None = Field(default=None, alias="Description")
+    source: AutomateRecordedActionSource | None = Field(default=None, alias="Source")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_recorded_action_source import AutomateRecordedActionSource
+from pyconnectwise.models.automate.automate_recorded_action_type import AutomateRecordedActionType
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRegisterSsoRequest(ConnectWiseModel):
+    registration_token: str | None = Field(default=None, alias="RegistrationToken")
+    enabled_user_folders: list[int] | None = Field(default=None, alias="EnabledUserFolders")
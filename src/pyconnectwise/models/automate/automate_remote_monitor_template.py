@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRemoteMonitorTemplate(ConnectWiseModel):
+    limiting_search: AutomateSearch | None = Field(default=None, alias="LimitingSearch")
+    group_id: int | None = Field(default=None, alias="GroupId")
+    target_type: AutomateTargetType | None = Field(default=None, alias="TargetType")
+    install_count: int | None = Field(default=None, alias="InstallCount")
+    sub_type: str | None = Field(default=None, alias="SubType")
+    details: str | None = Field(default=None, alias="Details")
+    last_edited_by: str | None = Field(default=None, alias="LastEditedBy")
+    last_edited_time: datetime | None = Field(default=None, alias="LastEditedTime")
+    remote_monitor_id: int | None = Field(default=None, alias="RemoteMonitorId")
+    name: str | None = Field(default=None, alias="Name")
+    alerting_settings: AutomateAlertingSettings | None = Field(default=None, alias="AlertingSettings")
+    configuration: AutomateConfiguration | None = Field(default=None, alias="Configuration")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_alerting_settings import AutomateAlertingSettings
+from pyconnectwise.models.automate.automate_configuration import AutomateConfiguration
+from pyconnectwise.models.automate.automate_search import AutomateSearch
+from pyconnectwise.models.automate.automate_target_type import AutomateTargetType
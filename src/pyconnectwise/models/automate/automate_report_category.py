@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.automate.automate_windows_update_category import AutomateWindowsUpdateCategory
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateReportCategory(AutomateWindowsUpdateCategory):
+    pass
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRunningScript(ConnectWiseModel):
+    script_instance_id: int | None = Field(default=None, alias="ScriptInstanceId")
+    target: AutomateRunningScriptTarget | None = Field(default=None, alias="Target")
+    script: AutomateScript | None = Field(default=None, alias="Script")
+    source: AutomateScriptSource | None = Field(default=None, alias="Source")
+    state: AutomateScriptState | None = Field(default=None, alias="State")
+    start_date: datetime | None = Field(default=None, alias="StartDate")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_running_script_target import AutomateRunningScriptTarget
+from pyconnectwise.models.automate.automate_script import AutomateScript
+from pyconnectwise.models.automate.automate_script_source import AutomateScriptSource
+from pyconnectwise.models.automate.automate_script_state import AutomateScriptState
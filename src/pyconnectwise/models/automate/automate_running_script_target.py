@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateRunningScriptTarget(ConnectWiseModel):
+    target_type: AutomateRunningScriptTargetType | None = Field(default=None, alias="TargetType")
+    computer: AutomateComputer | None = Field(default=None, alias="Computer")
+    client: AutomateClient | None = Field(default=None, alias="Client")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_client import AutomateClient
+from pyconnectwise.models.automate.automate_computer import AutomateComputer
+from pyconnectwise.models.automate.automate_running_script_target_type import AutomateRunningScriptTargetType
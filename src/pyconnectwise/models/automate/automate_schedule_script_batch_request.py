@@ -0,0 +1,67 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScheduleScriptBatchRequest(ConnectWiseModel):
+    entity_type: Literal[
+        "System",
+        "Computer",
+        "Site",
+        "Company",
+        "Probe",
+        "NetworkDevice",
+        "Ticket",
+        "Group",
+        "MobileDevice",
+        "Vendor",
+        "VendorProduct",
+        "Possibility",
+        "Opportunity",
+        "Contact",
+        "User",
+        "Script",
+        "Plugin",
+        "Service",
+        "ServiceBundle",
+        "Search",
+        "SearchFolder",
+        "Dataview",
+        "DataviewFolder",
+        "UserFolder",
+        "UserClass",
+        "ScriptFolder",
+        "RemoteMonitorTemplate",
+        "ExtraField",
+    ] | None = Field(default=None, alias="EntityType")
+    entity_ids: list[int] | None = Field(default=None, alias="EntityIds")
+    script_id: int | None = Field(default=None, alias="ScriptId")
+    script_guid: str | None = Field(default=None, alias="ScriptGuid")
+    schedule: AutomateScriptScheduleSettings | None = Field(default=None, alias="Schedule")
+    parameters: list[SystemString] | None = Field(default=None, alias="Parameters")
+    use_agent_time: bool | None = Field(default=None, alias="UseAgentTime")
+    start_date: datetime | None = Field(default=None, alias="StartDate")
+    expire_date: datetime | None = Field(default=None, alias="ExpireDate")
+    offline_action_flags: AutomateScheduledScriptOfflineActionFlags | None = Field(
+        default=None, alias="OfflineActionFlags"
+    )
+    distribution_window: AutomateDistributionWindow | None = Field(default=None, alias="DistributionWindow")
+    priority: int | None = Field(default=None, alias="Priority")
+    include_sub_groups: bool | None = Field(default=None, alias="IncludeSubGroups")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_distribution_window import AutomateDistributionWindow
+from pyconnectwise.models.automate.automate_scheduled_script_offline_action_flags import (
+    AutomateScheduledScriptOfflineActionFlags,
+)
+from pyconnectwise.models.automate.automate_script_schedule_settings import AutomateScriptScheduleSettings
+from pyconnectwise.models.automate.system_string import SystemString
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScheduleTargetType(ConnectWiseModel):
+    schedule_target_type_id: int | None = Field(default=None, alias="ScheduleTargetTypeId")
+    name: str | None = Field(default=None, alias="Name")
@@ -0,0 +1,45 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScheduledScript(ConnectWiseModel):
+    scheduled_script_id: int | None = Field(default=None, alias="ScheduledScriptId")
+    script: AutomateScript | None = Field(default=None, alias="Script")
+    schedule_target: AutomateScheduledScriptTarget | None = Field(default=None, alias="ScheduleTarget")
+    schedule: AutomateScriptScheduleSettings | None = Field(default=None, alias="Schedule")
+    limiting_search: AutomateSearch | None = Field(default=None, alias="LimitingSearch")
+    offline_action_flags: AutomateScheduledScriptOfflineActionFlags | None = Field(
+        default=None, alias="OfflineActionFlags"
+    )
+    distribution_window: AutomateDistributionWindow | None = Field(default=None, alias="DistributionWindow")
+    parameters: list[SystemString] | None = Field(default=None, alias="Parameters")
+    use_agent_time: bool | None = Field(default=None, alias="UseAgentTime")
+    scheduled_by: str | None = Field(default=None, alias="ScheduledBy")
+    occurrences: int | None = Field(default=None, alias="Occurrences")
+    start_date: datetime | None = Field(default=None, alias="StartDate")
+    expire_date: datetime | None = Field(default=None, alias="ExpireDate")
+    next_run_date: datetime | None = Field(default=None, alias="NextRunDate")
+    is_disabled: bool | None = Field(default=None, alias="IsDisabled")
+    priority: int | None = Field(default=None, alias="Priority")
+    include_sub_groups: bool | None = Field(default=None, alias="IncludeSubGroups")
+    is_inherited: bool | None = Field(default=None, alias="IsInherited")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_distribution_window import AutomateDistributionWindow
+from pyconnectwise.models.automate.automate_scheduled_script_offline_action_flags import (
+    AutomateScheduledScriptOfflineActionFlags,
+)
+from pyconnectwise.models.automate.automate_scheduled_script_target import AutomateScheduledScriptTarget
+from pyconnectwise.models.automate.automate_script import AutomateScript
+from pyconnectwise.models.automate.automate_script_schedule_settings import AutomateScriptScheduleSettings
+from pyconnectwise.models.automate.automate_search import AutomateSearch
+from pyconnectwise.models.automate.system_string import SystemString
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScheduledScriptOfflineActionFlags(ConnectWiseModel):
+    skips_offline_agents: bool | None = Field(default=None, alias="SkipsOfflineAgents")
+    wakes_offline_agents: bool | None = Field(default=None, alias="WakesOfflineAgents")
+    only_runs_on_offline_agents: bool | None = Field(default=None, alias="OnlyRunsOnOfflineAgents")
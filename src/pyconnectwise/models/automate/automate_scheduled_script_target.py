@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScheduledScriptTarget(ConnectWiseModel):
+    schedule_target_type: AutomateScheduleTargetType | None = Field(default=None, alias="ScheduleTargetType")
+    group: AutomateGroup | None = Field(default=None, alias="Group")
+    client: AutomateClient | None = Field(default=None, alias="Client")
+    location: AutomateLocation | None = Field(default=None, alias="Location")
+    computer: AutomateComputer | None = Field(default=None, alias="Computer")
+    network_device: AutomateNetworkDevice | None = Field(default=None, alias="NetworkDevice")
+    contact: AutomateContact | None = Field(default=None, alias="Contact")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_client import AutomateClient
+from pyconnectwise.models.automate.automate_computer import AutomateComputer
+from pyconnectwise.models.automate.automate_contact import AutomateContact
+from pyconnectwise.models.automate.automate_group import AutomateGroup
+from pyconnectwise.models.automate.automate_location import AutomateLocation
+from pyconnectwise.models.automate.automate_network_device import AutomateNetworkDevice
+from pyconnectwise.models.automate.automate_schedule_target_type import AutomateScheduleTargetType
@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScript(ConnectWiseModel):
+    script_id: int | None = Field(default=None, alias="ScriptId")
+    ticket_entry_settings: AutomateTicketEntrySettings | None = Field(default=None, alias="TicketEntrySettings")
+    time_entry_settings: AutomateTimeEntrySettings | None = Field(default=None, alias="TimeEntrySettings")
+    user_class_access_settings: list[AutomateUserClassAccess] | None = Field(
+        default=None, alias="UserClassAccessSettings"
+    )
+    is_protected: bool | None = Field(default=None, alias="IsProtected")
+    uses_enhanced_logging: bool | None = Field(default=None, alias="UsesEnhancedLogging")
+    steps: list[AutomateScriptStep] | None = Field(default=None, alias="Steps")
+    global_variables: dict[str, str] | None = Field(default=None, alias="GlobalVariables")
+    parameters: list[str] | None = Field(default=None, alias="Parameters")
+    name: str | None = Field(default=None, alias="Name")
+    description: str | None = Field(default=None, alias="Description")
+    folder: AutomateScriptFolder | None = Field(default=None, alias="Folder")
+    script_target_type: AutomateScriptTarget | None = Field(default=None, alias="ScriptTargetType")
+    script_options: AutomateScriptOptions | None = Field(default=None, alias="ScriptOptions")
+    automation_minutes: int | None = Field(default=None, alias="AutomationMinutes")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_script_folder import AutomateScriptFolder
+from pyconnectwise.models.automate.automate_script_options import AutomateScriptOptions
+from pyconnectwise.models.automate.automate_script_step import AutomateScriptStep
+from pyconnectwise.models.automate.automate_script_target import AutomateScriptTarget
+from pyconnectwise.models.automate.automate_ticket_entry_settings import AutomateTicketEntrySettings
+from pyconnectwise.models.automate.automate_time_entry_settings import AutomateTimeEntrySettings
+from pyconnectwise.models.automate.automate_user_class_access import AutomateUserClassAccess
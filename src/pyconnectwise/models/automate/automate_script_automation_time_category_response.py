@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptAutomationTimeCategoryResponse(ConnectWiseModel):
+    total: AutomateScriptAutomationTimeResult | None = Field(default=None, alias="Total")
+    system: AutomateScriptAutomationTimeResult | None = Field(default=None, alias="System")
+    users: AutomateScriptAutomationTimeResult | None = Field(default=None, alias="Users")
+    maximum_history_days_available: int | None = Field(default=None, alias="MaximumHistoryDaysAvailable")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_script_automation_time_result import AutomateScriptAutomationTimeResult
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptAutomationTimeResult(ConnectWiseModel):
+    successful_scripts: int | None = Field(default=None, alias="SuccessfulScripts")
+    automation_time_minutes: int | None = Field(default=None, alias="AutomationTimeMinutes")
+    automation_value: int | None = Field(default=None, alias="AutomationValue")
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptFolder(ConnectWiseModel):
+    script_folder_id: int | None = Field(default=None, alias="ScriptFolderId")
+    name: str | None = Field(default=None, alias="Name")
+    child_folders: list[AutomateScriptFolder] | None = Field(default=None, alias="ChildFolders")
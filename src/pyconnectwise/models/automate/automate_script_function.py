@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptFunction(ConnectWiseModel):
+    function_id: int | None = Field(default=None, alias="FunctionId")
+    name: str | None = Field(default=None, alias="Name")
+    is_conditional_function: bool | None = Field(default=None, alias="IsConditionalFunction")
+    description: str | None = Field(default=None, alias="Description")
+    target_type: AutomateScriptFunctionTarget | None = Field(default=None, alias="TargetType")
+    parameters: list[AutomateScriptFunctionParameter] | None = Field(default=None, alias="Parameters")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_script_function_parameter import AutomateScriptFunctionParameter
+from pyconnectwise.models.automate.automate_script_function_target import AutomateScriptFunctionTarget
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptOptions(ConnectWiseModel):
+    is_isolated_script: bool | None = Field(default=None, alias="IsIsolatedScript")
+    is_maintenance_script: bool | None = Field(default=None, alias="IsMaintenanceScript")
+    is_function_script: bool | None = Field(default=None, alias="IsFunctionScript")
+    is_offline_script: bool | None = Field(default=None, alias="IsOfflineScript")
+    is_system_script: bool | None = Field(default=None, alias="IsSystemScript")
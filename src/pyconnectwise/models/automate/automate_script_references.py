@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptReferences(ConnectWiseModel):
+    schedule_count: int | None = Field(default=None, alias="ScheduleCount")
+    internal_monitors: list[AutomateMonitor] | None = Field(default=None, alias="InternalMonitors")
+    remote_monitors: list[AutomateMonitor] | None = Field(default=None, alias="RemoteMonitors")
+    alert_templates: list[AutomateAlertTemplate] | None = Field(default=None, alias="AlertTemplates")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_alert_template import AutomateAlertTemplate
+from pyconnectwise.models.automate.automate_monitor import AutomateMonitor
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptScheduleSettings(ConnectWiseModel):
+    script_schedule_frequency: AutomateScriptScheduleFrequency | None = Field(
+        default=None, alias="ScriptScheduleFrequency"
+    )
+    minutely_settings: AutomateMinutelyScheduleFrequency | None = Field(default=None, alias="MinutelySettings")
+    hourly_settings: AutomateHourlyScheduleFrequency | None = Field(default=None, alias="HourlySettings")
+    daily_settings: AutomateDailyScheduleFrequency | None = Field(default=None, alias="DailySettings")
+    weekly_settings: AutomateWeeklyScheduleFrequency | None = Field(default=None, alias="WeeklySettings")
+    monthly_settings: AutomateMonthlyScheduleFrequency | None = Field(default=None, alias="MonthlySettings")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_daily_schedule_frequency import AutomateDailyScheduleFrequency
+from pyconnectwise.models.automate.automate_hourly_schedule_frequency import AutomateHourlyScheduleFrequency
+from pyconnectwise.models.automate.automate_minutely_schedule_frequency import AutomateMinutelyScheduleFrequency
+from pyconnectwise.models.automate.automate_monthly_schedule_frequency import AutomateMonthlyScheduleFrequency
+from pyconnectwise.models.automate.automate_script_schedule_frequency import AutomateScriptScheduleFrequency
+from pyconnectwise.models.automate.automate_weekly_schedule_frequency import AutomateWeeklyScheduleFrequency
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptSettingsViewModel(ConnectWiseModel):
+    user_classes: list[AutomateUserClass] | None = Field(default=None, alias="UserClasses")
+    ticket_categories: list[AutomateTicketEntryCategory] | None = Field(default=None, alias="TicketCategories")
+    close_ticket_triggers: list[AutomateCloseTicketTrigger] | None = Field(default=None, alias="CloseTicketTriggers")
+    users: list[AutomateTimeEntryTechnician] | None = Field(default=None, alias="Users")
+    stop_timer_triggers: list[AutomateStopTimerTrigger] | None = Field(default=None, alias="StopTimerTriggers")
+    ticket_time_categories: list[AutomateTimeEntryCategory] | None = Field(default=None, alias="TicketTimeCategories")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_close_ticket_trigger import AutomateCloseTicketTrigger
+from pyconnectwise.models.automate.automate_stop_timer_trigger import AutomateStopTimerTrigger
+from pyconnectwise.models.automate.automate_ticket_entry_category import AutomateTicketEntryCategory
+from pyconnectwise.models.automate.automate_time_entry_category import AutomateTimeEntryCategory
+from pyconnectwise.models.automate.automate_time_entry_technician import AutomateTimeEntryTechnician
+from pyconnectwise.models.automate.automate_user_class import AutomateUserClass
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptSource(ConnectWiseModel):
+    source_type: AutomateSourceType | None = Field(default=None, alias="SourceType")
+    name: str | None = Field(default=None, alias="Name")
+    alternative_name: str | None = Field(default=None, alias="AlternativeName")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_source_type import AutomateSourceType
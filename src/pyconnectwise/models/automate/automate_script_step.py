@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptStep(ConnectWiseModel):
+    operating_system: int | None = Field(default=None, alias="OperatingSystem")
+    is_enabled: bool | None = Field(default=None, alias="IsEnabled")
+    should_continue_on_failure: bool | None = Field(default=None, alias="ShouldContinueOnFailure")
+    indentation_level: int | None = Field(default=None, alias="IndentationLevel")
+    function: AutomateScriptFunctionBase | None = Field(default=None, alias="Function")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_script_function_base import AutomateScriptFunctionBase
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateScriptSummary(ConnectWiseModel):
+    name: str | None = Field(default=None, alias="Name")
+    description: str | None = Field(default=None, alias="Description")
+    folder: AutomateScriptFolder | None = Field(default=None, alias="Folder")
+    script_target_type: AutomateScriptTarget | None = Field(default=None, alias="ScriptTargetType")
+    script_options: AutomateScriptOptions | None = Field(default=None, alias="ScriptOptions")
+    automation_minutes: int | None = Field(default=None, alias="AutomationMinutes")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_script_folder import AutomateScriptFolder
+from pyconnectwise.models.automate.automate_script_options import AutomateScriptOptions
+from pyconnectwise.models.automate.automate_script_target import AutomateScriptTarget
@@ -0,0 +1,33 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSearchAttributes(ConnectWiseModel):
+    key: str | None = Field(default=None, alias="Key")
+    text: str | None = Field(default=None, alias="Text")
+    description: str | None = Field(default=None, alias="Description")
+    data_type: Literal[
+        "TypeBoolean",
+        "TypeNumber",
+        "TypeText",
+        "TypeVersion",
+        "TypeDate",
+        "TypeAssigned",
+        "TypeEquality",
+        "TypeRole",
+    ] | None = Field(default=None, alias="DataType")
+    data_look_up_type: Literal["None", "Static", "Dynamic"] | None = Field(default=None, alias="DataLookUpType")
+    data_lookup: list[AutomateSearchValueLookUp] | None = Field(default=None, alias="DataLookup")
+    collection_node: str | None = Field(default=None, alias="CollectionNode")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_search_value_look_up import AutomateSearchValueLookUp
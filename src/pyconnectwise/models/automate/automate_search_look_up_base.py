@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSearchLookUpBase(ConnectWiseModel):
+    search_node: str | None = Field(default=None, alias="SearchNode")
+    is_leaf_node: bool | None = Field(default=None, alias="IsLeafNode")
+    child_nodes: list[AutomateSearchLookUpBase] | None = Field(default=None, alias="ChildNodes")
+    attributes: AutomateSearchAttributes | None = Field(default=None, alias="Attributes")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_search_attributes import AutomateSearchAttributes
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSearchesBatchResponse(ConnectWiseModel):
+    searches_results: list[AutomateDeleteSearchesBatchResult] | None = Field(default=None, alias="SearchesResults")
+    contains_unsuccessful_results: bool | None = Field(default=None, alias="ContainsUnsuccessfulResults")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_delete_searches_batch_result import AutomateDeleteSearchesBatchResult
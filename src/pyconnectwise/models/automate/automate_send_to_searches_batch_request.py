@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSendToSearchesBatchRequest(ConnectWiseModel):
+    search_ids: list[int] | None = Field(default=None, alias="SearchIds")
+    folder_id: int | None = Field(default=None, alias="FolderId")
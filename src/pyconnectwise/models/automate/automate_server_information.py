@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateServerInformation(ConnectWiseModel):
+    server_id: int | None = Field(default=None, alias="ServerId")
+    operating_system: str | None = Field(default=None, alias="OperatingSystem")
+    mac_address: str | None = Field(default=None, alias="MacAddress")
+    machine_name: str | None = Field(default=None, alias="MachineName")
+    cpu_name: str | None = Field(default=None, alias="CPUName")
+    cpu_sockets: int | None = Field(default=None, alias="CPUSockets")
+    cpu_cores: int | None = Field(default=None, alias="CPUCores")
+    logical_processors: int | None = Field(default=None, alias="LogicalProcessors")
+    memory_total: int | None = Field(default=None, alias="MemoryTotal")
+    is_database_server: bool | None = Field(default=None, alias="IsDatabaseServer")
+    is_web_server: bool | None = Field(default=None, alias="IsWebServer")
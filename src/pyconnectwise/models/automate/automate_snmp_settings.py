@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSnmpSettings(ConnectWiseModel):
+    server_address: str | None = Field(default=None, alias="ServerAddress")
+    community_string: str | None = Field(default=None, alias="CommunityString")
+    oid: str | None = Field(default=None, alias="Oid")
+    should_use_snmp_v2: bool | None = Field(default=None, alias="ShouldUseSnmpV2")
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateSystemWorkflowProgressEntry(ConnectWiseModel):
+    system_workflow_progress_id: int | None = Field(default=None, alias="SystemWorkflowProgressId")
+    description: str | None = Field(default=None, alias="Description")
+    workflow_step: AutomateWorkflowStep | None = Field(default=None, alias="WorkflowStep")
+    workflow_status: AutomateWorkflowStatus | None = Field(default=None, alias="WorkflowStatus")
+    workflow_metadata: list[AutomateWorkflowMetadata] | None = Field(default=None, alias="WorkflowMetadata")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_workflow_metadata import AutomateWorkflowMetadata
+from pyconnectwise.models.automate.automate_workflow_status import AutomateWorkflowStatus
+from pyconnectwise.models.automate.automate_workflow_step import AutomateWorkflowStep
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.automate.automate_running_script_target_type import AutomateRunningScriptTargetType
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateTargetType(AutomateRunningScriptTargetType):
+    pass
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateTcpSettings(ConnectWiseModel):
+    server_address: str | None = Field(default=None, alias="ServerAddress")
+    port: int | None = Field(default=None, alias="Port")
+    data_to_send: str | None = Field(default=None, alias="DataToSend")
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateTemplateSettings(ConnectWiseModel):
+    remote_agent_template: AutomateRemoteAgentTemplate | None = Field(default=None, alias="RemoteAgentTemplate")
+    priority: int | None = Field(default=None, alias="Priority")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_remote_agent_template import AutomateRemoteAgentTemplate
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateThirdPartyPatchVersion(ConnectWiseModel):
+    lt_product_key: UUID | None = Field(
+        default=None,
+        alias="LTProductKey",
+        examples=["00000000-0000-0000-0000-000000000000"],
+    )
+    versions: list[str] | None = Field(default=None, alias="Versions")
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateTicketEntrySettings(ConnectWiseModel):
+    ticket_subject: str | None = Field(default=None, alias="TicketSubject")
+    ticket_requestor: str | None = Field(default=None, alias="TicketRequestor")
+    ticket_category: AutomateTicketEntryCategory | None = Field(default=None, alias="TicketCategory")
+    close_ticket_trigger: AutomateCloseTicketTrigger | None = Field(default=None, alias="CloseTicketTrigger")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_close_ticket_trigger import AutomateCloseTicketTrigger
+from pyconnectwise.models.automate.automate_ticket_entry_category import AutomateTicketEntryCategory
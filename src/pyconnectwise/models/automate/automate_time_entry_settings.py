@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateTimeEntrySettings(ConnectWiseModel):
+    ticket_id: str | None = Field(default=None, alias="TicketId")
+    minutes_to_log: str | None = Field(default=None, alias="MinutesToLog")
+    time_category: AutomateTimeEntryCategory | None = Field(default=None, alias="TimeCategory")
+    stop_timer_trigger: AutomateStopTimerTrigger | None = Field(default=None, alias="StopTimerTrigger")
+    notes: str | None = Field(default=None, alias="Notes")
+    technician: AutomateTimeEntryTechnician | None = Field(default=None, alias="Technician")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_stop_timer_trigger import AutomateStopTimerTrigger
+from pyconnectwise.models.automate.automate_time_entry_category import AutomateTimeEntryCategory
+from pyconnectwise.models.automate.automate_time_entry_technician import AutomateTimeEntryTechnician
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateTokenResult(ConnectWiseModel):
+    access_token: str | None = Field(default=None, alias="AccessToken")
+    token_type: str | None = Field(default=None, alias="TokenType")
+    expiration_date: datetime | None = Field(default=None, alias="ExpirationDate")
+    absolute_expiration_date: datetime | None = Field(default=None, alias="AbsoluteExpirationDate")
+    user_id: str | None = Field(default=None, alias="UserId")
+    internal_user_name: str | None = Field(default=None, alias="InternalUserName")
+    is_two_factor_required: bool | None = Field(default=None, alias="IsTwoFactorRequired")
+    is_internal_two_factor_required: bool | None = Field(default=None, alias="IsInternalTwoFactorRequired")
+    sso_access_token: str | None = Field(default=None, alias="SSOAccessToken")
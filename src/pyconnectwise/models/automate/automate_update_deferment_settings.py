@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUpdateDefermentSettings(ConnectWiseModel):
+    use_deferment: bool | None = Field(default=None, alias="UseDeferment")
+    deferment_period_days: int | None = Field(default=None, alias="DefermentPeriodDays")
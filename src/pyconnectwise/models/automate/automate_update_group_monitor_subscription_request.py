@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUpdateGroupMonitorSubscriptionRequest(ConnectWiseModel):
+    is_subscribed: bool | None = Field(default=None, alias="IsSubscribed")
+    overrides: AutomateAlertingOverride | None = Field(default=None, alias="Overrides")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_alerting_override import AutomateAlertingOverride
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUserAccess(ConnectWiseModel):
+    user_id: int | None = Field(default=None, alias="UserId")
+    user_permissions: list[str] | None = Field(default=None, alias="UserPermissions")
+    plugin_permissions: list[AutomateUserBinaryExtensionPermission] | None = Field(
+        default=None, alias="PluginPermissions"
+    )
+    web_extension_claims: list[AutomateUserExtensionClaimType] | None = Field(default=None, alias="WebExtensionClaims")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_user_binary_extension_permission import (
+    AutomateUserBinaryExtensionPermission,
+)
+from pyconnectwise.models.automate.automate_user_extension_claim_type import AutomateUserExtensionClaimType
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUserBinaryExtensionPermission(ConnectWiseModel):
+    has_permission: bool | None = Field(default=None, alias="HasPermission")
+    extension_permission_id: int | None = Field(default=None, alias="ExtensionPermissionId")
+    extension_guid: UUID | None = Field(
+        default=None,
+        alias="ExtensionGuid",
+        examples=["00000000-0000-0000-0000-000000000000"],
+    )
+    extension_name: str | None = Field(default=None, alias="ExtensionName")
+    permission_id: int | None = Field(default=None, alias="PermissionId")
+    permission_name: str | None = Field(default=None, alias="PermissionName")
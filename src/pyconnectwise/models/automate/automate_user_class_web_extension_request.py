@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUserClassWebExtensionRequest(ConnectWiseModel):
+    assigned_extensions: list[AutomateAssignedWebExtension] | None = Field(default=None, alias="AssignedExtensions")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_assigned_web_extension import AutomateAssignedWebExtension
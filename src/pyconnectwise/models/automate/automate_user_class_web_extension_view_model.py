@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUserClassWebExtensionViewModel(ConnectWiseModel):
+    web_extension_id: int | None = Field(default=None, alias="WebExtensionId")
+    web_extension_name: str | None = Field(default=None, alias="WebExtensionName")
+    extension_claims: list[AutomateExtensionClaimViewModel] | None = Field(default=None, alias="ExtensionClaims")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_extension_claim_view_model import AutomateExtensionClaimViewModel
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUserLockoutInfo(ConnectWiseModel):
+    user_name: str | None = Field(default=None, alias="UserName")
+    user_id: int | None = Field(default=None, alias="UserId")
+    last_ip_address: str | None = Field(default=None, alias="LastIPAddress")
+    is_locked: bool | None = Field(default=None, alias="IsLocked")
+    failed_login_count: int | None = Field(default=None, alias="FailedLoginCount")
+    last_fail_date_utc: datetime | None = Field(default=None, alias="LastFailDateUtc")
+    lock_out_expiration_date_utc: datetime | None = Field(default=None, alias="LockOutExpirationDateUtc")
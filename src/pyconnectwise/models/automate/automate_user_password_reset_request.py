@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUserPasswordResetRequest(ConnectWiseModel):
+    username: str | None = Field(default=None, alias="Username")
+    password_reset_token: str | None = Field(default=None, alias="PasswordResetToken")
+    new_password: str | None = Field(default=None, alias="NewPassword")
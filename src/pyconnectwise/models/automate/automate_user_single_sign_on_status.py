@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.automate.lab_tech_user_single_sign_on_status import LabTechUserSingleSignOnStatus
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUserSingleSignOnStatus(LabTechUserSingleSignOnStatus):
+    pass
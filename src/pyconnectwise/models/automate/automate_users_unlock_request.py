@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.automate.automate_generate_password_reset_token_batch_request import (
+    AutomateGeneratePasswordResetTokenBatchRequest,
+)
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateUsersUnlockRequest(AutomateGeneratePasswordResetTokenBatchRequest):
+    pass
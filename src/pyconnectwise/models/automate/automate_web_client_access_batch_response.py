@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebClientAccessBatchResponse(ConnectWiseModel):
+    web_client_access_results: list[AutomateWebClientAccessBatchResult] | None = Field(
+        default=None, alias="WebClientAccessResults"
+    )
+    contains_unsuccessful_results: bool | None = Field(default=None, alias="ContainsUnsuccessfulResults")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_web_client_access_batch_result import AutomateWebClientAccessBatchResult
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.automate.automate_contact_permission_batch_result import AutomateContactPermissionBatchResult
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebClientAccessBatchResult(AutomateContactPermissionBatchResult):
+    pass
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_response_result import AutomateResponseResult
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebExtensionAreaControls(ConnectWiseModel):
+    web_extension_area: AutomateWebExtensionArea | None = Field(default=None, alias="WebExtensionArea")
+    click_buttons: list[AutomateWebExtensionClickButton] | None = Field(default=None, alias="ClickButtons")
+    menu_buttons: list[AutomateWebExtensionMenuButton] | None = Field(default=None, alias="MenuButtons")
+    tiles: list[AutomateWebExtensionTile] | None = Field(default=None, alias="Tiles")
+    redirects: list[AutomateWebExtensionRedirect] | None = Field(default=None, alias="Redirects")
+    inline_frames: list[AutomateWebExtensionInlineFrame] | None = Field(default=None, alias="InlineFrames")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_web_extension_area import AutomateWebExtensionArea
+from pyconnectwise.models.automate.automate_web_extension_click_button import AutomateWebExtensionClickButton
+from pyconnectwise.models.automate.automate_web_extension_inline_frame import AutomateWebExtensionInlineFrame
+from pyconnectwise.models.automate.automate_web_extension_menu_button import AutomateWebExtensionMenuButton
+from pyconnectwise.models.automate.automate_web_extension_redirect import AutomateWebExtensionRedirect
+from pyconnectwise.models.automate.automate_web_extension_tile import AutomateWebExtensionTile
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebExtensionClickAction(ConnectWiseModel):
+    click_action_id: int | None = Field(default=None, alias="ClickActionId")
+    url: str | None = Field(default=None, alias="Url")
+    url_open_type: AutomateWebExtensionUrlOpenType | None = Field(default=None, alias="UrlOpenType")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_web_extension_url_open_type import AutomateWebExtensionUrlOpenType
@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebExtensionMenuButton(ConnectWiseModel):
+    icon_url: str | None = Field(default=None, alias="IconUrl")
+    button_text: str | None = Field(default=None, alias="ButtonText")
+    menu_items: list[AutomateWebExtensionMenuItem] | None = Field(default=None, alias="MenuItems")
+    allows_multi_select: bool | None = Field(default=None, alias="AllowsMultiSelect")
+    web_extension_control_id: int | None = Field(default=None, alias="WebExtensionControlId")
+    web_extension_control_name: str | None = Field(default=None, alias="WebExtensionControlName")
+    web_extension_guid: UUID | None = Field(
+        default=None,
+        alias="WebExtensionGuid",
+        examples=["00000000-0000-0000-0000-000000000000"],
+    )
+    extension_claim_type: AutomateExtensionClaimType | None = Field(default=None, alias="ExtensionClaimType")
+    is_core_extension: bool | None = Field(default=None, alias="IsCoreExtension")
+    web_extension_area_control_type_ids: list[int] | None = Field(default=None, alias="WebExtensionAreaControlTypeIds")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_extension_claim_type import AutomateExtensionClaimType
+from pyconnectwise.models.automate.automate_web_extension_menu_item import AutomateWebExtensionMenuItem
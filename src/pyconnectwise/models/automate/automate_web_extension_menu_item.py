@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebExtensionMenuItem(ConnectWiseModel):
+    web_extension_menu_item_id: int | None = Field(default=None, alias="WebExtensionMenuItemId")
+    web_extension_menu_item_parent_id: int | None = Field(default=None, alias="WebExtensionMenuItemParentId")
+    menu_text: str | None = Field(default=None, alias="MenuText")
+    click_action: AutomateWebExtensionClickAction | None = Field(default=None, alias="ClickAction")
+    menu_items: list[AutomateWebExtensionMenuItem] | None = Field(default=None, alias="MenuItems")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_web_extension_click_action import AutomateWebExtensionClickAction
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWebExtensionPermission(ConnectWiseModel):
+    web_extension_permission_id: int | None = Field(default=None, alias="WebExtensionPermissionId")
+    web_extension_id: int | None = Field(default=None, alias="WebExtensionId")
+    permission_key: str | None = Field(default=None, alias="PermissionKey")
+    permission_name: str | None = Field(default=None, alias="PermissionName")
+    description: str | None = Field(default=None, alias="Description")
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWeeklyScheduleFrequency(ConnectWiseModel):
+    runs_at: str | None = Field(default=None, alias="RunsAt")
+    weeks_of_month_settings: AutomateWeeksOfMonthSettings | None = Field(default=None, alias="WeeksOfMonthSettings")
+    days_of_week_settings: AutomateDaysOfWeekSettings | None = Field(default=None, alias="DaysOfWeekSettings")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_days_of_week_settings import AutomateDaysOfWeekSettings
+from pyconnectwise.models.automate.automate_weeks_of_month_settings import AutomateWeeksOfMonthSettings
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWindowsApprovalPolicyPatchBatchRequest(ConnectWiseModel):
+    patch_policies: list[AutomateWindowsApprovalPolicyPatch] | None = Field(default=None, alias="PatchPolicies")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_windows_approval_policy_patch import AutomateWindowsApprovalPolicyPatch
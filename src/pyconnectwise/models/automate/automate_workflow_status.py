@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutomateWorkflowStatus(ConnectWiseModel):
+    workflow_status_id: int | None = Field(default=None, alias="WorkflowStatusId")
+    description: str | None = Field(default=None, alias="Description")
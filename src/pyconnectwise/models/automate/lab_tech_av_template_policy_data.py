@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechAVTemplatePolicyData(ConnectWiseModel):
+    template_policy_id: str | None = Field(default=None, alias="TemplatePolicyId")
+    plugin_guid: str | None = Field(default=None, alias="PluginGUID")
+    data: str | None = Field(default=None, alias="Data")
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechClient(ConnectWiseModel):
+    id: str | None = Field(default=None, alias="Id")
+    name: str | None = Field(default=None, alias="Name")
+    company: str | None = Field(default=None, alias="Company")
+    first_name: str | None = Field(default=None, alias="FirstName")
+    last_name: str | None = Field(default=None, alias="LastName")
+    address1: str | None = Field(default=None, alias="Address1")
+    address2: str | None = Field(default=None, alias="Address2")
+    city: str | None = Field(default=None, alias="City")
+    state: str | None = Field(default=None, alias="State")
+    zip_code: str | None = Field(default=None, alias="ZipCode")
+    phone_number: str | None = Field(default=None, alias="PhoneNumber")
+    fax_number: str | None = Field(default=None, alias="FaxNumber")
+    comment: str | None = Field(default=None, alias="Comment")
+    country: str | None = Field(default=None, alias="Country")
+    external_id: str | None = Field(default=None, alias="ExternalId")
+    uses_in_house_support_staff: bool | None = Field(default=None, alias="UsesInHouseSupportStaff")
+    new_ticket_notification_email: str | None = Field(default=None, alias="NewTicketNotificationEmail")
+    is_hidden_from_all_inclusive_group: bool | None = Field(default=None, alias="IsHiddenFromAllInclusiveGroup")
+    locations: list[LabTechLocation] | None = Field(default=None, alias="Locations")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_location import LabTechLocation
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechCommandExecute(ConnectWiseModel):
+    id: int | None = Field(default=None, alias="Id")
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    command: LabTechCommand | None = Field(default=None, alias="Command")
+    status: str | None = Field(default=None, alias="Status")
+    parameters: list[str] | None = Field(default=None, alias="Parameters")
+    output: str | None = Field(default=None, alias="Output")
+    fastalk: bool | None = Field(default=None, alias="Fastalk")
+    date_last_inventoried: datetime | None = Field(default=None, alias="DateLastInventoried")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_command import LabTechCommand
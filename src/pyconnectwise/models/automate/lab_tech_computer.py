@@ -0,0 +1,101 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputer(ConnectWiseModel):
+    id: str | None = Field(default=None, alias="Id")
+    location: LabTechLocation | None = Field(default=None, alias="Location")
+    client: LabTechClient | None = Field(default=None, alias="Client")
+    contact: LabTechContact | None = Field(default=None, alias="Contact")
+    is_fas_talk: bool | None = Field(default=None, alias="IsFasTalk")
+    is_master: bool | None = Field(default=None, alias="IsMaster")
+    is_network_probe: bool | None = Field(default=None, alias="IsNetworkProbe")
+    is_heartbeat_enabled: bool | None = Field(default=None, alias="IsHeartbeatEnabled")
+    is_maintenance_mode_enabled: bool | None = Field(default=None, alias="IsMaintenanceModeEnabled")
+    is_tunnel_supported: bool | None = Field(default=None, alias="IsTunnelSupported")
+    is_virtual_machine: bool | None = Field(default=None, alias="IsVirtualMachine")
+    computer_name: str | None = Field(default=None, alias="ComputerName")
+    operating_system_name: str | None = Field(default=None, alias="OperatingSystemName")
+    operating_system_version: str | None = Field(default=None, alias="OperatingSystemVersion")
+    domain_name: str | None = Field(default=None, alias="DomainName")
+    remote_agent_last_inventory: datetime | None = Field(default=None, alias="RemoteAgentLastInventory")
+    utc_offset: int | None = Field(default=None, alias="UTCOffset")
+    open_ports_tcp: list[int] | None = Field(default=None, alias="OpenPortsTCP")
+    open_ports_udp: list[int] | None = Field(default=None, alias="OpenPortsUDP")
+    comment: str | None = Field(default=None, alias="Comment")
+    remote_agent_version: str | None = Field(default=None, alias="RemoteAgentVersion")
+    remote_agent_last_contact: datetime | None = Field(default=None, alias="RemoteAgentLastContact")
+    domain_name_servers: list[str] | None = Field(default=None, alias="DomainNameServers")
+    last_inventory_received: datetime | None = Field(default=None, alias="LastInventoryReceived")
+    windows_update_date: datetime | None = Field(default=None, alias="WindowsUpdateDate")
+    antivirus_definition_date: datetime | None = Field(default=None, alias="AntivirusDefinitionDate")
+    last_heartbeat: datetime | None = Field(default=None, alias="LastHeartbeat")
+    total_memory: int | None = Field(default=None, alias="TotalMemory")
+    free_memory: int | None = Field(default=None, alias="FreeMemory")
+    cpu_usage: int | None = Field(default=None, alias="CpuUsage")
+    local_ip_address: str | None = Field(default=None, alias="LocalIPAddress")
+    gateway_ip_address: str | None = Field(default=None, alias="GatewayIPAddress")
+    system_uptime: int | None = Field(default=None, alias="SystemUptime")
+    last_startup: datetime | None = Field(default=None, alias="LastStartup")
+    mac_address: str | None = Field(default=None, alias="MACAddress")
+    date_added: datetime | None = Field(default=None, alias="DateAdded")
+    user_idle_time: int | None = Field(default=None, alias="UserIdleTime")
+    logged_in_users: list[LabTechLoggedInUser] | None = Field(default=None, alias="LoggedInUsers")
+    last_user_name: str | None = Field(default=None, alias="LastUserName")
+    tickets: list[LabTechTicket] | None = Field(default=None, alias="Tickets")
+    groups: list[LabTechGroup] | None = Field(default=None, alias="Groups")
+    bandwidth: int | None = Field(default=None, alias="Bandwidth")
+    bandwidth_display: str | None = Field(default=None, alias="BandwidthDisplay")
+    asset_date: datetime | None = Field(default=None, alias="AssetDate")
+    asset_tag: str | None = Field(default=None, alias="AssetTag")
+    warranty_end_date: datetime | None = Field(default=None, alias="WarrantyEndDate")
+    type: str | None = Field(default=None, alias="Type")
+    status: str | None = Field(default=None, alias="Status")
+    master_mode: str | None = Field(default=None, alias="MasterMode")
+    virus_scanner: LabTechVirusScannerDef | None = Field(default=None, alias="VirusScanner")
+    friendly_name: str | None = Field(default=None, alias="FriendlyName")
+    is_locked_down: bool | None = Field(default=None, alias="IsLockedDown")
+    is_system_account: bool | None = Field(default=None, alias="IsSystemAccount")
+    is_reboot_needed: bool | None = Field(default=None, alias="IsRebootNeeded")
+    is_virtual_host: bool | None = Field(default=None, alias="IsVirtualHost")
+    is_heartbeat_running: bool | None = Field(default=None, alias="IsHeartbeatRunning")
+    has_intel_vpro: bool | None = Field(default=None, alias="HasIntelVPRO")
+    has_intel_amt: bool | None = Field(default=None, alias="HasIntelAMT")
+    has_h_pi_lo: bool | None = Field(default=None, alias="HasHPiLO")
+    temp_files: str | None = Field(default=None, alias="TempFiles")
+    serial_number: str | None = Field(default=None, alias="SerialNumber")
+    cpu_score: float | None = Field(default=None, alias="CpuScore")
+    d3_d_score: float | None = Field(default=None, alias="D3DScore")
+    disk_score: float | None = Field(default=None, alias="DiskScore")
+    graphics_score: float | None = Field(default=None, alias="GraphicsScore")
+    memory_score: float | None = Field(default=None, alias="MemoryScore")
+    power_profiles: list[str] | None = Field(default=None, alias="PowerProfiles")
+    current_power_profile: str | None = Field(default=None, alias="CurrentPowerProfile")
+    bios_manufacturer: str | None = Field(default=None, alias="BiosManufacturer")
+    bios_flash: str | None = Field(default=None, alias="BiosFlash")
+    primary_contact_name: str | None = Field(default=None, alias="PrimaryContactName")
+    comment_priority: LabTechCommentPriority | None = Field(default=None, alias="CommentPriority")
+    irq: list[int] | None = Field(default=None, alias="IRQ")
+    address: list[int] | None = Field(default=None, alias="Address")
+    dma: list[int] | None = Field(default=None, alias="DMA")
+    hardware_ports: list[str] | None = Field(default=None, alias="HardwarePorts")
+    user_accounts: list[str] | None = Field(default=None, alias="UserAccounts")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_client import LabTechClient
+from pyconnectwise.models.automate.lab_tech_comment_priority import LabTechCommentPriority
+from pyconnectwise.models.automate.lab_tech_contact import LabTechContact
+from pyconnectwise.models.automate.lab_tech_group import LabTechGroup
+from pyconnectwise.models.automate.lab_tech_location import LabTechLocation
+from pyconnectwise.models.automate.lab_tech_logged_in_user import LabTechLoggedInUser
+from pyconnectwise.models.automate.lab_tech_ticket import LabTechTicket
+from pyconnectwise.models.automate.lab_tech_virus_scanner_def import LabTechVirusScannerDef
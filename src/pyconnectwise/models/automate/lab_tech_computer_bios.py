@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerBios(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    vendor: str | None = Field(default=None, alias="Vendor")
+    version: str | None = Field(default=None, alias="Version")
+    date: datetime | None = Field(default=None, alias="Date")
+    size: int | None = Field(default=None, alias="Size")
+    system_bios_version: float | None = Field(default=None, alias="SystemBiosVersion")
+    embctl_version: float | None = Field(default=None, alias="EMBCTLVersion")
+    sm_bios_version: float | None = Field(default=None, alias="SmBiosVersion")
+    dmi_version: int | None = Field(default=None, alias="DmiVersion")
+    supports_acpi: bool | None = Field(default=None, alias="SupportsAcpi")
+    supports_apm: bool | None = Field(default=None, alias="SupportsApm")
+    supports_agp: bool | None = Field(default=None, alias="SupportsAgp")
+    supports_pcmcia: bool | None = Field(default=None, alias="SupportsPcmcia")
+    has_smart_battery: bool | None = Field(default=None, alias="HasSmartBattery")
+    supports_uefi: bool | None = Field(default=None, alias="SupportsUefi")
+    supports_legacy_usb: bool | None = Field(default=None, alias="SupportsLegacyUsb")
+    supports_pci: bool | None = Field(default=None, alias="SupportsPci")
+    supports_vlvesa: bool | None = Field(default=None, alias="SupportsVlvesa")
+    supports_escd: bool | None = Field(default=None, alias="SupportsEscd")
+    supports_net_boot: bool | None = Field(default=None, alias="SupportsNetBoot")
+    supports_i2_o_boot: bool | None = Field(default=None, alias="SupportsI2OBoot")
+    is_virtual_machine: bool | None = Field(default=None, alias="IsVirtualMachine")
+    power_on_reason: str | None = Field(default=None, alias="PowerOnReason")
+    bios_char: int | None = Field(default=None, alias="BiosChar")
+    is_portable: bool | None = Field(default=None, alias="IsPortable")
+    vm_host: str | None = Field(default=None, alias="VmHost")
+    vm_type: str | None = Field(default=None, alias="VmType")
+    vm_name: str | None = Field(default=None, alias="VmName")
+    date_updated: datetime | None = Field(default=None, alias="DateUpdated")
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerDrive(ConnectWiseModel):
+    drive_id: int | None = Field(default=None, alias="DriveId")
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    letter: str | None = Field(default=None, alias="Letter")
+    size: int | None = Field(default=None, alias="Size")
+    free_space: int | None = Field(default=None, alias="FreeSpace")
+    file_system: str | None = Field(default=None, alias="FileSystem")
+    model: str | None = Field(default=None, alias="Model")
+    smart_status: str | None = Field(default=None, alias="SmartStatus")
+    is_missing: bool | None = Field(default=None, alias="IsMissing")
+    date_last_inventoried: datetime | None = Field(default=None, alias="DateLastInventoried")
+    volume_name: str | None = Field(default=None, alias="VolumeName")
+    backup_flag: int | None = Field(default=None, alias="BackupFlag")
+    is_solid_state: bool | None = Field(default=None, alias="IsSolidState")
+    is_internal: bool | None = Field(default=None, alias="IsInternal")
+    maximum_history_days_available: int | None = Field(default=None, alias="MaximumHistoryDaysAvailable")
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerMenu(ConnectWiseModel):
+    menu_id: str | None = Field(default=None, alias="MenuID")
+    name: str | None = Field(default=None, alias="Name")
+    description: str | None = Field(default=None, alias="Description")
+    text: str | None = Field(default=None, alias="Text")
+    image_url: str | None = Field(default=None, alias="ImageURL")
+    root_only: int | None = Field(default=None, alias="RootOnly")
+    action: str | None = Field(default=None, alias="Action")
+    msg_title: str | None = Field(default=None, alias="MsgTitle")
+    msg_body: str | None = Field(default=None, alias="MsgBody")
+    msg_height: int | None = Field(default=None, alias="MsgHeight")
+    msg_width: int | None = Field(default=None, alias="MsgWidth")
+    ur_lor_exe: str | None = Field(default=None, alias="URLorEXE")
+    script_id: int | None = Field(default=None, alias="ScriptID")
+    parameters: str | None = Field(default=None, alias="Parameters")
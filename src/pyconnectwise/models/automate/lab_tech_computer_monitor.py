@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerMonitor(ConnectWiseModel):
+    monitor_id: int | None = Field(default=None, alias="MonitorId")
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    device_id: int | None = Field(default=None, alias="DeviceId")
+    name: str | None = Field(default=None, alias="Name")
+    state: str | None = Field(default=None, alias="State")
+    last_scanned: datetime | None = Field(default=None, alias="LastScanned")
+    last_failed: datetime | None = Field(default=None, alias="LastFailed")
+    last_inventory_date: datetime | None = Field(default=None, alias="LastInventoryDate")
+    alert_action: LabTechAlertAction | None = Field(default=None, alias="AlertAction")
+    monitor_history: LabTechComputerMonitorHistory | None = Field(default=None, alias="MonitorHistory")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_alert_action import LabTechAlertAction
+from pyconnectwise.models.automate.lab_tech_computer_monitor_history import LabTechComputerMonitorHistory
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerPatchingPolicy(ConnectWiseModel):
+    approval_policy_count: int | None = Field(default=None, alias="ApprovalPolicyCount")
+    group_id: int | None = Field(default=None, alias="GroupId")
+    microsoft_update_policy_name: str | None = Field(default=None, alias="MicrosoftUpdatePolicyName")
+    name: str | None = Field(default=None, alias="Name")
+    override_id: int | None = Field(default=None, alias="OverrideId")
+    priority: int | None = Field(default=None, alias="Priority")
+    reboot_policy_name: str | None = Field(default=None, alias="RebootPolicyName")
+    third_party_update_policy_name: str | None = Field(default=None, alias="ThirdPartyUpdatePolicyName")
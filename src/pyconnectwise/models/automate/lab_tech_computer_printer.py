@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerPrinter(ConnectWiseModel):
+    id: int | None = Field(default=None, alias="Id")
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    name: str | None = Field(default=None, alias="Name")
+    port_name: str | None = Field(default=None, alias="PortName")
+    resolution: str | None = Field(default=None, alias="Resolution")
+    paper_types: list[str] | None = Field(default=None, alias="PaperTypes")
+    features: list[str] | None = Field(default=None, alias="Features")
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerScriptHistory(ConnectWiseModel):
+    id: int | None = Field(default=None, alias="Id")
+    script_id: int | None = Field(default=None, alias="ScriptId")
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    name: str | None = Field(default=None, alias="Name")
+    user: str | None = Field(default=None, alias="User")
+    status: Literal["Running", "Completed"] | None = Field(default=None, alias="Status")
+    state: Literal["Failure", "Information", "Success"] | None = Field(default=None, alias="State")
+    history_date: datetime | None = Field(default=None, alias="HistoryDate")
+    diagnostic_message: str | None = Field(default=None, alias="DiagnosticMessage")
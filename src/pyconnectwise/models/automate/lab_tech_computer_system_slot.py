@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerSystemSlot(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    id: int | None = Field(default=None, alias="Id")
+    slot_handle: int | None = Field(default=None, alias="SlotHandle")
+    slot_name: str | None = Field(default=None, alias="SlotName")
+    slot_type: str | None = Field(default=None, alias="SlotType")
+    bus_width: str | None = Field(default=None, alias="BusWidth")
+    in_use: str | None = Field(default=None, alias="InUse")
+    length: str | None = Field(default=None, alias="Length")
+    supports3_volts: bool | None = Field(default=None, alias="Supports3Volts")
+    supports5_volts: bool | None = Field(default=None, alias="Supports5Volts")
+    is_hot_pluggable: bool | None = Field(default=None, alias="IsHotPluggable")
+    supports_power_management: bool | None = Field(default=None, alias="SupportsPowerManagement")
@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerThirdPartyPatch(ConnectWiseModel):
+    approved_version: str | None = Field(default=None, alias="ApprovedVersion")
+    available_version: str | None = Field(default=None, alias="AvailableVersion")
+    compliance_state: LabTechPatchComplianceState | None = Field(default=None, alias="ComplianceState")
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    display_title: str | None = Field(default=None, alias="DisplayTitle")
+    install_action: LabTechThirdParyInstallAction | None = Field(default=None, alias="InstallAction")
+    install_date: datetime | None = Field(default=None, alias="InstallDate")
+    install_state: str | None = Field(default=None, alias="InstallState")
+    installed_version: str | None = Field(default=None, alias="InstalledVersion")
+    is64_bit: bool | None = Field(default=None, alias="Is64Bit")
+    is_compliant: bool | None = Field(default=None, alias="IsCompliant")
+    is_failed: bool | None = Field(default=None, alias="IsFailed")
+    is_installed: bool | None = Field(default=None, alias="IsInstalled")
+    is_non_compliant: bool | None = Field(default=None, alias="IsNonCompliant")
+    manufacturer: str | None = Field(default=None, alias="Manufacturer")
+    patch_id: str | None = Field(default=None, alias="PatchId")
+    policy_approval: LabTechThirdPartyPolicyApproval | None = Field(default=None, alias="PolicyApproval")
+    software_id: str | None = Field(default=None, alias="SoftwareId")
+    title: str | None = Field(default=None, alias="Title")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_patch_compliance_state import LabTechPatchComplianceState
+from pyconnectwise.models.automate.lab_tech_third_party_policy_approval import LabTechThirdPartyPolicyApproval
+from pyconnectwise.models.automate.lab_tech_third_pary_install_action import LabTechThirdParyInstallAction
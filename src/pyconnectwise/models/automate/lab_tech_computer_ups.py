@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerUps(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    ups_id: int | None = Field(default=None, alias="UpsId")
+    ups_name: str | None = Field(default=None, alias="UpsName")
+    charge_remaining: int | None = Field(default=None, alias="ChargeRemaining")
+    remaining_run_time: int | None = Field(default=None, alias="RemainingRunTime")
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechComputerVideoCard(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    pnp_device_id: str | None = Field(default=None, alias="PnpDeviceId")
+    video_processor: str | None = Field(default=None, alias="VideoProcessor")
+    mode: str | None = Field(default=None, alias="Mode")
+    memory: str | None = Field(default=None, alias="Memory")
+    architecture: LabTechVideoCardArchitecture | None = Field(default=None, alias="Architecture")
+    memory_type: LabTechVideoCardMemory | None = Field(default=None, alias="MemoryType")
+    dac_adapter: str | None = Field(default=None, alias="DACAdapter")
+    bits_per_pixel: int | None = Field(default=None, alias="BitsPerPixel")
+    update_date: datetime | None = Field(default=None, alias="UpdateDate")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_video_card_architecture import LabTechVideoCardArchitecture
+from pyconnectwise.models.automate.lab_tech_video_card_memory import LabTechVideoCardMemory
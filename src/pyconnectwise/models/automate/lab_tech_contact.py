@@ -0,0 +1,39 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechContact(ConnectWiseModel):
+    id: str | None = Field(default=None, alias="Id")
+    location: LabTechLocation | None = Field(default=None, alias="Location")
+    client: LabTechClient | None = Field(default=None, alias="Client")
+    first_name: str | None = Field(default=None, alias="FirstName")
+    last_name: str | None = Field(default=None, alias="LastName")
+    address1: str | None = Field(default=None, alias="Address1")
+    address2: str | None = Field(default=None, alias="Address2")
+    city: str | None = Field(default=None, alias="City")
+    state: str | None = Field(default=None, alias="State")
+    zip_code: str | None = Field(default=None, alias="ZipCode")
+    phone_number: str | None = Field(default=None, alias="PhoneNumber")
+    mobile_number: str | None = Field(default=None, alias="MobileNumber")
+    fax_number: str | None = Field(default=None, alias="FaxNumber")
+    pager_number: str | None = Field(default=None, alias="PagerNumber")
+    email: str | None = Field(default=None, alias="Email")
+    external_id: str | None = Field(default=None, alias="ExternalId")
+    web_permissions: LabTechContactWebPermissions | None = Field(default=None, alias="WebPermissions")
+    created_date: datetime | None = Field(default=None, alias="CreatedDate")
+    associated_computers: list[LabTechComputer] | None = Field(default=None, alias="AssociatedComputers")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_client import LabTechClient
+from pyconnectwise.models.automate.lab_tech_computer import LabTechComputer
+from pyconnectwise.models.automate.lab_tech_contact_web_permissions import LabTechContactWebPermissions
+from pyconnectwise.models.automate.lab_tech_location import LabTechLocation
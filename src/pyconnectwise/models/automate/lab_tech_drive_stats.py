@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechDriveStats(ConnectWiseModel):
+    drive_id: int | None = Field(default=None, alias="DriveId")
+    free_space_percentage: int | None = Field(default=None, alias="FreeSpacePercentage")
+    fragmented_space_percentage: int | None = Field(default=None, alias="FragmentedSpacePercentage")
+    event_date: datetime | None = Field(default=None, alias="EventDate")
+    sample_count: int | None = Field(default=None, alias="SampleCount")
+    week: int | None = Field(default=None, alias="Week")
+    month: int | None = Field(default=None, alias="Month")
+    year: int | None = Field(default=None, alias="Year")
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechEventLogQueryParameters(ConnectWiseModel):
+    log: str | None = Field(default=None, alias="Log")
+    level_filter: LabTechEventLogQueryEventLevelFilter | None = Field(default=None, alias="LevelFilter")
+    keywords: int | None = Field(default=None, alias="Keywords")
+    source: str | None = Field(default=None, alias="Source")
+    event_id: int | None = Field(default=None, alias="EventId")
+    regular_expression_filter: str | None = Field(default=None, alias="RegularExpressionFilter")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_event_log_query_event_level_filter import (
+    LabTechEventLogQueryEventLevelFilter,
+)
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechGetExecutableResultParameters(ConnectWiseModel):
+    fully_qualified_executable_string: str | None = Field(default=None, alias="FullyQualifiedExecutableString")
+    result_transform_regular_expression: str | None = Field(default=None, alias="ResultTransformRegularExpression")
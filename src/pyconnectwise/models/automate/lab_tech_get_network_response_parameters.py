@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechGetNetworkResponseParameters(ConnectWiseModel):
+    target: str | None = Field(default=None, alias="Target")
+    port: str | None = Field(default=None, alias="Port")
+    payload: str | None = Field(default=None, alias="Payload")
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechHardwareSensorQueryParameters(ConnectWiseModel):
+    sensor: LabTechHardwareSensorQuerySensor | None = Field(default=None, alias="Sensor")
+    sensor_number: str | None = Field(default=None, alias="SensorNumber")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_hardware_sensor_query_sensor import LabTechHardwareSensorQuerySensor
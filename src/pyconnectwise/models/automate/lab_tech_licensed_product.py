@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechLicensedProduct(ConnectWiseModel):
+    cd_key: str | None = Field(default=None, alias="CdKey")
+    current_license_usage: int | None = Field(default=None, alias="CurrentLicenseUsage")
+    data: str | None = Field(default=None, alias="Data")
+    is_license_active: bool | None = Field(default=None, alias="IsLicenseActive")
+    license_file: str | None = Field(default=None, alias="LicenseFile")
+    max_license_usage: int | None = Field(default=None, alias="MaxLicenseUsage")
+    product_id: int | None = Field(default=None, alias="ProductId")
+    product_sku: str | None = Field(default=None, alias="ProductSku")
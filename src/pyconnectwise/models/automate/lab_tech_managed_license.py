@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechManagedLicense(ConnectWiseModel):
+    id: int | None = Field(default=None, alias="Id")
+    client_id: int | None = Field(default=None, alias="ClientId")
+    name: str | None = Field(default=None, alias="Name")
+    search_string: str | None = Field(default=None, alias="SearchString")
+    license_count: int | None = Field(default=None, alias="LicenseCount")
+    installed_count: int | None = Field(default=None, alias="InstalledCount")
+    product_key: LabTechProductKey | None = Field(default=None, alias="ProductKey")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_product_key import LabTechProductKey
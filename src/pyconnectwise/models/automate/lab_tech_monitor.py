@@ -0,0 +1,64 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitor(ConnectWiseModel):
+    alert_action: LabTechAlertAction | None = Field(default=None, alias="AlertAction")
+    alert_style: LabTechMonitorAlertStyle | None = Field(default=None, alias="AlertStyle")
+    comparer_settings: LabTechMonitorComparerSettings | None = Field(default=None, alias="ComparerSettings")
+    control_guid: str | None = Field(default=None, alias="ControlGuid")
+    failure_count: int | None = Field(default=None, alias="FailureCount")
+    id_field: str | None = Field(default=None, alias="IdField")
+    interval: int | None = Field(default=None, alias="Interval")
+    installed: bool | None = Field(default=None, alias="Installed")
+    is_internal_monitor: bool | None = Field(default=None, alias="IsInternalMonitor")
+    is_network_device_monitor: bool | None = Field(default=None, alias="IsNetworkDeviceMonitor")
+    last_checked: datetime | None = Field(default=None, alias="LastChecked")
+    last_failed: datetime | None = Field(default=None, alias="LastFailed")
+    last_status: str | None = Field(default=None, alias="LastStatus")
+    guid: str | None = Field(default=None, alias="Guid")
+    monitor_alert_target: LabTechMonitorAlertTarget | None = Field(default=None, alias="MonitorAlertTarget")
+    monitor_id: int | None = Field(default=None, alias="MonitorId")
+    monitor_owner: LabTechMonitorOwner | None = Field(default=None, alias="MonitorOwner")
+    monitor_state: LabTechMonitorState | None = Field(default=None, alias="MonitorState")
+    local_state: LabTechMonitorState | None = Field(default=None, alias="LocalState")
+    name: str | None = Field(default=None, alias="Name")
+    pending_update: bool | None = Field(default=None, alias="PendingUpdate")
+    report_category: LabTechReportCategory | None = Field(default=None, alias="ReportCategory")
+    ticket_category: LabTechTicketCategory | None = Field(default=None, alias="TicketCategory")
+    warning_count: int | None = Field(default=None, alias="WarningCount")
+    script: LabTechScript | None = Field(default=None, alias="Script")
+    version: int | None = Field(default=None, alias="Version")
+    routine_parameters: LabTechMonitorRoutineParameters | None = Field(default=None, alias="RoutineParameters")
+    routine: LabTechMonitorRoutine | None = Field(default=None, alias="Routine")
+    alert_messages: LabTechMonitorAlertMessages | None = Field(default=None, alias="AlertMessages")
+    targets: LabTechMonitorTarget | None = Field(default=None, alias="Targets")
+    is_global_monitor: bool | None = Field(default=None, alias="IsGlobalMonitor")
+    is_overridden: bool | None = Field(default=None, alias="IsOverridden")
+    is_collecting_data: bool | None = Field(default=None, alias="IsCollectingData")
+    affected_entities: LabTechMonitorAffectedEntities | None = Field(default=None, alias="AffectedEntities")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_alert_action import LabTechAlertAction
+from pyconnectwise.models.automate.lab_tech_monitor_affected_entities import LabTechMonitorAffectedEntities
+from pyconnectwise.models.automate.lab_tech_monitor_alert_messages import LabTechMonitorAlertMessages
+from pyconnectwise.models.automate.lab_tech_monitor_alert_style import LabTechMonitorAlertStyle
+from pyconnectwise.models.automate.lab_tech_monitor_alert_target import LabTechMonitorAlertTarget
+from pyconnectwise.models.automate.lab_tech_monitor_comparer_settings import LabTechMonitorComparerSettings
+from pyconnectwise.models.automate.lab_tech_monitor_owner import LabTechMonitorOwner
+from pyconnectwise.models.automate.lab_tech_monitor_routine import LabTechMonitorRoutine
+from pyconnectwise.models.automate.lab_tech_monitor_routine_parameters import LabTechMonitorRoutineParameters
+from pyconnectwise.models.automate.lab_tech_monitor_state import LabTechMonitorState
+from pyconnectwise.models.automate.lab_tech_monitor_target import LabTechMonitorTarget
+from pyconnectwise.models.automate.lab_tech_report_category import LabTechReportCategory
+from pyconnectwise.models.automate.lab_tech_script import LabTechScript
+from pyconnectwise.models.automate.lab_tech_ticket_category import LabTechTicketCategory
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorAffectedEntities(ConnectWiseModel):
+    remote_monitor_affected_location: LabTechLocation | None = Field(
+        default=None, alias="RemoteMonitorAffectedLocation"
+    )
+    remote_monitor_affected_client: LabTechClient | None = Field(default=None, alias="RemoteMonitorAffectedClient")
+    internal_monitor_affected_locations: list[LabTechLocation] | None = Field(
+        default=None, alias="InternalMonitorAffectedLocations"
+    )
+    internal_monitor_affected_clients: list[LabTechClient] | None = Field(
+        default=None, alias="InternalMonitorAffectedClients"
+    )
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_client import LabTechClient
+from pyconnectwise.models.automate.lab_tech_location import LabTechLocation
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorAlertMessages(ConnectWiseModel):
+    success_subject: str | None = Field(default=None, alias="SuccessSubject")
+    success_message: str | None = Field(default=None, alias="SuccessMessage")
+    failure_subject: str | None = Field(default=None, alias="FailureSubject")
+    failure_message: str | None = Field(default=None, alias="FailureMessage")
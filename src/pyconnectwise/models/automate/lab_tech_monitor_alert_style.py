@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorAlertStyle(ConnectWiseModel):
+    internal_monitor_alert_style: LabTechInternalMonitorAlertStyle | None = Field(
+        default=None, alias="InternalMonitorAlertStyle"
+    )
+    remote_monitor_alert_style: LabTechRemoteMonitorAlertStyle | None = Field(
+        default=None, alias="RemoteMonitorAlertStyle"
+    )
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_internal_monitor_alert_style import LabTechInternalMonitorAlertStyle
+from pyconnectwise.models.automate.lab_tech_remote_monitor_alert_style import LabTechRemoteMonitorAlertStyle
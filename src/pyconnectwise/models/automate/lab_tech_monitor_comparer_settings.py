@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorComparerSettings(ConnectWiseModel):
+    comparer: LabTechMonitorComparer | None = Field(default=None, alias="Comparer")
+    format: LabTechMonitorComparerSettingsFormat | None = Field(default=None, alias="Format")
+    value: LabTechMonitorComparerValue | None = Field(default=None, alias="Value")
+    smoothing_coefficient: float | None = Field(default=None, alias="SmoothingCoefficient")
+    is_expression: bool | None = Field(default=None, alias="IsExpression")
+    smoothing_style: LabTechMonitorComparerSettingsSmoothingStyle | None = Field(default=None, alias="SmoothingStyle")
+    language_overrides: dict[str, str] | None = Field(default=None, alias="LanguageOverrides")
+    result_format: LabTechMonitorComparerSettingsResultFormat | None = Field(default=None, alias="ResultFormat")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_monitor_comparer import LabTechMonitorComparer
+from pyconnectwise.models.automate.lab_tech_monitor_comparer_settings_format import LabTechMonitorComparerSettingsFormat
+from pyconnectwise.models.automate.lab_tech_monitor_comparer_settings_result_format import (
+    LabTechMonitorComparerSettingsResultFormat,
+)
+from pyconnectwise.models.automate.lab_tech_monitor_comparer_settings_smoothing_style import (
+    LabTechMonitorComparerSettingsSmoothingStyle,
+)
+from pyconnectwise.models.automate.lab_tech_monitor_comparer_value import LabTechMonitorComparerValue
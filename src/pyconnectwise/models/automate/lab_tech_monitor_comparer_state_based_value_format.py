@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorComparerStateBasedValueFormat(ConnectWiseModel):
+    normal_comparer: LabTechMonitorComparerSettings | None = Field(default=None, alias="NormalComparer")
+    warning_comparer: LabTechMonitorComparerSettings | None = Field(default=None, alias="WarningComparer")
+    error_comparer: LabTechMonitorComparerSettings | None = Field(default=None, alias="ErrorComparer")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_monitor_comparer_settings import LabTechMonitorComparerSettings
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorComparerValue(ConnectWiseModel):
+    format: LabTechMonitorComparerValueFormat | None = Field(default=None, alias="Format")
+    multi_value_format: LabTechMonitorComparerMultiValueFormat | None = Field(default=None, alias="MultiValueFormat")
+    state_based_value_format: LabTechMonitorComparerStateBasedValueFormat | None = Field(
+        default=None, alias="StateBasedValueFormat"
+    )
+    single_value_format: LabTechMonitorComparerSingleValueFormat | None = Field(default=None, alias="SingleValueFormat")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_monitor_comparer_multi_value_format import (
+    LabTechMonitorComparerMultiValueFormat,
+)
+from pyconnectwise.models.automate.lab_tech_monitor_comparer_single_value_format import (
+    LabTechMonitorComparerSingleValueFormat,
+)
+from pyconnectwise.models.automate.lab_tech_monitor_comparer_state_based_value_format import (
+    LabTechMonitorComparerStateBasedValueFormat,
+)
+from pyconnectwise.models.automate.lab_tech_monitor_comparer_value_format import LabTechMonitorComparerValueFormat
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorDataCollectionSettings(ConnectWiseModel):
+    monitor_id: int | None = Field(default=None, alias="MonitorId")
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    unit_label: str | None = Field(default=None, alias="UnitLabel")
+    graph_title: str | None = Field(default=None, alias="GraphTitle")
+    graph_vertical_limit: int | None = Field(default=None, alias="GraphVerticalLimit")
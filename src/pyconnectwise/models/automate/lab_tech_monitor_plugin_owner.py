@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorPluginOwner(ConnectWiseModel):
+    control_guid: str | None = Field(default=None, alias="ControlGUID")
+    plugin_name: str | None = Field(default=None, alias="PluginName")
+    alteration_instructions: str | None = Field(default=None, alias="AlterationInstructions")
@@ -0,0 +1,83 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorRoutineParameters(ConnectWiseModel):
+    format: LabTechMonitorRoutineParametersFormat | None = Field(default=None, alias="Format")
+    unformatted_monitor_parameters: LabTechUnformattedMonitorRoutineParameters | None = Field(
+        default=None, alias="UnformattedMonitorParameters"
+    )
+    internal_database_query_parameters: LabTechInternalDatabaseQueryParameters | None = Field(
+        default=None, alias="InternalDatabaseQueryParameters"
+    )
+    latency_target: str | None = Field(default=None, alias="LatencyTarget")
+    get_network_response_parameters: LabTechGetNetworkResponseParameters | None = Field(
+        default=None, alias="GetNetworkResponseParameters"
+    )
+    snmp_oid_query_parameters: LabTechSnmpOidQueryParameters | None = Field(
+        default=None, alias="SnmpOidQueryParameters"
+    )
+    performance_counter_query_parameters: LabTechPerformanceCounterQueryParameters | None = Field(
+        default=None, alias="PerformanceCounterQueryParameters"
+    )
+    hardware_sensor_query_parameters: LabTechHardwareSensorQueryParameters | None = Field(
+        default=None, alias="HardwareSensorQueryParameters"
+    )
+    network_device_wbem_query_parameters: LabTechNetworkDeviceWbemQueryParameters | None = Field(
+        default=None, alias="NetworkDeviceWbemQueryParameters"
+    )
+    get_plugin_command_result_parameters: LabTechGetPluginCommandResultParameters | None = Field(
+        default=None, alias="GetPluginCommandResultParameters"
+    )
+    file_or_directory_query_parameters: LabTechFileOrDirectoryQueryParameters | None = Field(
+        default=None, alias="FileOrDirectoryQueryParameters"
+    )
+    service_name: str | None = Field(default=None, alias="ServiceName")
+    volume_mountpoint: str | None = Field(default=None, alias="VolumeMountpoint")
+    registry_value_query_parameters: LabTechRegistryValueQueryParameters | None = Field(
+        default=None, alias="RegistryValueQueryParameters"
+    )
+    process_name: str | None = Field(default=None, alias="ProcessName")
+    event_log_listener_parameters: LabTechEventLogQueryParameters | None = Field(
+        default=None, alias="EventLogListenerParameters"
+    )
+    get_executable_result_parameters: LabTechGetExecutableResultParameters | None = Field(
+        default=None, alias="GetExecutableResultParameters"
+    )
+    wmi_query: str | None = Field(default=None, alias="WmiQuery")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_event_log_query_parameters import LabTechEventLogQueryParameters
+from pyconnectwise.models.automate.lab_tech_file_or_directory_query_parameters import (
+    LabTechFileOrDirectoryQueryParameters,
+)
+from pyconnectwise.models.automate.lab_tech_get_executable_result_parameters import LabTechGetExecutableResultParameters
+from pyconnectwise.models.automate.lab_tech_get_network_response_parameters import LabTechGetNetworkResponseParameters
+from pyconnectwise.models.automate.lab_tech_get_plugin_command_result_parameters import (
+    LabTechGetPluginCommandResultParameters,
+)
+from pyconnectwise.models.automate.lab_tech_hardware_sensor_query_parameters import LabTechHardwareSensorQueryParameters
+from pyconnectwise.models.automate.lab_tech_internal_database_query_parameters import (
+    LabTechInternalDatabaseQueryParameters,
+)
+from pyconnectwise.models.automate.lab_tech_monitor_routine_parameters_format import (
+    LabTechMonitorRoutineParametersFormat,
+)
+from pyconnectwise.models.automate.lab_tech_network_device_wbem_query_parameters import (
+    LabTechNetworkDeviceWbemQueryParameters,
+)
+from pyconnectwise.models.automate.lab_tech_performance_counter_query_parameters import (
+    LabTechPerformanceCounterQueryParameters,
+)
+from pyconnectwise.models.automate.lab_tech_registry_value_query_parameters import LabTechRegistryValueQueryParameters
+from pyconnectwise.models.automate.lab_tech_snmp_oid_query_parameters import LabTechSnmpOidQueryParameters
+from pyconnectwise.models.automate.lab_tech_unformatted_monitor_routine_parameters import (
+    LabTechUnformattedMonitorRoutineParameters,
+)
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorStatistic(ConnectWiseModel):
+    monitor_id: int | None = Field(default=None, alias="MonitorId")
+    last_fail_time: datetime | None = Field(default=None, alias="LastFailTime")
+    last_fail_message: str | None = Field(default=None, alias="LastFailMessage")
+    last_success_time: datetime | None = Field(default=None, alias="LastSuccessTime")
+    last_success_message: str | None = Field(default=None, alias="LastSuccessMessage")
+    last_warning_time: datetime | None = Field(default=None, alias="LastWarningTime")
+    last_warning_message: str | None = Field(default=None, alias="LastWarningMessage")
+    monitor_start_time: datetime | None = Field(default=None, alias="MonitorStartTime")
+    computer_id: int | None = Field(default=None, alias="ComputerId")
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechMonitorTarget(ConnectWiseModel):
+    location: LabTechLocation | None = Field(default=None, alias="Location")
+    client: LabTechClient | None = Field(default=None, alias="Client")
+    computer: LabTechComputer | None = Field(default=None, alias="Computer")
+    network_device: LabTechNetworkDevice | None = Field(default=None, alias="NetworkDevice")
+    group_ids: list[int] | None = Field(default=None, alias="GroupIds")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_client import LabTechClient
+from pyconnectwise.models.automate.lab_tech_computer import LabTechComputer
+from pyconnectwise.models.automate.lab_tech_location import LabTechLocation
+from pyconnectwise.models.automate.lab_tech_network_device import LabTechNetworkDevice
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechNetMapPluginStatus(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    is_net_map_plugin_enabled: bool | None = Field(default=None, alias="IsNetMapPluginEnabled")
@@ -0,0 +1,74 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechNetworkDevice(ConnectWiseModel):
+    id: str | None = Field(default=None, alias="Id")
+    location: LabTechLocation | None = Field(default=None, alias="Location")
+    local_ip_address: str | None = Field(default=None, alias="LocalIPAddress")
+    name: str | None = Field(default=None, alias="Name")
+    friendly_name: str | None = Field(default=None, alias="FriendlyName")
+    open_ports_tcp: list[int] | None = Field(default=None, alias="OpenPortsTCP")
+    device_type: LabTechNetworkDeviceType | None = Field(default=None, alias="DeviceType")
+    detection_template_name: str | None = Field(default=None, alias="DetectionTemplateName")
+    last_updated: datetime | None = Field(default=None, alias="LastUpdated")
+    mac_address: str | None = Field(default=None, alias="MACAddress")
+    status: str | None = Field(default=None, alias="Status")
+    contact: LabTechContact | None = Field(default=None, alias="Contact")
+    alert_action: LabTechAlertAction | None = Field(default=None, alias="AlertAction")
+    alert_message: str | None = Field(default=None, alias="AlertMessage")
+    alert_when_offline: bool | None = Field(default=None, alias="AlertWhenOffline")
+    date_added: datetime | None = Field(default=None, alias="DateAdded")
+    snmp_community_get: str | None = Field(default=None, alias="SNMPCommunityGet")
+    snmp_community_set: str | None = Field(default=None, alias="SNMPCommunitySet")
+    is_snm_pv1_supported: bool | None = Field(default=None, alias="IsSNMPv1Supported")
+    is_snm_pv2c_supported: bool | None = Field(default=None, alias="IsSNMPv2cSupported")
+    is_snm_pv3_supported: bool | None = Field(default=None, alias="IsSNMPv3Supported")
+    is_low_on_toner: bool | None = Field(default=None, alias="IsLowOnToner")
+    is_low_on_paper: bool | None = Field(default=None, alias="IsLowOnPaper")
+    is_high_bandwidth: bool | None = Field(default=None, alias="IsHighBandwidth")
+    flags_display: str | None = Field(default=None, alias="FlagsDisplay")
+    manufacturer_name: str | None = Field(default=None, alias="ManufacturerName")
+    model_name: str | None = Field(default=None, alias="ModelName")
+    description: str | None = Field(default=None, alias="Description")
+    uptime: int | None = Field(default=None, alias="Uptime")
+    uptime_display: str | None = Field(default=None, alias="UptimeDisplay")
+    data_out: int | None = Field(default=None, alias="DataOut")
+    data_out_display: str | None = Field(default=None, alias="DataOutDisplay")
+    data_in: int | None = Field(default=None, alias="DataIn")
+    data_in_display: str | None = Field(default=None, alias="DataInDisplay")
+    asset_date: datetime | None = Field(default=None, alias="AssetDate")
+    last_contact: datetime | None = Field(default=None, alias="LastContact")
+    nas_percent: str | None = Field(default=None, alias="NasPercent")
+    groups: list[LabTechGroup] | None = Field(default=None, alias="Groups")
+    client: LabTechClient | None = Field(default=None, alias="Client")
+    is_synced_to_manage: bool | None = Field(default=None, alias="IsSyncedToManage")
+    snmp_tree: list[int] | None = Field(default=None, alias="SnmpTree")
+    external_system_credentials: LabTechExternalSystemCredentials | None = Field(
+        default=None, alias="ExternalSystemCredentials"
+    )
+    interface_count: int | None = Field(default=None, alias="InterfaceCount")
+    probe_id: int | None = Field(default=None, alias="ProbeId")
+    probe_name: str | None = Field(default=None, alias="ProbeName")
+    agent_deployment_readiness_check: LabTechAgentDeploymentReadinessCheck | None = Field(
+        default=None, alias="AgentDeploymentReadinessCheck"
+    )
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_agent_deployment_readiness_check import LabTechAgentDeploymentReadinessCheck
+from pyconnectwise.models.automate.lab_tech_alert_action import LabTechAlertAction
+from pyconnectwise.models.automate.lab_tech_client import LabTechClient
+from pyconnectwise.models.automate.lab_tech_contact import LabTechContact
+from pyconnectwise.models.automate.lab_tech_external_system_credentials import LabTechExternalSystemCredentials
+from pyconnectwise.models.automate.lab_tech_group import LabTechGroup
+from pyconnectwise.models.automate.lab_tech_location import LabTechLocation
+from pyconnectwise.models.automate.lab_tech_network_device_type import LabTechNetworkDeviceType
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechNetworkDeviceWbemQueryParameters(ConnectWiseModel):
+    namespace: str | None = Field(default=None, alias="Namespace")
+    query: str | None = Field(default=None, alias="Query")
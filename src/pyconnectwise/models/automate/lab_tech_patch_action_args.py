@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechPatchActionArgs(ConnectWiseModel):
+    entity_type: int | None = Field(default=None, alias="EntityType")
+    entity_id: int | None = Field(default=None, alias="EntityId")
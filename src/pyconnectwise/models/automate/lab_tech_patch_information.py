@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechPatchInformation(ConnectWiseModel):
+    web_server_patch_version: str | None = Field(default=None, alias="WebServerPatchVersion")
+    db_agent_server_patch_version: str | None = Field(default=None, alias="DBAgentServerPatchVersion")
+    control_center_patch_version: str | None = Field(default=None, alias="ControlCenterPatchVersion")
+    remote_agent_patch_version: str | None = Field(default=None, alias="RemoteAgentPatchVersion")
+    linux_agent_patch_version: str | None = Field(default=None, alias="LinuxAgentPatchVersion")
+    mac_agent_patch_version: str | None = Field(default=None, alias="MacAgentPatchVersion")
+    last_patched_date: datetime | None = Field(default=None, alias="LastPatchedDate")
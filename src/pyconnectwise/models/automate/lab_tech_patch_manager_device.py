@@ -0,0 +1,46 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechPatchManagerDevice(ConnectWiseModel):
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    computer_name: str | None = Field(default=None, alias="ComputerName")
+    stage: LabTechPatchStage | None = Field(default=None, alias="Stage")
+    operating_system_name: str | None = Field(default=None, alias="OperatingSystemName")
+    normalized_operating_system_name: str | None = Field(default=None, alias="NormalizedOperatingSystemName")
+    company: LabTechClient | None = Field(default=None, alias="Company")
+    site: LabTechLocation | None = Field(default=None, alias="Site")
+    last_microsoft_window: datetime | None = Field(default=None, alias="LastMicrosoftWindow")
+    last_third_party_window: datetime | None = Field(default=None, alias="LastThirdPartyWindow")
+    next_microsoft_window: datetime | None = Field(default=None, alias="NextMicrosoftWindow")
+    next_third_party_window: datetime | None = Field(default=None, alias="NextThirdPartyWindow")
+    did_last_patch_job_fail: bool | None = Field(default=None, alias="DidLastPatchJobFail")
+    is_daytime_patching_enabled: bool | None = Field(default=None, alias="IsDaytimePatchingEnabled")
+    is_missing_baseline: bool | None = Field(default=None, alias="IsMissingBaseline")
+    is_missing_patch_inventory: bool | None = Field(default=None, alias="IsMissingPatchInventory")
+    is_patch_job_running: bool | None = Field(default=None, alias="IsPatchJobRunning")
+    is_pending_update: bool | None = Field(default=None, alias="IsPendingUpdate")
+    is_reboot_pending: bool | None = Field(default=None, alias="IsRebootPending")
+    is_wsus_enabled: bool | None = Field(default=None, alias="IsWsusEnabled")
+    is_wua_out_of_date: bool | None = Field(default=None, alias="IsWuaOutOfDate")
+    missing_patch_count: int | None = Field(default=None, alias="MissingPatchCount")
+    microsoft_compliance_percent: float | None = Field(default=None, alias="MicrosoftCompliancePercent")
+    third_party_compliance_percent: float | None = Field(default=None, alias="ThirdPartyCompliancePercent")
+    has_approved_patches: bool | None = Field(default=None, alias="HasApprovedPatches")
+    has_approved_microsoft_patches: bool | None = Field(default=None, alias="HasApprovedMicrosoftPatches")
+    has_approved_third_party_patches: bool | None = Field(default=None, alias="HasApprovedThirdPartyPatches")
+    release_id: int | None = Field(default=None, alias="ReleaseId")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_client import LabTechClient
+from pyconnectwise.models.automate.lab_tech_location import LabTechLocation
+from pyconnectwise.models.automate.lab_tech_patch_stage import LabTechPatchStage
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechPatchesSummaryData(ConnectWiseModel):
+    entity_id: int | None = Field(default=None, alias="EntityId")
+    entity_name: str | None = Field(default=None, alias="EntityName")
+    test_stage_failed_patches_count: int | None = Field(default=None, alias="TestStageFailedPatchesCount")
+    test_stage_not_attempted_patches_count: int | None = Field(default=None, alias="TestStageNotAttemptedPatchesCount")
+    test_stage_installed_patches_count: int | None = Field(default=None, alias="TestStageInstalledPatchesCount")
+    pilot_stage_failed_patches_count: int | None = Field(default=None, alias="PilotStageFailedPatchesCount")
+    pilot_stage_not_attempted_patches_count: int | None = Field(
+        default=None, alias="PilotStageNotAttemptedPatchesCount"
+    )
+    pilot_stage_installed_patches_count: int | None = Field(default=None, alias="PilotStageInstalledPatchesCount")
+    production_stage_failed_patches_count: int | None = Field(default=None, alias="ProductionStageFailedPatchesCount")
+    production_stage_not_attempted_patches_count: int | None = Field(
+        default=None, alias="ProductionStageNotAttemptedPatchesCount"
+    )
+    production_stage_installed_patches_count: int | None = Field(
+        default=None, alias="ProductionStageInstalledPatchesCount"
+    )
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechPerformanceCounterQueryParameters(ConnectWiseModel):
+    performance_object: str | None = Field(default=None, alias="PerformanceObject")
+    performance_counter: str | None = Field(default=None, alias="PerformanceCounter")
+    instance: str | None = Field(default=None, alias="Instance")
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeCommandHistoryEntry(ConnectWiseModel):
+    result_set: list[AutomateProbeCommandHistoryEntry] | None = Field(default=None, alias="ResultSet")
+    total_record_count: int | None = Field(default=None, alias="TotalRecordCount")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.automate_probe_command_history_entry import AutomateProbeCommandHistoryEntry
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeConfiguration(ConnectWiseModel):
+    probe_configuration_id: int | None = Field(default=None, alias="ProbeConfigurationId")
+    location_id: int | None = Field(default=None, alias="LocationId")
+    agent_deployment_attempt_maximum: int | None = Field(default=None, alias="AgentDeploymentAttemptMaximum")
+    automated_deployment_enabled: bool | None = Field(default=None, alias="AutomatedDeploymentEnabled")
+    discovery_settings: LabTechDiscoveryScanSettings | None = Field(default=None, alias="DiscoverySettings")
+    status_settings: LabTechStatusScanSettings | None = Field(default=None, alias="StatusSettings")
+    snmp_settings: LabTechSnmpSettings | None = Field(default=None, alias="SnmpSettings")
+    is_data_collection_enabled: bool | None = Field(default=None, alias="IsDataCollectionEnabled")
+    snmp_trap_server_listening_port: int | None = Field(default=None, alias="SnmpTrapServerListeningPort")
+    syslog_settings: LabTechSyslogServerSettings | None = Field(default=None, alias="SyslogSettings")
+    tftp_settings: LabTechTftpServerSettings | None = Field(default=None, alias="TftpSettings")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_discovery_scan_settings import LabTechDiscoveryScanSettings
+from pyconnectwise.models.automate.lab_tech_snmp_settings import LabTechSnmpSettings
+from pyconnectwise.models.automate.lab_tech_status_scan_settings import LabTechStatusScanSettings
+from pyconnectwise.models.automate.lab_tech_syslog_server_settings import LabTechSyslogServerSettings
+from pyconnectwise.models.automate.lab_tech_tftp_server_settings import LabTechTftpServerSettings
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeConfigurationCredentials(ConnectWiseModel):
+    probe_configuration_credentials_id: int | None = Field(default=None, alias="ProbeConfigurationCredentialsId")
+    probe_configuration_id: int | None = Field(default=None, alias="ProbeConfigurationId")
+    credential_id: int | None = Field(default=None, alias="CredentialId")
+    attempt_sequence: int | None = Field(default=None, alias="AttemptSequence")
+    credentials_alias: str | None = Field(default=None, alias="CredentialsAlias")
+    credential_details: LabTechExternalSystemCredentials | None = Field(default=None, alias="CredentialDetails")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_external_system_credentials import LabTechExternalSystemCredentials
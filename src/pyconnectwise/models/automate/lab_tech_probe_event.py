@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeEvent(ConnectWiseModel):
+    probe_id: int | None = Field(default=None, alias="ProbeId")
+    event_level: LabTechProbeEventLevel | None = Field(default=None, alias="EventLevel")
+    message: str | None = Field(default=None, alias="Message")
+    event_time: datetime | None = Field(default=None, alias="EventTime")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_probe_event_level import LabTechProbeEventLevel
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeSnmpAuthentication(ConnectWiseModel):
+    snmp_authentication_id: int | None = Field(default=None, alias="SnmpAuthenticationId")
+    probe_snmp_configuration_id: int | None = Field(default=None, alias="ProbeSnmpConfigurationId")
+    authentication_secret: str | None = Field(default=None, alias="AuthenticationSecret")
+    hash_method: LabTechHashMethod | None = Field(default=None, alias="HashMethod")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_hash_method import LabTechHashMethod
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeSnmpConfiguration(ConnectWiseModel):
+    probe_snmp_configuration_id: int | None = Field(default=None, alias="ProbeSnmpConfigurationId")
+    probe_configuration_id: int | None = Field(default=None, alias="ProbeConfigurationId")
+    snmp_timeout_in_seconds: int | None = Field(default=None, alias="SnmpTimeoutInSeconds")
+    community_string_get_list: str | None = Field(default=None, alias="CommunityStringGetList")
+    snmp_v3_settings: LabTechProbeSnmpV3Configuration | None = Field(default=None, alias="SnmpV3Settings")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_probe_snmp_v3_configuration import LabTechProbeSnmpV3Configuration
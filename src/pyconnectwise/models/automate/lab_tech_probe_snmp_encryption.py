@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeSnmpEncryption(ConnectWiseModel):
+    snmp_encryption_id: int | None = Field(default=None, alias="SnmpEncryptionId")
+    probe_snmp_configuration_id: int | None = Field(default=None, alias="ProbeSnmpConfigurationId")
+    encryption_password: str | None = Field(default=None, alias="EncryptionPassword")
+    encryption_method: LabTechEncryptionMethod | None = Field(default=None, alias="EncryptionMethod")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_encryption_method import LabTechEncryptionMethod
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeSnmpV3Configuration(ConnectWiseModel):
+    probe_snmp_configuration_id: int | None = Field(default=None, alias="ProbeSnmpConfigurationId")
+    snmp_v3_username: str | None = Field(default=None, alias="SnmpV3Username")
+    authentication: LabTechProbeSnmpAuthentication | None = Field(default=None, alias="Authentication")
+    encryption: LabTechProbeSnmpEncryption | None = Field(default=None, alias="Encryption")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_probe_snmp_authentication import LabTechProbeSnmpAuthentication
+from pyconnectwise.models.automate.lab_tech_probe_snmp_encryption import LabTechProbeSnmpEncryption
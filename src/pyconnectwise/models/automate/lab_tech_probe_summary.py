@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProbeSummary(ConnectWiseModel):
+    current_probe_id: int | None = Field(default=None, alias="CurrentProbeId")
+    total_devices: int | None = Field(default=None, alias="TotalDevices")
+    offline_devices: int | None = Field(default=None, alias="OfflineDevices")
+    missing_agents: int | None = Field(default=None, alias="MissingAgents")
+    last_discovery_scan: datetime | None = Field(default=None, alias="LastDiscoveryScan")
+    agent_deployment_enabled: bool | None = Field(default=None, alias="AgentDeploymentEnabled")
+    has_max_tile_permissions: bool | None = Field(default=None, alias="HasMaxTilePermissions")
+    is_generation_two: bool | None = Field(default=None, alias="IsGenerationTwo")
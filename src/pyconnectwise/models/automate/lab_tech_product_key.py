@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechProductKey(ConnectWiseModel):
+    id: int | None = Field(default=None, alias="Id")
+    client_id: int | None = Field(default=None, alias="ClientId")
+    product_name: str | None = Field(default=None, alias="ProductName")
+    serial_number: str | None = Field(default=None, alias="SerialNumber")
+    license_key: str | None = Field(default=None, alias="LicenseKey")
+    does_expire: bool | None = Field(default=None, alias="DoesExpire")
+    expiration_date: datetime | None = Field(default=None, alias="ExpirationDate")
+    notes: str | None = Field(default=None, alias="Notes")
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    computer_name: str | None = Field(default=None, alias="ComputerName")
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechQueryOptionExpand(ConnectWiseModel):
+    field_name: str | None = Field(default=None, alias="FieldName")
+    page: int | None = Field(default=None, alias="Page")
+    page_size: int | None = Field(default=None, alias="PageSize")
+    condition: str | None = Field(default=None, alias="Condition")
+    expands: dict[str, LabTechQueryOptionExpand] | None = Field(default=None, alias="Expands")
+    order_by: LabTechQueryOptionOrderBy | None = Field(default=None, alias="OrderBy")
+    included_fields: list[str] | None = Field(default=None, alias="IncludedFields")
+    excluded_fields: list[str] | None = Field(default=None, alias="ExcludedFields")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_query_option_order_by import LabTechQueryOptionOrderBy
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechRegistryValueQueryParameters(ConnectWiseModel):
+    hive: LabTechRegistryValueQueryRegistryHive | None = Field(default=None, alias="Hive")
+    key: str | None = Field(default=None, alias="Key")
+    value: str | None = Field(default=None, alias="Value")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_registry_value_query_registry_hive import (
+    LabTechRegistryValueQueryRegistryHive,
+)
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechRouter(ConnectWiseModel):
+    id: int | None = Field(default=None, alias="Id")
+    manufacturer_name: str | None = Field(default=None, alias="ManufacturerName")
+    model: str | None = Field(default=None, alias="Model")
+    version: str | None = Field(default=None, alias="Version")
+    port_type: str | None = Field(default=None, alias="PortType")
+    username: str | None = Field(default=None, alias="Username")
+    password: str | None = Field(default=None, alias="Password")
+    guid: str | None = Field(default=None, alias="Guid")
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechScanFrequency(ConnectWiseModel):
+    scan_frequency_id: int | None = Field(default=None, alias="ScanFrequencyId")
+    frequency_in_minutes: int | None = Field(default=None, alias="FrequencyInMinutes")
+    display_name: str | None = Field(default=None, alias="DisplayName")
+    frequency_category: LabTechScanFrequencyCategory | None = Field(default=None, alias="FrequencyCategory")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_scan_frequency_category import LabTechScanFrequencyCategory
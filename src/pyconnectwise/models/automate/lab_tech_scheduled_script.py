@@ -0,0 +1,49 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechScheduledScript(ConnectWiseModel):
+    id: int | None = Field(default=None, alias="Id")
+    script_id: int | None = Field(default=None, alias="ScriptId")
+    client_id: int | None = Field(default=None, alias="ClientId")
+    location_id: int | None = Field(default=None, alias="LocationId")
+    computer_id: int | None = Field(default=None, alias="ComputerId")
+    group_id: int | None = Field(default=None, alias="GroupId")
+    include_subgroups: bool | None = Field(default=None, alias="IncludeSubgroups")
+    search_id: int | None = Field(default=None, alias="SearchId")
+    disabled: bool | None = Field(default=None, alias="Disabled")
+    effective_start_date: datetime | None = Field(default=None, alias="EffectiveStartDate")
+    effective_end_date: datetime | None = Field(default=None, alias="EffectiveEndDate")
+    effective_occurrences: int | None = Field(default=None, alias="EffectiveOccurrences")
+    distribution_window_type: int | None = Field(default=None, alias="DistributionWindowType")
+    distribution_window_amount: int | None = Field(default=None, alias="DistributionWindowAmount")
+    next_run: datetime | None = Field(default=None, alias="NextRun")
+    next_schedule: datetime | None = Field(default=None, alias="NextSchedule")
+    schedule_type: int | None = Field(default=None, alias="ScheduleType")
+    exclude_time_start: str | None = Field(default=None, alias="ExcludeTimeStart")
+    exclude_time_end: str | None = Field(default=None, alias="ExcludeTimeEnd")
+    interval: int | None = Field(default=None, alias="Interval")
+    schedule_week_of_month: int | None = Field(default=None, alias="ScheduleWeekOfMonth")
+    schedule_day_of_week: int | None = Field(default=None, alias="ScheduleDayOfWeek")
+    repeat_type: int | None = Field(default=None, alias="RepeatType")
+    repeat_amount: int | None = Field(default=None, alias="RepeatAmount")
+    repeat_stop_after: int | None = Field(default=None, alias="RepeatStopAfter")
+    skip_offline: bool | None = Field(default=None, alias="SkipOffline")
+    offline_only: bool | None = Field(default=None, alias="OfflineOnly")
+    wake_offline: bool | None = Field(default=None, alias="WakeOffline")
+    wake_script: bool | None = Field(default=None, alias="WakeScript")
+    disable_time_zone: bool | None = Field(default=None, alias="DisableTimeZone")
+    run_script_on_probe: bool | None = Field(default=None, alias="RunScriptOnProbe")
+    parameters: str | None = Field(default=None, alias="Parameters")
+    priority: int | None = Field(default=None, alias="Priority")
+    time_zone_add: float | None = Field(default=None, alias="TimeZoneAdd")
+    user: str | None = Field(default=None, alias="User")
+    last_update: datetime | None = Field(default=None, alias="LastUpdate")
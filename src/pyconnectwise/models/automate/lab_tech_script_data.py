@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechScriptData(ConnectWiseModel):
+    script_metadata: LabTechScriptMetadata | None = Field(default=None, alias="ScriptMetadata")
+    script_steps: list[LabTechScriptStep] | None = Field(default=None, alias="ScriptSteps")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_script_metadata import LabTechScriptMetadata
+from pyconnectwise.models.automate.lab_tech_script_step import LabTechScriptStep
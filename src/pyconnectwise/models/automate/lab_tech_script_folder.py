@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechScriptFolder(ConnectWiseModel):
+    id: str | None = Field(default=None, alias="Id")
+    parent_id: str | None = Field(default=None, alias="ParentId")
+    name: str | None = Field(default=None, alias="Name")
+    guid: str | None = Field(default=None, alias="GUID")
+    sub_folders: list[LabTechScriptFolder] | None = Field(default=None, alias="SubFolders")
+    parent_folder: LabTechScriptFolder | None = Field(default=None, alias="ParentFolder")
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechScriptMetadata(ConnectWiseModel):
+    extra_data_fields: str | None = Field(default=None, alias="ExtraDataFields")
+    parameters: str | None = Field(default=None, alias="Parameters")
+    globals: str | None = Field(default=None, alias="Globals")
+    script_version: int | None = Field(default=None, alias="ScriptVersion")
+    script_guid: str | None = Field(default=None, alias="ScriptGuid")
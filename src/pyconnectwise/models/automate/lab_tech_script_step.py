@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechScriptStep(ConnectWiseModel):
+    script_section: int | None = Field(default=None, alias="ScriptSection")
+    function_id: int | None = Field(default=None, alias="FunctionId")
+    param1: str | None = Field(default=None, alias="Param1")
+    param2: str | None = Field(default=None, alias="Param2")
+    param3: str | None = Field(default=None, alias="Param3")
+    param4: str | None = Field(default=None, alias="Param4")
+    param5: str | None = Field(default=None, alias="Param5")
+    sort: int | None = Field(default=None, alias="Sort")
+    continue_: int | None = Field(default=None, alias="Continue")
+    os_limit: int | None = Field(default=None, alias="OsLimit")
+    indentation: int | None = Field(default=None, alias="Indentation")
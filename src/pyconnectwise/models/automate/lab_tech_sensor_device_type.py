@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechSensorDeviceType(ConnectWiseModel):
+    device_type: int | None = Field(default=None, alias="DeviceType")
+    name: str | None = Field(default=None, alias="Name")
+    indicator: str | None = Field(default=None, alias="Indicator")
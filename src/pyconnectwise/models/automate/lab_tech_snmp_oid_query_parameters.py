@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechSnmpOidQueryParameters(ConnectWiseModel):
+    ip_address: str | None = Field(default=None, alias="IpAddress")
+    snmp_version: LabTechSnmpOidQuerySnmpVersion | None = Field(default=None, alias="SnmpVersion")
+    community: str | None = Field(default=None, alias="Community")
+    username: str | None = Field(default=None, alias="Username")
+    encryption_method: LabTechSnmpOidQueryEncryptionMethod | None = Field(default=None, alias="EncryptionMethod")
+    encryption_password: str | None = Field(default=None, alias="EncryptionPassword")
+    authentication_method: LabTechSnmpOidQueryAuthenticationMethod | None = Field(
+        default=None, alias="AuthenticationMethod"
+    )
+    authentication_password: str | None = Field(default=None, alias="AuthenticationPassword")
+    object_identifier: str | None = Field(default=None, alias="ObjectIdentifier")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_snmp_oid_query_authentication_method import (
+    LabTechSnmpOidQueryAuthenticationMethod,
+)
+from pyconnectwise.models.automate.lab_tech_snmp_oid_query_encryption_method import LabTechSnmpOidQueryEncryptionMethod
+from pyconnectwise.models.automate.lab_tech_snmp_oid_query_snmp_version import LabTechSnmpOidQuerySnmpVersion
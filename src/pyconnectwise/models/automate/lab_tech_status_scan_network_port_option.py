@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechStatusScanNetworkPortOption(ConnectWiseModel):
+    status_scan_network_port_option_id: int | None = Field(default=None, alias="StatusScanNetworkPortOptionId")
+    description: str | None = Field(default=None, alias="Description")
@@ -0,0 +1,50 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechTicket(ConnectWiseModel):
+    ticket_id: int | None = Field(default=None, alias="TicketId")
+    client: LabTechClient | None = Field(default=None, alias="Client")
+    computer: LabTechComputer | None = Field(default=None, alias="Computer")
+    status: LabTechTicketStatus | None = Field(default=None, alias="Status")
+    subject: str | None = Field(default=None, alias="Subject")
+    priority: LabTechTicketPriority | None = Field(default=None, alias="Priority")
+    user: LabTechUser | None = Field(default=None, alias="User")
+    due_date: datetime | None = Field(default=None, alias="DueDate")
+    start_date: datetime | None = Field(default=None, alias="StartDate")
+    contact_date: datetime | None = Field(default=None, alias="ContactDate")
+    update_date: datetime | None = Field(default=None, alias="UpdateDate")
+    from_: str | None = Field(default=None, alias="From")
+    cc: str | None = Field(default=None, alias="CC")
+    support_level: int | None = Field(default=None, alias="SupportLevel")
+    category: LabTechTicketCategory | None = Field(default=None, alias="Category")
+    category_id: int | None = Field(default=None, alias="CategoryId")
+    category_name: str | None = Field(default=None, alias="CategoryName")
+    location: LabTechLocation | None = Field(default=None, alias="Location")
+    external_id: int | None = Field(default=None, alias="ExternalId")
+    monitor_id: int | None = Field(default=None, alias="MonitorId")
+    guid: str | None = Field(default=None, alias="Guid")
+    agent: LabTechComputerMonitor | None = Field(default=None, alias="Agent")
+    network_device: LabTechNetworkDevice | None = Field(default=None, alias="NetworkDevice")
+    comments: list[LabTechTicketComment] | None = Field(default=None, alias="Comments")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_client import LabTechClient
+from pyconnectwise.models.automate.lab_tech_computer import LabTechComputer
+from pyconnectwise.models.automate.lab_tech_computer_monitor import LabTechComputerMonitor
+from pyconnectwise.models.automate.lab_tech_location import LabTechLocation
+from pyconnectwise.models.automate.lab_tech_network_device import LabTechNetworkDevice
+from pyconnectwise.models.automate.lab_tech_ticket_category import LabTechTicketCategory
+from pyconnectwise.models.automate.lab_tech_ticket_comment import LabTechTicketComment
+from pyconnectwise.models.automate.lab_tech_ticket_priority import LabTechTicketPriority
+from pyconnectwise.models.automate.lab_tech_ticket_status import LabTechTicketStatus
+from pyconnectwise.models.automate.lab_tech_user import LabTechUser
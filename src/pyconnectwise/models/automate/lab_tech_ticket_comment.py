@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechTicketComment(ConnectWiseModel):
+    id: str | None = Field(default=None, alias="Id")
+    body: str | None = Field(default=None, alias="Body")
+    created_date: datetime | None = Field(default=None, alias="CreatedDate")
+    from_: str | None = Field(default=None, alias="From")
+    user: LabTechUser | None = Field(default=None, alias="User")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_user import LabTechUser
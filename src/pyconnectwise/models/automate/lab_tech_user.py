@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechUser(ConnectWiseModel):
+    user_id: str | None = Field(default=None, alias="UserId")
+    folder: LabTechUserFolder | None = Field(default=None, alias="Folder")
+    name: str | None = Field(default=None, alias="Name")
+    email_address: str | None = Field(default=None, alias="EmailAddress")
+    sso_status: LabTechUserSingleSignOnStatus | None = Field(default=None, alias="SsoStatus")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_user_folder import LabTechUserFolder
+from pyconnectwise.models.automate.lab_tech_user_single_sign_on_status import LabTechUserSingleSignOnStatus
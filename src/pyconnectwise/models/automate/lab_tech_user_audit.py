@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechUserAudit(ConnectWiseModel):
+    id: int | None = Field(default=None, alias="Id")
+    user: LabTechUser | None = Field(default=None, alias="User")
+    message: str | None = Field(default=None, alias="Message")
+    date_created: datetime | None = Field(default=None, alias="DateCreated")
+    external_id: int | None = Field(default=None, alias="ExternalId")
+    audit_action: LabTechAuditAction | None = Field(default=None, alias="AuditAction")
+    source: LabTechAuditSource | None = Field(default=None, alias="Source")
+    secondary_identifier: str | None = Field(default=None, alias="SecondaryIdentifier")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_audit_action import LabTechAuditAction
+from pyconnectwise.models.automate.lab_tech_audit_source import LabTechAuditSource
+from pyconnectwise.models.automate.lab_tech_user import LabTechUser
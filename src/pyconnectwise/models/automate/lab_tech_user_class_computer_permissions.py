@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechUserClassComputerPermissions(ConnectWiseModel):
+    id: str | None = Field(default=None, alias="Id")
+    user_class: LabTechUserClass | None = Field(default=None, alias="UserClass")
+    permissions: LabTechComputerPermissions | None = Field(default=None, alias="Permissions")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.lab_tech_computer_permissions import LabTechComputerPermissions
+from pyconnectwise.models.automate.lab_tech_user_class import LabTechUserClass
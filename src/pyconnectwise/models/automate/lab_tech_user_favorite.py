@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechUserFavorite(ConnectWiseModel):
+    id: int | None = Field(default=None, alias="Id")
+    user_id: int | None = Field(default=None, alias="UserId")
+    additional_identifier: str | None = Field(default=None, alias="AdditionalIdentifier")
+    order: int | None = Field(default=None, alias="Order")
+    item_guid: str | None = Field(default=None, alias="ItemGUID")
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LabTechUserProfile(ConnectWiseModel):
+    is_super_admin: bool | None = Field(default=None, alias="IsSuperAdmin")
+    is_folder_limited: bool | None = Field(default=None, alias="IsFolderLimited")
+    user_class_id_list: list[int] | None = Field(default=None, alias="UserClassIdList")
@@ -0,0 +1,13 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MicrosoftSafeWaitHandle(ConnectWiseModel):
+    is_invalid: bool | None = Field(default=None, alias="IsInvalid")
+    is_closed: bool | None = Field(default=None, alias="IsClosed")
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SystemCancellationToken(ConnectWiseModel):
+    is_cancellation_requested: bool | None = Field(default=None, alias="IsCancellationRequested")
+    can_be_canceled: bool | None = Field(default=None, alias="CanBeCanceled")
+    wait_handle: SystemWaitHandle | None = Field(default=None, alias="WaitHandle")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.system_wait_handle import SystemWaitHandle
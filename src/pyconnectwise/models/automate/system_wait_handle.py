@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  merged_spec.json
+
+from __future__ import annotations
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SystemWaitHandle(ConnectWiseModel):
+    safe_wait_handle: MicrosoftSafeWaitHandle | None = Field(default=None, alias="SafeWaitHandle")
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.automate.microsoft_safe_wait_handle import MicrosoftSafeWaitHandle
@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import inspect
+from array import array
+from functools import cache
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, get_args, get_origin
+
+from pydantic import BaseModel
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+TModel = TypeVar("TModel", bound="BaseModel")
+
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+class CompactRecords(Generic[TModel]):
+    """
+    CompactRecords holds a large number of records of one model in far less memory than a list of model instances.
+
+    Rather than one object (with its own __dict__, nested reference models and _info dicts) per record, each field
+    is stored in a column shared by every record. Fields of nested models, e.g. a ticket's company, are flattened
+    into their own columns ("company/id", "company/name", ...), following the model's schema, and so are the
+    entries of dict fields like _info:
+    - Integer, float and boolean columns are stored in typed arrays, at 8 bytes per value or less.
+    - Repeated strings, like the names of the same few statuses and boards, are stored once and shared.
+    - Fields that are never set take no space at all.
+
+    Values are kept as they're sent by the API, so dates are strings. Each record can be read through attributes
+    named like the model's fields, and promoted to the full, validated model with to_model() when needed.
+
+    Build it from an iterable of raw dicts (see the "raw" response mode) or models, e.g. straight from stream_all(),
+    so only the compact form of each record is ever kept:
+
+        tickets = CompactRecords(Ticket, client.service.tickets.with_response_mode("raw").stream_all())
+        open_tickets = [t for t in tickets if not t.closed_flag]
+        print(open_tickets[0].company.name)
+        open_tickets[0].to_model()  # -> Ticket
+    """
+
+    def __init__(self, model: type[TModel], records: Iterable[dict[str, Any] | BaseModel]) -> None:
+        """
+        Store the given records in columns.
+
+        Args:
+            model (type[BaseModel]): The model of the records.
+            records (Iterable[dict | BaseModel]): The records, as dicts decoded from the API's JSON or model instances.
+        """
+        self.model = model
+        self._layout = _get_layout(model)
+        builders: dict[str, list[Any]] = {path: [] for path in self._layout.columns}
+        strings: dict[str, str] = {}
+
+        count = 0
+        for record in records:
+            data = (
+                record.model_dump(mode="json", by_alias=True, exclude_none=True)
+                if isinstance(record, BaseModel)
+                else record
+            )
+            self._add_record(data, "", count, builders, strings)
+            count += 1
+
+        self._length = count
+        self._columns = {path: _Column.build(values, count) for path, values in builders.items()}
+        # Only the columns with values need looking at to rebuild a record
+        self._set_columns = [(path, column) for path, column in self._columns.items() if column is not _Column.EMPTY]
+
+    def _add_record(
+        self,
+        data: dict[str, Any],
+        prefix: str,
+        index: int,
+        builders: dict[str, list[Any]],
+        strings: dict[str, str],
+    ) -> None:
+        for key, value in data.items():
+            path = f"{prefix}{key}"
+            if path in self._layout.objects:
+                if isinstance(value, dict):
+                    self._add_record(value, f"{path}/", index, builders, strings)
+                continue
+            if path in self._layout.maps and isinstance(value, dict) and not any("/" in k for k in value):
+                for k, v in value.items():
+                    _append(builders.setdefault(f"{path}/{k}", []), index, v, strings)
+                continue
+            column = builders.get(path)
+            if column is not None:
+                _append(column, index, value, strings)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index: int) -> CompactRecord[TModel]:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("record index out of range")  # noqa: TRY003
+        return CompactRecord(self, index)
+
+    def __iter__(self) -> Iterator[CompactRecord[TModel]]:
+        for index in range(self._length):
+            yield CompactRecord(self, index)
+
+    def _get_data(self, index: int, prefix: str = "") -> dict[str, Any]:
+        """
+        Rebuild a record's data (or the data of the nested object at the given prefix), as it would be sent by
+        the API.
+        """
+        data: dict[str, Any] = {}
+        for path, column in self._set_columns:
+            if not path.startswith(prefix):
+                continue
+            value = column.get(index)
+            if value is None:
+                continue
+            *parents, key = path[len(prefix) :].split("/")
+            target = data
+            for parent in parents:
+                target = target.setdefault(parent, {})
+            target[key] = value
+        return data
+
+
+class CompactRecord(Generic[TModel]):
+    """
+    A view of one record (or one of its nested objects) in a CompactRecords, with attributes named like the model's
+    fields. Nested objects are returned as views too, or None if none of their fields are set.
+    """
+
+    __slots__ = ("_records", "_index", "_prefix")
+
+    def __init__(self, records: CompactRecords[TModel], index: int, prefix: str = "") -> None:
+        self._records = records
+        self._index = index
+        self._prefix = prefix
+
+    def __getattr__(self, name: str) -> Any:  # noqa: ANN401
+        layout = self._records._layout
+        alias = layout.aliases.get(self._prefix, {}).get(name)
+        if alias is None:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")  # noqa: TRY003
+        path = f"{self._prefix}{alias}"
+        if path in layout.objects:
+            columns = self._records._set_columns
+            if not any(p.startswith(f"{path}/") and c.get(self._index) is not None for p, c in columns):
+                return None
+            return CompactRecord(self._records, self._index, f"{path}/")
+        if path in layout.maps:
+            # Stored whole if its keys couldn't be flattened, otherwise rebuilt from its entries' columns
+            column = self._records._columns.get(path)
+            value = column.get(self._index) if column is not None else None
+            return value if value is not None else self._records._get_data(self._index, f"{path}/") or None
+        return self._records._columns[path].get(self._index)
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Get the record's data as a dict, as it would be sent by the API.
+        """
+        return self._records._get_data(self._index, self._prefix)
+
+    def to_model(self) -> TModel:
+        """
+        Promote the record to a full instance of its model, validating its data.
+        """
+        if self._prefix:
+            raise ValueError("Only whole records can be promoted to their model")  # noqa: TRY003
+        return self._records.model.model_validate(self.to_dict())
+
+    def __repr__(self) -> str:
+        return f"CompactRecord({self._records.model.__name__}, index={self._index}, prefix={self._prefix!r})"
+
+
+class _Column:
+    """
+    One field's values across all records. Numbers and booleans are packed into a typed array, with any missing
+    values marked in a separate mask. Anything else is kept in a list.
+    """
+
+    __slots__ = ("values", "nulls", "is_bool")
+
+    EMPTY: _Column
+
+    def __init__(
+        self, values: array | list[Any] | None, nulls: bytearray | None = None, *, is_bool: bool = False
+    ) -> None:
+        self.values = values
+        self.nulls = nulls
+        self.is_bool = is_bool
+
+    @classmethod
+    def build(cls, values: list[Any], length: int) -> _Column:
+        if not values:
+            return cls.EMPTY
+        if len(values) < length:
+            values.extend([None] * (length - len(values)))
+
+        present = [v for v in values if v is not None]
+        typecode = None
+        if all(isinstance(v, bool) for v in present):
+            typecode = "b"
+        elif any(isinstance(v, bool) for v in present):
+            typecode = None
+        elif all(isinstance(v, int) and _INT64_MIN <= v <= _INT64_MAX for v in present):
+            typecode = "q"
+        elif all(isinstance(v, int | float) for v in present):
+            typecode = "d"
+        if typecode is None:
+            return cls(values)
+
+        nulls = bytearray(v is None for v in values) if len(present) < length else None
+        return cls(array(typecode, [0 if v is None else v for v in values]), nulls, is_bool=typecode == "b")
+
+    def get(self, index: int) -> Any:  # noqa: ANN401
+        if self.values is None or (self.nulls is not None and self.nulls[index]):
+            return None
+        value = self.values[index]
+        return bool(value) if self.is_bool else value
+
+
+_Column.EMPTY = _Column(None)
+
+
+def _append(column: list[Any], index: int, value: Any, strings: dict[str, str]) -> None:  # noqa: ANN401
+    if value is None:
+        return
+    if len(column) < index:
+        column.extend([None] * (index - len(column)))
+    if isinstance(value, str):
+        # Share one copy of each distinct string
+        value = strings.setdefault(value, value)
+    column.append(value)
+
+
+class _Layout:
+    """
+    The columns of a model, derived from its fields: the flattened path of every field, the paths of nested models
+    (which are flattened rather than stored), the paths of dict fields (whose entries get their own columns, as
+    they're found), and the field name to alias mapping at each level.
+    """
+
+    def __init__(self) -> None:
+        self.columns: list[str] = []
+        self.objects: set[str] = set()
+        self.maps: set[str] = set()
+        self.aliases: dict[str, dict[str, str]] = {}
+
+
+@cache
+def _get_layout(model: type[BaseModel]) -> _Layout:
+    layout = _Layout()
+    _add_model_to_layout(layout, model, "", (model,))
+    return layout
+
+
+def _add_model_to_layout(layout: _Layout, model: type[BaseModel], prefix: str, parents: tuple[type, ...]) -> None:
+    if issubclass(model, ConnectWiseModel):
+        model._ensure_complete()
+    aliases = layout.aliases.setdefault(prefix, {})
+    for name, field in model.model_fields.items():
+        alias = field.alias or name
+        aliases[name] = alias
+        nested = next(
+            (
+                arg
+                for arg in (field.annotation, *get_args(field.annotation))
+                if inspect.isclass(arg) and issubclass(arg, BaseModel) and arg not in parents
+            ),
+            None,
+        )
+        if nested is None:
+            layout.columns.append(f"{prefix}{alias}")
+            if any(get_origin(arg) is dict for arg in (field.annotation, *get_args(field.annotation))):
+                layout.maps.add(f"{prefix}{alias}")
+        else:
+            layout.objects.add(f"{prefix}{alias}")
+            _add_model_to_layout(layout, nested, f"{prefix}{alias}/", (*parents, nested))
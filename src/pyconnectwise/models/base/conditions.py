@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import date, datetime, timezone
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pyconnectwise.models.base.connectwise_model import FieldPath
+
+
+class ConditionExpression(ABC):
+    """
+    A condition on a model's fields, built by comparing fields through the model class, e.g.
+    (Ticket.status.name == "New") & (Ticket.id > 1000). Conditions are combined with & (AND) and | (OR), and
+    compile to the API's conditions syntax with str(), which is only worked out once per condition:
+
+        conditions = (Ticket.status.name == "New") & (Ticket.id > 1000)
+        client.service.tickets.get(params={"conditions": str(conditions)})  # status/name = "New" AND id > 1000
+    """
+
+    __slots__ = ("_compiled",)
+
+    def __init__(self) -> None:
+        self._compiled: str | None = None
+
+    @abstractmethod
+    def _compile(self) -> str:
+        pass
+
+    def __str__(self) -> str:
+        if self._compiled is None:
+            self._compiled = self._compile()
+        return self._compiled
+
+    def __and__(self, other: ConditionExpression) -> ConditionExpression:
+        return ConditionGroup("AND", (self, other))
+
+    def __or__(self, other: ConditionExpression) -> ConditionExpression:
+        return ConditionGroup("OR", (self, other))
+
+    def __bool__(self) -> bool:
+        # Catches conditions used where a comparison was meant, and "and"/"or" used instead of &/|
+        message = f"{self!r} is a condition to send to the API, not a boolean. Combine conditions with & and |"
+        raise TypeError(message)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self)!r})"
+
+
+class Comparison(ConditionExpression):
+    """
+    Compares a field to a value, e.g. Ticket.id > 1000 or Ticket.summary.like("Printer%").
+    """
+
+    __slots__ = ("field", "operator", "value")
+
+    def __init__(self, field: FieldPath, operator: str, value: Any) -> None:  # noqa: ANN401
+        super().__init__()
+        self.field = field
+        self.operator = operator
+        self.value = value
+
+    def _compile(self) -> str:
+        if self.operator in ("in", "not in"):
+            value = f"({', '.join(format_value(v) for v in self.value)})"
+        else:
+            value = format_value(self.value)
+        return f"{self.field.path} {self.operator} {value}"
+
+
+class ConditionGroup(ConditionExpression):
+    """
+    Joins conditions with AND or OR. Nested groups joined by the other operator are wrapped in parentheses.
+    """
+
+    __slots__ = ("operator", "conditions")
+
+    def __init__(self, operator: str, conditions: Iterable[ConditionExpression]) -> None:
+        super().__init__()
+        self.operator = operator
+        # (a & b) & c is kept as a & b & c rather than a deeper tree
+        self.conditions: tuple[ConditionExpression, ...] = tuple(
+            nested
+            for condition in conditions
+            for nested in (
+                condition.conditions
+                if isinstance(condition, ConditionGroup) and condition.operator == operator
+                else (condition,)
+            )
+        )
+
+    def _compile(self) -> str:
+        return f" {self.operator} ".join(
+            f"({condition})" if isinstance(condition, ConditionGroup) else str(condition)
+            for condition in self.conditions
+        )
+
+
+def format_value(value: Any) -> str:  # noqa: ANN401
+    """
+    Format a value the way the API expects it in conditions: strings in double quotes, dates in square brackets.
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, Enum):
+        value = value.value
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, int | float):
+        return str(value)
+    if isinstance(value, datetime):
+        if value.utcoffset() is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+            return f"[{value.isoformat()}Z]"
+        return f"[{value.isoformat()}]"
+    if isinstance(value, date):
+        return f"[{value.isoformat()}]"
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+    return f'"{escaped}"'
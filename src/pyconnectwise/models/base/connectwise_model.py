@@ -1,31 +1,139 @@
 from __future__ import annotations
 
+import copy
 import inspect
+import os
+import weakref
+from functools import cache
 from types import UnionType
-from typing import Union, get_args, get_origin
+from typing import TYPE_CHECKING, Any, Union, get_args, get_origin
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, create_model
 
+from pyconnectwise.models.base.conditions import Comparison
 from pyconnectwise.utils.naming import to_camel_case
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
-class ConnectWiseModel(BaseModel):
+    from pydantic.fields import FieldInfo
+
+# Set PYCONNECTWISE_DEFER_MODEL_BUILD=1 (before any models are imported) to defer building each model's
+# pydantic schema and validator until the model is first validated, rather than when it's defined.
+# This makes importing models cheaper for processes that only ever validate a few of the models they import.
+DEFER_MODEL_BUILD = os.environ.get("PYCONNECTWISE_DEFER_MODEL_BUILD", "").lower() in ("1", "true", "yes")
+
+
+# The models pydantic has finished building. While a model is being built, pydantic looks up each of its
+# annotations on the class, and model_fields still holds its base's fields, so names can't refer to fields yet.
+_built_models: weakref.WeakSet[type] = weakref.WeakSet()
+
+
+class ConnectWiseModelMetaclass(type(BaseModel)):
+    def __new__(mcs, *args: Any, **kwargs: Any) -> type:  # noqa: ANN401, N804
+        cls = super().__new__(mcs, *args, **kwargs)
+        _built_models.add(cls)
+        return cls
+
+    def __getattr__(cls, name: str) -> Any:  # noqa: ANN401
+        # Fields aren't class attributes, so e.g. Ticket.id ends up here. It refers to the field, for select()
+        # and conditions.
+        if not name.startswith(("_", "model_")) and cls in _built_models and name in cls.model_fields:
+            return _get_nested_path(cls, (), name)
+        return super().__getattr__(name)
+
+
+class FieldPath:
+    """
+    Refers to a field of a model, or a field of one of its nested models, e.g. Ticket.status.name.
+    Used to select which fields to request from an endpoint, see ConnectWiseEndpoint.select(), and to build
+    conditions by comparing the field to a value, e.g. Ticket.status.name == "New", see ConditionExpression.
+    """
+
+    __slots__ = ("model", "names")
+
+    # Comparisons build conditions, so paths can't be hashed or compared to each other
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, model: type[ConnectWiseModel], names: tuple[str, ...]) -> None:
+        self.model = model
+        self.names = names
+
+    def __getattr__(self, name: str) -> FieldPath:
+        return _get_nested_path(self.model, self.names, name)
+
+    @property
+    def path(self) -> str:
+        """
+        The field's path as the API refers to it, e.g. "status/name".
+        """
+        return _get_field_path(self.model, self.names)
+
+    def __eq__(self, value: object) -> Comparison:  # type: ignore[override]
+        return Comparison(self, "=", value)
+
+    def __ne__(self, value: object) -> Comparison:  # type: ignore[override]
+        return Comparison(self, "!=", value)
+
+    def __lt__(self, value: object) -> Comparison:
+        return Comparison(self, "<", value)
+
+    def __le__(self, value: object) -> Comparison:
+        return Comparison(self, "<=", value)
+
+    def __gt__(self, value: object) -> Comparison:
+        return Comparison(self, ">", value)
+
+    def __ge__(self, value: object) -> Comparison:
+        return Comparison(self, ">=", value)
+
+    def contains(self, value: str) -> Comparison:
+        return Comparison(self, "contains", value)
+
+    def like(self, pattern: str) -> Comparison:
+        return Comparison(self, "like", pattern)
+
+    def not_like(self, pattern: str) -> Comparison:
+        return Comparison(self, "not like", pattern)
+
+    def in_(self, values: Iterable[object]) -> Comparison:
+        return Comparison(self, "in", tuple(values))
+
+    def not_in(self, values: Iterable[object]) -> Comparison:
+        return Comparison(self, "not in", tuple(values))
+
+    def __repr__(self) -> str:
+        return ".".join((self.model.__name__, *self.names))
+
+
+class ConnectWiseModel(BaseModel, metaclass=ConnectWiseModelMetaclass):
     model_config = ConfigDict(
         alias_generator=to_camel_case,
         populate_by_name=True,
         use_enum_values=True,
         protected_namespaces=(),
+        defer_build=DEFER_MODEL_BUILD,
     )
 
     @classmethod
-    def _get_field_names(cls) -> list[str]:
+    def _ensure_complete(cls) -> None:
+        # Models are defined before the models their fields refer to are imported, and pydantic only resolves
+        # those annotations once the model is first used. Until then the field annotations are unresolved.
+        if not cls.__pydantic_complete__:
+            cls.model_rebuild()
+
+    @classmethod
+    def _get_field_names(cls, parents: tuple[type[ConnectWiseModel], ...] = ()) -> list[str]:
+        cls._ensure_complete()
+        parents = (*parents, cls)
         field_names = []
-        for v in cls.__fields__.values():
+        for v in cls.model_fields.values():
             was_model = False
             for arg in get_args(v.annotation):
-                if inspect.isclass(arg) and issubclass(arg, ConnectWiseModel):
+                # Models that refer back to a model they're nested in (like Automate's) are left as one field
+                if inspect.isclass(arg) and issubclass(arg, ConnectWiseModel) and arg not in parents:
                     was_model = True
-                    field_names.extend([f"{v.alias}/{sub}" for sub in arg._get_field_names()])
+                    field_names.extend([f"{v.alias}/{sub}" for sub in arg._get_field_names(parents)])
 
             if not was_model:
                 field_names.append(v.alias)
@@ -33,24 +141,35 @@ class ConnectWiseModel(BaseModel):
         return field_names
 
     @classmethod
-    def _get_field_names_and_types(cls) -> dict[str, str]:  # noqa: C901
+    def _get_field_names_and_types(  # noqa: C901
+        cls, parents: tuple[type[ConnectWiseModel], ...] = ()
+    ) -> dict[str, str]:
+        cls._ensure_complete()
+        parents = (*parents, cls)
         field_names_and_types = {}
-        for v in cls.__fields__.values():
+        for v in cls.model_fields.values():
             was_model = False
             field_type = "None"
             if get_origin(v.annotation) is UnionType or get_origin(v.annotation) is Union:
                 for arg in get_args(v.annotation):
                     if inspect.isclass(arg) and issubclass(arg, ConnectWiseModel):
+                        if arg in parents:
+                            # It refers back to a model it's nested in, so it's left as one field
+                            field_type = "dict"
+                            continue
                         was_model = True
-                        for sk, sv in arg._get_field_names_and_types().items():
+                        for sk, sv in arg._get_field_names_and_types(parents).items():
                             field_names_and_types[f"{v.alias}/{sk}"] = sv
                     elif arg is not None and arg.__name__ != "NoneType":
                         field_type = arg.__name__
             else:
                 if inspect.isclass(v.annotation) and issubclass(v.annotation, ConnectWiseModel):
-                    was_model = True
-                    for sk, sv in v.annotation._get_field_names_and_types().items():
-                        field_names_and_types[f"{v.alias}/{sk}"] = sv
+                    if v.annotation in parents:
+                        field_type = "dict"
+                    else:
+                        was_model = True
+                        for sk, sv in v.annotation._get_field_names_and_types(parents).items():
+                            field_names_and_types[f"{v.alias}/{sk}"] = sv
                 elif v.annotation is not None and v.annotation.__name__ != "NoneType":
                     field_type = v.annotation.__name__
 
@@ -58,3 +177,69 @@ class ConnectWiseModel(BaseModel):
                 field_names_and_types[v.alias] = field_type
 
         return field_names_and_types
+
+    @classmethod
+    def _select(cls, *fields: FieldPath) -> type[ConnectWiseModel]:
+        """
+        Get a slim model with only the given fields, and only the given fields of any nested models.
+        Selecting a nested model itself (e.g. Ticket.company) keeps all of its fields.
+        """
+        return _get_selection_model(cls, frozenset(field.names for field in fields))
+
+
+def _get_nested_model(field: FieldInfo) -> type[ConnectWiseModel] | None:
+    for arg in (field.annotation, *get_args(field.annotation)):
+        if inspect.isclass(arg) and issubclass(arg, ConnectWiseModel):
+            return arg
+    return None
+
+
+@cache
+def _get_nested_path(model: type[ConnectWiseModel], names: tuple[str, ...], name: str) -> FieldPath:
+    # Referring to fields is cheap enough to do while building conditions, as each path is only looked up once
+    nested_model: type[ConnectWiseModel] | None = model
+    for field_name in names:
+        nested_model._ensure_complete()
+        nested_model = _get_nested_model(nested_model.model_fields[field_name])
+        if nested_model is None:
+            path = ".".join((model.__name__, *names))
+            raise AttributeError(f"{path} isn't a model, so it has no field {name!r}")  # noqa: TRY003
+    if name not in nested_model.model_fields:
+        raise AttributeError(f"{nested_model.__name__} has no field {name!r}")  # noqa: TRY003
+    return FieldPath(model, (*names, name))
+
+
+@cache
+def _get_field_path(model: type[ConnectWiseModel], names: tuple[str, ...]) -> str:
+    aliases = []
+    nested_model: type[ConnectWiseModel] | None = model
+    for name in names:
+        nested_model._ensure_complete()
+        field = nested_model.model_fields[name]
+        aliases.append(field.alias or name)
+        nested_model = _get_nested_model(field)
+    return "/".join(aliases)
+
+
+@cache
+def _get_selection_model(model: type[ConnectWiseModel], paths: frozenset[tuple[str, ...]]) -> type[ConnectWiseModel]:
+    model._ensure_complete()
+    nested_paths: dict[str, set[tuple[str, ...]]] = {}
+    for first, *rest in paths:
+        # An empty path means the whole field is selected
+        nested_paths.setdefault(first, set()).add(tuple(rest))
+
+    fields: dict[str, Any] = {}
+    # Keep the model's field order, rather than the order they were selected in
+    for name, field in model.model_fields.items():
+        if name not in nested_paths:
+            continue
+        selected = copy.copy(field)
+        annotation = field.annotation
+        nested_model = _get_nested_model(field)
+        # Selecting a nested model as well as some of its fields selects all of them
+        if nested_model is not None and () not in nested_paths[name]:
+            annotation = _get_selection_model(nested_model, frozenset(nested_paths[name])) | None
+            selected.default = None
+        fields[name] = (annotation, selected)
+    return create_model(f"{model.__name__}Selection", __base__=ConnectWiseModel, __module__=model.__module__, **fields)
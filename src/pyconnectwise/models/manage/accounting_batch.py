@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AccountingBatch(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    batch_identifier: Annotated[str | None, Field(alias="batchIdentifier")] = None
+    closed_flag: Annotated[bool | None, Field(alias="closedFlag")] = None
+    export_expenses_flag: Annotated[bool | None, Field(alias="exportExpensesFlag")] = None
+    export_invoices_flag: Annotated[bool | None, Field(alias="exportInvoicesFlag")] = None
+    export_products_flag: Annotated[bool | None, Field(alias="exportProductsFlag")] = None
+    id: int | None = None
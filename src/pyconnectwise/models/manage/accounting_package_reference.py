@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AccountingPackageReference(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    identifier: Literal["QB99", "Mas200", "GPlains", "SBA", "Mas200v4", "Other"] | None = None
+    name: str | None = None
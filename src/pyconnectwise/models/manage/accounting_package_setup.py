@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AccountingPackageSetup(ConnectWiseModel):
+    accounting_package: Annotated[AccountingPackageReference | None, Field(alias="accountingPackage")] = None
+    direct_transfer_flag: Annotated[bool | None, Field(alias="directTransferFlag")] = None
+    enable_tax_groups_flag: Annotated[bool | None, Field(alias="enableTaxGroupsFlag")] = None
+    expense_format: Annotated[Literal["Default", "Condensed"] | None, Field(alias="expenseFormat")] = None
+    id: int | None = None
+    include_cogs_drop_ship_flag: Annotated[bool | None, Field(alias="includeCogsDropShipFlag")] = None
+    include_cogs_entries_flag: Annotated[bool | None, Field(alias="includeCogsEntriesFlag")] = None
+    include_expenses_flag: Annotated[bool | None, Field(alias="includeExpensesFlag")] = None
+    include_invoices_flag: Annotated[bool | None, Field(alias="includeInvoicesFlag")] = None
+    include_items_flag: Annotated[bool | None, Field(alias="includeItemsFlag")] = None
+    include_sales_tax_flag: Annotated[bool | None, Field(alias="includeSalesTaxFlag")] = None
+    inventory_soh_flag: Annotated[bool | None, Field(alias="inventorySOHFlag")] = None
+    invoice_format: Annotated[Literal["Default", "Condensed", "Detailed"] | None, Field(alias="invoiceFormat")] = None
+    send_component_amount_flag: Annotated[bool | None, Field(alias="sendComponentAmountFlag")] = None
+    send_uom_flag: Annotated[bool | None, Field(alias="sendUomFlag")] = None
+    suppress_memo_flag: Annotated[bool | None, Field(alias="suppressMemoFlag")] = None
+    sync_payment_info_flag: Annotated[bool | None, Field(alias="syncPaymentInfoFlag")] = None
+    transfer_expenses_as_bill_flag: Annotated[bool | None, Field(alias="transferExpensesAsBillFlag")] = None
+    zero_dollar_tax_amounts_flag: Annotated[bool | None, Field(alias="zeroDollarTaxAmountsFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.accounting_package_reference import AccountingPackageReference
@@ -0,0 +1,66 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Activity(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement: AgreementReference | None = None
+    assign_to: Annotated[MemberReference | None, Field(alias="assignTo")] = None
+    assigned_by: Annotated[MemberReference | None, Field(alias="assignedBy")] = None
+    campaign: CampaignReference | None = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    currency: CurrencyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    date_end: Annotated[datetime | None, Field(alias="dateEnd")] = None
+    date_start: Annotated[datetime | None, Field(alias="dateStart")] = None
+    email: str | None = None
+    """
+     Max length: 250;
+    """
+    id: int | None = None
+    mobile_guid: Annotated[UUID | None, Field(alias="mobileGuid")] = None
+    name: str
+    """
+     Max length: 100;
+    """
+    notes: str | None = None
+    notify_flag: Annotated[bool | None, Field(alias="notifyFlag")] = None
+    opportunity: OpportunityReference | None = None
+    phone_number: Annotated[str | None, Field(alias="phoneNumber")] = None
+    """
+     Max length: 30;
+    """
+    reminder: ReminderReference | None = None
+    schedule_status: Annotated[ScheduleStatusReference | None, Field(alias="scheduleStatus")] = None
+    status: ActivityStatusReference | None = None
+    ticket: TicketReference | None = None
+    type: ActivityTypeReference | None = None
+    where: ServiceLocationReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.activity_status_reference import ActivityStatusReference
+from pyconnectwise.models.manage.activity_type_reference import ActivityTypeReference
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.campaign_reference import CampaignReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.opportunity_reference import OpportunityReference
+from pyconnectwise.models.manage.reminder_reference import ReminderReference
+from pyconnectwise.models.manage.schedule_status_reference import ScheduleStatusReference
+from pyconnectwise.models.manage.service_location_reference import ServiceLocationReference
+from pyconnectwise.models.manage.ticket_reference import TicketReference
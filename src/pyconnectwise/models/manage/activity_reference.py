@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ActivityReference(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    name: str | None = None
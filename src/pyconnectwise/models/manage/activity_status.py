@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ActivityStatus(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    closed_flag: Annotated[bool | None, Field(alias="closedFlag")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    name: str
+    """
+     Max length: 30;
+    """
+    spawn_followup_flag: Annotated[bool | None, Field(alias="spawnFollowupFlag")] = None
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ActivityStatusInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    closed_flag: Annotated[bool | None, Field(alias="closedFlag")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    name: str | None = None
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.manage.activity_reference import ActivityReference
+
+
+class ActivityStatusReference(ActivityReference):
+    pass
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ActivityType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    email_flag: Annotated[bool | None, Field(alias="emailFlag")] = None
+    history_flag: Annotated[bool | None, Field(alias="historyFlag")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    memo_flag: Annotated[bool | None, Field(alias="memoFlag")] = None
+    name: str
+    """
+     Max length: 50;
+    """
+    points: int | None = None
@@ -0,0 +1,61 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Addition(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_id: Annotated[int | None, Field(alias="agreementId")] = None
+    agreement_status: Annotated[
+        Literal["Active", "Cancelled", "Expired", "Inactive"] | None, Field(alias="agreementStatus")
+    ] = None
+    bill_customer: Annotated[Literal["Billable", "DoNotBill", "NoCharge"], Field(alias="billCustomer")]
+    billed_quantity: Annotated[float | None, Field(alias="billedQuantity")] = None
+    cancelled_date: Annotated[datetime | None, Field(alias="cancelledDate")] = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    description: str | None = None
+    effective_date: Annotated[datetime | None, Field(alias="effectiveDate")] = None
+    ext_cost: Annotated[float | None, Field(alias="extCost")] = None
+    ext_price: Annotated[float | None, Field(alias="extPrice")] = None
+    extended_prorate_cost: Annotated[float | None, Field(alias="extendedProrateCost")] = None
+    extended_prorate_price: Annotated[float | None, Field(alias="extendedProratePrice")] = None
+    id: int | None = None
+    invoice_description: Annotated[str | None, Field(alias="invoiceDescription")] = None
+    """
+     Max length: 6000;
+    """
+    invoice_grouping: Annotated[InvoiceGroupingReference | None, Field(alias="invoiceGrouping")] = None
+    less_included: Annotated[float | None, Field(alias="lessIncluded")] = None
+    margin: float | None = None
+    opportunity: OpportunityReference | None = None
+    product: IvItemReference | None = None
+    prorate_cost: Annotated[float | None, Field(alias="prorateCost")] = None
+    prorate_current_period_flag: Annotated[bool | None, Field(alias="prorateCurrentPeriodFlag")] = None
+    prorate_price: Annotated[float | None, Field(alias="proratePrice")] = None
+    purchase_item_flag: Annotated[bool | None, Field(alias="purchaseItemFlag")] = None
+    quantity: float | None = None
+    sequence_number: Annotated[float | None, Field(alias="sequenceNumber")] = None
+    serial_number: Annotated[str | None, Field(alias="serialNumber")] = None
+    """
+     Max length: 50;
+    """
+    special_order_flag: Annotated[bool | None, Field(alias="specialOrderFlag")] = None
+    taxable_flag: Annotated[bool | None, Field(alias="taxableFlag")] = None
+    unit_cost: Annotated[float | None, Field(alias="unitCost")] = None
+    unit_price: Annotated[float | None, Field(alias="unitPrice")] = None
+    uom: str | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.invoice_grouping_reference import InvoiceGroupingReference
+from pyconnectwise.models.manage.iv_item_reference import IvItemReference
+from pyconnectwise.models.manage.opportunity_reference import OpportunityReference
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AddressFormat(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_all_countries: Annotated[bool | None, Field(alias="addAllCountries")] = None
+    country_ids: Annotated[list[int] | None, Field(alias="countryIds")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    format: str
+    """
+     Max length: 250;
+    """
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    remove_all_countries: Annotated[bool | None, Field(alias="removeAllCountries")] = None
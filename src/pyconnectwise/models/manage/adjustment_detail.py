@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AdjustmentDetail(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    adjustment: AdjustmentReference | None = None
+    catalog_item: Annotated[CatalogItemReference | None, Field(alias="catalogItem")] = None
+    description: str | None = None
+    """
+     Max length: 50;
+    """
+    id: int | None = None
+    quantity_adjusted: Annotated[int, Field(alias="quantityAdjusted")]
+    quantity_on_hand: Annotated[float | None, Field(alias="quantityOnHand")] = None
+    serial_number: Annotated[str | None, Field(alias="serialNumber")] = None
+    """
+     Max length: 1000;
+    """
+    unit_cost: Annotated[float | None, Field(alias="unitCost")] = None
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: Annotated[WarehouseBinReference | None, Field(alias="warehouseBin")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.adjustment_reference import AdjustmentReference
+from pyconnectwise.models.manage.catalog_item_reference import CatalogItemReference
+from pyconnectwise.models.manage.warehouse_bin_reference import WarehouseBinReference
+from pyconnectwise.models.manage.warehouse_reference import WarehouseReference
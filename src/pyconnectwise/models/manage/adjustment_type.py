@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AdjustmentType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    audit_trail_flag: Annotated[bool | None, Field(alias="auditTrailFlag")] = None
+    created_by: Annotated[str | None, Field(alias="createdBy")] = None
+    date_created: Annotated[datetime | None, Field(alias="dateCreated")] = None
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 50;
+    """
+    name: str | None = None
+    """
+     Max length: 100;
+    """
@@ -0,0 +1,163 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Agreement(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_status: Annotated[
+        Literal["Active", "Cancelled", "Expired", "Inactive"] | None, Field(alias="agreementStatus")
+    ] = None
+    allow_overruns: Annotated[bool | None, Field(alias="allowOverruns")] = None
+    application_cycle: Annotated[
+        Literal[
+            "Contract2Weeks",
+            "Contract4Weeks",
+            "ContractYear",
+            "CalendarMonth",
+            "CalendarQuarter",
+            "CalendarWeek",
+            "ContractQuarter",
+            "CalendarYear",
+        ]
+        | None,
+        Field(alias="applicationCycle"),
+    ] = None
+    application_limit: Annotated[float | None, Field(alias="applicationLimit")] = None
+    application_units: Annotated[Literal["Amount", "Hours", "Incidents"] | None, Field(alias="applicationUnits")] = None
+    application_unlimited_flag: Annotated[bool | None, Field(alias="applicationUnlimitedFlag")] = None
+    auto_invoice_flag: Annotated[bool | None, Field(alias="autoInvoiceFlag")] = None
+    bill_amount: Annotated[float | None, Field(alias="billAmount")] = None
+    bill_expenses: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billExpenses")
+    ] = None
+    """
+     Required On Updates;
+    """
+    bill_one_time_flag: Annotated[bool | None, Field(alias="billOneTimeFlag")] = None
+    bill_products: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billProducts")
+    ] = None
+    """
+     Required On Updates;
+    """
+    bill_start_date: Annotated[datetime | None, Field(alias="billStartDate")] = None
+    bill_time: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billTime")
+    ] = None
+    """
+     Required On Updates;
+    """
+    bill_to_company: Annotated[CompanyReference | None, Field(alias="billToCompany")] = None
+    bill_to_contact: Annotated[ContactReference | None, Field(alias="billToContact")] = None
+    bill_to_site: Annotated[SiteReference | None, Field(alias="billToSite")] = None
+    billable_expense_invoice: Annotated[bool | None, Field(alias="billableExpenseInvoice")] = None
+    billable_product_invoice: Annotated[bool | None, Field(alias="billableProductInvoice")] = None
+    billable_time_invoice: Annotated[bool | None, Field(alias="billableTimeInvoice")] = None
+    billing_cycle: Annotated[BillingCycleReference | None, Field(alias="billingCycle")] = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    bottom_comment: Annotated[bool | None, Field(alias="bottomComment")] = None
+    cancelled_flag: Annotated[bool | None, Field(alias="cancelledFlag")] = None
+    carry_over_unused: Annotated[bool | None, Field(alias="carryOverUnused")] = None
+    charge_to_firm: Annotated[bool | None, Field(alias="chargeToFirm")] = None
+    comp_hourly_rate: Annotated[float | None, Field(alias="compHourlyRate")] = None
+    comp_limit_amount: Annotated[float | None, Field(alias="compLimitAmount")] = None
+    company: CompanyReference | None = None
+    company_location: Annotated[SystemLocationReference | None, Field(alias="companyLocation")] = None
+    contact: ContactReference | None = None
+    cover_agreement_expense: Annotated[bool | None, Field(alias="coverAgreementExpense")] = None
+    cover_agreement_product: Annotated[bool | None, Field(alias="coverAgreementProduct")] = None
+    cover_agreement_time: Annotated[bool | None, Field(alias="coverAgreementTime")] = None
+    cover_sales_tax: Annotated[bool | None, Field(alias="coverSalesTax")] = None
+    currency: CurrencyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    customer_po: Annotated[str | None, Field(alias="customerPO")] = None
+    """
+     Max length: 50;
+    """
+    date_cancelled: Annotated[datetime | None, Field(alias="dateCancelled")] = None
+    department: SystemDepartmentReference | None = None
+    employee_comp_not_exceed: Annotated[
+        Literal["Billing", "Amount", "Percent"] | None, Field(alias="employeeCompNotExceed")
+    ] = None
+    employee_comp_rate: Annotated[Literal["Actual", "Hourly"] | None, Field(alias="employeeCompRate")] = None
+    """
+     Required On Updates;
+    """
+    end_date: Annotated[datetime | None, Field(alias="endDate")] = None
+    expire_when_zero: Annotated[bool | None, Field(alias="expireWhenZero")] = None
+    expired_days: Annotated[int | None, Field(alias="expiredDays")] = None
+    id: int | None = None
+    internal_notes: Annotated[str | None, Field(alias="internalNotes")] = None
+    invoice_description: Annotated[str | None, Field(alias="invoiceDescription")] = None
+    invoice_template: Annotated[InvoiceTemplateReference | None, Field(alias="invoiceTemplate")] = None
+    invoicing_cycle: Annotated[Literal["ContractYear", "CalendarYear"] | None, Field(alias="invoicingCycle")] = None
+    """
+     Required On Updates;
+    """
+    limit: int | None = None
+    location: SystemLocationReference | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    next_invoice_date: Annotated[datetime | None, Field(alias="nextInvoiceDate")] = None
+    no_ending_date_flag: Annotated[bool | None, Field(alias="noEndingDateFlag")] = None
+    one_time_flag: Annotated[bool | None, Field(alias="oneTimeFlag")] = None
+    opportunity: OpportunityReference | None = None
+    parent_agreement: Annotated[AgreementReference | None, Field(alias="parentAgreement")] = None
+    period_type: Annotated[Literal["Current", "Future", "Both", "Undefined"] | None, Field(alias="periodType")] = None
+    project_type: Annotated[ProjectTypeReference | None, Field(alias="projectType")] = None
+    prorate_first_bill: Annotated[float | None, Field(alias="prorateFirstBill")] = None
+    prorate_flag: Annotated[bool | None, Field(alias="prorateFlag")] = None
+    reason_cancelled: Annotated[str | None, Field(alias="reasonCancelled")] = None
+    """
+     Max length: 100;
+    """
+    restrict_department_flag: Annotated[bool | None, Field(alias="restrictDepartmentFlag")] = None
+    restrict_down_payment: Annotated[bool | None, Field(alias="restrictDownPayment")] = None
+    restrict_location_flag: Annotated[bool | None, Field(alias="restrictLocationFlag")] = None
+    site: SiteReference | None = None
+    sla: SLAReference | None = None
+    start_date: Annotated[datetime | None, Field(alias="startDate")] = None
+    sub_contract_company: Annotated[CompanyReference | None, Field(alias="subContractCompany")] = None
+    sub_contract_contact: Annotated[ContactReference | None, Field(alias="subContractContact")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    taxable: bool | None = None
+    top_comment: Annotated[bool | None, Field(alias="topComment")] = None
+    type: AgreementTypeReference | None = None
+    work_order: Annotated[str | None, Field(alias="workOrder")] = None
+    """
+     Max length: 20;
+    """
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+    work_type: Annotated[WorkTypeReference | None, Field(alias="workType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.agreement_type_reference import AgreementTypeReference
+from pyconnectwise.models.manage.billing_cycle_reference import BillingCycleReference
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.invoice_template_reference import InvoiceTemplateReference
+from pyconnectwise.models.manage.opportunity_reference import OpportunityReference
+from pyconnectwise.models.manage.project_type_reference import ProjectTypeReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.sla_reference import SLAReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
+from pyconnectwise.models.manage.work_type_reference import WorkTypeReference
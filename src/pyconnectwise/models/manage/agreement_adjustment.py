@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementAdjustment(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_id: Annotated[int | None, Field(alias="agreementId")] = None
+    amount: float | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    description: str | None = None
+    """
+     Max length: 1000;
+    """
+    effective_date: Annotated[datetime | None, Field(alias="effectiveDate")] = None
+    id: int | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
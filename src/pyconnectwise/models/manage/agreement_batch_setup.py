@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementBatchSetup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    days_in_advance: Annotated[int, Field(alias="daysInAdvance")]
+    id: int | None = None
+    next_run_date: Annotated[datetime, Field(alias="nextRunDate")]
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementBillingInfo(ConnectWiseModel):
+    agreement_amount: Annotated[float | None, Field(alias="agreementAmount")] = None
+    agreement_name: Annotated[str | None, Field(alias="agreementName")] = None
+    agreement_rec_id: Annotated[int | None, Field(alias="agreementRecId")] = None
+    agreement_type: Annotated[str | None, Field(alias="agreementType")] = None
+    parent_rec_id: Annotated[int | None, Field(alias="parentRecId")] = None
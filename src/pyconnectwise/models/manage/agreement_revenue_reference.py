@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementRevenueReference(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    cost: float | None = None
+    id: int | None = None
+    margin: float | None = None
+    percentage: float | None = None
+    revenue: float | None = None
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementSite(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_id: Annotated[int | None, Field(alias="agreementId")] = None
+    company: CompanyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    id: int | None = None
+    site: SiteReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.site_reference import SiteReference
@@ -0,0 +1,115 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_all_work_role_exclusions: Annotated[bool | None, Field(alias="addAllWorkRoleExclusions")] = None
+    add_all_work_type_exclusions: Annotated[bool | None, Field(alias="addAllWorkTypeExclusions")] = None
+    allow_overruns_flag: Annotated[bool | None, Field(alias="allowOverrunsFlag")] = None
+    application_cycle: Annotated[
+        Literal[
+            "Contract2Weeks",
+            "Contract4Weeks",
+            "ContractYear",
+            "CalendarMonth",
+            "CalendarQuarter",
+            "CalendarWeek",
+            "ContractQuarter",
+            "CalendarYear",
+        ]
+        | None,
+        Field(alias="applicationCycle"),
+    ] = None
+    application_limit: Annotated[float | None, Field(alias="applicationLimit")] = None
+    application_units: Annotated[Literal["Amount", "Hours", "Incidents"] | None, Field(alias="applicationUnits")] = None
+    application_unlimited_flag: Annotated[bool | None, Field(alias="applicationUnlimitedFlag")] = None
+    auto_invoice_flag: Annotated[bool | None, Field(alias="autoInvoiceFlag")] = None
+    bill_amount: Annotated[float | None, Field(alias="billAmount")] = None
+    bill_expenses: Annotated[Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"], Field(alias="billExpenses")]
+    bill_one_time_flag: Annotated[bool | None, Field(alias="billOneTimeFlag")] = None
+    bill_products: Annotated[Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"], Field(alias="billProducts")]
+    bill_time: Annotated[Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"], Field(alias="billTime")]
+    billable_expense_invoice_flag: Annotated[bool | None, Field(alias="billableExpenseInvoiceFlag")] = None
+    billable_product_invoice_flag: Annotated[bool | None, Field(alias="billableProductInvoiceFlag")] = None
+    billable_time_invoice_flag: Annotated[bool | None, Field(alias="billableTimeInvoiceFlag")] = None
+    billing_cycle: Annotated[BillingCycleReference | None, Field(alias="billingCycle")] = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    bottom_comment_flag: Annotated[bool | None, Field(alias="bottomCommentFlag")] = None
+    carry_over_unused_flag: Annotated[bool | None, Field(alias="carryOverUnusedFlag")] = None
+    charge_to_firm_flag: Annotated[bool | None, Field(alias="chargeToFirmFlag")] = None
+    comp_hourly_rate: Annotated[float | None, Field(alias="compHourlyRate")] = None
+    comp_limit_amount: Annotated[float | None, Field(alias="compLimitAmount")] = None
+    copy_work_roles_flag: Annotated[bool | None, Field(alias="copyWorkRolesFlag")] = None
+    copy_work_types_flag: Annotated[bool | None, Field(alias="copyWorkTypesFlag")] = None
+    cover_agreement_expense_flag: Annotated[bool | None, Field(alias="coverAgreementExpenseFlag")] = None
+    cover_agreement_product_flag: Annotated[bool | None, Field(alias="coverAgreementProductFlag")] = None
+    cover_agreement_time_flag: Annotated[bool | None, Field(alias="coverAgreementTimeFlag")] = None
+    cover_sales_tax_flag: Annotated[bool | None, Field(alias="coverSalesTaxFlag")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    department: SystemDepartmentReference | None = None
+    email_template: Annotated[EmailTemplateReference | None, Field(alias="emailTemplate")] = None
+    employee_comp_not_exceed: Annotated[Literal["Billing", "Amount", "Percent"], Field(alias="employeeCompNotExceed")]
+    employee_comp_rate: Annotated[Literal["Actual", "Hourly"], Field(alias="employeeCompRate")]
+    exclusion_work_role_ids: Annotated[list[int] | None, Field(alias="exclusionWorkRoleIds")] = None
+    exclusion_work_type_ids: Annotated[list[int] | None, Field(alias="exclusionWorkTypeIds")] = None
+    expire_when_zero: Annotated[bool | None, Field(alias="expireWhenZero")] = None
+    expired_days: Annotated[int | None, Field(alias="expiredDays")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    integration_x_ref: Annotated[str | None, Field(alias="integrationXRef")] = None
+    """
+     Max length: 50;
+    """
+    invoice_description: Annotated[str | None, Field(alias="invoiceDescription")] = None
+    """
+     Max length: 4000;
+    """
+    invoice_pre_suffix: Annotated[str | None, Field(alias="invoicePreSuffix")] = None
+    """
+     Max length: 5;
+    """
+    invoice_template: Annotated[InvoiceTemplateReference | None, Field(alias="invoiceTemplate")] = None
+    invoicing_cycle: Annotated[Literal["ContractYear", "CalendarYear"], Field(alias="invoicingCycle")]
+    limit: int | None = None
+    location: SystemLocationReference | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    one_time_flag: Annotated[bool | None, Field(alias="oneTimeFlag")] = None
+    pre_payment_flag: Annotated[bool | None, Field(alias="prePaymentFlag")] = None
+    prefix_suffix_option: Annotated[Literal["Prefix", "Suffix"] | None, Field(alias="prefixSuffixOption")] = None
+    project_type: Annotated[ProjectTypeReference | None, Field(alias="projectType")] = None
+    prorate_flag: Annotated[bool | None, Field(alias="prorateFlag")] = None
+    remove_all_work_role_exclusions: Annotated[bool | None, Field(alias="removeAllWorkRoleExclusions")] = None
+    remove_all_work_type_exclusions: Annotated[bool | None, Field(alias="removeAllWorkTypeExclusions")] = None
+    restrict_department_flag: Annotated[bool | None, Field(alias="restrictDepartmentFlag")] = None
+    restrict_down_payment_flag: Annotated[bool | None, Field(alias="restrictDownPaymentFlag")] = None
+    restrict_location_flag: Annotated[bool | None, Field(alias="restrictLocationFlag")] = None
+    sla: SLAReference | None = None
+    taxable_flag: Annotated[bool | None, Field(alias="taxableFlag")] = None
+    top_comment_flag: Annotated[bool | None, Field(alias="topCommentFlag")] = None
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+    work_type: Annotated[WorkTypeReference | None, Field(alias="workType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_cycle_reference import BillingCycleReference
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.email_template_reference import EmailTemplateReference
+from pyconnectwise.models.manage.invoice_template_reference import InvoiceTemplateReference
+from pyconnectwise.models.manage.project_type_reference import ProjectTypeReference
+from pyconnectwise.models.manage.sla_reference import SLAReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
+from pyconnectwise.models.manage.work_type_reference import WorkTypeReference
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementTypeBoardDefault(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    board: BoardReference | None = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    department: SystemDepartmentReference | None = None
+    id: int | None = None
+    location: SystemLocationReference
+    service_type: Annotated[ServiceTypeReference | None, Field(alias="serviceType")] = None
+    type: AgreementTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_type_reference import AgreementTypeReference
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.service_type_reference import ServiceTypeReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
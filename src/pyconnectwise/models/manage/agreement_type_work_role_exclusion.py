@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementTypeWorkRoleExclusion(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    type: AgreementTypeReference | None = None
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_type_reference import AgreementTypeReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.manage.agreement_type_work_role_exclusion import AgreementTypeWorkRoleExclusion
+
+
+class AgreementTypeWorkRoleInfo(AgreementTypeWorkRoleExclusion):
+    pass
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_type_reference import AgreementTypeReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementTypeWorkType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    bill_time: Annotated[Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"], Field(alias="billTime")]
+    effective_date: Annotated[datetime | None, Field(alias="effectiveDate")] = None
+    ending_date: Annotated[datetime | None, Field(alias="endingDate")] = None
+    hours_max: Annotated[float | None, Field(alias="hoursMax")] = None
+    hours_min: Annotated[float | None, Field(alias="hoursMin")] = None
+    id: int | None = None
+    limit_to: Annotated[float | None, Field(alias="limitTo")] = None
+    overage_rate: Annotated[float | None, Field(alias="overageRate")] = None
+    overage_rate_type: Annotated[Literal["AdjAmount", "Custom", "Multiplier"], Field(alias="overageRateType")]
+    rate: float | None = None
+    rate_type: Annotated[Literal["AdjAmount", "Custom", "Multiplier"], Field(alias="rateType")]
+    round_bill_hours: Annotated[float | None, Field(alias="roundBillHours")] = None
+    type: AgreementTypeReference | None = None
+    work_type: Annotated[WorkTypeReference | None, Field(alias="workType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_type_reference import AgreementTypeReference
+from pyconnectwise.models.manage.work_type_reference import WorkTypeReference
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementWorkRole(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_id: Annotated[int | None, Field(alias="agreementId")] = None
+    effective_date: Annotated[datetime | None, Field(alias="effectiveDate")] = None
+    ending_date: Annotated[datetime | None, Field(alias="endingDate")] = None
+    id: int | None = None
+    limit_to: Annotated[float | None, Field(alias="limitTo")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    rate: float | None = None
+    rate_type: Annotated[Literal["AdjAmount", "Custom", "Multiplier"], Field(alias="rateType")]
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
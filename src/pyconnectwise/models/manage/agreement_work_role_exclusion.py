@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AgreementWorkRoleExclusion(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_id: Annotated[int | None, Field(alias="agreementId")] = None
+    id: int | None = None
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
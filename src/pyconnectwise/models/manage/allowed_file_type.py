@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AllowedFileType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    file_type: Annotated[str, Field(alias="fileType")]
+    id: int | None = None
+    size_limit: Annotated[int | None, Field(alias="sizeLimit")] = None
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AllowedOrigin(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    description: str
+    """
+     Max length: 2000;
+    """
+    id: int | None = None
+    last_update_utc: Annotated[datetime | None, Field(alias="lastUpdateUtc")] = None
+    origin: str
+    """
+     Max length: 2000;
+    """
+    updated_by: Annotated[str | None, Field(alias="updatedBy")] = None
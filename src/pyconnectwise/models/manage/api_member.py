@@ -0,0 +1,51 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ApiMember(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    block_cost_flag: Annotated[bool | None, Field(alias="blockCostFlag")] = None
+    block_price_flag: Annotated[bool | None, Field(alias="blockPriceFlag")] = None
+    default_department: Annotated[SystemDepartmentReference | None, Field(alias="defaultDepartment")] = None
+    default_location: Annotated[SystemLocationReference | None, Field(alias="defaultLocation")] = None
+    email_address: Annotated[str | None, Field(alias="emailAddress")] = None
+    """
+     Max length: 250;
+    """
+    excluded_service_board_ids: Annotated[list[int] | None, Field(alias="excludedServiceBoardIds")] = None
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 15;
+    """
+    inactive_date: Annotated[datetime | None, Field(alias="inactiveDate")] = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    name: str | None = None
+    """
+     Max length: 30; Required On Updates;
+    """
+    notes: str | None = None
+    sales_default_location: Annotated[SystemLocationReference | None, Field(alias="salesDefaultLocation")] = None
+    security_location: Annotated[SystemLocationReference | None, Field(alias="securityLocation")] = None
+    security_role: Annotated[SecurityRoleReference | None, Field(alias="securityRole")] = None
+    service_default_board: Annotated[BoardReference | None, Field(alias="serviceDefaultBoard")] = None
+    structure_level: Annotated[StructureReference | None, Field(alias="structureLevel")] = None
+    time_zone: Annotated[TimeZoneSetupReference | None, Field(alias="timeZone")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.security_role_reference import SecurityRoleReference
+from pyconnectwise.models.manage.structure_reference import StructureReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.time_zone_setup_reference import TimeZoneSetupReference
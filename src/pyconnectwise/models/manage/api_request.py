@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Any
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ApiRequest(ConnectWiseModel):
+    entity: IRestIdentifiedItem | None = None
+    external_id: Annotated[str | None, Field(alias="externalId")] = None
+    fields: str | None = None
+    filters: FilterValues | None = None
+    format: str | None = None
+    grand_parent_id: Annotated[int | None, Field(alias="grandParentId")] = None
+    id: int | None = None
+    member_context: Annotated[str | None, Field(alias="memberContext")] = None
+    misc_properties: Annotated[dict[str, dict[str, Any]] | None, Field(alias="miscProperties")] = None
+    page: PageValues | None = None
+    parent_id: Annotated[int | None, Field(alias="parentId")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.filter_values import FilterValues
+from pyconnectwise.models.manage.i_rest_identified_item import IRestIdentifiedItem
+from pyconnectwise.models.manage.page_values import PageValues
@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AuditTrailEntry(ConnectWiseModel):
+    audit_source: Annotated[str | None, Field(alias="auditSource")] = None
+    audit_sub_type: Annotated[str | None, Field(alias="auditSubType")] = None
+    audit_type: Annotated[str | None, Field(alias="auditType")] = None
+    entered_by: Annotated[str | None, Field(alias="enteredBy")] = None
+    entered_date: Annotated[str | None, Field(alias="enteredDate")] = None
+    text: str | None = None
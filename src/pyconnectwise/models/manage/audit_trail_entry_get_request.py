@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AuditTrailEntryGetRequest(ConnectWiseModel):
+    device_identifier: Annotated[str | None, Field(alias="deviceIdentifier")] = None
+    id: int | None = None
+    type: Literal[
+        "None",
+        "Ticket",
+        "Contact",
+        "Company",
+        "Opportunity",
+        "Time",
+        "Activity",
+        "ProductCatalog",
+        "ProjectTicket",
+        "Purchasing",
+        "Configuration",
+        "Schedule",
+        "Agreement",
+        "AgreementAddition",
+        "Project",
+        "Invoice",
+        "PurchaseOrder",
+        "Expense",
+    ] | None = None
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AuthAnvil(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    server_location_url: Annotated[str, Field(alias="serverLocationUrl")]
+    site_id: Annotated[int, Field(alias="siteId")]
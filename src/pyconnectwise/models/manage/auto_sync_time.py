@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class AutoSyncTime(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    sync_time: Annotated[str, Field(alias="syncTime")]
+    time_zone: Annotated[TimeZoneSetupReference | None, Field(alias="timeZone")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.time_zone_setup_reference import TimeZoneSetupReference
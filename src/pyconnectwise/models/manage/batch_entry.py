@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BatchEntry(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    account_type: Annotated[str | None, Field(alias="accountType")] = None
+    adjustment_detail: Annotated[AdjustmentDetailReference | None, Field(alias="adjustmentDetail")] = None
+    cost: float | None = None
+    cost_of_goods_sold_account_number: Annotated[str | None, Field(alias="costOfGoodsSoldAccountNumber")] = None
+    credit: float | None = None
+    debit: float | None = None
+    expense: ExpenseDetailReference | None = None
+    id: int | None = None
+    invoice: InvoiceReference | None = None
+    item: str | None = None
+    line_item: Annotated[PurchaseOrderLineItemReference | None, Field(alias="lineItem")] = None
+    name: str | None = None
+    purchase_order: Annotated[PurchaseOrderReference | None, Field(alias="purchaseOrder")] = None
+    sales_code: Annotated[str | None, Field(alias="salesCode")] = None
+    transfer: str | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.adjustment_detail_reference import AdjustmentDetailReference
+from pyconnectwise.models.manage.expense_detail_reference import ExpenseDetailReference
+from pyconnectwise.models.manage.invoice_reference import InvoiceReference
+from pyconnectwise.models.manage.purchase_order_line_item_reference import PurchaseOrderLineItemReference
+from pyconnectwise.models.manage.purchase_order_reference import PurchaseOrderReference
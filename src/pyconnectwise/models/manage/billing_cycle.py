@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BillingCycle(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    billing_options: Annotated[
+        Literal["BiMonthly", "BiWeekly", "Monthly", "NotRecurring", "Quarterly", "SemiAnnual", "Weekly", "Yearly"],
+        Field(alias="billingOptions"),
+    ]
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 5;
+    """
+    name: str
+    """
+     Max length: 50;
+    """
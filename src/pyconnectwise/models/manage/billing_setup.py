@@ -0,0 +1,131 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BillingSetup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    address_one: Annotated[str | None, Field(alias="addressOne")] = None
+    """
+     Max length: 50;
+    """
+    address_two: Annotated[str | None, Field(alias="addressTwo")] = None
+    """
+     Max length: 50;
+    """
+    agreement_invoice: Annotated[InvoiceTemplateReference | None, Field(alias="agreementInvoice")] = None
+    allow_restricted_dept_on_routing_flag: Annotated[
+        bool | None, Field(alias="allowRestrictedDeptOnRoutingFlag")
+    ] = None
+    bill_product_after_ship_flag: Annotated[bool | None, Field(alias="billProductAfterShipFlag")] = None
+    bill_project_complete_flag: Annotated[bool | None, Field(alias="billProjectCompleteFlag")] = None
+    bill_project_unapproved_flag: Annotated[bool | None, Field(alias="billProjectUnapprovedFlag")] = None
+    bill_sales_order_complete_flag: Annotated[bool | None, Field(alias="billSalesOrderCompleteFlag")] = None
+    bill_ticket_complete_flag: Annotated[bool | None, Field(alias="billTicketCompleteFlag")] = None
+    bill_ticket_separately_flag: Annotated[bool | None, Field(alias="billTicketSeparatelyFlag")] = None
+    bill_ticket_unapproved_flag: Annotated[bool | None, Field(alias="billTicketUnapprovedFlag")] = None
+    business_number: Annotated[str | None, Field(alias="businessNumber")] = None
+    """
+     Max length: 50;
+    """
+    charge_adj_to_firm_flag: Annotated[bool | None, Field(alias="chargeAdjToFirmFlag")] = None
+    city: str | None = None
+    """
+     Max length: 50;
+    """
+    company_code: Annotated[str | None, Field(alias="companyCode")] = None
+    """
+     Max length: 250;
+    """
+    copy_agreement_products_flag: Annotated[bool | None, Field(alias="copyAgreementProductsFlag")] = None
+    copy_non_service_products_flag: Annotated[bool | None, Field(alias="copyNonServiceProductsFlag")] = None
+    copy_service_products_flag: Annotated[bool | None, Field(alias="copyServiceProductsFlag")] = None
+    country: CountryReference | None = None
+    credit_memo_invoice: Annotated[InvoiceTemplateReference | None, Field(alias="creditMemoInvoice")] = None
+    currency: CurrencyReference | None = None
+    custom_label: Annotated[str | None, Field(alias="customLabel")] = None
+    """
+     Max length: 50;
+    """
+    custom_text: Annotated[str | None, Field(alias="customText")] = None
+    """
+     Max length: 500;
+    """
+    delivery_receipt_flag: Annotated[bool | None, Field(alias="deliveryReceiptFlag")] = None
+    disable_routing_email_flag: Annotated[bool | None, Field(alias="disableRoutingEmailFlag")] = None
+    display_tax_flag: Annotated[bool | None, Field(alias="displayTaxFlag")] = None
+    down_payment_invoice: Annotated[InvoiceTemplateReference | None, Field(alias="downPaymentInvoice")] = None
+    email_template: Annotated[EmailTemplateReference, Field(alias="emailTemplate")]
+    exclude_avalara_flag: Annotated[bool | None, Field(alias="excludeAvalaraFlag")] = None
+    exclude_do_not_bill_expense_flag: Annotated[bool | None, Field(alias="excludeDoNotBillExpenseFlag")] = None
+    exclude_do_not_bill_product_flag: Annotated[bool | None, Field(alias="excludeDoNotBillProductFlag")] = None
+    exclude_do_not_bill_time_flag: Annotated[bool | None, Field(alias="excludeDoNotBillTimeFlag")] = None
+    id: int | None = None
+    invoice_footer: Annotated[str | None, Field(alias="invoiceFooter")] = None
+    """
+     Max length: 500;
+    """
+    invoice_title: Annotated[str, Field(alias="invoiceTitle")]
+    """
+     Max length: 50;
+    """
+    localized_country: Annotated[CountryReference | None, Field(alias="localizedCountry")] = None
+    location: SystemLocationReference
+    misc_invoice: Annotated[InvoiceTemplateReference | None, Field(alias="miscInvoice")] = None
+    no_watermark_flag: Annotated[bool | None, Field(alias="noWatermarkFlag")] = None
+    overall_invoice_default: Annotated[InvoiceTemplateReference | None, Field(alias="overallInvoiceDefault")] = None
+    payable_name: Annotated[str, Field(alias="payableName")]
+    """
+     Max length: 50;
+    """
+    phone: str | None = None
+    """
+     Max length: 15;
+    """
+    prefix_suffix_flag: Annotated[Literal["Prefix", "Suffix"] | None, Field(alias="prefixSuffixFlag")] = None
+    prefix_suffix_text: Annotated[str | None, Field(alias="prefixSuffixText")] = None
+    """
+     Max length: 5;
+    """
+    print_logo_flag: Annotated[bool | None, Field(alias="printLogoFlag")] = None
+    progress_invoice: Annotated[InvoiceTemplateReference | None, Field(alias="progressInvoice")] = None
+    progress_time_flag: Annotated[bool | None, Field(alias="progressTimeFlag")] = None
+    quote_footer: Annotated[str | None, Field(alias="quoteFooter")] = None
+    """
+     Max length: 1000;
+    """
+    read_receipt_flag: Annotated[bool | None, Field(alias="readReceiptFlag")] = None
+    remit_name: Annotated[str, Field(alias="remitName")]
+    """
+     Max length: 50;
+    """
+    restrict_downpayment_flag: Annotated[bool | None, Field(alias="restrictDownpaymentFlag")] = None
+    restrict_project_downpayment_flag: Annotated[bool | None, Field(alias="restrictProjectDownpaymentFlag")] = None
+    sales_order_invoice: Annotated[InvoiceTemplateReference | None, Field(alias="salesOrderInvoice")] = None
+    standard_invoice_actual: Annotated[InvoiceTemplateReference | None, Field(alias="standardInvoiceActual")] = None
+    standard_invoice_fixed: Annotated[InvoiceTemplateReference | None, Field(alias="standardInvoiceFixed")] = None
+    state: StateReference | None = None
+    topcomment: str | None = None
+    """
+     Max length: 4000;
+    """
+    zip: str | None = None
+    """
+     Max length: 12;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.country_reference import CountryReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.email_template_reference import EmailTemplateReference
+from pyconnectwise.models.manage.invoice_template_reference import InvoiceTemplateReference
+from pyconnectwise.models.manage.state_reference import StateReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BillingSetupInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    currency: CurrencyReference | None = None
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    remit_name: Annotated[str | None, Field(alias="remitName")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
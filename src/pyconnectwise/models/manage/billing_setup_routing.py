@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BillingSetupRouting(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    invoice_rule: Annotated[Literal["All", "Standard", "Project", "Agreement"], Field(alias="invoiceRule")]
+    member: MemberReference | None = None
+    routing_rule: Annotated[
+        Literal["Account", "Territory", "Creator", "Department", "Location", "Member", "Project", "Sales"],
+        Field(alias="routingRule"),
+    ]
+    sequence_number: Annotated[int, Field(alias="sequenceNumber")]
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BillingTerm(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    due_days: Annotated[int, Field(alias="dueDays")]
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    terms_xref: Annotated[str | None, Field(alias="termsXref")] = None
+    """
+     Max length: 50;
+    """
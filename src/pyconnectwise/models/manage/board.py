@@ -0,0 +1,145 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Board(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    all_sort: Annotated[Literal["Ascending", "Descending"] | None, Field(alias="allSort")] = None
+    auto_assign_new_ec_tickets_flag: Annotated[bool | None, Field(alias="autoAssignNewECTicketsFlag")] = None
+    auto_assign_new_portal_tickets_flag: Annotated[bool | None, Field(alias="autoAssignNewPortalTicketsFlag")] = None
+    auto_assign_new_tickets_flag: Annotated[bool | None, Field(alias="autoAssignNewTicketsFlag")] = None
+    auto_assign_ticket_owner_flag: Annotated[bool | None, Field(alias="autoAssignTicketOwnerFlag")] = None
+    auto_close_status: Annotated[ServiceStatusReference | None, Field(alias="autoCloseStatus")] = None
+    bill_expense: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billExpense")
+    ] = None
+    bill_product: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billProduct")
+    ] = None
+    bill_ticket_separately_flag: Annotated[bool | None, Field(alias="billTicketSeparatelyFlag")] = None
+    bill_tickets_after_closed_flag: Annotated[bool | None, Field(alias="billTicketsAfterClosedFlag")] = None
+    bill_time: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billTime")
+    ] = None
+    bill_unapproved_time_expense_flag: Annotated[bool | None, Field(alias="billUnapprovedTimeExpenseFlag")] = None
+    board_icon: Annotated[DocumentReference | None, Field(alias="boardIcon")] = None
+    closed_loop_all_flag: Annotated[bool | None, Field(alias="closedLoopAllFlag")] = None
+    closed_loop_discussions_flag: Annotated[bool | None, Field(alias="closedLoopDiscussionsFlag")] = None
+    closed_loop_internal_analysis_flag: Annotated[bool | None, Field(alias="closedLoopInternalAnalysisFlag")] = None
+    closed_loop_resolution_flag: Annotated[bool | None, Field(alias="closedLoopResolutionFlag")] = None
+    contact_template: Annotated[ServiceEmailTemplateReference | None, Field(alias="contactTemplate")] = None
+    department: SystemDepartmentReference | None = None
+    discussions_locked_flag: Annotated[bool | None, Field(alias="discussionsLockedFlag")] = None
+    dispatch_member: Annotated[MemberReference | None, Field(alias="dispatchMember")] = None
+    duty_manager_member: Annotated[MemberReference | None, Field(alias="dutyManagerMember")] = None
+    email_connector_allow_reopen_closed_flag: Annotated[
+        bool | None, Field(alias="emailConnectorAllowReopenClosedFlag")
+    ] = None
+    email_connector_never_reopen_by_days_closed_flag: Annotated[
+        bool | None, Field(alias="emailConnectorNeverReopenByDaysClosedFlag")
+    ] = None
+    """
+    This field can only be set when emailConnectorAllowReopenClosed is true
+    """
+    email_connector_never_reopen_by_days_flag: Annotated[
+        bool | None, Field(alias="emailConnectorNeverReopenByDaysFlag")
+    ] = None
+    """
+    This field can only be set when emailConnectorAllowReopenClosed is true
+    """
+    email_connector_new_ticket_no_match_flag: Annotated[
+        bool | None, Field(alias="emailConnectorNewTicketNoMatchFlag")
+    ] = None
+    """
+    This field can only be set when emailConnectorAllowReopenClosed is true
+    """
+    email_connector_reopen_days_closed_limit: Annotated[
+        int | None, Field(alias="emailConnectorReopenDaysClosedLimit")
+    ] = None
+    """
+    This field can only be set when emailConnectorNeverReopenByDaysClosedFlag and emailConnectorAllowReopenClosed are both true
+                This field is required when emailConnectorNeverReopenByDaysClosedFlag is true
+    """
+    email_connector_reopen_days_limit: Annotated[int | None, Field(alias="emailConnectorReopenDaysLimit")] = None
+    """
+    This field can only be set when emailConnectorNeverReopenByDaysFlag and emailConnectorAllowReopenClosed are both true
+                This field is required when emailConnectorNeverReopenByDaysFlag is true
+    """
+    email_connector_reopen_resources_flag: Annotated[
+        bool | None, Field(alias="emailConnectorReopenResourcesFlag")
+    ] = None
+    """
+    This field can only be set when emailConnectorAllowReopenClosed is true
+    """
+    email_connector_reopen_status: Annotated[
+        ServiceStatusReference | None, Field(alias="emailConnectorReopenStatus")
+    ] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    internal_analysis_sort: Annotated[
+        Literal["Ascending", "Descending"] | None, Field(alias="internalAnalysisSort")
+    ] = None
+    location: SystemLocationReference | None = None
+    mark_first_note_issue_flag: Annotated[bool | None, Field(alias="markFirstNoteIssueFlag")] = None
+    name: str
+    """
+     Max length: 50;
+    """
+    notify_email_from: Annotated[str | None, Field(alias="notifyEmailFrom")] = None
+    """
+     Max length: 50;
+    """
+    notify_email_from_name: Annotated[str | None, Field(alias="notifyEmailFromName")] = None
+    """
+     Max length: 60;
+    """
+    oncall_member: Annotated[MemberReference | None, Field(alias="oncallMember")] = None
+    override_billing_setup_flag: Annotated[bool | None, Field(alias="overrideBillingSetupFlag")] = None
+    percentage_calculation: Annotated[
+        Literal["ActualHours", "Manual", "ClosedPhases", "ClosedTickets"] | None, Field(alias="percentageCalculation")
+    ] = None
+    problem_sort: Annotated[Literal["Ascending", "Descending"] | None, Field(alias="problemSort")] = None
+    project_flag: Annotated[bool | None, Field(alias="projectFlag")] = None
+    resolution_sort: Annotated[Literal["Ascending", "Descending"] | None, Field(alias="resolutionSort")] = None
+    resource_template: Annotated[ServiceEmailTemplateReference | None, Field(alias="resourceTemplate")] = None
+    restrict_board_by_default_flag: Annotated[bool | None, Field(alias="restrictBoardByDefaultFlag")] = None
+    send_to_cc_flag: Annotated[bool | None, Field(alias="sendToCCFlag")] = None
+    send_to_contact_flag: Annotated[bool | None, Field(alias="sendToContactFlag")] = None
+    send_to_resource_flag: Annotated[bool | None, Field(alias="sendToResourceFlag")] = None
+    service_manager_member: Annotated[MemberReference | None, Field(alias="serviceManagerMember")] = None
+    show_dependencies_flag: Annotated[bool | None, Field(alias="showDependenciesFlag")] = None
+    """
+    This field only shows if it is Project Board.
+    """
+    show_estimates_flag: Annotated[bool | None, Field(alias="showEstimatesFlag")] = None
+    """
+    This field only shows if it is Project Board.
+    """
+    sign_off_template: Annotated[ServiceSignoffReference | None, Field(alias="signOffTemplate")] = None
+    time_entry_discussion_flag: Annotated[bool | None, Field(alias="timeEntryDiscussionFlag")] = None
+    time_entry_internal_analysis_flag: Annotated[bool | None, Field(alias="timeEntryInternalAnalysisFlag")] = None
+    time_entry_locked_flag: Annotated[bool | None, Field(alias="timeEntryLockedFlag")] = None
+    time_entry_resolution_flag: Annotated[bool | None, Field(alias="timeEntryResolutionFlag")] = None
+    use_member_display_name_flag: Annotated[bool | None, Field(alias="useMemberDisplayNameFlag")] = None
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+    work_type: Annotated[WorkTypeReference | None, Field(alias="workType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.document_reference import DocumentReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.service_email_template_reference import ServiceEmailTemplateReference
+from pyconnectwise.models.manage.service_signoff_reference import ServiceSignoffReference
+from pyconnectwise.models.manage.service_status_reference import ServiceStatusReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
+from pyconnectwise.models.manage.work_type_reference import WorkTypeReference
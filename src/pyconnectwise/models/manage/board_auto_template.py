@@ -0,0 +1,55 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardAutoTemplate(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    auto_apply_flag: Annotated[bool | None, Field(alias="autoApplyFlag")] = None
+    board: BoardReference | None = None
+    budget_hours_setting: Annotated[
+        Literal["Append", "Overwrite", "Ignore"] | None, Field(alias="budgetHoursSetting")
+    ] = None
+    discussion_setting: Annotated[
+        Literal["Append", "Overwrite", "Ignore"] | None, Field(alias="discussionSetting")
+    ] = None
+    documents_setting: Annotated[
+        Literal["Append", "Overwrite", "Ignore"] | None, Field(alias="documentsSetting")
+    ] = None
+    finance_information_setting: Annotated[
+        Literal["Append", "Overwrite", "Ignore"] | None, Field(alias="financeInformationSetting")
+    ] = None
+    id: int | None = None
+    internal_analysis_setting: Annotated[
+        Literal["Append", "Overwrite", "Ignore"] | None, Field(alias="internalAnalysisSetting")
+    ] = None
+    item: ServiceItemReference | None = None
+    resolution_setting: Annotated[
+        Literal["Append", "Overwrite", "Ignore"] | None, Field(alias="resolutionSetting")
+    ] = None
+    resources_setting: Annotated[
+        Literal["Append", "Overwrite", "Ignore"] | None, Field(alias="resourcesSetting")
+    ] = None
+    send_notes_as_email_setting: Annotated[
+        Literal["Append", "Overwrite", "Ignore"] | None, Field(alias="sendNotesAsEmailSetting")
+    ] = None
+    service_template: Annotated[ServiceTemplateReference | None, Field(alias="serviceTemplate")] = None
+    subtype: ServiceSubTypeReference | None = None
+    summary_setting: Annotated[Literal["Append", "Overwrite", "Ignore"] | None, Field(alias="summarySetting")] = None
+    tasks_setting: Annotated[Literal["Append", "Overwrite", "Ignore"] | None, Field(alias="tasksSetting")] = None
+    type: ServiceTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.service_item_reference import ServiceItemReference
+from pyconnectwise.models.manage.service_sub_type_reference import ServiceSubTypeReference
+from pyconnectwise.models.manage.service_template_reference import ServiceTemplateReference
+from pyconnectwise.models.manage.service_type_reference import ServiceTypeReference
@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    all_sort: Annotated[Literal["Ascending", "Descending"] | None, Field(alias="allSort")] = None
+    closed_loop_all_flag: Annotated[bool | None, Field(alias="closedLoopAllFlag")] = None
+    closed_loop_discussions_flag: Annotated[bool | None, Field(alias="closedLoopDiscussionsFlag")] = None
+    closed_loop_internal_analysis_flag: Annotated[bool | None, Field(alias="closedLoopInternalAnalysisFlag")] = None
+    closed_loop_resolution_flag: Annotated[bool | None, Field(alias="closedLoopResolutionFlag")] = None
+    department: SystemDepartmentReference | None = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    internal_analysis_sort: Annotated[
+        Literal["Ascending", "Descending"] | None, Field(alias="internalAnalysisSort")
+    ] = None
+    location: SystemLocationReference | None = None
+    name: str | None = None
+    problem_sort: Annotated[Literal["Ascending", "Descending"] | None, Field(alias="problemSort")] = None
+    project_flag: Annotated[bool | None, Field(alias="projectFlag")] = None
+    resolution_sort: Annotated[Literal["Ascending", "Descending"] | None, Field(alias="resolutionSort")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardItemAssociation(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_all_sub_types_flag: Annotated[bool | None, Field(alias="addAllSubTypesFlag")] = None
+    board: BoardReference | None = None
+    id: int
+    item: ServiceItemReference | None = None
+    remove_all_sub_types_flag: Annotated[bool | None, Field(alias="removeAllSubTypesFlag")] = None
+    sub_type_association_ids: Annotated[list[int] | None, Field(alias="subTypeAssociationIds")] = None
+    """
+    If addAllSubTypesFlag and removeAllSubTypesFlag are both false, this field is required.
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.service_item_reference import ServiceItemReference
@@ -0,0 +1,47 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardStatus(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    board: BoardReference | None = None
+    closed_status: Annotated[bool | None, Field(alias="closedStatus")] = None
+    custom_status_indicator_name: Annotated[str | None, Field(alias="customStatusIndicatorName")] = None
+    """
+     Max length: 30;
+    """
+    customer_portal_description: Annotated[str | None, Field(alias="customerPortalDescription")] = None
+    """
+     Max length: 500;
+    """
+    customer_portal_flag: Annotated[bool | None, Field(alias="customerPortalFlag")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    display_on_board: Annotated[bool | None, Field(alias="displayOnBoard")] = None
+    email_template: Annotated[ServiceEmailTemplateReference | None, Field(alias="emailTemplate")] = None
+    escalation_status: Annotated[
+        Literal["NotResponded", "Responded", "ResolutionPlan", "Resolved", "NoEscalation"] | None,
+        Field(alias="escalationStatus"),
+    ] = None
+    id: int | None = None
+    inactive: bool | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    sort_order: Annotated[int | None, Field(alias="sortOrder")] = None
+    status_indicator: Annotated[StatusIndicatorReference | None, Field(alias="statusIndicator")] = None
+    time_entry_not_allowed: Annotated[bool | None, Field(alias="timeEntryNotAllowed")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.service_email_template_reference import ServiceEmailTemplateReference
+from pyconnectwise.models.manage.status_indicator_reference import StatusIndicatorReference
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardStatusNotification(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    email: str | None = None
+    """
+    Service Status Notification email must be entered if the notify type is "Email Address" Max length: 255;
+    """
+    id: int | None = None
+    member: MemberReference | None = None
+    notify_who: Annotated[NotificationRecipientReference | None, Field(alias="notifyWho")] = None
+    status: ServiceStatusReference | None = None
+    workflow_step: Annotated[int | None, Field(alias="workflowStep")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.notification_recipient_reference import NotificationRecipientReference
+from pyconnectwise.models.manage.service_status_reference import ServiceStatusReference
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardSubType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_all_types_flag: Annotated[bool | None, Field(alias="addAllTypesFlag")] = None
+    board: BoardReference | None = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    name: str
+    """
+     Max length: 50;
+    """
+    remove_all_types_flag: Annotated[bool | None, Field(alias="removeAllTypesFlag")] = None
+    type_association_ids: Annotated[list[int] | None, Field(alias="typeAssociationIds")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardTeam(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    board_id: Annotated[int | None, Field(alias="boardId")] = None
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    id: int | None = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    members: list[int] | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    notify_on_ticket_delete: Annotated[bool | None, Field(alias="notifyOnTicketDelete")] = None
+    team_leader: Annotated[MemberReference | None, Field(alias="teamLeader")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    board: BoardReference | None = None
+    category: Literal["Reactive", "Proactive"] | None = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    department: SystemDepartmentReference | None = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    integration_xref: Annotated[str | None, Field(alias="integrationXref")] = None
+    """
+     Max length: 50;
+    """
+    location: SystemLocationReference | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    request_for_change_flag: Annotated[bool | None, Field(alias="requestForChangeFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BoardTypeSubTypeItemAssociation(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    board: BoardReference | None = None
+    id: int | None = None
+    item: ServiceItemReference | None = None
+    sub_type: Annotated[ServiceSubTypeReference | None, Field(alias="subType")] = None
+    type: ServiceTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.service_item_reference import ServiceItemReference
+from pyconnectwise.models.manage.service_sub_type_reference import ServiceSubTypeReference
+from pyconnectwise.models.manage.service_type_reference import ServiceTypeReference
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BundleRequest(ConnectWiseModel):
+    api_request: Annotated[ApiRequest | None, Field(alias="apiRequest")] = None
+    resource_type: Annotated[str | None, Field(alias="resourceType")] = None
+    sequence_number: Annotated[int | None, Field(alias="sequenceNumber")] = None
+    version: str | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.api_request import ApiRequest
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BundleRequestsCollection(ConnectWiseModel):
+    requests: list[BundleRequest]
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.bundle_request import BundleRequest
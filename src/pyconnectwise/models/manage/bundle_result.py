@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class BundleResult(ConnectWiseModel):
+    count: int | None = None
+    entities: list[IRestIdentifiedItem] | None = None
+    error: ErrorResponseMessage | None = None
+    resource_type: Annotated[str | None, Field(alias="resourceType")] = None
+    sequence_number: Annotated[int | None, Field(alias="sequenceNumber")] = None
+    status_code: Annotated[int | None, Field(alias="statusCode")] = None
+    success: bool | None = None
+    version: str | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.error_response_message import ErrorResponseMessage
+from pyconnectwise.models.manage.i_rest_identified_item import IRestIdentifiedItem
@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Calendar(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    friday_end_time: Annotated[str | None, Field(alias="fridayEndTime")] = None
+    friday_start_time: Annotated[str | None, Field(alias="fridayStartTime")] = None
+    holiday_list: Annotated[HolidayListReference | None, Field(alias="holidayList")] = None
+    id: int | None = None
+    monday_end_time: Annotated[str | None, Field(alias="mondayEndTime")] = None
+    monday_start_time: Annotated[str | None, Field(alias="mondayStartTime")] = None
+    name: str
+    saturday_end_time: Annotated[str | None, Field(alias="saturdayEndTime")] = None
+    saturday_start_time: Annotated[str | None, Field(alias="saturdayStartTime")] = None
+    sunday_end_time: Annotated[str | None, Field(alias="sundayEndTime")] = None
+    sunday_start_time: Annotated[str | None, Field(alias="sundayStartTime")] = None
+    thursday_end_time: Annotated[str | None, Field(alias="thursdayEndTime")] = None
+    thursday_start_time: Annotated[str | None, Field(alias="thursdayStartTime")] = None
+    tuesday_end_time: Annotated[str | None, Field(alias="tuesdayEndTime")] = None
+    tuesday_start_time: Annotated[str | None, Field(alias="tuesdayStartTime")] = None
+    wednesday_end_time: Annotated[str | None, Field(alias="wednesdayEndTime")] = None
+    wednesday_start_time: Annotated[str | None, Field(alias="wednesdayStartTime")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.holiday_list_reference import HolidayListReference
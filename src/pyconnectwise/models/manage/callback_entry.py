@@ -0,0 +1,40 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CallbackEntry(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    description: str | None = None
+    """
+     Max length: 100;
+    """
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    is_self_suppressed_flag: Annotated[bool | None, Field(alias="isSelfSuppressedFlag")] = None
+    is_soap_callback_flag: Annotated[bool | None, Field(alias="isSoapCallbackFlag")] = None
+    level: str | None = None
+    """
+     Required Reference
+    """
+    member_id: Annotated[int | None, Field(alias="memberId")] = None
+    object_id: Annotated[int | None, Field(alias="objectId")] = None
+    """
+     Required Reference
+    """
+    payload_version: Annotated[str | None, Field(alias="payloadVersion")] = None
+    type: str | None = None
+    """
+     Required Reference
+    """
+    url: str | None = None
+    """
+     Required Reference
+    """
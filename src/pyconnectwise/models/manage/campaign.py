@@ -0,0 +1,51 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Campaign(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    actual_cost: Annotated[float | None, Field(alias="actualCost")] = None
+    actual_gross_margin: Annotated[float | None, Field(alias="actualGrossMargin")] = None
+    actual_roi: Annotated[float | None, Field(alias="actualROI")] = None
+    actual_revenue: Annotated[float | None, Field(alias="actualRevenue")] = None
+    budget_cost: Annotated[float | None, Field(alias="budgetCost")] = None
+    budget_gross_margin: Annotated[float | None, Field(alias="budgetGrossMargin")] = None
+    budget_roi: Annotated[float | None, Field(alias="budgetROI")] = None
+    budget_revenue: Annotated[float | None, Field(alias="budgetRevenue")] = None
+    default_group: Annotated[GroupReference | None, Field(alias="defaultGroup")] = None
+    emails_sent: Annotated[int | None, Field(alias="emailsSent")] = None
+    end_date: Annotated[datetime | None, Field(alias="endDate")] = None
+    id: int | None = None
+    impressions: int | None = None
+    inactive: bool | None = None
+    inactive_days_after_end: Annotated[int | None, Field(alias="inactiveDaysAfterEnd")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    marketing_manager_default_track_id: Annotated[int | None, Field(alias="marketingManagerDefaultTrackId")] = None
+    member: MemberReference | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    notes: str | None = None
+    opportunity_default_track_id: Annotated[int | None, Field(alias="opportunityDefaultTrackId")] = None
+    start_date: Annotated[datetime, Field(alias="startDate")]
+    status: CampaignStatusReference | None = None
+    sub_type: Annotated[CampaignSubTypeReference | None, Field(alias="subType")] = None
+    type: CampaignTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.campaign_status_reference import CampaignStatusReference
+from pyconnectwise.models.manage.campaign_sub_type_reference import CampaignSubTypeReference
+from pyconnectwise.models.manage.campaign_type_reference import CampaignTypeReference
+from pyconnectwise.models.manage.group_reference import GroupReference
+from pyconnectwise.models.manage.member_reference import MemberReference
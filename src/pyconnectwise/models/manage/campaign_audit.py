@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CampaignAudit(ConnectWiseModel):
+    campaign_id: Annotated[int | None, Field(alias="campaignId")] = None
+    created_by: Annotated[str | None, Field(alias="createdBy")] = None
+    date_created: Annotated[datetime | None, Field(alias="dateCreated")] = None
+    documents_created: Annotated[int | None, Field(alias="documentsCreated")] = None
+    email_subject: Annotated[str | None, Field(alias="emailSubject")] = None
+    """
+     Max length: 1000;
+    """
+    emails_sent: Annotated[int, Field(alias="emailsSent")]
+    emails_unsent: Annotated[int | None, Field(alias="emailsUnsent")] = None
+    group: GroupReference | None = None
+    id: int | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.group_reference import GroupReference
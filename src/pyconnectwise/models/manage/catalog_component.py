@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CatalogComponent(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    catalog_item: Annotated[CatalogItemReference | None, Field(alias="catalogItem")] = None
+    cost: float | None = None
+    hide_description_flag: Annotated[bool | None, Field(alias="hideDescriptionFlag")] = None
+    hide_extended_price_flag: Annotated[bool | None, Field(alias="hideExtendedPriceFlag")] = None
+    hide_item_identifier_flag: Annotated[bool | None, Field(alias="hideItemIdentifierFlag")] = None
+    hide_price_flag: Annotated[bool | None, Field(alias="hidePriceFlag")] = None
+    hide_quantity_flag: Annotated[bool | None, Field(alias="hideQuantityFlag")] = None
+    id: int | None = None
+    parent_catalog_item: Annotated[CatalogItemReference | None, Field(alias="parentCatalogItem")] = None
+    price: float | None = None
+    quantity: float
+    sequence_number: Annotated[int | None, Field(alias="sequenceNumber")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.catalog_item_reference import CatalogItemReference
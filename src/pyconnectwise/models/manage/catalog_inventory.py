@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CatalogInventory(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    catalog_item: Annotated[CatalogItemReference | None, Field(alias="catalogItem")] = None
+    id: int | None = None
+    on_hand: Annotated[int | None, Field(alias="onHand")] = None
+    serial_numbers: Annotated[list[OnHandSerialNumberReference] | None, Field(alias="serialNumbers")] = None
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: Annotated[WarehouseBinReference | None, Field(alias="warehouseBin")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.catalog_item_reference import CatalogItemReference
+from pyconnectwise.models.manage.on_hand_serial_number_reference import OnHandSerialNumberReference
+from pyconnectwise.models.manage.warehouse_bin_reference import WarehouseBinReference
+from pyconnectwise.models.manage.warehouse_reference import WarehouseReference
@@ -0,0 +1,98 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CatalogItem(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    billable_option: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billableOption")
+    ] = None
+    calculated_cost: Annotated[float | None, Field(alias="calculatedCost")] = None
+    calculated_cost_flag: Annotated[bool | None, Field(alias="calculatedCostFlag")] = None
+    calculated_price: Annotated[float | None, Field(alias="calculatedPrice")] = None
+    calculated_price_flag: Annotated[bool | None, Field(alias="calculatedPriceFlag")] = None
+    category: ProductCategoryReference | None = None
+    cost: float | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    customer_description: Annotated[str, Field(alias="customerDescription")]
+    """
+     Max length: 6000;
+    """
+    date_entered: Annotated[datetime | None, Field(alias="dateEntered")] = None
+    description: str
+    """
+     Max length: 60;
+    """
+    drop_ship_flag: Annotated[bool | None, Field(alias="dropShipFlag")] = None
+    entity_type: Annotated[EntityTypeReference | None, Field(alias="entityType")] = None
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 60;
+    """
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    integration_x_ref: Annotated[str | None, Field(alias="integrationXRef")] = None
+    """
+     Max length: 50;
+    """
+    manufacturer: ManufacturerReference | None = None
+    manufacturer_part_number: Annotated[str | None, Field(alias="manufacturerPartNumber")] = None
+    """
+     Max length: 50;
+    """
+    min_stock_level: Annotated[int | None, Field(alias="minStockLevel")] = None
+    notes: str | None = None
+    phase_product_flag: Annotated[bool | None, Field(alias="phaseProductFlag")] = None
+    price: float | None = None
+    price_attribute: Annotated[
+        Literal["FixedFee", "NotToExceed", "OverrideRate", "TimeAndMaterials"] | None, Field(alias="priceAttribute")
+    ] = None
+    product_class: Annotated[
+        Literal["Agreement", "Bundle", "Inventory", "NonInventory", "Service"] | None, Field(alias="productClass")
+    ] = None
+    """
+    Defaults to Non-Inventory
+    """
+    recurring_bill_cycle: Annotated[BillingCycleReference | None, Field(alias="recurringBillCycle")] = None
+    recurring_cost: Annotated[float | None, Field(alias="recurringCost")] = None
+    recurring_cycle_type: Annotated[
+        Literal["ContractYear", "CalendarYear"] | None, Field(alias="recurringCycleType")
+    ] = None
+    recurring_flag: Annotated[bool | None, Field(alias="recurringFlag")] = None
+    recurring_one_time_flag: Annotated[bool | None, Field(alias="recurringOneTimeFlag")] = None
+    recurring_revenue: Annotated[float | None, Field(alias="recurringRevenue")] = None
+    serialized_cost_flag: Annotated[bool | None, Field(alias="serializedCostFlag")] = None
+    serialized_flag: Annotated[bool | None, Field(alias="serializedFlag")] = None
+    sla: SLAReference | None = None
+    special_order_flag: Annotated[bool | None, Field(alias="specialOrderFlag")] = None
+    subcategory: ProductSubCategoryReference | None = None
+    taxable_flag: Annotated[bool | None, Field(alias="taxableFlag")] = None
+    type: ProductTypeReference | None = None
+    unit_of_measure: Annotated[UnitOfMeasureReference | None, Field(alias="unitOfMeasure")] = None
+    vendor: CompanyReference | None = None
+    vendor_sku: Annotated[str | None, Field(alias="vendorSku")] = None
+    """
+     Max length: 50;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_cycle_reference import BillingCycleReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.entity_type_reference import EntityTypeReference
+from pyconnectwise.models.manage.manufacturer_reference import ManufacturerReference
+from pyconnectwise.models.manage.product_category_reference import ProductCategoryReference
+from pyconnectwise.models.manage.product_sub_category_reference import ProductSubCategoryReference
+from pyconnectwise.models.manage.product_type_reference import ProductTypeReference
+from pyconnectwise.models.manage.sla_reference import SLAReference
+from pyconnectwise.models.manage.unit_of_measure_reference import UnitOfMeasureReference
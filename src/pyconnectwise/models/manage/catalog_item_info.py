@@ -0,0 +1,33 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CatalogItemInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    billable_option: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billableOption")
+    ] = None
+    cost: float | None = None
+    customer_description: Annotated[str | None, Field(alias="customerDescription")] = None
+    description: str | None = None
+    drop_ship_flag: Annotated[bool | None, Field(alias="dropShipFlag")] = None
+    id: int | None = None
+    identifier: str | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    manufacturer_part_number: Annotated[str | None, Field(alias="manufacturerPartNumber")] = None
+    price: float | None = None
+    product_class: Annotated[
+        Literal["Agreement", "Bundle", "Inventory", "NonInventory", "Service"] | None, Field(alias="productClass")
+    ] = None
+    serialized_cost_flag: Annotated[bool | None, Field(alias="serializedCostFlag")] = None
+    special_order_flag: Annotated[bool | None, Field(alias="specialOrderFlag")] = None
+    taxable_flag: Annotated[bool | None, Field(alias="taxableFlag")] = None
+    vendor_sku: Annotated[str | None, Field(alias="vendorSku")] = None
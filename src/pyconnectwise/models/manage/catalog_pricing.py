@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CatalogPricing(ConnectWiseModel):
+    catalog_item: Annotated[CatalogItemReference | None, Field(alias="catalogItem")] = None
+    company: CompanyReference | None = None
+    date: datetime | None = None
+    location: SystemLocationReference | None = None
+    price: float | None = None
+    quantity: int | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.catalog_item_reference import CatalogItemReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
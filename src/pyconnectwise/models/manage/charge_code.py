@@ -0,0 +1,43 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ChargeCode(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    allow_all_expense_type_flag: Annotated[bool | None, Field(alias="allowAllExpenseTypeFlag")] = None
+    bill_time: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billTime")
+    ] = None
+    company: CompanyReference | None = None
+    department: SystemDepartmentReference | None = None
+    expense_entry_flag: Annotated[bool | None, Field(alias="expenseEntryFlag")] = None
+    expense_type_ids: Annotated[list[int] | None, Field(alias="expenseTypeIds")] = None
+    id: int | None = None
+    integration_xref: Annotated[str | None, Field(alias="integrationXref")] = None
+    """
+     Max length: 50;
+    """
+    location: SystemLocationReference | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    time_entry_flag: Annotated[bool | None, Field(alias="timeEntryFlag")] = None
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+    work_type: Annotated[WorkTypeReference | None, Field(alias="workType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
+from pyconnectwise.models.manage.work_type_reference import WorkTypeReference
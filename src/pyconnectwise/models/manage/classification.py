@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Classification(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    company_flag: Annotated[bool | None, Field(alias="companyFlag")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    employee_flag: Annotated[bool | None, Field(alias="employeeFlag")] = None
+    id: int | None = None
+    multiplier: float | None = None
+    name: str | None = None
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Literal
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ClearPickerRequest(ConnectWiseModel):
+    member: MemberReference | None = None
+    type: Literal["Company", "Vendor"] | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
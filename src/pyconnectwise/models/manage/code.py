@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Code(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    board_id: Annotated[int | None, Field(alias="boardId")] = None
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    description: str
+    id: int | None = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    name: str
+    """
+     Max length: 50;
+    """
@@ -0,0 +1,66 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Commission(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement: AgreementReference | None = None
+    agreement_type: Annotated[AgreementTypeReference | None, Field(alias="agreementType")] = None
+    agreements_flag: Annotated[bool | None, Field(alias="agreementsFlag")] = None
+    billing_method: Annotated[
+        Literal["Agreement", "CreditMemo", "DownPayment", "Miscellaneous", "Progress", "Standard"] | None,
+        Field(alias="billingMethod"),
+    ] = None
+    commission_basis: Annotated[Literal["GrossProfit", "SalesAmount"] | None, Field(alias="commissionBasis")] = None
+    commission_percent: Annotated[float | None, Field(alias="commissionPercent")] = None
+    company: CompanyReference | None = None
+    date_end: Annotated[datetime | None, Field(alias="dateEnd")] = None
+    date_start: Annotated[datetime | None, Field(alias="dateStart")] = None
+    department: SystemDepartmentReference | None = None
+    id: int | None = None
+    invoice_option: Annotated[Literal["AllInvoices", "PaidInvoices"] | None, Field(alias="invoiceOption")] = None
+    item: IvItemReference | None = None
+    location: SystemLocationReference | None = None
+    member: MemberReference | None = None
+    my_opportunities_flag: Annotated[bool | None, Field(alias="myOpportunitiesFlag")] = None
+    number_of_months: Annotated[int | None, Field(alias="numberOfMonths")] = None
+    product_category: Annotated[ProductCategoryReference | None, Field(alias="productCategory")] = None
+    product_sub_category: Annotated[ProductSubCategoryReference | None, Field(alias="productSubCategory")] = None
+    products_flag: Annotated[bool | None, Field(alias="productsFlag")] = None
+    project: ProjectReference | None = None
+    project_board: Annotated[ProjectBoardReference | None, Field(alias="projectBoard")] = None
+    project_type: Annotated[ProjectTypeReference | None, Field(alias="projectType")] = None
+    service_board: Annotated[BoardReference | None, Field(alias="serviceBoard")] = None
+    service_type: Annotated[ServiceTypeReference | None, Field(alias="serviceType")] = None
+    services_flag: Annotated[bool | None, Field(alias="servicesFlag")] = None
+    site: SiteReference | None = None
+    territory: SystemLocationReference | None = None
+    ticket: TicketReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.agreement_type_reference import AgreementTypeReference
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.iv_item_reference import IvItemReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.product_category_reference import ProductCategoryReference
+from pyconnectwise.models.manage.product_sub_category_reference import ProductSubCategoryReference
+from pyconnectwise.models.manage.project_board_reference import ProjectBoardReference
+from pyconnectwise.models.manage.project_reference import ProjectReference
+from pyconnectwise.models.manage.project_type_reference import ProjectTypeReference
+from pyconnectwise.models.manage.service_type_reference import ServiceTypeReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.ticket_reference import TicketReference
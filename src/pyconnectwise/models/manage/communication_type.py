@@ -0,0 +1,49 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CommunicationType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    android_xref: Annotated[str | None, Field(alias="androidXref")] = None
+    """
+     Max length: 50;
+    """
+    core_entity_communication_type_id: Annotated[str | None, Field(alias="coreEntityCommunicationTypeId")] = None
+    """
+    Core_Entity_Communication_Type_ID required if core_entity_sync_flag is set Max length: 36;
+    """
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    description: str
+    email_flag: Annotated[bool | None, Field(alias="emailFlag")] = None
+    """
+    At least one flag is required to be true -- phone, fax, or email
+    """
+    exchange_xref: Annotated[str | None, Field(alias="exchangeXref")] = None
+    """
+     Max length: 50;
+    """
+    fax_flag: Annotated[bool | None, Field(alias="faxFlag")] = None
+    """
+    At least one flag is required to be true -- phone, fax, or email
+    """
+    google_xref: Annotated[str | None, Field(alias="googleXref")] = None
+    """
+     Max length: 50;
+    """
+    id: int | None = None
+    iphone_xref: Annotated[str | None, Field(alias="iphoneXref")] = None
+    """
+     Max length: 50;
+    """
+    phone_flag: Annotated[bool | None, Field(alias="phoneFlag")] = None
+    """
+    At least one flag is required to be true -- phone, fax, or email
+    """
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CommunicationTypeInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    description: str | None = None
+    email_flag: Annotated[bool | None, Field(alias="emailFlag")] = None
+    fax_flag: Annotated[bool | None, Field(alias="faxFlag")] = None
+    id: int | None = None
+    phone_flag: Annotated[bool | None, Field(alias="phoneFlag")] = None
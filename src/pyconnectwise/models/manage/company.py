@@ -0,0 +1,175 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Company(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    address_line1: Annotated[str | None, Field(alias="addressLine1")] = None
+    """
+    At least one address field is required -- addressLine1, addressLine2, city, state, zip and/or country Max length: 50;
+    """
+    address_line2: Annotated[str | None, Field(alias="addressLine2")] = None
+    """
+    At least one address field is required -- addressLine1, addressLine2, city, state, zip and/or country Max length: 50;
+    """
+    annual_revenue: Annotated[float | None, Field(alias="annualRevenue")] = None
+    bill_to_company: Annotated[CompanyReference | None, Field(alias="billToCompany")] = None
+    billing_contact: Annotated[ContactReference | None, Field(alias="billingContact")] = None
+    billing_site: Annotated[SiteReference | None, Field(alias="billingSite")] = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    calendar: CalendarReference | None = None
+    city: str | None = None
+    """
+    At least one address field is required -- addressLine1, addressLine2, city, state, zip and/or country Max length: 50;
+    """
+    company_entity_type: Annotated[EntityTypeReference | None, Field(alias="companyEntityType")] = None
+    country: CountryReference | None = None
+    currency: CurrencyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    date_acquired: Annotated[datetime | None, Field(alias="dateAcquired")] = None
+    date_deleted: Annotated[datetime | None, Field(alias="dateDeleted")] = None
+    default_contact: Annotated[ContactReference | None, Field(alias="defaultContact")] = None
+    deleted_by: Annotated[str | None, Field(alias="deletedBy")] = None
+    deleted_flag: Annotated[bool | None, Field(alias="deletedFlag")] = None
+    facebook_url: Annotated[str | None, Field(alias="facebookUrl")] = None
+    fax_number: Annotated[str | None, Field(alias="faxNumber")] = None
+    """
+     Max length: 30;
+    """
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 30;
+    """
+    integrator_tags: Annotated[list[str] | None, Field(alias="integratorTags")] = None
+    invoice_cc_email_address: Annotated[str | None, Field(alias="invoiceCCEmailAddress")] = None
+    invoice_delivery_method: Annotated[BillingDeliveryReference | None, Field(alias="invoiceDeliveryMethod")] = None
+    invoice_template: Annotated[InvoiceTemplateReference | None, Field(alias="invoiceTemplate")] = None
+    invoice_to_email_address: Annotated[str | None, Field(alias="invoiceToEmailAddress")] = None
+    is_vendor_flag: Annotated[bool | None, Field(alias="isVendorFlag")] = None
+    lead_flag: Annotated[bool | None, Field(alias="leadFlag")] = None
+    lead_source: Annotated[str | None, Field(alias="leadSource")] = None
+    """
+     Max length: 50;
+    """
+    linked_in_url: Annotated[str | None, Field(alias="linkedInUrl")] = None
+    market: MarketDescriptionReference | None = None
+    mobile_guid: Annotated[UUID | None, Field(alias="mobileGuid")] = None
+    name: str
+    """
+     Max length: 50;
+    """
+    number_of_employees: Annotated[int | None, Field(alias="numberOfEmployees")] = None
+    ownership_type: Annotated[OwnershipTypeReference | None, Field(alias="ownershipType")] = None
+    parent_company: Annotated[CompanyReference | None, Field(alias="parentCompany")] = None
+    phone_number: Annotated[str | None, Field(alias="phoneNumber")] = None
+    """
+     Max length: 30;
+    """
+    pricing_schedule: Annotated[PricingScheduleReference | None, Field(alias="pricingSchedule")] = None
+    reseller_identifier: Annotated[str | None, Field(alias="resellerIdentifier")] = None
+    revenue_year: Annotated[int | None, Field(alias="revenueYear")] = None
+    sic_code: Annotated[SicCodeReference | None, Field(alias="sicCode")] = None
+    site: SiteReference | None = None
+    state: str | None = None
+    """
+    At least one address field is required -- addressLine1, addressLine2, city, state, zip and/or country Max length: 50;
+    """
+    status: CompanyStatusReference | None = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    tax_identifier: Annotated[str | None, Field(alias="taxIdentifier")] = None
+    territory: SystemLocationReference | None = None
+    territory_manager: Annotated[MemberReference | None, Field(alias="territoryManager")] = None
+    time_zone_setup: Annotated[TimeZoneSetupReference | None, Field(alias="timeZoneSetup")] = None
+    twitter_url: Annotated[str | None, Field(alias="twitterUrl")] = None
+    types: list[CompanyTypeReference] | None = None
+    """
+    Integrer array of Company_Type_Recids to be assigned to company that can be passed in only during new company creation (post)
+                To update existing companies type, use the /company/companyTypeAssociations or /company/companies/{ID}/typeAssociations endpoints
+    """
+    unsubscribe_flag: Annotated[bool | None, Field(alias="unsubscribeFlag")] = None
+    user_defined_field1: Annotated[str | None, Field(alias="userDefinedField1")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field10: Annotated[str | None, Field(alias="userDefinedField10")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field2: Annotated[str | None, Field(alias="userDefinedField2")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field3: Annotated[str | None, Field(alias="userDefinedField3")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field4: Annotated[str | None, Field(alias="userDefinedField4")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field5: Annotated[str | None, Field(alias="userDefinedField5")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field6: Annotated[str | None, Field(alias="userDefinedField6")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field7: Annotated[str | None, Field(alias="userDefinedField7")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field8: Annotated[str | None, Field(alias="userDefinedField8")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field9: Annotated[str | None, Field(alias="userDefinedField9")] = None
+    """
+     Max length: 50;
+    """
+    vendor_identifier: Annotated[str | None, Field(alias="vendorIdentifier")] = None
+    website: str | None = None
+    """
+     Max length: 255;
+    """
+    year_established: Annotated[int | None, Field(alias="yearEstablished")] = None
+    zip: str | None = None
+    """
+    At least one address field is required -- addressLine1, addressLine2, city, state, zip and/or country Max length: 12;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_delivery_reference import BillingDeliveryReference
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.calendar_reference import CalendarReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.company_status_reference import CompanyStatusReference
+from pyconnectwise.models.manage.company_type_reference import CompanyTypeReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.country_reference import CountryReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.entity_type_reference import EntityTypeReference
+from pyconnectwise.models.manage.invoice_template_reference import InvoiceTemplateReference
+from pyconnectwise.models.manage.market_description_reference import MarketDescriptionReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.ownership_type_reference import OwnershipTypeReference
+from pyconnectwise.models.manage.pricing_schedule_reference import PricingScheduleReference
+from pyconnectwise.models.manage.sic_code_reference import SicCodeReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
+from pyconnectwise.models.manage.time_zone_setup_reference import TimeZoneSetupReference
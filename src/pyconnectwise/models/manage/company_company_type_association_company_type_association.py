@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.manage.company_company_type_association import CompanyCompanyTypeAssociation
+
+
+class CompanyCompanyTypeAssociationCompanyTypeAssociation(CompanyCompanyTypeAssociation):
+    pass
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.company_type_reference import CompanyTypeReference
@@ -0,0 +1,135 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyConfiguration(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    active_flag: Annotated[bool | None, Field(alias="activeFlag")] = None
+    backup_billable_space_gb: Annotated[float | None, Field(alias="backupBillableSpaceGb")] = None
+    backup_failed: Annotated[int | None, Field(alias="backupFailed")] = None
+    backup_incomplete: Annotated[int | None, Field(alias="backupIncomplete")] = None
+    backup_month: Annotated[int | None, Field(alias="backupMonth")] = None
+    backup_protected_device_list: Annotated[str | None, Field(alias="backupProtectedDeviceList")] = None
+    backup_restores: Annotated[int | None, Field(alias="backupRestores")] = None
+    backup_server_name: Annotated[str | None, Field(alias="backupServerName")] = None
+    """
+     Max length: 50;
+    """
+    backup_successes: Annotated[int | None, Field(alias="backupSuccesses")] = None
+    backup_year: Annotated[int | None, Field(alias="backupYear")] = None
+    bill_flag: Annotated[bool | None, Field(alias="billFlag")] = None
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    company: CompanyReference | None = None
+    company_location_id: Annotated[int | None, Field(alias="companyLocationId")] = None
+    contact: ContactReference | None = None
+    cpu_speed: Annotated[str | None, Field(alias="cpuSpeed")] = None
+    """
+     Max length: 100;
+    """
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    default_gateway: Annotated[str | None, Field(alias="defaultGateway")] = None
+    """
+     Max length: 50;
+    """
+    device_identifier: Annotated[str | None, Field(alias="deviceIdentifier")] = None
+    """
+     Max length: 100;
+    """
+    display_vendor_flag: Annotated[bool | None, Field(alias="displayVendorFlag")] = None
+    id: int | None = None
+    installation_date: Annotated[datetime | None, Field(alias="installationDate")] = None
+    installed_by: Annotated[MemberReference | None, Field(alias="installedBy")] = None
+    ip_address: Annotated[str | None, Field(alias="ipAddress")] = None
+    """
+     Max length: 50;
+    """
+    last_backup_date: Annotated[datetime | None, Field(alias="lastBackupDate")] = None
+    last_login_name: Annotated[str | None, Field(alias="lastLoginName")] = None
+    """
+     Max length: 100;
+    """
+    local_hard_drives: Annotated[str | None, Field(alias="localHardDrives")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    mac_address: Annotated[str | None, Field(alias="macAddress")] = None
+    """
+     Max length: 25;
+    """
+    management_link: Annotated[str | None, Field(alias="managementLink")] = None
+    """
+     Max length: 1000;
+    """
+    manufacturer: ManufacturerReference | None = None
+    manufacturer_part_number: Annotated[str | None, Field(alias="manufacturerPartNumber")] = None
+    """
+     Max length: 50;
+    """
+    mobile_guid: Annotated[UUID | None, Field(alias="mobileGuid")] = None
+    model_number: Annotated[str | None, Field(alias="modelNumber")] = None
+    """
+     Max length: 50;
+    """
+    name: str
+    """
+     Max length: 100;
+    """
+    needs_renewal_flag: Annotated[bool | None, Field(alias="needsRenewalFlag")] = None
+    notes: str | None = None
+    os_info: Annotated[str | None, Field(alias="osInfo")] = None
+    """
+     Max length: 250;
+    """
+    os_type: Annotated[str | None, Field(alias="osType")] = None
+    """
+     Max length: 250;
+    """
+    parent_configuration_id: Annotated[int | None, Field(alias="parentConfigurationId")] = None
+    purchase_date: Annotated[datetime | None, Field(alias="purchaseDate")] = None
+    questions: list[ConfigurationQuestion] | None = None
+    ram: str | None = None
+    """
+     Max length: 25;
+    """
+    remote_link: Annotated[str | None, Field(alias="remoteLink")] = None
+    """
+     Max length: 1000;
+    """
+    serial_number: Annotated[str | None, Field(alias="serialNumber")] = None
+    """
+     Max length: 250;
+    """
+    show_automate_flag: Annotated[bool | None, Field(alias="showAutomateFlag")] = None
+    show_remote_flag: Annotated[bool | None, Field(alias="showRemoteFlag")] = None
+    site: SiteReference | None = None
+    sla: SLAReference | None = None
+    status: ConfigurationStatusReference | None = None
+    tag_number: Annotated[str | None, Field(alias="tagNumber")] = None
+    """
+     Max length: 50;
+    """
+    type: ConfigurationTypeReference | None = None
+    vendor: CompanyReference | None = None
+    vendor_notes: Annotated[str | None, Field(alias="vendorNotes")] = None
+    warranty_expiration_date: Annotated[datetime | None, Field(alias="warrantyExpirationDate")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.configuration_question import ConfigurationQuestion
+from pyconnectwise.models.manage.configuration_status_reference import ConfigurationStatusReference
+from pyconnectwise.models.manage.configuration_type_reference import ConfigurationTypeReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.manufacturer_reference import ManufacturerReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.sla_reference import SLAReference
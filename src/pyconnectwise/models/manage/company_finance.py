@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyFinance(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    bill_complete_pm_flag: Annotated[bool | None, Field(alias="billCompletePmFlag")] = None
+    bill_complete_sr_flag: Annotated[bool | None, Field(alias="billCompleteSrFlag")] = None
+    bill_override_flag: Annotated[bool | None, Field(alias="billOverrideFlag")] = None
+    bill_restrict_pm_flag: Annotated[bool | None, Field(alias="billRestrictPmFlag")] = None
+    bill_sr_flag: Annotated[bool | None, Field(alias="billSrFlag")] = None
+    bill_unapproved_pm_flag: Annotated[bool | None, Field(alias="billUnapprovedPmFlag")] = None
+    bill_unapproved_sr_flag: Annotated[bool | None, Field(alias="billUnapprovedSrFlag")] = None
+    company: CompanyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    email_template: Annotated[EmailTemplateReference | None, Field(alias="emailTemplate")] = None
+    id: int | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.email_template_reference import EmailTemplateReference
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyGroup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    all_contacts_flag: Annotated[bool | None, Field(alias="allContactsFlag")] = None
+    company: CompanyReference | None = None
+    contact_ids: Annotated[list[int] | None, Field(alias="contactIds")] = None
+    default_contact_flag: Annotated[bool | None, Field(alias="defaultContactFlag")] = None
+    group: GroupReference | None = None
+    id: int | None = None
+    """
+     Required On Updates;
+    """
+    remove_all_contacts_flag: Annotated[bool | None, Field(alias="removeAllContactsFlag")] = None
+    unsubscribe_flag: Annotated[bool | None, Field(alias="unsubscribeFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.group_reference import GroupReference
@@ -0,0 +1,62 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyManagementSummary(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement: AgreementReference | None = None
+    alerts_generated: Annotated[str | None, Field(alias="alertsGenerated")] = None
+    company: CompanyReference | None = None
+    cpu_utilization: Annotated[float | None, Field(alias="cpuUtilization")] = None
+    device_type: Annotated[
+        Literal["WorkstationsAndServers", "BackupStats", "Servers", "Workstations"] | None, Field(alias="deviceType")
+    ] = None
+    """
+    deviceType is required if the managementSolution is Legacy
+    """
+    disk_cleanups: Annotated[int | None, Field(alias="diskCleanups")] = None
+    disk_defragmentations: Annotated[int | None, Field(alias="diskDefragmentations")] = None
+    disk_space_cleaned_mb: Annotated[int | None, Field(alias="diskSpaceCleanedMb")] = None
+    failed_backup_jobs: Annotated[int | None, Field(alias="failedBackupJobs")] = None
+    fully_patched_machines: Annotated[int | None, Field(alias="fullyPatchedMachines")] = None
+    group_identifier: Annotated[str, Field(alias="groupIdentifier")]
+    """
+     Max length: 100;
+    """
+    id: int | None = None
+    internet_connectivity: Annotated[float | None, Field(alias="internetConnectivity")] = None
+    management_solution: Annotated[ManagementSolutionReference | None, Field(alias="managementSolution")] = None
+    memory_utilization: Annotated[float | None, Field(alias="memoryUtilization")] = None
+    missing_more_five_patches_machines: Annotated[int | None, Field(alias="missingMoreFivePatchesMachines")] = None
+    missing_one_two_patches_machines: Annotated[int | None, Field(alias="missingOneTwoPatchesMachines")] = None
+    missing_security_patches: Annotated[str | None, Field(alias="missingSecurityPatches")] = None
+    missing_three_five_patches_machines: Annotated[int | None, Field(alias="missingThreeFivePatchesMachines")] = None
+    missing_unscanned_patches_machines: Annotated[int | None, Field(alias="missingUnscannedPatchesMachines")] = None
+    server_availability: Annotated[int | None, Field(alias="serverAvailability")] = None
+    servers_disk_space_low: Annotated[int | None, Field(alias="serversDiskSpaceLow")] = None
+    servers_offline: Annotated[int | None, Field(alias="serversOffline")] = None
+    snmp_machines: Annotated[int | None, Field(alias="snmpMachines")] = None
+    spyware_items_removed: Annotated[int | None, Field(alias="spywareItemsRemoved")] = None
+    successful_backup_jobs: Annotated[int | None, Field(alias="successfulBackupJobs")] = None
+    total_managed_machines: Annotated[int | None, Field(alias="totalManagedMachines")] = None
+    total_notifications: Annotated[int | None, Field(alias="totalNotifications")] = None
+    total_servers: Annotated[int | None, Field(alias="totalServers")] = None
+    total_windows_servers: Annotated[int | None, Field(alias="totalWindowsServers")] = None
+    total_windows_workstations: Annotated[int | None, Field(alias="totalWindowsWorkstations")] = None
+    total_workstations: Annotated[int | None, Field(alias="totalWorkstations")] = None
+    viruses_removed: Annotated[int | None, Field(alias="virusesRemoved")] = None
+    windows_patches_installed: Annotated[int | None, Field(alias="windowsPatchesInstalled")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.management_solution_reference import ManagementSolutionReference
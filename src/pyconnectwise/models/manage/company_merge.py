@@ -0,0 +1,55 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyMerge(ConnectWiseModel):
+    account_number: Annotated[Literal["From", "To"] | None, Field(alias="accountNumber")] = None
+    activities: Literal["Discard", "Merge"] | None = None
+    billing_address: Annotated[Literal["From", "To"] | None, Field(alias="billingAddress")] = None
+    billing_contact: Annotated[Literal["From", "To"] | None, Field(alias="billingContact")] = None
+    billing_terms: Annotated[Literal["From", "To"] | None, Field(alias="billingTerms")] = None
+    contacts: Literal["Discard", "Merge"] | None = None
+    date_acquired: Annotated[Literal["From", "To"] | None, Field(alias="dateAcquired")] = None
+    documents: Literal["Discard", "Merge"] | None = None
+    fax: Literal["From", "To"] | None = None
+    identifier: Literal["From", "To"] | None = None
+    market: Literal["From", "To"] | None = None
+    name: Literal["From", "To"] | None = None
+    notes: Literal["Discard", "Merge"] | None = None
+    number_of_employees: Annotated[Literal["From", "To"] | None, Field(alias="numberOfEmployees")] = None
+    opportunities: Literal["Discard", "Merge"] | None = None
+    phone: Literal["From", "To"] | None = None
+    primary_address: Annotated[Literal["From", "To"] | None, Field(alias="primaryAddress")] = None
+    primary_contact: Annotated[Literal["From", "To"] | None, Field(alias="primaryContact")] = None
+    projects: Literal["Discard", "Merge"] | None = None
+    revenue: Literal["From", "To"] | None = None
+    revenue_year: Annotated[Literal["From", "To"] | None, Field(alias="revenueYear")] = None
+    services: Literal["Discard", "Merge"] | None = None
+    sic_code: Annotated[Literal["From", "To"] | None, Field(alias="sicCode")] = None
+    sites: Literal["Discard", "Merge"] | None = None
+    source_list: Annotated[Literal["From", "To"] | None, Field(alias="sourceList")] = None
+    status: Literal["From", "To"] | None = None
+    tax_code: Annotated[Literal["From", "To"] | None, Field(alias="taxCode")] = None
+    territory: Literal["From", "To"] | None = None
+    time_zone: Annotated[Literal["From", "To"] | None, Field(alias="timeZone")] = None
+    to_company_id: Annotated[int, Field(alias="toCompanyId")]
+    type: Literal["From", "To"] | None = None
+    user_defined_field1: Annotated[Literal["From", "To"] | None, Field(alias="userDefinedField1")] = None
+    user_defined_field10: Annotated[Literal["From", "To"] | None, Field(alias="userDefinedField10")] = None
+    user_defined_field2: Annotated[Literal["From", "To"] | None, Field(alias="userDefinedField2")] = None
+    user_defined_field3: Annotated[Literal["From", "To"] | None, Field(alias="userDefinedField3")] = None
+    user_defined_field4: Annotated[Literal["From", "To"] | None, Field(alias="userDefinedField4")] = None
+    user_defined_field5: Annotated[Literal["From", "To"] | None, Field(alias="userDefinedField5")] = None
+    user_defined_field6: Annotated[Literal["From", "To"] | None, Field(alias="userDefinedField6")] = None
+    user_defined_field7: Annotated[Literal["From", "To"] | None, Field(alias="userDefinedField7")] = None
+    user_defined_field8: Annotated[Literal["From", "To"] | None, Field(alias="userDefinedField8")] = None
+    user_defined_field9: Annotated[Literal["From", "To"] | None, Field(alias="userDefinedField9")] = None
+    website: Literal["From", "To"] | None = None
@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyPickerItem(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    company: CompanyReference | None = None
+    company_country: Annotated[CountryReference | None, Field(alias="companyCountry")] = None
+    company_location: Annotated[SystemLocationReference | None, Field(alias="companyLocation")] = None
+    company_site: Annotated[SiteReference | None, Field(alias="companySite")] = None
+    company_status: Annotated[CompanyStatusReference | None, Field(alias="companyStatus")] = None
+    company_type: Annotated[CompanyTypeReference | None, Field(alias="companyType")] = None
+    id: int | None = None
+    member: MemberReference | None = None
+    vendor_picker_flag: Annotated[bool | None, Field(alias="vendorPickerFlag")] = None
+    """
+    If true, this record was created by the vendor picker component. Otherwise, the record was created by the company picker component.
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.company_status_reference import CompanyStatusReference
+from pyconnectwise.models.manage.company_type_reference import CompanyTypeReference
+from pyconnectwise.models.manage.country_reference import CountryReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
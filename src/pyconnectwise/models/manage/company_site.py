@@ -0,0 +1,74 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanySite(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    address_format: Annotated[str | None, Field(alias="addressFormat")] = None
+    address_line1: Annotated[str | None, Field(alias="addressLine1")] = None
+    """
+     Max length: 50;
+    """
+    address_line2: Annotated[str | None, Field(alias="addressLine2")] = None
+    """
+     Max length: 50;
+    """
+    bill_separate_flag: Annotated[bool | None, Field(alias="billSeparateFlag")] = None
+    calendar: CalendarReference | None = None
+    city: str | None = None
+    """
+     Max length: 50;
+    """
+    company: CompanyReference | None = None
+    core_entity_site_identifier: Annotated[str | None, Field(alias="coreEntitySiteIdentifier")] = None
+    """
+     Max length: 36;
+    """
+    country: CountryReference | None = None
+    default_billing_flag: Annotated[bool | None, Field(alias="defaultBillingFlag")] = None
+    default_mailing_flag: Annotated[bool | None, Field(alias="defaultMailingFlag")] = None
+    default_shipping_flag: Annotated[bool | None, Field(alias="defaultShippingFlag")] = None
+    entity_type: Annotated[EntityTypeReference | None, Field(alias="entityType")] = None
+    expense_reimbursement: Annotated[float | None, Field(alias="expenseReimbursement")] = None
+    fax_number: Annotated[str | None, Field(alias="faxNumber")] = None
+    """
+     Max length: 30;
+    """
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    mobile_guid: Annotated[UUID | None, Field(alias="mobileGuid")] = None
+    name: str
+    """
+     Max length: 50;
+    """
+    phone_number: Annotated[str | None, Field(alias="phoneNumber")] = None
+    """
+     Max length: 30;
+    """
+    primary_address_flag: Annotated[bool | None, Field(alias="primaryAddressFlag")] = None
+    state_reference: Annotated[StateReference | None, Field(alias="stateReference")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    time_zone: Annotated[TimeZoneSetupReference | None, Field(alias="timeZone")] = None
+    zip: str | None = None
+    """
+     Max length: 12;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.calendar_reference import CalendarReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.country_reference import CountryReference
+from pyconnectwise.models.manage.entity_type_reference import EntityTypeReference
+from pyconnectwise.models.manage.state_reference import StateReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
+from pyconnectwise.models.manage.time_zone_setup_reference import TimeZoneSetupReference
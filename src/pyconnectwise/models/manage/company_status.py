@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyStatus(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    cancel_open_tracks_flag: Annotated[bool | None, Field(alias="cancelOpenTracksFlag")] = None
+    custom_note_flag: Annotated[bool | None, Field(alias="customNoteFlag")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    disallow_saving_flag: Annotated[bool | None, Field(alias="disallowSavingFlag")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    name: str
+    """
+     Max length: 50;
+    """
+    notification_message: Annotated[str | None, Field(alias="notificationMessage")] = None
+    """
+     Max length: 500;
+    """
+    notify_flag: Annotated[bool | None, Field(alias="notifyFlag")] = None
+    track: TrackReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.track_reference import TrackReference
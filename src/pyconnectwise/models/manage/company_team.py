@@ -0,0 +1,33 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CompanyTeam(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    account_manager_flag: Annotated[bool | None, Field(alias="accountManagerFlag")] = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    department: SystemDepartmentReference | None = None
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    member: MemberReference | None = None
+    sales_flag: Annotated[bool | None, Field(alias="salesFlag")] = None
+    team_role: Annotated[TeamRoleReference | None, Field(alias="teamRole")] = None
+    tech_flag: Annotated[bool | None, Field(alias="techFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.team_role_reference import TeamRoleReference
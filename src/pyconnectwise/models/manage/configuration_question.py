@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConfigurationQuestion(ConnectWiseModel):
+    answer: str | bool | int | None = None
+    answer_id: Annotated[int | None, Field(alias="answerId")] = None
+    field_type: Annotated[
+        Literal[
+            "TextArea",
+            "Currency",
+            "Date",
+            "Hyperlink",
+            "IPAddress",
+            "Checkbox",
+            "Number",
+            "Percent",
+            "Text",
+            "Password",
+        ]
+        | None,
+        Field(alias="fieldType"),
+    ] = None
+    number_of_decimals: Annotated[int | None, Field(alias="numberOfDecimals")] = None
+    question: str | None = None
+    question_id: Annotated[int | None, Field(alias="questionId")] = None
+    required_flag: Annotated[bool | None, Field(alias="requiredFlag")] = None
+    sequence_number: Annotated[float | None, Field(alias="sequenceNumber")] = None
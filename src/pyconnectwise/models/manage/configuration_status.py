@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConfigurationStatus(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    closed_flag: Annotated[bool | None, Field(alias="closedFlag")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    description: str
+    """
+     Max length: 50;
+    """
+    id: int | None = None
@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConfigurationTypeQuestionInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    configuration_type: Annotated[ConfigurationTypeReference | None, Field(alias="configurationType")] = None
+    entry_type: Annotated[Literal["Date", "EntryField", "List", "Option"] | None, Field(alias="entryType")] = None
+    field_type: Annotated[
+        Literal[
+            "TextArea",
+            "Currency",
+            "Date",
+            "Hyperlink",
+            "IPAddress",
+            "Checkbox",
+            "Number",
+            "Percent",
+            "Text",
+            "Password",
+        ]
+        | None,
+        Field(alias="fieldType"),
+    ] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    number_of_decimals: Annotated[int | None, Field(alias="numberOfDecimals")] = None
+    question: str | None = None
+    required_flag: Annotated[bool | None, Field(alias="requiredFlag")] = None
+    sequence_number: Annotated[float | None, Field(alias="sequenceNumber")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.configuration_type_reference import ConfigurationTypeReference
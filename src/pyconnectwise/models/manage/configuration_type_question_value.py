@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConfigurationTypeQuestionValue(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    configuration_type: Annotated[ConfigurationTypeReference | None, Field(alias="configurationType")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    question: ConfigurationTypeQuestionReference | None = None
+    value: str
+    """
+     Max length: 1000;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.configuration_type_question_reference import ConfigurationTypeQuestionReference
+from pyconnectwise.models.manage.configuration_type_reference import ConfigurationTypeReference
@@ -0,0 +1,54 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConnectWiseHostedSetup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    client_id: Annotated[str | None, Field(alias="clientId")] = None
+    """
+    Only required if not already set Max length: 36;
+    """
+    created_by: Annotated[str | None, Field(alias="createdBy")] = None
+    date_created: Annotated[datetime | None, Field(alias="dateCreated")] = None
+    description: str
+    """
+     Max length: 50;
+    """
+    disabled_flag: Annotated[bool | None, Field(alias="disabledFlag")] = None
+    id: int | None = None
+    location_ids: Annotated[list[int] | None, Field(alias="locationIds")] = None
+    locations_enabled_flag: Annotated[bool | None, Field(alias="locationsEnabledFlag")] = None
+    origin: str | None = None
+    """
+     Max length: 100;
+    """
+    pod_height: Annotated[int | None, Field(alias="podHeight")] = None
+    screen_id: Annotated[int, Field(alias="screenId")]
+    """
+    Can be obtained via ConnectWiseHostedApiScreen report
+    """
+    toolbar_button_dialog_height: Annotated[int | None, Field(alias="toolbarButtonDialogHeight")] = None
+    toolbar_button_dialog_width: Annotated[int | None, Field(alias="toolbarButtonDialogWidth")] = None
+    toolbar_button_icon_document_id: Annotated[int | None, Field(alias="toolbarButtonIconDocumentId")] = None
+    toolbar_button_text: Annotated[str | None, Field(alias="toolbarButtonText")] = None
+    """
+    Only required for ToolbarButtons Max length: 50;
+    """
+    toolbar_button_tool_tip: Annotated[str | None, Field(alias="toolbarButtonToolTip")] = None
+    """
+     Max length: 50;
+    """
+    type: Literal["Tab", "Pod", "ToolbarButton"]
+    url: str
+    """
+     Max length: 1024;
+    """
@@ -0,0 +1,125 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Contact(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    address_line1: Annotated[str | None, Field(alias="addressLine1")] = None
+    address_line2: Annotated[str | None, Field(alias="addressLine2")] = None
+    anniversary: datetime | None = None
+    assistant_contact: Annotated[ContactReference | None, Field(alias="assistantContact")] = None
+    birth_day: Annotated[str | None, Field(alias="birthDay")] = None
+    children: str | None = None
+    children_flag: Annotated[bool | None, Field(alias="childrenFlag")] = None
+    city: str | None = None
+    communication_items: Annotated[list[ContactCommunicationItem] | None, Field(alias="communicationItems")] = None
+    company: CompanyReference | None = None
+    company_location: Annotated[SystemLocationReference | None, Field(alias="companyLocation")] = None
+    country: CountryReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    default_billing_flag: Annotated[bool | None, Field(alias="defaultBillingFlag")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    default_merge_contact_id: Annotated[int | None, Field(alias="defaultMergeContactId")] = None
+    default_phone_extension: Annotated[str | None, Field(alias="defaultPhoneExtension")] = None
+    default_phone_nbr: Annotated[str | None, Field(alias="defaultPhoneNbr")] = None
+    default_phone_type: Annotated[str | None, Field(alias="defaultPhoneType")] = None
+    department: ContactDepartmentReference | None = None
+    disable_portal_login_flag: Annotated[bool | None, Field(alias="disablePortalLoginFlag")] = None
+    facebook_url: Annotated[str | None, Field(alias="facebookUrl")] = None
+    first_name: Annotated[str | None, Field(alias="firstName")] = None
+    gender: Literal["Female", "Male"] | None = None
+    id: int | None = None
+    ignore_duplicates: Annotated[bool | None, Field(alias="ignoreDuplicates")] = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    integrator_tags: Annotated[list[str] | None, Field(alias="integratorTags")] = None
+    last_name: Annotated[str | None, Field(alias="lastName")] = None
+    linked_in_url: Annotated[str | None, Field(alias="linkedInUrl")] = None
+    manager_contact: Annotated[ContactReference | None, Field(alias="managerContact")] = None
+    married_flag: Annotated[bool | None, Field(alias="marriedFlag")] = None
+    mobile_guid: Annotated[UUID | None, Field(alias="mobileGuid")] = None
+    nick_name: Annotated[str | None, Field(alias="nickName")] = None
+    photo: DocumentReference | None = None
+    portal_password: Annotated[str | None, Field(alias="portalPassword")] = None
+    portal_security_level: Annotated[int | None, Field(alias="portalSecurityLevel")] = None
+    presence: Literal["NoAgent", "Online", "DoNotDisturb", "Away", "Offline"] | None = None
+    relationship: RelationshipReference | None = None
+    relationship_override: Annotated[str | None, Field(alias="relationshipOverride")] = None
+    school: str | None = None
+    security_identifier: Annotated[str | None, Field(alias="securityIdentifier")] = None
+    significant_other: Annotated[str | None, Field(alias="significantOther")] = None
+    site: SiteReference | None = None
+    state: str | None = None
+    title: str | None = None
+    twitter_url: Annotated[str | None, Field(alias="twitterUrl")] = None
+    type_ids: Annotated[list[int] | None, Field(alias="typeIds")] = None
+    """
+    Integrer array of Contact_Type_Recids to be assigned to contact that can be passed in only during new contact creation (post)
+                To update existing contacts type, use the /company/contactTypeAssociations or /company/contacts/{ID}/typeAssociations endpoints
+    """
+    types: list[ContactTypeReference] | None = None
+    unsubscribe_flag: Annotated[bool | None, Field(alias="unsubscribeFlag")] = None
+    user_defined_field1: Annotated[str | None, Field(alias="userDefinedField1")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field10: Annotated[str | None, Field(alias="userDefinedField10")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field2: Annotated[str | None, Field(alias="userDefinedField2")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field3: Annotated[str | None, Field(alias="userDefinedField3")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field4: Annotated[str | None, Field(alias="userDefinedField4")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field5: Annotated[str | None, Field(alias="userDefinedField5")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field6: Annotated[str | None, Field(alias="userDefinedField6")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field7: Annotated[str | None, Field(alias="userDefinedField7")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field8: Annotated[str | None, Field(alias="userDefinedField8")] = None
+    """
+     Max length: 50;
+    """
+    user_defined_field9: Annotated[str | None, Field(alias="userDefinedField9")] = None
+    """
+     Max length: 50;
+    """
+    zip: str | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_communication_item import ContactCommunicationItem
+from pyconnectwise.models.manage.contact_department_reference import ContactDepartmentReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.contact_type_reference import ContactTypeReference
+from pyconnectwise.models.manage.country_reference import CountryReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.document_reference import DocumentReference
+from pyconnectwise.models.manage.relationship_reference import RelationshipReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
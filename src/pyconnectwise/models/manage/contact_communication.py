@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactCommunication(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    communication_type: Annotated[Literal["Email", "Fax", "Phone"] | None, Field(alias="communicationType")] = None
+    contact_id: Annotated[int | None, Field(alias="contactId")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    domain: str | None = None
+    extension: str | None = None
+    """
+     Max length: 15;
+    """
+    id: int | None = None
+    mobile_guid: Annotated[UUID | None, Field(alias="mobileGuid")] = None
+    type: CommunicationTypeReference | None = None
+    value: str
+    """
+     Max length: 250;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.communication_type_reference import CommunicationTypeReference
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactCommunicationItem(ConnectWiseModel):
+    communication_type: Annotated[Literal["Email", "Fax", "Phone"] | None, Field(alias="communicationType")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    domain: str | None = None
+    extension: str | None = None
+    id: int | None = None
+    type: CommunicationTypeReference | None = None
+    value: str | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.communication_type_reference import CommunicationTypeReference
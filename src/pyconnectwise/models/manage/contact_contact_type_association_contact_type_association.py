@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.manage.company_contact_type_association import CompanyContactTypeAssociation
+
+
+class ContactContactTypeAssociationContactTypeAssociation(CompanyContactTypeAssociation):
+    pass
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.contact_type_reference import ContactTypeReference
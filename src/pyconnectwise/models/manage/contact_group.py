@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactGroup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    company_group_unsubscribed_email_message: Annotated[
+        str | None, Field(alias="companyGroupUnsubscribedEmailMessage")
+    ] = None
+    company_unsubcribed_email_message: Annotated[str | None, Field(alias="companyUnsubcribedEmailMessage")] = None
+    contact: ContactReference | None = None
+    contact_group_unsubscribed_email_message: Annotated[
+        str | None, Field(alias="contactGroupUnsubscribedEmailMessage")
+    ] = None
+    contact_unsubscribed_email_message: Annotated[str | None, Field(alias="contactUnsubscribedEmailMessage")] = None
+    description: str | None = None
+    """
+     Max length: 50;
+    """
+    group: GroupReference | None = None
+    id: int | None = None
+    unsubscribe_flag: Annotated[bool | None, Field(alias="unsubscribeFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.group_reference import GroupReference
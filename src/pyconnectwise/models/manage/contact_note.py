@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactNote(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    contact_id: Annotated[int | None, Field(alias="contactId")] = None
+    entered_by: Annotated[str | None, Field(alias="enteredBy")] = None
+    flagged: bool | None = None
+    id: int | None = None
+    text: str
+    type: NoteTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.note_type_reference import NoteTypeReference
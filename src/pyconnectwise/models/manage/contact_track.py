@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactTrack(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    action_remaining: Annotated[int | None, Field(alias="actionRemaining")] = None
+    action_taken: Annotated[int | None, Field(alias="actionTaken")] = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    end_date: Annotated[datetime | None, Field(alias="endDate")] = None
+    id: int | None = None
+    name: str | None = None
+    start_date: Annotated[datetime | None, Field(alias="startDate")] = None
+    started_by: Annotated[str | None, Field(alias="startedBy")] = None
+    track_id: Annotated[int | None, Field(alias="trackId")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
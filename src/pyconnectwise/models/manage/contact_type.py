@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ContactType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    description: str
+    """
+     Max length: 50;
+    """
+    id: int | None = None
+    service_alert_flag: Annotated[bool | None, Field(alias="serviceAlertFlag")] = None
+    service_alert_message: Annotated[str | None, Field(alias="serviceAlertMessage")] = None
+    """
+     Max length: 150;
+    """
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Conversion(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    parent_uom: Annotated[UnitOfMeasureReference | None, Field(alias="parentUOM")] = None
+    quantity: float | None = None
+    uom_type: Annotated[UnitOfMeasureReference | None, Field(alias="uomType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.unit_of_measure_reference import UnitOfMeasureReference
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConvertItem(ConnectWiseModel):
+    id: int | None = None
+    phase: ProjectPhaseReference | None = None
+    project: ProjectReference | None = None
+    record_type: Annotated[Literal["ProjectIssue", "ProjectTicket", "ServiceTicket"], Field(alias="recordType")]
+    wbs_code: Annotated[str | None, Field(alias="wbsCode")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.project_phase_reference import ProjectPhaseReference
+from pyconnectwise.models.manage.project_reference import ProjectReference
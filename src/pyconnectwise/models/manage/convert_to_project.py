@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ConvertToProject(ConnectWiseModel):
+    id: int | None = None
+    phase: ProjectPhaseReference | None = None
+    project: ProjectReference | None = None
+    record_type: Annotated[
+        Literal["ProjectIssue", "ProjectTicket", "ServiceTicket"] | None, Field(alias="recordType")
+    ] = None
+    wbs_code: Annotated[str, Field(alias="wbsCode")]
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.project_phase_reference import ProjectPhaseReference
+from pyconnectwise.models.manage.project_reference import ProjectReference
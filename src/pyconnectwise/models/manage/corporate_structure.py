@@ -0,0 +1,75 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CorporateStructure(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    base_currency: Annotated[CurrencyReference, Field(alias="baseCurrency")]
+    chief_operating_officer: Annotated[MemberReference | None, Field(alias="chiefOperatingOfficer")] = None
+    controller: MemberReference | None = None
+    dispatcher: MemberReference | None = None
+    duty_manager: Annotated[MemberReference | None, Field(alias="dutyManager")] = None
+    fiscal_year_start: Annotated[
+        Literal[
+            "January",
+            "February",
+            "March",
+            "April",
+            "May",
+            "June",
+            "July",
+            "August",
+            "September",
+            "October",
+            "November",
+            "December",
+        ],
+        Field(alias="fiscalYearStart"),
+    ]
+    group_caption: Annotated[str, Field(alias="groupCaption")]
+    """
+     Max length: 50;
+    """
+    id: int | None = None
+    level1_name: Annotated[str | None, Field(alias="level1Name")] = None
+    """
+     Max length: 20;
+    """
+    level2_name: Annotated[str | None, Field(alias="level2Name")] = None
+    """
+     Max length: 20;
+    """
+    level3_name: Annotated[str | None, Field(alias="level3Name")] = None
+    """
+     Max length: 20;
+    """
+    level4_name: Annotated[str | None, Field(alias="level4Name")] = None
+    """
+     Max length: 20;
+    """
+    level5_name: Annotated[str | None, Field(alias="level5Name")] = None
+    """
+     Max length: 20;
+    """
+    level_count: Annotated[
+        Literal["Level1", "Level2", "Level3", "Level4", "Level5"] | None, Field(alias="levelCount")
+    ] = None
+    location_caption: Annotated[str, Field(alias="locationCaption")]
+    """
+     Max length: 50;
+    """
+    president: MemberReference | None = None
+    service_manager: Annotated[MemberReference | None, Field(alias="serviceManager")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.member_reference import MemberReference
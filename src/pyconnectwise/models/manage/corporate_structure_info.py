@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CorporateStructureInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    base_currency: Annotated[CurrencyReference | None, Field(alias="baseCurrency")] = None
+    group_caption: Annotated[str | None, Field(alias="groupCaption")] = None
+    id: int | None = None
+    location_caption: Annotated[str | None, Field(alias="locationCaption")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
@@ -0,0 +1,314 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Country(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    address_format: Annotated[AddressFormatReference | None, Field(alias="addressFormat")] = None
+    city_caption: Annotated[str | None, Field(alias="cityCaption")] = None
+    """
+     Max length: 25;
+    """
+    core_entity_country_code: Annotated[
+        Literal[
+            "AF",
+            "AX",
+            "AL",
+            "DZ",
+            "AS",
+            "AD",
+            "AO",
+            "AI",
+            "AQ",
+            "AR",
+            "AM",
+            "AW",
+            "AT",
+            "AZ",
+            "BH",
+            "BD",
+            "BB",
+            "BY",
+            "BZ",
+            "BJ",
+            "BM",
+            "BT",
+            "BO",
+            "BQ",
+            "BA",
+            "BW",
+            "BV",
+            "IO",
+            "BN",
+            "BG",
+            "BF",
+            "BI",
+            "CM",
+            "CV",
+            "KY",
+            "CF",
+            "TD",
+            "CL",
+            "CX",
+            "CC",
+            "CO",
+            "KM",
+            "CG",
+            "CK",
+            "CI",
+            "HR",
+            "CU",
+            "CW",
+            "CY",
+            "CZ",
+            "CD",
+            "DK",
+            "DJ",
+            "DM",
+            "EC",
+            "EG",
+            "GQ",
+            "ER",
+            "EE",
+            "ET",
+            "FK",
+            "FO",
+            "FJ",
+            "FI",
+            "FR",
+            "GF",
+            "PF",
+            "TF",
+            "GA",
+            "GM",
+            "GE",
+            "GH",
+            "GI",
+            "GR",
+            "GL",
+            "GD",
+            "GP",
+            "GU",
+            "GT",
+            "GG",
+            "GN",
+            "GW",
+            "GY",
+            "HT",
+            "HM",
+            "HN",
+            "HK",
+            "HU",
+            "IS",
+            "IN",
+            "IR",
+            "IQ",
+            "IE",
+            "IM",
+            "IT",
+            "JM",
+            "JP",
+            "JE",
+            "JO",
+            "KZ",
+            "KE",
+            "KI",
+            "XK",
+            "KW",
+            "KG",
+            "LA",
+            "LV",
+            "LB",
+            "LS",
+            "LR",
+            "LY",
+            "LI",
+            "LT",
+            "LU",
+            "MO",
+            "MK",
+            "MG",
+            "MW",
+            "MY",
+            "ML",
+            "MT",
+            "MH",
+            "MQ",
+            "MR",
+            "MU",
+            "YT",
+            "FM",
+            "MD",
+            "MC",
+            "MN",
+            "ME",
+            "MS",
+            "MZ",
+            "NA",
+            "NR",
+            "NP",
+            "NC",
+            "NZ",
+            "NI",
+            "NE",
+            "NG",
+            "NU",
+            "NF",
+            "KP",
+            "MP",
+            "OM",
+            "PK",
+            "PW",
+            "PS",
+            "PG",
+            "PY",
+            "PE",
+            "PN",
+            "PL",
+            "PT",
+            "PR",
+            "RE",
+            "RO",
+            "RU",
+            "RW",
+            "BL",
+            "SH",
+            "PM",
+            "VC",
+            "WS",
+            "SM",
+            "ST",
+            "SN",
+            "RS",
+            "SC",
+            "SL",
+            "SX",
+            "SK",
+            "SI",
+            "SB",
+            "SO",
+            "ZA",
+            "GS",
+            "KR",
+            "SS",
+            "ES",
+            "LK",
+            "SD",
+            "SR",
+            "SJ",
+            "SZ",
+            "SE",
+            "SY",
+            "TJ",
+            "TZ",
+            "TH",
+            "TL",
+            "TG",
+            "TK",
+            "TO",
+            "TN",
+            "TR",
+            "TV",
+            "UG",
+            "UA",
+            "GB",
+            "UM",
+            "UZ",
+            "VU",
+            "VN",
+            "WF",
+            "EH",
+            "YE",
+            "ZM",
+            "ZW",
+            "US",
+            "CR",
+            "MX",
+            "AE",
+            "VI",
+            "VG",
+            "SA",
+            "KH",
+            "AU",
+            "ID",
+            "CA",
+            "BR",
+            "TW",
+            "TM",
+            "TC",
+            "QA",
+            "MM",
+            "CN",
+            "SG",
+            "IL",
+            "VA",
+            "DE",
+            "NL",
+            "AG",
+            "BE",
+            "LC",
+            "UY",
+            "PH",
+            "BS",
+            "VE",
+            "CH",
+            "MF",
+            "KN",
+            "TT",
+            "DO",
+            "PA",
+            "MV",
+            "SV",
+            "NO",
+            "MA",
+            "AC",
+            "TA",
+        ]
+        | None,
+        Field(alias="coreEntityCountryCode"),
+    ] = None
+    country_code: Annotated[str | None, Field(alias="countryCode")] = None
+    """
+     Max length: 2;
+    """
+    currency: CurrencyReference | None = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    dialing_prefix: Annotated[str | None, Field(alias="dialingPrefix")] = None
+    """
+     Max length: 5;
+    """
+    id: int | None = None
+    localization_caption_one: Annotated[str | None, Field(alias="localizationCaptionOne")] = None
+    """
+     Max length: 25;
+    """
+    localization_value_one: Annotated[str | None, Field(alias="localizationValueOne")] = None
+    """
+     Max length: 50;
+    """
+    name: str
+    """
+     Max length: 50;
+    """
+    state_caption: Annotated[str | None, Field(alias="stateCaption")] = None
+    """
+     Max length: 25;
+    """
+    zip_caption: Annotated[str | None, Field(alias="zipCaption")] = None
+    """
+     Max length: 25;
+    """
+    zip_minimum_length: Annotated[int | None, Field(alias="zipMinimumLength")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.address_format_reference import AddressFormatReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
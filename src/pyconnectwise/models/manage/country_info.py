@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CountryInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    city_caption: Annotated[str | None, Field(alias="cityCaption")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    dialing_prefix: Annotated[str | None, Field(alias="dialingPrefix")] = None
+    id: int | None = None
+    localization_caption_one: Annotated[str | None, Field(alias="localizationCaptionOne")] = None
+    name: str | None = None
+    state_caption: Annotated[str | None, Field(alias="stateCaption")] = None
+    zip_caption: Annotated[str | None, Field(alias="zipCaption")] = None
@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CreateAccountingBatchRequest(ConnectWiseModel):
+    batch_identifier: Annotated[str | None, Field(alias="batchIdentifier")] = None
+    """
+     Max length: 50;
+    """
+    export_expenses_flag: Annotated[bool | None, Field(alias="exportExpensesFlag")] = None
+    """
+    Batch must export Invoices, Expenses or Products
+    """
+    export_invoices_flag: Annotated[bool | None, Field(alias="exportInvoicesFlag")] = None
+    """
+    Batch must export Invoices, Expenses or Products
+    """
+    export_products_flag: Annotated[bool | None, Field(alias="exportProductsFlag")] = None
+    """
+    Batch must export Invoices, Expenses or Products
+    """
+    gl_interface_identifier: Annotated[str | None, Field(alias="glInterfaceIdentifier")] = None
+    id: int | None = None
+    processed_record_ids: Annotated[list[int], Field(alias="processedRecordIds")]
+    """
+    GL Entry RecIDs
+    """
+    summarize_expenses: Annotated[bool | None, Field(alias="summarizeExpenses")] = None
@@ -0,0 +1,83 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Crm(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    account_manager_role: Annotated[TeamRoleReference | None, Field(alias="accountManagerRole")] = None
+    company_id_generation_flag: Annotated[bool | None, Field(alias="companyIdGenerationFlag")] = None
+    company_list_count: Annotated[int | None, Field(alias="companyListCount")] = None
+    default_year: Annotated[bool | None, Field(alias="defaultYear")] = None
+    exclude_spaces_flag: Annotated[bool | None, Field(alias="excludeSpacesFlag")] = None
+    field10_caption: Annotated[str | None, Field(alias="field10Caption")] = None
+    """
+     Max length: 25;
+    """
+    field1_caption: Annotated[str | None, Field(alias="field1Caption")] = None
+    """
+     Max length: 25;
+    """
+    field2_caption: Annotated[str | None, Field(alias="field2Caption")] = None
+    """
+     Max length: 25;
+    """
+    field3_caption: Annotated[str | None, Field(alias="field3Caption")] = None
+    """
+     Max length: 25;
+    """
+    field4_caption: Annotated[str | None, Field(alias="field4Caption")] = None
+    """
+     Max length: 25;
+    """
+    field5_caption: Annotated[str | None, Field(alias="field5Caption")] = None
+    """
+     Max length: 25;
+    """
+    field6_caption: Annotated[str | None, Field(alias="field6Caption")] = None
+    """
+     Max length: 25;
+    """
+    field7_caption: Annotated[str | None, Field(alias="field7Caption")] = None
+    """
+     Max length: 25;
+    """
+    field8_caption: Annotated[str | None, Field(alias="field8Caption")] = None
+    """
+     Max length: 25;
+    """
+    field9_caption: Annotated[str | None, Field(alias="field9Caption")] = None
+    """
+     Max length: 25;
+    """
+    id: int | None = None
+    lock_probability_flag: Annotated[bool | None, Field(alias="lockProbabilityFlag")] = None
+    other1_caption: Annotated[str | None, Field(alias="other1Caption")] = None
+    """
+     Max length: 50;
+    """
+    other2_caption: Annotated[str | None, Field(alias="other2Caption")] = None
+    """
+     Max length: 50;
+    """
+    primary_rep_caption: Annotated[str | None, Field(alias="primaryRepCaption")] = None
+    """
+     Max length: 50;
+    """
+    sales_rep_role: Annotated[TeamRoleReference | None, Field(alias="salesRepRole")] = None
+    secondary_rep_caption: Annotated[str | None, Field(alias="secondaryRepCaption")] = None
+    """
+     Max length: 50;
+    """
+    technical_contact_role: Annotated[TeamRoleReference | None, Field(alias="technicalContactRole")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.team_role_reference import TeamRoleReference
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CrmInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    account_manager_role: Annotated[TeamRoleReference | None, Field(alias="accountManagerRole")] = None
+    field10_caption: Annotated[str | None, Field(alias="field10Caption")] = None
+    field1_caption: Annotated[str | None, Field(alias="field1Caption")] = None
+    field2_caption: Annotated[str | None, Field(alias="field2Caption")] = None
+    field3_caption: Annotated[str | None, Field(alias="field3Caption")] = None
+    field4_caption: Annotated[str | None, Field(alias="field4Caption")] = None
+    field5_caption: Annotated[str | None, Field(alias="field5Caption")] = None
+    field6_caption: Annotated[str | None, Field(alias="field6Caption")] = None
+    field7_caption: Annotated[str | None, Field(alias="field7Caption")] = None
+    field8_caption: Annotated[str | None, Field(alias="field8Caption")] = None
+    field9_caption: Annotated[str | None, Field(alias="field9Caption")] = None
+    id: int | None = None
+    primary_rep_caption: Annotated[str | None, Field(alias="primaryRepCaption")] = None
+    sales_rep_role: Annotated[TeamRoleReference | None, Field(alias="salesRepRole")] = None
+    secondary_rep_caption: Annotated[str | None, Field(alias="secondaryRepCaption")] = None
+    technical_contact_role: Annotated[TeamRoleReference | None, Field(alias="technicalContactRole")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.team_role_reference import TeamRoleReference
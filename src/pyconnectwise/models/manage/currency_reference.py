@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CurrencyReference(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    currency_code: Annotated[str | None, Field(alias="currencyCode")] = None
+    currency_identifier: Annotated[str | None, Field(alias="currencyIdentifier")] = None
+    decimal_separator: Annotated[str | None, Field(alias="decimalSeparator")] = None
+    display_id_flag: Annotated[bool | None, Field(alias="displayIdFlag")] = None
+    display_symbol_flag: Annotated[bool | None, Field(alias="displaySymbolFlag")] = None
+    id: int | None = None
+    name: str | None = None
+    negative_parentheses_flag: Annotated[bool | None, Field(alias="negativeParenthesesFlag")] = None
+    number_of_decimals: Annotated[int | None, Field(alias="numberOfDecimals")] = None
+    right_align: Annotated[bool | None, Field(alias="rightAlign")] = None
+    symbol: str | None = None
+    thousands_separator: Annotated[str | None, Field(alias="thousandsSeparator")] = None
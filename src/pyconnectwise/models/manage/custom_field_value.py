@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CustomFieldValue(ConnectWiseModel):
+    caption: str | None = None
+    entry_method: Annotated[Literal["Date", "EntryField", "List", "Option"] | None, Field(alias="entryMethod")] = None
+    id: int | None = None
+    number_of_decimals: Annotated[int | None, Field(alias="numberOfDecimals")] = None
+    type: Literal[
+        "TextArea",
+        "Button",
+        "Currency",
+        "Date",
+        "Hyperlink",
+        "IPAddress",
+        "Checkbox",
+        "Number",
+        "Percent",
+        "Text",
+        "Password",
+    ] | None = None
+    value: str | bool | int | None = None
@@ -0,0 +1,172 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CustomReport(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_flag: Annotated[bool | None, Field(alias="agreementFlag")] = None
+    agreement_override: Annotated[str | None, Field(alias="agreementOverride")] = None
+    agreement_param_id: Annotated[int | None, Field(alias="agreementParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Agreement parameter
+    """
+    agreement_type_flag: Annotated[bool | None, Field(alias="agreementTypeFlag")] = None
+    agreement_type_override: Annotated[str | None, Field(alias="agreementTypeOverride")] = None
+    agreement_type_param_id: Annotated[int | None, Field(alias="agreementTypeParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Agreement Type parameter
+    """
+    company_flag: Annotated[bool | None, Field(alias="companyFlag")] = None
+    company_override: Annotated[str | None, Field(alias="companyOverride")] = None
+    company_param_id: Annotated[int | None, Field(alias="companyParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Company parameter
+    """
+    department_default_flag: Annotated[bool | None, Field(alias="departmentDefaultFlag")] = None
+    department_flag: Annotated[bool | None, Field(alias="departmentFlag")] = None
+    department_override: Annotated[str | None, Field(alias="departmentOverride")] = None
+    department_param_id: Annotated[int | None, Field(alias="departmentParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Department parameter
+    """
+    description: str
+    """
+     Max length: 150;
+    """
+    end_date_flag: Annotated[bool | None, Field(alias="endDateFlag")] = None
+    end_date_override: Annotated[datetime | None, Field(alias="endDateOverride")] = None
+    end_date_param_id: Annotated[int | None, Field(alias="endDateParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's End Date parameter
+    """
+    generated_flag: Annotated[bool | None, Field(alias="generatedFlag")] = None
+    id: int | None = None
+    invoice_flag: Annotated[bool | None, Field(alias="invoiceFlag")] = None
+    invoice_override: Annotated[str | None, Field(alias="invoiceOverride")] = None
+    invoice_param_id: Annotated[int | None, Field(alias="invoiceParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Invoice Type parameter
+    """
+    location_default_flag: Annotated[bool | None, Field(alias="locationDefaultFlag")] = None
+    location_flag: Annotated[bool | None, Field(alias="locationFlag")] = None
+    location_override: Annotated[str | None, Field(alias="locationOverride")] = None
+    location_param_id: Annotated[int | None, Field(alias="locationParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Location parameter
+    """
+    marketing_campaign_flag: Annotated[bool | None, Field(alias="marketingCampaignFlag")] = None
+    marketing_campaign_override: Annotated[str | None, Field(alias="marketingCampaignOverride")] = None
+    marketing_campaign_param_id: Annotated[int | None, Field(alias="marketingCampaignParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Marketing Campaign parameter
+    """
+    member_flag: Annotated[bool | None, Field(alias="memberFlag")] = None
+    member_override: Annotated[str | None, Field(alias="memberOverride")] = None
+    member_param_id: Annotated[int | None, Field(alias="memberParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Member parameter
+    """
+    module: Literal[
+        "Companies", "Finance", "Marketing", "Procurement", "Project", "Sales", "ServiceDesk", "TimeExpense"
+    ]
+    """
+    The Module Name
+    """
+    name: str
+    """
+     Max length: 100;
+    """
+    opp_type_flag: Annotated[bool | None, Field(alias="oppTypeFlag")] = None
+    opp_type_override: Annotated[str | None, Field(alias="oppTypeOverride")] = None
+    opp_type_param_id: Annotated[int | None, Field(alias="oppTypeParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Opportunity Type parameter
+    """
+    opportunity_flag: Annotated[bool | None, Field(alias="opportunityFlag")] = None
+    opportunity_override: Annotated[str | None, Field(alias="opportunityOverride")] = None
+    opportunity_param_id: Annotated[int | None, Field(alias="opportunityParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Opportunity parameter
+    """
+    parameter_name_separator: Annotated[str | None, Field(alias="parameterNameSeparator")] = None
+    """
+     Max length: 50;
+    """
+    parameter_prefix: Annotated[str | None, Field(alias="parameterPrefix")] = None
+    """
+     Max length: 50;
+    """
+    parameter_separator: Annotated[str | None, Field(alias="parameterSeparator")] = None
+    """
+     Max length: 50;
+    """
+    parameter_suffix: Annotated[str | None, Field(alias="parameterSuffix")] = None
+    """
+     Max length: 50;
+    """
+    project_flag: Annotated[bool | None, Field(alias="projectFlag")] = None
+    project_override: Annotated[str | None, Field(alias="projectOverride")] = None
+    project_param_id: Annotated[int | None, Field(alias="projectParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Project parameter
+    """
+    project_type_flag: Annotated[bool | None, Field(alias="projectTypeFlag")] = None
+    project_type_override: Annotated[str | None, Field(alias="projectTypeOverride")] = None
+    project_type_param_id: Annotated[int | None, Field(alias="projectTypeParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Project Type parameter
+    """
+    report_link: Annotated[str, Field(alias="reportLink")]
+    service_board_default_flag: Annotated[bool | None, Field(alias="serviceBoardDefaultFlag")] = None
+    service_board_flag: Annotated[bool | None, Field(alias="serviceBoardFlag")] = None
+    service_board_override: Annotated[str | None, Field(alias="serviceBoardOverride")] = None
+    service_board_param_id: Annotated[int | None, Field(alias="serviceBoardParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Service Board parameter
+    """
+    service_status_flag: Annotated[bool | None, Field(alias="serviceStatusFlag")] = None
+    service_status_override: Annotated[str | None, Field(alias="serviceStatusOverride")] = None
+    service_status_param_id: Annotated[int | None, Field(alias="serviceStatusParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Service Status parameter
+    """
+    service_type_flag: Annotated[bool | None, Field(alias="serviceTypeFlag")] = None
+    service_type_override: Annotated[str | None, Field(alias="serviceTypeOverride")] = None
+    service_type_param_id: Annotated[int | None, Field(alias="serviceTypeParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Service Type parameter
+    """
+    start_date_flag: Annotated[bool | None, Field(alias="startDateFlag")] = None
+    start_date_override: Annotated[datetime | None, Field(alias="startDateOverride")] = None
+    start_date_param_id: Annotated[int | None, Field(alias="startDateParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Start Date parameter
+    """
+    territory_default_flag: Annotated[bool | None, Field(alias="territoryDefaultFlag")] = None
+    territory_flag: Annotated[bool | None, Field(alias="territoryFlag")] = None
+    territory_override: Annotated[str | None, Field(alias="territoryOverride")] = None
+    territory_param_id: Annotated[int | None, Field(alias="territoryParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Terriroty parameter
+    """
+    work_role_flag: Annotated[bool | None, Field(alias="workRoleFlag")] = None
+    work_role_override: Annotated[str | None, Field(alias="workRoleOverride")] = None
+    work_role_param_id: Annotated[int | None, Field(alias="workRoleParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Work Role parameter
+    """
+    work_type_flag: Annotated[bool | None, Field(alias="workTypeFlag")] = None
+    work_type_override: Annotated[str | None, Field(alias="workTypeOverride")] = None
+    work_type_param_id: Annotated[int | None, Field(alias="workTypeParamId")] = None
+    """
+    Parameter unique identifier for the Custom Report's Work Type parameter
+    """
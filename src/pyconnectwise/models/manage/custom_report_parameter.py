@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CustomReportParameter(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    caption_name: Annotated[str | None, Field(alias="captionName")] = None
+    """
+    Either a caption name or parameter name is required Max length: 50;
+    """
+    custom_report: Annotated[CustomReportReference | None, Field(alias="customReport")] = None
+    id: int | None = None
+    name: str | None = None
+    """
+    Either a caption name or parameter name is required Max length: 50;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.custom_report_reference import CustomReportReference
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class CwTimeZone(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    daylight_savings_flag: Annotated[bool | None, Field(alias="daylightSavingsFlag")] = None
+    """
+    Determined based on system library value for specified timeZone.
+                Not able to be used in query params at this time
+    """
+    end_date: Annotated[datetime | None, Field(alias="endDate")] = None
+    id: int | None = None
+    name: str | None = None
+    offset: float | None = None
+    """
+    The hours offset (+/-)
+    """
+    start_date: Annotated[datetime | None, Field(alias="startDate")] = None
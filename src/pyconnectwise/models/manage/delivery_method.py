@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class DeliveryMethod(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    email_flag: Annotated[bool | None, Field(alias="emailFlag")] = None
+    id: int | None = None
+    integration_active_flag: Annotated[bool | None, Field(alias="integrationActiveFlag")] = None
+    integration_email_flag: Annotated[bool | None, Field(alias="integrationEmailFlag")] = None
+    integration_print_flag: Annotated[bool | None, Field(alias="integrationPrintFlag")] = None
+    name: str
+    """
+     Max length: 50;
+    """
@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class DepartmentLocation(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_all_locations: Annotated[bool | None, Field(alias="addAllLocations")] = None
+    department: SystemDepartmentReference | None = None
+    department_manager: Annotated[MemberReference | None, Field(alias="departmentManager")] = None
+    dispatch: MemberReference | None = None
+    duty_manager: Annotated[MemberReference | None, Field(alias="dutyManager")] = None
+    id: int | None = None
+    ldap_config: Annotated[LdapConfigurationReference | None, Field(alias="ldapConfig")] = None
+    location: SystemLocationReference | None = None
+    remove_all_locations: Annotated[bool | None, Field(alias="removeAllLocations")] = None
+    service_manager: Annotated[MemberReference | None, Field(alias="serviceManager")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.ldap_configuration_reference import LdapConfigurationReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class DocumentFormData(ConnectWiseModel):
+    file: bytes | None = None
+    is_avatar: Annotated[bool | None, Field(alias="isAvatar")] = None
+    private_flag: Annotated[bool | None, Field(alias="privateFlag")] = None
+    read_only_flay: Annotated[bool | None, Field(alias="readOnlyFlay")] = None
+    record_id: Annotated[int | None, Field(alias="recordId")] = None
+    record_type: Annotated[str | None, Field(alias="recordType")] = None
+    title: str | None = None
+    url: str | None = None
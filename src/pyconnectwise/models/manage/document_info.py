@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class DocumentInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    file_name: Annotated[str | None, Field(alias="fileName")] = None
+    guid: Annotated[UUID | None, Field(example="00000000-0000-0000-0000-000000000000")] = None
+    html_template_flag: Annotated[bool | None, Field(alias="htmlTemplateFlag")] = None
+    id: int | None = None
+    image_flag: Annotated[bool | None, Field(alias="imageFlag")] = None
+    link_flag: Annotated[bool | None, Field(alias="linkFlag")] = None
+    owner: str | None = None
+    public_flag: Annotated[bool | None, Field(alias="publicFlag")] = None
+    read_only_flag: Annotated[bool | None, Field(alias="readOnlyFlag")] = None
+    server_file_name: Annotated[str | None, Field(alias="serverFileName")] = None
+    size: int | None = None
+    title: str | None = None
+    url_flag: Annotated[bool | None, Field(alias="urlFlag")] = None
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class DocumentSetup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    doc_path: Annotated[str | None, Field(alias="docPath")] = None
+    """
+     Max length: 100;
+    """
+    id: int | None = None
+    is_public_flag: Annotated[bool | None, Field(alias="isPublicFlag")] = None
+    template_output_path: Annotated[str | None, Field(alias="templateOutputPath")] = None
+    """
+     Max length: 200;
+    """
+    template_path: Annotated[str | None, Field(alias="templatePath")] = None
+    """
+     Max length: 200;
+    """
+    upload_as_link_flag: Annotated[bool | None, Field(alias="uploadAsLinkFlag")] = None
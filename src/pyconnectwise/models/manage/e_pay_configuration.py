@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EPayConfiguration(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    currency: CurrencyReference | None = None
+    encryption_key: Annotated[str | None, Field(alias="encryptionKey")] = None
+    """
+     Max length: 500;
+    """
+    id: int | None = None
+    initialization_vector: Annotated[str | None, Field(alias="initializationVector")] = None
+    """
+     Max length: 500;
+    """
+    location: SystemLocationReference | None = None
+    store_identifier: Annotated[str, Field(alias="storeIdentifier")]
+    """
+     Max length: 500;
+    """
+    url: str
+    """
+     Max length: 400;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
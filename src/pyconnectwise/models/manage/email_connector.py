@@ -0,0 +1,68 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EmailConnector(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_cc_flag: Annotated[bool | None, Field(alias="addCcFlag")] = None
+    bcc_email_to: Annotated[str | None, Field(alias="bccEmailTo")] = None
+    """
+     Max length: 250;
+    """
+    create_contact_flag: Annotated[bool | None, Field(alias="createContactFlag")] = None
+    default_company: Annotated[CompanyReference | None, Field(alias="defaultCompany")] = None
+    default_member: Annotated[MemberReference | None, Field(alias="defaultMember")] = None
+    department: SystemDepartmentReference | None = None
+    discard_duplicates_flag: Annotated[bool | None, Field(alias="discardDuplicatesFlag")] = None
+    email_errors_to: Annotated[str, Field(alias="emailErrorsTo")]
+    """
+     Max length: 50;
+    """
+    email_notify_from: Annotated[str | None, Field(alias="emailNotifyFrom")] = None
+    """
+     Max length: 50;
+    """
+    email_server_type: Annotated[Literal["IMAP", "Office365", "Google"] | None, Field(alias="emailServerType")] = None
+    google_email_setup: Annotated[GoogleEmailSetupReference | None, Field(alias="googleEmailSetup")] = None
+    id: int | None = None
+    imap_setup: Annotated[ImapSetupReference | None, Field(alias="imapSetup")] = None
+    item_override: Annotated[ServiceItemReference | None, Field(alias="itemOverride")] = None
+    location: SystemLocationReference | None = None
+    never_respond_flag: Annotated[bool | None, Field(alias="neverRespondFlag")] = None
+    no_response_flag: Annotated[bool | None, Field(alias="noResponseFlag")] = None
+    office365_email_setup: Annotated[Office365EmailSetupReference | None, Field(alias="office365EmailSetup")] = None
+    post_replies_to_ticket_flag: Annotated[bool | None, Field(alias="postRepliesToTicketFlag")] = None
+    priority_override: Annotated[PriorityReference | None, Field(alias="priorityOverride")] = None
+    response_email_for_existing: Annotated[str | None, Field(alias="responseEmailForExisting")] = None
+    response_email_for_new: Annotated[str | None, Field(alias="responseEmailForNew")] = None
+    service_board: Annotated[BoardReference | None, Field(alias="serviceBoard")] = None
+    set_email_to_default_contact_flag: Annotated[bool | None, Field(alias="setEmailToDefaultContactFlag")] = None
+    source_override: Annotated[ServiceSourceReference | None, Field(alias="sourceOverride")] = None
+    status_override: Annotated[ServiceStatusReference | None, Field(alias="statusOverride")] = None
+    sub_type_override: Annotated[ServiceSubTypeReference | None, Field(alias="subTypeOverride")] = None
+    type_override: Annotated[ServiceTypeReference | None, Field(alias="typeOverride")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.google_email_setup_reference import GoogleEmailSetupReference
+from pyconnectwise.models.manage.imap_setup_reference import ImapSetupReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.office365_email_setup_reference import Office365EmailSetupReference
+from pyconnectwise.models.manage.priority_reference import PriorityReference
+from pyconnectwise.models.manage.service_item_reference import ServiceItemReference
+from pyconnectwise.models.manage.service_source_reference import ServiceSourceReference
+from pyconnectwise.models.manage.service_status_reference import ServiceStatusReference
+from pyconnectwise.models.manage.service_sub_type_reference import ServiceSubTypeReference
+from pyconnectwise.models.manage.service_type_reference import ServiceTypeReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
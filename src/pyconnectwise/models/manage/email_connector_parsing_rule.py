@@ -0,0 +1,41 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EmailConnectorParsingRule(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    parsing_style: Annotated[EmailConnectorParsingStyleReference | None, Field(alias="parsingStyle")] = None
+    parsing_variable: Annotated[EmailConnectorParsingVariableReference | None, Field(alias="parsingVariable")] = None
+    priority: int
+    search_term: Annotated[str, Field(alias="searchTerm")]
+    """
+     Max length: 250;
+    """
+    service_board: Annotated[BoardReference | None, Field(alias="serviceBoard")] = None
+    service_item: Annotated[ServiceItemReference | None, Field(alias="serviceItem")] = None
+    service_priority: Annotated[PriorityReference | None, Field(alias="servicePriority")] = None
+    service_status: Annotated[ServiceStatusReference | None, Field(alias="serviceStatus")] = None
+    service_sub_type: Annotated[ServiceSubTypeReference | None, Field(alias="serviceSubType")] = None
+    service_type: Annotated[ServiceTypeReference | None, Field(alias="serviceType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.email_connector_parsing_style_reference import EmailConnectorParsingStyleReference
+from pyconnectwise.models.manage.email_connector_parsing_variable_reference import (
+    EmailConnectorParsingVariableReference,
+)
+from pyconnectwise.models.manage.priority_reference import PriorityReference
+from pyconnectwise.models.manage.service_item_reference import ServiceItemReference
+from pyconnectwise.models.manage.service_status_reference import ServiceStatusReference
+from pyconnectwise.models.manage.service_sub_type_reference import ServiceSubTypeReference
+from pyconnectwise.models.manage.service_type_reference import ServiceTypeReference
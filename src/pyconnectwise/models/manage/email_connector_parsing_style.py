@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EmailConnectorParsingStyle(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    parse_rule: Annotated[str, Field(alias="parseRule")]
+    """
+     Max length: 500;
+    """
+    parsing_type: Annotated[EmailConnectorParsingTypeReference | None, Field(alias="parsingType")] = None
+    priority: int
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.email_connector_parsing_type_reference import EmailConnectorParsingTypeReference
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EmailOpened(ConnectWiseModel):
+    campaign_id: Annotated[int | None, Field(alias="campaignId")] = None
+    contact_id: Annotated[int, Field(alias="contactId")]
+    date_opened: Annotated[datetime | None, Field(alias="dateOpened")] = None
+    id: int | None = None
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EmailToken(ConnectWiseModel):
+    address_flag: Annotated[bool | None, Field(alias="addressFlag")] = None
+    agreement_flag: Annotated[bool | None, Field(alias="agreementFlag")] = None
+    company_flag: Annotated[bool | None, Field(alias="companyFlag")] = None
+    config_flag: Annotated[bool | None, Field(alias="configFlag")] = None
+    contact_flag: Annotated[bool | None, Field(alias="contactFlag")] = None
+    description: str | None = None
+    id: int | None = None
+    invoice_flag: Annotated[bool | None, Field(alias="invoiceFlag")] = None
+    portal_password_flag: Annotated[bool | None, Field(alias="portalPasswordFlag")] = None
+    purchase_order_flag: Annotated[bool | None, Field(alias="purchaseOrderFlag")] = None
+    purchase_order_status_flag: Annotated[bool | None, Field(alias="purchaseOrderStatusFlag")] = None
+    rma_flag: Annotated[bool | None, Field(alias="rmaFlag")] = None
+    sales_flag: Annotated[bool | None, Field(alias="salesFlag")] = None
+    service_flag: Annotated[bool | None, Field(alias="serviceFlag")] = None
+    token: str | None = None
+    tracks_flag: Annotated[bool | None, Field(alias="tracksFlag")] = None
+    workflow_flag: Annotated[bool | None, Field(alias="workflowFlag")] = None
@@ -0,0 +1,12 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class EntityType(ConnectWiseModel):
+    code: str | None = None
+    id: int | None = None
+    name: str | None = None
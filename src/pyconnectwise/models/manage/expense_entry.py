@@ -0,0 +1,83 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ExpenseEntry(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement: AgreementReference | None = None
+    agreement_amount: Annotated[float | None, Field(alias="agreementAmount")] = None
+    amount: float
+    bill_amount: Annotated[float | None, Field(alias="billAmount")] = None
+    billable_option: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billableOption")
+    ] = None
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    charge_to_id: Annotated[int | None, Field(alias="chargeToId")] = None
+    charge_to_type: Annotated[
+        Literal["ServiceTicket", "ProjectTicket", "ChargeCode", "Activity"] | None, Field(alias="chargeToType")
+    ] = None
+    """
+    Company or chargeToType is required
+    """
+    classification: ClassificationReference | None = None
+    company: CompanyReference | None = None
+    currency: CurrencyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    date: datetime
+    expense_report: Annotated[ExpenseReportReference | None, Field(alias="expenseReport")] = None
+    id: int | None = None
+    invoice: InvoiceReference | None = None
+    invoice_amount: Annotated[float | None, Field(alias="invoiceAmount")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    member: MemberReference | None = None
+    mobile_guid: Annotated[UUID | None, Field(alias="mobileGuid")] = None
+    notes: str | None = None
+    odometer_end: Annotated[float | None, Field(alias="odometerEnd")] = None
+    odometer_start: Annotated[float | None, Field(alias="odometerStart")] = None
+    payment_method: Annotated[PaymentMethodReference | None, Field(alias="paymentMethod")] = None
+    phase: ProjectPhaseReference | None = None
+    project: ProjectReference | None = None
+    status: Literal[
+        "Open",
+        "Rejected",
+        "PendingApproval",
+        "ErrorsCorrected",
+        "PendingProjectApproval",
+        "ApprovedByTierOne",
+        "RejectBySecondTier",
+        "ApprovedByTierTwo",
+        "ReadyToBill",
+        "Billed",
+        "WrittenOff",
+        "BilledAgreement",
+    ] | None = None
+    taxes: list[ExpenseTax] | None = None
+    ticket: TicketReference | None = None
+    type: ExpenseTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.classification_reference import ClassificationReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.expense_report_reference import ExpenseReportReference
+from pyconnectwise.models.manage.expense_tax import ExpenseTax
+from pyconnectwise.models.manage.expense_type_reference import ExpenseTypeReference
+from pyconnectwise.models.manage.invoice_reference import InvoiceReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.payment_method_reference import PaymentMethodReference
+from pyconnectwise.models.manage.project_phase_reference import ProjectPhaseReference
+from pyconnectwise.models.manage.project_reference import ProjectReference
+from pyconnectwise.models.manage.ticket_reference import TicketReference
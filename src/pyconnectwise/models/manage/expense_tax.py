@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ExpenseTax(ConnectWiseModel):
+    amount: float | None = None
+    id: int | None = None
+    type: ExpenseTaxTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.expense_tax_type_reference import ExpenseTaxTypeReference
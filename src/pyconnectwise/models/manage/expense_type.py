@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ExpenseType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    advanced_amount_flag: Annotated[bool | None, Field(alias="advancedAmountFlag")] = None
+    amount_caption: Annotated[str, Field(alias="amountCaption")]
+    bill_expenses: Annotated[Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"], Field(alias="billExpenses")]
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    integration_x_ref: Annotated[str | None, Field(alias="integrationXRef")] = None
+    """
+     Max length: 50;
+    """
+    invoice_markup_amount: Annotated[float | None, Field(alias="invoiceMarkupAmount")] = None
+    invoice_markup_option: Annotated[Literal["Amount", "Mile", "Percent"], Field(alias="invoiceMarkupOption")]
+    max_amount: Annotated[float | None, Field(alias="maxAmount")] = None
+    mileage_flag: Annotated[bool | None, Field(alias="mileageFlag")] = None
+    name: str
+    """
+     Max length: 30;
+    """
+    quantity_flag: Annotated[bool | None, Field(alias="quantityFlag")] = None
+    reimbursement_rate: Annotated[float | None, Field(alias="reimbursementRate")] = None
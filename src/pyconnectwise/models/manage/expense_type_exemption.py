@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ExpenseTypeExemption(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    expense_type: Annotated[ExpenseTypeReference, Field(alias="expenseType")]
+    id: int | None = None
+    taxable_levels: Annotated[list[int] | None, Field(alias="taxableLevels")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.expense_type_reference import ExpenseTypeReference
@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ExportAccountingBatchRequest(ConnectWiseModel):
+    batch_identifier: Annotated[str | None, Field(alias="batchIdentifier")] = None
+    """
+     Max length: 50;
+    """
+    excluded_expense_ids: Annotated[list[int] | None, Field(alias="excludedExpenseIds")] = None
+    excluded_invoice_ids: Annotated[list[int] | None, Field(alias="excludedInvoiceIds")] = None
+    excluded_product_ids: Annotated[list[str] | None, Field(alias="excludedProductIds")] = None
+    export_expenses_flag: Annotated[bool | None, Field(alias="exportExpensesFlag")] = None
+    """
+    Batch export must include invoices, expenses, or products (procurement)
+    """
+    export_invoices_flag: Annotated[bool | None, Field(alias="exportInvoicesFlag")] = None
+    """
+    Batch export must include invoices, expenses, or products (procurement)
+    """
+    export_products_flag: Annotated[bool | None, Field(alias="exportProductsFlag")] = None
+    """
+    Batch export must include invoices, expenses, or products (procurement)
+    """
+    gl_interface_identifier: Annotated[str | None, Field(alias="glInterfaceIdentifier")] = None
+    included_expense_ids: Annotated[list[int] | None, Field(alias="includedExpenseIds")] = None
+    included_invoice_ids: Annotated[list[int] | None, Field(alias="includedInvoiceIds")] = None
+    included_product_ids: Annotated[list[str] | None, Field(alias="includedProductIds")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    summarize_invoices: Annotated[
+        Literal["Default", "Condensed", "Detailed"] | None, Field(alias="summarizeInvoices")
+    ] = None
+    thru_date: Annotated[datetime | None, Field(alias="thruDate")] = None
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class FileUploadSetting(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    global_file_size_limit: Annotated[int | None, Field(alias="globalFileSizeLimit")] = None
+    id: int | None = None
+    restrict_file_types_flag: Annotated[bool, Field(alias="restrictFileTypesFlag")]
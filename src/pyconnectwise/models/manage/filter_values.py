@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class FilterValues(ConnectWiseModel):
+    childconditions: str | None = None
+    conditions: str | None = None
+    customfieldconditions: str | None = None
+    order_by: Annotated[str | None, Field(alias="orderBy")] = None
@@ -0,0 +1,46 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class FinanceCurrency(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    currency_code: Annotated[CurrencyCodeReference | None, Field(alias="currencyCode")] = None
+    currency_identifier: Annotated[str, Field(alias="currencyIdentifier")]
+    """
+     Max length: 10;
+    """
+    decimal_separator: Annotated[str | None, Field(alias="decimalSeparator")] = None
+    """
+     Max length: 1;
+    """
+    display_id_flag: Annotated[bool | None, Field(alias="displayIdFlag")] = None
+    display_symbol_flag: Annotated[bool | None, Field(alias="displaySymbolFlag")] = None
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    negative_parentheses_flag: Annotated[bool | None, Field(alias="negativeParenthesesFlag")] = None
+    number_of_decimals: Annotated[int | None, Field(alias="numberOfDecimals")] = None
+    report_format: Annotated[str | None, Field(alias="reportFormat")] = None
+    right_align: Annotated[bool | None, Field(alias="rightAlign")] = None
+    symbol: str | None = None
+    """
+     Max length: 10;
+    """
+    thousands_separator: Annotated[str | None, Field(alias="thousandsSeparator")] = None
+    """
+     Max length: 1;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.currency_code_reference import CurrencyCodeReference
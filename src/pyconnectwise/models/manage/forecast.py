@@ -0,0 +1,54 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Forecast(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_revenue: Annotated[AgreementRevenueReference | None, Field(alias="agreementRevenue")] = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    currency: CurrencyReference | None = None
+    expected_probability: Annotated[int | None, Field(alias="expectedProbability")] = None
+    expense_revenue: Annotated[ExpenseRevenueReference | None, Field(alias="expenseRevenue")] = None
+    forecast_items: Annotated[list[ForecastItem] | None, Field(alias="forecastItems")] = None
+    forecast_revenue_totals: Annotated[ForecastRevenueReference | None, Field(alias="forecastRevenueTotals")] = None
+    forecast_total_with_taxes: Annotated[float | None, Field(alias="forecastTotalWithTaxes")] = None
+    id: int | None = None
+    inclusive_revenue_totals: Annotated[InclusiveRevenueReference | None, Field(alias="inclusiveRevenueTotals")] = None
+    lost_revenue: Annotated[LostRevenueReference | None, Field(alias="lostRevenue")] = None
+    open_revenue: Annotated[OpenRevenueReference | None, Field(alias="openRevenue")] = None
+    other_revenue1: Annotated[Other1RevenueReference | None, Field(alias="otherRevenue1")] = None
+    other_revenue2: Annotated[Other2RevenueReference | None, Field(alias="otherRevenue2")] = None
+    product_revenue: Annotated[ProductRevenueReference | None, Field(alias="productRevenue")] = None
+    recurring_total: Annotated[float | None, Field(alias="recurringTotal")] = None
+    sales_tax_revenue: Annotated[float | None, Field(alias="salesTaxRevenue")] = None
+    service_revenue: Annotated[ServiceRevenueReference | None, Field(alias="serviceRevenue")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    time_revenue: Annotated[TimeRevenueReference | None, Field(alias="timeRevenue")] = None
+    won_revenue: Annotated[WonRevenueReference | None, Field(alias="wonRevenue")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_revenue_reference import AgreementRevenueReference
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.expense_revenue_reference import ExpenseRevenueReference
+from pyconnectwise.models.manage.forecast_item import ForecastItem
+from pyconnectwise.models.manage.forecast_revenue_reference import ForecastRevenueReference
+from pyconnectwise.models.manage.inclusive_revenue_reference import InclusiveRevenueReference
+from pyconnectwise.models.manage.lost_revenue_reference import LostRevenueReference
+from pyconnectwise.models.manage.open_revenue_reference import OpenRevenueReference
+from pyconnectwise.models.manage.other1_revenue_reference import Other1RevenueReference
+from pyconnectwise.models.manage.other2_revenue_reference import Other2RevenueReference
+from pyconnectwise.models.manage.product_revenue_reference import ProductRevenueReference
+from pyconnectwise.models.manage.service_revenue_reference import ServiceRevenueReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
+from pyconnectwise.models.manage.time_revenue_reference import TimeRevenueReference
+from pyconnectwise.models.manage.won_revenue_reference import WonRevenueReference
@@ -0,0 +1,62 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ForecastItem(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    bill_cycle: Annotated[BillingCycleReference | None, Field(alias="billCycle")] = None
+    catalog_item: Annotated[IvItemReference | None, Field(alias="catalogItem")] = None
+    cost: float | None = None
+    cycle_basis: Annotated[str | None, Field(alias="cycleBasis")] = None
+    cycles: int | None = None
+    forecast_description: Annotated[str | None, Field(alias="forecastDescription")] = None
+    """
+     Max length: 50;
+    """
+    forecast_type: Annotated[
+        Literal["Other1", "Other2", "Agreement", "Product", "Service"], Field(alias="forecastType")
+    ]
+    id: int | None = None
+    include_flag: Annotated[bool | None, Field(alias="includeFlag")] = None
+    link_flag: Annotated[bool | None, Field(alias="linkFlag")] = None
+    margin: float | None = None
+    opportunity: OpportunityReference | None = None
+    percentage: int | None = None
+    product_class: Annotated[str | None, Field(alias="productClass")] = None
+    product_description: Annotated[str | None, Field(alias="productDescription")] = None
+    quantity: float | None = None
+    quote_werks_doc_name: Annotated[str | None, Field(alias="quoteWerksDocName")] = None
+    """
+     Max length: 255;
+    """
+    quote_werks_doc_no: Annotated[str | None, Field(alias="quoteWerksDocNo")] = None
+    """
+     Max length: 20;
+    """
+    quote_werks_quantity: Annotated[int | None, Field(alias="quoteWerksQuantity")] = None
+    recurring_cost: Annotated[float | None, Field(alias="recurringCost")] = None
+    recurring_date_end: Annotated[datetime | None, Field(alias="recurringDateEnd")] = None
+    recurring_date_start: Annotated[datetime | None, Field(alias="recurringDateStart")] = None
+    recurring_flag: Annotated[bool | None, Field(alias="recurringFlag")] = None
+    recurring_revenue: Annotated[float | None, Field(alias="recurringRevenue")] = None
+    revenue: float | None = None
+    sequence_number: Annotated[float | None, Field(alias="sequenceNumber")] = None
+    status: OpportunityStatusReference | None = None
+    sub_number: Annotated[int | None, Field(alias="subNumber")] = None
+    taxable_flag: Annotated[bool | None, Field(alias="taxableFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_cycle_reference import BillingCycleReference
+from pyconnectwise.models.manage.iv_item_reference import IvItemReference
+from pyconnectwise.models.manage.opportunity_reference import OpportunityReference
+from pyconnectwise.models.manage.opportunity_status_reference import OpportunityStatusReference
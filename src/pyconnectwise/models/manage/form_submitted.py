@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class FormSubmitted(ConnectWiseModel):
+    campaign_id: Annotated[int | None, Field(alias="campaignId")] = None
+    contact_id: Annotated[int, Field(alias="contactId")]
+    date_submitted: Annotated[datetime | None, Field(alias="dateSubmitted")] = None
+    id: int | None = None
+    page_sub_type: Annotated[str | None, Field(alias="pageSubType")] = None
+    page_type: Annotated[str | None, Field(alias="pageType")] = None
+    query_string: Annotated[str | None, Field(alias="queryString")] = None
+    status: str | None = None
+    topic: str | None = None
+    url: str
+    """
+     Max length: 2083;
+    """
+    version: str | None = None
@@ -0,0 +1,11 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.manage.accounting_package import AccountingPackage
+
+
+class GenericIdIdentifierReference(AccountingPackage):
+    pass
@@ -0,0 +1,138 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLAccount(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    cogs1: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs10: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs2: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs3: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs4: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs5: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs6: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs7: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs8: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs9: str | None = None
+    """
+     Max length: 255;
+    """
+    gl_type: Annotated[
+        Literal[
+            "AP",
+            "AR",
+            "EE",
+            "EI",
+            "EO",
+            "IA",
+            "IT",
+            "P",
+            "PF",
+            "R",
+            "RA",
+            "RD",
+            "RE",
+            "RP",
+            "ST",
+            "SD",
+            "ET",
+            "FT",
+            "PT",
+        ],
+        Field(alias="glType"),
+    ]
+    id: int | None = None
+    inventory: str | None = None
+    """
+     Max length: 255;
+    """
+    mapped_record: Annotated[MappedRecordReference, Field(alias="mappedRecord")]
+    mapped_type: Annotated[MappedTypeReference, Field(alias="mappedType")]
+    product_id: Annotated[str | None, Field(alias="productId")] = None
+    """
+     Max length: 255;
+    """
+    sales_code: Annotated[str | None, Field(alias="salesCode")] = None
+    """
+     Max length: 255;
+    """
+    segment1: str | None = None
+    """
+     Max length: 255;
+    """
+    segment10: str | None = None
+    """
+     Max length: 255;
+    """
+    segment2: str | None = None
+    """
+     Max length: 255;
+    """
+    segment3: str | None = None
+    """
+     Max length: 255;
+    """
+    segment4: str | None = None
+    """
+     Max length: 255;
+    """
+    segment5: str | None = None
+    """
+     Max length: 255;
+    """
+    segment6: str | None = None
+    """
+     Max length: 255;
+    """
+    segment7: str | None = None
+    """
+     Max length: 255;
+    """
+    segment8: str | None = None
+    """
+     Max length: 255;
+    """
+    segment9: str | None = None
+    """
+     Max length: 255;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.mapped_record_reference import MappedRecordReference
+from pyconnectwise.models.manage.mapped_type_reference import MappedTypeReference
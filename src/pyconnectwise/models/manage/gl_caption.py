@@ -0,0 +1,105 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLCaption(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    cogs1: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs10: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs2: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs3: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs4: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs5: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs6: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs7: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs8: str | None = None
+    """
+     Max length: 255;
+    """
+    cogs9: str | None = None
+    """
+     Max length: 255;
+    """
+    id: int | None = None
+    segment1: str | None = None
+    """
+     Max length: 255;
+    """
+    segment10: str | None = None
+    """
+     Max length: 255;
+    """
+    segment10type: Literal["Account", "Class"] | None = None
+    segment1type: Literal["Account", "Class"] | None = None
+    segment2: str | None = None
+    """
+     Max length: 255;
+    """
+    segment2type: Literal["Account", "Class"] | None = None
+    segment3: str | None = None
+    """
+     Max length: 255;
+    """
+    segment3type: Literal["Account", "Class"] | None = None
+    segment4: str | None = None
+    """
+     Max length: 255;
+    """
+    segment4type: Literal["Account", "Class"] | None = None
+    segment5: str | None = None
+    """
+     Max length: 255;
+    """
+    segment5type: Literal["Account", "Class"] | None = None
+    segment6: str | None = None
+    """
+     Max length: 255;
+    """
+    segment6type: Literal["Account", "Class"] | None = None
+    segment7: str | None = None
+    """
+     Max length: 255;
+    """
+    segment7type: Literal["Account", "Class"] | None = None
+    segment8: str | None = None
+    """
+     Max length: 255;
+    """
+    segment8type: Literal["Account", "Class"] | None = None
+    segment9: str | None = None
+    """
+     Max length: 255;
+    """
+    segment9type: Literal["Account", "Class"] | None = None
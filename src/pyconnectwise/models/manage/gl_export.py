@@ -0,0 +1,38 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExport(ConnectWiseModel):
+    adjustment_transactions: Annotated[
+        list[GLExportAdjustmentTransaction] | None, Field(alias="adjustmentTransactions")
+    ] = None
+    customers: list[GLExportCustomer] | None = None
+    expense_bills: Annotated[list[GLExportExpenseBill] | None, Field(alias="expenseBills")] = None
+    expenses: list[GLExportExpense] | None = None
+    export_settings: Annotated[GLExportSettings | None, Field(alias="exportSettings")] = None
+    inventory_transfers: Annotated[list[GLExportInventoryTransfer] | None, Field(alias="inventoryTransfers")] = None
+    purchase_transactions: Annotated[
+        list[GLExportPurchaseTransaction] | None, Field(alias="purchaseTransactions")
+    ] = None
+    transactions: list[GLExportTransaction] | None = None
+    vendors: list[GLExportVendor] | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.gl_export_adjustment_transaction import GLExportAdjustmentTransaction
+from pyconnectwise.models.manage.gl_export_customer import GLExportCustomer
+from pyconnectwise.models.manage.gl_export_expense import GLExportExpense
+from pyconnectwise.models.manage.gl_export_expense_bill import GLExportExpenseBill
+from pyconnectwise.models.manage.gl_export_inventory_transfer import GLExportInventoryTransfer
+from pyconnectwise.models.manage.gl_export_purchase_transaction import GLExportPurchaseTransaction
+from pyconnectwise.models.manage.gl_export_settings import GLExportSettings
+from pyconnectwise.models.manage.gl_export_transaction import GLExportTransaction
+from pyconnectwise.models.manage.gl_export_vendor import GLExportVendor
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportAdjustmentTransaction(ConnectWiseModel):
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    adjustment_description: Annotated[str | None, Field(alias="adjustmentDescription")] = None
+    adjustment_detail: Annotated[
+        list[GLExportAdjustmentTransactionDetail] | None, Field(alias="adjustmentDetail")
+    ] = None
+    document_date: Annotated[datetime | None, Field(alias="documentDate")] = None
+    document_type: Annotated[str | None, Field(alias="documentType")] = None
+    gl_class: Annotated[str | None, Field(alias="glClass")] = None
+    gl_type_id: Annotated[str | None, Field(alias="glTypeID")] = None
+    id: str | None = None
+    memo: str | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.gl_export_adjustment_transaction_detail import GLExportAdjustmentTransactionDetail
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportAdjustmentTransactionDetail(ConnectWiseModel):
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    cost: float | None = None
+    cost_account_number: Annotated[str | None, Field(alias="costAccountNumber")] = None
+    description: str | None = None
+    gl_class: Annotated[str | None, Field(alias="glClass")] = None
+    inventory_account_number: Annotated[str | None, Field(alias="inventoryAccountNumber")] = None
+    item: IvItemReference | None = None
+    memo: str | None = None
+    product_account_number: Annotated[str | None, Field(alias="productAccountNumber")] = None
+    quantity: int | None = None
+    total: float | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.iv_item_reference import IvItemReference
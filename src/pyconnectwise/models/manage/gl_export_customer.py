@@ -0,0 +1,53 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportCustomer(ConnectWiseModel):
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    billing_terms_xref: Annotated[str | None, Field(alias="billingTermsXref")] = None
+    city_tax_agency_xref: Annotated[str | None, Field(alias="cityTaxAgencyXref")] = None
+    city_tax_rate: Annotated[float | None, Field(alias="cityTaxRate")] = None
+    city_tax_xref: Annotated[str | None, Field(alias="cityTaxXref")] = None
+    company: CompanyReference | None = None
+    company_type: Annotated[CompanyTypeReference | None, Field(alias="companyType")] = None
+    composite_tax_agency_xref: Annotated[str | None, Field(alias="compositeTaxAgencyXref")] = None
+    composite_tax_rate: Annotated[float | None, Field(alias="compositeTaxRate")] = None
+    composite_tax_xref: Annotated[str | None, Field(alias="compositeTaxXref")] = None
+    contact: ContactReference | None = None
+    country_tax_agency_xref: Annotated[str | None, Field(alias="countryTaxAgencyXref")] = None
+    country_tax_rate: Annotated[float | None, Field(alias="countryTaxRate")] = None
+    country_tax_xref: Annotated[str | None, Field(alias="countryTaxXref")] = None
+    county_tax_agency_xref: Annotated[str | None, Field(alias="countyTaxAgencyXref")] = None
+    county_tax_rate: Annotated[float | None, Field(alias="countyTaxRate")] = None
+    county_tax_xref: Annotated[str | None, Field(alias="countyTaxXref")] = None
+    currency: CurrencyReference | None = None
+    due_days: Annotated[int | None, Field(alias="dueDays")] = None
+    site: SiteReference | None = None
+    state_tax_agency_xref: Annotated[str | None, Field(alias="stateTaxAgencyXref")] = None
+    state_tax_rate: Annotated[float | None, Field(alias="stateTaxRate")] = None
+    state_tax_xref: Annotated[str | None, Field(alias="stateTaxXref")] = None
+    tax_agency_xref: Annotated[str | None, Field(alias="taxAgencyXref")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    tax_group_rate: Annotated[float | None, Field(alias="taxGroupRate")] = None
+    tax_levels: Annotated[list[GLExportCustomerTaxLevel] | None, Field(alias="taxLevels")] = None
+    taxable: bool | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.company_type_reference import CompanyTypeReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.gl_export_customer_tax_level import GLExportCustomerTaxLevel
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
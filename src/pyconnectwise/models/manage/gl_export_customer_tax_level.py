@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportCustomerTaxLevel(ConnectWiseModel):
+    agency_xref: Annotated[str | None, Field(alias="agencyXref")] = None
+    tax_code_xref: Annotated[str | None, Field(alias="taxCodeXref")] = None
+    tax_level: Annotated[int | None, Field(alias="taxLevel")] = None
+    tax_rate: Annotated[float | None, Field(alias="taxRate")] = None
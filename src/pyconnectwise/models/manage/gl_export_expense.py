@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportExpense(ConnectWiseModel):
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    ap_account_number: Annotated[str | None, Field(alias="apAccountNumber")] = None
+    ap_class: Annotated[str | None, Field(alias="apClass")] = None
+    company: CompanyReference | None = None
+    company_account_number: Annotated[str | None, Field(alias="companyAccountNumber")] = None
+    currency: CurrencyReference | None = None
+    description: str | None = None
+    document_date: Annotated[datetime | None, Field(alias="documentDate")] = None
+    document_type: Annotated[str | None, Field(alias="documentType")] = None
+    gl_class: Annotated[str | None, Field(alias="glClass")] = None
+    gl_type_id: Annotated[str | None, Field(alias="glTypeId")] = None
+    id: int | None = None
+    member: MemberReference | None = None
+    memo: str | None = None
+    offset: GLExportExpenseOffset | None = None
+    period_end_date: Annotated[datetime | None, Field(alias="periodEndDate")] = None
+    period_start_date: Annotated[datetime | None, Field(alias="periodStartDate")] = None
+    project: ProjectReference | None = None
+    total: float | None = None
+    vendor_number: Annotated[str | None, Field(alias="vendorNumber")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.gl_export_expense_offset import GLExportExpenseOffset
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.project_reference import ProjectReference
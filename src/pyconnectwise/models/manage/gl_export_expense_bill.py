@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportExpenseBill(ConnectWiseModel):
+    ap_account_number: Annotated[str | None, Field(alias="apAccountNumber")] = None
+    currency: CurrencyReference | None = None
+    detail: list[GLExportExpenseBillDetail] | None = None
+    document_date: Annotated[datetime | None, Field(alias="documentDate")] = None
+    document_number: Annotated[str | None, Field(alias="documentNumber")] = None
+    document_type: Annotated[str | None, Field(alias="documentType")] = None
+    gl_class: Annotated[str | None, Field(alias="glClass")] = None
+    id: int | None = None
+    member: MemberReference | None = None
+    memo: str | None = None
+    total: float | None = None
+    vendor_number: Annotated[str | None, Field(alias="vendorNumber")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.gl_export_expense_bill_detail import GLExportExpenseBillDetail
+from pyconnectwise.models.manage.member_reference import MemberReference
@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportExpenseBillDetail(ConnectWiseModel):
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    billable: bool | None = None
+    company: CompanyReference | None = None
+    company_advance: Annotated[bool | None, Field(alias="companyAdvance")] = None
+    currency: CurrencyReference | None = None
+    document_date: Annotated[datetime | None, Field(alias="documentDate")] = None
+    expense_class: Annotated[ClassificationReference | None, Field(alias="expenseClass")] = None
+    gl_type_id: Annotated[str | None, Field(alias="glTypeId")] = None
+    id: list[int] | None = None
+    memo: str | None = None
+    reimbursable: bool | None = None
+    total: float | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.classification_reference import ClassificationReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportExpenseOffset(ConnectWiseModel):
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    description: str | None = None
+    document_date: Annotated[datetime | None, Field(alias="documentDate")] = None
+    document_type: Annotated[str | None, Field(alias="documentType")] = None
+    gl_class: Annotated[str | None, Field(alias="glClass")] = None
+    gl_type_id: Annotated[str | None, Field(alias="glTypeId")] = None
+    id: int | None = None
+    member: MemberReference | None = None
+    memo: str | None = None
+    total: float | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
@@ -0,0 +1,64 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportInventoryTransfer(ConnectWiseModel):
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    bin: WarehouseBinReference | None = None
+    cogs_xref: Annotated[str | None, Field(alias="cogsXref")] = None
+    cost: float | None = None
+    cost_account_number: Annotated[str | None, Field(alias="costAccountNumber")] = None
+    currency: CurrencyReference | None = None
+    description: str | None = None
+    document_date: Annotated[datetime | None, Field(alias="documentDate")] = None
+    document_type: Annotated[str | None, Field(alias="documentType")] = None
+    gl_class: Annotated[str | None, Field(alias="glClass")] = None
+    gl_item_id: Annotated[str | None, Field(alias="glItemId")] = None
+    gl_type_id: Annotated[str | None, Field(alias="glTypeId")] = None
+    id: str | None = None
+    inventory_account_number: Annotated[str | None, Field(alias="inventoryAccountNumber")] = None
+    inventory_xref: Annotated[str | None, Field(alias="inventoryXref")] = None
+    item: IvItemReference | None = None
+    item_description: Annotated[str | None, Field(alias="itemDescription")] = None
+    item_price: Annotated[float | None, Field(alias="itemPrice")] = None
+    item_type_xref: Annotated[str | None, Field(alias="itemTypeXref")] = None
+    location_xref: Annotated[str | None, Field(alias="locationXref")] = None
+    memo: str | None = None
+    offset: GLExportInventoryTransferOffset | None = None
+    price_level_xref: Annotated[str | None, Field(alias="priceLevelXref")] = None
+    quantity: float | None = None
+    sales_code: Annotated[str | None, Field(alias="salesCode")] = None
+    sales_description: Annotated[str | None, Field(alias="salesDescription")] = None
+    serial_numbers: Annotated[str | None, Field(alias="serialNumbers")] = None
+    serialized_flag: Annotated[bool | None, Field(alias="serializedFlag")] = None
+    sub_category: Annotated[ProductSubCategoryReference | None, Field(alias="subCategory")] = None
+    tax_note: Annotated[str | None, Field(alias="taxNote")] = None
+    taxable: bool | None = None
+    total: float | None = None
+    transfer_from_bin: Annotated[WarehouseBinReference | None, Field(alias="transferFromBin")] = None
+    transfer_from_location_xref: Annotated[str | None, Field(alias="transferFromLocationXref")] = None
+    transfer_id: Annotated[int | None, Field(alias="transferId")] = None
+    transfer_to_bin: Annotated[WarehouseBinReference | None, Field(alias="transferToBin")] = None
+    transfer_to_location_xref: Annotated[str | None, Field(alias="transferToLocationXref")] = None
+    unit_of_measure: Annotated[UnitOfMeasureReference | None, Field(alias="unitOfMeasure")] = None
+    uom_schedule_xref: Annotated[str | None, Field(alias="uomScheduleXref")] = None
+    warehouse: WarehouseReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.gl_export_inventory_transfer_offset import GLExportInventoryTransferOffset
+from pyconnectwise.models.manage.iv_item_reference import IvItemReference
+from pyconnectwise.models.manage.product_sub_category_reference import ProductSubCategoryReference
+from pyconnectwise.models.manage.unit_of_measure_reference import UnitOfMeasureReference
+from pyconnectwise.models.manage.warehouse_bin_reference import WarehouseBinReference
+from pyconnectwise.models.manage.warehouse_reference import WarehouseReference
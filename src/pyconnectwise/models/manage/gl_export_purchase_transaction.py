@@ -0,0 +1,73 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportPurchaseTransaction(ConnectWiseModel):
+    ap_account_number: Annotated[str | None, Field(alias="apAccountNumber")] = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    billing_terms_xref: Annotated[str | None, Field(alias="billingTermsXref")] = None
+    city_tax_xref: Annotated[str | None, Field(alias="cityTaxXref")] = None
+    company: CompanyReference | None = None
+    company_type: Annotated[CompanyTypeReference | None, Field(alias="companyType")] = None
+    contact: ContactReference | None = None
+    county_tax_xref: Annotated[str | None, Field(alias="countyTaxXref")] = None
+    currency: CurrencyReference | None = None
+    description: str | None = None
+    document_date: Annotated[datetime | None, Field(alias="documentDate")] = None
+    document_number: Annotated[str | None, Field(alias="documentNumber")] = None
+    dropship_flag: Annotated[bool | None, Field(alias="dropshipFlag")] = None
+    due_days: Annotated[int | None, Field(alias="dueDays")] = None
+    freight_amount: Annotated[float | None, Field(alias="freightAmount")] = None
+    freight_packing_slip: Annotated[str | None, Field(alias="freightPackingSlip")] = None
+    id: str | None = None
+    memo: str | None = None
+    packing_slip: Annotated[str | None, Field(alias="packingSlip")] = None
+    purchase_class: Annotated[str | None, Field(alias="purchaseClass")] = None
+    purchase_date: Annotated[datetime | None, Field(alias="purchaseDate")] = None
+    purchase_detail: Annotated[list[GLExportPurchaseTransactionDetail] | None, Field(alias="purchaseDetail")] = None
+    purchase_detail_tax: Annotated[
+        list[GLExportPurchaseTransactionDetailTax] | None, Field(alias="purchaseDetailTax")
+    ] = None
+    purchase_header_freight_taxable_flag: Annotated[bool | None, Field(alias="purchaseHeaderFreightTaxableFlag")] = None
+    purchase_header_tax_group: Annotated[str | None, Field(alias="purchaseHeaderTaxGroup")] = None
+    purchase_header_taxable_flag: Annotated[bool | None, Field(alias="purchaseHeaderTaxableFlag")] = None
+    ship_to_company: Annotated[CompanyReference | None, Field(alias="shipToCompany")] = None
+    ship_to_company_account_number: Annotated[str | None, Field(alias="shipToCompanyAccountNumber")] = None
+    ship_to_company_type: Annotated[CompanyTypeReference | None, Field(alias="shipToCompanyType")] = None
+    ship_to_contact: Annotated[ContactReference | None, Field(alias="shipToContact")] = None
+    ship_to_site: Annotated[SiteReference | None, Field(alias="shipToSite")] = None
+    ship_to_tax_group: Annotated[str | None, Field(alias="shipToTaxGroup")] = None
+    site: SiteReference | None = None
+    state_tax_xref: Annotated[str | None, Field(alias="stateTaxXref")] = None
+    tax_agency_xref: Annotated[str | None, Field(alias="taxAgencyXref")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    tax_group_rate: Annotated[float | None, Field(alias="taxGroupRate")] = None
+    tax_levels: Annotated[list[GLExportPurchaseTransactionTaxLevel] | None, Field(alias="taxLevels")] = None
+    total: float | None = None
+    use_avalara_tax_flag: Annotated[bool | None, Field(alias="useAvalaraTaxFlag")] = None
+    vendor_account_number: Annotated[str | None, Field(alias="vendorAccountNumber")] = None
+    vendor_invoice_date: Annotated[datetime | None, Field(alias="vendorInvoiceDate")] = None
+    vendor_invoice_number: Annotated[str | None, Field(alias="vendorInvoiceNumber")] = None
+    vendor_number: Annotated[str | None, Field(alias="vendorNumber")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.company_type_reference import CompanyTypeReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.gl_export_purchase_transaction_detail import GLExportPurchaseTransactionDetail
+from pyconnectwise.models.manage.gl_export_purchase_transaction_detail_tax import GLExportPurchaseTransactionDetailTax
+from pyconnectwise.models.manage.gl_export_purchase_transaction_tax_level import GLExportPurchaseTransactionTaxLevel
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
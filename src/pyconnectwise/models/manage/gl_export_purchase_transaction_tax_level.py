@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportPurchaseTransactionTaxLevel(ConnectWiseModel):
+    tax_code_xref: Annotated[str | None, Field(alias="taxCodeXref")] = None
+    tax_level: Annotated[int | None, Field(alias="taxLevel")] = None
@@ -0,0 +1,87 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportTransaction(ConnectWiseModel):
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    agreement_pre_payment_flag: Annotated[bool | None, Field(alias="agreementPrePaymentFlag")] = None
+    attention: str | None = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    billing_terms_xref: Annotated[str | None, Field(alias="billingTermsXref")] = None
+    billing_type: Annotated[str | None, Field(alias="billingType")] = None
+    city_tax: Annotated[float | None, Field(alias="cityTax")] = None
+    company: CompanyReference | None = None
+    company_account_number: Annotated[str | None, Field(alias="companyAccountNumber")] = None
+    company_type: Annotated[CompanyTypeReference | None, Field(alias="companyType")] = None
+    county_tax: Annotated[float | None, Field(alias="countyTax")] = None
+    county_tax_xref: Annotated[str | None, Field(alias="countyTaxXref")] = None
+    currency: CurrencyReference | None = None
+    description: str | None = None
+    detail: list[GLExportTransactionDetail] | None = None
+    document_date: Annotated[datetime | None, Field(alias="documentDate")] = None
+    document_number: Annotated[str | None, Field(alias="documentNumber")] = None
+    document_type: Annotated[str | None, Field(alias="documentType")] = None
+    due_date: Annotated[datetime | None, Field(alias="dueDate")] = None
+    due_days: Annotated[int | None, Field(alias="dueDays")] = None
+    email_delivery_flag: Annotated[bool | None, Field(alias="emailDeliveryFlag")] = None
+    gl_class: Annotated[str | None, Field(alias="glClass")] = None
+    gl_entry_ids: Annotated[str | None, Field(alias="glEntryIds")] = None
+    gl_type_id: Annotated[str | None, Field(alias="glTypeId")] = None
+    id: int | None = None
+    memo: str | None = None
+    piggy_back_flag: Annotated[bool | None, Field(alias="piggyBackFlag")] = None
+    print_delivery_flag: Annotated[bool | None, Field(alias="printDeliveryFlag")] = None
+    project: ProjectReference | None = None
+    purchase_order: Annotated[PurchaseOrderReference | None, Field(alias="purchaseOrder")] = None
+    sales_rep_id: Annotated[str | None, Field(alias="salesRepId")] = None
+    sales_rep_name: Annotated[str | None, Field(alias="salesRepName")] = None
+    sales_tax: Annotated[float | None, Field(alias="salesTax")] = None
+    sales_territory: Annotated[str | None, Field(alias="salesTerritory")] = None
+    send_avalara_tax_flag: Annotated[bool | None, Field(alias="sendAvalaraTaxFlag")] = None
+    ship_contact: Annotated[str | None, Field(alias="shipContact")] = None
+    ship_site: Annotated[SiteReference | None, Field(alias="shipSite")] = None
+    ship_to_company: Annotated[CompanyReference | None, Field(alias="shipToCompany")] = None
+    ship_to_company_account_number: Annotated[str | None, Field(alias="shipToCompanyAccountNumber")] = None
+    ship_to_company_type: Annotated[CompanyTypeReference | None, Field(alias="shipToCompanyType")] = None
+    ship_to_tax_id: Annotated[str | None, Field(alias="shipToTaxId")] = None
+    site: SiteReference | None = None
+    state_tax: Annotated[float | None, Field(alias="stateTax")] = None
+    state_tax_xref: Annotated[str | None, Field(alias="stateTaxXref")] = None
+    tax_account_number: Annotated[str | None, Field(alias="taxAccountNumber")] = None
+    tax_agency_xref: Annotated[str | None, Field(alias="taxAgencyXref")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    tax_dp_applied_flag: Annotated[bool | None, Field(alias="taxDpAppliedFlag")] = None
+    tax_group_rate: Annotated[float | None, Field(alias="taxGroupRate")] = None
+    tax_id: Annotated[str | None, Field(alias="taxId")] = None
+    tax_levels: Annotated[list[GLExportTransactionTaxLevel] | None, Field(alias="taxLevels")] = None
+    taxable: bool | None = None
+    taxable_amount1: Annotated[float | None, Field(alias="taxableAmount1")] = None
+    taxable_amount2: Annotated[float | None, Field(alias="taxableAmount2")] = None
+    taxable_amount3: Annotated[float | None, Field(alias="taxableAmount3")] = None
+    taxable_amount4: Annotated[float | None, Field(alias="taxableAmount4")] = None
+    taxable_amount5: Annotated[float | None, Field(alias="taxableAmount5")] = None
+    taxable_total: Annotated[float | None, Field(alias="taxableTotal")] = None
+    total: float | None = None
+    use_avalara_flag: Annotated[bool | None, Field(alias="useAvalaraFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.company_type_reference import CompanyTypeReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.gl_export_transaction_detail import GLExportTransactionDetail
+from pyconnectwise.models.manage.gl_export_transaction_tax_level import GLExportTransactionTaxLevel
+from pyconnectwise.models.manage.project_reference import ProjectReference
+from pyconnectwise.models.manage.purchase_order_reference import PurchaseOrderReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
@@ -0,0 +1,80 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportTransactionDetail(ConnectWiseModel):
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    cogs_xref: Annotated[str | None, Field(alias="cogsXref")] = None
+    cost: float | None = None
+    cost_account_number: Annotated[str | None, Field(alias="costAccountNumber")] = None
+    currency: CurrencyReference | None = None
+    description: str | None = None
+    document_date: Annotated[datetime | None, Field(alias="documentDate")] = None
+    document_type: Annotated[str | None, Field(alias="documentType")] = None
+    drop_shipped_flag: Annotated[bool | None, Field(alias="dropShippedFlag")] = None
+    gl_class: Annotated[str | None, Field(alias="glClass")] = None
+    gl_item_id: Annotated[str | None, Field(alias="glItemId")] = None
+    gl_type_id: Annotated[str | None, Field(alias="glTypeId")] = None
+    id: int | None = None
+    inventory_account_number: Annotated[str | None, Field(alias="inventoryAccountNumber")] = None
+    inventory_xref: Annotated[str | None, Field(alias="inventoryXref")] = None
+    invoice_summary_option: Annotated[str | None, Field(alias="invoiceSummaryOption")] = None
+    item: IvItemReference | None = None
+    item_cost: Annotated[float | None, Field(alias="itemCost")] = None
+    item_description: Annotated[str | None, Field(alias="itemDescription")] = None
+    item_price: Annotated[float | None, Field(alias="itemPrice")] = None
+    item_taxable_flag: Annotated[bool | None, Field(alias="itemTaxableFlag")] = None
+    item_type_xref: Annotated[str | None, Field(alias="itemTypeXref")] = None
+    location_xref: Annotated[str | None, Field(alias="locationXref")] = None
+    memo: str | None = None
+    price_level_xref: Annotated[str | None, Field(alias="priceLevelXref")] = None
+    product: ProductReference | None = None
+    product_account_number: Annotated[str | None, Field(alias="productAccountNumber")] = None
+    quantity: float | None = None
+    sales_code: Annotated[str | None, Field(alias="salesCode")] = None
+    sales_description: Annotated[str | None, Field(alias="salesDescription")] = None
+    serial_numbers: Annotated[str | None, Field(alias="serialNumbers")] = None
+    serialized_flag: Annotated[bool | None, Field(alias="serializedFlag")] = None
+    shipment_method: Annotated[ShipmentMethodReference | None, Field(alias="shipmentMethod")] = None
+    sub_category: Annotated[ProductSubCategoryReference | None, Field(alias="subCategory")] = None
+    tax_agency_xref: Annotated[str | None, Field(alias="taxAgencyXref")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    tax_code_xref: Annotated[str | None, Field(alias="taxCodeXref")] = None
+    tax_levels: Annotated[list[GLExportTransactionDetailTaxLevel] | None, Field(alias="taxLevels")] = None
+    tax_note: Annotated[str | None, Field(alias="taxNote")] = None
+    tax_rate: Annotated[float | None, Field(alias="taxRate")] = None
+    tax_rate_percent: Annotated[float | None, Field(alias="taxRatePercent")] = None
+    taxable2_flag: Annotated[bool | None, Field(alias="taxable2Flag")] = None
+    taxable3_flag: Annotated[bool | None, Field(alias="taxable3Flag")] = None
+    taxable4_flag: Annotated[bool | None, Field(alias="taxable4Flag")] = None
+    taxable5_flag: Annotated[bool | None, Field(alias="taxable5Flag")] = None
+    taxable_flag: Annotated[bool | None, Field(alias="taxableFlag")] = None
+    time_entry: Annotated[TimeEntryReference | None, Field(alias="timeEntry")] = None
+    total: float | None = None
+    unit_of_measure: Annotated[UnitOfMeasureReference | None, Field(alias="unitOfMeasure")] = None
+    uom_schedule_xref: Annotated[str | None, Field(alias="uomScheduleXref")] = None
+    warehouse_bin: Annotated[WarehouseBinReference | None, Field(alias="warehouseBin")] = None
+    warehouse_site: Annotated[SiteReference | None, Field(alias="warehouseSite")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.gl_export_transaction_detail_tax_level import GLExportTransactionDetailTaxLevel
+from pyconnectwise.models.manage.iv_item_reference import IvItemReference
+from pyconnectwise.models.manage.product_reference import ProductReference
+from pyconnectwise.models.manage.product_sub_category_reference import ProductSubCategoryReference
+from pyconnectwise.models.manage.shipment_method_reference import ShipmentMethodReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
+from pyconnectwise.models.manage.time_entry_reference import TimeEntryReference
+from pyconnectwise.models.manage.unit_of_measure_reference import UnitOfMeasureReference
+from pyconnectwise.models.manage.warehouse_bin_reference import WarehouseBinReference
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportTransactionDetailTaxLevel(ConnectWiseModel):
+    tax_level: Annotated[int | None, Field(alias="taxLevel")] = None
+    taxable_flag: Annotated[bool | None, Field(alias="taxableFlag")] = None
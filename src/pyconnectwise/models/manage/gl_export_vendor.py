@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLExportVendor(ConnectWiseModel):
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    due_days: Annotated[int | None, Field(alias="dueDays")] = None
+    member: MemberReference | None = None
+    site: SiteReference | None = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    vendor: CompanyReference | None = None
+    vendor_number: Annotated[str | None, Field(alias="vendorNumber")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class GLPath(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    database_name: Annotated[str | None, Field(alias="databaseName")] = None
+    """
+     Max length: 100;
+    """
+    id: int | None = None
+    last_payment_sync: Annotated[datetime | None, Field(alias="lastPaymentSync")] = None
+    last_payment_sync_by: Annotated[MemberReference | None, Field(alias="lastPaymentSyncBy")] = None
+    location: SystemLocationReference | None = None
+    path: str | None = None
+    """
+     Max length: 255;
+    """
+    sql_server_name: Annotated[str | None, Field(alias="sqlServerName")] = None
+    """
+     Max length: 255;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
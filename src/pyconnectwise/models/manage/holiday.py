@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Holiday(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    all_day_flag: Annotated[bool | None, Field(alias="allDayFlag")] = None
+    """
+    Can be set to false to set a holiday for specific hours (Defaults to True)
+    """
+    date: date
+    holiday_list: Annotated[HolidayListReference | None, Field(alias="holidayList")] = None
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    time_end: Annotated[datetime | None, Field(alias="timeEnd")] = None
+    time_start: Annotated[datetime | None, Field(alias="timeStart")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.holiday_list_reference import HolidayListReference
@@ -0,0 +1,50 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Imap(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    email_connector: Annotated[EmailConnectorReference | None, Field(alias="emailConnector")] = None
+    failed_folder: Annotated[str, Field(alias="failedFolder")]
+    """
+     Max length: 40;
+    """
+    id: int | None = None
+    imap_name: Annotated[str, Field(alias="imapName")]
+    """
+     Max length: 40;
+    """
+    name: str
+    """
+     Max length: 200;
+    """
+    password: str | None = None
+    """
+     Max length: 80;
+    """
+    port: int
+    processed_name: Annotated[str, Field(alias="processedName")]
+    """
+     Max length: 40;
+    """
+    server: str
+    """
+     Max length: 200;
+    """
+    ssl_flag: Annotated[bool | None, Field(alias="sslFlag")] = None
+    user_name: Annotated[str, Field(alias="userName")]
+    """
+     Max length: 80;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.email_connector_reference import EmailConnectorReference
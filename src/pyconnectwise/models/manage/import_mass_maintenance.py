@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ImportMassMaintenance(ConnectWiseModel):
+    deleted_company_count: Annotated[int | None, Field(alias="deletedCompanyCount")] = None
+    deleted_contact_count: Annotated[int | None, Field(alias="deletedContactCount")] = None
+    message: str | None = None
+    success: bool | None = None
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InOutBoard(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    additional_info: Annotated[str | None, Field(alias="additionalInfo")] = None
+    """
+     Max length: 100;
+    """
+    date_back: Annotated[datetime, Field(alias="dateBack")]
+    id: int | None = None
+    in_out_type: Annotated[InOutTypeReference | None, Field(alias="inOutType")] = None
+    member: MemberReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.in_out_type_reference import InOutTypeReference
+from pyconnectwise.models.manage.member_reference import MemberReference
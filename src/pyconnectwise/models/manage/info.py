@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Info(ConnectWiseModel):
+    cloud_region: Annotated[str | None, Field(alias="cloudRegion")] = None
+    is_cloud: Annotated[bool | None, Field(alias="isCloud")] = None
+    license_bits: Annotated[list[LicenseBit] | None, Field(alias="licenseBits")] = None
+    server_time_zone: Annotated[str | None, Field(alias="serverTimeZone")] = None
+    version: str | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.license_bit import LicenseBit
@@ -0,0 +1,136 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class IntegratorLogin(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    activity_api_flag: Annotated[bool | None, Field(alias="activityApiFlag")] = None
+    activity_callback_url: Annotated[str | None, Field(alias="activityCallbackUrl")] = None
+    """
+     Max length: 1000;
+    """
+    activity_legacy_callback_flag: Annotated[bool | None, Field(alias="activityLegacyCallbackFlag")] = None
+    agreement_api_flag: Annotated[bool | None, Field(alias="agreementApiFlag")] = None
+    agreement_callback_legacy_flag: Annotated[bool | None, Field(alias="agreementCallbackLegacyFlag")] = None
+    agreement_callback_url: Annotated[str | None, Field(alias="agreementCallbackUrl")] = None
+    """
+     Max length: 1000;
+    """
+    board: BoardReference | None = None
+    can_access_all_apis_flag: Annotated[bool | None, Field(alias="canAccessAllApisFlag")] = None
+    """
+    Setting this flag to true will create an integrator that can access all of the available apis in the system.
+                If this field is set to true, both the member and board fields are required.
+    """
+    can_access_all_records_flag: Annotated[bool | None, Field(alias="canAccessAllRecordsFlag")] = None
+    """
+    This flag controls whether the integrator can access only the db records it created, or all system records
+    """
+    company_api_flag: Annotated[bool | None, Field(alias="companyApiFlag")] = None
+    company_callback_url: Annotated[str | None, Field(alias="companyCallbackUrl")] = None
+    """
+     Max length: 1000;
+    """
+    company_legacy_callback_flag: Annotated[bool | None, Field(alias="companyLegacyCallbackFlag")] = None
+    configuration_api_flag: Annotated[bool | None, Field(alias="configurationApiFlag")] = None
+    configuration_auto_child_flag: Annotated[bool | None, Field(alias="configurationAutoChildFlag")] = None
+    configuration_callback_url: Annotated[str | None, Field(alias="configurationCallbackUrl")] = None
+    """
+     Max length: 1000;
+    """
+    configuration_childling_flag: Annotated[bool | None, Field(alias="configurationChildlingFlag")] = None
+    """
+    True if integrator is allowed to child configurations
+    """
+    configuration_legacy_callback_flag: Annotated[bool | None, Field(alias="configurationLegacyCallbackFlag")] = None
+    contact_api_flag: Annotated[bool | None, Field(alias="contactApiFlag")] = None
+    contact_callback_url: Annotated[str | None, Field(alias="contactCallbackUrl")] = None
+    """
+     Max length: 1000;
+    """
+    contact_legacy_callback_flag: Annotated[bool | None, Field(alias="contactLegacyCallbackFlag")] = None
+    date_inactivated: Annotated[datetime | None, Field(alias="dateInactivated")] = None
+    document_api_flag: Annotated[bool | None, Field(alias="documentApiFlag")] = None
+    id: int | None = None
+    inactivated_by: Annotated[MemberReference | None, Field(alias="inactivatedBy")] = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    invoice_api_flag: Annotated[bool | None, Field(alias="invoiceApiFlag")] = None
+    managed_services_api_flag: Annotated[bool | None, Field(alias="managedServicesApiFlag")] = None
+    managed_services_auto_child_flag: Annotated[bool | None, Field(alias="managedServicesAutoChildFlag")] = None
+    managed_services_childing_flag: Annotated[bool | None, Field(alias="managedServicesChildingFlag")] = None
+    """
+    True if integrator is allowed to child configurations
+    """
+    marketing_api_flag: Annotated[bool | None, Field(alias="marketingApiFlag")] = None
+    member: MemberReference | None = None
+    member_api_flag: Annotated[bool | None, Field(alias="memberApiFlag")] = None
+    opportunity_api_flag: Annotated[bool | None, Field(alias="opportunityApiFlag")] = None
+    opportunity_callback_url: Annotated[str | None, Field(alias="opportunityCallbackUrl")] = None
+    """
+     Max length: 1000;
+    """
+    opportunity_conversion_api_flag: Annotated[bool | None, Field(alias="opportunityConversionApiFlag")] = None
+    """
+    True if the member has access to the Opportunity Conversion Api
+    """
+    opportunity_legacy_callback_flag: Annotated[bool | None, Field(alias="opportunityLegacyCallbackFlag")] = None
+    password: str | None = None
+    """
+    The password will never be returned in response Max length: 50;
+    """
+    product_api_flag: Annotated[bool | None, Field(alias="productApiFlag")] = None
+    product_callback_url: Annotated[str | None, Field(alias="productCallbackUrl")] = None
+    """
+     Max length: 1000;
+    """
+    product_legacy_callback_flag: Annotated[bool | None, Field(alias="productLegacyCallbackFlag")] = None
+    project_api_flag: Annotated[bool | None, Field(alias="projectApiFlag")] = None
+    project_callback_url: Annotated[str | None, Field(alias="projectCallbackUrl")] = None
+    """
+     Max length: 1000;
+    """
+    project_legacy_callback_flag: Annotated[bool | None, Field(alias="projectLegacyCallbackFlag")] = None
+    purchasing_api_flag: Annotated[bool | None, Field(alias="purchasingApiFlag")] = None
+    purchasing_callback_url: Annotated[str | None, Field(alias="purchasingCallbackUrl")] = None
+    """
+     Max length: 1000;
+    """
+    purchasing_legacy_callback_flag: Annotated[bool | None, Field(alias="purchasingLegacyCallbackFlag")] = None
+    reporting_api_flag: Annotated[bool | None, Field(alias="reportingApiFlag")] = None
+    schedule_api_flag: Annotated[bool | None, Field(alias="scheduleApiFlag")] = None
+    schedule_callback_url: Annotated[str | None, Field(alias="scheduleCallbackUrl")] = None
+    """
+     Max length: 1000;
+    """
+    schedule_legacy_callback_flag: Annotated[bool | None, Field(alias="scheduleLegacyCallbackFlag")] = None
+    service_board_callback_url: Annotated[str | None, Field(alias="serviceBoardCallbackUrl")] = None
+    """
+     Max length: 1000;
+    """
+    service_board_legacy_callback_flag: Annotated[bool | None, Field(alias="serviceBoardLegacyCallbackFlag")] = None
+    service_ticket_api_flag: Annotated[bool | None, Field(alias="serviceTicketApiFlag")] = None
+    system_api_flag: Annotated[bool | None, Field(alias="systemApiFlag")] = None
+    time_entry_api_flag: Annotated[bool | None, Field(alias="timeEntryApiFlag")] = None
+    time_entry_callback_url: Annotated[str | None, Field(alias="timeEntryCallbackUrl")] = None
+    """
+     Max length: 1000;
+    """
+    time_entry_legacy_callback_flag: Annotated[bool | None, Field(alias="timeEntryLegacyCallbackFlag")] = None
+    username: str
+    """
+     Max length: 50;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.member_reference import MemberReference
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.manage.catalog_inventory import CatalogInventory
+
+
+class InventoryOnHand(CatalogInventory):
+    pass
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.catalog_item_reference import CatalogItemReference
+from pyconnectwise.models.manage.on_hand_serial_number_reference import OnHandSerialNumberReference
+from pyconnectwise.models.manage.warehouse_bin_reference import WarehouseBinReference
+from pyconnectwise.models.manage.warehouse_reference import WarehouseReference
@@ -0,0 +1,133 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Invoice(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    add_to_batch_email_list: Annotated[bool | None, Field(alias="addToBatchEmailList")] = None
+    adjusted_by: Annotated[str | None, Field(alias="adjustedBy")] = None
+    adjustment_reason: Annotated[str | None, Field(alias="adjustmentReason")] = None
+    agreement: AgreementReference | None = None
+    agreement_amount: Annotated[float | None, Field(alias="agreementAmount")] = None
+    apply_to_id: Annotated[int | None, Field(alias="applyToId")] = None
+    apply_to_type: Annotated[
+        Literal["All", "Agreement", "Project", "ProjectPhase", "SalesOrder", "Ticket"] | None,
+        Field(alias="applyToType"),
+    ] = None
+    attention: str | None = None
+    """
+     Max length: 60;
+    """
+    balance: float | None = None
+    bill_to_company: Annotated[CompanyReference | None, Field(alias="billToCompany")] = None
+    billing_setup_reference: Annotated[BillingSetupReference | None, Field(alias="billingSetupReference")] = None
+    billing_site: Annotated[SiteReference | None, Field(alias="billingSite")] = None
+    billing_site_address_line1: Annotated[str | None, Field(alias="billingSiteAddressLine1")] = None
+    billing_site_address_line2: Annotated[str | None, Field(alias="billingSiteAddressLine2")] = None
+    billing_site_city: Annotated[str | None, Field(alias="billingSiteCity")] = None
+    billing_site_country: Annotated[str | None, Field(alias="billingSiteCountry")] = None
+    billing_site_state: Annotated[str | None, Field(alias="billingSiteState")] = None
+    billing_site_zip: Annotated[str | None, Field(alias="billingSiteZip")] = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    bottom_comment: Annotated[str | None, Field(alias="bottomComment")] = None
+    company: CompanyReference | None = None
+    credits: float | None = None
+    currency: CurrencyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    customer_po: Annotated[str | None, Field(alias="customerPO")] = None
+    """
+     Max length: 50;
+    """
+    date: datetime | None = None
+    department_id: Annotated[int | None, Field(alias="departmentId")] = None
+    """
+    departmentId is only required for special invoices
+    """
+    downpayment_applied: Annotated[float | None, Field(alias="downpaymentApplied")] = None
+    downpayment_previously_taxed_flag: Annotated[bool | None, Field(alias="downpaymentPreviouslyTaxedFlag")] = None
+    due_date: Annotated[datetime | None, Field(alias="dueDate")] = None
+    email_template_id: Annotated[int | None, Field(alias="emailTemplateId")] = None
+    """
+    Can be obtained via InvoiceEmailTemplate report
+    """
+    expense_total: Annotated[float | None, Field(alias="expenseTotal")] = None
+    id: int | None = None
+    internal_notes: Annotated[str | None, Field(alias="internalNotes")] = None
+    invoice_number: Annotated[str | None, Field(alias="invoiceNumber")] = None
+    """
+     Max length: 15; Required On Updates;
+    """
+    invoice_template: Annotated[InvoiceTemplateDetailReference | None, Field(alias="invoiceTemplate")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    """
+     Required On Updates;
+    """
+    override_down_payment_amount_flag: Annotated[bool | None, Field(alias="overrideDownPaymentAmountFlag")] = None
+    payments: float | None = None
+    phase: ProjectPhaseReference | None = None
+    previous_progress_applied: Annotated[float | None, Field(alias="previousProgressApplied")] = None
+    product_total: Annotated[float | None, Field(alias="productTotal")] = None
+    project: ProjectReference | None = None
+    reference: str | None = None
+    """
+     Max length: 50;
+    """
+    remaining_downpayment: Annotated[float | None, Field(alias="remainingDownpayment")] = None
+    restrict_downpayment_flag: Annotated[bool | None, Field(alias="restrictDownpaymentFlag")] = None
+    sales_order: Annotated[SalesOrderReference | None, Field(alias="salesOrder")] = None
+    sales_tax: Annotated[float | None, Field(alias="salesTax")] = None
+    service_adjustment_amount: Annotated[float | None, Field(alias="serviceAdjustmentAmount")] = None
+    service_total: Annotated[float | None, Field(alias="serviceTotal")] = None
+    ship_to_attention: Annotated[str | None, Field(alias="shipToAttention")] = None
+    """
+     Max length: 60;
+    """
+    ship_to_company: Annotated[CompanyReference | None, Field(alias="shipToCompany")] = None
+    shipping_site: Annotated[SiteReference | None, Field(alias="shippingSite")] = None
+    shipping_site_address_line1: Annotated[str | None, Field(alias="shippingSiteAddressLine1")] = None
+    shipping_site_address_line2: Annotated[str | None, Field(alias="shippingSiteAddressLine2")] = None
+    shipping_site_city: Annotated[str | None, Field(alias="shippingSiteCity")] = None
+    shipping_site_country: Annotated[str | None, Field(alias="shippingSiteCountry")] = None
+    shipping_site_state: Annotated[str | None, Field(alias="shippingSiteState")] = None
+    shipping_site_zip: Annotated[str | None, Field(alias="shippingSiteZip")] = None
+    special_invoice_flag: Annotated[bool | None, Field(alias="specialInvoiceFlag")] = None
+    status: BillingStatusReference | None = None
+    subtotal: float | None = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    taxable_flag: Annotated[bool | None, Field(alias="taxableFlag")] = None
+    template_setup_id: Annotated[int | None, Field(alias="templateSetupId")] = None
+    """
+    Can be obtained via InvoiceTemplate report
+    """
+    territory_id: Annotated[int | None, Field(alias="territoryId")] = None
+    ticket: TicketReference | None = None
+    top_comment: Annotated[str | None, Field(alias="topComment")] = None
+    total: float | None = None
+    type: Literal["Agreement", "CreditMemo", "DownPayment", "Miscellaneous", "Progress", "Standard"]
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.billing_setup_reference import BillingSetupReference
+from pyconnectwise.models.manage.billing_status_reference import BillingStatusReference
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.invoice_template_detail_reference import InvoiceTemplateDetailReference
+from pyconnectwise.models.manage.project_phase_reference import ProjectPhaseReference
+from pyconnectwise.models.manage.project_reference import ProjectReference
+from pyconnectwise.models.manage.sales_order_reference import SalesOrderReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
+from pyconnectwise.models.manage.ticket_reference import TicketReference
@@ -0,0 +1,46 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InvoiceEmailTemplate(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    attach_invoice_flag: Annotated[bool | None, Field(alias="attachInvoiceFlag")] = None
+    body: str | None = None
+    copy_sender_flag: Annotated[bool | None, Field(alias="copySenderFlag")] = None
+    email_address: Annotated[str | None, Field(alias="emailAddress")] = None
+    """
+    From fields (first name, last name, email address) are required if useSenderFlag is false Max length: 100;
+    """
+    first_name: Annotated[str | None, Field(alias="firstName")] = None
+    """
+    From fields (first name, last name, email address) are required if useSenderFlag is false Max length: 100;
+    """
+    id: int | None = None
+    invoice_status: Annotated[BillingStatusReference | None, Field(alias="invoiceStatus")] = None
+    last_name: Annotated[str | None, Field(alias="lastName")] = None
+    """
+    From fields (first name, last name, email address) are required if useSenderFlag is false Max length: 100;
+    """
+    name: str
+    """
+     Max length: 50;
+    """
+    service_survey: Annotated[ServiceSurveyReference | None, Field(alias="serviceSurvey")] = None
+    subject: str
+    """
+     Max length: 200;
+    """
+    use_sender_flag: Annotated[bool | None, Field(alias="useSenderFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_status_reference import BillingStatusReference
+from pyconnectwise.models.manage.service_survey_reference import ServiceSurveyReference
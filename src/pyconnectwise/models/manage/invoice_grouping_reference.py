@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InvoiceGroupingReference(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    description: str | None = None
+    group_parent_child_additions_flag: Annotated[bool | None, Field(alias="groupParentChildAdditionsFlag")] = None
+    id: int | None = None
+    name: str | None = None
+    show_price_flag: Annotated[bool | None, Field(alias="showPriceFlag")] = None
+    show_sub_items_flag: Annotated[bool | None, Field(alias="showSubItemsFlag")] = None
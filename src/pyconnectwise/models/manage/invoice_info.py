@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InvoiceInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_billing_info: Annotated[list[AgreementBillingInfo] | None, Field(alias="agreementBillingInfo")] = None
+    billing_setup: Annotated[BillingSetup | None, Field(alias="billingSetup")] = None
+    bundled_components_info: Annotated[list[ProductComponent] | None, Field(alias="bundledComponentsInfo")] = None
+    expenses: list[ExpenseEntry] | None = None
+    id: int | None = None
+    invoice: Invoice | None = None
+    invoice_template: Annotated[InvoiceTemplate | None, Field(alias="invoiceTemplate")] = None
+    logo: DocumentInfo | None = None
+    products: list[ProductItem] | None = None
+    time_entries: Annotated[list[TimeEntry] | None, Field(alias="timeEntries")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_billing_info import AgreementBillingInfo
+from pyconnectwise.models.manage.billing_setup import BillingSetup
+from pyconnectwise.models.manage.document_info import DocumentInfo
+from pyconnectwise.models.manage.expense_entry import ExpenseEntry
+from pyconnectwise.models.manage.invoice import Invoice
+from pyconnectwise.models.manage.invoice_template import InvoiceTemplate
+from pyconnectwise.models.manage.product_component import ProductComponent
+from pyconnectwise.models.manage.product_item import ProductItem
+from pyconnectwise.models.manage.time_entry import TimeEntry
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InvoiceReference(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    apply_to_type: Annotated[str | None, Field(alias="applyToType")] = None
+    billing_type: Annotated[str | None, Field(alias="billingType")] = None
+    id: int | None = None
+    identifier: str | None = None
@@ -0,0 +1,432 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class InvoiceTemplate(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    adjustment_agr_type_visible_flag: Annotated[bool | None, Field(alias="adjustmentAgrTypeVisibleFlag")] = None
+    adjustment_amount_caption: Annotated[str | None, Field(alias="adjustmentAmountCaption")] = None
+    """
+     Max length: 50;
+    """
+    adjustment_amount_visible_flag: Annotated[bool | None, Field(alias="adjustmentAmountVisibleFlag")] = None
+    adjustment_description_caption: Annotated[str | None, Field(alias="adjustmentDescriptionCaption")] = None
+    """
+     Max length: 50;
+    """
+    adjustment_description_visible_flag: Annotated[bool | None, Field(alias="adjustmentDescriptionVisibleFlag")] = None
+    adjustment_price_caption: Annotated[str | None, Field(alias="adjustmentPriceCaption")] = None
+    """
+     Max length: 50;
+    """
+    adjustment_price_visible_flag: Annotated[bool | None, Field(alias="adjustmentPriceVisibleFlag")] = None
+    adjustment_quantity_caption: Annotated[str | None, Field(alias="adjustmentQuantityCaption")] = None
+    """
+     Max length: 50;
+    """
+    adjustment_quantity_visible_flag: Annotated[bool | None, Field(alias="adjustmentQuantityVisibleFlag")] = None
+    adjustment_total_visible_flag: Annotated[bool | None, Field(alias="adjustmentTotalVisibleFlag")] = None
+    credit_credit_amount_caption: Annotated[str | None, Field(alias="creditCreditAmountCaption")] = None
+    """
+     Max length: 50;
+    """
+    credit_credit_amount_visible_flag: Annotated[bool | None, Field(alias="creditCreditAmountVisibleFlag")] = None
+    credit_remaining_amount_caption: Annotated[str | None, Field(alias="creditRemainingAmountCaption")] = None
+    """
+     Max length: 50;
+    """
+    credit_remaining_amount_visible_flag: Annotated[bool | None, Field(alias="creditRemainingAmountVisibleFlag")] = None
+    currency_id_visible_flag: Annotated[bool | None, Field(alias="currencyIdVisibleFlag")] = None
+    currency_symbol_visible_flag: Annotated[bool | None, Field(alias="currencySymbolVisibleFlag")] = None
+    expense_detail_agreement_ext_amount_visible_flag: Annotated[
+        bool | None, Field(alias="expenseDetailAgreementExtAmountVisibleFlag")
+    ] = None
+    expense_detail_agreement_visible_flag: Annotated[
+        bool | None, Field(alias="expenseDetailAgreementVisibleFlag")
+    ] = None
+    expense_detail_billable_visible_flag: Annotated[bool | None, Field(alias="expenseDetailBillableVisibleFlag")] = None
+    expense_detail_contacts_visible_flag: Annotated[bool | None, Field(alias="expenseDetailContactsVisibleFlag")] = None
+    expense_detail_ext_amount_visible_flag: Annotated[
+        bool | None, Field(alias="expenseDetailExtAmountVisibleFlag")
+    ] = None
+    expense_detail_members_visible_flag: Annotated[bool | None, Field(alias="expenseDetailMembersVisibleFlag")] = None
+    expense_detail_nonbillable_caption: Annotated[str | None, Field(alias="expenseDetailNonbillableCaption")] = None
+    """
+     Max length: 50;
+    """
+    expense_detail_notes_visible_flag: Annotated[bool | None, Field(alias="expenseDetailNotesVisibleFlag")] = None
+    expense_detail_pm_phase_visible_flag: Annotated[bool | None, Field(alias="expenseDetailPmPhaseVisibleFlag")] = None
+    expense_detail_pm_summary_visible_flag: Annotated[
+        bool | None, Field(alias="expenseDetailPmSummaryVisibleFlag")
+    ] = None
+    expense_detail_primary_sort_direction: Annotated[
+        str | None, Field(alias="expenseDetailPrimarySortDirection")
+    ] = None
+    expense_detail_primary_sort_field: Annotated[str | None, Field(alias="expenseDetailPrimarySortField")] = None
+    expense_detail_secondary_sort_direction: Annotated[
+        str | None, Field(alias="expenseDetailSecondarySortDirection")
+    ] = None
+    expense_detail_secondary_sort_field: Annotated[str | None, Field(alias="expenseDetailSecondarySortField")] = None
+    expense_detail_sr_address_visible_flag: Annotated[
+        bool | None, Field(alias="expenseDetailSrAddressVisibleFlag")
+    ] = None
+    expense_detail_sr_contact_visible_flag: Annotated[
+        bool | None, Field(alias="expenseDetailSrContactVisibleFlag")
+    ] = None
+    expense_detail_sr_ticket_summary_visible_flag: Annotated[
+        bool | None, Field(alias="expenseDetailSrTicketSummaryVisibleFlag")
+    ] = None
+    expense_detail_subtotal_visible_flag: Annotated[bool | None, Field(alias="expenseDetailSubtotalVisibleFlag")] = None
+    expense_detail_ticket_number_visible_flag: Annotated[
+        bool | None, Field(alias="expenseDetailTicketNumberVisibleFlag")
+    ] = None
+    expense_detail_visible_flag: Annotated[bool | None, Field(alias="expenseDetailVisibleFlag")] = None
+    expenses_amount_caption: Annotated[str | None, Field(alias="expensesAmountCaption")] = None
+    """
+     Max length: 50;
+    """
+    expenses_amount_visible_flag: Annotated[bool | None, Field(alias="expensesAmountVisibleFlag")] = None
+    expenses_collapsed_flag: Annotated[bool | None, Field(alias="expensesCollapsedFlag")] = None
+    expenses_staff_caption: Annotated[str | None, Field(alias="expensesStaffCaption")] = None
+    """
+     Max length: 50;
+    """
+    expenses_staff_visible_flag: Annotated[bool | None, Field(alias="expensesStaffVisibleFlag")] = None
+    expenses_total_visible_flag: Annotated[bool | None, Field(alias="expensesTotalVisibleFlag")] = None
+    expenses_type_caption: Annotated[str | None, Field(alias="expensesTypeCaption")] = None
+    """
+     Max length: 50;
+    """
+    expenses_type_visible_flag: Annotated[bool | None, Field(alias="expensesTypeVisibleFlag")] = None
+    header_account_caption: Annotated[str | None, Field(alias="headerAccountCaption")] = None
+    """
+     Max length: 50;
+    """
+    header_account_visible_flag: Annotated[bool | None, Field(alias="headerAccountVisibleFlag")] = None
+    header_address_position: Annotated[
+        Literal["Center", "LeftSide", "RightSide"] | None, Field(alias="headerAddressPosition")
+    ] = None
+    header_due_date_caption: Annotated[str | None, Field(alias="headerDueDateCaption")] = None
+    """
+     Max length: 50;
+    """
+    header_due_date_visible_flag: Annotated[bool | None, Field(alias="headerDueDateVisibleFlag")] = None
+    header_hours_based_extended_amount_visible_flag: Annotated[
+        bool | None, Field(alias="headerHoursBasedExtendedAmountVisibleFlag")
+    ] = None
+    header_logo_position: Annotated[
+        Literal["Center", "LeftSide", "RightSide"] | None, Field(alias="headerLogoPosition")
+    ] = None
+    header_po_number_caption: Annotated[str | None, Field(alias="headerPoNumberCaption")] = None
+    """
+     Max length: 50;
+    """
+    header_po_number_visible_flag: Annotated[bool | None, Field(alias="headerPoNumberVisibleFlag")] = None
+    header_reference_caption: Annotated[str | None, Field(alias="headerReferenceCaption")] = None
+    """
+     Max length: 50;
+    """
+    header_reference_visible_flag: Annotated[bool | None, Field(alias="headerReferenceVisibleFlag")] = None
+    header_ship_to_caption: Annotated[str | None, Field(alias="headerShipToCaption")] = None
+    """
+     Max length: 50;
+    """
+    header_ship_to_visible_flag: Annotated[bool | None, Field(alias="headerShipToVisibleFlag")] = None
+    header_tax_id_caption: Annotated[str | None, Field(alias="headerTaxIdCaption")] = None
+    """
+     Max length: 50;
+    """
+    header_tax_id_visible_flag: Annotated[bool | None, Field(alias="headerTaxIdVisibleFlag")] = None
+    header_terms_caption: Annotated[str | None, Field(alias="headerTermsCaption")] = None
+    """
+     Max length: 50;
+    """
+    header_terms_visible_flag: Annotated[bool | None, Field(alias="headerTermsVisibleFlag")] = None
+    header_title_caption: Annotated[str | None, Field(alias="headerTitleCaption")] = None
+    """
+     Max length: 50;
+    """
+    header_title_font: Annotated[
+        Literal["Regular", "RegularBold", "Large", "LargeBold", "ExtraLarge", "ExtraLargeBold"] | None,
+        Field(alias="headerTitleFont"),
+    ] = None
+    header_title_position: Annotated[
+        Literal["Center", "LeftSide", "RightSide"] | None, Field(alias="headerTitlePosition")
+    ] = None
+    header_title_visible_flag: Annotated[bool | None, Field(alias="headerTitleVisibleFlag")] = None
+    id: int | None = None
+    invoice_balance_due_caption: Annotated[str | None, Field(alias="invoiceBalanceDueCaption")] = None
+    """
+     Max length: 50;
+    """
+    invoice_balance_due_visible_flag: Annotated[bool | None, Field(alias="invoiceBalanceDueVisibleFlag")] = None
+    invoice_credit_amount_caption: Annotated[str | None, Field(alias="invoiceCreditAmountCaption")] = None
+    """
+     Max length: 50;
+    """
+    invoice_credit_amount_visible_flag: Annotated[bool | None, Field(alias="invoiceCreditAmountVisibleFlag")] = None
+    invoice_payment_amount_caption: Annotated[str | None, Field(alias="invoicePaymentAmountCaption")] = None
+    """
+     Max length: 50;
+    """
+    invoice_payment_amount_visible_flag: Annotated[bool | None, Field(alias="invoicePaymentAmountVisibleFlag")] = None
+    logo_visible_flag: Annotated[bool | None, Field(alias="logoVisibleFlag")] = None
+    margin_bottom: Annotated[float | None, Field(alias="marginBottom")] = None
+    margin_left: Annotated[float | None, Field(alias="marginLeft")] = None
+    margin_right: Annotated[float | None, Field(alias="marginRight")] = None
+    margin_top: Annotated[float | None, Field(alias="marginTop")] = None
+    name: str
+    """
+     Max length: 50;
+    """
+    other_charges_amount_caption: Annotated[str | None, Field(alias="otherChargesAmountCaption")] = None
+    """
+     Max length: 50;
+    """
+    other_charges_amount_visible_flag: Annotated[bool | None, Field(alias="otherChargesAmountVisibleFlag")] = None
+    other_charges_collapsed_flag: Annotated[bool | None, Field(alias="otherChargesCollapsedFlag")] = None
+    other_charges_description_caption: Annotated[str | None, Field(alias="otherChargesDescriptionCaption")] = None
+    """
+     Max length: 50;
+    """
+    other_charges_description_visible_flag: Annotated[
+        bool | None, Field(alias="otherChargesDescriptionVisibleFlag")
+    ] = None
+    other_charges_display_six_decimals: Annotated[bool | None, Field(alias="otherChargesDisplaySixDecimals")] = None
+    other_charges_item_id_visible_flag: Annotated[bool | None, Field(alias="otherChargesItemIdVisibleFlag")] = None
+    other_charges_price_caption: Annotated[str | None, Field(alias="otherChargesPriceCaption")] = None
+    """
+     Max length: 50;
+    """
+    other_charges_price_visible_flag: Annotated[bool | None, Field(alias="otherChargesPriceVisibleFlag")] = None
+    other_charges_quantity_caption: Annotated[str | None, Field(alias="otherChargesQuantityCaption")] = None
+    """
+     Max length: 50;
+    """
+    other_charges_quantity_visible_flag: Annotated[bool | None, Field(alias="otherChargesQuantityVisibleFlag")] = None
+    other_charges_serial_number_visible_flag: Annotated[
+        bool | None, Field(alias="otherChargesSerialNumberVisibleFlag")
+    ] = None
+    other_charges_total_visible_flag: Annotated[bool | None, Field(alias="otherChargesTotalVisibleFlag")] = None
+    payable_caption: Annotated[str | None, Field(alias="payableCaption")] = None
+    """
+     Max length: 1000;
+    """
+    portal_flag: Annotated[bool | None, Field(alias="portalFlag")] = None
+    project_header_amount_caption: Annotated[str | None, Field(alias="projectHeaderAmountCaption")] = None
+    """
+     Max length: 50;
+    """
+    project_header_amount_visible_flag: Annotated[bool | None, Field(alias="projectHeaderAmountVisibleFlag")] = None
+    project_header_billing_method_caption: Annotated[
+        str | None, Field(alias="projectHeaderBillingMethodCaption")
+    ] = None
+    """
+     Max length: 50;
+    """
+    project_header_billing_method_visible_flag: Annotated[
+        bool | None, Field(alias="projectHeaderBillingMethodVisibleFlag")
+    ] = None
+    project_header_billing_type_caption: Annotated[str | None, Field(alias="projectHeaderBillingTypeCaption")] = None
+    """
+     Max length: 50;
+    """
+    project_header_billing_type_visible_flag: Annotated[
+        bool | None, Field(alias="projectHeaderBillingTypeVisibleFlag")
+    ] = None
+    project_header_company_name_caption: Annotated[str | None, Field(alias="projectHeaderCompanyNameCaption")] = None
+    """
+     Max length: 50;
+    """
+    project_header_company_name_visible_flag: Annotated[
+        bool | None, Field(alias="projectHeaderCompanyNameVisibleFlag")
+    ] = None
+    project_header_contact_name_caption: Annotated[str | None, Field(alias="projectHeaderContactNameCaption")] = None
+    """
+     Max length: 50;
+    """
+    project_header_contact_name_visible_flag: Annotated[
+        bool | None, Field(alias="projectHeaderContactNameVisibleFlag")
+    ] = None
+    project_header_original_downpayment_caption: Annotated[
+        str | None, Field(alias="projectHeaderOriginalDownpaymentCaption")
+    ] = None
+    """
+     Max length: 50;
+    """
+    project_header_original_downpayment_visible_flag: Annotated[
+        bool | None, Field(alias="projectHeaderOriginalDownpaymentVisibleFlag")
+    ] = None
+    project_header_project_name_caption: Annotated[str | None, Field(alias="projectHeaderProjectNameCaption")] = None
+    """
+     Max length: 50;
+    """
+    project_header_project_name_visible_flag: Annotated[
+        bool | None, Field(alias="projectHeaderProjectNameVisibleFlag")
+    ] = None
+    remit_to_visible_flag: Annotated[bool | None, Field(alias="remitToVisibleFlag")] = None
+    service_header_amount_caption: Annotated[str | None, Field(alias="serviceHeaderAmountCaption")] = None
+    """
+     Max length: 50;
+    """
+    service_header_amount_visible_flag: Annotated[bool | None, Field(alias="serviceHeaderAmountVisibleFlag")] = None
+    service_header_billing_method_caption: Annotated[
+        str | None, Field(alias="serviceHeaderBillingMethodCaption")
+    ] = None
+    """
+     Max length: 50;
+    """
+    service_header_billing_method_visible_flag: Annotated[
+        bool | None, Field(alias="serviceHeaderBillingMethodVisibleFlag")
+    ] = None
+    service_header_bundled_tickets_visible_flag: Annotated[
+        bool | None, Field(alias="serviceHeaderBundledTicketsVisibleFlag")
+    ] = None
+    service_header_closed_tasks_visible_flag: Annotated[
+        bool | None, Field(alias="serviceHeaderClosedTasksVisibleFlag")
+    ] = None
+    service_header_company_name_caption: Annotated[str | None, Field(alias="serviceHeaderCompanyNameCaption")] = None
+    """
+     Max length: 50;
+    """
+    service_header_company_name_visible_flag: Annotated[
+        bool | None, Field(alias="serviceHeaderCompanyNameVisibleFlag")
+    ] = None
+    service_header_contact_name_caption: Annotated[str | None, Field(alias="serviceHeaderContactNameCaption")] = None
+    """
+     Max length: 50;
+    """
+    service_header_contact_name_visible_flag: Annotated[
+        bool | None, Field(alias="serviceHeaderContactNameVisibleFlag")
+    ] = None
+    service_header_detail_description_caption: Annotated[
+        str | None, Field(alias="serviceHeaderDetailDescriptionCaption")
+    ] = None
+    """
+     Max length: 50;
+    """
+    service_header_detail_description_visible_flag: Annotated[
+        bool | None, Field(alias="serviceHeaderDetailDescriptionVisibleFlag")
+    ] = None
+    service_header_open_tasks_visible_flag: Annotated[
+        bool | None, Field(alias="serviceHeaderOpenTasksVisibleFlag")
+    ] = None
+    service_header_resolution_caption: Annotated[str | None, Field(alias="serviceHeaderResolutionCaption")] = None
+    """
+     Max length: 50;
+    """
+    service_header_resolution_visible_flag: Annotated[
+        bool | None, Field(alias="serviceHeaderResolutionVisibleFlag")
+    ] = None
+    service_header_summary_caption: Annotated[str | None, Field(alias="serviceHeaderSummaryCaption")] = None
+    """
+     Max length: 50;
+    """
+    service_header_summary_visible_flag: Annotated[bool | None, Field(alias="serviceHeaderSummaryVisibleFlag")] = None
+    service_header_ticket_number_caption: Annotated[str | None, Field(alias="serviceHeaderTicketNumberCaption")] = None
+    """
+     Max length: 50;
+    """
+    service_header_ticket_number_visible_flag: Annotated[
+        bool | None, Field(alias="serviceHeaderTicketNumberVisibleFlag")
+    ] = None
+    services_amount_caption: Annotated[str | None, Field(alias="servicesAmountCaption")] = None
+    """
+     Max length: 50;
+    """
+    services_amount_visible_flag: Annotated[bool | None, Field(alias="servicesAmountVisibleFlag")] = None
+    services_collapsed_flag: Annotated[bool | None, Field(alias="servicesCollapsedFlag")] = None
+    services_hours_caption: Annotated[str | None, Field(alias="servicesHoursCaption")] = None
+    """
+     Max length: 50;
+    """
+    services_hours_visible_flag: Annotated[bool | None, Field(alias="servicesHoursVisibleFlag")] = None
+    services_member_name_caption: Annotated[str | None, Field(alias="servicesMemberNameCaption")] = None
+    """
+     Max length: 50;
+    """
+    services_member_name_visible_flag: Annotated[bool | None, Field(alias="servicesMemberNameVisibleFlag")] = None
+    services_rate_caption: Annotated[str | None, Field(alias="servicesRateCaption")] = None
+    """
+     Max length: 50;
+    """
+    services_rate_visible_flag: Annotated[bool | None, Field(alias="servicesRateVisibleFlag")] = None
+    services_staff_caption: Annotated[str | None, Field(alias="servicesStaffCaption")] = None
+    """
+     Max length: 50;
+    """
+    services_staff_visible_flag: Annotated[bool | None, Field(alias="servicesStaffVisibleFlag")] = None
+    services_total_visible_flag: Annotated[bool | None, Field(alias="servicesTotalVisibleFlag")] = None
+    services_work_role_caption: Annotated[str | None, Field(alias="servicesWorkRoleCaption")] = None
+    """
+     Max length: 50;
+    """
+    services_work_role_visible_flag: Annotated[bool | None, Field(alias="servicesWorkRoleVisibleFlag")] = None
+    services_work_type_caption: Annotated[str | None, Field(alias="servicesWorkTypeCaption")] = None
+    """
+     Max length: 50;
+    """
+    services_work_type_visible_flag: Annotated[bool | None, Field(alias="servicesWorkTypeVisibleFlag")] = None
+    time_detail_agreement_visible_flag: Annotated[bool | None, Field(alias="timeDetailAgreementVisibleFlag")] = None
+    time_detail_amount_based_ext_amount_visible_flag: Annotated[
+        bool | None, Field(alias="timeDetailAmountBasedExtAmountVisibleFlag")
+    ] = None
+    time_detail_amount_based_hourly_rate_visible_flag: Annotated[
+        bool | None, Field(alias="timeDetailAmountBasedHourlyRateVisibleFlag")
+    ] = None
+    time_detail_amount_based_hours_visible_flag: Annotated[
+        bool | None, Field(alias="timeDetailAmountBasedHoursVisibleFlag")
+    ] = None
+    time_detail_billable_visible_flag: Annotated[bool | None, Field(alias="timeDetailBillableVisibleFlag")] = None
+    time_detail_contacts_visible_flag: Annotated[bool | None, Field(alias="timeDetailContactsVisibleFlag")] = None
+    time_detail_dates_visible_flag: Annotated[bool | None, Field(alias="timeDetailDatesVisibleFlag")] = None
+    time_detail_dollar_amounts_on_hourse_based_visible_flag: Annotated[
+        bool | None, Field(alias="timeDetailDollarAmountsOnHourseBasedVisibleFlag")
+    ] = None
+    time_detail_extended_amount_visible_flag: Annotated[
+        bool | None, Field(alias="timeDetailExtendedAmountVisibleFlag")
+    ] = None
+    time_detail_hourly_rate_visible_flag: Annotated[bool | None, Field(alias="timeDetailHourlyRateVisibleFlag")] = None
+    time_detail_hours_based_ext_amount_visible_flag: Annotated[
+        bool | None, Field(alias="timeDetailHoursBasedExtAmountVisibleFlag")
+    ] = None
+    time_detail_hours_based_hours_visible_flag: Annotated[
+        bool | None, Field(alias="timeDetailHoursBasedHoursVisibleFlag")
+    ] = None
+    time_detail_hours_visible_flag: Annotated[bool | None, Field(alias="timeDetailHoursVisibleFlag")] = None
+    time_detail_hoursbased_hourly_rate_visible_flag: Annotated[
+        bool | None, Field(alias="timeDetailHoursbasedHourlyRateVisibleFlag")
+    ] = None
+    time_detail_members_visible_flag: Annotated[bool | None, Field(alias="timeDetailMembersVisibleFlag")] = None
+    time_detail_non_billable_caption: Annotated[str | None, Field(alias="timeDetailNonBillableCaption")] = None
+    """
+     Max length: 50;
+    """
+    time_detail_notes_visible_flag: Annotated[bool | None, Field(alias="timeDetailNotesVisibleFlag")] = None
+    time_detail_pm_phase_visible_flag: Annotated[bool | None, Field(alias="timeDetailPmPhaseVisibleFlag")] = None
+    time_detail_pm_summary_visible_flag: Annotated[bool | None, Field(alias="timeDetailPmSummaryVisibleFlag")] = None
+    time_detail_primary_sort_direction: Annotated[str | None, Field(alias="timeDetailPrimarySortDirection")] = None
+    time_detail_primary_sort_field: Annotated[str | None, Field(alias="timeDetailPrimarySortField")] = None
+    time_detail_sr_address_visible_flag: Annotated[bool | None, Field(alias="timeDetailSRAddressVisibleFlag")] = None
+    time_detail_sr_contact_visible_flag: Annotated[bool | None, Field(alias="timeDetailSRContactVisibleFlag")] = None
+    time_detail_sr_ticket_summary_visible_flag: Annotated[
+        bool | None, Field(alias="timeDetailSRTicketSummaryVisibleFlag")
+    ] = None
+    time_detail_secondary_sort_direction: Annotated[str | None, Field(alias="timeDetailSecondarySortDirection")] = None
+    time_detail_secondary_sort_field: Annotated[str | None, Field(alias="timeDetailSecondarySortField")] = None
+    time_detail_start_end_time_visible_flag: Annotated[
+        bool | None, Field(alias="timeDetailStartEndTimeVisibleFlag")
+    ] = None
+    time_detail_subtotal_visible_flag: Annotated[bool | None, Field(alias="timeDetailSubtotalVisibleFlag")] = None
+    time_detail_ticket_number_visible_flag: Annotated[
+        bool | None, Field(alias="timeDetailTicketNumberVisibleFlag")
+    ] = None
+    time_detail_visible_flag: Annotated[bool | None, Field(alias="timeDetailVisibleFlag")] = None
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class KnowledgeBaseArticle(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    board: BoardReference | None = None
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    category_id: Annotated[int | None, Field(alias="categoryId")] = None
+    created_by: Annotated[str | None, Field(alias="createdBy")] = None
+    date_created: Annotated[datetime | None, Field(alias="dateCreated")] = None
+    id: int | None = None
+    issue: str
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    resolution: str
+    sub_category_id: Annotated[int | None, Field(alias="subCategoryId")] = None
+    title: str
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LdapConfiguration(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    domain: str
+    """
+    Domain Name of the server. Max length: 50;
+    """
+    id: int | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    server: str
+    """
+    FQDN of the Server. Max length: 200;
+    """
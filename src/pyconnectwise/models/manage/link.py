@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Link(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    screen_link: Annotated[
+        Literal["Company", "Contact", "Service", "Invoice", "PurchaseOrder", "SalesOrder"] | None,
+        Field(alias="screenLink"),
+    ] = None
+    table_reference_id: Annotated[int | None, Field(alias="tableReferenceId")] = None
+    url: str | None = None
+    """
+     Max length: 1000;
+    """
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LinkClicked(ConnectWiseModel):
+    campaign_id: Annotated[int | None, Field(alias="campaignId")] = None
+    contact_id: Annotated[int, Field(alias="contactId")]
+    date_clicked: Annotated[datetime | None, Field(alias="dateClicked")] = None
+    id: int | None = None
+    query_string: Annotated[str | None, Field(alias="queryString")] = None
+    url: str
+    """
+     Max length: 2083;
+    """
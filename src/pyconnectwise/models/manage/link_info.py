@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LinkInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    name: str | None = None
+    screen_link: Annotated[
+        Literal["Company", "Contact", "Service", "Invoice", "PurchaseOrder", "SalesOrder"] | None,
+        Field(alias="screenLink"),
+    ] = None
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class LocaleInfo(ConnectWiseModel):
+    id: int | None = None
+    locale_code: Annotated[str | None, Field(alias="localeCode")] = None
+    name: str | None = None
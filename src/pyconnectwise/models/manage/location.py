@@ -0,0 +1,79 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Location(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    calendar: CalendarReference | None = None
+    client_flag: Annotated[bool | None, Field(alias="clientFlag")] = None
+    department_ids: Annotated[list[int] | None, Field(alias="departmentIds")] = None
+    id: int | None = None
+    location_flag: Annotated[bool | None, Field(alias="locationFlag")] = None
+    manager: MemberReference | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    override_address_line1: Annotated[str | None, Field(alias="overrideAddressLine1")] = None
+    """
+     Max length: 50;
+    """
+    override_address_line2: Annotated[str | None, Field(alias="overrideAddressLine2")] = None
+    """
+     Max length: 50;
+    """
+    override_city: Annotated[str | None, Field(alias="overrideCity")] = None
+    """
+     Max length: 50;
+    """
+    override_country: Annotated[CountryReference | None, Field(alias="overrideCountry")] = None
+    override_fax_number: Annotated[str | None, Field(alias="overrideFaxNumber")] = None
+    """
+     Max length: 15;
+    """
+    override_phone_number: Annotated[str | None, Field(alias="overridePhoneNumber")] = None
+    """
+     Max length: 15;
+    """
+    override_state: Annotated[str | None, Field(alias="overrideState")] = None
+    """
+     Max length: 50;
+    """
+    override_zip: Annotated[str | None, Field(alias="overrideZip")] = None
+    """
+     Max length: 12;
+    """
+    owa_url: Annotated[str | None, Field(alias="owaUrl")] = None
+    """
+     Max length: 100;
+    """
+    owner_level_id: Annotated[int | None, Field(alias="ownerLevelId")] = None
+    payroll_xref: Annotated[str | None, Field(alias="payrollXref")] = None
+    """
+     Max length: 10;
+    """
+    reports_to: Annotated[SystemLocationReference | None, Field(alias="reportsTo")] = None
+    sales_rep: Annotated[str | None, Field(alias="salesRep")] = None
+    """
+     Max length: 50;
+    """
+    structure_level: Annotated[CorporateStructureLevelReference | None, Field(alias="structureLevel")] = None
+    time_zone_setup: Annotated[TimeZoneSetupReference | None, Field(alias="timeZoneSetup")] = None
+    work_role_ids: Annotated[list[int] | None, Field(alias="workRoleIds")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.calendar_reference import CalendarReference
+from pyconnectwise.models.manage.corporate_structure_level_reference import CorporateStructureLevelReference
+from pyconnectwise.models.manage.country_reference import CountryReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.time_zone_setup_reference import TimeZoneSetupReference
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedDeviceAccount(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    managed_devices_integration: Annotated[
+        ManagedDevicesIntegrationReference | None, Field(alias="managedDevicesIntegration")
+    ] = None
+    password: str | None = None
+    username: str | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.managed_devices_integration_reference import ManagedDevicesIntegrationReference
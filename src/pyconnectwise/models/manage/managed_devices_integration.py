@@ -0,0 +1,50 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedDevicesIntegration(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    config_bill_customer_flag: Annotated[bool | None, Field(alias="configBillCustomerFlag")] = None
+    default_billing_level: Annotated[Literal["Detail", "Summary"], Field(alias="defaultBillingLevel")]
+    default_department: Annotated[SystemDepartmentReference | None, Field(alias="defaultDepartment")] = None
+    default_location: Annotated[SystemLocationReference | None, Field(alias="defaultLocation")] = None
+    disable_new_cross_references_flag: Annotated[bool | None, Field(alias="disableNewCrossReferencesFlag")] = None
+    global_login_password: Annotated[str | None, Field(alias="globalLoginPassword")] = None
+    """
+    This is only required when globalLoginFlag = true Max length: 50;
+    """
+    global_login_username: Annotated[str | None, Field(alias="globalLoginUsername")] = None
+    """
+    This is only required when globalLoginFlag = true Max length: 50;
+    """
+    id: int | None = None
+    integrator_login: Annotated[IntegratorLoginReference | None, Field(alias="integratorLogin")] = None
+    login_by: Annotated[Literal["Global", "Member"], Field(alias="loginBy")]
+    management_it_setup_type: Annotated[str | None, Field(alias="managementItSetupType")] = None
+    match_on_serial_number_flag: Annotated[bool | None, Field(alias="matchOnSerialNumberFlag")] = None
+    name: str
+    """
+     Max length: 30;
+    """
+    portal_url: Annotated[str | None, Field(alias="portalUrl")] = None
+    """
+     Max length: 200;
+    """
+    solution: str
+    """
+     Max length: 30;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.integrator_login_reference import IntegratorLoginReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedDevicesIntegrationCrossReference(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_type: Annotated[AgreementTypeReference | None, Field(alias="agreementType")] = None
+    configuration_type: Annotated[ConfigurationTypeReference | None, Field(alias="configurationType")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    managed_devices_integration: Annotated[
+        ManagedDevicesIntegrationReference | None, Field(alias="managedDevicesIntegration")
+    ] = None
+    product: IvItemReference | None = None
+    vendor_level: Annotated[str | None, Field(alias="vendorLevel")] = None
+    """
+     Max length: 255;
+    """
+    vendor_type: Annotated[str | None, Field(alias="vendorType")] = None
+    """
+     Max length: 255;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_type_reference import AgreementTypeReference
+from pyconnectwise.models.manage.configuration_type_reference import ConfigurationTypeReference
+from pyconnectwise.models.manage.iv_item_reference import IvItemReference
+from pyconnectwise.models.manage.managed_devices_integration_reference import ManagedDevicesIntegrationReference
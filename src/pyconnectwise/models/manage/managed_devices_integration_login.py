@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedDevicesIntegrationLogin(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    managed_devices_integration: Annotated[
+        ManagedDevicesIntegrationReference | None, Field(alias="managedDevicesIntegration")
+    ] = None
+    member: MemberReference | None = None
+    password: str | None = None
+    """
+     Max length: 50;
+    """
+    username: str
+    """
+     Max length: 50;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.managed_devices_integration_reference import ManagedDevicesIntegrationReference
+from pyconnectwise.models.manage.member_reference import MemberReference
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedDevicesIntegrationNotification(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    log_type: Annotated[
+        Literal["All", "Error", "NewManagedSolution", "NewDeviceType", "NewConfiguration", "NewAddition", "Info"],
+        Field(alias="logType"),
+    ]
+    managed_devices_integration: Annotated[
+        ManagedDevicesIntegrationReference | None, Field(alias="managedDevicesIntegration")
+    ] = None
+    member: MemberReference | None = None
+    notify_who: Annotated[NotificationRecipientReference | None, Field(alias="notifyWho")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.managed_devices_integration_reference import ManagedDevicesIntegrationReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.notification_recipient_reference import NotificationRecipientReference
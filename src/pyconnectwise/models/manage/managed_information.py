@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagedInformation(ConnectWiseModel):
+    child_configurations_matching_on: Annotated[str | None, Field(alias="childConfigurationsMatchingOn")] = None
+    inactivate_configurations_matching_on: Annotated[
+        str | None, Field(alias="inactivateConfigurationsMatchingOn")
+    ] = None
+    inactive_configuration_status_id: Annotated[int | None, Field(alias="inactiveConfigurationStatusId")] = None
+    level: str | None = None
+    managed_identifier: Annotated[str | None, Field(alias="managedIdentifier")] = None
+    management_solution_name: Annotated[str | None, Field(alias="managementSolutionName")] = None
+    type: str | None = None
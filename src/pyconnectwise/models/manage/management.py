@@ -0,0 +1,48 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Management(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    added_configuration_status: Annotated[
+        ConfigurationStatusReference | None, Field(alias="addedConfigurationStatus")
+    ] = None
+    deleted_configuration_status: Annotated[
+        ConfigurationStatusReference | None, Field(alias="deletedConfigurationStatus")
+    ] = None
+    executive_summary_report_schedule_day: Annotated[
+        int | None, Field(alias="executiveSummaryReportScheduleDay")
+    ] = None
+    """
+    This is only required when scheduleExecutiveSummaryReportFlag = true
+    """
+    executive_summary_report_schedule_hour: Annotated[
+        int | None, Field(alias="executiveSummaryReportScheduleHour")
+    ] = None
+    """
+    This is only required when scheduleExecutiveSummaryReportFlag = true. Input should be in 24 hour format, ie 2pm is 14
+    """
+    executive_summary_report_schedule_minute: Annotated[
+        int | None, Field(alias="executiveSummaryReportScheduleMinute")
+    ] = None
+    """
+    This is only required when scheduleExecutiveSummaryReportFlag = true
+    """
+    id: int | None = None
+    integrator_login: Annotated[IntegratorLoginReference | None, Field(alias="integratorLogin")] = None
+    run_time: Annotated[datetime | None, Field(alias="runTime")] = None
+    schedule_executive_summary_report_flag: Annotated[bool, Field(alias="scheduleExecutiveSummaryReportFlag")]
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.configuration_status_reference import ConfigurationStatusReference
+from pyconnectwise.models.manage.integrator_login_reference import IntegratorLoginReference
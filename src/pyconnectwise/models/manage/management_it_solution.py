@@ -0,0 +1,79 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagementItSolution(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    continuum_api_password: Annotated[str | None, Field(alias="continuumApiPassword")] = None
+    """
+    This is only required for Continuum solution Max length: 100;
+    """
+    continuum_api_username: Annotated[str | None, Field(alias="continuumApiUsername")] = None
+    """
+    This is only required for Continuum solution Max length: 100;
+    """
+    global_login_flag: Annotated[bool | None, Field(alias="globalLoginFlag")] = None
+    global_login_password: Annotated[str | None, Field(alias="globalLoginPassword")] = None
+    """
+    This is only required when globalLoginFlag = true Max length: 50;
+    """
+    global_login_username: Annotated[str | None, Field(alias="globalLoginUsername")] = None
+    """
+    This is only required when globalLoginFlag = true Max length: 50;
+    """
+    id: int | None = None
+    level_api_password: Annotated[str | None, Field(alias="levelApiPassword")] = None
+    """
+    This is only required for Level Platforms solution Max length: 100;
+    """
+    level_api_username: Annotated[str | None, Field(alias="levelApiUsername")] = None
+    """
+    This is only required for Level Platforms solution Max length: 100;
+    """
+    level_var_domain: Annotated[str | None, Field(alias="levelVarDomain")] = None
+    """
+    This is only required for Level Platforms solution Max length: 100;
+    """
+    management_it_solution_type: Annotated[
+        Literal["LevelPlatforms", "NAble", "Continuum", "Custom"], Field(alias="managementItSolutionType")
+    ]
+    management_server_url: Annotated[str | None, Field(alias="managementServerUrl")] = None
+    """
+    This is only required for Level Platforms Max length: 200;
+    """
+    management_solution_name: Annotated[str | None, Field(alias="managementSolutionName")] = None
+    """
+    This is only required when managementItSolutionType is Custom Max length: 30;
+    """
+    n_able_password: Annotated[str | None, Field(alias="nAblePassword")] = None
+    """
+    This is only required for N-Able solution Max length: 50;
+    """
+    n_able_username: Annotated[str | None, Field(alias="nAbleUsername")] = None
+    """
+    This is only required for N-Able solution Max length: 50;
+    """
+    name: str
+    """
+     Max length: 30;
+    """
+    no_display_flag: Annotated[bool | None, Field(alias="noDisplayFlag")] = None
+    override_login_location_flag: Annotated[bool | None, Field(alias="overrideLoginLocationFlag")] = None
+    override_web_service_location_flag: Annotated[bool | None, Field(alias="overrideWebServiceLocationFlag")] = None
+    portal_override_login_url: Annotated[str | None, Field(alias="portalOverrideLoginUrl")] = None
+    """
+    This is only required for Level Platforms when overrideLoginLocationFlag is true Max length: 200;
+    """
+    using_ssl_flag: Annotated[bool | None, Field(alias="usingSslFlag")] = None
+    webservice_override_url: Annotated[str | None, Field(alias="webserviceOverrideUrl")] = None
+    """
+    This is only required for Level Platforms when overrideWebServiceLocationFlag is true Max length: 200;
+    """
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagementItSolutionAgreementInterfaceParameter(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_type: Annotated[AgreementTypeReference | None, Field(alias="agreementType")] = None
+    id: int | None = None
+    managed_devices_integration: Annotated[
+        ManagedDevicesIntegrationReference | None, Field(alias="managedDevicesIntegration")
+    ] = None
+    server_product: Annotated[IvItemReference | None, Field(alias="serverProduct")] = None
+    spam_stats_product: Annotated[IvItemReference | None, Field(alias="spamStatsProduct")] = None
+    workstation_product: Annotated[IvItemReference | None, Field(alias="workstationProduct")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_type_reference import AgreementTypeReference
+from pyconnectwise.models.manage.iv_item_reference import IvItemReference
+from pyconnectwise.models.manage.managed_devices_integration_reference import ManagedDevicesIntegrationReference
@@ -0,0 +1,15 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagementLogDocumentInfo(ConnectWiseModel):
+    file_size: Annotated[str | None, Field(alias="fileSize")] = None
+    full_path_file_name: Annotated[str | None, Field(alias="fullPathFileName")] = None
@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagementNetworkSecurity(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    name: str
+    """
+     Max length: 30;
+    """
+    password: str | None = None
+    """
+     Max length: 50;
+    """
+    site: str
+    """
+     Max length: 100;
+    """
+    username: str | None = None
+    """
+     Max length: 50;
+    """
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ManagementReportNotification(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    company: CompanyReference | None = None
+    email: str | None = None
+    """
+     Max length: 50;
+    """
+    global_flag: Annotated[bool | None, Field(alias="globalFlag")] = None
+    id: int | None = None
+    member: MemberReference | None = None
+    notify_who: Annotated[NotificationRecipientReference | None, Field(alias="notifyWho")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.notification_recipient_reference import NotificationRecipientReference
@@ -0,0 +1,43 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MappedType(ConnectWiseModel):
+    gl_type: Annotated[
+        Literal[
+            "AP",
+            "AR",
+            "EE",
+            "EI",
+            "EO",
+            "IA",
+            "IT",
+            "P",
+            "PF",
+            "R",
+            "RA",
+            "RD",
+            "RE",
+            "RP",
+            "ST",
+            "SD",
+            "ET",
+            "FT",
+            "PT",
+        ]
+        | None,
+        Field(alias="glType"),
+    ] = None
+    id: int | None = None
+    name: str | None = None
+    rec_id_field: Annotated[str | None, Field(alias="recIdField")] = None
+    sort_order: Annotated[int | None, Field(alias="sortOrder")] = None
+    table: str | None = None
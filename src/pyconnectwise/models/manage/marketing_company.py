@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MarketingCompany(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    all_contacts_flag: Annotated[bool | None, Field(alias="allContactsFlag")] = None
+    default_contact_flag: Annotated[bool | None, Field(alias="defaultContactFlag")] = None
+    group_id: Annotated[int | None, Field(alias="groupId")] = None
+    id: int | None = None
+    unsubscribe_flag: Annotated[bool | None, Field(alias="unsubscribeFlag")] = None
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MarketingContact(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    group_id: Annotated[int | None, Field(alias="groupId")] = None
+    id: int | None = None
+    note: str | None = None
+    """
+     Max length: 50;
+    """
+    unsubscribe_flag: Annotated[bool | None, Field(alias="unsubscribeFlag")] = None
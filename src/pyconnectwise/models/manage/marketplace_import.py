@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MarketplaceImport(ConnectWiseModel):
+    id: int | None = None
+    marketplace_import_type: Annotated[
+        Literal[
+            "Agreements",
+            "Configurations",
+            "CRMSurveys",
+            "CustomReports",
+            "CustomerPortalTypes",
+            "HTMLEmailTemplates",
+            "Products",
+            "ProjectBoards",
+            "ProjectTemplates",
+            "ReportWriterReports",
+            "ServiceBoards",
+            "TicketTemplates",
+            "Views",
+        ]
+        | None,
+        Field(alias="marketplaceImportType"),
+    ] = None
+    marketplace_object: Annotated[list | None, Field(alias="marketplaceObject")] = None
+    required_fields: Annotated[list[str] | None, Field(alias="requiredFields")] = None
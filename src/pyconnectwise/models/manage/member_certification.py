@@ -0,0 +1,33 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberCertification(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    certification: CertificationReference
+    certification_number: Annotated[str | None, Field(alias="certificationNumber")] = None
+    """
+     Max length: 50;
+    """
+    company: CompanyReference | None = None
+    date_expires: Annotated[datetime | None, Field(alias="dateExpires")] = None
+    date_received: Annotated[datetime | None, Field(alias="dateReceived")] = None
+    id: int | None = None
+    member: MemberReference | None = None
+    notes: str | None = None
+    percent_complete: Annotated[int | None, Field(alias="percentComplete")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.certification_reference import CertificationReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.member_reference import MemberReference
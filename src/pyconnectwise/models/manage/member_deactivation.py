@@ -0,0 +1,99 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberDeactivation(ConnectWiseModel):
+    activity: MemberDeactivationSalesActivity | None = None
+    company_team: Annotated[list[MemberDeactivationCompanyTeam] | None, Field(alias="companyTeam")] = None
+    """
+    A list of customers for which the member holds a team role
+    """
+    delete_open_time_sheets_flag: Annotated[bool | None, Field(alias="deleteOpenTimeSheetsFlag")] = None
+    """
+    By default, this is set to false
+                If there is any open timesheets, system will return error message
+                that there is open timesheets still attached to this member
+                If user would like to delete member with open timesheets, they can set this boolean to TRUE
+                System will delete member and any associated open timesheets
+    """
+    department_manager: Annotated[MemberDeactivationDepartmentMananager | None, Field(alias="departmentManager")] = None
+    dispatch_member: Annotated[MemberDeactivationDispatchMember | None, Field(alias="dispatchMember")] = None
+    duty_manager: Annotated[MemberDeactivationDutyManager | None, Field(alias="dutyManager")] = None
+    knowledge_base_article: Annotated[
+        MemberDeactivationKnowledgebaseArticle | None, Field(alias="knowledgeBaseArticle")
+    ] = None
+    my_company_coo: Annotated[MemberDeactivationMyCompanyCOORole | None, Field(alias="myCompanyCOO")] = None
+    my_company_controller: Annotated[
+        MemberDeactivationMyCompanyControllerRole | None, Field(alias="myCompanyController")
+    ] = None
+    my_company_dispatch: Annotated[
+        MemberDeactivationMyCompanyDispatchRole | None, Field(alias="myCompanyDispatch")
+    ] = None
+    my_company_duty_manager_role: Annotated[
+        MemberDeactivationMyCompanyDutyManagerRole | None, Field(alias="myCompanyDutyManagerRole")
+    ] = None
+    my_company_president: Annotated[
+        MemberDeactivationMyCompanyPresidentRole | None, Field(alias="myCompanyPresident")
+    ] = None
+    my_company_service_manager: Annotated[
+        MemberDeactivationMyCompanyServiceManagerRole | None, Field(alias="myCompanyServiceManager")
+    ] = None
+    opportunity: MemberDeactivationOpportunity | None = None
+    project_expense_approver: Annotated[
+        MemberDeactivationProjectManager | None, Field(alias="projectExpenseApprover")
+    ] = None
+    project_manager: Annotated[MemberDeactivationProjectManager | None, Field(alias="projectManager")] = None
+    project_time_approver: Annotated[MemberDeactivationProjectManager | None, Field(alias="projectTimeApprover")] = None
+    sales_team: Annotated[MemberDeactivationSalesTeam | None, Field(alias="salesTeam")] = None
+    send_from_email_notify: Annotated[
+        MemberDeactivationSendFromEmailNotify | None, Field(alias="sendFromEmailNotify")
+    ] = None
+    service_manager: Annotated[MemberDeactivationServiceManger | None, Field(alias="serviceManager")] = None
+    service_status_workflow: Annotated[
+        list[MemberDeactivationStatusWorkflow] | None, Field(alias="serviceStatusWorkflow")
+    ] = None
+    service_team: Annotated[MemberDeactivationServiceTeam | None, Field(alias="serviceTeam")] = None
+    ticket_template: Annotated[MemberDeactivationServiceTemplate | None, Field(alias="ticketTemplate")] = None
+    workflow_email: Annotated[MemberDeactivationWorkflow | None, Field(alias="workflowEmail")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_deactivation_company_team import MemberDeactivationCompanyTeam
+from pyconnectwise.models.manage.member_deactivation_department_mananager import MemberDeactivationDepartmentMananager
+from pyconnectwise.models.manage.member_deactivation_dispatch_member import MemberDeactivationDispatchMember
+from pyconnectwise.models.manage.member_deactivation_duty_manager import MemberDeactivationDutyManager
+from pyconnectwise.models.manage.member_deactivation_knowledgebase_article import MemberDeactivationKnowledgebaseArticle
+from pyconnectwise.models.manage.member_deactivation_my_company_controller_role import (
+    MemberDeactivationMyCompanyControllerRole,
+)
+from pyconnectwise.models.manage.member_deactivation_my_company_coo_role import MemberDeactivationMyCompanyCOORole
+from pyconnectwise.models.manage.member_deactivation_my_company_dispatch_role import (
+    MemberDeactivationMyCompanyDispatchRole,
+)
+from pyconnectwise.models.manage.member_deactivation_my_company_duty_manager_role import (
+    MemberDeactivationMyCompanyDutyManagerRole,
+)
+from pyconnectwise.models.manage.member_deactivation_my_company_president_role import (
+    MemberDeactivationMyCompanyPresidentRole,
+)
+from pyconnectwise.models.manage.member_deactivation_my_company_service_manager_role import (
+    MemberDeactivationMyCompanyServiceManagerRole,
+)
+from pyconnectwise.models.manage.member_deactivation_opportunity import MemberDeactivationOpportunity
+from pyconnectwise.models.manage.member_deactivation_project_manager import MemberDeactivationProjectManager
+from pyconnectwise.models.manage.member_deactivation_sales_activity import MemberDeactivationSalesActivity
+from pyconnectwise.models.manage.member_deactivation_sales_team import MemberDeactivationSalesTeam
+from pyconnectwise.models.manage.member_deactivation_send_from_email_notify import MemberDeactivationSendFromEmailNotify
+from pyconnectwise.models.manage.member_deactivation_service_manger import MemberDeactivationServiceManger
+from pyconnectwise.models.manage.member_deactivation_service_team import MemberDeactivationServiceTeam
+from pyconnectwise.models.manage.member_deactivation_service_template import MemberDeactivationServiceTemplate
+from pyconnectwise.models.manage.member_deactivation_status_workflow import MemberDeactivationStatusWorkflow
+from pyconnectwise.models.manage.member_deactivation_workflow import MemberDeactivationWorkflow
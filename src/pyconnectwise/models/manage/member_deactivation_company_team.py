@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberDeactivationCompanyTeam(ConnectWiseModel):
+    count: int | None = None
+    id: int | None = None
+    name: str | None = None
+    re_assign_to_contact: Annotated[ContactReference | None, Field(alias="reAssignToContact")] = None
+    re_assign_to_member: Annotated[MemberReference | None, Field(alias="reAssignToMember")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.member_reference import MemberReference
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberDelegation(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    date_end: Annotated[datetime, Field(alias="dateEnd")]
+    date_start: Annotated[datetime, Field(alias="dateStart")]
+    delegated_to: Annotated[MemberReference | None, Field(alias="delegatedTo")] = None
+    delegation_type: Annotated[Literal["Approval", "Project"], Field(alias="delegationType")]
+    id: int | None = None
+    member: MemberReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
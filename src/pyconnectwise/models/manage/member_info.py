@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    default_email: Annotated[str | None, Field(alias="defaultEmail")] = None
+    first_name: Annotated[str | None, Field(alias="firstName")] = None
+    full_name: Annotated[str | None, Field(alias="fullName")] = None
+    id: int | None = None
+    identifier: str | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    last_name: Annotated[str | None, Field(alias="lastName")] = None
+    license_class: Annotated[Literal["A", "C", "F", "X"] | None, Field(alias="licenseClass")] = None
+    """
+    F = Full Member, A = API Member, C = StreamlineIT Member, X = Subcontractor Member
+    """
+    middle_initial: Annotated[str | None, Field(alias="middleInitial")] = None
+    photo: DocumentReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.document_reference import DocumentReference
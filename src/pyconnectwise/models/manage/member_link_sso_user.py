@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberLinkSsoUser(ConnectWiseModel):
+    sso_user_id: Annotated[str | None, Field(alias="ssoUserId")] = None
+    """
+     Max length: 100;
+    """
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberNotificationSetting(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    notification_trigger: Annotated[
+        Literal[
+            "ActivityStatusReq",
+            "CustomerUpdated",
+            "ExpenseReport",
+            "TicketStatusChange",
+            "TicketStatusRequest",
+            "TimeNagApprover",
+            "TimeNagMember",
+            "TimeSheet",
+            "WorkflowRules",
+        ],
+        Field(alias="notificationTrigger"),
+    ]
+    notification_type: Annotated[Literal["Email", "Push"], Field(alias="notificationType")]
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberSkill(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    certified_flag: Annotated[bool | None, Field(alias="certifiedFlag")] = None
+    id: int | None = None
+    member: MemberReference | None = None
+    notes: str | None = None
+    skill: SkillReference
+    skill_level: Annotated[Literal["Beginner", "Intermediate", "Advanced", "Expert"], Field(alias="skillLevel")]
+    years_experience: Annotated[int | None, Field(alias="yearsExperience")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.skill_reference import SkillReference
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MemberSsoSettingsReference(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    email: str | None = None
+    id: int | None = None
+    sso_user_id: Annotated[str | None, Field(alias="ssoUserId")] = None
+    user_name: Annotated[str | None, Field(alias="userName")] = None
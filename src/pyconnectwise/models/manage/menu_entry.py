@@ -0,0 +1,42 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MenuEntry(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_all_locations: Annotated[bool | None, Field(alias="addAllLocations")] = None
+    caption: str
+    """
+     Max length: 50;
+    """
+    client_id: Annotated[str | None, Field(alias="clientId")] = None
+    """
+    Only required if not already set Max length: 36;
+    """
+    id: int | None = None
+    large_menu_icon_id: Annotated[int | None, Field(alias="largeMenuIconId")] = None
+    link: str
+    """
+     Max length: 2000;
+    """
+    location_ids: Annotated[list[int] | None, Field(alias="locationIds")] = None
+    menu_location: Annotated[MenuLocationReference | None, Field(alias="menuLocation")] = None
+    new_window_flag: Annotated[bool, Field(alias="newWindowFlag")]
+    origin: str | None = None
+    """
+     Max length: 2000;
+    """
+    remove_all_locations: Annotated[bool | None, Field(alias="removeAllLocations")] = None
+    small_menu_icon_id: Annotated[int | None, Field(alias="smallMenuIconId")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.menu_location_reference import MenuLocationReference
@@ -0,0 +1,223 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MyAccount(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_invoicing_display_options: Annotated[
+        Literal["RemainOnInvoicingScreen", "ShowRecentInvoices"], Field(alias="agreementInvoicingDisplayOptions")
+    ]
+    allow_expenses_entered_against_companies_flag: Annotated[
+        bool | None, Field(alias="allowExpensesEnteredAgainstCompaniesFlag")
+    ] = None
+    allow_in_cell_entry_on_time_sheet: Annotated[bool | None, Field(alias="allowInCellEntryOnTimeSheet")] = None
+    authentication_service_type: Annotated[
+        Literal["AuthAnvil", "GoogleAuthenticator", "Email"] | None, Field(alias="authenticationServiceType")
+    ] = None
+    auto_popup_quick_notes_with_stopwatch: Annotated[
+        bool | None, Field(alias="autoPopupQuickNotesWithStopwatch")
+    ] = None
+    auto_start_stopwatch: Annotated[bool | None, Field(alias="autoStartStopwatch")] = None
+    billable_forecast: Annotated[float | None, Field(alias="billableForecast")] = None
+    calendar: CalendarReference | None = None
+    calendar_sync_integration_flag: Annotated[bool | None, Field(alias="calendarSyncIntegrationFlag")] = None
+    client_id: Annotated[str | None, Field(alias="clientId")] = None
+    company_activity_tab_format: Annotated[
+        Literal["SummaryList", "DetailList"], Field(alias="companyActivityTabFormat")
+    ]
+    copy_column_layouts_and_filters: Annotated[bool | None, Field(alias="copyColumnLayoutsAndFilters")] = None
+    copy_pod_layouts: Annotated[bool | None, Field(alias="copyPodLayouts")] = None
+    copy_shared_default_views: Annotated[bool | None, Field(alias="copySharedDefaultViews")] = None
+    country: CountryReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    daily_capacity: Annotated[float | None, Field(alias="dailyCapacity")] = None
+    days_tolerance: Annotated[int | None, Field(alias="daysTolerance")] = None
+    default_department: Annotated[SystemDepartmentReference | None, Field(alias="defaultDepartment")] = None
+    default_email: Annotated[Literal["Office", "Mobile", "Home"], Field(alias="defaultEmail")]
+    default_location: Annotated[SystemLocationReference | None, Field(alias="defaultLocation")] = None
+    default_phone: Annotated[Literal["Office", "Mobile", "Home"], Field(alias="defaultPhone")]
+    disable_online_flag: Annotated[bool | None, Field(alias="disableOnlineFlag")] = None
+    employee_identifer: Annotated[str | None, Field(alias="employeeIdentifer")] = None
+    """
+     Max length: 10;
+    """
+    enable_mobile_flag: Annotated[bool | None, Field(alias="enableMobileFlag")] = None
+    enable_mobile_gps_flag: Annotated[bool | None, Field(alias="enableMobileGpsFlag")] = None
+    enter_time_against_company_flag: Annotated[bool | None, Field(alias="enterTimeAgainstCompanyFlag")] = None
+    expense_approver: Annotated[MemberReference | None, Field(alias="expenseApprover")] = None
+    first_name: Annotated[str, Field(alias="firstName")]
+    """
+     Max length: 30;
+    """
+    from_member_rec_id: Annotated[int | None, Field(alias="fromMemberRecId")] = None
+    global_search_default_sort: Annotated[
+        Literal["None", "LastUpdatedDesc", "LastUpdatedAsc", "CreatedDesc", "CreatedAsc"] | None,
+        Field(alias="globalSearchDefaultSort"),
+    ] = None
+    global_search_default_ticket_filter: Annotated[
+        Literal["OpenRecords", "ClosedRecords", "AllRecords"] | None, Field(alias="globalSearchDefaultTicketFilter")
+    ] = None
+    hide_member_in_dispatch_portal_flag: Annotated[bool | None, Field(alias="hideMemberInDispatchPortalFlag")] = None
+    hire_date: Annotated[datetime, Field(alias="hireDate")]
+    home_email: Annotated[str | None, Field(alias="homeEmail")] = None
+    """
+     Max length: 250;
+    """
+    home_extension: Annotated[str | None, Field(alias="homeExtension")] = None
+    """
+     Max length: 10;
+    """
+    home_phone: Annotated[str | None, Field(alias="homePhone")] = None
+    """
+     Max length: 15;
+    """
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 15;
+    """
+    inactive_date: Annotated[datetime | None, Field(alias="inactiveDate")] = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    include_in_utilization_reporting_flag: Annotated[
+        bool | None, Field(alias="includeInUtilizationReportingFlag")
+    ] = None
+    invoice_screen_default_tab_format: Annotated[
+        Literal["ShowInvoicingTab", "ShowAgreementInvoicingTab"], Field(alias="invoiceScreenDefaultTabFormat")
+    ]
+    invoice_time_tab_format: Annotated[Literal["SummaryList", "DetailList"], Field(alias="invoiceTimeTabFormat")]
+    invoicing_display_options: Annotated[
+        Literal["RemainOnInvoicingScreen", "ShowRecentInvoices"], Field(alias="invoicingDisplayOptions")
+    ]
+    last_login: Annotated[str | None, Field(alias="lastLogin")] = None
+    last_name: Annotated[str, Field(alias="lastName")]
+    """
+     Max length: 30;
+    """
+    license_class: Annotated[Literal["A", "C", "F", "X"], Field(alias="licenseClass")]
+    """
+    F = Full Member, A = API Member, C = StreamlineIT Member, X = Subcontractor Member
+    """
+    mapi_name: Annotated[str | None, Field(alias="mapiName")] = None
+    member_personas: Annotated[list[int] | None, Field(alias="memberPersonas")] = None
+    middle_initial: Annotated[str | None, Field(alias="middleInitial")] = None
+    """
+     Max length: 1;
+    """
+    minimum_hours: Annotated[float | None, Field(alias="minimumHours")] = None
+    mobile_email: Annotated[str | None, Field(alias="mobileEmail")] = None
+    """
+     Max length: 250;
+    """
+    mobile_extension: Annotated[str | None, Field(alias="mobileExtension")] = None
+    """
+     Max length: 10;
+    """
+    mobile_phone: Annotated[str | None, Field(alias="mobilePhone")] = None
+    """
+     Max length: 15;
+    """
+    notes: str | None = None
+    office365: MemberOffice365 | None = None
+    office_email: Annotated[str | None, Field(alias="officeEmail")] = None
+    """
+     Max length: 250;
+    """
+    office_extension: Annotated[str | None, Field(alias="officeExtension")] = None
+    """
+     Max length: 10;
+    """
+    office_phone: Annotated[str | None, Field(alias="officePhone")] = None
+    """
+     Max length: 15;
+    """
+    partner_portal_flag: Annotated[bool | None, Field(alias="partnerPortalFlag")] = None
+    password: str | None = None
+    """
+    ConditionallyRequired. API Member will get random password generated Max length: 60;
+    """
+    phone_integration_type: Annotated[
+        Literal["TAPI", "SKYPE", "NONE"] | None, Field(alias="phoneIntegrationType")
+    ] = None
+    phone_source: Annotated[str | None, Field(alias="phoneSource")] = None
+    photo: DocumentReference | None = None
+    primary_email: Annotated[str | None, Field(alias="primaryEmail")] = None
+    """
+     Max length: 250;
+    """
+    project_default_board: Annotated[ProjectBoardReference | None, Field(alias="projectDefaultBoard")] = None
+    project_default_department: Annotated[
+        SystemDepartmentReference | None, Field(alias="projectDefaultDepartment")
+    ] = None
+    project_default_location: Annotated[SystemLocationReference | None, Field(alias="projectDefaultLocation")] = None
+    report_card: Annotated[ReportCardReference | None, Field(alias="reportCard")] = None
+    reports_to: Annotated[MemberReference | None, Field(alias="reportsTo")] = None
+    require_expense_entry_flag: Annotated[bool | None, Field(alias="requireExpenseEntryFlag")] = None
+    require_start_and_end_time_on_time_entry_flag: Annotated[
+        bool | None, Field(alias="requireStartAndEndTimeOnTimeEntryFlag")
+    ] = None
+    require_time_sheet_entry_flag: Annotated[bool | None, Field(alias="requireTimeSheetEntryFlag")] = None
+    sales_default_location: Annotated[SystemLocationReference | None, Field(alias="salesDefaultLocation")] = None
+    schedule_capacity: Annotated[float | None, Field(alias="scheduleCapacity")] = None
+    schedule_default_department: Annotated[
+        SystemDepartmentReference | None, Field(alias="scheduleDefaultDepartment")
+    ] = None
+    schedule_default_location: Annotated[SystemLocationReference | None, Field(alias="scheduleDefaultLocation")] = None
+    service_board_team_ids: Annotated[list[int] | None, Field(alias="serviceBoardTeamIds")] = None
+    service_default_board: Annotated[BoardReference | None, Field(alias="serviceDefaultBoard")] = None
+    service_default_department: Annotated[
+        SystemDepartmentReference | None, Field(alias="serviceDefaultDepartment")
+    ] = None
+    service_default_location: Annotated[SystemLocationReference | None, Field(alias="serviceDefaultLocation")] = None
+    service_location: Annotated[ServiceLocationReference | None, Field(alias="serviceLocation")] = None
+    signature: str | None = None
+    sts_user_admin_url: Annotated[str | None, Field(alias="stsUserAdminUrl")] = None
+    time_approver: Annotated[MemberReference | None, Field(alias="timeApprover")] = None
+    time_reminder_email_flag: Annotated[bool | None, Field(alias="timeReminderEmailFlag")] = None
+    time_sheet_start_date: Annotated[datetime | None, Field(alias="timeSheetStartDate")] = None
+    time_zone: Annotated[TimeZoneSetupReference | None, Field(alias="timeZone")] = None
+    timebased_one_time_password_activated: Annotated[
+        bool | None, Field(alias="timebasedOneTimePasswordActivated")
+    ] = None
+    title: str | None = None
+    """
+     Max length: 50;
+    """
+    toast_notification_flag: Annotated[bool | None, Field(alias="toastNotificationFlag")] = None
+    token: str | None = None
+    type: MemberTypeReference | None = None
+    use_browser_language_flag: Annotated[bool | None, Field(alias="useBrowserLanguageFlag")] = None
+    vendor_number: Annotated[str | None, Field(alias="vendorNumber")] = None
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: Annotated[WarehouseBinReference | None, Field(alias="warehouseBin")] = None
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+    work_type: Annotated[WorkTypeReference | None, Field(alias="workType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.calendar_reference import CalendarReference
+from pyconnectwise.models.manage.country_reference import CountryReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.document_reference import DocumentReference
+from pyconnectwise.models.manage.member_office365 import MemberOffice365
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.member_type_reference import MemberTypeReference
+from pyconnectwise.models.manage.project_board_reference import ProjectBoardReference
+from pyconnectwise.models.manage.report_card_reference import ReportCardReference
+from pyconnectwise.models.manage.service_location_reference import ServiceLocationReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.time_zone_setup_reference import TimeZoneSetupReference
+from pyconnectwise.models.manage.warehouse_bin_reference import WarehouseBinReference
+from pyconnectwise.models.manage.warehouse_reference import WarehouseReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
+from pyconnectwise.models.manage.work_type_reference import WorkTypeReference
@@ -0,0 +1,184 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MyMember(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    admin_flag: Annotated[bool | None, Field(alias="adminFlag")] = None
+    agreement_invoicing_display_options: Annotated[
+        Literal["RemainOnInvoicingScreen", "ShowRecentInvoices"] | None, Field(alias="agreementInvoicingDisplayOptions")
+    ] = None
+    allow_expenses_entered_against_companies_flag: Annotated[
+        bool | None, Field(alias="allowExpensesEnteredAgainstCompaniesFlag")
+    ] = None
+    allow_in_cell_entry_on_time_sheet: Annotated[bool | None, Field(alias="allowInCellEntryOnTimeSheet")] = None
+    authentication_service_type: Annotated[
+        Literal["AuthAnvil", "GoogleAuthenticator", "Email"] | None, Field(alias="authenticationServiceType")
+    ] = None
+    billable_forecast: Annotated[float | None, Field(alias="billableForecast")] = None
+    calendar: CalendarReference | None = None
+    calendar_sync_integration_flag: Annotated[bool | None, Field(alias="calendarSyncIntegrationFlag")] = None
+    company_activity_tab_format: Annotated[
+        Literal["SummaryList", "DetailList"] | None, Field(alias="companyActivityTabFormat")
+    ] = None
+    corelytics_password: Annotated[str | None, Field(alias="corelyticsPassword")] = None
+    corelytics_username: Annotated[str | None, Field(alias="corelyticsUsername")] = None
+    country: CountryReference | None = None
+    daily_capacity: Annotated[float | None, Field(alias="dailyCapacity")] = None
+    days_tolerance: Annotated[int | None, Field(alias="daysTolerance")] = None
+    default_department: Annotated[SystemDepartmentReference | None, Field(alias="defaultDepartment")] = None
+    default_email: Annotated[Literal["Office", "Mobile", "Home"] | None, Field(alias="defaultEmail")] = None
+    default_location: Annotated[SystemLocationReference | None, Field(alias="defaultLocation")] = None
+    default_phone: Annotated[Literal["Office", "Mobile", "Home"] | None, Field(alias="defaultPhone")] = None
+    disable_online_flag: Annotated[bool | None, Field(alias="disableOnlineFlag")] = None
+    employee_identifer: Annotated[str | None, Field(alias="employeeIdentifer")] = None
+    enable_ldap_authentication_flag: Annotated[bool | None, Field(alias="enableLdapAuthenticationFlag")] = None
+    enable_mobile_flag: Annotated[bool | None, Field(alias="enableMobileFlag")] = None
+    enable_mobile_gps_flag: Annotated[bool | None, Field(alias="enableMobileGpsFlag")] = None
+    enter_time_against_company_flag: Annotated[bool | None, Field(alias="enterTimeAgainstCompanyFlag")] = None
+    excluded_project_board_ids: Annotated[list[int] | None, Field(alias="excludedProjectBoardIds")] = None
+    excluded_service_board_ids: Annotated[list[int] | None, Field(alias="excludedServiceBoardIds")] = None
+    expense_approver: Annotated[MemberReference | None, Field(alias="expenseApprover")] = None
+    first_name: Annotated[str | None, Field(alias="firstName")] = None
+    hide_member_in_dispatch_portal_flag: Annotated[bool | None, Field(alias="hideMemberInDispatchPortalFlag")] = None
+    hire_date: Annotated[datetime | None, Field(alias="hireDate")] = None
+    home_email: Annotated[str | None, Field(alias="homeEmail")] = None
+    home_extension: Annotated[str | None, Field(alias="homeExtension")] = None
+    home_phone: Annotated[str | None, Field(alias="homePhone")] = None
+    hourly_cost: Annotated[float | None, Field(alias="hourlyCost")] = None
+    hourly_rate: Annotated[float | None, Field(alias="hourlyRate")] = None
+    id: int | None = None
+    identifier: str | None = None
+    inactive_date: Annotated[datetime | None, Field(alias="inactiveDate")] = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    include_in_utilization_reporting_flag: Annotated[
+        bool | None, Field(alias="includeInUtilizationReportingFlag")
+    ] = None
+    invoice_screen_default_tab_format: Annotated[
+        Literal["ShowInvoicingTab", "ShowAgreementInvoicingTab"] | None, Field(alias="invoiceScreenDefaultTabFormat")
+    ] = None
+    invoice_time_tab_format: Annotated[
+        Literal["SummaryList", "DetailList"] | None, Field(alias="invoiceTimeTabFormat")
+    ] = None
+    invoicing_display_options: Annotated[
+        Literal["RemainOnInvoicingScreen", "ShowRecentInvoices"] | None, Field(alias="invoicingDisplayOptions")
+    ] = None
+    last_login: Annotated[str | None, Field(alias="lastLogin")] = None
+    last_name: Annotated[str | None, Field(alias="lastName")] = None
+    ldap_configuration: Annotated[LdapConfigurationReference | None, Field(alias="ldapConfiguration")] = None
+    ldap_user_name: Annotated[str | None, Field(alias="ldapUserName")] = None
+    license_class: Annotated[Literal["A", "C", "F", "X"] | None, Field(alias="licenseClass")] = None
+    """
+    F = Full Member, A = API Member, C = StreamlineIT Member, X = Subcontractor Member
+    """
+    mapi_name: Annotated[str | None, Field(alias="mapiName")] = None
+    middle_initial: Annotated[str | None, Field(alias="middleInitial")] = None
+    minimum_hours: Annotated[float | None, Field(alias="minimumHours")] = None
+    mobile_email: Annotated[str | None, Field(alias="mobileEmail")] = None
+    mobile_extension: Annotated[str | None, Field(alias="mobileExtension")] = None
+    mobile_phone: Annotated[str | None, Field(alias="mobilePhone")] = None
+    notes: str | None = None
+    office_email: Annotated[str | None, Field(alias="officeEmail")] = None
+    office_extension: Annotated[str | None, Field(alias="officeExtension")] = None
+    office_phone: Annotated[str | None, Field(alias="officePhone")] = None
+    password: str | None = None
+    """
+    ConditionallyRequired. API Member will get random password generated
+    """
+    photo: DocumentReference | None = None
+    project_default_board: Annotated[ProjectBoardReference | None, Field(alias="projectDefaultBoard")] = None
+    project_default_department: Annotated[
+        SystemDepartmentReference | None, Field(alias="projectDefaultDepartment")
+    ] = None
+    project_default_location: Annotated[SystemLocationReference | None, Field(alias="projectDefaultLocation")] = None
+    report_card: Annotated[ReportCardReference | None, Field(alias="reportCard")] = None
+    reports_to: Annotated[MemberReference | None, Field(alias="reportsTo")] = None
+    require_expense_entry_flag: Annotated[bool | None, Field(alias="requireExpenseEntryFlag")] = None
+    require_start_and_end_time_on_time_entry_flag: Annotated[
+        bool | None, Field(alias="requireStartAndEndTimeOnTimeEntryFlag")
+    ] = None
+    require_time_sheet_entry_flag: Annotated[bool | None, Field(alias="requireTimeSheetEntryFlag")] = None
+    restrict_default_sales_territory_flag: Annotated[
+        bool | None, Field(alias="restrictDefaultSalesTerritoryFlag")
+    ] = None
+    restrict_default_warehouse_bin_flag: Annotated[bool | None, Field(alias="restrictDefaultWarehouseBinFlag")] = None
+    restrict_default_warehouse_flag: Annotated[bool | None, Field(alias="restrictDefaultWarehouseFlag")] = None
+    restrict_department_flag: Annotated[bool | None, Field(alias="restrictDepartmentFlag")] = None
+    restrict_location_flag: Annotated[bool | None, Field(alias="restrictLocationFlag")] = None
+    restrict_project_default_department_flag: Annotated[
+        bool | None, Field(alias="restrictProjectDefaultDepartmentFlag")
+    ] = None
+    restrict_project_default_location_flag: Annotated[
+        bool | None, Field(alias="restrictProjectDefaultLocationFlag")
+    ] = None
+    restrict_schedule_flag: Annotated[bool | None, Field(alias="restrictScheduleFlag")] = None
+    restrict_service_default_department_flag: Annotated[
+        bool | None, Field(alias="restrictServiceDefaultDepartmentFlag")
+    ] = None
+    restrict_service_default_location_flag: Annotated[
+        bool | None, Field(alias="restrictServiceDefaultLocationFlag")
+    ] = None
+    sales_default_location: Annotated[SystemLocationReference | None, Field(alias="salesDefaultLocation")] = None
+    schedule_capacity: Annotated[float | None, Field(alias="scheduleCapacity")] = None
+    schedule_default_department: Annotated[
+        SystemDepartmentReference | None, Field(alias="scheduleDefaultDepartment")
+    ] = None
+    schedule_default_location: Annotated[SystemLocationReference | None, Field(alias="scheduleDefaultLocation")] = None
+    security_location: Annotated[SystemLocationReference | None, Field(alias="securityLocation")] = None
+    security_role: Annotated[SecurityRoleReference | None, Field(alias="securityRole")] = None
+    service_board_team_ids: Annotated[list[int] | None, Field(alias="serviceBoardTeamIds")] = None
+    service_default_board: Annotated[BoardReference | None, Field(alias="serviceDefaultBoard")] = None
+    service_default_department: Annotated[
+        SystemDepartmentReference | None, Field(alias="serviceDefaultDepartment")
+    ] = None
+    service_default_location: Annotated[SystemLocationReference | None, Field(alias="serviceDefaultLocation")] = None
+    service_location: Annotated[ServiceLocationReference | None, Field(alias="serviceLocation")] = None
+    sso_client_id: Annotated[str | None, Field(alias="ssoClientId")] = None
+    sso_session_flag: Annotated[bool | None, Field(alias="ssoSessionFlag")] = None
+    structure_level: Annotated[StructureReference | None, Field(alias="structureLevel")] = None
+    time_approver: Annotated[MemberReference | None, Field(alias="timeApprover")] = None
+    time_reminder_email_flag: Annotated[bool | None, Field(alias="timeReminderEmailFlag")] = None
+    time_sheet_start_date: Annotated[datetime | None, Field(alias="timeSheetStartDate")] = None
+    time_zone: Annotated[TimeZoneSetupReference | None, Field(alias="timeZone")] = None
+    timebased_one_time_password_activated: Annotated[
+        bool | None, Field(alias="timebasedOneTimePasswordActivated")
+    ] = None
+    title: str | None = None
+    toast_notification_flag: Annotated[bool | None, Field(alias="toastNotificationFlag")] = None
+    type: MemberTypeReference | None = None
+    vendor_number: Annotated[str | None, Field(alias="vendorNumber")] = None
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: Annotated[WarehouseBinReference | None, Field(alias="warehouseBin")] = None
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+    work_type: Annotated[WorkTypeReference | None, Field(alias="workType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.calendar_reference import CalendarReference
+from pyconnectwise.models.manage.country_reference import CountryReference
+from pyconnectwise.models.manage.document_reference import DocumentReference
+from pyconnectwise.models.manage.ldap_configuration_reference import LdapConfigurationReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.member_type_reference import MemberTypeReference
+from pyconnectwise.models.manage.project_board_reference import ProjectBoardReference
+from pyconnectwise.models.manage.report_card_reference import ReportCardReference
+from pyconnectwise.models.manage.security_role_reference import SecurityRoleReference
+from pyconnectwise.models.manage.service_location_reference import ServiceLocationReference
+from pyconnectwise.models.manage.structure_reference import StructureReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.time_zone_setup_reference import TimeZoneSetupReference
+from pyconnectwise.models.manage.warehouse_bin_reference import WarehouseBinReference
+from pyconnectwise.models.manage.warehouse_reference import WarehouseReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
+from pyconnectwise.models.manage.work_type_reference import WorkTypeReference
@@ -0,0 +1,94 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MyMemberInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    allow_expenses_entered_against_companies_flag: Annotated[
+        bool | None, Field(alias="allowExpensesEnteredAgainstCompaniesFlag")
+    ] = None
+    daily_capacity: Annotated[float | None, Field(alias="dailyCapacity")] = None
+    default_department: Annotated[SystemDepartmentReference | None, Field(alias="defaultDepartment")] = None
+    default_email: Annotated[str | None, Field(alias="defaultEmail")] = None
+    default_location: Annotated[SystemLocationReference | None, Field(alias="defaultLocation")] = None
+    enter_time_against_company_flag: Annotated[bool | None, Field(alias="enterTimeAgainstCompanyFlag")] = None
+    excluded_project_board_ids: Annotated[list[int] | None, Field(alias="excludedProjectBoardIds")] = None
+    excluded_service_board_ids: Annotated[list[int] | None, Field(alias="excludedServiceBoardIds")] = None
+    first_name: Annotated[str | None, Field(alias="firstName")] = None
+    full_name: Annotated[str | None, Field(alias="fullName")] = None
+    id: int | None = None
+    identifier: str | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    last_name: Annotated[str | None, Field(alias="lastName")] = None
+    license_class: Annotated[Literal["A", "C", "F", "X"] | None, Field(alias="licenseClass")] = None
+    """
+    F = Full Member, A = API Member, C = StreamlineIT Member, X = Subcontractor Member
+    """
+    middle_initial: Annotated[str | None, Field(alias="middleInitial")] = None
+    photo: DocumentReference | None = None
+    project_default_board: Annotated[ProjectBoardReference | None, Field(alias="projectDefaultBoard")] = None
+    project_default_department: Annotated[
+        SystemDepartmentReference | None, Field(alias="projectDefaultDepartment")
+    ] = None
+    project_default_location: Annotated[SystemLocationReference | None, Field(alias="projectDefaultLocation")] = None
+    require_expense_entry_flag: Annotated[bool | None, Field(alias="requireExpenseEntryFlag")] = None
+    require_start_and_end_time_on_time_entry_flag: Annotated[
+        bool | None, Field(alias="requireStartAndEndTimeOnTimeEntryFlag")
+    ] = None
+    require_time_sheet_entry_flag: Annotated[bool | None, Field(alias="requireTimeSheetEntryFlag")] = None
+    restrict_default_warehouse_bin_flag: Annotated[bool | None, Field(alias="restrictDefaultWarehouseBinFlag")] = None
+    restrict_default_warehouse_flag: Annotated[bool | None, Field(alias="restrictDefaultWarehouseFlag")] = None
+    restrict_project_default_department_flag: Annotated[
+        bool | None, Field(alias="restrictProjectDefaultDepartmentFlag")
+    ] = None
+    restrict_project_default_location_flag: Annotated[
+        bool | None, Field(alias="restrictProjectDefaultLocationFlag")
+    ] = None
+    restrict_service_default_department_flag: Annotated[
+        bool | None, Field(alias="restrictServiceDefaultDepartmentFlag")
+    ] = None
+    restrict_service_default_location_flag: Annotated[
+        bool | None, Field(alias="restrictServiceDefaultLocationFlag")
+    ] = None
+    sales_default_location: Annotated[SystemLocationReference | None, Field(alias="salesDefaultLocation")] = None
+    schedule_capacity: Annotated[float | None, Field(alias="scheduleCapacity")] = None
+    schedule_default_department: Annotated[
+        SystemDepartmentReference | None, Field(alias="scheduleDefaultDepartment")
+    ] = None
+    schedule_default_location: Annotated[SystemLocationReference | None, Field(alias="scheduleDefaultLocation")] = None
+    service_default_board: Annotated[BoardReference | None, Field(alias="serviceDefaultBoard")] = None
+    service_default_department: Annotated[
+        SystemDepartmentReference | None, Field(alias="serviceDefaultDepartment")
+    ] = None
+    service_default_location: Annotated[SystemLocationReference | None, Field(alias="serviceDefaultLocation")] = None
+    service_location: Annotated[ServiceLocationReference | None, Field(alias="serviceLocation")] = None
+    sso_client_id: Annotated[str | None, Field(alias="ssoClientId")] = None
+    sso_session_flag: Annotated[bool | None, Field(alias="ssoSessionFlag")] = None
+    time_zone: Annotated[TimeZoneSetupReference | None, Field(alias="timeZone")] = None
+    use_browser_language_flag: Annotated[bool | None, Field(alias="useBrowserLanguageFlag")] = None
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: Annotated[WarehouseBinReference | None, Field(alias="warehouseBin")] = None
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+    work_type: Annotated[WorkTypeReference | None, Field(alias="workType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.document_reference import DocumentReference
+from pyconnectwise.models.manage.project_board_reference import ProjectBoardReference
+from pyconnectwise.models.manage.service_location_reference import ServiceLocationReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.time_zone_setup_reference import TimeZoneSetupReference
+from pyconnectwise.models.manage.warehouse_bin_reference import WarehouseBinReference
+from pyconnectwise.models.manage.warehouse_reference import WarehouseReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
+from pyconnectwise.models.manage.work_type_reference import WorkTypeReference
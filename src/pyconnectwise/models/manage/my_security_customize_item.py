@@ -0,0 +1,39 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class MySecurityCustomizeItem(ConnectWiseModel):
+    customize_identifier: Annotated[
+        Literal[
+            "CompanyReports",
+            "FinanceReports",
+            "MarketingReports",
+            "ProcurementReports",
+            "ProjectReports",
+            "SalesReports",
+            "ServiceReports",
+            "SystemReports",
+            "TimeAndExpenseReports",
+            "CompanyConfigurations",
+            "FinanceAgreements",
+            "ProjectScheduling",
+            "ServiceResourceScheduling",
+            "SystemManageHostedApi",
+            "SystemMyAccount",
+            "SystemCustomMenuEntry",
+            "SystemMassMaintenance",
+            "SystemTableSetup",
+        ]
+        | None,
+        Field(alias="customizeIdentifier"),
+    ] = None
+    id: int | None = None
+    item_identifier: Annotated[str | None, Field(alias="itemIdentifier")] = None
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class NotificationRecipient(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_flag: Annotated[bool | None, Field(alias="agreementFlag")] = None
+    config_flag: Annotated[bool | None, Field(alias="configFlag")] = None
+    external_flag: Annotated[bool | None, Field(alias="externalFlag")] = None
+    id: int | None = None
+    identifier: str | None = None
+    invoice_flag: Annotated[bool | None, Field(alias="invoiceFlag")] = None
+    knowledge_base_flag: Annotated[bool | None, Field(alias="knowledgeBaseFlag")] = None
+    member_flag: Annotated[bool | None, Field(alias="memberFlag")] = None
+    msp_flag: Annotated[bool | None, Field(alias="mspFlag")] = None
+    name: str | None = None
+    procurement_flag: Annotated[bool | None, Field(alias="procurementFlag")] = None
+    project_flag: Annotated[bool | None, Field(alias="projectFlag")] = None
+    sales_flag: Annotated[bool | None, Field(alias="salesFlag")] = None
+    service_flag: Annotated[bool | None, Field(alias="serviceFlag")] = None
+    track_flag: Annotated[bool | None, Field(alias="trackFlag")] = None
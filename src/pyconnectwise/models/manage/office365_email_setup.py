@@ -0,0 +1,54 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Office365EmailSetup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    authorized_flag: Annotated[bool | None, Field(alias="authorizedFlag")] = None
+    client_id: Annotated[str | None, Field(alias="clientId")] = None
+    """
+     Max length: 36;
+    """
+    client_secret: Annotated[str | None, Field(alias="clientSecret")] = None
+    """
+     Max length: 4000;
+    """
+    email_connector: Annotated[EmailConnectorReference | None, Field(alias="emailConnector")] = None
+    failed_folder: Annotated[str, Field(alias="failedFolder")]
+    """
+     Max length: 40;
+    """
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    inbox_folder: Annotated[str, Field(alias="inboxFolder")]
+    """
+     Max length: 40;
+    """
+    name: str
+    """
+     Max length: 200;
+    """
+    processed_folder: Annotated[str, Field(alias="processedFolder")]
+    """
+     Max length: 40;
+    """
+    tenant_id: Annotated[str | None, Field(alias="tenantId")] = None
+    """
+     Max length: 36;
+    """
+    username: str
+    """
+     Max length: 100;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.email_connector_reference import EmailConnectorReference
@@ -0,0 +1,88 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Opportunity(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    bill_to_company: Annotated[CompanyReference | None, Field(alias="billToCompany")] = None
+    bill_to_contact: Annotated[ContactReference | None, Field(alias="billToContact")] = None
+    bill_to_site: Annotated[SiteReference | None, Field(alias="billToSite")] = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    """
+     Required On Updates;
+    """
+    campaign: CampaignReference | None = None
+    closed_by: Annotated[MemberReference | None, Field(alias="closedBy")] = None
+    closed_date: Annotated[datetime | None, Field(alias="closedDate")] = None
+    company: CompanyReference | None = None
+    company_location_id: Annotated[int | None, Field(alias="companyLocationId")] = None
+    contact: ContactReference | None = None
+    currency: CurrencyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    customer_po: Annotated[str | None, Field(alias="customerPO")] = None
+    """
+     Max length: 25;
+    """
+    date_became_lead: Annotated[datetime | None, Field(alias="dateBecameLead")] = None
+    expected_close_date: Annotated[datetime | None, Field(alias="expectedCloseDate")] = None
+    """
+     Required On Updates;
+    """
+    id: int | None = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    """
+     Required On Updates;
+    """
+    name: str
+    """
+     Max length: 100;
+    """
+    notes: str | None = None
+    pipeline_change_date: Annotated[datetime | None, Field(alias="pipelineChangeDate")] = None
+    primary_sales_rep: Annotated[MemberReference | None, Field(alias="primarySalesRep")] = None
+    priority: OpportunityPriorityReference | None = None
+    probability: OpportunityProbabilityReference | None = None
+    rating: OpportunityRatingReference | None = None
+    secondary_sales_rep: Annotated[MemberReference | None, Field(alias="secondarySalesRep")] = None
+    ship_to_company: Annotated[CompanyReference | None, Field(alias="shipToCompany")] = None
+    ship_to_contact: Annotated[ContactReference | None, Field(alias="shipToContact")] = None
+    ship_to_site: Annotated[SiteReference | None, Field(alias="shipToSite")] = None
+    site: SiteReference | None = None
+    source: str | None = None
+    """
+     Max length: 50;
+    """
+    stage: OpportunityStageReference | None = None
+    status: OpportunityStatusReference | None = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    technical_contact: Annotated[ContactReference | None, Field(alias="technicalContact")] = None
+    total_sales_tax: Annotated[float | None, Field(alias="totalSalesTax")] = None
+    type: OpportunityTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.campaign_reference import CampaignReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.opportunity_priority_reference import OpportunityPriorityReference
+from pyconnectwise.models.manage.opportunity_probability_reference import OpportunityProbabilityReference
+from pyconnectwise.models.manage.opportunity_rating_reference import OpportunityRatingReference
+from pyconnectwise.models.manage.opportunity_stage_reference import OpportunityStageReference
+from pyconnectwise.models.manage.opportunity_status_reference import OpportunityStatusReference
+from pyconnectwise.models.manage.opportunity_type_reference import OpportunityTypeReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
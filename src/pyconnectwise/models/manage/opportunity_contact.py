@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityContact(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    email_address: Annotated[str | None, Field(alias="emailAddress")] = None
+    id: int | None = None
+    notes: str | None = None
+    opportunity_id: Annotated[int | None, Field(alias="opportunityId")] = None
+    phone_number: Annotated[str | None, Field(alias="phoneNumber")] = None
+    referral_flag: Annotated[bool | None, Field(alias="referralFlag")] = None
+    role: OpportunitySalesRoleReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.opportunity_sales_role_reference import OpportunitySalesRoleReference
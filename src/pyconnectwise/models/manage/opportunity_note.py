@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityNote(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    entered_by: Annotated[str | None, Field(alias="enteredBy")] = None
+    flagged: bool | None = None
+    id: int | None = None
+    mobile_guid: Annotated[UUID | None, Field(alias="mobileGuid")] = None
+    opportunity_id: Annotated[int | None, Field(alias="opportunityId")] = None
+    text: str
+    type: NoteTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.note_type_reference import NoteTypeReference
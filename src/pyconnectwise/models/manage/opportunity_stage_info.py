@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityStageInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    color: str | None = None
+    id: int | None = None
+    name: str | None = None
+    probability: OpportunityProbabilityReference | None = None
+    sequence_number: Annotated[int | None, Field(alias="sequenceNumber")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.opportunity_probability_reference import OpportunityProbabilityReference
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityStatus(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    closed_flag: Annotated[bool | None, Field(alias="closedFlag")] = None
+    date_entered: Annotated[datetime | None, Field(alias="dateEntered")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    entered_by: Annotated[str | None, Field(alias="enteredBy")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    lost_flag: Annotated[bool | None, Field(alias="lostFlag")] = None
+    name: str
+    """
+     Max length: 30;
+    """
+    won_flag: Annotated[bool | None, Field(alias="wonFlag")] = None
@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityToAgreementConversion(ConnectWiseModel):
+    agreement_id: Annotated[int | None, Field(alias="agreementId")] = None
+    bill_cycle_id: Annotated[int | None, Field(alias="billCycleId")] = None
+    bill_one_time_flag: Annotated[bool | None, Field(alias="billOneTimeFlag")] = None
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    end_date: Annotated[datetime | None, Field(alias="endDate")] = None
+    include_all_documents_flag: Annotated[bool | None, Field(alias="includeAllDocumentsFlag")] = None
+    include_all_notes_flag: Annotated[bool | None, Field(alias="includeAllNotesFlag")] = None
+    include_all_products_flag: Annotated[bool | None, Field(alias="includeAllProductsFlag")] = None
+    include_document_ids: Annotated[list[int] | None, Field(alias="includeDocumentIds")] = None
+    include_note_ids: Annotated[list[int] | None, Field(alias="includeNoteIds")] = None
+    include_product_ids: Annotated[list[int] | None, Field(alias="includeProductIds")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    name: str | None = None
+    no_ending_date_flag: Annotated[bool | None, Field(alias="noEndingDateFlag")] = None
+    start_date: Annotated[datetime | None, Field(alias="startDate")] = None
+    type: AgreementTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_type_reference import AgreementTypeReference
@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityToProjectConversion(ConnectWiseModel):
+    board: ProjectBoardReference | None = None
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    estimated_end: Annotated[datetime | None, Field(alias="estimatedEnd")] = None
+    estimated_start: Annotated[datetime | None, Field(alias="estimatedStart")] = None
+    include_all_documents_flag: Annotated[bool | None, Field(alias="includeAllDocumentsFlag")] = None
+    include_all_notes_flag: Annotated[bool | None, Field(alias="includeAllNotesFlag")] = None
+    include_all_products_flag: Annotated[bool | None, Field(alias="includeAllProductsFlag")] = None
+    include_document_ids: Annotated[list[int] | None, Field(alias="includeDocumentIds")] = None
+    include_note_ids: Annotated[list[int] | None, Field(alias="includeNoteIds")] = None
+    include_product_ids: Annotated[list[int] | None, Field(alias="includeProductIds")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    manager: MemberReference | None = None
+    name: str | None = None
+    project_id: Annotated[int | None, Field(alias="projectId")] = None
+    status: ProjectStatusReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.project_board_reference import ProjectBoardReference
+from pyconnectwise.models.manage.project_status_reference import ProjectStatusReference
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OpportunityToSalesOrderConversion(ConnectWiseModel):
+    include_all_documents_flag: Annotated[bool | None, Field(alias="includeAllDocumentsFlag")] = None
+    include_all_notes_flag: Annotated[bool | None, Field(alias="includeAllNotesFlag")] = None
+    include_all_products_flag: Annotated[bool | None, Field(alias="includeAllProductsFlag")] = None
+    include_document_ids: Annotated[list[int] | None, Field(alias="includeDocumentIds")] = None
+    include_note_ids: Annotated[list[int] | None, Field(alias="includeNoteIds")] = None
+    include_product_ids: Annotated[list[int] | None, Field(alias="includeProductIds")] = None
+    name: str | None = None
+    sales_order_id: Annotated[int | None, Field(alias="salesOrderId")] = None
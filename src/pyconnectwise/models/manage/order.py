@@ -0,0 +1,73 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Order(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    bill_closed_flag: Annotated[bool | None, Field(alias="billClosedFlag")] = None
+    bill_shipped_flag: Annotated[bool | None, Field(alias="billShippedFlag")] = None
+    bill_to_company: Annotated[CompanyReference | None, Field(alias="billToCompany")] = None
+    bill_to_contact: Annotated[ContactReference | None, Field(alias="billToContact")] = None
+    bill_to_site: Annotated[SiteReference | None, Field(alias="billToSite")] = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    bottom_comment_flag: Annotated[bool | None, Field(alias="bottomCommentFlag")] = None
+    company: CompanyReference | None = None
+    company_location: Annotated[SystemLocationReference | None, Field(alias="companyLocation")] = None
+    config_ids: Annotated[list[int] | None, Field(alias="configIds")] = None
+    contact: ContactReference | None = None
+    currency: CurrencyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    department: SystemDepartmentReference | None = None
+    description: str | None = None
+    document_ids: Annotated[list[int] | None, Field(alias="documentIds")] = None
+    due_date: Annotated[datetime | None, Field(alias="dueDate")] = None
+    email: str | None = None
+    id: int | None = None
+    invoice_ids: Annotated[list[int] | None, Field(alias="invoiceIds")] = None
+    location: SystemLocationReference | None = None
+    notes: str | None = None
+    opportunity: OpportunityReference | None = None
+    order_date: Annotated[datetime | None, Field(alias="orderDate")] = None
+    phone: str | None = None
+    phone_ext: Annotated[str | None, Field(alias="phoneExt")] = None
+    po_number: Annotated[str | None, Field(alias="poNumber")] = None
+    """
+     Max length: 50;
+    """
+    product_ids: Annotated[list[int] | None, Field(alias="productIds")] = None
+    restrict_downpayment_flag: Annotated[bool | None, Field(alias="restrictDownpaymentFlag")] = None
+    sales_rep: Annotated[MemberReference | None, Field(alias="salesRep")] = None
+    ship_to_company: Annotated[CompanyReference | None, Field(alias="shipToCompany")] = None
+    ship_to_contact: Annotated[ContactReference | None, Field(alias="shipToContact")] = None
+    ship_to_site: Annotated[SiteReference | None, Field(alias="shipToSite")] = None
+    site: SiteReference | None = None
+    status: OrderStatusReference | None = None
+    sub_total: Annotated[float | None, Field(alias="subTotal")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    tax_total: Annotated[float | None, Field(alias="taxTotal")] = None
+    top_comment_flag: Annotated[bool | None, Field(alias="topCommentFlag")] = None
+    total: float | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.opportunity_reference import OpportunityReference
+from pyconnectwise.models.manage.order_status_reference import OrderStatusReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
@@ -0,0 +1,55 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Other(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    contact_sync: Annotated[Literal["FL", "LF", "CFL", "CLF"] | None, Field(alias="contactSync")] = None
+    default_address_format: Annotated[AddressFormatReference | None, Field(alias="defaultAddressFormat")] = None
+    default_calendar: Annotated[CalendarReference | None, Field(alias="defaultCalendar")] = None
+    default_from_address: Annotated[str, Field(alias="defaultFromAddress")]
+    """
+     Max length: 50;
+    """
+    default_ldap: Annotated[LdapConfigurationReference | None, Field(alias="defaultLdap")] = None
+    disable_z_admin_login_flag: Annotated[bool | None, Field(alias="disableZAdminLoginFlag")] = None
+    id: int | None = None
+    include_portal_link_flag: Annotated[bool | None, Field(alias="includePortalLinkFlag")] = None
+    locale: LocaleReference | None = None
+    logo_path: Annotated[str | None, Field(alias="logoPath")] = None
+    """
+     Max length: 200;
+    """
+    portal_url_override: Annotated[str, Field(alias="portalUrlOverride")]
+    """
+     Max length: 100;
+    """
+    server_time_zone: Annotated[TimeZoneSetupReference | None, Field(alias="serverTimeZone")] = None
+    site_url: Annotated[str, Field(alias="siteUrl")]
+    """
+     Max length: 100;
+    """
+    sync_leads_flag: Annotated[bool | None, Field(alias="syncLeadsFlag")] = None
+    update_member_time_zones_flag: Annotated[bool | None, Field(alias="updateMemberTimeZonesFlag")] = None
+    """
+    If true, all Members time zone will also be set to serverTimeZone. Otherwise, only My Company time zone will be updated.
+    """
+    use_expanded_format_activity_flag: Annotated[bool | None, Field(alias="useExpandedFormatActivityFlag")] = None
+    use_expanded_format_time_flag: Annotated[bool | None, Field(alias="useExpandedFormatTimeFlag")] = None
+    use_ssl_flag: Annotated[bool | None, Field(alias="useSslFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.address_format_reference import AddressFormatReference
+from pyconnectwise.models.manage.calendar_reference import CalendarReference
+from pyconnectwise.models.manage.ldap_configuration_reference import LdapConfigurationReference
+from pyconnectwise.models.manage.locale_reference import LocaleReference
+from pyconnectwise.models.manage.time_zone_setup_reference import TimeZoneSetupReference
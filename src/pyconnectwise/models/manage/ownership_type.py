@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class OwnershipType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    core_entity_ownership_type: Annotated[
+        Literal[
+            "CharitableOrganization",
+            "Clinic",
+            "Government",
+            "Hospital",
+            "PrivateSchoolForProfit",
+            "PrivateSchoolNonProfit",
+            "PublicCompany",
+            "PublicSchool",
+            "Regulator",
+            "Reseller",
+            "SmallBusiness",
+        ]
+        | None,
+        Field(alias="coreEntityOwnershipType"),
+    ] = None
+    id: int | None = None
+    name: str
+    """
+     Max length: 200;
+    """
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PageValues(ConnectWiseModel):
+    page: int | None = None
+    page_id: Annotated[int | None, Field(alias="pageId")] = None
+    page_size: Annotated[int | None, Field(alias="pageSize")] = None
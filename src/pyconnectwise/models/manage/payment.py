@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Payment(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    amount: float | None = None
+    applied_by: Annotated[str | None, Field(alias="appliedBy")] = None
+    credit: InvoiceReference | None = None
+    id: int | None = None
+    invoice: InvoiceReference | None = None
+    payment_date: Annotated[datetime | None, Field(alias="paymentDate")] = None
+    type: str | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.invoice_reference import InvoiceReference
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalCalendar(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    adjust1_end: Annotated[str | None, Field(alias="adjust1End")] = None
+    adjust1_hours: Annotated[float | None, Field(alias="adjust1Hours")] = None
+    adjust1_start: Annotated[str | None, Field(alias="adjust1Start")] = None
+    adjust2_end: Annotated[str | None, Field(alias="adjust2End")] = None
+    adjust2_hours: Annotated[float | None, Field(alias="adjust2Hours")] = None
+    adjust2_start: Annotated[str | None, Field(alias="adjust2Start")] = None
+    adjust3_end: Annotated[str | None, Field(alias="adjust3End")] = None
+    adjust3_hours: Annotated[float | None, Field(alias="adjust3Hours")] = None
+    adjust3_start: Annotated[str | None, Field(alias="adjust3Start")] = None
+    id: int | None = None
+    week_start: Annotated[
+        Literal["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"], Field(alias="weekStart")
+    ]
@@ -0,0 +1,74 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfiguration(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement_type_ids: Annotated[list[int] | None, Field(alias="agreementTypeIds")] = None
+    board_ids: Annotated[list[int] | None, Field(alias="boardIds")] = None
+    button_color: Annotated[str | None, Field(alias="buttonColor")] = None
+    """
+     Max length: 7;
+    """
+    company: CompanyReference | None = None
+    config_type_ids: Annotated[list[int] | None, Field(alias="configTypeIds")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    display_vendor_flag: Annotated[bool | None, Field(alias="displayVendorFlag")] = None
+    header_color: Annotated[str | None, Field(alias="headerColor")] = None
+    """
+     Max length: 7;
+    """
+    id: int | None = None
+    """
+    An existing Portal Configuration id is required when copying a Portal Configuration.
+    """
+    language: Literal[
+        "English",
+        "Spanish",
+        "French",
+        "British",
+        "Australian",
+        "BrazilianPortuguese",
+        "CanadianFrench",
+        "German",
+        "NewZealand",
+        "Dutch",
+    ] | None = None
+    location_ids: Annotated[list[int] | None, Field(alias="locationIds")] = None
+    login_background_color: Annotated[str | None, Field(alias="loginBackgroundColor")] = None
+    """
+     Max length: 7;
+    """
+    menu_color: Annotated[str | None, Field(alias="menuColor")] = None
+    """
+     Max length: 7;
+    """
+    name: str
+    """
+     Max length: 150;
+    """
+    portal_background_color: Annotated[str | None, Field(alias="portalBackgroundColor")] = None
+    """
+     Max length: 7;
+    """
+    portal_image_copy_success_flag: Annotated[bool | None, Field(alias="portalImageCopySuccessFlag")] = None
+    url: str | None = None
+    """
+     Max length: 1000;
+    """
+    welcome_text: Annotated[str | None, Field(alias="welcomeText")] = None
+    """
+     Max length: 4000;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfigurationInvoiceSetup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_all_statuses: Annotated[bool | None, Field(alias="addAllStatuses")] = None
+    allow_inv_pmt_flag: Annotated[bool | None, Field(alias="allowInvPmtFlag")] = None
+    billing_status_ids: Annotated[list[int] | None, Field(alias="billingStatusIds")] = None
+    display_inv_pmt_flag: Annotated[bool | None, Field(alias="displayInvPmtFlag")] = None
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    login: str | None = None
+    password: str | None = None
+    payment_processor: Annotated[
+        PortalConfigurationPaymentProcessorReference | None, Field(alias="paymentProcessor")
+    ] = None
+    portal_configuration: Annotated[PortalConfigurationReference | None, Field(alias="portalConfiguration")] = None
+    remove_all_statuses: Annotated[bool | None, Field(alias="removeAllStatuses")] = None
+    url_override: Annotated[str | None, Field(alias="urlOverride")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.portal_configuration_payment_processor_reference import (
+    PortalConfigurationPaymentProcessorReference,
+)
+from pyconnectwise.models.manage.portal_configuration_reference import PortalConfigurationReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
@@ -0,0 +1,85 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfigurationOpportunitySetup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    acceptance_change_status_flag: Annotated[bool | None, Field(alias="acceptanceChangeStatusFlag")] = None
+    acceptance_create_activity_flag: Annotated[bool | None, Field(alias="acceptanceCreateActivityFlag")] = None
+    acceptance_email_activity_type: Annotated[
+        ActivityTypeReference | None, Field(alias="acceptanceEmailActivityType")
+    ] = None
+    acceptance_email_assigned_by_member: Annotated[
+        MemberReference | None, Field(alias="acceptanceEmailAssignedByMember")
+    ] = None
+    acceptance_email_body: Annotated[str | None, Field(alias="acceptanceEmailBody")] = None
+    acceptance_email_from_first_name: Annotated[str | None, Field(alias="acceptanceEmailFromFirstName")] = None
+    acceptance_email_from_last_name: Annotated[str | None, Field(alias="acceptanceEmailFromLastName")] = None
+    acceptance_email_subject: Annotated[str | None, Field(alias="acceptanceEmailSubject")] = None
+    acceptance_from_email: Annotated[str | None, Field(alias="acceptanceFromEmail")] = None
+    """
+    Required when acceptanceSendEmailFlag is true
+    """
+    acceptance_opportunity_status: Annotated[
+        OpportunityStatusReference | None, Field(alias="acceptanceOpportunityStatus")
+    ] = None
+    acceptance_send_email_flag: Annotated[bool | None, Field(alias="acceptanceSendEmailFlag")] = None
+    add_all_opportunity_statuses: Annotated[bool | None, Field(alias="addAllOpportunityStatuses")] = None
+    add_all_opportunity_types: Annotated[bool | None, Field(alias="addAllOpportunityTypes")] = None
+    confirmation_email_body: Annotated[str | None, Field(alias="confirmationEmailBody")] = None
+    confirmation_email_from_first_name: Annotated[str | None, Field(alias="confirmationEmailFromFirstName")] = None
+    confirmation_email_from_last_name: Annotated[str | None, Field(alias="confirmationEmailFromLastName")] = None
+    confirmation_email_subject: Annotated[str | None, Field(alias="confirmationEmailSubject")] = None
+    confirmation_email_use_default_company_email_address_flag: Annotated[
+        bool | None, Field(alias="confirmationEmailUseDefaultCompanyEmailAddressFlag")
+    ] = None
+    confirmation_from_email: Annotated[str | None, Field(alias="confirmationFromEmail")] = None
+    """
+    Required when confirmationSendEmailFlag is true
+    """
+    confirmation_send_email_flag: Annotated[bool | None, Field(alias="confirmationSendEmailFlag")] = None
+    id: int | None = None
+    opportunity_status_rec_i_ds: Annotated[list[int] | None, Field(alias="opportunityStatusRecIDs")] = None
+    opportunity_type_rec_i_ds: Annotated[list[int] | None, Field(alias="opportunityTypeRecIDs")] = None
+    rejection_change_status_flag: Annotated[bool | None, Field(alias="rejectionChangeStatusFlag")] = None
+    rejection_create_activity_flag: Annotated[bool | None, Field(alias="rejectionCreateActivityFlag")] = None
+    rejection_email_activity_type: Annotated[
+        ActivityTypeReference | None, Field(alias="rejectionEmailActivityType")
+    ] = None
+    rejection_email_assigned_by_member: Annotated[
+        MemberReference | None, Field(alias="rejectionEmailAssignedByMember")
+    ] = None
+    rejection_email_body: Annotated[str | None, Field(alias="rejectionEmailBody")] = None
+    rejection_email_from_first_name: Annotated[str | None, Field(alias="rejectionEmailFromFirstName")] = None
+    rejection_email_from_last_name: Annotated[str | None, Field(alias="rejectionEmailFromLastName")] = None
+    rejection_email_subject: Annotated[str | None, Field(alias="rejectionEmailSubject")] = None
+    rejection_from_email: Annotated[str | None, Field(alias="rejectionFromEmail")] = None
+    """
+    Required when rejectionSendEmailFlag is true
+    """
+    rejection_opportunity_status: Annotated[
+        OpportunityStatusReference | None, Field(alias="rejectionOpportunityStatus")
+    ] = None
+    rejection_send_email_flag: Annotated[bool | None, Field(alias="rejectionSendEmailFlag")] = None
+    remove_all_opportunity_statuses: Annotated[bool | None, Field(alias="removeAllOpportunityStatuses")] = None
+    remove_all_opportunity_types: Annotated[bool | None, Field(alias="removeAllOpportunityTypes")] = None
+    restrict_view_by_opportunity_status_flag: Annotated[
+        bool | None, Field(alias="restrictViewByOpportunityStatusFlag")
+    ] = None
+    restrict_view_by_opportunity_type_flag: Annotated[
+        bool | None, Field(alias="restrictViewByOpportunityTypeFlag")
+    ] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.activity_type_reference import ActivityTypeReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.opportunity_status_reference import OpportunityStatusReference
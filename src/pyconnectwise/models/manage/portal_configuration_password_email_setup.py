@@ -0,0 +1,39 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfigurationPasswordEmailSetup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    invalid_password_email_body: Annotated[str | None, Field(alias="invalidPasswordEmailBody")] = None
+    invalid_password_email_from_email: Annotated[str | None, Field(alias="invalidPasswordEmailFromEmail")] = None
+    """
+    Required when invalidPasswordEmailUseCustomEmailFlag is true
+    """
+    invalid_password_email_from_first_name: Annotated[
+        str | None, Field(alias="invalidPasswordEmailFromFirstName")
+    ] = None
+    invalid_password_email_from_last_name: Annotated[str | None, Field(alias="invalidPasswordEmailFromLastName")] = None
+    invalid_password_email_subject: Annotated[str | None, Field(alias="invalidPasswordEmailSubject")] = None
+    invalid_password_email_use_custom_email_flag: Annotated[
+        bool | None, Field(alias="invalidPasswordEmailUseCustomEmailFlag")
+    ] = None
+    valid_password_email_body: Annotated[str | None, Field(alias="validPasswordEmailBody")] = None
+    valid_password_email_from_email: Annotated[str | None, Field(alias="validPasswordEmailFromEmail")] = None
+    """
+    Required when validPasswordEmailUseCustomEmailFlag is true
+    """
+    valid_password_email_from_first_name: Annotated[str | None, Field(alias="validPasswordEmailFromFirstName")] = None
+    valid_password_email_from_last_name: Annotated[str | None, Field(alias="validPasswordEmailFromLastName")] = None
+    valid_password_email_subject: Annotated[str | None, Field(alias="validPasswordEmailSubject")] = None
+    valid_password_email_use_custom_email_flag: Annotated[
+        bool | None, Field(alias="validPasswordEmailUseCustomEmailFlag")
+    ] = None
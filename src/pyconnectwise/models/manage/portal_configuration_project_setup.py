@@ -0,0 +1,65 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfigurationProjectSetup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    billing_method_flag: Annotated[bool | None, Field(alias="billingMethodFlag")] = None
+    contact_flag: Annotated[bool | None, Field(alias="contactFlag")] = None
+    description_flag: Annotated[bool | None, Field(alias="descriptionFlag")] = None
+    estimated_end_flag: Annotated[bool | None, Field(alias="estimatedEndFlag")] = None
+    estimated_start_flag: Annotated[bool | None, Field(alias="estimatedStartFlag")] = None
+    fixed_fee_actual_finish_flag: Annotated[bool | None, Field(alias="fixedFeeActualFinishFlag")] = None
+    fixed_fee_actual_hrs_flag: Annotated[bool | None, Field(alias="fixedFeeActualHrsFlag")] = None
+    fixed_fee_actual_start_flag: Annotated[bool | None, Field(alias="fixedFeeActualStartFlag")] = None
+    fixed_fee_assigned_flag: Annotated[bool | None, Field(alias="fixedFeeAssignedFlag")] = None
+    fixed_fee_bill_flag: Annotated[bool | None, Field(alias="fixedFeeBillFlag")] = None
+    fixed_fee_budget_hrs_flag: Annotated[bool | None, Field(alias="fixedFeeBudgetHrsFlag")] = None
+    fixed_fee_scheduled_finish_flag: Annotated[bool | None, Field(alias="fixedFeeScheduledFinishFlag")] = None
+    fixed_fee_scheduled_hrs_flag: Annotated[bool | None, Field(alias="fixedFeeScheduledHrsFlag")] = None
+    fixed_fee_scheduled_start_flag: Annotated[bool | None, Field(alias="fixedFeeScheduledStartFlag")] = None
+    fixed_fee_status_flag: Annotated[bool | None, Field(alias="fixedFeeStatusFlag")] = None
+    id: int | None = None
+    last_updated_flag: Annotated[bool | None, Field(alias="lastUpdatedFlag")] = None
+    only_display: Annotated[
+        Literal["DoNotDisplay", "Closed30Days", "Closed60Days", "Closed90Days", "Closed120Days", "AllClosed"],
+        Field(alias="onlyDisplay"),
+    ]
+    portal_config: Annotated[PortalConfigurationReference | None, Field(alias="portalConfig")] = None
+    project_detail_total_hours_flag: Annotated[bool | None, Field(alias="projectDetailTotalHoursFlag")] = None
+    project_issue_actual_finish_flag: Annotated[bool | None, Field(alias="projectIssueActualFinishFlag")] = None
+    project_issue_actual_hrs_flag: Annotated[bool | None, Field(alias="projectIssueActualHrsFlag")] = None
+    project_issue_actual_start_flag: Annotated[bool | None, Field(alias="projectIssueActualStartFlag")] = None
+    project_issue_assigned_flag: Annotated[bool | None, Field(alias="projectIssueAssignedFlag")] = None
+    project_issue_bill_flag: Annotated[bool | None, Field(alias="projectIssueBillFlag")] = None
+    project_issue_budget_hrs_flag: Annotated[bool | None, Field(alias="projectIssueBudgetHrsFlag")] = None
+    project_issue_scheduled_finish_flag: Annotated[bool | None, Field(alias="projectIssueScheduledFinishFlag")] = None
+    project_issue_scheduled_hrs_flag: Annotated[bool | None, Field(alias="projectIssueScheduledHrsFlag")] = None
+    project_issue_scheduled_start_flag: Annotated[bool | None, Field(alias="projectIssueScheduledStartFlag")] = None
+    project_issue_status_flag: Annotated[bool | None, Field(alias="projectIssueStatusFlag")] = None
+    project_manager_flag: Annotated[bool | None, Field(alias="projectManagerFlag")] = None
+    project_name_flag: Annotated[bool | None, Field(alias="projectNameFlag")] = None
+    project_type_flag: Annotated[bool | None, Field(alias="projectTypeFlag")] = None
+    status_flag: Annotated[bool | None, Field(alias="statusFlag")] = None
+    time_material_actual_finish_flag: Annotated[bool | None, Field(alias="timeMaterialActualFinishFlag")] = None
+    time_material_actual_hrs_flag: Annotated[bool | None, Field(alias="timeMaterialActualHrsFlag")] = None
+    time_material_actual_start_flag: Annotated[bool | None, Field(alias="timeMaterialActualStartFlag")] = None
+    time_material_assigned_flag: Annotated[bool | None, Field(alias="timeMaterialAssignedFlag")] = None
+    time_material_bill_flag: Annotated[bool | None, Field(alias="timeMaterialBillFlag")] = None
+    time_material_budget_hrs_flag: Annotated[bool | None, Field(alias="timeMaterialBudgetHrsFlag")] = None
+    time_material_scheduled_finish_flag: Annotated[bool | None, Field(alias="timeMaterialScheduledFinishFlag")] = None
+    time_material_scheduled_hrs_flag: Annotated[bool | None, Field(alias="timeMaterialScheduledHrsFlag")] = None
+    time_material_scheduled_start_flag: Annotated[bool | None, Field(alias="timeMaterialScheduledStartFlag")] = None
+    time_material_status_flag: Annotated[bool | None, Field(alias="timeMaterialStatusFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.portal_configuration_reference import PortalConfigurationReference
@@ -0,0 +1,45 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalConfigurationServiceSetup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    actual_hours_flag: Annotated[bool | None, Field(alias="actualHoursFlag")] = None
+    approval_status_flag: Annotated[bool | None, Field(alias="approvalStatusFlag")] = None
+    assigned_resources_flag: Annotated[bool | None, Field(alias="assignedResourcesFlag")] = None
+    budget_hours_flag: Annotated[bool | None, Field(alias="budgetHoursFlag")] = None
+    closed_tasks_flag: Annotated[bool | None, Field(alias="closedTasksFlag")] = None
+    contact_flag: Annotated[bool | None, Field(alias="contactFlag")] = None
+    display_closed_tickets_option: Annotated[
+        Literal["DoNotDisplay", "Closed30Days", "Closed60Days", "Closed90Days", "Closed120Days", "AllClosed"],
+        Field(alias="displayClosedTicketsOption"),
+    ]
+    enable_chat_assist_flag: Annotated[bool | None, Field(alias="enableChatAssistFlag")] = None
+    entered_date_flag: Annotated[bool | None, Field(alias="enteredDateFlag")] = None
+    fixed_fee_ticket_template: Annotated[ServiceSignoffReference | None, Field(alias="fixedFeeTicketTemplate")] = None
+    id: int | None = None
+    last_update_flag: Annotated[bool | None, Field(alias="lastUpdateFlag")] = None
+    open_tasks_flag: Annotated[bool | None, Field(alias="openTasksFlag")] = None
+    required_date_flag: Annotated[bool | None, Field(alias="requiredDateFlag")] = None
+    service_board_flag: Annotated[bool | None, Field(alias="serviceBoardFlag")] = None
+    service_sub_type_flag: Annotated[bool | None, Field(alias="serviceSubTypeFlag")] = None
+    service_sub_type_item_flag: Annotated[bool | None, Field(alias="serviceSubTypeItemFlag")] = None
+    service_type_flag: Annotated[bool | None, Field(alias="serviceTypeFlag")] = None
+    site_name_flag: Annotated[bool | None, Field(alias="siteNameFlag")] = None
+    sla_info_flag: Annotated[bool | None, Field(alias="slaInfoFlag")] = None
+    status_flag: Annotated[bool | None, Field(alias="statusFlag")] = None
+    time_materials_ticket_template: Annotated[
+        ServiceSignoffReference | None, Field(alias="timeMaterialsTicketTemplate")
+    ] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.service_signoff_reference import ServiceSignoffReference
@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalReport(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    custom_flag: Annotated[bool | None, Field(alias="customFlag")] = None
+    display_flag: Annotated[bool | None, Field(alias="displayFlag")] = None
+    id: int | None = None
+    name: str
+    """
+     Max length: 255;
+    """
+    open_same_window_flag: Annotated[bool | None, Field(alias="openSameWindowFlag")] = None
+    portal_configuration: Annotated[PortalConfigurationReference | None, Field(alias="portalConfiguration")] = None
+    url: str
+    """
+     Max length: 255;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.portal_configuration_reference import PortalConfigurationReference
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalSecurityLevel(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    caption: str | None = None
+    """
+     Max length: 50;
+    """
+    caption_identifier: Annotated[str | None, Field(alias="captionIdentifier")] = None
+    id: int | None = None
+    is_default_flag: Annotated[bool | None, Field(alias="isDefaultFlag")] = None
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PortalSecuritySetting(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    function_description: Annotated[str | None, Field(alias="functionDescription")] = None
+    function_identifier: Annotated[str | None, Field(alias="functionIdentifier")] = None
+    id: int | None = None
+    level_five: Annotated[bool | None, Field(alias="levelFive")] = None
+    level_four: Annotated[bool | None, Field(alias="levelFour")] = None
+    level_one: Annotated[bool | None, Field(alias="levelOne")] = None
+    level_six: Annotated[bool | None, Field(alias="levelSix")] = None
+    level_three: Annotated[bool | None, Field(alias="levelThree")] = None
+    level_two: Annotated[bool | None, Field(alias="levelTwo")] = None
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PricingBreak(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    amount: float | None = None
+    detail_id: Annotated[int | None, Field(alias="detailId")] = None
+    id: int | None = None
+    price_method: Annotated[
+        Literal["FlatRateForRange", "PercentMarkupFromCost", "PercentMarkdownFromPrice", "PricePerUnit"],
+        Field(alias="priceMethod"),
+    ]
+    quantity_end: Annotated[float | None, Field(alias="quantityEnd")] = None
+    quantity_start: Annotated[float, Field(alias="quantityStart")]
+    unlimited: bool | None = None
@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PricingDetail(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    category: ProductCategoryReference | None = None
+    end_date: Annotated[datetime | None, Field(alias="endDate")] = None
+    id: int | None = None
+    no_end_date: Annotated[bool | None, Field(alias="noEndDate")] = None
+    product: CatalogItemReference | None = None
+    start_date: Annotated[datetime, Field(alias="startDate")]
+    sub_category: Annotated[ProductSubCategoryReference | None, Field(alias="subCategory")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.catalog_item_reference import CatalogItemReference
+from pyconnectwise.models.manage.product_category_reference import ProductCategoryReference
+from pyconnectwise.models.manage.product_sub_category_reference import ProductSubCategoryReference
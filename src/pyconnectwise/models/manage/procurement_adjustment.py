@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProcurementAdjustment(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    adjustment_details: Annotated[list[AdjustmentDetail] | None, Field(alias="adjustmentDetails")] = None
+    closed_by: Annotated[str | None, Field(alias="closedBy")] = None
+    closed_date: Annotated[datetime | None, Field(alias="closedDate")] = None
+    closed_flag: Annotated[bool | None, Field(alias="closedFlag")] = None
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 50;
+    """
+    notes: str | None = None
+    reason: str | None = None
+    """
+     Max length: 100;
+    """
+    type: AdjustmentTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.adjustment_detail import AdjustmentDetail
+from pyconnectwise.models.manage.adjustment_type_reference import AdjustmentTypeReference
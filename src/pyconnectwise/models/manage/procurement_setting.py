@@ -0,0 +1,41 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProcurementSetting(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    auto_approve_purchase_order_flag: Annotated[bool | None, Field(alias="autoApprovePurchaseOrderFlag")] = None
+    auto_close_purchase_order_flag: Annotated[bool | None, Field(alias="autoClosePurchaseOrderFlag")] = None
+    auto_close_purchase_order_item_flag: Annotated[bool | None, Field(alias="autoClosePurchaseOrderItemFlag")] = None
+    costing_method: Annotated[Literal["FIFO", "LIFO", "AverageCosting"], Field(alias="costingMethod")]
+    default_product_taxable_flag: Annotated[bool | None, Field(alias="defaultProductTaxableFlag")] = None
+    disable_auto_pick_flag: Annotated[bool | None, Field(alias="disableAutoPickFlag")] = None
+    disable_cost_updates_flag: Annotated[bool | None, Field(alias="disableCostUpdatesFlag")] = None
+    disable_negative_inventory_flag: Annotated[bool | None, Field(alias="disableNegativeInventoryFlag")] = None
+    eori_number: Annotated[str | None, Field(alias="eoriNumber")] = None
+    """
+     Max length: 50;
+    """
+    id: int | None = None
+    num_decimal_places: Annotated[int | None, Field(alias="numDecimalPlaces")] = None
+    prefix_suffix_type: Annotated[Literal["Prefix", "Suffix"] | None, Field(alias="prefixSuffixType")] = None
+    purchase_order_prefix: Annotated[str | None, Field(alias="purchaseOrderPrefix")] = None
+    """
+     Max length: 5;
+    """
+    purchase_order_suffix: Annotated[str | None, Field(alias="purchaseOrderSuffix")] = None
+    """
+     Max length: 5;
+    """
+    starting_purchase_order_num: Annotated[int, Field(alias="startingPurchaseOrderNum")]
+    tax_freight_flag: Annotated[bool | None, Field(alias="taxFreightFlag")] = None
+    tax_purchase_order_flag: Annotated[bool | None, Field(alias="taxPurchaseOrderFlag")] = None
+    use_vendor_tax_code_flag: Annotated[bool | None, Field(alias="useVendorTaxCodeFlag")] = None
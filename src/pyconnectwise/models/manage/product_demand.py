@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProductDemand(ConnectWiseModel):
+    cost: float | None = None
+    product_rec_id: Annotated[int | None, Field(alias="productRecId")] = None
+    quantity: int | None = None
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProductDetach(ConnectWiseModel):
+    remove_from_invoice: Annotated[bool | None, Field(alias="removeFromInvoice")] = None
+    remove_from_opportunity: Annotated[bool | None, Field(alias="removeFromOpportunity")] = None
+    remove_from_project: Annotated[bool | None, Field(alias="removeFromProject")] = None
+    remove_from_sales_order: Annotated[bool | None, Field(alias="removeFromSalesOrder")] = None
+    remove_from_ticket: Annotated[bool | None, Field(alias="removeFromTicket")] = None
@@ -0,0 +1,128 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProductItem(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_components_flag: Annotated[bool | None, Field(alias="addComponentsFlag")] = None
+    agreement: AgreementReference | None = None
+    agreement_amount: Annotated[float | None, Field(alias="agreementAmount")] = None
+    billable_option: Annotated[Literal["Billable", "DoNotBill", "NoCharge"], Field(alias="billableOption")]
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    """
+     Required On Updates;
+    """
+    bypass_forecast_update: Annotated[bool | None, Field(alias="bypassForecastUpdate")] = None
+    calculated_cost: Annotated[float | None, Field(alias="calculatedCost")] = None
+    calculated_cost_flag: Annotated[bool | None, Field(alias="calculatedCostFlag")] = None
+    calculated_price: Annotated[float | None, Field(alias="calculatedPrice")] = None
+    calculated_price_flag: Annotated[bool | None, Field(alias="calculatedPriceFlag")] = None
+    cancelled_by: Annotated[int | None, Field(alias="cancelledBy")] = None
+    cancelled_date: Annotated[datetime | None, Field(alias="cancelledDate")] = None
+    cancelled_flag: Annotated[bool | None, Field(alias="cancelledFlag")] = None
+    cancelled_reason: Annotated[str | None, Field(alias="cancelledReason")] = None
+    """
+     Max length: 100;
+    """
+    catalog_item: Annotated[CatalogItemReference | None, Field(alias="catalogItem")] = None
+    company: CompanyReference | None = None
+    cost: float | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    customer_description: Annotated[str | None, Field(alias="customerDescription")] = None
+    """
+     Max length: 6000; Required On Updates;
+    """
+    description: str | None = None
+    """
+     Max length: 2000;
+    """
+    discount: float | None = None
+    dropship_flag: Annotated[bool | None, Field(alias="dropshipFlag")] = None
+    entity_type: Annotated[EntityTypeReference | None, Field(alias="entityType")] = None
+    forecast_detail_id: Annotated[int | None, Field(alias="forecastDetailId")] = None
+    forecast_status: Annotated[OpportunityStatusReference | None, Field(alias="forecastStatus")] = None
+    id: int | None = None
+    ignore_pricing_schedules_flag: Annotated[bool | None, Field(alias="ignorePricingSchedulesFlag")] = None
+    integration_x_ref: Annotated[str | None, Field(alias="integrationXRef")] = None
+    internal_notes: Annotated[str | None, Field(alias="internalNotes")] = None
+    """
+     Max length: 1000;
+    """
+    invoice: InvoiceReference | None = None
+    invoice_grouping: Annotated[InvoiceGroupingReference | None, Field(alias="invoiceGrouping")] = None
+    list_price: Annotated[float | None, Field(alias="listPrice")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    """
+     Required On Updates;
+    """
+    minimum_stock_flag: Annotated[bool | None, Field(alias="minimumStockFlag")] = None
+    need_to_order_quantity: Annotated[int | None, Field(alias="needToOrderQuantity")] = None
+    need_to_purchase_flag: Annotated[bool | None, Field(alias="needToPurchaseFlag")] = None
+    opportunity: OpportunityReference | None = None
+    phase: ProjectPhaseReference | None = None
+    phase_product_flag: Annotated[bool | None, Field(alias="phaseProductFlag")] = None
+    po_approved_flag: Annotated[bool | None, Field(alias="poApprovedFlag")] = None
+    price: float | None = None
+    price_method: Annotated[
+        Literal["FlatRateForRange", "PercentMarkupFromCost", "PercentMarkdownFromPrice", "PricePerUnit"] | None,
+        Field(alias="priceMethod"),
+    ] = None
+    product_class: Annotated[
+        Literal["Agreement", "Bundle", "Inventory", "NonInventory", "Service"] | None, Field(alias="productClass")
+    ] = None
+    product_supplied_flag: Annotated[bool | None, Field(alias="productSuppliedFlag")] = None
+    project: ProjectReference | None = None
+    purchase_date: Annotated[datetime | None, Field(alias="purchaseDate")] = None
+    quantity: float | None = None
+    quantity_cancelled: Annotated[float | None, Field(alias="quantityCancelled")] = None
+    recurring: ProductRecurring | None = None
+    sales_order: Annotated[SalesOrderReference | None, Field(alias="salesOrder")] = None
+    sequence_number: Annotated[float | None, Field(alias="sequenceNumber")] = None
+    serial_number_ids: Annotated[list[int] | None, Field(alias="serialNumberIds")] = None
+    serial_numbers: Annotated[list[str] | None, Field(alias="serialNumbers")] = None
+    ship_set: Annotated[str | None, Field(alias="shipSet")] = None
+    """
+     Max length: 10;
+    """
+    sla: SLAReference | None = None
+    special_order_flag: Annotated[bool | None, Field(alias="specialOrderFlag")] = None
+    sub_contractor_amount_limit: Annotated[float | None, Field(alias="subContractorAmountLimit")] = None
+    sub_contractor_ship_to_id: Annotated[int | None, Field(alias="subContractorShipToId")] = None
+    taxable_flag: Annotated[bool | None, Field(alias="taxableFlag")] = None
+    ticket: TicketReference | None = None
+    vendor: CompanyReference | None = None
+    vendor_sku: Annotated[str | None, Field(alias="vendorSku")] = None
+    """
+     Max length: 50;
+    """
+    warehouse: str | None = None
+    warehouse_bin: Annotated[str | None, Field(alias="warehouseBin")] = None
+    warehouse_bin_id: Annotated[int | None, Field(alias="warehouseBinId")] = None
+    warehouse_id: Annotated[int | None, Field(alias="warehouseId")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.catalog_item_reference import CatalogItemReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.entity_type_reference import EntityTypeReference
+from pyconnectwise.models.manage.invoice_grouping_reference import InvoiceGroupingReference
+from pyconnectwise.models.manage.invoice_reference import InvoiceReference
+from pyconnectwise.models.manage.opportunity_reference import OpportunityReference
+from pyconnectwise.models.manage.opportunity_status_reference import OpportunityStatusReference
+from pyconnectwise.models.manage.product_recurring import ProductRecurring
+from pyconnectwise.models.manage.project_phase_reference import ProjectPhaseReference
+from pyconnectwise.models.manage.project_reference import ProjectReference
+from pyconnectwise.models.manage.sales_order_reference import SalesOrderReference
+from pyconnectwise.models.manage.sla_reference import SLAReference
+from pyconnectwise.models.manage.ticket_reference import TicketReference
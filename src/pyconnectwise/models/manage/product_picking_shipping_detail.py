@@ -0,0 +1,33 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProductPickingShippingDetail(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    line_number: Annotated[int | None, Field(alias="lineNumber")] = None
+    picked_quantity: Annotated[int | None, Field(alias="pickedQuantity")] = None
+    product_item: Annotated[ProductItemReference | None, Field(alias="productItem")] = None
+    quantity: int | None = None
+    serial_number: Annotated[str | None, Field(alias="serialNumber")] = None
+    serial_number_ids: Annotated[list[int] | None, Field(alias="serialNumberIds")] = None
+    shipment_method: Annotated[ShipmentMethodReference | None, Field(alias="shipmentMethod")] = None
+    shipped_quantity: Annotated[int | None, Field(alias="shippedQuantity")] = None
+    tracking_number: Annotated[str | None, Field(alias="trackingNumber")] = None
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: Annotated[WarehouseBinReference | None, Field(alias="warehouseBin")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.product_item_reference import ProductItemReference
+from pyconnectwise.models.manage.shipment_method_reference import ShipmentMethodReference
+from pyconnectwise.models.manage.warehouse_bin_reference import WarehouseBinReference
+from pyconnectwise.models.manage.warehouse_reference import WarehouseReference
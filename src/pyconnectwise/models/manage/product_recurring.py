@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProductRecurring(ConnectWiseModel):
+    bill_cycle_id: Annotated[int | None, Field(alias="billCycleId")] = None
+    cycle_type: Annotated[Literal["ContractYear", "CalendarYear"] | None, Field(alias="cycleType")] = None
+    cycles: int | None = None
+    end_date: Annotated[datetime | None, Field(alias="endDate")] = None
+    """
+    The Recurring End Date is calculated based on the
+                start date, number of cycles, and cycle type.
+    """
+    recurring_cost: Annotated[float | None, Field(alias="recurringCost")] = None
+    recurring_revenue: Annotated[float | None, Field(alias="recurringRevenue")] = None
+    start_date: Annotated[datetime | None, Field(alias="startDate")] = None
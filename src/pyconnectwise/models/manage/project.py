@@ -0,0 +1,129 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Project(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    actual_end: Annotated[datetime | None, Field(alias="actualEnd")] = None
+    actual_hours: Annotated[float | None, Field(alias="actualHours")] = None
+    actual_start: Annotated[datetime | None, Field(alias="actualStart")] = None
+    agreement: AgreementReference | None = None
+    bill_expenses: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billExpenses")
+    ] = None
+    """
+     Required On Updates;
+    """
+    bill_products: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billProducts")
+    ] = None
+    """
+     Required On Updates;
+    """
+    bill_project_after_closed_flag: Annotated[bool | None, Field(alias="billProjectAfterClosedFlag")] = None
+    bill_time: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billTime")
+    ] = None
+    """
+     Required On Updates;
+    """
+    bill_to_company: Annotated[CompanyReference | None, Field(alias="billToCompany")] = None
+    bill_to_contact: Annotated[ContactReference | None, Field(alias="billToContact")] = None
+    bill_to_site: Annotated[SiteReference | None, Field(alias="billToSite")] = None
+    bill_unapproved_time_and_expense: Annotated[bool | None, Field(alias="billUnapprovedTimeAndExpense")] = None
+    billing_amount: Annotated[float | None, Field(alias="billingAmount")] = None
+    billing_attention: Annotated[str | None, Field(alias="billingAttention")] = None
+    """
+     Max length: 50;
+    """
+    billing_method: Annotated[
+        Literal["ActualRates", "FixedFee", "NotToExceed", "OverrideRate"], Field(alias="billingMethod")
+    ]
+    billing_rate_type: Annotated[Literal["StaffMember", "WorkRole"] | None, Field(alias="billingRateType")] = None
+    """
+     Required On Updates;
+    """
+    billing_start_date: Annotated[datetime | None, Field(alias="billingStartDate")] = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    board: ProjectBoardReference | None = None
+    budget_analysis: Annotated[Literal["ActualHours", "BillableHours"] | None, Field(alias="budgetAnalysis")] = None
+    """
+     Required On Updates;
+    """
+    budget_flag: Annotated[bool | None, Field(alias="budgetFlag")] = None
+    budget_hours: Annotated[float | None, Field(alias="budgetHours")] = None
+    closed_flag: Annotated[bool | None, Field(alias="closedFlag")] = None
+    company: CompanyReference | None = None
+    company_location: Annotated[SystemLocationReference | None, Field(alias="companyLocation")] = None
+    contact: ContactReference | None = None
+    currency: CurrencyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    customer_po: Annotated[str | None, Field(alias="customerPO")] = None
+    """
+     Max length: 50;
+    """
+    department: SystemDepartmentReference | None = None
+    description: str | None = None
+    do_not_display_in_portal_flag: Annotated[bool | None, Field(alias="doNotDisplayInPortalFlag")] = None
+    downpayment: float | None = None
+    estimated_end: Annotated[datetime, Field(alias="estimatedEnd")]
+    estimated_expense_cost: Annotated[float | None, Field(alias="estimatedExpenseCost")] = None
+    estimated_expense_revenue: Annotated[float | None, Field(alias="estimatedExpenseRevenue")] = None
+    estimated_hours: Annotated[float | None, Field(alias="estimatedHours")] = None
+    estimated_product_cost: Annotated[float | None, Field(alias="estimatedProductCost")] = None
+    estimated_product_revenue: Annotated[float | None, Field(alias="estimatedProductRevenue")] = None
+    estimated_start: Annotated[datetime, Field(alias="estimatedStart")]
+    estimated_time_cost: Annotated[float | None, Field(alias="estimatedTimeCost")] = None
+    estimated_time_revenue: Annotated[float | None, Field(alias="estimatedTimeRevenue")] = None
+    expense_approver: Annotated[MemberReference | None, Field(alias="expenseApprover")] = None
+    id: int | None = None
+    include_dependencies_flag: Annotated[bool | None, Field(alias="includeDependenciesFlag")] = None
+    include_estimates_flag: Annotated[bool | None, Field(alias="includeEstimatesFlag")] = None
+    location: SystemLocationReference | None = None
+    manager: MemberReference | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    opportunity: OpportunityReference | None = None
+    percent_complete: Annotated[float | None, Field(alias="percentComplete")] = None
+    project_template_id: Annotated[int | None, Field(alias="projectTemplateId")] = None
+    restrict_down_payment_flag: Annotated[bool | None, Field(alias="restrictDownPaymentFlag")] = None
+    scheduled_end: Annotated[datetime | None, Field(alias="scheduledEnd")] = None
+    scheduled_hours: Annotated[float | None, Field(alias="scheduledHours")] = None
+    scheduled_start: Annotated[datetime | None, Field(alias="scheduledStart")] = None
+    ship_to_company: Annotated[CompanyReference | None, Field(alias="shipToCompany")] = None
+    ship_to_contact: Annotated[ContactReference | None, Field(alias="shipToContact")] = None
+    ship_to_site: Annotated[SiteReference | None, Field(alias="shipToSite")] = None
+    site: SiteReference | None = None
+    status: ProjectStatusReference | None = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    time_approver: Annotated[MemberReference | None, Field(alias="timeApprover")] = None
+    type: ProjectTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.opportunity_reference import OpportunityReference
+from pyconnectwise.models.manage.project_board_reference import ProjectBoardReference
+from pyconnectwise.models.manage.project_status_reference import ProjectStatusReference
+from pyconnectwise.models.manage.project_type_reference import ProjectTypeReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectBoardTeamMember(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    member: MemberReference | None = None
+    project_role: Annotated[ProjectRoleReference | None, Field(alias="projectRole")] = None
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.project_role_reference import ProjectRoleReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
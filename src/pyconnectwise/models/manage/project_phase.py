@@ -0,0 +1,110 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectPhase(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    actual_end: Annotated[datetime | None, Field(alias="actualEnd")] = None
+    actual_hours: Annotated[float | None, Field(alias="actualHours")] = None
+    actual_start: Annotated[datetime | None, Field(alias="actualStart")] = None
+    agreement: AgreementReference | None = None
+    bill_expenses: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billExpenses")
+    ] = None
+    """
+     Required On Updates;
+    """
+    bill_phase_closed_flag: Annotated[bool | None, Field(alias="billPhaseClosedFlag")] = None
+    """
+    This phase can only be billed after it has been closed
+    """
+    bill_products: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billProducts")
+    ] = None
+    """
+     Required On Updates;
+    """
+    bill_project_closed_flag: Annotated[bool | None, Field(alias="billProjectClosedFlag")] = None
+    """
+    This phase can only be billed after the project has been closed
+    """
+    bill_separately_flag: Annotated[bool | None, Field(alias="billSeparatelyFlag")] = None
+    bill_time: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billTime")
+    ] = None
+    """
+     Required On Updates;
+    """
+    bill_to_company: Annotated[CompanyReference | None, Field(alias="billToCompany")] = None
+    bill_to_contact: Annotated[ContactReference | None, Field(alias="billToContact")] = None
+    bill_to_site: Annotated[SiteReference | None, Field(alias="billToSite")] = None
+    billing_method: Annotated[
+        Literal["ActualRates", "FixedFee", "NotToExceed", "OverrideRate"] | None, Field(alias="billingMethod")
+    ] = None
+    """
+    billingMethod is required if the phase billSeparatelyFlag is true
+    """
+    billing_start_date: Annotated[datetime | None, Field(alias="billingStartDate")] = None
+    board: ProjectBoardReference | None = None
+    budget_hours: Annotated[float | None, Field(alias="budgetHours")] = None
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    currency: CurrencyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    deadline_date: Annotated[datetime | None, Field(alias="deadlineDate")] = None
+    description: str
+    """
+     Max length: 100;
+    """
+    downpayment: float | None = None
+    estimated_expense_cost: Annotated[float | None, Field(alias="estimatedExpenseCost")] = None
+    estimated_expense_revenue: Annotated[float | None, Field(alias="estimatedExpenseRevenue")] = None
+    estimated_product_cost: Annotated[float | None, Field(alias="estimatedProductCost")] = None
+    estimated_product_revenue: Annotated[float | None, Field(alias="estimatedProductRevenue")] = None
+    estimated_time_cost: Annotated[float | None, Field(alias="estimatedTimeCost")] = None
+    estimated_time_revenue: Annotated[float | None, Field(alias="estimatedTimeRevenue")] = None
+    hourly_rate: Annotated[float | None, Field(alias="hourlyRate")] = None
+    id: int | None = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    mark_as_milestone_flag: Annotated[bool | None, Field(alias="markAsMilestoneFlag")] = None
+    notes: str | None = None
+    opportunity: OpportunityReference | None = None
+    parent_phase: Annotated[ProjectPhaseReference | None, Field(alias="parentPhase")] = None
+    po_amount: Annotated[float | None, Field(alias="poAmount")] = None
+    po_number: Annotated[str | None, Field(alias="poNumber")] = None
+    """
+     Max length: 25;
+    """
+    project_id: Annotated[int | None, Field(alias="projectId")] = None
+    scheduled_end: Annotated[datetime | None, Field(alias="scheduledEnd")] = None
+    scheduled_hours: Annotated[float | None, Field(alias="scheduledHours")] = None
+    scheduled_start: Annotated[datetime | None, Field(alias="scheduledStart")] = None
+    ship_to_company: Annotated[CompanyReference | None, Field(alias="shipToCompany")] = None
+    ship_to_contact: Annotated[ContactReference | None, Field(alias="shipToContact")] = None
+    ship_to_site: Annotated[SiteReference | None, Field(alias="shipToSite")] = None
+    status: PhaseStatusReference | None = None
+    wbs_code: Annotated[str | None, Field(alias="wbsCode")] = None
+    """
+     Max length: 50;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.opportunity_reference import OpportunityReference
+from pyconnectwise.models.manage.phase_status_reference import PhaseStatusReference
+from pyconnectwise.models.manage.project_board_reference import ProjectBoardReference
+from pyconnectwise.models.manage.project_phase_reference import ProjectPhaseReference
+from pyconnectwise.models.manage.site_reference import SiteReference
@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectSecurityRole(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    default_contact_flag: Annotated[bool | None, Field(alias="defaultContactFlag")] = None
+    id: int | None = None
+    manager_role_flag: Annotated[bool | None, Field(alias="managerRoleFlag")] = None
+    name: str
+    """
+     Max length: 30;
+    """
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectSecurityRoleSetting(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_level: Annotated[Literal["None", "My", "All"] | None, Field(alias="addLevel")] = None
+    delete_level: Annotated[Literal["None", "My", "All"] | None, Field(alias="deleteLevel")] = None
+    edit_level: Annotated[Literal["None", "My", "All"] | None, Field(alias="editLevel")] = None
+    id: int | None = None
+    inquire_level: Annotated[Literal["None", "My", "All"] | None, Field(alias="inquireLevel")] = None
+    module_identifier: Annotated[str | None, Field(alias="moduleIdentifier")] = None
+    """
+     Max length: 50;
+    """
+    my_flag: Annotated[bool | None, Field(alias="myFlag")] = None
@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectStatus(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    closed_flag: Annotated[bool | None, Field(alias="closedFlag")] = None
+    custom_status_indicator_name: Annotated[str | None, Field(alias="customStatusIndicatorName")] = None
+    """
+    Required when statusIndicator is Custom Max length: 30;
+    """
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    name: str
+    """
+     Max length: 30;
+    """
+    no_time_flag: Annotated[bool | None, Field(alias="noTimeFlag")] = None
+    status_indicator: Annotated[StatusIndicatorReference | None, Field(alias="statusIndicator")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.status_indicator_reference import StatusIndicatorReference
@@ -0,0 +1,36 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ProjectTicketNote(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    bundled_flag: Annotated[bool | None, Field(alias="bundledFlag")] = None
+    contact: ContactReference | None = None
+    detail_description_flag: Annotated[bool | None, Field(alias="detailDescriptionFlag")] = None
+    id: int | None = None
+    internal_analysis_flag: Annotated[bool | None, Field(alias="internalAnalysisFlag")] = None
+    issue_flag: Annotated[bool | None, Field(alias="issueFlag")] = None
+    member: MemberReference | None = None
+    merged_flag: Annotated[bool | None, Field(alias="mergedFlag")] = None
+    note_type: Annotated[Literal["TicketNote", "TimeEntryNote", "MeetingNote"] | None, Field(alias="noteType")] = None
+    original_author: Annotated[str | None, Field(alias="originalAuthor")] = None
+    resolution_flag: Annotated[bool | None, Field(alias="resolutionFlag")] = None
+    text: str | None = None
+    ticket: TicketReference | None = None
+    time_end: Annotated[datetime | None, Field(alias="timeEnd")] = None
+    time_start: Annotated[datetime | None, Field(alias="timeStart")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.ticket_reference import TicketReference
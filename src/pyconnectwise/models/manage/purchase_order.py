@@ -0,0 +1,103 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PurchaseOrder(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    cancel_reason: Annotated[str | None, Field(alias="cancelReason")] = None
+    closed_flag: Annotated[bool | None, Field(alias="closedFlag")] = None
+    """
+    The closed flag can only be updated via updating the purchase order status to a closed/open status.
+    """
+    currency: CurrencyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    customer_city: Annotated[str | None, Field(alias="customerCity")] = None
+    customer_company: Annotated[CompanyReference | None, Field(alias="customerCompany")] = None
+    customer_contact: Annotated[ContactReference | None, Field(alias="customerContact")] = None
+    customer_country: Annotated[CountryReference | None, Field(alias="customerCountry")] = None
+    customer_extension: Annotated[str | None, Field(alias="customerExtension")] = None
+    customer_name: Annotated[str | None, Field(alias="customerName")] = None
+    customer_phone: Annotated[str | None, Field(alias="customerPhone")] = None
+    customer_site: Annotated[SiteReference | None, Field(alias="customerSite")] = None
+    customer_site_name: Annotated[str | None, Field(alias="customerSiteName")] = None
+    customer_state: Annotated[str | None, Field(alias="customerState")] = None
+    customer_street_line1: Annotated[str | None, Field(alias="customerStreetLine1")] = None
+    customer_street_line2: Annotated[str | None, Field(alias="customerStreetLine2")] = None
+    customer_zip: Annotated[str | None, Field(alias="customerZip")] = None
+    date_closed: Annotated[datetime | None, Field(alias="dateClosed")] = None
+    drop_ship_customer_flag: Annotated[bool | None, Field(alias="dropShipCustomerFlag")] = None
+    entered_by: Annotated[str | None, Field(alias="enteredBy")] = None
+    freight_cost: Annotated[float | None, Field(alias="freightCost")] = None
+    freight_packing_slip: Annotated[str | None, Field(alias="freightPackingSlip")] = None
+    freight_tax_total: Annotated[float | None, Field(alias="freightTaxTotal")] = None
+    id: int | None = None
+    internal_notes: Annotated[str | None, Field(alias="internalNotes")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    po_date: Annotated[datetime | None, Field(alias="poDate")] = None
+    """
+     Required On Updates;
+    """
+    po_number: Annotated[str | None, Field(alias="poNumber")] = None
+    """
+     Required On Updates; Max length: 50;
+    """
+    sales_tax: Annotated[float | None, Field(alias="salesTax")] = None
+    shipment_date: Annotated[datetime | None, Field(alias="shipmentDate")] = None
+    shipment_method: Annotated[ShipmentMethodReference | None, Field(alias="shipmentMethod")] = None
+    shipping_instructions: Annotated[str | None, Field(alias="shippingInstructions")] = None
+    status: PurchaseOrderStatusReference | None = None
+    sub_total: Annotated[float | None, Field(alias="subTotal")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    tax_freight_flag: Annotated[bool | None, Field(alias="taxFreightFlag")] = None
+    tax_po_flag: Annotated[bool | None, Field(alias="taxPoFlag")] = None
+    terms: BillingTermsReference | None = None
+    total: float | None = None
+    tracking_number: Annotated[str | None, Field(alias="trackingNumber")] = None
+    """
+     Max length: 50;
+    """
+    update_shipment_info: Annotated[bool | None, Field(alias="updateShipmentInfo")] = None
+    """
+    Determines whether or not to update all of the shipment info for each associated line item when new shipment info is passed in
+    """
+    update_vendor_order_number: Annotated[bool | None, Field(alias="updateVendorOrderNumber")] = None
+    """
+    Determines whether or not to update vendor order number for each associated line item when new vendor order number is passed in
+    """
+    vendor_company: Annotated[CompanyReference | None, Field(alias="vendorCompany")] = None
+    vendor_contact: Annotated[ContactReference | None, Field(alias="vendorContact")] = None
+    vendor_invoice_date: Annotated[datetime | None, Field(alias="vendorInvoiceDate")] = None
+    vendor_invoice_number: Annotated[str | None, Field(alias="vendorInvoiceNumber")] = None
+    """
+     Max length: 50;
+    """
+    vendor_order_number: Annotated[str | None, Field(alias="vendorOrderNumber")] = None
+    """
+     Max length: 50;
+    """
+    vendor_site: Annotated[SiteReference | None, Field(alias="vendorSite")] = None
+    warehouse: WarehouseReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.country_reference import CountryReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.purchase_order_status_reference import PurchaseOrderStatusReference
+from pyconnectwise.models.manage.shipment_method_reference import ShipmentMethodReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
+from pyconnectwise.models.manage.warehouse_reference import WarehouseReference
@@ -0,0 +1,84 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PurchaseOrderLineItem(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    backordered_flag: Annotated[bool | None, Field(alias="backorderedFlag")] = None
+    canceled_by: Annotated[str | None, Field(alias="canceledBy")] = None
+    canceled_flag: Annotated[bool | None, Field(alias="canceledFlag")] = None
+    canceled_reason: Annotated[str | None, Field(alias="canceledReason")] = None
+    """
+     Max length: 100;
+    """
+    closed_flag: Annotated[bool | None, Field(alias="closedFlag")] = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    date_canceled: Annotated[datetime | None, Field(alias="dateCanceled")] = None
+    date_canceled_utc: Annotated[datetime | None, Field(alias="dateCanceledUtc")] = None
+    date_received: Annotated[datetime | None, Field(alias="dateReceived")] = None
+    description: str
+    """
+     Max length: 6000;
+    """
+    display_internal_notes_flag: Annotated[bool | None, Field(alias="displayInternalNotesFlag")] = None
+    expected_ship_date: Annotated[datetime | None, Field(alias="expectedShipDate")] = None
+    id: int | None = None
+    internal_notes: Annotated[str | None, Field(alias="internalNotes")] = None
+    """
+     Max length: 1000;
+    """
+    line_number: Annotated[int, Field(alias="lineNumber")]
+    packing_slip: Annotated[str | None, Field(alias="packingSlip")] = None
+    """
+     Max length: 50;
+    """
+    product: IvItemReference | None = None
+    purchase_order_id: Annotated[int | None, Field(alias="purchaseOrderId")] = None
+    quantity: float
+    received_quantity: Annotated[int | None, Field(alias="receivedQuantity")] = None
+    received_status: Annotated[
+        Literal["Waiting", "FullyReceived", "PartiallyReceiveCancelRest", "PartiallyReceiveCloneRest"] | None,
+        Field(alias="receivedStatus"),
+    ] = None
+    serial_numbers: Annotated[str | None, Field(alias="serialNumbers")] = None
+    ship_date: Annotated[datetime | None, Field(alias="shipDate")] = None
+    ship_set: Annotated[str | None, Field(alias="shipSet")] = None
+    """
+     Max length: 10;
+    """
+    shipment_method: Annotated[ShipmentMethodReference | None, Field(alias="shipmentMethod")] = None
+    tax: float | None = None
+    tracking_number: Annotated[str | None, Field(alias="trackingNumber")] = None
+    """
+     Max length: 50;
+    """
+    unit_cost: Annotated[float | None, Field(alias="unitCost")] = None
+    unit_of_measure: Annotated[UnitOfMeasureReference | None, Field(alias="unitOfMeasure")] = None
+    vendor_order_number: Annotated[str | None, Field(alias="vendorOrderNumber")] = None
+    """
+     Max length: 50;
+    """
+    vendor_sku: Annotated[str | None, Field(alias="vendorSku")] = None
+    """
+     Max length: 50;
+    """
+    warehouse: WarehouseReference | None = None
+    warehouse_bin: Annotated[WarehouseBinReference | None, Field(alias="warehouseBin")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.iv_item_reference import IvItemReference
+from pyconnectwise.models.manage.shipment_method_reference import ShipmentMethodReference
+from pyconnectwise.models.manage.unit_of_measure_reference import UnitOfMeasureReference
+from pyconnectwise.models.manage.warehouse_bin_reference import WarehouseBinReference
+from pyconnectwise.models.manage.warehouse_reference import WarehouseReference
@@ -0,0 +1,24 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class PurchasingDemand(ConnectWiseModel):
+    products: list[ProductDemand] | None = None
+    purchase_order: Annotated[PurchaseOrder | None, Field(alias="purchaseOrder")] = None
+    vendor: CompanyReference | None = None
+    warehouse: WarehouseReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.product_demand import ProductDemand
+from pyconnectwise.models.manage.purchase_order import PurchaseOrder
+from pyconnectwise.models.manage.warehouse_reference import WarehouseReference
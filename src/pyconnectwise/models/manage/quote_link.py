@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class QuoteLink(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    all_locations_flag: Annotated[bool | None, Field(alias="allLocationsFlag")] = None
+    id: int | None = None
+    link: str
+    """
+     Max length: 2000;
+    """
+    location: SystemLocationReference | None = None
+    new_window_flag: Annotated[bool | None, Field(alias="newWindowFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ReportCardDetail(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    kpi: KPIReference | None = None
+    report_card: Annotated[ReportCardReference | None, Field(alias="reportCard")] = None
+    sort_order: Annotated[int | None, Field(alias="sortOrder")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.kpi_reference import KPIReference
+from pyconnectwise.models.manage.report_card_reference import ReportCardReference
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ReportColumnDefinition(ConnectWiseModel):
+    identity_column: Annotated[bool | None, Field(alias="identityColumn")] = None
+    is_nullable: Annotated[bool | None, Field(alias="isNullable")] = None
+    type: str | None = None
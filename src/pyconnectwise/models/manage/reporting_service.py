@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ReportingService(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    reporting_domain: Annotated[str | None, Field(alias="reportingDomain")] = None
+    """
+     Max length: 50;
+    """
+    reporting_password: Annotated[str | None, Field(alias="reportingPassword")] = None
+    """
+    To blank out the password, enter an empty string here. Max length: 50;
+    """
+    reporting_url: Annotated[str | None, Field(alias="reportingUrl")] = None
+    """
+     Max length: 100;
+    """
+    reporting_user_name: Annotated[str | None, Field(alias="reportingUserName")] = None
+    """
+     Max length: 50;
+    """
@@ -0,0 +1,39 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class RmaStatusEmailTemplate(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    body: str
+    copy_sender_flag: Annotated[bool | None, Field(alias="copySenderFlag")] = None
+    email_address: Annotated[str | None, Field(alias="emailAddress")] = None
+    """
+     Max length: 100;
+    """
+    first_name: Annotated[str | None, Field(alias="firstName")] = None
+    """
+     Max length: 100;
+    """
+    id: int | None = None
+    last_name: Annotated[str | None, Field(alias="lastName")] = None
+    """
+     Max length: 100;
+    """
+    status: RmaStatusReference | None = None
+    subject: str
+    """
+     Max length: 200;
+    """
+    use_sender_flag: Annotated[bool | None, Field(alias="useSenderFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.rma_status_reference import RmaStatusReference
@@ -0,0 +1,229 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class RmaTag(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    account_manager: Annotated[MemberReference | None, Field(alias="accountManager")] = None
+    closed_by: Annotated[MemberReference | None, Field(alias="closedBy")] = None
+    closing_notes: Annotated[str | None, Field(alias="closingNotes")] = None
+    """
+     Max length: 1000;
+    """
+    currency: CurrencyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    date_closed: Annotated[datetime | None, Field(alias="dateClosed")] = None
+    department: SystemDepartmentReference | None = None
+    drop_ship_flag: Annotated[bool | None, Field(alias="dropShipFlag")] = None
+    id: int | None = None
+    internal_notes: Annotated[str | None, Field(alias="internalNotes")] = None
+    """
+     Max length: 1000;
+    """
+    invoice: InvoiceReference | None = None
+    iv_description: Annotated[str | None, Field(alias="ivDescription")] = None
+    list_price: Annotated[float | None, Field(alias="listPrice")] = None
+    location: SystemLocationReference | None = None
+    mfg_item_id: Annotated[str | None, Field(alias="mfgItemID")] = None
+    """
+     Max length: 100;
+    """
+    problem_description: Annotated[str | None, Field(alias="problemDescription")] = None
+    """
+     Max length: 1000;
+    """
+    product: IvItemReference | None = None
+    product_description: Annotated[str, Field(alias="productDescription")]
+    """
+     Max length: 200;
+    """
+    project: ProjectReference | None = None
+    purchased_company: Annotated[CompanyReference | None, Field(alias="purchasedCompany")] = None
+    purchased_contact: Annotated[ContactReference | None, Field(alias="purchasedContact")] = None
+    purchased_contact_address_line1: Annotated[str | None, Field(alias="purchasedContactAddressLine1")] = None
+    """
+     Max length: 50;
+    """
+    purchased_contact_address_line2: Annotated[str | None, Field(alias="purchasedContactAddressLine2")] = None
+    """
+     Max length: 50;
+    """
+    purchased_contact_city: Annotated[str | None, Field(alias="purchasedContactCity")] = None
+    """
+     Max length: 50;
+    """
+    purchased_contact_country: Annotated[CountryReference | None, Field(alias="purchasedContactCountry")] = None
+    purchased_contact_email: Annotated[str | None, Field(alias="purchasedContactEmail")] = None
+    purchased_contact_extension: Annotated[str | None, Field(alias="purchasedContactExtension")] = None
+    purchased_contact_phone: Annotated[str | None, Field(alias="purchasedContactPhone")] = None
+    purchased_contact_state: Annotated[str | None, Field(alias="purchasedContactState")] = None
+    """
+     Max length: 50;
+    """
+    purchased_contact_type: Annotated[str | None, Field(alias="purchasedContactType")] = None
+    purchased_contact_zip: Annotated[str | None, Field(alias="purchasedContactZip")] = None
+    """
+     Max length: 12;
+    """
+    purchased_invoice_date: Annotated[date | None, Field(alias="purchasedInvoiceDate")] = None
+    purchased_invoice_number: Annotated[str | None, Field(alias="purchasedInvoiceNumber")] = None
+    """
+     Max length: 50;
+    """
+    purchased_notes: Annotated[str | None, Field(alias="purchasedNotes")] = None
+    """
+     Max length: 1000;
+    """
+    purchased_order_number: Annotated[str | None, Field(alias="purchasedOrderNumber")] = None
+    """
+     Max length: 50;
+    """
+    purchased_site: Annotated[SiteReference | None, Field(alias="purchasedSite")] = None
+    purchased_vendor_action: Annotated[RmaActionReference | None, Field(alias="purchasedVendorAction")] = None
+    purchased_vendor_rma_number: Annotated[str | None, Field(alias="purchasedVendorRmaNumber")] = None
+    """
+     Max length: 50;
+    """
+    repair_company: Annotated[CompanyReference | None, Field(alias="repairCompany")] = None
+    repair_contact: Annotated[ContactReference | None, Field(alias="repairContact")] = None
+    repair_contact_address_line1: Annotated[str | None, Field(alias="repairContactAddressLine1")] = None
+    """
+     Max length: 50;
+    """
+    repair_contact_address_line2: Annotated[str | None, Field(alias="repairContactAddressLine2")] = None
+    """
+     Max length: 50;
+    """
+    repair_contact_city: Annotated[str | None, Field(alias="repairContactCity")] = None
+    """
+     Max length: 50;
+    """
+    repair_contact_country: Annotated[CountryReference | None, Field(alias="repairContactCountry")] = None
+    repair_contact_email: Annotated[str | None, Field(alias="repairContactEmail")] = None
+    repair_contact_extension: Annotated[str | None, Field(alias="repairContactExtension")] = None
+    repair_contact_phone: Annotated[str | None, Field(alias="repairContactPhone")] = None
+    repair_contact_state: Annotated[str | None, Field(alias="repairContactState")] = None
+    """
+     Max length: 50;
+    """
+    repair_contact_type: Annotated[str | None, Field(alias="repairContactType")] = None
+    repair_contact_zip: Annotated[str | None, Field(alias="repairContactZip")] = None
+    """
+     Max length: 12;
+    """
+    repair_notes: Annotated[str | None, Field(alias="repairNotes")] = None
+    """
+     Max length: 1000;
+    """
+    repair_order_number: Annotated[str | None, Field(alias="repairOrderNumber")] = None
+    """
+     Max length: 50;
+    """
+    repair_site: Annotated[SiteReference | None, Field(alias="repairSite")] = None
+    returned_company: Annotated[CompanyReference | None, Field(alias="returnedCompany")] = None
+    returned_contact: Annotated[ContactReference | None, Field(alias="returnedContact")] = None
+    returned_contact_address_line1: Annotated[str | None, Field(alias="returnedContactAddressLine1")] = None
+    """
+     Max length: 50;
+    """
+    returned_contact_address_line2: Annotated[str | None, Field(alias="returnedContactAddressLine2")] = None
+    """
+     Max length: 50;
+    """
+    returned_contact_city: Annotated[str | None, Field(alias="returnedContactCity")] = None
+    """
+     Max length: 50;
+    """
+    returned_contact_country: Annotated[CountryReference | None, Field(alias="returnedContactCountry")] = None
+    returned_contact_email: Annotated[str | None, Field(alias="returnedContactEmail")] = None
+    returned_contact_extension: Annotated[str | None, Field(alias="returnedContactExtension")] = None
+    returned_contact_phone: Annotated[str | None, Field(alias="returnedContactPhone")] = None
+    returned_contact_state: Annotated[str | None, Field(alias="returnedContactState")] = None
+    """
+     Max length: 50;
+    """
+    returned_contact_type: Annotated[str | None, Field(alias="returnedContactType")] = None
+    returned_contact_zip: Annotated[str | None, Field(alias="returnedContactZip")] = None
+    """
+     Max length: 12;
+    """
+    returned_site: Annotated[SiteReference | None, Field(alias="returnedSite")] = None
+    rma_disposition: Annotated[RmaDispositionReference | None, Field(alias="rmaDisposition")] = None
+    sales_order: Annotated[SalesOrderReference | None, Field(alias="salesOrder")] = None
+    serial_number: Annotated[str | None, Field(alias="serialNumber")] = None
+    service_ticket: Annotated[TicketReference | None, Field(alias="serviceTicket")] = None
+    ship_method: Annotated[ShipmentMethodReference | None, Field(alias="shipMethod")] = None
+    shipping_date: Annotated[date | None, Field(alias="shippingDate")] = None
+    shipping_tracking_number: Annotated[str | None, Field(alias="shippingTrackingNumber")] = None
+    """
+     Max length: 50;
+    """
+    status: RmaStatusReference | None = None
+    summary: str | None = None
+    """
+     Max length: 150;
+    """
+    technical_contact: Annotated[MemberReference | None, Field(alias="technicalContact")] = None
+    unit_price: Annotated[float | None, Field(alias="unitPrice")] = None
+    warranty_company: Annotated[CompanyReference | None, Field(alias="warrantyCompany")] = None
+    warranty_contact: Annotated[ContactReference | None, Field(alias="warrantyContact")] = None
+    warranty_contact_address_line1: Annotated[str | None, Field(alias="warrantyContactAddressLine1")] = None
+    """
+     Max length: 50;
+    """
+    warranty_contact_address_line2: Annotated[str | None, Field(alias="warrantyContactAddressLine2")] = None
+    """
+     Max length: 50;
+    """
+    warranty_contact_city: Annotated[str | None, Field(alias="warrantyContactCity")] = None
+    """
+     Max length: 50;
+    """
+    warranty_contact_country: Annotated[CountryReference | None, Field(alias="warrantyContactCountry")] = None
+    warranty_contact_email: Annotated[str | None, Field(alias="warrantyContactEmail")] = None
+    warranty_contact_extension: Annotated[str | None, Field(alias="warrantyContactExtension")] = None
+    warranty_contact_phone: Annotated[str | None, Field(alias="warrantyContactPhone")] = None
+    warranty_contact_state: Annotated[str | None, Field(alias="warrantyContactState")] = None
+    """
+     Max length: 50;
+    """
+    warranty_contact_type: Annotated[str | None, Field(alias="warrantyContactType")] = None
+    warranty_contact_zip: Annotated[str | None, Field(alias="warrantyContactZip")] = None
+    """
+     Max length: 12;
+    """
+    warranty_notes: Annotated[str | None, Field(alias="warrantyNotes")] = None
+    """
+     Max length: 1000;
+    """
+    warranty_site: Annotated[SiteReference | None, Field(alias="warrantySite")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.country_reference import CountryReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.invoice_reference import InvoiceReference
+from pyconnectwise.models.manage.iv_item_reference import IvItemReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.project_reference import ProjectReference
+from pyconnectwise.models.manage.rma_action_reference import RmaActionReference
+from pyconnectwise.models.manage.rma_disposition_reference import RmaDispositionReference
+from pyconnectwise.models.manage.rma_status_reference import RmaStatusReference
+from pyconnectwise.models.manage.sales_order_reference import SalesOrderReference
+from pyconnectwise.models.manage.shipment_method_reference import ShipmentMethodReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.ticket_reference import TicketReference
@@ -0,0 +1,55 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SalesQuota(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    april_margin: Annotated[float | None, Field(alias="aprilMargin")] = None
+    april_revenue: Annotated[float | None, Field(alias="aprilRevenue")] = None
+    august_margin: Annotated[float | None, Field(alias="augustMargin")] = None
+    august_revenue: Annotated[float | None, Field(alias="augustRevenue")] = None
+    category: ProductCategoryReference | None = None
+    currency: CurrencyReference | None = None
+    december_margin: Annotated[float | None, Field(alias="decemberMargin")] = None
+    december_revenue: Annotated[float | None, Field(alias="decemberRevenue")] = None
+    department: SystemDepartmentReference | None = None
+    february_margin: Annotated[float | None, Field(alias="februaryMargin")] = None
+    february_revenue: Annotated[float | None, Field(alias="februaryRevenue")] = None
+    forecast_year: Annotated[int | None, Field(alias="forecastYear")] = None
+    id: int | None = None
+    january_margin: Annotated[float | None, Field(alias="januaryMargin")] = None
+    january_revenue: Annotated[float | None, Field(alias="januaryRevenue")] = None
+    july_margin: Annotated[float | None, Field(alias="julyMargin")] = None
+    july_revenue: Annotated[float | None, Field(alias="julyRevenue")] = None
+    june_margin: Annotated[float | None, Field(alias="juneMargin")] = None
+    june_revenue: Annotated[float | None, Field(alias="juneRevenue")] = None
+    location: SystemLocationReference | None = None
+    march_margin: Annotated[float | None, Field(alias="marchMargin")] = None
+    march_revenue: Annotated[float | None, Field(alias="marchRevenue")] = None
+    may_margin: Annotated[float | None, Field(alias="mayMargin")] = None
+    may_revenue: Annotated[float | None, Field(alias="mayRevenue")] = None
+    member: MemberReference | None = None
+    november_margin: Annotated[float | None, Field(alias="novemberMargin")] = None
+    november_revenue: Annotated[float | None, Field(alias="novemberRevenue")] = None
+    october_margin: Annotated[float | None, Field(alias="octoberMargin")] = None
+    october_revenue: Annotated[float | None, Field(alias="octoberRevenue")] = None
+    september_margin: Annotated[float | None, Field(alias="septemberMargin")] = None
+    september_revenue: Annotated[float | None, Field(alias="septemberRevenue")] = None
+    sub_category: Annotated[ProductSubCategoryReference | None, Field(alias="subCategory")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.product_category_reference import ProductCategoryReference
+from pyconnectwise.models.manage.product_sub_category_reference import ProductSubCategoryReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
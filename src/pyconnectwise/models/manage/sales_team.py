@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SalesTeam(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    sales_team_description: Annotated[str, Field(alias="salesTeamDescription")]
+    """
+     Max length: 50;
+    """
+    sales_team_identifier: Annotated[str, Field(alias="salesTeamIdentifier")]
+    """
+     Max length: 20;
+    """
+    sales_team_location: Annotated[SystemLocationReference | None, Field(alias="salesTeamLocation")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
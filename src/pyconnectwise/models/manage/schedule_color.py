@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ScheduleColor(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    color: str
+    """
+    Must be a valid Hexadecimal Color Code
+    """
+    end_percent: Annotated[int | None, Field(alias="endPercent")] = None
+    """
+    A endPercent is required if startPercent has value
+    """
+    id: int | None = None
+    start_percent: Annotated[int | None, Field(alias="startPercent")] = None
+    """
+    A startPercent (0 or higher) is required if endPercent has value
+    """
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ScheduleDetail(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    date_end: Annotated[datetime | None, Field(alias="dateEnd")] = None
+    date_start: Annotated[datetime | None, Field(alias="dateStart")] = None
+    id: int | None = None
+    member: MemberReference | None = None
+    schedule_entry: Annotated[ScheduleEntryReference | None, Field(alias="scheduleEntry")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.schedule_entry_reference import ScheduleEntryReference
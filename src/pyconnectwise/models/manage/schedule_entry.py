@@ -0,0 +1,50 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ScheduleEntry(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    acknowledged_date: Annotated[datetime | None, Field(alias="acknowledgedDate")] = None
+    acknowledged_flag: Annotated[bool | None, Field(alias="acknowledgedFlag")] = None
+    add_member_to_project_flag: Annotated[bool | None, Field(alias="addMemberToProjectFlag")] = None
+    allow_schedule_conflicts_flag: Annotated[bool | None, Field(alias="allowScheduleConflictsFlag")] = None
+    close_date: Annotated[datetime | None, Field(alias="closeDate")] = None
+    date_end: Annotated[datetime | None, Field(alias="dateEnd")] = None
+    date_start: Annotated[datetime | None, Field(alias="dateStart")] = None
+    done_flag: Annotated[bool | None, Field(alias="doneFlag")] = None
+    hours: float | None = None
+    id: int | None = None
+    meeting_flag: Annotated[bool | None, Field(alias="meetingFlag")] = None
+    member: MemberReference | None = None
+    mobile_guid: Annotated[UUID | None, Field(alias="mobileGuid")] = None
+    name: str | None = None
+    """
+     Max length: 250;
+    """
+    object_id: Annotated[int | None, Field(alias="objectId")] = None
+    owner_flag: Annotated[bool | None, Field(alias="ownerFlag")] = None
+    project_role_id: Annotated[int | None, Field(alias="projectRoleId")] = None
+    reminder: ReminderReference | None = None
+    span: ScheduleSpanReference | None = None
+    status: ScheduleStatusReference | None = None
+    type: ScheduleTypeReference | None = None
+    where: ServiceLocationReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.reminder_reference import ReminderReference
+from pyconnectwise.models.manage.schedule_span_reference import ScheduleSpanReference
+from pyconnectwise.models.manage.schedule_status_reference import ScheduleStatusReference
+from pyconnectwise.models.manage.schedule_type_reference import ScheduleTypeReference
+from pyconnectwise.models.manage.service_location_reference import ServiceLocationReference
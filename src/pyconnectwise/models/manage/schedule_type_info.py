@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ScheduleTypeInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    charge_code: Annotated[ChargeCodeReference | None, Field(alias="chargeCode")] = None
+    id: int | None = None
+    identifier: str | None = None
+    name: str | None = None
+    system_flag: Annotated[bool | None, Field(alias="systemFlag")] = None
+    where: ServiceLocationReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.charge_code_reference import ChargeCodeReference
+from pyconnectwise.models.manage.service_location_reference import ServiceLocationReference
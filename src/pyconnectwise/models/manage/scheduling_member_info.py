@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SchedulingMemberInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    default_email: Annotated[str | None, Field(alias="defaultEmail")] = None
+    first_name: Annotated[str | None, Field(alias="firstName")] = None
+    full_name: Annotated[str | None, Field(alias="fullName")] = None
+    id: int | None = None
+    identifier: str | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    last_name: Annotated[str | None, Field(alias="lastName")] = None
+    middle_initial: Annotated[str | None, Field(alias="middleInitial")] = None
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SecurityRoleSetting(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_level: Annotated[Literal["None", "My", "All"] | None, Field(alias="addLevel")] = None
+    custom_flag: Annotated[bool | None, Field(alias="customFlag")] = None
+    delete_level: Annotated[Literal["None", "My", "All"] | None, Field(alias="deleteLevel")] = None
+    edit_level: Annotated[Literal["None", "My", "All"] | None, Field(alias="editLevel")] = None
+    id: int | None = None
+    inquire_level: Annotated[Literal["None", "My", "All"] | None, Field(alias="inquireLevel")] = None
+    module_description: Annotated[str | None, Field(alias="moduleDescription")] = None
+    module_function_description: Annotated[str | None, Field(alias="moduleFunctionDescription")] = None
+    module_function_identifier: Annotated[str | None, Field(alias="moduleFunctionIdentifier")] = None
+    module_function_name: Annotated[str | None, Field(alias="moduleFunctionName")] = None
+    module_identifier: Annotated[str | None, Field(alias="moduleIdentifier")] = None
+    module_name: Annotated[str | None, Field(alias="moduleName")] = None
+    my_all_flag: Annotated[bool | None, Field(alias="myAllFlag")] = None
+    report_flag: Annotated[bool | None, Field(alias="reportFlag")] = None
+    restrict_flag: Annotated[bool | None, Field(alias="restrictFlag")] = None
+    sort_order: Annotated[int | None, Field(alias="sortOrder")] = None
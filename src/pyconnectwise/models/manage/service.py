@@ -0,0 +1,47 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Service(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    allow_cc_flag: Annotated[bool | None, Field(alias="allowCCFlag")] = None
+    allow_to_flag: Annotated[bool | None, Field(alias="allowTOFlag")] = None
+    calendar_setup: Annotated[CalendarSetupReference | None, Field(alias="calendarSetup")] = None
+    contact_color: Annotated[str | None, Field(alias="contactColor")] = None
+    """
+     Max length: 50;
+    """
+    contact_color_disable_flag: Annotated[bool | None, Field(alias="contactColorDisableFlag")] = None
+    header_color: Annotated[str | None, Field(alias="headerColor")] = None
+    """
+     Max length: 50;
+    """
+    header_color_disable_flag: Annotated[bool | None, Field(alias="headerColorDisableFlag")] = None
+    hide_delimiter_flag: Annotated[bool | None, Field(alias="hideDelimiterFlag")] = None
+    id: int | None = None
+    member_color: Annotated[str | None, Field(alias="memberColor")] = None
+    """
+     Max length: 50;
+    """
+    member_color_disable_flag: Annotated[bool | None, Field(alias="memberColorDisableFlag")] = None
+    schedule_span: Annotated[Literal["Standard", "OfficeHours", "Overnight"], Field(alias="scheduleSpan")]
+    sr_notify: Annotated[
+        Literal["All", "NewAndClosedRequests", "ClosedRequestsOnly", "NewRequestsOnly", "None"], Field(alias="srNotify")
+    ]
+    unknown_color: Annotated[str | None, Field(alias="unknownColor")] = None
+    """
+     Max length: 50;
+    """
+    unknown_color_disable_flag: Annotated[bool | None, Field(alias="unknownColorDisableFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.calendar_setup_reference import CalendarSetupReference
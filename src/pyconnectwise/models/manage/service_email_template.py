@@ -0,0 +1,48 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceEmailTemplate(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    body: str | None = None
+    copy_sender_flag: Annotated[bool | None, Field(alias="copySenderFlag")] = None
+    email_address: Annotated[str | None, Field(alias="emailAddress")] = None
+    """
+    From fields (first name, last name, email address) are required if useSenderFlag is false. Max length: 100;
+    """
+    external_contact_notifications: Annotated[bool | None, Field(alias="externalContactNotifications")] = None
+    first_name: Annotated[str | None, Field(alias="firstName")] = None
+    """
+    From fields (first name, last name, email address) are required if useSenderFlag is false. Max length: 100;
+    """
+    id: int | None = None
+    internal_contact_notifications: Annotated[bool | None, Field(alias="internalContactNotifications")] = None
+    last_name: Annotated[str | None, Field(alias="lastName")] = None
+    """
+    From fields (first name, last name, email address) are required if useSenderFlag is false. Max length: 100;
+    """
+    resource_records_flag: Annotated[bool | None, Field(alias="resourceRecordsFlag")] = None
+    service_board: Annotated[BoardReference | None, Field(alias="serviceBoard")] = None
+    service_status: Annotated[ServiceStatusReference | None, Field(alias="serviceStatus")] = None
+    service_survey: Annotated[ServiceSurveyReference | None, Field(alias="serviceSurvey")] = None
+    subject: str | None = None
+    """
+     Max length: 200;
+    """
+    tasks_flag: Annotated[bool | None, Field(alias="tasksFlag")] = None
+    type: Literal["Any", "Closed", "Invoice", "New", "SalesOrder", "PurchaseOrder", "RMA", "Specific"]
+    use_sender_flag: Annotated[bool | None, Field(alias="useSenderFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.service_status_reference import ServiceStatusReference
+from pyconnectwise.models.manage.service_survey_reference import ServiceSurveyReference
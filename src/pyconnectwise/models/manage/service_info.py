@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    contact_color: Annotated[str | None, Field(alias="contactColor")] = None
+    header_color: Annotated[str | None, Field(alias="headerColor")] = None
+    id: int | None = None
+    member_color: Annotated[str | None, Field(alias="memberColor")] = None
+    unknown_color: Annotated[str | None, Field(alias="unknownColor")] = None
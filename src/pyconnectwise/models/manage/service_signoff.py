@@ -0,0 +1,100 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceSignoff(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    billing_methods_text: Annotated[str | None, Field(alias="billingMethodsText")] = None
+    """
+     Max length: 2000;
+    """
+    billing_methods_text_flag: Annotated[bool | None, Field(alias="billingMethodsTextFlag")] = None
+    """
+    On add/post, if billingMethodsText.Length > 0, this is set to true
+    """
+    billing_terms_flag: Annotated[bool | None, Field(alias="billingTermsFlag")] = None
+    company_info_flag: Annotated[bool | None, Field(alias="companyInfoFlag")] = None
+    configurations_flag: Annotated[bool | None, Field(alias="configurationsFlag")] = None
+    credit_card_fields_flag: Annotated[bool | None, Field(alias="creditCardFieldsFlag")] = None
+    customer_signoff_fields_flag: Annotated[bool | None, Field(alias="customerSignoffFieldsFlag")] = None
+    customer_signoff_text: Annotated[str | None, Field(alias="customerSignoffText")] = None
+    """
+     Max length: 4000;
+    """
+    customer_signoff_text_flag: Annotated[bool | None, Field(alias="customerSignoffTextFlag")] = None
+    """
+    On add/post, if customerSignoffText.Length > 0, this is set to true
+    """
+    default_ff_flag: Annotated[bool | None, Field(alias="defaultFFFlag")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    discussion_flag: Annotated[bool | None, Field(alias="discussionFlag")] = None
+    expense_agreement_flag: Annotated[bool | None, Field(alias="expenseAgreementFlag")] = None
+    expense_amount_flag: Annotated[bool | None, Field(alias="expenseAmountFlag")] = None
+    expense_bill_flag: Annotated[bool | None, Field(alias="expenseBillFlag")] = None
+    expense_date_flag: Annotated[bool | None, Field(alias="expenseDateFlag")] = None
+    expense_flag: Annotated[bool | None, Field(alias="expenseFlag")] = None
+    """
+    On add/post, if any expense related flag is set to true, this is also set to true
+    """
+    expense_manual_entry: Annotated[int | None, Field(alias="expenseManualEntry")] = None
+    expense_manual_flag: Annotated[bool | None, Field(alias="expenseManualFlag")] = None
+    expense_member_flag: Annotated[bool | None, Field(alias="expenseMemberFlag")] = None
+    expense_notes_flag: Annotated[bool | None, Field(alias="expenseNotesFlag")] = None
+    expense_tax_flag: Annotated[bool | None, Field(alias="expenseTaxFlag")] = None
+    expense_type_flag: Annotated[bool | None, Field(alias="expenseTypeFlag")] = None
+    id: int | None = None
+    internal_notes_flag: Annotated[bool | None, Field(alias="internalNotesFlag")] = None
+    name: str
+    """
+     Max length: 50;
+    """
+    product_agreement_flag: Annotated[bool | None, Field(alias="productAgreementFlag")] = None
+    product_bill_flag: Annotated[bool | None, Field(alias="productBillFlag")] = None
+    product_description_flag: Annotated[bool | None, Field(alias="productDescriptionFlag")] = None
+    product_extended_amount_flag: Annotated[bool | None, Field(alias="productExtendedAmountFlag")] = None
+    product_flag: Annotated[bool | None, Field(alias="productFlag")] = None
+    """
+    On add/post, if any product related flag is set to true, this is also set to true
+    """
+    product_manual_entry: Annotated[int | None, Field(alias="productManualEntry")] = None
+    product_manual_flag: Annotated[bool | None, Field(alias="productManualFlag")] = None
+    product_price_flag: Annotated[bool | None, Field(alias="productPriceFlag")] = None
+    product_quantity_flag: Annotated[bool | None, Field(alias="productQuantityFlag")] = None
+    product_tax_flag: Annotated[bool | None, Field(alias="productTaxFlag")] = None
+    resolution_flag: Annotated[bool | None, Field(alias="resolutionFlag")] = None
+    summary_flag: Annotated[bool | None, Field(alias="summaryFlag")] = None
+    task: Literal["All", "Closed", "Open"] | None = None
+    """
+    On add/post, if this is set but no value is set for taskFlag, taskFlag is set to true
+    """
+    task_flag: Annotated[bool | None, Field(alias="taskFlag")] = None
+    """
+    On add/post, if this is set to true but no value is set for task, task is defaulted to ServiceTasks.All
+    """
+    technician_signoff_flag: Annotated[bool | None, Field(alias="technicianSignoffFlag")] = None
+    time_agreement_flag: Annotated[bool | None, Field(alias="timeAgreementFlag")] = None
+    time_bill_flag: Annotated[bool | None, Field(alias="timeBillFlag")] = None
+    time_date_flag: Annotated[bool | None, Field(alias="timeDateFlag")] = None
+    time_extended_amount_flag: Annotated[bool | None, Field(alias="timeExtendedAmountFlag")] = None
+    time_flag: Annotated[bool | None, Field(alias="timeFlag")] = None
+    """
+    On add/post, if any time related flag is set to true, this is also set to true
+    """
+    time_hours_flag: Annotated[bool | None, Field(alias="timeHoursFlag")] = None
+    time_manual_entry: Annotated[int | None, Field(alias="timeManualEntry")] = None
+    time_manual_flag: Annotated[bool | None, Field(alias="timeManualFlag")] = None
+    time_member_flag: Annotated[bool | None, Field(alias="timeMemberFlag")] = None
+    time_notes_flag: Annotated[bool | None, Field(alias="timeNotesFlag")] = None
+    time_rate_flag: Annotated[bool | None, Field(alias="timeRateFlag")] = None
+    time_start_end_flag: Annotated[bool | None, Field(alias="timeStartEndFlag")] = None
+    time_tax_flag: Annotated[bool | None, Field(alias="timeTaxFlag")] = None
+    time_work_type_flag: Annotated[bool | None, Field(alias="timeWorkTypeFlag")] = None
+    visible_logo_flag: Annotated[bool | None, Field(alias="visibleLogoFlag")] = None
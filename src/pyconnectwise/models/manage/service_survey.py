@@ -0,0 +1,43 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceSurvey(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    footer_text: Annotated[str | None, Field(alias="footerText")] = None
+    """
+     Max length: 500;
+    """
+    footer_text_visible_flag: Annotated[bool | None, Field(alias="footerTextVisibleFlag")] = None
+    header_include_logo_flag: Annotated[bool | None, Field(alias="headerIncludeLogoFlag")] = None
+    header_text: Annotated[str | None, Field(alias="headerText")] = None
+    """
+     Max length: 4000;
+    """
+    header_text_visible_flag: Annotated[bool | None, Field(alias="headerTextVisibleFlag")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    name: str
+    """
+     Max length: 50;
+    """
+    notify_member: Annotated[MemberReference | None, Field(alias="notifyMember")] = None
+    notify_who: Annotated[GenericIdIdentifierReference | None, Field(alias="notifyWho")] = None
+    notify_who_visible_flag: Annotated[bool | None, Field(alias="notifyWhoVisibleFlag")] = None
+    thank_you_text: Annotated[str | None, Field(alias="thankYouText")] = None
+    """
+     Max length: 4000;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.generic_id_identifier_reference import GenericIdIdentifierReference
+from pyconnectwise.models.manage.member_reference import MemberReference
@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceSurveyQuestion(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    include_flag: Annotated[bool | None, Field(alias="includeFlag")] = None
+    no_answer_points: Annotated[int | None, Field(alias="noAnswerPoints")] = None
+    options: list[ServiceSurveyQuestionOption] | None = None
+    question: str
+    """
+     Max length: 1000;
+    """
+    required_flag: Annotated[bool | None, Field(alias="requiredFlag")] = None
+    sequence_number: Annotated[int | None, Field(alias="sequenceNumber")] = None
+    survey_id: Annotated[int | None, Field(alias="surveyId")] = None
+    type: Literal["OpenEnded", "Selection"]
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.service_survey_question_option import ServiceSurveyQuestionOption
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceSurveyQuestionOption(ConnectWiseModel):
+    caption: str | None = None
+    include_flag: Annotated[bool | None, Field(alias="includeFlag")] = None
+    points: int | None = None
@@ -0,0 +1,84 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceTemplate(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement: AgreementReference | None = None
+    assigned_by: Annotated[MemberReference | None, Field(alias="assignedBy")] = None
+    assigned_notify_flag: Annotated[bool | None, Field(alias="assignedNotifyFlag")] = None
+    attach_schedule_to_new_service_flag: Annotated[bool | None, Field(alias="attachScheduleToNewServiceFlag")] = None
+    bill_complete_flag: Annotated[bool | None, Field(alias="billComplete_Flag")] = None
+    bill_service_separately_flag: Annotated[bool | None, Field(alias="billServiceSeparatelyFlag")] = None
+    bill_unapproved_time_and_expenses_flag: Annotated[
+        bool | None, Field(alias="billUnapprovedTimeAndExpensesFlag")
+    ] = None
+    billing_amount: Annotated[float | None, Field(alias="billingAmount")] = None
+    billing_method: Annotated[
+        Literal["ActualRates", "FixedFee", "NotToExceed", "OverrideRate"] | None, Field(alias="billingMethod")
+    ] = None
+    board: BoardReference | None = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    department: SystemDepartmentReference | None = None
+    email_cc: Annotated[str | None, Field(alias="emailCC")] = None
+    email_cc_flag: Annotated[bool | None, Field(alias="emailCCFlag")] = None
+    email_contact_flag: Annotated[bool | None, Field(alias="emailContactFlag")] = None
+    email_resource_flag: Annotated[bool | None, Field(alias="emailResourceFlag")] = None
+    expense_billable_flag: Annotated[bool | None, Field(alias="expenseBillableFlag")] = None
+    expense_invoice_flag: Annotated[bool | None, Field(alias="expenseInvoiceFlag")] = None
+    hours_budget: Annotated[float | None, Field(alias="hoursBudget")] = None
+    id: int | None = None
+    impact: Literal["Low", "Medium", "High"] | None = None
+    internal_analysis: Annotated[str | None, Field(alias="internalAnalysis")] = None
+    item: ServiceItemReference | None = None
+    location: SystemLocationReference | None = None
+    name: str | None = None
+    override_flag: Annotated[bool | None, Field(alias="overrideFlag")] = None
+    priority: PriorityReference | None = None
+    problem: str | None = None
+    product_invoice_flag: Annotated[bool | None, Field(alias="productInvoiceFlag")] = None
+    purchase_order_number: Annotated[str | None, Field(alias="purchaseOrderNumber")] = None
+    reference: str | None = None
+    restrict_downpayment_flag: Annotated[bool | None, Field(alias="restrictDownpaymentFlag")] = None
+    schedule_days_before: Annotated[int | None, Field(alias="scheduleDaysBefore")] = None
+    service_days_before: Annotated[int | None, Field(alias="serviceDaysBefore")] = None
+    service_location: Annotated[ServiceLocationReference | None, Field(alias="serviceLocation")] = None
+    severity: Literal["Low", "Medium", "High"] | None = None
+    site: SiteReference | None = None
+    source: ServiceSourceReference | None = None
+    status: ServiceStatusReference | None = None
+    subtype: ServiceSubTypeReference | None = None
+    summary: str | None = None
+    team: ServiceTeamReference | None = None
+    template_flag: Annotated[bool | None, Field(alias="templateFlag")] = None
+    time_billable_flag: Annotated[bool | None, Field(alias="timeBillableFlag")] = None
+    time_invoice_flag: Annotated[bool | None, Field(alias="timeInvoiceFlag")] = None
+    type: ServiceTypeReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.priority_reference import PriorityReference
+from pyconnectwise.models.manage.service_item_reference import ServiceItemReference
+from pyconnectwise.models.manage.service_location_reference import ServiceLocationReference
+from pyconnectwise.models.manage.service_source_reference import ServiceSourceReference
+from pyconnectwise.models.manage.service_status_reference import ServiceStatusReference
+from pyconnectwise.models.manage.service_sub_type_reference import ServiceSubTypeReference
+from pyconnectwise.models.manage.service_team_reference import ServiceTeamReference
+from pyconnectwise.models.manage.service_type_reference import ServiceTypeReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
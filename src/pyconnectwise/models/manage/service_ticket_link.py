@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class ServiceTicketLink(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    enabled_flag: Annotated[bool | None, Field(alias="enabledFlag")] = None
+    id: int | None = None
+    link_text: Annotated[str, Field(alias="linkText")]
+    """
+     Max length: 50;
+    """
+    name: str
+    """
+     Max length: 50;
+    """
+    url: str
+    """
+     Max length: 1000;
+    """
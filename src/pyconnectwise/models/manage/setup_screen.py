@@ -0,0 +1,21 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SetupScreen(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    category: str | None = None
+    description: str | None = None
+    id: int | None = None
+    module_description: Annotated[str | None, Field(alias="moduleDescription")] = None
+    module_identifier: Annotated[str | None, Field(alias="moduleIdentifier")] = None
+    module_name: Annotated[str | None, Field(alias="moduleName")] = None
+    name: str | None = None
@@ -0,0 +1,43 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SLA(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    application_order: Annotated[int | None, Field(alias="applicationOrder")] = None
+    based_on: Annotated[Literal["AllHours", "Customer", "MyCalendar", "Custom"], Field(alias="basedOn")]
+    custom_calendar: Annotated[CalendarReference | None, Field(alias="customCalendar")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    hi_impact_hi_urgency: Annotated[PriorityReference | None, Field(alias="hiImpactHiUrgency")] = None
+    hi_impact_low_urgency: Annotated[PriorityReference | None, Field(alias="hiImpactLowUrgency")] = None
+    hi_impact_med_urgency: Annotated[PriorityReference | None, Field(alias="hiImpactMedUrgency")] = None
+    id: int | None = None
+    low_impact_hi_urgency: Annotated[PriorityReference | None, Field(alias="lowImpactHiUrgency")] = None
+    low_impact_low_urgency: Annotated[PriorityReference | None, Field(alias="lowImpactLowUrgency")] = None
+    low_impact_med_urgency: Annotated[PriorityReference | None, Field(alias="lowImpactMedUrgency")] = None
+    med_impact_hi_urgency: Annotated[PriorityReference | None, Field(alias="medImpactHiUrgency")] = None
+    med_impact_low_urgency: Annotated[PriorityReference | None, Field(alias="medImpactLowUrgency")] = None
+    med_impact_med_urgency: Annotated[PriorityReference | None, Field(alias="medImpactMedUrgency")] = None
+    name: str
+    """
+     Max length: 25;
+    """
+    plan_within: Annotated[float | None, Field(alias="planWithin")] = None
+    plan_within_percent: Annotated[int | None, Field(alias="planWithinPercent")] = None
+    resolution_hours: Annotated[float | None, Field(alias="resolutionHours")] = None
+    resolution_percent: Annotated[int | None, Field(alias="resolutionPercent")] = None
+    respond_hours: Annotated[float | None, Field(alias="respondHours")] = None
+    respond_percent: Annotated[int | None, Field(alias="respondPercent")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.calendar_reference import CalendarReference
+from pyconnectwise.models.manage.priority_reference import PriorityReference
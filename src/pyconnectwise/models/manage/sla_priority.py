@@ -0,0 +1,28 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SLAPriority(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    plan_within: Annotated[float | None, Field(alias="planWithin")] = None
+    plan_within_percent: Annotated[int | None, Field(alias="planWithinPercent")] = None
+    priority: PriorityReference | None = None
+    resolution_hours: Annotated[float | None, Field(alias="resolutionHours")] = None
+    resolution_percent: Annotated[int | None, Field(alias="resolutionPercent")] = None
+    respond_hours: Annotated[float | None, Field(alias="respondHours")] = None
+    respond_percent: Annotated[int | None, Field(alias="respondPercent")] = None
+    sla: SLAReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.priority_reference import PriorityReference
+from pyconnectwise.models.manage.sla_reference import SLAReference
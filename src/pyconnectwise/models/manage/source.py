@@ -0,0 +1,23 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Source(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    date_entered: Annotated[datetime | None, Field(alias="dateEntered")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    entered_by: Annotated[str | None, Field(alias="enteredBy")] = None
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
@@ -0,0 +1,83 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SsoConfiguration(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    all_members_submitted: Annotated[bool | None, Field(alias="allMembersSubmitted")] = None
+    client_id: Annotated[str | None, Field(alias="clientId")] = None
+    """
+    Client identity for this configuration of ConnectWise SSO Max length: 1000;
+    """
+    id: int | None = None
+    """
+    Unique identifier of the SSO Configuration
+    """
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    """
+    Whether the SSO configuration is not active
+    """
+    is_sso_on_by_default: Annotated[bool | None, Field(alias="isSsoOnByDefault")] = None
+    location_ids: Annotated[list[int], Field(alias="locationIds")]
+    """
+    The locations where the SAML Idp Configuration is used
+    """
+    name: str
+    """
+    Descriptor of the SSO Configuration Max length: 100;
+    """
+    saml_certificate_issued_to: Annotated[str | None, Field(alias="samlCertificateIssuedTo")] = None
+    """
+    Who the SAML certificate was issued to. Metadata on SAML_Idp_Certificate
+    """
+    saml_certificate_name: Annotated[str | None, Field(alias="samlCertificateName")] = None
+    """
+    Name of the SAML certificate. Metadata on SAML_Idp_Certificate
+    """
+    saml_certificate_thumbprint: Annotated[str | None, Field(alias="samlCertificateThumbprint")] = None
+    """
+    Thumbprint of the SAML certificate. Metadata on SAML_Idp_Certificate
+    """
+    saml_certificate_valid_from: Annotated[datetime | None, Field(alias="samlCertificateValidFrom")] = None
+    """
+    Date when the SAML certificate becomes valid. Metadata on SAML_Idp_Certificate
+    """
+    saml_certificate_valid_to: Annotated[datetime | None, Field(alias="samlCertificateValidTo")] = None
+    """
+    Date when the SAML certificate is no longer valid. Metadata on SAML_Idp_Certificate
+    """
+    saml_entity_id: Annotated[str | None, Field(alias="samlEntityId")] = None
+    """
+    SAML Identity Provider Id Max length: 1000;
+    """
+    saml_idp_certificate: Annotated[str | None, Field(alias="samlIdpCertificate")] = None
+    """
+    Public certificate for Identity Provider signatures
+    """
+    saml_sign_in_url: Annotated[str | None, Field(alias="samlSignInUrl")] = None
+    """
+    Sign in url for the SAML Identity Provider Max length: 1000;
+    """
+    sso_type: Annotated[Literal["CWSSO", "SAML"], Field(alias="ssoType")]
+    """
+    Type of SSO Configuration
+    """
+    sts_base_url: Annotated[str | None, Field(alias="stsBaseUrl")] = None
+    """
+    Sign in URL for ConnectWise SSO
+    """
+    sts_user_admin_url: Annotated[str | None, Field(alias="stsUserAdminUrl")] = None
+    """
+    User Admin Url for ConnectWise SSO
+    """
+    submitted_member_count: Annotated[int | None, Field(alias="submittedMemberCount")] = None
+    token: str | None = None
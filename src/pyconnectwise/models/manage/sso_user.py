@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SsoUser(ConnectWiseModel):
+    date_entered: Annotated[datetime | None, Field(alias="dateEntered")] = None
+    disabled_flag: Annotated[bool | None, Field(alias="disabledFlag")] = None
+    email: str | None = None
+    email_confirmed: Annotated[bool | None, Field(alias="emailConfirmed")] = None
+    first_name: Annotated[str | None, Field(alias="firstName")] = None
+    id: int | None = None
+    last_name: Annotated[str | None, Field(alias="lastName")] = None
+    last_updated: Annotated[datetime | None, Field(alias="lastUpdated")] = None
+    linked_flag: Annotated[bool | None, Field(alias="linkedFlag")] = None
+    linked_member: Annotated[MemberReference | None, Field(alias="linkedMember")] = None
+    sso_user_id: Annotated[str | None, Field(alias="ssoUserId")] = None
+    user_name: Annotated[str | None, Field(alias="userName")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
@@ -0,0 +1,45 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SurveyQuestion(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    entry_type: Annotated[Literal["Date", "EntryField", "List", "Option"], Field(alias="entryType")]
+    field_type: Annotated[
+        Literal[
+            "TextArea",
+            "Button",
+            "Currency",
+            "Date",
+            "Hyperlink",
+            "IPAddress",
+            "Checkbox",
+            "Number",
+            "Percent",
+            "Text",
+            "Password",
+        ],
+        Field(alias="fieldType"),
+    ]
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    number_of_decimals: Annotated[int | None, Field(alias="numberOfDecimals")] = None
+    question: str
+    """
+     Max length: 1000;
+    """
+    required_flag: Annotated[bool | None, Field(alias="requiredFlag")] = None
+    sequence_number: Annotated[float, Field(alias="sequenceNumber")]
+    survey: SurveyReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.survey_reference import SurveyReference
@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SurveyQuestionValue(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    point_value: Annotated[int | None, Field(alias="pointValue")] = None
+    question: SurveyQuestionReference | None = None
+    survey: SurveyReference | None = None
+    value: str
+    """
+     Max length: 1000;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.survey_question_reference import SurveyQuestionReference
+from pyconnectwise.models.manage.survey_reference import SurveyReference
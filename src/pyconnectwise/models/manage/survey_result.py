@@ -0,0 +1,30 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SurveyResult(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    contact_me_flag: Annotated[bool | None, Field(alias="contactMeFlag")] = None
+    email_address: Annotated[str | None, Field(alias="emailAddress")] = None
+    footer_response: Annotated[str | None, Field(alias="footerResponse")] = None
+    id: int | None = None
+    results: list[SurveyResultDetail] | None = None
+    survey_id: Annotated[int | None, Field(alias="surveyId")] = None
+    ticket_id: Annotated[int, Field(alias="ticketId")]
+    total_points: Annotated[int | None, Field(alias="totalPoints")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.survey_result_detail import SurveyResultDetail
@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Any
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class SurveyResultDetail(ConnectWiseModel):
+    answer: dict[str, Any] | None = None
+    """
+    If question type is Selection, this should be the option array index
+    """
+    question_id: Annotated[int | None, Field(alias="questionId")] = None
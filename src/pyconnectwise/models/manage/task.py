@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Task(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    child_schedule_action: Annotated[
+        Literal["Transfer", "Delete", "Done"] | None, Field(alias="childScheduleAction")
+    ] = None
+    child_ticket_id: Annotated[int | None, Field(alias="childTicketId")] = None
+    closed_flag: Annotated[bool | None, Field(alias="closedFlag")] = None
+    code: ServiceCodeReference | None = None
+    id: int | None = None
+    notes: str | None = None
+    priority: int | None = None
+    resolution: str | None = None
+    schedule: ScheduleEntryReference | None = None
+    ticket_id: Annotated[int | None, Field(alias="ticketId")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.schedule_entry_reference import ScheduleEntryReference
+from pyconnectwise.models.manage.service_code_reference import ServiceCodeReference
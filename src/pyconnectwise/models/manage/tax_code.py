@@ -0,0 +1,182 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxCode(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_all_expense_types: Annotated[bool | None, Field(alias="addAllExpenseTypes")] = None
+    add_all_product_types: Annotated[bool | None, Field(alias="addAllProductTypes")] = None
+    add_all_work_roles: Annotated[bool | None, Field(alias="addAllWorkRoles")] = None
+    canada_calculate_gst_flag: Annotated[bool | None, Field(alias="canadaCalculateGSTFlag")] = None
+    cancel_date: Annotated[datetime | None, Field(alias="cancelDate")] = None
+    country: CountryReference | None = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    description: str
+    """
+     Max length: 50;
+    """
+    display_on_invoice_flag: Annotated[bool | None, Field(alias="displayOnInvoiceFlag")] = None
+    effective_date: Annotated[datetime, Field(alias="effectiveDate")]
+    expense_type_ids: Annotated[list[int] | None, Field(alias="expenseTypeIds")] = None
+    """
+    Array of expense type exemptions for the tax code
+    """
+    id: int | None = None
+    identifier: str
+    """
+     Max length: 8;
+    """
+    invoice_caption: Annotated[str, Field(alias="invoiceCaption")]
+    """
+     Max length: 25;
+    """
+    level_five_agency_xref: Annotated[str | None, Field(alias="levelFiveAgencyXref")] = None
+    """
+     Max length: 100;
+    """
+    level_five_apply_single_unit_flag: Annotated[bool | None, Field(alias="levelFiveApplySingleUnitFlag")] = None
+    level_five_apply_single_unit_max: Annotated[float | None, Field(alias="levelFiveApplySingleUnitMax")] = None
+    level_five_apply_single_unit_min: Annotated[float | None, Field(alias="levelFiveApplySingleUnitMin")] = None
+    level_five_caption: Annotated[str | None, Field(alias="levelFiveCaption")] = None
+    """
+     Max length: 25;
+    """
+    level_five_expenses_flag: Annotated[bool | None, Field(alias="levelFiveExpensesFlag")] = None
+    level_five_products_flag: Annotated[bool | None, Field(alias="levelFiveProductsFlag")] = None
+    level_five_rate: Annotated[float | None, Field(alias="levelFiveRate")] = None
+    level_five_rate_type: Annotated[Literal["Amount", "Percent"] | None, Field(alias="levelFiveRateType")] = None
+    level_five_services_flag: Annotated[bool | None, Field(alias="levelFiveServicesFlag")] = None
+    level_five_tax_code_xref: Annotated[str | None, Field(alias="levelFiveTaxCodeXref")] = None
+    """
+     Max length: 50;
+    """
+    level_five_taxable_max: Annotated[float | None, Field(alias="levelFiveTaxableMax")] = None
+    level_four_agency_xref: Annotated[str | None, Field(alias="levelFourAgencyXref")] = None
+    """
+     Max length: 100;
+    """
+    level_four_apply_single_unit_flag: Annotated[bool | None, Field(alias="levelFourApplySingleUnitFlag")] = None
+    level_four_apply_single_unit_max: Annotated[float | None, Field(alias="levelFourApplySingleUnitMax")] = None
+    level_four_apply_single_unit_min: Annotated[float | None, Field(alias="levelFourApplySingleUnitMin")] = None
+    level_four_caption: Annotated[str | None, Field(alias="levelFourCaption")] = None
+    """
+     Max length: 25;
+    """
+    level_four_expenses_flag: Annotated[bool | None, Field(alias="levelFourExpensesFlag")] = None
+    level_four_products_flag: Annotated[bool | None, Field(alias="levelFourProductsFlag")] = None
+    level_four_rate: Annotated[float | None, Field(alias="levelFourRate")] = None
+    level_four_rate_type: Annotated[Literal["Amount", "Percent"] | None, Field(alias="levelFourRateType")] = None
+    level_four_services_flag: Annotated[bool | None, Field(alias="levelFourServicesFlag")] = None
+    level_four_tax_code_xref: Annotated[str | None, Field(alias="levelFourTaxCodeXref")] = None
+    """
+     Max length: 50;
+    """
+    level_four_taxable_max: Annotated[float | None, Field(alias="levelFourTaxableMax")] = None
+    level_one_agency_xref: Annotated[str | None, Field(alias="levelOneAgencyXref")] = None
+    """
+     Max length: 100;
+    """
+    level_one_apply_single_unit_flag: Annotated[bool | None, Field(alias="levelOneApplySingleUnitFlag")] = None
+    level_one_apply_single_unit_max: Annotated[float | None, Field(alias="levelOneApplySingleUnitMax")] = None
+    level_one_apply_single_unit_min: Annotated[float | None, Field(alias="levelOneApplySingleUnitMin")] = None
+    level_one_caption: Annotated[str | None, Field(alias="levelOneCaption")] = None
+    """
+     Max length: 25;
+    """
+    level_one_expenses_flag: Annotated[bool | None, Field(alias="levelOneExpensesFlag")] = None
+    level_one_products_flag: Annotated[bool | None, Field(alias="levelOneProductsFlag")] = None
+    level_one_rate: Annotated[float | None, Field(alias="levelOneRate")] = None
+    level_one_rate_type: Annotated[Literal["Amount", "Percent"] | None, Field(alias="levelOneRateType")] = None
+    level_one_services_flag: Annotated[bool | None, Field(alias="levelOneServicesFlag")] = None
+    level_one_tax_code_xref: Annotated[str | None, Field(alias="levelOneTaxCodeXref")] = None
+    """
+     Max length: 50;
+    """
+    level_one_taxable_max: Annotated[float | None, Field(alias="levelOneTaxableMax")] = None
+    level_six_agency_xref: Annotated[str | None, Field(alias="levelSixAgencyXref")] = None
+    """
+     Max length: 100;
+    """
+    level_six_apply_single_unit_flag: Annotated[bool | None, Field(alias="levelSixApplySingleUnitFlag")] = None
+    level_six_apply_single_unit_max: Annotated[float | None, Field(alias="levelSixApplySingleUnitMax")] = None
+    level_six_apply_single_unit_min: Annotated[float | None, Field(alias="levelSixApplySingleUnitMin")] = None
+    level_six_caption: Annotated[str | None, Field(alias="levelSixCaption")] = None
+    """
+     Max length: 25;
+    """
+    level_six_expenses_flag: Annotated[bool | None, Field(alias="levelSixExpensesFlag")] = None
+    level_six_products_flag: Annotated[bool | None, Field(alias="levelSixProductsFlag")] = None
+    level_six_rate: Annotated[float | None, Field(alias="levelSixRate")] = None
+    level_six_rate_type: Annotated[Literal["Amount", "Percent"] | None, Field(alias="levelSixRateType")] = None
+    level_six_services_flag: Annotated[bool | None, Field(alias="levelSixServicesFlag")] = None
+    level_six_tax_code_xref: Annotated[str | None, Field(alias="levelSixTaxCodeXref")] = None
+    """
+     Max length: 50;
+    """
+    level_six_taxable_max: Annotated[float | None, Field(alias="levelSixTaxableMax")] = None
+    level_three_agency_xref: Annotated[str | None, Field(alias="levelThreeAgencyXref")] = None
+    """
+     Max length: 100;
+    """
+    level_three_apply_single_unit_flag: Annotated[bool | None, Field(alias="levelThreeApplySingleUnitFlag")] = None
+    level_three_apply_single_unit_max: Annotated[float | None, Field(alias="levelThreeApplySingleUnitMax")] = None
+    level_three_apply_single_unit_min: Annotated[float | None, Field(alias="levelThreeApplySingleUnitMin")] = None
+    level_three_caption: Annotated[str | None, Field(alias="levelThreeCaption")] = None
+    """
+     Max length: 25;
+    """
+    level_three_expenses_flag: Annotated[bool | None, Field(alias="levelThreeExpensesFlag")] = None
+    level_three_products_flag: Annotated[bool | None, Field(alias="levelThreeProductsFlag")] = None
+    level_three_rate: Annotated[float | None, Field(alias="levelThreeRate")] = None
+    level_three_rate_type: Annotated[Literal["Amount", "Percent"] | None, Field(alias="levelThreeRateType")] = None
+    level_three_services_flag: Annotated[bool | None, Field(alias="levelThreeServicesFlag")] = None
+    level_three_tax_code_xref: Annotated[str | None, Field(alias="levelThreeTaxCodeXref")] = None
+    """
+     Max length: 50;
+    """
+    level_three_taxable_max: Annotated[float | None, Field(alias="levelThreeTaxableMax")] = None
+    level_two_agency_xref: Annotated[str | None, Field(alias="levelTwoAgencyXref")] = None
+    """
+     Max length: 100;
+    """
+    level_two_apply_single_unit_flag: Annotated[bool | None, Field(alias="levelTwoApplySingleUnitFlag")] = None
+    level_two_apply_single_unit_max: Annotated[float | None, Field(alias="levelTwoApplySingleUnitMax")] = None
+    level_two_apply_single_unit_min: Annotated[float | None, Field(alias="levelTwoApplySingleUnitMin")] = None
+    level_two_caption: Annotated[str | None, Field(alias="levelTwoCaption")] = None
+    """
+     Max length: 25;
+    """
+    level_two_expenses_flag: Annotated[bool | None, Field(alias="levelTwoExpensesFlag")] = None
+    level_two_products_flag: Annotated[bool | None, Field(alias="levelTwoProductsFlag")] = None
+    level_two_rate: Annotated[float | None, Field(alias="levelTwoRate")] = None
+    level_two_rate_type: Annotated[Literal["Amount", "Percent"] | None, Field(alias="levelTwoRateType")] = None
+    level_two_services_flag: Annotated[bool | None, Field(alias="levelTwoServicesFlag")] = None
+    level_two_tax_code_xref: Annotated[str | None, Field(alias="levelTwoTaxCodeXref")] = None
+    """
+     Max length: 50;
+    """
+    level_two_taxable_max: Annotated[float | None, Field(alias="levelTwoTaxableMax")] = None
+    product_type_ids: Annotated[list[int] | None, Field(alias="productTypeIds")] = None
+    """
+    Array of product type exemptions for the tax code
+    """
+    remove_all_expense_types: Annotated[bool | None, Field(alias="removeAllExpenseTypes")] = None
+    remove_all_product_types: Annotated[bool | None, Field(alias="removeAllProductTypes")] = None
+    remove_all_work_roles: Annotated[bool | None, Field(alias="removeAllWorkRoles")] = None
+    work_role_ids: Annotated[list[int] | None, Field(alias="workRoleIds")] = None
+    """
+    Array of work role exemptions for the tax code
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.country_reference import CountryReference
@@ -0,0 +1,20 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxCodeInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    cancel_date: Annotated[datetime | None, Field(alias="cancelDate")] = None
+    description: str | None = None
+    effective_date: Annotated[datetime | None, Field(alias="effectiveDate")] = None
+    id: int | None = None
+    identifier: str | None = None
@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxCodeLevel(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agency_xref: Annotated[str | None, Field(alias="agencyXref")] = None
+    """
+     Max length: 100;
+    """
+    caption: str | None = None
+    """
+     Max length: 25;
+    """
+    id: int | None = None
+    rate_type: Annotated[Literal["Amount", "Percent"], Field(alias="rateType")]
+    single_unit_flag: Annotated[bool | None, Field(alias="singleUnitFlag")] = None
+    single_unit_maximum: Annotated[float | None, Field(alias="singleUnitMaximum")] = None
+    single_unit_minimum: Annotated[float | None, Field(alias="singleUnitMinimum")] = None
+    tax_code_xref: Annotated[str | None, Field(alias="taxCodeXref")] = None
+    """
+     Max length: 50;
+    """
+    tax_expenses_flag: Annotated[bool | None, Field(alias="taxExpensesFlag")] = None
+    tax_level: Annotated[int | None, Field(alias="taxLevel")] = None
+    tax_products_flag: Annotated[bool | None, Field(alias="taxProductsFlag")] = None
+    tax_rate: Annotated[float, Field(alias="taxRate")]
+    tax_services_flag: Annotated[bool | None, Field(alias="taxServicesFlag")] = None
+    taxable_max: Annotated[float | None, Field(alias="taxableMax")] = None
@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxCodeXRef(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    description: str
+    """
+     Max length: 50;
+    """
+    id: int | None = None
+    level_five: Annotated[Literal["NonTaxable", "Taxable"] | None, Field(alias="levelFive")] = None
+    level_four: Annotated[Literal["NonTaxable", "Taxable"] | None, Field(alias="levelFour")] = None
+    level_one: Annotated[Literal["NonTaxable", "Taxable"] | None, Field(alias="levelOne")] = None
+    level_six: Annotated[Literal["NonTaxable", "Taxable"] | None, Field(alias="levelSix")] = None
+    level_three: Annotated[Literal["NonTaxable", "Taxable"] | None, Field(alias="levelThree")] = None
+    level_two: Annotated[Literal["NonTaxable", "Taxable"] | None, Field(alias="levelTwo")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    taxable_levels: Annotated[list[int] | None, Field(alias="taxableLevels")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
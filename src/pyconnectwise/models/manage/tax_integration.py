@@ -0,0 +1,57 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxIntegration(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    """
+     Max length: 50;
+    """
+    accounting_integration_flag: Annotated[bool | None, Field(alias="accountingIntegrationFlag")] = None
+    commit_transactions_flag: Annotated[bool | None, Field(alias="commitTransactionsFlag")] = None
+    company_code: Annotated[str | None, Field(alias="companyCode")] = None
+    """
+     Max length: 50;
+    """
+    enabled_flag: Annotated[bool | None, Field(alias="enabledFlag")] = None
+    expense_tax_code: Annotated[str | None, Field(alias="expenseTaxCode")] = None
+    """
+     Max length: 50;
+    """
+    freight_tax_code: Annotated[str | None, Field(alias="freightTaxCode")] = None
+    """
+     Max length: 50;
+    """
+    id: int | None = None
+    invoice_amount_tax_code: Annotated[str | None, Field(alias="invoiceAmountTaxCode")] = None
+    """
+     Max length: 50;
+    """
+    license_key: Annotated[str | None, Field(alias="licenseKey")] = None
+    """
+     Max length: 50;
+    """
+    product_tax_code: Annotated[str | None, Field(alias="productTaxCode")] = None
+    """
+     Max length: 50;
+    """
+    sales_invoice_flag: Annotated[bool | None, Field(alias="salesInvoiceFlag")] = None
+    service_url: Annotated[str | None, Field(alias="serviceUrl")] = None
+    """
+     Max length: 250;
+    """
+    tax_integration_type: Annotated[Literal["Avalara"] | None, Field(alias="taxIntegrationType")] = None
+    tax_line_flag: Annotated[bool | None, Field(alias="taxLineFlag")] = None
+    time_tax_code: Annotated[str | None, Field(alias="timeTaxCode")] = None
+    """
+     Max length: 50;
+    """
@@ -0,0 +1,17 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TaxIntegrationInfo(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    enabled_flag: Annotated[bool | None, Field(alias="enabledFlag")] = None
+    id: int | None = None
+    tax_integration_type: Annotated[Literal["Avalara"] | None, Field(alias="taxIntegrationType")] = None
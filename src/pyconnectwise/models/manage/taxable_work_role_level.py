@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+from pyconnectwise.models.manage.taxable_expense_type_level import TaxableExpenseTypeLevel
+
+
+class TaxableWorkRoleLevel(TaxableExpenseTypeLevel):
+    pass
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.tax_code_level_reference import TaxCodeLevelReference
@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Team(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    commission_percent: Annotated[int | None, Field(alias="commissionPercent")] = None
+    id: int | None = None
+    member: MemberReference | None = None
+    opportunity_id: Annotated[int | None, Field(alias="opportunityId")] = None
+    referral_flag: Annotated[bool | None, Field(alias="referralFlag")] = None
+    responsible_flag: Annotated[bool | None, Field(alias="responsibleFlag")] = None
+    sales_team: Annotated[SalesTeamReference | None, Field(alias="salesTeam")] = None
+    type: Literal["Individual", "Team"]
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.sales_team_reference import SalesTeamReference
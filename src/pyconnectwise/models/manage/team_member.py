@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TeamMember(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    board: BoardReference | None = None
+    id: int | None = None
+    member: MemberReference | None = None
+    team: ServiceTeamReference | None = None
+    team_leader_flag: Annotated[bool | None, Field(alias="teamLeaderFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.service_team_reference import ServiceTeamReference
@@ -0,0 +1,22 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TeamRole(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    account_manager_flag: Annotated[bool | None, Field(alias="accountManagerFlag")] = None
+    id: int | None = None
+    name: str
+    """
+     Max length: 20;
+    """
+    sales_flag: Annotated[bool | None, Field(alias="salesFlag")] = None
+    tech_flag: Annotated[bool | None, Field(alias="techFlag")] = None
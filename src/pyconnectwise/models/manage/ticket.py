@@ -0,0 +1,225 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Ticket(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    actual_hours: Annotated[float | None, Field(alias="actualHours")] = None
+    address_line1: Annotated[str | None, Field(alias="addressLine1")] = None
+    """
+     Max length: 50;
+    """
+    address_line2: Annotated[str | None, Field(alias="addressLine2")] = None
+    """
+     Max length: 50;
+    """
+    agreement: AgreementReference | None = None
+    allow_all_clients_portal_view: Annotated[bool | None, Field(alias="allowAllClientsPortalView")] = None
+    approved: bool | None = None
+    automatic_email_cc: Annotated[str | None, Field(alias="automaticEmailCc")] = None
+    """
+     Max length: 1000;
+    """
+    automatic_email_cc_flag: Annotated[bool | None, Field(alias="automaticEmailCcFlag")] = None
+    automatic_email_contact_flag: Annotated[bool | None, Field(alias="automaticEmailContactFlag")] = None
+    automatic_email_resource_flag: Annotated[bool | None, Field(alias="automaticEmailResourceFlag")] = None
+    bill_expenses: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billExpenses")
+    ] = None
+    bill_products: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billProducts")
+    ] = None
+    bill_time: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billTime")
+    ] = None
+    billing_amount: Annotated[float | None, Field(alias="billingAmount")] = None
+    billing_method: Annotated[
+        Literal["ActualRates", "FixedFee", "NotToExceed", "OverrideRate"] | None, Field(alias="billingMethod")
+    ] = None
+    board: BoardReference | None = None
+    budget_hours: Annotated[float | None, Field(alias="budgetHours")] = None
+    city: str | None = None
+    """
+     Max length: 50;
+    """
+    closed_by: Annotated[str | None, Field(alias="closedBy")] = None
+    closed_date: Annotated[datetime | None, Field(alias="closedDate")] = None
+    closed_flag: Annotated[bool | None, Field(alias="closedFlag")] = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    contact_email_address: Annotated[str | None, Field(alias="contactEmailAddress")] = None
+    """
+     Max length: 250;
+    """
+    contact_email_lookup: Annotated[str | None, Field(alias="contactEmailLookup")] = None
+    contact_name: Annotated[str | None, Field(alias="contactName")] = None
+    """
+     Max length: 62;
+    """
+    contact_phone_extension: Annotated[str | None, Field(alias="contactPhoneExtension")] = None
+    """
+     Max length: 15;
+    """
+    contact_phone_number: Annotated[str | None, Field(alias="contactPhoneNumber")] = None
+    """
+     Max length: 20;
+    """
+    country: CountryReference | None = None
+    currency: CurrencyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    customer_updated_flag: Annotated[bool | None, Field(alias="customerUpdatedFlag")] = None
+    date_resolved: Annotated[str | None, Field(alias="dateResolved")] = None
+    date_resplan: Annotated[str | None, Field(alias="dateResplan")] = None
+    date_responded: Annotated[str | None, Field(alias="dateResponded")] = None
+    department: SystemDepartmentReference | None = None
+    duration: int | None = None
+    escalation_level: Annotated[int | None, Field(alias="escalationLevel")] = None
+    escalation_start_date_utc: Annotated[datetime | None, Field(alias="escalationStartDateUTC")] = None
+    estimated_expense_cost: Annotated[float | None, Field(alias="estimatedExpenseCost")] = None
+    estimated_expense_revenue: Annotated[float | None, Field(alias="estimatedExpenseRevenue")] = None
+    estimated_product_cost: Annotated[float | None, Field(alias="estimatedProductCost")] = None
+    estimated_product_revenue: Annotated[float | None, Field(alias="estimatedProductRevenue")] = None
+    estimated_start_date: Annotated[datetime | None, Field(alias="estimatedStartDate")] = None
+    estimated_time_cost: Annotated[float | None, Field(alias="estimatedTimeCost")] = None
+    estimated_time_revenue: Annotated[float | None, Field(alias="estimatedTimeRevenue")] = None
+    external_x_ref: Annotated[str | None, Field(alias="externalXRef")] = None
+    """
+     Max length: 100;
+    """
+    has_child_ticket: Annotated[bool | None, Field(alias="hasChildTicket")] = None
+    has_merged_child_ticket_flag: Annotated[bool | None, Field(alias="hasMergedChildTicketFlag")] = None
+    hourly_rate: Annotated[float | None, Field(alias="hourlyRate")] = None
+    id: int | None = None
+    impact: Literal["Low", "Medium", "High"] | None = None
+    """
+     Required On Updates;
+    """
+    initial_description: Annotated[str | None, Field(alias="initialDescription")] = None
+    """
+    Only available for POST, will not be returned in the response
+    """
+    initial_description_from: Annotated[str | None, Field(alias="initialDescriptionFrom")] = None
+    initial_internal_analysis: Annotated[str | None, Field(alias="initialInternalAnalysis")] = None
+    """
+    Only available for POST, will not be returned in the response
+    """
+    initial_resolution: Annotated[str | None, Field(alias="initialResolution")] = None
+    """
+    Only available for POST, will not be returned in the response
+    """
+    integrator_tags: Annotated[list[str] | None, Field(alias="integratorTags")] = None
+    is_in_sla: Annotated[bool | None, Field(alias="isInSla")] = None
+    item: ServiceItemReference | None = None
+    knowledge_base_category_id: Annotated[int | None, Field(alias="knowledgeBaseCategoryId")] = None
+    knowledge_base_link_id: Annotated[int | None, Field(alias="knowledgeBaseLinkId")] = None
+    knowledge_base_link_type: Annotated[
+        Literal["Activity", "ProjectIssue", "KnowledgeBaseArticle", "ProjectTicket", "ServiceTicket", "Time"] | None,
+        Field(alias="knowledgeBaseLinkType"),
+    ] = None
+    knowledge_base_sub_category_id: Annotated[int | None, Field(alias="knowledgeBaseSubCategoryId")] = None
+    lag_days: Annotated[int | None, Field(alias="lagDays")] = None
+    lag_nonworking_days_flag: Annotated[bool | None, Field(alias="lagNonworkingDaysFlag")] = None
+    location: SystemLocationReference | None = None
+    merged_parent_ticket: Annotated[TicketReference | None, Field(alias="mergedParentTicket")] = None
+    minutes_before_waiting: Annotated[int | None, Field(alias="minutesBeforeWaiting")] = None
+    mobile_guid: Annotated[UUID | None, Field(alias="mobileGuid")] = None
+    opportunity: OpportunityReference | None = None
+    owner: MemberReference | None = None
+    parent_ticket_id: Annotated[int | None, Field(alias="parentTicketId")] = None
+    po_number: Annotated[str | None, Field(alias="poNumber")] = None
+    """
+     Max length: 50;
+    """
+    predecessor_closed_flag: Annotated[bool | None, Field(alias="predecessorClosedFlag")] = None
+    predecessor_id: Annotated[int | None, Field(alias="predecessorId")] = None
+    predecessor_type: Annotated[Literal["Ticket", "Phase"] | None, Field(alias="predecessorType")] = None
+    priority: PriorityReference | None = None
+    process_notifications: Annotated[bool | None, Field(alias="processNotifications")] = None
+    """
+    Can be set to false to skip notification processing when adding or updating a ticket (Defaults to True)
+    """
+    record_type: Annotated[
+        Literal["ProjectIssue", "ProjectTicket", "ServiceTicket"] | None, Field(alias="recordType")
+    ] = None
+    request_for_change_flag: Annotated[bool | None, Field(alias="requestForChangeFlag")] = None
+    required_date: Annotated[datetime | None, Field(alias="requiredDate")] = None
+    res_plan_minutes: Annotated[int | None, Field(alias="resPlanMinutes")] = None
+    resolve_minutes: Annotated[int | None, Field(alias="resolveMinutes")] = None
+    resources: str | None = None
+    resplan_skipped_minutes: Annotated[int | None, Field(alias="resplanSkippedMinutes")] = None
+    respond_minutes: Annotated[int | None, Field(alias="respondMinutes")] = None
+    responded_skipped_minutes: Annotated[int | None, Field(alias="respondedSkippedMinutes")] = None
+    service_location: Annotated[ServiceLocationReference | None, Field(alias="serviceLocation")] = None
+    severity: Literal["Low", "Medium", "High"] | None = None
+    """
+     Required On Updates;
+    """
+    site: SiteReference | None = None
+    site_name: Annotated[str | None, Field(alias="siteName")] = None
+    """
+     Max length: 50;
+    """
+    skip_callback: Annotated[bool | None, Field(alias="skipCallback")] = None
+    sla: SLAReference | None = None
+    sla_status: Annotated[str | None, Field(alias="slaStatus")] = None
+    source: ServiceSourceReference | None = None
+    state_identifier: Annotated[str | None, Field(alias="stateIdentifier")] = None
+    """
+     Max length: 50;
+    """
+    status: ServiceStatusReference | None = None
+    sub_billing_amount: Annotated[float | None, Field(alias="subBillingAmount")] = None
+    sub_billing_method: Annotated[
+        Literal["ActualRates", "FixedFee", "NotToExceed", "OverrideRate"] | None, Field(alias="subBillingMethod")
+    ] = None
+    sub_date_accepted: Annotated[str | None, Field(alias="subDateAccepted")] = None
+    sub_type: Annotated[ServiceSubTypeReference | None, Field(alias="subType")] = None
+    summary: str
+    """
+     Max length: 100;
+    """
+    team: ServiceTeamReference | None = None
+    type: ServiceTypeReference | None = None
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+    work_type: Annotated[WorkTypeReference | None, Field(alias="workType")] = None
+    zip: str | None = None
+    """
+     Max length: 12;
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.country_reference import CountryReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.opportunity_reference import OpportunityReference
+from pyconnectwise.models.manage.priority_reference import PriorityReference
+from pyconnectwise.models.manage.service_item_reference import ServiceItemReference
+from pyconnectwise.models.manage.service_location_reference import ServiceLocationReference
+from pyconnectwise.models.manage.service_source_reference import ServiceSourceReference
+from pyconnectwise.models.manage.service_status_reference import ServiceStatusReference
+from pyconnectwise.models.manage.service_sub_type_reference import ServiceSubTypeReference
+from pyconnectwise.models.manage.service_team_reference import ServiceTeamReference
+from pyconnectwise.models.manage.service_type_reference import ServiceTypeReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.sla_reference import SLAReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.ticket_reference import TicketReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
+from pyconnectwise.models.manage.work_type_reference import WorkTypeReference
@@ -0,0 +1,14 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TicketBundle(ConnectWiseModel):
+    child_ticket_ids: Annotated[list[int] | None, Field(alias="childTicketIds")] = None
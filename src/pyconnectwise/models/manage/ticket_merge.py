@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TicketMerge(ConnectWiseModel):
+    merge_ticket_ids: Annotated[list[int], Field(alias="mergeTicketIds")]
+    status: ServiceStatusReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.service_status_reference import ServiceStatusReference
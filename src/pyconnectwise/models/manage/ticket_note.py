@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TicketNote(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    contact: ContactReference | None = None
+    customer_updated_flag: Annotated[bool | None, Field(alias="customerUpdatedFlag")] = None
+    detail_description_flag: Annotated[bool | None, Field(alias="detailDescriptionFlag")] = None
+    external_flag: Annotated[bool | None, Field(alias="externalFlag")] = None
+    id: int | None = None
+    internal_analysis_flag: Annotated[bool | None, Field(alias="internalAnalysisFlag")] = None
+    internal_flag: Annotated[bool | None, Field(alias="internalFlag")] = None
+    issue_flag: Annotated[bool | None, Field(alias="issueFlag")] = None
+    member: MemberReference | None = None
+    process_notifications: Annotated[bool | None, Field(alias="processNotifications")] = None
+    resolution_flag: Annotated[bool | None, Field(alias="resolutionFlag")] = None
+    text: str | None = None
+    ticket_id: Annotated[int | None, Field(alias="ticketId")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.member_reference import MemberReference
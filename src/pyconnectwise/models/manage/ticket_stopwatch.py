@@ -0,0 +1,54 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TicketStopwatch(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    agreement: AgreementReference | None = None
+    billable_option: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billableOption")
+    ] = None
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    date_entered: Annotated[datetime | None, Field(alias="dateEntered")] = None
+    email_notes_to_contact_flag: Annotated[bool | None, Field(alias="emailNotesToContactFlag")] = None
+    email_notes_to_resources_flag: Annotated[bool | None, Field(alias="emailNotesToResourcesFlag")] = None
+    end_time: Annotated[datetime | None, Field(alias="endTime")] = None
+    id: int | None = None
+    internal_notes: Annotated[str | None, Field(alias="internalNotes")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    member: MemberReference | None = None
+    mobile_guid: Annotated[UUID | None, Field(alias="mobileGuid")] = None
+    notes: str | None = None
+    """
+     Max length: 4000;
+    """
+    service_status: Annotated[ServiceStatusReference | None, Field(alias="serviceStatus")] = None
+    show_notes_in_discussion_flag: Annotated[bool | None, Field(alias="showNotesInDiscussionFlag")] = None
+    show_notes_in_internal_flag: Annotated[bool | None, Field(alias="showNotesInInternalFlag")] = None
+    show_notes_in_resolution_flag: Annotated[bool | None, Field(alias="showNotesInResolutionFlag")] = None
+    start_time: Annotated[datetime | None, Field(alias="startTime")] = None
+    status: Literal["Reset", "Running", "Paused", "Stopped"]
+    ticket: TicketReference | None = None
+    ticket_mobile_guid: Annotated[UUID | None, Field(alias="ticketMobileGuid")] = None
+    total_pause_time: Annotated[int | None, Field(alias="totalPauseTime")] = None
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+    work_type: Annotated[WorkTypeReference | None, Field(alias="workType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.service_status_reference import ServiceStatusReference
+from pyconnectwise.models.manage.ticket_reference import TicketReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
+from pyconnectwise.models.manage.work_type_reference import WorkTypeReference
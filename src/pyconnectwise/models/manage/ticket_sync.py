@@ -0,0 +1,34 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TicketSync(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    company: CompanyReference | None = None
+    id: int | None = None
+    integrator_login: Annotated[IntegratorLoginReference | None, Field(alias="integratorLogin")] = None
+    internal_analysis_flag: Annotated[bool | None, Field(alias="internalAnalysisFlag")] = None
+    name: str
+    """
+     Max length: 80;
+    """
+    password: str | None = None
+    problem_description_flag: Annotated[bool | None, Field(alias="problemDescriptionFlag")] = None
+    psg: str | None = None
+    resolution_flag: Annotated[bool | None, Field(alias="resolutionFlag")] = None
+    url: str
+    user_name: Annotated[str | None, Field(alias="userName")] = None
+    vendor_type: Annotated[Literal["Zenith"], Field(alias="vendorType")]
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.integrator_login_reference import IntegratorLoginReference
@@ -0,0 +1,56 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeAccrual(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    holiday_available_type: Annotated[
+        Literal["AnniversaryYear", "CalendarYear"] | None, Field(alias="holidayAvailableType")
+    ] = None
+    holiday_carryover_allowed_flag: Annotated[bool | None, Field(alias="holidayCarryoverAllowedFlag")] = None
+    holiday_carryover_limit: Annotated[float | None, Field(alias="holidayCarryoverLimit")] = None
+    holiday_flag: Annotated[bool | None, Field(alias="holidayFlag")] = None
+    """
+    if holidayFlag is set to false, system will clear out or ignore the values of holidayAvailableType, holidayCarryoverAllowedFlag, holidayCarryoverLimit
+    """
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    pto_available_type: Annotated[
+        Literal["AnniversaryYear", "CalendarYear"] | None, Field(alias="ptoAvailableType")
+    ] = None
+    pto_carryover_allowed_flag: Annotated[bool | None, Field(alias="ptoCarryoverAllowedFlag")] = None
+    pto_carryover_limit: Annotated[float | None, Field(alias="ptoCarryoverLimit")] = None
+    pto_flag: Annotated[bool | None, Field(alias="ptoFlag")] = None
+    """
+    if ptoFlag is set to false, system will clear out or ignore the values of ptoAvailableType, ptoCarryoverAllowedFlag, ptoCarryoverLimit
+    """
+    sick_available_type: Annotated[
+        Literal["AnniversaryYear", "CalendarYear"] | None, Field(alias="sickAvailableType")
+    ] = None
+    sick_carryover_allowed_flag: Annotated[bool | None, Field(alias="sickCarryoverAllowedFlag")] = None
+    sick_carryover_limit: Annotated[float | None, Field(alias="sickCarryoverLimit")] = None
+    sick_flag: Annotated[bool | None, Field(alias="sickFlag")] = None
+    """
+    if sickFlag is set to false, system will clear out or ignore the values of sickAvailableType, sickCarryoverAllowedFlag, sickCarryoverLimit
+    """
+    vacation_available_type: Annotated[
+        Literal["AnniversaryYear", "CalendarYear"] | None, Field(alias="vacationAvailableType")
+    ] = None
+    vacation_carryover_allowed_flag: Annotated[bool | None, Field(alias="vacationCarryoverAllowedFlag")] = None
+    vacation_carryover_limit: Annotated[float | None, Field(alias="vacationCarryoverLimit")] = None
+    vacation_flag: Annotated[bool | None, Field(alias="vacationFlag")] = None
+    """
+    if vacationFlag is set to false, system will clear out or ingore the values of vacationAvailableType, vacationCarryoverAllowedFlag, vacationCarryoverLimit
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
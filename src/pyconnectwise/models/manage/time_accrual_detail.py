@@ -0,0 +1,27 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeAccrualDetail(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    accrual_type: Annotated[Literal["Holiday", "PTO", "Sick", "Vacation"], Field(alias="accrualType")]
+    """
+    Available types are: Holiday, PTO, Sick and Vacation.
+    """
+    end_year: Annotated[int, Field(alias="endYear")]
+    hours: float
+    id: int | None = None
+    start_year: Annotated[int, Field(alias="startYear")]
+    time_accrual: Annotated[TimeAccrualReference | None, Field(alias="timeAccrual")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.time_accrual_reference import TimeAccrualReference
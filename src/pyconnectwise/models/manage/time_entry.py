@@ -0,0 +1,111 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+from uuid import UUID
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeEntry(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    actual_hours: Annotated[float | None, Field(alias="actualHours")] = None
+    add_to_detail_description_flag: Annotated[bool | None, Field(alias="addToDetailDescriptionFlag")] = None
+    add_to_internal_analysis_flag: Annotated[bool | None, Field(alias="addToInternalAnalysisFlag")] = None
+    add_to_resolution_flag: Annotated[bool | None, Field(alias="addToResolutionFlag")] = None
+    agreement: AgreementReference | None = None
+    agreement_amount: Annotated[float | None, Field(alias="agreementAmount")] = None
+    agreement_hours: Annotated[float | None, Field(alias="agreementHours")] = None
+    billable_option: Annotated[
+        Literal["Billable", "DoNotBill", "NoCharge", "NoDefault"] | None, Field(alias="billableOption")
+    ] = None
+    """
+     Required On Updates;
+    """
+    business_unit_id: Annotated[int | None, Field(alias="businessUnitId")] = None
+    charge_to_id: Annotated[int | None, Field(alias="chargeToId")] = None
+    """
+    If chargeToId is not specified, we asume you enter time against the company specified
+    """
+    charge_to_type: Annotated[
+        Literal["ServiceTicket", "ProjectTicket", "ChargeCode", "Activity"] | None, Field(alias="chargeToType")
+    ] = None
+    """
+    If chargeToId is not specified, we asume you enter time against the company specified
+    """
+    company: CompanyReference | None = None
+    custom_fields: Annotated[list[CustomFieldValue] | None, Field(alias="customFields")] = None
+    date_entered: Annotated[datetime | None, Field(alias="dateEntered")] = None
+    email_cc: Annotated[str | None, Field(alias="emailCc")] = None
+    """
+    To update this value use the /service/tickets endpoint automaticEmailCc field
+    """
+    email_cc_flag: Annotated[bool | None, Field(alias="emailCcFlag")] = None
+    """
+    This is an action flag. To update this value use the /service/tickets endpoint automaticEmailCcFlag field
+    """
+    email_contact_flag: Annotated[bool | None, Field(alias="emailContactFlag")] = None
+    """
+    This is an action flag. To update this value use the /service/tickets endpoint automaticEmailContactFlag field
+    """
+    email_resource_flag: Annotated[bool | None, Field(alias="emailResourceFlag")] = None
+    """
+    This is an action flag. To update this value use the /service/tickets endpoint automaticEmailResourceFlag field
+    """
+    entered_by: Annotated[str | None, Field(alias="enteredBy")] = None
+    hourly_rate: Annotated[float | None, Field(alias="hourlyRate")] = None
+    """
+    This field may only be Updated, it is defaulted on Create
+    """
+    hours_billed: Annotated[float | None, Field(alias="hoursBilled")] = None
+    hours_deduct: Annotated[float | None, Field(alias="hoursDeduct")] = None
+    id: int | None = None
+    internal_notes: Annotated[str | None, Field(alias="internalNotes")] = None
+    invoice: InvoiceReference | None = None
+    invoice_hours: Annotated[float | None, Field(alias="invoiceHours")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    member: MemberReference | None = None
+    mobile_guid: Annotated[UUID | None, Field(alias="mobileGuid")] = None
+    notes: str | None = None
+    overage_rate: Annotated[float | None, Field(alias="overageRate")] = None
+    phase: ProjectPhaseReference | None = None
+    project: ProjectReference | None = None
+    status: Literal[
+        "Open",
+        "Rejected",
+        "PendingApproval",
+        "ErrorsCorrected",
+        "PendingProjectApproval",
+        "ApprovedByTierOne",
+        "RejectBySecondTier",
+        "ApprovedByTierTwo",
+        "ReadyToBill",
+        "Billed",
+        "WrittenOff",
+        "BilledAgreement",
+    ] | None = None
+    ticket: TicketReference | None = None
+    time_end: Annotated[datetime | None, Field(alias="timeEnd")] = None
+    time_sheet: Annotated[TimeSheetReference | None, Field(alias="timeSheet")] = None
+    time_start: Annotated[datetime, Field(alias="timeStart")]
+    work_role: Annotated[WorkRoleReference | None, Field(alias="workRole")] = None
+    work_type: Annotated[WorkTypeReference | None, Field(alias="workType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.custom_field_value import CustomFieldValue
+from pyconnectwise.models.manage.invoice_reference import InvoiceReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.project_phase_reference import ProjectPhaseReference
+from pyconnectwise.models.manage.project_reference import ProjectReference
+from pyconnectwise.models.manage.ticket_reference import TicketReference
+from pyconnectwise.models.manage.time_sheet_reference import TimeSheetReference
+from pyconnectwise.models.manage.work_role_reference import WorkRoleReference
+from pyconnectwise.models.manage.work_type_reference import WorkTypeReference
@@ -0,0 +1,144 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeEntryAudit(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    member: MemberReference | None = None
+    message: str | None = None
+    new_value: Annotated[str | None, Field(alias="newValue")] = None
+    old_value: Annotated[str | None, Field(alias="oldValue")] = None
+    source: Literal[
+        "None",
+        "Member",
+        "API",
+        "Workflow",
+        "Portal",
+        "Mobile",
+        "Network",
+        "EmailConnector",
+        "MassMaintenance",
+        "Application",
+        "SystemAPI",
+        "Conversion",
+    ] | None = None
+    type: Literal[
+        "Activity",
+        "CloseDate",
+        "Company",
+        "Contact",
+        "Conversion",
+        "Document",
+        "Forecast",
+        "Note",
+        "Notes",
+        "Opportunity",
+        "Products",
+        "Stage",
+        "Status",
+        "Surveys",
+        "Team",
+        "Tracks",
+        "Configuration",
+        "ConfigurationQuestions",
+        "DeviceBackupDetails",
+        "Tickets",
+        "Subject",
+        "ActivityOverview",
+        "Schedule",
+        "Resources",
+        "ExpenseEntry",
+        "Member",
+        "Date",
+        "Classification",
+        "Amount",
+        "ExpenseType",
+        "WorkType",
+        "WorkRole",
+        "Mileage",
+        "Billing",
+        "ExpenseHeader",
+        "Project",
+        "TimeEntry",
+        "TicketStatus",
+        "DateTime",
+        "DeductHours",
+        "ActualHours",
+        "Invoice",
+        "CompanyFinance",
+        "Billable",
+        "SalesOrder",
+        "Shipping",
+        "Profile",
+        "Group",
+        "GroupContact",
+        "GroupCompany",
+        "Options",
+        "Site",
+        "Agreement",
+        "Addition",
+        "Adjustment",
+        "API",
+        "ProjectFinance",
+        "CompanyProfile",
+        "CompanyTeam",
+        "CompanyMgmt",
+        "InvoiceTotal",
+        "BillingInformation",
+        "ShippingInformation",
+        "BillingStatus",
+        "Location",
+        "Department",
+        "Territory",
+        "Payment",
+        "Credit",
+        "SubcontractorInformation",
+        "InvoicingParameters",
+        "ApplicationParameters",
+        "Finance",
+        "Invoicing",
+        "Email",
+        "Batching",
+        "KnowledgeBase",
+        "KbArticle",
+        "KnowledgeBaseApproval",
+        "KnowledgeBaseTicket",
+        "ManageNetwork",
+        "Tasks",
+        "CustomField",
+        "ScreenConnect",
+        "SLA",
+        "Ticket",
+        "Workflow",
+        "Record",
+        "CombinedTickets",
+        "Template",
+        "PurchaseOrder",
+        "Meeting",
+        "RmaOverview",
+        "ReturnedBy",
+        "PurchasedFromVendor",
+        "WarrantyVendor",
+        "RepairVendor",
+        "AdditionalDetails",
+        "TicketTemplate",
+        "AutoGeneration",
+        "TimeInternalNote",
+        "TimeDiscussion",
+        "TimeInternal",
+        "TimeResolution",
+    ] | None = None
+    value: str | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
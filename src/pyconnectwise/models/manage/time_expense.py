@@ -0,0 +1,31 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeExpense(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    default_special_invoice_type: Annotated[
+        Literal["Agreement", "CreditMemo", "DownPayment", "Miscellaneous", "Progress", "Standard"] | None,
+        Field(alias="defaultSpecialInvoiceType"),
+    ] = None
+    disable_time_entry_flag: Annotated[bool | None, Field(alias="disableTimeEntryFlag")] = None
+    id: int | None = None
+    internal_company: Annotated[CompanyReference | None, Field(alias="internalCompany")] = None
+    invoice_start: Annotated[int | None, Field(alias="invoiceStart")] = None
+    require_expense_note_flag: Annotated[bool | None, Field(alias="requireExpenseNoteFlag")] = None
+    require_time_note_flag: Annotated[bool | None, Field(alias="requireTimeNoteFlag")] = None
+    rounding_factor: Annotated[float | None, Field(alias="roundingFactor")] = None
+    tier1_approval_flag: Annotated[bool | None, Field(alias="tier1ApprovalFlag")] = None
+    tier2_approval_flag: Annotated[bool | None, Field(alias="tier2ApprovalFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
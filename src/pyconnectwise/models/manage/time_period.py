@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimePeriod(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    deadline_date: Annotated[datetime | None, Field(alias="deadlineDate")] = None
+    end_date: Annotated[datetime | None, Field(alias="endDate")] = None
+    id: int | None = None
+    period: int | None = None
+    start_date: Annotated[datetime | None, Field(alias="startDate")] = None
+    time_period_setup: Annotated[TimePeriodSetupReference | None, Field(alias="timePeriodSetup")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.time_period_setup_reference import TimePeriodSetupReference
@@ -0,0 +1,43 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import date
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimePeriodSetup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    days_past_end_date: Annotated[int, Field(alias="daysPastEndDate")]
+    description: str | None = None
+    """
+     Max length: 100;
+    """
+    first_period_end_date: Annotated[date, Field(alias="firstPeriodEndDate")]
+    id: int | None = None
+    last_day_flag: Annotated[bool | None, Field(alias="lastDayFlag")] = None
+    """
+    Only needed when type is monthly
+    """
+    monthly_period_ends: Annotated[int | None, Field(alias="monthlyPeriodEnds")] = None
+    """
+    Only needed when type is monthly
+    """
+    number_future_periods: Annotated[int, Field(alias="numberFuturePeriods")]
+    period_apply_to: Annotated[Literal["Both", "Expense", "Time"], Field(alias="periodApplyTo")]
+    semi_monthly_first_period: Annotated[int | None, Field(alias="semiMonthlyFirstPeriod")] = None
+    """
+    Only needed when type is semi-monthly
+    """
+    semi_monthly_last_day_flag: Annotated[bool | None, Field(alias="semiMonthlyLastDayFlag")] = None
+    semi_monthly_second_period: Annotated[int | None, Field(alias="semiMonthlySecondPeriod")] = None
+    """
+    Only needed when type is semi-monthly
+    """
+    type: Literal["Weekly", "BiWeekly", "SemiMonthly", "Monthly"]
+    year: int
@@ -0,0 +1,41 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeSheet(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    date_end: Annotated[datetime | None, Field(alias="dateEnd")] = None
+    date_start: Annotated[datetime | None, Field(alias="dateStart")] = None
+    deadline: datetime | None = None
+    hours: float | None = None
+    id: int | None = None
+    member: MemberReference | None = None
+    period: int | None = None
+    status: Literal[
+        "Open",
+        "Rejected",
+        "PendingApproval",
+        "ErrorsCorrected",
+        "PendingProjectApproval",
+        "ApprovedByTierOne",
+        "RejectBySecondTier",
+        "ApprovedByTierTwo",
+        "ReadyToBill",
+        "Billed",
+        "WrittenOff",
+        "BilledAgreement",
+    ] | None = None
+    year: int | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.member_reference import MemberReference
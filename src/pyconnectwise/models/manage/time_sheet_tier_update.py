@@ -0,0 +1,29 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeSheetTierUpdate(ConnectWiseModel):
+    approval_type: Annotated[
+        Literal[
+            "DataEntry",
+            "Tier1Update",
+            "Tier2Update",
+            "Billing",
+            "Service",
+            "Project",
+            "MonthlySummary",
+            "SalesActivity",
+            "Schedule",
+        ]
+        | None,
+        Field(alias="approvalType"),
+    ] = None
+    id: int | None = None
@@ -0,0 +1,37 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TimeZoneSetup(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    daylight_savings_flag: Annotated[bool | None, Field(alias="daylightSavingsFlag")] = None
+    """
+    Determined based on system library value for specified timeZone.
+                Not able to be used in query params at this time
+    """
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    """
+    Identifies the default system time zone setup
+    """
+    id: int | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    offset: float | None = None
+    """
+    The hours offset from UTC (+/-)
+    """
+    time_zone: Annotated[TimeZoneReference | None, Field(alias="timeZone")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.time_zone_reference import TimeZoneReference
@@ -0,0 +1,16 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Token(ConnectWiseModel):
+    expiration: str | None = None
+    private_key: Annotated[str | None, Field(alias="privateKey")] = None
+    public_key: Annotated[str | None, Field(alias="publicKey")] = None
@@ -0,0 +1,60 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class TrackAction(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    activity_status: Annotated[ActivityStatusReference | None, Field(alias="activityStatus")] = None
+    activity_type: Annotated[ActivityTypeReference | None, Field(alias="activityType")] = None
+    attached_track: Annotated[TrackReference | None, Field(alias="attachedTrack")] = None
+    bcc_contact: Annotated[ContactReference | None, Field(alias="bccContact")] = None
+    cc_contact: Annotated[ContactReference | None, Field(alias="ccContact")] = None
+    company_status: Annotated[CompanyStatusReference | None, Field(alias="companyStatus")] = None
+    days_to_execute: Annotated[int | None, Field(alias="daysToExecute")] = None
+    email_from: Annotated[str | None, Field(alias="emailFrom")] = None
+    """
+     Max length: 250;
+    """
+    email_recipient: Annotated[str | None, Field(alias="emailRecipient")] = None
+    """
+     Max length: 250;
+    """
+    group: GroupReference | None = None
+    id: int | None = None
+    notes: str | None = None
+    notify_from: Annotated[NotificationRecipientReference | None, Field(alias="notifyFrom")] = None
+    notify_type: Annotated[
+        Literal[
+            "CreateActivity", "SendEmail", "AddToGroup", "AttachTrack", "ChangeCompanyStatus", "CreateServiceTicket"
+        ],
+        Field(alias="notifyType"),
+    ]
+    notify_who: Annotated[NotificationRecipientReference | None, Field(alias="notifyWho")] = None
+    service_template: Annotated[ServiceTemplateReference | None, Field(alias="serviceTemplate")] = None
+    specific_member_from: Annotated[MemberReference | None, Field(alias="specificMemberFrom")] = None
+    specific_member_to: Annotated[MemberReference | None, Field(alias="specificMemberTo")] = None
+    subject: str | None = None
+    """
+     Max length: 100;
+    """
+    track: TrackReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.activity_status_reference import ActivityStatusReference
+from pyconnectwise.models.manage.activity_type_reference import ActivityTypeReference
+from pyconnectwise.models.manage.company_status_reference import CompanyStatusReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.group_reference import GroupReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.notification_recipient_reference import NotificationRecipientReference
+from pyconnectwise.models.manage.service_template_reference import ServiceTemplateReference
+from pyconnectwise.models.manage.track_reference import TrackReference
@@ -0,0 +1,122 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UnpostedExpense(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    agreement: AgreementReference | None = None
+    agreement_amount_covered: Annotated[float | None, Field(alias="agreementAmountCovered")] = None
+    avalara_tax_flag: Annotated[bool | None, Field(alias="avalaraTaxFlag")] = None
+    """
+    Used to determine if Avalara tax is enabled.
+    """
+    billable_amount: Annotated[float | None, Field(alias="billableAmount")] = None
+    charge_code: Annotated[ChargeCodeReference | None, Field(alias="chargeCode")] = None
+    charge_description: Annotated[str | None, Field(alias="chargeDescription")] = None
+    city_tax_amount: Annotated[float | None, Field(alias="cityTaxAmount")] = None
+    city_tax_flag: Annotated[bool | None, Field(alias="cityTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the city level.
+    """
+    city_tax_xref: Annotated[str | None, Field(alias="cityTaxXref")] = None
+    classification: Literal["NonReimbursable", "Reimbursable", "Personal"] | None = None
+    company: CompanyReference | None = None
+    composite_tax_amount: Annotated[float | None, Field(alias="compositeTaxAmount")] = None
+    composite_tax_flag: Annotated[bool | None, Field(alias="compositeTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the composite level.
+    """
+    composite_tax_xref: Annotated[str | None, Field(alias="compositeTaxXref")] = None
+    country_tax_amount: Annotated[float | None, Field(alias="countryTaxAmount")] = None
+    country_tax_flag: Annotated[bool | None, Field(alias="countryTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the country level.
+    """
+    country_tax_xref: Annotated[str | None, Field(alias="countryTaxXref")] = None
+    county_tax_amount: Annotated[float | None, Field(alias="countyTaxAmount")] = None
+    county_tax_flag: Annotated[bool | None, Field(alias="countyTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the county level.
+    """
+    county_tax_xref: Annotated[str | None, Field(alias="countyTaxXref")] = None
+    credit_account: Annotated[str | None, Field(alias="creditAccount")] = None
+    currency: CurrencyReference | None = None
+    date_closed: Annotated[datetime | None, Field(alias="dateClosed")] = None
+    date_expense: Annotated[datetime | None, Field(alias="dateExpense")] = None
+    department_id: Annotated[int | None, Field(alias="departmentId")] = None
+    expense_detail_id: Annotated[int | None, Field(alias="expenseDetailId")] = None
+    expense_type: Annotated[ExpenseTypeReference | None, Field(alias="expenseType")] = None
+    gl_type: Annotated[
+        Literal[
+            "AP",
+            "AR",
+            "EE",
+            "EI",
+            "EO",
+            "IA",
+            "IT",
+            "P",
+            "PF",
+            "R",
+            "RA",
+            "RD",
+            "RE",
+            "RP",
+            "ST",
+            "SD",
+            "ET",
+            "FT",
+            "PT",
+        ]
+        | None,
+        Field(alias="glType"),
+    ] = None
+    id: int | None = None
+    in_policy: Annotated[bool | None, Field(alias="inPolicy")] = None
+    item_taxable_flag: Annotated[bool | None, Field(alias="itemTaxableFlag")] = None
+    level_six_tax_amount: Annotated[float | None, Field(alias="levelSixTaxAmount")] = None
+    level_six_tax_flag: Annotated[bool | None, Field(alias="levelSixTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at level six.
+    """
+    level_six_tax_xref: Annotated[str | None, Field(alias="levelSixTaxXref")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    member: MemberReference | None = None
+    non_billable_amount: Annotated[float | None, Field(alias="nonBillableAmount")] = None
+    payment_method: Annotated[PaymentMethodReference | None, Field(alias="paymentMethod")] = None
+    project: ProjectReference | None = None
+    project_phase: Annotated[ProjectPhaseReference | None, Field(alias="projectPhase")] = None
+    sales_tax_amount: Annotated[float | None, Field(alias="salesTaxAmount")] = None
+    state_tax_amount: Annotated[float | None, Field(alias="stateTaxAmount")] = None
+    state_tax_flag: Annotated[bool | None, Field(alias="stateTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the state level.
+    """
+    state_tax_xref: Annotated[str | None, Field(alias="stateTaxXref")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    ticket: TicketReference | None = None
+    total: float | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.agreement_reference import AgreementReference
+from pyconnectwise.models.manage.charge_code_reference import ChargeCodeReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.expense_type_reference import ExpenseTypeReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.payment_method_reference import PaymentMethodReference
+from pyconnectwise.models.manage.project_phase_reference import ProjectPhaseReference
+from pyconnectwise.models.manage.project_reference import ProjectReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
+from pyconnectwise.models.manage.ticket_reference import TicketReference
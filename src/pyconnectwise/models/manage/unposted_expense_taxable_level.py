@@ -0,0 +1,18 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UnpostedExpenseTaxableLevel(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    id: int | None = None
+    tax_amount: Annotated[float | None, Field(alias="taxAmount")] = None
+    tax_code_xref: Annotated[str | None, Field(alias="taxCodeXref")] = None
+    tax_level: Annotated[int | None, Field(alias="taxLevel")] = None
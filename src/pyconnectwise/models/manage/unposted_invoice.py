@@ -0,0 +1,92 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UnpostedInvoice(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    account_number: Annotated[str | None, Field(alias="accountNumber")] = None
+    avalara_tax_flag: Annotated[bool | None, Field(alias="avalaraTaxFlag")] = None
+    """
+    Used to determine if Avalara tax is enabled.
+    """
+    bill_to_company: Annotated[CompanyReference | None, Field(alias="billToCompany")] = None
+    bill_to_site: Annotated[SiteReference | None, Field(alias="billToSite")] = None
+    billing_log_id: Annotated[int | None, Field(alias="billingLogId")] = None
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    city_tax_amount: Annotated[float | None, Field(alias="cityTaxAmount")] = None
+    city_tax_flag: Annotated[bool | None, Field(alias="cityTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the city level.
+    """
+    city_tax_xref: Annotated[str | None, Field(alias="cityTaxXref")] = None
+    company: CompanyReference | None = None
+    composite_tax_amount: Annotated[float | None, Field(alias="compositeTaxAmount")] = None
+    composite_tax_flag: Annotated[bool | None, Field(alias="compositeTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the composite level.
+    """
+    composite_tax_xref: Annotated[str | None, Field(alias="compositeTaxXref")] = None
+    country_tax_amount: Annotated[float | None, Field(alias="countryTaxAmount")] = None
+    country_tax_flag: Annotated[bool | None, Field(alias="countryTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the country level.
+    """
+    country_tax_xref: Annotated[str | None, Field(alias="countryTaxXref")] = None
+    county_tax_amount: Annotated[float | None, Field(alias="countyTaxAmount")] = None
+    county_tax_flag: Annotated[bool | None, Field(alias="countyTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the county level.
+    """
+    county_tax_xref: Annotated[str | None, Field(alias="countyTaxXref")] = None
+    created_by: Annotated[str | None, Field(alias="createdBy")] = None
+    currency: CurrencyReference | None = None
+    date_closed: Annotated[datetime | None, Field(alias="dateClosed")] = None
+    department_id: Annotated[int | None, Field(alias="departmentId")] = None
+    description: str | None = None
+    due_date: Annotated[datetime | None, Field(alias="dueDate")] = None
+    due_days: Annotated[str | None, Field(alias="dueDays")] = None
+    id: int | None = None
+    invoice_date: Annotated[datetime | None, Field(alias="invoiceDate")] = None
+    invoice_number: Annotated[str | None, Field(alias="invoiceNumber")] = None
+    invoice_taxable_flag: Annotated[bool | None, Field(alias="invoiceTaxableFlag")] = None
+    invoice_type: Annotated[
+        Literal["Agreement", "CreditMemo", "DownPayment", "Miscellaneous", "Progress", "Standard"] | None,
+        Field(alias="invoiceType"),
+    ] = None
+    item_taxable_flag: Annotated[bool | None, Field(alias="itemTaxableFlag")] = None
+    level_six_tax_amount: Annotated[float | None, Field(alias="levelSixTaxAmount")] = None
+    level_six_tax_flag: Annotated[bool | None, Field(alias="levelSixTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at level six.
+    """
+    level_six_tax_xref: Annotated[str | None, Field(alias="levelSixTaxXref")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    sales_tax_amount: Annotated[float | None, Field(alias="salesTaxAmount")] = None
+    ship_to_company: Annotated[CompanyReference | None, Field(alias="shipToCompany")] = None
+    ship_to_site: Annotated[SiteReference | None, Field(alias="shipToSite")] = None
+    state_tax_amount: Annotated[float | None, Field(alias="stateTaxAmount")] = None
+    state_tax_flag: Annotated[bool | None, Field(alias="stateTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the state level.
+    """
+    state_tax_xref: Annotated[str | None, Field(alias="stateTaxXref")] = None
+    sub_total: Annotated[float | None, Field(alias="subTotal")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    total: float | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
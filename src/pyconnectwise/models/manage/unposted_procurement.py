@@ -0,0 +1,90 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UnpostedProcurement(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    avalara_tax_flag: Annotated[bool | None, Field(alias="avalaraTaxFlag")] = None
+    """
+    Used to determine if Avalara tax is enabled.
+    """
+    billing_terms: Annotated[BillingTermsReference | None, Field(alias="billingTerms")] = None
+    city_tax_amount: Annotated[float | None, Field(alias="cityTaxAmount")] = None
+    city_tax_flag: Annotated[bool | None, Field(alias="cityTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the city level.
+    """
+    city_tax_xref: Annotated[str | None, Field(alias="cityTaxXref")] = None
+    composite_tax_amount: Annotated[float | None, Field(alias="compositeTaxAmount")] = None
+    composite_tax_flag: Annotated[bool | None, Field(alias="compositeTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the composite level.
+    """
+    composite_tax_xref: Annotated[str | None, Field(alias="compositeTaxXref")] = None
+    country_tax_amount: Annotated[float | None, Field(alias="countryTaxAmount")] = None
+    country_tax_flag: Annotated[bool | None, Field(alias="countryTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the country level.
+    """
+    country_tax_xref: Annotated[str | None, Field(alias="countryTaxXref")] = None
+    county_tax_amount: Annotated[float | None, Field(alias="countyTaxAmount")] = None
+    county_tax_flag: Annotated[bool | None, Field(alias="countyTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the county level.
+    """
+    county_tax_xref: Annotated[str | None, Field(alias="countyTaxXref")] = None
+    currency: CurrencyReference | None = None
+    customer: CompanyReference | None = None
+    date_closed: Annotated[datetime | None, Field(alias="dateClosed")] = None
+    department_id: Annotated[int | None, Field(alias="departmentId")] = None
+    description: str | None = None
+    freight_cost: Annotated[float | None, Field(alias="freightCost")] = None
+    freight_tax_total: Annotated[float | None, Field(alias="freightTaxTotal")] = None
+    id: int | None = None
+    item_taxable_flag: Annotated[bool | None, Field(alias="itemTaxableFlag")] = None
+    level_six_tax_amount: Annotated[float | None, Field(alias="levelSixTaxAmount")] = None
+    level_six_tax_flag: Annotated[bool | None, Field(alias="levelSixTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at level six.
+    """
+    level_six_tax_xref: Annotated[str | None, Field(alias="levelSixTaxXref")] = None
+    location_id: Annotated[int | None, Field(alias="locationId")] = None
+    procurement_type: Annotated[
+        Literal["Purchase", "Adjustment", "Transfer"] | None, Field(alias="procurementType")
+    ] = None
+    purchase_date: Annotated[datetime | None, Field(alias="purchaseDate")] = None
+    purchase_order: Annotated[PurchaseOrderReference | None, Field(alias="purchaseOrder")] = None
+    purchase_order_taxable_flag: Annotated[bool | None, Field(alias="purchaseOrderTaxableFlag")] = None
+    state_tax_amount: Annotated[float | None, Field(alias="stateTaxAmount")] = None
+    state_tax_flag: Annotated[bool | None, Field(alias="stateTaxFlag")] = None
+    """
+    Set to true if transaction is taxable at the state level.
+    """
+    state_tax_xref: Annotated[str | None, Field(alias="stateTaxXref")] = None
+    tax_code: Annotated[TaxCodeReference | None, Field(alias="taxCode")] = None
+    tax_freight_flag: Annotated[bool | None, Field(alias="taxFreightFlag")] = None
+    tax_total: Annotated[float | None, Field(alias="taxTotal")] = None
+    total: float | None = None
+    tracking_number: Annotated[str | None, Field(alias="trackingNumber")] = None
+    unposted_product_id: Annotated[str | None, Field(alias="unpostedProductId")] = None
+    vendor: CompanyReference | None = None
+    vendor_account_number: Annotated[str | None, Field(alias="vendorAccountNumber")] = None
+    vendor_invoice_date: Annotated[datetime | None, Field(alias="vendorInvoiceDate")] = None
+    vendor_invoice_number: Annotated[str | None, Field(alias="vendorInvoiceNumber")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.billing_terms_reference import BillingTermsReference
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.purchase_order_reference import PurchaseOrderReference
+from pyconnectwise.models.manage.tax_code_reference import TaxCodeReference
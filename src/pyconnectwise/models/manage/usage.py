@@ -0,0 +1,19 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Usage(ConnectWiseModel):
+    count: int | None = None
+    description: str | None = None
+    hyperlink: str | None = None
+    id: int | None = None
+    type: str | None = None
+    type_key: Annotated[str | None, Field(alias="typeKey")] = None
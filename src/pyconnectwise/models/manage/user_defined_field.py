@@ -0,0 +1,84 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class UserDefinedField(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_all_business_units: Annotated[bool | None, Field(alias="addAllBusinessUnits")] = None
+    add_all_locations: Annotated[bool | None, Field(alias="addAllLocations")] = None
+    business_unit_ids: Annotated[list[int] | None, Field(alias="businessUnitIds")] = None
+    button_url: Annotated[str | None, Field(alias="buttonUrl")] = None
+    """
+    Only available with Button Field Type. Required when entryTypeIdentifier is button Max length: 1000;
+    """
+    caption: str
+    """
+    Field caption Max length: 25;
+    """
+    date_created: Annotated[datetime | None, Field(alias="dateCreated")] = None
+    """
+    Date in UTC the custom field was created
+    """
+    display_on_screen_flag: Annotated[bool | None, Field(alias="displayOnScreenFlag")] = None
+    entry_type_identifier: Annotated[
+        Literal["Date", "EntryField", "List", "Option"] | None, Field(alias="entryTypeIdentifier")
+    ] = None
+    field_type_identifier: Annotated[
+        Literal[
+            "TextArea",
+            "Button",
+            "Currency",
+            "Date",
+            "Hyperlink",
+            "IPAddress",
+            "Checkbox",
+            "Number",
+            "Percent",
+            "Text",
+            "Password",
+        ],
+        Field(alias="fieldTypeIdentifier"),
+    ]
+    help_text: Annotated[str | None, Field(alias="helpText")] = None
+    """
+    Help text to accompany the custom field Max length: 1000;
+    """
+    id: int | None = None
+    """
+    ID of the custom user defined field
+    """
+    list_view_flag: Annotated[bool | None, Field(alias="listViewFlag")] = None
+    """
+    Denotes that this custom field is included on a list view
+    """
+    location_ids: Annotated[list[int] | None, Field(alias="locationIds")] = None
+    number_decimals: Annotated[int | None, Field(alias="numberDecimals")] = None
+    """
+    Only valid for Number or percent
+    """
+    options: list[UserDefinedFieldOption] | None = None
+    pod_id: Annotated[int, Field(alias="podId")]
+    """
+    Id of the Pod where the custom field will be placed
+    """
+    read_only_flag: Annotated[bool | None, Field(alias="readOnlyFlag")] = None
+    remove_all_business_units: Annotated[bool | None, Field(alias="removeAllBusinessUnits")] = None
+    remove_all_locations: Annotated[bool | None, Field(alias="removeAllLocations")] = None
+    required_flag: Annotated[bool | None, Field(alias="requiredFlag")] = None
+    sequence_number: Annotated[int, Field(alias="sequenceNumber")]
+    """
+    Must be between 1 and 500.  This defines the order in which the custom fields will appear
+    """
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.user_defined_field_option import UserDefinedFieldOption
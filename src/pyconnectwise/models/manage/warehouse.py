@@ -0,0 +1,44 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Warehouse(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    company: CompanyReference | None = None
+    contact: ContactReference | None = None
+    currency: CurrencyReference | None = None
+    department: SystemDepartmentReference | None = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    location: SystemLocationReference | None = None
+    location_default_flag: Annotated[bool | None, Field(alias="locationDefaultFlag")] = None
+    location_xref: Annotated[str | None, Field(alias="locationXref")] = None
+    """
+     Max length: 10;
+    """
+    locked_flag: Annotated[bool | None, Field(alias="lockedFlag")] = None
+    manager: MemberReference | None = None
+    name: str
+    """
+     Max length: 50;
+    """
+    overall_default_flag: Annotated[bool | None, Field(alias="overallDefaultFlag")] = None
+    site: SiteReference | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.currency_reference import CurrencyReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.site_reference import SiteReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
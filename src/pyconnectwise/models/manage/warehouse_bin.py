@@ -0,0 +1,44 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WarehouseBin(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    company: CompanyReference | None = None
+    default_flag: Annotated[bool | None, Field(alias="defaultFlag")] = None
+    department: SystemDepartmentReference | None = None
+    height: float | None = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    length: float | None = None
+    location: SystemLocationReference | None = None
+    manager: MemberReference | None = None
+    max_quantity: Annotated[float | None, Field(alias="maxQuantity")] = None
+    min_quantity: Annotated[float | None, Field(alias="minQuantity")] = None
+    name: str
+    """
+     Max length: 50;
+    """
+    overflow_bin: Annotated[WarehouseBinReference | None, Field(alias="overflowBin")] = None
+    quantity_on_hand: Annotated[int | None, Field(alias="quantityOnHand")] = None
+    transfer_bin: Annotated[WarehouseBinReference | None, Field(alias="transferBin")] = None
+    warehouse: WarehouseReference | None = None
+    weight: float | None = None
+    width: float | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.company_reference import CompanyReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.warehouse_bin_reference import WarehouseBinReference
+from pyconnectwise.models.manage.warehouse_reference import WarehouseReference
@@ -0,0 +1,32 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkRole(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    add_all_agreement_exclusions: Annotated[bool | None, Field(alias="addAllAgreementExclusions")] = None
+    """
+    Used only on create to add the work role to all agreement and agreement type exclusion lists
+    """
+    add_all_locations: Annotated[bool | None, Field(alias="addAllLocations")] = None
+    hourly_rate: Annotated[float | None, Field(alias="hourlyRate")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    integration_xref: Annotated[str | None, Field(alias="integrationXref")] = None
+    """
+     Max length: 50;
+    """
+    location_ids: Annotated[list[int] | None, Field(alias="locationIds")] = None
+    name: str
+    """
+     Max length: 50;
+    """
+    remove_all_locations: Annotated[bool | None, Field(alias="removeAllLocations")] = None
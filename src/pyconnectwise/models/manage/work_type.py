@@ -0,0 +1,39 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    accrual_type: Annotated[Literal["Holiday", "PTO", "Sick", "Vacation"] | None, Field(alias="accrualType")] = None
+    activity_default_flag: Annotated[bool | None, Field(alias="activityDefaultFlag")] = None
+    add_all_agreement_exclusions: Annotated[bool | None, Field(alias="addAllAgreementExclusions")] = None
+    """
+    Used only on create to add the work type to all agreement and agreement type exclusion lists
+    """
+    bill_time: Annotated[Literal["Billable", "DoNotBill", "NoCharge"], Field(alias="billTime")]
+    cost_multiplier: Annotated[float | None, Field(alias="costMultiplier")] = None
+    hours_max: Annotated[float | None, Field(alias="hoursMax")] = None
+    hours_min: Annotated[float | None, Field(alias="hoursMin")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    integration_x_ref: Annotated[str | None, Field(alias="integrationXRef")] = None
+    """
+     Max length: 50;
+    """
+    name: str
+    """
+     Max length: 50;
+    """
+    overall_default_flag: Annotated[bool | None, Field(alias="overallDefaultFlag")] = None
+    rate: float
+    rate_type: Annotated[Literal["AdjAmount", "Custom", "Multiplier"], Field(alias="rateType")]
+    round_bill_hours_to: Annotated[float | None, Field(alias="roundBillHoursTo")] = None
+    utilization_flag: Annotated[bool | None, Field(alias="utilizationFlag")] = None
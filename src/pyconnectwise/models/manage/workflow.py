@@ -0,0 +1,49 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class Workflow(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    activate_flag: Annotated[bool | None, Field(alias="activateFlag")] = None
+    """
+    Batches can not be turned on until after the workflow is created and it has atleast one event associated with it
+    """
+    batch_frequency_unit: Annotated[
+        Literal["Minutes", "Hours", "Days"] | None, Field(alias="batchFrequencyUnit")
+    ] = None
+    """
+    If not specified, defaults to Minutes. Months is not supported as month length varies
+    """
+    batch_interval: Annotated[int | None, Field(alias="batchInterval")] = None
+    batch_last_ran: Annotated[datetime | None, Field(alias="batchLastRan")] = None
+    batch_schedule: Annotated[
+        Literal["AnyTime", "MyCompanyOfficeHours", "SlaHours"] | None, Field(alias="batchSchedule")
+    ] = None
+    """
+    If activateFlag is true, batchSchedule is required
+    """
+    board: BoardReference | None = None
+    department: SystemDepartmentReference | None = None
+    id: int | None = None
+    location: SystemLocationReference | None = None
+    name: str
+    """
+     Max length: 100;
+    """
+    table_type: Annotated[WorkflowTableTypeReference | None, Field(alias="tableType")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.system_department_reference import SystemDepartmentReference
+from pyconnectwise.models.manage.system_location_reference import SystemLocationReference
+from pyconnectwise.models.manage.workflow_table_type_reference import WorkflowTableTypeReference
@@ -0,0 +1,95 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkflowAction(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    activity_status: Annotated[ActivityStatusReference | None, Field(alias="activityStatus")] = None
+    activity_type: Annotated[ActivityTypeReference | None, Field(alias="activityType")] = None
+    attach_configurations_for: Annotated[
+        Literal["Company", "Contact"] | None, Field(alias="attachConfigurationsFor")
+    ] = None
+    """
+    Required when notifyType is set to: "Attach Configuration"
+    """
+    attached_track: Annotated[TrackReference | None, Field(alias="attachedTrack")] = None
+    attachments: list[int] | None = None
+    audit_notes_flag: Annotated[bool | None, Field(alias="auditNotesFlag")] = None
+    automate_script: Annotated[AutomateScriptReference | None, Field(alias="automateScript")] = None
+    bcc_contact: Annotated[ContactReference | None, Field(alias="bccContact")] = None
+    board: BoardReference | None = None
+    board_status: Annotated[ServiceStatusReference | None, Field(alias="boardStatus")] = None
+    cc_contact: Annotated[ContactReference | None, Field(alias="ccContact")] = None
+    company_status: Annotated[CompanyStatusReference | None, Field(alias="companyStatus")] = None
+    configuration_status: Annotated[ConfigurationStatusReference | None, Field(alias="configurationStatus")] = None
+    configuration_type: Annotated[ConfigurationTypeReference | None, Field(alias="configurationType")] = None
+    days_to_execute: Annotated[int | None, Field(alias="daysToExecute")] = None
+    detail_notes_flag: Annotated[bool | None, Field(alias="detailNotesFlag")] = None
+    email_from: Annotated[str | None, Field(alias="emailFrom")] = None
+    """
+    Required when notifyFrom is set to: "Email Address" Max length: 250;
+    """
+    email_recipient: Annotated[str | None, Field(alias="emailRecipient")] = None
+    """
+    Required when notifyWho is set to: "Email Address" Max length: 250;
+    """
+    group: GroupReference | None = None
+    id: int | None = None
+    internal_notes_flag: Annotated[bool | None, Field(alias="internalNotesFlag")] = None
+    invoice_min_days: Annotated[int | None, Field(alias="invoiceMinDays")] = None
+    notes: str | None = None
+    notify_from: Annotated[NotificationRecipientReference | None, Field(alias="notifyFrom")] = None
+    notify_type: Annotated[NotifyTypeReference, Field(alias="notifyType")]
+    notify_who: Annotated[NotificationRecipientReference | None, Field(alias="notifyWho")] = None
+    project_status: Annotated[ProjectStatusReference | None, Field(alias="projectStatus")] = None
+    sales_order_status: Annotated[OrderStatusReference | None, Field(alias="salesOrderStatus")] = None
+    script_fail_status: Annotated[ServiceStatusReference | None, Field(alias="scriptFailStatus")] = None
+    script_success_status: Annotated[ServiceStatusReference | None, Field(alias="scriptSuccessStatus")] = None
+    service_item: Annotated[ServiceItemReference | None, Field(alias="serviceItem")] = None
+    service_priority: Annotated[PriorityReference | None, Field(alias="servicePriority")] = None
+    service_sub_type: Annotated[ServiceSubTypeReference | None, Field(alias="serviceSubType")] = None
+    service_survey: Annotated[ServiceSurveyReference | None, Field(alias="serviceSurvey")] = None
+    service_template: Annotated[ServiceTemplateReference | None, Field(alias="serviceTemplate")] = None
+    service_type: Annotated[ServiceTypeReference | None, Field(alias="serviceType")] = None
+    specific_member_from: Annotated[MemberReference | None, Field(alias="specificMemberFrom")] = None
+    specific_member_to: Annotated[MemberReference | None, Field(alias="specificMemberTo")] = None
+    specific_team_to: Annotated[GenericBoardTeamReference | None, Field(alias="specificTeamTo")] = None
+    subject: str | None = None
+    """
+    Required when notifyType is set to: "Create Activity", "Send Email", "Assign Resource" Max length: 100;
+    """
+    update_owner_flag: Annotated[bool | None, Field(alias="updateOwnerFlag")] = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.activity_status_reference import ActivityStatusReference
+from pyconnectwise.models.manage.activity_type_reference import ActivityTypeReference
+from pyconnectwise.models.manage.automate_script_reference import AutomateScriptReference
+from pyconnectwise.models.manage.board_reference import BoardReference
+from pyconnectwise.models.manage.company_status_reference import CompanyStatusReference
+from pyconnectwise.models.manage.configuration_status_reference import ConfigurationStatusReference
+from pyconnectwise.models.manage.configuration_type_reference import ConfigurationTypeReference
+from pyconnectwise.models.manage.contact_reference import ContactReference
+from pyconnectwise.models.manage.generic_board_team_reference import GenericBoardTeamReference
+from pyconnectwise.models.manage.group_reference import GroupReference
+from pyconnectwise.models.manage.member_reference import MemberReference
+from pyconnectwise.models.manage.notification_recipient_reference import NotificationRecipientReference
+from pyconnectwise.models.manage.notify_type_reference import NotifyTypeReference
+from pyconnectwise.models.manage.order_status_reference import OrderStatusReference
+from pyconnectwise.models.manage.priority_reference import PriorityReference
+from pyconnectwise.models.manage.project_status_reference import ProjectStatusReference
+from pyconnectwise.models.manage.service_item_reference import ServiceItemReference
+from pyconnectwise.models.manage.service_status_reference import ServiceStatusReference
+from pyconnectwise.models.manage.service_sub_type_reference import ServiceSubTypeReference
+from pyconnectwise.models.manage.service_survey_reference import ServiceSurveyReference
+from pyconnectwise.models.manage.service_template_reference import ServiceTemplateReference
+from pyconnectwise.models.manage.service_type_reference import ServiceTypeReference
+from pyconnectwise.models.manage.track_reference import TrackReference
@@ -0,0 +1,26 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkflowActionUserDefinedField(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    action_id: Annotated[int | None, Field(alias="actionId")] = None
+    caption: str | None = None
+    entry_type_id: Annotated[str | None, Field(alias="entryTypeId")] = None
+    event_id: Annotated[int | None, Field(alias="eventId")] = None
+    field_type_id: Annotated[str | None, Field(alias="fieldTypeId")] = None
+    id: int | None = None
+    inactive_flag: Annotated[bool | None, Field(alias="inactiveFlag")] = None
+    overwrite_flag: Annotated[bool | None, Field(alias="overwriteFlag")] = None
+    pod_description: Annotated[str | None, Field(alias="podDescription")] = None
+    required_flag: Annotated[bool | None, Field(alias="requiredFlag")] = None
+    user_defined_field_id: Annotated[int | None, Field(alias="userDefinedFieldId")] = None
+    value: str | None = None
@@ -0,0 +1,35 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated, Literal
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkflowEvent(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    event_condition: Annotated[str, Field(alias="eventCondition")]
+    execution_time: Annotated[
+        Literal["Once", "MultipleTimes", "Continuously"] | None, Field(alias="executionTime")
+    ] = None
+    """
+    Defaults to Once when not specified
+    """
+    frequency_of_execution: Annotated[int | None, Field(alias="frequencyOfExecution")] = None
+    """
+    Required when exectionTimes is set to MultipleTimes or Continuously
+    """
+    frequency_unit: Annotated[Literal["Minutes", "Hours", "Days", "Months"] | None, Field(alias="frequencyUnit")] = None
+    """
+    Required when exectionTimes is set to MultipleTimes or Continuously
+    """
+    id: int | None = None
+    max_number_of_execution: Annotated[int | None, Field(alias="maxNumberOfExecution")] = None
+    """
+    Required when exectionTimes is set to MultipleTimes
+    """
+    name: str | None = None
@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkflowNotifyType(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    external_flag: Annotated[bool | None, Field(alias="externalFlag")] = None
+    """
+    If the current action effects external objects e.g. integrations or sending an email
+    """
+    id: int | None = None
+    identifier: str | None = None
+    is_setup_flag: Annotated[bool | None, Field(alias="isSetupFlag")] = None
+    """
+    If the current action is available because it is already set up. Pertains to integrations such as Automate
+    """
+    name: str | None = None
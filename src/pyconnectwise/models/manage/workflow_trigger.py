@@ -0,0 +1,25 @@
+# generated by datamodel-codegen:
+#   filename:  tmpsy69p9nm
+
+from __future__ import annotations
+
+from typing import Annotated
+
+from pydantic import Field
+
+from pyconnectwise.models.base.connectwise_model import ConnectWiseModel
+
+
+class WorkflowTrigger(ConnectWiseModel):
+    info: Annotated[dict[str, str] | None, Field(alias="_info")] = None
+    custom_field: Annotated[UserDefinedFieldReference | None, Field(alias="customField")] = None
+    description: str | None = None
+    expected_type: Annotated[str | None, Field(alias="expectedType")] = None
+    has_operator_flag: Annotated[bool | None, Field(alias="hasOperatorFlag")] = None
+    has_options_flag: Annotated[bool | None, Field(alias="hasOptionsFlag")] = None
+    id: int | None = None
+    name: str | None = None
+
+
+# Imported after the model is defined, so models that refer to each other can be imported
+from pyconnectwise.models.manage.user_defined_field_reference import UserDefinedFieldReference
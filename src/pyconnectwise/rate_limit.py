@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+
+# Statuses the API (or a proxy in front of it) uses to tell us to slow down
+THROTTLED_STATUSES = frozenset((429, 503))
+
+
+class RateLimiter:
+    """
+    A thread-safe token bucket that paces requests to the API.
+
+    Requests are let through at up to `rate` per second, with bursts of up to `burst` requests. Callers beyond
+    that are given a wait, so requests queue up evenly instead of all hitting the API at once.
+
+    The limiter is adaptive: whenever the API throttles us (HTTP 429 or 503), the rate is halved, down to
+    `min_rate`. Every successful request then raises it by `recovery` requests per second, back up to `rate`.
+    This finds and stays near the fastest rate the server will accept.
+
+    Args:
+        rate (float): The maximum number of requests per second.
+        burst (int): The number of requests that can be made at once before pacing kicks in (default = 1)
+        min_rate (float): The lowest the rate will be lowered to when throttled (default = 1)
+        recovery (float, optional): How many requests per second each success adds back to a lowered rate
+            (default = 2% of rate)
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int = 1,
+        min_rate: float = 1.0,
+        recovery: float | None = None,
+    ) -> None:
+        self.max_rate = rate
+        self.burst = burst
+        self.min_rate = min(min_rate, rate)
+        self.recovery = recovery if recovery is not None else rate * 0.02
+        self.rate = rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token for a request, returning how long the caller must wait before sending it.
+        Waits are reserved in order, so concurrent callers are spaced out evenly rather than racing.
+
+        Returns:
+            float: The number of seconds to wait before making the request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._tokens + (now - self._updated) * self.rate, self.burst)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def record_response(self, status_code: int) -> None:
+        """
+        Adapt the rate to a response from the API.
+
+        Args:
+            status_code (int): The response's HTTP status code.
+        """
+        if status_code in THROTTLED_STATUSES:
+            self.on_throttled()
+        else:
+            self.on_success()
+
+    def on_success(self) -> None:
+        """
+        Record a request that wasn't throttled, recovering towards the maximum rate.
+        """
+        with self._lock:
+            self.rate = min(self.rate + self.recovery, self.max_rate)
+
+    def on_throttled(self) -> None:
+        """
+        Record a request that was throttled, halving the rate.
+        """
+        with self._lock:
+            self.rate = max(self.rate / 2, self.min_rate)
+            # Drop any saved-up burst so the lower rate applies straight away
+            self._tokens = min(self._tokens, 0.0)
+
+
+class SQLiteRateLimiter(RateLimiter):
+    """
+    A RateLimiter whose bucket is kept in an SQLite database, so every process using the same file shares one rate,
+    including processes on other machines when the file is on a shared file system. Use it to keep a job split
+    across processes (see ShardedExtract) within the API's limits as a whole, rather than per process.
+
+    The database isn't put in WAL mode, which doesn't work over network file systems. Processes on different
+    machines need their clocks in sync (e.g. with NTP), as the bucket is refilled by the wall clock.
+
+    Args:
+        path (str): The database file. It's created if it doesn't exist.
+        rate (float): The maximum number of requests per second, across every process.
+        burst (int): The number of requests that can be made at once before pacing kicks in (default = 1)
+        min_rate (float): The lowest the rate will be lowered to when throttled (default = 1)
+        recovery (float, optional): How many requests per second each success adds back to a lowered rate
+            (default = 2% of rate)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        rate: float,
+        burst: int = 1,
+        min_rate: float = 1.0,
+        recovery: float | None = None,
+    ) -> None:
+        super().__init__(rate, burst, min_rate, recovery)
+        self.path = path
+        self._local = threading.local()
+        connection = self._connect()
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS rate_limit ("
+            "id INTEGER PRIMARY KEY CHECK (id = 1), tokens REAL NOT NULL, updated REAL NOT NULL, rate REAL NOT NULL)"
+        )
+        connection.execute("INSERT OR IGNORE INTO rate_limit VALUES (1, ?, ?, ?)", (float(burst), time.time(), rate))
+
+    def __getstate__(self) -> dict:
+        # Connections can't be pickled, so a limiter sent to another process opens its own
+        state = self.__dict__.copy()
+        del state["_local"], state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads, so each thread gets its own
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            self._local.connection = connection
+        return connection
+
+    def reserve(self) -> float:
+        connection = self._connect()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            tokens, updated, rate = connection.execute("SELECT tokens, updated, rate FROM rate_limit").fetchone()
+            now = time.time()
+            tokens = min(tokens + max(now - updated, 0.0) * rate, self.burst) - 1
+            connection.execute("UPDATE rate_limit SET tokens = ?, updated = ?", (tokens, max(now, updated)))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        self.rate = rate
+        return 0.0 if tokens >= 0 else -tokens / rate
+
+    def on_success(self) -> None:
+        if self.rate < self.max_rate:
+            self._connect().execute("UPDATE rate_limit SET rate = MIN(rate + ?, ?)", (self.recovery, self.max_rate))
+
+    def on_throttled(self) -> None:
+        self._connect().execute(
+            "UPDATE rate_limit SET rate = MAX(rate / 2, ?), tokens = MIN(tokens, 0.0)", (self.min_rate,)
+        )
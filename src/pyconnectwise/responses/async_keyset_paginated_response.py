@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from pyconnectwise.responses.keyset_paginated_response import KeysetPaginatedResponse
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from pydantic import BaseModel
+
+    from pyconnectwise.interfaces import IAsyncPaginateable
+    from pyconnectwise.types import RequestParams
+
+TModel = TypeVar("TModel", bound="BaseModel")
+
+
+class AsyncKeysetPaginatedResponse(KeysetPaginatedResponse[TModel], Generic[TModel]):
+    """
+    AsyncKeysetPaginatedResponse is the asyncio counterpart of KeysetPaginatedResponse, returned by the
+    keyset_paginated() method of async endpoints. get_next_page() and all() must be awaited or iterated
+    with async for:
+
+        async for ticket in await client.service.tickets.keyset_paginated(1000):
+            ...
+    """
+
+    def __init__(
+        self,
+        endpoint: IAsyncPaginateable,
+        page_size: int,
+        params: RequestParams | None = None,
+        key: str = "id",
+        after: Any = None,  # noqa: ANN401
+    ) -> None:
+        # The first page can't be fetched here, keyset_paginated() awaits get_next_page() for us
+        self._configure(endpoint, page_size, params, key, after)
+
+    async def get_next_page(self) -> AsyncKeysetPaginatedResponse[TModel]:  # type: ignore[override]
+        """
+        Fetch the next page, starting after the last key seen.
+
+        Returns:
+            AsyncKeysetPaginatedResponse[TModel]: The updated AsyncKeysetPaginatedResponse instance
+            with the data from the next page, or no data if there is no next page.
+        """
+        if not self.has_next_page:
+            self.data = []
+            self.has_data = False
+            return self
+
+        page = await self.endpoint.paginated(1, self.page_size, self._next_page_params())  # type: ignore[arg-type, misc]
+        self._set_page(page.data)
+        return self
+
+    async def all(self) -> AsyncIterator[TModel]:  # type: ignore[override]  # noqa: A003
+        """
+        Iterate through all items, across all pages.
+
+        Yields:
+            TModel: An instance of the model class for each item.
+        """
+        while self.has_data:
+            for item in self.data:
+                yield item
+            await self.get_next_page()
+
+    def __aiter__(self) -> AsyncIterator[TModel]:
+        """
+        Implement the async iterator protocol, iterating through all items across all pages.
+
+        Returns:
+            AsyncIterator[TModel]: An async iterator over every item.
+        """
+        return self.all()
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+from pyconnectwise.responses.paginated_response import PaginatedResponse
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from pydantic import BaseModel
+
+TModel = TypeVar("TModel", bound="BaseModel")
+
+
+class AsyncPaginatedResponse(PaginatedResponse[TModel], Generic[TModel]):
+    """
+    AsyncPaginatedResponse is the asyncio counterpart of PaginatedResponse, returned by the
+    paginated() method of async endpoints. Navigating between pages makes a request, so
+    get_next_page(), get_previous_page() and all() must be awaited or iterated with async for.
+
+    The current page can still be iterated synchronously, exactly like PaginatedResponse. Iterating
+    the response itself with async for walks through every item across all pages:
+
+        async for ticket in await client.service.tickets.paginated(1, 1000):
+            ...
+    """
+
+    async def get_next_page(self) -> AsyncPaginatedResponse[TModel]:  # type: ignore[override]
+        """
+        Fetch the next page of the paginated response.
+
+        Returns:
+            AsyncPaginatedResponse[TModel]: The updated AsyncPaginatedResponse instance
+            with the data from the next page or None if there is no next page.
+        """
+        if not self.has_next_page or not self.next_page:
+            self.has_data = False
+            return self
+
+        next_response = await self.endpoint.paginated(self.next_page, self.page_size, self.params)
+        self._initialize(
+            next_response.response,
+            next_response.response_model,
+            next_response.endpoint,
+            self.next_page,
+            next_response.page_size,
+            self.params,
+        )
+        return self
+
+    async def get_previous_page(self) -> AsyncPaginatedResponse[TModel]:  # type: ignore[override]
+        """
+        Fetch the previous page of the paginated response.
+
+        Returns:
+            AsyncPaginatedResponse[TModel]: The updated AsyncPaginatedResponse instance
+            with the data from the previous page or None if there is no previous page.
+        """
+        if not self.has_prev_page or not self.prev_page:
+            self.has_data = False
+            return self
+
+        prev_response = await self.endpoint.paginated(self.prev_page, self.page_size, self.params)
+        self._initialize(
+            prev_response.response,
+            prev_response.response_model,
+            prev_response.endpoint,
+            self.prev_page,
+            prev_response.page_size,
+            self.params,
+        )
+        return self
+
+    async def all(self, concurrency: int = 1) -> AsyncIterator[TModel]:  # type: ignore[override]  # noqa: A003
+        """
+        Iterate through all items in the paginated response, across all pages.
+
+        With a concurrency above 1, up to `concurrency` upcoming pages are requested at once while the
+        caller is still working through the current one. Items are still yielded in page order.
+
+        Args:
+            concurrency (int): The number of pages to fetch at once (default = 1, no prefetching).
+
+        Yields:
+            TModel: An instance of the model class for each item in the paginated response.
+        """
+        if concurrency > 1:
+            async for item in self._prefetch_all(concurrency):
+                yield item
+            return
+
+        while self.has_data:
+            for item in self.data:
+                yield item
+            await self.get_next_page()
+
+    async def _prefetch_all(self, concurrency: int) -> AsyncIterator[TModel]:  # type: ignore[override]  # noqa: C901
+        """
+        Yield every item across all pages, requesting up to `concurrency` upcoming pages at once.
+        """
+        if not self.has_data:
+            return
+        for item in self.data:
+            yield item
+
+        pages = self._remaining_pages()
+        pending: deque[asyncio.Task[AsyncPaginatedResponse[TModel]]] = deque()
+
+        def fetch_next() -> None:
+            page = next(pages, None)
+            if page is not None:
+                pending.append(asyncio.ensure_future(self._fetch_page(page)))
+
+        for _ in range(concurrency):
+            fetch_next()
+        try:
+            while pending:
+                page_response = await pending.popleft()
+                if not page_response.has_data:
+                    break
+                fetch_next()
+                for item in page_response.data:
+                    yield item
+                if not page_response.has_next_page:
+                    break
+        finally:
+            # Stop fetching pages nobody is going to consume
+            for task in pending:
+                task.cancel()
+        self.has_data = False
+
+    async def _fetch_page(self, page: int) -> AsyncPaginatedResponse[TModel]:  # type: ignore[override]
+        params = dict(self.params) if self.params else None
+        return await self.endpoint.paginated(page, self.page_size, params)  # type: ignore[arg-type]
+
+    def __aiter__(self) -> AsyncIterator[TModel]:
+        """
+        Implement the async iterator protocol, iterating through all items across all pages.
+
+        Returns:
+            AsyncIterator[TModel]: An async iterator over every item in the paginated response.
+        """
+        return self.all()
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pydantic import BaseModel
+
+    from pyconnectwise.interfaces import IAsyncPaginateable, IPaginateable
+    from pyconnectwise.types import RequestParams
+
+TModel = TypeVar("TModel", bound="BaseModel")
+# The API returns at most 1000 items per page, however many are asked for
+MAX_PAGE_SIZE = 1000
+
+
+class KeysetPaginatedResponse(Generic[TModel]):
+    """
+    KeysetPaginatedResponse walks through an endpoint's data in order of a unique, sortable key (the id by default),
+    instead of by page number. Each page is requested as the first page of everything after the last key seen, using
+    the `conditions` and `orderBy` query parameters:
+
+        GET /service/tickets?conditions=id > 1234&orderBy=id asc&page=1&pageSize=1000
+
+    Unlike deep page numbers, which the API has to skip through on every request, each page costs the same no matter
+    how far into the data it is. Rows created or deleted mid-scan also can't shift the pages, so no row is skipped or
+    returned twice. Any conditions passed in are kept and combined with the key condition.
+
+    It supports the same iteration as PaginatedResponse: iterating the response walks through the current page, and
+    all() walks through every item across all pages. A scan that was interrupted can be resumed by passing its last_key
+    as the after argument of keyset_paginated().
+    """
+
+    def __init__(
+        self,
+        endpoint: IPaginateable,
+        page_size: int,
+        params: RequestParams | None = None,
+        key: str = "id",
+        after: Any = None,  # noqa: ANN401
+    ) -> None:
+        self._configure(endpoint, page_size, params, key, after)
+        self.get_next_page()
+
+    def _configure(
+        self,
+        endpoint: IPaginateable | IAsyncPaginateable,
+        page_size: int,
+        params: RequestParams | None,
+        key: str,
+        after: Any = None,  # noqa: ANN401
+    ) -> None:
+        """
+        Set up the scan without fetching anything.
+
+        Args:
+            endpoint: The endpoint to page through.
+            page_size (int): The number of items per page, at most 1000 (larger sizes are capped at 1000).
+            params (dict, optional): Additional query parameters, including any conditions to filter by.
+            key (str): The model field to page by. It must be unique and sortable.
+            after (optional): The key to start after, e.g. the last key of an earlier scan to resume it.
+        """
+        field = endpoint.model.model_fields.get(key)  # type: ignore[attr-defined]
+        if field is None:
+            raise ValueError(f"{endpoint.model.__name__} has no field named {key!r} to paginate by")  # type: ignore[attr-defined]  # noqa: TRY003
+
+        self.endpoint = endpoint
+        # A short page marks the end of the scan, so asking for more than the API returns would end it early
+        self.page_size = min(page_size, MAX_PAGE_SIZE)
+        self.params: dict[str, Any] = dict(params) if params else {}
+        self.key = key
+        self.key_field: str = field.alias or key
+        self.conditions_param: str = endpoint.client._conditions_param  # type: ignore[attr-defined]
+
+        order_by = f"{self.key_field} asc"
+        if self.params.get("orderBy", order_by).lower() != order_by.lower():
+            raise ValueError(  # noqa: TRY003
+                f"Keyset pagination orders by {order_by!r} and can't be combined with another orderBy"
+            )
+        self.params["orderBy"] = order_by
+
+        self.last_key: Any = after
+        self.has_next_page = True
+        self.data: list[TModel] = []
+        self.has_data = False
+        self.index = 0
+
+    def _next_page_params(self) -> dict[str, Any]:
+        """
+        Build the query parameters for the page after the last key seen.
+        """
+        params = dict(self.params)
+        if self.last_key is not None:
+            cursor = f"{self.key_field} > {_format_condition_value(self.last_key)}"
+            conditions = params.get(self.conditions_param)
+            params[self.conditions_param] = f"({conditions}) and {cursor}" if conditions else cursor
+        return params
+
+    def _set_page(self, data: list[TModel]) -> None:
+        """
+        Make the given items the current page, and move the cursor past them.
+        """
+        self.data = data
+        self.has_data = len(data) > 0
+        self.index = 0
+        # A short page means we've reached the end, so there's no need to ask for an empty one
+        self.has_next_page = len(data) >= self.page_size
+        if data:
+            last_item = data[-1]
+            if isinstance(last_item, dict):
+                # Items are dicts in the "raw" response mode
+                last_key = last_item.get(self.key_field)
+            else:
+                last_key = getattr(last_item, self.key, None)
+            if last_key is None:
+                raise ValueError(  # noqa: TRY003
+                    f"Can't paginate by {self.key!r}, it is missing from the returned items"
+                )
+            self.last_key = last_key
+
+    def get_next_page(self) -> KeysetPaginatedResponse[TModel]:
+        """
+        Fetch the next page, starting after the last key seen.
+
+        Returns:
+            KeysetPaginatedResponse[TModel]: The updated KeysetPaginatedResponse instance
+            with the data from the next page, or no data if there is no next page.
+        """
+        if not self.has_next_page:
+            self.data = []
+            self.has_data = False
+            return self
+
+        page = self.endpoint.paginated(1, self.page_size, self._next_page_params())  # type: ignore[arg-type]
+        self._set_page(page.data)
+        return self
+
+    def all(self) -> Iterable[TModel]:  # noqa: A003
+        """
+        Iterate through all items, across all pages.
+
+        Yields:
+            TModel: An instance of the model class for each item.
+        """
+        while self.has_data:
+            yield from self.data
+            self.get_next_page()
+
+    def __iter__(self):  # noqa: ANN204
+        """
+        Implement the iterator protocol for the KeysetPaginatedResponse class.
+
+        Returns:
+            KeysetPaginatedResponse[TModel]: The current instance of the KeysetPaginatedResponse.
+        """
+        return self
+
+    def __next__(self):  # noqa: ANN204
+        """
+        Implement the iterator protocol by getting the next item in the current page.
+
+        Returns:
+            TModel: The next item in the data.
+
+        Raises:
+            StopIteration: If there are no more items in the data.
+        """
+        if self.index < len(self.data):
+            result = self.data[self.index]
+            self.index += 1
+            return result
+        raise StopIteration
+
+
+def _format_condition_value(value: Any) -> str:  # noqa: ANN401
+    """
+    Format a key value for use in a conditions string. Numbers are left bare and strings are quoted,
+    except for numeric strings (Automate types its ids as strings), which compare as numbers.
+    """
+    if isinstance(value, str) and not value.isdigit():
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
+    return str(value)
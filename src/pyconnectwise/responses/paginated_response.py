@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import itertools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Generic, TypeVar
 
 from pyconnectwise.utils.helpers import parse_link_headers
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable
+    from collections.abc import Iterable, Iterator
+    from concurrent.futures import Future
 
     from pydantic import BaseModel
     from requests import Response
@@ -98,7 +102,7 @@ class PaginatedResponse(Generic[TModel]):
             self.prev_page = page - 1 if page > 1 else 1
             self.next_page = page + 1
             self.last_page = 999999
-        self.data: list[TModel] = [response_model.model_validate(d) for d in response.json()]
+        self.data: list[TModel] = endpoint._parse_many(response_model, response.content)  # type: ignore[attr-defined]
         self.has_data = self.data and len(self.data) > 0
         self.index = 0
 
@@ -148,17 +152,78 @@ class PaginatedResponse(Generic[TModel]):
         )
         return self
 
-    def all(self) -> Iterable[TModel]:  # noqa: A003
+    def all(self, concurrency: int = 1) -> Iterable[TModel]:  # noqa: A003
         """
         Iterate through all items in the paginated response, across all pages.
 
+        By default pages are fetched one after another as the items are consumed. With a concurrency above 1,
+        upcoming pages are fetched on a thread pool while the caller is still working through the current one.
+        Items are still yielded in page order, and at most `concurrency` pages are fetched ahead at any time.
+
+        Args:
+            concurrency (int): The number of pages to fetch at once (default = 1, no prefetching).
+
         Yields:
             TModel: An instance of the model class for each item in the paginated response.
         """
+        if concurrency > 1:
+            yield from self._prefetch_all(concurrency)
+            return
+
         while self.has_data:
             yield from self.data
             self.get_next_page()
 
+    def _prefetch_all(self, concurrency: int) -> Iterable[TModel]:
+        """
+        Yield every item across all pages, fetching up to `concurrency` upcoming pages at once.
+        """
+        if not self.has_data:
+            return
+        yield from self.data
+
+        pages = self._remaining_pages()
+        pending: deque[Future[PaginatedResponse[TModel]]] = deque()
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="pyconnectwise-prefetch") as executor:
+
+            def fetch_next() -> None:
+                page = next(pages, None)
+                if page is not None:
+                    pending.append(executor.submit(self._fetch_page, page))
+
+            for _ in range(concurrency):
+                fetch_next()
+            try:
+                while pending:
+                    page_response = pending.popleft().result()
+                    if not page_response.has_data:
+                        break
+                    fetch_next()
+                    yield from page_response.data
+                    if not page_response.has_next_page:
+                        break
+            finally:
+                # Stop fetching pages nobody is going to consume
+                for future in pending:
+                    future.cancel()
+        self.has_data = False
+
+    def _remaining_pages(self) -> Iterator[int]:
+        """
+        Returns the page numbers after the current page. Manage tells us the last page in its Link header,
+        Automate doesn't, so for Automate we count up until a page comes back empty.
+        """
+        if not self.has_next_page or not self.next_page:
+            return iter(())
+        if self.parsed_link_headers is not None and self.last_page:
+            return iter(range(self.next_page, self.last_page + 1))
+        return itertools.count(self.next_page)
+
+    def _fetch_page(self, page: int) -> PaginatedResponse[TModel]:
+        # paginated() writes the page number into params, so each request needs its own copy
+        params = dict(self.params) if self.params else None
+        return self.endpoint.paginated(page, self.page_size, params)  # type: ignore[arg-type]
+
     def __iter__(self):  # noqa: ANN204
         """
         Implement the iterator protocol for the PaginatedResponse class.
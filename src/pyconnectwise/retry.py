@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+from pyconnectwise.utils.helpers import is_timeout_response
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    import httpx
+    from requests import Response
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of the requests being made, shared by every thread (or task) using it.
+
+    When the API is struggling, every caller retrying every failed request multiplies the load at the worst
+    possible time. A budget lets occasional failures be retried freely, but once retries make up more than
+    `ratio` of the traffic, further failures are raised instead of retried until enough requests succeed.
+
+    Args:
+        ratio (float): The number of retries earned by each request (default = 0.2, one retry per 5 requests).
+        reserve (int): The number of retries available up front, and the most that can be saved up (default = 10).
+    """
+
+    def __init__(self, ratio: float = 0.2, reserve: int = 10) -> None:
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = float(reserve)
+        self._lock = threading.Lock()
+
+    def record_request(self) -> None:
+        """
+        Record a new (non-retry) request, earning `ratio` retries.
+        """
+        with self._lock:
+            self._balance = min(self._balance + self.ratio, self.reserve)
+
+    def try_spend(self) -> bool:
+        """
+        Withdraw a retry from the budget.
+
+        Returns:
+            bool: Whether a retry was available.
+        """
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides which failed requests are retried, and how long to wait before each retry.
+
+    By default, rate limited (429) responses are retried, as the server turned the request away without handling it.
+    Gateway errors (502, 503, 504) and ConnectWise's timeout 500s are only retried for idempotent requests (GET, HEAD,
+    PUT, DELETE): the server may have handled the request before failing, and repeating a POST or PATCH could
+    e.g. create a ticket twice. Waits grow exponentially with the number of attempts, with full jitter so that many
+    callers failing at once don't all retry at once. A Retry-After header from the server always takes precedence.
+
+    Args:
+        max_retries (int): The maximum number of retries for a single request (default = 3)
+        backoff_base (float): The wait ceiling in seconds for the first retry, doubled for each retry after
+            (default = 0.5)
+        backoff_max (float): The most to wait between retries in seconds, without a Retry-After (default = 30)
+        max_retry_after (float): The most to wait when the server sends a Retry-After, in seconds (default = 120)
+        retry_statuses (Iterable[int]): The HTTP statuses that are always retried (default = 429)
+        idempotent_retry_statuses (Iterable[int]): The HTTP statuses that are retried for idempotent requests,
+            along with timeout 500s (default = 502, 503, 504)
+        idempotent_methods (Iterable[str]): The HTTP methods that are safe to repeat (default = GET, HEAD, PUT, DELETE)
+        budget (RetryBudget, optional): The budget that retries are drawn from (default = a RetryBudget()).
+            Pass the same budget to several policies to share it between them.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        max_retry_after: float = 120.0,
+        retry_statuses: Iterable[int] = (429,),
+        idempotent_retry_statuses: Iterable[int] = (502, 503, 504),
+        idempotent_methods: Iterable[str] = ("GET", "HEAD", "PUT", "DELETE"),
+        budget: RetryBudget | None = None,
+    ) -> None:
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = frozenset(retry_statuses)
+        self.idempotent_retry_statuses = frozenset(idempotent_retry_statuses)
+        self.idempotent_methods = frozenset(method.upper() for method in idempotent_methods)
+        self.budget = budget if budget is not None else RetryBudget()
+
+    def is_retryable(self, response: Response | httpx.Response) -> bool:
+        """
+        Checks whether a failed response is worth retrying at all.
+        """
+        if response.status_code in self.retry_statuses:
+            return True
+        if response.request.method.upper() not in self.idempotent_methods:
+            return False
+        return response.status_code in self.idempotent_retry_statuses or is_timeout_response(response)
+
+    def should_retry(self, response: Response | httpx.Response, retry_count: int) -> bool:
+        """
+        Checks whether a failed response should be retried, withdrawing from the retry budget if so.
+
+        Args:
+            response: The failed response.
+            retry_count (int): The number of times the request has already been retried.
+
+        Returns:
+            bool: Whether to retry the request.
+        """
+        return retry_count < self.max_retries and self.is_retryable(response) and self.budget.try_spend()
+
+    def get_delay(self, response: Response | httpx.Response, retry_count: int) -> float:
+        """
+        Returns how long to wait before the next retry, in seconds.
+
+        Args:
+            response: The failed response.
+            retry_count (int): The number of times the request has already been retried.
+
+        Returns:
+            float: The number of seconds to wait.
+        """
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**retry_count))  # noqa: S311
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header, which is either a number of seconds or a HTTP date.
+
+    Args:
+        value (str, optional): The header value.
+
+    Returns:
+        float | None: The number of seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
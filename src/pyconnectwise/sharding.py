@@ -0,0 +1,472 @@
+from __future__ import annotations
+
+import contextlib
+import copy
+import csv
+import functools
+import io
+import math
+import os
+import shutil
+import socket
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.export import COMPRESSIONS, _Flattener, _get_format, export
+from pyconnectwise.hydration import _get_id_alias
+from pyconnectwise.rate_limit import SQLiteRateLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+
+    from pyconnectwise.clients.connectwise_client import ConnectWiseClient
+    from pyconnectwise.interfaces import IPaginateable
+    from pyconnectwise.types import RequestParams
+
+
+class Shard:
+    """
+    A range of ids, from low (inclusive) up to high (exclusive). The first shard has no low and the last has no
+    high, so together the shards cover every id, including ids created after they were planned.
+
+    Shards handed out by a WorkQueue also carry the number of the claim they were handed out with, which counts up
+    each time the shard is claimed.
+    """
+
+    def __init__(self, index: int, low: int | None, high: int | None, claim: int = 0) -> None:
+        self.index = index
+        self.low = low
+        self.high = high
+        self.claim = claim
+
+    def get_condition(self, key_field: str) -> str | None:
+        conditions = []
+        if self.low is not None:
+            conditions.append(f"{key_field} >= {self.low}")
+        if self.high is not None:
+            conditions.append(f"{key_field} < {self.high}")
+        return " and ".join(conditions) or None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Shard):
+            return NotImplemented
+        return (self.index, self.low, self.high) == (other.index, other.low, other.high)
+
+    def __hash__(self) -> int:
+        return hash((self.index, self.low, self.high))
+
+    def __repr__(self) -> str:
+        return f"Shard(index={self.index}, low={self.low}, high={self.high})"
+
+
+def plan_shards(
+    endpoint: IPaginateable,
+    shards: int | None = None,
+    rows_per_shard: int = 100_000,
+    params: RequestParams | None = None,
+    min_shards: int = 1,
+) -> list[Shard]:
+    """
+    Split an endpoint's ids into disjoint ranges of about the same size, to be fetched in parallel. The lowest and
+    highest ids are looked up with a request each, and unless the number of shards is given, the number of items is
+    counted with the endpoint's count endpoint (where it has one) to size the shards.
+
+    The range between the lowest and highest id is split evenly, so the shards hold about the same number of items
+    as long as the ids are spread evenly. Ids are assumed to be numbers, as they are on both APIs.
+
+    Args:
+        endpoint (IPaginateable): The endpoint to split.
+        shards (int, optional): The number of shards (default = as many as it takes to hold rows_per_shard items
+            each).
+        rows_per_shard (int): The number of items per shard, when the number of shards isn't given
+            (default = 100,000).
+        params (dict, optional): The query parameters to send, e.g. conditions to split only some of the items.
+        min_shards (int): The fewest shards, when the number of shards isn't given (default = 1).
+
+    Returns:
+        list[Shard]: The shards, in order of their ids. There's just the one if there are no items.
+    """
+    id_alias = _get_id_alias(endpoint.model)  # type: ignore[arg-type]
+    lowest = _probe_id(endpoint, params, id_alias, "asc")
+    highest = _probe_id(endpoint, params, id_alias, "desc")
+    if lowest is None or highest is None:
+        return [Shard(0, None, None)]
+
+    if shards is None:
+        count = _count(endpoint, params)
+        # Without a count, the ids are assumed to have no gaps
+        count = count if count is not None else highest - lowest + 1
+        shards = max(math.ceil(count / rows_per_shard), min_shards)
+    shards = max(1, min(shards, highest - lowest + 1))
+    width = (highest - lowest + 1) / shards
+    bounds = [lowest + round(width * i) for i in range(1, shards)]
+    lows: list[int | None] = [None, *bounds]
+    highs: list[int | None] = [*bounds, None]
+    return [Shard(index, low, high) for index, (low, high) in enumerate(zip(lows, highs, strict=True))]
+
+
+def _probe_id(endpoint: IPaginateable, params: RequestParams | None, id_alias: str, direction: str) -> int | None:
+    """
+    Look up the lowest or highest id, by fetching the first id in that order.
+    """
+    raw_endpoint = endpoint.with_response_mode("raw")  # type: ignore[attr-defined]
+    probe_params = {**(params or {}), "orderBy": f"{id_alias} {direction}", raw_endpoint.client._fields_param: id_alias}
+    items = raw_endpoint.paginated(1, 1, probe_params).data
+    return int(items[0][id_alias]) if items else None
+
+
+def _count(endpoint: IPaginateable, params: RequestParams | None) -> int | None:
+    count_endpoint = getattr(endpoint, "count", None)
+    if count_endpoint is None:
+        return None
+    conditions_param = endpoint.client._conditions_param  # type: ignore[attr-defined]
+    count_params = {conditions_param: params[conditions_param]} if params and conditions_param in params else None
+    result = count_endpoint.get(params=count_params)
+    return result["count"] if isinstance(result, dict) else result.count
+
+
+class WorkQueue:
+    """
+    Hands out shards to workers, from an SQLite database. Workers in any number of processes, on any number of
+    machines when the file is on a shared file system, claim shards one at a time until there are none left.
+
+    A claimed shard is handed out again once its lease has run out, in case its worker died, so the lease has to
+    be longer than a shard takes. Each claim is numbered, and only the latest claim of a shard can complete or
+    release it, so a worker that outlived its lease can tell its work was handed to another worker. The database
+    isn't put in WAL mode, which doesn't work over network file systems.
+
+    Args:
+        path (str): The database file. It's created if it doesn't exist.
+        lease (float): How many seconds a worker has to finish a shard before it's handed out again
+            (default = 3600).
+    """
+
+    def __init__(self, path: str, lease: float = 3600.0) -> None:
+        self.path = path
+        self.lease = lease
+        with self._connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS shards ("
+                "shard INTEGER PRIMARY KEY, low INTEGER, high INTEGER, status TEXT NOT NULL, worker TEXT, "
+                "claimed_at REAL, rows INTEGER, claim INTEGER NOT NULL DEFAULT 0)"
+            )
+
+    @contextlib.contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        # Each call gets its own connection, so the queue can be shared between threads and sent to other processes
+        connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+        try:
+            yield connection
+        finally:
+            connection.close()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        with self._connect() as connection:
+            connection.execute("BEGIN IMMEDIATE")
+            try:
+                yield connection
+                connection.execute("COMMIT")
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+    def add(self, shards: list[Shard]) -> list[Shard]:
+        """
+        Add shards to the queue, unless it already has them from an earlier run.
+
+        Returns:
+            list[Shard]: The shards in the queue.
+        """
+        with self._transaction() as connection:
+            if connection.execute("SELECT COUNT(*) FROM shards").fetchone()[0] == 0:
+                connection.executemany(
+                    "INSERT INTO shards (shard, low, high, status) VALUES (?, ?, ?, 'pending')",
+                    [(shard.index, shard.low, shard.high) for shard in shards],
+                )
+        return self.get_shards()
+
+    def get_shards(self) -> list[Shard]:
+        with self._connect() as connection:
+            rows = connection.execute("SELECT shard, low, high, claim FROM shards ORDER BY shard").fetchall()
+        return [Shard(*row) for row in rows]
+
+    def claim(self, worker: str) -> Shard | None:
+        """
+        Claim the next shard that's waiting, or whose lease has run out.
+
+        Returns:
+            Shard: The shard, or None if there are none left to claim.
+        """
+        now = time.time()
+        with self._transaction() as connection:
+            row = connection.execute(
+                "SELECT shard, low, high, claim + 1 FROM shards WHERE status = 'pending' "
+                "OR (status = 'claimed' AND claimed_at < ?) ORDER BY shard LIMIT 1",
+                (now - self.lease,),
+            ).fetchone()
+            if row is None:
+                return None
+            connection.execute(
+                "UPDATE shards SET status = 'claimed', worker = ?, claimed_at = ?, claim = ? WHERE shard = ?",
+                (worker, now, row[3], row[0]),
+            )
+        return Shard(*row)
+
+    def complete(self, shard: Shard, worker: str, rows: int) -> bool:
+        """
+        Mark a claimed shard as done.
+
+        Returns:
+            bool: Whether the shard was completed, or False if the worker's claim was lost, because its lease ran
+                out and the shard was handed out again.
+        """
+        with self._transaction() as connection:
+            cursor = connection.execute(
+                "UPDATE shards SET status = 'done', rows = ? "
+                "WHERE shard = ? AND worker = ? AND claim = ? AND status = 'claimed'",
+                (rows, shard.index, worker, shard.claim),
+            )
+        return cursor.rowcount == 1
+
+    def release(self, shard: Shard, worker: str) -> None:
+        """
+        Put a shard back in the queue, e.g. because its worker failed, for another worker to claim.
+        """
+        with self._transaction() as connection:
+            connection.execute(
+                "UPDATE shards SET status = 'pending', worker = NULL, claimed_at = NULL "
+                "WHERE shard = ? AND worker = ? AND claim = ? AND status = 'claimed'",
+                (shard.index, worker, shard.claim),
+            )
+
+    def get_progress(self) -> dict[str, int]:
+        """
+        Get the number of shards pending, claimed and done, and the number of rows the shards done hold.
+        """
+        with self._connect() as connection:
+            rows = connection.execute("SELECT status, COUNT(*), COALESCE(SUM(rows), 0) FROM shards GROUP BY status")
+            progress = {"pending": 0, "claimed": 0, "done": 0, "rows": 0}
+            for status, count, total in rows:
+                progress[status] = count
+                progress["rows"] += total
+        return progress
+
+
+class ShardedExtract:
+    """
+    Exports an endpoint to an NDJSON or CSV file using many processes, on one machine or several, for tables too
+    big for one process to keep up with. The endpoint's ids are split into shards (see plan_shards()), each
+    shard is exported to its own part file by whichever worker claims it from a WorkQueue, and the parts are then
+    merged into the file in order of their ids.
+
+    Each worker creates its own client with client_factory, which has to be a function defined at the top level of
+    a module so it can be sent to other processes. When rate_limit is given, every worker's client shares an
+    SQLiteRateLimiter kept in the queue's database, so the workers together stay within the rate.
+
+    Shards are exported with checkpoints, so a shard whose worker died is resumed by the worker that claims it next,
+    and the whole extract can be resumed by running it again. Each claim of a shard is exported to its own part and
+    checkpoint files, starting from a copy of the previous claim's, so a worker that's still running after its lease
+    ran out can't write over the files of the worker the shard was handed to.
+
+        def create_client():
+            return ConnectWiseManageAPIClient(...)
+
+        extract = ShardedExtract(create_client, "service.tickets", "tickets.ndjson.gz", rate_limit=20)
+        extract.run(processes=8)
+
+    To spread the work over several machines, put the path (and so the queue and part files) on a shared file
+    system, call plan() on one of them, work() on each, and merge() on one of them once every shard is done.
+
+    Args:
+        client_factory (Callable): Creates a client, in each worker.
+        endpoint (str): The endpoint to export, as its path on the client, e.g. "service.tickets".
+        path (str): The file to write.
+        format (str, optional): "ndjson" or "csv" (default = from the path's extension).
+        compression (str, optional): "gzip", "bz2" or "xz" (default = from the path's extension, or none).
+        params (dict, optional): The query parameters to send, e.g. conditions to export some of the items.
+        page_size (int): The number of items to request per page (default = 1000).
+        rate_limit (float, optional): The most requests per second, across every worker (default = no limit).
+        work_dir (str, optional): Where the queue and part files are kept, which has to be shared by every
+            worker (default = the path with ".parts" on the end).
+        lease (float): How many seconds a worker has to export a shard before it's handed out again
+            (default = 3600).
+    """
+
+    def __init__(
+        self,
+        client_factory: Callable[[], ConnectWiseClient],
+        endpoint: str,
+        path: str,
+        format: str | None = None,  # noqa: A002
+        compression: str | None = None,
+        params: RequestParams | None = None,
+        page_size: int = 1000,
+        rate_limit: float | None = None,
+        work_dir: str | None = None,
+        lease: float = 3600.0,
+    ) -> None:
+        self.format, self.compression = _get_format(path, format, compression)
+        if self.format == "parquet":
+            message = "Sharded extracts can't be written to Parquet, as the parts can't be merged, use NDJSON or CSV"
+            raise ValueError(message)
+        self.client_factory = client_factory
+        self.endpoint = endpoint
+        self.path = path
+        self.params: dict[str, Any] = dict(params) if params else {}
+        self.page_size = page_size
+        self.rate_limit = rate_limit
+        self.work_dir = work_dir if work_dir is not None else f"{path}.parts"
+        self.lease = lease
+        os.makedirs(self.work_dir, exist_ok=True)  # noqa: PTH103
+
+    @property
+    def queue(self) -> WorkQueue:
+        return WorkQueue(os.path.join(self.work_dir, "queue.sqlite"), self.lease)  # noqa: PTH118
+
+    def _get_part_path(self, shard: Shard, claim: int | None = None) -> str:
+        claim = claim if claim is not None else shard.claim
+        return os.path.join(self.work_dir, f"{shard.index:06d}.{claim}.part")  # noqa: PTH118
+
+    def _resume_claim(self, shard: Shard) -> None:
+        """
+        Start a claim of a shard from the progress of the latest claim before it that saved any.
+        """
+        part_path = self._get_part_path(shard)
+        for claim in range(shard.claim - 1, 0, -1):
+            earlier_path = self._get_part_path(shard, claim)
+            if os.path.exists(f"{earlier_path}.checkpoint"):  # noqa: PTH110
+                # The checkpoint is copied before the part, in case the earlier worker is still writing: the part
+                # is then at least as long as the checkpoint says, and resuming cuts off anything after that
+                shutil.copyfile(f"{earlier_path}.checkpoint", f"{part_path}.checkpoint")
+                shutil.copyfile(earlier_path, part_path)
+                return
+
+    def _create_client(self) -> ConnectWiseClient:
+        client = self.client_factory()
+        if self.rate_limit is not None:
+            # The client's config may be shared, so the limiter is set on a copy
+            client.config = copy.copy(client.config)
+            client.config.rate_limiter = SQLiteRateLimiter(self.queue.path, self.rate_limit)
+        return client
+
+    def _get_endpoint(self, client: ConnectWiseClient) -> IPaginateable:
+        return functools.reduce(getattr, self.endpoint.split("."), client)  # type: ignore[arg-type, return-value]
+
+    def plan(self, shards: int | None = None, rows_per_shard: int = 100_000, min_shards: int = 1) -> list[Shard]:
+        """
+        Split the endpoint into shards and queue them, unless they were queued by an earlier run.
+
+        Args:
+            shards (int, optional): The number of shards (default = as many as it takes to hold rows_per_shard
+                items each).
+            rows_per_shard (int): The number of items per shard, when the number of shards isn't given
+                (default = 100,000).
+            min_shards (int): The fewest shards, when the number of shards isn't given (default = 1).
+
+        Returns:
+            list[Shard]: The shards queued.
+        """
+        queue = self.queue
+        queued = queue.get_shards()
+        if queued:
+            return queued
+        endpoint = self._get_endpoint(self._create_client())
+        return queue.add(plan_shards(endpoint, shards, rows_per_shard, self.params, min_shards))
+
+    def work(self, worker: str | None = None) -> int:
+        """
+        Export shards until there are none left to claim.
+
+        Args:
+            worker (str, optional): Identifies the worker in the queue (default = the host name and process id).
+
+        Returns:
+            int: The number of shards exported.
+        """
+        worker = worker if worker is not None else f"{socket.gethostname()}:{os.getpid()}"
+        queue = self.queue
+        endpoint = self._get_endpoint(self._create_client())
+        conditions_param: str = endpoint.client._conditions_param  # type: ignore[attr-defined]
+        key_field = _get_id_alias(endpoint.model)  # type: ignore[arg-type]
+        exported = 0
+        while (shard := queue.claim(worker)) is not None:
+            params = dict(self.params)
+            condition = shard.get_condition(key_field)
+            if condition is not None:
+                conditions = params.get(conditions_param)
+                params[conditions_param] = f"({conditions}) and {condition}" if conditions else condition
+            part_path = self._get_part_path(shard)
+            self._resume_claim(shard)
+            try:
+                rows = export(
+                    endpoint,
+                    part_path,
+                    self.format,
+                    self.compression,
+                    params,
+                    self.page_size,
+                    checkpoint=f"{part_path}.checkpoint",
+                    header=False,
+                )
+            except BaseException:
+                queue.release(shard, worker)
+                raise
+            # When the lease ran out, the shard is another worker's now, and its part will be merged instead
+            if queue.complete(shard, worker, rows):
+                exported += 1
+        return exported
+
+    def merge(self) -> int:
+        """
+        Merge the shards' parts into the file, in order, once every shard is done, and delete the work directory.
+
+        Returns:
+            int: The number of items exported.
+        """
+        queue = self.queue
+        progress = queue.get_progress()
+        if progress["pending"] or progress["claimed"]:
+            message = f"{progress['pending'] + progress['claimed']} shards haven't been exported yet"
+            raise RuntimeError(message)
+
+        with open(self.path, "wb") as file:  # noqa: PTH123
+            if self.format == "csv":
+                file.write(self._get_csv_header())
+            # Each shard's part is the one written by the claim that completed it
+            for shard in queue.get_shards():
+                with open(self._get_part_path(shard), "rb") as part:  # noqa: PTH123
+                    shutil.copyfileobj(part, file)
+        shutil.rmtree(self.work_dir)
+        return progress["rows"]
+
+    def _get_csv_header(self) -> bytes:
+        endpoint = self._get_endpoint(self.client_factory())
+        text = io.StringIO()
+        csv.writer(text).writerow(_Flattener(endpoint.model).columns)
+        data = text.getvalue().encode()
+        return COMPRESSIONS[self.compression](data) if self.compression is not None else data
+
+    def run(self, processes: int | None = None, shards: int | None = None, rows_per_shard: int = 100_000) -> int:
+        """
+        Plan, export and merge the extract, with a pool of worker processes on this machine.
+
+        Args:
+            processes (int, optional): The number of worker processes (default = one per CPU).
+            shards (int, optional): The number of shards (default = enough to hold rows_per_shard items each, and
+                at least one per process).
+            rows_per_shard (int): The number of items per shard, when the number of shards isn't given
+                (default = 100,000).
+
+        Returns:
+            int: The number of items exported.
+        """
+        processes = processes if processes is not None else os.cpu_count() or 1
+        planned = self.plan(shards, rows_per_shard, min_shards=processes)
+        with ProcessPoolExecutor(processes) as pool:
+            futures = [pool.submit(self.work) for _ in range(min(processes, len(planned)))]
+            for future in futures:
+                future.result()
+        return self.merge()
@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping
+
+
+class SingleFlightStats:
+    """
+    Counts of how many requests were coalesced.
+
+    Attributes:
+        calls (int): Requests that went to the API.
+        saved (int): Requests that waited on an identical request already in flight and shared its response, instead
+            of going to the API themselves.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.saved = 0
+
+    @property
+    def saved_ratio(self) -> float:
+        requests = self.calls + self.saved
+        return self.saved / requests if requests else 0.0
+
+    def __repr__(self) -> str:
+        return f"SingleFlightStats(calls={self.calls}, saved={self.saved})"
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """
+    Coalesces identical GET requests made at the same time, from any number of threads or tasks, into one request to
+    the API whose response they all share. Set it in the client's Config to use it, e.g. for a web service where
+    many requests look up the same company or board at once.
+
+    Requests are identical if they're for the same URL, with the same query parameters and credentials. Only requests
+    that overlap are coalesced: once the response has arrived, the next request goes to the API again (see
+    ResponseCache to reuse responses for longer). If the request fails, every caller waiting on it gets the error.
+    Streamed requests (see stream_all()) aren't coalesced.
+
+    Example:
+        single_flight = SingleFlight()
+        manage_api_client = ConnectWiseManageAPIClient(..., config=Config(single_flight=single_flight))
+        ...
+        single_flight.stats  # SingleFlightStats(calls=120, saved=380)
+    """
+
+    def __init__(self) -> None:
+        self.stats = SingleFlightStats()
+        self._calls: dict[tuple, _Call] = {}
+        self._async_calls: dict[tuple, asyncio.Future] = {}
+        self._lock = threading.Lock()
+
+    def get_key(self, url: str, params: Mapping[str, Any] | None, headers: Mapping[str, str]) -> tuple:
+        credentials = headers.get("Authorization") or headers.get("authorization")
+        return (url, tuple(sorted((k, str(v)) for k, v in (params or {}).items())), credentials)
+
+    def do(self, key: tuple, request: Callable[[], Any]) -> Any:  # noqa: ANN401
+        """
+        Make a request, or wait for the identical request already in flight and return its response.
+
+        Args:
+            key (tuple): Identifies the request (see get_key()).
+            request (Callable): Makes the request, if it isn't already in flight.
+
+        Returns:
+            The response.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+                self.stats.calls += 1
+            else:
+                self.stats.saved += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = request()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: tuple, request: Callable[[], Awaitable[Any]]) -> Any:  # noqa: ANN401
+        """
+        Make a request, or wait for the identical request already in flight on the same event loop and return its
+        response. See do().
+        """
+        # Futures belong to an event loop, so requests are only coalesced with others on the same loop
+        loop = asyncio.get_running_loop()
+        loop_key = (id(loop), *key)
+        with self._lock:
+            future = self._async_calls.get(loop_key)
+            leader = future is None
+            if leader:
+                future = self._async_calls[loop_key] = loop.create_future()
+                self.stats.calls += 1
+            else:
+                self.stats.saved += 1
+
+        if not leader:
+            try:
+                # Shielded, so a waiter being cancelled doesn't cancel the request for everyone else
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            # The task making the request was cancelled rather than this one, so make it again
+            return await self.do_async(key, request)
+
+        try:
+            result = await request()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # Marks the error as retrieved, as there may be no waiters to retrieve it
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._async_calls[loop_key]
@@ -0,0 +1,343 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any
+
+from pyconnectwise.hydration import _get_id_alias, _get_value
+from pyconnectwise.models.base.conditions import format_value
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pyconnectwise.interfaces import IPaginateable
+    from pyconnectwise.types import RequestParams
+
+
+class SyncState:
+    """
+    Where a DeltaSync left off: its high-water mark, the ids it's seen, and when it last checked for deletions.
+
+    Attributes:
+        mark (datetime): The lastUpdated time everything up to has been synced (None before the first sync).
+        ids (set): The ids of the items synced, to tell which have been deleted.
+        recent (dict): A digest of each item updated around the mark, by id. These items are fetched again by the
+            next sync, and only passed on again if they've changed since.
+        last_deletion_check (float): When deletions were last checked for, as a Unix timestamp.
+    """
+
+    def __init__(
+        self,
+        mark: datetime | None = None,
+        ids: set[Any] | None = None,
+        recent: dict[Any, str] | None = None,
+        last_deletion_check: float | None = None,
+    ) -> None:
+        self.mark = mark
+        self.ids = ids if ids is not None else set()
+        self.recent = recent if recent is not None else {}
+        self.last_deletion_check = last_deletion_check
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "mark": self.mark.isoformat() if self.mark is not None else None,
+            "ids": sorted(self.ids),
+            "recent": list(self.recent.items()),
+            "last_deletion_check": self.last_deletion_check,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> SyncState:
+        return cls(
+            datetime.fromisoformat(data["mark"]) if data["mark"] is not None else None,
+            set(data["ids"]),
+            dict(data["recent"]),
+            data["last_deletion_check"],
+        )
+
+
+class MemorySyncStateStore:
+    """
+    Keeps sync states in memory, for syncs that only need to pick up where they left off within one process.
+    """
+
+    def __init__(self) -> None:
+        self._states: dict[str, dict[str, Any]] = {}
+
+    def get(self, key: str) -> SyncState | None:
+        data = self._states.get(key)
+        return SyncState.from_dict(data) if data is not None else None
+
+    def set(self, key: str, state: SyncState) -> None:  # noqa: A003
+        self._states[key] = state.to_dict()
+
+
+class JSONSyncStateStore:
+    """
+    Keeps sync states in a JSON file, so syncs pick up where they left off across runs. The file is replaced
+    atomically, so a crash mid-write leaves the previous states.
+
+    Args:
+        path (str): The file. It's created on the first sync.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, Any]:
+        try:
+            with open(self.path) as f:  # noqa: PTH123
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def get(self, key: str) -> SyncState | None:
+        with self._lock:
+            data = self._load().get(key)
+        return SyncState.from_dict(data) if data is not None else None
+
+    def set(self, key: str, state: SyncState) -> None:  # noqa: A003
+        with self._lock:
+            states = self._load()
+            states[key] = state.to_dict()
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w") as f:  # noqa: PTH123
+                json.dump(states, f)
+            os.replace(temp_path, self.path)  # noqa: PTH105
+
+
+class SyncSink(ABC):
+    """
+    Where a DeltaSync sends its changes. Subclass it to write them to a database, a search index, a queue etc.
+    """
+
+    @abstractmethod
+    def upsert(self, items: list[Any]) -> None:
+        """
+        Insert or update items that are new or have changed, a page at a time. An item may be passed again even
+        if it hasn't changed, so this has to be idempotent.
+        """
+
+    @abstractmethod
+    def delete(self, ids: list[Any]) -> None:
+        """
+        Delete the items with the given ids, which have been deleted (or no longer match the sync's conditions).
+        """
+
+
+class MemorySink(SyncSink):
+    """
+    Keeps the synced items in a dict, by id.
+    """
+
+    def __init__(self, id_alias: str = "id") -> None:
+        self.id_alias = id_alias
+        self.items: dict[Any, Any] = {}
+
+    def upsert(self, items: list[Any]) -> None:
+        for item in items:
+            self.items[_get_value(item, "id", self.id_alias)] = item
+
+    def delete(self, ids: list[Any]) -> None:
+        for id_ in ids:
+            self.items.pop(id_, None)
+
+
+class SyncResult:
+    """
+    What a sync did.
+
+    Attributes:
+        upserted (int): Items passed to the sink as new or changed.
+        deleted (int): Ids passed to the sink as deleted.
+        full (bool): Whether it was the first sync, which fetches everything.
+        checked_deletions (bool): Whether it checked for deletions.
+    """
+
+    def __init__(self, full: bool, checked_deletions: bool) -> None:  # noqa: FBT001
+        self.upserted = 0
+        self.deleted = 0
+        self.full = full
+        self.checked_deletions = checked_deletions
+
+    def __repr__(self) -> str:
+        return (
+            f"SyncResult(upserted={self.upserted}, deleted={self.deleted}, full={self.full}, "
+            f"checked_deletions={self.checked_deletions})"
+        )
+
+
+class DeltaSync:
+    """
+    Keeps a copy of an endpoint's items up to date, fetching only the items that have changed since the last sync
+    (by their _info.lastUpdated), so each sync costs as much as the churn since the last one rather than the size
+    of the table. The first sync fetches everything.
+
+    Each sync keeps a high-water mark in its state store, per endpoint and conditions. The next sync asks for the
+    items updated since the mark less the overlap, to allow for the clock difference between this machine and the
+    API, items updated while the last sync was running, and items updated in the same second as the mark. Items
+    fetched again from that window are only passed on if they've changed.
+
+    The API doesn't say what's been deleted, so every deletion_check_interval seconds the sync also fetches every
+    id (and only the ids) matching the conditions, and passes on the ones it's synced that are gone. Items that no
+    longer match the conditions are passed on as deleted too.
+
+        sync = DeltaSync(client.service.tickets, MySink(), JSONSyncStateStore("sync.json"))
+        sync.run()  # SyncResult(upserted=12, deleted=1, full=False, checked_deletions=False)
+
+    Args:
+        endpoint (IPaginateable): The endpoint to sync. Its items must have an id and _info.lastUpdated.
+        sink (SyncSink): Where the changes go.
+        store (optional): Where the sync's state is kept (default = MemorySyncStateStore()).
+        params (dict, optional): The query parameters to send, e.g. conditions to sync a subset of the items.
+        page_size (int): The number of items to request per page (default = 1000).
+        overlap (float): How many seconds before the mark to fetch again (default = 300).
+        deletion_check_interval (float): How many seconds apart to check for deletions (default = 86400, daily).
+    """
+
+    def __init__(
+        self,
+        endpoint: IPaginateable,
+        sink: SyncSink,
+        store: Any = None,  # noqa: ANN401
+        params: RequestParams | None = None,
+        page_size: int = 1000,
+        overlap: float = 300.0,
+        deletion_check_interval: float = 86400.0,
+    ) -> None:
+        self.endpoint = endpoint
+        self.sink = sink
+        self.store = store if store is not None else MemorySyncStateStore()
+        self.params: dict[str, Any] = dict(params) if params else {}
+        self.page_size = page_size
+        self.overlap = overlap
+        self.deletion_check_interval = deletion_check_interval
+        self._conditions_param: str = endpoint.client._conditions_param  # type: ignore[attr-defined]
+        self._id_alias = _get_id_alias(endpoint.model)  # type: ignore[arg-type]
+
+    @property
+    def key(self) -> str:
+        """
+        Identifies the sync's state: the endpoint's URL and the query parameters.
+        """
+        params = "&".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.endpoint._get_endpoint_url()}?{params}"  # type: ignore[attr-defined]
+
+    def run(self, check_deletions: bool | None = None) -> SyncResult:
+        """
+        Sync the changes since the last sync.
+
+        Args:
+            check_deletions (bool, optional): Whether to check for deletions, regardless of when they were last
+                checked for (default = when the deletion_check_interval has passed).
+
+        Returns:
+            SyncResult: What the sync did.
+        """
+        key = self.key
+        state = self.store.get(key) or SyncState()
+        started = datetime.now(timezone.utc).replace(microsecond=0)
+        full = state.mark is None
+        if check_deletions is None:
+            check_deletions = not full and (
+                state.last_deletion_check is None
+                or time.time() - state.last_deletion_check >= self.deletion_check_interval
+            )
+        result = SyncResult(full, check_deletions)
+
+        result.upserted = self._sync_changes(state, started)
+        if check_deletions:
+            deleted = sorted(state.ids - self._get_ids())
+            if deleted:
+                self.sink.delete(deleted)
+                state.ids.difference_update(deleted)
+            result.deleted = len(deleted)
+        if full or check_deletions:
+            state.last_deletion_check = time.time()
+        self.store.set(key, state)
+        return result
+
+    def _sync_changes(self, state: SyncState, started: datetime) -> int:
+        """
+        Pass on the items updated since the mark to the sink, and move the mark up.
+
+        Returns:
+            int: The number of items passed on.
+        """
+        params = dict(self.params)
+        if state.mark is not None:
+            since = state.mark - timedelta(seconds=self.overlap)
+            self._add_condition(params, f"lastUpdated >= {format_value(since)}")
+        overlap = timedelta(seconds=self.overlap)
+        # The items the next sync may fetch again, and when they were updated
+        window: dict[Any, tuple[datetime, Any]] = {}
+        latest = state.mark
+        upserted = 0
+        for page in self._get_pages(self.endpoint, params):
+            changed = []
+            for item in page:
+                id_ = _get_value(item, "id", self._id_alias)
+                last_updated = _get_last_updated(item)
+                if last_updated is not None:
+                    updated = _parse_time(last_updated)
+                    latest = updated if latest is None else max(latest, updated)
+                    window[id_] = (updated, item)
+                # Items fetched again from the overlap are compared by their contents rather than their lastUpdated,
+                # as they may have changed again within the same second
+                if id_ not in state.recent or state.recent[id_] != _get_digest(item):
+                    changed.append(item)
+            if changed:
+                self.sink.upsert(changed)
+                upserted += len(changed)
+            state.ids.update(_get_value(item, "id", self._id_alias) for item in page)
+            if latest is not None:
+                window_start = min(latest, started) - overlap
+                window = {id_: value for id_, value in window.items() if value[0] >= window_start}
+
+        # The mark can't pass the time the sync started, as items updated after that may have been missed, or the
+        # latest lastUpdated seen, in case this machine's clock is ahead of the API's
+        mark = min(latest, started) if latest is not None else started
+        state.mark = max(mark, state.mark) if state.mark is not None else mark
+        window_start = state.mark - overlap
+        state.recent = {id_: _get_digest(item) for id_, (updated, item) in window.items() if updated >= window_start}
+        return upserted
+
+    def _add_condition(self, params: dict[str, Any], condition: str) -> None:
+        conditions = params.get(self._conditions_param)
+        params[self._conditions_param] = f"({conditions}) and {condition}" if conditions else condition
+
+    def _get_pages(self, endpoint: Any, params: dict[str, Any]) -> Iterator[list[Any]]:  # noqa: ANN401
+        response = endpoint.keyset_paginated(self.page_size, params, "id")
+        while response.has_data:
+            yield response.data
+            response.get_next_page()
+
+    def _get_ids(self) -> set[Any]:
+        """
+        Fetch the ids of every item matching the sync's conditions.
+        """
+        endpoint = self.endpoint.with_response_mode("raw")  # type: ignore[attr-defined]
+        params = {**self.params, endpoint.client._fields_param: self._id_alias}
+        return {item[self._id_alias] for page in self._get_pages(endpoint, params) for item in page}
+
+
+def _get_last_updated(item: Any) -> str | None:  # noqa: ANN401
+    info = item.get("_info") if isinstance(item, dict) else getattr(item, "info", None)
+    return info.get("lastUpdated") if info else None
+
+
+def _parse_time(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value)
+    # The API gives times in UTC
+    return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=timezone.utc)
+
+
+def _get_digest(item: Any) -> str:  # noqa: ANN401
+    data = json.dumps(item, sort_keys=True) if isinstance(item, dict) else item.model_dump_json()
+    return hashlib.sha256(data.encode()).hexdigest()
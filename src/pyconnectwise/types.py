@@ -40,3 +40,4 @@ RequestParams: TypeAlias = ConnectWiseManageRequestParams | ConnectWiseAutomateR
 PatchRequestData: TypeAlias = list[Patch]
 RequestData: TypeAlias = JSON | PatchRequestData
 RequestMethod: TypeAlias = Literal["GET", "POST", "PUT", "PATCH", "DELETE"]
+ResponseMode: TypeAlias = Literal["model", "raw"]
@@ -1,11 +1,9 @@
 from __future__ import annotations
 
-import inspect
-import re
-from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
+from pyconnectwise.models.base.conditions import format_value
 from pyconnectwise.utils.naming import to_camel_case
 
 if TYPE_CHECKING:
@@ -26,22 +24,7 @@ class Condition(Generic[T]):
         self._field = ""
 
     def field(self: Condition[T], selector: Callable[[type[T]], Any]) -> Condition[T]:
-        field = ""
-
-        frame = inspect.currentframe()
-        try:
-            context = inspect.getframeinfo(frame.f_back).code_context
-            caller_lines = "".join([line.strip() for line in context])
-            m = re.search(r"field\s*\(([^)]+)\)", caller_lines)
-            if m:
-                caller_lines = m.group(1)
-
-            field = to_camel_case("/".join(caller_lines.replace("(", "").replace(")", "").split(".")[1:]))
-
-        finally:
-            del frame
-
-        self._condition_string += field
+        self._condition_string += _get_selected_field(selector)
         return self
 
     def equals(self: Condition[T], value: Any) -> Condition[T]:  # noqa: ANN401
@@ -50,7 +33,7 @@ class Condition(Generic[T]):
         return self
 
     def not_equals(self: Condition[T], value: Any) -> Condition[T]:  # noqa: ANN401
-        self._condition_string += " = "
+        self._condition_string += " != "
         self.__add_typed_value_to_string(value, type(value))
         return self
 
@@ -105,57 +88,20 @@ class Condition(Generic[T]):
         value: Any,  # noqa: ANN401
         type: type,  # noqa: A002
     ):
-        if type is str:
-            self._condition_string += f'"{value}"'
-        elif type is int:  # noqa: SIM114
-            self._condition_string += str(value)
-        elif type is bool:
-            self._condition_string += str(value)
-        elif type is datetime:
-            self._condition_string += f"[{value}]"
-        else:
-            self._condition_string += f'"{value}"'
+        self._condition_string += format_value(value)
 
     def and_(self: Condition[T], selector: Callable[[type[T]], Any] | None = None) -> Condition[T]:
         self._condition_string += " AND "
 
         if selector is not None:
-            field = ""
-            frame = inspect.currentframe()
-            try:
-                context = inspect.getframeinfo(frame.f_back).code_context
-                caller_lines = "".join([line.strip() for line in context])
-                m = re.search(r"and_\s*\(([^)]+)\)", caller_lines)
-                if m:
-                    caller_lines = m.group(1)
-
-                field = "/".join(caller_lines.replace("(", "").replace(")", "").split(".")[1:])
-
-            finally:
-                del frame
-
-            self._condition_string += field
+            self._condition_string += _get_selected_field(selector)
         return self
 
     def or_(self: Condition[T], selector: Callable[[type[T]], Any] | None = None) -> Condition[T]:
         self._condition_string += " OR "
 
         if selector is not None:
-            field = ""
-            frame = inspect.currentframe()
-            try:
-                context = inspect.getframeinfo(frame.f_back).code_context
-                caller_lines = "".join([line.strip() for line in context])
-                m = re.search(r"or_\s*\(([^)]+)\)", caller_lines)
-                if m:
-                    caller_lines = m.group(1)
-
-                field = "/".join(caller_lines.replace("(", "").replace(")", "").split(".")[1:])
-
-            finally:
-                del frame
-
-            self._condition_string += field
+            self._condition_string += _get_selected_field(selector)
         return self
 
     def wrap(self: Condition[T], condition: Callable[[Condition[T]], Condition[T]]) -> Condition[T]:
@@ -164,3 +110,25 @@ class Condition(Generic[T]):
 
     def __str__(self: Condition[T]) -> str:
         return self._condition_string.strip()
+
+
+class _FieldRecorder:
+    """
+    Stands in for the model passed to a field selector, recording the attributes the selector reads.
+    """
+
+    __slots__ = ("names",)
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+
+    def __getattr__(self, name: str) -> _FieldRecorder:
+        self.names.append(name)
+        return self
+
+
+def _get_selected_field(selector: Callable[[Any], Any]) -> str:
+    # Run the selector against a recorder, rather than reading the caller's source, to find the field it selects
+    recorder = _FieldRecorder()
+    selector(recorder)
+    return "/".join(to_camel_case(name) for name in recorder.names)
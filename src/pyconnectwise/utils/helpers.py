@@ -1,8 +1,20 @@
+from __future__ import annotations
+
 import re
-from datetime import datetime
-from typing import Any
+from functools import cache
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from pydantic import TypeAdapter
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    import httpx
+    from pydantic import BaseModel
+    from requests import Response
+    from requests.structures import CaseInsensitiveDict
 
-from requests.structures import CaseInsensitiveDict
+TModel = TypeVar("TModel", bound="BaseModel")
 
 
 def cw_format_datetime(dt: datetime) -> str:
@@ -99,3 +111,53 @@ def parse_link_headers(  # noqa: C901
         result["has_prev_page"] = has_prev_page
 
     return result
+
+
+def get_reason_phrase(response: Response | httpx.Response) -> str:
+    """
+    Returns the HTTP reason phrase of a response, regardless of which HTTP library produced it.
+
+    Args:
+        response: A requests or httpx response.
+
+    Returns:
+        str: The reason phrase, or an empty string if the server didn't send one.
+    """
+    reason = getattr(response, "reason", None)
+    if reason is None:
+        reason = getattr(response, "reason_phrase", "")
+    return reason or ""
+
+
+def is_timeout_response(response: Response | httpx.Response) -> bool:
+    """
+    Checks whether a response is a ConnectWise timeout error, which is worth retrying.
+
+    If timeout is mentioned anywhere in a HTTP 500 response then we'll retry.
+    Ideally we'd return immediately on any non-timeout errors (since
+    retries won't help much there), but err towards classifying too much
+    as retries instead of too little.
+    """
+    return response.status_code == 500 and "timeout" in (response.text + get_reason_phrase(response)).lower()
+
+
+@cache
+def get_list_adapter(model: type[TModel]) -> TypeAdapter[list[TModel]]:
+    """
+    Returns a TypeAdapter for a list of the given model, which can validate a JSON array of items straight from
+    the raw response body, without decoding it into Python objects first. Building one isn't free, so there's
+    only ever one per model.
+
+    Args:
+        model (type[BaseModel]): The model of the items in the list.
+
+    Returns:
+        TypeAdapter[list[BaseModel]]: The cached TypeAdapter.
+
+    Example:
+        tickets = get_list_adapter(Ticket).validate_json(response.content)
+    """
+    # Models that refer to each other are only complete once the models they refer to are defined, which
+    # pydantic would otherwise only check when the model itself validates something, not when it's wrapped
+    model.model_rebuild()
+    return TypeAdapter(list[model])  # type: ignore[valid-type]
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import codecs
+import json
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+# Large enough that a whole record usually arrives in one chunk, small enough to keep memory flat
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",]"
+
+
+class JSONArrayDecoder:
+    """
+    Incrementally decodes a JSON array, such as a page of results from the API, as its bytes arrive.
+
+    Feed it chunks of the response body and it returns each element of the array as soon as the element
+    is complete, so only one element (plus at most one partial chunk) is ever held in memory rather than
+    the whole body and every decoded element at once.
+
+    Example:
+        decoder = JSONArrayDecoder()
+        for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+            for item in decoder.feed(chunk):
+                ...
+        decoder.close()
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._started = False
+        self._finished = False
+
+    def feed(self, chunk: bytes) -> list[Any]:
+        """
+        Add the next chunk of the body and return the array elements completed by it.
+
+        Args:
+            chunk (bytes): The next chunk of the response body.
+
+        Returns:
+            list: The decoded elements, in order. Empty if the chunk didn't complete an element.
+
+        Raises:
+            json.JSONDecodeError: If the body isn't a JSON array.
+        """
+        self._buffer += self._text_decoder.decode(chunk)
+        return self._drain(final=False)
+
+    def close(self) -> list[Any]:
+        """
+        Signal the end of the body, returning any remaining elements.
+
+        Returns:
+            list: The decoded elements left in the buffer.
+
+        Raises:
+            json.JSONDecodeError: If the body ended before the array did.
+        """
+        self._buffer += self._text_decoder.decode(b"", final=True)
+        items = self._drain(final=True)
+        if not self._finished:
+            raise json.JSONDecodeError("Unterminated JSON array", self._buffer, len(self._buffer))  # noqa: TRY003
+        return items
+
+    def _drain(self, *, final: bool) -> list[Any]:  # noqa: C901
+        items = []
+        buffer = self._buffer
+        index = 0
+        while not self._finished:
+            while index < len(buffer) and buffer[index] in _WHITESPACE:
+                index += 1
+            if index == len(buffer):
+                break
+
+            if not self._started:
+                if buffer[index] != "[":
+                    raise json.JSONDecodeError("Expected a JSON array", buffer, index)  # noqa: TRY003
+                self._started = True
+                index += 1
+                continue
+            if buffer[index] == "]":
+                self._finished = True
+                index += 1
+                break
+            if buffer[index] == ",":
+                index += 1
+                continue
+
+            try:
+                item, end = self._decoder.raw_decode(buffer, index)
+            except json.JSONDecodeError:
+                if final:
+                    raise
+                # Most likely the element is cut off by the end of the chunk, wait for more
+                break
+            if end == len(buffer) or buffer[end] not in _DELIMITERS:
+                if not final:
+                    # The element may continue in the next chunk, e.g. a number cut off as "1e" of "1e5"
+                    break
+                if end < len(buffer):
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buffer, end)  # noqa: TRY003
+            items.append(item)
+            index = end
+
+        self._buffer = buffer[index:]
+        return items
+
+
+def iter_json_array(chunks: Iterable[bytes]) -> Iterator[Any]:
+    """
+    Yield each element of a JSON array from an iterable of byte chunks, e.g. `response.iter_content()`.
+
+    Args:
+        chunks: The chunks of the JSON body.
+
+    Yields:
+        Any: Each decoded element of the array, in order.
+    """
+    decoder = JSONArrayDecoder()
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes]) -> AsyncIterator[Any]:
+    """
+    Yield each element of a JSON array from an async iterable of byte chunks, e.g. `response.aiter_bytes()`.
+
+    Args:
+        chunks: The chunks of the JSON body.
+
+    Yields:
+        Any: Each decoded element of the array, in order.
+    """
+    decoder = JSONArrayDecoder()
+    async for chunk in chunks:
+        for item in decoder.feed(chunk):
+            yield item
+    for item in decoder.close():
+        yield item
@@ -3,6 +3,7 @@ from pathlib import Path
 
 import typer
 
+from pyconnectwise_generator.model_splitter import split_models_module
 from pyconnectwise_generator.normalize_schema_refs import normalize_json_schema
 
 from .models import generate_models
@@ -22,7 +23,9 @@ def generate_manage_code(
     *,
     gen_models: bool = True,
     gen_endpoints: bool = True,
+    gen_async: bool = True,
     endpoint_output_path: str = "src/pyconnectwise/endpoints/manage",
+    async_endpoint_output_path: str = "src/pyconnectwise/endpoints/manage_async",
     model_output_path: str = "src/pyconnectwise/models/manage",
     client_output_path: str = "src/pyconnectwise/clients",
 ) -> None:
@@ -31,8 +34,15 @@ def generate_manage_code(
     if gen_models:
         logging.info("Generating models")
         generate_models(schema, Path(model_output_path) / "__init__.py")
+        split_models_module(Path(model_output_path), "Models for the ConnectWise Manage API.")
     if gen_endpoints:
-        generate_manage(endpoint_output_path, model_output_path, client_output_path, schema)
+        generate_manage(
+            endpoint_output_path,
+            model_output_path,
+            client_output_path,
+            schema,
+            async_endpoint_output_path=async_endpoint_output_path if gen_async else None,
+        )
 
     print("After generating run `ruff src/pyconnectwise/models/manage --fix --unsafe-fixes`")
 
@@ -43,7 +53,9 @@ def generate_automate_code(  # noqa: ANN201
     *,
     gen_models: bool = True,
     gen_endpoints: bool = True,
+    gen_async: bool = True,
     endpoint_output_path: str = "src/pyconnectwise/endpoints/automate",
+    async_endpoint_output_path: str = "src/pyconnectwise/endpoints/automate_async",
     model_output_path: str = "src/pyconnectwise/models/automate",
     client_output_path: str = "src/pyconnectwise/clients",
 ):
@@ -53,8 +65,15 @@ def generate_automate_code(  # noqa: ANN201
     # Does this need normalize_json_schema too??
     if gen_models:
         generate_models(schema, Path(model_output_path) / "__init__.py")
+        split_models_module(Path(model_output_path), "Models for the ConnectWise Automate API.")
     if gen_endpoints:
-        generate_automate(endpoint_output_path, model_output_path, client_output_path, schema)
+        generate_automate(
+            endpoint_output_path,
+            model_output_path,
+            client_output_path,
+            schema,
+            async_endpoint_output_path=async_endpoint_output_path if gen_async else None,
+        )
 
     print("After generating run `ruff src/pyconnectwise/models/automate --fix --unsafe-fixes`")
 
@@ -20,25 +20,43 @@ def create_null_client(client_output_path: str, client_type: Literal["automate",
     )
 
 
-def generate_manage_client(client_output_path: str, endpoints: list[str]) -> None:
-    imports = [f"from pyconnectwise.endpoints.manage.{endpoint} import {endpoint}" for endpoint in endpoints]
+def generate_manage_client(client_output_path: str, endpoints: list[str], *, is_async: bool = False) -> None:
+    endpoint_package = "manage_async" if is_async else "manage"
+    imports = [
+        f"from pyconnectwise.endpoints.{endpoint_package}.{endpoint} import {endpoint}" for endpoint in endpoints
+    ]
     endpoint_registrations = [
         {"field_name": endpoint.replace("Endpoint", "").lower(), "class_name": endpoint} for endpoint in endpoints
     ]
-    client_code = manage_client_template.render(imports=imports, endpoints=endpoint_registrations)
+    client_code = manage_client_template.render(
+        imports=imports,
+        endpoints=endpoint_registrations,
+        endpoint_package=endpoint_package,
+        is_async=is_async,
+    )
     save_py_file(
-        os.path.join(client_output_path, "manage_client.py"),  # noqa: PTH118
+        os.path.join(client_output_path, "async_manage_client.py" if is_async else "manage_client.py"),  # noqa: PTH118
         client_code,
     )
 
 
-def generate_automate_client(client_output_path: str, endpoints: list[str]) -> None:
-    imports = [f"from pyconnectwise.endpoints.automate.{endpoint} import {endpoint}" for endpoint in endpoints]
+def generate_automate_client(client_output_path: str, endpoints: list[str], *, is_async: bool = False) -> None:
+    endpoint_package = "automate_async" if is_async else "automate"
+    imports = [
+        f"from pyconnectwise.endpoints.{endpoint_package}.{endpoint} import {endpoint}" for endpoint in endpoints
+    ]
     endpoint_registrations = [
         {"field_name": endpoint.replace("Endpoint", "").lower(), "class_name": endpoint} for endpoint in endpoints
     ]
-    client_code = automate_client_template.render(imports=imports, endpoints=endpoint_registrations)
+    client_code = automate_client_template.render(
+        imports=imports,
+        endpoints=endpoint_registrations,
+        endpoint_package=endpoint_package,
+        is_async=is_async,
+    )
     save_py_file(
-        os.path.join(client_output_path, "automate_client.py"),  # noqa: PTH118
+        os.path.join(  # noqa: PTH118
+            client_output_path, "async_automate_client.py" if is_async else "automate_client.py"
+        ),
         client_code,
     )
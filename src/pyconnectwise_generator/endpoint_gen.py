@@ -30,6 +30,7 @@ def generate_endpoint(  # noqa: ANN201, C901
     relationships: dict,
     *,
     is_manage: bool,
+    is_async: bool = False,
 ):
     formatted_path = format_endpoint_path(path)
     endpoint_class_name = get_endpoint_class_name_from_path(formatted_path)
@@ -191,6 +192,7 @@ def generate_endpoint(  # noqa: ANN201, C901
         has_id_child=has_id_child,
         raw_path=path,
         is_manage=is_manage,
+        is_async=is_async,
         interfaces=interfaces,
     )
 
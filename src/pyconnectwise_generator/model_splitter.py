@@ -0,0 +1,170 @@
+import ast
+import itertools
+import re
+from pathlib import Path
+
+from pyconnectwise_generator.utils.fs import save_py_file
+
+INIT_TEMPLATE = '''"""
+{docstring}
+
+Each model is defined in its own submodule, which is only imported the first time the model is accessed,
+along with the models it refers to:
+
+    from {package} import {example}
+
+Importing this package doesn't define any models, so it's cheap no matter how many models there are.
+"""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+{type_checking_imports}
+
+_MODEL_MODULES = {{
+{model_modules}
+}}
+
+__all__ = list(_MODEL_MODULES)
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {{__name__!r}} has no attribute {{name!r}}")  # noqa: TRY003
+    model = getattr(importlib.import_module(f"{{__name__}}.{{module_name}}"), name)
+    # Cache the model so later lookups don't go through __getattr__ again
+    globals()[name] = model
+    return model
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *_MODEL_MODULES]
+'''
+
+
+def model_module_name(model_name: str) -> str:
+    """
+    Get the name of the submodule a model is defined in, e.g. GLExportSettings -> gl_export_settings.
+
+    Args:
+        model_name (str): The model's class name.
+
+    Returns:
+        str: The snake case module name.
+    """
+    return re.sub(r"(?<=[a-z0-9])(?=[A-Z])|(?<=[A-Z])(?=[A-Z][a-z])", "_", model_name).lower()
+
+
+def split_models_module(package_dir: Path, docstring: str) -> None:
+    """
+    Split the single models module written by datamodel-codegen (package_dir/__init__.py) into one submodule
+    per model, and replace it with a package that imports each model lazily through a module __getattr__.
+
+    The model's base class is imported at the top of its submodule, since it's needed to define the model.
+    Models only referred to in field annotations are imported at the bottom instead, after the model is
+    defined, so that models referring to each other can import each other. Pydantic resolves those annotations
+    when the model is first used.
+
+    Args:
+        package_dir (Path): The models package, e.g. src/pyconnectwise/models/manage
+        docstring (str): The first line of the package's docstring.
+    """
+    init_path = package_dir / "__init__.py"
+    source = init_path.read_text()
+    lines = source.splitlines()
+    module = ast.parse(source)
+    package = ".".join(package_dir.parts[package_dir.parts.index("pyconnectwise") :])
+
+    header_comments = "\n".join(itertools.takewhile(lambda line: line.startswith("#"), lines))
+
+    # Clear out the submodules from the last split, in case models have been removed since
+    for old_module in package_dir.glob("*.py"):
+        if old_module != init_path:
+            old_module.unlink()
+
+    # Map each imported name (other than __future__) to the module it comes from, to copy only the ones used
+    header_imports = {
+        alias.asname or alias.name: node.module
+        for node in module.body
+        if isinstance(node, ast.ImportFrom) and node.module != "__future__"
+        for alias in node.names
+    }
+
+    # Anything else at the top level is a model_rebuild() call for a self referencing model. Those are rebuilt
+    # by pydantic when first used, so the calls can go.
+    classes = [node for node in module.body if isinstance(node, ast.ClassDef)]
+    model_names = {node.name for node in classes}
+    base_models = {node.name: {b.id for b in node.bases if isinstance(b, ast.Name)} & model_names for node in classes}
+    used_names = {
+        node.name: {n.id for n in ast.walk(node) if isinstance(n, ast.Name) and isinstance(n.ctx, ast.Load)}
+        for node in classes
+    }
+    _check_base_imports(base_models, used_names)
+    # Pydantic resolves the annotations of inherited fields in the subclass's module, so it needs their imports too
+    for name in model_names:
+        used_names[name] |= _inherited_names(name, base_models, used_names)
+
+    for node in classes:
+        start = (node.decorator_list[0] if node.decorator_list else node).lineno - 1
+        class_source = "\n".join(lines[start : node.end_lineno])
+        bases = base_models[node.name]
+        used = used_names[node.name]
+
+        imports_by_module: dict[str, list[str]] = {}
+        for name in sorted(used & header_imports.keys()):
+            imports_by_module.setdefault(header_imports[name], []).append(name)
+        top_imports = [f"from {m} import {', '.join(names)}" for m, names in imports_by_module.items()]
+        top_imports += [f"from {package}.{model_module_name(name)} import {name}" for name in sorted(bases)]
+        bottom_imports = [
+            f"from {package}.{model_module_name(name)} import {name}"
+            for name in sorted((used & model_names) - bases - {node.name})
+        ]
+
+        content = f"{header_comments}\n\nfrom __future__ import annotations\n\n"
+        content += "\n".join(top_imports) + "\n\n\n" + class_source + "\n"
+        if bottom_imports:
+            content += "\n\n# Imported after the model is defined, so models that refer to each other can be imported\n"
+            content += "\n".join(bottom_imports) + "\n"
+        save_py_file(str(package_dir / f"{model_module_name(node.name)}.py"), content)
+
+    names = sorted(model_names)
+    type_checking_imports = "\n".join(f"    from {package}.{model_module_name(name)} import {name}" for name in names)
+    model_modules = "\n".join(f'    "{name}": "{model_module_name(name)}",' for name in names)
+    save_py_file(
+        str(init_path),
+        INIT_TEMPLATE.format(
+            docstring=docstring,
+            package=package,
+            example="Ticket" if "Ticket" in model_names else names[0],
+            type_checking_imports=type_checking_imports,
+            model_modules=model_modules,
+        ),
+    )
+
+
+def _check_base_imports(base_models: dict[str, set[str]], used_names: dict[str, set[str]]) -> None:
+    """
+    Make sure no model's base class (imported before the model is defined) imports the model back,
+    which would fail as a circular import.
+    """
+    for name, bases in base_models.items():
+        seen: set[str] = set()
+        pending = list(bases)
+        while pending:
+            dependency = pending.pop()
+            if dependency == name:
+                raise ValueError(f"{name}'s base class depends on {name}, so it can't be imported")  # noqa: TRY003
+            if dependency not in seen:
+                seen.add(dependency)
+                pending.extend(used_names[dependency] & base_models.keys())
+
+
+def _inherited_names(name: str, base_models: dict[str, set[str]], used_names: dict[str, set[str]]) -> set[str]:
+    inherited: set[str] = set()
+    for base in base_models[name]:
+        inherited |= used_names[base] | _inherited_names(base, base_models, used_names)
+    return inherited
@@ -102,45 +102,56 @@ def generate_manage(
     model_output_path: str,
     client_output_path: str,
     schema: dict,
+    async_endpoint_output_path: str | None = None,
 ) -> None:
     create_null_client(client_output_path, "manage")
     schema = _pre_process_schema(schema)
     relationships, top_level_endpoints = _parse_relationships(schema["paths"])
     client_top_level_endpoints = []
-    for endpoint in relationships:
-        path = f"{endpoint}"
-        path_info = {}
-
-        if path in MALFORMED_MANAGE_ENDPOINTS:
-            continue
-
-        if schema["paths"].get(path) is not None:
-            path_info = dict(schema["paths"][path].items())
-        generate_endpoint(
-            endpoint_output_path,
-            model_output_path,
-            path,
-            path_info,
-            relationships,
-            is_manage=True,
-        )
+    output_paths = [(endpoint_output_path, False)]
+    if async_endpoint_output_path:
+        output_paths.append((async_endpoint_output_path, True))
+
+    for output_path, is_async in output_paths:
+        for endpoint in relationships:
+            path = f"{endpoint}"
+            path_info = {}
+
+            if path in MALFORMED_MANAGE_ENDPOINTS:
+                continue
+
+            if schema["paths"].get(path) is not None:
+                path_info = dict(schema["paths"][path].items())
+            generate_endpoint(
+                output_path,
+                model_output_path,
+                path,
+                path_info,
+                relationships,
+                is_manage=True,
+                is_async=is_async,
+            )
 
     for endpoint in top_level_endpoints:
         path = f"/{endpoint}"
         path_info = {}
         if schema["paths"].get(path) is not None:
             path_info = dict(schema["paths"][path].items())
-        endpoint_class = generate_endpoint(
-            endpoint_output_path,
-            model_output_path,
-            path,
-            path_info,
-            relationships,
-            is_manage=True,
-        )
+        for output_path, is_async in output_paths:
+            endpoint_class = generate_endpoint(
+                output_path,
+                model_output_path,
+                path,
+                path_info,
+                relationships,
+                is_manage=True,
+                is_async=is_async,
+            )
         client_top_level_endpoints.append(endpoint_class)
 
     generate_manage_client(client_output_path, client_top_level_endpoints)
+    if async_endpoint_output_path:
+        generate_manage_client(client_output_path, client_top_level_endpoints, is_async=True)
 
 
 def generate_automate(
@@ -148,24 +159,31 @@ def generate_automate(
     model_output_path: str,
     client_output_path: str,
     schema: dict,
+    async_endpoint_output_path: str | None = None,
 ) -> None:
     create_null_client(client_output_path, "automate")
     schema = _pre_process_schema(schema)
     relationships, top_level_endpoints = _parse_relationships(schema["paths"])
     client_top_level_endpoints = []
-    for endpoint in relationships:
-        path = f"{endpoint}"
-        path_info = {}
-        if schema["paths"].get(path) is not None:
-            path_info = dict(schema["paths"][path].items())
-        generate_endpoint(
-            endpoint_output_path,
-            model_output_path,
-            path,
-            path_info,
-            relationships,
-            is_manage=False,
-        )
+    output_paths = [(endpoint_output_path, False)]
+    if async_endpoint_output_path:
+        output_paths.append((async_endpoint_output_path, True))
+
+    for output_path, is_async in output_paths:
+        for endpoint in relationships:
+            path = f"{endpoint}"
+            path_info = {}
+            if schema["paths"].get(path) is not None:
+                path_info = dict(schema["paths"][path].items())
+            generate_endpoint(
+                output_path,
+                model_output_path,
+                path,
+                path_info,
+                relationships,
+                is_manage=False,
+                is_async=is_async,
+            )
 
     for endpoint in top_level_endpoints:
         path = f"/{endpoint}"
@@ -173,14 +191,18 @@ def generate_automate(
         if schema["paths"].get(path) is not None:
             path_info = dict(schema["paths"][path].items())
 
-        endpoint_class = generate_endpoint(
-            endpoint_output_path,
-            model_output_path,
-            path,
-            path_info,
-            relationships,
-            is_manage=False,
-        )
+        for output_path, is_async in output_paths:
+            endpoint_class = generate_endpoint(
+                output_path,
+                model_output_path,
+                path,
+                path_info,
+                relationships,
+                is_manage=False,
+                is_async=is_async,
+            )
         client_top_level_endpoints.append(endpoint_class)
 
     generate_automate_client(client_output_path, client_top_level_endpoints)
+    if async_endpoint_output_path:
+        generate_automate_client(client_output_path, client_top_level_endpoints, is_async=True)
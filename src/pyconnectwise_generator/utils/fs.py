@@ -30,7 +30,7 @@ def save_py_file(filepath: str, content: str) -> None:
             formatted_content = black.format_file_contents(content, fast=False, mode=black.FileMode(line_length=120))
         except NothingChanged:
             formatted_content = content
-        formatted_content = isort.code(formatted_content, line_length=120)
+        formatted_content = isort.code(formatted_content, profile="black", line_length=120)
 
         # Reset the file handle, and write the formatted content
         f.seek(0)
@@ -0,0 +1,246 @@
+import asyncio
+from collections.abc import Callable
+
+import httpx
+import pytest
+from requests.exceptions import Timeout
+from typing_extensions import override
+
+from pyconnectwise.cache import CacheRule, ResponseCache
+from pyconnectwise.clients.async_connectwise_client import AsyncConnectWiseClient, gather_limited
+from pyconnectwise.config import Config
+from pyconnectwise.endpoints.manage_async.ServiceEndpoint import ServiceEndpoint
+from pyconnectwise.exceptions import NotFoundException, ObjectExistsError, ServerError
+from pyconnectwise.single_flight import SingleFlight
+from tests.conftest import BASE_URL
+
+TIMEOUT_BODY = '{ "code": "ConnectWiseApi", "message": "A timeout has occured. Please try again."}'
+
+
+class FakeAsyncConnectWiseClient(AsyncConnectWiseClient):
+    def __init__(self, handler: Callable[[httpx.Request], httpx.Response], max_retries: int = 0) -> None:
+        super().__init__()
+        self.config = Config(max_retries=max_retries)
+        self._http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    @override
+    def _get_headers(self) -> dict[str, str]:
+        return {}
+
+    @override
+    def _get_url(self) -> str:
+        return BASE_URL
+
+
+def test_one_timeout_500():
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 1:
+            return httpx.Response(500, text=TIMEOUT_BODY)
+        return httpx.Response(200, text="Success!")
+
+    async def run() -> httpx.Response:
+        async with FakeAsyncConnectWiseClient(handler, max_retries=1) as client:
+            return await client._make_request("GET", f"{BASE_URL}/system/callbacks")
+
+    response = asyncio.run(run())
+
+    assert response.text == "Success!"
+    # Initial try and 1 retry
+    assert len(requests) == 2
+
+
+@pytest.mark.parametrize(
+    ("status_code", "response_text", "expected_error", "expected_requests"),
+    [
+        # Timeouts are retried, then bubble up if they persist
+        (500, TIMEOUT_BODY, Timeout, 2),
+        (500, '{ "code": "ConnectWiseApi", "message": "Error converting value" }', ServerError, 1),
+        (404, '{ "code": "NotFound", "message": "Ticket not found" }', NotFoundException, 1),
+        (
+            400,
+            '{"code": "InvalidObject", "errors": [{"code": "ObjectExists", "message": "A matching entry already exists"}]}',
+            ObjectExistsError,
+            1,
+        ),
+    ],
+)
+def test_exceptions(
+    *,
+    status_code: int,
+    response_text: str,
+    expected_error: type[Exception],
+    expected_requests: int,
+):
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(status_code, text=response_text)
+
+    client = FakeAsyncConnectWiseClient(handler, max_retries=1)
+    with pytest.raises(expected_error):
+        asyncio.run(client._make_request("GET", f"{BASE_URL}/system/callbacks"))
+
+    assert len(requests) == expected_requests
+
+
+def test_retries_429_honoring_retry_after():
+    responses = [httpx.Response(429, headers={"Retry-After": "0"}), httpx.Response(200, text="Success!")]
+
+    client = FakeAsyncConnectWiseClient(lambda request: responses.pop(0), max_retries=1)
+    response = asyncio.run(client._make_request("GET", f"{BASE_URL}/system/callbacks"))
+
+    assert response.text == "Success!"
+    assert responses == []
+
+
+def test_endpoint_get():
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.url.path == "/v2022_2/apis/3.0/service/tickets"
+        assert request.url.params["conditions"] == "closedFlag=false"
+        return httpx.Response(200, json=[{"id": 1, "summary": "First"}, {"id": 2, "summary": "Second"}])
+
+    endpoint = ServiceEndpoint(FakeAsyncConnectWiseClient(handler)).tickets
+    tickets = asyncio.run(endpoint.get(params={"conditions": "closedFlag=false"}))
+
+    assert [ticket.id for ticket in tickets] == [1, 2]
+
+
+def test_paginated_async_iteration():
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        link = f'<{BASE_URL}/service/tickets?pageSize=2&page={page + 1}>; rel="next"' if page < 2 else ""
+        return httpx.Response(
+            200,
+            json=[{"id": page * 10 + 1, "summary": "First"}, {"id": page * 10 + 2, "summary": "Second"}],
+            headers={"Link": link},
+        )
+
+    async def run() -> list[int]:
+        endpoint = ServiceEndpoint(FakeAsyncConnectWiseClient(handler)).tickets
+        return [ticket.id async for ticket in await endpoint.paginated(1, 2)]
+
+    assert asyncio.run(run()) == [11, 12, 21, 22]
+
+
+def test_paginated_prefetch_keeps_page_order():
+    requested_pages: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        requested_pages.append(page)
+        links = f'<{BASE_URL}/service/tickets?pageSize=2&page=5>; rel="last"'
+        if page < 5:
+            links += f', <{BASE_URL}/service/tickets?pageSize=2&page={page + 1}>; rel="next"'
+        return httpx.Response(200, json=[{"id": page, "summary": "Ticket"}], headers={"Link": links})
+
+    async def run() -> list[int]:
+        endpoint = ServiceEndpoint(FakeAsyncConnectWiseClient(handler)).tickets
+        paginated = await endpoint.paginated(1, 2)
+        return [ticket.id async for ticket in paginated.all(concurrency=3)]
+
+    assert asyncio.run(run()) == [1, 2, 3, 4, 5]
+    assert sorted(requested_pages) == [1, 2, 3, 4, 5]
+
+
+def test_keyset_paginated():
+    conditions: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        conditions.append(request.url.params.get("conditions"))
+        after = int(request.url.params.get("conditions", "id > 0").rsplit("> ", 1)[1])
+        return httpx.Response(200, json=[{"id": id_, "summary": "Ticket"} for id_ in (5, 7, 12) if id_ > after][:2])
+
+    async def run() -> list[int]:
+        endpoint = ServiceEndpoint(FakeAsyncConnectWiseClient(handler)).tickets
+        return [ticket.id async for ticket in await endpoint.keyset_paginated(2)]
+
+    assert asyncio.run(run()) == [5, 7, 12]
+    assert conditions == [None, "id > 7"]
+
+
+def test_stream_all():
+    def handler(request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        tickets = [{"id": page * 10 + 1, "summary": "A"}, {"id": page * 10 + 2, "summary": "B"}]
+        return httpx.Response(200, json=tickets if page < 3 else [])
+
+    async def run() -> list[int]:
+        endpoint = ServiceEndpoint(FakeAsyncConnectWiseClient(handler)).tickets
+        return [ticket.id async for ticket in endpoint.stream_all(2)]
+
+    assert asyncio.run(run()) == [11, 12, 21, 22]
+
+
+def test_gather_limited_bounds_concurrency():
+    in_flight = 0
+    max_in_flight = 0
+
+    async def work(n: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return n
+
+    results = asyncio.run(gather_limited(*(work(n) for n in range(10)), limit=3))
+
+    assert results == list(range(10))
+    assert max_in_flight == 3
+
+
+def test_get_many_by_ids():
+    def handler(request: httpx.Request) -> httpx.Response:
+        conditions = request.url.params["conditions"]
+        ids = [int(i) for i in conditions[len("id in (") : -1].split(",")]
+        return httpx.Response(200, json=[{"id": i, "name": f"Board {i}"} for i in ids])
+
+    async def run() -> list[int]:
+        endpoint = ServiceEndpoint(FakeAsyncConnectWiseClient(handler)).boards
+        return [board.id for board in await endpoint.get_many_by_ids(range(10), chunk_size=3)]
+
+    assert asyncio.run(run()) == list(range(10))
+
+
+def test_cached_get():
+    calls = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return httpx.Response(200, json=[{"id": 1, "name": "Help Desk"}])
+
+    async def run() -> list[str]:
+        client = FakeAsyncConnectWiseClient(handler)
+        client.config = Config(response_cache=ResponseCache([CacheRule("service/boards", ttl=60)]))
+        boards = ServiceEndpoint(client).boards
+        return [(await boards.get())[0].name for _ in range(3)]
+
+    assert asyncio.run(run()) == ["Help Desk"] * 3
+    assert calls == 1
+
+
+def test_concurrent_gets_are_coalesced():
+    calls = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.1)
+        return httpx.Response(200, json=[{"id": 1, "name": "Help Desk"}])
+
+    single_flight = SingleFlight()
+
+    async def run() -> list[str]:
+        client = FakeAsyncConnectWiseClient(handler)
+        client.config = Config(single_flight=single_flight)
+        boards = ServiceEndpoint(client).boards
+        return [found[0].name for found in await asyncio.gather(*(boards.get() for _ in range(5)))]
+
+    assert asyncio.run(run()) == ["Help Desk"] * 5
+    assert calls == 1
+    assert (single_flight.stats.calls, single_flight.stats.saved) == (1, 4)
@@ -161,3 +161,40 @@ def test_exceptions(
             "GET",
             test_url,
         )
+
+
+def test_session_is_reused_and_sized_from_config(requests_mock: RequestMocker):
+    test_url = "https://staging.connectwisedev.com/v2022_2/apis/3.0/system/callbacks"
+    requests_mock.get(test_url, text="Success!")
+
+    client = FakeConnectWiseClient()
+    client.config = Config(pool_connections=2, pool_maxsize=25)
+    client._make_request("GET", test_url)
+    session = client._session
+    client._make_request("GET", test_url)
+
+    assert session is not None
+    assert client._session is session
+    adapter = session.get_adapter(test_url)
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 25
+
+
+def test_close_releases_session(requests_mock: RequestMocker):
+    test_url = "https://staging.connectwisedev.com/v2022_2/apis/3.0/system/callbacks"
+    requests_mock.get(test_url, text="Success!")
+
+    with FakeConnectWiseClient() as client:
+        client._make_request("GET", test_url)
+        assert client._session is not None
+
+    assert client._session is None
+    # A closed client transparently opens a new pool when used again
+    assert client._make_request("GET", test_url).text == "Success!"
+
+
+def test_clients_dont_share_session_lock():
+    first, second = FakeConnectWiseClient(), FakeConnectWiseClient()
+
+    assert first._get_session_lock() is first._get_session_lock()
+    assert first._get_session_lock() is not second._get_session_lock()
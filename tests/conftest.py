@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import pytest
+from typing_extensions import override
+
+from pyconnectwise.clients.connectwise_client import ConnectWiseClient
+
+if TYPE_CHECKING:
+    from pyconnectwise.config import Config
+
+BASE_URL = "https://staging.connectwisedev.com/v2022_2/apis/3.0"
+
+
+class FakeConnectWiseClient(ConnectWiseClient):
+    """
+    A client for the staging URL, for requests_mock to answer. It sends the given headers (none by default), and
+    uses the given config instead of the default one.
+    """
+
+    def __init__(self, config: Config | None = None, headers: dict[str, str] | None = None) -> None:
+        super().__init__()
+        if config is not None:
+            self.config = config
+        self.headers = headers if headers is not None else {}
+
+    @override
+    def _get_headers(self) -> dict[str, str]:
+        return self.headers
+
+    @override
+    def _get_url(self) -> str:
+        return BASE_URL
+
+
+class FakeAutomateClient(FakeConnectWiseClient):
+    """
+    A client that sends conditions and fields the way the Automate API takes them.
+    """
+
+    _conditions_param = "condition"
+    _fields_param = "includeFields"
+
+
+@pytest.fixture()
+def client() -> FakeConnectWiseClient:
+    return FakeConnectWiseClient()
+
+
+@pytest.fixture()
+def automate_client() -> FakeAutomateClient:
+    return FakeAutomateClient()
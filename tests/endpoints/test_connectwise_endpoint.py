@@ -0,0 +1,193 @@
+from urllib.parse import urlsplit
+
+import pytest
+from pydantic import ValidationError
+from requests_mock import Mocker as RequestMocker
+
+from pyconnectwise.config import Config
+from pyconnectwise.endpoints.automate.ComputersEndpoint import ComputersEndpoint
+from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+from pyconnectwise.endpoints.manage.ServiceBoardsIdItemsIdEndpoint import ServiceBoardsIdItemsIdEndpoint
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+from pyconnectwise.models.automate import LabTechComputer
+from pyconnectwise.models.manage import Ticket
+from tests.conftest import BASE_URL, FakeAutomateClient, FakeConnectWiseClient
+
+
+def test_child_endpoints_are_created_on_first_access(client: FakeConnectWiseClient) -> None:
+    service = ServiceEndpoint(client)
+    assert service._child_endpoints == []
+
+    tickets = service.tickets
+    assert service._child_endpoints == [tickets]
+    assert tickets._child_endpoints == []
+
+
+def test_child_endpoints_are_reused(client: FakeConnectWiseClient) -> None:
+    service = ServiceEndpoint(client)
+
+    assert service.tickets is service.tickets
+    assert service.tickets.id(1).notes is not service.tickets.id(2).notes
+    assert len(service._child_endpoints) == 1
+
+
+def test_child_endpoint_urls(requests_mock: RequestMocker, client: FakeConnectWiseClient) -> None:
+    requests_mock.get(f"{BASE_URL}/service/tickets/1/notes", json=[])
+    notes = ServiceEndpoint(client).tickets.id(1).notes
+
+    assert notes.get() == []
+
+
+def test_child_endpoints_named_after_builtins(client: FakeConnectWiseClient) -> None:
+    # Children are defined after the methods, so e.g. "list" doesn't shadow the builtin in their annotations
+    item = ServiceEndpoint(client).boards.id(1).items.id(2)
+
+    assert isinstance(item, ServiceBoardsIdItemsIdEndpoint)
+    assert item.usages.list._get_endpoint_url() == f"{BASE_URL}/service/boards/1/items/2/usages/list"
+
+
+def test_endpoint_urls_fill_in_each_id(client: FakeConnectWiseClient) -> None:
+    boards = ServiceEndpoint(client).boards
+    first = boards.id(1).items.id(2).usages
+    second = boards.id(3).items.id(4).usages
+
+    assert first._get_endpoint_url() == f"{BASE_URL}/service/boards/1/items/2/usages"
+    assert second._get_endpoint_url() == f"{BASE_URL}/service/boards/3/items/4/usages"
+    assert first._get_url_template()[0] == second._get_url_template()[0] == "service/boards/{}/items/{}/usages"
+
+
+def test_endpoint_urls_follow_the_client_url(client: FakeConnectWiseClient) -> None:
+    tickets = ServiceEndpoint(client).tickets
+    assert tickets._get_endpoint_url() == f"{BASE_URL}/service/tickets"
+
+    client._get_url = lambda: "https://na.myconnectwise.net/v4_6_release/apis/3.0/"
+    assert tickets._get_endpoint_url() == "https://na.myconnectwise.net/v4_6_release/apis/3.0/service/tickets"
+
+
+def test_get_validates_the_raw_response_body(requests_mock: RequestMocker, client: FakeConnectWiseClient) -> None:
+    requests_mock.get(f"{BASE_URL}/service/tickets", json=[{"id": 1, "summary": "First", "company": {"id": 2}}])
+    requests_mock.get(f"{BASE_URL}/service/tickets/1", json={"id": 1, "summary": "First"})
+    tickets = ServiceEndpoint(client).tickets
+
+    [ticket] = tickets.get()
+    assert isinstance(ticket, Ticket)
+    assert ticket.company.id == 2
+    assert tickets.id(1).get() == Ticket(id=1, summary="First")
+
+
+def test_parse_accepts_bytes_or_decoded_json(client: FakeConnectWiseClient) -> None:
+    tickets = ServiceEndpoint(client).tickets
+    data = [{"id": 1, "summary": "First"}, {"id": 2, "summary": "Second"}]
+
+    assert tickets._parse_many(Ticket, b'[{"id": 1, "summary": "First"}, {"id": 2, "summary": "Second"}]') == (
+        tickets._parse_many(Ticket, data)
+    )
+    assert tickets._parse_one(Ticket, b'{"id": 1, "summary": "First"}') == tickets._parse_one(Ticket, data[0])
+    with pytest.raises(ValidationError):
+        tickets._parse_many(Ticket, b'[{"id": "not an id"}]')
+
+
+def test_raw_response_mode_from_config(requests_mock: RequestMocker, client: FakeConnectWiseClient) -> None:
+    requests_mock.get(f"{BASE_URL}/service/tickets", json=[{"id": 1, "summary": "First", "company": {"id": 2}}])
+    requests_mock.get(f"{BASE_URL}/service/tickets/1", json={"id": 1, "summary": "First"})
+    client.config = Config(response_mode="raw")
+    tickets = ServiceEndpoint(client).tickets
+
+    assert tickets.get() == [{"id": 1, "summary": "First", "company": {"id": 2}}]
+    assert tickets.id(1).get() == {"id": 1, "summary": "First"}
+    assert tickets.paginated(1, 1000).data == [{"id": 1, "summary": "First", "company": {"id": 2}}]
+    assert list(tickets.stream_all()) == [{"id": 1, "summary": "First", "company": {"id": 2}}]
+
+
+def test_with_response_mode(requests_mock: RequestMocker, client: FakeConnectWiseClient) -> None:
+    requests_mock.get(f"{BASE_URL}/service/tickets/1/notes", json=[{"id": 2, "text": "Note"}])
+    tickets = ServiceEndpoint(client).tickets
+    typed_notes = tickets.id(1).notes
+    raw_tickets = tickets.with_response_mode("raw")
+
+    assert raw_tickets.id(1).notes.get() == [{"id": 2, "text": "Note"}]
+    assert raw_tickets.id(1).notes._get_endpoint_url() == f"{BASE_URL}/service/tickets/1/notes"
+    # The original endpoint and its children are unaffected
+    assert typed_notes.get()[0].text == "Note"
+    assert tickets.id(1).notes.paginated(1, 1000).data[0].text == "Note"
+    assert raw_tickets.with_response_mode("model").id(1).notes.get()[0].text == "Note"
+
+
+def test_select_requests_and_parses_only_the_selected_fields(
+    requests_mock: RequestMocker, client: FakeConnectWiseClient
+) -> None:
+    requests_mock.get(f"{BASE_URL}/service/tickets", json=[{"id": 1, "status": {"name": "New"}}])
+    tickets = ServiceEndpoint(client).tickets.select(Ticket.id, Ticket.status.name)
+
+    [ticket] = tickets.paginated(1, 1000).data
+    assert requests_mock.last_request.qs["fields"] == ["id,status/name"]
+    assert ticket.id == 1
+    assert ticket.status.name == "New"
+    assert set(type(ticket).model_fields) == {"id", "status"}
+    assert set(type(ticket.status).model_fields) == {"name"}
+    assert [t.status.name for t in tickets.stream_all()] == ["New"]
+
+
+def test_select_leaves_the_original_endpoint_alone(requests_mock: RequestMocker, client: FakeConnectWiseClient) -> None:
+    requests_mock.get(f"{BASE_URL}/service/tickets", json=[{"id": 1, "summary": "First"}])
+    tickets = ServiceEndpoint(client).tickets
+    tickets.select(Ticket.id)
+
+    assert isinstance(tickets.get()[0], Ticket)
+    assert "fields" not in requests_mock.last_request.qs
+
+
+def test_select_automate_top_level_fields(requests_mock: RequestMocker, automate_client: FakeAutomateClient) -> None:
+    requests_mock.get(f"{BASE_URL}/computers", json=[{"Id": "1", "Client": {"Id": 2, "Name": "Client"}}])
+    computers = ComputersEndpoint(automate_client).select(LabTechComputer.id, LabTechComputer.client.name)
+
+    [computer] = computers.get()
+    assert requests_mock.last_request.qs["includefields"] == ["id,client"]
+    assert computer.client.name == "Client"
+    assert not hasattr(computer.client, "id")
+
+
+def test_select_fields_of_one_model(client: FakeConnectWiseClient) -> None:
+    tickets = ServiceEndpoint(client).tickets
+
+    with pytest.raises(ValueError, match="all of the same model"):
+        tickets.select()
+    with pytest.raises(ValueError, match="all of the same model"):
+        tickets.select(Ticket.id, LabTechComputer.id)
+
+
+def test_get_many_by_ids_splits_long_id_lists(requests_mock: RequestMocker, client: FakeConnectWiseClient) -> None:
+    def companies(request, context) -> list[dict]:  # noqa: ANN001
+        conditions = request.qs["conditions"][0]
+        ids = [int(i) for i in conditions[conditions.index("(", 1) + 1 : -1].split(",")]
+        return [{"id": i, "identifier": f"Company{i}", "name": f"Company {i}"} for i in ids if i != 5]
+
+    requests_mock.get(f"{BASE_URL}/company/companies", json=companies)
+    companies_endpoint = CompanyEndpoint(client).companies
+    ids = [100_000 + i for i in range(1000)]
+
+    found = companies_endpoint.get_many_by_ids(
+        [*reversed(ids), ids[0], 5], params={"conditions": "deletedFlag = false"}
+    )
+
+    assert [company.id for company in found] == list(reversed(ids))
+    assert requests_mock.call_count == 7
+    for request in requests_mock.request_history:
+        assert len(urlsplit(request.url).query) < 2048
+        assert request.qs["conditions"][0].startswith("(deletedflag = false) and id in (")
+
+
+def test_get_many_by_ids_uses_search_endpoint(requests_mock: RequestMocker, client: FakeConnectWiseClient) -> None:
+    requests_mock.post(
+        f"{BASE_URL}/service/tickets/search",
+        json=lambda request, context: [{"id": 2, "summary": "Second"}, {"id": 1, "summary": "First"}],
+    )
+    tickets = ServiceEndpoint(client).tickets
+
+    found = tickets.get_many_by_ids([1, 2, 3], chunk_size=2)
+
+    assert [ticket.summary for ticket in found] == ["First", "Second"]
+    assert sorted(request.json()["conditions"] for request in requests_mock.request_history) == [
+        "id in (1,2)",
+        "id in (3)",
+    ]
@@ -0,0 +1,73 @@
+import pytest
+
+from pyconnectwise.models.base.compact_records import CompactRecords
+from pyconnectwise.models.manage import Ticket
+
+
+def ticket(id_: int) -> dict:
+    return {
+        "id": id_,
+        "summary": f"Ticket {id_}",
+        "closedFlag": id_ % 2 == 0,
+        "actualHours": 1.5 if id_ > 1 else None,
+        "company": {"id": 250, "name": "Health IT", "_info": {"company_href": "https://example.com/250"}},
+        "_info": {"lastUpdated": "2023-11-02T04:15:00Z"},
+    }
+
+
+@pytest.fixture()
+def records() -> CompactRecords[Ticket]:
+    return CompactRecords(Ticket, [ticket(1), ticket(2), {"id": 3, "summary": "No company"}])
+
+
+def test_attribute_access(records: CompactRecords[Ticket]) -> None:
+    first = records[0]
+
+    assert len(records) == 3
+    assert first.id == 1
+    assert first.summary == "Ticket 1"
+    assert first.closed_flag is False
+    assert records[1].closed_flag is True
+    assert first.actual_hours is None
+    assert records[1].actual_hours == 1.5
+    assert first.company.name == "Health IT"
+    assert first.company.info == {"company_href": "https://example.com/250"}
+    assert first.info == {"lastUpdated": "2023-11-02T04:15:00Z"}
+    assert records[-1].company is None
+    assert records[-1].info is None
+    assert first.agreement is None
+    with pytest.raises(AttributeError):
+        first.not_a_field  # noqa: B018
+
+
+def test_records_round_trip(records: CompactRecords[Ticket]) -> None:
+    assert [r.to_dict() for r in records] == [
+        {k: v for k, v in ticket(1).items() if v is not None},
+        ticket(2),
+        {"id": 3, "summary": "No company"},
+    ]
+    assert records[0].company.to_dict() == ticket(1)["company"]
+    with pytest.raises(IndexError):
+        records[3]
+
+
+def test_promote_to_model(records: CompactRecords[Ticket]) -> None:
+    promoted = records[1].to_model()
+
+    assert promoted == Ticket.model_validate(ticket(2))
+    assert promoted.company.id == 250
+
+
+def test_build_from_models() -> None:
+    models = [Ticket.model_validate(ticket(1)), Ticket.model_validate(ticket(2))]
+    records = CompactRecords(Ticket, models)
+
+    assert [r.to_model() for r in records] == models
+
+
+def test_columns_are_compact(records: CompactRecords[Ticket]) -> None:
+    # Numbers go in typed arrays, identical strings are stored once and fields that are never set take no space
+    assert records._columns["id"].values.typecode == "q"
+    assert records._columns["closedFlag"].values.typecode == "b"
+    assert records._columns["company/name"].values[0] is records._columns["company/name"].values[1]
+    assert records._columns["agreement/id"].values is None
@@ -0,0 +1,51 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from pyconnectwise.models.automate import LabTechComputer
+from pyconnectwise.models.manage import Ticket
+
+
+def test_comparisons() -> None:
+    assert str(Ticket.status.name == "New") == 'status/name = "New"'
+    assert str(Ticket.id != 5) == "id != 5"
+    assert str(Ticket.id < 5) == "id < 5"
+    assert str(Ticket.actual_hours <= 1.5) == "actualHours <= 1.5"
+    assert str(Ticket.closed_flag == False) == "closedFlag = false"  # noqa: E712
+    assert str(Ticket.owner == None) == "owner = null"  # noqa: E711
+    assert str(Ticket.summary.contains("printer")) == 'summary contains "printer"'
+    assert str(Ticket.summary.not_like("Test%")) == 'summary not like "Test%"'
+    assert str(Ticket.board.id.in_([1, 2])) == "board/id in (1, 2)"
+    assert str(Ticket.summary.not_in(["a", "b"])) == 'summary not in ("a", "b")'
+
+
+def test_values_are_formatted_for_the_api() -> None:
+    brisbane = timezone(timedelta(hours=10))
+
+    assert str(Ticket.required_date > datetime(2024, 1, 1, 10, tzinfo=brisbane)) == (
+        "requiredDate > [2024-01-01T00:00:00Z]"
+    )
+    assert str(Ticket.required_date > date(2024, 1, 1)) == "requiredDate > [2024-01-01]"
+    assert str(Ticket.summary == 'The "big" one') == r'summary = "The \"big\" one"'
+
+
+def test_conditions_are_combined() -> None:
+    condition = (Ticket.status.name == "New") & (Ticket.id > 1000) | Ticket.summary.like("Printer%") & (
+        Ticket.closed_flag == False  # noqa: E712
+    )
+
+    assert str(condition) == ('(status/name = "New" AND id > 1000) OR (summary like "Printer%" AND closedFlag = false)')
+    assert str((Ticket.id > 1) & (Ticket.id < 5) & (Ticket.id != 3)) == "id > 1 AND id < 5 AND id != 3"
+    with pytest.raises(TypeError):
+        (Ticket.id > 1) and (Ticket.id < 5)  # noqa: B018
+
+
+def test_fields_are_referred_to_by_alias() -> None:
+    assert str(LabTechComputer.client.name == "Health IT") == 'Client/Name = "Health IT"'
+    assert str(Ticket.info == "x") == '_info = "x"'
+
+
+def test_compiled_conditions_are_cached() -> None:
+    condition = Ticket.status.name == "New"
+
+    assert str(condition) is str(condition)
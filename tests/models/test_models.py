@@ -0,0 +1,112 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import pyconnectwise.models.automate as automate_models
+import pyconnectwise.models.manage as manage_models
+
+
+def test_importing_the_models_package_defines_no_models() -> None:
+    code = (
+        "import sys, pyconnectwise.models.manage\n"
+        "assert not [m for m in sys.modules if m.startswith('pyconnectwise.models.manage.')]"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)  # noqa: S603
+
+
+def test_models_are_imported_from_their_submodule() -> None:
+    from pyconnectwise.models.manage import Ticket
+
+    assert Ticket.__module__ == "pyconnectwise.models.manage.ticket"
+    assert manage_models.Ticket is Ticket
+    assert "Ticket" in dir(manage_models)
+
+
+def test_unknown_model() -> None:
+    with pytest.raises(AttributeError):
+        manage_models.NotAModel  # noqa: B018
+
+
+def test_models_resolve_references_to_other_models() -> None:
+    ticket = manage_models.Ticket.model_validate({"id": 1, "summary": "Ticket", "company": {"id": 2}})
+
+    assert isinstance(ticket.company, manage_models.CompanyReference)
+
+
+def test_inherited_fields_resolve_in_subclass() -> None:
+    audit = manage_models.ExpenseEntryAudit.model_validate({"member": {"id": 1, "identifier": "member"}})
+
+    assert isinstance(audit.member, manage_models.MemberReference)
+
+
+def test_self_referencing_models() -> None:
+    folder = automate_models.LabTechScriptFolder.model_validate({"Id": "1", "SubFolders": [{"Id": "2"}]})
+
+    assert folder.sub_folders[0].id == "2"
+
+
+@pytest.mark.parametrize("first", ["LabTechClient", "LabTechLocation"])
+def test_models_referring_to_each_other(first: str) -> None:
+    # A client holds its locations, which hold their client. Whichever is imported first, in a fresh interpreter,
+    # imports the other before it's defined, and both have to be completed once they're used.
+    code = (
+        f"from pyconnectwise.models.automate import {first}\n"
+        "from pyconnectwise.models.automate import LabTechClient, LabTechLocation\n"
+        "from pyconnectwise.utils.helpers import get_list_adapter\n"
+        "client = LabTechClient.model_validate({'Id': '1', 'Locations': [{'Id': '2', 'Client': {'Id': '1'}}]})\n"
+        "assert client.locations[0].client.id == '1'\n"
+        "assert get_list_adapter(LabTechLocation).validate_json('[{\"Id\": 2}]')[0].id == 2"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)  # noqa: S603
+
+
+def test_field_names_of_unused_model() -> None:
+    assert "company/id" in manage_models.Ticket._get_field_names()
+
+
+def test_field_names_of_models_referring_back_to_themselves() -> None:
+    # A computer's client holds its computers, which hold their client, and so on
+    field_types = automate_models.LabTechComputer._get_field_names_and_types()
+
+    assert field_types["Client/Name"] == "str"
+    assert set(automate_models.LabTechComputer._get_field_names()) == set(field_types)
+
+
+@pytest.mark.parametrize("defer_build", [False, True])
+def test_defer_model_build(defer_build: bool) -> None:  # noqa: FBT001
+    code = (
+        "from pyconnectwise.models.manage import CompanyReference\n"
+        f"assert CompanyReference.__pydantic_complete__ is {not defer_build}\n"
+        "assert CompanyReference.model_validate({'id': 1}).id == 1\n"
+        "assert CompanyReference.__pydantic_complete__"
+    )
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(sys.path),
+        "PYCONNECTWISE_DEFER_MODEL_BUILD": "1" if defer_build else "",
+    }
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)  # noqa: S603
+
+
+def test_field_paths() -> None:
+    assert repr(manage_models.Ticket.company.name) == "Ticket.company.name"
+    with pytest.raises(AttributeError):
+        manage_models.Ticket.summary.length  # noqa: B018
+    with pytest.raises(AttributeError):
+        manage_models.Ticket.company.not_a_field  # noqa: B018
+
+
+def test_selection_models_are_cached() -> None:
+    Ticket = manage_models.Ticket  # noqa: N806
+    selection = Ticket._select(Ticket.id, Ticket.company.name)
+
+    assert selection is Ticket._select(Ticket.company.name, Ticket.id)
+    assert selection._get_field_names() == ["company/name", "id"]
+    # Selecting a nested model selects all of its fields
+    assert Ticket._select(Ticket.company, Ticket.company.name).model_fields["company"].annotation == (
+        Ticket.model_fields["company"].annotation
+    )
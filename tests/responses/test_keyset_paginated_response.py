@@ -0,0 +1,97 @@
+import pytest
+from requests_mock import Mocker as RequestMocker
+
+from pyconnectwise.endpoints.automate.ClientsEndpoint import ClientsEndpoint
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+from tests.conftest import BASE_URL, FakeAutomateClient, FakeConnectWiseClient
+
+TICKET_IDS = [3, 8, 9, 15, 16, 23, 42]
+
+
+def tickets_after(request, context):  # noqa: ANN001
+    # Stands in for "conditions=... and id > N&orderBy=id asc" on the API side
+    conditions = request.qs.get("conditions", [""])[0]
+    after = int(conditions.rsplit("id > ", 1)[1]) if "id > " in conditions else 0
+    page_size = int(request.qs["pagesize"][0])
+    return [{"id": id_, "summary": "Ticket"} for id_ in TICKET_IDS if id_ > after][:page_size]
+
+
+def test_keyset_paginated_walks_all_pages(requests_mock: RequestMocker, client: FakeConnectWiseClient):
+    requests_mock.get(f"{BASE_URL}/service/tickets", json=tickets_after)
+
+    tickets = ServiceEndpoint(client).tickets
+    paginated = tickets.keyset_paginated(3, {"conditions": "closedFlag = false"})
+
+    assert [ticket.id for ticket in paginated] == [3, 8, 9]
+    assert [ticket.id for ticket in paginated.all()] == TICKET_IDS
+    assert not paginated.has_data
+
+    history = requests_mock.request_history
+    # The last page is short, so no request is made for an empty page after it
+    assert len(history) == 3
+    assert all(r.qs["page"] == ["1"] and r.qs["orderby"] == ["id asc"] for r in history)
+    assert [r.qs["conditions"] for r in history] == [
+        ["closedflag = false"],
+        ["(closedflag = false) and id > 9"],
+        ["(closedflag = false) and id > 23"],
+    ]
+
+
+def test_keyset_paginated_automate(requests_mock: RequestMocker, automate_client: FakeAutomateClient):
+    requests_mock.get(
+        f"{BASE_URL}/clients",
+        [{"json": [{"Id": "9", "Name": "A"}, {"Id": "10", "Name": "B"}]}, {"json": []}],
+    )
+
+    clients = ClientsEndpoint(automate_client)
+    names = [client.name for client in clients.keyset_paginated(2).all()]
+
+    assert names == ["A", "B"]
+    first, second = requests_mock.request_history
+    assert first.qs["orderby"] == ["id asc"]
+    assert "condition" not in first.qs
+    # Automate types ids as strings, but they still need to compare as numbers
+    assert second.qs["condition"] == ["id > 10"]
+
+
+def test_keyset_paginated_caps_the_page_size(requests_mock: RequestMocker, client: FakeConnectWiseClient):
+    ids = list(range(1, 2501))
+
+    def respond(request, context) -> list[dict]:  # noqa: ANN001
+        # The API returns at most 1000 items per page, however many are asked for
+        after = int(request.qs.get("conditions", ["id > 0"])[0].rsplit(" ", 1)[1])
+        return [{"id": id_, "summary": "Ticket"} for id_ in ids[after:]][:1000]
+
+    requests_mock.get(f"{BASE_URL}/service/tickets", json=respond)
+
+    tickets = ServiceEndpoint(client).tickets
+
+    # A full page of 1000 doesn't look short, so the scan doesn't end early
+    assert [ticket.id for ticket in tickets.keyset_paginated(5000).all()] == ids
+    assert [r.qs["pagesize"] for r in requests_mock.request_history] == [["1000"]] * 3
+
+
+def test_keyset_paginated_rejects_other_ordering(client: FakeConnectWiseClient):
+    tickets = ServiceEndpoint(client).tickets
+
+    with pytest.raises(ValueError, match="orderBy"):
+        tickets.keyset_paginated(10, {"orderBy": "dateEntered desc"})
+
+
+def test_keyset_paginated_raw_response_mode(requests_mock: RequestMocker, client: FakeConnectWiseClient):
+    requests_mock.get(f"{BASE_URL}/service/tickets", json=tickets_after)
+
+    tickets = ServiceEndpoint(client).tickets.with_response_mode("raw")
+
+    assert [ticket["id"] for ticket in tickets.keyset_paginated(3).all()] == TICKET_IDS
+
+
+def test_keyset_paginated_resumes_after_key(requests_mock: RequestMocker, client: FakeConnectWiseClient):
+    requests_mock.get(f"{BASE_URL}/service/tickets", json=tickets_after)
+
+    tickets = ServiceEndpoint(client).tickets
+    first = tickets.keyset_paginated(3)
+    resumed = tickets.keyset_paginated(3, after=first.last_key)
+
+    assert [ticket.id for ticket in resumed.all()] == [15, 16, 23, 42]
+    assert requests_mock.request_history[1].qs["conditions"] == ["id > 9"]
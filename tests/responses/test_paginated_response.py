@@ -0,0 +1,79 @@
+import threading
+
+import pytest
+from requests_mock import Mocker as RequestMocker
+
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+from pyconnectwise.responses.paginated_response import PaginatedResponse
+from tests.conftest import BASE_URL, FakeConnectWiseClient
+
+TICKETS_URL = f"{BASE_URL}/service/tickets"
+
+
+def page_of(page: int) -> list[dict]:
+    return [{"id": page * 10 + 1, "summary": "First"}, {"id": page * 10 + 2, "summary": "Second"}]
+
+
+def three_pages(request, context):  # noqa: ANN001
+    page = int(request.qs["page"][0])
+    return page_of(page) if page <= 3 else []
+
+
+def manage_link_header(page: int, last_page: int) -> str:
+    links = [f'<{TICKETS_URL}?pageSize=2&page=1>; rel="first"']
+    if page < last_page:
+        links.append(f'<{TICKETS_URL}?pageSize=2&page={page + 1}>; rel="next"')
+        links.append(f'<{TICKETS_URL}?pageSize=2&page={last_page}>; rel="last"')
+    return ", ".join(links)
+
+
+@pytest.mark.parametrize("concurrency", [1, 4])
+def test_all_with_link_headers(concurrency: int, requests_mock: RequestMocker, client: FakeConnectWiseClient):
+    last_page = 6
+
+    def callback(request, context):  # noqa: ANN001, ANN202
+        page = int(request.qs["page"][0])
+        context.headers["Link"] = manage_link_header(page, last_page)
+        return page_of(page)
+
+    requests_mock.get(TICKETS_URL, json=callback)
+
+    tickets = ServiceEndpoint(client).tickets
+    paginated = tickets.paginated(1, 2, {"conditions": "closedFlag=false"})
+    ids = [ticket.id for ticket in paginated.all(concurrency=concurrency)]
+
+    assert ids == [id_ for page in range(1, last_page + 1) for id_ in (page * 10 + 1, page * 10 + 2)]
+    # Every page is requested exactly once, and never past the last page
+    requested_pages = sorted(int(r.qs["page"][0]) for r in requests_mock.request_history)
+    assert requested_pages == list(range(1, last_page + 1))
+    assert all(r.qs["conditions"] == ["closedflag=false"] for r in requests_mock.request_history)
+    assert not paginated.has_data
+
+
+def test_all_without_link_headers_stops_at_empty_page(requests_mock: RequestMocker, client: FakeConnectWiseClient):
+    # Automate doesn't send Link headers, so prefetching keeps going until a page comes back empty
+    requests_mock.get(TICKETS_URL, json=three_pages)
+
+    tickets = ServiceEndpoint(client).tickets
+    ids = [ticket.id for ticket in tickets.paginated(1, 2).all(concurrency=3)]
+
+    assert ids == [11, 12, 21, 22, 31, 32]
+
+
+def test_all_prefetches_concurrently(requests_mock: RequestMocker, client: FakeConnectWiseClient):
+    requests_mock.get(TICKETS_URL, json=three_pages)
+    tickets = ServiceEndpoint(client).tickets
+
+    # Pages 2 and 3 only return once both have been requested, which can't happen without concurrency
+    both_requested = threading.Barrier(2, timeout=5)
+    paginated = tickets.paginated
+
+    def blocking_paginated(page: int, page_size: int, params: dict | None = None) -> PaginatedResponse:
+        if page in (2, 3):
+            both_requested.wait()
+        return paginated(page, page_size, params)
+
+    tickets.paginated = blocking_paginated
+    ids = [ticket.id for ticket in tickets.paginated(1, 2).all(concurrency=2)]
+
+    assert ids == [11, 12, 21, 22, 31, 32]
@@ -0,0 +1,199 @@
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+from requests_mock import Mocker as RequestMocker
+
+from pyconnectwise.cache import CacheRule, MemoryCacheBackend, ResponseCache, SQLiteCacheBackend
+from pyconnectwise.config import Config
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+from pyconnectwise.endpoints.manage.SystemEndpoint import SystemEndpoint
+from pyconnectwise.endpoints.manage.SystemMembersEndpoint import SystemMembersEndpoint
+from tests.conftest import BASE_URL, FakeConnectWiseClient
+
+
+def create_client(cache: ResponseCache, auth: str = "Basic one") -> FakeConnectWiseClient:
+    return FakeConnectWiseClient(Config(response_cache=cache), {"Authorization": auth})
+
+
+def test_cached_get(requests_mock: RequestMocker) -> None:
+    requests_mock.get(f"{BASE_URL}/service/boards", json=[{"id": 1, "name": "Help Desk"}])
+    requests_mock.get(f"{BASE_URL}/service/tickets", json=[])
+    cache = ResponseCache([CacheRule("service/boards*", ttl=60)])
+    service = ServiceEndpoint(create_client(cache))
+
+    assert [board.name for board in service.boards.get()] == ["Help Desk"]
+    assert [board.name for board in service.boards.get()] == ["Help Desk"]
+    service.boards.get(params={"conditions": "inactiveFlag = false"})
+    service.tickets.get()
+    service.tickets.get()
+
+    assert requests_mock.call_count == 4
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+    # Clients with other credentials don't share cached responses
+    ServiceEndpoint(create_client(cache, "Basic two")).boards.get()
+    assert requests_mock.call_count == 5
+
+
+def test_cache_rule_for_endpoint_class(requests_mock: RequestMocker) -> None:
+    requests_mock.get(f"{BASE_URL}/system/members", json=[])
+    cache = ResponseCache([CacheRule(SystemMembersEndpoint, ttl=60)])
+    members = SystemEndpoint(create_client(cache)).members
+
+    members.get()
+    members.get()
+
+    assert requests_mock.call_count == 1
+
+
+def wait_for_refreshes(cache: ResponseCache) -> None:
+    deadline = time.monotonic() + 5
+    while cache._refreshing and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def test_stale_while_revalidate(requests_mock: RequestMocker) -> None:
+    requests_mock.get(
+        f"{BASE_URL}/service/boards", [{"json": [{"id": 1, "name": "Old"}]}, {"json": [{"id": 1, "name": "New"}]}]
+    )
+    cache = ResponseCache([CacheRule("service/boards", ttl=0, stale_ttl=60)])
+    boards = ServiceEndpoint(create_client(cache)).boards
+
+    assert boards.get()[0].name == "Old"
+    # The stale response is returned straight away, while it's refreshed in the background
+    assert boards.get()[0].name == "Old"
+    wait_for_refreshes(cache)
+    assert boards.get()[0].name == "New"
+    wait_for_refreshes(cache)
+    assert (cache.stats.misses, cache.stats.stale_hits, cache.stats.refreshes) == (1, 2, 2)
+
+
+def test_least_recently_used_responses_are_evicted(requests_mock: RequestMocker) -> None:
+    for name in ("boards", "priorities", "sources"):
+        requests_mock.get(f"{BASE_URL}/service/{name}", json=[])
+    cache = ResponseCache([CacheRule("service/*", ttl=60)], MemoryCacheBackend(max_entries=2))
+    service = ServiceEndpoint(create_client(cache))
+
+    service.boards.get()
+    service.priorities.get()
+    service.boards.get()
+    service.sources.get()
+    service.boards.get()
+    service.priorities.get()
+
+    assert requests_mock.call_count == 4
+    assert cache.stats.evictions == 2
+
+
+def test_changes_drop_cached_responses(requests_mock: RequestMocker) -> None:
+    requests_mock.get(f"{BASE_URL}/service/boards", json=[])
+    requests_mock.get(f"{BASE_URL}/service/boards/1/statuses", json=[])
+    requests_mock.put(f"{BASE_URL}/service/boards/1", json={"id": 1, "name": "Renamed"})
+    cache = ResponseCache([CacheRule("service/boards*", ttl=60)])
+    boards = ServiceEndpoint(create_client(cache)).boards
+
+    boards.get()
+    boards.id(1).statuses.get()
+    boards.id(1).put(data={"id": 1, "name": "Renamed"})
+    boards.get()
+    boards.id(1).statuses.get()
+
+    assert requests_mock.call_count == 5
+
+
+@pytest.mark.parametrize("on_disk", [False, True])
+def test_changes_keep_other_collections_cached(
+    requests_mock: RequestMocker, tmp_path: Path, on_disk: bool  # noqa: FBT001
+) -> None:
+    statuses_url = f"{BASE_URL}/procurement/purchaseorderstatuses"
+    requests_mock.get(statuses_url, json=[])
+    requests_mock.get(f"{BASE_URL}/procurement/purchaseorders/1/lineitems", json=[])
+    requests_mock.post(f"{BASE_URL}/procurement/purchaseorders", json={"id": 2})
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.db")) if on_disk else MemoryCacheBackend()
+    client = create_client(ResponseCache([CacheRule("procurement/*", ttl=60)], backend))
+
+    client._make_request("GET", statuses_url)
+    client._make_request("GET", f"{BASE_URL}/procurement/purchaseorders/1/lineitems")
+    client._make_request("POST", f"{BASE_URL}/procurement/purchaseorders", data={"vendorCompany": {"id": 1}})
+    client._make_request("GET", statuses_url)
+    client._make_request("GET", f"{BASE_URL}/procurement/purchaseorders/1/lineitems")
+
+    # A new purchase order drops the cached purchase orders, but not the purchase order statuses
+    assert [request.url for request in requests_mock.request_history[3:]] == [
+        f"{BASE_URL}/procurement/purchaseorders/1/lineitems"
+    ]
+
+
+def test_searches_keep_cached_responses(requests_mock: RequestMocker) -> None:
+    requests_mock.post(f"{BASE_URL}/service/tickets/search", json=[{"id": 1, "summary": "Ticket"}])
+    requests_mock.post(f"{BASE_URL}/service/tickets", json={"id": 2, "summary": "New"})
+    invalidated: list[str] = []
+
+    class Backend(MemoryCacheBackend):
+        def delete_prefix(self, url_prefix: str) -> None:
+            invalidated.append(url_prefix)
+            super().delete_prefix(url_prefix)
+
+    tickets = ServiceEndpoint(create_client(ResponseCache([], Backend()))).tickets
+
+    # Looking tickets up by id POSTs to the search endpoint, which doesn't change anything
+    tickets.get_many_by_ids([1])
+    assert invalidated == []
+    tickets.post(data={"summary": "New"})
+    assert invalidated == [f"{BASE_URL}/service/tickets"]
+
+
+def test_disk_cache_is_shared(requests_mock: RequestMocker, tmp_path: Path) -> None:
+    boards = [{"id": i, "name": f"Board {i}"} for i in range(100)]
+    requests_mock.get(f"{BASE_URL}/service/boards", json=boards)
+    path = str(tmp_path / "cache.db")
+    rules = [CacheRule("service/boards", ttl=60)]
+
+    ServiceEndpoint(create_client(ResponseCache(rules, SQLiteCacheBackend(path)))).boards.get()
+    # Another process opening the same file gets the cached response
+    cache = ResponseCache(rules, SQLiteCacheBackend(path))
+    assert len(ServiceEndpoint(create_client(cache)).boards.get()) == 100
+
+    assert requests_mock.call_count == 1
+    assert cache.stats.hits == 1
+    with sqlite3.connect(path) as connection:
+        (size,) = connection.execute("SELECT size FROM responses").fetchone()
+    # Responses are stored compressed
+    assert size < len(json.dumps(boards)) // 2
+
+
+def test_disk_cache_revalidates_expired_responses(requests_mock: RequestMocker, tmp_path: Path) -> None:
+    requests_mock.get(
+        f"{BASE_URL}/service/boards",
+        [
+            {"json": [{"id": 1, "name": "Help Desk"}], "headers": {"ETag": '"v1"'}},
+            {"status_code": 304, "headers": {"ETag": '"v1"'}},
+        ],
+    )
+    cache = ResponseCache([CacheRule("service/boards", ttl=0)], SQLiteCacheBackend(str(tmp_path / "cache.db")))
+    boards = ServiceEndpoint(create_client(cache)).boards
+
+    assert boards.get()[0].name == "Help Desk"
+    assert boards.get()[0].name == "Help Desk"
+
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+
+
+def test_disk_cache_evicts_by_size(requests_mock: RequestMocker, tmp_path: Path) -> None:
+    for name in ("boards", "priorities", "sources"):
+        requests_mock.get(f"{BASE_URL}/service/{name}", content=os.urandom(1024))
+    backend = SQLiteCacheBackend(str(tmp_path / "cache.db"), max_bytes=2500)
+    cache = ResponseCache([CacheRule("service/*", ttl=60)], backend)
+    client = create_client(cache)
+
+    for name in ("boards", "priorities", "sources"):
+        client._make_request("GET", f"{BASE_URL}/service/{name}")
+    client._make_request("GET", f"{BASE_URL}/service/sources")
+    client._make_request("GET", f"{BASE_URL}/service/boards")
+
+    assert requests_mock.call_count == 4
+    assert cache.stats.evictions == 2
@@ -0,0 +1,139 @@
+import csv
+import gzip
+import json
+import re
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from requests_mock import Mocker as RequestMocker
+
+from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+from pyconnectwise.exceptions import NotFoundException
+from tests.conftest import BASE_URL, FakeConnectWiseClient
+
+
+def serve_companies(requests_mock: RequestMocker, count: int) -> None:
+    companies = [
+        {
+            "id": id_,
+            "identifier": f"Company{id_}",
+            "name": f"Company {id_}",
+            "deletedFlag": id_ % 2 == 0,
+            "status": {"id": 1, "name": "Active", "_info": {"status_href": "https://example.com"}},
+            "customFields": [{"id": 1, "value": id_}],
+        }
+        for id_ in range(1, count + 1)
+    ]
+
+    def respond(request, context) -> list[dict]:  # noqa: ANN001
+        query = parse_qs(urlsplit(request.url).query)
+        after = re.search(r"id > (\d+)", query.get("conditions", [""])[0])
+        rows = [company for company in companies if not after or company["id"] > int(after.group(1))]
+        return rows[: int(query["pageSize"][0])]
+
+    requests_mock.get(f"{BASE_URL}/company/companies", json=respond)
+
+
+def test_export_ndjson(requests_mock: RequestMocker, tmp_path: Path, client: FakeConnectWiseClient) -> None:
+    serve_companies(requests_mock, 25)
+    path = tmp_path / "companies.ndjson"
+
+    count = client.export(CompanyEndpoint(client).companies, str(path), page_size=10)
+
+    lines = path.read_text().splitlines()
+    assert count == len(lines) == 25
+    assert len(requests_mock.request_history) == 3
+    assert json.loads(lines[0])["status"] == {
+        "id": 1,
+        "name": "Active",
+        "_info": {"status_href": "https://example.com"},
+    }
+
+
+def test_export_csv_flattens_nested_fields(
+    requests_mock: RequestMocker, tmp_path: Path, client: FakeConnectWiseClient
+) -> None:
+    serve_companies(requests_mock, 5)
+    path = tmp_path / "companies.csv.gz"
+
+    assert client.export(CompanyEndpoint(client).companies, str(path)) == 5
+
+    with gzip.open(path, "rt", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 5
+    assert rows[1]["id"] == "2"
+    assert rows[1]["status/name"] == "Active"
+    assert rows[1]["deletedFlag"] == "true"
+    assert rows[1]["customFields"] == '[{"id": 1, "value": 2}]'
+    assert rows[1]["billToCompany/id"] == ""
+
+
+def test_export_parquet(requests_mock: RequestMocker, tmp_path: Path, client: FakeConnectWiseClient) -> None:
+    pq = pytest.importorskip("pyarrow.parquet")
+    serve_companies(requests_mock, 25)
+    path = tmp_path / "companies.parquet"
+
+    client.export(CompanyEndpoint(client).companies, str(path), page_size=10)
+
+    table = pq.read_table(path)
+    assert table.num_rows == 25
+    assert table.column("status/name").to_pylist()[0] == "Active"
+    assert str(table.schema.field("id").type) == "int64"
+
+
+def test_export_failure_is_raised(requests_mock: RequestMocker, tmp_path: Path, client: FakeConnectWiseClient) -> None:
+    requests_mock.get(f"{BASE_URL}/company/companies", status_code=404, json={})
+
+    with pytest.raises(NotFoundException):
+        client.export(CompanyEndpoint(client).companies, str(tmp_path / "companies.ndjson"))
+
+
+def test_export_unknown_format(tmp_path: Path, client: FakeConnectWiseClient) -> None:
+    with pytest.raises(ValueError, match="choose a format"):
+        client.export(CompanyEndpoint(client).companies, str(tmp_path / "companies.xlsx"))
+
+
+def test_checkpointed_export_resumes_without_duplicates(
+    requests_mock: RequestMocker, tmp_path: Path, client: FakeConnectWiseClient
+) -> None:
+    path = tmp_path / "companies.csv.gz"
+    checkpoint = tmp_path / "companies.checkpoint.json"
+    endpoint = CompanyEndpoint(client).companies
+
+    # The export dies fetching the third page
+    requests_mock.get(
+        f"{BASE_URL}/company/companies",
+        [
+            {"json": [{"id": id_, "name": f"Company {id_}"} for id_ in range(1, 11)]},
+            {"json": [{"id": id_, "name": f"Company {id_}"} for id_ in range(11, 21)]},
+            {"status_code": 404, "json": {}},
+        ],
+    )
+    with pytest.raises(NotFoundException):
+        client.export(endpoint, str(path), page_size=10, checkpoint=str(checkpoint))
+    saved = json.loads(checkpoint.read_text())
+    assert (saved["pages"], saved["rows"], saved["last_id"]) == (2, 20, 20)
+    # Anything written after the last committed page is cut when the export resumes
+    with path.open("ab") as f:
+        f.write(gzip.compress(b"21,Half-written\n"))
+
+    serve_companies(requests_mock, 25)
+    count = client.export(endpoint, str(path), page_size=10, checkpoint=str(checkpoint))
+
+    with gzip.open(path, "rt", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert count == len(rows) == 25
+    assert [int(row["id"]) for row in rows] == list(range(1, 26))
+    assert parse_qs(urlsplit(requests_mock.last_request.url).query)["conditions"] == ["id > 20"]
+    assert not checkpoint.exists()
+
+
+def test_checkpoint_for_another_export_is_rejected(tmp_path: Path, client: FakeConnectWiseClient) -> None:
+    path = tmp_path / "companies.ndjson"
+    checkpoint = tmp_path / "companies.checkpoint.json"
+    extract = {"url": f"{BASE_URL}/company/companies", "params": {}, "format": "csv"}
+    checkpoint.write_text(json.dumps({"extract": extract, "pages": 1, "rows": 10, "offset": 100, "last_id": 10}))
+
+    with pytest.raises(ValueError, match="different export"):
+        client.export(CompanyEndpoint(client).companies, str(path), checkpoint=str(checkpoint))
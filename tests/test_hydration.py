@@ -0,0 +1,93 @@
+import re
+
+from requests_mock import Mocker as RequestMocker
+
+from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+from pyconnectwise.hydration import Hydrator
+from pyconnectwise.models.manage import Board, Company, Ticket
+from tests.conftest import BASE_URL, FakeConnectWiseClient
+
+
+def ids_in(request) -> list[int]:  # noqa: ANN001
+    return [int(i) for i in re.search(r"id in \(([\d,]+)\)", request.qs["conditions"][0]).group(1).split(",")]
+
+
+def mock_lookups(requests_mock: RequestMocker) -> None:
+    requests_mock.get(
+        f"{BASE_URL}/company/companies",
+        json=lambda request, context: [
+            {"id": i, "identifier": f"Company{i}", "name": f"Company {i}", "addressLine1": f"{i} Main St"}
+            for i in ids_in(request)
+            if i != 404
+        ],
+    )
+    requests_mock.get(
+        f"{BASE_URL}/service/boards",
+        json=lambda request, context: [{"id": i, "name": f"Board {i}"} for i in ids_in(request)],
+    )
+
+
+def tickets() -> list[dict]:
+    return [
+        {"id": 1, "summary": "A", "company": {"id": 10, "name": "Company 10"}, "board": {"id": 1}},
+        {"id": 2, "summary": "B", "company": {"id": 20, "name": "Company 20"}, "board": {"id": 1}},
+        {"id": 3, "summary": "C", "company": {"id": 10, "name": "Company 10"}},
+        {"id": 4, "summary": "D", "company": {"id": 404, "name": "Deleted"}},
+    ]
+
+
+def test_prefetch_references(requests_mock: RequestMocker, client: FakeConnectWiseClient) -> None:
+    mock_lookups(requests_mock)
+    items = [Ticket.model_validate(ticket) for ticket in tickets()]
+    hydrator = Hydrator()
+
+    hydrator.prefetch(
+        items,
+        (Ticket.company, CompanyEndpoint(client).companies),
+        (Ticket.board, ServiceEndpoint(client).boards),
+    )
+
+    companies = [hydrator.resolve(ticket, Ticket.company) for ticket in items]
+    assert [type(company) for company in companies[:3]] == [Company] * 3
+    assert companies[0].address_line1 == "10 Main St"
+    assert companies[0] is companies[2]
+    assert isinstance(hydrator.resolve(items[1], Ticket.board), Board)
+    assert hydrator.resolve(items[2], Ticket.board) is None
+    # Companies that aren't found resolve to nothing
+    assert companies[3] is None
+    assert sorted(ids_in(request) for request in requests_mock.request_history) == [[1], [10, 20, 404]]
+
+
+def test_prefetched_items_dump_as_they_were(requests_mock: RequestMocker, client: FakeConnectWiseClient) -> None:
+    mock_lookups(requests_mock)
+    items = [Ticket.model_validate(ticket) for ticket in tickets()]
+    dumped = [item.model_dump() for item in items]
+
+    Hydrator().prefetch(items, (Ticket.company, CompanyEndpoint(client).companies))
+
+    assert [item.model_dump() for item in items] == dumped
+
+
+def test_references_that_werent_prefetched() -> None:
+    ticket = Ticket.model_validate(tickets()[0])
+
+    assert Hydrator().resolve(ticket, Ticket.company) is None
+
+
+def test_hydrator_looks_each_object_up_once(requests_mock: RequestMocker, client: FakeConnectWiseClient) -> None:
+    mock_lookups(requests_mock)
+    companies = CompanyEndpoint(client).companies.with_response_mode("raw")
+    hydrator = Hydrator()
+
+    first, second = tickets()[:2], tickets()
+    hydrator.prefetch(first, (Ticket.company, companies))
+    hydrator.prefetch(second, (Ticket.company, companies))
+
+    company = hydrator.resolve(first[0], Ticket.company)
+    assert company["addressLine1"] == "10 Main St"
+    assert hydrator.resolve(second[0], Ticket.company) is company
+    assert hydrator.get(Company, 20) is hydrator.resolve(first[1], Ticket.company)
+    assert [ids_in(request) for request in requests_mock.request_history] == [[10, 20], [404]]
+    hydrator.prefetch(tickets(), (Ticket.company, companies))
+    assert requests_mock.call_count == 2
@@ -0,0 +1,131 @@
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from requests_mock import Mocker as RequestMocker
+
+from pyconnectwise.endpoints.automate.ComputersEndpoint import ComputersEndpoint
+from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+from pyconnectwise.mirror import Mirror
+from pyconnectwise.models.manage import Company
+from tests.conftest import BASE_URL, FakeAutomateClient, FakeConnectWiseClient
+
+COMPANIES = [
+    {
+        "id": 1,
+        "identifier": "Acme",
+        "name": "Acme Corp",
+        "city": "Tampa",
+        "deletedFlag": False,
+        "status": {"id": 1, "name": "Active"},
+        "_info": {"lastUpdated": "2024-01-01T00:00:00Z"},
+    },
+    {
+        "id": 2,
+        "identifier": "Globex",
+        "name": "Globex 100% Ltd",
+        "city": None,
+        "deletedFlag": False,
+        "status": {"id": 2, "name": "Inactive"},
+        "_info": {"lastUpdated": "2024-02-01T00:00:00Z"},
+    },
+    {
+        "id": 3,
+        "identifier": "Initech",
+        "name": "Initech",
+        "city": "Austin",
+        "deletedFlag": True,
+        "status": {"id": 1, "name": "Active"},
+        "_info": {"lastUpdated": "2024-03-01T00:00:00Z"},
+    },
+]
+
+
+@pytest.fixture()
+def mirror(requests_mock: RequestMocker) -> Mirror:
+    requests_mock.get(f"{BASE_URL}/company/companies", [{"json": COMPANIES}, {"json": []}])
+    mirror = Mirror()
+    mirror.add(CompanyEndpoint(FakeConnectWiseClient()).companies)
+    mirror.sync()
+    return mirror
+
+
+@pytest.mark.parametrize(
+    ("conditions", "ids"),
+    [
+        ('name = "acme corp"', [1]),
+        ('status/name = "Active" and deletedFlag = false', [1]),
+        ("status/id = 2 or (city != null and id >= 3)", [2, 3]),
+        ("city = null", [2]),
+        ('name contains "100%"', [2]),
+        ('name not like "A%"', [2, 3]),
+        ('identifier in ("Globex", "Initech")', [2, 3]),
+        ("id not in (1, 3)", [2]),
+        ("lastUpdated > [2024-01-15T00:00:00Z]", [2, 3]),
+        (Company.status.name == "Inactive", [2]),
+        (None, [1, 2, 3]),
+    ],
+)
+def test_query_conditions(mirror: Mirror, conditions: str, ids: list[int]) -> None:
+    assert [company.id for company in mirror["company_companies"].query(conditions, order_by="id")] == ids
+
+
+def test_query_order_and_limit(mirror: Mirror) -> None:
+    companies = mirror["company_companies"]
+
+    assert [c.id for c in companies.query(order_by="status/id desc, id asc", limit=2)] == [2, 1]
+    assert [c.id for c in companies.query(order_by="id", limit=2, offset=2)] == [3]
+    assert companies.query("id = 1")[0].status.name == "Active"
+    assert companies.count("deletedFlag = true") == 1
+
+
+def test_query_rejects_what_it_cant_run(mirror: Mirror) -> None:
+    companies = mirror["company_companies"]
+
+    with pytest.raises(ValueError, match="isn't a field"):
+        companies.query('nickname = "Acme"')
+    with pytest.raises(ValueError, match="ends too soon"):
+        companies.query("id = ")
+    with pytest.raises(ValueError, match="Can't order"):
+        companies.query(order_by="id; DROP TABLE company_companies")
+
+
+def test_sync_fetches_changes(requests_mock: RequestMocker, tmp_path: Path, client: FakeConnectWiseClient) -> None:
+    path = str(tmp_path / "mirror.db")
+    requests_mock.get(f"{BASE_URL}/company/companies", [{"json": COMPANIES}, {"json": []}])
+    with Mirror(path) as mirror:
+        mirror.add(CompanyEndpoint(client).companies)
+        assert mirror.sync()["company_companies"].upserted == 3
+
+    renamed = {**COMPANIES[0], "name": "Acme Inc", "_info": {"lastUpdated": "2024-04-01T00:00:00Z"}}
+    requests_mock.get(f"{BASE_URL}/company/companies", json=[renamed])
+    with Mirror(path) as mirror:
+        companies = mirror.add(CompanyEndpoint(client).with_response_mode("raw").companies)
+        result = mirror.sync()["company_companies"]
+
+        assert (result.full, result.upserted) == (False, 1)
+        # Only the items updated since the last sync (less the overlap) are fetched
+        conditions = parse_qs(urlsplit(requests_mock.last_request.url).query)["conditions"]
+        assert conditions == ["lastUpdated >= [2024-02-29T23:55:00Z]"]
+        assert companies.query("id = 1")[0]["name"] == "Acme Inc"
+        assert companies.count() == 3
+
+
+def test_sync_reloads_endpoints_without_last_updated(
+    requests_mock: RequestMocker, automate_client: FakeAutomateClient
+) -> None:
+    requests_mock.get(
+        f"{BASE_URL}/Computers",
+        [
+            {"json": [{"Id": "1", "ComputerName": "PC1"}, {"Id": "2", "ComputerName": "PC2"}]},
+            {"json": [{"Id": "2", "ComputerName": "PC2"}]},
+        ],
+    )
+    mirror = Mirror()
+    computers = mirror.add(ComputersEndpoint(automate_client))
+
+    mirror.sync()
+    result = computers.sync()
+
+    assert (result.upserted, result.deleted) == (1, 1)
+    assert [computer.computer_name for computer in computers.query('ComputerName like "PC*"')] == ["PC2"]
@@ -0,0 +1,133 @@
+import time
+from email.utils import formatdate
+
+import pytest
+from requests_mock import Mocker as RequestMocker
+
+from pyconnectwise.config import Config
+from pyconnectwise.exceptions import ServiceUnavailableError, TooManyRequestsException
+from pyconnectwise.rate_limit import RateLimiter
+from pyconnectwise.retry import RetryBudget, RetryPolicy, parse_retry_after
+from tests.conftest import BASE_URL, FakeConnectWiseClient
+
+TEST_URL = f"{BASE_URL}/system/callbacks"
+
+
+def test_retries_429_honoring_retry_after(requests_mock: RequestMocker, monkeypatch: pytest.MonkeyPatch):
+    sleeps: list[float] = []
+    monkeypatch.setattr(time, "sleep", sleeps.append)
+    requests_mock.get(
+        TEST_URL,
+        [
+            {"status_code": 429, "headers": {"Retry-After": "7"}},
+            {"status_code": 503},
+            {"text": "Success!"},
+        ],
+    )
+
+    client = FakeConnectWiseClient(Config(retry_policy=RetryPolicy(max_retries=2, backoff_base=0.5)))
+    response = client._make_request("GET", TEST_URL)
+
+    assert response.text == "Success!"
+    assert len(requests_mock.request_history) == 3
+    # Retry-After wins over backoff, the 503 without one gets a jittered backoff of at most backoff_base * 2
+    assert sleeps[0] == 7
+    assert 0 <= sleeps[1] <= 1
+
+
+@pytest.mark.parametrize(
+    ("status_code", "expected_error"),
+    [(429, TooManyRequestsException), (502, ServiceUnavailableError), (503, ServiceUnavailableError)],
+)
+def test_persistent_failures_raise(status_code: int, expected_error: type[Exception], requests_mock: RequestMocker):
+    requests_mock.get(TEST_URL, status_code=status_code)
+
+    client = FakeConnectWiseClient(Config(retry_policy=RetryPolicy(max_retries=2, backoff_base=0)))
+    with pytest.raises(expected_error):
+        client._make_request("GET", TEST_URL)
+
+    assert len(requests_mock.request_history) == 3
+
+
+def test_gateway_errors_are_only_retried_for_idempotent_requests(requests_mock: RequestMocker):
+    requests_mock.post(TEST_URL, status_code=504)
+    requests_mock.put(TEST_URL, [{"status_code": 504}, {"text": "Success!"}])
+
+    client = FakeConnectWiseClient(Config(retry_policy=RetryPolicy(max_retries=2, backoff_base=0)))
+    # The POST may have been handled before the gateway gave up, so repeating it could e.g. create a callback twice
+    with pytest.raises(ServiceUnavailableError):
+        client._make_request("POST", TEST_URL)
+    assert len(requests_mock.request_history) == 1
+
+    assert client._make_request("PUT", TEST_URL).text == "Success!"
+    assert len(requests_mock.request_history) == 3
+
+
+def test_rate_limited_requests_are_always_retried(requests_mock: RequestMocker):
+    requests_mock.post(TEST_URL, [{"status_code": 429}, {"text": "Success!"}])
+
+    client = FakeConnectWiseClient(Config(retry_policy=RetryPolicy(max_retries=2, backoff_base=0)))
+
+    assert client._make_request("POST", TEST_URL).text == "Success!"
+    assert len(requests_mock.request_history) == 2
+
+
+def test_retry_budget_is_shared(requests_mock: RequestMocker):
+    requests_mock.get(TEST_URL, status_code=503)
+
+    # Two clients sharing one budget of 3 retries, which earns nothing back from new requests
+    policy = RetryPolicy(max_retries=5, backoff_base=0, budget=RetryBudget(ratio=0, reserve=3))
+    first = FakeConnectWiseClient(Config(retry_policy=policy))
+    second = FakeConnectWiseClient(Config(retry_policy=policy))
+
+    with pytest.raises(ServiceUnavailableError):
+        first._make_request("GET", TEST_URL)
+    with pytest.raises(ServiceUnavailableError):
+        second._make_request("GET", TEST_URL)
+
+    # 1 request + 3 retries, then the budget is spent and the second client doesn't retry
+    assert len(requests_mock.request_history) == 5
+
+
+def test_retry_budget_refills_from_requests():
+    budget = RetryBudget(ratio=0.5, reserve=1)
+
+    assert budget.try_spend()
+    assert not budget.try_spend()
+    budget.record_request()
+    budget.record_request()
+    assert budget.try_spend()
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("12") == 12
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("soon") is None
+    assert 25 < parse_retry_after(formatdate(time.time() + 30, usegmt=True)) <= 30
+
+
+def test_rate_limiter_paces_requests():
+    limiter = RateLimiter(rate=10, burst=2)
+
+    waits = [limiter.reserve() for _ in range(4)]
+
+    # The burst goes straight through, then requests are spaced 1/rate apart
+    assert waits[:2] == [0, 0]
+    assert waits[2] == pytest.approx(0.1, abs=0.01)
+    assert waits[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_rate_limiter_adapts_to_throttling():
+    limiter = RateLimiter(rate=100, min_rate=10, recovery=5)
+
+    limiter.record_response(429)
+    assert limiter.rate == 50
+    for _ in range(3):
+        limiter.record_response(429)
+    assert limiter.rate == 10
+
+    limiter.record_response(200)
+    assert limiter.rate == 15
+    for _ in range(100):
+        limiter.record_response(200)
+    assert limiter.rate == 100
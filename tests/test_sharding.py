@@ -0,0 +1,164 @@
+import csv
+import gzip
+import json
+import re
+import time
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from requests_mock import Mocker as RequestMocker
+
+from pyconnectwise.endpoints.manage.CompanyCompaniesEndpoint import CompanyCompaniesEndpoint
+from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+from pyconnectwise.exceptions import MalformedRequestException
+from pyconnectwise.export import export
+from pyconnectwise.rate_limit import SQLiteRateLimiter
+from pyconnectwise.sharding import Shard, ShardedExtract, WorkQueue, plan_shards
+from tests.conftest import BASE_URL, FakeConnectWiseClient
+
+# Ids with a gap in the middle, as deleted items leave
+COMPANY_IDS = [*range(101, 131), *range(161, 191)]
+
+
+class CompaniesClient(FakeConnectWiseClient):
+    @property
+    def companies(self) -> CompanyCompaniesEndpoint:
+        return CompanyEndpoint(self).companies
+
+
+def serve_companies(requests_mock: RequestMocker) -> None:
+    def respond(request, context) -> list[dict]:  # noqa: ANN001
+        query = parse_qs(urlsplit(request.url).query)
+        conditions = query.get("conditions", [""])[0]
+        ids = COMPANY_IDS
+        for operator, value in re.findall(r"id (>=|<|>) (\d+)", conditions):
+            if operator == ">=":
+                ids = [id_ for id_ in ids if id_ >= int(value)]
+            elif operator == "<":
+                ids = [id_ for id_ in ids if id_ < int(value)]
+            else:
+                ids = [id_ for id_ in ids if id_ > int(value)]
+        if query.get("orderBy") == ["id desc"]:
+            ids = ids[::-1]
+        rows = [{"id": id_, "name": f"Company {id_}"} for id_ in ids[: int(query["pageSize"][0])]]
+        if "fields" in query:
+            rows = [{"id": row["id"]} for row in rows]
+        return rows
+
+    requests_mock.get(f"{BASE_URL}/company/companies", json=respond)
+    requests_mock.get(f"{BASE_URL}/company/companies/count", json={"count": len(COMPANY_IDS)})
+
+
+def test_plan_shards_covers_the_id_range(requests_mock: RequestMocker) -> None:
+    serve_companies(requests_mock)
+
+    shards = plan_shards(CompaniesClient().companies, rows_per_shard=20)
+
+    # 60 companies at 20 per shard, over the ids from 101 to 190
+    assert shards == [Shard(0, None, 131), Shard(1, 131, 161), Shard(2, 161, None)]
+    assert [shard.get_condition("id") for shard in shards] == ["id < 131", "id >= 131 and id < 161", "id >= 161"]
+
+
+def test_plan_shards_without_items(requests_mock: RequestMocker) -> None:
+    requests_mock.get(f"{BASE_URL}/company/companies", json=[])
+
+    assert plan_shards(CompaniesClient().companies, shards=4) == [Shard(0, None, None)]
+
+
+def test_work_queue_hands_out_each_shard_once(tmp_path: Path) -> None:
+    queue = WorkQueue(str(tmp_path / "queue.sqlite"), lease=60)
+    queue.add([Shard(0, None, 10), Shard(1, 10, None)])
+    # Adding again, e.g. from another machine, keeps the shards already queued
+    assert queue.add([Shard(0, None, None)]) == [Shard(0, None, 10), Shard(1, 10, None)]
+
+    first = queue.claim("a")
+    second = queue.claim("b")
+    assert (first.index, second.index) == (0, 1)
+    assert queue.claim("c") is None
+
+    queue.release(second, "b")
+    assert queue.claim("c") == second
+    queue.complete(first, "a", 10)
+    assert queue.get_progress() == {"pending": 0, "claimed": 1, "done": 1, "rows": 10}
+
+
+def test_work_queue_hands_out_expired_leases(tmp_path: Path) -> None:
+    queue = WorkQueue(str(tmp_path / "queue.sqlite"), lease=0)
+    queue.add([Shard(0, None, None)])
+
+    claimed = queue.claim("a")
+    time.sleep(0.01)
+
+    taken_over = queue.claim("b")
+    assert taken_over == claimed
+    assert (claimed.claim, taken_over.claim) == (1, 2)
+    # The worker whose lease ran out can no longer complete the shard
+    assert not queue.complete(claimed, "a", 5)
+    assert queue.get_progress()["done"] == 0
+    assert queue.complete(taken_over, "b", 5)
+
+
+def test_sharded_extract_merges_parts_in_order(requests_mock: RequestMocker, tmp_path: Path) -> None:
+    serve_companies(requests_mock)
+    path = tmp_path / "companies.csv.gz"
+    extract = ShardedExtract(CompaniesClient, "companies", str(path), page_size=10, rate_limit=1000)
+
+    extract.plan(shards=4)
+    # Two workers, which would normally be in different processes or on different machines
+    assert extract.work("a") == 4
+    assert extract.work("b") == 0
+    count = extract.merge()
+
+    with gzip.open(path, "rt", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert count == len(rows) == len(COMPANY_IDS)
+    assert [int(row["id"]) for row in rows] == COMPANY_IDS
+    assert not Path(extract.work_dir).exists()
+
+
+def test_expired_claims_are_resumed_in_their_own_files(requests_mock: RequestMocker, tmp_path: Path) -> None:
+    serve_companies(requests_mock)
+    extract = ShardedExtract(CompaniesClient, "companies", str(tmp_path / "companies.ndjson"), page_size=10, lease=0)
+    extract.plan(shards=1)
+    # Worker a exports the first page, then stalls until its lease has run out
+    first_page = [{"id": id_, "name": f"Company {id_}"} for id_ in COMPANY_IDS[:10]]
+    requests_mock.get(f"{BASE_URL}/company/companies", [{"json": first_page}, {"status_code": 400}])
+    stalled = extract.queue.claim("a")
+    part_path = extract._get_part_path(stalled)
+    with pytest.raises(MalformedRequestException):
+        export(CompaniesClient().companies, part_path, "ndjson", page_size=10, checkpoint=f"{part_path}.checkpoint")
+    time.sleep(0.01)
+
+    serve_companies(requests_mock)
+    requests_mock.reset_mock()
+    assert extract.work("b") == 1
+
+    # Worker b carried on from a's checkpoint, in files of its own, and a can't complete the shard anymore
+    assert requests_mock.request_history[0].qs["conditions"] == ["id > 110"]
+    assert Path(part_path).read_bytes().count(b"\n") == 10
+    assert not extract.queue.complete(stalled, "a", 10)
+    assert extract.merge() == len(COMPANY_IDS)
+    ids = [json.loads(line)["id"] for line in (tmp_path / "companies.ndjson").read_text().splitlines()]
+    assert ids == COMPANY_IDS
+
+
+def test_merge_waits_for_every_shard(requests_mock: RequestMocker, tmp_path: Path) -> None:
+    serve_companies(requests_mock)
+    extract = ShardedExtract(CompaniesClient, "companies", str(tmp_path / "companies.ndjson"))
+    extract.plan(shards=2)
+
+    with pytest.raises(RuntimeError, match="2 shards"):
+        extract.merge()
+
+
+def test_sqlite_rate_limiter_is_shared(tmp_path: Path) -> None:
+    path = str(tmp_path / "rate.sqlite")
+    first = SQLiteRateLimiter(path, rate=10)
+    second = SQLiteRateLimiter(path, rate=10)
+
+    assert first.reserve() == 0.0
+    # The other limiter draws from the same bucket, so it has to wait for the next token
+    assert second.reserve() == pytest.approx(0.1, abs=0.02)
+    second.on_throttled()
+    assert first.reserve() == pytest.approx(0.4, abs=0.04)
@@ -0,0 +1,72 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from requests_mock import Mocker as RequestMocker
+
+from pyconnectwise.config import Config
+from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+from pyconnectwise.exceptions import NotFoundException
+from pyconnectwise.single_flight import SingleFlight
+from tests.conftest import BASE_URL, FakeConnectWiseClient
+
+
+def create_client(single_flight: SingleFlight) -> FakeConnectWiseClient:
+    config = Config(max_retries=0, single_flight=single_flight)
+    return FakeConnectWiseClient(config, {"Authorization": "Basic one"})
+
+
+def slow_response(status_code: int = 200) -> dict:
+    def json(request, context) -> dict:  # noqa: ANN001
+        time.sleep(0.2)
+        context.status_code = status_code
+        return {"id": 1, "identifier": "Company1", "name": "Company 1"}
+
+    return {"json": json}
+
+
+def test_concurrent_gets_are_coalesced(requests_mock: RequestMocker) -> None:
+    requests_mock.get(f"{BASE_URL}/company/companies/1", [slow_response()])
+    single_flight = SingleFlight()
+    company = CompanyEndpoint(create_client(single_flight)).companies.id(1)
+
+    with ThreadPoolExecutor(10) as executor:
+        companies = list(executor.map(lambda _: company.get(), range(10)))
+
+    assert requests_mock.call_count == 1
+    assert {c.name for c in companies} == {"Company 1"}
+    # Each caller gets its own model
+    assert len({id(c) for c in companies}) == 10
+    assert (single_flight.stats.calls, single_flight.stats.saved) == (1, 9)
+
+
+def test_only_overlapping_gets_are_coalesced(requests_mock: RequestMocker) -> None:
+    requests_mock.get(f"{BASE_URL}/company/companies/1", json={"id": 1, "identifier": "Company1", "name": "Company 1"})
+    requests_mock.get(f"{BASE_URL}/company/companies", json=[])
+    single_flight = SingleFlight()
+    companies = CompanyEndpoint(create_client(single_flight)).companies
+
+    companies.id(1).get()
+    companies.id(1).get()
+    companies.get(params={"conditions": "id = 1"})
+
+    assert requests_mock.call_count == 3
+    assert single_flight.stats.saved == 0
+
+
+def test_errors_are_shared(requests_mock: RequestMocker) -> None:
+    requests_mock.get(f"{BASE_URL}/company/companies/1", [slow_response(404)])
+    company = CompanyEndpoint(create_client(SingleFlight())).companies.id(1)
+    barrier = threading.Barrier(3)
+
+    def get() -> None:
+        barrier.wait()
+        with pytest.raises(NotFoundException):
+            company.get()
+
+    with ThreadPoolExecutor(3) as executor:
+        for future in [executor.submit(get) for _ in range(3)]:
+            future.result()
+
+    assert requests_mock.call_count == 1
@@ -0,0 +1,106 @@
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from requests_mock import Mocker as RequestMocker
+
+from pyconnectwise.endpoints.manage.CompanyEndpoint import CompanyEndpoint
+from pyconnectwise.sync import DeltaSync, JSONSyncStateStore, MemorySink
+from tests.conftest import BASE_URL, FakeConnectWiseClient
+
+
+class FakeCompanies:
+    """
+    Serves a table of companies, filtered by the "lastUpdated >= [...]" and "id > ..." conditions DeltaSync uses.
+    """
+
+    def __init__(self, requests_mock: RequestMocker) -> None:
+        self.companies: dict[int, dict] = {}
+        self.served = 0
+        requests_mock.get(f"{BASE_URL}/company/companies", json=self.respond)
+
+    def save(self, id_: int, name: str, last_updated: datetime) -> None:
+        info = {"lastUpdated": last_updated.strftime("%Y-%m-%dT%H:%M:%SZ")}
+        self.companies[id_] = {"id": id_, "identifier": f"Company{id_}", "name": name, "_info": info}
+
+    def respond(self, request, context) -> list[dict]:  # noqa: ANN001
+        query = parse_qs(urlsplit(request.url).query)
+        conditions = query.get("conditions", [""])[0]
+        rows = sorted(self.companies.values(), key=lambda company: company["id"])
+        if since := re.search(r"lastUpdated >= \[(.+?)\]", conditions):
+            rows = [row for row in rows if row["_info"]["lastUpdated"] >= since.group(1)]
+        if after := re.search(r"id > (\d+)", conditions):
+            rows = [row for row in rows if row["id"] > int(after.group(1))]
+        rows = rows[: int(query["pageSize"][0])]
+        if "fields" in query:
+            rows = [{"id": row["id"]} for row in rows]
+        self.served += len(rows)
+        return rows
+
+
+@pytest.fixture()
+def now() -> datetime:
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def test_only_changes_are_synced(requests_mock: RequestMocker, now: datetime, client: FakeConnectWiseClient) -> None:
+    table = FakeCompanies(requests_mock)
+    for id_ in range(1, 101):
+        table.save(id_, f"Company {id_}", now - timedelta(days=101 - id_))
+    sink = MemorySink()
+    sync = DeltaSync(CompanyEndpoint(client).companies, sink, page_size=30, overlap=60)
+
+    first = sync.run()
+    table.served = 0
+    table.save(5, "Renamed", now - timedelta(seconds=5))
+    table.save(101, "New", now - timedelta(seconds=5))
+    second = sync.run()
+
+    assert (first.upserted, first.full) == (100, True)
+    assert (second.upserted, second.full) == (2, False)
+    # The latest item from the last sync is fetched again, as the mark is its lastUpdated
+    assert table.served == 3
+    assert len(sink.items) == 101
+    assert sink.items[5].name == "Renamed"
+    # Items fetched again from the overlap aren't passed on again unless they've changed
+    assert sync.run().upserted == 0
+
+
+def test_items_updated_at_the_mark_are_synced(
+    requests_mock: RequestMocker, now: datetime, client: FakeConnectWiseClient
+) -> None:
+    table = FakeCompanies(requests_mock)
+    table.save(1, "Company 1", now - timedelta(seconds=10))
+    sink = MemorySink()
+    sync = DeltaSync(CompanyEndpoint(client).companies, sink, overlap=60)
+
+    sync.run()
+    # Updated in the same second as the mark
+    table.save(1, "Renamed", now - timedelta(seconds=10))
+    table.save(2, "Company 2", now - timedelta(seconds=10))
+
+    assert sync.run().upserted == 2
+    assert sink.items[1].name == "Renamed"
+    assert set(sink.items) == {1, 2}
+
+
+def test_deletions_are_synced(
+    requests_mock: RequestMocker, now: datetime, tmp_path: Path, client: FakeConnectWiseClient
+) -> None:
+    table = FakeCompanies(requests_mock)
+    for id_ in range(1, 11):
+        table.save(id_, f"Company {id_}", now - timedelta(days=1))
+    sink = MemorySink()
+    store = JSONSyncStateStore(str(tmp_path / "sync.json"))
+    DeltaSync(CompanyEndpoint(client).companies, sink, store).run()
+    del table.companies[3], table.companies[7]
+
+    # Picks up from the state saved by the last run
+    sync = DeltaSync(CompanyEndpoint(client).companies, sink, store)
+    assert sync.run().deleted == 0
+    result = sync.run(check_deletions=True)
+
+    assert (result.upserted, result.deleted) == (0, 2)
+    assert sorted(sink.items) == [1, 2, 4, 5, 6, 8, 9, 10]
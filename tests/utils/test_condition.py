@@ -0,0 +1,26 @@
+from pyconnectwise.models.manage import Ticket
+from pyconnectwise.utils.experimental.condition import Condition
+
+
+def test_condition_builder() -> None:
+    condition = (
+        Condition[Ticket]()
+        .field(lambda t: t.status.name)
+        .equals("New")
+        .and_(lambda t: t.closed_flag)
+        .not_equals(True)  # noqa: FBT003
+        .or_()
+        .wrap(lambda c: c.field(lambda t: t.actual_hours).greater_than(1.5))
+    )
+
+    assert str(condition) == 'status/name = "New" AND closedFlag != true OR (actualHours > 1.5)'
+
+
+def test_condition_builder_with_selector_defined_elsewhere() -> None:
+    # The selected field used to be read from the source line of the call, so only inline lambdas worked
+    def company_identifier(ticket: type[Ticket]) -> object:
+        return ticket.company.identifier
+
+    condition = Condition[Ticket]().field(company_identifier).equals("HealthIT")
+
+    assert str(condition) == 'company/identifier = "HealthIT"'
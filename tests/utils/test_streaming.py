@@ -0,0 +1,76 @@
+import json
+
+import pytest
+from requests_mock import Mocker as RequestMocker
+
+from pyconnectwise.endpoints.manage.ServiceEndpoint import ServiceEndpoint
+from pyconnectwise.utils.streaming import iter_json_array
+from tests.conftest import BASE_URL, FakeConnectWiseClient
+
+TICKETS_URL = f"{BASE_URL}/service/tickets"
+
+
+def chunked(body: bytes, size: int) -> list[bytes]:
+    return [body[i : i + size] for i in range(0, len(body), size)]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 4096])
+def test_iter_json_array_across_chunk_boundaries(chunk_size: int):
+    items = [
+        {"id": 1, "summary": 'Quotes " and \\ backslashes, and multi-byte ünïcödé 🎫', "nested": [1, {"a": None}]},
+        12345,
+        -3.25e-7,
+        "text",
+        True,
+        None,
+        [],
+    ]
+    body = json.dumps(items, ensure_ascii=False, indent=2).encode()
+
+    assert list(iter_json_array(chunked(body, chunk_size))) == items
+
+
+def test_iter_json_array_empty():
+    assert list(iter_json_array([b" [ ] "])) == []
+
+
+@pytest.mark.parametrize("body", [b'{"id": 1}', b"[1, 2", b"[1x]"])
+def test_iter_json_array_rejects_invalid_bodies(body: bytes):
+    with pytest.raises(json.JSONDecodeError):
+        list(iter_json_array(chunked(body, 1)))
+
+
+def test_stream_all_follows_link_headers(requests_mock: RequestMocker, client: FakeConnectWiseClient):
+    def callback(request, context):  # noqa: ANN001, ANN202
+        page = int(request.qs["page"][0])
+        if page < 2:
+            context.headers["Link"] = f'<{TICKETS_URL}?pageSize=2&page={page + 1}>; rel="next"'
+        else:
+            context.headers["Link"] = f'<{TICKETS_URL}?pageSize=2&page=1>; rel="first"'
+        return json.dumps([{"id": page * 10 + 1, "summary": "A"}, {"id": page * 10 + 2, "summary": "B"}])
+
+    requests_mock.get(TICKETS_URL, text=callback)
+
+    tickets = ServiceEndpoint(client).tickets
+    ids = [ticket.id for ticket in tickets.stream_all(2, {"conditions": "closedFlag = false"})]
+
+    assert ids == [11, 12, 21, 22]
+    assert [r.qs["page"] for r in requests_mock.request_history] == [["1"], ["2"]]
+    assert all(r.qs["conditions"] == ["closedflag = false"] for r in requests_mock.request_history)
+
+
+def test_stream_all_without_link_headers_stops_at_short_page(
+    requests_mock: RequestMocker, client: FakeConnectWiseClient
+):
+    requests_mock.get(
+        TICKETS_URL,
+        [
+            {"json": [{"id": 1, "summary": "A"}, {"id": 2, "summary": "B"}]},
+            {"json": [{"id": 3, "summary": "C"}]},
+        ],
+    )
+
+    tickets = ServiceEndpoint(client).tickets
+
+    assert [ticket.id for ticket in tickets.stream_all(2)] == [1, 2, 3]
+    assert len(requests_mock.request_history) == 2